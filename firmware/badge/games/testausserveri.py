@@ -4,14 +4,13 @@ from neopixel import NeoPixel
 
 from gui.core.ugui import Screen, ssd
 from bdg.config import Config
-from bdg.utils import blit
+from bdg.assets import blit_asset
 from gui.core.writer import CWriter, AlphaColor
 from gui.widgets import Label
 from fonts import poppins35
 from gui.core.colors import WHITE, BLACK
 from bdg.widgets.hidden_active_widget import HiddenActiveWidget
 from bdg.bleds import clear_leds, dimm_gamma
-from images import matriisi as matriisi_img
 from images import testausserveri_logo as logo_img
 
 LOGO_W = logo_img.cols
@@ -74,7 +73,7 @@ class Testausserveri(Screen):
         self.running = True
 
     def after_open(self):
-        blit(ssd, matriisi_img, 0, 0)
+        blit_asset(ssd, "matriisi")
         blit_keyed(ssd, logo_img, self.logo_row, self.logo_col)
         self.show(True)
         self.reg_task(self.led_animation(), True)
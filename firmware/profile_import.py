@@ -137,9 +137,9 @@ def profile_imports():
 
     checkpoint("import ScoreLeds")
 
-    from images import boot as screen1
+    from bdg.assets import blit_asset
 
-    checkpoint("import images.boot")
+    checkpoint("import bdg.assets")
 
     from bdg.widgets.hidden_active_widget import HiddenActiveWidget
 
@@ -16,7 +16,9 @@ module("bdg/__init__.py", base_path="modules")
 module("bdg/config.py", base_path="modules")
 module("bdg/version.py", base_path="modules")
 module("bdg/buttons.py", base_path="modules")
+module("bdg/aproc.py", base_path="modules")
 module("bdg/utils.py", base_path="modules")
+module("bdg/display.py", base_path="modules")
 module("bdg/bleds.py", base_path="modules")
 module("bdg/screens/ota.py", base_path="modules")
 module("hardware_setup.py", base_path="modules")
@@ -0,0 +1,49 @@
+import asyncio
+
+
+class AProc:
+    # A mixed class that ensures that the task() coro is running only once
+    # >>> Aproc.start(task=True) returns a task, a new one or the running one
+    # >>> Aproc.stop()  # will cancel the running task
+    stop_event = asyncio.Event()
+    _task = None
+
+    def __init__(self):
+        pass
+
+    async def task(self, *args, **kwargs):
+        # This needs to be overridden
+        print("ERROR: AProc task started!!!!!")
+        pass
+
+    async def wait_stop(self):
+        await self.stop_event.wait()
+
+    @classmethod
+    def start(cls, *args, **kwargs):
+        print(f"Starting async {type(cls).__name__}")
+        task = kwargs.pop("task", None)
+        if task:
+            if cls._task and cls._task.done() or not cls._task:
+                # now start the task with all args except "task"
+                cls._task = asyncio.create_task(cls.task(*args, **kwargs))
+                print(f"new task: {cls._task=}")
+            return cls._task
+        else:
+            # sync run, this is missing the logic to ensure single task
+            loop = asyncio.get_event_loop()
+            loop.run_until_complete(cls.task(*args, **kwargs))
+
+    @classmethod
+    def is_running(cls):
+        if cls._task and not cls._task.done():
+            return True
+        return False
+
+    @classmethod
+    def stop(cls):
+        print(f"Stopping async {cls.__name__}")
+        if cls.stop_event:
+            cls.stop_event.set()
+            cls._task.cancel()
+            cls._task = None
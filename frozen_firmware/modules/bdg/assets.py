@@ -0,0 +1,166 @@
+"""
+Binary image assets, streamed into the framebuffer.
+
+A .bimg file is an 8 byte header, b"BI", mode, flags, rows and cols (big
+endian u16), then the rows of pixel data in the byte order of ssd.mvb, the
+same bytes as the data of an images/*.py module. Assets are built with
+scripts/img_bimg.py into frozen_fs/images and read from /readonly_fs/images.
+
+    from bdg.assets import blit_asset
+    blit_asset(ssd, "boot")           # /readonly_fs/images/boot.bimg
+    blit_asset(ssd, "/sd/pic.bimg", row=10, col=20)
+
+Rows are read with readinto() straight into ssd.mvb, an image as wide as the
+display in a single call, so there is no copy of the image in RAM, only a
+scratch row for the pixels outside the clip rectangle.
+
+With flags DEFLATE the rows are a zlib stream, made with a small window
+(scripts/img_bimg.py --deflate uses 1 KB), and the deflate module expands
+them row by row on the way into ssd.mvb.
+
+An atlas (flags ATLAS, scripts/img_atlas.py) is a vertical strip of sprite
+frames. After the header come the frame count, lut size and key (u16 each),
+a keyed byte and a pad byte, the lut of an indexed strip (2 bytes per colour)
+and a (y, h) u16 pair per frame, then the rows. load_atlas() reads the rows
+into one buffer for bdg.widgets.sprite.SpriteAtlas.
+"""
+
+ASSET_DIR = "/readonly_fs/images"
+MAGIC = b"BI"
+HEADER = 8
+
+# modes of framebuf and bdg.utils
+RGB565 = 1
+GS4_HMSB = 2
+GS2_HMSB = 5
+GS8 = 6
+RGB565_I = 10
+BPP = {RGB565: 2, GS8: 1, RGB565_I: 2}
+BITS = {RGB565: 16, GS4_HMSB: 4, GS2_HMSB: 2, GS8: 8, RGB565_I: 16}
+
+RAW = 0  # flags: rows stored as they are
+DEFLATE = 1  # flags: rows in a zlib stream
+CODEC = 0x0F  # flags: the bits of the above
+ATLAS = 0x10  # flags: a frame table follows the header
+
+
+class ImageHeader(object):
+    def __init__(self, mode, flags, rows, cols):
+        self.mode = mode
+        self.flags = flags
+        self.rows = rows
+        self.cols = cols
+        self.frames = None  # (y, h) of each frame of an atlas
+        self.lut = None
+        self.key = -1
+
+
+def asset_path(name: str) -> str:
+    if "/" in name:
+        return name
+    return f"{ASSET_DIR}/{name}.bimg"
+
+
+def read_header(f) -> ImageHeader:
+    h = f.read(HEADER)
+    if len(h) != HEADER or h[:2] != MAGIC:
+        raise ValueError("not a .bimg image")
+    return ImageHeader(
+        h[2], h[3], int.from_bytes(h[4:6], "big"), int.from_bytes(h[6:8], "big")
+    )
+
+
+def _readinto(f, mv):
+    # streams may return less than asked for, compressed ones do
+    n = 0
+    while n < len(mv):
+        k = f.readinto(mv[n:])
+        if not k:
+            raise ValueError("image data truncated")
+        n += k
+
+
+def _skip(f, n, scratch):
+    while n:
+        k = min(n, len(scratch))
+        _readinto(f, scratch[:k])
+        n -= k
+
+
+def _rows(f, img):
+    if img.flags & CODEC == DEFLATE:
+        import deflate
+
+        return deflate.DeflateIO(f, deflate.ZLIB)
+    if img.flags & CODEC != RAW:
+        raise ValueError(f"unknown image codec {img.flags & CODEC}")
+    return f
+
+
+def _u16(b, i):
+    return b[i] << 8 | b[i + 1]
+
+
+def load_atlas(name: str):
+    """Header with frame table, lut and key, and a bytearray of the rows."""
+    with open(asset_path(name), "rb") as f:
+        img = read_header(f)
+        if not img.flags & ATLAS:
+            raise ValueError("not an atlas")
+        t = f.read(8)
+        n, colours = _u16(t, 0), _u16(t, 2)
+        img.key = _u16(t, 4) if t[6] else -1
+        if colours:
+            img.lut = f.read(colours * 2)
+        t = f.read(n * 4)
+        img.frames = [(_u16(t, i), _u16(t, i + 2)) for i in range(0, n * 4, 4)]
+        buf = bytearray(img.rows * ((img.cols * BITS[img.mode] + 7) // 8))
+        _readinto(_rows(f, img), memoryview(buf))
+    return img, buf
+
+
+def blit_asset(ssd, name: str, row=0, col=0, clip=None) -> ImageHeader:
+    """Draw a .bimg image at row, col, clipped to clip (x, y, w, h) and the
+    display. Rows below the clip rectangle are not read."""
+    x0, y0, x1, y1 = 0, 0, ssd.width, ssd.height
+    if clip is not None:
+        x, y, w, h = clip
+        x0, y0, x1, y1 = max(x0, x), max(y0, y), min(x1, x + w), min(y1, y + h)
+    with open(asset_path(name), "rb") as f:
+        img = read_header(f)
+        mode = RGB565 if img.mode == RGB565_I else img.mode
+        if mode != ssd.mode:
+            raise ValueError("Image and display have differing modes.")
+        if img.flags & ATLAS:
+            raise ValueError("an atlas, draw it with SpriteAtlas")
+        f = _rows(f, img)
+        top, bottom = max(row, y0), min(row + img.rows, y1)
+        left, right = max(col, x0), min(col + img.cols, x1)
+        if top >= bottom or left >= right:
+            return img
+        bpp = BPP[img.mode]
+        dwidth = ssd.width * bpp
+        iwidth = img.cols * bpp
+        before = (left - col) * bpp
+        dbytes = (right - left) * bpp
+        after = iwidth - before - dbytes
+        above = (top - row) * iwidth
+        d = (top * ssd.width + left) * bpp
+        mvb = ssd.mvb
+        rest = max(before, after, min(above, iwidth))
+        scratch = memoryview(bytearray(rest)) if rest else None
+        if above:
+            _skip(f, above, scratch)
+        if dbytes == iwidth == dwidth:
+            _readinto(f, mvb[d : d + (bottom - top) * dwidth])
+        else:
+            for _ in range(bottom - top):
+                if before:
+                    _skip(f, before, scratch)
+                _readinto(f, mvb[d : d + dbytes])
+                if after:
+                    _skip(f, after, scratch)
+                d += dwidth
+    if hasattr(ssd, "mark"):
+        ssd.mark(left, top, right - left, bottom - top)
+    return img
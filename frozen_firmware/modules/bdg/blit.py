@@ -0,0 +1,46 @@
+"""
+Blitters that copy image rows straight into ssd.mvb.
+
+No framebuf or gui imports, so the host benchmarks can run them on a plain
+object with mvb, width and height.
+"""
+
+
+def blit_spans(ssd, img, row=0, col=0):
+    """
+    Blit the opaque pixels of an RGB565 image with precomputed spans.
+
+    img.spans comes from scripts/img_spans.py: per image row a count n, then
+    n (skip, run) byte pairs, pixels to leave and pixels to copy, so a run is
+    one slice copy instead of a key compare per pixel.
+    """
+    mvb = ssd.mvb
+    data = memoryview(img.data)
+    spans = img.spans
+    width = ssd.width
+    i = 0
+    for r in range(img.rows):
+        n = spans[i]
+        i += 1
+        y = row + r
+        if not 0 <= y < ssd.height:
+            i += 2 * n
+            continue
+        x = col
+        s = r * img.cols * 2
+        for _ in range(n):
+            x += spans[i]
+            s += spans[i] * 2
+            k = spans[i + 1]
+            i += 2
+            # clip the run to the display
+            a = max(x, 0)
+            b = min(x + k, width)
+            if a < b:
+                d = (y * width + a) * 2
+                o = s + (a - x) * 2
+                mvb[d : d + (b - a) * 2] = data[o : o + (b - a) * 2]
+            x += k
+            s += k * 2
+    if hasattr(ssd, "mark"):
+        ssd.mark(col, row, img.cols, img.rows)
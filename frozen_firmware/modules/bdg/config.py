@@ -73,6 +73,7 @@ class Config:
                 "beacon": 20,
                 "nick": clean_user_nick(config),
                 "b_needed": 10,
+                "gossip": config.get("espnow", {}).get("gossip", True),
             },
         }
         return Config.config
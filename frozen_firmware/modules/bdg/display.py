@@ -0,0 +1,310 @@
+"""
+Partial display refresh.
+
+The st7789 driver's show() sends the whole 320x170 RGB565 framebuffer, 108800
+bytes, however little changed. partial(SSD) returns a subclass of the driver
+that records the area of every drawing call in a DirtyRects: fill_rect, blit,
+text and the other FrameBuffer methods, so ugui widgets and Writer glyphs too.
+show() (and do_refresh() of the ugui refresh loop) then sends only those
+windows, each with the column (0x2A) and row (0x2B) address commands in front
+of its RAM write, and nothing at all when nothing was drawn.
+
+    ssd = partial(SSD)(spi, cs=pcs, dc=pdc, rst=prst, height=170, width=320)
+    ssd.fill_rect(8, 5, 7, 7, RED)
+    ssd.show()                  # 7x7 pixels, 111 bytes on the bus
+    ssd.partial = False         # the driver's full refresh, every time
+
+show() blocks while it sends. The ugui refresh loop calls do_refresh()
+instead, which is flush(): the same windows cut into bands of at most 4 KB,
+about 0.4 ms on the 80 MHz bus, with a yield to the scheduler after each, so
+ButtonEvents and NowListener keep running while a frame goes out. Games on
+bdg.frames.FrameLoop leave the flush to it (see there for how it shares the
+display with this loop), other screens leave it to the ugui refresh loop, and a
+screen that needs its frame on the glass awaits ssd.wait_frame().
+
+Code that writes ssd.mvb directly marks what it wrote with ssd.mark(x, y, w,
+h) or ssd.mark_all(), like bdg.utils.blit does. FrameBuffer does not tell its
+size, so a blit source without width and height attributes (Writer glyphs) is
+marked as a glyph sized box, raise ssd.glyph for fonts above 48 pixels.
+
+The window origin in controller RAM is the one the driver itself sets in its
+set_window(), the subclass picks it up from the driver's _wcd() calls.
+"""
+
+import asyncio
+
+CASET = b"\x2a"
+RASET = b"\x2b"
+RAMWR = b"\x2c"
+
+
+class DirtyRects(object):
+    """
+    Changed areas of the display as a short list of (x, y, w, h).
+
+    A new area is merged with a listed one when their bounding box costs at
+    most win_cost pixels more than the two windows, so neighbouring cells and
+    the glyphs of a label end up as one window.
+
+    Args:
+        width (int): Display width in pixels, areas are clipped to it.
+        height (int): Display height in pixels.
+        max_rects (int): More windows are merged into their closest neighbour.
+        win_cost (int): Overhead of one window in pixels, address commands and
+            the per row writes.
+        full (float): Part of the screen above which a full refresh is cheaper.
+    """
+
+    def __init__(self, width, height, max_rects=8, win_cost=256, full=0.5):
+        self.width = width
+        self.height = height
+        self.max_rects = max_rects
+        self.win_cost = win_cost
+        self.full_area = int(width * height * full)
+        self.rects = []
+        self.full = False
+
+    def add(self, x, y, w, h):
+        if self.full:
+            return
+        if x < 0:
+            w += x
+            x = 0
+        if y < 0:
+            h += y
+            y = 0
+        w = min(w, self.width - x)
+        h = min(h, self.height - y)
+        if w <= 0 or h <= 0:
+            return
+        rects = self.rects
+        i = 0
+        while i < len(rects):
+            u = _union(rects[i], x, y, w, h)
+            if u[2] * u[3] <= rects[i][2] * rects[i][3] + w * h + self.win_cost:
+                x, y, w, h = u
+                rects.pop(i)
+                i = 0  # the bigger area may reach another one now
+            else:
+                i += 1
+        if len(rects) == self.max_rects:
+            # grow the neighbour that grows least
+            best = min(rects, key=lambda r: _area(_union(r, x, y, w, h)) - _area(r))
+            rects.remove(best)
+            x, y, w, h = _union(best, x, y, w, h)
+        rects.append((x, y, w, h))
+        if self.area() > self.full_area:
+            self.all()
+
+    def all(self):
+        self.full = True
+        self.rects = []
+
+    def clear(self):
+        self.full = False
+        self.rects = []
+
+    def area(self) -> int:
+        if self.full:
+            return self.width * self.height
+        return sum(r[2] * r[3] for r in self.rects)
+
+
+def _area(r):
+    return r[2] * r[3]
+
+
+def _union(r, x, y, w, h):
+    x0 = min(r[0], x)
+    y0 = min(r[1], y)
+    x1 = max(r[0] + r[2], x + w)
+    y1 = max(r[1] + r[3], y + h)
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
+def partial(base):
+    """Subclass of the display driver class base with partial refresh."""
+
+    class Partial(base):
+        partial = True
+        glyph = (48, 48)  # marked for blit sources of unknown size
+
+        def __init__(self, *args, **kwargs):
+            self._cols = None  # full window, as the driver set it
+            self._rows = None
+            self._windowed = False
+            super().__init__(*args, **kwargs)
+            self.dirty = DirtyRects(self.width, self.height)
+            self.dirty.all()
+            self.bpp = len(self.mvb) // (self.width * self.height)
+            self.frames = 0  # completed refreshes
+            self._next = asyncio.Event()
+
+        def _wcd(self, command, data):
+            if not self._windowed:
+                if command == CASET:
+                    self._cols = bytes(data)
+                elif command == RASET:
+                    self._rows = bytes(data)
+            base._wcd(self, command, data)
+
+        def mark(self, x, y, w, h):
+            self.dirty.add(x, y, w, h)
+
+        def mark_all(self):
+            self.dirty.all()
+
+        def fill(self, c):
+            self.dirty.all()
+            super().fill(c)
+
+        def fill_rect(self, x, y, w, h, c):
+            self.dirty.add(x, y, w, h)
+            super().fill_rect(x, y, w, h, c)
+
+        def rect(self, x, y, w, h, c, f=False):
+            self.dirty.add(x, y, w, h)
+            super().rect(x, y, w, h, c, f)
+
+        def pixel(self, x, y, c=None):
+            if c is None:
+                return super().pixel(x, y)
+            self.dirty.add(x, y, 1, 1)
+            super().pixel(x, y, c)
+
+        def hline(self, x, y, w, c):
+            self.dirty.add(x, y, w, 1)
+            super().hline(x, y, w, c)
+
+        def vline(self, x, y, h, c):
+            self.dirty.add(x, y, 1, h)
+            super().vline(x, y, h, c)
+
+        def line(self, x1, y1, x2, y2, c):
+            x, y = min(x1, x2), min(y1, y2)
+            self.dirty.add(x, y, max(x1, x2) - x + 1, max(y1, y2) - y + 1)
+            super().line(x1, y1, x2, y2, c)
+
+        def ellipse(self, x, y, xr, yr, c, *args):
+            self.dirty.add(x - xr, y - yr, 2 * xr + 1, 2 * yr + 1)
+            super().ellipse(x, y, xr, yr, c, *args)
+
+        def poly(self, x, y, coords, c, *args):
+            xs = [coords[i] for i in range(0, len(coords), 2)]
+            ys = [coords[i] for i in range(1, len(coords), 2)]
+            if xs:
+                x0, y0 = x + min(xs), y + min(ys)
+                self.dirty.add(x0, y0, x + max(xs) - x0 + 1, y + max(ys) - y0 + 1)
+            super().poly(x, y, coords, c, *args)
+
+        def text(self, s, x, y, c=1):
+            self.dirty.add(x, y, 8 * len(s), 8)
+            super().text(s, x, y, c)
+
+        def blit(self, fbuf, x, y, *args):
+            if isinstance(fbuf, tuple):  # (buffer, width, height, format)
+                w, h = fbuf[1], fbuf[2]
+            elif hasattr(fbuf, "height"):
+                w, h = fbuf.width, fbuf.height
+            else:
+                # a glyph: horizontally mapped, so no taller than its bytes
+                w, h = self.glyph
+                try:
+                    h = min(h, len(memoryview(fbuf)))
+                except TypeError:
+                    pass
+            self.dirty.add(x, y, w, h)
+            super().blit(fbuf, x, y, *args)
+
+        def scroll(self, xstep, ystep):
+            self.dirty.all()
+            super().scroll(xstep, ystep)
+
+        def _full(self) -> bool:
+            # True when the driver has to send the whole frame
+            return not self.partial or self.dirty.full or self._cols is None
+
+        def _restore(self):
+            if self._windowed:
+                base._wcd(self, CASET, self._cols)
+                base._wcd(self, RASET, self._rows)
+                self._windowed = False
+
+        def _window(self, x, y, w, h):
+            # framebuffer x, y plus the origin of the driver's window in RAM
+            cx = x + (self._cols[0] << 8 | self._cols[1])
+            ry = y + (self._rows[0] << 8 | self._rows[1])
+            self._windowed = True
+            base._wcd(self, CASET, int.to_bytes((cx << 16) + cx + w - 1, 4, "big"))
+            base._wcd(self, RASET, int.to_bytes((ry << 16) + ry + h - 1, 4, "big"))
+            mvb = self.mvb
+            n = w * self.bpp
+            stride = self.width * self.bpp
+            start = (y * self.width + x) * self.bpp
+            spi = self._spi
+            self._dc(0)
+            self._cs(0)
+            spi.write(RAMWR)
+            self._dc(1)
+            if w == self.width:
+                spi.write(mvb[start : start + stride * h])
+            else:
+                for _ in range(h):
+                    spi.write(mvb[start : start + n])
+                    start += stride
+            self._cs(1)
+
+        def _frame(self):
+            # event of the refresh starting now, wait_frame() is on the next one
+            ev = self._next
+            self._next = asyncio.Event()
+            return ev
+
+        def _done(self, ev):
+            self.frames += 1
+            ev.set()
+
+        def show(self):
+            ev = self._frame()
+            if self._full():
+                self._restore()
+                super().show()
+            else:
+                for r in self.dirty.rects:
+                    self._window(*r)
+            self.dirty.clear()
+            self._done(ev)
+
+        async def flush(self, chunk=4096):
+            """
+            Send what changed in windows of at most chunk bytes, yielding to
+            the scheduler after each, so input and radio tasks keep running.
+            """
+            if self._cols is None:
+                self.show()  # no window origin, the driver's blocking show()
+                return
+            ev = self._frame()
+            if not self.partial or self.dirty.full:
+                rects = [(0, 0, self.width, self.height)]
+            else:
+                rects = self.dirty.rects
+            # drawn from now on goes into the next refresh, a band that is
+            # sent twice shows the newer pixels the second time
+            self.dirty.clear()
+            for x, y, w, h in rects:
+                n = max(1, chunk // (w * self.bpp))
+                for r in range(y, y + h, n):
+                    # every band sets its own window, a show() in between is fine
+                    self._window(x, r, w, min(n, y + h - r))
+                    await asyncio.sleep_ms(0)
+            self._done(ev)
+
+        async def do_refresh(self, split=4):
+            # the ugui refresh loop, split is the driver's, chunk sizes are ours
+            await self.flush()
+
+        async def wait_frame(self):
+            """Wait until everything drawn so far is on the display."""
+            await self._next.wait()
+
+    return Partial
@@ -0,0 +1,159 @@
+"""
+One frame loop for all games.
+
+Games register an update callback that runs every step_ms of game time (a
+fixed timestep, the same number of steps however busy the badge is) and a
+render callback that draws what changed. Each frame of FrameLoop runs the due
+updates, then every render, then one display flush (bdg.display), and sleeps
+until the next frame_ms slot. A frame that runs late skips the slots it
+missed, and updates catch up at most max_steps per frame, the rest are
+dropped and counted in skipped. A client whose update or render raises is
+logged and removed, the other games keep running.
+
+    def after_open(self):
+        self._frame = FrameLoop.add(self._update, self._render, step_ms=20)
+
+    def on_hide(self):
+        FrameLoop.remove(self._frame)
+
+FrameLoop owns the display flush of its games. It holds ugui's
+Screen.rfsh_lock from the first render to the end of the flush, so the ugui
+refresh loop, which draws widgets such as a game's score labels and sends
+them, only runs between frames and never sends half of one. Render callbacks
+draw and return, they do not flush.
+
+FrameLoop.stats() has frame counts and the average and worst update, render
+and flush times of the last frames, in us.
+"""
+
+import asyncio
+from array import array
+from time import ticks_ms, ticks_us, ticks_diff, ticks_add
+
+
+class FrameClient(object):
+    """A game registered with FrameLoop.add()."""
+
+    def __init__(self, update, render, step_ms):
+        self.update = update
+        self.render = render
+        self.step_ms = step_ms
+        self.acc = 0  # game time owed, ms
+        self.steps = 0
+        self.active = True
+
+
+class FrameLoop(object):
+    frame_ms = 20
+    max_steps = 4  # updates per client and frame, catching up after a stall
+    ssd = None  # hardware_setup.ssd, set on the first start
+    lock = None  # ugui Screen.rfsh_lock, the ugui refresh loop waits for it
+    clients = []
+    frames = 0
+    overruns = 0  # frame slots skipped because a frame took too long
+    skipped = 0  # updates dropped after a stall
+    _task = None
+    _times = None  # update, render, flush us of the last frames
+    _n_times = 32
+
+    @classmethod
+    def add(cls, update, render=None, step_ms=20) -> FrameClient:
+        client = FrameClient(update, render, step_ms)
+        cls.clients.append(client)
+        if cls._task is None or cls._task.done():
+            cls._task = asyncio.create_task(cls.task())
+        return client
+
+    @classmethod
+    def remove(cls, client):
+        # the loop stops itself when the last client is gone
+        client.active = False
+        if client in cls.clients:
+            cls.clients.remove(client)
+
+    @classmethod
+    def _fault(cls, client, e):
+        # only the game at fault stops, the loop keeps running the others
+        print(f"FrameLoop: {client.update} raised {e!r}, removed")
+        cls.remove(client)
+
+    @classmethod
+    def stats(cls) -> dict:
+        t = cls._times
+        n = min(cls.frames, cls._n_times)
+        stats = {
+            "frames": cls.frames,
+            "overruns": cls.overruns,
+            "skipped": cls.skipped,
+        }
+        for i, name in enumerate(("update", "render", "flush")):
+            last = [t[j * 3 + i] for j in range(n)] if n else [0]
+            stats[name] = (sum(last) // len(last), max(last))
+        return stats
+
+    @classmethod
+    async def task(cls):
+        if cls.ssd is None:
+            from hardware_setup import ssd
+            from gui.core.ugui import Screen
+
+            cls.ssd = ssd
+            cls.lock = getattr(Screen, "rfsh_lock", None)
+        if cls._times is None:
+            cls._times = array("I", [0] * (3 * cls._n_times))
+        last = ticks_ms()
+        deadline = last
+        while cls.clients:
+            now = ticks_ms()
+            elapsed = ticks_diff(now, last)
+            last = now
+            clients = list(cls.clients)  # callbacks may remove themselves
+            t0 = ticks_us()
+            for c in clients:
+                c.acc += elapsed
+                n = 0
+                while c.acc >= c.step_ms and n < cls.max_steps and c.active:
+                    c.acc -= c.step_ms
+                    try:
+                        c.update()
+                    except Exception as e:
+                        cls._fault(c, e)
+                    n += 1
+                c.steps += n
+                if c.acc >= c.step_ms:
+                    cls.skipped += c.acc // c.step_ms
+                    c.acc %= c.step_ms
+            lock = cls.lock
+            if lock is not None:
+                await lock.acquire()
+            try:
+                t1 = ticks_us()
+                for c in clients:
+                    if c.render is not None and c.active:
+                        try:
+                            c.render()
+                        except Exception as e:
+                            cls._fault(c, e)
+                t2 = ticks_us()
+                if hasattr(cls.ssd, "flush"):
+                    await cls.ssd.flush()
+                else:
+                    cls.ssd.show()
+                t3 = ticks_us()
+            finally:
+                if lock is not None:
+                    lock.release()
+            i = cls.frames % cls._n_times * 3
+            cls._times[i] = ticks_diff(t1, t0)
+            cls._times[i + 1] = ticks_diff(t2, t1)
+            cls._times[i + 2] = ticks_diff(t3, t2)
+            cls.frames += 1
+            deadline = ticks_add(deadline, cls.frame_ms)
+            wait = ticks_diff(deadline, ticks_ms())
+            if wait < 0:
+                # over budget: drop the slots already missed
+                missed = -wait // cls.frame_ms + 1
+                cls.overruns += missed
+                deadline = ticks_add(deadline, missed * cls.frame_ms)
+                wait = ticks_diff(deadline, ticks_ms())
+            await asyncio.sleep_ms(max(0, wait))
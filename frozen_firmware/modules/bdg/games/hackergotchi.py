@@ -4,6 +4,7 @@ from machine import Pin
 from neopixel import NeoPixel
 
 from gui.core.ugui import Screen, ssd
+from bdg.frames import FrameLoop
 from gui.widgets import Label, Button
 from gui.core.writer import CWriter
 from gui.fonts import arial35, font10
@@ -483,21 +484,20 @@ class TamaCountdownScreen(Screen):
             self.np[i] = self.led_state[i]
         self.np.write()
 
-        # Start countdown task
-        self.reg_task(self._countdown(), False)
+        # Countdown, one FrameLoop update per spinner step
+        self.end_time = time.time() + 300  # seconds
+        self.spinner_idx = 0
+        self._frame = None
 
-    async def _countdown(self):
-        duration = 300  # seconds 
-        end_time = time.time() + duration
+    def after_open(self):
+        if self._frame is None:
+            self._frame = FrameLoop.add(self._countdown, step_ms=200)  # spinner speed
 
+    def _countdown(self):
         spinner_chars = ["|", "/", "-", "\\"]
-        spinner_idx = 0
-
-        while True:
-            remaining = int(end_time - time.time())
-            if remaining < 0:
-                break
 
+        remaining = int(self.end_time - time.time())
+        if remaining >= 0:
             minutes = remaining // 60
             seconds = remaining % 60
             time_str = f"{minutes:02d}:{seconds:02d}"
@@ -505,11 +505,12 @@ class TamaCountdownScreen(Screen):
             # Update labels
             self.l1.value(f"... evolving ...")
             self.l2.value(f"{time_str}")
-            self.spinner_label.value(spinner_chars[spinner_idx])
-            spinner_idx = (spinner_idx + 1) % len(spinner_chars)
-
-            await asyncio.sleep(0.2)  # spinner speed
+            self.spinner_label.value(spinner_chars[self.spinner_idx])
+            self.spinner_idx = (self.spinner_idx + 1) % len(spinner_chars)
+            return
 
+        FrameLoop.remove(self._frame)
+        self._frame = None
         # Transition to next stage or stats screen
         if self.next_stage > self.total_stages:
             Screen.change(
@@ -529,6 +530,9 @@ class TamaCountdownScreen(Screen):
         # Cancel any running tasks
         for task in getattr(self, "_tasks", []):
             task.cancel()
+        if self._frame is not None:
+            FrameLoop.remove(self._frame)
+            self._frame = None
 
         # Turn off LEDs safely using helper
         turn_off_leds(self.np, self.led_power)
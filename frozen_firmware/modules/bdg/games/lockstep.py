@@ -0,0 +1,246 @@
+"""
+Deterministic lockstep with optional rollback for two player games.
+
+Both badges run the same game simulation at a fixed tick and only exchange
+inputs. Every InputMsg carries the inputs the peer has not acknowledged yet,
+so a lost frame is repaired by the next one without retransmits, and the
+message stream doubles as the acknowledgement channel.
+
+The game object provides:
+
+    step(inputs)     advance one frame, inputs is (player 0, player 1)
+    local_input()    input of this badge for the next frame, a small int
+    save(), load(s)  state snapshot and restore, needed for rollback > 0
+    checksum()       int over the game state, needed for hash_every > 0
+
+step() must only depend on the state and the inputs (seed random from a value
+both badges agreed on, never use time), otherwise the badges drift apart.
+checksum() results are exchanged and a mismatch calls on_desync(frame).
+
+    ls = Lockstep(conn, game, tick_ms=125, delay=2, rollback=4)
+    await ls.run()  # until ls.stop() or the connection terminates
+
+With rollback=0 a frame is only simulated when the peer input for it has
+arrived, the game stalls on loss. With rollback=n the game runs up to n frames
+ahead on predicted peer inputs (the last one seen) and replays them when the
+real input differs.
+"""
+
+import asyncio
+from time import ticks_ms, ticks_diff, ticks_add
+
+from bdg.msg import AppMsg, BadgeMsg
+
+
+@AppMsg.register
+class InputMsg(BadgeMsg):
+    """Inputs for frames f.., peer inputs received up to a, checksum hv of frame hf"""
+
+    def __init__(self, f: int, i: list, a: int, hf: int = -1, hv: int = 0):
+        super().__init__()
+        self.f = f
+        self.i = i
+        self.a = a
+        self.hf = hf
+        self.hv = hv
+
+
+class Lockstep(object):
+    """
+    Fixed tick input exchange and simulation for a game on a Connection.
+
+    Args:
+        conn (Connection): Active connection to the other player.
+        game: Game simulation, see module docstring.
+        player (int): 0 or 1, defaults to 0 on the badge that opened conn.
+        tick_ms (int): Simulation step. The listener handles fewer than ten
+            frames per second (NowListener.rx_yield_s) and each tick receives
+            one InputMsg, posted without an ack (codec.CAP_POSTED).
+        delay (int): Frames between sampling an input and simulating it, hides
+            the radio latency.
+        rollback (int): Frames to run ahead of the peer on predicted inputs.
+        hash_every (int): Exchange a checksum every n frames, 0 disables.
+        window (int): Max inputs per InputMsg.
+        on_msg: Called with other messages arriving on conn.
+        on_desync: Called with the first frame whose checksums differ.
+    """
+
+    def __init__(
+        self,
+        conn,
+        game,
+        player=None,
+        tick_ms=125,
+        delay=2,
+        rollback=0,
+        hash_every=16,
+        window=8,
+        on_msg=None,
+        on_desync=None,
+    ):
+        self.conn = conn
+        self.game = game
+        self.me = (0 if conn.initiator else 1) if player is None else player
+        self.tick_ms = tick_ms
+        self.delay = delay
+        self.rollback = rollback
+        self.hash_every = hash_every
+        self.window = window
+        self.on_msg = on_msg
+        self.on_desync = on_desync
+
+        # frame -> input for each player, the first delay frames are idle
+        self.inputs = ({f: 0 for f in range(delay)}, {f: 0 for f in range(delay)})
+        self.frame = 0  # next frame to simulate
+        self.confirmed = -1  # frames up to here used real inputs only
+        self.remote_ack = delay - 1  # peer inputs complete up to this frame
+        self.peer_ack = delay - 1  # peer has our inputs up to this frame
+        self.states = {}  # frame -> game state before it, for rollback
+        self.predicted = {}  # frame -> guessed peer input
+        self.hashes = {}  # frame -> checksum after it
+        self.peer_hash = (-1, 0)
+        self.desync = None
+        self.stalls = 0
+        self.rollbacks = 0
+        self.running = False
+        self._redo = None
+
+    def _can_step(self):
+        f = self.frame
+        if f + self.delay - self.peer_ack > self.window:
+            return False  # the peer misses inputs that no longer fit an InputMsg
+        return f in self.inputs[1 - self.me] or f - self.confirmed <= self.rollback
+
+    def _step(self):
+        f = self.frame
+        local = self.inputs[self.me][f]
+        remote = self.inputs[1 - self.me].get(f)
+        self.predicted.pop(f, None)
+        if remote is None:
+            # the peer most likely still holds the same buttons
+            remote = self.inputs[1 - self.me].get(self.remote_ack, 0)
+            self.predicted[f] = remote
+        if self.rollback:
+            self.states[f] = self.game.save()
+        self.game.step((local, remote) if self.me == 0 else (remote, local))
+        if self.hash_every and f % self.hash_every == 0:
+            self.hashes[f] = self.game.checksum()
+        self.frame = f + 1
+
+    def _confirm(self):
+        peer = self.inputs[1 - self.me]
+        while self.confirmed + 1 < self.frame:
+            f = self.confirmed + 1
+            if f not in peer:
+                break
+            guess = self.predicted.pop(f, None)
+            if guess is not None and guess != peer[f]:
+                self._redo = f
+                break
+            self.confirmed = f
+
+    def _replay(self):
+        # restore the state before the first wrong guess and simulate again
+        f, self._redo = self._redo, None
+        target = self.frame
+        self.game.load(self.states[f])
+        self.frame = f
+        self.rollbacks += 1
+        while self.frame < target:
+            self._step()
+        self._confirm()
+
+    def tick(self):
+        """Run one simulation tick, called by run() every tick_ms."""
+        self._confirm()
+        if self._redo is not None:
+            self._replay()
+        if self._can_step():
+            self.inputs[self.me][self.frame + self.delay] = self.game.local_input()
+            self._step()
+            self._confirm()
+        else:
+            self.stalls += 1
+        self._send()
+        self._check_hash()
+        self._prune()
+
+    def _send(self):
+        mine = self.inputs[self.me]
+        newest = self.frame - 1 + self.delay
+        first = max(self.peer_ack + 1, newest - self.window + 1)
+        hf = -1
+        for f in self.hashes:
+            if hf < f <= self.confirmed:
+                hf = f
+        msg = InputMsg(
+            first,
+            [mine[f] for f in range(first, newest + 1)],
+            self.remote_ack,
+            hf,
+            self.hashes.get(hf, 0),
+        )
+        self.conn.post_app_msg(msg)
+
+    def on_input(self, msg: InputMsg):
+        peer = self.inputs[1 - self.me]
+        for k, v in enumerate(msg.i):
+            f = msg.f + k
+            if f > self.remote_ack and f not in peer:
+                peer[f] = v
+        while self.remote_ack + 1 in peer:
+            self.remote_ack += 1
+        if msg.a > self.peer_ack:
+            self.peer_ack = msg.a
+        if msg.hf >= 0:
+            self.peer_hash = (msg.hf, msg.hv)
+
+    def _check_hash(self):
+        hf, hv = self.peer_hash
+        if self.desync is not None or hf > self.confirmed or hf not in self.hashes:
+            return
+        if self.hashes[hf] != hv:
+            self.desync = hf
+            print(f"lockstep: desync at frame {hf}")
+            if self.on_desync:
+                self.on_desync(hf)
+
+    def _prune(self):
+        low = min(self.confirmed, self.peer_ack) - self.window
+        for d in self.inputs:
+            for f in [f for f in d if f < low]:
+                del d[f]
+        for f in [f for f in self.states if f <= self.confirmed]:
+            del self.states[f]
+        keep = self.confirmed - 4 * self.hash_every
+        for f in [f for f in self.hashes if f < keep]:
+            del self.hashes[f]
+
+    async def _recv(self):
+        async for msg in self.conn.get_msg_aiter():
+            if isinstance(msg, InputMsg):
+                self.on_input(msg)
+            elif self.on_msg:
+                self.on_msg(msg)
+        self.running = False  # connection terminated
+
+    async def run(self):
+        self.running = True
+        rx = asyncio.create_task(self._recv())
+        next_t = ticks_ms()
+        try:
+            while self.running and self.conn.active:
+                self.tick()
+                next_t = ticks_add(next_t, self.tick_ms)
+                wait = ticks_diff(next_t, ticks_ms())
+                if wait > 0:
+                    await asyncio.sleep_ms(wait)
+                else:
+                    next_t = ticks_ms()  # fell behind, do not sprint to catch up
+                    await asyncio.sleep_ms(0)
+        finally:
+            rx.cancel()
+            self.running = False
+
+    def stop(self):
+        self.running = False
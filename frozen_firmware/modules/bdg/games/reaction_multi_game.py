@@ -7,7 +7,9 @@ import asyncio
 from gui.core.colors import *
 from bdg.widgets.hidden_active_widget import HiddenActiveWidget
 import random
+from time import ticks_ms, ticks_diff, ticks_add
 from bdg.msg.connection import Connection, Beacon
+from bdg.msg.clock import ClockSync
 from bdg.asyncbutton import ButtonEvents, ButAct
 from bdg.msg import AppMsg, BadgeMsg, CancelActivityMsg
 
@@ -20,6 +22,14 @@ class ReactionStart(BadgeMsg):
         self.my_seed = my_seed
 
 
+@AppMsg.register
+class ReactionGo(BadgeMsg):
+    """Shared clock time when both badges start the sequence"""
+    def __init__(self, at: int):
+        super().__init__()
+        self.at = at
+
+
 @AppMsg.register
 class ReactionEnd(BadgeMsg):
     """Send final score when game over"""
@@ -202,6 +212,9 @@ class ReactionGameScr(Screen):
     bt = None
     # Game UI state
     gs = STATE_GAME_PAUSED
+    # delay before the first button, from ReactionStart or from ReactionGo
+    START_MS = 1500
+    GO_MS = 1000
 
     def __init__(self, conn: Connection):
         # Multiplayer only - connection required
@@ -215,6 +228,13 @@ class ReactionGameScr(Screen):
         self.my_final_score = None
         self.waiting_for_opponent = False
         self.cancelled = False
+
+        # shared clock so both badges light the first button at the same time
+        self.clock = ClockSync(conn)
+        self.sync_err = None
+        self.synced = asyncio.Event()
+        self.start_at = None
+        self.go = asyncio.Event()
         
         super().__init__()
         self.wri = CWriter(ssd, font10, GREEN, BLACK, verbose=False)
@@ -279,6 +299,7 @@ class ReactionGameScr(Screen):
         
         # Register message reading task
         self.reg_task(self.read_messages(), True)
+        self.reg_task(self.sync_clock(), True)
         
         # Generate and send our seed immediately
         my_seed = random.randint(10_000, 100_000)
@@ -309,9 +330,36 @@ class ReactionGameScr(Screen):
             except Exception as e:
                 print(f"ReactionGame: Failed to send cancel: {e}")
         # Don't cleanup here - let the end screen handle it
+        self.clock.stop()
+
+    async def sync_clock(self):
+        self.sync_err = await self.clock.sync()
+        print(f"ReactionGame: clock sync error bound {self.sync_err}ms")
+        self.synced.set()
+
+    async def wait_start(self):
+        t0 = ticks_ms()
+        await self.synced.wait()
+        if self.sync_err is not None:
+            # higher seed picks the start time, both wait for it on the shared clock
+            if self.my_seed > self.opponent_seed:
+                self.start_at = ticks_add(self.clock.now(), self.GO_MS)
+                self.conn.send_app_msg(ReactionGo(self.start_at), sync=False)
+                self.go.set()
+            try:
+                await asyncio.wait_for_ms(self.go.wait(), 2 * self.GO_MS)
+                await self.clock.sleep_until(self.start_at)
+                return
+            except asyncio.TimeoutError:
+                print("ReactionGame: no start time from opponent")
+                return
+        # opponent with older firmware has no clock sync, keep the fixed delay
+        wait = self.START_MS - ticks_diff(ticks_ms(), t0)
+        if wait > 0:
+            await asyncio.sleep_ms(wait)
 
     async def cont_sqnc(self):
-        await asyncio.sleep(1.5)
+        await self.wait_start()
         self.gs = self.STATE_GAME_ONGOING
         print("cont_sqnc")
         try:
@@ -418,6 +466,10 @@ class ReactionGameScr(Screen):
                 if not self.gt or self.gt.done():
                     self.gt = self.reg_task(self.cont_sqnc(), True)
             
+            elif msg.msg_type == "ReactionGo":
+                self.start_at = msg.at
+                self.go.set()
+
             elif msg.msg_type == "ReactionEnd":
                 # Opponent finished their game
                 self.opponent_finished = True
@@ -4,14 +4,14 @@ from neopixel import NeoPixel
 
 from gui.core.ugui import Screen, ssd
 from bdg.config import Config
-from bdg.utils import blit
+from bdg.blit import blit_spans
+from bdg.assets import blit_asset
 from gui.core.writer import CWriter, AlphaColor
 from gui.widgets import Label
 from fonts import poppins35
 from gui.core.colors import WHITE, BLACK
 from bdg.widgets.hidden_active_widget import HiddenActiveWidget
 from bdg.bleds import clear_leds, dimm_gamma
-from images import matriisi as matriisi_img
 from images import testausserveri_logo as logo_img
 
 LOGO_W = logo_img.cols
@@ -20,30 +20,6 @@ TEXT_H = 35  # poppins35 font height
 GAP = 8
 
 
-def blit_keyed(ssd, img, row, col):
-    """Blit image skipping pixels that match the first pixel (background key)."""
-    data = img.data
-    key0 = data[0]
-    key1 = data[1]
-    mvb = ssd.mvb
-    irows = min(img.rows, ssd.height - row)
-    icols = min(img.cols, ssd.width - col)
-    ibytes = img.cols * 2
-    dwidth = ssd.width * 2
-    d = (row * ssd.width + col) * 2
-    s = 0
-    while irows:
-        for p in range(icols):
-            si = s + p * 2
-            if data[si] != key0 or data[si + 1] != key1:
-                di = d + p * 2
-                mvb[di] = data[si]
-                mvb[di + 1] = data[si + 1]
-        s += ibytes
-        d += dwidth
-        irows -= 1
-
-
 class Testausserveri(Screen):
     def __init__(self):
         super().__init__()
@@ -74,8 +50,8 @@ class Testausserveri(Screen):
         self.running = True
 
     def after_open(self):
-        blit(ssd, matriisi_img, 0, 0)
-        blit_keyed(ssd, logo_img, self.logo_row, self.logo_col)
+        blit_asset(ssd, "matriisi")
+        blit_spans(ssd, logo_img, self.logo_row, self.logo_col)
         self.show(True)
         self.reg_task(self.led_animation(), True)
 
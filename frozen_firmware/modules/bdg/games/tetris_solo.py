@@ -16,7 +16,9 @@ import ujson
 from hardware_setup import BtnConfig, ssd
 
 from bdg.asyncbutton import ButAct, ButtonEvents
+from bdg.frames import FrameLoop
 from bdg.widgets.hidden_active_widget import HiddenActiveWidget
+from bdg.widgets.tilemap import TileMap
 from gui.core.colors import (
     BLACK,
     BLUE,
@@ -60,10 +62,6 @@ def _shuffle_in_place(a) -> None:
         a[i], a[j] = a[j], a[i]
 
 
-def _ticks_ms() -> int:
-    return time.ticks_ms()
-
-
 def _ticks_add(t: int, delta: int) -> int:
     return time.ticks_add(t, delta)
 
@@ -129,6 +127,7 @@ PIECES = (
 
 # Piece colors (limited palette; 4-bit mode likely).
 PIECE_COLORS = (CYAN, YELLOW, MAGENTA, GREEN, RED, BLUE, LIGHTGREEN)
+TILES = (BLACK,) + PIECE_COLORS  # TileMap tiles, board value 0 is empty
 
 
 class _HiScore:
@@ -343,15 +342,9 @@ class TetrisGameScreen(Screen):
         self._game = TetrisGame()
         self._hi = _HiScore.load()
 
-        self._task_tick = None
+        self._frame = None
         self._task_btn = None
 
-        # Cached render buffers (composite includes active piece).
-        self._render_buf = bytearray(BOARD_W * BOARD_H)
-        self._last_draw = bytearray(BOARD_W * BOARD_H)
-        for i in range(len(self._last_draw)):
-            self._last_draw[i] = 0
-
         self._last_score = -1
         self._last_lines = -1
         self._last_level = -1
@@ -377,6 +370,10 @@ class TetrisGameScreen(Screen):
         self._next_w = 4 * self._next_cell
         self._next_h = 4 * self._next_cell
         display.rect(self._next_x - 1, self._next_y - 1, self._next_w + 2, self._next_h + 2, GREY)
+        cell = self._next_cell
+        self._preview = TileMap(
+            ssd, self._next_x, self._next_y, 4, 4, cell, cell, TILES, gap=1, bg=BLACK
+        )
 
         # Board frame
         display.rect(
@@ -387,6 +384,10 @@ class TetrisGameScreen(Screen):
             GREY,
         )
         display.fill_rect(BOARD_X, BOARD_Y, BOARD_W * CELL, BOARD_H * CELL, BLACK)
+        # composite of the locked board and the active piece, 0 empty, else 1..7
+        self._board = TileMap(
+            ssd, BOARD_X, BOARD_Y, BOARD_W, BOARD_H, CELL, CELL, TILES, gap=1, bg=BLACK
+        )
 
         # Button events for discrete actions.
         ev_subset = ButtonEvents.get_event_subset(
@@ -408,30 +409,37 @@ class TetrisGameScreen(Screen):
         self._l_next = 0
         self._r_next = 0
 
+        # Game clock (ms), advanced by POLL_MS per FrameLoop update.
+        self._now = 0
         self._next_fall = 0
+        self._redraw = False
+        self._redraw_all = False
 
         # Start game
         self._game.spawn()
         self._update_hud(force=True)
         self._draw_next_preview(force=True)
         self._render_board(force=True)
-        ssd.show()
 
     def after_open(self):
         self._running = True
-        if not self._task_tick or self._task_tick.done():
-            self._task_tick = self.reg_task(self._tick_loop(), True)
+        self._next_fall = self._now + self._gravity_ms()
+        if self._frame is None:
+            self._frame = FrameLoop.add(self._update, self._render, step_ms=POLL_MS)
         if not self._task_btn or self._task_btn.done():
             self._task_btn = self.reg_task(self._btn_loop(), True)
 
     def on_hide(self):
         self._running = False
-        for t in (self._task_tick, self._task_btn):
-            try:
-                if t and not t.done():
-                    t.cancel()
-            except Exception:
-                pass
+        if self._frame is not None:
+            FrameLoop.remove(self._frame)
+            self._frame = None
+        t = self._task_btn
+        try:
+            if t and not t.done():
+                t.cancel()
+        except Exception:
+            pass
 
     def _gravity_ms(self) -> int:
         ms = int(800 * (0.85 ** self._game.level))
@@ -496,7 +504,7 @@ class TetrisGameScreen(Screen):
                 self._paused = not self._paused
                 self.lbl_status.value("PAUSED" if self._paused else "")
                 # Reset fall timer so gravity doesn't "catch up" instantly on resume.
-                self._next_fall = _ticks_add(_ticks_ms(), self._gravity_ms())
+                self._next_fall = self._now + self._gravity_ms()
                 continue
 
             if self._paused or self._game.game_over:
@@ -504,7 +512,7 @@ class TetrisGameScreen(Screen):
 
             if btn in ("btn_u", "btn_a"):
                 if self._game.try_rotate_cw():
-                    self._render_board()
+                    self._redraw = True
                 continue
 
             if btn == "btn_b":
@@ -519,7 +527,7 @@ class TetrisGameScreen(Screen):
             return False
         ok = fn(*args)
         if ok:
-            self._render_board()
+            self._redraw = True
         return ok
 
     def _lock_step(self):
@@ -527,10 +535,8 @@ class TetrisGameScreen(Screen):
         if not self._game.spawn():
             self._go_game_over()
             return
-        self._update_hud()
-        self._draw_next_preview()
-        self._render_board(force=True)
-        self._next_fall = _ticks_add(_ticks_ms(), self._gravity_ms())
+        self._redraw_all = True
+        self._next_fall = self._now + self._gravity_ms()
 
     def _go_game_over(self):
         self._game.game_over = True
@@ -554,30 +560,34 @@ class TetrisGameScreen(Screen):
 
         asyncio.create_task(_change())
 
-    async def _tick_loop(self):
-        self._next_fall = _ticks_add(_ticks_ms(), self._gravity_ms())
-        while self._running:
-            now = _ticks_ms()
-            self._poll_holds(now)
-
-            if not self._paused and not self._game.game_over:
-                if _ticks_diff(now, self._next_fall) >= 0:
-                    if self._hold_d:
-                        # Soft drop points per step when held.
-                        if self._game.try_move(0, 1):
-                            self._game.score += 1
-                            self._render_board()
-                        else:
-                            self._lock_step()
-                    else:
-                        if self._game.try_move(0, 1):
-                            self._render_board()
-                        else:
-                            self._lock_step()
-                    self._update_hud()
-                    self._next_fall = _ticks_add(now, self._gravity_ms())
-
-            await asyncio.sleep_ms(POLL_MS)
+    def _update(self):
+        # One POLL_MS step of game time, FrameLoop keeps the pace.
+        if not self._running:
+            return
+        self._now += POLL_MS
+        now = self._now
+        self._poll_holds(now)
+
+        if self._paused or self._game.game_over or now < self._next_fall:
+            return
+        if self._game.try_move(0, 1):
+            if self._hold_d:
+                # Soft drop points per step when held.
+                self._game.score += 1
+            self._redraw = True
+        else:
+            self._lock_step()
+        self._next_fall = now + self._gravity_ms()
+
+    def _render(self):
+        # Once per frame, FrameLoop flushes the display right after.
+        if self._redraw_all:
+            self._draw_next_preview()
+            self._render_board(force=True)
+        elif self._redraw:
+            self._render_board()
+        self._redraw = self._redraw_all = False
+        self._update_hud()
 
     def _update_hud(self, force: bool = False):
         g = self._game
@@ -597,23 +607,20 @@ class TetrisGameScreen(Screen):
             return
         self._last_next_piece = pid
 
-        # Clear preview area
-        display.fill_rect(self._next_x, self._next_y, self._next_w, self._next_h, BLACK)
-
-        col = PIECE_COLORS[pid]
+        tm = self._preview
+        tm.fill(0)
         # Show rotation 0
         for dx, dy in PIECES[pid][0]:
-            x = self._next_x + dx * self._next_cell
-            y = self._next_y + dy * self._next_cell
-            display.fill_rect(x, y, self._next_cell - 1, self._next_cell - 1, col)
-        ssd.show()
+            tm.set(dx, dy, pid + 1)
+        if force:
+            tm.invalidate()
+        tm.render()
 
     def _render_board(self, force: bool = False):
-        # Composite buffer = locked board + active piece.
-        rb = self._render_buf
-        bd = self._game.board
-        for i in range(len(rb)):
-            rb[i] = bd[i]
+        # Composite = locked board + active piece, TileMap draws what changed.
+        tm = self._board
+        rb = tm.cells
+        rb[:] = self._game.board
 
         active_color_id = self._game.piece_id + 1
         for x, y in self._game._cells_for(
@@ -622,22 +629,10 @@ class TetrisGameScreen(Screen):
             if 0 <= x < BOARD_W and 0 <= y < BOARD_H:
                 rb[y * BOARD_W + x] = active_color_id
 
-        last = self._last_draw
-        dirty = False
-        for i in range(len(rb)):
-            v = rb[i]
-            if not force and v == last[i]:
-                continue
-            last[i] = v
-            dirty = True
-            x = i % BOARD_W
-            y = i // BOARD_W
-            color = BLACK if v == 0 else PIECE_COLORS[v - 1]
-            px = BOARD_X + x * CELL
-            py = BOARD_Y + y * CELL
-            display.fill_rect(px, py, CELL - 1, CELL - 1, color)
-        if dirty:
-            ssd.show()
+        # drawn now, FrameLoop sends the changed cells at the end of the frame
+        if force:
+            tm.invalidate()
+        tm.render()
 
 
 def badge_game_config():
@@ -1,12 +1,11 @@
-import asyncio
-
-import gc
 import random
 
 from time import time
 
 import umsgpack
 
+from bdg.msg.pipeline import SendPipeline
+
 
 # Low level messages that handle connection link
 class BadgeMsg(object):
@@ -69,6 +68,12 @@ class BadgeMsg(object):
 
             d = umsgpack.loads(dump)
 
+            if isinstance(d, list):
+                # compact AppMsg, only sent to peers that negotiated it
+                from bdg.msg.codec import unpack_app
+
+                return unpack_app(d)
+
             if not isinstance(d, dict):
                 print("desrlz: unpacked payload is not a dict")
                 return None
@@ -114,6 +119,17 @@ class BeaconMsg(BadgeMsg):
         self.nick: str = nick
 
 
+# Extra beacon fields, sent every few beacons. Older firmware counts it as a
+# malformed message, which is harmless below 3 per 10 s. Unknown fields are
+# ignored, so later firmware can add more.
+@BadgeMsg.register
+class BeaconExt(BadgeMsg):
+    def __init__(self, fw: str = "", nb: list = None, **ext):
+        super().__init__()
+        self.fw: str = fw  # firmware version this badge shares, see bdg.msg.fwshare
+        self.nb: list = nb  # neighbour digest, see bdg.msg.gossip
+
+
 # Low level message that handle connection link
 @BadgeMsg.register
 class AckMsg(BadgeMsg):
@@ -212,33 +228,13 @@ class VictoryMsg(BadgeMsg):
 
 
 async def send_message(espnow, mac: bytes, msg: bytes, sync=False, retries=3):
-    for _ in range(retries):  # tree retries on sending
-        try:
-            await espnow.asend(mac, msg, sync=sync)
-            print(f"<<<{mac}:{msg}")
-            return
-        except OSError as err:
-            print(f"send retry: {err}")
-            if len(err.args) < 2:
-                raise err
-            if err.args[1] == "ESP_ERR_ESPNOW_NOT_INIT":
-                espnow.active(True)
-                gc.collect()
-            elif err.args[1] == "ESP_ERR_ESPNOW_NOT_FOUND":
-                espnow.add_peer(mac)
-                gc.collect()
-            elif err.args[1] == "ESP_ERR_ESPNOW_IF":
-                import network
-
-                network.WLAN(network.STA_IF).active(True)
-                gc.collect()
-            else:
-                raise err
-        except Exception as e:
-            print(f"send message Exeption {e}")
-            raise e
+    """Queue msg to mac and wait until the driver took it, returns True if sent."""
+    return await SendPipeline.of(espnow).send(mac, msg, sync, retries)
+
 
-    print("msg-send out")
+def post_message(espnow, mac: bytes, msg: bytes, sync=False, retries=3, cb=None):
+    """Queue msg to mac without waiting, returns a SendFuture."""
+    return SendPipeline.of(espnow).submit(mac, msg, sync, retries, cb)
 
 
 class BadgeAdr(object):
@@ -0,0 +1,318 @@
+"""
+Chunked bulk transfer over a Connection, for blobs larger than one frame.
+
+The sender offers a blob with BulkStart (sent with retries). When the receiver
+accepts, the sender posts up to `window` BulkChunk frames without per-frame
+retries. The receiver answers with BulkAck: every chunk below base arrived,
+and bit i of sack means chunk base + 1 + i arrived too. Chunks that stay
+unacknowledged for the retransmit timeout are sent again, chunks the receiver
+already has are not.
+
+Chunks are written straight to their offset in the receiver's buffer or file,
+the sender reads them from its buffer or file when they are sent, so neither
+side holds the blob twice.
+
+    # sender
+    ok = await conn.send_blob(image_bytes, name="cat.bimg")
+    with open("/save.bin", "rb") as f:
+        ok = await conn.send_blob(f)
+
+    # receiver, BulkStart arrives like any other message
+    async for msg in conn.get_msg_aiter():
+        if isinstance(msg, BulkStart):
+            buf = bytearray(msg.size)
+            await conn.recv_blob(msg, buf)
+
+Both badges need the CAP_WINDOW capability (bdg.msg.codec). The receiving
+listener still paces frames with rx_yield_s, which bounds the throughput on
+the badge.
+"""
+
+import asyncio
+import random
+from time import ticks_ms, ticks_diff
+
+from bdg.msg import AppMsg, BadgeMsg
+
+CHUNK = 200  # payload bytes per frame, ESP-NOW frames are at most 250 bytes
+SACK_BITS = 32
+
+
+@AppMsg.register
+class BulkStart(BadgeMsg):
+    """Offer of blob x, size bytes in pieces of chunk bytes, w chunks in flight"""
+
+    def __init__(self, x: int, size: int, chunk: int, w: int, name: str = ""):
+        super().__init__()
+        self.x = x
+        self.size = size
+        self.chunk = chunk
+        self.w = w
+        self.name = name
+
+
+@AppMsg.register
+class BulkChunk(BadgeMsg):
+    """Chunk n of blob x"""
+
+    def __init__(self, x: int, n: int, d: bytes):
+        super().__init__()
+        self.x = x
+        self.n = n
+        self.d = d
+
+
+@AppMsg.register
+class BulkAck(BadgeMsg):
+    """Chunks below base and base + 1 + i for bit i of sack arrived, -1 refuses"""
+
+    def __init__(self, x: int, base: int, sack: int = 0):
+        super().__init__()
+        self.x = x
+        self.base = base
+        self.sack = sack
+
+
+def valid_start(start) -> bool:
+    """Is BulkStart start an offer BulkReceiver can take, the peer sets every field."""
+    for v in (start.x, start.size, start.chunk, start.w):
+        if not isinstance(v, int):
+            return False
+    return start.chunk > 0 and start.size >= 0 and isinstance(start.name, str)
+
+
+class BulkSender(object):
+    """
+    Sends one blob, see Connection.send_blob().
+
+    Args:
+        conn (Connection): Connection to the receiver.
+        src: bytes like object, or a file opened in binary mode.
+        size (int): Bytes to send, default is the whole src.
+        name (str): Passed to the receiver in BulkStart.
+        chunk (int): Payload bytes per frame.
+        window (int): Chunks in flight.
+    """
+
+    def __init__(self, conn, src, size=None, name="", chunk=CHUNK, window=8):
+        self.conn = conn
+        self.src = src
+        self.file = hasattr(src, "read")
+        if size is None:
+            if self.file:
+                src.seek(0, 2)
+                size = src.tell()
+            else:
+                size = len(src)
+        self.size = size
+        self.name = name
+        self.chunk = chunk
+        self.n = (size + chunk - 1) // chunk
+        self.window = window
+        self.x = random.getrandbits(16)
+        self.base = -2  # no answer yet, -1 refused
+        self.sacked = set()
+        self.inflight = {}  # chunk -> ticks_ms it was sent
+        self.resends = set()  # chunks in flight that were sent more than once
+        self.srtt = None
+        self.backoff = 1
+        self.sent = 0
+        self.resent = 0
+        self.progress = ticks_ms()
+        self._got = asyncio.Event()
+        if not self.file:
+            self.src = memoryview(src)
+
+    def rto(self):
+        rto = 500 if self.srtt is None else max(100, int(2 * self.srtt))
+        return min(3000, rto * self.backoff)
+
+    def on_msg(self, msg):
+        if not isinstance(msg, BulkAck):
+            return
+        if not isinstance(msg.base, int) or not isinstance(msg.sack, int):
+            return
+        now = ticks_ms()
+        if msg.base > self.base:
+            k = msg.base - 1
+            # round trips of resent chunks are ambiguous, leave them out
+            if k >= 0 and k in self.inflight and k not in self.resends:
+                rtt = ticks_diff(now, self.inflight[k])
+                if self.srtt is None:
+                    self.srtt = rtt
+                else:
+                    self.srtt += (rtt - self.srtt) / 8
+            if msg.base >= 0:
+                for k in [k for k in self.inflight if k < msg.base]:
+                    del self.inflight[k]
+                self.sacked = {k for k in self.sacked if k >= msg.base}
+                self.resends = {k for k in self.resends if k >= msg.base}
+            self.base = msg.base
+            self.progress = now
+            self.backoff = 1
+        for i in range(SACK_BITS):
+            if msg.sack >> i & 1:
+                k = msg.base + 1 + i
+                if k not in self.sacked:
+                    self.sacked.add(k)
+                    self.inflight.pop(k, None)
+                    self.progress = now
+        self._got.set()
+
+    def _read(self, k):
+        off = k * self.chunk
+        ln = min(self.chunk, self.size - off)
+        if self.file:
+            self.src.seek(off)
+            return self.src.read(ln)
+        return bytes(self.src[off : off + ln])
+
+    def _send(self, k, now):
+        if k in self.inflight:
+            self.resent += 1
+            self.resends.add(k)
+        self.inflight[k] = now
+        self.sent += 1
+        self.conn.post_app_msg(BulkChunk(self.x, k, self._read(k)))
+
+    async def _wait(self, timeout_ms):
+        self._got.clear()
+        try:
+            await asyncio.wait_for_ms(self._got.wait(), timeout_ms)
+        except asyncio.TimeoutError:
+            pass
+        if self.conn.closed:
+            self.base = -1  # the receiver left, maybe after the last ack got lost
+        elif ticks_diff(ticks_ms(), self.progress) > self.timeout_ms:
+            raise asyncio.TimeoutError
+
+    async def run(self, timeout_ms=5000):
+        """True when the receiver has everything, False if it refused or left."""
+        self.timeout_ms = timeout_ms
+        self.conn.bulk[self.x] = self
+        try:
+            start = BulkStart(self.x, self.size, self.chunk, self.window, self.name)
+            self.conn.send_app_msg(start)
+            while self.base == -2:
+                await self._wait(self.rto())
+            if self.base < 0:
+                return False
+            while 0 <= self.base < self.n:
+                now = ticks_ms()
+                rto = self.rto()
+                timed_out = False
+                for k in range(self.base, min(self.n, self.base + self.window)):
+                    if k in self.sacked:
+                        continue
+                    t = self.inflight.get(k)
+                    if t is None:
+                        self._send(k, now)
+                    elif ticks_diff(now, t) > rto:
+                        timed_out = True
+                        self._send(k, now)
+                if timed_out:
+                    # the receiver may just be slow, do not flood it
+                    self.backoff = min(4, self.backoff * 2)
+                await self._wait(rto)
+            return self.base == self.n
+        finally:
+            del self.conn.bulk[self.x]
+
+
+class BulkReceiver(object):
+    """
+    Receives the blob of a BulkStart into a buffer or file, see Connection.recv_blob().
+
+    Args:
+        conn (Connection): Connection to the sender.
+        start (BulkStart): The offer.
+        into: Writable buffer of at least start.size bytes, or a file opened
+            for writing in binary mode.
+        ack_every (int): Acknowledge after this many chunks in order, at most
+            half the sender's window. Gaps are acknowledged at once.
+    """
+
+    def __init__(self, conn, start: BulkStart, into, ack_every=4):
+        if not valid_start(start):
+            raise ValueError("malformed BulkStart")
+        self.conn = conn
+        self.x = start.x
+        self.size = start.size
+        self.chunk = start.chunk
+        self.n = (start.size + start.chunk - 1) // start.chunk
+        self.file = hasattr(into, "write")
+        if not self.file and len(into) < self.size:
+            raise ValueError("buffer too small")
+        self.into = into if self.file else memoryview(into)
+        self.ack_every = max(1, min(ack_every, start.w // 2))
+        self.have = bytearray((self.n + 7) // 8)
+        self.base = 0
+        self.got = 0
+        self.dup = 0
+        self.finished = False
+        self._since_ack = 0
+        self.progress = ticks_ms()
+        self._done = asyncio.Event()
+
+    def _has(self, k):
+        return self.have[k >> 3] >> (k & 7) & 1
+
+    def _ack(self):
+        sack = 0
+        for i in range(SACK_BITS):
+            k = self.base + 1 + i
+            if k >= self.n:
+                break
+            if self._has(k):
+                sack |= 1 << i
+        self._since_ack = 0
+        self.conn.post_app_msg(BulkAck(self.x, self.base, sack))
+
+    def on_msg(self, msg):
+        if not isinstance(msg, BulkChunk) or not isinstance(msg.n, int):
+            return
+        if not 0 <= msg.n < self.n or not isinstance(msg.d, (bytes, bytearray)):
+            return
+        k = msg.n
+        off = k * self.chunk
+        if len(msg.d) != min(self.chunk, self.size - off):
+            return  # would write past the chunk, or grow a bytearray target
+        if self._has(k):
+            self.dup += 1
+            self._ack()  # the sender missed our ack
+            return
+        if self.file:
+            self.into.seek(off)
+            self.into.write(msg.d)
+        else:
+            self.into[off : off + len(msg.d)] = msg.d
+        self.have[k >> 3] |= 1 << (k & 7)
+        self.got += 1
+        self.progress = ticks_ms()
+        gap = k != self.base
+        while self.base < self.n and self._has(self.base):
+            self.base += 1
+        self._since_ack += 1
+        if gap or self._since_ack >= self.ack_every or self.base == self.n:
+            self._ack()
+        if self.base == self.n:
+            self.finished = True
+            self._done.set()
+
+    async def run(self, timeout_ms=5000, idle_ack_ms=200):
+        """Returns the size once every chunk arrived."""
+        conn = self.conn
+        # earlier transfers only answer late duplicates, a new one replaces them
+        for x in [x for x, b in conn.bulk.items() if getattr(b, "finished", False)]:
+            del conn.bulk[x]
+        conn.bulk[self.x] = self
+        self._ack()  # accept
+        while not self.finished:
+            try:
+                await asyncio.wait_for_ms(self._done.wait(), idle_ack_ms)
+            except asyncio.TimeoutError:
+                if ticks_diff(ticks_ms(), self.progress) > timeout_ms:
+                    del conn.bulk[self.x]
+                    raise
+                self._ack()  # the accept or the last ack may be lost
+        return self.size
@@ -0,0 +1,162 @@
+import struct
+from time import ticks_ms, ticks_diff, time
+
+MAGIC = b"BCAP"
+VERSION = 1
+# segment header: magic, version, segment sequence number, time() at start
+HDR = "<4sBIi"
+HDR_SIZE = struct.calcsize(HDR)
+# record: ms since capture start, direction, rssi, mac, payload length
+REC = "<IBb6sH"
+REC_SIZE = struct.calcsize(REC)
+
+RX = 0
+TX = 1
+
+
+class Capture:
+    """
+    Capture received and sent ESP-NOW frames to flash.
+
+    Frames are packed into a RAM buffer and appended to a ring of segment
+    files (path0.bin ... path<segments-1>.bin). When a segment is full the
+    oldest one is overwritten, so flash usage stays at segments * seg_size.
+    Every start() opens a new segment, read() returns segments in order.
+
+    >>> from bdg.msg.capture import Capture
+    >>> Capture.start()  # NowListener and the send pipeline start recording
+    >>> Capture.stop()   # flush and detach
+
+    Copy the files with `mpremote cp :/capture0.bin .` and replay them on the
+    host with scripts/replay_capture.py.
+    """
+
+    active = None  # Capture instance NowListener and SendPipeline write to
+
+    def __init__(
+        self, path="/capture", segments=4, seg_size=16 * 1024, buf_size=1024
+    ):
+        self.path = path
+        self.segments = segments
+        self.seg_size = seg_size
+        self._buf = bytearray(buf_size)
+        self._pos = 0
+        self._f = None
+        self._seg_len = 0
+        self._seq = -1
+        self._t0 = ticks_ms()
+        self._flushed = self._t0
+        self.frames = 0
+        self.dropped = 0
+
+    @classmethod
+    def start(cls, *args, **kwargs) -> "Capture":
+        if cls.active is None:
+            cls.active = cls(*args, **kwargs)
+            cls.active._rotate()
+            print(f"capture: recording to {cls.active.path}*.bin")
+        return cls.active
+
+    @classmethod
+    def stop(cls):
+        cap, cls.active = cls.active, None
+        if cap is not None:
+            cap.close()
+            print(f"capture: {cap.frames} frames, {cap.dropped} dropped")
+
+    def rx(self, mac, rssi, msg):
+        self._add(RX, mac, rssi, msg)
+
+    def tx(self, mac, msg):
+        self._add(TX, mac, 0, msg)
+
+    def _add(self, direction, mac, rssi, msg):
+        n = len(msg)
+        if REC_SIZE + n > len(self._buf):
+            self.dropped += 1
+            return
+        now = ticks_ms()
+        if self._pos + REC_SIZE + n > len(self._buf):
+            self.flush()
+        elif ticks_diff(now, self._flushed) > 2000:
+            self.flush()  # keep the last seconds on flash if the badge crashes
+        t_ms = ticks_diff(now, self._t0)
+        struct.pack_into(REC, self._buf, self._pos, t_ms, direction, rssi, mac, n)
+        self._pos += REC_SIZE
+        self._buf[self._pos : self._pos + n] = msg
+        self._pos += n
+        self.frames += 1
+
+    def flush(self):
+        self._flushed = ticks_ms()
+        if not self._pos or self._f is None:
+            return
+        if self._seg_len + self._pos > self.seg_size:
+            self._rotate()
+        try:
+            self._f.write(memoryview(self._buf)[: self._pos])
+            self._f.flush()
+            self._seg_len += self._pos
+        except OSError as e:
+            print(f"capture: write failed {e}")
+            self.dropped += 1
+        self._pos = 0
+
+    def _rotate(self):
+        if self._f is not None:
+            self._f.close()
+        if self._seq < 0:
+            # continue after the newest segment of earlier captures
+            for seq, _ in segments(self.path, self.segments):
+                self._seq = max(self._seq, seq)
+        self._seq += 1
+        self._f = open(f"{self.path}{self._seq % self.segments}.bin", "wb")
+        self._f.write(struct.pack(HDR, MAGIC, VERSION, self._seq, int(time())))
+        self._seg_len = HDR_SIZE
+
+    def close(self):
+        self.flush()
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+
+def segments(path="/capture", count=4):
+    """Return [(seq, file name)] of existing capture segments, oldest first."""
+    found = []
+    for i in range(count):
+        name = f"{path}{i}.bin"
+        try:
+            with open(name, "rb") as f:
+                head = f.read(HDR_SIZE)
+        except OSError:
+            continue
+        if len(head) < HDR_SIZE:
+            continue
+        magic, version, seq, _ = struct.unpack(HDR, head)
+        if magic == MAGIC and version == VERSION:
+            found.append((seq, name))
+    found.sort()
+    return found
+
+
+def read(path="/capture", count=4):
+    """
+    Yield captured frames oldest first.
+
+    Yields:
+        tuple: (seq, t_ms, direction, rssi, mac, msg), t_ms counts from the
+        Capture.start() that recorded the frame.
+    """
+    for seq, name in segments(path, count):
+        with open(name, "rb") as f:
+            f.read(HDR_SIZE)
+            while True:
+                head = f.read(REC_SIZE)
+                if len(head) < REC_SIZE:
+                    break
+                t_ms, direction, rssi, mac, n = struct.unpack(REC, head)
+                msg = f.read(n)
+                if len(msg) < n:
+                    break  # torn write at power loss
+                yield seq, t_ms, direction, rssi, mac, msg
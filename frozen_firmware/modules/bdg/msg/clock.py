@@ -0,0 +1,155 @@
+import asyncio
+from time import ticks_ms, ticks_diff, ticks_add
+
+from bdg.msg import PingMsg
+
+
+class ClockSync(object):
+    """
+    NTP style clock offset and drift estimate towards the peer of a Connection.
+
+    Every exchange is a PingMsg: mark is our send time t1, the peer replies with
+    [t2, t3], its receive and reply times, and t4 is our receive time. Receive
+    times are the ESP-NOW driver timestamps, so time a frame waits in the
+    listener does not count. From the exchange with the smallest round trip:
+
+        offset = ((t2 - t1) + (t3 - t4)) / 2    peer clock - our clock
+        delay = (t4 - t1) - (t3 - t2)            error is at most delay / 2
+
+    The shared time base is the midpoint of both clocks, so both badges must run
+    sync() and nobody has to be the master. Times are ticks_ms values, compare
+    them with ticks_diff().
+
+    >>> clock = ClockSync(conn)
+    >>> await clock.sync()          # error bound in ms, None if it failed
+    >>> at = ticks_add(clock.now(), 1000)
+    >>> conn.send_app_msg(StartAt(at))
+    >>> await clock.sleep_until(at)  # the peer does the same with its clock
+    """
+
+    def __init__(self, conn, rounds=8):
+        self.conn = conn
+        conn.clock = self
+        self.rounds = rounds
+        self.points = []  # (t4, offset, delay) of the best exchange per round
+        self.offset = None  # peer - own clock in ms at self.ref
+        self.delay = None
+        self.ref = 0
+        self.drift = 0.0  # ms of offset change per ms
+        self.legacy = False  # peer replies without timestamps
+        self._round = []
+        self._pending = set()
+        self._got = asyncio.Event()
+        self._task = None
+
+    def on_reply(self, msg: PingMsg, t4) -> bool:
+        """Called by Connection for ping replies, False if it is not ours."""
+        if msg.mark not in self._pending:
+            return False
+        self._pending.discard(msg.mark)
+        if not isinstance(msg.reply, list):
+            self.legacy = True  # old firmware answers True
+            self._got.set()
+            return True
+
+        t1 = msg.mark
+        t2, t3 = msg.reply
+        # modular arithmetic, the clocks can be any distance apart
+        a = ticks_diff(t2, t1)
+        offset = a + ticks_diff(t3, ticks_add(t4, a)) // 2
+        delay = ticks_diff(t4, t1) - ticks_diff(t3, t2)
+        self._round.append((t4, offset, delay))
+        self._got.set()
+        return True
+
+    async def sync(self, pings=5, gap_ms=80, timeout_ms=1500):
+        """
+        Run one round of ping exchanges.
+
+        Returns:
+            int: Error bound in ms, None if no exchange completed.
+        """
+        self._round = []
+        for _ in range(pings):
+            t1 = ticks_ms()
+            self._pending.add(t1)
+            self.conn.send_app_msg(PingMsg(t1, False))
+            await asyncio.sleep_ms(gap_ms)
+
+        deadline = ticks_add(ticks_ms(), timeout_ms)
+        while self._pending and ticks_diff(deadline, ticks_ms()) > 0:
+            self._got.clear()
+            try:
+                await asyncio.wait_for_ms(
+                    self._got.wait(), max(1, ticks_diff(deadline, ticks_ms()))
+                )
+            except asyncio.TimeoutError:
+                break
+        self._pending.clear()
+
+        if not self._round:
+            return None
+        self.points.append(min(self._round, key=lambda p: p[2]))
+        self.points = self.points[-self.rounds :]
+        self._estimate()
+        return self.error()
+
+    def _estimate(self):
+        # offset from the latest round, drift from the trend over all rounds
+        t4, offset, delay = self.points[-1]
+        self.ref, self.offset, self.delay = t4, offset, max(0, delay)
+        if len(self.points) < 3:
+            return
+        xs = [ticks_diff(p[0], t4) for p in self.points]
+        if -xs[0] < 20_000:
+            return  # 1 ms resolution needs a long baseline
+        ys = [p[1] - offset for p in self.points]
+        mx = sum(xs) / len(xs)
+        my = sum(ys) / len(ys)
+        var = sum((x - mx) ** 2 for x in xs)
+        if var:
+            self.drift = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var
+
+    @property
+    def synced(self) -> bool:
+        return self.offset is not None
+
+    def peer_offset(self, at=None) -> int:
+        """Peer clock minus own clock in ms at local time at."""
+        age = ticks_diff(ticks_ms() if at is None else at, self.ref)
+        return self.offset + int(self.drift * age)
+
+    def error(self) -> int:
+        """Error bound of now() in ms."""
+        age = ticks_diff(ticks_ms(), self.ref)
+        return self.delay // 2 + 1 + int(abs(self.drift) * age)
+
+    def now(self) -> int:
+        """Shared time, the same on both badges within error()."""
+        t = ticks_ms()
+        return ticks_add(t, self.peer_offset(t) // 2)
+
+    def to_local(self, shared) -> int:
+        return ticks_add(shared, -(self.peer_offset() // 2))
+
+    async def sleep_until(self, shared):
+        wait = ticks_diff(self.to_local(shared), ticks_ms())
+        if wait > 0:
+            await asyncio.sleep_ms(wait)
+
+    async def _run(self, interval_s):
+        while self.conn.active:
+            await self.sync()
+            await asyncio.sleep(interval_s)
+
+    def start(self, interval_s=10):
+        """Keep the estimate fresh and learn the drift in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(interval_s))
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self.conn.clock is self:
+            self.conn.clock = None
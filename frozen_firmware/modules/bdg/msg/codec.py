@@ -0,0 +1,99 @@
+"""
+Protocol version and capabilities of a Connection, and the compact AppMsg codec.
+
+OpenConn cannot get new fields, older firmware rejects unknown constructor
+arguments. The version and capability bits travel in the high bits of
+OpenConn.session_id instead, which every firmware stores and echoes back:
+
+    bits  0-29  session base, ticks_ms of the requesting badge
+    bit   30    OFFER, set by a requester that can negotiate
+    bit   31    AGREED, set in the reply of an acceptor that can negotiate
+    bits 32-35  protocol version
+    bits 36-    capabilities, offered in the request, agreed in the reply
+
+An old acceptor echoes the request unchanged, OFFER is still set in the reply
+and the connection stays on the legacy format. An old requester never sets
+OFFER. Both badges use the session_id of the reply from then on.
+"""
+
+import umsgpack
+
+from bdg.msg import AppMsg
+
+VERSION = 1
+
+CAP_COMPACT = 1  # AppMsg as a msgpack list, see pack_app()
+CAP_BATCH = 2  # reserved: several frames per ESP-NOW packet
+CAP_COMPRESS = 4  # reserved: compressed payloads
+CAP_WINDOW = 8  # windowed bulk transfer, see bdg.msg.bulk
+CAP_POSTED = 16  # posted compact AppMsgs are marked and not acked
+
+CAPS = CAP_COMPACT | CAP_WINDOW | CAP_POSTED  # supported by this firmware
+
+SID_MASK = 0x3FFFFFFF
+OFFER = 1 << 30
+AGREED = 1 << 31
+
+
+def offer(sid) -> int:
+    """session_id for an OpenConn request."""
+    return (sid & SID_MASK) | OFFER | VERSION << 32 | CAPS << 36
+
+
+def answer(sid):
+    """session_id for the OpenConn reply and the agreed capabilities."""
+    if not sid & OFFER:
+        return sid, 0  # legacy requester
+    version = min(VERSION, sid >> 32 & 0xF)
+    caps = sid >> 36 & CAPS
+    return (sid & SID_MASK) | AGREED | version << 32 | caps << 36, caps
+
+
+def agreed(sid) -> int:
+    """Capabilities of a connection from the session_id of the reply."""
+    if sid & OFFER or not sid & AGREED:
+        return 0
+    return sid >> 36 & CAPS
+
+
+def pack_app(amsg: AppMsg, posted=False) -> bytes:
+    """
+    Serialize without the field names of the AppMsg envelope:
+
+        [con_id, id, session_id, content msg_type, {content fields}]
+
+    A posted frame (CAP_POSTED) has a sixth element 1, the receiver does not
+    ack it: the sender never retries it and the ack would only cost airtime.
+    """
+    fields = amsg.content.to_dict()
+    ctype = fields.pop("msg_type")
+    d = [amsg.con_id, amsg.id, amsg.session_id, ctype, fields]
+    if posted:
+        d.append(1)
+    return umsgpack.dumps(d)
+
+
+def unpack_app(d: list) -> AppMsg:
+    """Inverse of pack_app() for the unpacked list, called by BadgeMsg.desrlz.
+
+    Returns None for a malformed list, like the dict path of desrlz.
+    """
+    if len(d) < 5:
+        print("unpack_app: short compact frame")
+        return None
+    con_id, mid, sid, ctype, fields = d[:5]
+    if (
+        not isinstance(con_id, int)
+        or not isinstance(mid, int)
+        or not (sid is None or isinstance(sid, int))
+        or not isinstance(ctype, str)
+        or not isinstance(fields, dict)
+    ):
+        print("unpack_app: invalid header types", con_id, mid, ctype)
+        return None
+    fields["msg_type"] = ctype
+    msg = AppMsg(fields, con_id, sid)
+    msg.__id = mid
+    if len(d) > 5 and d[5]:
+        msg.posted = True  # not an __init__ field, legacy to_dict() must not see it
+    return msg
@@ -1,27 +1,46 @@
 import asyncio
-from time import ticks_ms, ticks_diff, time
+from time import ticks_ms, ticks_us, ticks_diff, ticks_add, time
 
 import aioespnow
-from collections import namedtuple, deque
+from collections import namedtuple, deque, OrderedDict
 
 from bdg.msg import (
     OpenConn,
     send_message,
+    post_message,
     ConTerm,
     PingMsg,
     AppMsg,
     BadgeMsg,
     BeaconMsg,
+    BeaconExt,
     BadgeAdr,
     BadgeAdrDict,
     AckMsg,
 )
+from bdg.msg import codec
+from bdg.msg.bulk import (
+    BulkAck,
+    BulkChunk,
+    BulkReceiver,
+    BulkSender,
+    BulkStart,
+    valid_start,
+)
+from bdg.msg.capture import Capture
+from bdg.msg.link import LinkQuality
+from bdg.msg.metrics import Metrics
+from bdg.msg.peers import PeerSlots
 
-from bdg.utils import AProc
+from bdg.aproc import AProc
+from bdg import trace
 from primitives import Queue
 
 
-OutQueMsg = namedtuple("OutQueMsg", ["msg", "mac", "id", "retry"])
+# t is ticks_ms of the first send, for the ack round trip time
+# con_id is set for AppMsg frames, they are handed back to the Connection when
+# the retries run out
+OutQueMsg = namedtuple("OutQueMsg", ["msg", "mac", "id", "retry", "t", "con_id"])
 OutQueAck = namedtuple("OutQueMsg", ["mac", "id"])
 
 
@@ -36,6 +55,33 @@ class Connection(object):
         last_msg (timestamp): Timestamp of the last message received.
         con_id: Unique identifier for the app that uses this connection. Like content-type
         in_q (Queue): Queue to store incoming messages.
+        metrics (Metrics): Counters and latencies, registered as con<con_id>.
+        clock (ClockSync): Set by bdg.msg.clock.ClockSync, gets the ping replies.
+        initiator (bool): True on the badge that requested the connection.
+        caps (int): Capabilities both badges support, see bdg.msg.codec.
+        bulk (dict): Running bulk transfers by transfer id, see bdg.msg.bulk.
+        lost_at (int): ticks_ms when the link was lost, None while it works.
+        retx (deque): Unacked AppMsg frames kept for replay after a resume.
+        last_rx (int): ticks_ms of the last frame or ack from the peer.
+        link (LinkQuality): RSSI, delivery ratio and round trip estimate.
+        peer_lost (asyncio.Event): Set when max_misses heartbeats went unanswered.
+        on_peer_lost: Optional callback, called with the connection.
+
+    A frame whose retries run out does not end the connection. It goes to the
+    retransmit buffer and the session is kept for grace_s while probes (PingMsg
+    with mark PROBE) are sent every probe_ms. The first message from the peer
+    on the same con_id and session_id resumes it and the buffered frames are
+    sent again with their original ids, so the peer drops the ones it already
+    got. They are replayed one at a time, each after the ack of the one before,
+    so the peer gets them in the order they were sent. Frames sent while the
+    link is lost or the replay runs are buffered as well. After grace_s
+    without an answer the connection is terminated.
+
+    Idle connections are kept alive by NowListener: when nothing arrived from
+    the peer for idle_ms times the number of active connections, a heartbeat
+    (PingMsg with mark HEARTBEAT) is sent without retries. max_misses
+    heartbeats in a row without an answer set peer_lost and start the probes
+    and grace period above.
 
     Methods:
         async connect(self, rcvr=False):
@@ -53,6 +99,10 @@ class Connection(object):
         async send_app_msg(self, msg: BadgeMsg, sync=False):
             Sends an application message over the connection. Receiving end gets the same class as the sender sent.
 
+        post_app_msg(self, msg: BadgeMsg):
+            Sends an application message once, without ack wait and retries. With
+            CAP_POSTED the receiver does not ack it either.
+
         async send_msg_b(self, msg: bytes, sync=False):
             Sends a byte message over the connection.
 
@@ -61,8 +111,28 @@ class Connection(object):
 
         get_msg_aiter(self):
             Returns an asynchronous iterator to iterate over incoming messages.
+
+        async send_blob(self, src, size=None, name="", timeout=5.0):
+            Sends a buffer or file larger than one frame, see bdg.msg.bulk.
+
+        async recv_blob(self, start, into, timeout=5.0):
+            Accepts a BulkStart and writes the blob into a buffer or file.
+
+        link_lost(self, data=None, msg_id=None):
+            Buffers an unacked frame and starts probing for the peer. Called by NowListener.
+
+        keepalive(self, idle_ms):
+            Sends a heartbeat when the connection is idle. Called by NowListener.
     """
 
+    PROBE = -1  # PingMsg mark of resume probes, old firmware answers them too
+    HEARTBEAT = -2
+    grace_s = 15  # keep a lost session this long
+    probe_ms = 250
+    retx_size = 8
+    idle_ms = 2000  # heartbeat interval of a single idle connection
+    max_misses = 3
+
     # Connection is a bidirectional communication channel between two badges
     #
     def __init__(self, mac: bytes, con_id, espnow):
@@ -78,6 +148,21 @@ class Connection(object):
         self.session_id = ticks_ms()  # unique session ID to prevent cross-session messages
         self.in_q = Queue(maxsize=5)
         self.out_q = Queue(maxsize=3)
+        self.metrics = Metrics()
+        self.link = LinkQuality()
+        self.metrics.link = self.link
+        self.clock = None
+        self.initiator = False  # this badge sent the connection request
+        self.caps = 0  # legacy format until the OpenConn reply says otherwise
+        self.bulk = {}
+        self.lost_at = None
+        self.retx = deque([], self.retx_size)
+        self.replaying = False
+        self.last_rx = ticks_ms()
+        self.hb_sent = None  # ticks_ms of the unanswered heartbeat
+        self.misses = 0
+        self.peer_lost = asyncio.Event()
+        self.on_peer_lost = None
 
         NowListener.register_con(self)
 
@@ -98,12 +183,13 @@ class Connection(object):
 
     async def connect(self, rcvr=False):
         try:
-            oc = OpenConn(con_id=self.con_id, session_id=self.session_id)
+            oc = OpenConn(con_id=self.con_id, session_id=codec.offer(self.session_id))
             if rcvr:
                 self.send_msg(oc)
                 self.active = True
                 return True
             else:
+                self.initiator = True
                 reply = await self.send_wait_reply(oc, timeout=20)
             if (
                 not isinstance(reply, OpenConn)
@@ -115,6 +201,7 @@ class Connection(object):
             # Store peer's session_id from their reply
             if hasattr(reply, 'session_id') and reply.session_id:
                 self.session_id = reply.session_id
+                self.caps = codec.agreed(reply.session_id)
             # connection made
             self.active = True
             return True
@@ -142,12 +229,18 @@ class Connection(object):
             return  # cannot send on closed connection
         while self.out_q.qsize() > 0 or self.active:
             msg = await asyncio.wait_for(self.out_q.get(), 5000)
-            print(f"_s:  {msg}")
+            if trace.level >= trace.DEBUG:  # tid() is a dict lookup, skip it too
+                trace.rec(trace.DEBUG, trace.CONN_SEND, self.con_id, trace.tid(msg))
             self.send_app_msg(msg, sync=False)
 
     async def recv_msg(self, msg: BadgeMsg):
         # internal recv_msg that is called from NowListener
-        print(f"recv-msg {msg=}")
+        if trace.level >= trace.DEBUG:
+            trace.rec(trace.DEBUG, trace.CONN_RX, self.con_id, trace.tid(msg))
+        self.metrics.frames_in += 1
+        self._alive(msg)
+        if self.lost_at is not None:
+            self._resumed()  # the peer still has this session
         if isinstance(msg, ConTerm):
             if self.active:
                 await self.terminate(send_out=False)
@@ -157,40 +250,212 @@ class Connection(object):
                 # Store peer's session_id from their OpenConn
                 if hasattr(msg, 'session_id') and msg.session_id:
                     self.session_id = msg.session_id
-                self.in_q.put_nowait(msg)
+                self._put(msg)
                 self.active = True
                 print(f"connection {self.con_id} activated, session_id={self.session_id}")
             # self.send_msg(AckMsg(id=msg.id), retry=0)
         elif isinstance(msg, PingMsg):
             if msg.reply:
-                self.in_q.put_nowait(msg)
+                if msg.mark < 0:
+                    return  # probe or heartbeat, handled by _alive()
+                if self.clock is None or not self.clock.on_reply(msg, self._rx_ticks()):
+                    self._put(msg)
                 return
-            msg.reply = True
-            self.send_app_msg(msg)
+            # receive and reply time for ClockSync, old firmware replies True
+            msg.reply = [self._rx_ticks(), ticks_ms()]
+            if msg.mark < 0:
+                self.post_app_msg(msg)  # the peer sends another when it is lost
+            else:
+                self.send_app_msg(msg)
+        elif isinstance(msg, (BulkChunk, BulkAck)):
+            # the peer sets x, an unhashable one must not reach the dict
+            handler = self.bulk.get(msg.x) if isinstance(msg.x, int) else None
+            if handler is not None:
+                handler.on_msg(msg)  # late frames of finished transfers are dropped
+        elif isinstance(msg, BulkStart) and not valid_start(msg):
+            print(f"con {self.con_id}: malformed BulkStart dropped")
         elif not self.active:
             print("connection not active")
         else:
-            # this can block, should check quefull and return something to client B
-            self.in_q.put_nowait(msg)
+            self._put(msg)
+
+    def _alive(self, msg):
+        now = ticks_ms()
+        self.last_rx = now
+        self.link.rssi_sample(self.espnow.peers_table[self.c_mac][0])
+        if self.hb_sent is not None:
+            if isinstance(msg, PingMsg) and msg.reply and msg.mark == self.HEARTBEAT:
+                self.link.sample(True, ticks_diff(now, self.hb_sent))
+            self.hb_sent = None
+        self.misses = 0
+
+    def keepalive(self, idle_ms):
+        """Send a heartbeat if the peer was silent for idle_ms, count misses."""
+        if not self.active or self.lost_at is not None:
+            return
+        now = ticks_ms()
+        if ticks_diff(now, self.last_rx) < idle_ms:
+            return
+        if self.hb_sent is not None:
+            if ticks_diff(now, self.hb_sent) < idle_ms:
+                return
+            self.misses += 1
+            self.link.sample(False)
+            if self.misses >= self.max_misses:
+                self._peer_lost()
+                return
+        self.hb_sent = now
+        self.metrics.heartbeats += 1
+        self.post_app_msg(PingMsg(self.HEARTBEAT, False))
+
+    def _peer_lost(self):
+        trace.rec(trace.INFO, trace.PEER_LOST, self.con_id, self.misses, self.c_mac)
+        self.metrics.peers_lost += 1
+        self.hb_sent = None
+        self.misses = 0
+        self.peer_lost.set()
+        if self.on_peer_lost:
+            self.on_peer_lost(self)
+        self.link_lost()
+
+    def _rx_ticks(self):
+        # driver receive time of the frame being handled, raw ms since boot
+        return ticks_add(self.espnow.peers_table[self.c_mac][1], 0)
+
+    def _put(self, msg):
+        if self.in_q.full():
+            # app is not reading, drop instead of taking down NowListener
+            self.metrics.q_overflow += 1
+            NowListener.metrics.q_overflow += 1
+            return
+        self.in_q.put_nowait(msg)
 
     def send_app_msg(self, msg: BadgeMsg, sync=False):
         amsg = AppMsg(con_id=self.con_id, content=msg, session_id=self.session_id)
         if self.closed:
             print(f"cannot send {self.con_id=} is terminated")
             return  # cannot send on closed connection
-        NowListener.send_msg(amsg, self.c_mac, sync=sync)
+        data = self._pack(amsg)
+        if self.lost_at is not None or self.replaying:
+            self._buffer(data, amsg.id)  # sent after the frames before it
+            return
+        NowListener.send_data(data, self.c_mac, amsg.id, con_id=self.con_id)
+        self._count_out(len(data))
+
+    def post_app_msg(self, msg: BadgeMsg):
+        """Send once without waiting for an ack, for streams that repair loss."""
+        if self.closed:
+            return
+        amsg = AppMsg(con_id=self.con_id, content=msg, session_id=self.session_id)
+        data = self._pack(amsg, posted=True)
+        post_message(self.espnow, self.c_mac, data)
+        self._count_out(len(data))
+
+    def _pack(self, amsg: AppMsg, posted=False) -> bytes:
+        if self.caps & codec.CAP_COMPACT:
+            return codec.pack_app(amsg, posted and self.caps & codec.CAP_POSTED)
+        return amsg.srlz()
 
     def send_msg(self, msg: BadgeMsg, sync=False, retry=3):
         if self.closed:
             print(f"cannot send {self.con_id=} is terminated")
             return  # cannot send on closed connection # TODO :raise
-        NowListener.send_msg(msg, self.c_mac, sync=sync, retry=retry)
+        self._count_out(NowListener.send_msg(msg, self.c_mac, sync=sync, retry=retry))
+
+    def _buffer(self, data, msg_id):
+        if len(self.retx) == self.retx_size:
+            self.metrics.q_overflow += 1  # the oldest frame is dropped
+        self.retx.append((data, msg_id))
+
+    def link_lost(self, data=None, msg_id=None):
+        if self.closed:
+            return
+        if data is not None:
+            self._buffer(data, msg_id)
+        if self.lost_at is None:
+            self.lost_at = ticks_ms()
+            self.metrics.link_losses += 1
+            trace.rec(
+                trace.INFO, trace.LINK_LOST, self.con_id, len(self.retx), self.c_mac
+            )
+            asyncio.create_task(self._probe())
+
+    async def _probe(self):
+        # look for the peer until it answers on this session or grace_s is over
+        while self.lost_at is not None and not self.closed:
+            if ticks_diff(ticks_ms(), self.lost_at) > self.grace_s * 1000:
+                trace.rec(
+                    trace.ERROR,
+                    trace.SESSION_GONE,
+                    self.con_id,
+                    len(self.retx),
+                    self.c_mac,
+                )
+                self.lost_at = None
+                await self.terminate()
+                return
+            self.post_app_msg(PingMsg(self.PROBE, False))
+            await asyncio.sleep_ms(self.probe_ms)
+
+    def _resumed(self):
+        ms = ticks_diff(ticks_ms(), self.lost_at)
+        self.lost_at = None
+        self.peer_lost.clear()
+        self.metrics.resumes += 1
+        trace.rec(trace.INFO, trace.RESUMED, self.con_id, ms, self.c_mac)
+        if self.retx and not self.replaying:
+            self.replaying = True
+            asyncio.create_task(self._replay())
+
+    async def _replay(self):
+        # one frame in flight at a time, jitter on the medium cannot reorder them
+        try:
+            while self.retx and self.lost_at is None and not self.closed:
+                frames = list(self.retx)
+                self.retx = deque([], self.retx_size)
+                for i, (data, msg_id) in enumerate(frames):
+                    if not await NowListener.send_acked(
+                        data, self.c_mac, msg_id, self.con_id
+                    ):
+                        # lost again, keep the rest ahead of frames buffered since
+                        later = list(self.retx)
+                        self.retx = deque([], self.retx_size)
+                        for frame in frames[i:] + later:
+                            self._buffer(*frame)
+                        return
+        finally:
+            self.replaying = False
+
+    def _count_out(self, n_bytes):
+        self.metrics.frames_out += 1
+        self.metrics.bytes_out += n_bytes
 
     async def send_wait_reply(self, msg: BadgeMsg, sync=False, timeout=5.0):
         # raises TimeoutError if timeout exceeded
         self.send_msg(msg, sync=sync)
         return await asyncio.wait_for(self.in_q.get(), timeout)
 
+    async def send_blob(self, src, size=None, name="", timeout=5.0):
+        """
+        Send a blob in chunks, returns True when the peer has all of it.
+
+        src is a bytes like object or a binary file. Returns False when the peer
+        refused or has no bulk transfer, raises TimeoutError when it stops
+        answering for timeout seconds.
+        """
+        if not self.caps & codec.CAP_WINDOW:
+            print(f"con {self.con_id}: peer firmware has no bulk transfer")
+            return False
+        sender = BulkSender(self, src, size, name)
+        return await sender.run(int(timeout * 1000))
+
+    async def recv_blob(self, start, into, timeout=5.0):
+        """Receive the blob offered by BulkStart start, returns its size."""
+        return await BulkReceiver(self, start, into).run(int(timeout * 1000))
+
+    def refuse_blob(self, start):
+        self.post_app_msg(BulkAck(start.x, -1))
+
     def get_msg_aiter(self):
         class Aiter:
             def __init__(self, conn: Connection):
@@ -201,7 +466,7 @@ class Connection(object):
 
             async def __anext__(self):
                 msg: AppMsg = await self.conn.in_q.get()
-                print(f"__anext__ ")
+                trace.rec(trace.DEBUG, trace.CONN_NEXT, self.conn.con_id)
                 if isinstance(msg, ConTerm):
                     raise StopAsyncIteration
                 self.conn.last_msg = time()
@@ -249,6 +514,12 @@ class NowListener(object):
         update_event (asyncio.Event): Asyncio event to notify updates.
         conn_request (asyncio.Event): Asyncio event for new connection requests.
         __espnow (aioespnow.AIOESPNow): AIOESPNow instance to handle ESP-NOW communication.
+        metrics (Metrics): Counters and latencies of all traffic, see bdg.msg.metrics.
+        beacon_ext (dict): Last BeaconExt by MAC, pruned with last_seen.
+        services (dict): con_id -> callable(conn) returning bool, accepts
+            connections without asking the user, e.g. bdg.msg.fwshare.
+        gossip (Gossip): Multi-hop discovery from BeaconExt digests, None
+            when off, see bdg.msg.gossip.
 
     Methods:
         incoming_con_cb(con): Callback for handling incoming connections.
@@ -265,10 +536,15 @@ class NowListener(object):
     __task = None
     __instance = None
     __cleanup_task = None
+    __keepalive_task = None
     _sender_t = None
     connections = {}
+    replay_acks = {}  # wait_index: [Event, acked] of frames from send_acked()
     delivered = deque([], 50)  # Track last 50 messages to prevent re-delivery
     last_seen = BadgeAdrDict(max_size=20, stale_multiplier=2.6)
+    beacon_ext = {}
+    services = {}
+    gossip = None
 
     update_event = asyncio.Event()
     conn_request = asyncio.Event()
@@ -276,6 +552,10 @@ class NowListener(object):
 
     __espnow: aioespnow.AIOESPNow = None
     con_cb = def_con_cb
+    # pause after each received frame, lets the ESP-NOW stack run on the badge
+    rx_yield_s = 0.1
+    keepalive_ms = 500  # how often idle connections are checked
+    metrics = Metrics("listener")
     
     # Malformed message tracking: {mac: (count, first_timestamp)}
     malformed_counter = {}
@@ -311,8 +591,25 @@ class NowListener(object):
         else:
             NowListener.malformed_counter[mac] = (1, current_time)
     
+    def _post(self, mac, data):
+        self.metrics.frames_out += 1
+        self.metrics.bytes_out += len(data)
+        post_message(self.__espnow, mac, data, sync=False)
+
+    def _conns(self, mac):
+        # connections to mac, there is rarely more than one
+        return [c for c in self.connections.values() if c.c_mac == mac]
+
+    def _conn_metrics(self, mac):
+        return [c.metrics for c in self._conns(mac)]
+
     def ack_msg(self, mac, msg_id):
-        self.out_q.put_nowait(OutQueAck(mac, msg_id))
+        if self.out_q.full():
+            # never let a busy sender take down the listener, msg is retried
+            trace.rec(trace.ERROR, trace.ACK_DROP, msg_id, mac=mac)
+            self.metrics.q_overflow += 1
+        else:
+            self.out_q.put_nowait(OutQueAck(mac, msg_id))
         # start sender task to eat the out_q
         if self._sender_t is None or self._sender_t.done():
             self._sender_t = asyncio.create_task(self._sender())
@@ -326,6 +623,10 @@ class NowListener(object):
                 if removed > 0:
                     print(f"Cleaned up {removed} stale badge(s)")
                     self.update_event.set()  # Notify UI to update
+                for mac in [m for m in self.beacon_ext if m not in self.last_seen]:
+                    del self.beacon_ext[mac]
+                if self.gossip is not None and self.gossip.expire():
+                    self.update_event.set()
                 
                 # Cleanup expired blocked MACs
                 current_time = time()
@@ -339,6 +640,16 @@ class NowListener(object):
         except Exception as e:
             print(f"cleanup_task error: {e}")
 
+    async def keepalive_task(self):
+        """Heartbeat idle connections, see Connection.keepalive()."""
+        while True:
+            await asyncio.sleep_ms(self.keepalive_ms)
+            conns = [c for c in self.connections.values() if c.active]
+            # one heartbeat budget for all, more connections beat less often
+            idle_ms = Connection.idle_ms * max(1, len(conns))
+            for c in conns:
+                c.keepalive(idle_ms)
+
     async def task(self):
         """
         Main task to listen and process incoming ESP-NOW messages.
@@ -350,10 +661,18 @@ class NowListener(object):
             if mac is None:
                 continue
 
+            if Capture.active:
+                Capture.active.rx(mac, self.__espnow.peers_table[mac][0], msg)
+            m = self.metrics
+            m.frames_in += 1
+            m.bytes_in += len(msg)
+
             # Check if MAC is blocked
             if mac in NowListener.blocked_macs:
                 if time() < NowListener.blocked_macs[mac]:
                     # Still blocked, silently ignore
+                    trace.rec(trace.DEBUG, trace.RX_BLOCKED, mac=mac)
+                    m.blocked += 1
                     continue
                 else:
                     # Block expired, cleanup will handle removal
@@ -361,6 +680,7 @@ class NowListener(object):
 
             rssi = self.__espnow.peers_table[mac][0]
             if rssi < -70:
+                trace.rec(trace.DEBUG, trace.RX_WEAK, rssi, mac=mac)
                 continue
 
             # Protect deserialization so a malformed message doesn't cancel the listener
@@ -370,6 +690,7 @@ class NowListener(object):
                 mac_hex = ":".join(f"{byte:02x}" for byte in mac)
                 print(f"NowListener: fatal deserialization from {mac_hex}: {e}")
                 self._track_malformed_message(mac)
+                m.malformed += 1
                 continue
 
             if incm_msg is None:
@@ -377,13 +698,31 @@ class NowListener(object):
                 head = msg[:32] if isinstance(msg, (bytes, bytearray)) else b""
                 print(f"Ignoring malformed msg from {mac_hex} len={len(msg)} head={head.hex()}")
                 self._track_malformed_message(mac)
+                m.malformed += 1
                 continue
 
-            print(f">>>{mac}:{incm_msg}")
+            if trace.level >= trace.INFO:
+                trace.rec(trace.INFO, trace.RX, trace.tid(incm_msg), incm_msg.id, mac)
+            t_dispatch = ticks_us()
 
             if isinstance(incm_msg, BeaconMsg):
                 NowListener.last_seen[mac] = BadgeAdr(mac, incm_msg.nick, rssi, time())
+                # nearby badges are likely opponents, register while slots are free
+                PeerSlots.of(self.__espnow).prewarm((mac,))
                 self.update_event.set()  # trigger updates function
+            elif isinstance(incm_msg, BeaconExt):
+                NowListener.beacon_ext[mac] = incm_msg
+                if self.gossip is not None and incm_msg.nb:
+                    try:
+                        new = self.gossip.learn(mac, incm_msg.nb)
+                    except Exception as e:
+                        # a bad digest must not take the listener down
+                        print(f"gossip: digest from {mac.hex()} failed: {e!r}")
+                        new = None
+                    if new:
+                        # likely met soon, register while slots are free
+                        PeerSlots.of(self.__espnow).prewarm(new)
+                        self.update_event.set()
             elif isinstance(incm_msg, AckMsg):
                 NowListener.last_seen.update_last_seen(mac, time())
                 # mark for retry buffer that msg is acked
@@ -404,32 +743,37 @@ class NowListener(object):
                     else:
                         # Existing connection with different peer - reject new one
                         print(f"Rejecting OpenConn: con_id {incm_msg.con_id} already used by different peer")
-                        await send_message(
-                            self.__espnow, mac, 
-                            OpenConn(incm_msg.con_id, accept=False).srlz(), 
-                            sync=False
-                        )
+                        reject = OpenConn(incm_msg.con_id, accept=False)
+                        # same id as the request, it acks the request's retries
+                        reject.__id = incm_msg.id
+                        self._post(mac, reject.srlz())
                         continue
                 elif existing_conn and existing_conn.closed:
                     # Old closed connection still registered - clean it up
                     print(f"Cleaning up closed connection for con_id={incm_msg.con_id}")
                     NowListener.unregister_con(existing_conn)
 
+                if incm_msg.accept is False:
+                    continue  # late rejection of a request we gave up on
+
                 # Add new incoming connection, ack the incoming OpenConn
-                await send_message(
-                    self.__espnow, mac, AckMsg(id=incm_msg.id).srlz(), sync=False
-                )
+                self._post(mac, AckMsg(id=incm_msg.id).srlz())
 
                 # proto connection, not yet capable of receiving other messages
                 conn = Connection(mac, incm_msg.con_id, self.__espnow)
                 # Use session_id from incoming OpenConn if available
                 if hasattr(incm_msg, 'session_id') and incm_msg.session_id:
-                    conn.session_id = incm_msg.session_id
+                    conn.session_id, conn.caps = codec.answer(incm_msg.session_id)
                 conn.active = True
 
                 try:
-                    # ask user process can we accept connection
-                    (await NowListener.con_cb(conn)) or 1 / 0
+                    service = NowListener.services.get(incm_msg.con_id)
+                    if service is not None:
+                        accepted = service(conn)
+                    else:
+                        # ask user process can we accept connection
+                        accepted = await NowListener.con_cb(conn)
+                    accepted or 1 / 0
                 except (asyncio.TimeoutError, ZeroDivisionError):
                     # connection was not opened in time, or it returned false
                     NowListener.unregister_con(conn)
@@ -450,30 +794,37 @@ class NowListener(object):
                 self.ack_msg(mac, incm_msg.id)
                 NowListener.last_seen.update_last_seen(mac, time())
 
-                if incm_msg.con_id in self.connections:
+                conn = self.connections.get(incm_msg.con_id)
+                # a late ConTerm of an earlier peer must not end the current session
+                if conn is not None and conn.c_mac == mac:
                     print(f"con term for {incm_msg=}")
-                    conn = self.connections[incm_msg.con_id]
                     await conn.terminate(send_out=True, reply_to_id=incm_msg.id)
                     NowListener.unregister_con(conn)
                 else:
-                    await send_message(
-                        self.__espnow, mac, AckMsg(id=incm_msg.id).srlz(), sync=False
-                    )
+                    self._post(mac, AckMsg(id=incm_msg.id).srlz())
 
             elif isinstance(incm_msg, AppMsg):
                 NowListener.last_seen.update_last_seen(mac, time())
-                await send_message(
-                    self.__espnow, mac, AckMsg(id=incm_msg.id).srlz(), sync=False
-                )
+                if not getattr(incm_msg, "posted", False):
+                    self._post(mac, AckMsg(id=incm_msg.id).srlz())
+                conn = self.connections.get(incm_msg.con_id)
+                if conn is not None and conn.c_mac == mac:
+                    conn.metrics.bytes_in += len(msg)
 
                 if not await self.dispatch_app_msg(incm_msg, mac):
-                    print(f"No receiver for RCV:{mac}->{incm_msg=}")
+                    trace.rec(
+                        trace.INFO,
+                        trace.NO_RECEIVER,
+                        incm_msg.con_id,
+                        incm_msg.id,
+                        mac,
+                    )
 
-            else:
-                tmp = ":".join(f"{byte:02x}" for byte in mac)
-                print(f"{tmp} [{rssi}dBm] {msg} :")
+            elif trace.level >= trace.INFO:
+                trace.rec(trace.INFO, trace.RX_UNKNOWN, trace.tid(incm_msg), rssi, mac)
+            m.dispatch.add(ticks_diff(ticks_us(), t_dispatch))
             await asyncio.sleep(
-                0.1
+                self.rx_yield_s
             )  # Do not touch, MSG stack crashes when running without
 
     @classmethod
@@ -509,7 +860,8 @@ class NowListener(object):
     async def _sender(self):
         # temporary task to send messages for retry times or until ack arrives
         timeout_ms = 500
-        waiting_ack = {}
+        # first send order, a retry keeps its place: MicroPython dicts are unordered
+        waiting_ack = OrderedDict()
         start = ticks_ms()
         while self.out_q.qsize() > 0 or waiting_ack:
             try:
@@ -517,36 +869,101 @@ class NowListener(object):
                     self.out_q.get(), timeout_ms / 1000
                 )
                 if type(out_q_t) == OutQueMsg:
-                    waiting_ack[wait_index(out_q_t)] = out_q_t
-                    await send_message(
-                        self.__espnow, out_q_t.mac, out_q_t.msg, sync=False
-                    )
+                    conn = self.connections.get(out_q_t.con_id)
+                    if (
+                        conn is not None
+                        and conn.lost_at is not None
+                        and conn.c_mac == out_q_t.mac
+                    ):
+                        # queued before the link was lost, it waits behind the
+                        # frames that were moved to conn.retx, not after later ones
+                        if self._settle(wait_index(out_q_t), False):
+                            conn.link_lost()  # send_acked() keeps the frame
+                        else:
+                            conn.link_lost(out_q_t.msg, out_q_t.id)
+                    else:
+                        waiting_ack[wait_index(out_q_t)] = out_q_t
+                        self._post(out_q_t.mac, out_q_t.msg)
                 elif type(out_q_t) == OutQueAck:
                     w_index = wait_index(out_q_t)
                     if w_index in waiting_ack:
-                        print(f"ack mach {out_q_t=}")
-                        del waiting_ack[w_index]
+                        trace.rec(
+                            trace.DEBUG, trace.OUT_ACKED, out_q_t.id, mac=out_q_t.mac
+                        )
+                        rtt = ticks_diff(ticks_ms(), waiting_ack.pop(w_index).t)
+                        self._settle(w_index, True)
+                        self.metrics.ack_rtt.add(rtt)
+                        for c in self._conns(out_q_t.mac):
+                            c.metrics.ack_rtt.add(rtt)
+                            c.link.sample(True, rtt)
+                            c.last_rx = ticks_ms()
 
                 if ticks_diff(ticks_ms(), start) > timeout_ms:
                     raise asyncio.TimeoutError
 
             except asyncio.TimeoutError:
-                ack_items = waiting_ack.items()
+                ack_items = list(waiting_ack.items())  # entries are deleted below
+                # connections with an exhausted frame take all their pending
+                # frames, in send order, to replay them after a resume
+                lost = set()
+                for k, out_que_msg in ack_items:
+                    if out_que_msg.retry <= 0 and out_que_msg.con_id is not None:
+                        lost.add(out_que_msg.con_id)
                 for k, out_que_msg in ack_items:
+                    if out_que_msg.con_id in lost:
+                        del waiting_ack[k]
+                        replayed = self._settle(k, False)
+                        conn = self.connections.get(out_que_msg.con_id)
+                        if conn is not None and conn.c_mac == out_que_msg.mac:
+                            if replayed:
+                                conn.link_lost()  # send_acked() keeps the frame
+                            else:
+                                conn.link_lost(out_que_msg.msg, out_que_msg.id)
+                        if out_que_msg.retry > 0:
+                            continue
+                        trace.rec(
+                            trace.INFO,
+                            trace.OUT_TIMEOUT,
+                            out_que_msg.id,
+                            mac=out_que_msg.mac,
+                        )
+                        self.metrics.retry_timeouts += 1
+                        for m in self._conn_metrics(out_que_msg.mac):
+                            m.retry_timeouts += 1
+                        continue
                     if out_que_msg.retry <= 0:
-                        print(f"retry timeout {k=} {out_que_msg=}")
+                        trace.rec(
+                            trace.INFO,
+                            trace.OUT_TIMEOUT,
+                            out_que_msg.id,
+                            mac=out_que_msg.mac,
+                        )
+                        self.metrics.retry_timeouts += 1
+                        for m in self._conn_metrics(out_que_msg.mac):
+                            m.retry_timeouts += 1
                         del waiting_ack[k]
+                        self._settle(k, False)
                         continue
 
-                    print(f"<<{'r'*out_que_msg.retry}{out_que_msg.msg} {out_que_msg=}")
-                    await send_message(
-                        self.__espnow, out_que_msg.mac, out_que_msg.msg, sync=False
+                    trace.rec(
+                        trace.INFO,
+                        trace.OUT_RETRY,
+                        out_que_msg.id,
+                        out_que_msg.retry,
+                        out_que_msg.mac,
                     )
+                    self.metrics.retries += 1
+                    for c in self._conns(out_que_msg.mac):
+                        c.metrics.retries += 1
+                        c.link.sample(False)
+                    self._post(out_que_msg.mac, out_que_msg.msg)
                     waiting_ack[k] = OutQueMsg(
                         out_que_msg.msg,
                         out_que_msg.mac,
                         out_que_msg.id,
                         out_que_msg.retry - 1,
+                        out_que_msg.t,
+                        out_que_msg.con_id,
                     )
 
                 start = ticks_ms()
@@ -555,13 +972,45 @@ class NowListener(object):
 
     @classmethod
     def send_msg(cls, msg: BadgeMsg, mac, sync=False, retry=3):
+        """Queue msg for sending until acked, returns the frame size."""
+        data = msg.srlz()
+        cls.send_data(data, mac, msg.id, retry)
+        return len(data)
+
+    @classmethod
+    def send_data(cls, data, mac, msg_id, retry=3, con_id=None):
+        """Queue a serialized frame for sending until acked."""
         out_q = cls.__instance.out_q
-        out_q.put_nowait(OutQueMsg(msg.srlz(), mac, msg.id, retry))
+        out_q.put_nowait(OutQueMsg(data, mac, msg_id, retry, ticks_ms(), con_id))
 
         # start sender task
         if cls.__instance._sender_t is None or cls.__instance._sender_t.done():
             cls.__instance._sender_t = asyncio.create_task(cls.__instance._sender())
 
+    @classmethod
+    async def send_acked(cls, data, mac, msg_id, con_id, retry=3, timeout=10):
+        """Send a serialized frame, returns True once the peer acked it."""
+        key = mac + bytes([msg_id])
+        waiter = [asyncio.Event(), False]
+        cls.replay_acks[key] = waiter
+        try:
+            cls.send_data(data, mac, msg_id, retry, con_id)
+            await asyncio.wait_for(waiter[0].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            cls.replay_acks.pop(key, None)
+        return waiter[1]
+
+    def _settle(self, key, acked):
+        # wake send_acked() for key, True when it was waiting
+        waiter = self.replay_acks.pop(key, None)
+        if waiter is None:
+            return False
+        waiter[1] = acked
+        waiter[0].set()
+        return True
+
     @classmethod
     def register_con(cls, connection: "Connection"):
         """
@@ -572,10 +1021,11 @@ class NowListener(object):
         """
         print(f"register: {connection.con_id}")
         cls.connections[connection.con_id] = connection
-        try:
-            cls.__espnow.add_peer(connection.c_mac)
-        except Exception:
-            pass
+        connection.metrics.register(f"con{connection.con_id}")
+        # peers with a connection must never be evicted from the peer table
+        if not PeerSlots.of(connection.espnow).pin(connection.c_mac, connection.con_id):
+            # sends retry through the pipeline, which asks PeerSlots again
+            print(f"register: no peer slot for con {connection.con_id}")
 
     @classmethod
     def unregister_con(cls, connection: "Connection"):
@@ -588,6 +1038,8 @@ class NowListener(object):
         if connection.con_id in cls.connections:
             print(f"unregister: {connection.con_id}")
             del cls.connections[connection.con_id]
+            connection.metrics.unregister()
+            PeerSlots.of(connection.espnow).unpin(connection.c_mac, connection.con_id)
             # Note: We intentionally do NOT clean up the delivered deque here.
             # Keeping old message IDs prevents stale messages (still in retry queues)
             # from being re-delivered in new sessions. The deque's max size will
@@ -606,8 +1058,10 @@ class NowListener(object):
         """
         if not cls.__instance:
             cls.__instance = cls(espnow)
+        if not cls.__task:  # first start, or again after stop()
             cls.__task = asyncio.create_task(cls.__instance.task())
             cls.__cleanup_task = asyncio.create_task(cls.__instance.cleanup_task())
+            cls.__keepalive_task = asyncio.create_task(cls.__instance.keepalive_task())
             return cls.__task
 
     @classmethod
@@ -618,6 +1072,12 @@ class NowListener(object):
         if cls.__task:
             cls.__task.cancel()
             cls.__task = None
+        if cls.__cleanup_task:
+            cls.__cleanup_task.cancel()
+            cls.__cleanup_task = None
+        if cls.__keepalive_task:
+            cls.__keepalive_task.cancel()
+            cls.__keepalive_task = None
 
     async def dispatch_app_msg(self, app_msg: AppMsg, s_mac):
         """
@@ -637,12 +1097,21 @@ class NowListener(object):
             # Pass only the inner content to app
             # filter out retries, don't deliver message with same id
             w_index = wait_index_mac(s_mac, msg_id=app_msg.id)
+            conn = self.connections[app_msg.con_id]
+            if app_msg.session_id not in (None, conn.session_id):
+                # an earlier session on the same con_id, must not resume this one
+                print(f"session_id mismatch {app_msg.session_id=} {conn.session_id=}")
+                return False
             if w_index not in NowListener.delivered:
-                await self.connections[app_msg.con_id].recv_msg(app_msg.content)
+                t = ticks_us()
+                await conn.recv_msg(app_msg.content)
+                conn.metrics.dispatch.add(ticks_diff(ticks_us(), t))
                 NowListener.delivered.append(w_index)
                 return True
             else:
-                print(f"Filtered out {w_index=} {app_msg=}")
+                trace.rec(trace.DEBUG, trace.DUPLICATE, app_msg.id, mac=s_mac)
+                self.metrics.duplicates += 1
+                self.connections[app_msg.con_id].metrics.duplicates += 1
 
         return False
 
@@ -674,9 +1143,7 @@ class NowListener(object):
                     if w_index not in NowListener.delivered:
                         NowListener.delivered.append(w_index)
                     # Still send ACK to prevent retries, but don't deliver the message
-                    await send_message(
-                        self.__espnow, s_mac, AckMsg(id=msg.id).srlz(), sync=False
-                    )
+                    self._post(s_mac, AckMsg(id=msg.id).srlz())
                     return True
 
             # filter out retries, don't deliver message with same id
@@ -684,11 +1151,13 @@ class NowListener(object):
             if w_index not in NowListener.delivered:
                 await conn.recv_msg(msg)
                 NowListener.delivered.append(w_index)
+            else:
+                trace.rec(trace.DEBUG, trace.DUPLICATE, msg.id, mac=s_mac)
+                self.metrics.duplicates += 1
+                conn.metrics.duplicates += 1
 
             # despite was msg retry or not send ack
-            await send_message(
-                self.__espnow, s_mac, AckMsg(id=msg.id).srlz(), sync=False
-            )
+            self._post(s_mac, AckMsg(id=msg.id).srlz())
             return True
         return False  # Connection was not found
 
@@ -711,12 +1180,16 @@ class Beacon(AProc):
     # Beacon.start(task=True) will return a asyncio.task ans start running Beacon
     # Beacon.stop() will cancel the running task
     # Beacon.suspend(True|False) will suspend/resume the Beacon task # why not to use stop start?
+    # Beacon.ext holds BeaconExt fields, sent with every ext_every-th beacon if set,
+    # together with the NowListener.gossip digest
     __espnow: aioespnow.AIOESPNow = None
     __id: BeaconMsg = None
     peer = None
     _susp = asyncio.Event()
     timeout = 5
     _task = None
+    ext = {}
+    ext_every = 6  # older firmware blocks senders of 3 unknown messages in 10 s
 
     @classmethod
     def suspend(cls, value: bool):
@@ -725,9 +1198,20 @@ class Beacon(AProc):
     @classmethod
     async def task(cls, *args, **kwargs):
         try:
+            n = 0
             while not cls.stop_event.is_set():
                 msg = BeaconMsg(nick=cls.__id.nick).srlz()
                 await send_message(cls.__espnow, cls.peer, msg)
+                if n % cls.ext_every == 0:
+                    ext = cls.ext
+                    if NowListener.gossip is not None:
+                        nb = NowListener.gossip.digest()
+                        if nb:
+                            ext = dict(ext, nb=nb)
+                    if ext:
+                        ext = BeaconExt(**ext).srlz()
+                        await send_message(cls.__espnow, cls.peer, ext)
+                n += 1
                 await asyncio.sleep(cls.timeout)
                 if not cls._susp.is_set():
                     print("Beacon suspended...")
@@ -743,10 +1227,5 @@ class Beacon(AProc):
         Beacon.timeout = timeout
         Beacon._susp.set()
         Beacon.peer = peer
-        try:
-            Beacon.__espnow.add_peer(peer)
-        except OSError as err:
-            if len(err.args) < 2:
-                raise err
-            if err.args[1] == "ESP_ERR_ESPNOW_EXIST":
-                print("Addr exist")
+        if not PeerSlots.of(espnow).pin(peer, "beacon"):
+            print("Beacon: no peer slot for the beacon address yet")
@@ -0,0 +1,299 @@
+"""
+Firmware distribution between badges over ESP-NOW.
+
+A badge that runs a version it installed with a manifest (the ota.json entry
+of it, saved by save_manifest()) is a seed: start_seed() advertises the
+version in BeaconExt and serves the image from the running partition on
+FW_CON_ID. A badge with older firmware finds seeds with seeds() and
+downloads with FwFetch. Every SEG byte segment is a bulk transfer
+(bdg.msg.bulk). It is hashed and written through ota.update as it arrives,
+and the new partition is only made bootable when the sha256 of the whole
+image matches the manifest. An updated badge is a seed after its reboot,
+so only the first few badges need the WiFi server.
+
+    found = seeds(current_version)      # [(version, mac), ...] best first
+    manifest = {"version": latest, "size": ..., "sha256": ...}  # ota.json
+    ok = await FwFetch(espnow, manifest).run([m for v, m in found if v == latest])
+
+A seed serves one badge at a time, NowListener keys connections by con_id,
+and a fetch continues at the same offset on the next seed when one fails.
+The manifest comes from the server's ota.json, not from the seed: any badge
+can advertise any version, so a seed whose FwInfo differs from the manifest
+is skipped and the image is only kept when its sha256 is the server's.
+"""
+
+import asyncio
+import hashlib
+import json
+from binascii import hexlify
+
+from bdg.msg import AppMsg, BadgeMsg, ConTerm
+from bdg.msg.bulk import BulkStart
+from bdg.msg.connection import Beacon, Connection, NowListener
+
+FW_CON_ID = 240
+SEG = 4096  # flash block size
+MANIFEST = "/fw_manifest.json"
+
+
+@AppMsg.register
+class FwInfo(BadgeMsg):
+    """ota.json entry of the version a seed serves"""
+
+    def __init__(self, version: str, size: int, sha256: str):
+        super().__init__()
+        self.version = version
+        self.size = size
+        self.sha256 = sha256
+
+
+@AppMsg.register
+class FwReq(BadgeMsg):
+    """Request for n bytes of the image at off, n=0 asks for FwInfo"""
+
+    def __init__(self, off: int, n: int):
+        super().__init__()
+        self.off = off
+        self.n = n
+
+
+class FwError(Exception):
+    pass
+
+
+def parse_version(version: str) -> tuple:
+    """'v1.0.9' -> (1, 0, 9)"""
+    return tuple(int(x) for x in version.lstrip("v").split("."))
+
+
+def save_manifest(version: str, entry: dict):
+    """Remember the ota.json entry of the version that was just written."""
+    with open(MANIFEST, "w") as f:
+        json.dump(
+            {"version": version, "size": entry["size"], "sha256": entry["sha256"]}, f
+        )
+
+
+def load_manifest(running_version: str):
+    try:
+        with open(MANIFEST) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # after a rollback the running image is not the one of the manifest
+    return manifest if manifest.get("version") == running_version else None
+
+
+def partition_reader():
+    """read(off, buf) of the running app partition, off is SEG aligned."""
+    from esp32 import Partition
+
+    part = Partition(Partition.RUNNING)
+
+    def read(off, buf):
+        part.readblocks(off // SEG, buf)
+
+    return read
+
+
+def ota_writer():
+    # leaving the context with an exception keeps the old partition bootable
+    from ota.update import OTA
+
+    return OTA(reboot=False)
+
+
+def seeds(current: str, version: str = None) -> list:
+    """(version, mac) of badges sharing a newer or the given version, best first."""
+    cur = parse_version(current)
+    found = []
+    for mac, ext in NowListener.beacon_ext.items():
+        if not isinstance(ext.fw, str) or not ext.fw:
+            continue  # fields of a BeaconExt are whatever the sender put there
+        if version is not None and ext.fw != version:
+            continue
+        try:
+            v = parse_version(ext.fw)
+        except ValueError:
+            continue
+        if v > cur and mac in NowListener.last_seen:
+            found.append((v, NowListener.last_seen[mac].rssi, ext.fw, mac))
+    found.sort(reverse=True)  # newest version, then strongest signal
+    return [(fw, mac) for v, rssi, fw, mac in found]
+
+
+class FwSeed(object):
+    """
+    Serves one firmware image on FW_CON_ID, see start_seed().
+
+    Args:
+        manifest (dict): version, size and sha256 of the image.
+        read: read(off, buf) of the image, default is the running partition.
+    """
+
+    def __init__(self, manifest: dict, read=None):
+        self.manifest = manifest
+        self.read = read or partition_reader()
+        self.busy = False
+        self.served = 0  # segments
+        self.buf = None
+        self.idle_s = 10  # free the seed for others when a fetcher goes silent
+
+    def enable(self):
+        NowListener.services[FW_CON_ID] = self
+        Beacon.ext["fw"] = self.manifest["version"]
+
+    def disable(self):
+        NowListener.services.pop(FW_CON_ID, None)
+        Beacon.ext.pop("fw", None)
+
+    def __call__(self, conn) -> bool:
+        # NowListener.services callback for an incoming connection
+        if self.busy:
+            return False
+        self.busy = True
+        asyncio.create_task(self.serve(conn))
+        return True
+
+    async def serve(self, conn):
+        m = self.manifest
+        if self.buf is None:
+            self.buf = bytearray(SEG)
+        mv = memoryview(self.buf)
+        last = -1
+        try:
+            while True:
+                msg = await asyncio.wait_for(conn.in_q.get(), self.idle_s)
+                if isinstance(msg, ConTerm):
+                    break
+                if not isinstance(msg, FwReq):
+                    continue
+                if msg.n == 0:
+                    conn.send_app_msg(FwInfo(m["version"], m["size"], m["sha256"]))
+                    continue
+                if msg.off == last:
+                    continue  # a retried request that got delivered twice
+                if msg.off % SEG or not 0 <= msg.off < m["size"]:
+                    break
+                last = msg.off
+                n = min(msg.n, SEG, m["size"] - msg.off)
+                self.read(msg.off, self.buf)
+                if not await conn.send_blob(mv[:n]):
+                    break
+                self.served += 1
+        except asyncio.TimeoutError:
+            print("fwshare: peer stopped fetching")
+        finally:
+            self.busy = False
+            if not conn.closed:
+                await conn.terminate()
+
+
+def start_seed(version: str = None):
+    """Share the running firmware when it has a manifest, returns the FwSeed."""
+    if version is None:
+        from bdg.version import Version
+
+        version = Version().version
+    manifest = load_manifest(version)
+    if manifest is None:
+        return None
+    seed = FwSeed(manifest)
+    seed.enable()
+    print(f"fwshare: sharing firmware {version}")
+    return seed
+
+
+class FwFetch(object):
+    """
+    Downloads firmware from seeds and writes it while it arrives.
+
+    Args:
+        espnow: ESP-NOW instance of NowListener.
+        manifest (dict): version, size and sha256 of the image from the
+            server's ota.json, seeds serving anything else are skipped.
+        writer: Returns a context manager with write(buf) for the new
+            partition, default ota.update.OTA(reboot=False).
+        progress: Called with (bytes done, size) after every segment.
+    """
+
+    def __init__(self, espnow, manifest: dict, writer=None, progress=None):
+        self.espnow = espnow
+        self.manifest = manifest
+        self.writer = writer or ota_writer
+        self.progress = progress
+        self.off = 0
+        self.sha = None
+        self.buf = bytearray(SEG)
+
+    async def _next(self, conn, cls, timeout):
+        while True:
+            msg = await asyncio.wait_for(conn.in_q.get(), timeout)
+            if isinstance(msg, ConTerm):
+                raise FwError("seed closed the connection")
+            if isinstance(msg, cls):
+                return msg
+
+    async def _fetch(self, mac, w, timeout):
+        conn = Connection(mac, FW_CON_ID, self.espnow)
+        if not await conn.connect():
+            return False  # busy with another badge or gone
+        mv = memoryview(self.buf)
+        x = None
+        try:
+            conn.send_app_msg(FwReq(0, 0))
+            info = await self._next(conn, FwInfo, timeout)
+            m = self.manifest
+            if (info.version, info.size, info.sha256) != (
+                m["version"],
+                m["size"],
+                m["sha256"],
+            ):
+                print(f"fwshare: {hexlify(mac)} serves another image than ota.json")
+                return False
+            while self.off < info.size:
+                conn.send_app_msg(FwReq(self.off, SEG))
+                start = await self._next(conn, BulkStart, timeout)
+                while start.x == x:  # a retried offer that got delivered twice
+                    start = await self._next(conn, BulkStart, timeout)
+                x = start.x
+                if start.size != min(SEG, info.size - self.off):
+                    raise FwError(f"bad segment size {start.size}")
+                n = await conn.recv_blob(start, self.buf, timeout)
+                self.sha.update(mv[:n])
+                w.write(mv[:n])
+                self.off += n
+                if self.progress:
+                    self.progress(self.off, info.size)
+            return True
+        except (asyncio.TimeoutError, FwError) as e:
+            print(f"fwshare: fetch from {hexlify(mac)} stopped: {e!r}")
+            return False
+        finally:
+            if not conn.closed:
+                await conn.terminate()
+
+    async def run(self, macs, timeout=5.0, rounds=3) -> bool:
+        """True once the image from macs is written and its sha256 matches."""
+        m = self.manifest
+        self.off = 0
+        self.sha = hashlib.sha256()
+        try:
+            with self.writer() as w:
+                for _ in range(rounds):
+                    for mac in macs:
+                        if await self._fetch(mac, w, timeout):
+                            break
+                    else:
+                        continue
+                    break
+                if self.off < m["size"]:
+                    raise FwError("no seed finished the image")
+                digest = hexlify(self.sha.digest()).decode()
+                if digest != m["sha256"]:
+                    raise FwError(f"sha256 mismatch {digest}")
+        except FwError as e:
+            print(f"fwshare: {e}")
+            return False
+        save_manifest(m["version"], m)
+        return True
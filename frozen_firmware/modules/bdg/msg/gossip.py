@@ -0,0 +1,165 @@
+"""
+Multi-hop neighbour discovery.
+
+With NowListener.gossip set, BeaconExt carries a digest of the badges this
+badge heard recently: its direct neighbours (1 hop) and what they told it, up
+to max_hops. Receivers keep the entries in Gossip.heard, a bounded table that
+also deduplicates: a badge is learned once, from the neighbour with the
+fewest hops, and forgotten ttl_s after the last digest that mentioned it.
+
+    NowListener.gossip = Gossip(NowListener.last_seen, sta.config("mac"))
+    for peer in NowListener.gossip.heard.values():
+        print(peer.nick, peer.hops, hexlify(peer.via))
+
+Digests only ride on BeaconExt and a token bucket of budget bytes per second
+caps them, so the extra airtime stays bounded however many badges are around.
+Digest entries are [mac, nick, rssi, hops, age_s], rssi as heard by the hop
+closest to the badge.
+"""
+
+from time import time
+
+from bdg.msg import BadgeAdr
+
+MAX_NICK = 20  # longest nick bdg.config accepts
+
+
+def _entry(e):
+    """(mac, nick, rssi, hops, age) of a digest entry, None when malformed."""
+    if not isinstance(e, (list, tuple)) or len(e) != 5:
+        return None
+    mac, nick, rssi, hops, age = e
+    if not isinstance(mac, bytes) or len(mac) != 6:
+        return None
+    if not isinstance(nick, str) or len(nick) > MAX_NICK:
+        return None
+    for v in (rssi, hops, age):
+        if not isinstance(v, int) or isinstance(v, bool):
+            return None
+    if hops < 0 or age < 0:
+        return None
+    return mac, nick, rssi, hops, age
+
+
+class GossipPeer(BadgeAdr):
+    """A badge out of radio range, learned from a neighbour's digest."""
+
+    def __init__(self, mac, nick, rssi, last_seen, hops, via):
+        super().__init__(mac, nick, rssi, last_seen)
+        self.hops: int = hops
+        self.via: bytes = via  # neighbour that told us
+
+    def __repr__(self):
+        return f"0x{self.mac.hex()}:{self.nick}({self.hops} hops)"
+
+
+class Gossip(object):
+    """
+    Builds digests for BeaconExt and learns from those of neighbours.
+
+    Args:
+        last_seen (BadgeAdrDict): Directly heard badges, NowListener.last_seen.
+        mac (bytes): Own mac, neighbours list us in their digests.
+        max_size (int): Learned badges kept, the oldest are evicted.
+        max_hops (int): Badges further away are neither learned nor forwarded.
+        ttl_s (int): Entries expire this long after they were last heard of.
+        budget (int): Average digest bytes per second.
+        burst (int): Most digest bytes at once, ESP-NOW frames carry 250.
+        max_entries (int): Most entries per digest.
+    """
+
+    def __init__(
+        self,
+        last_seen,
+        mac,
+        max_size=20,
+        max_hops=2,
+        ttl_s=90,
+        budget=8,
+        burst=160,
+        max_entries=8,
+    ):
+        self.last_seen = last_seen
+        self.mac = mac
+        self.max_size = max_size
+        self.max_hops = max_hops
+        self.ttl_s = ttl_s
+        self.budget = budget
+        self.burst = burst
+        self.max_entries = max_entries
+        self.heard = {}  # mac -> GossipPeer
+        self.tokens = burst
+        self.t_fill = time()
+        self.sent = 0  # digest bytes
+        self.dropped = 0  # entries left out for the budget
+
+    def digest(self):
+        """Entries for the next BeaconExt, None when the budget is used up."""
+        now = time()
+        self.tokens = min(self.burst, self.tokens + (now - self.t_fill) * self.budget)
+        self.t_fill = now
+        # freshest first, the receiver keeps what fits its table
+        direct = sorted(self.last_seen.values(), key=lambda b: -b.last_seen)
+        cands = [(b, 1) for b in direct]
+        cands += [
+            (p, p.hops)
+            for p in sorted(self.heard.values(), key=lambda p: p.hops)
+            if p.hops < self.max_hops
+        ]
+        entries = []
+        for b, hops in cands:
+            age = int(now - b.last_seen)
+            if age >= self.ttl_s:
+                continue
+            cost = len(b.nick) + 16  # packed size, about
+            if len(entries) == self.max_entries or cost > self.tokens:
+                self.dropped += 1
+                continue
+            self.tokens -= cost
+            self.sent += cost
+            entries.append([b.mac, b.nick, b.rssi, hops, age])
+        return entries or None
+
+    def learn(self, via, entries) -> list:
+        """Take in the digest of neighbour via, returns the newly learned macs."""
+        now = time()
+        new = []
+        if not isinstance(entries, (list, tuple)):
+            return new
+        for e in entries:
+            e = _entry(e)
+            if e is None:
+                continue  # a neighbour's digest is not to be trusted
+            mac, nick, rssi, hops, age = e
+            hops += 1
+            if mac == self.mac or mac in self.last_seen or hops > self.max_hops:
+                continue
+            seen = now - age
+            if age >= self.ttl_s:
+                continue
+            peer = self.heard.get(mac)
+            if peer is not None:
+                # keep the shortest route, refresh it from whoever repeats it
+                if hops > peer.hops or (hops == peer.hops and seen <= peer.last_seen):
+                    continue
+                peer.nick, peer.rssi, peer.last_seen = nick, rssi, seen
+                peer.hops, peer.via = hops, via
+                continue
+            if len(self.heard) >= self.max_size:
+                oldest = min(self.heard, key=lambda m: self.heard[m].last_seen)
+                del self.heard[oldest]
+            self.heard[mac] = GossipPeer(mac, nick, rssi, seen, hops, via)
+            new.append(mac)
+        return new
+
+    def expire(self) -> int:
+        """Forget stale entries and badges now heard directly, returns how many."""
+        now = time()
+        stale = [
+            m
+            for m, p in self.heard.items()
+            if now - p.last_seen > self.ttl_s or m in self.last_seen
+        ]
+        for m in stale:
+            del self.heard[m]
+        return len(stale)
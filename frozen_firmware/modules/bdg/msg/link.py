@@ -0,0 +1,48 @@
+class LinkQuality(object):
+    """
+    Smoothed RSSI, delivery ratio and round trip time towards one peer.
+
+    Connection feeds it with the RSSI of every received frame, the ack or
+    retry of every sent frame and the heartbeat round trips. All values are
+    exponential moving averages, one update is a few float operations.
+
+    >>> conn.link.quality   # 0 (unusable) .. 100
+    """
+
+    RSSI_MIN = -70  # NowListener ignores weaker frames
+    RSSI_GOOD = -45
+
+    def __init__(self, alpha=0.125):
+        self.alpha = alpha
+        self.rssi = None
+        self.delivery = 1.0  # share of frames that got an answer
+        self.rtt = None  # ms
+
+    def rssi_sample(self, rssi):
+        if self.rssi is None:
+            self.rssi = rssi
+        else:
+            self.rssi += self.alpha * (rssi - self.rssi)
+
+    def sample(self, ok, rtt=None):
+        """Outcome of one frame or heartbeat, rtt in ms when it was answered."""
+        self.delivery += self.alpha * ((1.0 if ok else 0.0) - self.delivery)
+        if rtt is None:
+            return
+        if self.rtt is None:
+            self.rtt = rtt
+        else:
+            self.rtt += self.alpha * (rtt - self.rtt)
+
+    @property
+    def quality(self) -> int:
+        margin = 1.0
+        if self.rssi is not None:
+            margin = (self.rssi - self.RSSI_MIN) / (self.RSSI_GOOD - self.RSSI_MIN)
+            margin = min(1.0, max(0.0, margin))
+        return int(100 * self.delivery * margin)
+
+    def __str__(self):
+        rssi = "-" if self.rssi is None else f"{self.rssi:.0f}dBm"
+        rtt = "-" if self.rtt is None else f"{self.rtt:.0f}ms"
+        return f"q {self.quality} rssi {rssi} ok {self.delivery:.0%} rtt {rtt}"
@@ -0,0 +1,139 @@
+from array import array
+
+
+class Histogram(object):
+    """
+    Fixed bucket histogram, recording is a short scan and two integer adds.
+
+    Bucket i counts values below bounds[i], the last bucket everything above
+    the last bound.
+    """
+
+    def __init__(self, bounds, unit="ms"):
+        self.bounds = bounds
+        self.unit = unit
+        self.counts = array("I", bytes(4 * (len(bounds) + 1)))
+        self.n = 0
+        self.max = 0
+
+    def add(self, value):
+        i = 0
+        for bound in self.bounds:
+            if value < bound:
+                break
+            i += 1
+        self.counts[i] += 1
+        self.n += 1
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile, max if above."""
+        if not self.n:
+            return None
+        rank = self.n * p // 100
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen > rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.n = 0
+        self.max = 0
+
+    def __str__(self):
+        if not self.n:
+            return "-"
+        p50, p90 = self.percentile(50), self.percentile(90)
+        return f"n={self.n} p50<={p50} p90<={p90} max={self.max}{self.unit}"
+
+
+class Metrics(object):
+    """
+    Counters and latency histograms of NowListener or one Connection.
+
+    Counters are plain int attributes, the hot paths only do `m.retries += 1`.
+    Every Metrics with a name is kept in Metrics.registry for the REPL and the
+    debug screen:
+
+    >>> from bdg.msg.metrics import report
+    >>> report()
+    """
+
+    COUNTERS = (
+        "frames_in",
+        "frames_out",
+        "bytes_in",
+        "bytes_out",
+        "retries",
+        "retry_timeouts",
+        "duplicates",
+        "malformed",
+        "blocked",
+        "q_overflow",
+        "link_losses",
+        "resumes",
+        "heartbeats",
+        "peers_lost",
+    )
+
+    registry = {}
+
+    def __init__(self, name=None):
+        self.name = name
+        self.link = None  # LinkQuality of a Connection
+        self.ack_rtt = Histogram((5, 10, 20, 50, 100, 200, 500, 1000), "ms")
+        self.dispatch = Histogram((100, 250, 500, 1000, 2500, 5000, 10000), "us")
+        self.reset()
+        if name:
+            self.register(name)
+
+    def reset(self):
+        for c in self.COUNTERS:
+            setattr(self, c, 0)
+        self.ack_rtt.reset()
+        self.dispatch.reset()
+
+    def register(self, name):
+        self.name = name
+        Metrics.registry[name] = self
+
+    def unregister(self):
+        if Metrics.registry.get(self.name) is self:
+            del Metrics.registry[self.name]
+
+    def counters(self) -> dict:
+        return {c: getattr(self, c) for c in self.COUNTERS}
+
+    def lines(self):
+        """Short text lines for the REPL and the debug screen."""
+        yield (
+            f"in {self.frames_in}/{self.bytes_in}B"
+            f" out {self.frames_out}/{self.bytes_out}B"
+        )
+        yield (
+            f"retry {self.retries} tmo {self.retry_timeouts}"
+            f" dup {self.duplicates} ovf {self.q_overflow}"
+        )
+        if self.malformed or self.blocked:
+            yield f"malformed {self.malformed} blocked {self.blocked}"
+        if self.link_losses:
+            yield f"link lost {self.link_losses} resumed {self.resumes}"
+        if self.heartbeats:
+            yield f"heartbeats {self.heartbeats} peer lost {self.peers_lost}"
+        if self.link is not None:
+            yield str(self.link)
+        yield f"ack {self.ack_rtt}"
+        yield f"disp {self.dispatch}"
+
+
+def report():
+    """Print all registered metrics."""
+    for name, m in Metrics.registry.items():
+        print(f"{name}:")
+        for line in m.lines():
+            print(f"  {line}")
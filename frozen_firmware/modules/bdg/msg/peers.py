@@ -0,0 +1,178 @@
+from time import ticks_ms, ticks_diff
+
+from bdg import trace
+
+# ESP-NOW on ESP32 accepts at most 20 registered peers
+# (ESP_NOW_MAX_TOTAL_PEER_NUM), the beacon address uses one of them.
+MAX_PEERS = 20
+# prewarm() never takes the last free slots, they are kept for real traffic
+PREWARM_RESERVE = 4
+
+
+class PeerSlots:
+    """
+    PeerSlots keeps the ESP-NOW peer table below the driver limit.
+
+    Every MAC we talk to is tracked with a last used timestamp. When the table is
+    full, the least recently used peer that is not pinned is deleted to make room
+    for the new one. Pinned peers (beacon address, peers of active connections)
+    are never evicted. Pins are owned, so the same MAC can be pinned by several
+    users (e.g. con_id) and is released when the last owner unpins it.
+
+    One PeerSlots exists per ESP-NOW instance, use PeerSlots.of(espnow).
+
+    Methods:
+        ensure(mac): Register mac as a peer if needed, evict LRU peer when full.
+        touch(mac): Mark mac as recently used.
+        pin(mac, owner) / unpin(mac, owner): Protect mac from eviction.
+        prewarm(macs): Register likely peers, only while free slots are left.
+        evict_one(): Remove the least recently used idle peer.
+    """
+
+    __slots = {}  # id(espnow) -> PeerSlots
+
+    def __init__(self, espnow, max_peers=MAX_PEERS):
+        self.espnow = espnow
+        self.max_peers = max_peers
+        self.used = {}  # mac -> ticks_ms of last use
+        self.pins = {}  # mac -> set of owners
+        self.evictions = 0
+        self.sync()
+
+    @classmethod
+    def of(cls, espnow, max_peers=MAX_PEERS) -> "PeerSlots":
+        slots = cls.__slots.get(id(espnow))
+        if slots is None:
+            slots = cls(espnow, max_peers)
+            cls.__slots[id(espnow)] = slots
+        return slots
+
+    def sync(self):
+        """Adopt peers that were registered directly to the driver."""
+        try:
+            peers = self.espnow.get_peers()
+        except Exception:
+            return
+        now = ticks_ms()
+        for peer in peers:
+            if peer[0] not in self.used:
+                self.used[peer[0]] = now
+
+    def __len__(self):
+        return len(self.used)
+
+    def __contains__(self, mac):
+        return mac in self.used
+
+    def free(self) -> int:
+        return self.max_peers - len(self.used)
+
+    def touch(self, mac):
+        if mac in self.used:
+            self.used[mac] = ticks_ms()
+
+    def is_pinned(self, mac) -> bool:
+        return bool(self.pins.get(mac))
+
+    def ensure(self, mac) -> bool:
+        """
+        Make sure mac is a registered peer.
+
+        Returns:
+            bool: True if mac is registered, False if no slot could be freed
+                or the driver refused the peer.
+        """
+        if mac in self.used:
+            self.used[mac] = ticks_ms()
+            return True
+
+        if self.free() <= 0 and self.evict_one() is None:
+            print(f"peers: no free slot for {mac.hex()}")
+            return False
+
+        for _ in range(2):
+            try:
+                self.espnow.add_peer(mac)
+                break
+            except OSError as err:
+                name = err.args[1] if len(err.args) > 1 else None
+                if name == "ESP_ERR_ESPNOW_EXIST":
+                    break
+                if name != "ESP_ERR_ESPNOW_FULL":
+                    # callers run in the listener and Beacon.setup, never raise
+                    print(f"peers: add_peer {mac.hex()} failed: {err!r}")
+                    return False
+                # driver table has peers we do not know about, adopt and evict
+                self.sync()
+                if self.evict_one() is None:
+                    return False
+        else:
+            return False
+
+        self.used[mac] = ticks_ms()
+        return True
+
+    def pin(self, mac, owner=None) -> bool:
+        ok = self.ensure(mac)
+        if ok:
+            self.pins.setdefault(mac, set()).add(owner)
+        return ok
+
+    def unpin(self, mac, owner=None):
+        owners = self.pins.get(mac)
+        if owners is None:
+            return
+        owners.discard(owner)
+        if not owners:
+            # peer stays registered and ages out like any other idle peer
+            del self.pins[mac]
+
+    def prewarm(self, macs) -> int:
+        """
+        Register likely opponents ahead of time without evicting anybody.
+
+        Returns:
+            int: Number of newly registered peers.
+        """
+        added = 0
+        for mac in macs:
+            if mac in self.used:
+                continue
+            if self.free() <= PREWARM_RESERVE:
+                break
+            if self.ensure(mac):
+                added += 1
+        return added
+
+    def evict_one(self):
+        """
+        Delete the least recently used peer that is not pinned.
+
+        Returns:
+            bytes: Evicted mac or None if all peers are pinned.
+        """
+        now = ticks_ms()
+        lru = None
+        lru_age = -1
+        for mac, last in self.used.items():
+            if self.pins.get(mac):
+                continue
+            age = ticks_diff(now, last)
+            if age > lru_age:
+                lru, lru_age = mac, age
+
+        if lru is None:
+            return None
+
+        self.forget(lru)
+        self.evictions += 1
+        trace.rec(trace.INFO, trace.PEER_EVICT, lru_age, mac=lru)
+        return lru
+
+    def forget(self, mac):
+        self.used.pop(mac, None)
+        self.pins.pop(mac, None)
+        try:
+            self.espnow.del_peer(mac)
+        except OSError:
+            pass  # already gone from the driver
@@ -0,0 +1,279 @@
+import asyncio
+import errno
+import gc
+from collections import deque
+from time import ticks_ms, ticks_diff, ticks_add
+
+from bdg.msg.capture import Capture
+from bdg.msg.peers import PeerSlots
+from bdg import trace
+
+NOT_INIT = "ESP_ERR_ESPNOW_NOT_INIT"
+NOT_FOUND = "ESP_ERR_ESPNOW_NOT_FOUND"
+NO_IF = "ESP_ERR_ESPNOW_IF"
+
+# errors that break every send until the driver is repaired
+DRIVER_ERRORS = (NOT_INIT, NO_IF)
+
+
+class SendFuture(object):
+    """
+    Completion handle for one queued frame.
+
+    result() is None while the frame is queued, True when the driver accepted
+    it and False when it was dropped (queue full, retries exhausted or an
+    unrecoverable driver error, see err).
+    """
+
+    def __init__(self, mac: bytes, msg: bytes, sync=False, retries=3):
+        self.mac = mac
+        self.msg = msg
+        self.sync = sync
+        self.retries = retries
+        self.ok = None
+        self.err = None
+        self.due = 0  # ticks_ms when a parked frame may be retried
+        self._cbs = None
+        self._ev = None
+
+    def done(self) -> bool:
+        return self.ok is not None
+
+    def result(self):
+        return self.ok
+
+    def add_done_callback(self, cb):
+        """cb(future) is called once the frame is sent or dropped."""
+        if self.done():
+            cb(self)
+            return
+        if self._cbs is None:
+            self._cbs = []
+        self._cbs.append(cb)
+
+    async def wait(self, timeout=None):
+        if not self.done():
+            if self._ev is None:
+                self._ev = asyncio.Event()
+            if timeout is None:
+                await self._ev.wait()
+            else:
+                await asyncio.wait_for(self._ev.wait(), timeout)
+        return self.ok
+
+    def _resolve(self, ok: bool, err=None):
+        self.ok = ok
+        self.err = err
+        self.msg = None  # release the payload early, futures may be kept around
+        if self._ev is not None:
+            self._ev.set()
+        if self._cbs:
+            for cb in self._cbs:
+                try:
+                    cb(self)
+                except Exception as e:
+                    print(f"send cb error: {e}")
+            self._cbs = None
+
+
+class SendPipeline(object):
+    """
+    SendPipeline owns all writes to one ESP-NOW instance.
+
+    Frames are submitted to a bounded queue and sent by a single worker task,
+    the caller gets a SendFuture back instead of waiting for the radio. A frame
+    that fails for one peer is parked and retried later, so frames to other
+    peers keep flowing. Driver faults (ESP-NOW not initialised, WLAN interface
+    down) pause the worker and are repaired by a separate supervisor task with
+    backoff, after which the parked frames are sent in order.
+
+    One SendPipeline exists per ESP-NOW instance, use SendPipeline.of(espnow).
+
+    Methods:
+        submit(mac, msg, sync, retries, cb): Queue a frame, returns SendFuture.
+        send(mac, msg, sync, retries): Queue a frame and wait for completion.
+    """
+
+    __pipes = {}  # id(espnow) -> SendPipeline
+
+    maxsize = 16
+    retry_ms = 20  # delay before a parked frame is tried again
+    recover_ms = 50  # first supervisor backoff, doubled on repeated faults
+    max_recover_ms = 2000
+
+    def __init__(self, espnow, maxsize=None):
+        self.espnow = espnow
+        if maxsize is not None:
+            self.maxsize = maxsize
+        self.q = deque((), self.maxsize)
+        self.parked = []
+        self.fault = None
+        self.ready = asyncio.Event()
+        self.ready.set()
+        self._kick = asyncio.Event()
+        self._fault_ev = asyncio.Event()
+        self._backoff = self.recover_ms
+        self._worker_t = None
+        self._supervisor_t = None
+
+        # counters, see stats()
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.dropped = 0
+        self.recoveries = 0
+
+    @classmethod
+    def of(cls, espnow) -> "SendPipeline":
+        pipe = cls.__pipes.get(id(espnow))
+        if pipe is None:
+            pipe = cls(espnow)
+            cls.__pipes[id(espnow)] = pipe
+        return pipe
+
+    def __len__(self):
+        return len(self.q) + len(self.parked)
+
+    def stats(self) -> dict:
+        return {
+            "queued": len(self),
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "recoveries": self.recoveries,
+        }
+
+    def submit(self, mac: bytes, msg: bytes, sync=False, retries=3, cb=None):
+        """
+        Queue msg for mac without waiting.
+
+        Returns:
+            SendFuture: Resolved with False right away if the queue is full.
+        """
+        fut = SendFuture(mac, msg, sync, retries)
+        if cb is not None:
+            fut.add_done_callback(cb)
+
+        if len(self) >= self.maxsize:
+            self.dropped += 1
+            fut._resolve(False, OSError(errno.ENOBUFS, "send queue full"))
+            return fut
+
+        self.q.append(fut)
+        self._start()
+        self._kick.set()
+        return fut
+
+    async def send(self, mac: bytes, msg: bytes, sync=False, retries=3):
+        return await self.submit(mac, msg, sync, retries).wait()
+
+    def _start(self):
+        if self._worker_t is None or self._worker_t.done():
+            self._worker_t = asyncio.create_task(self._worker())
+        if self._supervisor_t is None or self._supervisor_t.done():
+            self._supervisor_t = asyncio.create_task(self._supervisor())
+
+    def _next(self):
+        # parked frames are older than anything still in the queue
+        if self.parked:
+            now = ticks_ms()
+            for i, fut in enumerate(self.parked):
+                if ticks_diff(now, fut.due) >= 0:
+                    return self.parked.pop(i)
+        if len(self.q):
+            return self.q.popleft()
+        return None
+
+    def _idle_ms(self):
+        if not self.parked:
+            return None
+        now = ticks_ms()
+        return max(0, min(ticks_diff(fut.due, now) for fut in self.parked))
+
+    async def _worker(self):
+        while True:
+            if not self.ready.is_set():
+                await self.ready.wait()
+
+            fut = self._next()
+            if fut is None:
+                self._kick.clear()
+                idle_ms = self._idle_ms()
+                try:
+                    if idle_ms is None:
+                        await self._kick.wait()
+                    else:
+                        await asyncio.wait_for_ms(self._kick.wait(), idle_ms)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self.espnow.asend(fut.mac, fut.msg, sync=fut.sync)
+            except OSError as err:
+                self._failed(fut, err)
+                continue
+            except Exception as err:
+                trace.rec(trace.ERROR, trace.SEND_ERR, -1, mac=fut.mac)
+                self.failed += 1
+                fut._resolve(False, err)
+                continue
+
+            if Capture.active:
+                Capture.active.tx(fut.mac, fut.msg)
+            PeerSlots.of(self.espnow).touch(fut.mac)
+            self.sent += 1
+            self._backoff = self.recover_ms
+            fut._resolve(True)
+
+    def _failed(self, fut: SendFuture, err: OSError):
+        name = err.args[1] if len(err.args) > 1 else None
+        fut.retries -= 1
+        if fut.retries <= 0 or (name != NOT_FOUND and name not in DRIVER_ERRORS):
+            trace.rec(trace.ERROR, trace.SEND_FAIL, err.args[0], mac=fut.mac)
+            self.failed += 1
+            fut._resolve(False, err)
+            return
+
+        if name == NOT_FOUND:
+            # peer table is limited, let PeerSlots evict an idle peer
+            try:
+                PeerSlots.of(self.espnow).ensure(fut.mac)
+            except Exception as e:
+                # runs in the worker, which must outlive one bad frame
+                print(f"send: peer slot for {fut.mac.hex()} failed: {e!r}")
+                trace.rec(trace.ERROR, trace.SEND_FAIL, err.args[0], mac=fut.mac)
+                self.failed += 1
+                fut._resolve(False, err)
+                return
+            self.retried += 1
+            fut.due = ticks_ms()
+        else:
+            self.retried += 1
+            fut.due = ticks_add(ticks_ms(), self.retry_ms)
+            self.fault = name
+            self.ready.clear()
+            self._fault_ev.set()
+        self.parked.append(fut)
+
+    async def _supervisor(self):
+        while True:
+            await self._fault_ev.wait()
+            self._fault_ev.clear()
+            print(f"send: recovering from {self.fault}, backoff {self._backoff}ms")
+            try:
+                if self.fault == NOT_INIT:
+                    self.espnow.active(True)
+                elif self.fault == NO_IF:
+                    import network
+
+                    network.WLAN(network.STA_IF).active(True)
+            except Exception as e:
+                print(f"send: recovery failed {e}")
+            gc.collect()
+            self.recoveries += 1
+            await asyncio.sleep_ms(self._backoff)
+            self._backoff = min(self._backoff * 2, self.max_recover_ms)
+            self.fault = None
+            self.ready.set()
@@ -5,7 +5,7 @@ import asyncio
 from bdg.msg import BeaconMsg
 from bdg.config import Config
 from bdg.version import Version
-from bdg.utils import blit
+from bdg.assets import blit_asset
 from bdg.widgets.hidden_active_widget import HiddenActiveWidget
 from gui.core.colors import GREEN, BLACK
 from gui.core.ugui import Screen, ssd
@@ -13,7 +13,6 @@ from gui.core.writer import CWriter, AlphaColor
 from gui.fonts import font10
 from gui.primitives import launch
 from gui.widgets.label import Label
-from images import boot as screen1
 
 
 class BootScr(Screen):
@@ -34,7 +33,7 @@ class BootScr(Screen):
         # Lazy import connection module
         from bdg.msg.connection import NowListener, Beacon
 
-        blit(ssd, screen1, 0, 0)
+        blit_asset(ssd, "boot")
         self.show(True)
         self.reg_task(self.next_scr(), False)
 
@@ -50,9 +49,20 @@ class BootScr(Screen):
         Beacon.setup(self.espnow, beaconmsg)
         Beacon.start(task=True)
 
+        if Config.config["espnow"].get("gossip") and self.sta:
+            from bdg.msg.gossip import Gossip
+
+            # learn about badges beyond radio range from neighbours' beacons
+            NowListener.gossip = Gossip(NowListener.last_seen, self.sta.config("mac"))
+
         NowListener.con_cb = new_con_cb
         NowListener.start(self.espnow)
 
+        # share the running firmware with badges that have an older one
+        from bdg.msg.fwshare import start_seed
+
+        start_seed()
+
     async def next_scr(self):
         print(">>> next_scr")
         await asyncio.sleep(3)
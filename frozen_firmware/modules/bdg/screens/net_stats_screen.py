@@ -0,0 +1,53 @@
+import asyncio
+
+from gui.core.colors import GREEN, BLACK
+from gui.fonts import font10, font14
+from gui.core.ugui import Screen, ssd
+from gui.core.writer import CWriter
+from gui.widgets import Label
+from bdg.widgets.hidden_active_widget import HiddenActiveWidget
+from bdg.msg.metrics import Metrics
+
+
+class NetStatsScreen(Screen):
+    """Live messaging counters and latencies from bdg.msg.metrics, paged"""
+
+    ROWS = 6  # 40 + 6 * 19 px, the display is 170 px tall
+    PAGE_S = 3  # seconds per page when the lines do not fit
+
+    def __init__(self):
+        super().__init__()
+
+        wri_title = CWriter(ssd, font14, GREEN, BLACK, verbose=False)
+        self.wri = CWriter(ssd, font10, GREEN, BLACK, verbose=False)
+
+        self.title = Label(wri_title, 10, 10, 300)
+        self.title.value("Network stats")
+        self.page = 0
+        self.rows = [Label(self.wri, 40 + i * 19, 4, 312) for i in range(self.ROWS)]
+
+        HiddenActiveWidget(self.wri)  # Enable closing with button
+        self.reg_task(self.refresh(), True)
+
+    def lines(self):
+        for name, m in Metrics.registry.items():
+            yield f"[{name}]"
+            for line in m.lines():
+                yield line
+
+    async def refresh(self):
+        t = 0
+        while True:
+            lines = list(self.lines())
+            pages = max(1, (len(lines) + self.ROWS - 1) // self.ROWS)
+            if t and t % self.PAGE_S == 0:
+                self.page += 1
+            self.page %= pages
+            title = "Network stats"
+            self.title.value(f"{title} {self.page + 1}/{pages}" if pages > 1 else title)
+            lines = lines[self.page * self.ROWS : (self.page + 1) * self.ROWS]
+            lines += [""] * (self.ROWS - len(lines))
+            for lbl, line in zip(self.rows, lines):
+                lbl.value(line)
+            t += 1
+            await asyncio.sleep(1)
@@ -1,5 +1,6 @@
 from bdg.screens.solo_games_screen import SoloGamesScreen
 from bdg.screens.info_screen import InfoScreen
+from bdg.screens.net_stats_screen import NetStatsScreen
 from bdg.screens.credits_screen import CreditsScreen
 from gui.fonts import freesans20, font10
 from gui.core.colors import *
@@ -24,6 +25,7 @@ class OptionScreen(Screen):
         self.els = [
             "Home",
             "Info",
+            "Network stats",
             "Credits",
             "Firmware update",
             "Solo games & apps",
@@ -65,6 +67,8 @@ class OptionScreen(Screen):
             Screen.change(GameLobbyScr)
         elif selected == "Info":
             Screen.change(InfoScreen, mode=Screen.STACK)
+        elif selected == "Network stats":
+            Screen.change(NetStatsScreen, mode=Screen.STACK)
         elif selected == "Credits":
             Screen.change(CreditsScreen, mode=Screen.STACK)
         elif selected == "Firmware update":
@@ -62,10 +62,43 @@ class OTAScreen(Screen):
             NowListener.start(self.espnow)
 
     async def start_ota(self, sta, ssid, password):
+        # badges sharing newer firmware, seen before ESP-NOW goes quiet
+        found = self.badge_seeds()
         if self.espnow:
             from bdg.msg.connection import NowListener
 
             NowListener.stop()
+        if not await self.connect_wifi(sta, ssid, password):
+            return
+        updater = OtaUpdater(
+            self.ota_config["host"], self.ota_project, self.cur_version
+        )
+        self.box_out.append("Checking FW-version")
+        await asyncio.sleep_ms(200)
+        try:
+            if not updater.update_available():
+                self.box_out.append(f"No new version found")
+                return
+            self.box_out.append(f"New version {updater.available_version} found")
+            await asyncio.sleep_ms(200)
+            if await self.update_from_badges(sta, updater, found):
+                return
+            if not sta.isconnected() and not await self.connect_wifi(
+                sta, ssid, password
+            ):
+                return
+            self.box_out.append(f"Downloading & updating")
+            await asyncio.sleep_ms(200)
+            updater.update()
+            self.box_out.append(f"Update successful, rebooting..")
+            await asyncio.sleep_ms(200)
+            ota_status.ota_reboot(delay=5)
+        except Exception as e:
+            self.box_out.append(f"Update failed: {e}")
+            print(f"OTA Error: {e}")
+            await asyncio.sleep_ms(200)
+
+    async def connect_wifi(self, sta, ssid, password):
         # Reset sta activity before we start
         sta.active(False)
         await asyncio.sleep_ms(100)
@@ -81,37 +114,67 @@ class OTAScreen(Screen):
 
         if sta.status() in [network.STAT_WRONG_PASSWORD, network.STAT_NO_AP_FOUND]:
             self.box_out.append(f"Connecting to {ssid} failed, check password")
-            return
+            return False
         elif sta.status() is network.STAT_GOT_IP:
             self.box_out.append(f"Connected to {ssid} ")
-
             await asyncio.sleep_ms(200)
-            await self.start_ota_update()
-        else:
-            self.box_out.append(f"Unknown event")
+            return True
+        self.box_out.append(f"Unknown event")
+        return False
+
+    def badge_seeds(self):
+        """(version, mac) of nearby badges sharing newer firmware."""
+        if not self.espnow:
+            return []
+        try:
+            from bdg.msg import fwshare
+        except ImportError:
+            return []  # minimal firmware, no ESP-NOW stack
+        return fwshare.seeds(self.cur_version)
+
+    async def update_from_badges(self, sta, updater, found):
+        """Fetch the version of ota.json from nearby badges, True when written.
+
+        Only version, size and sha256 of the server's ota.json are trusted,
+        a badge can advertise anything.
+        """
+        version = updater.available_version
+        macs = [mac for v, mac in found if v == version]
+        if not macs:
+            return False
+        from bdg.config import Config
+        from bdg.msg import fwshare
+        from bdg.msg.connection import NowListener
+
+        entry = updater.json["versions"][version]
+        manifest = {
+            "version": version,
+            "size": entry["size"],
+            "sha256": entry["sha256"],
+        }
+        self.box_out.append(f"Version {version} on {len(macs)} badge(s) nearby")
+        # back to the ESP-NOW channel of the badges
+        sta.disconnect()
+        sta.config(channel=int(Config.config["espnow"]["ch"]))
+        NowListener.start(self.espnow)
+        shown = [0]
+
+        def progress(done, size):
+            pct = done * 100 // size
+            if pct >= shown[0] + 10:
+                shown[0] = pct
+                self.box_out.append(f"Received {pct}%")
 
-    async def start_ota_update(self):
-        updater = OtaUpdater(
-            self.ota_config["host"], self.ota_project, self.cur_version
-        )
-        self.box_out.append("Checking FW-version")
         await asyncio.sleep_ms(200)
-        try:
-            if updater.update_available():
-                self.box_out.append(f"New version {updater.available_version} found")
-                await asyncio.sleep_ms(200)
-                self.box_out.append(f"Downloading & updating")
-                await asyncio.sleep_ms(200)
-                updater.update()
-                self.box_out.append(f"Update successful, rebooting..")
-                await asyncio.sleep_ms(200)
-                ota_status.ota_reboot(delay=5)
-            else:
-                self.box_out.append(f"No new version found")
-        except Exception as e:
-            self.box_out.append(f"Update failed: {e}")
-            print(f"OTA Error: {e}")
+        fetch = fwshare.FwFetch(self.espnow, manifest, progress=progress)
+        if await fetch.run(macs):
+            self.box_out.append(f"Update successful, rebooting..")
             await asyncio.sleep_ms(200)
+            ota_status.ota_reboot(delay=5)
+            return True
+        NowListener.stop()
+        self.box_out.append("Badge update failed, trying WiFi")
+        return False
 
 
 class OtaUpdater:
@@ -145,6 +208,13 @@ class OtaUpdater:
         ota_update.from_file(
             self.fw_url(v["url"]), sha=v["sha256"], length=v["size"], reboot=False
         )
+        try:
+            from bdg.msg import fwshare
+
+            # the new firmware shares itself with other badges after the reboot
+            fwshare.save_manifest(self.available_version, v)
+        except ImportError:
+            pass
 
     def __download_version_json(self) -> dict:
         if not self.json:
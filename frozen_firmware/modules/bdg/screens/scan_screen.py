@@ -130,11 +130,15 @@ class ScannerScreen(Screen):
         
         # Get all current badges from NowListener
         current_badges = list(NowListener.last_seen.values())
+        # Badges out of range that neighbours told about, shown but not selectable
+        far = []
+        if NowListener.gossip is not None:
+            far = sorted(NowListener.gossip.heard.values(), key=lambda p: p.hops)
         
         # Clear the existing list (modifying in place)
         self.elements.clear()
         
-        if not current_badges:
+        if not current_badges and not far:
             # No badges found, show placeholder
             self.elements.append(("No badges found, looking..", dolittle, (null_badge_adr,)))
         else:
@@ -152,6 +156,10 @@ class ScannerScreen(Screen):
             
             # Add sorted elements to the list
             self.elements.extend(new_elements)
+
+        self.elements.extend(
+            (f"{peer.nick} [{peer.hops} hops]", dolittle, (peer,)) for peer in far
+        )
         
         # Update listbox display
         if hasattr(self, "listbox"):
@@ -0,0 +1,187 @@
+"""
+Binary ring buffer tracing for the messaging hot paths.
+
+Every record is five ints in a preallocated array: level and event id, ticks_ms,
+two small integer arguments and the last two bytes of a MAC. Recording is a
+level compare and a few integer stores, nothing is formatted until the records
+are dumped, so it is cheap enough to leave on for every received frame.
+
+    >>> from bdg import trace
+    >>> trace.dump()             # print the last records on the REPL
+    >>> trace.level = trace.DEBUG
+    >>> trace.echo = trace.INFO  # also print records up to INFO as they happen
+    >>> trace.save()             # /trace.bin, decode with scripts/decode_trace.py
+"""
+
+import struct
+from array import array
+from time import ticks_ms
+
+OFF = 0
+ERROR = 1
+INFO = 2
+DEBUG = 3
+
+LEVELS = ("OFF", "ERROR", "INFO", "DEBUG")
+
+# event ids, never reuse a number, saved traces are decoded with this table
+RX = 1
+RX_WEAK = 2
+RX_BLOCKED = 3
+RX_UNKNOWN = 4
+NO_RECEIVER = 5
+CONN_RX = 6
+CONN_SEND = 7
+CONN_NEXT = 8
+OUT_RETRY = 9
+OUT_TIMEOUT = 10
+OUT_ACKED = 11
+ACK_DROP = 12
+SEND_ERR = 13
+SEND_FAIL = 14
+PEER_EVICT = 15
+DUPLICATE = 16
+LINK_LOST = 17
+RESUMED = 18
+SESSION_GONE = 19
+PEER_LOST = 20
+
+# event id: (name, name of arg a, name of arg b), "type" args index type names
+EVENTS = {
+    RX: ("rx", "type", "id"),
+    RX_WEAK: ("rx_weak", "rssi", None),
+    RX_BLOCKED: ("rx_blocked", None, None),
+    RX_UNKNOWN: ("rx_unknown", "type", "rssi"),
+    NO_RECEIVER: ("no_receiver", "con_id", "id"),
+    CONN_RX: ("conn_rx", "con_id", "type"),
+    CONN_SEND: ("conn_send", "con_id", "type"),
+    CONN_NEXT: ("conn_next", "con_id", None),
+    OUT_RETRY: ("out_retry", "id", "retry"),
+    OUT_TIMEOUT: ("out_timeout", "id", None),
+    OUT_ACKED: ("out_acked", "id", None),
+    ACK_DROP: ("ack_drop", "id", None),
+    SEND_ERR: ("send_err", "errno", None),
+    SEND_FAIL: ("send_fail", "errno", None),
+    PEER_EVICT: ("peer_evict", "idle_ms", None),
+    DUPLICATE: ("duplicate", "id", None),
+    LINK_LOST: ("link_lost", "con_id", "buffered"),
+    RESUMED: ("resumed", "con_id", "ms"),
+    SESSION_GONE: ("session_gone", "con_id", "buffered"),
+    PEER_LOST: ("peer_lost", "con_id", "misses"),
+}
+
+REC_INTS = 5
+NO_MAC = -1
+
+MAGIC = b"BTRC"
+VERSION = 1
+# file header: magic, version, record count, ring size, next write index
+HDR = "<4sBIII"
+
+level = INFO  # records above this level are not stored
+echo = ERROR  # records up to this level are also printed when stored
+
+_size = 256
+_buf = array("i", bytes(4 * REC_INTS * _size))
+_n = 0  # records stored since clear()
+_names = []  # type names, "type" args are indexes into this
+_name_ids = {}
+
+
+def rec(lvl, ev, a=0, b=0, mac=None):
+    """Store one event if lvl passes the level gate."""
+    global _n
+    if lvl > level:
+        return
+    i = (_n % _size) * REC_INTS
+    buf = _buf
+    buf[i] = lvl << 16 | ev
+    buf[i + 1] = ticks_ms()
+    buf[i + 2] = a
+    buf[i + 3] = b
+    buf[i + 4] = NO_MAC if mac is None else mac[-2] << 8 | mac[-1]
+    _n += 1
+    if lvl <= echo:
+        print(fmt((lvl, ev, buf[i + 1], a, b, buf[i + 4])))
+
+
+def tid(obj):
+    """Small integer id of the type of obj, for "type" args.
+
+    Arguments are built before rec() checks the level, so hot paths test
+    trace.level first instead of calling tid() for a record that is dropped.
+    """
+    name = type(obj).__name__
+    i = _name_ids.get(name)
+    if i is None:
+        i = _name_ids[name] = len(_names)
+        _names.append(name)
+    return i
+
+
+def resize(records):
+    global _size, _buf
+    _size = records
+    _buf = array("i", bytes(4 * REC_INTS * _size))
+    clear()
+
+
+def clear():
+    global _n
+    _n = 0
+
+
+def records(buf=None, n=None, size=None):
+    """Yield records oldest first as (level, event, ticks_ms, a, b, mac tail)."""
+    if buf is None:
+        buf, n, size = _buf, _n, _size
+    for k in range(max(0, n - size), n):
+        i = (k % size) * REC_INTS
+        yield (buf[i] >> 16, buf[i] & 0xFFFF) + tuple(buf[i + 1 : i + REC_INTS])
+
+
+def fmt(r, names=None):
+    """Format one record as returned by records()."""
+    names = _names if names is None else names
+    lvl, ev, t, a, b, mac = r
+    name, a_name, b_name = EVENTS.get(ev, (f"ev{ev}", "a", "b"))
+    out = [f"{t:>10} {LEVELS[lvl]:<5} {name}"]
+    if mac != NO_MAC:
+        out.append(f"mac=..{mac:04x}")
+    for arg_name, v in ((a_name, a), (b_name, b)):
+        if arg_name == "type":
+            v = names[v] if 0 <= v < len(names) else v
+        if arg_name:
+            out.append(f"{arg_name}={v}")
+    return " ".join(out)
+
+
+def dump(last=50):
+    """Print the last records on the REPL, oldest first."""
+    recs = list(records())[-last:]
+    for r in recs:
+        print(fmt(r))
+    print(f"trace: {len(recs)} of {_n} records, level {LEVELS[level]}")
+
+
+def save(path="/trace.bin"):
+    """Write the raw ring and the type names for decoding on the host."""
+    with open(path, "wb") as f:
+        f.write(struct.pack(HDR, MAGIC, VERSION, _n, _size, _n % _size))
+        f.write(_buf)
+        f.write("\n".join(_names).encode())
+    print(f"trace: {min(_n, _size)} records written to {path}")
+
+
+def load(path="/trace.bin"):
+    """Read a saved trace, returns (records list, type names)."""
+    size_hdr = struct.calcsize(HDR)
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, n, size, _ = struct.unpack(HDR, data[:size_hdr])
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a trace file: {path}")
+    end = size_hdr + 4 * REC_INTS * size
+    buf = array("i", data[size_hdr:end])
+    names = data[end:].decode().split("\n") if end < len(data) else []
+    return list(records(buf, n, size)), names
@@ -4,6 +4,8 @@ from time import time
 
 from gui.primitives import launch
 
+from bdg.aproc import AProc
+
 
 def enum(**enums: int):
     # https://github.com/micropython/micropython-lib/issues/269#issuecomment-1046314507
@@ -11,10 +13,16 @@ def enum(**enums: int):
 
 
 def copy_img_to_mvb(img_file, ssd):
-    with open(img_file, "rb") as f:
-        rows = int.from_bytes(f.read(2), "big")
-        cols = int.from_bytes(f.read(2), "big")
-        f.readinto(ssd.mvb)
+    # .bimg asset file, see bdg.assets
+    from bdg.assets import blit_asset
+
+    blit_asset(ssd, img_file)
+
+
+def mark(ssd, x, y, w, h):
+    # tell a partial refresh display (bdg.display) about a direct ssd.mvb write
+    if hasattr(ssd, "mark"):
+        ssd.mark(x, y, w, h)
 
 
 from framebuf import RGB565, GS4_HMSB, GS8
@@ -48,6 +56,7 @@ def blit(ssd, img, row=0, col=0):
         s += ibytes
         d += dwidth
         irows -= 1
+    mark(ssd, col, row, icols, min(img.rows, ssd.height - row))
 
 
 def blit_to_buf(ssd, t_mvb, img_height, img_width, pos_y=0, pos_x=0):
@@ -72,54 +81,6 @@ def blit_to_buf(ssd, t_mvb, img_height, img_width, pos_y=0, pos_x=0):
         irows -= 1
 
 
-class AProc:
-    # A mixed class that ensures that the task() coro is running only once
-    # >>> Aproc.start(task=True) returns a task, a new one or the running one
-    # >>> Aproc.stop()  # will cancel the running task
-    stop_event = asyncio.Event()
-    _task = None
-
-    def __init__(self):
-        pass
-
-    async def task(self, *args, **kwargs):
-        # This needs to be overridden
-        print("ERROR: AProc task started!!!!!")
-        pass
-
-    async def wait_stop(self):
-        await self.stop_event.wait()
-
-    @classmethod
-    def start(cls, *args, **kwargs):
-        print(f"Starting async {type(cls).__name__}")
-        task = kwargs.pop("task", None)
-        if task:
-            if cls._task and cls._task.done() or not cls._task:
-                # now start the task with all args except "task"
-                cls._task = asyncio.create_task(cls.task(*args, **kwargs))
-                print(f"new task: {cls._task=}")
-            return cls._task
-        else:
-            # sync run, this is missing the logic to ensure single task
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(cls.task(*args, **kwargs))
-
-    @classmethod
-    def is_running(cls):
-        if cls._task and not cls._task.done():
-            return True
-        return False
-
-    @classmethod
-    def stop(cls):
-        print(f"Stopping async {cls.__name__}")
-        if cls.stop_event:
-            cls.stop_event.set()
-            cls._task.cancel()
-            cls._task = None
-
-
 def singleton(cls):
     instance = None
 
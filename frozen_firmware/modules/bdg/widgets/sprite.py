@@ -1,5 +1,7 @@
 import framebuf
 
+from bdg.assets import RGB565_I, load_atlas
+from bdg.blit import blit_spans
 from bdg.utils import blit_to_buf, blit
 from gui.core import writer
 from gui.core.colors import BLACK, GREEN, WHITE
@@ -8,21 +10,154 @@ from gui.core.writer import AlphaColor
 from hardware_setup import ssd
 
 
+# palette indexed sprites (scripts/img_index.py): pixels per byte of a row
+INDEXED = {framebuf.GS2_HMSB: 4, framebuf.GS4_HMSB: 2, framebuf.GS8: 1}
+
+
 class SpriteBuffer(framebuf.FrameBuffer):
-    def __init__(self, width, height):
-        buf = bytearray(height * width * 2)
+    def __init__(self, width, height, mode=framebuf.RGB565, buf=None):
+        if buf is not None:
+            pass  # a frame of a SpriteAtlas, a slice of its buffer
+        elif mode in INDEXED:
+            per = INDEXED[mode]
+            buf = bytearray(height * ((width + per - 1) // per))
+        else:
+            buf = bytearray(height * width * 2)
         self.mvb = memoryview(buf)
         self.height = height  # Required by Writer class
         self.width = width
-        self.mode = framebuf.RGB565
-        super().__init__(buf, width, height, framebuf.RGB565)
+        self.mode = mode
+        super().__init__(buf, width, height, mode)
 
     def from_image(self, image):
         self.mvb[:] = image.data
         return self
 
 
+class SpriteImage(object):
+    """An image module ready to draw: with spans, palette indexed or RGB565.
+
+    key is the transparent colour of a plain RGB565 image, -1 for none.
+    """
+
+    def __init__(self, image, key=-1):
+        self.height = image.rows
+        self.width = image.cols
+        self._image = None
+        self._sprite = None
+        self._palette = None
+        self._key = key
+        if hasattr(image, "lut"):
+            # 2, 4 or 8 bits per pixel, expanded through the lut on blit
+            mode = image.mode
+            self._sprite = SpriteBuffer(self.width, self.height, mode).from_image(image)
+            lut = bytearray(image.lut)
+            self._palette = framebuf.FrameBuffer(lut, len(lut) // 2, 1, framebuf.RGB565)
+            self._key = self._palette.pixel(image.key, 0) if image.key >= 0 else -1
+        elif hasattr(image, "spans"):
+            # images with spans (scripts/img_spans.py) skip the keyed blit
+            self._image = image
+        else:
+            self._sprite = SpriteBuffer(self.width, self.height).from_image(image)
+
+    def blit(self, ssd, row, col):
+        if self._image is not None:
+            blit_spans(ssd, self._image, row, col)
+        else:
+            ssd.blit(self._sprite, col, row, self._key, self._palette)
+
+
+class SpriteAtlas(object):
+    """The frames of a .bimg atlas (scripts/img_atlas.py), all in one buffer.
+
+    Each frame is a SpriteBuffer over its rows of the buffer, made once when
+    the atlas loads, so drawing a frame copies and allocates nothing.
+    """
+
+    def __init__(self, name: str):
+        img, buf = load_atlas(name)
+        mode = framebuf.RGB565 if img.mode == RGB565_I else img.mode
+        self.width = img.cols
+        self.height = max(h for _, h in img.frames)
+        self._palette = None
+        self._key = img.key
+        if img.lut is not None:
+            lut = bytearray(img.lut)
+            self._palette = framebuf.FrameBuffer(lut, len(lut) // 2, 1, framebuf.RGB565)
+            if img.key >= 0:
+                self._key = self._palette.pixel(img.key, 0)
+        stride = len(buf) // img.rows
+        mv = memoryview(buf)
+        self.frames = [
+            SpriteBuffer(self.width, h, mode, mv[y * stride : (y + h) * stride])
+            for y, h in img.frames
+        ]
+
+    def __len__(self):
+        return len(self.frames)
+
+    def blit(self, ssd, frame, row, col):
+        ssd.blit(self.frames[frame], col, row, self._key, self._palette)
+
+
+class AnimatedSprite(object):
+    """
+    Frames of a SpriteAtlas shown in turn, a SpriteImage for SpriteLayer.
+
+    step(ms) advances the frame clock, call it with the step_ms of a FrameLoop
+    update (SpriteLayer.step() does it for its sprites). It returns True when
+    another frame is due, which then needs drawing.
+
+    Args:
+        atlas (SpriteAtlas): Shared by all sprites with the same frames.
+        frames: Frame numbers to show, default all in atlas order.
+        frame_ms (int): How long each frame shows.
+        loop (bool): Start over after the last frame, else stay on it.
+    """
+
+    def __init__(self, atlas, frames=None, frame_ms=100, loop=True):
+        self.atlas = atlas
+        self.width = atlas.width
+        self.height = atlas.height
+        self.frame_ms = frame_ms
+        self.loop = loop
+        self.play(frames)
+
+    def play(self, frames=None):
+        """Show frames from the first, a tuple or range of frame numbers."""
+        self.frames = range(len(self.atlas)) if frames is None else frames
+        self.index = 0
+        self.done = False
+        self._ms = 0
+
+    def step(self, ms) -> bool:
+        if self.done:
+            return False
+        self._ms += ms
+        if self._ms < self.frame_ms:
+            return False
+        n = self._ms // self.frame_ms
+        self._ms -= n * self.frame_ms
+        last = len(self.frames) - 1
+        if self.loop:
+            self.index = (self.index + n) % (last + 1)
+        elif self.index + n >= last:
+            self.index = last
+            self.done = True
+        else:
+            self.index += n
+        return True
+
+    def blit(self, ssd, row, col):
+        self.atlas.blit(ssd, self.frames[self.index], row, col)
+
+
 class Sprite(Widget):
+    """A single moving image that saves and restores the background under it.
+
+    Overlapping sprites overwrite each other's saved background, use a
+    bdg.widgets.sprite_layer.SpriteLayer for several sprites.
+    """
 
     def __init__(
         self,
@@ -39,7 +174,7 @@ class Sprite(Widget):
         width = image.cols
         super().__init__(writer, row, col, height, width, fgcolor, bgcolor, bdcolor)
 
-        self._sprite = SpriteBuffer(width, height).from_image(image)
+        self._img = SpriteImage(image, bgcolor)
         self._bg_store = SpriteBuffer(width, height)
 
         self._old_row = row
@@ -71,6 +206,6 @@ class Sprite(Widget):
             # ssd.palette.fg(WHITE)  # prepare for blitting
             # ssd.palette.bg(self.bgcolor)
             # blit with transparency if self.bgcolor matches the _sprite palette
-            ssd.blit(self._sprite, self.col, self.row, self.bgcolor)
+            self._img.blit(ssd, self.row, self.col)
         self._old_row = self.row
         self._old_col = self.col
@@ -0,0 +1,174 @@
+"""
+All moving sprites of a screen, drawn in one pass.
+
+Sprite saves the background under itself and puts it back when it moves, so
+two overlapping sprites save each other's pixels, and each sprite costs a
+save and a restore. A SpriteLayer instead knows how to draw the background,
+a colour or a callback for an area, and every render():
+
+    1. paints the background once over the areas the moved sprites left,
+       merged into a few rectangles (bdg.display.DirtyRects),
+    2. draws, bottom z first, the sprites that moved and the ones those areas
+       or a lower sprite drew over.
+
+    layer = SpriteLayer(ssd, BLACK)
+    # or a .bimg background: lambda x, y, w, h: blit_asset(
+    #     ssd, "matriisi", clip=(x, y, w, h))
+    ship = layer.add(ship_img, row=100, col=20, z=1)
+    rock = layer.add(rock_img, row=30, col=200)
+
+    def update(self):  # FrameLoop update, every 20 ms
+        layer.step(20)  # animated sprites, see AnimatedSprite
+        ship.move(ship.row, ship.col + 2)
+        if layer.collisions(ship):
+            self.crash()
+
+    def render(self):
+        layer.render()  # FrameLoop flushes the dirty rectangles after it
+
+Drawing goes through ssd, so a partial refresh display sends only what
+changed, layer.dirty lists those areas as (x, y, w, h) after each render.
+"""
+
+from bdg.display import DirtyRects
+from bdg.widgets.sprite import SpriteImage
+
+
+def overlap(a, b) -> bool:
+    """Do the (x, y, w, h) boxes a and b overlap."""
+    return (
+        a[0] < b[0] + b[2]
+        and b[0] < a[0] + a[2]
+        and a[1] < b[1] + b[3]
+        and b[1] < a[1] + a[3]
+    )
+
+
+class LayerSprite(object):
+    """A sprite of a SpriteLayer, made by SpriteLayer.add()."""
+
+    def __init__(self, image, row, col, z):
+        self.image = image
+        self.row = row
+        self.col = col
+        self.z = z
+        self.visible = True
+        self.drawn = None  # box on screen at the last render
+        self.changed = True
+
+    def move(self, row, col):
+        if row != self.row or col != self.col:
+            self.row = row
+            self.col = col
+            self.changed = True
+
+    def show(self, visible=True):
+        if visible != self.visible:
+            self.visible = visible
+            self.changed = True
+
+    def rect(self) -> tuple:
+        return (self.col, self.row, self.image.width, self.image.height)
+
+    def collides(self, other) -> bool:
+        return overlap(self.rect(), other.rect())
+
+
+class SpriteLayer(object):
+    """
+    Sprites in z order over a background.
+
+    Args:
+        ssd: The display.
+        background: A colour to fill uncovered areas with, or a callable
+            background(x, y, w, h) that draws that area of the background.
+        max_rects (int): Background areas are merged down to this many.
+    """
+
+    def __init__(self, ssd, background=0, max_rects=4):
+        self.ssd = ssd
+        self.background = background
+        self.sprites = []  # bottom first
+        self.dirty = []
+        self._restore = DirtyRects(ssd.width, ssd.height, max_rects)
+
+    def add(self, image, row, col, z=0, key=-1) -> LayerSprite:
+        """Add an image module, SpriteImage or AnimatedSprite, above the
+        sprites of lower or the same z."""
+        if not hasattr(image, "blit"):
+            image = SpriteImage(image, key)
+        sprite = LayerSprite(image, row, col, z)
+        i = len(self.sprites)
+        while i and self.sprites[i - 1].z > z:
+            i -= 1
+        self.sprites.insert(i, sprite)
+        return sprite
+
+    def remove(self, sprite):
+        if sprite.drawn is not None:
+            self._restore.add(*sprite.drawn)
+        self.sprites.remove(sprite)
+
+    def collisions(self, sprite) -> list:
+        """The visible sprites whose box overlaps the box of sprite."""
+        r = sprite.rect()
+        return [
+            s
+            for s in self.sprites
+            if s is not sprite and s.visible and overlap(r, s.rect())
+        ]
+
+    def at(self, x, y):
+        """The top visible sprite at x, y, or None."""
+        for s in reversed(self.sprites):
+            if s.visible and overlap((x, y, 1, 1), s.rect()):
+                return s
+        return None
+
+    def step(self, ms):
+        """Advance the frame clocks of the animated sprites by ms."""
+        for s in self.sprites:
+            if hasattr(s.image, "step") and s.image.step(ms):
+                s.changed = True
+
+    def redraw(self):
+        """Draw background and sprites again, after the screen was cleared."""
+        self._restore.add(0, 0, self.ssd.width, self.ssd.height)
+        for s in self.sprites:
+            s.changed = True
+
+    def render(self) -> list:
+        """Draw what changed since the last render, returns layer.dirty."""
+        restore = self._restore
+        for s in self.sprites:
+            if s.changed and s.drawn is not None:
+                restore.add(*s.drawn)
+        if restore.full:
+            painted = [(0, 0, self.ssd.width, self.ssd.height)]
+        else:
+            painted = list(restore.rects)
+        restore.clear()
+        bg = self.background
+        for r in painted:
+            if callable(bg):
+                bg(*r)
+            else:
+                self.ssd.fill_rect(r[0], r[1], r[2], r[3], bg)
+        for s in self.sprites:
+            if not s.visible:
+                s.drawn = None
+                s.changed = False
+                continue
+            r = s.rect()
+            if not s.changed:
+                for p in painted:
+                    if overlap(r, p):
+                        break
+                else:
+                    continue
+            s.image.blit(self.ssd, s.row, s.col)
+            s.drawn = r
+            s.changed = False
+            painted.append(r)
+        self.dirty = painted
+        return painted
@@ -0,0 +1,109 @@
+"""
+Tile map: a grid of cells, each drawn from a pre-rendered tile bitmap.
+
+The game writes tile numbers into tm.cells, a bytearray of cols * rows, and
+render() draws only the cells that differ from what is on the display. Each
+grid row that changed is compared in one slice, the changed cells are blit
+from their tile bitmaps, and each run of neighbouring changed cells is marked
+as one rectangle for the partial refresh display (bdg.display) and listed in
+tm.dirty.
+
+    tm = TileMap(ssd, x=8, y=5, cols=10, rows=20, tile_w=8, tile_h=8,
+                 tiles=(BLACK, RED, GREEN), gap=1)
+    tm.cells[:] = board             # or tm.set(col, row, tile)
+    tm.render()
+
+A tile is a colour, drawn as a tile_w - gap by tile_h - gap square on bg, or
+an RGB565 image module of tile_w by tile_h.
+"""
+
+import framebuf
+
+
+class TileMap(object):
+    """
+    Args:
+        ssd: The display.
+        x (int): Left edge on the display, pixels.
+        y (int): Top edge.
+        cols (int): Cells per row.
+        rows (int): Rows of cells.
+        tile_w (int): Cell width, pixels.
+        tile_h (int): Cell height.
+        tiles: Per tile number a colour or an image module.
+        gap (int): Pixels of bg right of and below a colour tile.
+        bg: Colour of the gap.
+    """
+
+    def __init__(self, ssd, x, y, cols, rows, tile_w, tile_h, tiles, gap=0, bg=0):
+        self.ssd = ssd
+        self.x = x
+        self.y = y
+        self.cols = cols
+        self.rows = rows
+        self.tile_w = tile_w
+        self.tile_h = tile_h
+        self.cells = bytearray(cols * rows)
+        self._shown = bytearray(b"\xff" * (cols * rows))  # nothing drawn yet
+        self.dirty = []
+        self._tiles = []
+        for t in tiles:
+            buf = bytearray(tile_w * tile_h * 2)
+            fb = framebuf.FrameBuffer(buf, tile_w, tile_h, framebuf.RGB565)
+            if isinstance(t, int):
+                fb.fill(bg)
+                fb.fill_rect(0, 0, tile_w - gap, tile_h - gap, t)
+            else:
+                buf[:] = t.data
+            self._tiles.append(fb)
+
+    def set(self, col, row, tile):
+        self.cells[row * self.cols + col] = tile
+
+    def get(self, col, row) -> int:
+        return self.cells[row * self.cols + col]
+
+    def fill(self, tile):
+        for i in range(len(self.cells)):
+            self.cells[i] = tile
+
+    def invalidate(self):
+        """Draw every cell on the next render, after the screen was cleared."""
+        for i in range(len(self._shown)):
+            self._shown[i] = 0xFF
+
+    def render(self) -> list:
+        """Draw the changed cells, returns tm.dirty."""
+        ssd = self.ssd
+        cells = self.cells
+        shown = self._shown
+        tiles = self._tiles
+        cols = self.cols
+        tw = self.tile_w
+        th = self.tile_h
+        # the driver's own blit, one mark per run instead of one per cell
+        blit = framebuf.FrameBuffer.blit
+        mark = getattr(ssd, "mark", None)
+        dirty = []
+        for r in range(self.rows):
+            i = r * cols
+            if cells[i : i + cols] == shown[i : i + cols]:
+                continue
+            py = self.y + r * th
+            c = 0
+            while c < cols:
+                if cells[i + c] == shown[i + c]:
+                    c += 1
+                    continue
+                start = c
+                while c < cols and cells[i + c] != shown[i + c]:
+                    v = cells[i + c]
+                    blit(ssd, tiles[v], self.x + c * tw, py)
+                    shown[i + c] = v
+                    c += 1
+                run = (self.x + start * tw, py, (c - start) * tw, th)
+                if mark is not None:
+                    mark(*run)
+                dirty.append(run)
+        self.dirty = dirty
+        return dirty
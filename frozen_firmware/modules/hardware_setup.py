@@ -2,7 +2,12 @@ import gc
 
 from machine import Pin, SPI, freq
 
-from drivers.st7789.st7789_16bit import ST7789 as SSD, PORTRAIT, ADAFRUIT_1_9
+from drivers.st7789.st7789_16bit import ST7789, PORTRAIT, ADAFRUIT_1_9
+
+from bdg.display import partial
+
+# show() sends only what was drawn since the last one, see bdg.display
+SSD = partial(ST7789)
 
 # Create and export an SSD instance
 pdc = Pin(15, Pin.OUT, value=0)  # data command (violet)
@@ -1,6807 +0,0 @@
-# Code generated by img_cvt.py.version = "0.1"
-source = "/tmp/tmp.AL5yPKpDKH.ppm"
-rows = 170
-cols = 320
-mode = 10
-data =\
-b'\xa5\xba\xa5\xba\xa5\xba\xa5\xba\xa5\xba\xa5\xba\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x95\x7a\x9d\x9a'\
-b'\x9d\x9a\x95\x7a\x95\x7a\x9d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x9a'\
-b'\x95\x9a\x95\x7a\xa5\xbb\x8d\x5a\x85\x3a\x9d\x9a\x85\x3a\x85\x3b'\
-b'\x9d\x9a\x95\x9a\x95\x9a\x95\x7a\x95\x5a\x9d\x9a\x9d\x9a\x8d\x7b'\
-b'\x74\xfb\x6c\xfa\x6c\xfb\x64\xfb\x44\x1a\x23\x58\x2b\x37\x33\x16'\
-b'\x3b\x14\x52\xd2\x62\x8f\x62\x6f\x5a\xb0\x4a\xd2\x42\xf4\x3b\x15'\
-b'\x3b\x15\x42\xf4\x42\xf3\x4a\xf3\x33\x37\x0b\x9b\x0b\x9b\x0b\x9b'\
-b'\x13\xbb\x13\xbb\x34\x3b\x54\x9b\x54\x9b\x4c\x9b\x54\x9b\x4c\x9b'\
-b'\x4c\x7b\x44\x5b\x44\x7b\x44\x5b\x44\x5b\x4c\x7b\x4c\x9b\x54\x9b'\
-b'\x54\x9b\x4c\x9b\x4c\x7b\x4c\x7b\x44\x5b\x3c\x5b\x3c\x5b\x3c\x5b'\
-b'\x3c\x5b\x3c\x5b\x44\x5b\x44\x5b\x34\x3b\x3c\x3b\x34\x3b\x34\x3b'\
-b'\x34\x1b\x2c\x1b\x34\x1b\x34\x1b\x2c\x1b\x2c\x1b\x34\x3b\x34\x3b'\
-b'\x3c\x3b\x3c\x5b\x3c\x5b\x44\x5b\x4c\x7b\x4c\x9b\x54\xbb\x5c\xbb'\
-b'\x64\xda\x64\xdb\x6c\xfa\x75\x1a\x85\x3a\x8d\x5b\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x7d\x3b\x75\x1b\x5c\xbb\x4c\x7b'\
-b'\x44\x7b\x4c\x7b\x5c\xbb\x75\x1a\x7d\x1a\x7d\x1b\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x3b\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x85\x3b\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x9d\x7a\x95\x7a\x95\x7a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x7a\x9d\x9a\x95\x9a\x95\x7a\x9d\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3b\x7d\x3a\x6c\xfb\x64\xda\x64\xdb\x6c\xfa'\
-b'\x75\x1b\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x85\x5b\x7d\x3a\x7d\x1a\x75\x1b'\
-b'\x6c\xfb\x64\xda\x64\xdb\x5c\xdb\x5c\xbb\x54\xbb\x54\x9b\x54\x9b'\
-b'\x4c\x9b\x4c\x9b\x4c\x7b\x4c\x7b\x4c\x7b\x4c\x7b\x44\x7b\x44\x7b'\
-b'\x44\x5b\x4c\x7b\x54\x9b\x54\x9b\x54\xbb\x5c\xba\x6c\xfa\x6c\xfb'\
-b'\x75\x1b\x75\x1a\x75\x1b\x7d\x1a\x7d\x3a\x7d\x3b\x75\x1a\x75\x1a'\
-b'\x74\xfa\x7d\x3a\x85\x5b\x7d\x3a\x74\xfa\x6c\xfb\x5c\xda\x5c\xba'\
-b'\x5c\xbb\x54\x9b\x54\xbb\x54\xbb\x5c\xba\x64\xdb\x6c\xfb\x75\x1a'\
-b'\x7d\x3a\x8d\x5a\x8d\x7a\x95\x7a\x9d\x9a\xa5\xba\xa5\xba\xad\xda'\
-b'\xad\xda\xad\xda\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xda'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xfa\xbd\xfa'\
-b'\xb5\xfa\xb5\xfa\xbd\xfa\xbd\xfa\xb5\xfa\xbd\xfa\xbd\xfa\xb5\xfa'\
-b'\xa5\xba\xa5\x9a\x9d\xba\xa5\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x9d\x9a\x85\x5a\x85\x3a\x95\x9a\x74\xf9'\
-b'\x85\x3a\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x8d\x7a\x95\x7a\x95\x7a'\
-b'\x85\x3a\x6c\xda\x64\xda\x6c\xfa\x5c\xbb\x33\xf9\x23\x57\x2b\x16'\
-b'\x33\x15\x42\xf4\x52\xb1\x5a\x8f\x52\xb1\x4a\xd2\x3a\xf4\x33\x15'\
-b'\x3b\x15\x42\xf3\x4a\xd2\x4a\xd2\x2b\x36\x0b\x9b\x0b\x9b\x0b\x9b'\
-b'\x13\xbb\x1b\xbb\x1b\xdb\x34\x1b\x44\x9b\x4c\x9a\x4c\x7b\x3c\x5b'\
-b'\x34\x3b\x44\x3a\x44\x5a\x3c\x5a\x44\x5b\x44\x7a\x4c\x7a\x4c\x9b'\
-b'\x54\x9a\x4c\x7a\x44\x7b\x44\x5b\x44\x5b\x34\x3a\x34\x3b\x3c\x3b'\
-b'\x3c\x3b\x3c\x5a\x44\x5b\x3c\x5a\x34\x3b\x34\x3b\x34\x3b\x34\x3b'\
-b'\x2c\x3b\x34\x3b\x34\x3b\x2c\x1b\x2c\x1b\x34\x1b\x34\x3b\x34\x3b'\
-b'\x34\x3b\x3c\x3a\x3c\x5b\x44\x7a\x4c\x7a\x4c\x7a\x54\x9a\x5c\xba'\
-b'\x5c\xba\x64\xdb\x6c\xfa\x75\x1a\x7d\x1a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x74\xfa\x5c\xba\x44\x7a'\
-b'\x44\x5a\x44\x5a\x54\xba\x6c\xfa\x75\x1a\x7d\x1a\x75\x1a\x7d\x3a'\
-b'\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x9d\x7a\x95\x7a\x95\x9a\x9d\x7a'\
-b'\x9d\x9a\x9d\x7a\x9d\x9a\x9d\x7a\x95\x7a\x9d\x79\x95\x9a\x95\x7a'\
-b'\x95\x79\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x75\x1a\x64\xda\x5c\xda\x64\xba\x64\xdb'\
-b'\x75\x1a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x7d\x3a\x7d\x1a\x75\x1a\x6c\xfa'\
-b'\x6c\xfa\x64\xda\x64\xda\x5c\xbb\x5c\xba\x54\xba\x54\x9a\x4c\x9a'\
-b'\x4c\x9a\x4c\x7b\x4c\x7a\x4c\x7b\x4c\x7b\x44\x7a\x44\x5b\x44\x5a'\
-b'\x44\x5b\x44\x5a\x54\x9a\x4c\x7a\x54\xbb\x64\xda\x64\xda\x6c\xfa'\
-b'\x6c\xfa\x6c\xfa\x75\x1b\x75\x1a\x75\x1a\x75\x1a\x74\xfa\x74\xfa'\
-b'\x75\x1a\x85\x3b\x85\x5a\x7d\x1a\x74\xfa\x6c\xda\x64\xdb\x5c\xba'\
-b'\x54\xba\x54\xba\x5c\x9a\x5c\x9a\x5c\xbb\x64\xda\x6c\xfa\x74\xfa'\
-b'\x7d\x1a\x85\x3a\x8d\x5a\x95\x7a\x9d\x9a\x9d\x9a\xa5\xba\xa5\xba'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xb5\xd9\xb5\xd9\xb5\xd9'\
-b'\xb5\xd9\xb5\xd9\xb5\xd9\xb5\xd9\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xd9'\
-b'\xb5\xf9\xb5\xda\xb5\xd9\xb5\xd9\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xa5\xba\x9d\xba\xa5\x9a\x9d\xba\xa5\x99\x9d\x99\x9d\x99\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x9d\x7a\x95\x9a\x9d\x7a\x95\x7a\x95\x9a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x7a'\
-b'\x8d\x7a\x8d\x5a\x95\x7a\x95\x7a\x95\x9a\x8d\x5a\x7d\x1a\x95\x7a'\
-b'\x6c\xd9\x75\x1a\x95\x7a\x95\x5a\x95\x7a\x8d\x5a\x8d\x5a\x95\x7a'\
-b'\x95\x9a\x85\x5a\x6c\xda\x64\xda\x64\xda\x5c\xba\x3c\x19\x23\x58'\
-b'\x23\x37\x33\x16\x3a\xf4\x42\xd3\x4a\xb2\x42\xd3\x3b\x14\x33\x15'\
-b'\x3a\xf4\x4a\xd3\x4a\xd2\x4a\xd2\x2b\x36\x0b\x7b\x0b\x9a\x13\x9b'\
-b'\x13\xbb\x1b\xdb\x23\xdb\x23\xfb\x2c\x1b\x34\x1b\x34\x1b\x2c\x1a'\
-b'\x34\x1b\x3c\x3b\x3c\x5b\x3c\x5b\x44\x5b\x4c\x7b\x4c\x7a\x4c\x9b'\
-b'\x4c\x9b\x4c\x9a\x4c\x7b\x44\x5a\x3c\x5b\x3c\x5b\x34\x1a\x34\x3b'\
-b'\x3c\x3b\x3c\x5a\x3c\x5b\x44\x5a\x34\x1b\x3c\x3b\x34\x3a\x34\x3a'\
-b'\x34\x1b\x34\x1a\x34\x3a\x34\x1b\x34\x1a\x34\x3b\x34\x3a\x34\x3b'\
-b'\x34\x3a\x3c\x5b\x44\x5b\x44\x5a\x4c\x7b\x4c\x7b\x54\x9a\x5c\xba'\
-b'\x64\xbb\x64\xda\x6c\xfb\x74\xfa\x7d\x1a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x1a\x5c\xba\x4c\x7b'\
-b'\x44\x5b\x44\x5b\x54\x9a\x6c\xfa\x7d\x1b\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3b\x7d\x3a\x85\x3a\x85\x1a\x7d\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x95\x5a\x95\x7a\x95\x5a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x9d\x99\x9d\x79\x95\x9a'\
-b'\x95\x79\x95\x99\x9d\x7a\x95\x99\x95\x9a\x9d\x9a\x9d\x7a\x95\x99'\
-b'\x9d\x9a\x9d\x9a\x95\x79\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x8d\x7a\x95\x59\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x74\xfa\x64\xda\x5c\xbb\x5c\xda\x64\xda'\
-b'\x75\x1a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x8d\x5a\x85\x5a\x7d\x3a\x7d\x1a\x75\x1a\x74\xfb'\
-b'\x6c\xfb\x64\xda\x64\xdb\x5c\xba\x5c\xba\x54\x9b\x54\xbb\x54\x9b'\
-b'\x54\x9a\x4c\x7b\x4c\x7b\x4c\x7a\x44\x7a\x4c\x7b\x44\x7b\x44\x5a'\
-b'\x44\x5b\x4c\x7b\x54\x9a\x4c\x9b\x5c\xba\x64\xdb\x64\xda\x6c\xfa'\
-b'\x6c\xfa\x74\xfa\x74\xfa\x75\x1a\x75\x1a\x74\xfa\x74\xfa\x6d\x1a'\
-b'\x7d\x1a\x85\x5a\x85\x5a\x7d\x3a\x75\x1a\x6c\xfa\x64\xda\x5c\xdb'\
-b'\x5c\xba\x5c\xba\x5c\xbb\x5c\xba\x64\xda\x64\xdb\x6c\xfa\x75\x1a'\
-b'\x7d\x1a\x85\x3a\x8d\x5a\x95\x7a\x95\x7a\x9d\x9a\xa5\xb9\xa5\xba'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xfa\xb5\xf9\xb5\xfa\xad\xfa\xb5\xf9'\
-b'\xb5\xf9\xad\xfa\xb5\xf9\xb5\xfa\xad\xfa\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xda\xb5\xda\xb5\xf9'\
-b'\xb5\xda\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xfa'\
-b'\xa5\xba\xa5\x99\x9d\xba\xa5\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x95\x7a\x95\x79\x95\x9a\x9d\x7a\x95\x79'\
-b'\x95\x7a\x95\x79\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79'\
-b'\x95\x7a\x95\x7a\x8d\x7a\x8d\x7a\x95\x79\x95\x7a\x8d\x5a\x7d\x3a'\
-b'\x8d\x5a\x7d\x1a\x74\xfa\x85\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x85\x5a'\
-b'\x95\x7a\x8d\x7a\x85\x5a\x6c\xfa\x74\xfa\x7d\x3a\x75\x1a\x3c\x1a'\
-b'\x1b\x59\x23\x38\x23\x37\x33\x15\x42\xf4\x42\xf4\x3a\xf4\x33\x15'\
-b'\x42\xf4\x4a\xd3\x4a\xd2\x4a\xb1\x2b\x37\x0b\x9b\x0b\x9b\x0b\x9b'\
-b'\x1b\xdb\x1b\xfb\x23\xfb\x23\xfb\x23\xfb\x2c\x1b\x2b\xfa\x2c\x1b'\
-b'\x2c\x1b\x34\x3a\x3c\x3b\x3c\x3a\x3c\x5b\x44\x5b\x4c\x7a\x4c\x7a'\
-b'\x4c\x9b\x4c\x7a\x4c\x7b\x44\x5b\x44\x5a\x3c\x3b\x34\x3a\x34\x1b'\
-b'\x34\x3a\x34\x3b\x3c\x5b\x44\x5b\x34\x3b\x3c\x3b\x3c\x3a\x34\x3b'\
-b'\x34\x3b\x34\x3b\x34\x3a\x34\x3b\x34\x3b\x34\x3b\x3c\x5b\x3c\x3b'\
-b'\x3c\x5a\x3c\x3a\x44\x5b\x44\x7b\x44\x7a\x4c\x7b\x54\x9a\x5c\xbb'\
-b'\x5c\xba\x64\xda\x64\xfa\x74\xfb\x75\x1a\x7d\x3a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x64\xfa\x4c\x7a'\
-b'\x3c\x5b\x44\x5b\x4c\x7a\x64\xda\x75\x1a\x75\x1a\x7d\x1a\x7d\x1a'\
-b'\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x85\x3b\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x9a'\
-b'\x9d\x7a\x95\x9a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79\x95\x7a\x95\x7a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x59\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x64\xfa\x5c\xba\x5c\xbb\x64\xba\x6c\xfa'\
-b'\x7d\x1a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x85\x3a\x7d\x3a\x7d\x1a\x75\x1a\x6c\xfa'\
-b'\x6c\xfa\x6c\xfa\x64\xda\x5c\xdb\x5c\xba\x5c\xba\x54\xba\x54\x9b'\
-b'\x54\x9a\x54\x9b\x4c\x9b\x4c\x7a\x4c\x7a\x4c\x7b\x44\x5b\x44\x5a'\
-b'\x44\x5a\x4c\x7b\x54\xbb\x54\x9a\x5c\xba\x64\xda\x64\xda\x6c\xfb'\
-b'\x6c\xfa\x74\xfb\x75\x1a\x75\x1b\x74\xfa\x74\xfa\x6c\xfb\x75\x1a'\
-b'\x7d\x3a\x8d\x5a\x85\x5a\x85\x3a\x75\x1a\x6c\xfb\x6c\xfa\x64\xda'\
-b'\x64\xbb\x64\xba\x5c\xba\x5c\xdb\x64\xda\x6c\xda\x6c\xfa\x75\x1a'\
-b'\x7d\x1a\x85\x3a\x85\x5a\x8d\x7a\x95\x7a\x9d\x9a\x9d\x99\xa5\xba'\
-b'\xa5\xba\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xd9\xb5\xd9\xad\xda'\
-b'\xb5\xd9\xb5\xd9\xad\xd9\xb5\xd9\xb5\xf9\xb5\xd9\xad\xd9\xb5\xf9'\
-b'\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xfa'\
-b'\xa5\xba\xa5\xba\x9d\x9a\xa5\x99\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\x7a\x9d\x9a\x95\x9a\x95\x7a\x9d\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79\x8d\x7a\x8d\x7a\x95\x5a'\
-b'\x8d\x7a\x8d\x5a\x95\x79\x8d\x5a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a'\
-b'\x7d\x1a\x8d\x7a\x8d\x5a\x7d\x3a\x85\x3a\x8d\x5a\x8d\x79\x8d\x5a'\
-b'\x8d\x5a\x95\x9a\x95\x7a\x8d\x5a\x85\x3a\x7d\x1a\x75\x1a\x75\x1b'\
-b'\x3c\x3a\x13\x99\x1b\x79\x1b\x58\x2b\x37\x33\x15\x32\xf5\x33\x15'\
-b'\x3a\xf4\x4a\xd2\x4a\xd2\x4a\xb2\x2b\x57\x0b\x9b\x0b\x9b\x13\x9b'\
-b'\x13\xbb\x23\xfb\x23\xfb\x23\xfb\x2c\x1b\x34\x1a\x2c\x1b\x2c\x1b'\
-b'\x34\x3b\x34\x3b\x3c\x5a\x3c\x3b\x3c\x5a\x44\x7a\x4c\x7b\x4c\x9b'\
-b'\x4c\x7a\x4c\x9b\x4c\x7a\x44\x5b\x44\x5b\x3c\x5b\x34\x3b\x34\x1a'\
-b'\x34\x1a\x34\x3b\x44\x5b\x44\x7a\x34\x3b\x3c\x5b\x3c\x3a\x34\x3b'\
-b'\x34\x3b\x3c\x3a\x34\x3b\x34\x3a\x3c\x3b\x34\x3b\x3c\x3b\x3c\x5b'\
-b'\x3c\x3a\x44\x5b\x44\x5b\x44\x5a\x4c\x7a\x54\x9b\x54\xbb\x54\xba'\
-b'\x5c\xba\x64\xdb\x6c\xfa\x74\xfa\x7d\x1a\x7d\x3a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x6c\xfb\x54\x9a'\
-b'\x44\x5b\x3c\x3a\x4c\x5b\x5c\xba\x6c\xfa\x7d\x1b\x7d\x1a\x7d\x3a'\
-b'\x7d\x3b\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x3a\x85\x3a\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x79'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x59\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x79\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79'\
-b'\x95\x7a\x95\x9a\x95\x7a\x95\x79\x8d\x7a\x8d\x5a\x8d\x7a\x95\x7a'\
-b'\x95\x59\x8d\x5a\x8d\x7a\x8d\x59\x8d\x5a\x8d\x5a\x8d\x5a\x85\x59'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x3a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x75\x1a\x64\xdb\x5c\xba\x5c\xdb\x64\xda\x74\xfa'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x85\x5a\x85\x3a\x7d\x1a\x75\x1a\x74\xfa'\
-b'\x6c\xfb\x64\xda\x64\xda\x64\xda\x5c\xbb\x5c\xbb\x54\xbb\x54\x9a'\
-b'\x54\x9b\x54\x9a\x4c\x9b\x4c\x7a\x4c\x7b\x4c\x7b\x44\x7b\x44\x7a'\
-b'\x44\x5b\x4c\x7b\x54\xba\x54\x9b\x5c\xba\x64\xda\x6c\xfb\x6c\xfa'\
-b'\x6c\xfb\x74\xfa\x74\xfa\x75\x1a\x75\x1a\x6c\xfa\x75\x1a\x7d\x3a'\
-b'\x85\x3a\x8d\x5a\x85\x5a\x7d\x1a\x7d\x1a\x74\xfa\x6c\xda\x64\xda'\
-b'\x64\xda\x64\xda\x64\xda\x64\xda\x64\xda\x6c\xfa\x6c\xfa\x75\x1a'\
-b'\x7d\x1a\x85\x3a\x85\x5a\x8d\x5a\x95\x7a\x95\x9a\x9d\x99\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xad\xd9\xad\xda\xad\xda\xb5\xf9\xad\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xad\xfa\xb5\xf9\xb5\xda\xb5\xfa'\
-b'\xad\xf9\xb5\xd9\xb5\xf9\xb5\xda\xb5\xda\xb5\xf9\xb5\xd9\xb5\xda'\
-b'\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xd9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xbd\xfa\xbd\xf9'\
-b'\xa5\xba\xa5\xba\x9d\xba\xa5\xba\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\x7a\x95\x9a\x95\x79\x9d\x7a\x95\x9a\x95\x79\x95\x7a'\
-b'\x95\x79\x95\x7a\x95\x7a\x95\x59\x95\x5a\x8d\x7a\x8d\x5a\x95\x79'\
-b'\x95\x7a\x8d\x5a\x8d\x7a\x8d\x79\x8d\x5a\x8d\x7a\x8d\x5a\x95\x7a'\
-b'\x95\x9a\x7d\x3a\x8d\x7a\x95\x7a\x85\x3a\x85\x5a\x95\x5a\x8d\x5a'\
-b'\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x7d\x3a\x7d\x3a\x75\x1a'\
-b'\x64\xdb\x3c\x3b\x13\xba\x13\x7a\x13\x79\x1b\x58\x2b\x37\x33\x15'\
-b'\x42\xf4\x4a\xd2\x4a\xd1\x4a\xd2\x33\x57\x0b\x9b\x0b\x9b\x13\x9b'\
-b'\x1b\xdb\x23\xfb\x23\xfb\x2c\x1b\x34\x1b\x34\x3b\x34\x3b\x34\x3a'\
-b'\x34\x3b\x34\x3a\x34\x3a\x3c\x3b\x3c\x5b\x44\x5b\x44\x7a\x4c\x7b'\
-b'\x4c\x9a\x4c\x7b\x4c\x7b\x44\x7a\x44\x5b\x3c\x5a\x3c\x3b\x34\x3a'\
-b'\x34\x3b\x34\x1b\x3c\x5a\x44\x5a\x34\x3b\x3c\x5a\x3c\x5b\x3c\x3b'\
-b'\x34\x3b\x3c\x3a\x3c\x5b\x3c\x3a\x3c\x3a\x3c\x5b\x3c\x5a\x3c\x5b'\
-b'\x44\x5a\x44\x5b\x4c\x7b\x4c\x7b\x4c\x9b\x54\x9a\x54\x9a\x5c\xbb'\
-b'\x5c\xda\x64\xda\x6c\xfa\x74\xfa\x75\x1b\x7d\x3a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x74\xfa\x54\xba'\
-b'\x44\x7a\x44\x5b\x44\x7b\x54\xba\x64\xfa\x7d\x1a\x7d\x3a\x7d\x1a'\
-b'\x7d\x1a\x7d\x1a\x7d\x3b\x7d\x3a\x85\x1a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a'\
-b'\x95\x7a\x95\x7a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x9a\x95\x79\x95\x9a\x9d\x7a\x95\x9a\x9d\x7a'\
-b'\x95\x7a\x95\x79\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x8d\x7a'\
-b'\x95\x7a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x7d\x3a\x74\xfa\x64\xda\x5c\xda\x64\xda\x6c\xfb\x7d\x3a'\
-b'\x85\x3a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x59\x8d\x7a\x8d\x7a\x8d\x5a\x85\x5a\x7d\x1a\x75\x1a\x6d\x1a'\
-b'\x6c\xfb\x6c\xfa\x64\xda\x64\xdb\x5c\xba\x5c\xba\x5c\xba\x54\x9a'\
-b'\x54\x9b\x54\xbb\x54\x9a\x4c\x7a\x4c\x7b\x4c\x7a\x44\x5a\x44\x5b'\
-b'\x44\x7a\x4c\x9a\x54\xba\x54\x9b\x5c\xda\x64\xda\x64\xfa\x6c\xfa'\
-b'\x6c\xfa\x74\xfb\x6c\xfa\x74\xfa\x6c\xfa\x74\xfa\x7d\x1a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x7d\x1a\x75\x1b\x6c\xfa\x6c\xfb'\
-b'\x64\xda\x64\xdb\x64\xda\x64\xda\x6c\xdb\x6c\xfb\x74\xfa\x75\x1a'\
-b'\x7d\x3a\x85\x3a\x85\x5a\x8d\x5a\x95\x7a\x95\x7a\x9d\x9a\xa5\x9a'\
-b'\xa5\xba\xa5\xb9\xad\xda\xad\xda\xad\xda\xb5\xd9\xad\xda\xb5\xd9'\
-b'\xb5\xd9\xad\xd9\xb5\xf9\xb5\xd9\xb5\xd9\xad\xf9\xb5\xda\xb5\xd9'\
-b'\xb5\xfa\xad\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\x9d\x99\x85\x59\x85\x5a'\
-b'\xa5\xba\xa5\xba\xa5\x99\x9d\x9a\xa5\x99\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x95\x7a\x95\x99\x95\x7a\x9d\x9a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x8d\x5a\x95\x7a\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x7a'\
-b'\x8d\x7a\x95\x7a\x95\x7a\x9d\x9a\x95\x9a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x99\x95\x9a\x95\x7a\x8d\x7a\x8d\x7a\x8d\x5a\x75\x1a'\
-b'\x5c\xba\x54\xba\x3c\x3b\x1b\xdb\x13\x9b\x13\x9a\x1b\x79\x2b\x37'\
-b'\x3a\xf4\x4a\xd2\x4a\xb1\x4a\xd2\x2b\x57\x13\xbb\x0b\xbb\x13\xbb'\
-b'\x1b\xbb\x23\xfb\x23\xfb\x2c\x1b\x2c\x1b\x34\x3a\x34\x3b\x34\x3b'\
-b'\x34\x1b\x34\x3a\x34\x3b\x3c\x3b\x3c\x5b\x44\x5a\x44\x5b\x44\x7a'\
-b'\x4c\x7b\x4c\x7a\x4c\x7b\x44\x7a\x44\x5b\x44\x5b\x3c\x5a\x34\x3b'\
-b'\x34\x3b\x34\x3a\x3c\x5b\x44\x5b\x34\x3b\x3c\x3b\x3c\x3a\x3c\x5b'\
-b'\x3c\x3b\x3c\x5b\x3c\x5a\x3c\x3b\x3c\x5b\x3c\x3a\x44\x5b\x3c\x5b'\
-b'\x44\x5a\x44\x5b\x4c\x7a\x4c\x7a\x4c\x7b\x54\x9a\x54\x9b\x5c\xba'\
-b'\x5c\xbb\x64\xdb\x6c\xda\x6c\xfa\x7d\x1a\x7d\x3a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x7d\x3a\x75\x1a\x5c\xbb'\
-b'\x44\x7b\x3c\x3a\x44\x5b\x4c\x7a\x64\xda\x75\x1a\x7d\x1a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x8d\x59\x8d\x7a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x95\x79'\
-b'\x95\x79\x9d\x7a\x95\x7a\x9d\x7a\x95\x79\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x8d\x59\x95\x7a\x8d\x59'\
-b'\x95\x5a\x8d\x59\x95\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x59\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x7d\x3a\x6c\xfa\x5c\xba\x5c\xbb\x64\xba\x6c\xfa\x7d\x3a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x8d\x7a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x75\x1a\x75\x1a\x74\xfa'\
-b'\x6c\xfa\x64\xda\x64\xda\x64\xda\x64\xba\x5c\xdb\x5c\xbb\x54\xba'\
-b'\x54\x9a\x54\x9a\x4c\x9b\x4c\x9a\x4c\x9b\x44\x7a\x44\x5b\x44\x5b'\
-b'\x4c\x7b\x4c\x7a\x5c\xba\x5c\xbb\x64\xda\x64\xda\x6c\xda\x6c\xfb'\
-b'\x6c\xfa\x6c\xfa\x74\xfa\x6c\xfb\x75\x1a\x75\x1a\x7d\x3b\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x7d\x3a\x7d\x3a\x75\x1a\x74\xfa\x6c\xfa'\
-b'\x6c\xfa\x6c\xdb\x6c\xda\x6c\xfa\x6c\xfa\x74\xfa\x75\x1a\x75\x1a'\
-b'\x7d\x3a\x85\x3a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x9d\x99\x9d\x9a'\
-b'\xa5\xb9\xa5\xba\xa5\xda\xad\xd9\xad\xda\xad\xfa\xb5\xf9\xb5\xd9'\
-b'\xad\xfa\xb5\xfa\xb5\xda\xad\xfa\xb5\xfa\xb5\xd9\xb5\xf9\xad\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xda\xad\xda\xb5\xf9\xb5\xda\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xda\xb5\xf9\x95\x7a\x6c\xd9\x6c\xf9'\
-b'\xa5\xda\xa5\xba\xa5\xba\x9d\x9a\x9d\xba\x9d\x99\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x7a\x95\x9a\x95\x79\x9d\x9a\x95\x79\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x59\x8d\x7a\x8d\x5a\x8d\x59\x8d\x5a'\
-b'\x8d\x59\x8d\x5a\x8d\x5a\x8d\x59\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x79\x9d\x9a\x8d\x7a\x75\x19'\
-b'\x7d\x1a\x95\x7a\x95\x7a\x95\x5a\x8d\x5a\x95\x7a\x8d\x5a\x7d\x3a'\
-b'\x5c\xda\x5c\xba\x54\x9a\x44\x5b\x34\x3b\x34\x1b\x2b\xfa\x23\xba'\
-b'\x3b\x15\x4a\xd2\x52\xd2\x4a\xd2\x2b\x57\x13\xbb\x0b\x9b\x13\xbb'\
-b'\x1b\xdb\x23\xfb\x24\x1b\x2c\x1b\x2c\x1a\x34\x1b\x34\x3b\x34\x3b'\
-b'\x34\x3a\x34\x3b\x34\x3b\x3c\x3b\x3c\x5a\x3c\x5b\x44\x5b\x44\x5a'\
-b'\x44\x7a\x4c\x7b\x4c\x7a\x4c\x7b\x4c\x7b\x44\x5a\x3c\x5b\x3c\x3b'\
-b'\x34\x3a\x34\x1b\x3c\x3a\x44\x5a\x34\x3a\x34\x3b\x3c\x5b\x3c\x3b'\
-b'\x3c\x5b\x3c\x5a\x44\x5b\x44\x5b\x3c\x5a\x44\x5b\x44\x5b\x44\x5a'\
-b'\x44\x5b\x44\x7b\x4c\x7a\x4c\x7b\x4c\x9a\x54\x9b\x54\xba\x54\xba'\
-b'\x64\xdb\x64\xda\x64\xda\x6c\xfb\x75\x1a\x7d\x1a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x7d\x3a\x75\x1a\x64\xba'\
-b'\x4c\x7a\x34\x3a\x3c\x3b\x44\x7b\x5c\xba\x75\x1b\x7d\x3a\x85\x3b'\
-b'\x7d\x3a\x7d\x1a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x8d\x59\x8d\x7a'\
-b'\x95\x7a\x8d\x5a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x8d\x5a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79'\
-b'\x95\x79\x95\x7a\x8d\x7a\x8d\x5a\x95\x7a\x8d\x7a\x8d\x59\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x3a\x7d\x1a\x64\xda\x5c\xba\x5c\xba\x5c\xdb\x6c\xfa\x85\x3a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x59\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x7d\x3a\x7d\x1a\x75\x1a\x6c\xfa'\
-b'\x6c\xfb\x6c\xda\x64\xda\x64\xda\x64\xba\x64\xdb\x5c\xba\x5c\xbb'\
-b'\x54\xba\x54\x9b\x54\x9a\x4c\x7b\x4c\x7a\x4c\x7b\x44\x5a\x44\x7a'\
-b'\x4c\x7b\x54\x9a\x5c\xbb\x5c\xba\x64\xda\x6c\xdb\x6c\xfa\x6c\xfa'\
-b'\x6c\xfb\x6c\xfa\x6c\xfa\x6c\xfa\x75\x1a\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1b\x74\xfa\x6c\xfa'\
-b'\x6c\xfa\x6c\xfb\x6c\xfa\x6c\xfb\x6c\xfa\x74\xfa\x75\x1a\x7d\x1a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x8d\x5a\x95\x7a\x95\x7a\x9d\x7a\x9d\x99'\
-b'\xa5\xba\xa5\xba\xa5\xd9\xad\xda\xad\xda\xad\xf9\xad\xda\xb5\xd9'\
-b'\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xd9\xad\xda\xb5\xf9\xb5\xd9\xb5\xd9'\
-b'\xad\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xd9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xda\xb5\xda'\
-b'\xad\xba\xa5\xda\xa5\xba\xa5\xb9\x9d\x9a\x9d\x9a\xa5\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x99\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x8d\x7a\x8d\x7a\x95\x5a\x95\x7a\x8d\x5a\x95\x7a'\
-b'\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x9d\xba\x7d\x1a'\
-b'\x6c\xda\x85\x3a\x8d\x5a\x8d\x5a\x7d\x3a\x8d\x5a\x8d\x7a\x7d\x1a'\
-b'\x64\xda\x5c\xba\x54\xbb\x4c\x9a\x4c\x7a\x44\x7b\x3c\x5b\x2b\xfa'\
-b'\x3b\x14\x4a\xd2\x4a\xd2\x4a\xd3\x2b\x78\x13\xbb\x13\xbb\x13\xbb'\
-b'\x1b\xdb\x23\xfb\x23\xfb\x2b\xfb\x2c\x1b\x2c\x3b\x34\x1a\x34\x3b'\
-b'\x3c\x5b\x3c\x3a\x3c\x5b\x3c\x3a\x3c\x5b\x44\x5a\x44\x5a\x44\x5b'\
-b'\x44\x7b\x4c\x7b\x4c\x9a\x4c\x9a\x4c\x7b\x44\x7b\x44\x5a\x3c\x3b'\
-b'\x34\x3a\x34\x3b\x34\x5b\x44\x5b\x34\x3b\x3c\x3a\x3c\x3b\x3c\x5a'\
-b'\x3c\x5b\x44\x5a\x44\x5b\x44\x5b\x44\x5a\x44\x5b\x44\x5a\x44\x7b'\
-b'\x4c\x7a\x4c\x7b\x4c\x7a\x4c\x9a\x4c\x9b\x54\x9a\x54\xbb\x5c\xbb'\
-b'\x5c\xda\x64\xba\x6c\xda\x6c\xfa\x74\xfa\x75\x1a\x7d\x3a\x85\x5b'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x59\x7d\x3a\x85\x3a\x7d\x3a\x64\xda'\
-b'\x4c\x7b\x3c\x3b\x34\x3b\x44\x5a\x54\x9b\x6c\xfa\x7d\x3a\x85\x3a'\
-b'\x7d\x3a\x85\x1a\x7d\x1a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x7d\x3a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x39\x85\x5a\x85\x3a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x59\x95\x5a\x95\x7a\x8d\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x79\x95\x7a\x95\x7a\x95\x79\x95\x7a\x95\x7a'\
-b'\x8d\x7a\x95\x5a\x95\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x95\x5a\x8d\x59\x8d\x5a\x8d\x59\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x74\xfa\x5c\xbb\x54\xbb\x5c\xba\x64\xda\x6c\xfa\x7d\x3a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x59\x8d\x5a\x8d\x7a\x85\x5a'\
-b'\x8d\x7a\x8d\x59\x8d\x7a\x85\x5a\x7d\x3a\x7d\x1a\x75\x1a\x6c\xfa'\
-b'\x6c\xfb\x6c\xfa\x64\xda\x64\xda\x64\xda\x64\xda\x5c\xbb\x5c\xba'\
-b'\x5c\xba\x54\x9b\x4c\x9b\x4c\x7a\x4c\x7b\x4c\x7a\x44\x5b\x4c\x7b'\
-b'\x4c\x7a\x54\x9b\x5c\xda\x64\xbb\x64\xda\x6c\xfa\x6c\xfb\x6c\xfa'\
-b'\x6c\xda\x6c\xda\x6c\xfa\x74\xfa\x75\x1a\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x3a\x75\x1a\x7d\x1a\x75\x1a\x74\xfa'\
-b'\x75\x1a\x6c\xfa\x6c\xfb\x74\xfa\x75\x1a\x74\xfa\x75\x1a\x7d\x1a'\
-b'\x7d\x3a\x85\x3b\x85\x5a\x8d\x5a\x95\x7a\x95\x79\x95\x9a\x9d\x9a'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xad\xda\xad\xd9\xad\xda\xb5\xfa\xb5\xd9'\
-b'\xad\xfa\xb5\xda\xb5\xf9\xad\xf9\xb5\xd9\xb5\xf9\xad\xfa\xb5\xda'\
-b'\xb5\xf9\xb5\xd9\xad\xd9\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xd9\xad\xfa'\
-b'\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xda\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xa5\xba\xa5\xba\xa5\xba\xa5\xba\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x95\x7a\x95\x79\x9d\x7a\x95\x9a\x95\x7a'\
-b'\x95\x7a\x95\x79\x95\x7a\x8d\x7a\x95\x7a\x8d\x5a\x8d\x59\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x59\x8d\x7a\x8d\x7a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x95\x7a\x95\x7a\x8d\x5a\x95\x7a'\
-b'\x8d\x5a\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x3a\x85\x5a\x7d\x3a'\
-b'\x64\xda\x64\xbb\x5c\xba\x54\xba\x54\x9b\x4c\x5a\x34\x3b\x23\x78'\
-b'\x3a\xf4\x4a\xd3\x4a\xd2\x42\xd2\x2b\x78\x13\xbb\x13\xbb\x1b\xdb'\
-b'\x23\xfc\x23\xfb\x23\xfb\x2c\x1b\x2c\x1b\x2c\x1b\x34\x3b\x3c\x3a'\
-b'\x3c\x5b\x3c\x5b\x3c\x5b\x3c\x3b\x3c\x3a\x3c\x5b\x44\x5b\x44\x5a'\
-b'\x44\x5a\x4c\x7a\x4c\x9b\x4c\x7b\x4c\x7a\x44\x7b\x44\x5a\x3c\x5b'\
-b'\x3c\x3b\x34\x3b\x3c\x5a\x3c\x5a\x2c\x1b\x34\x3a\x3c\x3b\x3c\x3b'\
-b'\x3c\x5b\x44\x5b\x44\x7b\x44\x5a\x44\x7b\x44\x5b\x44\x7b\x4c\x7a'\
-b'\x4c\x7b\x4c\x7a\x4c\x9b\x54\x7b\x54\x9a\x54\xbb\x54\xba\x5c\xba'\
-b'\x5c\xba\x64\xda\x64\xdb\x6c\xfb\x6c\xfa\x75\x1a\x7d\x3a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x1a\x74\xfa'\
-b'\x54\xba\x3c\x5b\x3c\x3b\x44\x5a\x4c\x9b\x6c\xda\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x39'\
-b'\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a\x95\x7a\x8d\x7a\x95\x79'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x8d\x79\x95\x7a\x95\x7a\x8d\x7a\x95\x7a\x8d\x5a'\
-b'\x8d\x59\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x3a\x85\x5a\x85\x5a'\
-b'\x7d\x3a\x6c\xfb\x5c\xba\x54\xba\x5c\xbb\x5c\xbb\x6c\xfa\x7d\x3a'\
-b'\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x85\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x74\xfa'\
-b'\x6c\xfb\x6c\xfa\x6c\xdb\x64\xda\x64\xda\x64\xdb\x5c\xda\x5c\xba'\
-b'\x5c\xbb\x54\xba\x4c\x9b\x4c\x7a\x4c\x7b\x4c\x7a\x44\x7a\x4c\x7b'\
-b'\x4c\x9a\x54\xba\x64\xdb\x64\xda\x6c\xda\x6c\xfa\x6c\xfa\x6c\xfb'\
-b'\x6c\xfb\x6c\xfa\x6c\xfa\x75\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x7d\x1b\x75\x1a\x74\xfa\x6c\xfa\x75\x1a\x75\x1a\x75\x1a\x75\x1a'\
-b'\x74\xfa\x74\xfa\x74\xfa\x75\x1a\x75\x1a\x7d\x1a\x7d\x1a\x7d\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x9d\x99'\
-b'\x9d\x9a\xa5\xba\xa5\xb9\xa5\xba\xad\xda\xad\xda\xad\xd9\xb5\xda'\
-b'\xb5\xd9\xad\xf9\xb5\xda\xb5\xda\xb5\xf9\xb5\xd9\xb5\xda\xad\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xfa\xb5\xf9'\
-b'\xa5\xba\xa5\x9a\x9d\x99\x9d\x9a\xa5\xba\xa5\xb9\x9d\x99\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79\x95\x7a'\
-b'\x95\x7a\x95\x7a\x8d\x7a\x95\x5a\x95\x7a\x8d\x7a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x8d\x7a\x85\x59\x74\xfa'\
-b'\x8d\x7a\x8d\x7a\x75\x1a\x7d\x1a\x7d\x3a\x85\x3a\x74\xfa\x75\x1a'\
-b'\x6c\xda\x64\xdb\x5c\xda\x54\xba\x4c\x9a\x44\x5b\x2c\x1a\x2b\x37'\
-b'\x42\xf4\x42\xd2\x4a\xd2\x4a\xd3\x2b\x99\x1b\xdb\x1b\xdb\x1b\xdb'\
-b'\x23\xfb\x23\xfb\x2b\xfb\x2c\x1b\x2c\x1a\x2c\x1b\x34\x3b\x3c\x3b'\
-b'\x3c\x5a\x3c\x3b\x44\x5a\x44\x5b\x44\x5b\x44\x5a\x44\x5b\x44\x5b'\
-b'\x44\x7b\x4c\x7b\x4c\x7a\x4c\x9a\x4c\x7b\x4c\x7b\x44\x7a\x44\x5a'\
-b'\x3c\x5b\x34\x3b\x3c\x5a\x3c\x3b\x2c\x1b\x34\x1b\x34\x3b\x3c\x3b'\
-b'\x3c\x5a\x44\x5a\x44\x5a\x44\x7b\x4c\x7a\x4c\x7b\x4c\x7a\x4c\x7a'\
-b'\x4c\x9b\x4c\x9a\x54\x9b\x4c\x9a\x54\x9b\x54\x9a\x54\x9b\x5c\xba'\
-b'\x5c\xdb\x64\xda\x64\xda\x6c\xfa\x74\xfa\x75\x1a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x75\x1a'\
-b'\x5c\xbb\x44\x5a\x3c\x3a\x3c\x5a\x4c\x7b\x64\xda\x7d\x3a\x85\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x95\x7a\x8d\x59\x8d\x7a'\
-b'\x95\x7a\x95\x5a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x59\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x8d\x39\x85\x5a\x85\x5a\x85\x3a\x8d\x3a\x85\x3a'\
-b'\x7d\x1a\x64\xda\x5c\xbb\x54\xba\x5c\xbb\x64\xda\x74\xfa\x85\x3a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x59\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x8d\x79\x8d\x5a\x85\x5a\x7d\x3a\x7d\x1a\x75\x1b\x75\x1a'\
-b'\x74\xfa\x6c\xfa\x6c\xfa\x64\xdb\x64\xda\x64\xda\x64\xdb\x5c\xba'\
-b'\x5c\xba\x54\x9b\x4c\x7a\x44\x7b\x4c\x7b\x4c\x7a\x4c\x7b\x4c\x7b'\
-b'\x54\x9a\x5c\xbb\x64\xda\x64\xda\x64\xfb\x6c\xfa\x6c\xfa\x6c\xfa'\
-b'\x6c\xfa\x6c\xfa\x74\xfa\x75\x1b\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x75\x1a\x74\xfa\x74\xfa\x6c\xfb\x74\xfa\x75\x1a\x7d\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x75\x1a\x75\x1a\x75\x1a\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x85\x5a\x85\x5a\x8d\x5a\x95\x7a\x95\x79\x9d\x9a\x9d\x7a'\
-b'\x9d\x9a\xa5\xba\xa5\xba\xad\xb9\xad\xd9\xad\xda\xad\xda\xad\xd9'\
-b'\xb5\xda\xad\xd9\xb5\xd9\xb5\xf9\xad\xda\xb5\xf9\xb5\xf9\xb5\xd9'\
-b'\xad\xf9\xb5\xda\x95\x79\x85\x39\x85\x59\x85\x59\x85\x39\x85\x59'\
-b'\x85\x5a\x85\x59\x8d\x5a\x85\x59\x8d\x59\x85\x59\x8d\x5a\x8d\x39'\
-b'\x85\x59\x85\x5a\x8d\x59\x85\x59\x85\x59\x85\x59\x8d\x59\x8d\x5a'\
-b'\xa5\xba\xa5\xba\xa5\x9a\x9d\x9a\x9d\x9a\xa5\xba\x9d\xba\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\x9d\x7a\x95\x99\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a'\
-b'\x8d\x59\x8d\x5a\x85\x5a\x8d\x7a\x8d\x5a\x85\x59\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x8d\x5a\x85\x5a'\
-b'\x74\xfa\x8d\x5a\x8d\x7a\x74\xfa\x7d\x1a\x85\x5a\x85\x3a\x75\x1a'\
-b'\x6c\xfa\x64\xda\x64\xba\x5c\xbb\x4c\x9a\x3c\x3b\x23\xba\x2b\x16'\
-b'\x3a\xf4\x4a\xd3\x4a\xd2\x42\xd3\x2b\x99\x1b\xdb\x1b\xfb\x23\xfb'\
-b'\x2c\x1b\x2c\x1b\x2c\x1b\x2c\x1b\x24\x1b\x2c\x1b\x34\x3a\x34\x3b'\
-b'\x3c\x3a\x3c\x5b\x44\x5b\x44\x5b\x44\x5b\x44\x5a\x44\x5b\x44\x5a'\
-b'\x4c\x5a\x44\x7b\x4c\x7a\x4c\x7b\x4c\x9b\x4c\x9a\x4c\x7b\x44\x5b'\
-b'\x3c\x3b\x3c\x3a\x3c\x3a\x3c\x3b\x2c\x1b\x2c\x1a\x2c\x1b\x34\x1b'\
-b'\x34\x3b\x3c\x3b\x3c\x3b\x44\x5a\x4c\x7b\x4c\x7a\x4c\x7b\x4c\x7a'\
-b'\x4c\x7b\x54\x9b\x4c\x9a\x54\x9b\x54\x9a\x54\xba\x5c\xbb\x5c\xba'\
-b'\x5c\xdb\x64\xda\x6c\xda\x6c\xfa\x6d\x1b\x7d\x1a\x7d\x3a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x75\x1a'\
-b'\x5c\xba\x44\x5b\x34\x3b\x34\x3a\x44\x7a\x64\xda\x7d\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x3a\x85\x39\x85\x5a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x8d\x5a\x85\x3a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x59\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x7a'\
-b'\x8d\x5a\x8d\x7a\x95\x79\x8d\x5a\x8d\x79\x8d\x5a\x8d\x5a\x95\x7a'\
-b'\x95\x7a\x8d\x5a\x8d\x59\x8d\x7a\x8d\x7a\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x3a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x3a\x8d\x5a\x85\x5a\x8d\x5a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x6c\xfa\x5c\xda\x5c\xbb\x54\xba\x5c\xbb\x64\xda\x75\x1a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x85\x5a\x7d\x3a\x7d\x1a\x75\x1a\x74\xfa'\
-b'\x75\x1a\x6c\xfb\x6c\xfa\x6c\xda\x64\xfa\x64\xda\x64\xda\x5c\xdb'\
-b'\x54\xba\x54\x9b\x44\x7b\x44\x5a\x4c\x7b\x4c\x7a\x4c\x7a\x54\x9b'\
-b'\x54\xba\x64\xda\x64\xdb\x64\xda\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xda'\
-b'\x6c\xfa\x6c\xfb\x75\x1a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x1a'\
-b'\x74\xfb\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfa\x75\x1a\x7d\x3b\x75\x1a'\
-b'\x75\x1a\x75\x1b\x75\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x85\x5a\x8d\x3a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x9d\x99'\
-b'\x9d\x99\xa5\xba\xa5\xb9\xa5\xba\xad\xda\xad\xda\xad\xda\xb5\xf9'\
-b'\xad\xd9\xb5\xfa\xad\xd9\xb5\xfa\xb5\xd9\xad\xd9\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xb5\xf9\x95\x7a\x85\x59\x8d\x5a\x8d\x59\x8d\x59\x8d\x5a'\
-b'\x8d\x59\x8d\x59\x8d\x59\x8d\x5a\x8d\x59\x8d\x59\x8d\x5a\x8d\x59'\
-b'\x8d\x5a\x8d\x59\x8d\x79\x8d\x59\x8d\x5a\x8d\x59\x8d\x7a\x8d\x59'\
-b'\xa5\xba\xa5\xba\xa5\xba\xa5\xba\x9d\x99\x9d\xba\xa5\x9a\x9d\xba'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x95\x7a\x95\x7a\x9d\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x8d\x5a\x95\x7a\x95\x5a\x8d\x79\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x3a\x8d\x5a\x85\x5a'\
-b'\x85\x3a\x8d\x5a\x85\x5a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x5a'\
-b'\x85\x5a\x74\xfa\x85\x5a\x95\x7a\x95\x7a\xa5\xba\x9d\x9a\x85\x3a'\
-b'\x6c\xfa\x64\xda\x64\xdb\x5c\xba\x4c\x7b\x34\x1b\x1b\x78\x33\x16'\
-b'\x3a\xf4\x42\xf3\x4a\xd2\x42\xf3\x2b\xb9\x24\x1b\x23\xfb\x2b\xfb'\
-b'\x2c\x1b\x2c\x1b\x2c\x1b\x2c\x1b\x2c\x1a\x2c\x1a\x34\x1b\x34\x3b'\
-b'\x3c\x3a\x44\x5b\x44\x5b\x44\x7a\x44\x7b\x44\x7b\x44\x7a\x4c\x7b'\
-b'\x44\x7b\x44\x7a\x4c\x7b\x4c\x7b\x4c\x7a\x4c\x9a\x4c\x7b\x44\x5a'\
-b'\x44\x5b\x3c\x3b\x34\x5a\x3c\x5b\x2b\xfb\x24\x1b\x2c\x1b\x34\x1a'\
-b'\x34\x3b\x3c\x3b\x3c\x5a\x44\x5b\x44\x7a\x4c\x7b\x4c\x9a\x4c\x7a'\
-b'\x4c\x9b\x54\x9a\x54\x9b\x54\x9a\x54\x9b\x54\xba\x5c\xba\x5c\xbb'\
-b'\x64\xdb\x64\xda\x6c\xda\x6c\xfa\x74\xfa\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x64\xfa\x4c\x9a\x3c\x3a\x3c\x3b\x44\x5b\x64\xdb\x75\x1a\x7d\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x7d\x5a'\
-b'\x85\x59\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a'\
-b'\x8d\x59\x8d\x5a\x8d\x7a\x8d\x5a\x85\x5a\x85\x5a\x7c\xd9\x74\xb8'\
-b'\x7c\xd9\x85\x3a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x95\x79'\
-b'\x8d\x7a\x8d\x5a\x95\x7a\x95\x7a\x8d\x5a\x8d\x5a\x8d\x59\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x59\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x3a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x6c\xfa\x5c\xba\x54\x9b\x5c\x9a\x64\xda\x6c\xfb\x7d\x1a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x7a\x8d\x59\x8d\x5a'\
-b'\x8d\x7a\x8d\x7a\x8d\x5a\x85\x3a\x7d\x1a\x7d\x1a\x75\x1b\x75\x1a'\
-b'\x74\xfa\x75\x1a\x6c\xfa\x6c\xfb\x6c\xfb\x6c\xda\x64\xdb\x5c\xba'\
-b'\x54\xba\x4c\x9b\x44\x5a\x44\x5b\x4c\x7b\x4c\x9a\x4c\x9a\x54\x9b'\
-b'\x5c\xbb\x64\xda\x64\xda\x64\xda\x6c\xfa\x6c\xfb\x6c\xfa\x6c\xfa'\
-b'\x74\xfa\x74\xfa\x75\x1b\x7d\x3a\x7d\x1a\x75\x1a\x75\x1b\x75\x1a'\
-b'\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfa\x74\xfa\x7d\x1a\x7d\x1a\x7d\x1a'\
-b'\x7d\x1a\x75\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x3a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x8d\x59\x95\x7a\x95\x7a\x95\x9a\x9d\x7a'\
-b'\x9d\x9a\xa5\xba\xa5\xb9\xa5\xba\xad\xd9\xad\xd9\xad\xda\xad\xda'\
-b'\xb5\xda\xad\xd9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9'\
-b'\xb5\xd9\xad\xfa\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9'\
-b'\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xa5\xda\xa5\xda\xa5\xb9\xa5\xba\xa5\xba\x9d\x99\x9d\x9a\x9d\x99'\
-b'\x9d\xba\x9d\x9a\x9d\x9a\x9d\x9a\x95\x79\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x8d\x7a\x8d\x7a\x8d\x59\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x74\xfa\x7d\x3a\x9d\xba\xa5\xb9\xa5\xba\x85\x5a'\
-b'\x6c\xfa\x64\xda\x64\xdb\x54\xba\x44\x7b\x23\xda\x23\x58\x33\x15'\
-b'\x3a\xf4\x42\xd3\x42\xd3\x3a\xf4\x2b\xb9\x2c\x1b\x2c\x1b\x2c\x1a'\
-b'\x34\x3b\x34\x3b\x34\x3b\x34\x3a\x2c\x1b\x2c\x1b\x2c\x1b\x34\x3b'\
-b'\x3c\x3a\x44\x5b\x44\x5b\x44\x5a\x4c\x7a\x4c\x7b\x4c\x7b\x44\x7a'\
-b'\x4c\x7a\x4c\x7a\x4c\x7b\x4c\x9a\x4c\x9b\x4c\x9b\x4c\x7a\x4c\x7b'\
-b'\x44\x5b\x3c\x5b\x3c\x5a\x44\x5a\x2c\x1b\x23\xfb\x2c\x1a\x2c\x1b'\
-b'\x34\x3b\x3c\x3a\x3c\x3b\x3c\x5b\x44\x5b\x4c\x7a\x4c\x9b\x4c\x9b'\
-b'\x54\x9a\x54\x9b\x54\xbb\x54\x9a\x54\xba\x5c\xbb\x5c\xba\x5c\xba'\
-b'\x5c\xbb\x64\xda\x64\xda\x6c\xfb\x75\x1a\x7d\x1a\x7d\x3a\x85\x5b'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x7d\x3a'\
-b'\x6c\xfb\x54\x9b\x3c\x5a\x3c\x3b\x44\x5a\x54\x9a\x75\x1a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x7c\xf9\x74\x57\x6b\x94\x63\x53\x63\xd6'\
-b'\x63\x73\x63\x73\x74\x16\x7c\xd8\x85\x3a\x85\x5a\x8d\x7a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x8d\x59\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x85\x59\x85\x5a\x8d\x5a\x85\x5a\x7d\x3a'\
-b'\x64\xda\x54\xbb\x5c\xba\x5c\xba\x64\xda\x6c\xfb\x7d\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x8d\x59\x8d\x5a\x85\x5a\x7d\x3a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x75\x1a\x6c\xfa\x6c\xfa\x64\xda\x64\xda\x5c\xbb'\
-b'\x54\xba\x4c\x9b\x44\x5b\x44\x5b\x4c\x7b\x4c\x9a\x54\x9a\x54\xba'\
-b'\x5c\xba\x64\xdb\x64\xda\x64\xda\x6c\xfb\x6c\xfa\x6c\xfb\x6c\xfa'\
-b'\x74\xfa\x75\x1a\x75\x1a\x7d\x1a\x75\x1a\x75\x1a\x75\x1a\x6c\xfb'\
-b'\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfb\x75\x1a\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x7d\x1b\x75\x1a\x7d\x3a\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x99\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\xa5\xba\xa5\xba\xa5\xba\xad\xda\xad\xda\xad\xd9'\
-b'\xad\xf9\xad\xda\xb5\xd9\xad\xda\xad\xf9\xb5\xd9\xb5\xfa\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xda\xb5\xd9'\
-b'\xb5\xfa\xb5\xd9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xad\xba\xa5\xba\xa5\xda\xa5\xba\xa5\xba\xa5\xba\xa5\x9a\xa5\xba'\
-b'\xa5\x99\x9d\xba\x9d\x9a\x9d\x9a\x9d\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x79\x95\x7a\x8d\x5a\x8d\x5a\x95\x7a\x8d\x5a\x8d\x5a\x85\x59'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x7d\x1a\x7d\x1a\x7d\x1a'\
-b'\x7d\x1a\x75\x1a\x85\x3a\x74\xfa\x8d\x7a\x9d\x99\x9d\x9a\x7d\x3a'\
-b'\x74\xfa\x64\xda\x5c\xba\x54\xbb\x3c\x5b\x1b\xba\x23\x37\x33\x16'\
-b'\x3a\xf4\x42\xf3\x42\xf3\x3a\xf4\x2b\xb9\x2c\x1b\x34\x1a\x34\x1b'\
-b'\x34\x3b\x3c\x3a\x3c\x5b\x34\x3b\x34\x1b\x2c\x1a\x2c\x1b\x34\x3b'\
-b'\x3c\x3b\x3c\x5a\x44\x5b\x44\x5b\x4c\x7b\x4c\x9a\x4c\x7b\x54\x9a'\
-b'\x54\x9b\x54\x9b\x4c\x9b\x4c\x9a\x4c\x7b\x4c\x7b\x4c\x9b\x4c\x7a'\
-b'\x44\x7b\x44\x5a\x44\x5b\x44\x7b\x2c\x1a\x23\xfb\x2b\xfb\x2c\x1b'\
-b'\x34\x3b\x34\x3b\x3c\x5a\x44\x5a\x4c\x7b\x4c\x7a\x4c\x9a\x54\x9a'\
-b'\x54\x9a\x54\x9a\x54\x9a\x54\x9a\x54\xbb\x5c\xba\x5c\xbb\x5c\xba'\
-b'\x5c\xda\x64\xdb\x6c\xda\x6c\xfa\x74\xfa\x75\x1a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a'\
-b'\x6d\x1a\x54\xba\x3c\x5b\x34\x3a\x3c\x3b\x4c\x9a\x6c\xfa\x7d\x1a'\
-b'\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x39'\
-b'\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x8d\x3a\x85\x3a\x7d\x3a'\
-b'\x7c\xf9\x6c\x77\x63\xb5\x63\x53\x63\x94\x74\x56\x7c\xf9\x85\x5a'\
-b'\x85\x1a\x74\x98\x63\xd4\x63\x53\x63\x94\x6c\x36\x7c\xf9\x85\x5a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x3a\x7d\x1a'\
-b'\x5c\xba\x54\x9a\x54\x9b\x5c\xbb\x64\xdb\x75\x1a\x85\x3a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x59\x85\x5a\x8d\x7a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x85\x5a\x85\x3a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1a\x74\xfa\x6c\xfb\x6c\xda\x64\xdb\x5c\xbb\x54\x9a'\
-b'\x4c\x7b\x44\x7a\x3c\x5a\x3c\x5b\x44\x5a\x54\x9b\x54\x9b\x54\x9b'\
-b'\x5c\xba\x64\xfa\x64\xdb\x6c\xfa\x6c\xfa\x6c\xdb\x6c\xfa\x74\xfa'\
-b'\x75\x1b\x75\x1a\x7d\x1a\x75\x1a\x7d\x1b\x75\x1a\x74\xfa\x6c\xfa'\
-b'\x6c\xda\x64\xdb\x6c\xfa\x6c\xfa\x75\x1b\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x1a\x7d\x1a\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x9d\x9a'\
-b'\x9d\x9a\xa5\x99\xa5\xba\xa5\xb9\xa5\xd9\xad\xda\xad\xd9\xad\xda'\
-b'\xb5\xda\xb5\xda\xad\xf9\xb5\xd9\xad\xda\xb5\xf9\xb5\xd9\xb5\xda'\
-b'\xb5\xf9\xad\xda\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xfa\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xd9\xbd\xf9\xb5\xf9'\
-b'\xa5\xda\xa5\xb9\xad\xb9\xa5\xba\xa5\xba\xa5\xb9\x9d\xb9\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\xba\x9d\x9a\x95\x99\x95\x7a'\
-b'\x95\x7a\x95\x7a\x8d\x5a\x8d\x59\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x8d\x3a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x75\x1a\x7d\x1a'\
-b'\x75\x1a\x7d\x1a\x75\x1a\x85\x3a\x95\x7a\x9d\x9a\x95\x7a\x85\x3a'\
-b'\x6c\xfa\x64\xda\x5c\xbb\x4c\x7a\x2c\x1b\x1b\x7a\x23\x37\x2b\x16'\
-b'\x3a\xf5\x3a\xf4\x42\xf3\x3b\x14\x2b\xda\x2c\x1b\x34\x3b\x3c\x3b'\
-b'\x3c\x5a\x3c\x5b\x3c\x5a\x3c\x3a\x34\x3b\x34\x1b\x2c\x1a\x34\x1a'\
-b'\x34\x3b\x3c\x3b\x3c\x5a\x44\x5a\x44\x7b\x4c\x7b\x54\x9a\x54\xbb'\
-b'\x4c\x9a\x54\x9a\x4c\x9a\x4c\x7b\x4c\x9a\x4c\x7a\x4c\x9b\x4c\x7a'\
-b'\x4c\x7a\x44\x5b\x44\x7a\x44\x7a\x2c\x1b\x2b\xfa\x2c\x1b\x2c\x1b'\
-b'\x2c\x1a\x34\x1b\x3c\x3b\x44\x5b\x44\x7b\x4c\x7a\x54\x9b\x54\x9b'\
-b'\x54\xba\x54\x9b\x54\xbb\x54\xba\x5c\xba\x5c\xbb\x5c\xba\x5c\xba'\
-b'\x64\xda\x64\xdb\x6c\xfa\x6c\xfa\x74\xfb\x75\x1a\x7d\x3a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x75\x1a\x5c\x9a\x44\x5b\x34\x1b\x34\x3b\x44\x5a\x64\xda\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x85\x3a\x85\x39\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x39\x85\x3a\x7d\x3a\x7d\x39\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7c\xd9\x6c\x78\x6b\xd5'\
-b'\x63\x53\x6b\x93\x6c\x16\x74\xd9\x85\x3a\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x74\xf9\x74\x77\x6b\xb4\x63\x53\x6b\xb4'\
-b'\x74\x57\x74\xf9\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x75\x1a'\
-b'\x5c\xba\x4c\x9a\x54\x9a\x5c\xba\x64\xdb\x75\x1a\x85\x3a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x59\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x3a\x7d\x1a\x75\x1a\x75\x1b'\
-b'\x74\xfa\x74\xfa\x6c\xfb\x6c\xfa\x64\xfa\x64\xda\x5c\xda\x54\x9b'\
-b'\x44\x5b\x3c\x5a\x3c\x3b\x44\x5b\x44\x7a\x54\x9a\x54\xbb\x54\xbb'\
-b'\x5c\xba\x6c\xda\x6c\xfa\x64\xdb\x6c\xfa\x6c\xfa\x6c\xfb\x74\xfa'\
-b'\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x6c\xfa\x6c\xfa\x6c\xfa'\
-b'\x64\xdb\x64\xfa\x6c\xfb\x74\xfa\x7d\x1a\x7d\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x1a\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x9d\x79\x9d\x7a'\
-b'\x9d\x9a\x9d\x99\xa5\xba\xa5\xba\xa5\xba\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xd9\xb5\xda\xad\xd9\xad\xd9\xb5\xf9\xad\xf9'\
-b'\xb5\xd9\xb5\xf9\xad\xf9\xb5\xda\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xda'\
-b'\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xad\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xba\x9d\x99\x9d\x9a\x9d\xba\x9d\x99\x9d\x9a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x85\x5a\x8d\x7a'\
-b'\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x85\x3a\x8d\x7a\x95\x9a\x95\x7a'\
-b'\x7d\x3a\x64\xda\x5c\xbb\x4c\x7a\x23\xfb\x13\x7a\x2b\x37\x33\x35'\
-b'\x33\x15\x3a\xf4\x42\xf3\x3a\xf4\x2b\xda\x2c\x1b\x3c\x5a\x3c\x5b'\
-b'\x44\x7b\x44\x5a\x44\x5b\x3c\x3b\x34\x3a\x34\x3b\x34\x3b\x2c\x1b'\
-b'\x34\x3a\x3c\x3b\x3c\x5b\x44\x5a\x4c\x7b\x4c\x9a\x54\x9a\x54\x9b'\
-b'\x54\x9b\x54\xbb\x54\x9a\x4c\x7a\x4c\x7b\x4c\x9b\x4c\x7a\x4c\x7b'\
-b'\x4c\x7b\x44\x7b\x4c\x7b\x4c\x7b\x34\x1b\x2c\x1b\x23\xfb\x2b\xfb'\
-b'\x2c\x1b\x34\x1a\x34\x3b\x3c\x5b\x4c\x7b\x4c\x7a\x4c\x9a\x54\x9a'\
-b'\x54\xba\x5c\xba\x5c\xba\x5c\xbb\x5c\xba\x5c\xba\x5c\xbb\x5c\xba'\
-b'\x64\xda\x64\xdb\x6c\xfa\x6c\xfa\x74\xfa\x74\xfa\x7d\x1a\x85\x3a'\
-b'\x85\x3b\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x75\x1a\x5c\xbb\x44\x5a\x2c\x3b\x34\x1a\x3c\x5b\x5c\x9b\x7d\x1a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x74\xfa\x6c\x77\x63\xb5\x63\x53\x63\x74\x6c\x16'\
-b'\x74\xb8\x7d\x3a\x85\x5b\x8d\x5a\x85\x5a\x85\x3a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x7c\xf9\x74\x36'\
-b'\x63\x94\x63\x53\x63\xb4\x74\x77\x7c\xf9\x7d\x5a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x6c\xda'\
-b'\x54\x9b\x4c\x7b\x54\x9b\x5c\xba\x64\xda\x7d\x1a\x85\x3a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x59'\
-b'\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x5a\x85\x3a\x7d\x3a\x75\x1a\x75\x1a'\
-b'\x74\xfa\x74\xfa\x6c\xfa\x6c\xfb\x64\xda\x64\xda\x5c\xbb\x54\x9a'\
-b'\x44\x5a\x3c\x3b\x3c\x5b\x44\x5b\x4c\x7a\x54\xbb\x54\xbb\x5c\xba'\
-b'\x64\xdb\x6c\xfa\x64\xda\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfa\x75\x1a'\
-b'\x7d\x1b\x75\x1a\x75\x1a\x74\xfa\x74\xfa\x6c\xfb\x6c\xfa\x64\xda'\
-b'\x6c\xda\x64\xda\x6c\xfa\x74\xfa\x75\x1b\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x1a\x85\x3a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a\x95\x7a\x95\x7a\x95\x9a\x9d\x9a'\
-b'\x9d\x99\xa5\x9a\xa5\xba\xa5\xba\xad\xb9\xad\xda\xad\xda\xad\xd9'\
-b'\xb5\xda\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xd9'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\xa5\xda\xad\xba\xa5\xb9\xa5\xba\xa5\xda\xad\xb9\xa5\xda\xa5\xd9'\
-b'\xa5\xba\xa5\xba\xa5\xb9\x9d\x9a\x9d\x9a\x9d\x99\x9d\xba\x9d\x9a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x8d\x5a\x85\x5a\x8d\x59\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x75\x1a'\
-b'\x74\xfa\x75\x1a\x74\xfa\x6c\xfa\x6c\xfa\x7d\x1a\x8d\x7a\x95\x79'\
-b'\x85\x5a\x75\x1b\x5c\xba\x3c\x3b\x13\xdb\x13\x79\x2b\x37\x33\x16'\
-b'\x3b\x15\x3a\xf4\x3a\xf4\x3b\x15\x2b\xda\x2c\x3b\x3c\x3b\x44\x5b'\
-b'\x4c\x7a\x4c\x9a\x44\x5b\x44\x5b\x3c\x5b\x34\x3a\x34\x1b\x34\x3a'\
-b'\x34\x3b\x34\x3a\x3c\x3b\x44\x5a\x4c\x7b\x4c\x9b\x54\x9a\x54\x9a'\
-b'\x54\xba\x54\xba\x4c\x9b\x4c\x7b\x4c\x9a\x4c\x7a\x54\x7b\x4c\x9a'\
-b'\x4c\x7a\x4c\x7b\x4c\x9b\x4c\x9a\x34\x3b\x34\x1a\x2b\xfb\x24\x1b'\
-b'\x2c\x1b\x34\x3b\x34\x3a\x3c\x5b\x44\x5a\x4c\x7b\x4c\x7b\x54\xbb'\
-b'\x5c\xba\x5c\xbb\x5c\xbb\x5c\xbb\x5c\xba\x5c\xdb\x5c\xba\x64\xdb'\
-b'\x64\xda\x64\xda\x6c\xfa\x6c\xfb\x74\xfa\x75\x1a\x75\x1a\x7d\x3a'\
-b'\x85\x5a\x8d\x5a\x85\x3a\x85\x5a\x85\x3a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x75\x1a\x5c\xba\x44\x7b\x34\x1a\x2c\x1b\x3c\x3b\x4c\x9a\x6d\x1a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x74\xfa'\
-b'\x6c\x78\x63\xb5\x63\x73\x63\x74\x6c\x15\x74\xb8\x7d\x3a\x85\x5a'\
-b'\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x3a\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x7a\x85\x5a'\
-b'\x85\x3b\x7c\xd9\x74\x36\x63\x94\x63\x73\x63\xb4\x6c\x37\x7c\xd9'\
-b'\x7d\x3a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x3a\x8d\x5a\x85\x3a\x85\x5a\x85\x3a\x7d\x1a\x5c\xda'\
-b'\x4c\x9a\x4c\x9a\x54\x9b\x5c\xba\x64\xda\x75\x1a\x85\x5a\x8d\x5a'\
-b'\x8d\x3a\x85\x5a\x85\x5a\x85\x59\x8d\x5a\x85\x59\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x85\x5a\x85\x3a\x7d\x3a\x75\x1a\x75\x1b'\
-b'\x74\xfa\x6c\xfa\x6c\xfa\x64\xda\x64\xda\x64\xdb\x54\xbb\x54\x9a'\
-b'\x3c\x5a\x3c\x3b\x3c\x5b\x44\x5a\x4c\x7a\x54\xba\x54\xba\x5c\xbb'\
-b'\x64\xda\x6c\xfa\x64\xda\x6c\xda\x6c\xfa\x6c\xfb\x74\xfa\x75\x1b'\
-b'\x75\x1a\x74\xfa\x74\xfa\x74\xfa\x6c\xfb\x6c\xfa\x6c\xdb\x64\xda'\
-b'\x64\xda\x64\xda\x6c\xfa\x74\xfa\x75\x1a\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x85\x5a\x85\x5a\x7d\x3a\x6c\xfa\x6c\xfa\x6c\xfa'\
-b'\x6c\xfa\x6c\xf9\x6c\xfa\x74\xf9\x75\x1a\x75\x19\x74\xf9\x7d\x1a'\
-b'\x7d\x19\x7d\x39\x7d\x3a\x7d\x39\x85\x39\x85\x59\x85\x5a\x8d\x59'\
-b'\x8d\x5a\x85\x59\x8d\x79\x8d\x59\x85\x5a\x8d\x59\x8d\x59\x85\x59'\
-b'\x8d\x59\x8d\x5a\x8d\x59\x8d\x59\x8d\x59\x8d\x59\x9d\x99\xb5\xda'\
-b'\xb5\xda\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9'\
-b'\xa5\xb9\xa5\xba\xa5\xba\xa5\x99\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\x9a\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x39\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1a\x74\xfa'\
-b'\x74\xfa\x75\x1a\x74\xfa\x6c\xfb\x6c\xfa\x6c\xfa\x75\x1a\x85\x3a'\
-b'\x8d\x5a\x85\x5b\x6c\xfa\x44\x5a\x1b\xba\x1b\x79\x23\x37\x2b\x36'\
-b'\x33\x15\x3a\xf4\x3a\xf4\x33\x15\x23\xda\x34\x3a\x3c\x5b\x44\x5a'\
-b'\x4c\x9a\x54\xbb\x4c\x9a\x44\x7b\x3c\x5b\x3c\x3b\x3c\x3b\x34\x3b'\
-b'\x34\x3b\x34\x1b\x3c\x5a\x44\x7b\x4c\x9b\x54\x9a\x54\x9b\x54\xbb'\
-b'\x5c\x9a\x5c\x9a\x54\x9b\x54\x9a\x54\x9b\x4c\x9b\x4c\x9b\x4c\x7a'\
-b'\x4c\x7b\x4c\x9a\x54\x9a\x54\x9b\x3c\x3b\x34\x3b\x2c\x1a\x24\x1b'\
-b'\x2c\x1b\x2c\x1b\x34\x3b\x3c\x5b\x4c\x5a\x4c\x7a\x4c\x9a\x54\x9b'\
-b'\x54\xba\x5c\x9a\x5c\xba\x5c\xba\x5c\xba\x5c\xda\x64\xdb\x64\xda'\
-b'\x64\xda\x64\xfa\x6c\xfa\x6c\xfa\x6c\xfa\x74\xfa\x75\x1b\x7d\x3a'\
-b'\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x75\x1a\x64\xdb\x4c\x7b\x34\x3a\x24\x1b\x34\x3b\x4c\x7b\x64\xda'\
-b'\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a\x74\xfa\x6c\x98\x6b\xf5\x63\x53'\
-b'\x63\x73\x63\xf6\x6c\xb8\x7d\x1a\x85\x5b\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a'\
-b'\x8d\x5a\x8d\x7a\x85\x5a\x85\x3a\x74\xd9\x6c\x37\x63\x94\x63\x53'\
-b'\x6b\xb5\x74\x77\x7c\xf9\x7d\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x6c\xfa\x5c\x9b'\
-b'\x4c\x7b\x4c\x7a\x54\x9b\x5c\xba\x6c\xfa\x7d\x1a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x59'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x85\x5a\x85\x3a\x7d\x3a\x7d\x1a\x75\x1a'\
-b'\x74\xfa\x6c\xfb\x6c\xfa\x6c\xfa\x64\xdb\x5c\xba\x54\x9a\x4c\x9b'\
-b'\x44\x5b\x3c\x5b\x44\x5a\x44\x5b\x4c\x9b\x5c\xba\x5c\xba\x5c\xbb'\
-b'\x64\xda\x6c\xfb\x64\xda\x6c\xdb\x6c\xfa\x74\xfa\x74\xfa\x75\x1a'\
-b'\x7d\x1b\x75\x1a\x75\x1a\x6c\xfb\x6c\xda\x64\xda\x64\xda\x64\xda'\
-b'\x64\xdb\x6c\xfa\x6c\xfa\x74\xfb\x74\xfa\x75\x1a\x7d\x1a\x7d\x1a'\
-b'\x75\x1a\x7d\x3a\x85\x5a\x8d\x3a\x7d\x3a\x64\xda\x64\xda\x64\xda'\
-b'\x64\xd9\x6c\xda\x6c\xda\x6c\xfa\x6c\xf9\x6c\xfa\x6c\xfa\x75\x19'\
-b'\x74\xfa\x75\x1a\x75\x19\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x39\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x5a\x85\x59\x85\x59\x7d\x5a\x85\x39\x85\x39'\
-b'\x85\x59\x85\x59\x85\x5a\x85\x39\x85\x59\x85\x3a\x95\x7a\xb5\xf9'\
-b'\xb5\xf9\xb5\xda\xb5\xf9\xb5\xda\xb5\xf9\xb5\xda\xb5\xd9\xb5\xda'\
-b'\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xda\xbd\xf9\xbd\xfa'\
-b'\xad\xda\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\x9d\xba\x9d\x99\x9d\x7a\x9d\x9a'\
-b'\x95\x7a\x9d\x9a\x95\x9a\x95\x7a\x8d\x7a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x85\x5a\x8d\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1a\x6c\xfa\x6c\xdb\x64\xda\x6c\xdb\x64\xda\x6c\xda'\
-b'\x7d\x1a\x7d\x1a\x8d\x7a\x7d\x3b\x4c\x5b\x1b\x59\x23\x37\x2b\x37'\
-b'\x33\x16\x33\x15\x32\xf4\x33\x36\x23\xda\x34\x3b\x44\x3a\x44\x5b'\
-b'\x54\x9b\x5c\xba\x5c\xbb\x54\x9a\x44\x7a\x3c\x3b\x3c\x3a\x34\x3a'\
-b'\x34\x3b\x34\x1a\x3c\x3b\x44\x7a\x4c\x7b\x54\x9a\x54\x9a\x54\xbb'\
-b'\x5c\xba\x54\xbb\x54\xba\x54\x9a\x4c\x9a\x54\x7a\x54\x9b\x54\x9b'\
-b'\x4c\x9a\x4c\x7b\x54\x9a\x54\xbb\x3c\x5b\x34\x3a\x2c\x1b\x2c\x1b'\
-b'\x2c\x1b\x2c\x1a\x34\x1a\x3c\x5b\x44\x7b\x4c\x7b\x4c\x7b\x54\x9a'\
-b'\x54\xbb\x5c\xba\x5c\xbb\x5c\xbb\x5c\xda\x64\xbb\x64\xda\x64\xda'\
-b'\x64\xda\x6c\xdb\x6c\xfa\x74\xfb\x74\xfa\x74\xfa\x75\x1a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x7d\x3a'\
-b'\x7d\x1a\x64\xda\x4c\x7a\x34\x3b\x2b\xfb\x2c\x1b\x44\x5b\x5c\xba'\
-b'\x7d\x1a\x7d\x1a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x75\x1a\x74\x98\x63\xf6\x5b\x74\x63\x73\x63\xd5\x6c\x98'\
-b'\x74\xfa\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x7d\x3a\x7c\xd9'\
-b'\x6c\x16\x63\x94\x63\x73\x63\xb5\x6c\x58\x7c\xfa\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x8d\x3a\x85\x3a\x85\x5a\x85\x3a\x6c\xda\x54\x9b'\
-b'\x4c\x7b\x4c\x7a\x54\x9a\x5c\xdb\x6c\xfa\x7d\x1a\x85\x5a\x8d\x3a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x59\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x8d\x59\x85\x5a\x85\x3a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x74\xfa\x6c\xfa\x6c\xfb\x64\xda\x5c\xda\x5c\xbb\x54\x9a\x4c\x9b'\
-b'\x44\x5b\x44\x5b\x44\x5b\x44\x7a\x54\x9b\x5c\xdb\x5c\xda\x64\xda'\
-b'\x64\xdb\x6c\xfa\x64\xda\x6c\xfa\x74\xfb\x74\xfa\x75\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x6c\xfa\x6c\xfa\x64\xdb\x64\xda\x64\xda\x64\xda'\
-b'\x64\xdb\x6c\xfa\x6c\xfa\x75\x1a\x75\x1a\x75\x1a\x75\x1b\x74\xfa'\
-b'\x75\x1a\x85\x3a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\xa5\x99\xa5\xba\xa5\xb9\xa5\xba\xad\xda\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xfa\xb5\xd9\xad\xda\xb5\xd9\xb5\xda\xb5\xf9\xad\xfa'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda\xb5\xd9'\
-b'\xb5\xda\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xad\xda\xa5\xda\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xb9'\
-b'\xa5\xba\xa5\x9a\xa5\xba\xa5\xba\xa5\xba\xa5\xba\x9d\x99\x9d\x9a'\
-b'\x9d\x9a\x95\x7a\x95\x9a\x95\x99\x95\x7a\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x8d\x59\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x39\x85\x3a'\
-b'\x85\x3a\x85\x5a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x75\x1a'\
-b'\x74\xfa\x75\x1a\x6c\xdb\x64\xda\x64\xda\x64\xda\x64\xdb\x64\xda'\
-b'\x5c\xda\x75\x1b\x9d\x9a\x95\x7a\x75\x1a\x3b\xf8\x4c\x39\x44\x39'\
-b'\x3b\x98\x33\x15\x32\xf5\x33\x36\x1b\xdb\x34\x3b\x3c\x5a\x44\x5b'\
-b'\x4c\x7b\x5c\xbb\x5c\xba\x5c\xbb\x54\x9b\x44\x7b\x3c\x5b\x3c\x3b'\
-b'\x3c\x3a\x34\x3b\x3c\x5b\x44\x5b\x4c\x7b\x4c\x7a\x54\x9a\x5c\xbb'\
-b'\x54\xbb\x5c\xba\x54\xbb\x54\x9b\x54\x9a\x4c\x9b\x4c\x9a\x54\x9a'\
-b'\x4c\x9a\x4c\x7b\x54\x9a\x54\xba\x44\x5b\x3c\x3b\x34\x3b\x2c\x1a'\
-b'\x2b\xfb\x2c\x1b\x2c\x1b\x3c\x3b\x44\x5a\x4c\x7a\x4c\x7b\x54\x9b'\
-b'\x54\xba\x54\xba\x5c\xbb\x5c\xda\x5c\xba\x64\xda\x64\xdb\x64\xda'\
-b'\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfa\x6d\x1a\x75\x1a\x7d\x1a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x6c\xfa\x4c\x9b\x3c\x3b\x2c\x1b\x2b\xfa\x3c\x5a\x54\x9b'\
-b'\x74\xfa\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x1a\x74\xfa\x6c\xb9'\
-b'\x6c\x16\x63\x94\x63\x53\x6b\xd5\x6c\x98\x74\xfa\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x8d\x59\x8d\x7a\x8d\x5a\x8d\x79\x8d\x7a\x8d\x5a\x95\x7a'\
-b'\x8d\x79\x8d\x7a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x74\xb9\x6c\x36\x63\x93\x63\x52\x6b\xd5\x74\x98'\
-b'\x7d\x1a\x7d\x3a\x85\x5a\x85\x3a\x85\x3a\x7d\x1a\x64\xdb\x4c\x9a'\
-b'\x4c\x7b\x4c\x9a\x54\xba\x64\xda\x75\x1a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x8d\x3a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x59'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x6c\xfa\x64\xda\x64\xbb\x54\xba\x54\x9a\x4c\x7a'\
-b'\x44\x5a\x4c\x7b\x44\x5b\x4c\x7a\x5c\xba\x5c\xba\x5c\xda\x64\xdb'\
-b'\x64\xda\x6c\xfa\x64\xda\x6c\xfb\x74\xfa\x74\xfa\x75\x1a\x75\x1a'\
-b'\x74\xfa\x74\xfa\x6c\xfa\x64\xdb\x5c\xda\x5c\xba\x64\xda\x64\xdb'\
-b'\x6c\xfa\x6c\xfb\x6c\xfa\x6c\xfb\x74\xfa\x74\xfa\x6c\xfa\x6c\xfa'\
-b'\x75\x1a\x7d\x3a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a'\
-b'\x8d\x5a\x95\x59\x95\x7a\x95\x7a\x95\x79\x95\x9a\x9d\x7a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\xa5\x9a\xa5\xb9\xa5\xba\xa5\xba\xa5\xd9\xad\xda'\
-b'\xad\xda\xb5\xd9\xad\xfa\xad\xf9\xad\xf9\xad\xd9\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xad\xd9\xb5\xda\xb5\xd9\xad\xd9\xb5\xf9\xb5\xf9\xb5\xda'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xfa'\
-b'\xad\xda\xa5\xba\xad\xd9\xad\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xba'\
-b'\xa5\xb9\xa5\xb9\xa5\x9a\x9d\x99\xa5\x9a\xa5\xba\xa5\x9a\x9d\x99'\
-b'\x9d\x9a\x95\x7a\x95\x7a\x9d\x7a\x95\x9a\x95\x7a\x8d\x79\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x74\xfa\x75\x1b\x6c\xfa\x64\xda\x64\xdb\x64\xda\x64\xda\x5c\xbb'\
-b'\x54\x9b\x5c\xba\x75\x1a\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x7d\x3b'\
-b'\x64\xba\x33\x57\x33\x15\x2b\x16\x1b\xba\x34\x1a\x3c\x19\x3c\x1a'\
-b'\x33\xf9\x4c\x39\x54\x59\x54\x59\x54\x7a\x54\x9a\x44\x7a\x3c\x5b'\
-b'\x3c\x3b\x3c\x3a\x44\x5b\x44\x5a\x44\x7b\x4c\x7a\x54\x9a\x54\xbb'\
-b'\x5c\xba\x5c\xba\x5c\xba\x5c\xbb\x5c\xbb\x54\x9a\x54\x9b\x54\x9a'\
-b'\x54\x9b\x4c\x9b\x54\x9a\x5c\xbb\x44\x5b\x3c\x5b\x34\x3a\x2c\x1b'\
-b'\x2b\xfb\x2c\x1b\x2c\x1b\x34\x3a\x44\x5b\x44\x5b\x4c\x9a\x54\x9b'\
-b'\x54\x9a\x5c\xbb\x64\xbb\x64\xba\x5c\xdb\x5c\xda\x64\xdb\x64\xda'\
-b'\x6c\xfb\x6c\xda\x6c\xfa\x6c\xfb\x74\xfa\x75\x1a\x7d\x3a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x75\x1a\x54\x9b\x34\x3b\x2c\x1b\x23\xfa\x34\x3b\x54\x9a'\
-b'\x75\x1a\x7d\x3a\x7d\x3a\x7d\x1b\x74\xb9\x6c\x16\x63\x94\x5b\x53'\
-b'\x63\xb5\x74\x57\x7c\xf9\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x7a\x85\x59\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x95\x7a\x8d\x5a\x8d\x5a\x8d\x59\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x3a\x74\xb9\x6c\x16\x63\x74'\
-b'\x63\x73\x6b\xf6\x74\xb9\x7d\x1a\x7d\x3a\x75\x1a\x5c\xda\x4c\x7b'\
-b'\x4c\x9a\x54\x9b\x5c\xba\x74\xfb\x85\x3a\x85\x5a\x85\x5b\x85\x5a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x59\x8d\x5a'\
-b'\x8d\x7a\x8d\x59\x8d\x5a\x85\x5a\x85\x5a\x7d\x1a\x75\x1a\x7d\x1a'\
-b'\x75\x1a\x74\xfb\x6c\xfa\x64\xdb\x5c\xba\x54\xbb\x4c\x7b\x44\x7b'\
-b'\x4c\x7b\x4c\x7b\x4c\x7b\x4c\x9b\x5c\xba\x64\xda\x64\xda\x64\xdb'\
-b'\x64\xda\x74\xfa\x6c\xdb\x6c\xfa\x74\xfa\x75\x1b\x74\xfa\x75\x1b'\
-b'\x6c\xfa\x6c\xfa\x6c\xfb\x64\xda\x5c\xba\x5c\xdb\x64\xda\x64\xda'\
-b'\x6c\xda\x6c\xfa\x6c\xfa\x74\xfa\x74\xfa\x6c\xfa\x6c\xfa\x6c\xfb'\
-b'\x74\xfa\x85\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x59\x8d\x7a'\
-b'\x8d\x7a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x99\x95\x7a\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xb5\xda\xad\xd9\xb5\xda\xb5\xf9\xb5\xda\xad\xfa'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xad\xfa\xb5\xf9\xb5\xda\xb5\xd9\xad\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xd9'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xd9\xa5\xba\xad\xd9\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\x9a\xa5\xba\xa5\xba\xa5\xb9\x9d\xb9\xa5\xba\xa5\xba'\
-b'\x9d\xba\x9d\x99\x9d\x9a\x95\x7a\x95\x79\x95\x7a\x95\x9a\x8d\x7a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x74\xfa\x6d\x1a\x6c\xda\x64\xdb\x64\xda\x64\xdb\x64\xda\x5c\xba'\
-b'\x54\x9a\x4c\x7a\x54\x9b\x64\xda\x8d\x7a\x95\x7a\x85\x3a\x7d\x1a'\
-b'\x5c\xba\x33\x57\x33\x15\x2b\x36\x1b\x7a\x2b\x37\x33\x15\x3b\x15'\
-b'\x3a\xf4\x3b\x14\x3b\x14\x3a\xf5\x2b\x77\x4c\x7b\x4c\x9b\x44\x7b'\
-b'\x44\x5a\x44\x5b\x44\x7b\x44\x5b\x44\x7a\x4c\x7b\x44\x3a\x54\x9a'\
-b'\x54\xbb\x5c\xba\x54\xbb\x54\xba\x54\xba\x54\x9b\x54\xba\x54\x9b'\
-b'\x54\x9a\x54\x9b\x54\x9a\x64\xda\x54\x9b\x44\x5a\x3c\x3a\x34\x3b'\
-b'\x34\x3b\x2c\x1b\x2c\x1a\x34\x1b\x3c\x3b\x44\x5b\x4c\x9a\x54\x9a'\
-b'\x54\xbb\x5c\x9a\x5c\xba\x5c\xdb\x64\xda\x5c\xbb\x64\xda\x64\xda'\
-b'\x64\xda\x6c\xfb\x6c\xfa\x74\xfa\x75\x1a\x7d\x1a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x6c\xfa\x54\xba\x3c\x5a\x2c\x1b\x2b\xfb\x2c\x1b\x54\x9b'\
-b'\x6c\xfb\x6c\xb9\x6c\x17\x63\x94\x63\x73\x63\xd5\x6c\x78\x74\xd9'\
-b'\x7d\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x59\x8d\x5a\x8d\x7a'\
-b'\x8d\x59\x8d\x7a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x7d\x3a'\
-b'\x74\xb8\x6b\xf5\x63\x73\x63\x93\x64\x16\x5c\x79\x54\x7b\x44\x7b'\
-b'\x4c\x9a\x54\xba\x64\xdb\x75\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x3a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x3a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x6c\xfa\x6c\xda\x5c\xda\x54\xbb\x4c\x9a\x4c\x7b\x44\x7a'\
-b'\x4c\x7a\x4c\x7a\x4c\x9a\x54\x9a\x5c\xbb\x64\xda\x5c\xda\x64\xdb'\
-b'\x64\xda\x75\x1a\x75\x1a\x6c\xfa\x74\xfa\x74\xfa\x6c\xfa\x75\x1a'\
-b'\x74\xfa\x6c\xfa\x64\xda\x5c\xda\x5c\xba\x5c\xbb\x64\xda\x6c\xfa'\
-b'\x6c\xfb\x6c\xfa\x6c\xfb\x6c\xfa\x6c\xfb\x6c\xfa\x6c\xfa\x6c\xfa'\
-b'\x6c\xfa\x85\x3a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x7a\x95\x7a'\
-b'\x95\x7a\x95\x79\x95\x7a\x95\x7a\x95\x99\x9d\x7a\x9d\x99\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\xa5\x9a\xa5\xb9\xa5\xba\xa5\xb9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xf9\xb5\xfa\xad\xf9\xad\xda\xb5\xf9\xb5\xd9'\
-b'\xb5\xf9\xad\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xfa\xb5\xd9'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xfa\xb5\xfa'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xd9\xa5\xba'\
-b'\xa5\xb9\xa5\xd9\xa5\xba\xa5\xda\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\x9d\x99\x9d\x9a\x9d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x8d\x7a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x75\x1a\x74\xfa'\
-b'\x74\xfa\x6d\x1a\x6c\xda\x64\xda\x64\xdb\x64\xda\x5c\xba\x5c\xbb'\
-b'\x5c\xbb\x4c\x9b\x44\x5a\x44\x5a\x64\xda\x85\x5a\x85\x5a\x7d\x3b'\
-b'\x54\x39\x2b\x37\x33\x16\x23\x37\x13\x79\x33\x16\x3a\xf5\x32\xf4'\
-b'\x3a\xf4\x3a\xf5\x3a\xf5\x3a\xf4\x2b\x57\x23\xfb\x4c\x9b\x54\x9a'\
-b'\x4c\x7a\x4c\x7b\x44\x5b\x44\x5a\x44\x5b\x3c\x19\x23\x98\x3c\x3a'\
-b'\x54\xbb\x5c\xba\x5c\xba\x5c\xba\x5c\xba\x5c\xbb\x54\xba\x54\x9a'\
-b'\x54\x9b\x54\x9a\x54\xba\x64\xdb\x54\xbb\x4c\x7b\x44\x5a\x3c\x5b'\
-b'\x34\x3b\x2c\x1b\x2c\x1b\x2c\x1a\x34\x3b\x3c\x5a\x4c\x7b\x54\x9a'\
-b'\x54\xbb\x54\xba\x5c\xbb\x5c\xda\x64\xda\x64\xdb\x64\xda\x64\xda'\
-b'\x64\xda\x6c\xfb\x6c\xfa\x6c\xfa\x75\x1a\x7d\x1a\x7d\x3b\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x1a\x75\x1a\x64\xda\x44\x7b\x2c\x1b\x23\xdb\x2b\xda\x4b\xd7'\
-b'\x5b\x94\x63\x53\x63\xb5\x6c\x57\x74\xf9\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x7a\x8d\x59\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x7c\xfa\x6c\x78\x63\xb5\x5b\x53\x5b\x54\x4b\xd7'\
-b'\x4c\x39\x4c\x9a\x64\xda\x75\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x59'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x7d\x3a\x75\x1a\x75\x1a'\
-b'\x74\xfa\x6c\xfb\x64\xda\x5c\xbb\x54\x9a\x4c\x7b\x4c\x7a\x4c\x7b'\
-b'\x4c\x7a\x4c\x9b\x54\x9a\x54\xbb\x5c\xda\x64\xda\x64\xdb\x5c\xda'\
-b'\x6c\xfa\x75\x1b\x6c\xfa\x6c\xfa\x74\xfa\x74\xfb\x6d\x1a\x6c\xfa'\
-b'\x6c\xfb\x6c\xfa\x64\xda\x5c\xbb\x5c\xbb\x64\xda\x64\xdb\x6c\xfa'\
-b'\x6c\xfa\x6c\xfb\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfb\x6c\xfa\x6c\xfa'\
-b'\x6c\xfa\x85\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x95\x7a\x8d\x79\x8d\x7a'\
-b'\x95\x7a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xd9\xad\xda'\
-b'\xad\xda\xad\xd9\xb5\xda\xad\xd9\xb5\xd9\xad\xfa\xb5\xd9\xb5\xd9'\
-b'\xad\xfa\xb5\xfa\xb5\xd9\xad\xfa\xb5\xd9\xb5\xd9\xad\xf9\xb5\xd9'\
-b'\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xfa'\
-b'\xb5\xfa\xb5\xd9\xad\xd9\xb5\xf9\xad\xda\xad\xd9\xad\xda\xad\xd9'\
-b'\xb5\xda\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xd9\xad\xba\xad\xb9'\
-b'\xa5\xda\xa5\xba\xa5\xb9\x9d\xba\x95\x7a\x8d\x7a\x8d\x5a\x8d\x7a'\
-b'\x8d\x7a\x8d\x7a\x8d\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x39\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1a\x75\x1a\x74\xfa'\
-b'\x74\xfb\x6d\x1a\x64\xda\x64\xdb\x64\xda\x5c\xda\x5c\xba\x5c\xba'\
-b'\x5c\xba\x54\x9b\x44\x7b\x3c\x3b\x34\x1b\x5c\x9b\x7d\x1a\x6c\xfa'\
-b'\x5c\x9a\x3b\xd8\x2b\x16\x23\x57\x13\x79\x2b\x36\x33\x36\x33\x56'\
-b'\x33\x15\x3a\xf4\x33\x14\x3a\xf4\x2b\x58\x1b\xfb\x4c\x7a\x54\xbb'\
-b'\x54\x9b\x54\x9a\x4c\x7a\x44\x7b\x3c\x3a\x23\x79\x23\xb9\x2b\xda'\
-b'\x4c\x5a\x54\xbb\x5c\xba\x5c\xbb\x5c\x9a\x5c\xbb\x5c\xbb\x5c\xba'\
-b'\x5c\xba\x54\xbb\x5c\xba\x64\xda\x5c\xba\x4c\x9b\x4c\x7a\x44\x7b'\
-b'\x44\x5b\x34\x3a\x2c\x1b\x34\x1b\x34\x3b\x44\x5b\x4c\x7a\x54\x9a'\
-b'\x54\x9a\x54\xbb\x5c\xba\x5c\xbb\x5c\xdb\x64\xba\x64\xba\x64\xda'\
-b'\x64\xdb\x6c\xfa\x6c\xfa\x6c\xfa\x74\xfa\x75\x1a\x75\x1a\x7d\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a'\
-b'\x7d\x3a\x75\x1a\x64\xda\x4c\x5a\x3b\xb7\x43\x35\x4b\x13\x4b\x54'\
-b'\x53\xf7\x6c\xb9\x7d\x1b\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x5b\x85\x5a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x7a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x85\x59\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x8d\x59\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x74\xfa\x5c\x9a\x4b\xf7\x4b\x54'\
-b'\x53\x33\x5b\x74\x5c\x17\x6c\xda\x7d\x1a\x7d\x3a\x7d\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x7d\x1a\x75\x1a\x74\xfa'\
-b'\x74\xfa\x6c\xfa\x64\xdb\x54\xba\x4c\x9a\x4c\x7a\x4c\x7b\x4c\x7b'\
-b'\x4c\x7a\x54\xbb\x54\x9b\x5c\xba\x5c\xda\x64\xbb\x5c\xba\x64\xba'\
-b'\x6c\xfb\x74\xfa\x6c\xfb\x6c\xfa\x74\xfa\x6c\xfa\x74\xfa\x6c\xfb'\
-b'\x6c\xfa\x64\xda\x5c\xbb\x54\xba\x5c\xba\x5c\xba\x64\xda\x6c\xfb'\
-b'\x6c\xfa\x6c\xda\x6c\xfb\x6c\xda\x6c\xdb\x6c\xfa\x64\xda\x6c\xdb'\
-b'\x6c\xfa\x8d\x5a\x95\x7a\x8d\x5a\x95\x7a\x95\x5a\x8d\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x79\x95\x7a\x9d\x9a\x9d\x7a\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x99\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xb5\xf9\xad\xfa\xb5\xd9\xad\xfa\xb5\xd9'\
-b'\xb5\xf9\xad\xd9\xb5\xda\xb5\xd9\xad\xf9\xb5\xfa\xb5\xd9\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xda\xb5\xd9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xf9\x8d\x59\x95\x7a\xbd\xf9'\
-b'\xb5\xfa\xb5\xda\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xda'\
-b'\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xda\xb5\xda\xad\xda\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xa5\xba\xa5\xba\x9d\x9a\x95\x79\x8d\x7a\x8d\x5a'\
-b'\x8d\x59\x8d\x5a\x8d\x7a\x8d\x5a\x85\x59\x85\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x3a\x75\x1a\x7d\x1a\x75\x1b\x74\xfa'\
-b'\x6c\xfa\x75\x1b\x6c\xda\x64\xda\x64\xba\x5c\xbb\x5c\xba\x5c\xbb'\
-b'\x5c\xba\x54\xbb\x4c\x9a\x44\x5b\x34\x3b\x3c\x5a\x44\x7a\x54\xba'\
-b'\x4c\x5a\x5c\x9a\x43\xf8\x23\x58\x13\x7a\x2b\x78\x54\x59\x4c\x5a'\
-b'\x3b\x76\x33\x15\x3a\xf5\x32\xf5\x23\x78\x1b\xdb\x44\x7a\x64\xba'\
-b'\x5c\xba\x5c\xba\x54\x9b\x4c\x9b\x33\xf9\x2b\xb9\x2b\xda\x33\xfa'\
-b'\x44\x5a\x54\x9b\x5c\xba\x54\xbb\x54\x9a\x54\xba\x5c\xbb\x5c\xbb'\
-b'\x5c\xba\x5c\xba\x54\xbb\x64\xda\x5c\xdb\x54\x9a\x4c\x7a\x4c\x9b'\
-b'\x44\x7a\x34\x3a\x2c\x1b\x2c\x1b\x34\x3a\x3c\x5b\x44\x7b\x4c\x7a'\
-b'\x4c\x7b\x54\xba\x5c\xba\x5c\xba\x5c\xbb\x64\xda\x64\xda\x5c\xdb'\
-b'\x64\xda\x6c\xdb\x6c\xda\x6c\xfb\x75\x1a\x74\xfa\x6d\x1a\x75\x1a'\
-b'\x7d\x1a\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1a'\
-b'\x6c\xd9\x6c\x58\x63\xb5\x53\x33\x43\x34\x33\x57\x23\xba\x34\x1b'\
-b'\x4c\x9b\x6c\xfa\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x39\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x59\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x3a\x7d\x3a\x6c\xfb\x5c\xba\x44\x7b\x3c\x5b'\
-b'\x44\x19\x53\xd7\x5b\x74\x63\x32\x63\xb5\x6c\x57\x74\xd9\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x6c\xfb\x64\xda\x5c\xba\x54\x9b\x4c\x7b\x4c\x7b\x44\x7a\x4c\x7a'\
-b'\x54\x9b\x54\x9a\x54\xba\x5c\xda\x64\xdb\x64\xda\x64\xda\x64\xda'\
-b'\x6c\xfa\x75\x1a\x75\x1a\x75\x1b\x75\x1a\x74\xfa\x6c\xfa\x6c\xda'\
-b'\x64\xda\x5c\xba\x54\xba\x5c\xba\x5c\xbb\x5c\xba\x6c\xdb\x6c\xfa'\
-b'\x6c\xfb\x6c\xfa\x64\xda\x64\xda\x64\xda\x64\xdb\x4c\x7a\x64\xdb'\
-b'\x6c\xfa\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x5a\x95\x79'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x79\x95\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\xba\xa5\xba\xa5\x9a\xa5\xb9\xa5\xba\xa5\xb9\xad\xda'\
-b'\xad\xd9\xad\xba\xad\xd9\xb5\xda\xad\xd9\xb5\xd9\xb5\xf9\xb5\xd9'\
-b'\xad\xda\xb5\xda\xb5\xd9\xad\xda\xb5\xf9\xb5\xd9\xb5\xfa\xad\xd9'\
-b'\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda'\
-b'\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xfa\x85\x59\x8d\x79\xbd\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xda\xad\xd9'\
-b'\xad\xd9\xad\xd9\xad\xfa\xad\xd9\xb5\xd9\xad\xf9\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xda\xa5\xda\x9d\x9a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x75\x1a\x75\x1a\x74\xfa'\
-b'\x75\x1a\x6c\xfa\x6c\xfa\x64\xdb\x5c\xda\x5c\xba\x5c\xba\x5c\xba'\
-b'\x54\xbb\x5c\xba\x4c\x7a\x44\x5b\x3c\x5b\x3c\x5b\x23\xdb\x2b\xfb'\
-b'\x4c\x9a\x44\x19\x4c\x5a\x44\x3a\x1b\x79\x33\xf9\x64\xdb\x54\x9a'\
-b'\x33\x98\x33\x15\x33\x15\x33\x15\x23\x58\x1b\xdb\x44\x5b\x64\xda'\
-b'\x64\xdb\x5c\xdb\x54\xba\x4c\x7b\x33\xd9\x3c\x3b\x2b\xda\x33\xd9'\
-b'\x4c\x7b\x4c\x9b\x54\xba\x5c\xba\x5c\xbb\x5c\xba\x5c\xba\x5c\xda'\
-b'\x5c\xba\x64\xda\x64\xdb\x6c\xda\x64\xfb\x5c\xba\x54\x9a\x54\x7a'\
-b'\x4c\x7b\x3c\x3b\x2c\x1b\x2c\x1a\x34\x3b\x3c\x3b\x44\x5a\x4c\x7a'\
-b'\x4c\x7a\x54\x9b\x5c\x9a\x5c\xbb\x5c\xba\x64\xdb\x64\xda\x64\xda'\
-b'\x64\xda\x6c\xda\x6c\xfb\x6c\xfa\x6c\xfa\x6c\xfa\x74\xfb\x74\xfa'\
-b'\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1a\x74\xda\x6c\x57\x63\x94'\
-b'\x5b\x33\x5b\x74\x5b\xf6\x4c\x39\x34\x1b\x1b\xfb\x23\xfb\x2b\xfb'\
-b'\x4c\x7b\x6c\xfa\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x75\x3a\x75\x1a'\
-b'\x7d\x3b\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x5a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x7d\x1a'\
-b'\x7d\x1a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x75\x1a\x64\xba\x54\x9b\x4c\x7a\x4c\x7b'\
-b'\x54\x9b\x5c\xbb\x6c\xfa\x74\x98\x63\xf6\x63\x53\x5b\x33\x63\xb5'\
-b'\x64\x57\x74\xda\x75\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x7d\x1a\x74\xfb\x74\xfa'\
-b'\x6c\xfa\x64\xda\x5c\xbb\x54\x9b\x4c\x7a\x4c\x7b\x44\x5b\x4c\x9b'\
-b'\x54\x9a\x5c\xba\x5c\x9a\x5c\xba\x6c\xda\x7d\x1a\x7d\x1a\x75\x1a'\
-b'\x7d\x3b\x85\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x75\x1a\x75\x1a\x74\xfa'\
-b'\x74\xfa\x6c\xfb\x64\xda\x5c\xbb\x5c\xba\x5c\xba\x6c\xfa\x6c\xfb'\
-b'\x6c\xfa\x6c\xfa\x64\xda\x64\xdb\x5c\xba\x44\x7a\x4c\x9a\x5c\xba'\
-b'\x6c\xfa\x8d\x5a\x95\x7a\x95\x7a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x79\x95\x7a\x9d\x7a\x9d\x99\x95\x9a\x9d\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\x99\x9d\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xb5\xf9\xad\xf9\xb5\xda\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xad\xf9\xb5\xd9\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xad\xba\xad\xd9\xb5\xfa'\
-b'\xb5\xda\xad\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xad\xda'\
-b'\xb5\xd9\xb5\xfa\xad\xd9\xb5\xda\xad\xda\xad\xda\xb5\xd9\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\x9d\x9a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x75\x1b\x74\xfa'\
-b'\x74\xfa\x75\x1a\x64\xda\x64\xda\x5c\xbb\x5c\xbb\x5c\xbb\x5c\xba'\
-b'\x54\x9b\x54\x9a\x4c\x9b\x44\x7a\x44\x5b\x3c\x5a\x2c\x1b\x2c\x1b'\
-b'\x34\x3b\x3c\x5a\x3b\xd9\x4c\x5a\x4c\x5a\x44\x3a\x64\xda\x54\x9b'\
-b'\x2b\x77\x33\x16\x33\x16\x33\x15\x23\x58\x1b\xdb\x3c\x3b\x54\xba'\
-b'\x64\xda\x64\xdb\x64\xbb\x4c\x7a\x33\xd9\x44\x3b\x2b\xb9\x3c\x3a'\
-b'\x44\x5b\x4c\x7b\x5c\xba\x6c\xfa\x75\x1a\x74\xfb\x75\x1a\x75\x1a'\
-b'\x74\xfa\x75\x1b\x74\xfa\x6c\xfa\x75\x1a\x74\xfb\x6c\xfa\x6c\xfa'\
-b'\x6c\xfb\x54\x9a\x44\x5a\x2c\x1a\x34\x1b\x3c\x3b\x44\x5b\x4c\x7b'\
-b'\x54\xbb\x54\x9a\x54\x9b\x5c\xba\x5c\xba\x64\xdb\x64\xda\x64\xda'\
-b'\x64\xdb\x6c\xda\x6c\xfa\x6c\xfb\x6c\xfa\x74\xfa\x6c\xfa\x75\x1a'\
-b'\x7d\x1b\x7d\x1a\x74\xfa\x64\x78\x63\xb5\x63\x32\x63\x53\x6c\x16'\
-b'\x6c\x98\x75\x1a\x64\xdb\x54\x7a\x3c\x5b\x2c\x1b\x1b\xdb\x34\x1b'\
-b'\x4c\x7a\x5c\xda\x7d\x3a\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x54\x9a\x4c\x39'\
-b'\x64\xba\x75\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x1a\x6c\xfa\x4c\x5a'\
-b'\x4c\x7a\x75\x1a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x59\x85\x3a'\
-b'\x85\x5a\x85\x5a\x7d\x3a\x6c\xfa\x5c\xba\x4c\x9a\x4c\x7b\x4c\x7a'\
-b'\x54\xba\x64\xda\x75\x1a\x7d\x3a\x7d\x3a\x75\x1a\x74\x98\x6b\xf6'\
-b'\x63\x73\x63\x32\x63\x94\x6c\x57\x74\xfa\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x7d\x3a\x75\x1a\x74\xfa'\
-b'\x6c\xfa\x64\xdb\x54\x9a\x54\x9b\x4c\x7a\x44\x7a\x4c\x7a\x54\x9b'\
-b'\x5c\xbb\x54\xbb\x54\x9a\x5c\xba\x75\x1a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x7d\x5a\x64\xba\x5c\xba\x5c\xdb\x6c\xdb\x6c\xfa'\
-b'\x6c\xfa\x6c\xda\x64\xda\x5c\xba\x44\x5a\x54\x9b\x44\x1a\x4c\x59'\
-b'\x6c\xdb\x8d\x5a\x95\x7a\x8d\x7a\x95\x7a\x95\x5a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x9a\x9d\x7a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99'\
-b'\xa5\x9a\xa5\x9a\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xad\xda'\
-b'\xad\xd9\xad\xda\xb5\xda\xad\xd9\xad\xfa\xb5\xd9\xb5\xda\xb5\xd9'\
-b'\xb5\xd9\xad\xda\xb5\xf9\xb5\xd9\xb5\xda\xad\xf9\xb5\xd9\xad\xda'\
-b'\xb5\xf9\xb5\xda\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xfa\xb5\xd9\xad\xd9\xb5\xda\xb5\xfa\xb5\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xf9\xb5\xda\xad\xd9\xad\xda\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xda\x9d\x99\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x95\x7a\x8d\x5a\x8d\x59\x85\x5a\x8d\x5a\x8d\x7a'\
-b'\x85\x5a\x85\x3a\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfb\x64\xfb\x64\xda\x64\xba\x5c\xba\x5c\xba\x54\xbb'\
-b'\x54\x9a\x54\x9b\x4c\x7a\x44\x5b\x44\x5b\x3c\x5b\x34\x3a\x3c\x3b'\
-b'\x3c\x3b\x23\xda\x3c\x3b\x4c\x5a\x6d\x1b\x6c\xfa\x6c\xfa\x4c\x7a'\
-b'\x2b\x57\x33\x16\x33\x16\x2b\x36\x1b\x9a\x1b\xdb\x34\x3b\x4c\x7a'\
-b'\x64\xdb\x64\xda\x64\xda\x54\x7a\x23\xda\x23\xda\x2b\x98\x3b\xfa'\
-b'\x44\x7b\x4c\x7a\x54\x9b\x74\xfa\x7d\x1a\x75\x1a\x7d\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x75\x1a'\
-b'\x74\xfa\x64\xda\x64\xfb\x54\x9b\x34\x3a\x34\x3b\x3c\x5a\x44\x7a'\
-b'\x4c\x7a\x4c\x9a\x44\x5a\x4c\x9b\x64\xba\x64\xda\x64\xdb\x64\xda'\
-b'\x64\xda\x64\xfb\x6c\xda\x6c\xfa\x6c\xfb\x6d\x1b\x75\x1a\x74\xfa'\
-b'\x6c\x98\x63\xd5\x63\x53\x63\x74\x63\xf6\x6c\x78\x74\xfa\x7d\x3a'\
-b'\x7d\x3a\x7d\x1a\x75\x1a\x5c\xda\x4c\x7a\x2c\x1b\x23\xfb\x2c\x1b'\
-b'\x44\x5a\x54\x9b\x6c\xfa\x85\x3a\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x39\x7d\x3a\x6c\xfb\x53\x75\x62\x8f'\
-b'\x54\x18\x75\x1b\x7d\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x75\x1a\x5c\x79\x62\xaf'\
-b'\x53\x13\x64\xda\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x7d\x1a\x64\xda\x5c\xbb\x4c\x7b\x4c\x7b\x54\x9b'\
-b'\x5c\xba\x6c\xfa\x75\x1b\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3b'\
-b'\x7d\x1a\x74\xb8\x6c\x16\x63\x74\x63\x53\x63\xd6\x6c\x78\x74\xfa'\
-b'\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x7d\x3a\x75\x1a'\
-b'\x6c\xfb\x5c\xda\x54\x9a\x4c\x9b\x44\x7a\x4c\x7b\x4c\x9a\x54\xba'\
-b'\x5c\xba\x64\xda\x75\x1a\x7d\x3a\x7d\x3b\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x8d\x3a\x85\x5a\x8d\x5a\x8d\x3a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x7d\x3a\x5c\xbb\x5c\xba\x64\xda\x6c\xfa\x6c\xfa'\
-b'\x6c\xfa\x64\xda\x5c\xba\x3c\x3a\x4c\x7b\x44\x5a\x33\x36\x4c\x39'\
-b'\x6c\xfa\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79'\
-b'\x95\x7a\x95\x9a\x9d\x79\x95\x9a\x95\x9a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\xba\x9d\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xba\xad\xd9\xb5\xda\xad\xfa\xad\xf9\xb5\xd9\xad\xda'\
-b'\xad\xf9\xb5\xf9\xb5\xd9\xad\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xfa'\
-b'\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xda\xad\xf9\xb5\xda\xad\xd9\xad\xd9\xad\xfa\xad\xd9\xb5\xfa'\
-b'\xb5\xd9\xad\xda\xb5\xda\xad\xf9\xad\xda\xb5\xd9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xd9\xad\xda\xad\xd9\xad\xda\x9d\x9a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x8d\x7a\x8d\x7a\x95\x7a\x8d\x5a\x8d\x5a\x85\x3a\x85\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x6c\xfa\x64\xda\x64\xdb\x5c\xba\x5c\xbb\x54\x9a'\
-b'\x54\x9b\x54\x9a\x4c\x7b\x44\x5b\x44\x5a\x3c\x5a\x3c\x3b\x3c\x3b'\
-b'\x34\x3b\x23\xfb\x2c\x1b\x44\x7b\x75\x1a\x7d\x3a\x74\xfa\x6c\xda'\
-b'\x43\xf8\x2b\x37\x23\x57\x1b\xba\x13\xdb\x1b\xdb\x3c\x5b\x5c\x9a'\
-b'\x64\xda\x64\xdb\x5c\xbb\x54\xbb\x3c\x3b\x2b\xfa\x33\xd9\x3c\x3a'\
-b'\x44\x5a\x44\x7b\x4c\x9a\x74\xfb\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x1a'\
-b'\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x74\xfa\x75\x1a\x75\x1a'\
-b'\x6c\xfa\x5c\xda\x6c\xfa\x64\xda\x4c\x7b\x3c\x3b\x3c\x5b\x3c\x5b'\
-b'\x4c\x5b\x4c\x9a\x4c\x9a\x5c\xbb\x5c\xda\x64\xda\x64\xbb\x64\xda'\
-b'\x6c\xfb\x6c\xfa\x6c\xfb\x6c\xda\x6c\xda\x64\x78\x63\xd6\x5b\x74'\
-b'\x63\x74\x6c\x16\x74\x98\x75\x1a\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x1a\x64\xda\x4c\x7b\x34\x3b\x23\xfb\x2b\xfb'\
-b'\x3c\x5b\x4c\x7a\x6c\xda\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x1a\x6c\xfa\x53\x95\x62\x6e'\
-b'\x53\xf8\x6c\xfa\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x85\x3a\x85\x5a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x1a\x75\x1a\x5c\x59\x62\x8f'\
-b'\x5b\x53\x6c\xda\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x75\x1a\x64\xda\x54\x7a\x4c\x7b\x4c\x7b\x54\x9b'\
-b'\x5c\xda\x6c\xfa\x75\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x7d\x1a\x74\xd9\x6b\xf5\x63\x53\x63\x52'\
-b'\x63\xd5\x6c\x78\x74\xf9\x7d\x3a\x7d\x3b\x85\x3a\x7d\x3a\x75\x1a'\
-b'\x6c\xfa\x64\xbb\x54\xba\x4c\x7a\x4c\x5b\x4c\x7b\x54\x9b\x5c\xba'\
-b'\x64\xda\x74\xfa\x7d\x3a\x7d\x1a\x7d\x1a\x85\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x7d\x3b\x5c\xba\x5c\xbb\x5c\xda\x64\xdb\x6c\xfa'\
-b'\x64\xda\x64\xda\x4c\x7b\x44\x7b\x3c\x19\x33\x98\x3a\xf4\x4c\x19'\
-b'\x6c\xfa\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x9d\x9a\x95\x79\x9d\x9a\x9d\x9a\x9d\x79\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\xa5\x9a\xa5\x9a\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\xa5\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xd9\xb5\xda\xad\xf9\xb5\xda\xb5\xd9'\
-b'\xad\xda\xb5\xda\xb5\xd9\xb5\xfa\xad\xd9\xb5\xf9\xb5\xd9\xb5\xda'\
-b'\xb5\xf9\xad\xd9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\xb5\xd9\xad\xda\xb5\xda\xad\xfa\xb5\xda\xad\xda\xad\xd9'\
-b'\xad\xfa\xb5\xd9\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xda\xa5\xb9\x9d\x99\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x7d\x3b\x7d\x3a\x7d\x1a\x75\x1a'\
-b'\x75\x1b\x75\x1a\x6c\xda\x64\xdb\x5c\xda\x5c\xda\x54\xba\x54\x9b'\
-b'\x54\xba\x54\x9a\x4c\x7b\x44\x7b\x3c\x5a\x3c\x5b\x3c\x3a\x3c\x3a'\
-b'\x34\x5b\x2c\x1a\x2c\x1b\x2c\x1b\x3c\x5a\x6c\xfa\x75\x1a\x75\x1a'\
-b'\x5c\x9a\x2b\x98\x2b\xda\x24\x1b\x23\xfb\x2b\xfa\x5c\xba\x64\xfa'\
-b'\x6c\xda\x5c\xba\x4c\x7a\x44\x5a\x23\xda\x23\x99\x3c\x1a\x44\x7b'\
-b'\x44\x5b\x44\x5a\x4c\x9b\x74\xfa\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x3a'\
-b'\x7d\x1a\x7d\x1a\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x75\x1a'\
-b'\x74\xfa\x64\xda\x64\xda\x6c\xfa\x6c\xfb\x54\x9a\x3c\x3a\x3c\x5a'\
-b'\x44\x5b\x4c\x7b\x54\x9a\x5c\xba\x64\xbb\x64\xda\x64\xda\x64\xdb'\
-b'\x64\xfa\x64\xda\x64\x79\x63\xf6\x5b\x74\x63\x74\x63\xf6\x64\x78'\
-b'\x6c\xfa\x7d\x1a\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x1a\x6c\xda\x54\x9b\x3c\x5a\x23\xfb\x23\xfb'\
-b'\x34\x3b\x4c\x7a\x64\xda\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a'\
-b'\x7d\x1a\x74\xfa\x54\x9b\x5c\xbb\x75\x1a\x7d\x3a\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1a\x5c\xba\x53\x13'\
-b'\x53\x75\x64\xdb\x75\x1a\x7d\x3a\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x6c\xfa\x53\xf7\x52\xf2'\
-b'\x54\x79\x74\xfa\x7d\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x75\x1a\x75\x1a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x6c\xfa\x5c\xbb\x4c\x7b\x44\x7a\x4c\x7b\x54\x9a'\
-b'\x64\xda\x6c\xfa\x7d\x1a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x74\xfa\x6c\x98'\
-b'\x63\xd5\x63\x32\x63\x33\x63\xd5\x74\x98\x7d\x1a\x7d\x3a\x74\xfa'\
-b'\x64\xfa\x5c\xbb\x4c\x9b\x4c\x7a\x4c\x9a\x4c\x9a\x54\xbb\x64\xba'\
-b'\x75\x1a\x85\x5a\x85\x5b\x7d\x1a\x7d\x1a\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x7d\x3a\x5c\xba\x5c\xba\x64\xdb\x64\xda\x64\xfa'\
-b'\x64\xdb\x64\xba\x4c\x7a\x44\x19\x2b\x36\x33\x77\x4a\xd2\x4b\xf8'\
-b'\x6c\xfb\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79\x95\x9a'\
-b'\x9d\x7a\x9d\x9a\x95\x79\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\x9d\xba'\
-b'\xa5\xba\x9d\xb9\xa5\xba\xa5\x99\xa5\xb9\xa5\xd9\xad\xba\xad\xd9'\
-b'\xad\xd9\xad\xda\xad\xd9\xb5\xda\xad\xfa\xb5\xd9\xad\xd9\xad\xda'\
-b'\xb5\xd9\xad\xd9\xb5\xf9\xb5\xd9\xb5\xf9\xad\xda\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xda\xad\xf9\xad\xd9\xad\xda\xb5\xd9\xad\xd9\xad\xda\xb5\xda'\
-b'\xb5\xd9\xad\xda\xb5\xda\xad\xda\xb5\xd9\xad\xda\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xba\xad\xda\x95\x9a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a'\
-b'\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x7d\x1a\x74\xfa\x6c\xfa\x64\xdb\x64\xda\x5c\xba\x5c\xbb\x54\xba'\
-b'\x54\x9a\x4c\x9a\x4c\x7b\x44\x5a\x3c\x5b\x3c\x3b\x3c\x3b\x3c\x5b'\
-b'\x34\x3a\x34\x3b\x34\x1b\x2c\x1b\x23\xfb\x34\x3b\x64\xbb\x7d\x1a'\
-b'\x75\x1b\x4c\x7a\x34\x3b\x34\x1b\x34\x3b\x3c\x1a\x54\x9a\x6c\xfb'\
-b'\x6c\xdb\x4c\x7a\x3c\x3b\x4c\x7b\x54\x9b\x33\xf9\x3c\x3b\x54\x9a'\
-b'\x44\x5a\x44\x5b\x4c\x7a\x6c\xfb\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x75\x1a\x7d\x1a\x75\x1a\x7d\x1a\x75\x1a\x7d\x1a\x75\x1a'\
-b'\x75\x1b\x6c\xda\x6c\xfa\x75\x1b\x74\xfa\x5c\xda\x4c\x7b\x44\x5b'\
-b'\x44\x7a\x4c\x7b\x54\x9b\x54\xba\x5c\xba\x5c\xdb\x5c\xba\x5c\x79'\
-b'\x5b\xf7\x5b\x74\x5b\x74\x5b\xd5\x64\x58\x6c\xfa\x74\xfa\x75\x1a'\
-b'\x75\x1a\x7d\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x1a\x6c\xfa\x5c\xba\x44\x5b\x23\xfb\x1b\xfb'\
-b'\x34\x1b\x44\x5b\x5c\xba\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x3a'\
-b'\x75\x1a\x54\x7a\x3b\x15\x43\x34\x54\x5a\x74\xfa\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x7d\x1a\x7d\x3a\x75\x1a\x64\xfb\x53\x96'\
-b'\x5a\xf2\x5c\x9a\x75\x1a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1a\x64\xda\x53\x54\x53\x54'\
-b'\x64\xdb\x75\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x7d\x3a\x74\xfa\x53\x95\x53\xd6\x74\xfb\x85\x3a\x85\x3a'\
-b'\x85\x5a\x7d\x1a\x64\xfa\x4c\x9a\x44\x5a\x44\x5b\x4c\x7b\x54\xbb'\
-b'\x64\xda\x75\x1a\x7d\x1a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x3a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x7d\x3a\x7c\xfa\x74\x98\x63\xd4\x63\x53\x63\x74\x64\x16\x64\x79'\
-b'\x5c\xba\x54\xbb\x4c\x7b\x4c\x7a\x4c\x9a\x54\x9b\x64\xba\x6c\xfa'\
-b'\x7d\x3a\x85\x5a\x85\x5a\x7d\x1a\x7d\x1a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x7a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x85\x3a\x5c\xba\x5c\xbb\x5c\xda\x5c\xda\x64\xbb'\
-b'\x64\xdb\x54\x9b\x3c\x5b\x3b\x97\x3a\xf4\x3b\x56\x5a\x90\x53\xd6'\
-b'\x6c\xfa\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x7a\x95\x79'\
-b'\x95\x9a\x9d\x7a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\xa5\x9a'\
-b'\x9d\x99\xa5\x9a\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xda\xad\xda'\
-b'\xad\xb9\xad\xda\xad\xd9\xad\xda\xb5\xfa\xad\xf9\xb5\xd9\xb5\xda'\
-b'\xad\xf9\xb5\xda\xb5\xf9\xad\xf9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xd9'\
-b'\xad\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xd9'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa'\
-b'\xb5\xfa\xad\xd9\xb5\xda\xad\xfa\xad\xda\xb5\xfa\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xba\xa5\xb9\xa5\xda\x9d\x9a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x59\x8d\x5a\x8d\x79\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x7d\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1a\x6c\xfa\x64\xdb\x5c\xdb\x5c\xba\x5c\xba\x5c\xbb'\
-b'\x54\x9b\x54\x9a\x4c\x9b\x44\x5b\x3c\x5a\x3c\x5b\x3c\x3a\x34\x3b'\
-b'\x34\x3b\x34\x3a\x2c\x1b\x23\xfb\x1b\xfb\x1b\xdb\x2b\xfb\x5c\xbb'\
-b'\x75\x1a\x6c\xfa\x4c\x7b\x3c\x1a\x3c\x19\x3c\x1a\x44\x5a\x64\xda'\
-b'\x5c\xda\x2c\x1a\x34\x3b\x2b\xfb\x34\x1a\x3c\x1a\x44\x7a\x54\x9b'\
-b'\x4c\x7a\x44\x5a\x4c\x7b\x6c\xfa\x7d\x3a\x7d\x3b\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x7d\x1b\x75\x1a\x75\x1a\x75\x1a\x7d\x1a\x75\x1a\x7d\x1a'\
-b'\x75\x1b\x6c\xda\x6c\xdb\x75\x1a\x6d\x1a\x6c\xdb\x64\xda\x4c\x7a'\
-b'\x44\x7b\x4c\x7b\x4c\x7b\x4c\x9a\x54\x59\x5b\xf7\x5b\x94\x63\x74'\
-b'\x63\xd5\x64\x58\x64\xba\x6c\xfa\x74\xfb\x75\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x7d\x1a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x1a\x75\x1a\x64\xdb\x44\x7a\x23\xfb\x1b\xdb'\
-b'\x2c\x1b\x3c\x3b\x54\x9a\x75\x1a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x74\xfb\x44\x39\x62\x6e\x6a\x4d\x43\xf9\x6c\xfa\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x6d\x1a\x5c\x58'\
-b'\x52\xb1\x54\x17\x6c\xfa\x75\x1a\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x1a'\
-b'\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x75\x1a\x54\x7a\x52\xd2\x53\xd7'\
-b'\x6c\xfa\x75\x1a\x7d\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x5a\x7d\x3a\x5c\x59\x6a\x6e\x5a\xf1\x64\xba\x7d\x3a\x85\x3a'\
-b'\x7d\x3a\x75\x1a\x5c\xba\x44\x7b\x3c\x3b\x44\x5a\x4c\x7b\x54\x9b'\
-b'\x64\xda\x7d\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x5a\x7d\x3a\x7c\xfa\x6c\x78\x63\xd5\x5b\x73'\
-b'\x53\x75\x4b\xd7\x44\x3a\x44\x5b\x44\x7b\x54\x9a\x6c\xfa\x75\x1a'\
-b'\x7d\x3a\x8d\x5a\x85\x5a\x7d\x3a\x7d\x1a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x8d\x7a\x7d\x3a\x64\xba\x5c\xbb\x54\xba\x5c\x9a\x5c\xba'\
-b'\x5c\xba\x4c\x9b\x2b\xfa\x43\x76\x4a\xd2\x43\x34\x62\x8f\x5b\xb6'\
-b'\x6c\xfb\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x7a\x9d\x9a'\
-b'\x95\x79\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\x9d\x99\x9d\xba'\
-b'\xa5\xba\xa5\x9a\xa5\xb9\xa5\xba\xa5\xb9\xad\xda\xa5\xb9\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xb5\xd9\xad\xda'\
-b'\xad\xd9\xb5\xf9\xb5\xd9\xb5\xda\xad\xf9\xb5\xda\xb5\xda\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xad\xd9\xb5\xf9\xb5\xda\xb5\xda\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xda\xad\xf9\xad\xd9\xb5\xda\xad\xd9\xad\xd9\xb5\xda\xad\xda'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xd9\xa5\xba\xad\xda\xa5\xb9\x9d\x9a\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x7a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x1a\x75\x1a\x6c\xfa\x64\xda\x5c\xbb\x5c\xba\x5c\xba\x5c\xbb'\
-b'\x54\xba\x54\x9a\x4c\x9b\x44\x7b\x44\x5b\x3c\x3a\x3c\x3b\x3c\x3b'\
-b'\x34\x3b\x34\x3a\x2c\x1b\x23\xfb\x1b\xdb\x1b\xdb\x13\xbb\x1b\xdb'\
-b'\x4c\x7b\x6c\xfa\x64\xda\x4c\x39\x33\xd9\x33\xda\x33\xd9\x4c\x5a'\
-b'\x64\xba\x44\x5b\x34\x1b\x2c\x1b\x23\xb9\x3c\x1a\x54\xbb\x54\x9b'\
-b'\x4c\x9a\x4c\x7a\x4c\x7b\x64\xda\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x1a'\
-b'\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x1b\x7d\x1a\x7d\x3a'\
-b'\x75\x1a\x6c\xfa\x6c\xfa\x74\xfa\x74\xfa\x64\xda\x5c\xdb\x54\x9b'\
-b'\x3c\x3a\x44\x39\x4b\xd7\x4b\x75\x53\x54\x5b\x95\x64\x38\x64\xba'\
-b'\x64\xfa\x6c\xfb\x6c\xfa\x6c\xda\x75\x1a\x75\x1a\x74\xfa\x75\x1a'\
-b'\x7d\x1a\x7d\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x75\x1a\x64\xda\x44\x7b\x23\xfb\x1b\xbb'\
-b'\x1b\xdb\x34\x1b\x4c\x7a\x6c\xfa\x85\x3a\x85\x3a\x7d\x1a\x7d\x3a'\
-b'\x75\x1a\x4c\x7a\x43\x14\x5a\x8f\x3c\x19\x6c\xfb\x7d\x3a\x7d\x1a'\
-b'\x85\x3a\x85\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x1a\x74\xfa\x5c\xba'\
-b'\x53\x13\x53\x75\x64\xda\x75\x1a\x75\x1a\x7d\x1a\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x6c\xfb\x4b\xf7\x52\xd1\x54\x79'\
-b'\x75\x1b\x7d\x1a\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x54\x59\x5a\xb0\x53\x95\x6c\xfa\x7d\x3a\x85\x3a'\
-b'\x7d\x3a\x6c\xfa\x54\xbb\x3c\x5b\x34\x3b\x3c\x5b\x4c\x7a\x54\xba'\
-b'\x6c\xda\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x8d\x59\x8d\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x8d\x5a\x85\x5a\x85\x5a\x75\x1a\x64\xfb\x5c\x7a'\
-b'\x4b\xd7\x4b\x55\x4b\x34\x4b\x75\x54\x18\x5c\x9a\x75\x1b\x74\xfa'\
-b'\x7d\x1a\x85\x5a\x8d\x5a\x7d\x3a\x7d\x1a\x85\x5a\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x59\x8d\x5a\x8d\x7a'\
-b'\x95\x7a\x8d\x5a\x7d\x1a\x5c\xba\x54\xbb\x4c\x7b\x54\x9b\x5c\xbb'\
-b'\x54\xbb\x4c\x7a\x33\xfa\x4b\x55\x5a\x8f\x4b\x14\x62\x8f\x5b\x95'\
-b'\x6c\xfa\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x7a\x95\x99\x95\x7a'\
-b'\x9d\x9a\x95\x79\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\xa5\x9a\xa5\x99'\
-b'\x9d\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xda\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xd9\xad\xda\xad\xda\xb5\xd9\xad\xda\xb5\xf9\xb5\xd9'\
-b'\xad\xda\xb5\xf9\xb5\xf9\xad\xd9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xd9'\
-b'\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xfa\xb5\xf9'\
-b'\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xfa\xbd\xfa\xb5\xf9'\
-b'\xb5\xfa\xad\xda\xb5\xda\xad\xd9\xb5\xfa\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xd9\xad\xba'\
-b'\xad\xd9\xad\xda\xad\xd9\xa5\xba\xa5\xda\x9d\x99\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x79\x8d\x7a\x95\x7a\x95\x7a\x8d\x7a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x5a\x85\x3a\x7d\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x6c\xfa\x64\xdb\x5c\xba\x5c\xbb\x5c\xba\x54\xba'\
-b'\x5c\x9b\x54\x9a\x54\x9b\x4c\x7a\x44\x5b\x3c\x5b\x34\x3a\x3c\x3b'\
-b'\x3c\x3b\x34\x3b\x2c\x1a\x23\xdb\x1b\xdb\x13\xbb\x13\xbb\x13\xbb'\
-b'\x13\xbb\x3c\x3b\x5c\xba\x64\xda\x44\x5a\x44\x1a\x43\x97\x4c\x38'\
-b'\x5c\xba\x64\xfa\x5c\xdb\x44\x5b\x44\x5a\x4c\x7b\x5c\xba\x54\xba'\
-b'\x54\xbb\x4c\x9a\x4c\x7a\x6c\xfa\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x1a'\
-b'\x75\x1a\x6c\xda\x6d\x1b\x75\x1a\x75\x1a\x64\xda\x5c\xda\x5c\x59'\
-b'\x4b\x55\x4b\x34\x4b\x75\x53\xf7\x54\x79\x5c\xda\x6c\xfb\x6c\xfa'\
-b'\x6c\xfa\x6c\xfa\x6c\xfa\x74\xfa\x75\x1a\x74\xfa\x75\x1a\x75\x1a'\
-b'\x7d\x1a\x7d\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x75\x1a\x6c\xdb\x4c\x7b\x2b\xfa\x1b\xbb'\
-b'\x13\xbb\x23\xfb\x44\x5b\x64\xda\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x1a\x64\xdb\x3b\x97\x5a\x6f\x43\xd8\x64\xda\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x85\x3a\x7d\x1a\x7d\x1a\x7d\x3a\x75\x1a\x6c\xfa'\
-b'\x4b\xb6\x52\xd2\x54\x5a\x6c\xfa\x75\x1a\x7d\x1a\x7d\x1a\x7d\x1a'\
-b'\x7d\x1a\x7d\x3a\x75\x1a\x75\x1a\x5c\xba\x53\x55\x53\x34\x5c\xba'\
-b'\x75\x1a\x7d\x3a\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x7d\x3a\x75\x1a\x54\x38\x5a\x90\x54\x18\x75\x1b\x85\x3a\x7d\x3a'\
-b'\x75\x1a\x64\xda\x54\x9a\x3c\x3b\x2c\x1b\x34\x1a\x44\x5a\x54\x7a'\
-b'\x6c\xfa\x7d\x3a\x85\x3a\x7d\x3a\x85\x5a\x85\x3a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x75\x1a\x5c\xbb\x54\xba'\
-b'\x4c\x9b\x44\x5b\x44\x19\x4b\xd6\x5b\x54\x5b\x74\x6c\xd9\x6c\xfa'\
-b'\x7d\x1a\x8d\x5a\x8d\x5a\x7d\x3a\x7d\x3a\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x7a\x95\x7a'\
-b'\x8d\x7a\x8d\x7a\x85\x3a\x5c\xba\x54\x9a\x44\x5a\x4c\x7a\x5c\xba'\
-b'\x54\xba\x4c\x7b\x33\xb9\x53\x54\x6a\x6e\x53\x13\x5a\x8f\x5b\x95'\
-b'\x6c\xfa\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x79\x95\x7a\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x9d\x79\x9d\x9a\x9d\x9a\x9d\x99\x9d\xba\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xad\xb9\xad\xda\xa5\xba'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xd9\xb5\xda\xad\xd9\xad\xfa'\
-b'\xb5\xd9\xad\xda\xb5\xfa\xb5\xd9\xb5\xda\xb5\xf9\xad\xda\xb5\xf9'\
-b'\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\xb5\xda\xad\xf9\xad\xda\xb5\xda\xad\xd9\xad\xda\xad\xda\xb5\xda'\
-b'\xad\xd9\xad\xda\xad\xda\xb5\xda\xad\xda\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xd9\xad\xba\xa5\xba\xa5\xba\x9d\x9a\x8d\x7a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x85\x5a\x85\x5a\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x85\x3a\x75\x1b\x6c\xda\x64\xda\x5c\xba\x5c\xbb\x5c\xba'\
-b'\x5c\xbb\x54\xba\x54\x9b\x4c\x7a\x44\x7b\x3c\x5a\x34\x3b\x34\x3a'\
-b'\x34\x3b\x34\x3b\x2c\x1b\x1b\xfb\x13\xbb\x13\xbb\x13\xbb\x13\xbb'\
-b'\x13\xbb\x13\xbb\x34\x1b\x64\xdb\x6c\xfa\x5c\x99\x4c\x39\x5c\xbb'\
-b'\x6c\xdb\x6c\xfa\x54\x9b\x2b\xfa\x33\xfa\x4c\x5a\x5c\xbb\x5c\xba'\
-b'\x54\x9a\x54\x9b\x54\x9b\x75\x1a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x7d\x1a\x7d\x3b\x7d\x3a\x7d\x1a\x7d\x3a'\
-b'\x7d\x3b\x6c\xfa\x6c\xfa\x75\x1b\x74\xfa\x64\xda\x5c\xdb\x5c\x79'\
-b'\x3b\xb7\x3c\x1a\x44\x5b\x4c\x9b\x54\x9a\x5c\xda\x64\xda\x6c\xda'\
-b'\x6c\xfb\x6c\xfb\x74\xfa\x75\x1a\x75\x1b\x74\xfa\x75\x1a\x75\x1a'\
-b'\x75\x1a\x7d\x1b\x85\x3a\x7d\x3a\x85\x3a\x8d\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x7d\x3a\x85\x3a\x7d\x1a\x6c\xfa\x4c\x7a\x4b\x34\x4a\xd2'\
-b'\x13\x9a\x1b\xdb\x3c\x5b\x64\xda\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x3a'\
-b'\x7d\x1a\x6c\xfa\x43\xf9\x5a\x8f\x43\x96\x5c\xdb\x7d\x1a\x7d\x3a'\
-b'\x85\x3a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x6c\xfb'\
-b'\x4c\x39\x52\xb1\x4b\xd7\x64\xfb\x75\x1a\x7d\x1a\x75\x3a\x7d\x1a'\
-b'\x7d\x1a\x7d\x1a\x75\x1a\x6c\xfb\x54\x79\x52\xf2\x4b\x97\x6c\xfa'\
-b'\x75\x1a\x7d\x1a\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x75\x1b\x53\xd6\x5a\xb0\x54\x39\x7d\x1a\x85\x3a\x85\x5a'\
-b'\x7d\x1a\x64\xdb\x44\x7b\x34\x3a\x2c\x1b\x2b\xfb\x53\x13\x62\xd0'\
-b'\x64\x99\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x7a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x8d\x5a\x8d\x5a\x8d\x7a\x7d\x3a\x6c\xda\x54\xbb\x4c\x7b'\
-b'\x4c\x7a\x4c\x7b\x4c\x9b\x54\x9b\x54\x9a\x64\x79\x7c\xfa\x6d\x1b'\
-b'\x7d\x3a\x8d\x5a\x85\x5a\x7d\x3a\x85\x3a\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x8d\x7a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x59\x8d\x5a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x8d\x7a\x85\x3a\x5c\xbb\x4c\x9b\x44\x5a\x4c\x7a\x5c\xbb'\
-b'\x5c\xbb\x54\x7a\x3b\xb8\x4b\x34\x6a\x4d\x52\xf2\x5a\xb0\x53\x75'\
-b'\x6c\xfb\x95\x7a\x95\x7a\x95\x7a\x9d\x9a\x95\x9a\x9d\x7a\x95\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x9d\xba\xa5\x9a\xa5\x9a'\
-b'\xa5\xba\xa5\x99\xa5\xba\xa5\xba\xa5\xba\xad\xda\xa5\xda\xad\xda'\
-b'\xad\xd9\xad\xb9\xad\xd9\xad\xda\xb5\xda\xad\xd9\xb5\xda\xb5\xd9'\
-b'\xad\xd9\xb5\xf9\xb5\xd9\xad\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xfa\xb5\xf9\xad\xf9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xd9'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xad\xda\xb5\xd9\xad\xfa\xb5\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xda'\
-b'\xa5\xda\xa5\xb9\xa5\xb9\x9d\x99\x9d\x9a\x95\x7a\x95\x7a\x8d\x5a'\
-b'\x95\x5a\x95\x7a\x95\x7a\x95\x9a\x95\x7a\x95\x7a\x95\x79\x8d\x7a'\
-b'\x8d\x7a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x8d\x5a\x85\x3a'\
-b'\x7d\x1a\x7d\x3a\x7d\x3b\x74\xfa\x64\xfa\x5c\xba\x5c\xba\x5c\xbb'\
-b'\x5c\xba\x54\xbb\x54\x9a\x4c\x7b\x4c\x7b\x3c\x3b\x34\x3a\x34\x3b'\
-b'\x34\x3b\x34\x3b\x2b\xfb\x1b\xdb\x1b\xdb\x13\xbb\x13\xbb\x0b\xbb'\
-b'\x0b\xbb\x0b\x9b\x0b\x7a\x2b\xda\x5c\xba\x64\xdb\x5c\xba\x64\xda'\
-b'\x64\xda\x6c\xfa\x44\x5a\x3c\x3b\x34\x19\x54\x7a\x64\xda\x5c\xba'\
-b'\x5c\xbb\x54\x9a\x54\x9a\x74\xfb\x85\x3a\x85\x5a\x85\x5b\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x6c\xfa\x6c\xfa\x7d\x1a\x7d\x1a\x64\xda\x5c\xba\x5c\xba'\
-b'\x3c\x3b\x34\x1b\x44\x5a\x4c\x7a\x54\x9b\x5c\xba\x6c\xda\x6c\xfb'\
-b'\x6c\xfa\x6c\xda\x74\xfa\x75\x1a\x75\x1a\x74\xfa\x74\xfa\x75\x1b'\
-b'\x7d\x1a\x7d\x1a\x7d\x3a\x75\x1a\x85\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x74\xfb\x54\x9b\x5b\x33\x52\xb1'\
-b'\x13\x7a\x13\xdb\x34\x1b\x5c\xbb\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a'\
-b'\x7d\x3a\x6c\xfa\x44\x3a\x5a\xb0\x4b\x34\x5c\x9b\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x74\xfa'\
-b'\x5c\xba\x4b\x14\x53\x34\x5c\xba\x74\xfa\x75\x1a\x7d\x1a\x7d\x3a'\
-b'\x75\x1a\x7d\x1a\x75\x1a\x6c\xfb\x4b\xf8\x52\xd1\x4c\x39\x6d\x1a'\
-b'\x7d\x1a\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x6c\xfa\x53\x75\x5a\xd1\x54\x7a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x75\x1a\x5c\xba\x44\x5b\x34\x1a\x2c\x1b\x2c\x1b\x53\x34\x62\xd1'\
-b'\x64\xda\x7d\x3b\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x8d\x7a\x8d\x7a\x8d\x5a\x85\x3a\x64\xda\x54\x9a\x4c\x7a'\
-b'\x44\x5b\x4c\x7a\x4c\x9a\x5c\xbb\x6c\xfa\x6d\x1a\x7d\x3a\x74\xfa'\
-b'\x7d\x3a\x8d\x5a\x8d\x7a\x7d\x3a\x85\x5a\x8d\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x8d\x7a\x85\x3a\x5c\x9a\x4c\x7b\x44\x5a\x44\x5a\x5c\xba'\
-b'\x54\xbb\x4c\x5a\x3b\x97\x53\x53\x6a\x4d\x53\x12\x62\x8f\x53\x74'\
-b'\x6c\xfa\x95\x7a\x95\x7a\x95\x79\x95\x79\x9d\x7a\x95\x99\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99\xa5\xba\x9d\x9a\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xad\xb9\xad\xda\xad\xda'\
-b'\xad\xb9\xad\xda\xad\xda\xad\xd9\xb5\xda\xad\xda\xad\xf9\xad\xda'\
-b'\xb5\xd9\xad\xf9\xb5\xfa\xb5\xd9\xad\xda\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xda'\
-b'\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa\xbd\xfa'\
-b'\xb5\xda\xad\xfa\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xa5\xba'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x95\x9a\x9d\x79\x95\x99\x95\x7a\x9d\x9a'\
-b'\xa5\xba\xa5\xba\xa5\xb9\x9d\xba\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x95\x7a\x95\x7a\x8d\x5a\x85\x5a\x85\x3a'\
-b'\x75\x1a\x74\xfa\x7d\x1a\x6c\xfa\x6c\xfa\x6c\xfb\x64\xda\x64\xba'\
-b'\x5c\xbb\x54\xba\x54\x9a\x54\x7b\x44\x7b\x3c\x3a\x34\x1b\x34\x3b'\
-b'\x2c\x1a\x2c\x1b\x24\x1a\x1b\xdb\x1b\xdb\x13\xbb\x13\xbb\x0b\x9b'\
-b'\x0b\x9b\x13\x9b\x13\x7a\x13\x79\x2b\x99\x54\x9a\x64\xda\x64\xdb'\
-b'\x64\xda\x6c\xfa\x5c\xbb\x3c\x3a\x4c\x7a\x64\xba\x64\xdb\x5c\xda'\
-b'\x5c\xbb\x5c\xba\x5c\xba\x75\x1b\x7d\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x85\x1a\x7d\x3a\x7d\x3a\x7d\x1a\x85\x1a'\
-b'\x7d\x1a\x6c\xdb\x6c\xfa\x7d\x3a\x75\x1b\x64\xda\x5c\xbb\x54\x9b'\
-b'\x3c\x3a\x3c\x3b\x3c\x5b\x44\x5a\x54\x9b\x64\xda\x6c\xfa\x6c\xfa'\
-b'\x6c\xfb\x6c\xfa\x6c\xfa\x75\x1a\x75\x1b\x6c\xfa\x75\x1a\x7d\x1a'\
-b'\x7d\x3a\x7d\x3a\x75\x1a\x64\xdb\x75\x1b\x7d\x3a\x7d\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x5a\x7d\x3a\x7d\x1a\x5c\xda\x4b\x55\x52\xf2'\
-b'\x13\x9a\x13\xbb\x34\x1b\x54\xba\x7d\x1a\x7d\x3a\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x75\x1a\x54\x7a\x52\xf2\x52\xf2\x54\x9a\x75\x1a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x1a\x85\x3a\x7d\x1a\x75\x1a'\
-b'\x64\xfa\x4b\xb7\x52\xb1\x54\x59\x6c\xfb\x75\x1a\x7d\x1a\x7d\x1a'\
-b'\x75\x1a\x7d\x1b\x75\x1a\x5c\xda\x4b\x55\x4b\x13\x5c\xba\x75\x1a'\
-b'\x7d\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x64\xfa\x5b\x13\x52\xf2\x5c\xba\x7d\x3a\x85\x3a\x85\x5a'\
-b'\x75\x1a\x5c\xbb\x44\x5b\x34\x3b\x2c\x3b\x34\x3b\x4b\x54\x5b\x32'\
-b'\x6c\xfb\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x7d\x1a\x64\xdb\x54\xba\x44\x5b'\
-b'\x44\x3a\x44\x5a\x5c\xdb\x64\xda\x6c\xfa\x7d\x3b\x7d\x3a\x6c\xfa'\
-b'\x7d\x3a\x8d\x5a\x8d\x5a\x7d\x3a\x85\x3a\x8d\x7a\x95\x7a\x8d\x5a'\
-b'\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x7d\x3a\x5c\xba\x4c\x9a\x44\x3a\x4c\x39\x54\x9b'\
-b'\x5c\xba\x54\x7a\x3b\x77\x4b\x55\x6a\x4d\x52\xf2\x62\x8f\x5b\x54'\
-b'\x74\xfa\x95\x7a\x95\x7a\x9d\x7a\x9d\x9a\x95\x9a\x9d\x7a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\xa5\x9a\x9d\x9a\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xda\xad\xda\xa5\xd9'\
-b'\xad\xd9\xad\xda\xad\xb9\xad\xd9\xb5\xda\xad\xd9\xb5\xd9\xb5\xd9'\
-b'\xad\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xd9\xad\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xd9'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xd9\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xad\xda\xb5\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xa5\xba\xa5\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\x79\x95\x7a\x9d\x9a\x9d\x9a\x9d\x9a\xa5\xba\xa5\xba\xad\xd9'\
-b'\xad\xd9\xad\xfa\xad\xda\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xba\xa5\xba\x9d\xb9\x9d\x9a\x9d\x9a\x95\x7a\x8d\x5a'\
-b'\x7d\x1a\x74\xfa\x75\x1a\x6d\x1b\x6c\xfa\x64\xfa\x6c\xdb\x64\xdb'\
-b'\x5c\xba\x5c\xba\x54\x9b\x4c\x7b\x44\x7a\x34\x3b\x34\x1b\x34\x3a'\
-b'\x34\x3b\x2c\x1b\x23\xfb\x23\xdb\x1b\xdb\x13\xbb\x0b\xbc\x13\xbb'\
-b'\x13\x9b\x0b\x9b\x13\x7a\x1b\x79\x1b\x58\x2b\x78\x4c\x3a\x64\xdb'\
-b'\x64\xda\x64\xda\x6c\xfa\x64\xda\x64\xdb\x64\xdb\x64\xda\x64\xda'\
-b'\x5c\xbb\x5c\xba\x5c\xba\x6c\xfa\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x1a\x64\xfa\x75\x1a\x7d\x3a\x7d\x1a\x5c\xda\x5c\xba\x5c\xba'\
-b'\x44\x5b\x3c\x5b\x3c\x5a\x44\x5b\x4c\x7b\x64\xda\x6c\xda\x6c\xfa'\
-b'\x6c\xda\x64\xdb\x64\xda\x75\x1a\x74\xfa\x74\xfa\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x6c\xfa\x5c\x18\x5b\x74\x64\x99\x7d\x3b\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x6c\xfb\x53\x54\x4a\xf2'\
-b'\x13\x9a\x13\xbb\x2c\x1b\x54\x9a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x64\xdb\x4b\x54\x5a\xb0\x4c\x59\x7d\x1b\x7d\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a\x75\x1a'\
-b'\x6d\x1a\x4c\x39\x4a\xd2\x4b\xb6\x64\xfb\x75\x1a\x75\x1a\x75\x1a'\
-b'\x7d\x1a\x75\x1a\x74\xfa\x54\x7a\x4a\xd3\x4b\x96\x64\xda\x75\x1a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x7d\x3a\x5c\xba\x5a\xd1\x53\x34\x64\xda\x85\x3a\x85\x3a\x85\x5a'\
-b'\x6c\xfa\x54\x9b\x3c\x5a\x2c\x1b\x2c\x1a\x3c\x3b\x4b\x54\x5b\x33'\
-b'\x6c\xfa\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x7c\xf9\x63\x94\x64\x16\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x7d\x3a\x6c\xda\x5c\xba\x54\x9b\x3c\x3b'\
-b'\x3c\x5b\x44\x7a\x64\xda\x74\xfa\x7d\x1a\x7d\x3a\x7d\x1a\x75\x1a'\
-b'\x7d\x1a\x8d\x7a\x8d\x7a\x85\x5a\x85\x3a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x5a\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x8d\x7a\x7d\x1a\x54\x9a\x44\x7b\x44\x3a\x4c\x39\x54\x9a'\
-b'\x54\xbb\x54\x7a\x3b\x97\x4b\x34\x6a\x4d\x5a\xf1\x62\x8f\x5b\x54'\
-b'\x75\x1a\x95\x7a\x95\x9a\x95\x7a\x9d\x99\x9d\x9a\x95\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99\x9d\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\x99\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xad\xd9\xad\xba\xad\xda'\
-b'\xad\xd9\xad\xba\xad\xda\xb5\xd9\xad\xda\xad\xda\xad\xda\xb5\xf9'\
-b'\xad\xd9\xb5\xf9\xb5\xf9\xad\xda\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9'\
-b'\xad\xda\xb5\xf9\xb5\xf9\xb5\xda\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xfa'\
-b'\xad\xda\xad\xd9\xad\xda\xb5\xda\xad\xd9\xb5\xda\xad\xda\xb5\xda'\
-b'\xad\xda\xa5\xba\xa5\xb9\x9d\x9a\x9d\x9a\x9d\x99\x95\x9a\x95\x9a'\
-b'\x9d\x9a\x9d\x99\x9d\xba\xa5\xb9\xad\xd9\xad\xda\xa5\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xba\x9d\xb9\x9d\x9a'\
-b'\x7d\x3a\x74\xfa\x75\x1a\x6c\xfa\x6c\xda\x64\xda\x64\xbb\x64\xda'\
-b'\x64\xda\x5c\xba\x4c\x9a\x4c\x7b\x44\x5b\x3c\x3a\x34\x3b\x34\x1b'\
-b'\x2c\x1b\x2c\x1b\x23\xfb\x1b\xdb\x1b\xdb\x13\xbc\x13\xbb\x0b\x9b'\
-b'\x0b\x9b\x13\x9b\x13\x79\x13\x79\x1b\x58\x23\x38\x2b\x36\x4b\xf8'\
-b'\x64\xda\x64\xfb\x6c\xfb\x6c\xfa\x64\xda\x64\xdb\x64\xda\x64\xda'\
-b'\x5c\xbb\x5c\xdb\x64\xba\x74\xfa\x85\x5a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x3a\x6c\xda\x75\x1b\x85\x3a\x7d\x3a\x5c\xbb\x5c\xbb\x64\xda'\
-b'\x44\x7a\x3c\x3b\x3c\x3a\x34\x3b\x34\x3a\x54\x9b\x64\xdb\x6c\xda'\
-b'\x64\xfa\x5c\xba\x64\xdb\x75\x1a\x6c\xfa\x74\xfa\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x6c\xfb\x5b\x94\x6a\x6e\x5c\x58\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x6c\xfb\x4b\x55\x52\xf2'\
-b'\x13\x9a\x13\x9b\x23\xfb\x4c\x9a\x75\x1a\x85\x3a\x85\x3a\x7d\x5a'\
-b'\x85\x3a\x85\x3a\x6c\xfa\x4b\x96\x62\x6f\x4b\xf8\x75\x1a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a'\
-b'\x75\x1a\x5c\xba\x43\x34\x4b\x13\x5c\x9a\x74\xfa\x75\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1a\x6c\xfa\x4b\xf8\x4a\xd2\x4c\x18\x6c\xfb\x7d\x1a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x54\x59\x5a\x90\x4b\x96\x6d\x1b\x85\x3a\x85\x5a\x85\x3a'\
-b'\x6c\xfa\x4c\x9a\x3c\x3b\x34\x1b\x34\x3b\x3c\x5b\x53\x34\x5b\x33'\
-b'\x64\xda\x7d\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x6c\xb9\x6a\x6e\x63\x53\x7d\x1a\x8d\x5a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x75\x1a\x5c\xda\x54\x9b\x4c\x7a\x44\x7b'\
-b'\x44\x7a\x54\xbb\x6c\xda\x75\x1a\x7d\x3b\x7d\x1a\x7d\x3a\x6c\xfb'\
-b'\x74\xfa\x8d\x5a\x8d\x5a\x85\x3a\x85\x5a\x95\x7a\x8d\x7a\x95\x7a'\
-b'\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x79\x95\x5a\x95\x7a\x95\x79'\
-b'\x95\x7a\x95\x7a\x85\x5a\x54\x9a\x3c\x5b\x44\x3a\x3b\xf9\x4c\x9b'\
-b'\x54\x9a\x54\x7a\x3b\x97\x4b\x34\x72\x4c\x5a\xf1\x62\x8f\x63\x53'\
-b'\x75\x1a\x95\x9a\x9d\x99\x95\x9a\x9d\x7a\x9d\x99\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x9d\x99\xa5\x9a\xa5\x9a\xa5\xba\xa5\xba\xa5\x9a'\
-b'\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xd9\xad\xba\xa5\xd9\xad\xd9'\
-b'\xad\xba\xad\xd9\xad\xd9\xad\xda\xad\xd9\xb5\xda\xad\xda\xb5\xd9'\
-b'\xb5\xf9\xad\xda\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xda\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xad\xda\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xda\xa5\xba'\
-b'\xa5\x99\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x95\x99\x9d\x9a\x9d\x99'\
-b'\xa5\xb9\xad\xda\xad\xda\xad\xda\xa5\xba\xa5\xb9\xad\xba\xa5\xd9'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xa5\x9a\xa5\xba\xa5\x99\x9d\x9a\x9d\x9a'\
-b'\x7d\x3a\x6c\xfb\x75\x1a\x74\xfa\x64\xdb\x64\xda\x64\xda\x5c\xda'\
-b'\x64\xdb\x5c\xbb\x54\xba\x4c\x9a\x44\x7b\x34\x3b\x34\x3a\x2c\x1a'\
-b'\x2c\x1b\x24\x1b\x23\xfb\x1b\xdb\x13\xbb\x13\xbb\x13\xbb\x13\x9b'\
-b'\x0b\x9b\x0b\x9b\x13\x7a\x1b\x79\x1b\x79\x23\x58\x2b\x16\x33\x15'\
-b'\x43\xb7\x5c\xba\x6c\xfa\x64\xda\x64\xdb\x64\xda\x64\xda\x64\xda'\
-b'\x64\xda\x64\xda\x64\xda\x75\x1a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x6c\xfa\x6c\xfa\x7d\x3a\x7d\x3a\x5c\xba\x54\x9a\x64\xdb'\
-b'\x44\x7b\x3c\x3a\x34\x1b\x23\xfb\x23\xfb\x44\x7b\x54\xba\x64\xdb'\
-b'\x6c\xda\x5c\xba\x64\xda\x6c\xfa\x6c\xfa\x75\x1b\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x7d\x1a\x64\xfb\x53\x74\x5a\xf1\x6c\xda\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x5a\x7d\x3a\x7d\x1a\x64\xfa\x53\x54\x4a\xf2'\
-b'\x13\x9a\x0b\x9b\x23\xdb\x44\x5b\x6c\xfa\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x7d\x3a\x6c\xfb\x4b\xf8\x62\x6f\x4b\x96\x6c\xfa\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a'\
-b'\x75\x1a\x64\xdb\x43\xb7\x4a\xd2\x4c\x39\x6c\xfa\x74\xfa\x74\xfb'\
-b'\x75\x1a\x6c\xfa\x5c\xba\x4b\x75\x4a\xf3\x54\x9a\x74\xfa\x7d\x1a'\
-b'\x7d\x3a\x7d\x3a\x85\x3b\x85\x3a\x85\x3a\x7d\x3a\x85\x5a\x85\x3a'\
-b'\x75\x3a\x54\x18\x62\x6f\x53\xd7\x75\x1a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x64\xdb\x44\x7a\x34\x1a\x2c\x1b\x34\x3a\x3c\x5b\x53\x33\x53\x33'\
-b'\x64\xfa\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x74\xfa\x52\xf1\x53\x34\x75\x1a\x85\x5a\x85\x5a\x8d\x3a\x85\x5a'\
-b'\x85\x5a\x8d\x5a\x85\x3a\x6c\xfb\x54\xbb\x44\x7a\x4c\x7b\x4c\x7b'\
-b'\x54\x9b\x5c\xda\x6c\xfa\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x6c\xda'\
-b'\x75\x1a\x8d\x7a\x8d\x5a\x7d\x3a\x85\x5a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x9d\x9a\x9d\x9a\x85\x5a\x4c\x7a\x34\x3b\x4c\x3a\x23\x79\x44\x3a'\
-b'\x5c\xbb\x54\x99\x3b\x77\x53\x34\x72\x4c\x5a\xd1\x62\xb0\x5b\x53'\
-b'\x7d\x1a\x95\x7a\x9d\x9a\x9d\x9a\x95\x9a\x9d\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\xa5\x9a\xa5\x99\x9d\xba\xa5\x99\xa5\xba\x9d\xb9'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xd9\xad\xda\xa5\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\xb5\xd9\xad\xf9\xad\xd9\xb5\xd9'\
-b'\xad\xda\xb5\xf9\xb5\xfa\xad\xd9\xb5\xf9\xb5\xf9\xad\xd9\xb5\xfa'\
-b'\xad\xd9\xb5\xf9\xb5\xfa\xad\xd9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9'\
-b'\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\xb5\xda\xad\xfa\xad\xda\xad\xda\xa5\xb9\xa5\xb9\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\x9d\x99\x9d\x9a\x9d\xb9\xa5\xba\xa5\xba\xa5\xba'\
-b'\xad\xda\xad\xf9\xad\xda\xad\xb9\xad\xd9\xad\xda\xa5\xd9\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\x9a\xa5\xba'\
-b'\xa5\xb9\xa5\x9a\xa5\xba\xa5\xb9\x9d\xba\x9d\xba\x9d\x99\x9d\x7a'\
-b'\x7d\x3a\x6c\xfa\x75\x1a\x6c\xfa\x64\xba\x54\x9a\x5c\xbb\x64\xda'\
-b'\x5c\xda\x64\xda\x64\xdb\x54\x9a\x4c\x7a\x34\x3b\x2c\x1b\x2c\x1b'\
-b'\x2c\x1b\x23\xfb\x23\xfb\x13\xdb\x13\xbb\x13\x9c\x13\xbb\x13\xbb'\
-b'\x0b\xbb\x0b\x9b\x13\x7a\x13\x79\x1b\x59\x23\x58\x2b\x36\x33\x15'\
-b'\x3a\xf4\x43\x76\x5c\xba\x6c\xfa\x64\xda\x64\xdb\x64\xda\x64\xda'\
-b'\x64\xdb\x64\xbb\x64\xda\x75\x1a\x85\x5a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x6c\xfb\x6c\xfa\x85\x3a\x7d\x3a\x5c\xba\x54\x9b\x64\xda'\
-b'\x4c\x7a\x3c\x3b\x34\x3b\x2b\xfb\x23\xda\x44\x7b\x5c\xbb\x64\xda'\
-b'\x64\xfa\x5c\x59\x5b\xf6\x64\xba\x6c\xda\x75\x1a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x1a\x64\xda\x53\x13\x53\x13\x6c\xfa\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x85\x39\x7d\x3a\x7d\x1a\x64\xdb\x4b\x54\x52\xf2'\
-b'\x13\x9a\x0b\x7a\x13\xbb\x3c\x3b\x64\xda\x7d\x3a\x7d\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x6d\x1a\x4c\x39\x5a\x8f\x53\x34\x64\xdb\x7d\x1a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x1a'\
-b'\x7d\x1a\x6c\xfa\x4c\x39\x4a\xd2\x4b\x76\x5c\xdb\x6c\xfa\x74\xfa'\
-b'\x6c\xfb\x6c\xfa\x54\x7a\x4a\xf3\x43\x76\x64\xba\x75\x1a\x75\x1a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x7d\x5a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x6c\xfb\x4b\x95\x5a\x8f\x54\x38\x75\x1a\x85\x3a\x85\x5a\x7d\x1b'\
-b'\x5c\xba\x3c\x5b\x2c\x1b\x2c\x1b\x34\x3b\x3c\x5b\x4b\x13\x53\x33'\
-b'\x64\xda\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x74\xfa\x4b\x13\x52\xf2\x64\xda\x85\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x8d\x5a\x85\x3a\x6c\xfa\x63\xf6\x4b\xf7\x44\x5b\x44\x7a\x54\x9a'\
-b'\x5c\xbb\x6c\xfa\x74\xfa\x7d\x1a\x75\x1a\x64\xda\x7d\x1a\x6c\xfa'\
-b'\x74\xfa\x8d\x5a\x8d\x7a\x7d\x1a\x85\x3a\x95\x7a\x8d\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79\x95\x7a'\
-b'\x95\x9a\x95\x99\x85\x5a\x4c\x7a\x2c\x1b\x4c\x5a\x33\xb9\x44\x5a'\
-b'\x5c\xba\x5c\x9a\x43\x96\x4b\x34\x72\x4c\x62\xf1\x5a\xd0\x5b\x53'\
-b'\x75\x1a\x9d\x7a\x95\x79\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99'\
-b'\x9d\x99\xa5\xba\x9d\xba\xa5\xba\xa5\x9a\xa5\xba\xa5\xba\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xad\xd9\xad\xba\xad\xd9'\
-b'\xad\xb9\xad\xda\xad\xda\xad\xd9\xb5\xda\xad\xfa\xad\xda\xb5\xd9'\
-b'\xb5\xf9\xad\xd9\xb5\xda\xb5\xda\xb5\xd9\xad\xf9\xb5\xda\xb5\xd9'\
-b'\xb5\xf9\xb5\xda\xad\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9'\
-b'\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xad\xda\xad\xda\xa5\xba\xa5\x9a\x9d\x9a\x9d\xba\xa5\x99\x9d\x9a'\
-b'\x9d\x99\xa5\x9a\xa5\xba\xa5\xba\xa5\xda\xa5\xb9\xa5\xba\xa5\xb9'\
-b'\xad\xd9\xad\xda\xa5\xd9\xa5\xba\xa5\xba\xa5\xda\xa5\xb9\xad\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\x9d\xba\xa5\x9a\x9d\x9a\xa5\x9a\xa5\xba\x9d\x99\x95\x9a'\
-b'\x7d\x1a\x6c\xfa\x7d\x1a\x6c\xdb\x54\x9b\x4c\x7b\x4c\x9a\x54\x9b'\
-b'\x64\xdb\x5c\xba\x5c\xba\x5c\xbb\x4c\x7b\x3c\x3b\x2c\x1a\x2c\x1b'\
-b'\x2c\x1b\x23\xfb\x1b\xdb\x1b\xbb\x13\xbb\x13\xbb\x13\xbb\x0b\x9b'\
-b'\x13\xbc\x0b\x9b\x13\x7a\x13\x79\x1b\x79\x23\x58\x2b\x36\x33\x16'\
-b'\x32\xf4\x33\x15\x33\x78\x54\x7a\x6c\xda\x6c\xfa\x6c\xda\x64\xda'\
-b'\x64\xda\x64\xba\x64\xda\x7d\x3a\x85\x3a\x85\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x6c\xfa\x6c\xfa\x85\x3a\x7d\x3a\x5c\xbb\x54\x9a\x64\xda'\
-b'\x4c\x7b\x3c\x5a\x3c\x5b\x23\xfb\x1b\xdb\x44\x7a\x54\x9a\x5c\xbb'\
-b'\x64\xdb\x5b\xd6\x5a\xd1\x5c\x79\x74\xfa\x75\x1b\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x75\x1b\x54\x9a\x52\xd1\x53\x54\x64\xfa\x7d\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x5c\xdb\x53\x34\x4a\xf2'\
-b'\x13\xbb\x13\x7a\x13\x9a\x2c\x1b\x4c\x9a\x7d\x1a\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x75\x1a\x4c\x7a\x52\xd1\x52\xd1\x54\x9a\x7d\x1a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a'\
-b'\x75\x1a\x6c\xfa\x54\xbb\x43\x15\x4a\xf3\x54\x9a\x6c\xfa\x6c\xfa'\
-b'\x6c\xfa\x64\xdb\x4b\xf8\x4a\xb2\x43\xf9\x64\xda\x75\x1a\x7d\x1a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x7d\x3a\x7d\x3a'\
-b'\x64\xda\x53\x34\x5a\xb0\x54\x59\x7d\x3a\x85\x3a\x7d\x3a\x74\xfb'\
-b'\x54\x9a\x34\x3b\x23\xfb\x2c\x1b\x3c\x3a\x3c\x5b\x53\x13\x53\x33'\
-b'\x64\xda\x7d\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x74\xfa\x4b\x34\x52\xd1\x54\x7a\x85\x3a\x85\x5a\x8d\x3a\x85\x5a'\
-b'\x85\x3a\x7d\x3a\x64\xba\x5b\x12\x53\x54\x44\x5b\x44\x7a\x54\x9a'\
-b'\x64\xda\x6c\xfa\x75\x1a\x75\x1a\x75\x1b\x5c\xba\x64\xfb\x6c\xda'\
-b'\x75\x1a\x8d\x7a\x8d\x5a\x7d\x3a\x85\x5a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x9d\x7a\x95\x7a'\
-b'\x95\x7a\x9d\x7a\x85\x5a\x5c\x9b\x44\x3a\x54\x7a\x4c\x39\x64\xda'\
-b'\x64\xda\x64\xba\x4b\xb7\x53\x75\x6a\x8f\x5b\x33\x5b\x11\x63\x74'\
-b'\x7d\x3a\x95\x9a\x9d\x7a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a'\
-b'\xa5\xba\xa5\xba\xa5\xba\x9d\x9a\xa5\xb9\xa5\xba\xa5\xb9\xa5\xb9'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xad\xda\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xb5\xd9\xb5\xd9'\
-b'\xad\xda\xb5\xfa\xb5\xf9\xb5\xd9\xad\xf9\xb5\xf9\xb5\xd9\xb5\xf9'\
-b'\xb5\xda\xb5\xd9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xa5\xba\xa5\xba\xa5\xba\x9d\x99\xa5\xba\x9d\x9a\x9d\x99\xa5\xb9'\
-b'\xa5\xda\xad\xda\xa5\xd9\xa5\xda\xa5\xb9\xa5\xba\xa5\xba\xa5\xd9'\
-b'\xad\xda\xad\xda\xa5\xd9\xad\xd9\xad\xba\xa5\xb9\xa5\xba\xad\xd9'\
-b'\xa5\xba\xa5\xba\xa5\xba\xa5\xba\xa5\xba\xa5\xba\xa5\x99\xa5\xba'\
-b'\xa5\x9a\x9d\x99\x9d\x99\xa5\xb9\x9d\x9a\x9d\x99\x9d\x9a\x9d\x7a'\
-b'\x7d\x1a\x6c\xfa\x75\x1a\x6c\xda\x54\x9a\x44\x7a\x44\x5b\x44\x5a'\
-b'\x4c\x9b\x5c\xbb\x5c\xba\x54\x9a\x4c\x9a\x44\x5b\x34\x3b\x2c\x1b'\
-b'\x2c\x1a\x23\xfb\x1b\xdb\x13\xbb\x13\xbb\x13\xbb\x13\xbb\x13\xbb'\
-b'\x0b\x9b\x0b\x9b\x13\x7a\x13\x79\x13\x79\x1b\x59\x23\x37\x2b\x36'\
-b'\x33\x16\x2b\x36\x2b\x37\x2b\x77\x4c\x7a\x6c\xda\x6c\xfb\x6c\xfb'\
-b'\x64\xda\x5c\xba\x6c\xfa\x7d\x1a\x85\x5a\x85\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x6c\xfa\x7d\x1a\x85\x3a\x7d\x3a\x5c\xba\x5c\xba\x5c\xda'\
-b'\x4c\x7b\x44\x7b\x3c\x3a\x2c\x1b\x2c\x1a\x44\x5b\x54\x9a\x5c\xba'\
-b'\x64\xdb\x5b\x74\x53\x95\x6c\xfa\x75\x1b\x7d\x1a\x7d\x3a\x7d\x1a'\
-b'\x75\x1a\x6c\xfa\x4c\x3a\x5a\xb0\x53\x96\x6c\xfb\x7d\x3a\x85\x3a'\
-b'\x85\x3a\x7d\x3a\x85\x3a\x7d\x3a\x75\x1a\x5c\xda\x53\x34\x52\xd2'\
-b'\x13\xba\x13\x9a\x0b\x9a\x23\xfb\x44\x5b\x74\xfa\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x1a\x54\x9b\x4a\xf3\x5a\x90\x4c\x39\x75\x1a'\
-b'\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x3a\x85\x3a\x7d\x1a\x7d\x1a'\
-b'\x7d\x1a\x74\xfa\x64\xdb\x3b\xb7\x4a\xb1\x4b\xf8\x64\xdb\x6c\xda'\
-b'\x64\xda\x5c\x9b\x43\x55\x42\xf3\x4c\x5a\x6c\xfa\x75\x1a\x7d\x1a'\
-b'\x7d\x3a\x7d\x3b\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x5c\x9a\x5a\xd1\x5a\xd1\x5c\x9a\x7d\x3b\x85\x3a\x7d\x3a\x64\xdb'\
-b'\x4c\x7b\x2c\x1a\x24\x1b\x34\x1b\x3c\x3b\x44\x5a\x52\xf2\x53\x33'\
-b'\x64\xba\x75\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x75\x1b\x43\x55\x5a\x90\x4c\x39\x7d\x3a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x85\x5a\x7d\x1a\x64\xda\x4b\xd7\x4b\x14\x3c\x3a\x4c\x7a\x5c\xbb'\
-b'\x6c\xdb\x74\xfa\x74\xfa\x6c\xfb\x5c\xbb\x44\x5a\x54\x9b\x5c\xda'\
-b'\x6c\xfa\x8d\x5a\x95\x7a\x85\x5a\x85\x5a\x95\x7a\x95\x7a\x95\x5a'\
-b'\x95\x7a\x95\x7a\x95\x79\x95\x7a\x95\x7a\x9d\x79\x95\x9a\x95\x7a'\
-b'\x95\x79\x95\x7a\x8d\x7a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x8d\x7a\x8d\x39\x85\x3a\x8c\xf8\x85\x19\x8d\x19\x8d\x19'\
-b'\x95\x7a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\xa5\xba'\
-b'\x9d\x99\xa5\x9a\x9d\xba\xa5\xba\xa5\xba\xa5\x99\xa5\xba\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xad\xba\xa5\xd9\xa5\xda\xad\xb9\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xd9\xb5\xda\xad\xfa\xad\xd9\xb5\xfa'\
-b'\xb5\xd9\xad\xda\xb5\xf9\xad\xd9\xb5\xda\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xd9\xad\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xa5\xba\xa5\xba\x9d\xba\xa5\x9a\x9d\x99\x9d\xba\xa5\x9a\xa5\xba'\
-b'\xa5\xba\xad\xda\xad\xda\xad\xb9\xa5\xd9\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xad\xda\xa5\xda\xad\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xba'\
-b'\x9d\xba\x9d\xba\x9d\x9a\xa5\x9a\x9d\x9a\x9d\x9a\x9d\xb9\x95\x9a'\
-b'\x75\x1a\x6c\xfa\x75\x1a\x6c\xfb\x4c\x9a\x44\x7b\x4c\x5b\x44\x7b'\
-b'\x44\x5a\x4c\x7b\x54\x9a\x54\xbb\x54\x9a\x4c\x9a\x44\x7b\x34\x3b'\
-b'\x2b\xfb\x23\xfb\x1b\xdb\x13\xbb\x13\xbb\x13\xbb\x13\xbb\x13\xbb'\
-b'\x0b\x9c\x0b\x9b\x13\x7a\x13\x79\x13\x79\x1b\x59\x2b\x37\x2b\x36'\
-b'\x2b\x37\x23\x37\x23\x37\x23\x58\x1b\x9a\x44\x5b\x6c\xfa\x74\xfa'\
-b'\x6c\xfa\x6c\xfb\x6c\xfa\x7d\x1a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x64\xda\x6c\xfa\x85\x5a\x7d\x3a\x5c\xbb\x5c\xbb\x54\x79'\
-b'\x53\x75\x43\xf9\x3c\x5b\x3c\x3a\x34\x3b\x3c\x5a\x4c\x7b\x54\xbb'\
-b'\x5c\x9a\x53\x12\x5c\x38\x6d\x1a\x75\x1a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x1a\x6c\xfb\x4b\xf8\x5a\x8f\x4b\xb7\x6c\xfa\x7d\x3a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x75\x1a\x5c\xbb\x4b\x54\x52\xf2'\
-b'\x1b\xbb\x13\x7a\x13\x9a\x1b\xbb\x3c\x5b\x6c\xfa\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x1b\x5c\xba\x4b\x55\x62\x6f\x43\xd7\x6d\x1a'\
-b'\x7d\x1a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x1a'\
-b'\x7d\x1a\x75\x1a\x6c\xfb\x44\x3a\x42\xd3\x43\x75\x54\xba\x64\xdb'\
-b'\x64\xbb\x4c\x7a\x4a\xf2\x3b\x55\x54\x9a\x6c\xfb\x75\x1a\x7d\x1a'\
-b'\x7d\x1a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x54\x79\x5a\xb0\x53\x13\x5c\xba\x7d\x3a\x7d\x3a\x75\x1a\x64\xda'\
-b'\x44\x5b\x2c\x1b\x24\x1a\x34\x3b\x3c\x5b\x4c\x7a\x52\xf2\x53\x34'\
-b'\x5c\xdb\x75\x1a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x6d\x1a\x43\x76\x5a\x8f\x43\xf9\x7d\x3a\x85\x5a\x8d\x5a\x85\x3a'\
-b'\x85\x3a\x74\xfa\x54\xba\x3c\x19\x4a\xf3\x43\xf9\x4c\x9b\x64\xda'\
-b'\x6c\xfa\x75\x1a\x75\x1a\x5c\xba\x43\x76\x4a\xd2\x4c\x59\x54\xbb'\
-b'\x64\xda\x8d\x5a\x8d\x7a\x85\x3a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x79\x95\x7a\x95\x7a\x95\x7a\x95\x79\x95\x7a\x95\x7a\x9d\x7a'\
-b'\x95\x7a\x9d\x9a\x95\x7a\x95\x5a\x95\x7a\x95\x7a\x95\x7a\x95\x79'\
-b'\x8d\x7a\x9d\x9a\x9d\x9a\x9d\x9a\x95\x9a\x9d\x9a\x95\x99\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\xa5\xba\x9d\xba'\
-b'\xa5\x9a\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xad\xd9\xa5\xba\xad\xba\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xb5\xd9\xad\xd9\xad\xda\xad\xd9'\
-b'\xb5\xda\xb5\xf9\xad\xda\xb5\xd9\xb5\xf9\xad\xf9\xb5\xd9\xb5\xf9'\
-b'\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xda\xb5\xd9\xb5\xda'\
-b'\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xa5\xba\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99\xa5\x9a\xa5\xba'\
-b'\xa5\xd9\xad\xda\xa5\xb9\xa5\xba\xad\xda\xa5\xba\xa5\xb9\xa5\xb9'\
-b'\xad\xda\xad\xd9\xa5\xb9\xa5\xba\xa5\xb9\xad\xda\xa5\xda\xad\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\x99\xa5\xba\xa5\x99'\
-b'\xa5\x9a\xa5\xb9\x9d\x99\x9d\x9a\xa5\xb9\x9d\x9a\x9d\x9a\x9d\x7a'\
-b'\x7d\x1a\x6c\xfb\x75\x1a\x64\xda\x54\x7a\x44\x5b\x44\x5b\x44\x5a'\
-b'\x44\x5b\x44\x5b\x44\x7b\x4c\x9a\x54\x9b\x4c\x9b\x44\x7a\x3c\x3b'\
-b'\x34\x1a\x23\xfb\x1b\xdb\x13\xbb\x13\xbb\x13\xbb\x13\xbb\x13\xbb'\
-b'\x0b\x9b\x0b\x9b\x13\x7a\x13\x79\x13\x79\x1b\x79\x23\x37\x2b\x37'\
-b'\x2b\x37\x23\x37\x23\x38\x1b\x59\x13\x9a\x1b\xdb\x54\x9b\x6c\xfa'\
-b'\x74\xfb\x6c\xfa\x6c\xfa\x7d\x3a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x8d\x3a\x8d\x5a\x85\x5a'\
-b'\x85\x3a\x75\x1a\x6c\xfb\x85\x3a\x85\x3a\x5c\xba\x54\xba\x54\x18'\
-b'\x5a\x90\x4b\xb7\x44\x9a\x44\x5a\x34\x3b\x34\x3b\x3c\x5b\x4c\x7a'\
-b'\x4c\x18\x52\xf2\x6c\xb9\x75\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x1a'\
-b'\x7d\x1b\x64\xda\x43\xb7\x5a\x8f\x4b\xf8\x6c\xfa\x85\x3a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1a\x6c\xfa\x54\x9a\x4b\x34\x5a\xd1'\
-b'\x1b\xdb\x0b\x9b\x13\x7a\x13\xba\x34\x3b\x64\xfa\x7d\x3a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x1a\x64\xdb\x4b\xb7\x62\x6e\x4b\x75\x64\xfb'\
-b'\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a'\
-b'\x75\x1a\x75\x1a\x6c\xfa\x4c\x9a\x3b\x15\x4a\xd2\x44\x3a\x5c\xba'\
-b'\x54\xbb\x43\xd8\x4a\xb2\x3b\xd8\x5c\xdb\x74\xfa\x75\x1a\x7d\x1a'\
-b'\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a\x7d\x3a\x75\x1a'\
-b'\x54\x38\x62\x6e\x4b\x54\x64\xdb\x7d\x3a\x7d\x3a\x74\xfa\x5c\xba'\
-b'\x3c\x3b\x24\x1b\x2c\x1b\x34\x3b\x44\x5b\x4c\x7a\x52\xf2\x4b\x34'\
-b'\x5c\xba\x75\x1a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a'\
-b'\x6d\x1a\x3b\x97\x5a\x8f\x3b\x98\x6c\xfb\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x7d\x3a\x64\xdb\x54\x9b\x34\x3a\x43\x14\x4b\xb7\x54\x9b\x64\xda'\
-b'\x75\x1a\x75\x1a\x75\x1a\x5c\xbb\x53\x55\x62\x6f\x54\x38\x54\x9b'\
-b'\x64\xda\x95\x7a\x95\x5a\x7d\x3a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x79\x95\x7a\x95\x7a\x9d\x7a\x95\x9a\x9d\x79\x95\x9a'\
-b'\x95\x7a\x95\x9a\x95\x7a\x95\x7a\x95\x7a\x95\x79\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x79\x9d\x9a\x9d\x9a\x9d\x79\x9d\x9a\x9d\x9a\x9d\x79'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\xa5\xb9\xa5\x9a'\
-b'\x9d\xba\xa5\x99\xa5\xba\xa5\x9a\x9d\xba\xa5\x99\xa5\xba\xa5\xba'\
-b'\xa5\xba\xa5\xd9\xad\xba\xa5\xda\xad\xd9\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\xb5\xfa\xad\xda\xb5\xf9\xad\xf9'\
-b'\xb5\xd9\xad\xfa\xb5\xd9\xad\xd9\xb5\xfa\xb5\xda\xad\xda\xb5\xf9'\
-b'\xb5\xd9\xb5\xda\xad\xfa\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\xa5\xba'\
-b'\xa5\xba\xad\xd9\xad\xda\xad\xb9\xa5\xb9\xa5\xba\xa5\xba\xa5\xba'\
-b'\xad\xda\xa5\xda\xad\xda\xa5\xb9\xa5\xba\xa5\xb9\xa5\xda\xa5\xba'\
-b'\xad\xb9\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\x9a\xa5\xba'\
-b'\x9d\xb9\xa5\x9a\xa5\xba\x9d\xba\xa5\x9a\x9d\x9a\x8d\x5a\x7d\x3a'\
-b'\x75\x1a\x74\xfa\x75\x1a\x64\xdb\x4c\x9a\x4c\x7b\x44\x7b\x44\x7b'\
-b'\x44\x5a\x44\x5a\x44\x5a\x44\x7b\x4c\x7b\x4c\x9b\x4c\x7a\x3c\x3b'\
-b'\x2c\x1b\x2c\x1b\x23\xfb\x13\xdb\x13\xbb\x13\xbb\x13\xbb\x0b\xbb'\
-b'\x0b\x9b\x13\x9b\x13\x7a\x13\x79\x13\x79\x1b\x59\x23\x37\x2b\x37'\
-b'\x2b\x37\x23\x58\x1b\x58\x13\x7a\x13\xbb\x23\xfb\x34\x3b\x5c\xba'\
-b'\x6c\xfb\x6c\xfa\x6c\xfa\x7d\x1a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x75\x1a\x6c\xda\x85\x3a\x7d\x3a\x5c\xba\x54\xbb\x63\xb5'\
-b'\x53\x33\x54\x9a\x54\xbb\x4c\x7b\x3c\x3b\x34\x1b\x34\x1b\x3c\x3b'\
-b'\x4b\x95\x5b\x54\x6c\xdb\x75\x1a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1b'\
-b'\x75\x1a\x5c\xbb\x43\x75\x5a\x8f\x4c\x19\x75\x1b\x7d\x3a\x7d\x3a'\
-b'\x7d\x1a\x7d\x1a\x7d\x1a\x75\x1a\x6c\xda\x54\x9b\x4b\x34\x5a\xd1'\
-b'\x2b\xdb\x0b\x9b\x13\x7a\x13\x9a\x2c\x1b\x54\x9a\x7d\x1a\x7d\x1a'\
-b'\x7d\x1a\x7d\x1a\x75\x1a\x64\xfb\x43\xf8\x62\x6f\x4a\xf3\x54\x9a'\
-b'\x75\x1a\x75\x1a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x1a'\
-b'\x75\x1b\x75\x1a\x74\xfb\x5c\xbb\x33\x98\x4a\xb2\x43\xb7\x4c\x9b'\
-b'\x4c\x7a\x43\x55\x3a\xd4\x3c\x1a\x64\xda\x74\xfa\x75\x1a\x7d\x1a'\
-b'\x7d\x1b\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x6c\xfb'\
-b'\x4b\xb6\x62\x6e\x4b\x96\x64\xda\x75\x1a\x7d\x1a\x6c\xda\x4c\x9b'\
-b'\x2c\x1b\x23\xfb\x2c\x1a\x3c\x3b\x4c\x7b\x4c\x7a\x52\xd2\x4b\x34'\
-b'\x5c\xba\x75\x1a\x7d\x1b\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x6c\xfb\x33\xb8\x5a\x8f\x3b\x56\x5c\xdb\x85\x5a\x8d\x5a\x85\x3a'\
-b'\x6c\xfa\x5c\xba\x4c\x7b\x34\x3b\x3b\x55\x4b\x55\x54\x9b\x6c\xfa'\
-b'\x7d\x1b\x75\x1a\x75\x1a\x6c\xda\x4c\x5a\x4a\xf2\x64\x17\x5c\xba'\
-b'\x6c\xda\x8d\x7a\x95\x7a\x85\x3a\x8d\x5a\x95\x7a\x95\x9a\x9d\x7a'\
-b'\x95\x7a\x95\x7a\x95\x9a\x9d\x79\x95\x7a\x9d\x9a\x95\x79\x9d\x7a'\
-b'\x95\x79\x9d\x9a\x95\x79\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x9d\x9a\x9d\x7a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x9d\xba\xa5\xba\x9d\xba\xa5\x9a\xa5\xba'\
-b'\xa5\x9a\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xb9\xa5\xb9\xa5\xda\xad\xb9\xa5\xba\xa5\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xb5\xd9\xad\xd9\xb5\xfa\xad\xda\xb5\xd9'\
-b'\xad\xda\xb5\xd9\xad\xf9\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xd9\xad\xfa\xb5\xd9\xb5\xd9\xb5\xfa\xad\xd9\xb5\xd9\xb5\xfa'\
-b'\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\xa5\xb9'\
-b'\xa5\xda\xad\xda\xad\xda\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9'\
-b'\xad\xda\xad\xd9\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xba\xa5\x9a\xa5\xb9\xa5\xba'\
-b'\x9d\xba\x9d\xb9\xa5\x9a\x95\x9a\x8d\x5a\x75\x1a\x6c\xfa\x64\xda'\
-b'\x64\xda\x64\xfa\x7d\x1a\x64\xdb\x5c\xba\x54\x9a\x54\x9a\x54\x9b'\
-b'\x54\x9a\x54\x9b\x4c\x7a\x4c\x7a\x4c\x7a\x4c\x7a\x4c\x9b\x44\x7a'\
-b'\x2c\x1a\x2b\xfa\x23\xfb\x23\xdb\x13\xbb\x13\xbb\x13\xbc\x0b\x9b'\
-b'\x0b\x9b\x13\x9b\x13\x9a\x13\x7a\x13\x79\x1b\x58\x23\x38\x23\x37'\
-b'\x23\x37\x1b\x58\x1b\x59\x13\x7a\x13\xbb\x23\xfb\x3c\x3b\x54\x9a'\
-b'\x64\xda\x6c\xfb\x6c\xfa\x7d\x3a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x74\xfa\x6c\xfa\x85\x5a\x7d\x3a\x64\xda\x5c\xba\x5b\x95'\
-b'\x53\xd7\x64\xda\x5c\xda\x54\x9b\x3c\x5a\x2c\x1a\x24\x1b\x2c\x1b'\
-b'\x4b\x12\x53\xd6\x6c\xfb\x75\x1a\x7d\x1a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x6c\xfa\x54\x9b\x4b\x14\x5a\xb0\x4c\x39\x75\x1a\x7d\x1a\x7d\x3a'\
-b'\x7d\x1a\x75\x1a\x74\xfa\x6c\xfb\x64\xda\x4c\x9b\x4b\x13\x5a\xf1'\
-b'\x2b\xfa\x13\xbb\x13\x7a\x13\x7a\x23\xfa\x4c\x9a\x74\xfa\x7d\x1a'\
-b'\x7d\x3a\x7d\x1a\x75\x1a\x6c\xfb\x44\x19\x5a\x90\x52\xb1\x54\x5a'\
-b'\x75\x1a\x75\x1a\x75\x1a\x7d\x1b\x7d\x1a\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x6c\xfa\x5c\xdb\x3c\x1a\x4a\xd2\x43\x14\x44\x5b'\
-b'\x3c\x3a\x4a\xf3\x33\x36\x4c\x7b\x64\xda\x6c\xfa\x75\x1a\x75\x1a'\
-b'\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x64\xdb'\
-b'\x4b\x54\x62\x6f\x4b\xf8\x6c\xfb\x75\x1a\x75\x1a\x64\xda\x44\x5b'\
-b'\x23\xfb\x1b\xfb\x2c\x1b\x3c\x5a\x54\x9b\x4c\x59\x52\xd1\x4b\x34'\
-b'\x54\xbb\x74\xfa\x75\x1a\x75\x1b\x75\x1a\x75\x1a\x75\x1a\x7d\x1a'\
-b'\x6c\xfa\x3b\xb9\x5a\x90\x3b\x35\x54\x9a\x7d\x3a\x85\x5a\x7d\x1a'\
-b'\x64\xdb\x54\x9a\x3c\x5b\x34\x3b\x3b\xb8\x4a\xf3\x54\x7a\x75\x1a'\
-b'\x7d\x1a\x7d\x3a\x75\x1a\x6d\x1b\x64\xdb\x53\x96\x5b\xf6\x64\xda'\
-b'\x75\x1a\x95\x7a\x95\x7a\x8d\x5a\x8d\x5a\x95\x7a\x9d\x9a\x95\x9a'\
-b'\x9d\x79\x9d\x9a\x9d\x9a\x9d\x9a\x95\x9a\x9d\x79\x95\x9a\x9d\x9a'\
-b'\x95\x7a\x95\x9a\x95\x7a\x95\x79\x95\x7a\x95\x7a\x9d\x99\x95\x7a'\
-b'\x95\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\x9a\x9d\xba\xa5\xba\xa5\x99\x9d\x99\xa5\xba\xa5\x9a\x9d\xb9'\
-b'\xa5\x9a\xa5\xba\x9d\xba\xa5\x99\xa5\xba\xa5\xb9\xa5\xba\xa5\xba'\
-b'\xa5\xba\xad\xba\xa5\xb9\xad\xda\xad\xda\xad\xda\xad\xb9\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\xb5\xfa\xad\xd9\xb5\xf9\xad\xfa'\
-b'\xb5\xd9\xb5\xda\xb5\xf9\xad\xda\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xd9'\
-b'\xad\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa'\
-b'\x9d\x9a\x9d\x9a\x9d\x7a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x99\xa5\xba'\
-b'\xad\xda\xad\xda\xad\xb9\xa5\xda\xa5\xd9\xa5\xba\xa5\xba\xa5\xba'\
-b'\xa5\xba\xad\xba\xa5\xd9\xad\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xb9'\
-b'\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\x9d\x9a'\
-b'\x9d\x9a\x8d\x7a\x85\x3a\x74\xfa\x6c\xda\x64\xda\x6c\xfa\x6c\xfa'\
-b'\x75\x1a\x74\xfa\x74\xfb\x64\xda\x64\xfa\x64\xda\x64\xfb\x64\xda'\
-b'\x64\xda\x5c\xda\x5c\xbb\x5c\xda\x5c\xbb\x54\xba\x54\x9a\x54\x9b'\
-b'\x34\x3b\x2c\x1b\x23\xfb\x23\xfb\x23\xfb\x1b\xdb\x13\xbb\x0b\x9b'\
-b'\x0b\x9b\x0b\x9b\x13\x7a\x13\x79\x13\x7a\x23\x58\x23\x57\x23\x37'\
-b'\x23\x58\x1b\x58\x13\x79\x13\x9b\x1b\xdb\x2c\x1b\x3c\x5b\x54\x9a'\
-b'\x54\xba\x54\x9b\x64\xda\x7d\x3a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x7a'\
-b'\x8d\x7a\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x6c\xfa\x75\x1a\x85\x5a\x7d\x3a\x54\x9b\x64\xda\x53\xf7'\
-b'\x54\x79\x64\xfa\x64\xda\x5c\xbb\x4c\x7b\x34\x1b\x23\xdb\x2b\xb9'\
-b'\x52\xd1\x54\x39\x64\xfa\x75\x1a\x75\x1a\x7d\x1b\x7d\x1a\x75\x1a'\
-b'\x6c\xfb\x4c\x7a\x52\xd2\x52\xd1\x4c\x7a\x75\x1a\x7d\x3a\x7d\x1b'\
-b'\x75\x1a\x74\xfa\x6c\xfa\x64\xdb\x5c\xba\x44\x7b\x4b\x13\x52\xd1'\
-b'\x3c\x1a\x13\xbb\x13\x7a\x13\x7a\x1b\xbb\x3c\x5b\x6c\xfa\x7d\x1a'\
-b'\x75\x1a\x75\x1a\x6d\x1a\x64\xfa\x44\x3a\x52\xf1\x5a\x8f\x4c\x18'\
-b'\x64\xfa\x6c\xfb\x75\x1a\x75\x1a\x75\x1b\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x7d\x1a\x74\xfa\x6c\xfa\x64\xda\x44\x5b\x3b\x35\x4a\xd2\x33\xda'\
-b'\x3b\xb8\x4a\xd2\x2b\x98\x4c\x9b\x64\xda\x6c\xfa\x75\x1a\x75\x1a'\
-b'\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x1a\x75\x1a\x5c\x9a'\
-b'\x53\x12\x5a\x6f\x4c\x19\x6c\xfa\x6c\xfa\x6c\xfa\x5c\xba\x3c\x3b'\
-b'\x1b\xdb\x23\xdb\x34\x1b\x4c\x5a\x5c\xbb\x4c\x5a\x52\xd1\x4b\x34'\
-b'\x54\xba\x6c\xfa\x6c\xfa\x6c\xfa\x64\xda\x6c\xda\x6c\xfb\x74\xfa'\
-b'\x6c\xfa\x33\xfa\x52\x90\x42\xf3\x44\x5b\x7d\x1a\x85\x3a\x6c\xfa'\
-b'\x5c\xba\x4c\x7b\x3c\x3b\x3c\x3b\x3c\x19\x4a\xf2\x4c\x18\x64\xdb'\
-b'\x74\xfa\x75\x1a\x75\x1a\x75\x1a\x6d\x1a\x54\x39\x5c\x37\x6c\xfa'\
-b'\x6c\xda\x95\x7a\x95\x9a\x8d\x5a\x8d\x5a\x95\x9a\x9d\x79\x9d\x9a'\
-b'\x95\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\x95\x9a'\
-b'\x9d\x99\x9d\x7a\x95\x7a\x95\x7a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\x9d\xba\x9d\x9a\x9d\x9a\x9d\xba\x9d\x99\x9d\x9a'\
-b'\xa5\x99\x9d\xba\x9d\x9a\xa5\xba\xa5\x9a\xa5\xb9\xa5\x9a\xa5\x9a'\
-b'\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xda'\
-b'\xa5\xba\xa5\xd9\xad\xda\xa5\xb9\xa5\xba\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xba\xb5\xd9\xb5\xda\xad\xda\xb5\xf9\xad\xda\xb5\xd9'\
-b'\xad\xd9\xad\xf9\xb5\xf9\xb5\xd9\xad\xf9\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xd9'\
-b'\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\x9d\x7a\x95\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a\xa5\xba'\
-b'\xad\xda\xad\xd9\xa5\xda\xa5\xb9\xa5\xba\xa5\xb9\xa5\x9a\xa5\xb9'\
-b'\xa5\xba\xad\xd9\xa5\xda\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\x9d\x9a\x95\x7a\x85\x3a'\
-b'\x74\xfa\x6c\xfa\x64\xda\x6c\xda\x75\x1a\x75\x1a\x7d\x3a\x74\xfa'\
-b'\x6c\xda\x64\xda\x6c\xfa\x75\x1a\x75\x1b\x75\x1a\x75\x1a\x75\x1a'\
-b'\x74\xfb\x75\x1a\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfa\x64\xfb\x64\xda'\
-b'\x44\x5a\x2c\x1b\x2b\xfb\x2c\x1b\x23\xfb\x1b\xfb\x1b\xdb\x13\xbb'\
-b'\x0b\x9b\x0b\x9b\x13\x7a\x13\x7a\x13\x79\x1b\x58\x23\x38\x2b\x38'\
-b'\x1b\x58\x1b\x78\x13\x7a\x0b\x9b\x1b\xdb\x2c\x1b\x3c\x5a\x54\x9a'\
-b'\x5c\xbb\x44\x5a\x4c\x7a\x75\x1a\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x7a\x85\x59\x8d\x5a\x8d\x7a\x8d\x5a'\
-b'\x85\x5a\x6c\xda\x64\xba\x85\x5a\x85\x3a\x5c\xba\x5c\xba\x5c\x9a'\
-b'\x64\xdb\x6c\xfa\x6c\xfa\x64\xba\x4c\x9a\x34\x3b\x1b\xfb\x33\x56'\
-b'\x52\xf3\x4c\x7a\x5c\xbb\x64\xdb\x6c\xfb\x75\x1a\x75\x1a\x74\xfa'\
-b'\x64\xda\x44\x3a\x5a\xb0\x52\xf2\x54\x7a\x75\x1a\x7d\x1a\x75\x1a'\
-b'\x75\x1a\x6c\xfa\x64\xdb\x54\x9a\x44\x7b\x3c\x5b\x4b\x13\x52\xd1'\
-b'\x3c\x3a\x1b\xdb\x13\x9a\x1b\x79\x13\x9a\x34\x1b\x64\xda\x7d\x1a'\
-b'\x75\x1b\x74\xfa\x6c\xfa\x64\xdb\x44\x5b\x4b\x13\x62\x6f\x3b\x97'\
-b'\x5c\xbb\x6c\xfa\x74\xfa\x75\x1a\x7d\x1a\x75\x1a\x75\x1b\x75\x1a'\
-b'\x74\xfa\x74\xfa\x6c\xfb\x64\xda\x4c\x9b\x33\x98\x4a\xb2\x33\x56'\
-b'\x3b\x15\x42\xd3\x2b\xf9\x54\x9b\x64\xda\x6c\xfa\x74\xfb\x75\x1a'\
-b'\x75\x1a\x7d\x1b\x7d\x1b\x75\x1a\x7d\x1a\x75\x1a\x75\x1a\x54\x7a'\
-b'\x52\xb1\x5a\xb0\x3c\x1a\x54\xbb\x64\xda\x64\xda\x4c\x7b\x2c\x1b'\
-b'\x1b\xdb\x23\xdb\x34\x3b\x4c\x9a\x5c\xda\x4c\x5a\x52\xb1\x4b\x34'\
-b'\x54\x9b\x64\xda\x5c\xbb\x4c\x9b\x44\x7b\x4c\x7b\x5c\xba\x64\xfa'\
-b'\x6c\xfb\x33\xfa\x52\xb1\x4a\xd2\x3c\x3a\x75\x1b\x7d\x1a\x64\xdb'\
-b'\x54\x9b\x44\x5b\x3c\x3a\x34\x3b\x3c\x3a\x4b\x14\x3b\x76\x44\x7b'\
-b'\x5c\xbb\x6c\xfa\x75\x1a\x7d\x1a\x75\x1b\x64\xba\x64\xba\x64\xdb'\
-b'\x5c\xba\x95\x9a\x95\x7a\x85\x3a\x8d\x7a\x95\x7a\x95\x9a\x9d\x7a'\
-b'\x9d\x99\x9d\x7a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\x95\x99\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\xa5\x9a\x9d\xba\xa5\x99\xa5\x99\xa5\xba\x9d\x9a\xa5\xba'\
-b'\xa5\xba\x9d\x99\xa5\xba\x9d\x99\x9d\xb9\xa5\x9a\xa5\xba\xa5\xba'\
-b'\x9d\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xad\xb9'\
-b'\xa5\xb9\xad\xda\xad\xba\xa5\xd9\xad\xb9\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda\xb5\xd9\xad\xfa'\
-b'\xb5\xf9\xb5\xda\xb5\xd9\xb5\xfa\xb5\xd9\xad\xfa\xb5\xd9\xb5\xda'\
-b'\xb5\xfa\xad\xd9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xda\xbd\xf9\xb5\xfa'\
-b'\x9d\x9a\x9d\x7a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\xa5\x9a\xa5\xb9'\
-b'\xad\xda\xad\xda\xad\xd9\xa5\xba\xa5\xd9\xa5\xba\xa5\xba\xa5\x9a'\
-b'\xa5\xda\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xda'\
-b'\xad\xb9\xa5\xba\xa5\xba\x95\x9a\x85\x5a\x85\x3a\x74\xfa\x6c\xfa'\
-b'\x6c\xfa\x74\xfa\x7d\x3a\x75\x1a\x75\x1a\x6c\xda\x6c\xfa\x6c\xfa'\
-b'\x75\x1b\x75\x1a\x7d\x1a\x75\x1a\x75\x1a\x7d\x1b\x7d\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1a\x74\xfa\x74\xfb\x75\x1a\x6c\xfa\x6c\xfa\x6c\xdb'\
-b'\x44\x5b\x2c\x1b\x2c\x1b\x34\x3b\x2c\x1b\x1b\xdb\x1b\xdb\x1b\xdb'\
-b'\x13\xbb\x0b\x9b\x13\x7a\x13\x7a\x13\x79\x1b\x78\x23\x58\x23\x37'\
-b'\x1b\x58\x1b\x59\x13\x7a\x13\x9a\x1b\xdb\x34\x1b\x3c\x5b\x54\xba'\
-b'\x5c\xbb\x44\x5a\x3c\x5b\x74\xfa\x8d\x7a\x8d\x7a\x95\x7a\x8d\x7a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a'\
-b'\x8d\x5a\x74\xfa\x54\xba\x85\x5a\x85\x3a\x5c\xdb\x5c\xdb\x5c\x9a'\
-b'\x6c\xfa\x6c\xfb\x6c\xfa\x64\xda\x54\x9b\x3c\x5b\x23\xfb\x4a\xf3'\
-b'\x43\x34\x3c\x1a\x43\x96\x4b\xd7\x54\x9a\x6c\xfa\x75\x1a\x74\xfa'\
-b'\x64\xdb\x3b\xf8\x5a\x8f\x4b\x13\x54\x9b\x75\x1a\x7d\x1a\x75\x1a'\
-b'\x74\xfa\x64\xdb\x4c\x7a\x3b\x97\x43\x34\x33\x98\x4a\xf3\x52\xb1'\
-b'\x44\x3a\x23\xfb\x13\x7a\x1b\x58\x13\x9a\x2b\xfb\x64\xdb\x75\x1a'\
-b'\x75\x1a\x74\xfa\x6c\xfb\x5c\xbb\x3c\x3a\x52\xd2\x72\x4c\x43\x34'\
-b'\x4c\x7a\x64\xda\x6c\xfb\x74\xfa\x74\xfa\x74\xfa\x75\x1a\x75\x1a'\
-b'\x74\xfa\x6c\xfa\x6c\xfa\x64\xda\x4c\x9b\x2b\xda\x4a\xd2\x62\x6f'\
-b'\x6a\x6d\x42\xd3\x2b\xfa\x4c\x9a\x64\xba\x6c\xfb\x6c\xfa\x74\xfa'\
-b'\x75\x1a\x75\x1a\x75\x1a\x7d\x1a\x75\x1a\x75\x1a\x6c\xfb\x4c\x18'\
-b'\x62\x6f\x5a\x90\x43\x35\x3b\xd8\x54\x7b\x54\x9b\x3c\x5a\x23\xdb'\
-b'\x13\xbb\x23\xfb\x3c\x5a\x54\x9b\x64\xdb\x44\x39\x52\xb1\x4b\x34'\
-b'\x4c\x9a\x54\xbb\x44\x5a\x43\x76\x4a\xf3\x33\x77\x3c\x5a\x64\xdb'\
-b'\x64\xdb\x3c\x1a\x4a\xd2\x4a\xb1\x33\xfa\x64\xfa\x6c\xfa\x5c\xba'\
-b'\x44\x7b\x34\x5a\x3c\x3b\x44\x7a\x3c\x5b\x4b\x13\x5a\x90\x3b\x36'\
-b'\x3c\x3a\x5c\xba\x75\x1a\x7d\x1a\x7d\x1a\x6c\xfa\x5c\xbb\x5c\xba'\
-b'\x5c\x9b\x95\x7a\x95\x7a\x85\x3a\x8d\x5a\x95\x7a\x95\x7a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x95\x9a\x9d\x7a\x9d\x9a\x9d\xb9\x9d\xba\x9d\x99'\
-b'\x9d\x9a\xa5\xba\x9d\xba\x9d\x99\x9d\xba\x9d\x9a\xa5\xb9\x9d\x9a'\
-b'\x9d\x9a\xa5\xba\xa5\x99\xa5\xba\xa5\x9a\xa5\xba\xa5\xba\xa5\x99'\
-b'\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xda\xa5\xda'\
-b'\xad\xb9\xa5\xda\xa5\xba\xad\xda\xad\xb9\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xda\xb5\xda\xb5\xda\xad\xda\xb5\xd9\xb5\xd9\xad\xd9'\
-b'\xad\xf9\xb5\xd9\xad\xfa\xb5\xd9\xb5\xf9\xb5\xd9\xad\xfa\xb5\xf9'\
-b'\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\x9d\x9a\x95\x9a\x9d\x79\x9d\x9a\x9d\x9a\x9d\x9a\xa5\xb9\xa5\xba'\
-b'\xad\xda\xad\xd9\xa5\xba\xad\xda\xad\xba\xa5\xba\xa5\xb9\x9d\x9a'\
-b'\xad\xba\xad\xd9\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9'\
-b'\x9d\x9a\x8d\x5a\x85\x5a\x75\x1a\x74\xfa\x74\xfa\x75\x1a\x7d\x1a'\
-b'\x7d\x3a\x75\x1a\x6c\xfa\x6c\xda\x6c\xfa\x6d\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1b\x75\x1a\x75\x1a\x74\xfa\x7d\x1a\x75\x1a\x75\x1a'\
-b'\x74\xfa\x75\x1a\x74\xfa\x74\xfa\x6c\xfa\x6c\xfa\x6c\xfa\x64\xda'\
-b'\x3c\x5b\x23\xfb\x34\x3a\x3c\x3a\x34\x3b\x2c\x1b\x1b\xdb\x1b\xdb'\
-b'\x1b\xdb\x1b\xbb\x13\x9a\x13\x7a\x13\x79\x2b\x38\x2b\x36\x23\x58'\
-b'\x1b\x58\x1b\x79\x13\x7a\x0b\x9b\x1b\xdb\x2c\x3b\x3c\x5a\x54\x9b'\
-b'\x5c\xba\x44\x7a\x44\x5b\x6c\xda\x8d\x7a\x95\x7a\x8d\x5a\x8d\x7a'\
-b'\x95\x7a\x8d\x5a\x8d\x7a\x8d\x79\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x7a\x75\x1a\x54\x9a\x85\x3a\x85\x5a\x5c\xba\x5c\xda\x6c\xda'\
-b'\x6c\xfa\x74\xfa\x6c\xfb\x6c\xda\x5c\xdb\x44\x5a\x2b\xd9\x52\xd2'\
-b'\x33\x77\x4b\x14\x82\x0a\x7a\x0b\x53\x54\x5c\xba\x75\x1a\x6c\xfa'\
-b'\x5c\xbb\x43\xb7\x62\x6e\x43\x35\x54\x9b\x75\x1a\x75\x1a\x75\x1a'\
-b'\x6c\xfa\x5c\xdb\x44\x39\x6a\x6e\x89\xe8\x72\x4d\x52\x91\x52\xb1'\
-b'\x44\x3a\x2c\x1b\x13\x9a\x1b\x59\x13\x79\x23\xdb\x54\x9a\x75\x1a'\
-b'\x74\xfa\x6c\xfa\x64\xda\x54\x9b\x43\x97\x7a\x0a\x91\xc8\x6a\x8f'\
-b'\x44\x3a\x64\xda\x6c\xda\x6c\xfa\x75\x1b\x75\x1a\x75\x1a\x75\x1a'\
-b'\x74\xfb\x74\xfa\x64\xda\x5c\xdb\x54\x9a\x33\xfa\x42\xd3\x89\xe9'\
-b'\x91\xe8\x62\x6e\x33\xfa\x4c\x9b\x5c\xda\x6c\xdb\x6c\xfa\x74\xfa'\
-b'\x74\xfa\x75\x1a\x7d\x1a\x75\x1b\x75\x1a\x74\xfa\x64\xdb\x43\xb7'\
-b'\x6a\x4d\x82\x09\x89\xe9\x5a\xb0\x3c\x3a\x44\x7a\x2c\x1b\x13\xdb'\
-b'\x1b\xdb\x23\xfb\x3c\x5b\x5c\xba\x64\xda\x44\x19\x52\xb0\x43\x55'\
-b'\x4c\x7b\x4c\x9a\x43\x97\x7a\x0b\x91\xc8\x62\x6e\x3c\x1a\x5c\xba'\
-b'\x64\xda\x34\x3a\x42\xf3\x52\x90\x33\xd9\x54\xbb\x5c\xba\x4c\x9b'\
-b'\x3c\x5b\x34\x3b\x3c\x3a\x4c\x9b\x43\xf9\x72\x4c\x91\xc8\x72\x2c'\
-b'\x33\xb9\x5c\xba\x6c\xfa\x7d\x1a\x7d\x1a\x75\x1a\x6c\xda\x5c\xba'\
-b'\x54\x9a\x95\x7a\x95\x7a\x75\x1a\x8d\x5a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\x95\x99\x9d\x9a\x9d\x7a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\xba\xa5\xba\xa5\x9a\x9d\xb9'\
-b'\xa5\x99\x9d\x9a\xa5\xba\xa5\x99\xa5\x9a\xa5\xba\x9d\xb9\xa5\x9a'\
-b'\xa5\xb9\xa5\x9a\xa5\x9a\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xad\xb9\xa5\xd9\xa5\xba'\
-b'\xad\xda\xad\xb9\xa5\xda\xad\xb9\xad\xda\xad\xd9\xad\xba\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xfa\xad\xd9\xad\xda\xb5\xfa'\
-b'\xb5\xd9\xad\xd9\xb5\xda\xb5\xf9\xad\xd9\xb5\xfa\xb5\xda\xb5\xd9'\
-b'\xb5\xf9\xb5\xda\xad\xf9\xb5\xf9\xb5\xda\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xda\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\x9d\x9a\x9d\x9a\x95\x9a\x9d\x9a\x9d\x9a\x9d\x99\xa5\x9a\xa5\xba'\
-b'\xa5\xda\xad\xd9\xad\xda\xa5\xb9\xa5\xda\xa5\xba\x9d\x99\x9d\x99'\
-b'\xa5\xda\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\x9d\x9a\x95\x7a\x85\x59'\
-b'\x7d\x1a\x74\xfa\x74\xfa\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x75\x1a'\
-b'\x6c\xfa\x6c\xfa\x75\x1a\x75\x1a\x75\x1a\x75\x1b\x75\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x75\x1a\x74\xfa\x75\x1a\x75\x1a\x75\x1a\x75\x1a'\
-b'\x74\xfb\x74\xfa\x74\xfa\x75\x1a\x6c\xfb\x6c\xfa\x6c\xda\x64\xda'\
-b'\x44\x5b\x2b\xfb\x34\x1b\x3c\x5b\x3c\x3a\x34\x3b\x34\x1b\x23\xfb'\
-b'\x1b\xdb\x1b\xdb\x13\xbb\x0b\x7a\x1b\x79\x3a\xf4\x3a\xf4\x1b\x58'\
-b'\x13\x7a\x1b\x79\x13\x7a\x0b\x9b\x1b\xfb\x34\x1a\x44\x5b\x5c\xba'\
-b'\x5c\xba\x44\x7b\x44\x5b\x6c\xda\x8d\x7a\x8d\x7a\x95\x7a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x8d\x79\x8d\x5a\x8d\x5a\x8d\x7a\x8d\x59\x8d\x5a'\
-b'\x8d\x7a\x74\xfa\x64\xfa\x85\x3a\x85\x3a\x54\x9a\x64\xda\x6c\xfb'\
-b'\x74\xfa\x6c\xfb\x6c\xfa\x6c\xfa\x64\xdb\x44\x7b\x3b\x97\x4a\xb2'\
-b'\x1b\xba\x3b\x36\x7a\x2b\x7a\x2a\x53\x75\x5c\xbb\x6c\xfa\x6c\xda'\
-b'\x54\x9b\x43\x76\x62\x6e\x43\x76\x54\xba\x75\x1a\x7d\x1a\x74\xfa'\
-b'\x6c\xfa\x64\xda\x44\x3a\x5a\xb0\x82\x09\x6a\x6e\x52\xb1\x5a\xb1'\
-b'\x44\x39\x3c\x5a\x1b\xbb\x1b\x59\x1b\x79\x1b\xbb\x44\x7a\x6c\xfa'\
-b'\x74\xfa\x6c\xfb\x64\xda\x54\xbb\x3b\xb8\x72\x4c\x89\xe9\x62\x6e'\
-b'\x44\x19\x5c\xba\x64\xda\x6c\xfa\x74\xfb\x74\xfa\x74\xfa\x74\xfa'\
-b'\x6c\xfa\x6c\xfa\x6c\xda\x5c\xdb\x54\x9b\x34\x1b\x3b\x15\x7a\x2a'\
-b'\x89\xe9\x52\xb1\x34\x1a\x4c\x9a\x5c\xba\x64\xda\x6c\xfa\x74\xfa'\
-b'\x75\x1a\x75\x1a\x75\x1a\x75\x1a\x74\xfa\x6c\xfa\x5c\xbb\x4b\x55'\
-b'\x6a\x4d\x82\x0a\x82\x0a\x52\xd1\x44\x5a\x3c\x5b\x23\xfb\x13\x9b'\
-b'\x13\xbb\x2c\x1b\x44\x7b\x64\xda\x64\xdb\x44\x19\x52\x90\x43\x35'\
-b'\x4c\x7b\x4c\x7b\x3b\xb8\x6a\x4d\x82\x0a\x52\xd1\x3c\x3a\x5c\xdb'\
-b'\x64\xdb\x3c\x3b\x42\xf4\x5a\x8f\x2b\x98\x44\x7b\x4c\x7b\x44\x7b'\
-b'\x3c\x3a\x3c\x3b\x3c\x5a\x54\x9b\x44\x1a\x62\x8f\x82\x0a\x62\x8f'\
-b'\x33\xfa\x5c\xdb\x6c\xfa\x7d\x1b\x7d\x3a\x75\x1a\x75\x1a\x64\xda'\
-b'\x64\xda\x95\x7a\x95\x7a\x7d\x1a\x85\x5a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\xba\x9d\x9a\x9d\x99'\
-b'\x9d\x99\x9d\x7a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\xba\xa5\x9a'\
-b'\x9d\xba\xa5\xba\xa5\x9a\x9d\xba\x9d\xba\xa5\x9a\xa5\x9a\xa5\xba'\
-b'\xa5\xba\x9d\xb9\xa5\xba\xa5\xb9\x9d\x9a\xa5\xba\xa5\x99\x9d\xb9'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xda\xa5\xb9\xad\xd9'\
-b'\xa5\xba\xa5\xda\xad\xb9\xad\xda\xad\xda\xa5\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xb5\xda\xad\xd9\xb5\xda\xb5\xda\xad\xf9\xb5\xd9\xad\xd9'\
-b'\xb5\xd9\xb5\xda\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xda\xb5\xd9\xad\xf9'\
-b'\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\x9d\x9a\x9d\x7a\x95\x79\x9d\x9a\x9d\x9a\x9d\x99\xa5\xba\xa5\xba'\
-b'\xad\xda\xad\xda\xad\xda\xa5\xb9\xad\xda\xa5\xb9\x9d\x9a\x9d\x7a'\
-b'\xa5\xba\xa5\xba\x9d\xba\x95\x7a\x85\x5a\x7d\x1a\x75\x1a\x6c\xfa'\
-b'\x75\x1a\x7d\x3a\x85\x3a\x7d\x3a\x74\xfa\x6c\xfa\x6c\xfa\x7d\x1a'\
-b'\x7d\x3b\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x1a\x74\xfb\x74\xfa'\
-b'\x75\x1a\x75\x1a\x7d\x1b\x75\x1a\x75\x1a\x7d\x1a\x75\x1a\x74\xfa'\
-b'\x74\xfa\x6c\xfa\x75\x1a\x74\xfb\x6c\xfa\x6c\xfa\x6c\xda\x64\xda'\
-b'\x3c\x5b\x24\x1b\x34\x3a\x3c\x3b\x34\x3b\x34\x3b\x34\x3a\x34\x3b'\
-b'\x23\xfb\x1b\xdb\x13\xbb\x13\x9b\x23\x57\x4a\xd3\x3a\xf5\x1b\x59'\
-b'\x13\x79\x13\x7a\x0b\x9b\x13\xbb\x1b\xfb\x34\x3b\x44\x5a\x54\x9b'\
-b'\x5c\xba\x4c\x5b\x3c\x5a\x5c\xba\x8d\x5a\x8d\x7a\x8d\x7a\x95\x5a'\
-b'\x95\x5a\x8d\x59\x95\x7a\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x6c\xda\x5c\xba\x85\x3a\x7d\x3a\x44\x7b\x5c\xdb\x6c\xfa'\
-b'\x74\xfa\x6c\xfa\x6c\xfa\x6c\xfb\x64\xda\x54\x9a\x4b\x34\x42\xf3'\
-b'\x1b\xdb\x2b\x58\x4a\xb2\x42\xf4\x44\x39\x64\xdb\x6c\xda\x64\xdb'\
-b'\x4c\x7b\x43\x34\x62\x6e\x3b\xb7\x5c\xbb\x75\x1a\x75\x1a\x75\x1a'\
-b'\x6c\xfb\x64\xdb\x3c\x3a\x3a\xf4\x52\xb0\x33\x15\x4a\xd3\x52\xb1'\
-b'\x44\x39\x3c\x5a\x23\xdb\x1b\x79\x23\x58\x13\x9a\x3c\x3b\x64\xda'\
-b'\x6d\x1a\x6c\xfa\x64\xdb\x54\x9b\x2b\xb9\x4a\xb1\x6a\x6d\x5a\x8f'\
-b'\x3b\xb7\x5c\xbb\x6c\xfa\x6c\xfb\x6d\x1a\x6d\x1a\x74\xfa\x74\xfa'\
-b'\x6d\x1a\x6c\xfb\x64\xda\x5c\xda\x54\x9b\x34\x3a\x33\x36\x6a\x4d'\
-b'\x72\x4c\x3b\x15\x34\x1b\x4c\x7b\x5c\xba\x6c\xda\x6c\xfa\x74\xfa'\
-b'\x75\x1a\x75\x1a\x74\xfa\x75\x1a\x6d\x1a\x6c\xfa\x54\x9a\x4b\x13'\
-b'\x62\x6e\x52\xb0\x52\xb1\x33\x57\x44\x7b\x34\x3b\x1b\xbb\x0b\x9b'\
-b'\x1b\xdb\x34\x1b\x4c\x9a\x64\xda\x5c\xdb\x43\xf9\x52\xb0\x43\x55'\
-b'\x44\x7b\x4c\x9a\x3c\x3a\x3b\x15\x52\xb1\x33\x36\x3c\x5b\x64\xba'\
-b'\x64\xda\x3c\x5b\x33\x35\x5a\x8f\x33\x77\x34\x3b\x3c\x3a\x3c\x3b'\
-b'\x3c\x3b\x3c\x5a\x4c\x7b\x5c\xba\x4c\x9b\x33\x57\x5a\x6f\x4a\xd2'\
-b'\x33\xfa\x5c\xba\x6c\xfa\x7d\x1a\x7d\x1a\x75\x1a\x75\x1a\x6c\xda'\
-b'\x5c\xba\x95\x7a\x95\x7a\x75\x1a\x8d\x5a\x9d\x9a\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\xa5\x9a\xa5\xb9\x9d\x9a'\
-b'\xa5\xb9\xa5\x99\xa5\xba\xa5\xba\xa5\x99\xa5\xba\x9d\x99\xa5\x9a'\
-b'\xa5\xba\xa5\x9a\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xba'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xad\xba\xa5\xda\xa5\xb9\xad\xda'\
-b'\xad\xba\xa5\xb9\xad\xda\xad\xda\xad\xb9\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xf9\xad\xda\xb5\xf9\xad\xda\xb5\xd9'\
-b'\xad\xfa\xad\xf9\xb5\xda\xad\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9'\
-b'\xad\xd9\xb5\xf9\xb5\xf9\xad\xd9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xd9'\
-b'\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\xa5\xba\x9d\x9a\x9d\x9a\x9d\x9a\x95\x99\x9d\x9a\x9d\x9a\xa5\xb9'\
-b'\xad\xd9\xa5\xda\xad\xda\xa5\xb9\xa5\xba\xa5\xba\x95\x9a\x8d\x7a'\
-b'\x95\x79\x8d\x7a\x85\x3a\x74\xfa\x74\xfa\x75\x1a\x75\x1a\x7d\x1a'\
-b'\x7d\x3a\x75\x1a\x6c\xfa\x64\xda\x64\xdb\x6c\xfa\x75\x1a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x3b\x75\x1a\x75\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1a\x74\xfa\x75\x1a\x74\xfb\x75\x1a\x74\xfa\x75\x1b'\
-b'\x74\xfa\x6c\xfa\x74\xfa\x74\xfb\x6c\xfa\x6c\xfa\x6c\xda\x64\xdb'\
-b'\x3c\x5b\x2c\x1b\x34\x3b\x3c\x3a\x3c\x3b\x34\x3b\x34\x3b\x34\x3b'\
-b'\x34\x3b\x2c\x1b\x23\xdb\x13\xbb\x1b\x79\x3b\x14\x2b\x36\x13\x79'\
-b'\x13\x7a\x13\x9a\x0b\x9b\x13\xbb\x23\xfb\x34\x3b\x44\x5b\x54\xba'\
-b'\x64\xda\x44\x7a\x44\x5b\x64\xda\x8d\x7a\x95\x7a\x95\x7a\x8d\x7a'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x95\x5a\x8d\x5a\x8d\x7a\x8d\x7a\x8d\x5a'\
-b'\x8d\x7a\x75\x1a\x5c\xba\x7d\x3a\x7d\x3a\x54\x9b\x64\xda\x6c\xfa'\
-b'\x74\xfb\x6c\xfa\x75\x1a\x6c\xfb\x6c\xfb\x54\x7a\x4a\xf2\x43\x76'\
-b'\x23\xfb\x2b\x37\x42\xd3\x33\x36\x44\x5a\x64\xda\x64\xdb\x5c\xda'\
-b'\x44\x5a\x4a\xf2\x62\x6f\x3b\xd8\x5c\xdb\x75\x1a\x7c\xfa\x74\xfa'\
-b'\x6c\xfa\x5c\xdb\x2b\xda\x3a\xf4\x4a\xd2\x2b\x37\x42\xf3\x5a\xb0'\
-b'\x44\x1a\x44\x7a\x2b\xfa\x1b\x99\x1b\x58\x13\x79\x2c\x1b\x64\xbb'\
-b'\x6c\xfa\x6c\xda\x64\xda\x4c\x9b\x2b\x78\x4a\xd1\x62\x6f\x62\x6e'\
-b'\x43\x76\x5c\xbb\x64\xda\x6c\xfa\x74\xfa\x74\xfa\x6c\xfb\x74\xfa'\
-b'\x6c\xfa\x6c\xfa\x64\xda\x5c\xba\x4c\x9b\x34\x1b\x3b\x35\x6a\x4d'\
-b'\x6a\x4d\x3b\x15\x34\x1b\x4c\x9b\x5c\xba\x64\xda\x6c\xfa\x6c\xfa'\
-b'\x74\xfb\x75\x1b\x75\x1a\x74\xfa\x6c\xfa\x6c\xfb\x4c\x5a\x5a\xd1'\
-b'\x62\x6e\x42\xd3\x4a\xd2\x2b\x57\x3c\x5a\x2c\x1b\x13\xbb\x13\x9b'\
-b'\x1b\xdb\x34\x3b\x5c\xbb\x6c\xfa\x5c\xdb\x3b\xd8\x52\x90\x43\x55'\
-b'\x4c\x9a\x54\xbb\x3c\x5b\x2b\x57\x42\xd2\x2b\x36\x3c\x1a\x64\xdb'\
-b'\x6c\xdb\x3c\x5b\x33\x56\x62\x8f\x33\x36\x2b\xfb\x34\x3b\x34\x3b'\
-b'\x34\x3b\x44\x7a\x5c\x9a\x64\xdb\x54\x9b\x2b\xb9\x4a\xb1\x52\x90'\
-b'\x2b\xb8\x54\xbb\x6c\xfb\x7d\x1a\x75\x1a\x6c\xfa\x74\xfb\x64\xfa'\
-b'\x64\xbb\x95\x9a\x95\x7a\x75\x1a\x95\x7a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99\x9d\xba\x9d\x9a\x9d\x9a\xa5\x9a'\
-b'\x9d\xba\x9d\xba\x9d\x99\x9d\x9a\xa5\xba\x9d\xb9\x9d\x9a\xa5\xba'\
-b'\xa5\xba\x9d\xba\x9d\xba\x9d\x9a\xa5\x9a\xa5\xba\xa5\xba\xa5\xb9'\
-b'\xa5\xb9\xa5\xb9\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xb9\xa5\xda\xa5\xb9\xa5\xd9\xa5\xba\xa5\xd9'\
-b'\xad\xda\xa5\xba\xa5\xd9\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xda\xad\xda\xb5\xda\xad\xf9\xb5\xd9\xb5\xda\xad\xd9'\
-b'\xad\xb9\xad\x98\xa5\x98\xa5\x78\xa5\x98\xad\xb9\xb5\xd9\xb5\xf9'\
-b'\xb5\xda\xad\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xf9'\
-b'\xa5\xba\xa5\xba\x9d\xba\x9d\xba\x9d\x99\x9d\x9a\x9d\x9a\xa5\xba'\
-b'\xad\xba\xad\xd9\xa5\xda\xa5\xba\xa5\xb9\xa5\xba\x95\x7a\x8d\x5a'\
-b'\x8d\x5a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x1a\x75\x1a\x6c\xfa'\
-b'\x64\xdb\x5c\xba\x5c\xba\x64\xdb\x6c\xda\x6c\xfa\x75\x1a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x1a\x75\x1a'\
-b'\x74\xfa\x75\x1a\x75\x1a\x74\xfa\x75\x1a\x75\x1a\x75\x1a\x74\xfa'\
-b'\x75\x1a\x6c\xfa\x75\x1b\x6d\x1a\x74\xfa\x6c\xfb\x6c\xfa\x64\xda'\
-b'\x3c\x5b\x2c\x1a\x34\x3b\x3c\x5b\x3c\x3a\x34\x3a\x34\x1a\x34\x3b'\
-b'\x2c\x1b\x34\x1a\x2c\x1a\x1b\xdb\x13\x9a\x23\x37\x23\x38\x13\x7a'\
-b'\x13\x7a\x0b\x7a\x0b\x9b\x13\xbb\x2c\x1b\x3c\x3a\x44\x5a\x5c\xbb'\
-b'\x64\xdb\x4c\x7b\x44\x5b\x5c\xda\x8d\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x8d\x7a\x8d\x5a\x95\x7a\x95\x7a\x8d\x79\x8d\x18\x85\x18\x8d\x18'\
-b'\x8d\x18\x74\xf8\x5c\x79\x74\xf9\x74\xd9\x54\x59\x5c\x99\x64\xb9'\
-b'\x6c\xb9\x64\xb9\x64\x98\x64\x99\x64\x99\x4b\xf8\x4a\xd1\x43\xf8'\
-b'\x2b\xfb\x33\x16\x42\xf3\x2b\x57\x3c\x5b\x5c\xdb\x5c\xdb\x54\x9b'\
-b'\x3c\x1a\x52\xb1\x5a\x90\x3b\xf9\x5c\xda\x74\xfa\x75\x1a\x75\x1b'\
-b'\x6c\xfb\x54\x9a\x23\xb9\x3a\xf4\x42\xd3\x23\x58\x4a\xd2\x5a\xb0'\
-b'\x44\x1a\x4c\x7b\x2c\x1b\x1b\x9a\x23\x58\x1b\x59\x23\xda\x54\xbb'\
-b'\x6c\xfa\x6c\xfb\x5c\xdb\x3c\x5b\x23\x57\x4a\xd2\x5a\x90\x62\x6e'\
-b'\x43\x34\x54\x9b\x64\xda\x6c\xfb\x6c\xfb\x74\xfa\x6c\xfa\x74\xfb'\
-b'\x6c\xfa\x6c\xfb\x64\xdb\x5c\xbb\x4c\x9b\x33\xfa\x42\xf3\x6a\x6e'\
-b'\x6a\x4e\x4a\xd2\x2b\xfa\x4c\x9a\x5c\xda\x64\xfb\x6c\xfa\x74\xfa'\
-b'\x6d\x1a\x74\xfa\x75\x1b\x6d\x1a\x6d\x1b\x64\xdb\x4c\x18\x5a\x90'\
-b'\x5a\x90\x3a\xf4\x42\xd3\x2b\x37\x34\x1b\x23\xfb\x13\x9b\x0b\x9a'\
-b'\x1b\xdb\x3c\x3a\x5c\x9a\x64\xda\x5c\xba\x3b\xb8\x52\x90\x43\x55'\
-b'\x4c\x7b\x54\x9b\x34\x1a\x2b\x57\x42\xd3\x33\x36\x2b\xfa\x5c\xda'\
-b'\x64\xda\x44\x7b\x2b\x77\x5a\x8f\x3a\xf5\x1b\xbb\x23\xfb\x2c\x1a'\
-b'\x3c\x5b\x4c\x9b\x64\xda\x6c\xfa\x54\x9a\x2b\xb9\x42\xf3\x5a\x8f'\
-b'\x33\x57\x44\x7b\x6d\x1a\x75\x1a\x6c\xfa\x5c\xbb\x6c\xfa\x64\xda'\
-b'\x64\xda\x95\x9a\x95\x7a\x7d\x3a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\x9d\xba\x9d\xba\x9d\x9a\xa5\xba\x9d\x99\xa5\x99'\
-b'\xa5\xba\xa5\xba\x9d\x9a\xa5\xba\x9d\xba\xa5\x9a\xa5\xba\x9d\x99'\
-b'\xa5\x9a\xa5\x99\xa5\xba\xa5\x99\xa5\x99\x9d\xba\xa5\xba\xa5\x9a'\
-b'\xa5\xba\x9d\xba\xa5\x99\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xad\xd9\xad\xba\xad\xda\xa5\xb9\xad\xba'\
-b'\xad\xd9\xa5\xba\xad\xda\xad\xd9\xad\xba\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xd9\xb5\xda\xad\xd9\xad\xda\xb5\xfa\xad\xf9\xad\xda\xb5\xfa'\
-b'\x6b\x8f\x21\x45\x29\x66\x29\x65\x21\x45\x6b\x8f\xb5\xfa\xad\xd9'\
-b'\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xda\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xa5\xba\xa5\xba\xad\xba\xa5\xda\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xad\xd9\xad\xda\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\x95\x7a\x85\x5a'\
-b'\x85\x5a\x7d\x3a\x7d\x3a\x8d\x5a\x7d\x3a\x74\xfa\x64\xda\x64\xdb'\
-b'\x54\xba\x54\x9b\x5c\xbb\x64\xda\x6c\xdb\x6c\xfb\x75\x1a\x85\x3a'\
-b'\x85\x5a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x1b\x7d\x1b'\
-b'\x75\x1a\x7d\x1a\x7d\x1b\x74\xfa\x75\x1a\x75\x1a\x75\x1a\x74\xfa'\
-b'\x75\x1b\x74\xfa\x74\xfa\x75\x1a\x6c\xfb\x64\xda\x5c\xbb\x4c\x9a'\
-b'\x3c\x3b\x2c\x3a\x3c\x5b\x44\x5a\x3c\x5b\x3c\x3b\x3c\x3b\x34\x3b'\
-b'\x34\x1a\x34\x1b\x2c\x1b\x23\xfb\x13\x9b\x1b\x58\x23\x37\x1b\x99'\
-b'\x13\x9b\x13\x9b\x0b\x9b\x13\xbb\x2b\xfb\x3c\x3b\x44\x7b\x5c\xdb'\
-b'\x64\xda\x4c\x7a\x44\x5b\x64\xba\x95\x5a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x8d\x7a\x95\x5a\x95\x7a\x8d\x79\x53\x0f\x19\x25\x19\x25\x19\x25'\
-b'\x19\x25\x19\x05\x11\x05\x19\x25\x19\x25\x11\x05\x11\x05\x11\x05'\
-b'\x11\x05\x19\x05\x11\x05\x11\x05\x11\x06\x29\xeb\x4a\xd2\x33\xf9'\
-b'\x2b\x99\x33\x15\x3a\xf4\x2b\x37\x2b\xda\x44\x5a\x4c\x59\x44\x3a'\
-b'\x33\xb8\x5a\x8f\x5a\xb0\x33\xd9\x4c\x7a\x5c\xba\x5c\x9a\x5c\x9a'\
-b'\x54\x7a\x3c\x1a\x2b\x57\x42\xd3\x42\xf3\x33\x36\x52\xb1\x5a\x90'\
-b'\x3b\xd8\x3c\x3a\x2b\xfa\x23\x78\x2b\x36\x2b\x36\x2b\x78\x44\x19'\
-b'\x54\x7a\x54\x5a\x4c\x3a\x33\xd9\x33\x15\x52\xd2\x5a\x90\x6a\x6e'\
-b'\x52\xd2\x4b\xf8\x4c\x59\x54\x59\x5c\x59\x54\x59\x5c\x79\x5c\x59'\
-b'\x5c\x59\x5c\x38\x54\x38\x54\x39\x43\xf9\x3b\x77\x5a\xb0\x62\x6e'\
-b'\x6a\x4e\x5a\x90\x33\x56\x43\xf8\x54\x18\x5c\x38\x5c\x38\x5c\x38'\
-b'\x5c\x58\x5c\x58\x5c\x58\x5c\x38\x5c\x38\x54\x38\x4b\x55\x62\x6e'\
-b'\x5a\x8f\x3a\xf4\x42\xd3\x33\x15\x33\x98\x12\x92\x01\x4a\x01\x49'\
-b'\x09\x49\x11\x69\x19\xa9\x21\xc9\x19\xa9\x11\x48\x18\xe5\x11\x27'\
-b'\x19\xaa\x22\x2c\x22\x90\x1a\x92\x3a\xb2\x3b\x15\x2b\x99\x44\x19'\
-b'\x54\x39\x43\xd9\x3b\x36\x5a\x8f\x4a\xd2\x23\x58\x23\x78\x2b\xb9'\
-b'\x3b\xd9\x44\x19\x4c\x39\x54\x59\x4c\x19\x2b\x99\x3a\xf4\x62\x8f'\
-b'\x3a\xf4\x33\xf9\x4c\x5a\x54\x59\x44\x39\x44\x19\x5c\x9a\x64\xdb'\
-b'\x64\xda\x9d\x9a\x95\x9a\x85\x5a\x9d\x9a\x9d\xba\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\x95\x59\x9d\x9a\xa5\xba\xa5\xba\x9d\xba\x9d\x9a'\
-b'\xa5\xba\xa5\xba\x9d\x99\x9d\x99\xa5\x9a\x9d\xba\x9d\x99\xa5\xba'\
-b'\xa5\xba\x9d\xba\xa5\x99\x9d\x9a\xa5\x9a\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xb9\xa5\x99\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9'\
-b'\xa5\xda\xa5\xb9\xa5\xba\xa5\xd9\xa5\xd9\xa5\xba\xa5\xb9\xad\xda'\
-b'\xa5\xba\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xda'\
-b'\xad\xda\xad\xda\xb5\xd9\xad\xfa\xad\xd9\xb5\xda\xb5\xf9\xad\xfa'\
-b'\x52\xcb\x00\x00\x00\x00\x00\x00\x00\x00\x52\xcb\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xad\xda\xb5\xf9\xad\xd9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xda'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xad\xda\xad\xda\xad\xd9\xad\xba\xa5\xba'\
-b'\xa5\xda\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\x95\x7a\x7c\xd7'\
-b'\x3a\x6c\x2a\x0a\x32\x0a\x32\x2a\x32\x0a\x2a\x0a\x29\xeb\x21\xea'\
-b'\x21\xca\x21\xea\x21\xea\x21\xea\x29\xea\x2a\x0a\x2a\x0a\x32\x0a'\
-b'\x32\x0a\x32\x0b\x32\x0a\x2a\x0a\x2a\x0a\x2a\x0a\x32\x0a\x2a\x0a'\
-b'\x3a\xae\x74\xd9\x75\x1a\x75\x1a\x7d\x1b\x75\x1a\x74\xfa\x75\x1a'\
-b'\x74\xfa\x6c\xfa\x6c\xfb\x64\xda\x54\x9a\x4c\x7b\x3c\x5a\x34\x3b'\
-b'\x3c\x3b\x44\x7b\x54\x9a\x54\x9a\x4c\x9b\x4c\x7b\x4c\x7a\x4c\x7b'\
-b'\x44\x7a\x44\x5a\x3c\x5b\x3c\x5b\x13\xbb\x13\x9a\x1b\x7a\x13\x79'\
-b'\x13\x7a\x13\xbb\x13\xbb\x1b\xdb\x2c\x1b\x3c\x3a\x44\x7a\x5c\xbb'\
-b'\x6c\xfa\x4c\x7a\x44\x5b\x64\xdb\x8d\x7a\x95\x7a\x95\x5a\x95\x7a'\
-b'\x8d\x7a\x8d\x7a\x95\x59\x53\x0e\x00\x41\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x21\xab\x2b\x36'\
-b'\x3b\x14\x4a\xd2\x4a\xb1\x42\xf3\x33\x36\x2b\x37\x23\x57\x23\x57'\
-b'\x3b\x14\x6a\x6d\x5a\x90\x2b\x38\x23\x79\x1b\x79\x23\x78\x23\x78'\
-b'\x2b\x57\x33\x15\x42\xd3\x52\xb1\x52\xb1\x4a\xd2\x62\x6f\x62\x6e'\
-b'\x3b\x15\x23\x57\x2b\x37\x3a\xf5\x4a\xd3\x4a\xd2\x42\xf3\x3b\x15'\
-b'\x33\x15\x32\xd4\x2a\xb2\x32\x4f\x39\xec\x39\xab\x41\xa9\x49\x88'\
-b'\x49\xcb\x32\x4f\x32\xb2\x3a\xf3\x3a\xf4\x42\xf4\x42\xf3\x42\xd3'\
-b'\x42\xf3\x42\xf3\x42\xd2\x42\xd3\x42\xf2\x52\xb1\x6a\x6e\x62\x6e'\
-b'\x6a\x6d\x6a\x6e\x52\xb0\x4a\xd2\x4a\xd2\x4a\xd2\x4a\xd3\x4a\xd2'\
-b'\x4a\xd3\x4a\xd3\x4a\xd2\x4a\xd3\x4a\xd2\x4a\xd2\x5a\x90\x72\x4d'\
-b'\x6a\x6e\x52\xb0\x52\xb1\x52\xb1\x29\x8a\x00\x20\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x21\x10\xa4\x21\x8a\x32\x91\x42\xf4'\
-b'\x3a\xf4\x3b\x14\x42\xd3\x62\x6e\x62\x8f\x4a\xd2\x42\xf3\x3a\xf4'\
-b'\x33\x15\x33\x15\x33\x16\x33\x15\x33\x35\x33\x15\x42\xf3\x5a\x8f'\
-b'\x52\x90\x33\x16\x2b\x36\x2b\x37\x2b\x17\x23\x17\x43\xf9\x64\xda'\
-b'\x7d\x3a\x9d\x9a\x95\x7a\x85\x3a\x95\x7a\x9d\x99\x9d\x9a\xa5\xba'\
-b'\x95\x58\x4a\x8c\x21\x66\x3a\x29\x5b\x4f\x7c\x74\x95\x17\x9d\x79'\
-b'\xa5\xba\xa5\xba\x9d\xba\xa5\xba\x9d\xba\xa5\xba\xa5\xba\xa5\xba'\
-b'\x9d\x9a\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\x9a\xa5\xba'\
-b'\xa5\xb9\x9d\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xad\xd9\xad\xba\xa5\xba\xad\xda\xad\xda\xa5\xb9'\
-b'\xad\xda\xad\xba\xa5\xd9\xad\xba\xad\xda\xad\xd9\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xda\xb5\xda\xad\xd9\xb5\xda\xad\xfa\xad\xda\xb5\xfa'\
-b'\x52\xcc\x00\x00\x00\x00\x00\x00\x00\x00\x52\xab\xb5\xfa\xad\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa'\
-b'\xa5\xba\x9d\x9a\xa5\x9a\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xad\xb9'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xad\xda\xa5\xba\x8d\x7a\x6c\x76'\
-b'\x08\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x11\x05\x74\xb9\x75\x1a\x75\x1a\x7d\x1a\x75\x1a\x74\xfb\x74\xfb'\
-b'\x64\xda\x54\xbb\x4c\x7a\x44\x5b\x3c\x5a\x3c\x5b\x44\x5a\x4c\x7a'\
-b'\x54\x9b\x5c\xba\x54\xba\x54\x9b\x54\x9a\x5c\xba\x54\xbb\x54\x9a'\
-b'\x54\x9b\x4c\x9a\x54\x9a\x44\x5b\x13\xba\x0a\xf6\x0a\x72\x01\x6b'\
-b'\x01\x29\x0a\x93\x13\x57\x23\xfb\x2c\x1b\x3c\x5b\x4c\x7a\x5c\xba'\
-b'\x64\xda\x4c\x7a\x44\x7b\x5c\xba\x85\x5a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x8d\x5a\x53\x0e\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\xcd'\
-b'\x3a\xf4\x4a\xd2\x4a\xd2\x42\xf3\x33\x15\x2b\x37\x23\x37\x23\x37'\
-b'\x42\xd3\x72\x4d\x5a\x90\x23\x37\x1b\x59\x1b\x78\x1b\x59\x23\x58'\
-b'\x2b\x37\x3a\xf4\x4a\xd2\x52\xb1\x4a\xb1\x4a\xd2\x62\x6f\x62\x6e'\
-b'\x33\x15\x23\x58\x2b\x37\x33\x15\x4a\xd3\x4a\xb1\x3a\x4f\x21\xac'\
-b'\x11\x27\x08\xa4\x00\x42\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x20\x00\x62\x08\xa4\x19\x49\x29\xed\x3a\x70\x42\xd3'\
-b'\x42\xd3\x42\xd3\x4a\xd2\x4a\xd2\x4a\xd2\x5a\x8f\x6a\x6e\x62\x6e'\
-b'\x62\x6e\x6a\x6e\x5a\x90\x4a\xd2\x4a\xd2\x4a\xd2\x4a\xd2\x42\xd2'\
-b'\x4a\xd2\x4a\xd2\x42\xd2\x4a\xd2\x4a\xd2\x4a\xd2\x62\x8f\x72\x4c'\
-b'\x62\x6e\x5a\x90\x52\x90\x29\x69\x00\x20\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x62\x21\xcb'\
-b'\x3a\xd4\x3a\xf4\x42\xd3\x62\x6e\x62\x6e\x4a\xb2\x42\xf3\x3a\xf4'\
-b'\x33\x15\x33\x16\x33\x36\x2b\x16\x33\x15\x33\x15\x3a\xf4\x5a\xb1'\
-b'\x5a\x8f\x3a\xf5\x2b\x36\x2b\x16\x2b\x36\x2b\x16\x4c\x18\x75\x3b'\
-b'\x64\xda\x9d\x9a\x95\x7a\x74\xfa\x95\x7a\x9d\xb9\x9d\x9a\xa5\xba'\
-b'\x84\xb5\x08\x61\x00\x00\x00\x00\x00\x00\x08\x41\x18\xe4\x29\xa7'\
-b'\x42\x8b\x5b\x6f\x73\xf2\x7c\x95\x8d\x17\x84\xd6\x95\x17\x9d\x58'\
-b'\x9d\x99\x9d\x99\x9d\x79\x9d\x99\xa5\xba\xa5\xb9\xa5\xba\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xb9'\
-b'\xa5\xba\xa5\xd9\xa5\xba\xa5\xd9\xa5\xd9\xad\xba\xa5\xb9\xa5\xda'\
-b'\xad\xda\xad\xb9\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xb5\xda\xad\xda\xb5\xda\xb5\xf9\xad\xfa\xb5\xfa'\
-b'\x52\xac\x00\x00\x00\x00\x00\x00\x00\x00\x52\xcb\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xad\xda\xb5\xf9\xb5\xda\xb5\xd9\xb5\xd9\xb5\xf9\xb5\xda'\
-b'\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xfa'\
-b'\xb5\xfa\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\xa5\xba\xa5\xba\xa5\xba'\
-b'\xa5\xba\xa5\xba\xa5\xda\xa5\xb9\xa5\xb9\x9d\x9a\x95\x7a\x6c\x76'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x11\x05\x74\xd9\x7d\x1a\x75\x1a\x75\x1a\x6c\xfa\x64\xba\x4c\x9a'\
-b'\x44\x7b\x44\x5a\x44\x5b\x44\x5a\x4c\x9a\x54\x9a\x5c\xbb\x5c\xbb'\
-b'\x5c\xba\x5c\xbb\x5c\xbb\x54\x9a\x54\xbb\x54\xba\x54\x9b\x54\x9b'\
-b'\x54\x9a\x4c\x9b\x4c\x7b\x44\x5a\x12\xd4\x00\xa5\x00\x41\x00\x00'\
-b'\x00\x00\x00\x41\x01\x8b\x13\xbb\x2c\x1b\x44\x5b\x4c\x5b\x54\xba'\
-b'\x64\xdb\x4c\x9a\x4c\x7a\x5c\xbb\x8d\x5a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x84\xf7\x3a\x6b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x11\x6a'\
-b'\x3a\xf3\x4a\xd3\x42\xf3\x3a\xf4\x33\x15\x2b\x37\x23\x37\x2b\x37'\
-b'\x4a\xb2\x72\x4c\x52\xb1\x23\x37\x1b\x79\x1b\x59\x1b\x78\x23\x58'\
-b'\x2b\x36\x3a\xf5\x42\xd2\x4a\xd2\x4a\xd2\x42\xd2\x62\x6f\x62\x6e'\
-b'\x3b\x15\x1b\x58\x23\x37\x2a\xd4\x29\xcc\x10\xc5\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\x19\x07'\
-b'\x32\x0d\x42\xb2\x42\xd3\x4a\xd3\x4a\xd2\x5a\x8f\x62\x6e\x5a\x8f'\
-b'\x5a\x8f\x62\x6e\x62\x6f\x52\xb1\x4a\xd2\x4a\xd2\x42\xd3\x4a\xd2'\
-b'\x4a\xd2\x4a\xb3\x4a\xd2\x4a\xb2\x4a\xd2\x4a\xb2\x62\x6e\x72\x4c'\
-b'\x62\x6f\x52\x90\x29\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x11\x07\x32\xb2\x4a\xd3\x62\x6e\x6a\x6e\x52\xb1\x42\xf3\x3a\xf5'\
-b'\x33\x15\x2b\x16\x2b\x16\x33\x16\x33\x15\x33\x15\x3b\x15\x4a\xb2'\
-b'\x62\x8f\x42\xf3\x33\x16\x33\x16\x33\x16\x2b\x16\x4c\x39\x6c\xfa'\
-b'\x5c\xba\x9d\x9a\x8d\x7a\x75\x3a\x95\x9a\x9d\xba\xa5\xba\xa5\xba'\
-b'\x63\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x08\x61\x10\xc3\x10\x82\x10\xc4\x21\x46'\
-b'\x31\xa8\x31\xe8\x29\x87\x31\xc8\x7c\x54\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xad\xd9\xa5\xba\xa5\x99\xa5\x99\xa5\x99\xa5\x99'\
-b'\xa5\x99\xa5\xb9\xad\xda\xad\xd9\xad\xb9\xad\xda\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xb9\xad\xb9\xad\xb9\xad\xb9\xad\xb9'\
-b'\x4a\xab\x00\x00\x00\x00\x00\x00\x00\x00\x4a\xab\xad\xb9\xad\xb8'\
-b'\xad\xb9\xad\xb9\xad\xd9\xb5\xd9\xb5\xda\xb5\xd9\xb5\xd9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xf9'\
-b'\xad\xda\x9d\x7a\x95\x7a\x9d\x9a\x9d\x9a\x9d\xba\xa5\xba\xa5\xba'\
-b'\xa5\x9a\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\x8d\x7a\x6c\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x11\x05\x6c\xd9\x6c\xfa\x64\xda\x5c\xbb\x4c\x7b\x4c\x7b\x4c\x5a'\
-b'\x4c\x7b\x4c\x7b\x54\xba\x5c\xbb\x5c\xba\x5c\xba\x5c\xbb\x5c\xba'\
-b'\x5c\xbb\x54\x9a\x54\x9a\x54\xba\x54\x9a\x54\x9a\x54\x9a\x54\xba'\
-b'\x4c\x9a\x4c\x9a\x4c\x7b\x2b\x33\x00\xa4\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x01\x49\x13\x16\x1b\x99\x34\x3b\x4c\x9b\x5c\xba'\
-b'\x5c\xba\x54\x9b\x4c\x7b\x5c\xba\x8d\x5a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x63\xb1\x21\x46\x63\xd2\x3a\x4b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\x69\x32\xf5'\
-b'\x3a\xf4\x3a\xf4\x42\xf4\x3a\xf4\x33\x15\x33\x16\x2b\x36\x2b\x16'\
-b'\x5a\xb1\x6a\x4c\x4a\xd2\x1b\x58\x13\x79\x13\x79\x1b\x59\x23\x58'\
-b'\x2b\x16\x3a\xf4\x42\xf3\x4a\xd3\x42\xd3\x42\xd3\x62\x8f\x62\x6e'\
-b'\x33\x15\x1b\x17\x11\xed\x00\x84\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x08\xc4\x31\xec\x42\xb2\x52\xb1\x62\x6e\x62\x8f\x52\x90'\
-b'\x52\xb1\x62\x6f\x62\x6e\x52\xb1\x4a\xd2\x4a\xd2\x4a\xd2\x42\xb2'\
-b'\x4a\xd3\x42\xd2\x4a\xd2\x42\xd3\x4a\xd2\x52\xb1\x6a\x4d\x72\x4d'\
-b'\x5a\x6e\x21\x27\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x08\xc5\x3a\x70\x62\x8f\x6a\x6d\x4a\xb1\x42\xf4\x33\x15'\
-b'\x33\x16\x33\x36\x2b\x36\x33\x36\x33\x16\x33\x15\x33\x15\x42\xd3'\
-b'\x5a\x90\x4a\xd2\x33\x15\x33\x15\x33\x16\x2b\x16\x4c\x39\x64\xdb'\
-b'\x54\x59\x85\x18\x74\x96\x53\xb3\x74\x33\x73\xf3\x5b\x4f\x42\x6b'\
-b'\x10\xc3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x19\x04\x8c\xd5\xa5\xba\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xb9\xad\xb9'\
-b'\xa5\xda\xa5\xd9\xad\xba\xa5\xb9\x5b\x0d\x29\x86\x29\xa7\x29\x86'\
-b'\x29\xa6\x7c\x32\xad\xda\xad\xda\xad\xda\xad\xb9\xad\xda\xad\xda'\
-b'\xb5\xd9\xad\xda\xb5\xda\x6b\x8f\x29\x86\x29\xa7\x29\xa6\x29\xa7'\
-b'\x10\xc3\x00\x00\x00\x00\x00\x00\x00\x00\x10\xa2\x31\xa7\x29\xa6'\
-b'\x31\xa7\x29\x86\x6b\x8f\xb5\xfa\xb5\xf9\xb5\xf9\xad\xda\xb5\xd9'\
-b'\xb5\xf9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xad\xda\x95\x9a\x95\x79\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\xba\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\x9d\x99\x8d\x5a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x11\x05\x5c\x79\x54\x9a\x4c\x9a\x4c\x7a\x4c\x9a\x54\x9a\x54\xbb'\
-b'\x5c\xba\x5c\xba\x5c\xdb\x5c\xba\x5c\xbb\x5c\xda\x5c\xba\x5c\xbb'\
-b'\x5c\xba\x5c\xba\x5c\xbb\x54\x9b\x54\xbb\x54\xbb\x54\x9a\x54\x9b'\
-b'\x4c\x9b\x54\x9b\x43\xf7\x08\xc4\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x09\x28\x09\x48\x23\x35\x2c\x1b\x44\x5a\x54\xba'\
-b'\x64\xdb\x54\x9a\x4c\x7b\x54\xba\x8d\x5a\x95\x9a\x9d\x9a\x63\xb1'\
-b'\x08\x82\x00\x00\x10\xe3\x6b\xf2\x3a\x4b\x08\x82\x08\x82\x08\x82'\
-b'\x08\x82\x08\x82\x00\x62\x00\x62\x08\x82\x00\x62\x00\x62\x00\x82'\
-b'\x00\x62\x00\x42\x00\x42\x00\x41\x00\x21\x11\x49\x23\x16\x33\x16'\
-b'\x33\x15\x3a\xf4\x3a\xf4\x33\x15\x33\x15\x33\x15\x33\x16\x33\x15'\
-b'\x62\x8f\x6a\x4d\x42\xf3\x1b\x59\x13\x79\x1b\x7a\x1b\x59\x23\x57'\
-b'\x2b\x16\x3b\x15\x3a\xf3\x42\xd3\x42\xf3\x4a\xd3\x62\x8f\x62\x6e'\
-b'\x22\x0e\x00\xa5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x21\x00\xa4\x09\x27\x19\x6a\x21\xab\x29\xec\x29\xec\x31\xaa'\
-b'\x39\x47\x29\x26\x10\xe5\x08\x63\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x18\xe6\x42\x2d\x62\x8f\x5a\x90\x52\xb0'\
-b'\x52\xb1\x5a\xb0\x62\x6f\x52\x90\x4a\xd2\x4a\xd2\x4a\xd3\x42\xd2'\
-b'\x4a\xd2\x4a\xd3\x42\xd2\x4a\xd2\x4a\xd2\x52\xb0\x6a\x4d\x6a\x4d'\
-b'\x29\x47\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x10\xc4\x5a\x4d\x6a\x6e\x52\xb1\x42\xd3\x33\x15'\
-b'\x33\x16\x2b\x16\x2b\x16\x33\x36\x33\x16\x33\x15\x33\x15\x3a\xf4'\
-b'\x52\xb0\x52\xb1\x3a\xf4\x33\x15\x33\x15\x2b\x36\x4c\x18\x43\x10'\
-b'\x11\x06\x18\xe4\x08\xa3\x00\x20\x00\x20\x00\x20\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\x6a\xa5\x99\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xd9\xa5\xba'\
-b'\xa5\xda\xa5\xb9\xad\xda\xa5\xb9\x31\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x63\x6f\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xd9\xb5\xda\xad\xfa\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x4a\x8b\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xd9'\
-b'\xb5\xfa\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xa5\xba\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x9d\x9a\x9d\x9a\x9d\x99'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\x9d\x9a\x8d\x7a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x08\xe5\x4c\x59\x4c\x7b\x4c\x9b\x54\xbb\x5c\xdb\x64\xdb\x64\xda'\
-b'\x5c\xbb\x5c\xbb\x5c\xba\x5c\xba\x64\xbb\x5c\xba\x5c\xdb\x5c\xba'\
-b'\x5c\xbb\x5c\xba\x5c\xbb\x54\xba\x54\x9a\x54\x9a\x54\x9a\x54\x9a'\
-b'\x4c\x9a\x54\xbb\x2a\xd0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x41\x1a\x70\x23\x97\x34\x3b\x3c\x5b\x54\x9a'\
-b'\x64\xda\x54\x9a\x4c\x7b\x54\xba\x85\x3a\x9d\x9a\x6b\xf2\x08\x82'\
-b'\x00\x00\x00\x00\x00\x00\x10\xe4\x74\x34\x84\xb6\x7c\xb6\x84\xb6'\
-b'\x84\xb6\x74\x96\x54\x16\x64\x56\x6c\x76\x64\x36\x5c\x36\x5c\x36'\
-b'\x33\x96\x0a\xf5\x12\xf5\x2a\x92\x4a\x2d\x3a\xd3\x2b\x37\x2b\x36'\
-b'\x33\x15\x3a\xf5\x33\x15\x33\x36\x33\x15\x32\xf5\x33\x16\x3a\xf4'\
-b'\x62\x6e\x6a\x4d\x3a\xf4\x1b\x79\x13\x7a\x13\x79\x1b\x79\x23\x37'\
-b'\x2b\x36\x33\x15\x3a\xf4\x42\xf4\x3a\xf4\x42\xd3\x52\x4e\x29\x06'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x10\xc5\x21\xab'\
-b'\x2a\x70\x32\xf4\x33\x15\x3a\xf5\x42\xf4\x42\xf3\x42\xf3\x5a\x90'\
-b'\x72\x6d\x62\x6e\x4a\xb2\x3a\xb2\x32\x2e\x19\x69\x08\x84\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x08\x41\x31\x68\x52\x90\x4a\xd1'\
-b'\x4a\xb1\x52\xb1\x5a\x8f\x5a\x8f\x4a\xd2\x4a\xd3\x4a\xd2\x42\xd3'\
-b'\x42\xd3\x42\xd3\x4a\xd3\x42\xd3\x4a\xd3\x5a\x90\x72\x4d\x62\x4d'\
-b'\x10\x83\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x29\x06\x6a\x4d\x52\xb0\x3a\xf4\x33\x15'\
-b'\x33\x16\x2b\x36\x2b\x36\x2b\x16\x33\x16\x33\x15\x33\x15\x33\x15'\
-b'\x4a\xd2\x5a\x90\x42\xd3\x3b\x15\x33\x16\x2b\x36\x43\xf8\x21\x87'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x82\x84\xb5\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xb9\xa5\xd9\xad\xba\xad\xd9'\
-b'\xa5\xb9\xad\xda\xa5\xba\xa5\xb9\x39\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x63\x8f\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda'\
-b'\xb5\xf9\xad\xda\xad\xf9\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x4a\x8b\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9'\
-b'\x9d\xba\x95\x7a\x95\x7a\x95\x7a\x9d\x79\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\xa5\xba\xa5\xb9\xa5\xba\x9d\xba\x8d\x5a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x11\x46\x21\xa9'\
-b'\x19\xa9\x11\x89\x19\x89\x11\x89\x19\x89\x19\xa9\x21\xc9\x29\xc9'\
-b'\x29\xc9\x21\xc9\x11\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x83\x22\x8f\x2a\xb0\x32\xf1\x32\xf0\x3a\xf0\x43\x31\x5c\x79'\
-b'\x64\xda\x5c\xba\x5c\xda\x64\xbb\x64\xda\x64\xdb\x5c\xba\x5c\xbb'\
-b'\x5c\xda\x5c\xbb\x5c\xba\x5c\xbb\x54\xba\x5c\xbb\x54\xbb\x54\x9b'\
-b'\x54\x9b\x4c\x7a\x19\x89\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x1a\x2d\x2b\x75\x3c\x5b\x44\x5b\x54\x9a'\
-b'\x64\xda\x64\xdb\x54\x9a\x54\xba\x7d\x1a\x95\x9a\x4a\xac\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x70\x95\x9a\x95\x7a\x95\x9a'\
-b'\x9d\x9a\x95\x7a\x6c\xfa\x75\x1a\x64\xda\x54\x9b\x54\x9b\x54\xba'\
-b'\x3c\x3a\x13\x7a\x1b\x79\x4a\xd3\x52\xb1\x33\x16\x23\x37\x2b\x36'\
-b'\x33\x16\x33\x15\x33\x16\x2b\x36\x2b\x16\x33\x15\x3b\x15\x42\xf3'\
-b'\x6a\x6e\x62\x6e\x33\x15\x13\x79\x13\x7a\x13\x79\x1b\x59\x23\x57'\
-b'\x2b\x16\x33\x15\x3a\xf4\x3a\xf4\x42\xf4\x32\x50\x10\xa4\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x21\x09\x28\x32\x2f\x4a\xb1\x4a\xf2'\
-b'\x3a\xf4\x3b\x15\x33\x15\x3a\xf4\x3a\xf4\x42\xf4\x42\xf3\x52\xb1'\
-b'\x6a\x4e\x6a\x6e\x52\xb1\x42\xf3\x42\xf3\x42\xf3\x3a\xb2\x29\xec'\
-b'\x10\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\x07\x4a\x90'\
-b'\x4a\xb2\x52\xb1\x52\xb0\x5a\x8f\x52\xb2\x4a\xd2\x42\xd2\x42\xd3'\
-b'\x4a\xd2\x42\xd2\x42\xd3\x4a\xd3\x4a\xd2\x5a\x8f\x6a\x4d\x62\x4d'\
-b'\x10\x83\x00\x00\x00\x00\x08\x62\x10\x83\x10\xa4\x10\xc4\x10\xc5'\
-b'\x10\xe5\x10\xe6\x08\xc5\x08\xa4\x00\x62\x00\x21\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x41\x89\x5a\xb1\x3a\xf4\x33\x15'\
-b'\x33\x16\x2b\x37\x2b\x37\x2b\x36\x2b\x36\x33\x16\x33\x15\x32\xf5'\
-b'\x42\xd3\x5a\x90\x42\xd3\x33\x15\x33\x15\x2b\x36\x2b\x37\x08\xc4'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x52\xed\xa5\xda'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xd9\xa5\xba'\
-b'\xad\xda\xa5\xb9\xad\xda\xa5\xb9\x31\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x63\x6f\xad\xfa\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xda\xb5\xda\xb5\xfa\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x4a\x8b\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xfa'\
-b'\x9d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x9d\x79\x9d\x99\x9d\x9a'\
-b'\x9d\x99\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\x9d\x9a\x85\x5a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x4b\x93\x64\xda'\
-b'\x64\xda\x5c\xba\x54\x9a\x4c\x7a\x4c\x7a\x54\x9a\x64\xda\x75\x1a'\
-b'\x6c\xf9\x64\xda\x32\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x62\x54\x16'\
-b'\x64\xdb\x64\xba\x5c\xda\x5c\xbb\x64\xda\x64\xba\x5c\xbb\x5c\xba'\
-b'\x64\xba\x5c\xbb\x5c\xba\x54\xba\x5c\xbb\x54\xba\x54\x9a\x44\x7a'\
-b'\x3c\x5b\x2b\xd8\x00\xa4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x2a\xd1\x3c\x19\x3c\x5b\x44\x5a\x5c\xbb'\
-b'\x6c\xfa\x6c\xda\x64\xda\x54\xba\x7d\x3a\x9d\x9a\x4a\xac\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x70\x95\x9a\x95\x7a\x9d\x7a'\
-b'\x95\x7a\x95\x9a\x75\x1a\x6c\xfa\x64\xda\x4c\x7a\x44\x5b\x44\x5b'\
-b'\x34\x1a\x13\x7a\x23\x58\x52\xb1\x4a\xb2\x2b\x36\x2b\x37\x2b\x36'\
-b'\x33\x16\x33\x16\x2b\x36\x2b\x37\x2b\x37\x33\x15\x3b\x15\x4a\xb2'\
-b'\x6a\x4d\x62\x8e\x2b\x16\x1b\x79\x13\x7a\x13\x79\x1b\x78\x23\x37'\
-b'\x2b\x36\x33\x16\x3b\x15\x3a\xf5\x2a\x4f\x00\x83\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\xe7\x12\x92\x2b\x36\x3a\xf4\x4a\xd2\x4a\xd2'\
-b'\x42\xf3\x3b\x15\x33\x15\x3b\x15\x3a\xf5\x3a\xf4\x42\xf3\x52\xb2'\
-b'\x6a\x6e\x6a\x6e\x52\xb0\x42\xd3\x42\xf3\x42\xd3\x42\xd3\x42\xf3'\
-b'\x42\xb2\x29\xcc\x08\x83\x00\x00\x00\x00\x00\x00\x00\x00\x10\xc5'\
-b'\x42\x6f\x4a\xd2\x52\xb1\x5a\x90\x52\xb0\x4a\xd2\x4a\xd3\x42\xf3'\
-b'\x42\xd3\x42\xd3\x42\xd3\x42\xf3\x4a\xd2\x62\x6e\x72\x4d\x62\x4d'\
-b'\x10\x83\x00\x00\x00\x00\x39\xaa\x52\x6f\x5a\x90\x52\x90\x4a\xd2'\
-b'\x42\xd3\x42\xd3\x42\xd3\x3a\xb2\x3a\xb2\x42\x4e\x39\xaa\x19\x06'\
-b'\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x18\x83\x4a\x6f\x3a\xf4\x33\x16'\
-b'\x2b\x36\x2b\x37\x2b\x37\x2b\x16\x2b\x16\x2b\x36\x33\x15\x33\x15'\
-b'\x42\xf4\x52\xb1\x52\xb2\x3b\x15\x2b\x36\x2b\x37\x1a\xf6\x00\x84'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x5b\x4f\xa5\xba'\
-b'\xa5\xb9\xa5\xb9\xa5\xb9\xa5\xda\xa5\xb9\xad\xb9\xad\xba\xa5\xb9'\
-b'\xa5\xb9\xa5\xb9\xad\xba\xa5\x99\x31\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x63\x8f\xad\xda\xad\xb9\xad\xb9\xad\xd9\xad\xd9\xb5\xda'\
-b'\xad\xd9\xad\xfa\xad\xf9\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x4a\xab\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xda\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xfa'\
-b'\x95\x7a\x8d\x7a\x8d\x7a\x95\x7a\x9d\x7a\x95\x9a\x9d\x7a\x9d\x99'\
-b'\x9d\x9a\xa5\x9a\xa5\xb9\xa5\xba\xa5\xba\x9d\x99\x85\x5a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x4b\xb4\x6c\xfa'\
-b'\x6c\xfa\x6c\xfb\x6c\xfb\x64\xfa\x5c\xbb\x54\x9a\x4c\x9b\x54\x9a'\
-b'\x4c\x9a\x54\xbb\x32\xd0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41\x54\x16'\
-b'\x64\xdb\x5c\xba\x64\xda\x64\xda\x64\xda\x5c\xdb\x5c\xda\x5c\xba'\
-b'\x5c\xba\x5c\xbb\x5c\xbb\x54\xbb\x4c\x7a\x4c\x5b\x3c\x5b\x3c\x3b'\
-b'\x3c\x3b\x2b\x76\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x62\x33\x54\x44\x7b\x44\x5b\x44\x5a\x6c\xfa'\
-b'\x75\x1a\x75\x1a\x6c\xfa\x5c\xba\x7d\x3a\x9d\xba\x4a\xad\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x70\x9d\x9a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x9d\x9a\x7d\x1a\x64\xdb\x6c\xfb\x54\x9b\x44\x7a\x3c\x5b'\
-b'\x2b\xfa\x13\x79\x2b\x16\x52\x90\x42\xf3\x23\x37\x23\x37\x2b\x37'\
-b'\x2b\x37\x2b\x36\x2b\x37\x23\x37\x23\x57\x2b\x36\x3a\xf5\x52\xb0'\
-b'\x6a\x4d\x5a\x8f\x2b\x37\x13\x7a\x13\x79\x1b\x79\x1b\x58\x23\x37'\
-b'\x2b\x37\x33\x35\x33\x15\x2a\x50\x00\x62\x00\x00\x00\x00\x00\x00'\
-b'\x00\x21\x09\xcd\x1b\x37\x1b\x59\x23\x37\x3a\xf4\x4a\xd2\x52\xb2'\
-b'\x42\xd3\x32\xb2\x2a\x70\x21\xed\x19\xab\x19\x69\x19\x69\x21\x69'\
-b'\x39\x68\x49\xaa\x52\x2d\x42\xd2\x42\xf3\x42\xf3\x42\xf3\x42\xd3'\
-b'\x42\xd3\x42\xf3\x3a\x70\x19\x06\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x10\xc4\x42\x70\x52\xb2\x52\x90\x5a\xb0\x4a\xd2\x42\xd3\x42\xd3'\
-b'\x42\xf3\x42\xd3\x42\xf3\x4a\xd3\x52\xb1\x62\x6e\x6a\x4d\x5a\x4e'\
-b'\x10\xa3\x00\x00\x00\x00\x41\xcb\x5a\x90\x52\x90\x52\xb1\x4a\xd2'\
-b'\x42\xd3\x42\xd3\x42\xf3\x42\xd4\x42\xf3\x4a\xd1\x62\x8f\x4a\xd2'\
-b'\x2a\x71\x11\x27\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x31\xcb\x3b\x15\x33\x16'\
-b'\x2b\x36\x23\x37\x23\x37\x2b\x37\x2b\x36\x2b\x16\x33\x16\x3b\x15'\
-b'\x3a\xf4\x52\xb1\x52\xb1\x3b\x14\x2b\x36\x2b\x37\x23\x38\x09\xed'\
-b'\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x40\x00\x61\x08\x41\x00\x40\x4a\x8b\x9d\x99\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xb9\xa5\xda\xa5\xda\xa5\xb9\xa5\xb9\x5b\x2e'\
-b'\x31\xe8\x39\xe8\x31\xe8\x39\xe8\x5b\x0e\x6b\xd0\x6b\xd0\x6b\xb0'\
-b'\x6b\xd0\x4a\xab\x39\xe8\x39\xe8\x31\xe8\x39\xe8\x7c\x33\xb5\xda'\
-b'\xad\xda\xb5\xda\xad\xfa\x8c\xb4\x73\xd0\x6b\xd0\x6b\xd0\x73\xd0'\
-b'\x31\xc7\x00\x00\x00\x00\x00\x00\x00\x00\x31\xc7\x73\xd0\x73\xd0'\
-b'\x6b\xd0\x73\xd0\x8c\xb4\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xbd\xfa'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x95\x79\x95\x99\x95\x7a\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\x9d\x9a\x85\x5a\x64\x36'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x4b\xb3\x75\x3b'\
-b'\x7d\x1a\x74\xfa\x6c\xfa\x75\x1a\x6c\xfa\x6c\xda\x5c\xba\x54\x9b'\
-b'\x4c\x7b\x44\x7b\x22\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x61\x54\x16'\
-b'\x64\xdb\x64\xda\x5c\xda\x64\xdb\x64\xbb\x5c\xba\x5c\xbb\x5c\xdb'\
-b'\x5c\xba\x54\x9a\x4c\x7a\x4c\x7b\x44\x5b\x3c\x3a\x44\x5a\x4c\x7a'\
-b'\x4c\x9b\x33\x32\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x19\xec\x3c\x18\x44\x5b\x3c\x5b\x44\x5b\x74\xfa'\
-b'\x7d\x3a\x7d\x1a\x7d\x3a\x75\x1a\x7d\x3a\x9d\x9a\x4a\xac\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x70\x95\x9a\x9d\x7a\x95\x9a'\
-b'\x9d\x99\x95\x7a\x7d\x3a\x6c\xda\x75\x1a\x64\xba\x4c\x9a\x3c\x5b'\
-b'\x2b\xda\x1b\x59\x3a\xf3\x52\xb0\x3b\x15\x23\x58\x23\x37\x2b\x37'\
-b'\x2b\x37\x2b\x37\x23\x37\x23\x38\x23\x58\x2b\x37\x3b\x15\x5a\x8f'\
-b'\x6a\x4d\x5a\x90\x23\x37\x13\x79\x13\x7a\x1b\x79\x23\x58\x23\x37'\
-b'\x2b\x37\x33\x36\x2a\x71\x00\x83\x00\x00\x00\x00\x00\x00\x08\x42'\
-b'\x22\x2f\x13\x79\x1b\x79\x1b\x58\x23\x37\x3b\x15\x42\xb1\x39\xec'\
-b'\x19\x28\x08\x83\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x41\x10\xc5\x21\xab\x3a\x70\x42\xd3\x42\xf4'\
-b'\x42\xd3\x42\xd3\x4a\xd2\x52\x90\x29\x89\x00\x20\x00\x00\x00\x00'\
-b'\x00\x00\x10\xe5\x4a\x91\x52\xd1\x52\x90\x4a\xb2\x4a\xd2\x42\xd3'\
-b'\x42\xd3\x42\xf3\x42\xd3\x42\xf3\x52\xb1\x6a\x6e\x6a\x6d\x5a\x6f'\
-b'\x08\x83\x00\x00\x00\x00\x39\xeb\x5a\x90\x5a\x90\x52\xd1\x4a\xd2'\
-b'\x42\xd3\x42\xf3\x3a\xd4\x42\xf4\x42\xd3\x4a\xb2\x5a\x8f\x4a\xd3'\
-b'\x3b\x15\x32\xf4\x21\xcc\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\xe6\x3a\xf3\x2b\x36'\
-b'\x23\x37\x23\x37\x23\x37\x2b\x37\x2b\x37\x2b\x36\x33\x15\x3a\xf5'\
-b'\x3a\xf4\x42\xd2\x52\xb1\x3a\xf5\x23\x37\x23\x57\x1b\x58\x1b\x58'\
-b'\x0a\x51\x09\x48\x19\x25\x19\x25\x19\x25\x00\x20\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x82'\
-b'\x31\xc8\x31\xc8\x32\x09\x42\x4a\x42\x8b\x4a\xac\x4a\x8b\x52\xed'\
-b'\x6b\xf1\x7c\x74\x84\x95\x84\xb5\x84\x74\x95\x58\xa5\xba\xa5\xb9'\
-b'\xad\xba\xa5\xb9\xa5\xb9\xad\xba\xad\xb9\xa5\xba\xa5\xb9\x31\xc7'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xd0\xb5\xfa\xad\xda\xad\xfa'\
-b'\xad\xda\x42\x2a\x00\x00\x00\x00\x00\x00\x00\x00\x63\x4e\xad\xfa'\
-b'\xad\xd9\xb5\xfa\xad\xda\xb5\xda\xb5\xfa\xb5\xfa\xb5\xfa\xb6\x1a'\
-b'\x52\xcc\x00\x00\x00\x00\x00\x00\x00\x00\x52\xcc\xb6\x1a\xb5\xfa'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xda\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x9d\x7a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\xa5\xba\xa5\xba\xa5\xba\x9d\x9a\x85\x5a\x6c\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x4b\xb4\x8d\x7a'\
-b'\xad\xda\xa5\x9a\x8d\x5a\x7d\x1a\x6c\xfa\x6c\xfb\x74\xfa\x6c\xfa'\
-b'\x64\xba\x54\xbb\x2a\xaf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41\x54\x16'\
-b'\x64\xfb\x64\xda\x5c\xbb\x64\xdb\x64\xda\x5c\xba\x5c\xba\x54\x9a'\
-b'\x4c\x7b\x4c\x7b\x44\x7b\x44\x7a\x44\x5a\x54\x9b\x5c\xbb\x54\xbb'\
-b'\x54\xbb\x2a\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x1a\x0c\x3c\x19\x44\x5b\x44\x5a\x44\x7a\x7d\x1b'\
-b'\x85\x3a\x7d\x3a\x7d\x3b\x7d\x1a\x85\x3a\x95\x9a\x4a\xac\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x70\x9d\x9a\x95\x7a\x95\x9a'\
-b'\x9d\x7a\x95\x9a\x7d\x3a\x74\xfa\x7d\x1a\x6c\xfa\x5c\xbb\x44\x5a'\
-b'\x23\xba\x23\x37\x4a\xd2\x52\xb1\x2b\x16\x23\x58\x23\x57\x23\x37'\
-b'\x23\x37\x23\x37\x23\x37\x23\x58\x1b\x58\x23\x38\x33\x15\x62\x8f'\
-b'\x72\x4c\x52\x90\x23\x57\x13\x79\x13\x79\x1b\x79\x1b\x58\x23\x57'\
-b'\x2b\x37\x2a\xd4\x08\xc5\x00\x00\x00\x00\x00\x00\x08\x62\x4a\x0c'\
-b'\x3b\x15\x13\x79\x1b\x79\x1b\x79\x23\x17\x1a\x0e\x10\xc5\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\x19\x49\x3a\x70'\
-b'\x42\xf3\x42\xf3\x4a\xb2\x5a\x90\x4a\xd2\x29\xcc\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x19\x27\x4a\xb1\x52\xb1\x52\xb1\x42\xf3\x42\xf3'\
-b'\x42\xd3\x42\xf3\x42\xf3\x42\xd3\x5a\xb0\x6a\x4d\x6a\x6d\x52\x6f'\
-b'\x10\xa4\x00\x00\x00\x00\x41\xcb\x5a\xb0\x52\x90\x4a\xb2\x4a\xb1'\
-b'\x4a\xd2\x42\xf3\x3a\xf4\x3a\xf4\x42\xf4\x4a\xb1\x5a\x8f\x42\xd3'\
-b'\x33\x15\x33\x15\x33\x15\x22\x0e\x00\x21\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\x32\xb1\x33\x36'\
-b'\x2b\x37\x23\x37\x23\x37\x2b\x37\x2b\x36\x2b\x16\x33\x15\x3b\x15'\
-b'\x3a\xf4\x3a\xf4\x52\xd1\x3a\xf4\x23\x37\x23\x58\x1b\x58\x1b\x59'\
-b'\x13\x7a\x44\x3a\x74\xd9\x85\x39\x84\x95\x08\x82\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x63\xb0'\
-b'\xa5\x99\x9d\x99\xa5\x9a\xa5\xba\xa5\xba\xa5\xba\xa5\xba\xa5\xda'\
-b'\xa5\xda\xad\xba\xa5\xda\xa5\xba\xa5\xda\xa5\xba\xa5\xb9\xad\xba'\
-b'\xa5\xba\xa5\xba\xa5\xd9\xa5\xda\xa5\xb9\xad\xda\xa5\x99\x31\xc7'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xb0\xad\xfa\xad\xda\xad\xda'\
-b'\xad\xd9\x3a\x29\x00\x00\x00\x00\x00\x00\x00\x00\x63\x4e\xad\xfa'\
-b'\xb5\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xb5\xf9\xad\xfa\xb5\xfa'\
-b'\x52\xcc\x00\x00\x00\x00\x00\x00\x00\x00\x52\xab\xb5\xf9\xb5\xda'\
-b'\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xda\xb5\xd9'\
-b'\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xbd\xfa'\
-b'\x8d\x7a\x8d\x7a\x8d\x7a\x95\x7a\x95\x79\x95\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\x9a\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\x9d\xba\x85\x3a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xb4\x8d\x7a'\
-b'\xad\xda\xad\xfa\xad\xf9\xad\xda\x9d\x9a\x85\x3a\x74\xfa\x6c\xfa'\
-b'\x6c\xfa\x75\x1b\x3a\xef\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x61\x5c\x16'\
-b'\x6c\xfb\x64\xda\x5c\xdb\x5c\xdb\x5c\xbb\x54\x9b\x4c\x9a\x4c\x9b'\
-b'\x54\x9a\x54\x9b\x4c\x7b\x4c\x7a\x54\x9b\x54\x9a\x5c\xba\x54\xba'\
-b'\x54\xbb\x21\xeb\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x22\x2d\x44\x3a\x44\x5b\x44\x5a\x4c\x5a\x75\x1a'\
-b'\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x3a\x85\x3a\x95\x9a\x4a\xac\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x70\x9d\x9a\x95\x9a\x9d\x7a'\
-b'\x9d\x99\x95\x7a\x85\x5a\x7d\x3a\x85\x3a\x7d\x3a\x64\xfa\x4c\x7b'\
-b'\x2b\xb9\x33\x15\x52\xb1\x42\xd3\x2b\x37\x1b\x58\x23\x38\x23\x37'\
-b'\x23\x37\x2b\x57\x23\x57\x23\x58\x1b\x59\x23\x58\x33\x15\x62\x8f'\
-b'\x6a\x4d\x52\xb1\x2b\x37\x1b\x79\x13\x7a\x1b\x59\x1b\x58\x23\x58'\
-b'\x23\x16\x11\x49\x00\x00\x00\x00\x00\x00\x08\x62\x4a\x0c\x5a\x8f'\
-b'\x3a\xf4\x13\x79\x1b\x79\x1a\xd4\x09\x28\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x62'\
-b'\x29\xcc\x42\xd2\x52\xb1\x52\xb1\x52\xb1\x5a\x90\x41\x88\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x29\xcb\x52\xb1\x5a\x90\x52\xb0\x52\xb1'\
-b'\x4a\xd3\x42\xd3\x42\xd3\x4a\xd2\x5a\x90\x6a\x6d\x62\x6d\x52\x6f'\
-b'\x08\xa4\x00\x00\x00\x00\x41\xca\x5a\x8f\x52\xb1\x52\xb0\x72\x4d'\
-b'\x62\x8f\x42\xd3\x3a\xf4\x3a\xf4\x3a\xf4\x4a\xd2\x5a\x90\x42\xd3'\
-b'\x33\x15\x3b\x15\x3b\x15\x33\x15\x19\xcc\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2a\x2e\x2b\x16'\
-b'\x2b\x37\x23\x37\x23\x37\x2b\x37\x2b\x36\x33\x16\x33\x15\x3b\x15'\
-b'\x33\x15\x3b\x15\x4a\xd2\x42\xd3\x23\x38\x23\x58\x1b\x58\x13\x79'\
-b'\x13\x79\x44\x3a\x85\x5a\x95\x9a\x74\x12\x00\x20\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\xa2\x8c\xf6'\
-b'\xa5\xba\xa5\x9a\x9d\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xb9\xa5\xb9\xa5\xba\xa5\xd9'\
-b'\xa5\xba\xad\xb9\xa5\xda\xad\xb9\xa5\xba\xad\xba\xa5\xb9\x31\xc7'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xb0\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xb9\x42\x29\x00\x00\x00\x00\x00\x00\x00\x00\x63\x4e\xad\xfa'\
-b'\xad\xfa\xb5\xda\xb5\xf9\xad\xda\xb5\xd9\xad\xda\xad\xd9\xb5\xfa'\
-b'\x52\xcb\x00\x00\x00\x00\x00\x00\x00\x00\x52\xcc\xb5\xfa\xb5\xd9'\
-b'\xad\xd9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xd9\xad\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x9d\x7a\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\xa5\xba\xa5\xba\xa5\xba\x9d\x9a\x85\x3a\x64\x56'\
-b'\x08\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x4b\xb3\x95\x7a'\
-b'\xb5\xfa\xb5\xda\xb5\xd9\xad\xd9\xb5\xfa\xad\xda\xa5\xba\x8d\x5a'\
-b'\x7d\x3a\x74\xfb\x43\x51\x08\xc4\x10\xc3\x08\xc3\x08\xc4\x08\xa3'\
-b'\x00\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41\x43\x72'\
-b'\x53\xf6\x4b\xf5\x4b\xd6\x43\xd5\x43\xd5\x4c\x39\x4c\x7b\x54\xba'\
-b'\x5c\xba\x54\xbb\x54\x9a\x4c\x7a\x4c\x9b\x5c\xbb\x5c\xba\x54\x9b'\
-b'\x54\x9a\x19\x89\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x08\xc5\x3b\xf8\x44\x5b\x44\x5b\x5c\xba\x7d\x3b'\
-b'\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x3a\x85\x3a\x95\x7a\x4a\xad\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x70\x9d\x9a\x9d\x7a\x95\x9a'\
-b'\x95\x7a\x9d\x99\x8d\x5a\x7d\x1a\x85\x3a\x85\x5a\x75\x1a\x5c\xba'\
-b'\x33\xd9\x3a\xf4\x5a\x90\x3a\xf4\x23\x57\x23\x38\x23\x38\x23\x57'\
-b'\x23\x37\x23\x37\x23\x38\x1b\x58\x1b\x59\x1b\x58\x33\x14\x62\x6e'\
-b'\x6a\x4d\x52\xb2\x2b\x36\x1b\x79\x13\x79\x1b\x59\x1b\x58\x23\x58'\
-b'\x1a\x2f\x00\x00\x00\x00\x00\x00\x00\x41\x2a\x0e\x5a\x90\x5a\x8f'\
-b'\x3b\x15\x1b\x79\x12\x51\x00\x84\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x08\x83\x19\x06\x31\x26\x41\x47\x29\x8a\x21\x8a'\
-b'\x21\x27\x20\x82\x08\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x19\x07\x4a\x6f\x5a\x90\x6a\x6e\x62\x6e\x62\x6e\x31\x47'\
-b'\x00\x00\x00\x00\x00\x00\x00\x62\x42\x4e\x72\x4c\x7a\x2b\x7a\x2b'\
-b'\x72\x4d\x4a\xd1\x42\xf4\x4a\xd2\x62\x8f\x7a\x2c\x7a\x2c\x6a\x2c'\
-b'\x10\x83\x00\x00\x00\x00\x51\xa9\x6a\x6d\x5a\xb0\x62\x6f\x7a\x2b'\
-b'\x72\x4c\x4a\xd2\x3a\xf4\x3a\xf4\x3a\xf4\x4a\xb2\x5a\x90\x42\xf3'\
-b'\x33\x15\x33\x15\x33\x15\x33\x15\x32\xf4\x11\x07\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\xac\x33\x36'\
-b'\x2b\x37\x23\x37\x23\x37\x23\x37\x2b\x36\x33\x15\x3b\x15\x33\x15'\
-b'\x33\x15\x33\x15\x42\xf3\x42\xd3\x2b\x37\x23\x38\x1b\x58\x1b\x59'\
-b'\x13\x59\x44\x3a\x85\x5a\x9d\x9a\x52\xed\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\x04\x95\x38'\
-b'\xa5\xba\x9d\x99\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xa5\x9a'\
-b'\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\xad\xb9\xa5\xba\xad\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xba\xa5\xd9\xa5\xda\xad\xb9\xa5\xda\xa5\x99\x31\xc7'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xb0\xad\xfa\xad\xda\xad\xd9'\
-b'\xad\xda\x3a\x29\x00\x00\x00\x00\x00\x00\x00\x00\x63\x4e\xad\xfa'\
-b'\xad\xda\xad\xda\xad\xda\xb5\xd9\xad\xda\xad\xd9\xb5\xfa\xb5\xfa'\
-b'\x52\xac\x00\x00\x00\x00\x00\x00\x00\x00\x4a\xab\xb5\xfa\xb5\xf9'\
-b'\xb5\xda\xad\xf9\xb5\xd9\xad\xda\xb5\xfa\xb5\xd9\xb5\xda\xb5\xf9'\
-b'\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda\xbd\xf9\xb5\xfa'\
-b'\x8d\x5a\x8d\x5a\x8d\x7a\x95\x7a\x95\x79\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\xba\xa5\xb9\xa5\xb9\xa5\xba\x9d\xba\x85\x5a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x4b\xb4\x95\x9a'\
-b'\xb5\xda\xad\xda\xb5\xd9\xb5\xd9\xad\xd9\xb5\xd9\xb5\xda\xad\xf9'\
-b'\xa5\xda\x95\x9a\x85\x19\x6c\x97\x64\x78\x64\x78\x64\x98\x5c\x78'\
-b'\x43\x52\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41'\
-b'\x00\x42\x00\x61\x00\x42\x00\x62\x00\x62\x33\x13\x4c\x9b\x5c\xba'\
-b'\x5c\xbb\x5c\xbb\x54\x9b\x4c\x7a\x54\x9a\x5c\xbb\x5c\xba\x5c\xba'\
-b'\x54\x7a\x11\x67\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x20\x00\x61\x43\xd5\x5c\xdb\x6c\xfa\x75\x1a\x7d\x3a'\
-b'\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x8d\x7b\x4a\xcc\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x70\x95\x9a\x95\x9a\x9d\x9a'\
-b'\x9d\x9a\x95\x9a\x8d\x7a\x85\x3a\x85\x5a\x85\x5a\x7d\x3a\x6c\xfa'\
-b'\x43\xd9\x42\xd2\x52\xb1\x33\x15\x23\x58\x23\x58\x23\x38\x23\x37'\
-b'\x23\x37\x23\x37\x23\x58\x23\x58\x1b\x79\x1b\x59\x3a\xf4\x6a\x6e'\
-b'\x6a\x4e\x52\xb1\x33\x16\x23\x58\x1b\x59\x1b\x58\x23\x58\x1a\xf5'\
-b'\x00\xa4\x00\x00\x00\x00\x00\x00\x11\xcd\x3a\xf4\x52\x90\x5a\x90'\
-b'\x3a\xf4\x0a\x0f\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x21'\
-b'\x28\xe5\x59\xa8\x4a\x70\x42\xd3\x62\x8f\x82\x0a\x6a\x6e\x4a\xd2'\
-b'\x5a\x90\x82\x09\x61\xeb\x31\x89\x18\x83\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x18\xc4\x5a\x0c\x62\x8f\x6a\x6e\x62\x8f\x5a\x4e'\
-b'\x20\xe4\x00\x00\x00\x00\x00\x00\x20\xe5\x6a\x4d\x5a\x90\x5a\x90'\
-b'\x7a\x4b\x6a\x6e\x42\xd3\x4a\xd2\x6a\x4e\x82\x0a\x82\x0a\x6a\x2c'\
-b'\x18\x83\x00\x00\x00\x00\x51\xa9\x72\x4d\x5a\x90\x4a\xb2\x5a\x8f'\
-b'\x52\xb1\x42\xf4\x3a\xf4\x3a\xf5\x3a\xf4\x4a\xd2\x5a\xb0\x42\xf3'\
-b'\x33\x15\x33\x16\x33\x15\x33\x16\x33\x15\x2a\x4f\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\x69\x33\x36'\
-b'\x23\x36\x23\x37\x2b\x37\x2b\x37\x33\x16\x33\x15\x3b\x15\x33\x16'\
-b'\x33\x16\x2b\x16\x3a\xf4\x4a\xd2\x2b\x16\x23\x57\x23\x58\x1b\x59'\
-b'\x13\x79\x44\x3a\x8d\x5a\x95\x79\x29\xa7\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x31\xc8\xa5\xb9'\
-b'\xa5\xba\xa5\x99\xa5\x9a\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xd9\xa5\xba'\
-b'\x9d\x9a\xa5\xd9\xa5\xba\xad\xb9\xa5\xb9\xad\xda\xa5\xb9\x74\x12'\
-b'\x5b\x4e\x5b\x4e\x63\x4e\x63\x4e\x4a\xac\x42\x4a\x42\x4a\x42\x4a'\
-b'\x42\x4a\x52\xed\x63\x4e\x5b\x4e\x63\x4e\x63\x4e\x8c\xd5\xad\xfa'\
-b'\xb5\xd9\xb5\xda\xad\xfa\xad\xd9\xb5\xda\xad\xda\xad\xd9\xad\xf9'\
-b'\x84\x93\x63\x4e\x63\x4e\x63\x4e\x63\x4e\x8c\x94\xb5\xf9\xb5\xda'\
-b'\xad\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xda'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\xa5\xba\xa5\xba\xa5\xba\x9d\x9a\x85\x5a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x4b\xb3\x95\x9a'\
-b'\xb5\xfa\xb5\xf9\xad\xfa\xb5\xfa\xad\xd9\xad\xda\xb5\xd9\xad\xd9'\
-b'\xb5\xda\xb5\xda\xad\xda\x9d\x9a\x8d\x7a\x7d\x1a\x6c\xfa\x6d\x1b'\
-b'\x53\xd4\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2a\xf2\x4c\x9b\x5c\xba'\
-b'\x5c\xda\x5c\xda\x5c\xbb\x4c\x7b\x54\xbb\x5c\xda\x5c\xba\x5c\xba'\
-b'\x54\x7a\x11\x26\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x08\xe4\x08\x83\x64\x35\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x1a\x75\x1a\x3a\x8d\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x32\xd0\x54\x17\x5c\x18\x6c\xfa'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x7d\x3b\x6c\xfa'\
-b'\x43\xd8\x4a\xb2\x4a\xd2\x33\x16\x1b\x58\x23\x37\x23\x37\x23\x58'\
-b'\x23\x37\x23\x37\x23\x58\x1b\x58\x1b\x59\x1b\x58\x42\xd3\x6a\x6e'\
-b'\x62\x6e\x4a\xd2\x33\x14\x2b\x37\x1b\x58\x23\x58\x23\x57\x11\xac'\
-b'\x00\x00\x00\x00\x00\x00\x09\x07\x23\x16\x3b\x14\x5a\xb0\x5a\x8f'\
-b'\x29\xec\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00\x11\x06\x42\x2e'\
-b'\x6a\x4d\x82\x2b\x4a\xb1\x42\xf3\x4a\xd2\x72\x4c\x82\x0a\x52\xb1'\
-b'\x5a\x8f\x82\x0a\x72\x4c\x62\x8f\x62\x0c\x39\x89\x00\x62\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x18\xc4\x5a\x2d\x52\xb1\x42\xd2\x4a\xf2'\
-b'\x42\x4f\x08\x62\x00\x00\x00\x00\x00\x00\x41\xeb\x52\xd2\x42\xd3'\
-b'\x62\x6e\x6a\x4c\x42\xd3\x52\xd1\x6a\x6e\x82\x0a\x72\x4c\x4a\x90'\
-b'\x08\xa3\x00\x00\x00\x00\x49\xa9\x62\x8e\x4a\xd2\x52\xb1\x52\xb1'\
-b'\x42\xf3\x3a\xf4\x3a\xf4\x3a\xf4\x3a\xf4\x4a\xd2\x52\x90\x3a\xf4'\
-b'\x33\x15\x33\x15\x33\x15\x33\x15\x33\x15\x3a\xf4\x10\xe6\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\x48\x33\x15'\
-b'\x2b\x37\x23\x37\x2b\x37\x2b\x16\x33\x15\x33\x15\x33\x15\x33\x36'\
-b'\x2b\x16\x2b\x37\x33\x15\x42\xd3\x3b\x15\x23\x37\x1b\x58\x1b\x58'\
-b'\x13\x79\x44\x3a\x8d\x7b\x7c\xb6\x08\x82\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4a\xed\xa5\xba'\
-b'\x9d\x9a\x9d\xba\xa5\xba\xa5\xb9\xa5\x9a\xa5\xb9\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xad\xba\xad\xd9\xa5\xba'\
-b'\x9d\x9a\xa5\xb9\xa5\xda\xad\xda\xa5\xb9\xa5\xba\xad\xda\xad\xda'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\x39\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x63\x8f\xb5\xfa\xad\xfa\xad\xda\xad\xfa\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xb5\xd9\xad\xfa\xad\xd9\xb5\xda\xb5\xf9\xad\xda'\
-b'\xb5\xda\xb5\xfa\xb5\xfa\xb5\xfa\xad\xfa\xb5\xf9\xb5\xf9\xb5\xd9'\
-b'\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xda\xb5\xfa\xb5\xd9\xad\xf9\xb5\xd9'\
-b'\xb5\xda\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x9d\x7a\x9d\x9a\x95\x79'\
-b'\x9d\x99\xa5\x9a\xa5\xba\xa5\xb9\xa5\xba\x9d\x9a\x85\x3a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xb4\x95\x9a'\
-b'\xb5\xda\xb5\xd9\xb5\xd9\xb5\xd9\xb5\xd9\xad\xda\xb5\xd9\xb5\xfa'\
-b'\xad\xd9\xad\xd9\xb5\xfa\xad\xda\xad\xda\xa5\xba\x95\x9a\x85\x3a'\
-b'\x53\xd4\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2b\x12\x54\x9b\x5c\xda'\
-b'\x64\xda\x64\xdb\x5c\xba\x4c\x7a\x54\xbb\x5c\xda\x5c\xbb\x5c\xdb'\
-b'\x54\x79\x10\xe5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x19\x26\x08\x82\x63\xf4\x85\x5b\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x6d\x1b\x32\x6c\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x4f\x3a\xf4\x2b\x36\x5c\xba'\
-b'\x85\x3a\x85\x3a\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x7d\x1a\x64\xda'\
-b'\x3b\x97\x4a\xb1\x42\xf3\x2b\x16\x23\x37\x23\x58\x23\x58\x23\x38'\
-b'\x23\x37\x23\x38\x1b\x58\x23\x58\x1b\x79\x23\x58\x4a\xd2\x62\x6e'\
-b'\x62\x8e\x4a\xd2\x3a\xf4\x33\x16\x23\x57\x23\x58\x1a\xf5\x00\x83'\
-b'\x00\x00\x00\x00\x00\x41\x1a\x72\x23\x37\x32\xf5\x5a\xb0\x41\xec'\
-b'\x00\x41\x00\x00\x00\x00\x00\x00\x00\x41\x19\xcd\x3a\xd4\x4a\xd1'\
-b'\x6a\x4d\x7a\x2b\x52\xb1\x3a\xf4\x42\xf3\x6a\x6d\x7a\x0a\x52\xb1'\
-b'\x5a\x90\x82\x2a\x72\x4c\x62\x6f\x6a\x4d\x62\x8e\x4a\x2d\x20\xa3'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x21\x06\x42\xd2\x42\xd3\x42\xd3'\
-b'\x42\xf3\x31\x8a\x00\x00\x00\x00\x00\x00\x18\xe5\x4a\x90\x4a\xd2'\
-b'\x62\x6f\x7a\x2b\x52\xb1\x52\xb1\x6a\x4d\x82\x0a\x7a\x2a\x6a\x2c'\
-b'\x18\x62\x00\x00\x00\x00\x49\xca\x52\xb1\x4a\xd2\x62\x6e\x5a\x8f'\
-b'\x42\xf4\x3a\xf4\x32\xf4\x3a\xf5\x3a\xf4\x4a\xd2\x52\x90\x42\xf4'\
-b'\x33\x15\x33\x16\x33\x15\x33\x16\x3b\x15\x3a\xf4\x29\xab\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\x48\x33\x15'\
-b'\x2b\x37\x2b\x37\x2b\x16\x33\x16\x3b\x15\x33\x15\x33\x16\x2b\x36'\
-b'\x2b\x37\x2b\x36\x2b\x16\x42\xf3\x3a\xf4\x23\x37\x23\x58\x1b\x58'\
-b'\x1b\x59\x3c\x3a\x8d\x7b\x6c\x13\x00\x20\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x74\x33\xa5\xba'\
-b'\x9d\x99\xa5\x9a\xa5\x9a\xa5\xba\x9d\xb9\xa5\x9a\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xda\xa5\xda\xa5\xba\xa5\xb9\x9d\x9a'\
-b'\x95\x9a\xad\xba\xa5\xb9\xa5\xd9\xad\xba\xad\xd9\xa5\xba\xa5\xb9'\
-b'\xad\xda\xad\xba\xad\xda\xa5\xb9\x31\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x63\x6f\xad\xfa\xad\xda\xad\xda\xad\xda\xad\xd9\xb5\xda'\
-b'\xb5\xfa\xad\xd9\xad\xda\xb5\xda\xad\xfa\xad\xd9\xb5\xda\xad\xd9'\
-b'\xb5\xd9\xb5\xd9\xad\xd9\xad\xd9\xb5\xd9\xad\xfa\xb5\xd9\xad\xf9'\
-b'\xb5\xd9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x9a\x9d\x7a'\
-b'\x9d\x99\x9d\x9a\xa5\xba\xa5\xb9\xa5\xba\x95\x99\x7d\x3a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x4b\xb4\x9d\x9a'\
-b'\xb5\xf9\xb5\xda\xad\xfa\xb5\xda\xad\xfa\xb5\xd9\xb5\xda\xad\xd9'\
-b'\xb5\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda'\
-b'\x7c\x54\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2a\xf2\x54\x9b\x5c\xda'\
-b'\x64\xda\x64\xdb\x5c\xbb\x54\x9a\x5c\xba\x64\xdb\x64\xda\x64\xda'\
-b'\x64\x98\x10\xe4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x29\xc9\x10\xc3\x64\x35\x85\x5a\x85\x5a\x85\x3a\x7d\x3a'\
-b'\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x1a\x75\x1b\x32\x6c\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x19\xee\x3a\xf4\x33\xb9\x6d\x1a'\
-b'\x85\x3a\x85\x3a\x85\x5a\x8d\x5a\x85\x5a\x7d\x3a\x75\x1a\x54\x9b'\
-b'\x3b\x36\x4a\xd2\x3b\x15\x2b\x37\x23\x37\x23\x37\x23\x57\x23\x38'\
-b'\x1b\x58\x23\x57\x23\x38\x1b\x58\x1b\x59\x23\x37\x52\xb1\x6a\x6e'\
-b'\x5a\x8f\x3a\xf4\x3a\xf5\x33\x15\x2b\x37\x23\x58\x09\xee\x00\x00'\
-b'\x00\x00\x00\x00\x09\x6a\x23\x37\x23\x58\x3b\x14\x4a\x6f\x10\x83'\
-b'\x00\x00\x00\x00\x00\x00\x00\x42\x12\x50\x23\x37\x33\x16\x4a\xd2'\
-b'\x6a\x6d\x7a\x0b\x52\xd1\x3a\xf4\x3a\xf4\x6a\x4e\x7a\x2a\x52\xb2'\
-b'\x52\xb1\x7a\x0a\x72\x2c\x62\x6e\x5a\x90\x62\x6f\x6a\x6e\x5a\x2d'\
-b'\x20\xc4\x00\x00\x00\x00\x00\x00\x00\x00\x29\xcb\x42\xd3\x42\xf3'\
-b'\x42\xd3\x42\x91\x10\xa3\x00\x00\x00\x00\x00\x20\x3a\x0e\x4a\xd2'\
-b'\x52\xb1\x7a\x2c\x72\x4d\x5a\x90\x72\x4c\x82\x0a\x6a\x6e\x5a\x6e'\
-b'\x10\x83\x00\x00\x00\x00\x49\xaa\x4a\xb1\x4a\xd2\x6a\x4e\x5a\x8f'\
-b'\x42\xf4\x3a\xf4\x3a\xf4\x3a\xf5\x3a\xf4\x4a\xd2\x52\x90\x3a\xf4'\
-b'\x33\x15\x33\x16\x33\x15\x33\x15\x3a\xf4\x42\xf3\x3a\x2f\x00\x20'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x21\x6a\x3b\x15'\
-b'\x2b\x36\x2b\x37\x2b\x16\x33\x15\x33\x16\x33\x16\x2b\x36\x2b\x36'\
-b'\x2b\x37\x2b\x37\x2b\x37\x3a\xf4\x42\xf3\x2b\x37\x23\x38\x1b\x58'\
-b'\x13\x59\x3c\x3a\x85\x5b\x53\x2f\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x29\xa7\x9d\x59\x9d\x9a'\
-b'\x9d\x9a\xa5\xba\xa5\x9a\xa5\xb9\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xb9\xad\xb9\xa5\xda\x9d\x99'\
-b'\x95\x7a\xad\xd9\xad\xda\xa5\xba\xa5\xda\xad\xba\xad\xd9\xad\xda'\
-b'\xad\xba\xad\xd9\xad\xda\xad\xb9\x31\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x63\x8f\xb5\xfa\xad\xda\xad\xd9\xad\xd9\xad\xda\xb5\xda'\
-b'\xad\xd9\xad\xda\xad\xf9\xb5\xda\xad\xd9\xb5\xda\xad\xf9\xb5\xd9'\
-b'\xad\xda\xb5\xfa\xad\xd9\xb5\xda\xad\xda\xb5\xd9\xb5\xfa\xb5\xda'\
-b'\xb5\xf9\xb5\xf9\xb5\xda\xad\xda\xb5\xf9\xb5\xd9\xad\xd9\xb5\xf9'\
-b'\xb5\xd9\xb5\xda\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xfa'\
-b'\x8d\x5a\x85\x5a\x8d\x7a\x8d\x7a\x95\x79\x95\x7a\x9d\x9a\x9d\x99'\
-b'\x9d\x99\x9d\x9a\xa5\xba\xa5\xba\xa5\xba\x95\x7a\x7d\x3a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xb3\x9d\xba'\
-b'\xb5\xda\xb5\xd9\xb5\xd9\xb5\xf9\xb5\xd9\xad\xf9\xb5\xda\xb5\xd9'\
-b'\xad\xf9\xb5\xfa\xad\xf9\xb5\xda\xad\xda\xad\xda\xad\xd9\xad\xfa'\
-b'\x84\x94\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x33\x12\x54\xbb\x64\xda'\
-b'\x64\xda\x64\xda\x5c\xdb\x5c\xba\x5c\xba\x6c\xfa\x74\xfb\x74\xfa'\
-b'\x64\x99\x10\xe4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x32\x4b\x29\xe9\x7c\xd8\x85\x5a\x85\x3a\x7d\x3a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x3a\x8d\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x21\xcd\x33\x36\x4c\x3a\x7d\x1a'\
-b'\x7d\x3a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x74\xfa\x3c\x3a'\
-b'\x33\x15\x42\xd2\x2b\x36\x23\x37\x2b\x37\x23\x37\x23\x38\x1b\x58'\
-b'\x23\x58\x1b\x58\x1b\x58\x1b\x58\x1b\x79\x2b\x36\x52\xb0\x62\x6e'\
-b'\x52\xb0\x3a\xf5\x33\x15\x3a\xf5\x33\x16\x23\x17\x00\xc5\x00\x00'\
-b'\x00\x00\x00\x41\x1a\xb3\x23\x58\x23\x38\x3a\xf4\x29\x48\x00\x00'\
-b'\x00\x00\x00\x00\x00\x21\x0a\x50\x1b\x59\x23\x58\x2b\x36\x42\xf3'\
-b'\x62\x6e\x7a\x0a\x52\xb1\x3a\xf4\x42\xd3\x72\x4d\x7a\x2a\x52\xb1'\
-b'\x4a\xd2\x7a\x2b\x72\x4c\x62\x6f\x5a\xb0\x42\xd3\x42\xf3\x4a\xd2'\
-b'\x6a\x0c\x18\xa3\x00\x00\x00\x00\x00\x00\x00\x62\x3a\x70\x52\xb1'\
-b'\x52\xb1\x4a\xf3\x29\xab\x00\x00\x00\x00\x00\x00\x21\x48\x4a\xb1'\
-b'\x42\xd3\x62\x6e\x7a\x2b\x62\x8e\x7a\x2b\x7a\x2b\x62\x6f\x52\x8f'\
-b'\x10\x84\x00\x00\x00\x00\x41\xca\x6a\x6e\x62\x6e\x72\x4c\x5a\x8f'\
-b'\x3a\xf4\x3a\xf4\x3a\xf4\x32\xf5\x3a\xf4\x4a\xd2\x52\xb1\x3a\xf4'\
-b'\x33\x15\x33\x15\x33\x16\x33\x15\x3a\xf4\x42\xf3\x42\x90\x00\x62'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x31\xcb\x3b\x15'\
-b'\x2b\x16\x2b\x16\x33\x35\x3b\x15\x33\x15\x33\x16\x2b\x36\x2b\x17'\
-b'\x23\x37\x23\x37\x23\x37\x33\x15\x42\xf3\x2b\x16\x23\x58\x1b\x58'\
-b'\x1b\x79\x3c\x1a\x85\x3a\x29\xc8\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x90\xa5\xba\x9d\x9a'\
-b'\xa5\x99\x9d\xba\xa5\x9a\xa5\xba\xa5\xb9\xa5\x9a\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xad\xda\xa5\xba\x9d\x9a'\
-b'\x95\x99\xad\xba\xa5\xba\xad\xd9\xad\xb9\xa5\xda\xa5\xba\xad\xd9'\
-b'\xa5\xda\xad\xba\xad\xd9\xa5\xb9\x31\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x63\x6f\xad\xfa\xad\xda\xad\xda\xb5\xd9\xad\xda\xad\xda'\
-b'\xb5\xd9\xad\xda\xad\xda\xb5\xfa\xb5\xfa\xad\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xd9\xad\xfa\xb5\xd9\xad\xd9\xad\xf9\xb5\xfa\xb5\xd9\xad\xf9'\
-b'\xb5\xda\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xd9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x7a'\
-b'\x9d\x99\x9d\x9a\xa5\xba\xa5\xb9\xa5\xb9\x95\x9a\x7d\x3a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xb4\x9d\xba'\
-b'\xb5\xfa\xad\xd9\xb5\xda\xad\xfa\xb5\xf9\xb5\xda\xb5\xda\xad\xd9'\
-b'\xad\xda\xad\xf9\xad\xda\xad\xd9\xb5\xda\xad\xda\xad\xd9\xb5\xfa'\
-b'\x84\x74\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3b\x31\x64\xdb\x6c\xfa'\
-b'\x6c\xfa\x6c\xfb\x64\xda\x5c\xbb\x64\xdb\x6c\xfa\x75\x1a\x75\x1a'\
-b'\x64\x98\x08\xc4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x08\xa3\x5b\xd2\x32\x2b\x7c\xb8\x85\x5a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x8d\x5a\x85\x5b\x3a\x8c\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x21\xcc\x2b\x78\x64\xda\x7d\x3a'\
-b'\x85\x5a\x8d\x5a\x8d\x7a\x85\x5a\x85\x3a\x7d\x3a\x64\xdb\x2b\xda'\
-b'\x3a\xf4\x3a\xf4\x23\x38\x1b\x58\x23\x37\x2b\x37\x23\x37\x23\x58'\
-b'\x1b\x58\x1b\x58\x1b\x79\x13\x79\x1b\x79\x33\x16\x5a\x90\x62\x6e'\
-b'\x52\xb1\x2b\x36\x2b\x36\x33\x15\x33\x15\x1a\x71\x00\x21\x00\x00'\
-b'\x00\x00\x01\x28\x23\x38\x23\x58\x1b\x58\x2a\x91\x00\x42\x00\x00'\
-b'\x00\x00\x00\x00\x01\xac\x13\x79\x1b\x59\x23\x58\x2b\x37\x3a\xf4'\
-b'\x62\x6e\x82\x0b\x52\xb1\x3a\xf4\x5a\x8f\x82\x0a\x72\x4d\x4a\xd3'\
-b'\x42\xd3\x7a\x2b\x7a\x4b\x6a\x6e\x5a\x90\x42\xd2\x42\xf3\x4a\xd2'\
-b'\x72\x4c\x4a\x2d\x00\x63\x00\x00\x00\x00\x00\x00\x21\x48\x5a\x8f'\
-b'\x5a\x6f\x52\xb2\x5a\x2c\x08\x62\x00\x00\x00\x00\x08\x63\x42\x90'\
-b'\x4a\xf2\x62\x8f\x6a\x4d\x62\x6e\x82\x0b\x82\x0a\x7a\x2b\x72\x0b'\
-b'\x18\x62\x00\x00\x00\x00\x41\xcb\x62\x6e\x6a\x6e\x72\x4c\x5a\x8f'\
-b'\x42\xf4\x3a\xf4\x32\xf4\x3a\xf4\x3b\x14\x4a\xb2\x52\xb1\x3a\xf4'\
-b'\x33\x15\x33\x15\x33\x15\x3a\xf5\x42\xf4\x42\xd3\x42\xb2\x08\x83'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x42\x2e\x3a\xf4'\
-b'\x33\x16\x33\x16\x33\x15\x33\x15\x33\x16\x2b\x36\x2b\x37\x2b\x37'\
-b'\x2b\x37\x2b\x37\x2b\x36\x2b\x16\x3a\xf4\x33\x16\x23\x38\x1b\x58'\
-b'\x13\x79\x3c\x1a\x6c\x97\x10\xc3\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x10\xe4\x84\xf7\x9d\x9a\x9d\xba'\
-b'\xa5\xba\xa5\x99\x9d\xba\xa5\xb9\xa5\xb9\x9d\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xb9\xa5\xda\xad\xd9\xa5\xba\xad\xd9\x9d\x9a'\
-b'\x9d\x9a\xa5\xda\xad\xb9\xa5\xda\xa5\xba\xad\xb9\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xb9\x73\xf1\x52\xed\x52\xed\x53\x0d'\
-b'\x5a\xed\x8c\xb4\xad\xda\xb5\xda\xad\xda\xad\xd9\xb5\xd9\xad\xda'\
-b'\xad\xda\xad\xf9\xad\xfa\x7c\x11\x4a\xab\x52\xac\x4a\xab\x4a\xab'\
-b'\x84\x53\xb5\xfa\xad\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xda'\
-b'\xb5\xd9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9\xad\xd9'\
-b'\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x7a\x95\x7a\x95\x79\x95\x7a\x9d\x99'\
-b'\x9d\x9a\x9d\x99\xa5\xba\xa5\xba\xa5\xba\x95\x9a\x7d\x3a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xd3\xa5\xbb'\
-b'\xb5\xf9\xad\xd9\xb5\xd9\xb5\xd9\xad\xfa\xb5\xf9\xad\xf9\xb5\xfa'\
-b'\xb5\xd9\xad\xda\xb5\xf9\xad\xda\xad\xd9\xb5\xda\xad\xda\xad\xfa'\
-b'\x84\x94\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x91\x7d\x3b\x74\xfa'\
-b'\x75\x1a\x6c\xfa\x64\xda\x5c\xbb\x64\xda\x6c\xfa\x74\xfa\x75\x1b'\
-b'\x64\x78\x08\xc4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x08\x82\x64\x35\x21\x87\x6c\x14\x8d\x7a\x8d\x5a\x85\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x42\x8d\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x19\xed\x33\xfa\x75\x1b\x85\x3a'\
-b'\x85\x5a\x8d\x7a\x8d\x5a\x85\x5a\x85\x3a\x7d\x1a\x54\xba\x23\x99'\
-b'\x3a\xf4\x33\x15\x1b\x59\x1b\x79\x1b\x58\x2b\x37\x2b\x37\x23\x58'\
-b'\x1b\x58\x1b\x79\x1b\x59\x13\x79\x1b\x59\x3a\xf4\x5a\x90\x62\x6e'\
-b'\x4a\xd2\x23\x38\x23\x37\x33\x15\x3b\x15\x19\x8b\x00\x00\x00\x00'\
-b'\x00\x00\x12\x2f\x1b\x58\x23\x38\x23\x58\x11\x6a\x00\x00\x00\x00'\
-b'\x00\x00\x00\xc5\x13\x38\x13\x7a\x1b\x59\x23\x58\x23\x37\x3a\xf5'\
-b'\x62\x8e\x82\x0a\x6a\x6d\x5a\x8f\x6a\x4d\x72\x4d\x4a\xd2\x3a\xf4'\
-b'\x42\xd3\x72\x4c\x7a\x2a\x6a\x4e\x62\x8f\x62\x6f\x62\x6e\x6a\x6e'\
-b'\x6a\x4d\x4a\xd2\x29\xcc\x00\x00\x00\x00\x00\x00\x00\x42\x42\x6f'\
-b'\x52\xb1\x62\x6e\x5a\x8f\x21\x27\x00\x00\x00\x00\x00\x00\x41\xec'\
-b'\x62\x8f\x6a\x6e\x5a\x8f\x62\x6e\x7a\x2b\x72\x4c\x62\x6e\x5a\x6e'\
-b'\x10\x83\x00\x00\x00\x00\x41\xca\x6a\x6e\x6a\x6e\x62\x8e\x4a\xb1'\
-b'\x42\xf4\x3a\xf4\x3a\xf4\x3a\xf5\x3a\xf4\x4a\xd2\x52\xb1\x3a\xf4'\
-b'\x33\x15\x33\x16\x3a\xf5\x3a\xf4\x42\xf3\x42\xf3\x3a\xb2\x08\x84'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x83\x52\x90\x42\xf4'\
-b'\x33\x15\x33\x15\x33\x15\x33\x16\x2b\x36\x2b\x37\x2b\x17\x23\x37'\
-b'\x23\x37\x23\x37\x23\x37\x2b\x37\x3b\x15\x33\x15\x23\x58\x1b\x58'\
-b'\x13\x59\x3c\x3a\x53\x92\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x31\xe9\x85\x18\x95\x58\x95\x59'\
-b'\x9d\x99\xa5\xba\xa5\xba\xa5\xba\xa5\xba\xa5\xba\xa5\xda\xa5\xda'\
-b'\xa5\xda\xa5\xda\xad\xda\xa5\xb9\xa5\xba\xad\xda\xa5\xda\x9d\x9a'\
-b'\x9d\x9a\xa5\xb9\xad\xda\xad\xba\xa5\xd9\xa5\xda\xad\xba\xad\xb9'\
-b'\xa5\xda\xad\xb9\xad\xda\xad\xda\xad\xfa\xad\xfa\xb5\xfa\xb5\xda'\
-b'\xad\xfa\xad\xda\xad\xda\xad\xd9\xb5\xd9\xad\xda\xad\xda\xb5\xd9'\
-b'\xb5\xda\xad\xda\xb5\xda\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xd9\xad\xd9\xad\xda\xb5\xf9\xad\xd9\xb5\xda'\
-b'\xb5\xd9\xb5\xf9\xad\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\xa5\xba\xa5\xba\xa5\xba\x95\x7a\x7d\x3a\x64\x36'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xb4\xa5\xba'\
-b'\xb5\xfa\xad\xd9\xad\xda\xb5\xd9\xb5\xda\xb5\xda\xad\xd9\xad\xda'\
-b'\xad\xd9\xb5\xda\xad\xda\xb5\xd9\xad\xfa\xad\xd9\xb5\xda\xb5\xfa'\
-b'\x84\x93\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x91\x85\x5a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x64\xdb\x5c\xda\x64\xdb\x6c\xfa\x6c\xfa\x6c\xfa'\
-b'\x5c\x77\x08\xa3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x08\x82\x74\x55\x29\xc8\x63\xf3\x95\x9a\x8d\x7a\x8d\x7a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x3a\x8c\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0a\x2f\x4c\x9a\x85\x3a\x85\x5a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x85\x5a\x7d\x3a\x75\x1a\x44\x5a\x23\x58'\
-b'\x33\x15\x2b\x37\x13\x79\x13\x7a\x1b\x79\x23\x38\x2b\x36\x2b\x37'\
-b'\x23\x58\x1b\x59\x13\x79\x1b\x79\x1b\x59\x42\xf4\x62\x8f\x62\x8f'\
-b'\x42\xd3\x23\x58\x1b\x58\x2b\x37\x3a\xf4\x08\xe6\x00\x00\x00\x00'\
-b'\x00\x62\x1a\xf5\x1b\x59\x23\x57\x1a\xf6\x00\x83\x00\x00\x00\x00'\
-b'\x00\x00\x0a\x30\x13\x7a\x13\x79\x1b\x59\x1b\x58\x23\x37\x33\x15'\
-b'\x52\xb1\x6a\x4d\x6a\x4d\x62\x6f\x5a\x90\x42\xd2\x3b\x14\x3a\xf4'\
-b'\x3a\xf4\x62\x6e\x6a\x4d\x62\x6e\x62\x6f\x62\x6e\x62\x8e\x62\x6e'\
-b'\x52\xb1\x42\xd3\x42\xb2\x08\xa4\x00\x00\x00\x00\x00\x00\x39\x47'\
-b'\x62\x6f\x52\xb1\x4a\xd2\x31\xec\x00\x00\x00\x00\x00\x00\x31\x47'\
-b'\x5a\x8f\x52\xb1\x5a\x90\x62\x6e\x6a\x6e\x5a\x8f\x52\xb1\x4a\x90'\
-b'\x10\x83\x00\x00\x00\x00\x39\xeb\x62\x8f\x5a\x8f\x4a\xd2\x42\xf3'\
-b'\x3a\xf4\x3a\xf4\x3a\xf4\x32\xf4\x3a\xf4\x4a\xd2\x52\xb1\x3b\x14'\
-b'\x33\x15\x33\x15\x3a\xf4\x42\xf3\x42\xd3\x42\xf4\x3a\x92\x00\x62'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x41\x39\xcb\x42\xd3'\
-b'\x3b\x15\x33\x15\x33\x15\x2b\x36\x2b\x37\x23\x37\x23\x37\x2b\x37'\
-b'\x23\x37\x2b\x37\x23\x37\x23\x37\x33\x15\x3b\x14\x23\x37\x1b\x58'\
-b'\x1b\x59\x3c\x1a\x32\x4c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41\x19\x04\x21\x46\x21\x46'\
-b'\x3a\x09\x42\x8b\x6b\xb1\x74\x33\x63\x90\x5b\x4e\x5b\x2e\x5b\x0e'\
-b'\x52\xed\x52\xec\x4a\xac\x42\x4a\x42\x6a\x7c\x32\xad\xba\x9d\x9a'\
-b'\x9d\x9a\xa5\xb9\xa5\xda\xad\xb9\xad\xba\xad\xd9\xad\xb9\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xb5\xda\xad\xfa\xad\xd9'\
-b'\xad\xfa\xb5\xd9\xad\xfa\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xda\xad\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xad\xda'\
-b'\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xda\xb5\xd9'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x9d\x79'\
-b'\x9d\x9a\x9d\xba\xa5\xb9\xa5\xb9\xa5\xba\x95\x7a\x7d\x3a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xb3\xa5\xba'\
-b'\xb5\xf9\xb5\xd9\xb5\xf9\xad\xf9\xad\xd9\xb5\xf9\xb5\xda\xad\xfa'\
-b'\xb5\xd9\xad\xf9\xad\xda\xad\xda\xb5\xd9\xad\xfa\xad\xd9\xb5\xfa'\
-b'\x84\x94\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x91\x7d\x3b\x7d\x1a'\
-b'\x75\x1b\x75\x1a\x64\xda\x64\xdb\x64\xda\x6c\xda\x6c\xfb\x74\xfa'\
-b'\x64\xb9\x11\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x10\xe4\x6c\x55\x42\x6b\x84\xd7\x95\x7a\x8d\x5a\x95\x7a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5b\x42\xad\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x70\x6c\xfb\x85\x5a\x8d\x7a'\
-b'\x95\x9a\x95\x7a\x8d\x7a\x85\x5a\x7d\x3a\x6c\xfb\x2c\x1b\x23\x58'\
-b'\x2b\x36\x23\x38\x13\x7a\x13\x7a\x1b\x79\x1b\x78\x23\x37\x2b\x16'\
-b'\x2b\x37\x1b\x58\x13\x79\x13\x79\x23\x58\x42\xd3\x62\x8f\x5a\x8f'\
-b'\x3a\xf3\x1b\x58\x1b\x59\x23\x57\x2a\xb3\x00\x62\x00\x00\x00\x00'\
-b'\x00\xe7\x1b\x38\x1b\x58\x1b\x79\x12\x51\x00\x00\x00\x00\x00\x00'\
-b'\x00\xa4\x1b\x17\x13\x7a\x13\x79\x1b\x79\x23\x58\x23\x37\x2b\x36'\
-b'\x42\xd3\x5a\x90\x52\xb0\x4a\xd3\x3b\x15\x33\x15\x3a\xf4\x3a\xf4'\
-b'\x3a\xf4\x42\xf3\x52\xb0\x62\x6e\x62\x8f\x52\xb0\x4a\xd2\x52\xd2'\
-b'\x4a\xd2\x42\xd3\x42\xf3\x29\xcb\x00\x00\x00\x00\x00\x00\x10\xc4'\
-b'\x42\xb1\x4a\xd2\x4a\xf2\x3a\x70\x00\x42\x00\x00\x00\x00\x10\xe6'\
-b'\x4a\xb1\x52\xb1\x5a\x90\x6a\x6e\x62\x6e\x5a\x90\x52\xb1\x4a\x90'\
-b'\x10\x83\x00\x00\x00\x00\x32\x0d\x4a\xd3\x42\xd3\x42\xd3\x42\xf3'\
-b'\x42\xd4\x3a\xf4\x3a\xf5\x3b\x14\x3a\xf4\x4a\xb2\x52\xb1\x3a\xf4'\
-b'\x33\x16\x3b\x15\x3a\xf4\x42\xf3\x42\xf3\x3a\xf4\x32\x70\x00\x41'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\x48'\
-b'\x32\xd2\x3b\x15\x33\x16\x2b\x37\x23\x37\x2b\x37\x23\x37\x23\x37'\
-b'\x2b\x37\x23\x37\x23\x37\x23\x37\x2b\x37\x3b\x15\x2b\x36\x1b\x58'\
-b'\x1b\x59\x33\xb8\x19\x46\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x82\x7c\x53\x85\x3a'\
-b'\x8d\x5a\xa5\xda\xad\xba\xa5\xda\xa5\xd9\xad\xb9\xa5\xda\xad\xd9'\
-b'\xad\xba\xad\xd9\xad\xda\xad\xba\xad\xda\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xd9\xb5\xda\xad\xda'\
-b'\xb5\xd9\xad\xda\xb5\xfa\x4a\x8a\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xd9\xad\xda\xad\xd9\xb5\xd9\xb5\xda\xb5\xf9'\
-b'\xb5\xf9\xad\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\xa5\xba\xa5\xba\xa5\xb9\x95\x7a\x7d\x3a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xd4\xa5\xda'\
-b'\xad\xda\xb5\xd9\xb5\xfa\xb5\xda\xad\xd9\xb5\xda\xad\xd9\xb5\xd9'\
-b'\xad\xda\xb5\xda\xad\xf9\xb5\xda\xad\xda\xb5\xda\xad\xda\xb5\xfa'\
-b'\x84\x73\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x91\x85\x5b\x7d\x1a'\
-b'\x7d\x1a\x75\x1a\x64\xda\x64\xba\x64\xdb\x6c\xfa\x6c\xfa\x74\xfa'\
-b'\x6c\xb9\x11\x26\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x41\x5b\x71\x53\x50\x8d\x39\x8d\x7a\x95\x7a\x8d\x7a\x8d\x5a'\
-b'\x8d\x7a\x8d\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x64\x35\x10\xe4'\
-b'\x00\x00\x00\x00\x00\x00\x00\xe6\x2b\x76\x64\x55\x74\x55\x74\x75'\
-b'\x74\x75\x74\x55\x6c\x55\x6c\x35\x64\x35\x4b\xd5\x1a\xf5\x1a\x93'\
-b'\x1a\xb3\x12\xb4\x12\xd4\x12\xd5\x0a\xd5\x13\x38\x23\x58\x2b\x36'\
-b'\x33\x36\x23\x37\x1b\x59\x1b\x79\x23\x37\x4a\xd2\x62\x6f\x5a\x8f'\
-b'\x3a\xf4\x1b\x59\x1b\x79\x1b\x79\x22\x92\x00\x21\x00\x00\x00\x00'\
-b'\x09\x8b\x1b\x79\x1b\x58\x23\x58\x09\x8b\x00\x00\x00\x00\x00\x00'\
-b'\x11\x6a\x1b\x58\x13\x79\x1b\x79\x1b\x59\x1b\x58\x23\x37\x33\x16'\
-b'\x3a\xf4\x52\xb1\x5a\x90\x4a\xd2\x3b\x14\x33\x15\x3a\xf5\x3a\xf4'\
-b'\x3a\xf4\x3a\xf4\x52\xb1\x62\x6f\x62\x6f\x5a\x90\x4a\xd1\x52\xb2'\
-b'\x4a\xd2\x42\xd3\x42\xf3\x3a\x70\x00\x42\x00\x00\x00\x00\x00\x41'\
-b'\x3a\x70\x4a\xd2\x4a\xd2\x4a\xb2\x08\xa4\x00\x00\x00\x00\x08\x83'\
-b'\x4a\x90\x52\xb0\x62\x8f\x62\x6e\x62\x6e\x5a\x8f\x52\xb1\x52\x6f'\
-b'\x10\x83\x00\x00\x00\x00\x32\x0d\x4a\xf3\x42\xd2\x42\xd3\x42\xf3'\
-b'\x42\xf4\x3a\xf4\x3a\xf4\x3a\xf4\x3a\xf4\x4a\xd2\x52\xb1\x3b\x14'\
-b'\x33\x15\x3a\xf5\x42\xf3\x42\xd3\x42\xd3\x3b\x14\x21\xed\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x11\x07\x2a\xd3\x2b\x36\x2b\x37\x23\x37\x23\x37\x23\x37\x23\x37'\
-b'\x23\x37\x23\x37\x23\x38\x23\x57\x23\x37\x33\x15\x33\x16\x1b\x58'\
-b'\x1b\x79\x23\x35\x00\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x29\xc8\x7c\xf9'\
-b'\x95\x7a\xa5\xda\xad\xb9\xad\xda\xad\xba\xa5\xba\xad\xda\xad\xda'\
-b'\xad\xda\xad\xda\xad\xda\xad\xfa\xad\xda\xad\xda\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xb5\xd9'\
-b'\xad\xda\xad\xda\xad\xfa\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xad\xd9\xb5\xd9\xb5\xda\xb5\xf9\xad\xf9\xb5\xda'\
-b'\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\x8d\x5a\x85\x5a\x8d\x5a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x9d\x9a\x9d\x9a\xa5\xba\xa5\xb9\xa5\xba\x95\x7a\x7d\x3a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xb3\xa5\xda'\
-b'\xb5\xf9\xad\xd9\xb5\xda\xad\xd9\xb5\xf9\xb5\xf9\xad\xda\xad\xf9'\
-b'\xb5\xd9\xad\xda\xad\xda\xad\xf9\xad\xd9\xad\xd9\xad\xda\xad\xfa'\
-b'\x84\x94\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x91\x85\x3a\x7d\x3a'\
-b'\x75\x1a\x75\x1b\x6c\xfb\x64\xda\x64\xda\x64\xdb\x6c\xdb\x7d\x3a'\
-b'\x85\x19\x19\x25\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x08\x82\x5b\xd2\x5b\xb2\x6c\x33\x95\x5a\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x7a\x8d\x5a\x85\x5a\x7d\x3a\x7d\x1a\x7d\x3a\x5c\x15'\
-b'\x10\xe4\x00\x00\x00\xc5\x1a\xb4\x11\x8a\x00\x61\x08\x61\x00\x41'\
-b'\x00\x41\x08\x61\x00\x41\x00\x61\x00\x41\x00\x41\x00\x41\x00\x21'\
-b'\x00\x21\x00\x21\x00\x21\x00\x21\x00\x21\x01\x6a\x1b\x37\x23\x58'\
-b'\x2b\x16\x2b\x37\x23\x58\x1b\x58\x2b\x16\x52\xb1\x62\x8f\x5a\x90'\
-b'\x32\xf5\x1b\x79\x13\x7a\x1b\x7a\x12\x51\x00\x00\x00\x00\x00\x00'\
-b'\x0a\x0f\x1b\x79\x1b\x59\x1b\x38\x08\xe6\x00\x00\x00\x00\x00\x00'\
-b'\x2a\x2f\x23\x58\x13\x7a\x1b\x79\x1b\x59\x1b\x58\x23\x37\x2b\x37'\
-b'\x3a\xf4\x52\xb1\x5a\x8f\x4a\xb1\x3a\xf4\x3a\xf4\x3a\xf4\x3a\xf4'\
-b'\x3b\x14\x42\xf3\x52\xb1\x62\x8f\x62\x6e\x62\x8f\x52\xb1\x4a\xb1'\
-b'\x4a\xd2\x4a\xd3\x4a\xd2\x4a\xb2\x10\xe5\x00\x00\x00\x00\x00\x00'\
-b'\x31\xec\x52\xd2\x4a\xd2\x4a\xb1\x19\x06\x00\x00\x00\x00\x00\x41'\
-b'\x4a\x4f\x5a\xb0\x62\x6e\x6a\x4e\x62\x6e\x5a\x90\x52\xb0\x5a\x6f'\
-b'\x10\x83\x00\x00\x00\x00\x32\x0c\x4a\xd2\x4a\xd3\x4a\xd2\x42\xd3'\
-b'\x3a\xf4\x3a\xf4\x3a\xf4\x3a\xf4\x3a\xf4\x4a\xd2\x4a\xb1\x3a\xf4'\
-b'\x33\x15\x3a\xf4\x42\xd3\x4a\xd3\x3a\xf4\x3a\xf4\x11\x07\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x11\x28\x2a\xf6\x23\x37\x23\x37\x23\x37\x23\x38\x23\x37'\
-b'\x23\x38\x23\x58\x23\x37\x23\x38\x23\x57\x33\x16\x33\x15\x1b\x58'\
-b'\x1b\x79\x12\x50\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x61\x74\x75'\
-b'\x9d\x9a\xa5\xda\xa5\xda\xa5\xb9\xad\xd9\xa5\xda\xad\xb9\x73\xf1'\
-b'\x53\x0d\x5b\x0d\x5b\x0d\x5b\x0d\x8c\xd5\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xb5\xd9\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xb5\xd9\xad\xf9\xb5\xda\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xd9\xad\xda\xad\xf9\xb5\xda\xb5\xd9\xad\xfa'\
-b'\xb5\xd9\xad\xd9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x95\x7a\x95\x79\x95\x7a\x95\x79\x9d\x99'\
-b'\x9d\x9a\xa5\x9a\xa5\xb9\xa5\xba\xa5\xba\x95\x7a\x7d\x3a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xd4\xa5\xda'\
-b'\xb5\xda\xb5\xf9\xb5\xfa\xb5\xda\xb5\xf9\xb5\xda\xb5\xd9\xb5\xda'\
-b'\xad\xf9\xad\xfa\xb5\xd9\xb5\xda\xad\xda\xad\xda\xb5\xd9\xb5\xda'\
-b'\x84\x74\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x92\x85\x5a\x7d\x3a'\
-b'\x7d\x1a\x7d\x1a\x6c\xfa\x64\xda\x64\xda\x64\xfa\x6c\xdb\x75\x1a'\
-b'\x85\x18\x21\x46\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x11\x04\x6c\x56\x32\x0a\x3a\x6b\x8d\x7a\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x39\x85\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1b'\
-b'\x33\x75\x09\x49\x22\x72\x09\x49\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x6a\x1b\x16'\
-b'\x2b\x36\x33\x36\x2b\x37\x23\x37\x33\x15\x52\xb1\x62\x6f\x52\xb0'\
-b'\x33\x15\x13\x79\x13\x59\x13\x7a\x0a\x0f\x00\x00\x00\x00\x00\x00'\
-b'\x12\x51\x1b\x79\x1b\x59\x1b\x16\x00\x84\x00\x00\x00\x00\x00\x41'\
-b'\x32\x91\x23\x58\x13\x79\x13\x79\x1b\x79\x1b\x58\x23\x57\x2b\x37'\
-b'\x33\x15\x4a\xb1\x6a\x4d\x6a\x6e\x5a\xb1\x52\xb1\x5a\x8f\x5a\x90'\
-b'\x42\xd3\x5a\x8f\x62\x6e\x6a\x4d\x72\x4c\x72\x4d\x72\x4d\x62\x6e'\
-b'\x62\x6e\x5a\x8f\x5a\x8f\x62\x8f\x29\x27\x00\x00\x00\x00\x00\x00'\
-b'\x39\x48\x62\x8f\x62\x6e\x62\x8f\x31\x27\x00\x00\x00\x00\x00\x20'\
-b'\x51\xeb\x72\x4d\x72\x4c\x72\x4c\x6a\x4d\x5a\x8f\x6a\x6d\x6a\x2c'\
-b'\x18\x83\x00\x00\x00\x00\x41\xcb\x62\x8f\x5a\x8f\x62\x8f\x5a\x90'\
-b'\x42\xf3\x3a\xf4\x3a\xf4\x3a\xf4\x3a\xf4\x4a\xd2\x4a\xb2\x3b\x14'\
-b'\x3b\x14\x42\xd3\x4a\xd3\x42\xf3\x3b\x15\x2a\x71\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x11\xac\x23\x37\x23\x37\x23\x57\x2b\x37\x23\x37'\
-b'\x23\x57\x23\x37\x23\x38\x23\x58\x1b\x58\x2b\x37\x33\x16\x23\x58'\
-b'\x13\x79\x01\x4a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x6c\x13'\
-b'\x9d\x9a\xad\xba\xad\xda\xa5\xba\xad\xba\xad\xda\xa5\xb9\x31\xc7'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xd0\xb5\xfa\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xd9\xb5\xd9\xad\xda'\
-b'\xad\xda\xb5\xda\xad\xfa\x4a\x8a\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xad\xd9\xb5\xd9\xad\xda\xb5\xf9\xb5\xf9\xb5\xd9'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\x9d\x9a\x8d\x5a\x8d\x79\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x95\x99'\
-b'\x9d\x9a\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\x95\x7a\x75\x3a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xb3\xad\xda'\
-b'\xb5\xfa\xad\xf9\xad\xd9\xb5\xf9\xad\xda\xb5\xf9\xad\xda\xb5\xd9'\
-b'\xad\xd9\xad\xfa\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda\xb5\xda'\
-b'\x84\x94\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x91\x85\x5b\x7d\x3a'\
-b'\x7d\x1a\x75\x1a\x6c\xfa\x64\xdb\x64\xda\x6c\xfb\x6c\xfa\x7d\x1a'\
-b'\x85\x19\x19\x66\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x32\x4b\x2a\x0a\x32\x09\x8d\x5a\x8d\x7a\x8d\x5a\x85\x5a'\
-b'\x85\x5a\x8d\x5a\x85\x5a\x85\x3a\x7d\x3a\x7d\x1a\x7d\x1a\x64\xda'\
-b'\x2b\xda\x2b\x15\x11\x49\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\x8b'\
-b'\x23\x37\x2b\x36\x33\x16\x2b\x36\x3a\xf4\x5a\x90\x5a\x8f\x52\xb1'\
-b'\x2b\x16\x13\x79\x1b\x7a\x1b\x7a\x09\xee\x00\x00\x00\x00\x00\x00'\
-b'\x1a\x71\x1b\x58\x1b\x79\x12\xf5\x00\x42\x00\x00\x00\x00\x08\x63'\
-b'\x3a\xb2\x23\x58\x13\x7a\x13\x79\x1b\x79\x1b\x58\x23\x38\x2b\x37'\
-b'\x33\x15\x4a\xd3\x6a\x6d\x6a\x6e\x62\x4e\x62\x6e\x6a\x4d\x5a\x8f'\
-b'\x4a\xd2\x6a\x6e\x72\x4d\x72\x4c\x72\x2c\x7a\x2c\x72\x2b\x6a\x4d'\
-b'\x6a\x6e\x6a\x6e\x6a\x4d\x6a\x6e\x39\x68\x00\x00\x00\x00\x00\x00'\
-b'\x31\x05\x6a\x4e\x6a\x6d\x62\x6f\x39\x27\x00\x00\x00\x00\x00\x00'\
-b'\x51\xca\x6a\x6d\x72\x4c\x72\x4c\x6a\x4d\x62\x8f\x72\x4c\x6a\x2c'\
-b'\x10\x83\x00\x00\x00\x00\x49\xaa\x72\x4d\x6a\x4e\x5a\x90\x52\xb0'\
-b'\x42\xf3\x3a\xf4\x3a\xf4\x3a\xf4\x3a\xf4\x4a\xd2\x4a\xb2\x3a\xf4'\
-b'\x42\xf4\x42\xd3\x42\xf3\x3a\xf4\x33\x15\x21\xee\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x41\x1a\x72\x23\x37\x23\x37\x23\x37\x23\x58'\
-b'\x23\x38\x23\x57\x1b\x58\x23\x57\x1b\x58\x23\x37\x33\x16\x23\x37'\
-b'\x13\x58\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\xe4\x7c\xb7'\
-b'\x95\x9a\xa5\xda\xa5\xb9\xad\xd9\xa5\xda\xad\xd9\xa5\x99\x31\xc8'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xb0\xad\xfa\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xda\xb5\xd9'\
-b'\xad\xfa\xad\xd9\xb5\xda\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xda\xad\xd9\xb5\xd9\xb5\xfa\xad\xd9\xb5\xf9'\
-b'\xb5\xd9\xad\xda\xb5\xf9\xb5\xd9\xad\xda\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\x9d\x9a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x9d\x7a\x9d\x9a'\
-b'\x9d\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\x95\x7a\x7d\x3a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xd3\xa5\xda'\
-b'\xb5\xfa\xb5\xf9\xb5\xda\xb5\xda\xb5\xf9\xb5\xd9\xb5\xda\xad\xfa'\
-b'\xb5\xd9\xb5\xda\xad\xda\xb5\xd9\xb5\xda\xad\xda\xad\xd9\xb5\xfa'\
-b'\x84\x74\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x91\x85\x5b\x85\x3a'\
-b'\x7d\x3a\x7d\x1a\x6c\xda\x64\xda\x64\xdb\x6c\xfa\x6c\xfa\x7d\x3a'\
-b'\x8d\x39\x19\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x29\xc9\x3a\x6c\x29\xa8\x85\x3a\x7d\x3a\x75\x1a\x75\x1a'\
-b'\x85\x3a\x8d\x5a\x85\x5a\x85\x3a\x7d\x3a\x7d\x3a\x75\x1a\x4c\x7b'\
-b'\x1b\x78\x23\x37\x12\x0f\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x21\x0a\x10'\
-b'\x1a\xf5\x2a\xf5\x33\x16\x33\x15\x42\xf3\x5a\x90\x5a\x8f\x52\xb2'\
-b'\x2b\x37\x13\x79\x13\x79\x13\x7a\x09\xed\x00\x00\x00\x00\x00\x00'\
-b'\x2a\x50\x23\x58\x1b\x79\x12\xd5\x00\x42\x00\x00\x00\x00\x08\xa3'\
-b'\x3a\xd2\x23\x37\x1b\x79\x13\x79\x1b\x59\x23\x58\x23\x37\x2b\x37'\
-b'\x2b\x36\x42\xf3\x5a\x8f\x5a\x6f\x52\xb2\x42\xf2\x4a\xd2\x4a\xb2'\
-b'\x42\xf3\x42\xd2\x52\xb1\x62\x6f\x6a\x4d\x6a\x6d\x62\x6e\x5a\x90'\
-b'\x5a\x8f\x52\xb0\x52\xb1\x5a\xb1\x39\xaa\x00\x00\x00\x00\x00\x00'\
-b'\x29\x06\x62\x8f\x62\x6e\x62\x8f\x31\x68\x00\x00\x00\x00\x00\x00'\
-b'\x41\xeb\x62\x6e\x6a\x4d\x6a\x6d\x62\x6e\x5a\x90\x62\x6e\x62\x4e'\
-b'\x10\x83\x00\x00\x00\x00\x39\xec\x52\xd1\x52\xb0\x52\xd2\x4a\xd2'\
-b'\x42\xd3\x3a\xf4\x3a\xf4\x3a\xd4\x42\xf4\x4a\xd2\x4a\xb2\x42\xf3'\
-b'\x42\xd3\x4a\xd2\x42\xf3\x3a\xf4\x33\x16\x2a\xb3\x09\x07\x00\x20'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x09\x07\x23\x16\x23\x38\x23\x57\x23\x57'\
-b'\x1b\x38\x23\x37\x1b\x38\x23\x38\x23\x58\x23\x58\x2b\x16\x2b\x37'\
-b'\x12\xf5\x00\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20'\
-b'\x00\x40\x00\x20\x00\x00\x08\xa2\x31\xc8\x52\xed\x7c\x75\x7d\x3a'\
-b'\x95\x7a\xad\xda\xad\xba\xa5\xba\xad\xd9\xad\xda\xa5\xb9\x31\xc7'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xb0\xb5\xfa\xad\xd9\xad\xda'\
-b'\xad\xda\xb5\xda\xad\xda\xad\xda\xb5\xda\xad\xda\xad\xd9\xad\xda'\
-b'\xb5\xda\xad\xd9\xad\xfa\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xfa\xad\xd9'\
-b'\xb5\xf9\xb5\xf9\xb5\xda\xb5\xd9\xb5\xfa\xb5\xda\xb5\xd9\xb5\xd9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xbd\xfa'\
-b'\xa5\xba\x95\x7a\x95\x7a\x95\x7a\x95\x79\x95\x9a\x9d\x79\x95\x9a'\
-b'\x9d\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\x8d\x5a\x7d\x1a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\xd4\xa5\xda'\
-b'\xb5\xf9\xb5\xd9\xad\xf9\xb5\xfa\xb5\xd9\xad\xfa\xb5\xd9\xb5\xd9'\
-b'\xad\xd9\xad\xfa\xad\xda\xad\xf9\xb5\xda\xad\xda\xb5\xda\xb5\xfa'\
-b'\x84\x94\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x91\x85\x5a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x6c\xfb\x6c\xfa\x64\xfb\x64\xda\x6c\xda\x7d\x3a'\
-b'\x7d\x3a\x2a\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x5b\xb1\x53\x30\x21\x87\x74\xf9\x6c\xfa\x74\xfa\x74\xfa'\
-b'\x85\x3a\x8d\x7a\x8d\x5a\x7d\x3a\x7d\x1a\x74\xfa\x64\xda\x33\xfa'\
-b'\x23\x37\x23\x58\x34\x1a\x42\xef\x00\x41\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x21\x02\x30\x0a\xb4'\
-b'\x00\xa5\x09\x49\x2a\xf5\x43\x14\x4a\xd2\x5a\x90\x5a\x90\x4a\xd2'\
-b'\x23\x37\x13\x79\x13\x79\x13\x7a\x09\xee\x00\x00\x00\x00\x00\x00'\
-b'\x32\x2f\x2b\x36\x1b\x58\x1b\x16\x00\x83\x00\x00\x00\x00\x18\xe6'\
-b'\x42\xd3\x23\x57\x1b\x79\x1b\x59\x1b\x58\x23\x58\x23\x37\x2b\x37'\
-b'\x2b\x36\x3a\xf4\x52\xb1\x5a\x8f\x4a\xd2\x3a\xf4\x3b\x15\x3a\xf4'\
-b'\x3a\xf4\x3a\xf4\x42\xd3\x52\xb0\x62\x6e\x6a\x6e\x62\x8f\x52\xb0'\
-b'\x4a\xd2\x4a\xd2\x4a\xd2\x52\xd1\x3a\x0d\x00\x00\x00\x00\x00\x00'\
-b'\x29\x48\x5a\x90\x52\x90\x5a\xb0\x29\x68\x00\x00\x00\x00\x00\x00'\
-b'\x41\xec\x62\x8f\x6a\x6e\x6a\x4e\x62\x6f\x5a\x8f\x5a\x8f\x5a\x4e'\
-b'\x10\x83\x00\x00\x00\x00\x32\x0d\x4a\xd2\x4a\xd2\x4a\xd2\x42\xd3'\
-b'\x42\xf3\x42\xd3\x42\xf3\x42\xf3\x42\xd3\x4a\xd2\x4a\xd2\x42\xd3'\
-b'\x4a\xd2\x4a\xd3\x3a\xf4\x33\x15\x3b\x14\x33\x15\x33\x15\x1a\x30'\
-b'\x08\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x21\x1a\x71\x23\x58\x23\x38\x23\x38'\
-b'\x23\x58\x1b\x58\x23\x58\x1b\x58\x1b\x58\x1b\x58\x2b\x37\x2b\x37'\
-b'\x12\x72\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x08\x82\x00\xe6\x08\xe6\x09\x28\x21\xe9\x21\xa8'\
-b'\x10\xc3\x29\xa7\x52\xed\x4a\xcc\x52\xed\x5b\x4f\x6b\xd0\x74\x33'\
-b'\x84\x94\x7c\x74\x74\x32\x8c\xd5\xa5\xb9\xad\xda\x8d\x7a\x75\x1a'\
-b'\x95\x7a\xad\xd9\xa5\xd9\xad\xba\xad\xda\xad\xd9\xa5\x99\x31\xc8'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xb0\xb5\xfa\xad\xda\xad\xd9'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda\xb5\xda\xad\xd9\xb5\xda'\
-b'\xad\xd9\xb5\xda\xb5\xfa\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xda\xad\xd9\xad\xd9\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xd9\xad\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xda\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xad\xda\x95\x7a\x95\x99\x9d\x9a\x9d\x7a\x95\x7a\x9d\x99\x9d\x9a'\
-b'\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\x95\x7a\x7d\x3a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x53\xd4\xad\xfa'\
-b'\xb5\xfa\xb5\xd9\xb5\xd9\xad\xfa\xb5\xd9\xb5\xda\xb5\xfa\xad\xd9'\
-b'\xad\xda\xb5\xda\xb5\xd9\xad\xda\xad\xf9\xad\xda\xad\xd9\xb5\xfa'\
-b'\x84\x74\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x92\x85\x5a\x85\x3a'\
-b'\x7d\x3a\x7d\x1a\x6c\xfa\x6c\xfb\x6c\xfa\x6c\xda\x64\xda\x7d\x3b'\
-b'\x75\x1b\x33\x32\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x5b\xb1\x6c\x14\x3a\x4b\x7d\x39\x7d\x3a\x74\xfa\x74\xfa'\
-b'\x7d\x3a\x8d\x5a\x85\x5a\x75\x1a\x75\x1a\x74\xfa\x4c\x9b\x23\x99'\
-b'\x2b\x16\x1b\x79\x4c\x9b\x85\x3a\x53\x4f\x21\x66\x21\x66\x21\x66'\
-b'\x19\x46\x21\x46\x19\x46\x11\x46\x00\xe6\x00\xe6\x00\xe6\x09\x06'\
-b'\x01\x06\x00\xe7\x00\xe6\x00\xe6\x00\xe7\x02\x30\x0a\xd4\x00\xa4'\
-b'\x00\x00\x00\x00\x11\x49\x3a\xd3\x52\xb1\x5a\x8f\x5a\x8f\x4a\xd3'\
-b'\x23\x58\x13\x79\x13\x7a\x1b\x7a\x0a\x0f\x00\x00\x00\x00\x00\x00'\
-b'\x2a\x0e\x3b\x15\x23\x57\x1b\x58\x12\x30\x08\xa4\x10\xc5\x42\x2d'\
-b'\x42\xf3\x2b\x37\x1b\x59\x1b\x79\x1b\x58\x23\x57\x23\x37\x2b\x37'\
-b'\x2b\x16\x3a\xf4\x52\xb1\x5a\x8f\x52\xb1\x3a\xf4\x3a\xf4\x3a\xf4'\
-b'\x3a\xf4\x3a\xf4\x42\xf3\x5a\xb0\x62\x6e\x6a\x6e\x5a\x6e\x52\xb0'\
-b'\x52\xb1\x4a\xb1\x52\xb1\x52\xb1\x52\x90\x29\x48\x10\x83\x20\xe5'\
-b'\x52\x4e\x5a\x8f\x5a\x8f\x5a\x90\x29\x27\x00\x00\x00\x00\x00\x20'\
-b'\x4a\x0c\x62\x6f\x6a\x6d\x6a\x6e\x62\x6f\x5a\x8f\x62\x8f\x5a\x6e'\
-b'\x10\x83\x00\x00\x00\x00\x31\xec\x4a\xd2\x4a\xd2\x4a\xd2\x4a\xd3'\
-b'\x42\xd3\x4a\xd3\x42\xf3\x4a\xd2\x4a\xd2\x4a\xd2\x52\xb1\x4a\xd2'\
-b'\x52\xd2\x42\xd3\x3b\x14\x33\x15\x3b\x15\x33\x16\x2b\x36\x33\x36'\
-b'\x2a\xd4\x09\x49\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x09\x6a\x23\x37\x23\x38\x1b\x58'\
-b'\x1b\x58\x1b\x58\x1b\x58\x23\x58\x23\x58\x1b\x58\x23\x37\x2b\x37'\
-b'\x09\xee\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x21\x66\x64\x76\x33\xf9\x23\x37\x23\x58\x54\x9a\x85\x39'\
-b'\x84\xf8\x95\x59\xa5\xba\xa5\xba\xa5\xda\xa5\xda\xad\xda\xa5\xba'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\xa5\xba\xa5\xba\x6c\xfa\x44\x39'\
-b'\x64\xb9\xa5\xba\xad\xba\xa5\xd9\xa5\xda\xad\xd9\xad\xb9\x31\xc7'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xb0\xad\xfa\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xd9\xad\xfa\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xf9\xad\xd9\xb5\xda\xb5\xfa\xb5\xd9\xb5\xf9'\
-b'\xad\xf9\xb5\xd9\xb5\xf9\xb5\xda\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xad\xfa\x9d\x9a\x9d\x7a\x95\x99\x95\x9a\x9d\x7a\x95\x99\x9d\x9a'\
-b'\x9d\x99\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\x8d\x7a\x7d\x3a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\xf3\xad\xfa'\
-b'\xad\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xad\xf9\xb5\xfa\xb5\xd9\xb5\xd9'\
-b'\xad\xf9\xb5\xda\xad\xda\xad\xf9\xb5\xda\xb5\xda\xad\xd9\xb5\xfa'\
-b'\x84\x94\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x91\x85\x5a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x6c\xfa\x64\xda\x64\xfa\x6c\xda\x64\xda\x75\x1a'\
-b'\x5c\xdb\x33\x33\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x11\x05\x6c\x34\x7c\xd7\x63\xb2\x84\xf8\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x8d\x7a\x85\x3a\x74\xfa\x6c\xfa\x6c\xfb\x34\x1b\x23\x58'\
-b'\x23\x37\x23\xda\x6c\xfa\x8d\x7a\x95\x7b\x8d\x39\x8d\x39\x8d\x39'\
-b'\x85\x39\x7d\x19\x7c\xf9\x54\x7a\x1b\xba\x0b\x5a\x13\xba\x3c\x5a'\
-b'\x2b\xfa\x0b\x9a\x0b\x7a\x0b\x7a\x0b\x7a\x0b\x18\x00\xa5\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x19\x69\x52\x90\x62\x6f\x5a\x90\x42\xd3'\
-b'\x23\x38\x13\x79\x13\x79\x13\x9a\x0a\x51\x00\x00\x00\x00\x00\x00'\
-b'\x21\xec\x42\xf4\x2b\x16\x1b\x58\x23\x37\x3a\xd3\x4a\xb1\x52\xb1'\
-b'\x42\xd3\x2b\x16\x1b\x58\x1b\x79\x23\x58\x23\x37\x2b\x37\x33\x16'\
-b'\x33\x35\x33\x14\x4a\xb2\x62\x8f\x52\x90\x42\xf3\x3a\xf4\x3a\xf4'\
-b'\x3a\xf4\x3a\xf4\x42\xd3\x52\xb1\x62\x6f\x6a\x6e\x62\x6f\x5a\x90'\
-b'\x4a\xb1\x52\xb2\x52\xb1\x52\xb1\x52\xb0\x5a\x90\x5a\x4e\x5a\x6e'\
-b'\x62\x8e\x62\x6e\x62\x6f\x62\x8f\x20\xe5\x00\x00\x00\x00\x00\x41'\
-b'\x52\x2d\x62\x6e\x6a\x6d\x6a\x6e\x62\x6e\x5a\x8f\x62\x6f\x5a\x4e'\
-b'\x10\xa3\x00\x00\x00\x00\x32\x0d\x4a\xd2\x4a\xd2\x4a\xd2\x4a\xd2'\
-b'\x4a\xd2\x4a\xb2\x4a\xd2\x4a\xb2\x4a\xb2\x52\xb1\x5a\x90\x52\xb0'\
-b'\x4a\xb2\x42\xf3\x33\x15\x33\x15\x33\x15\x33\x16\x33\x16\x2b\x16'\
-b'\x2b\x37\x2a\xf5\x19\x69\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x84\x1b\x16\x23\x38\x23\x58'\
-b'\x23\x58\x1b\x58\x1b\x58\x1b\x58\x1b\x58\x23\x58\x1b\x58\x2b\x37'\
-b'\x09\x49\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x42\xcd\x85\x5b\x54\x9a\x23\x79\x23\x37\x3c\x1a\x7d\x3a'\
-b'\x95\x7a\x95\x7a\x9d\x9a\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xb9\xa5\xb9\xa5\xda\xa5\xd9\xad\xba\x9d\x9a\x3b\xd8\x2b\x16'\
-b'\x53\xf7\xa5\xda\xad\xda\xad\xb9\xad\xda\xad\xba\xa5\xb9\x31\xc7'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xb0\xb5\xfa\xb5\xda\xad\xd9'\
-b'\xb5\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xb5\xd9\xad\xda\xb5\xda'\
-b'\xb5\xda\xad\xd9\xb5\xfa\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xfa\xad\xd9\xad\xd9\xb5\xf9\xb5\xfa\xb5\xd9'\
-b'\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xfa'\
-b'\xb5\xfa\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x95\x7a\x9d\x9a'\
-b'\xa5\xba\xa5\x9a\xa5\xb9\xa5\xba\xa5\xba\x8d\x5a\x75\x1a\x64\x56'\
-b'\x08\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x5b\xd4\xad\xfa'\
-b'\xb5\xfa\xad\xd9\xb5\xfa\xb5\xda\xb5\xd9\xad\xf9\xb5\xda\xb5\xda'\
-b'\xad\xda\xb5\xd9\xad\xf9\xad\xda\xb5\xda\xad\xf9\xad\xda\xb5\xfa'\
-b'\x84\x73\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x92\x85\x5a\x85\x3a'\
-b'\x7d\x3a\x7d\x3a\x74\xfb\x64\xdb\x6c\xfa\x64\xda\x64\xdb\x6c\xda'\
-b'\x53\x95\x3a\x2d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x08\x61\x5b\x4f\x7c\xb7\x4b\x0e\x8d\x18\x8d\x7a\x95\x7a\x95\x7a'\
-b'\x8d\x7a\x8d\x5a\x85\x5a\x6c\xfa\x74\xfb\x5c\xba\x23\xda\x2b\x37'\
-b'\x23\x57\x3c\x3a\x7d\x3a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x7a'\
-b'\x8d\x5a\x85\x3a\x75\x1a\x44\x7b\x13\x9b\x0b\x9b\x23\xfb\x54\x9a'\
-b'\x34\x1b\x13\xbb\x0b\x9b\x0b\x9b\x0b\x9b\x0a\xd5\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x52\x90\x62\x8f\x5a\x90\x3a\xf3'\
-b'\x1b\x58\x13\x7a\x13\x79\x13\x7a\x12\xb4\x00\x20\x00\x00\x00\x00'\
-b'\x11\x6b\x3a\xf4\x3b\x14\x23\x38\x23\x37\x3a\xf4\x52\xd2\x52\xb1'\
-b'\x42\xf3\x2b\x36\x23\x38\x1b\x58\x23\x58\x23\x37\x2b\x16\x33\x16'\
-b'\x33\x15\x3a\xf4\x4a\xd2\x5a\x8f\x5a\x90\x42\xd3\x3a\xf4\x3a\xf4'\
-b'\x3a\xf4\x3a\xf4\x42\xd3\x52\xb1\x62\x8e\x62\x6e\x62\x6e\x5a\x90'\
-b'\x52\xb1\x4a\xd1\x52\xb1\x52\x90\x5a\x90\x5a\x8f\x62\x8f\x62\x6f'\
-b'\x62\x6e\x62\x6e\x62\x6e\x62\x6e\x18\xa3\x00\x00\x00\x00\x08\x62'\
-b'\x5a\x4e\x62\x6e\x6a\x4e\x6a\x6e\x62\x6e\x62\x6f\x62\x6f\x52\x6f'\
-b'\x10\x83\x00\x00\x00\x00\x31\xec\x52\xd1\x52\xb1\x4a\xb1\x52\xb1'\
-b'\x52\xb1\x52\xb1\x4a\xb1\x52\xb1\x52\xb1\x5a\xb0\x5a\x8f\x5a\x90'\
-b'\x4a\xd2\x42\xf4\x33\x15\x3b\x15\x33\x15\x33\x16\x2b\x36\x2b\x37'\
-b'\x2b\x16\x33\x16\x3a\xd3\x11\x06\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x21\x1a\x93\x1b\x58\x1b\x58'\
-b'\x1b\x58\x1b\x58\x23\x59\x1b\x59\x1b\x58\x1b\x59\x1b\x59\x1a\xd5'\
-b'\x00\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x40\x74\x33\x8d\x7a\x6c\xdb\x2b\xda\x23\x57\x2b\x99\x64\xbb'\
-b'\x8d\x5a\x95\x9a\x9d\x99\xa5\x99\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9'\
-b'\xad\xda\xad\xba\xa5\xb9\xad\xba\xad\xd9\x8d\x7a\x23\x99\x1b\x58'\
-b'\x54\x38\xa5\xba\xad\xba\xad\xd9\xad\xd9\xad\xda\xa5\xb9\x31\xc7'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xb0\xb5\xfa\xad\xda\xad\xd9'\
-b'\xad\xda\xb5\xda\xad\xd9\xad\xda\xb5\xda\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xd9\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xda\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xd9'\
-b'\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xda\xbd\xf9\xb5\xf9'\
-b'\xb5\xfa\x9d\xba\x9d\x9a\x9d\x79\x9d\x9a\x95\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\xba\xa5\xba\xa5\xba\xa5\xd9\xa5\xba\x8d\x5a\x7d\x1a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\xf3\xad\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xd9\xad\xf9\xb5\xda\xb5\xd9\xad\xd9\xb5\xf9'\
-b'\xad\xd9\xad\xd9\xb5\xda\xad\xda\xad\xd9\xb5\xda\xad\xda\xb5\xfa'\
-b'\x84\x93\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\xb1\x85\x5a\x85\x3a'\
-b'\x85\x3a\x7d\x3a\x74\xfa\x64\xda\x64\xda\x64\xda\x64\xda\x74\x98'\
-b'\x6a\x8f\x69\xea\x10\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x29\xc8\x63\x91\x29\xc8\x84\xf8\x95\x7a\x95\x9a\x95\x7a'\
-b'\x95\x7a\x8d\x5a\x85\x5a\x6c\xfa\x6c\xfa\x3c\x5b\x1b\x79\x2b\x16'\
-b'\x33\x57\x5c\xba\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x8d\x5a'\
-b'\x85\x5a\x85\x3a\x6c\xfa\x34\x3b\x0b\x9b\x13\xbb\x34\x1b\x5c\xba'\
-b'\x3c\x3b\x13\xdb\x13\xbb\x0b\x9b\x0b\xbc\x0a\xd5\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x52\x90\x62\x8f\x5a\x8f\x3a\xf4'\
-b'\x1b\x58\x13\x7a\x13\x79\x13\x7a\x13\x16\x00\x63\x00\x00\x00\x00'\
-b'\x09\x07\x32\xf4\x42\xd4\x33\x35\x2b\x37\x3a\xf4\x52\xd1\x52\xb1'\
-b'\x42\xd3\x33\x16\x23\x37\x23\x58\x23\x37\x2b\x37\x2b\x36\x33\x15'\
-b'\x3b\x15\x3a\xf5\x42\xd3\x5a\x8f\x62\x6f\x4a\xd2\x42\xf4\x42\xf4'\
-b'\x3a\xf4\x3a\xf4\x42\xf3\x52\xb1\x62\x8f\x62\x6e\x62\x6e\x5a\x90'\
-b'\x52\xb1\x52\xb1\x52\xb0\x5a\x90\x5a\x8f\x62\x8f\x62\x6e\x6a\x4e'\
-b'\x6a\x6d\x72\x4d\x6a\x6e\x5a\x0c\x08\x41\x00\x00\x00\x00\x18\xc4'\
-b'\x62\x6e\x62\x6e\x6a\x6d\x6a\x6e\x62\x6e\x62\x8e\x62\x6f\x52\x6f'\
-b'\x10\xa3\x00\x00\x00\x00\x39\xec\x52\xb1\x52\xb1\x52\xb1\x52\xb1'\
-b'\x52\xb1\x52\xb1\x52\xb0\x52\xb0\x52\xb0\x5a\x90\x5a\x8f\x52\x90'\
-b'\x42\xf3\x3a\xf4\x3b\x15\x33\x15\x33\x15\x33\x16\x2b\x36\x2b\x36'\
-b'\x33\x16\x33\x15\x42\xf4\x32\x71\x00\x62\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x12\x2f\x23\x58\x1b\x58'\
-b'\x1b\x59\x1b\x58\x1b\x79\x1b\x59\x1b\x79\x1b\x79\x1b\x79\x12\x0f'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x19\x46\x8d\x18\x95\x7a\x7d\x3a\x44\x5a\x23\x58\x1b\x58\x44\x7a'\
-b'\x85\x5a\x95\x7a\x9d\x9a\x9d\x9a\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xb9\xad\xda\xa5\xba\xa5\xd9\xad\xba\x8d\x5a\x23\xfb\x13\x7a'\
-b'\x4c\x59\xa5\xda\xad\xba\xad\xda\xad\xd9\xad\xb9\xa5\xb9\x31\xc8'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xb0\xb5\xfa\xad\xd9\xb5\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xb5\xda\xad\xda\xb5\xd9'\
-b'\xb5\xfa\xad\xd9\xb5\xda\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xd9\xad\xd9\xad\xd9\xb5\xda\xb5\xf9\xb5\xd9'\
-b'\xb5\xfa\xad\xf9\xb5\xd9\xb5\xfa\xad\xd9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xfa'\
-b'\xb5\xfa\xa5\xb9\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99'\
-b'\xa5\x9a\xa5\xba\xa5\xb9\xa5\xba\x9d\xba\x8d\x5a\x75\x1a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x5b\xf3\xad\xfa'\
-b'\xb5\xda\xb5\xfa\xb5\xf9\xad\xda\xb5\xd9\xb5\xfa\xad\xd9\xb5\xda'\
-b'\xad\xfa\xb5\xd9\xad\xf9\xb5\xda\xad\xf9\xad\xd9\xb5\xda\xb5\xfa'\
-b'\x84\x94\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x91\x85\x7b\x85\x5a'\
-b'\x85\x3a\x85\x3a\x75\x1b\x64\xfa\x64\xda\x64\xdb\x64\xda\x6c\xda'\
-b'\x4b\x76\x2a\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x41\x53\x2f\x5b\x70\x84\xf8\x8d\x7a\x8d\x7a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x3a\x6c\xda\x5c\xdb\x2b\xfa\x23\x38\x33\x16'\
-b'\x43\x96\x74\xfa\x95\x7a\x95\x9a\x95\x7a\x95\x7a\x8d\x7a\x8d\x5a'\
-b'\x85\x5a\x7d\x3a\x5c\xbb\x23\xfb\x0b\x9b\x1b\xdb\x3c\x5a\x64\xdb'\
-b'\x3c\x3b\x13\xdb\x13\xbb\x13\x9b\x0b\xbb\x0a\xd6\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x52\xb0\x5a\x6f\x5a\x90\x42\xd3'\
-b'\x23\x58\x13\x7a\x13\x7a\x13\x79\x13\x59\x00\xe7\x00\x00\x00\x00'\
-b'\x00\x63\x22\xd4\x42\xf3\x3a\xf4\x2b\x16\x3a\xf4\x52\xb1\x52\xb1'\
-b'\x42\xd2\x33\x16\x23\x37\x23\x37\x2b\x37\x2b\x16\x33\x16\x33\x15'\
-b'\x3b\x15\x3a\xf4\x42\xf3\x5a\x90\x62\x6e\x52\xb1\x42\xd3\x3a\xf4'\
-b'\x3a\xf4\x3a\xf3\x42\xf3\x4a\xb2\x5a\x8f\x62\x6e\x62\x6f\x5a\x8f'\
-b'\x52\xb0\x52\xb1\x5a\x90\x62\x6e\x62\x6e\x6a\x4d\x72\x4d\x72\x4c'\
-b'\x72\x4c\x72\x4c\x7a\x4c\x51\xa9\x00\x00\x00\x00\x00\x00\x29\x27'\
-b'\x62\x6e\x6a\x6e\x6a\x6e\x62\x6e\x62\x6e\x62\x6e\x62\x6f\x52\x6f'\
-b'\x10\xa3\x00\x00\x00\x00\x31\xec\x52\xb1\x52\xb1\x52\xb0\x52\x90'\
-b'\x52\x90\x52\xb0\x52\x90\x5a\xb0\x5a\x90\x62\x6f\x62\x8f\x52\xb1'\
-b'\x42\xd3\x3a\xf4\x3b\x15\x33\x15\x33\x15\x2b\x36\x2b\x17\x2b\x16'\
-b'\x33\x15\x3a\xf4\x3a\xf4\x33\x15\x19\xab\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\xcd\x1b\x58\x23\x78'\
-b'\x1b\x59\x1b\x78\x1b\x59\x1b\x79\x1b\x78\x13\x79\x13\x79\x01\x6a'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x4a\xcd\x95\x7a\x95\x9a\x8d\x5a\x5c\xbb\x23\xba\x1b\x58\x33\xfa'\
-b'\x75\x1a\x95\x7a\x95\x7a\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9'\
-b'\xad\xba\xa5\xb9\xad\xb9\xad\xda\xad\xda\x7d\x3a\x1b\xda\x13\x59'\
-b'\x4c\x18\xa5\xda\xad\xb9\xad\xda\xad\xda\xad\xd9\xa5\xb9\x31\xc8'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6b\xd0\xb6\x1a\xb5\xfa\xb5\xfa'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xda\xb5\xfa\xb5\xfa\xad\xfa\xb5\xfa'\
-b'\xb5\xfa\xad\xfa\xb5\xfa\x4a\xab\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xad\xf9\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xfa\xb5\xd9'\
-b'\xb5\xd9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xa5\xba\x9d\x9a\x9d\x99\x95\x7a\x9d\x99\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\xa5\xba\xa5\xba\xa5\xb9\xa5\x9a\x85\x5a\x75\x1a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\xf3\xad\xda'\
-b'\xb5\xda\xb5\xf9\xb5\xda\xb5\xd9\xad\xd9\xad\xd9\xb5\xd9\xad\xd9'\
-b'\xad\xd9\xad\xda\xb5\xd9\xad\xda\xb5\xd9\xad\xf9\xad\xda\xb5\xfa'\
-b'\x84\x73\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\xb1\x8d\x7a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x75\x1a\x6c\xdb\x6c\xda\x6c\xfa\x6c\xfa\x6c\xfb'\
-b'\x34\x3b\x12\xf5\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x11\x04\x74\x75\x7c\xd8\x84\xf8\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x7d\x3a\x64\xda\x4c\x7b\x1b\x99\x23\x37\x23\x37'\
-b'\x4b\xd7\x85\x3a\x95\x9a\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x8d\x5a'\
-b'\x85\x3a\x7d\x1a\x4c\x7a\x1b\xdb\x0b\x9b\x23\xfb\x4c\x7a\x6c\xfa'\
-b'\x34\x3b\x13\xbb\x13\xbb\x0b\xbb\x0b\xbc\x0a\xd6\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xe5\x52\x90\x5a\x90\x5a\x90\x42\xf3'\
-b'\x23\x38\x13\x79\x13\x7a\x13\x7a\x13\x7a\x01\xac\x00\x00\x00\x00'\
-b'\x00\x00\x12\x51\x3b\x15\x42\xd3\x3b\x15\x3a\xf3\x4a\xd2\x52\xb1'\
-b'\x4a\xd2\x33\x15\x2b\x37\x2b\x37\x2b\x37\x2b\x36\x33\x15\x3b\x15'\
-b'\x3b\x14\x3a\xf4\x3a\xf3\x52\xb1\x62\x6e\x5a\x90\x42\xd2\x42\xf4'\
-b'\x3a\xf4\x42\xf4\x42\xd3\x4a\xd2\x5a\x90\x62\x6f\x62\x6f\x5a\x90'\
-b'\x52\xb0\x52\xb1\x5a\x90\x6a\x4d\x72\x4c\x7a\x2c\x7a\x2b\x7a\x2c'\
-b'\x7a\x2b\x7a\x2b\x7a\x2b\x31\x05\x00\x00\x00\x00\x00\x00\x41\xaa'\
-b'\x62\x8e\x6a\x6e\x62\x6e\x62\x6e\x62\x6e\x6a\x6e\x62\x8f\x52\x8f'\
-b'\x08\xa4\x00\x00\x00\x00\x39\xec\x52\xb1\x52\xb1\x52\xb0\x5a\x90'\
-b'\x5a\x90\x5a\x90\x5a\x90\x5a\x90\x5a\x6f\x62\x6e\x5a\x8f\x4a\xb2'\
-b'\x42\xf3\x3a\xf4\x3a\xf4\x33\x16\x33\x16\x33\x16\x2b\x36\x33\x16'\
-b'\x3b\x15\x3a\xf4\x3a\xf4\x33\x16\x2a\xb3\x00\x42\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\xac\x1b\x78\x1b\x79'\
-b'\x1b\x59\x1b\x59\x1b\x79\x13\x59\x13\x79\x1b\x79\x13\x38\x00\xc5'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x61'\
-b'\x74\x55\x95\x9a\x95\x7a\x95\x7a\x6c\xfa\x2b\xfa\x23\x58\x23\x79'\
-b'\x5c\x9b\x8d\x5a\x95\x9a\xa5\x9a\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xad\xba\xa5\xb9\xa5\xda\xad\xba\x7d\x3a\x44\x5a\x23\xba'\
-b'\x54\x59\xa5\xda\xad\xda\xad\xd9\xad\xb9\xad\xda\xad\xb9\x5b\x2e'\
-b'\x31\xc8\x31\xe8\x39\xe8\x39\xe8\x5b\x0d\x6b\xd1\x6b\xb0\x6b\xb0'\
-b'\x73\xd1\x6b\xd0\x73\xd0\x73\xd1\x6b\xd0\x6b\xb0\x73\xb0\x6b\xd0'\
-b'\x73\xd1\x6b\xd0\x73\xd0\x29\xa7\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xda\xad\xd9\xad\xd9\xb5\xfa\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xd9\xad\xda\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa'\
-b'\xbd\xfa\xa5\xb9\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\xa5\xb9\xa5\x9a\xa5\xb9\xa5\xba\x9d\xba\x85\x3a\x75\x1a\x64\x36'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x63\xf3\xad\xfa'\
-b'\xb5\xf9\xb5\xd9\xad\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xda\xad\xfa'\
-b'\xb5\xd9\xad\xf9\xad\xda\xb5\xda\xad\xf9\xad\xda\xb5\xda\xb5\xfa'\
-b'\x84\x74\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x91\x8d\x7b\x85\x5a'\
-b'\x85\x3a\x85\x3a\x75\x1a\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfa'\
-b'\x44\x7b\x23\x77\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x4a\xee\x85\x39\x74\x75\x74\xb6\x8d\x5a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x64\xba\x34\x1b\x1b\x79\x23\x37\x23\x9a'\
-b'\x5c\x7a\x8d\x7a\x9d\x9a\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x8d\x5a'\
-b'\x85\x3a\x6c\xfa\x3c\x3a\x13\xbb\x13\xbb\x2c\x1b\x54\xba\x6c\xfb'\
-b'\x3c\x3a\x13\xdb\x13\xbc\x13\xbb\x13\xbb\x0a\xd5\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x52\x90\x5a\x90\x4a\xb1\x42\xf3'\
-b'\x33\x16\x1b\x59\x13\x7a\x13\x7a\x13\x7a\x0a\x92\x00\x00\x00\x00'\
-b'\x00\x00\x01\x6a\x2b\x36\x42\xf3\x42\xf3\x42\xd4\x4a\xd2\x52\xb0'\
-b'\x4a\xd2\x3a\xf5\x23\x37\x2b\x36\x2b\x16\x33\x16\x33\x15\x3b\x15'\
-b'\x3a\xf5\x3a\xf4\x3a\xf4\x52\xb1\x62\x8f\x5a\x8f\x4a\xd2\x3a\xf4'\
-b'\x3b\x14\x3a\xf4\x42\xf3\x4a\xd2\x52\xb1\x62\x8f\x62\x8f\x5a\x8f'\
-b'\x5a\xb0\x52\xb1\x5a\x90\x62\x6e\x6a\x4e\x72\x4c\x72\x4c\x72\x4c'\
-b'\x7a\x2b\x7a\x2c\x6a\x0b\x10\x62\x00\x00\x00\x00\x08\x41\x5a\x2c'\
-b'\x6a\x6e\x62\x6e\x62\x6e\x62\x6e\x62\x6e\x62\x6e\x5a\x8f\x4a\x90'\
-b'\x10\x84\x00\x00\x00\x00\x39\xec\x52\xb1\x52\xb1\x52\xb0\x52\x90'\
-b'\x52\x90\x5a\x90\x5a\x90\x5a\x6f\x62\x8f\x62\x6e\x5a\x90\x4a\xd2'\
-b'\x42\xf3\x42\xf4\x3a\xf4\x33\x15\x33\x16\x2b\x16\x33\x36\x33\x15'\
-b'\x3a\xf4\x3a\xf4\x33\x15\x2b\x36\x2b\x15\x11\x27\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\xac\x1b\x78\x1b\x59'\
-b'\x1b\x59\x1b\x59\x1b\x79\x13\x79\x1b\x59\x13\x7a\x0a\xd5\x00\x42'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x32\x0a'\
-b'\x8d\x5a\x95\x7a\x95\x7a\x95\x9a\x8d\x5a\x4c\x7b\x1b\x99\x1b\x58'\
-b'\x3c\x3a\x7d\x3a\x95\x7a\x9d\x9a\xa5\xba\xa5\xb9\xa5\xba\xa5\xba'\
-b'\xad\xb9\xa5\xd9\xa5\xba\xad\xd9\xa5\xba\x8d\x5a\x6c\xfa\x64\xda'\
-b'\x7d\x3a\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xd9\xad\xb9\xad\xda\xad\xb9\x3a\x08\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xad\xd9\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xda\xb5\xd9'\
-b'\xb5\xfa\xad\xd9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xd9'\
-b'\xb5\xda\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xbe\x1a\xad\xda\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99'\
-b'\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\x85\x3a\x75\x1a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x63\xf4\xad\xfa'\
-b'\xb5\xda\xb5\xf9\xb5\xda\xb5\xd9\xad\xd9\xb5\xf9\xb5\xda\xb5\xd9'\
-b'\xad\xd9\xad\xda\xb5\xf9\xad\xda\xad\xda\xb5\xd9\xad\xd9\xb5\xfa'\
-b'\x84\x94\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\xb1\x8d\x7a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x7d\x3a\x6c\xfa\x74\xfb\x74\xfb\x6d\x1a\x75\x1b'\
-b'\x54\x9b\x33\x75\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x29\xa8\x85\x19\x53\x30\x64\x14\x8d\x7a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x3a\x7d\x1a\x4c\x9a\x23\xda\x23\x58\x1b\x59\x2b\xfb'\
-b'\x6d\x1a\x95\x7a\x95\x79\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x85\x5a'\
-b'\x85\x3a\x64\xdb\x2c\x1b\x0b\x9b\x1b\xdb\x3c\x3b\x64\xda\x74\xfa'\
-b'\x3c\x3b\x13\xdb\x13\xbb\x13\x9b\x0b\xbc\x0a\xf6\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x52\xb0\x52\xb1\x4a\xd2\x3a\xf4'\
-b'\x33\x15\x23\x37\x13\x7a\x13\x7a\x0b\x7a\x13\x38\x00\xa5\x00\x00'\
-b'\x00\x00\x00\x63\x1a\xd5\x3a\xf5\x42\xd3\x42\xf3\x4a\xd2\x52\xb1'\
-b'\x4a\xd2\x32\xf5\x2b\x36\x2b\x37\x2b\x36\x33\x15\x2a\x91\x22\x2f'\
-b'\x32\xd2\x3a\xf4\x3a\xf4\x4a\xd2\x5a\x8f\x62\x6f\x4a\xd1\x3a\xb2'\
-b'\x32\xb2\x32\xb2\x3a\x91\x42\x91\x4a\x6f\x52\x4e\x52\x2d\x52\x4e'\
-b'\x52\x6f\x52\xb0\x5a\x90\x5a\x90\x62\x8e\x6a\x4d\x72\x4d\x72\x4c'\
-b'\x6a\x4c\x72\x4d\x49\x88\x00\x00\x00\x00\x00\x00\x21\x05\x62\x6e'\
-b'\x62\x6e\x62\x6e\x62\x6f\x62\x6f\x62\x6e\x6a\x6e\x5a\x90\x4a\x91'\
-b'\x10\xa4\x00\x00\x00\x00\x32\x0c\x52\xb1\x52\xb1\x5a\x90\x52\x90'\
-b'\x5a\x90\x5a\x90\x5a\x90\x5a\x8f\x62\x6e\x62\x8f\x52\x90\x4a\xd2'\
-b'\x42\xd3\x42\xf4\x3b\x15\x33\x15\x33\x16\x2b\x36\x33\x16\x3a\xf4'\
-b'\x3a\xf4\x3b\x15\x33\x36\x2b\x36\x2b\x37\x19\xac\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\xee\x1b\x79\x1b\x79'\
-b'\x1b\x59\x13\x79\x13\x79\x13\x7a\x13\x7a\x13\x9a\x0a\x51\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\xb2'\
-b'\x95\x7a\x95\x7a\x95\x7a\x9d\x9a\x8d\x7a\x64\xda\x23\xda\x1b\x59'\
-b'\x23\xda\x6c\xda\x8d\x5a\x9d\x9a\x9d\xb9\xa5\xb9\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xad\xba\xad\xda\xa5\xb9\xa5\xba\x95\x9a\x8d\x5a\x85\x5a'\
-b'\x95\x9a\xad\xba\xad\xda\xad\xd9\xad\xda\xad\xb9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xb9\x31\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xda\xad\xd9\xad\xf9\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xbd\xfa\xad\xda\x9d\x99\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\x9d\xba\x85\x3a\x75\x1a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x64\x13\xb5\xfa'\
-b'\xb5\xf9\xb5\xda\xad\xf9\xb5\xfa\xb5\xda\xad\xf9\xb5\xf9\xad\xfa'\
-b'\xb5\xd9\xb5\xd9\xad\xfa\xb5\xfa\xb5\xfa\xad\xf9\xb5\xfa\xb5\xfa'\
-b'\x84\x94\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\xb1\x8d\x7a\x8d\x5a'\
-b'\x85\x5a\x85\x5a\x7d\x3a\x75\x1a\x74\xfa\x75\x1a\x75\x1a\x7d\x3a'\
-b'\x5c\xba\x4c\x18\x08\xa3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x41\x3a\x8c\x7c\xf8\x3a\x4a\x4b\x0e\x8d\x7a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x75\x1a\x34\x3a\x1b\x79\x23\x58\x13\x9a\x3c\x3a'\
-b'\x85\x3a\x9d\x7a\x95\x9a\x9d\x7a\x95\x7a\x8d\x7a\x8d\x5a\x85\x5a'\
-b'\x7d\x3a\x54\x9a\x1b\xdb\x13\xbb\x23\xfb\x44\x7b\x6c\xfa\x6d\x1a'\
-b'\x3c\x3b\x1b\xdb\x13\xbb\x13\xbb\x13\xbb\x0a\xf6\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x52\x90\x52\xb1\x42\xf3\x33\x15'\
-b'\x33\x16\x33\x16\x1b\x58\x13\x9a\x0b\x9b\x0b\x9a\x01\xcd\x00\x00'\
-b'\x00\x00\x00\x00\x01\xcd\x2b\x37\x42\xd2\x4a\xd2\x4a\xd2\x4a\xb1'\
-b'\x4a\xd3\x33\x15\x2b\x36\x2b\x37\x23\x37\x19\xcd\x00\x21\x00\x00'\
-b'\x08\xc5\x32\x91\x3a\xf4\x42\xd3\x5a\x90\x62\x6e\x31\xab\x08\x83'\
-b'\x00\x62\x00\x42\x00\x62\x00\x62\x08\x42\x08\x41\x08\x41\x08\x42'\
-b'\x18\xe5\x4a\x4f\x52\xb1\x52\x90\x5a\x8f\x6a\x6e\x6a\x4d\x6a\x4d'\
-b'\x6a\x4d\x6a\x2c\x20\xa3\x00\x00\x00\x00\x00\x00\x49\xca\x62\x6f'\
-b'\x62\x6e\x6a\x6e\x62\x8f\x62\x8f\x62\x6e\x62\x6e\x5a\xb0\x42\xb1'\
-b'\x08\xa4\x00\x00\x00\x00\x31\xed\x52\xd2\x52\xb1\x52\xb1\x52\xb0'\
-b'\x52\x90\x5a\x90\x5a\x90\x5a\x6f\x62\x6f\x5a\x8f\x52\xb1\x42\xd2'\
-b'\x42\xd3\x3a\xf4\x33\x15\x33\x16\x2b\x36\x33\x16\x3b\x15\x42\xf4'\
-b'\x33\x15\x2b\x16\x2b\x37\x2b\x37\x2b\x37\x22\x2f\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x12\x51\x1b\x79\x1b\x59'\
-b'\x13\x79\x13\x7a\x13\x7a\x13\x7a\x0b\x7a\x0b\x9b\x01\xee\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x61\x74\x75'\
-b'\x8d\x7a\x95\x7a\x95\x7a\x95\x9a\x95\x7a\x75\x1a\x3c\x3a\x1b\x79'\
-b'\x1b\x79\x44\x7b\x85\x5a\x9d\x7a\x9d\x9a\xa5\xba\xa5\xba\xa5\xba'\
-b'\xa5\xba\xa5\xb9\xad\xd9\xad\xda\xa5\xba\x95\x7a\x8d\x7a\x8d\x7a'\
-b'\x9d\x9a\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xb9\x39\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xd9\xb5\xda\xb5\xda\xb5\xf9\xb5\xd9\xb5\xda'\
-b'\xad\xf9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xda\xb5\xf9\xad\xd9\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xfa\xad\xda\xa5\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\xa5\x99'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\x85\x5a\x7d\x3a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x64\x13\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xda\xb5\xd9\xb5\xf9\xb5\xda'\
-b'\xad\xd9\xad\xfa\xa5\x78\x94\xf5\x94\xf5\x94\xf5\x94\xf6\x95\x16'\
-b'\x73\xd0\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x82'\
-b'\x10\xa3\x10\xc3\x08\xa3\x10\xc3\x10\xc3\x63\xf3\x8d\x7a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x7d\x3a\x7d\x1a\x7d\x1b\x75\x1a\x7d\x1a\x85\x5a'\
-b'\x64\xfa\x5c\x99\x10\xe5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x20\x32\x0a\x84\xf8\x42\xad\x42\xad\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x5a\x85\x3a\x64\xfa\x23\xda\x1b\x58\x1b\x58\x23\xda\x4c\x9b'\
-b'\x8d\x5a\x9d\x7a\x95\x9a\x95\x7a\x95\x7a\x8d\x59\x8d\x5a\x85\x5a'\
-b'\x75\x1a\x44\x5b\x1b\xdb\x13\xbb\x2c\x1b\x54\x9a\x74\xfa\x75\x1a'\
-b'\x3c\x3b\x13\xdb\x13\xbc\x13\xbb\x13\xbc\x0a\xf6\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x52\xb1\x52\xd1\x3a\xf4\x2b\x37'\
-b'\x23\x37\x33\x15\x2b\x37\x13\x7a\x0b\x9b\x13\x9b\x0a\xf6\x00\x42'\
-b'\x00\x00\x00\x00\x00\x63\x1a\xd5\x3b\x14\x4a\xd2\x4a\xd2\x4a\xb1'\
-b'\x42\xd3\x33\x15\x2b\x37\x23\x37\x22\xd5\x00\x63\x00\x00\x00\x00'\
-b'\x00\x00\x19\x6a\x3b\x15\x3a\xf4\x52\xb1\x5a\x4d\x08\x62\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x29\x69\x4a\xd1\x52\xb1\x5a\x90\x62\x6f\x6a\x6d\x6a\x4d'\
-b'\x6a\x4d\x49\x89\x00\x00\x00\x00\x00\x00\x10\xa3\x5a\x6e\x62\x6f'\
-b'\x62\x6f\x62\x6f\x5a\x8f\x5a\x6f\x62\x6e\x5a\x8f\x52\xb1\x42\xb2'\
-b'\x08\xa4\x00\x00\x00\x00\x32\x0d\x42\xd3\x4a\xd2\x4a\xb2\x52\xb2'\
-b'\x4a\xb1\x52\xb1\x52\xb0\x62\x6f\x5a\x8f\x5a\x90\x4a\xb2\x4a\xd3'\
-b'\x42\xf3\x33\x15\x33\x16\x33\x36\x2b\x36\x33\x16\x3a\xf4\x3a\xf4'\
-b'\x2b\x16\x2b\x37\x2b\x37\x2b\x36\x2b\x37\x22\x71\x00\x20\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\x12\xd4\x1b\x79\x13\x79'\
-b'\x13\x7a\x13\x7a\x13\x7a\x0b\x9a\x0b\x9b\x0b\x9b\x01\x8b\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x11\x05\x7c\xf8'\
-b'\x8d\x7a\x95\x7a\x95\x7a\x9d\x7a\x95\x7a\x85\x5a\x54\xbb\x1b\xba'\
-b'\x1b\x79\x34\x1b\x75\x1a\x95\x7a\x9d\x9a\x9d\xb9\xa5\xb9\xa5\xba'\
-b'\xad\xda\xa5\xb9\xad\xda\xa5\xba\xa5\xb9\x95\x7a\x95\x79\x95\x7a'\
-b'\x9d\x99\xad\xda\xa5\xda\xad\xda\xad\xd9\xa5\xba\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xb9\x31\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xda\xad\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xbe\x1a\xb5\xf9\x9d\xba\x9d\x99\x9d\x9a\x9d\x9a\xa5\xba\x9d\xba'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\x85\x3a\x75\x1a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x6c\x14\xb5\xfa'\
-b'\xb5\xf9\xad\xda\xb5\xf9\xad\xfa\xb5\xf9\xad\xfa\xb5\xf9\xb5\xd9'\
-b'\xb5\xda\xb5\xfa\x73\xb0\x08\xa2\x10\x82\x10\xa2\x08\x82\x10\x82'\
-b'\x08\x61\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x61\x74\x13'\
-b'\x84\xf7\x84\xf7\x84\xf7\x84\xd7\x84\xd7\x8d\x39\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x8d\x5a\x7d\x3a\x75\x1a\x7d\x1a\x7d\x1a\x7d\x3a\x8d\x5a'\
-b'\x7d\x1a\x6c\xb9\x11\x25\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x20\x5b\x91\x4b\x0e\x42\x8c\x8d\x7a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x7d\x3a\x54\x9b\x1b\x9a\x23\x38\x1b\x79\x2c\x1b\x5c\xba'\
-b'\x8d\x5a\x9d\x9a\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x85\x5a\x85\x3a'\
-b'\x6c\xda\x34\x3b\x13\xbb\x1b\xdb\x3c\x3b\x5c\xba\x75\x1a\x75\x1b'\
-b'\x3c\x3b\x1b\xdb\x13\xdb\x13\xbb\x13\xbb\x0a\xf6\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x4a\xb1\x4a\xd2\x3a\xf4\x1b\x58'\
-b'\x1b\x79\x2b\x37\x33\x15\x23\x58\x0b\x9b\x0b\x9b\x0b\x7a\x01\xac'\
-b'\x00\x00\x00\x00\x00\x00\x01\x6a\x2b\x16\x4a\xd2\x52\xb2\x4a\xd2'\
-b'\x42\xd3\x33\x16\x23\x58\x23\x58\x1a\xd4\x00\x62\x00\x00\x00\x00'\
-b'\x00\x00\x11\x6a\x33\x36\x33\x15\x4a\xd2\x5a\x4e\x10\x62\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x29\x8a\x4a\xd2\x4a\xd2\x52\xb1\x5a\x90\x5a\x8f\x62\x8f'\
-b'\x5a\x2d\x10\x83\x00\x00\x00\x00\x00\x00\x39\xab\x52\x90\x5a\x90'\
-b'\x5a\x8f\x5a\x8f\x5a\x90\x5a\x8f\x62\x6f\x5a\xb0\x4a\xd2\x3a\xb2'\
-b'\x08\xa4\x00\x00\x00\x00\x2a\x2e\x3b\x14\x3a\xf4\x42\xf3\x42\xf3'\
-b'\x42\xd3\x4a\xd2\x52\xb1\x5a\x8f\x52\x90\x4a\xb2\x42\xf3\x42\xf3'\
-b'\x3a\xf5\x33\x16\x2b\x36\x2b\x36\x2b\x16\x3b\x15\x3a\xf4\x2b\x16'\
-b'\x2b\x37\x23\x37\x23\x37\x23\x37\x23\x37\x22\x71\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe6\x1b\x38\x13\x79\x13\x7a'\
-b'\x13\x7a\x0b\x9a\x0b\x9a\x0b\x9b\x13\x9b\x0b\x7a\x00\xe7\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x29\xa8\x85\x39'\
-b'\x8d\x7a\x95\x7a\x9d\x9a\x9d\x9a\x9d\x9a\x95\x7a\x64\xd9\x2b\xb9'\
-b'\x12\xf7\x1a\xb3\x32\xaf\x3a\x4a\x63\xb1\x9d\x9a\xa5\xda\xad\xda'\
-b'\xa5\xda\xad\xda\xad\xda\xad\xda\xa5\xb9\x95\x7a\x95\x7a\x9d\x9a'\
-b'\x9d\x9a\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xd9\xad\xda\xad\xb9\x5b\x0d\x29\x86\x29\x86\x29\x86'\
-b'\x29\x86\x29\x86\x29\x87\x29\x86\x29\x86\x29\x86\x29\x86\x29\x87'\
-b'\x29\x86\x29\x86\x29\x86\x10\xa2\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x5a\xec\xb5\xfa\xb5\xd9\xb5\xd9\xad\xfa\xb5\xfa\xb5\xd9\xb5\xd9'\
-b'\xad\xf9\xb5\xd9\xb5\xd9\xad\xf9\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xbd\xf9\xb5\xda\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xfa\xa5\x99\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\xa5\x9a'\
-b'\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\x9d\xba\x85\x3a\x7d\x1a\x5c\x36'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x6c\x13\xad\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xda\xb5\xda\xad\xd9\xb5\xd9'\
-b'\xad\xd9\xb5\xfa\x63\x6f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x61\x7c\xb6'\
-b'\x9d\x9a\x9d\x7a\x95\x9a\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x8d\x7a'\
-b'\x8d\x7a\x8d\x5a\x85\x3a\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x8d\x7a'\
-b'\x85\x3a\x74\xd8\x19\x25\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x20\x63\xf2\x74\x55\x53\x2f\x8d\x5a\x8d\x5a\x8d\x5a'\
-b'\x85\x3a\x6c\xfa\x3c\x5b\x1b\x79\x1b\x58\x1b\xbb\x3c\x5b\x6c\xfa'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x79\x8d\x5a\x8d\x5a\x7d\x3a'\
-b'\x5c\xba\x2c\x1b\x13\xbb\x23\xfb\x44\x7b\x6c\xda\x75\x1a\x75\x1a'\
-b'\x3c\x5a\x1b\xdb\x1b\xdb\x1b\xbb\x13\xdc\x12\xf5\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x4a\xb1\x4a\xd2\x32\xf5\x1b\x59'\
-b'\x0b\x7a\x1b\x79\x2b\x36\x2b\x36\x13\x7a\x0b\x9b\x0b\x9b\x0b\x17'\
-b'\x00\x63\x00\x00\x00\x00\x00\x20\x12\x2f\x42\xf4\x4a\xd2\x4a\xd2'\
-b'\x42\xf3\x2b\x36\x23\x58\x1b\x58\x1b\x58\x09\x8b\x00\x00\x00\x00'\
-b'\x00\x63\x1a\x92\x2b\x37\x2b\x16\x3a\xf4\x5a\x8f\x41\xaa\x08\x84'\
-b'\x00\x83\x00\x63\x00\x63\x00\x83\x00\x63\x00\x63\x08\x62\x08\x62'\
-b'\x19\x06\x42\x90\x42\xd3\x42\xd3\x4a\xd2\x4a\xb2\x52\xb1\x52\xb1'\
-b'\x21\x27\x00\x00\x00\x00\x00\x00\x10\xe5\x4a\xb1\x4a\xb1\x52\xb1'\
-b'\x5a\x90\x5a\x90\x52\x90\x62\x8f\x5a\x8f\x4a\xb1\x42\xf4\x3a\xd4'\
-b'\x08\xa4\x00\x00\x00\x00\x22\x2f\x33\x15\x3a\xf5\x3a\xf4\x3a\xf4'\
-b'\x42\xf4\x4a\xd2\x52\xb0\x52\xb0\x4a\xb2\x4a\xd2\x3a\xf4\x33\x15'\
-b'\x33\x15\x2b\x36\x2b\x37\x2b\x37\x33\x16\x3a\xf4\x2b\x35\x23\x37'\
-b'\x23\x58\x23\x58\x23\x37\x23\x38\x2b\x58\x1a\x50\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x09\xcd\x13\x7a\x13\x7a\x13\x7a'\
-b'\x0b\x9a\x0b\x9b\x0b\x9b\x0b\x9b\x13\xbc\x13\x37\x00\x63\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3a\x4b\x8d\x5a'\
-b'\x85\x39\x7c\xb7\x6c\x13\x5b\x90\x4a\xed\x3a\x4b\x21\xa8\x08\xe5'\
-b'\x00\x63\x00\x20\x00\x00\x00\x00\x08\x61\x53\x0e\x74\x12\x63\x6f'\
-b'\x5b\x0d\x5b\x4e\x73\xf1\x95\x37\x9d\xba\x95\x7a\x9d\x7a\x95\x9a'\
-b'\xa5\xb9\xad\xd9\xad\xda\xad\xb9\xad\xda\xad\xda\xad\xda\xad\xda'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\xad\xb9\xa5\xb9\xad\xb9\xad\xb9'\
-b'\xad\xb9\xad\xb9\xad\xb9\xad\xb9\xad\xb9\xad\xb9\xad\xb9\xad\xb9'\
-b'\xad\xb9\xad\xb9\xad\xb9\x42\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xad\xd9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xda'\
-b'\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xa5\xba\x9d\x99\x9d\x9a\x9d\x9a\xa5\x9a\x9d\xba'\
-b'\xa5\x99\xa5\xba\xa5\xba\xa5\xb9\x9d\x9a\x85\x3a\x75\x1b\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x6c\x33\xb6\x1a'\
-b'\xb5\xd9\xad\xda\xb5\xf9\xad\xfa\xb5\xf9\xb5\xd9\xb5\xd9\xad\xf9'\
-b'\xb5\xf9\xb5\xfa\x6b\x6f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x61\x7c\x95'\
-b'\x9d\x9a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x95\x7a'\
-b'\x8d\x5a\x8d\x5a\x85\x5a\x7d\x1a\x85\x3a\x85\x3a\x85\x3a\x8d\x7a'\
-b'\x8d\x5a\x7d\x19\x19\x26\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x20\x63\xd3\x74\x96\x5b\x91\x8d\x5a\x8d\x5a\x85\x5a'\
-b'\x7d\x3a\x5c\xbb\x2b\xfb\x1b\x59\x13\x79\x23\xfa\x54\xba\x7d\x1a'\
-b'\x95\x7a\x95\x7a\x9d\x7a\x95\x7a\x95\x7a\x8d\x5a\x85\x5a\x75\x1a'\
-b'\x4c\x7a\x23\xfb\x1b\xbb\x2c\x1b\x4c\x7a\x6c\xfa\x7d\x1a\x75\x1b'\
-b'\x3c\x5b\x23\xfb\x1b\xdb\x1b\xdb\x13\xdc\x0a\xf6\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x4a\xb1\x4a\xd3\x33\x16\x13\x79'\
-b'\x0b\x9b\x0b\x9b\x1b\x58\x33\x36\x23\x37\x13\x7a\x0b\xbb\x0b\x9b'\
-b'\x02\x10\x00\x00\x00\x00\x00\x00\x00\x63\x2a\x71\x4a\xd2\x4a\xb2'\
-b'\x3a\xf4\x2b\x36\x1b\x59\x1b\x59\x1b\x59\x1b\x38\x12\x50\x09\xee'\
-b'\x1a\xb4\x23\x37\x23\x37\x2b\x37\x33\x16\x52\xb1\x5a\x8f\x3a\xd3'\
-b'\x2a\xd4\x2a\xd3\x2a\xf4\x23\x16\x22\xf5\x3a\xb2\x42\x90\x4a\x90'\
-b'\x4a\xb1\x42\xd3\x42\xf4\x3a\xf4\x3a\xf3\x42\xf3\x42\xf3\x29\xcc'\
-b'\x00\x20\x00\x00\x00\x00\x00\x21\x32\x2f\x42\xf3\x4a\xd2\x52\xb1'\
-b'\x5a\x90\x52\xb0\x5a\xb0\x5a\x8f\x5a\x90\x42\xd3\x33\x15\x32\xf4'\
-b'\x08\xa4\x00\x00\x00\x00\x1a\x50\x33\x36\x33\x16\x33\x36\x33\x15'\
-b'\x3a\xf4\x42\xd3\x52\xb1\x4a\xd2\x42\xf3\x42\xf4\x3b\x15\x2b\x36'\
-b'\x2b\x37\x23\x37\x23\x37\x2b\x17\x3b\x15\x33\x15\x2b\x37\x23\x58'\
-b'\x23\x58\x23\x58\x23\x58\x23\x37\x23\x58\x11\xed\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x42\x12\xf5\x13\x9a\x13\x7a\x0b\x9a'\
-b'\x0b\x9b\x13\x9b\x13\x9b\x13\xbb\x13\xdc\x12\xb3\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x11\x05\x3a\x4b'\
-b'\x21\x87\x10\xa3\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x19\x04\x63\x70\x95\x59\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\xad\xda\xad\xb9\xad\xd9\xad\xd9\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xd9\xad\xd9\xad\xd9\xad\xda\xb5\xda\xad\xfa\xad\xf9'\
-b'\xad\xda\xad\xfa\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xd9\xad\xd9\xb5\xfa\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xda\xb5\xf9'\
-b'\xad\xd9\xb5\xd9\xb5\xf9\xad\xd9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xd9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xfa\xb5\xfa\xad\xda\x9d\xba\x9d\x9a\xa5\x9a\x9d\xb9\xa5\xb9'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xa5\xba\x9d\x9a\x85\x3a\x75\x3a\x64\x36'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x6c\x34\xb5\xfa'\
-b'\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9\xad\xda\xb5\xfa\xb5\xda\xb5\xd9'\
-b'\xad\xda\xb5\xfa\x63\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x61\x7c\xb6'\
-b'\x9d\x9a\x95\x7a\x95\x7a\x95\x9a\x95\x7a\x95\x7a\x8d\x79\x95\x7a'\
-b'\x8d\x7a\x8d\x5a\x85\x3a\x7d\x3a\x85\x5a\x85\x5a\x85\x5a\x95\x7a'\
-b'\x95\x7a\x7c\xf8\x19\x25\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x32\x2a\x5b\x91\x53\x2f\x8d\x59\x8d\x5a\x85\x3a'\
-b'\x75\x1a\x44\x7b\x1b\xba\x1b\x79\x1b\xba\x3c\x3a\x64\xda\x7d\x3a'\
-b'\x95\x7a\x9d\x7a\x95\x9a\x95\x7a\x8d\x79\x8d\x5a\x85\x5a\x6c\xfa'\
-b'\x3c\x5b\x1b\xdb\x23\xfb\x3c\x3b\x5c\xbb\x75\x1a\x7d\x3a\x75\x1a'\
-b'\x3c\x5a\x23\xfb\x1b\xfb\x1b\xdb\x1b\xdc\x13\x15\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc5\x4a\xb1\x42\xf3\x2b\x16\x13\x7a'\
-b'\x0b\x9b\x0b\x9b\x13\x7a\x23\x37\x33\x16\x1b\x59\x13\xbb\x13\xbb'\
-b'\x0b\x79\x01\x28\x00\x00\x00\x00\x00\x00\x08\xa4\x42\x70\x52\xd1'\
-b'\x3a\xf4\x23\x37\x13\x79\x0b\x9b\x13\x7a\x13\x79\x13\x7a\x1b\x79'\
-b'\x13\x79\x1b\x59\x1b\x58\x1b\x58\x23\x37\x4a\xd2\x62\x6f\x42\xf3'\
-b'\x2b\x36\x33\x36\x23\x37\x1b\x58\x23\x38\x33\x16\x42\xd3\x52\xb1'\
-b'\x4a\xd2\x42\xf3\x33\x14\x33\x15\x33\x15\x33\x15\x2a\x2f\x00\x42'\
-b'\x00\x00\x00\x00\x00\x00\x19\x8b\x32\xf4\x3a\xf4\x42\xd3\x4a\xd1'\
-b'\x52\xb1\x52\xb1\x5a\x90\x62\x6f\x4a\xb1\x3a\xf4\x2b\x36\x2a\xf5'\
-b'\x08\xa5\x00\x00\x00\x00\x1a\x51\x23\x37\x23\x37\x2b\x36\x2b\x16'\
-b'\x32\xf5\x4a\xd2\x4a\xd2\x3a\xf4\x33\x15\x3a\xf3\x32\xf5\x2b\x37'\
-b'\x23\x37\x23\x37\x23\x37\x33\x16\x3a\xf5\x2b\x16\x1b\x38\x1b\x58'\
-b'\x1b\x58\x1b\x38\x1b\x58\x1b\x38\x1b\x38\x09\x28\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x01\x8b\x0b\x7a\x0b\x7a\x0b\x9b\x0b\x9b'\
-b'\x0b\x9b\x13\xbb\x13\xbb\x1b\xdb\x1b\xdb\x09\xee\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x5b\x4f\x9d\x7a\x9d\x9a'\
-b'\xa5\xb9\xad\xda\xa5\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xda'\
-b'\xad\xda\xad\xba\xad\xda\xb5\xda\xad\xd9\xad\xda\xb5\xd9\xad\xda'\
-b'\xb5\xf9\xad\xda\xb5\xda\xad\xd9\xb5\xf9\xb5\xd9\xad\xfa\xb5\xd9'\
-b'\xb5\xda\xad\xf9\xad\xda\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xda\xad\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xda\xb5\xfa\xb5\xf9\xb5\xda\xb5\xd9\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xad\xd9\x9d\x9a\xa5\xb9\x9d\xba\x9d\x9a\xa5\x9a'\
-b'\x9d\xba\xa5\xba\xa5\xb9\xad\xda\x9d\x9a\x85\x3a\x75\x3a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x74\x33\xb5\xfa'\
-b'\xad\xf9\xb5\xfa\xb5\xd9\xad\xfa\xb5\xf9\xb5\xf9\xad\xda\xb5\xda'\
-b'\xb5\xf9\xb5\xfa\x6b\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x61\x84\xb5'\
-b'\xa5\xba\x9d\xba\xa5\xb9\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\x99\x8d\x7a\x95\x79\x9d\x9a\x9d\x9a\x95\x9a\x9d\x99'\
-b'\x9d\x9a\x8d\x18\x21\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x32\x09\x84\x95\x5b\x4f\x95\x59\x95\x7a\x8d\x5a'\
-b'\x6c\xfa\x3c\x5b\x13\xbb\x13\x9a\x34\x1b\x5c\xdb\x85\x5a\x95\x7a'\
-b'\x9d\x9a\x95\x7a\x95\x7a\x95\x7a\x95\x5a\x8d\x5a\x85\x3a\x5c\xba'\
-b'\x34\x1b\x1b\xdb\x23\xfb\x44\x5b\x64\xda\x7d\x3a\x7d\x3a\x7d\x1a'\
-b'\x5c\xba\x4c\x9b\x4c\x7b\x4c\x7a\x44\x7b\x33\x95\x00\x21\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xe5\x3a\xd3\x33\x15\x2b\x78\x34\x1a'\
-b'\x3c\x3b\x3c\x3b\x34\x3b\x34\x1a\x2b\x78\x1b\x58\x2b\xfb\x34\x3b'\
-b'\x34\x3b\x2b\x97\x08\xc4\x00\x00\x00\x00\x00\x00\x10\xc5\x3a\x70'\
-b'\x3a\xf5\x2b\x79\x23\xfa\x2c\x1b\x33\xfb\x2b\xfa\x2c\x1a\x33\xfa'\
-b'\x2b\xfa\x33\xfa\x33\xfa\x33\xd9\x2b\xd9\x3b\x36\x5a\x90\x42\xd3'\
-b'\x23\x58\x23\x78\x23\x99\x23\xda\x2b\xda\x2b\x78\x33\x15\x42\xf3'\
-b'\x3a\xf4\x33\x16\x2b\x58\x33\xb8\x3b\xd9\x2a\xb2\x00\x63\x00\x00'\
-b'\x00\x00\x00\x00\x11\x68\x3b\x97\x43\xd8\x33\x77\x33\x16\x42\xf3'\
-b'\x42\xd3\x42\xd3\x52\xb1\x52\xb0\x3b\x15\x33\x98\x2b\x99\x23\x37'\
-b'\x00\xc5\x00\x00\x00\x00\x22\xf2\x3b\xf9\x3b\xd9\x43\xf8\x3b\xd8'\
-b'\x33\x57\x3a\xf4\x33\x36\x2b\x78\x23\x58\x2b\x36\x23\x58\x23\x99'\
-b'\x33\xd9\x33\xd9\x2b\x99\x2b\x57\x33\x98\x3b\xf9\x3c\x19\x3b\xf9'\
-b'\x3c\x1a\x3b\xfa\x3c\x19\x3c\x19\x33\x56\x00\x83\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x83\x2b\x55\x3c\x1a\x34\x3b\x3c\x3a\x3c\x3b'\
-b'\x3c\x5a\x44\x5a\x44\x7b\x44\x7b\x44\x5a\x11\x68\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\xc3\x84\xb6\x9d\xba'\
-b'\xa5\xb9\xad\xd9\xad\xd9\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda'\
-b'\xb5\xd9\xad\xda\xad\xda\xad\xda\xb5\xda\xb5\xfa\xb5\xfa\xb5\xfa'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\xad\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xad\xfa'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\x4a\x8a\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x52\xec\xb5\xfa\xb5\xf9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xbd\xfa\xb5\xfa\xad\xda\xa5\xba\xa5\xba\xa5\x9a\x9d\x99\xa5\x99'\
-b'\xa5\xba\xa5\xba\xa5\xb9\xa5\xb9\x9d\x9a\x85\x3a\x7d\x3a\x64\x36'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x6c\x33\xad\xd8'\
-b'\xad\xb8\xad\xb9\xad\xb8\xad\xb9\xad\xb8\xad\xb8\xad\xb9\xad\x98'\
-b'\xad\xb8\xad\xb9\x63\x6e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x20\x00\x00\x00\x00\x08\xa2\x94\xf6'\
-b'\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xda\xa5\xba\xa5\xda\xad\xba\xa5\xb9\xad\xba\xad\xda'\
-b'\xa5\xba\xa5\xb9\x42\x6a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x3a\x09\x74\x12\x31\xe8\x95\x59\x95\x9a\x8d\x7a'\
-b'\x5c\xba\x2c\x1b\x13\x9b\x1b\xdb\x4c\x7a\x75\x1a\x95\x9a\x9d\x9a'\
-b'\x9d\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x7a\x85\x5a\x7d\x1a\x54\x9b'\
-b'\x2c\x1b\x23\xdb\x34\x3b\x4c\x7a\x6c\xfa\x7d\x1a\x7d\x3a\x7d\x1a'\
-b'\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x1a\x7d\x3b\x5c\x15\x00\x41\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x08\xe6\x33\x15\x1b\x59\x2c\x1b\x64\xfa'\
-b'\x6c\xfa\x6c\xfb\x6c\xfa\x6c\xfa\x44\x5a\x1b\x7a\x2c\x1a\x64\xdb'\
-b'\x64\xda\x64\xdb\x43\x73\x00\x62\x00\x00\x00\x00\x00\x00\x08\xa4'\
-b'\x32\x70\x2b\xd9\x4c\x7b\x54\xba\x5c\xba\x5c\xbb\x5c\xba\x5c\xda'\
-b'\x5c\xba\x5c\xbb\x5c\xba\x5c\xba\x54\xbb\x3b\xf9\x52\xb1\x42\xd2'\
-b'\x13\x9a\x1b\xdb\x2c\x3b\x3c\x5b\x4c\x9b\x2c\x1b\x1b\x59\x2b\x16'\
-b'\x33\x36\x1b\x58\x1b\xdb\x54\x9b\x43\x52\x08\xa3\x00\x00\x00\x00'\
-b'\x00\x00\x11\x05\x54\x37\x64\xfa\x5c\xda\x34\x1b\x1b\x79\x2b\x16'\
-b'\x33\x15\x3b\x15\x4a\xd1\x4a\xd3\x33\xb9\x44\x5b\x34\x3b\x1b\xb9'\
-b'\x00\xe6\x00\x00\x00\x20\x3b\x73\x64\xdb\x64\xda\x64\xdb\x4c\x9a'\
-b'\x2b\x58\x23\x57\x34\x3a\x2c\x1b\x13\xba\x13\x7a\x13\x9b\x34\x1b'\
-b'\x54\xbb\x54\x9b\x1b\xba\x23\xda\x5c\xbb\x6c\xfb\x6d\x1a\x74\xfb'\
-b'\x74\xfa\x75\x1a\x74\xfa\x75\x1b\x3a\xce\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x12\x4f\x64\xdb\x75\x1a\x7d\x1a\x75\x1a\x7d\x1a'\
-b'\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x3a\x74\xb8\x10\xe4\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x4f\xad\xda'\
-b'\xa5\xda\xad\xda\xad\xd9\xad\xda\xad\xba\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xb5\xda\xad\xd9\x94\xf5\x84\x73\x84\x73\x84\x73'\
-b'\x84\x73\x84\x73\x84\x93\x84\x73\x84\x73\x84\x73\x84\x73\x84\x73'\
-b'\x84\x93\x84\x73\x84\x73\x52\xab\x21\x45\x21\x45\x21\x45\x21\x45'\
-b'\x6b\xaf\xb5\xfa\xb5\xd9\xb5\xfa\xad\xda\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xad\xd9\xad\xd9\xb5\xda\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xda\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xd9\xbd\xfa\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xad\xd9\xa5\xba\x9d\xba\x9d\x9a\xa5\xba\xa5\xba'\
-b'\xa5\xba\xa5\xba\xa5\xda\xa5\xba\x9d\x9a\x85\x3a\x7d\x3a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\x04\x29\x87'\
-b'\x29\x86\x29\x86\x29\x86\x29\x86\x29\x87\x29\x86\x29\x86\x29\x87'\
-b'\x29\x86\x29\x86\x18\xe4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x10\xc3\x74\x11\x7c\x32\x7c\x32\x7c\x32\x7c\x32\x7c\x53\xa5\x98'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xb9\xa5\xda\xad\xda\xad\xd9\xad\xb9'\
-b'\xad\xda\xa5\xba\x3a\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x08\x82\x74\x32\x95\x17\x42\x6b\x8d\x17\x9d\x9a\x7d\x3a'\
-b'\x4c\x7b\x1b\xdb\x0b\xbb\x2c\x1b\x5c\xba\x8d\x5a\x9d\x9a\x95\x9a'\
-b'\x9d\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x79\x8d\x5a\x74\xfa\x44\x7a'\
-b'\x23\xfb\x23\xfb\x34\x3a\x54\xba\x74\xfa\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x3b\x7d\x1a\x7d\x3a\x64\x15\x00\x20\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x08\xe6\x2b\x16\x1b\x79\x3c\x3a\x6c\xfa'\
-b'\x6c\xfb\x74\xfa\x6c\xfa\x6c\xfb\x64\xdb\x34\x1a\x1b\x99\x4c\x7a'\
-b'\x64\xdb\x5c\xda\x5c\xba\x3b\x11\x00\x42\x00\x00\x00\x00\x00\x00'\
-b'\x00\x63\x1a\x70\x44\x5a\x5c\xbb\x5c\xbb\x5c\xbb\x5c\xba\x5c\xba'\
-b'\x5c\xdb\x5c\xba\x5c\xba\x5c\xda\x5c\xbb\x44\x3a\x4a\xd2\x52\xb1'\
-b'\x23\x9a\x23\xfb\x34\x3b\x4c\x7b\x54\x9b\x3c\x3a\x13\x79\x2b\x37'\
-b'\x2b\x36\x1b\x58\x1b\x79\x22\x4e\x00\x41\x00\x00\x00\x00\x00\x00'\
-b'\x08\xe4\x53\xf6\x6c\xfa\x64\xda\x5c\xdb\x2c\x1b\x1b\x59\x33\x16'\
-b'\x33\x15\x3a\xf5\x52\xb1\x3a\xf4\x3c\x3a\x4c\x9b\x3c\x3a\x23\xd9'\
-b'\x00\xe6\x00\x00\x00\x00\x3b\x53\x5c\xdb\x64\xda\x64\xda\x3c\x1a'\
-b'\x2b\x37\x33\xda\x44\x7b\x2b\xfb\x13\xbb\x0b\x9b\x13\xbb\x34\x1b'\
-b'\x54\xbb\x34\x3b\x13\xba\x4c\x7b\x6c\xfb\x6c\xfa\x74\xfa\x75\x1a'\
-b'\x6d\x1b\x74\xfa\x75\x1b\x64\x36\x08\xc3\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x01\x29\x23\xb9\x5c\xda\x7d\x1a\x75\x1a\x7d\x1a\x7d\x1a'\
-b'\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x3b\x64\x35\x00\x41\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x0d\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xb9\xad\xda\xad\xd9\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xb9\x42\x29\x00\x20\x00\x41\x00\x41'\
-b'\x00\x41\x00\x21\x00\x40\x00\x41\x00\x41\x00\x40\x00\x41\x08\x20'\
-b'\x00\x41\x00\x40\x00\x20\x5b\x2e\xad\xb9\xa5\x98\xad\x98\xad\x98'\
-b'\xad\xb9\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xfa\xbd\xfa\xad\xf9\xa5\xba\x9d\x9a\x9d\x99\xa5\xba\xa5\x9a'\
-b'\xa5\xb9\xa5\xba\xad\xda\xa5\xb9\x9d\x9a\x7d\x3a\x7d\x3a\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x21\x45\xa5\x98\xb5\xfa\xb5\xda\xb5\xda\xad\xfa\xad\xfa\xb5\xda'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xba'\
-b'\xad\xd9\xad\xda\xad\xba\xad\xd9\xad\xd9\xad\xda\xa5\xba\xad\xda'\
-b'\xad\xd9\xad\xd9\x3a\x29\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x42\x4a\x6b\xd0\x5b\x2f\x95\x79\x95\x7a\x6c\xfa'\
-b'\x3c\x5b\x13\xbb\x1b\xbb\x44\x5a\x6c\xda\x95\x7a\x95\x9a\x9d\x7a'\
-b'\x95\x7a\x95\x7a\x95\x79\x95\x7a\x8d\x7a\x85\x3a\x64\xdb\x3c\x5b'\
-b'\x23\xfb\x2c\x1b\x44\x7b\x5c\xda\x7d\x1b\x85\x3a\x7d\x3a\x85\x3a'\
-b'\x7d\x3a\x85\x3b\x7d\x3a\x7d\x3b\x7d\x3b\x64\x35\x00\x62\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x09\x07\x2b\x16\x1b\x7a\x44\x5a\x6d\x1a'\
-b'\x74\xfa\x74\xfa\x6c\xfb\x6c\xfa\x6c\xfa\x5c\xbb\x23\xba\x2b\xba'\
-b'\x5c\xbb\x64\xda\x5c\xba\x54\xba\x22\xf1\x00\x42\x00\x00\x00\x00'\
-b'\x00\x00\x00\x21\x19\xeb\x4c\x17\x5c\xbb\x5c\xdb\x5c\xba\x5c\xbb'\
-b'\x64\xba\x5c\xdb\x5c\xba\x5c\xba\x5c\xbb\x44\x7b\x3b\x35\x5a\x90'\
-b'\x2b\x78\x2c\x1b\x3c\x5a\x4c\x7a\x5c\xba\x44\x7b\x13\x9a\x23\x58'\
-b'\x33\x16\x1a\x92\x01\x08\x00\x00\x00\x00\x00\x00\x00\x00\x11\x05'\
-b'\x53\xf5\x6c\xfb\x6c\xfa\x6c\xfa\x5c\xbb\x23\xfa\x1b\x58\x33\x16'\
-b'\x33\x15\x3a\xf4\x52\xb0\x3b\x35\x4c\x7b\x5c\xbb\x44\x5a\x2b\xfa'\
-b'\x00\xe6\x00\x00\x00\x00\x33\x53\x5c\xdb\x64\xda\x54\x9b\x2b\x78'\
-b'\x2b\x78\x4c\x7a\x4c\x7b\x2c\x1b\x13\xbb\x0b\x9b\x13\xbb\x34\x3b'\
-b'\x44\x5a\x1b\x9a\x3c\x3b\x64\xda\x6c\xfa\x74\xfb\x74\xfa\x6c\xfa'\
-b'\x75\x1a\x75\x1a\x6c\xb9\x29\xc9\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\xa5\x12\xf6\x1b\xdb\x5c\xda\x7d\x1b\x7d\x1a\x7d\x3a\x7d\x3b'\
-b'\x7d\x3a\x7d\x3a\x7d\x3a\x85\x3a\x4b\x10\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x20\x00\x41\x29\x86\x94\xd6\xad\xda'\
-b'\xa5\xd9\xad\xda\xad\xda\xa5\xd9\xad\xba\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xda\xad\xda\xad\xb9\x39\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x5b\x2d\xb5\xfa\xb5\xda\xad\xd9\xb5\xda'\
-b'\xb5\xf9\xb5\xf9\xad\xda\xb5\xf9\xad\xfa\xb5\xda\xb5\xd9\xb5\xd9'\
-b'\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xda\xb5\xd9\xb5\xd9\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xd9\xbd\xfa\xb5\xf9\xb5\xfa'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xa5\xba\x9d\x99\x9d\x9a\xa5\xba\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xda\xa5\xba\x9d\x9a\x85\x3a\x75\x1a\x64\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x21\x25\xa5\x98\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda'\
-b'\xad\xb9\xad\xd9\xad\xda\xa5\xd9\xad\xba\xad\xd9\xad\xd9\xa5\xba'\
-b'\xad\xd9\xad\xba\x3a\x29\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x19\x04\x29\xa7\x8d\x18\x85\x5a\x5c\xbb'\
-b'\x2c\x1b\x13\xbb\x23\xfb\x54\x9b\x7d\x3a\x95\x7a\x9d\x9a\x9d\x79'\
-b'\x95\x7a\x95\x9a\x95\x7a\x95\x7a\x64\x13\x3a\x6c\x2a\x2c\x11\xec'\
-b'\x09\xcc\x11\xcc\x19\xeb\x2a\x2c\x32\x4c\x3a\x4b\x3a\x6c\x32\x4c'\
-b'\x3a\x4c\x3a\x6b\x32\x4c\x3a\x4b\x3a\x6c\x5b\xd3\x3a\xad\x00\x00'\
-b'\x00\x00\x00\x00\x00\x63\x22\x70\x23\x57\x1b\x9a\x4c\x7b\x6c\xfa'\
-b'\x74\xfb\x6c\xfa\x6c\xfa\x6c\xfb\x64\xba\x64\x58\x3c\x5a\x1b\x99'\
-b'\x3c\x3a\x5c\xbb\x5c\xba\x54\xbb\x3c\x5b\x12\xd3\x00\x84\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x08\xa3\x2a\x8e\x54\x17\x5c\xba\x64\xdb'\
-b'\x5c\xda\x64\xbb\x5c\xba\x5c\xba\x54\x9b\x3c\x5a\x33\x77\x5a\x8f'\
-b'\x3b\x56\x34\x3b\x44\x5a\x54\x9a\x5c\xdb\x54\x9b\x1b\x9a\x1a\xb3'\
-b'\x11\x49\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00\x19\x67\x5c\x16'\
-b'\x6c\xfb\x6c\xfa\x6c\xfa\x64\xda\x54\x9b\x23\xdb\x23\x58\x33\x16'\
-b'\x33\x15\x4a\xd3\x52\xb1\x33\x97\x5c\xbb\x5c\xba\x4c\x9b\x33\xf9'\
-b'\x08\xe6\x00\x00\x00\x00\x2b\x13\x54\xbb\x64\xdb\x3b\xf9\x2b\x36'\
-b'\x33\xf9\x5c\xba\x44\x7b\x2c\x1b\x13\xbb\x0b\x9b\x13\xbb\x34\x3b'\
-b'\x23\xdb\x1b\xba\x5c\xba\x6c\xfa\x6d\x1b\x6c\xfa\x74\xfa\x75\x1b'\
-b'\x75\x1b\x6c\xd9\x32\x2b\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa4'\
-b'\x12\xb4\x1b\x79\x1b\xda\x54\x9b\x75\x1a\x7d\x1a\x75\x1a\x7d\x1a'\
-b'\x7d\x3a\x7d\x1a\x85\x3a\x7d\x3a\x32\x0a\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x21\x10\xe4\x31\xe9'\
-b'\x4a\xac\x53\x0e\x63\xb0\x74\x32\x8c\xb4\x9d\x58\xad\xda\xad\xb9'\
-b'\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xd9\xad\xb9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xd9\x39\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x5b\x2d\xb5\xfa\xad\xd9\xad\xda\xb5\xd9'\
-b'\xb5\xfa\xad\xd9\xb5\xd9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xd9'\
-b'\xb5\xfa\xad\xf9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda\xbd\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xa5\xba\x9d\x9a\xa5\xba\x9d\xba\xa5\x99'\
-b'\xa5\xba\xa5\xb9\xad\xba\xad\xb9\x95\x9a\x7d\x3a\x7d\x3b\x64\x56'\
-b'\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x21\x45\xa5\x98\xb5\xda\xb5\xda\xad\xd9\xad\xda\xad\xda\xb5\xd9'\
-b'\xad\xd9\xad\xda\xb5\xda\xad\xd9\xad\xda\xad\xda\xad\xb9\xad\xda'\
-b'\xad\xda\xa5\xd9\xad\xba\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9'\
-b'\xad\xda\xa5\x98\x21\x66\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41\x6c\x13\x7d\x3a\x4c\x7b'\
-b'\x1b\xdb\x13\xdb\x3c\x5a\x64\xda\x8d\x5a\x9d\x9a\x9d\x9a\x95\x9a'\
-b'\x9d\x7a\x95\x7a\x95\x7a\x6b\xf3\x10\xc3\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\xc4\x5b\xd3\x3a\x8d'\
-b'\x00\x00\x00\x63\x1a\x72\x2b\x36\x23\x58\x1b\xba\x54\x9b\x6d\x1a'\
-b'\x74\xfa\x74\xfa\x74\xfa\x6c\xfa\x64\xba\x5b\x74\x53\xd6\x2b\xda'\
-b'\x1b\x79\x4c\x7a\x5c\xba\x54\x9b\x34\x3a\x1b\xdb\x0a\xf6\x01\x08'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\xa3\x22\x0b\x43\x73'\
-b'\x54\x58\x5c\xba\x64\xdb\x5c\xdb\x4c\x7b\x34\x3b\x2b\xb9\x5a\x90'\
-b'\x43\x14\x3c\x5b\x44\x7b\x54\x9a\x4c\x37\x33\x11\x09\x69\x00\x42'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x2a\x4c\x64\x98\x6c\xfb'\
-b'\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xda\x4c\x7b\x1b\xba\x23\x58\x2b\x16'\
-b'\x33\x15\x52\xd1\x4a\xd2\x3b\xf9\x64\xdb\x64\xda\x54\x9a\x3c\x19'\
-b'\x09\x06\x00\x00\x00\x00\x23\x13\x44\x7b\x4c\x9b\x2b\x77\x2b\x57'\
-b'\x4c\x7b\x5c\xdb\x4c\x7a\x2b\xfb\x13\xbb\x0b\x9b\x1b\xbb\x23\xfa'\
-b'\x1b\x9a\x44\x5b\x64\xda\x6c\xfa\x74\xfb\x74\xfa\x75\x1a\x75\x1b'\
-b'\x64\x77\x29\xea\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe5\x12\xf5'\
-b'\x1b\x59\x1b\x79\x1b\xdb\x54\x9b\x75\x1a\x7d\x1a\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x21\x87\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x61\x09\x05\x09\x6a\x0a\x10\x2b\x54\x74\xd8\x95\x7a'\
-b'\x9d\x9a\xa5\xda\xa5\xda\xad\xda\xad\xda\xa5\xda\xa5\xda\xad\xb9'\
-b'\xa5\xba\xad\xda\xa5\xda\xad\xd9\xad\xda\xad\xda\xad\xb9\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xb9\x31\xe8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x5b\x2e\xb5\xfa\xad\xd9\xb5\xd9\xad\xda'\
-b'\xb5\xf9\xb5\xf9\xb5\xd9\xad\xfa\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9'\
-b'\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xda\xb5\xd9\xb5\xd9\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa'\
-b'\xbd\xfa\xbd\xfa\xb5\xf9\xa5\xba\xa5\x9a\xa5\xb9\xa5\x9a\xa5\xba'\
-b'\xa5\xb9\xa5\xda\xad\xda\xa5\xb9\x9d\x7a\x7d\x3a\x7d\x3a\x6c\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x21\x25\xa5\x98\xad\xda\xad\xd9\xad\xda\xb5\xd9\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xd9\xad\xba\xad\xd9\xad\xd9\xad\xba\xad\xd9\xad\xb9\xad\xda'\
-b'\xad\xd9\xa5\xb9\x4a\xab\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x63\xf3\x64\xfb\x34\x3a'\
-b'\x1b\xdb\x23\xfb\x4c\x7b\x75\x1a\x95\x7a\x9d\x99\x9d\x9a\x95\x79'\
-b'\x95\x7a\x95\x79\x6c\x13\x10\xc3\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\xc4\x53\xb3'\
-b'\x22\x8f\x0a\x93\x23\x58\x2b\x36\x1b\x58\x23\xdb\x5c\xba\x74\xfa'\
-b'\x75\x1b\x6c\xfa\x6c\xfa\x6c\xfb\x6c\xfa\x5c\x79\x5b\x53\x4b\x96'\
-b'\x23\x99\x2b\xd9\x54\xbb\x54\x9b\x3c\x3b\x1b\xdb\x0b\xbb\x0b\x59'\
-b'\x02\x0f\x00\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20'\
-b'\x08\xc4\x21\xa9\x2a\x8e\x3b\x11\x32\xd1\x2a\xb2\x1a\xf5\x3a\x2e'\
-b'\x3a\x0d\x22\xb0\x22\x2d\x19\x67\x08\x83\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\xc5\x3b\x52\x64\xda\x6c\xfa\x6c\xfa'\
-b'\x6c\xfa\x6c\xda\x6c\xfb\x64\xfa\x44\x5b\x1b\x9a\x23\x57\x2b\x36'\
-b'\x33\x15\x52\x91\x42\xf4\x44\x3a\x64\xda\x5c\xda\x54\xba\x44\x39'\
-b'\x09\x06\x00\x00\x00\x00\x2a\x91\x4b\x96\x3b\xf9\x33\x16\x3b\xf9'\
-b'\x5c\xdb\x5c\xba\x4c\x7b\x2c\x1b\x13\xbb\x0b\x9b\x13\xbb\x1b\xbb'\
-b'\x2c\x1b\x5c\xda\x6c\xfb\x6c\xfb\x6d\x1b\x75\x1b\x64\x98\x43\x31'\
-b'\x11\x05\x00\x00\x00\x00\x00\x00\x00\x00\x21\x88\x43\xf7\x1b\xdb'\
-b'\x1b\x79\x1b\x59\x1b\xba\x4c\x7a\x74\xfa\x7d\x1a\x7d\x3a\x7d\x1a'\
-b'\x7d\x3b\x85\x1a\x85\x3a\x74\xd8\x10\xe4\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x08\x82\x19\x25\x21\x87\x29\x87\x29\xa7\x3a\x6b'\
-b'\x63\xd1\x7c\x76\x5c\x99\x2c\x1a\x13\xbb\x2c\x1b\x64\xda\x8d\x5a'\
-b'\x9d\x9a\x9d\x9a\xa5\xb9\xa5\xba\xa5\xba\xad\xb9\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xb9\xad\xd9\xad\xba\xa5\xd9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xb9\x4a\xab\x18\xe4\x19\x04\x19\x04'\
-b'\x19\x04\x19\x04\x19\x04\x19\x04\x19\x04\x19\x04\x19\x04\x19\x04'\
-b'\x19\x04\x19\x04\x18\xe4\x6b\xaf\xb5\xfa\xad\xd9\xb5\xda\xb5\xd9'\
-b'\xb5\xfa\xad\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xda\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xda\xb5\xfa\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xad\xfa\xa5\xba\xa5\xba\xa5\x99\xa5\xba\xa5\xb9'\
-b'\xa5\xb9\xa5\xda\xad\xda\xad\xb9\x95\x9a\x7d\x3a\x7d\x3b\x6c\x56'\
-b'\x08\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x21\x25\xa5\x98\xb5\xda\xad\xda\xad\xd9\xb5\xfa\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xa5\xda\xad\xda\xad\xb9'\
-b'\xad\xda\xad\xfa\x6b\xb0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x08\x82\x29\xa7\x29\xa7\x42\x4a\x4a\xac\x64\x35\x54\x9b\x2c\x1b'\
-b'\x1b\xbb\x34\x3b\x5c\xba\x85\x5a\x9d\x9a\x9d\x9a\x9d\x99\x95\x9a'\
-b'\x9d\x7a\x95\x59\x32\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x21\xca'\
-b'\x34\x1b\x1b\x9a\x23\x37\x2b\x37\x1b\x59\x23\xfb\x64\xda\x6d\x1a'\
-b'\x74\xfa\x74\xfa\x6c\xfa\x6c\xfb\x6c\xfa\x64\xda\x5c\x9a\x5b\x54'\
-b'\x3b\x35\x23\x78\x44\x3a\x54\x9b\x34\x3a\x1b\xdb\x0b\x9b\x0b\x9b'\
-b'\x13\xbb\x23\x56\x11\xab\x00\x41\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x00\x21\x00\x20'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x63\x01\xce\x1b\x98\x54\xbb\x6c\xfa\x6c\xfb\x6c\xfb'\
-b'\x6c\xfa\x6c\xfa\x6c\xfa\x64\xda\x3c\x3b\x13\x9a\x23\x37\x2b\x17'\
-b'\x42\xf3\x5a\x90\x33\x56\x4c\x9b\x64\xda\x64\xda\x5c\xbb\x44\x59'\
-b'\x09\x06\x00\x00\x00\x00\x31\xcb\x33\x55\x2b\x15\x2a\xf5\x44\x18'\
-b'\x54\x58\x54\x58\x3b\xf8\x23\x98\x13\x79\x0b\x58\x13\x38\x1b\x57'\
-b'\x44\x18\x5c\x78\x64\x57\x5c\x36\x53\x93\x32\x8d\x19\x25\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x41\x32\x8d\x6c\xb8\x54\xbb\x23\xfa'\
-b'\x13\x79\x13\x59\x1b\xba\x44\x5a\x6d\x1b\x7d\x3a\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x7d\x3a\x85\x3a\x74\x97\x08\xa3\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x08\x82'\
-b'\x2a\x0a\x5b\xb2\x7c\xb6\x8d\x39\x95\x59\x95\x59\x95\x79\x9d\x9a'\
-b'\x9d\xba\x95\x9a\x7d\x1a\x44\x5a\x1b\xdb\x1b\xdb\x54\x9b\x85\x3a'\
-b'\x95\x9a\x9d\x9a\xa5\xb9\xa5\xba\xa5\xda\xa5\xda\xad\xb9\xa5\xb9'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xd9\xad\xda\xad\xda\xa5\x98\xa5\x57\x9d\x58\x9d\x57'\
-b'\xa5\x57\xa5\x58\x9d\x57\xa5\x57\xa5\x57\x9d\x57\xa5\x57\xa5\x58'\
-b'\x9d\x77\xa5\x57\xa5\x77\xa5\x99\xad\xd9\xad\xda\xb5\xf9\xb5\xfa'\
-b'\xad\xd9\xb5\xf9\xb5\xda\xad\xf9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9'\
-b'\xad\xf9\xb5\xd9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\xbe\x1a\xb5\xfa\xb5\xd9\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xd9\xad\xda\xa5\xba\x9d\x9a\x85\x3a\x7d\x1a\x74\xb8'\
-b'\x3a\xce\x3a\x8c\x3a\x6c\x32\x6c\x32\x6c\x32\x6c\x4a\xcc\x52\xec'\
-b'\x52\xec\x52\xec\x52\xec\x52\xcc\x52\xec\x52\xec\x52\xec\x52\xec'\
-b'\x52\xcc\x52\xec\x52\xec\x52\xcc\x52\xcc\x52\xec\x52\xec\x52\xcc'\
-b'\x63\x8f\xad\xb9\xad\xd9\xb5\xda\xad\xda\xad\xd9\xb5\xfa\xad\xda'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xb9\xad\xda\xa5\xb9\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xb9\xad\xda\x6b\xd1\x00\x00\x00\x00\x00\x00\x10\xe3\x42\x6b'\
-b'\x84\x95\x8c\xf6\x95\x58\x9d\x99\x95\x7a\x6c\xfa\x44\x5a\x23\xfb'\
-b'\x23\xdb\x44\x5a\x6c\xfa\x8d\x7a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x7a'\
-b'\x95\x7a\x95\x79\x7c\x96\x19\x45\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\x46\x54\x36'\
-b'\x2c\x1b\x13\x7a\x23\x37\x2b\x37\x1b\x79\x2c\x1b\x64\xda\x75\x1a'\
-b'\x75\x1b\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfa\x64\xda\x64\xbb\x54\x7a'\
-b'\x53\x54\x3a\xf4\x33\x78\x44\x7b\x34\x3b\x23\xfb\x0b\x9b\x0b\x9b'\
-b'\x13\xbb\x2c\x1c\x3c\x1a\x2a\x71\x19\x69\x08\xc4\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x00\xc6'\
-b'\x09\xee\x22\xf4\x1b\x59\x1b\xbb\x44\x7a\x6c\xfa\x74\xfa\x6c\xfa'\
-b'\x6c\xda\x74\xfb\x74\xfa\x64\xdb\x2c\x1b\x1b\x79\x23\x37\x2b\x36'\
-b'\x4a\xd2\x52\xb0\x33\xb8\x5c\xbb\x6c\xda\x64\xda\x5c\xdb\x4c\x59'\
-b'\x09\x06\x00\x00\x00\x00\x00\x42\x00\x84\x00\x83\x00\x83\x08\xc4'\
-b'\x08\xc4\x08\xc4\x08\xa4\x00\xa4\x00\x84\x00\x84\x00\x84\x00\xa4'\
-b'\x08\xc4\x08\xc4\x08\xc3\x08\x82\x00\x21\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x11\x47\x4b\xb3\x6c\xfa\x75\x1b\x64\xda\x2b\xfb'\
-b'\x13\x7a\x1b\x79\x1b\xbb\x3c\x5b\x6c\xfa\x7d\x1a\x7d\x3a\x7d\x1a'\
-b'\x7d\x3a\x7d\x3a\x85\x3a\x7d\x3a\x32\x2a\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x08\xa3\x11\x47\x11\xcb\x22\xb0\x33\x75\x54\x37'\
-b'\x7d\x1a\x8d\x7a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x7a\x9d\x7a'\
-b'\x9d\x9a\x9d\x9a\x85\x3a\x54\x9a\x2b\xfb\x13\xbb\x3c\x3b\x75\x1a'\
-b'\x95\x7a\x9d\x9a\xa5\xb9\xa5\xb9\xa5\xb9\xad\xda\xad\xba\xad\xd9'\
-b'\xad\xda\xad\xb9\xa5\xd9\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda'\
-b'\xad\xda\xb5\xda\xad\xda\xad\xda\xb5\xda\xad\xda\xb5\xda\xad\xda'\
-b'\xad\xda\xb5\xfa\xad\xfa\xad\xfa\xb5\xda\xad\xda\xad\xda\xb5\xfa'\
-b'\xad\xfa\xad\xf9\xb5\xda\xad\xda\xb5\xfa\xad\xd9\xb5\xd9\xb5\xf9'\
-b'\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xad\xfa\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xda\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xd9\xb5\xfa'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xa5\xba\xa5\xb9\xa5\xba\xa5\xb9\xa5\xb9'\
-b'\xa5\xba\xa5\xda\xad\xb9\xa5\xba\x95\x9a\x7d\x3a\x7d\x3a\x7d\x3a'\
-b'\x75\x1a\x85\x5b\x75\x3a\x75\x1b\x6d\x1b\x75\x1a\xa5\xba\xbd\xfa'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xfa'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xad\xfa\xb5\xfa\xb5\xfa'\
-b'\xad\xda\xad\xda\xb5\xd9\xad\xda\xad\xda\xb5\xd9\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xd9'\
-b'\xa5\xda\xad\xda\x95\x37\x31\xe8\x08\x81\x42\x6b\x94\xf6\xa5\x99'\
-b'\xa5\xba\xa5\xba\xa5\xba\x9d\x9a\x8d\x5a\x5c\xba\x34\x3b\x1b\xfb'\
-b'\x2c\x1b\x54\x9a\x7d\x1a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x95\x9a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x74\x76\x19\x26\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\x46\x6c\x76\x5c\xdb'\
-b'\x23\xfb\x13\x79\x23\x37\x23\x37\x13\x7a\x34\x1b\x6c\xdb\x75\x1a'\
-b'\x74\xfa\x74\xfa\x75\x1b\x6c\xfa\x6c\xfa\x6c\xdb\x64\xda\x5c\xbb'\
-b'\x54\x7a\x53\x54\x42\xd3\x33\xd9\x34\x3a\x1b\xdb\x0b\x9b\x0b\x9b'\
-b'\x13\xbb\x2c\x1b\x44\x5b\x3b\xb8\x3b\x14\x3b\xb7\x3b\x52\x22\x2c'\
-b'\x11\x06\x00\x82\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x20\x00\xa3\x19\x47\x2a\x6d\x3b\x94\x13\x99'\
-b'\x1b\x79\x23\x38\x1b\x58\x13\xbb\x44\x5b\x6c\xfa\x6c\xfb\x6c\xfb'\
-b'\x6c\xfa\x74\xfa\x6d\x1a\x5c\xda\x2b\xfb\x1b\x79\x23\x37\x33\x16'\
-b'\x52\xb1\x4a\xd2\x33\xf9\x64\xda\x64\xda\x64\xda\x5c\xda\x4c\x5a'\
-b'\x09\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20'\
-b'\x18\xe5\x3a\xd0\x64\x99\x6d\x1a\x74\xfa\x74\xfa\x64\xda\x2c\x1b'\
-b'\x13\x9a\x13\x79\x13\x9b\x34\x3b\x6c\xfa\x7d\x3a\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x3a\x85\x3a\x6c\x35\x19\x25\x00\x20\x00\x00'\
-b'\x08\xa3\x3a\x8d\x5c\x57\x54\x7a\x44\x5a\x3c\x5b\x44\x7b\x5c\xbb'\
-b'\x7d\x1a\x85\x5a\x8d\x5a\x8d\x5a\x95\x79\x95\x7a\x95\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x8d\x7a\x6c\xfa\x3c\x5b\x1b\xdb\x24\x1a\x5c\xdb'\
-b'\x8d\x5a\x9d\x7a\x9d\xba\xa5\xda\xa5\xba\xad\xb9\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xda\xb5\xb9\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda'\
-b'\xb5\xd9\xad\xda\xb5\xf9\xad\xda\xad\xd9\xad\xd9\xb5\xda\xb5\xd9'\
-b'\xad\xd9\xb5\xfa\xad\xd9\xad\xd9\xad\xda\xb5\xfa\xad\xfa\xb5\xd9'\
-b'\xad\xf9\xb5\xf9\xad\xda\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xd9'\
-b'\xb5\xf9\xb5\xda\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9'\
-b'\xbe\x1a\xb5\xfa\xb5\xf9\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xba\xa5\xd9\xad\xba\xa5\xba\x9d\x9a\x85\x39\x7d\x3a\x7d\x1a'\
-b'\x75\x1a\x7d\x3a\x75\x1a\x74\xfa\x74\xfa\x75\x1a\xa5\xda\xb5\xf9'\
-b'\xb5\xd9\xb5\xd9\xb5\xd9\xb5\xd9\xb5\xda\xb5\xd9\xb5\xd9\xb5\xd9'\
-b'\xb5\xd9\xb5\xd9\xb5\xd9\xad\xd9\xad\xd9\xb5\xda\xad\xda\xad\xd9'\
-b'\xb5\xda\xad\xf9\xad\xda\xad\xda\xb5\xd9\xad\xfa\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xb5\xda\xad\xda\xad\xd9'\
-b'\xad\xba\xad\xd9\xad\xd9\xad\xda\xad\xb9\xad\xda\xad\xd9\xad\xba'\
-b'\xa5\xba\xad\xda\xad\xda\x9d\x78\x84\x94\xa5\x78\xa5\xda\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xa5\xba\x95\x7a\x75\x1a\x4c\x7a\x2c\x1b\x23\xfb'\
-b'\x3c\x5a\x64\xda\x8d\x5a\x9d\x9a\x9d\x9a\x9d\x9a\x95\x9a\x9d\x79'\
-b'\x95\x7a\x95\x7a\x8d\x7a\x85\x5a\x54\x37\x2a\xb0\x1a\x91\x1a\xb0'\
-b'\x2a\xd0\x3b\x10\x4b\x30\x4b\x50\x53\x50\x53\x50\x4b\x50\x53\x50'\
-b'\x4b\x50\x4b\x50\x4b\x30\x4b\x50\x53\x50\x6c\x97\x7d\x3a\x5c\xba'\
-b'\x1b\xdb\x1b\x79\x23\x38\x23\x58\x13\x9a\x3c\x5b\x6c\xfa\x75\x1a'\
-b'\x6c\xfa\x74\xfa\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xda\x64\xda\x64\xda'\
-b'\x5c\xbb\x54\x7a\x53\x54\x4a\xf3\x33\xfa\x1b\xdb\x13\x9b\x0b\x9b'\
-b'\x13\xbb\x2c\x1b\x44\x7a\x4c\x5a\x3b\x14\x3b\x97\x5c\xbb\x64\xba'\
-b'\x54\x79\x4b\xf7\x3b\x74\x22\x90\x21\xaa\x11\xac\x12\x0d\x12\x0e'\
-b'\x29\xaa\x41\xaa\x3b\x33\x4c\x38\x5c\x99\x64\xdb\x5c\xbb\x23\xfb'\
-b'\x13\x7a\x23\x58\x1b\x78\x13\x9a\x34\x3b\x64\xda\x6c\xfa\x74\xfa'\
-b'\x74\xfa\x74\xfa\x74\xfa\x54\xbb\x23\xfb\x1b\x79\x2b\x37\x32\xf5'\
-b'\x5a\x90\x3b\x14\x3c\x3b\x64\xdb\x64\xda\x64\xda\x5c\xbb\x4c\x39'\
-b'\x29\xaa\x00\x41\x00\x21\x00\x21\x00\x20\x00\x00\x00\x20\x00\x41'\
-b'\x00\x21\x00\x21\x00\x41\x00\x21\x00\x20\x00\x00\x00\x20\x00\x00'\
-b'\x00\x20\x00\x20\x00\x41\x00\x82\x10\xe4\x19\x88\x32\x2c\x4a\x6e'\
-b'\x5b\xf6\x64\xfb\x6c\xfa\x75\x1a\x75\x1b\x75\x1a\x64\xfb\x34\x3b'\
-b'\x13\x9a\x13\x79\x13\xba\x34\x3b\x6c\xdb\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x74\xd8\x5b\xd3\x42\xce'\
-b'\x6c\x76\x85\x3a\x75\x1a\x5c\xba\x4c\x7b\x3c\x5a\x3c\x5b\x54\x9a'\
-b'\x75\x1a\x85\x5a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x9d\x99\x9d\x9a'\
-b'\x9d\x9a\x9d\x99\x95\x9a\x7d\x1b\x4c\x7a\x23\xfb\x23\xdb\x4c\x7b'\
-b'\x7d\x3a\x95\x79\xa5\xb9\xa5\xba\xa5\xb9\xa5\xba\xa5\xd9\xad\xda'\
-b'\xad\xb9\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xb9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xda\xad\xda\xb5\xd9\xad\xda\xad\xda\xb5\xda\xb5\xda'\
-b'\xad\xda\xad\xf9\xad\xda\xb5\xda\xb5\xda\xad\xd9\xad\xda\xb5\xfa'\
-b'\xad\xd9\xad\xd9\xb5\xda\xad\xd9\xb5\xf9\xad\xd9\xb5\xda\xb5\xfa'\
-b'\xb5\xd9\xb5\xda\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xda\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xbd\xfa\xb5\xfa\xb5\xda\xad\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xb9'\
-b'\xa5\xda\xad\xba\xad\xd9\xa5\xba\x95\x9a\x85\x5a\x85\x3a\x7d\x1a'\
-b'\x75\x1a\x7d\x1a\x75\x1a\x74\xfb\x6c\xfa\x74\xfa\xad\xba\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xd9\xb5\xfa\xb5\xda\xad\xd9\xad\xda\xb5\xd9\xad\xf9\xad\xda'\
-b'\xb5\xd9\xad\xda\xb5\xda\xb5\xd9\xad\xda\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xba\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xba\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xa5\xd9'\
-b'\xad\xba\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xda\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\xba\x9d\x9a\x8d\x5a\x64\xda\x3c\x5b\x23\xfb\x2c\x1b'\
-b'\x54\x7a\x6c\xfb\x8d\x7a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x8d\x7a\x7d\x3a\x5c\xbb\x3c\x5b\x34\x3b\x3c\x5b'\
-b'\x54\xbb\x6c\xfb\x7d\x3b\x85\x5b\x85\x5a\x85\x5b\x85\x5a\x85\x5b'\
-b'\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x7d\x3b\x7d\x3a\x7d\x1a\x54\x9a'\
-b'\x1b\xdb\x1b\x79\x23\x37\x1b\x58\x1b\xba\x44\x5b\x6c\xfa\x75\x1a'\
-b'\x75\x1a\x74\xfa\x74\xfa\x6c\xfa\x6c\xfb\x6c\xfb\x64\xda\x64\xdb'\
-b'\x5c\xba\x5c\xba\x54\x7a\x53\x54\x43\x14\x1b\xbb\x0b\xbb\x0b\x9b'\
-b'\x13\xbb\x2c\x1b\x44\x5b\x54\x9a\x43\x97\x42\xf4\x4c\x39\x5c\xba'\
-b'\x5c\xba\x54\xbb\x4c\x5a\x4b\x54\x3b\x36\x23\xda\x2c\x1b\x34\x3b'\
-b'\x4b\x14\x5a\x90\x53\x14\x54\x18\x5c\xba\x64\xda\x5c\xdb\x34\x1a'\
-b'\x1b\x79\x2b\x37\x23\x37\x1b\x79\x33\xfa\x54\x7a\x6c\xda\x74\xfa'\
-b'\x6d\x1a\x6c\xfa\x6c\xfb\x4c\x7a\x1b\xba\x1b\x58\x23\x37\x42\xf3'\
-b'\x5a\x90\x2b\x57\x44\x7b\x6c\xda\x64\xda\x5c\xdb\x5c\x58\x5b\x33'\
-b'\x43\x96\x33\x96\x23\x55\x22\x92\x22\x91\x2a\xb2\x3a\x6f\x3b\x53'\
-b'\x3b\xb5\x3b\xb5\x2b\x75\x1b\x35\x12\xb3\x0a\xb4\x12\xf5\x2b\x34'\
-b'\x3b\x94\x4b\xb4\x53\xf5\x54\x37\x5c\x99\x64\x17\x5b\x33\x5c\x37'\
-b'\x64\xdb\x74\xfa\x74\xfa\x74\xfb\x75\x1a\x75\x1a\x6c\xfa\x3c\x3b'\
-b'\x1b\x9a\x13\x7a\x13\xbb\x2c\x1b\x5c\xba\x7d\x3a\x7d\x1a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x75\x1a\x64\xdb\x4c\x9a\x44\x5b\x44\x5b\x54\x9a'\
-b'\x6c\xda\x85\x3a\x8d\x5a\x95\x79\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x85\x5a\x5c\xba\x34\x3b\x1b\xdb\x34\x3b'\
-b'\x6c\xfa\x95\x7a\x9d\x9a\xa5\xba\xad\xb9\xad\xba\xa5\xda\xad\xb9'\
-b'\xa5\xda\xad\xda\xad\xb9\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda'\
-b'\xb5\xd9\xad\xfa\xb5\xd9\xad\xda\xad\xd9\xad\xda\xb5\xda\xad\xd9'\
-b'\xad\xda\xb5\xda\xad\xf9\xad\xda\xb5\xda\xad\xd9\xb5\xf9\xb5\xda'\
-b'\xad\xf9\xb5\xf9\xad\xda\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xfa'\
-b'\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xd9\xbd\xfa\xb5\xfa'\
-b'\xbd\xfa\xb5\xf9\xb5\xf9\xad\xda\xad\xda\xad\xda\xa5\xb9\xad\xda'\
-b'\xad\xd9\xa5\xda\xad\xda\xa5\xba\x95\x79\x85\x5a\x7d\x3a\x7d\x1a'\
-b'\x75\x1a\x7d\x3a\x75\x1a\x74\xfa\x6c\xfa\x7d\x1a\xa5\xda\xb5\xf9'\
-b'\xb5\xd9\xad\xd9\xb5\xd9\xad\xda\xad\xd9\xb5\xd9\xad\xd9\xad\xf9'\
-b'\xb5\xda\xad\xd9\xb5\xfa\xb5\xd9\xad\xf9\xad\xda\xb5\xd9\xad\xd9'\
-b'\xad\xfa\xb5\xd9\xad\xfa\xad\xd9\xad\xda\xb5\xda\xad\xda\xad\xda'\
-b'\xb5\xd9\xad\xda\xb5\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xb9'\
-b'\xad\xda\xad\xd9\xad\xd9\xa5\xba\xad\xd9\xad\xda\xad\xda\xad\xd9'\
-b'\xa5\xba\xad\xda\xad\xda\xa5\xba\xad\xda\xa5\xda\xa5\xb9\xa5\xba'\
-b'\xa5\xb9\xa5\xba\x95\x7a\x7d\x3a\x54\x9a\x34\x1a\x23\xfb\x3c\x5a'\
-b'\x5c\xbb\x7d\x3a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x95\x99\x95\x7a'\
-b'\x95\x7a\x95\x7a\x85\x5a\x74\xfa\x54\x9a\x3c\x3b\x34\x3a\x44\x5b'\
-b'\x54\xba\x6c\xfa\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x75\x1a\x4c\x7b'\
-b'\x1b\xbb\x1b\x59\x23\x58\x1b\x59\x1b\xbb\x4c\x9b\x75\x1a\x75\x1a'\
-b'\x74\xfa\x75\x1a\x6c\xfa\x6c\xfa\x6c\xfb\x5c\x38\x5c\x99\x5c\xba'\
-b'\x5c\xbb\x5c\xba\x54\xba\x44\x5a\x4b\x35\x42\xf4\x13\x9a\x0b\x9b'\
-b'\x13\xdb\x2c\x1b\x44\x7b\x54\xba\x4c\x5a\x43\x14\x3b\x97\x54\xbb'\
-b'\x54\xbb\x4c\x38\x4b\x34\x3b\x77\x1b\xdb\x1b\xdb\x2c\x1b\x3c\x5b'\
-b'\x4b\x76\x5a\x90\x43\xb6\x53\x54\x53\xf7\x5c\xba\x64\xdb\x44\x3a'\
-b'\x3b\x14\x42\xd2\x4a\xd2\x42\xf4\x3b\x15\x3b\x35\x4b\xf8\x75\x1b'\
-b'\x74\xfa\x75\x1a\x6c\xfb\x44\x5b\x1b\x9a\x1b\x58\x2b\x36\x4a\xd2'\
-b'\x52\xb1\x2b\x98\x54\x9b\x64\xda\x64\xdb\x54\x59\x53\x13\x53\xd6'\
-b'\x4c\x7b\x44\x7b\x33\xfa\x3b\x15\x2b\x99\x23\xfb\x43\x97\x53\x33'\
-b'\x4c\x19\x4c\x9b\x3c\x5b\x23\x9a\x1b\x7a\x13\xbb\x1b\xfb\x3c\x5b'\
-b'\x5c\xbb\x64\xdb\x64\xdb\x64\xdb\x5c\x17\x5b\x33\x5c\x38\x64\xdb'\
-b'\x6c\xfa\x74\xfa\x75\x1a\x6c\xfa\x6c\x99\x75\x1a\x6c\xfa\x44\x5b'\
-b'\x1b\xbb\x13\x7a\x13\x9a\x2c\x1b\x5c\xba\x7d\x1a\x7d\x3a\x85\x3a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x1a\x6c\xfa\x54\xba\x44\x5b\x3c\x3b\x4c\x7b'\
-b'\x64\xda\x7d\x3a\x85\x5a\x8d\x5a\x95\x7a\x95\x7a\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x8d\x7a\x74\xfa\x4c\x5a\x2b\xfb\x2c\x1a'\
-b'\x5c\xba\x85\x3a\x9d\x7a\xa5\xba\xa5\xb9\xa5\xda\xad\xb9\xa5\xda'\
-b'\xad\xb9\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xda\xad\xda\xad\xda'\
-b'\xad\xd9\xb5\xda\xad\xd9\xb5\xda\xad\xda\xad\xda\xb5\xda\xb5\xd9'\
-b'\xad\xda\xad\xda\xad\xfa\xb5\xd9\xad\xda\xad\xda\xb5\xd9\xad\xda'\
-b'\xad\xda\xb5\xf9\xad\xd9\xb5\xda\xad\xfa\xad\xd9\xb5\xda\xb5\xf9'\
-b'\xb5\xda\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xbd\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xbd\xfa\xb5\xfa\xb5\xfa\xad\xda\xa5\xb9\xad\xda\xa5\xba\xad\xb9'\
-b'\xad\xda\xad\xd9\xad\xda\xa5\xb9\x95\x9a\x85\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x1a\x7d\x3a\x7d\x1a\x74\xfa\x74\xfa\x7d\x1a\xad\xba\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xad\xf9\xb5\xda\xad\xd9\xb5\xda\xad\xf9'\
-b'\xb5\xd9\xad\xfa\xad\xf9\xb5\xd9\xad\xd9\xad\xd9\xb5\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xb9\xad\xda\xad\xd9'\
-b'\xad\xb9\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xb9\xad\xba\xa5\xba\xa5\xb9'\
-b'\xa5\xba\xa5\x9a\x8d\x7a\x74\xfa\x4c\x7a\x2c\x1b\x2c\x3a\x4c\x7b'\
-b'\x6c\xfa\x8d\x5a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x7a\x95\x9a'\
-b'\x95\x7a\x95\x7a\x85\x5a\x6c\xda\x44\x7b\x34\x3a\x3c\x3b\x4c\x7a'\
-b'\x5c\xda\x75\x1a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x3a\x85\x3a\x74\xfa\x3c\x5a'\
-b'\x13\xbb\x1b\x79\x1b\x57\x13\x59\x1b\xdb\x54\x9a\x75\x1a\x75\x1a'\
-b'\x74\xfa\x75\x1a\x74\xfa\x6c\xfa\x6c\xda\x5b\xf7\x53\x54\x5c\x79'\
-b'\x5c\xda\x5c\xdb\x5c\xba\x4c\x9b\x33\xfa\x42\xd3\x42\xd3\x13\x7a'\
-b'\x13\xbb\x2b\xfa\x44\x5a\x54\x9a\x54\xbb\x43\x97\x42\xf4\x44\x39'\
-b'\x53\xf8\x53\x34\x3b\xb7\x23\xfb\x23\xba\x2b\x98\x2c\x1a\x3c\x7b'\
-b'\x4b\xf8\x5a\x8f\x4b\xb7\x54\x79\x53\x54\x5b\xd6\x5c\xda\x4c\x7a'\
-b'\x2b\x57\x2b\x37\x2b\x36\x23\x37\x2b\x78\x2b\x57\x4c\x18\x74\xfa'\
-b'\x6c\xfa\x74\xfa\x64\xfa\x3c\x5b\x13\x9b\x23\x58\x33\x16\x52\xb1'\
-b'\x42\xd3\x2b\xda\x5c\xba\x64\xdb\x5c\x79\x5b\x33\x53\xd6\x54\xba'\
-b'\x54\xba\x4c\x7b\x3b\x77\x3a\xf4\x33\x78\x23\xfb\x34\x3b\x43\xb8'\
-b'\x53\x33\x4b\xd8\x2b\xfa\x23\x78\x13\x9b\x13\xbb\x23\xfb\x3c\x5b'\
-b'\x54\x9a\x64\xda\x64\xbb\x5b\xd6\x5b\x53\x5c\x59\x6c\xda\x6c\xfa'\
-b'\x75\x1a\x75\x1a\x6c\xda\x5b\xd6\x64\x37\x75\x1a\x75\x1a\x44\x7b'\
-b'\x13\xbb\x13\x7a\x13\x9b\x24\x1b\x54\x9a\x7d\x1b\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x7d\x3a\x6c\xfa\x5c\xba\x4c\x7b\x44\x5b\x44\x7a'\
-b'\x5c\xba\x7d\x1a\x85\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99\x7d\x3a\x54\xba\x34\x3b\x23\xfb'\
-b'\x44\x7a\x7d\x1b\x95\x7a\x9d\x99\xa5\xba\xad\xda\xad\xda\xa5\xd9'\
-b'\xa5\xba\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xb9'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xd9\xad\xda\xad\xda'\
-b'\xb5\xf9\xad\xda\xb5\xd9\xad\xda\xad\xd9\xb5\xda\xad\xda\xad\xd9'\
-b'\xb5\xfa\xad\xda\xad\xda\xb5\xd9\xad\xd9\xad\xd9\xb5\xf9\xb5\xd9'\
-b'\xad\xf9\xad\xfa\xb5\xda\xad\xd9\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9'\
-b'\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xda\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9'\
-b'\xbe\x1a\xb5\xf9\xb5\xf9\xad\xda\xad\xda\xad\xd9\xad\xba\xad\xda'\
-b'\xa5\xd9\xad\xda\xad\xda\xa5\xba\x95\x9a\x85\x5a\x85\x3a\x7d\x1a'\
-b'\x7d\x1a\x7d\x3a\x75\x3a\x75\x1a\x75\x1a\x7d\x3a\xad\xda\xb5\xf9'\
-b'\xb5\xd9\xad\xda\xb5\xf9\xb5\xd9\xad\xda\xb5\xd9\xb5\xd9\xad\xfa'\
-b'\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xd9\xad\xd9\xad\xfa\xad\xd9\xb5\xda'\
-b'\xad\xd9\xad\xda\xad\xfa\xb5\xfa\xad\xd9\xb5\xda\xad\xda\xad\xda'\
-b'\xad\xd9\xb5\xda\xad\xb9\xb5\xda\xad\xd9\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xba\xad\xda\xad\xda\xa5\xb9\xad\xda\xa5\xb9\xa5\xba'\
-b'\xa5\xba\x9d\x99\x85\x5a\x64\xda\x3c\x5b\x2c\x1b\x3c\x3b\x54\xba'\
-b'\x7d\x1a\x95\x7a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x79\x95\x9a\x95\x7a'\
-b'\x95\x7a\x95\x79\x7d\x1a\x5c\xba\x44\x7a\x3c\x3b\x3c\x5a\x4c\x9b'\
-b'\x64\xda\x7d\x1a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x7d\x1a\x6c\xfa\x3c\x3b'\
-b'\x13\x9a\x1b\x59\x1b\x58\x13\x79\x23\xdb\x5c\xba\x75\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x6c\xfa\x6c\xfa\x6c\xfb\x64\xda\x53\xb6\x53\x75'\
-b'\x5c\x9a\x5c\xba\x5c\xba\x4c\x7b\x34\x3b\x2b\x98\x4a\xd2\x33\x36'\
-b'\x13\xdb\x2c\x1b\x44\x5a\x54\xbb\x5c\xba\x4c\x7a\x43\x14\x4b\x13'\
-b'\x53\x34\x43\xf9\x34\x3b\x23\xfb\x23\xba\x43\x14\x43\x76\x44\x5b'\
-b'\x4c\x3a\x5a\xb0\x53\x54\x54\xbb\x5c\x79\x53\x75\x5b\xd6\x54\x7a'\
-b'\x2b\xfb\x1b\xbb\x0b\x9b\x13\xbb\x2c\x1b\x44\x7b\x5c\xbb\x75\x1b'\
-b'\x75\x1a\x74\xfa\x64\xda\x34\x1b\x13\x9a\x23\x58\x32\xf5\x5a\x8f'\
-b'\x33\x15\x3c\x3a\x5c\xda\x5c\x79\x53\x33\x53\xb6\x5c\xba\x5c\xdb'\
-b'\x5c\xba\x44\x19\x42\xf3\x4a\xd2\x33\x77\x23\xfb\x2c\x1a\x3c\x3b'\
-b'\x43\xf8\x53\x13\x3b\x14\x23\x9a\x13\xbb\x13\xbb\x1b\xfb\x3c\x5b'\
-b'\x5c\x9a\x64\xda\x53\xd6\x53\x54\x5c\x99\x64\xfb\x6c\xfb\x6c\xfa'\
-b'\x6c\xfa\x6c\xda\x5b\xd6\x5b\xf7\x74\xfa\x75\x1b\x75\x1a\x4c\x7a'\
-b'\x1b\xdb\x13\x9a\x0b\x9a\x23\xfb\x4c\x9a\x75\x1a\x85\x3a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x7d\x3a\x75\x1a\x5c\xda\x4c\x9a\x44\x5b\x44\x5b'\
-b'\x5c\xba\x74\xfa\x85\x5a\x8d\x5a\x95\x79\x95\x7a\x95\x7a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x8d\x5a\x6c\xda\x44\x7b\x23\xfb'\
-b'\x3c\x3a\x6c\xda\x8d\x7a\x9d\x9a\xa5\xb9\xa5\xba\xad\xda\xad\xda'\
-b'\xa5\xb9\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xd9\xb5\xda'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xb5\xd9\xad\xda'\
-b'\xad\xda\xb5\xd9\xad\xfa\xb5\xd9\xad\xfa\xad\xd9\xb5\xda\xad\xfa'\
-b'\xb5\xd9\xad\xd9\xb5\xda\xad\xfa\xad\xda\xb5\xda\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xda\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xbd\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xba\x95\x99\x85\x5a\x85\x3a\x7d\x3a'\
-b'\x7d\x1a\x7d\x1a\x75\x1b\x75\x1a\x74\xfa\x7d\x1a\xad\xda\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xfa\xad\xf9\xb5\xd9\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xad\xda\xb5\xd9\xb5\xd9\xad\xfa\xad\xd9'\
-b'\xb5\xd9\xb5\xd9\xad\xda\xad\xd9\xb5\xda\xad\xf9\xb5\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda'\
-b'\xad\xba\xa5\xd9\xad\xba\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xd9\xa5\xb9\xad\xba\xad\xda\xad\xb9\xa5\xda\xa5\xb9'\
-b'\xa5\x9a\x95\x9a\x7d\x1a\x54\x9a\x34\x3b\x34\x1a\x44\x7b\x64\xdb'\
-b'\x85\x5a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x79\x95\x9a\x95\x9a'\
-b'\x95\x7a\x8d\x7a\x75\x1a\x5c\xba\x3c\x5b\x3c\x3a\x44\x5b\x54\x9a'\
-b'\x6c\xfb\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x3a\x6c\xda\x34\x3b'\
-b'\x13\x9a\x1b\x59\x1b\x59\x13\x7a\x2c\x1b\x64\xda\x74\xfa\x75\x1a'\
-b'\x75\x1b\x74\xfa\x74\xfa\x6c\xfa\x6c\xfa\x64\xda\x5c\xba\x53\xb6'\
-b'\x53\x75\x54\x9a\x54\xba\x54\x9b\x3c\x3b\x23\xda\x2b\x37\x23\x37'\
-b'\x1b\xdb\x2b\xfb\x44\x5b\x54\x9a\x54\xba\x54\x9a\x4b\x14\x5a\x90'\
-b'\x43\xf9\x44\x7b\x2c\x3b\x23\xfb\x1b\xdb\x2b\xba\x4b\x13\x4b\x75'\
-b'\x44\x5b\x53\x13\x52\xf2\x54\x9a\x5c\xdb\x54\x7a\x53\x75\x53\xd6'\
-b'\x44\x5b\x23\xfb\x0b\x9b\x13\xbb\x34\x1b\x54\x9a\x64\xda\x6c\xfb'\
-b'\x74\xfa\x75\x1a\x54\xbb\x2b\xfb\x13\x79\x23\x58\x42\xf3\x5a\x90'\
-b'\x2b\x77\x3c\x7b\x5c\x79\x5b\x53\x53\xb7\x5c\xba\x64\xda\x5c\xba'\
-b'\x54\xbb\x43\x76\x5a\xb0\x43\x77\x23\xfb\x23\xfb\x2c\x1b\x3c\x3a'\
-b'\x44\x5b\x3b\x98\x4a\xf2\x3b\x35\x13\x9b\x13\xbb\x23\xfb\x3c\x3b'\
-b'\x54\xba\x64\xba\x5c\x38\x64\x99\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfb'\
-b'\x6c\xda\x5b\xb5\x63\xf6\x6c\xfa\x75\x1a\x7d\x1a\x75\x1a\x54\x9a'\
-b'\x1b\xdb\x13\x7a\x13\x9b\x23\xfb\x4c\x7b\x75\x1a\x85\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x75\x1a\x64\xda\x54\x9b\x44\x5b\x44\x7a'\
-b'\x54\x9a\x6c\xfa\x7d\x3a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x9d\x7a'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\x95\x7a\x7d\x1a\x54\x9a\x2c\x1b'\
-b'\x2c\x1b\x54\x9a\x85\x3a\x9d\x9a\x9d\xba\xa5\xba\xad\xda\xa5\xd9'\
-b'\xad\xba\xad\xda\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xd9\xb5\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xb5\xd9'\
-b'\xad\xda\xad\xda\xb5\xd9\xad\xda\xad\xda\xb5\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xb5\xf9\xad\xd9\xad\xda\xb5\xf9\xad\xf9\xad\xda\xb5\xd9'\
-b'\xb5\xfa\xb5\xf9\xad\xd9\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xd9\xbd\xfa\xb5\xf9\xb5\xf9'\
-b'\xbe\x1a\xbd\xf9\xb5\xf9\xad\xda\xad\xda\xad\xb9\xad\xda\xad\xd9'\
-b'\xad\xba\xad\xda\xad\xda\xa5\xb9\x95\x7a\x85\x5a\x7d\x3a\x7d\x1a'\
-b'\x7d\x1a\x7d\x3a\x75\x1a\x75\x1a\x74\xfa\x7d\x3a\xad\xda\xb5\xd9'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xd9\xb5\xd9\xb5\xda\xb5\xf9\xad\xd9'\
-b'\xb5\xfa\xad\xd9\xb5\xfa\xb5\xda\xad\xd9\xad\xfa\xb5\xd9\xad\xda'\
-b'\xad\xfa\xad\xda\xb5\xf9\xad\xda\xad\xd9\xb5\xda\xad\xd9\xad\xda'\
-b'\xb5\xd9\xad\xd9\xb5\xba\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xba'\
-b'\xad\xd9\xa5\xda\xa5\xba\xa5\xb9\xad\xda\xa5\xda\xa5\xb9\xa5\xba'\
-b'\x9d\x9a\x8d\x5a\x6c\xfa\x4c\x7b\x34\x3b\x3c\x3b\x54\x7a\x6c\xfa'\
-b'\x95\x7a\x9d\xba\x9d\x99\x9d\x9a\x9d\x99\x9d\x7a\x95\x7a\x95\x7a'\
-b'\x95\x7a\x8d\x5a\x6c\xfa\x54\x9b\x3c\x3b\x3c\x3a\x4c\x7b\x5c\xba'\
-b'\x75\x1a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x39\x85\x3a\x7d\x3a\x7d\x3a\x64\xda\x2c\x1b'\
-b'\x13\x9a\x13\x59\x1b\x79\x13\x9a\x34\x1a\x64\xda\x75\x1a\x75\x1a'\
-b'\x74\xfa\x75\x1a\x74\xfa\x6d\x1a\x6c\xfb\x6c\xfa\x64\xda\x54\x9a'\
-b'\x53\x75\x53\x75\x54\x9a\x4c\x9b\x3c\x3a\x23\xfb\x1b\x99\x2b\x37'\
-b'\x1b\xba\x2c\x1b\x3c\x5b\x4c\x9b\x54\x7a\x53\x75\x53\x75\x42\xf4'\
-b'\x43\x96\x3c\x5a\x2c\x1b\x1b\xdb\x2b\xb9\x3b\x98\x3c\x19\x4b\x34'\
-b'\x4b\x75\x4b\x55\x52\xb0\x4c\x59\x5c\xda\x54\x9a\x5c\x9a\x5c\x79'\
-b'\x34\x1a\x1b\xba\x13\x7a\x13\x7a\x23\xda\x34\x3a\x54\x9a\x6c\xda'\
-b'\x6c\xfa\x6c\xfb\x54\x9a\x2b\xfa\x13\x7a\x2b\x37\x4a\xb1\x4a\xb1'\
-b'\x23\x99\x4c\x9b\x5b\xd6\x53\xd6\x5c\xdb\x64\xda\x64\xdb\x64\xda'\
-b'\x54\x39\x52\xd2\x4b\x97\x34\x1a\x33\xb8\x23\xda\x23\xfb\x34\x3b'\
-b'\x3c\x1a\x2b\x78\x33\xd9\x43\x34\x42\xf4\x1b\x9a\x1b\xdb\x3c\x5b'\
-b'\x5c\xba\x64\xdb\x64\xfa\x6c\xfb\x6c\xfb\x6c\xfa\x6c\xfa\x6c\xda'\
-b'\x5b\xb5\x63\xd5\x6c\xfa\x75\x1a\x75\x1a\x7d\x1a\x75\x1b\x54\xba'\
-b'\x23\xfb\x13\x9b\x0b\x9b\x1b\xdb\x44\x5a\x75\x1a\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x7d\x3a\x6c\xfa\x5c\xbb\x4c\x7b\x44\x5b'\
-b'\x4c\x9a\x64\xda\x7d\x3b\x8d\x5a\x95\x79\x95\x7a\x95\x79\x95\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x85\x5a\x5c\xda\x34\x5b'\
-b'\x23\xfa\x44\x5b\x75\x1a\x95\x7a\x9d\x9a\xa5\xb9\xad\xda\xad\xda'\
-b'\xa5\xb9\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xba'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xb5\xda\xad\xda\xad\xd9'\
-b'\xb5\xd9\xad\xda\xad\xfa\xb5\xd9\xad\xf9\xb5\xd9\xad\xda\xb5\xf9'\
-b'\xb5\xda\xad\xda\xad\xda\xb5\xda\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xda\xb5\xfa\xad\xda\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa'\
-b'\xb5\xd9\xad\xd9\xb5\xfa\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xba'\
-b'\xad\xd9\xad\xda\xad\xda\xa5\xba\x8d\x7a\x85\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x1a\x75\x1a\x74\xfa\x74\xfb\x74\xfa\x7d\x3a\xad\xda\xb5\xf9'\
-b'\xb5\xfa\xb5\xd9\xad\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xad\xf9\xb5\xf9'\
-b'\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xda\xad\xf9\xad\xd9\xb5\xda\xad\xd9'\
-b'\xb5\xd9\xad\xd9\xb5\xd9\xad\xf9\xb5\xda\xad\xfa\xad\xda\xb5\xd9'\
-b'\xad\xda\xad\xba\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xd9\xad\xba'\
-b'\xad\xda\xad\xb9\xad\xda\xad\xba\xad\xd9\xad\xd9\xa5\xda\xad\xd9'\
-b'\xad\xba\xad\xd9\xa5\xb9\xad\xba\xa5\xb9\xa5\xb9\xa5\xba\xa5\xb9'\
-b'\x95\x9a\x7d\x3a\x5c\xba\x44\x5a\x34\x3a\x44\x5b\x5c\xba\x7d\x3a'\
-b'\x95\x9a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\x95\x7a\x95\x7a'\
-b'\x95\x7a\x85\x3a\x64\xda\x4c\x7b\x3c\x3b\x3c\x5b\x4c\x9b\x64\xdb'\
-b'\x75\x1a\x85\x5a\x85\x5a\x8d\x5a\x85\x5a\x8d\x3a\x85\x3a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x1a\x5c\xda\x23\xfb'\
-b'\x13\x9b\x1b\x59\x1b\x79\x13\xba\x3c\x3b\x6c\xfb\x75\x1a\x7d\x1a'\
-b'\x75\x1b\x74\xfa\x74\xfa\x74\xfa\x6c\xfa\x6c\xfb\x64\xda\x5c\xba'\
-b'\x5c\x9a\x53\x75\x53\x95\x44\x5a\x34\x5b\x24\x1b\x1b\xbb\x23\x58'\
-b'\x2b\x58\x2c\x1b\x3c\x3b\x4c\x19\x53\x53\x53\xb6\x54\x9a\x4b\xb7'\
-b'\x42\xf3\x33\xfa\x23\xfb\x2b\x98\x42\xf3\x3b\x97\x3c\x5b\x44\x3a'\
-b'\x53\x54\x52\xd1\x5a\x90\x4b\xf8\x64\xdb\x64\xda\x64\xdb\x64\xdb'\
-b'\x34\x3b\x13\xbb\x13\x9a\x13\x7a\x13\x9a\x23\xfb\x54\x9b\x75\x1a'\
-b'\x75\x1a\x6c\xfa\x4c\x9b\x23\xdb\x13\x79\x2b\x36\x5a\xb0\x42\xf4'\
-b'\x23\xda\x5c\xba\x64\xba\x6c\xdb\x6c\xda\x64\xda\x64\xdb\x5c\x79'\
-b'\x53\x12\x43\x34\x44\x7b\x44\x3a\x43\x55\x3b\x36\x2b\xda\x2b\xfb'\
-b'\x33\x98\x33\xd9\x34\x3b\x23\xdb\x33\x35\x42\xf3\x2b\x99\x3c\x5b'\
-b'\x54\xba\x64\xda\x64\xda\x6c\xfa\x6c\xda\x6c\xfa\x6c\xda\x5b\xb5'\
-b'\x5b\xd6\x74\xfa\x75\x1a\x75\x1a\x7d\x1a\x7d\x1a\x75\x3a\x5c\xbb'\
-b'\x2b\xfb\x13\x9b\x0b\x9a\x1b\xdb\x44\x5b\x6c\xfa\x7d\x3a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x7d\x3a\x74\xfa\x64\xba\x4c\x7a\x44\x5b'\
-b'\x4c\x9a\x64\xba\x75\x1a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x9d\x79'\
-b'\x9d\x99\x9d\x9a\x9d\x9a\xa5\x9a\x9d\x9a\x8d\x7a\x74\xfa\x4c\x7b'\
-b'\x2c\x1b\x3c\x3a\x64\xda\x85\x5a\x9d\x9a\xa5\xba\xa5\xd9\xa5\xba'\
-b'\xad\xda\xad\xb9\xad\xda\xa5\xd9\xad\xd9\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xda'\
-b'\xad\xd9\xad\xda\xad\xd9\xb5\xda\xad\xd9\xad\xda\xb5\xda\xad\xda'\
-b'\xad\xd9\xad\xd9\xb5\xfa\xad\xd9\xad\xd9\xad\xda\xb5\xfa\xb5\xd9'\
-b'\xad\xf9\xb5\xd9\xb5\xd9\xb5\xd9\xad\xda\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xda\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9'\
-b'\xbe\x1a\xbd\xf9\xb5\xfa\xad\xd9\xad\xda\xad\xd9\xad\xba\xa5\xd9'\
-b'\xad\xda\xad\xd9\xad\xda\xa5\xd9\x8d\x59\x85\x3a\x7d\x3a\x7d\x1a'\
-b'\x7d\x1a\x7d\x3a\x75\x1a\x75\x1a\x75\x1b\x85\x3a\xad\xd9\xb5\xf9'\
-b'\xb5\xda\xb5\xd9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xda\xad\xfa'\
-b'\xb5\xd9\xb5\xfa\xad\xfa\xb5\xd9\xad\xd9\xb5\xda\xad\xfa\xb5\xda'\
-b'\xad\xf9\xb5\xda\xad\xda\xad\xd9\xad\xda\xb5\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xb5\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xd9\xa5\xda\xad\xd9\xad\xba\xad\xda\xad\xb9\xad\xda'\
-b'\xa5\xba\xad\xba\xa5\xda\xa5\xb9\xad\xda\xa5\xba\xa5\xba\x9d\xb9'\
-b'\x95\x7a\x6c\xfa\x54\x9b\x3c\x5b\x3c\x3b\x4c\x9a\x6c\xfa\x8d\x5a'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x99\x95\x7a\x9d\x9a\x95\x7a'\
-b'\x8d\x7a\x7d\x3a\x5c\xba\x44\x7a\x3c\x3b\x44\x5a\x5c\xba\x6c\xfa'\
-b'\x7d\x3a\x85\x5a\x8d\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x5a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x85\x3a\x7d\x3a\x54\xbb\x23\xfb'\
-b'\x13\x7a\x13\x79\x13\x79\x1b\xdb\x3c\x5b\x6c\xfa\x7d\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x75\x1b\x74\xfa\x6c\xfa\x6c\xfb\x6c\xda\x64\xda'\
-b'\x64\xda\x54\x9a\x53\x54\x4b\x75\x34\x3a\x2b\xfb\x1b\xdb\x13\xbb'\
-b'\x2b\x37\x2b\xb9\x43\xd8\x53\x34\x53\xf7\x54\x9a\x54\xbb\x4c\x7a'\
-b'\x4a\xf3\x33\x77\x33\x78\x4a\xd2\x3b\x97\x34\x3b\x44\x5a\x4c\x9b'\
-b'\x4c\x7a\x53\x54\x6a\x6e\x4b\x76\x5c\xbb\x64\xda\x6c\xda\x6c\xda'\
-b'\x44\x7b\x1b\xdb\x13\x9a\x0b\x7a\x13\x9b\x23\xfb\x4c\x7a\x6c\xfa'\
-b'\x75\x1b\x64\xda\x44\x5a\x1b\xbb\x1b\x79\x3a\xf4\x5a\x8f\x33\x37'\
-b'\x2c\x1b\x64\xdb\x6c\xfa\x6c\xfa\x6c\xda\x64\xfb\x5c\x79\x5b\x33'\
-b'\x4a\xd2\x4c\x19\x54\xbb\x4c\x7b\x3c\x1a\x43\x15\x43\x14\x2b\x98'\
-b'\x2b\x78\x3c\x3a\x34\x3a\x23\xfb\x1b\xbb\x2b\x57\x4a\xf3\x43\xf9'\
-b'\x54\xba\x64\xda\x6c\xdb\x6c\xfa\x6c\xfb\x64\xba\x5b\xb5\x5b\xd6'\
-b'\x6c\xda\x74\xfa\x75\x1a\x75\x1b\x75\x3b\x7d\x1a\x7d\x3a\x5c\xba'\
-b'\x34\x1b\x13\xbb\x0b\x9b\x1b\xdb\x34\x3a\x6c\xda\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x75\x1a\x64\xdb\x54\x9b\x4c\x7a'\
-b'\x4c\x7a\x5c\xba\x75\x1a\x85\x5a\x8d\x5a\x95\x7a\x95\x7a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\xa5\x9a\x95\x7a\x7d\x3a\x5c\xba'\
-b'\x3c\x3a\x34\x3b\x54\xba\x7d\x1a\x95\x9a\xa5\xba\xa5\xb9\xad\xb9'\
-b'\xa5\xba\xa5\xda\xad\xd9\xad\xda\xad\xda\xad\xb9\xad\xda\xad\xba'\
-b'\xad\xd9\xad\xd9\xad\xda\xad\xda\xb5\xda\xad\xba\xb5\xd9\xad\xba'\
-b'\xb5\xda\xb5\xd9\xad\xda\xad\xfa\xb5\xda\xad\xf9\xad\xda\xb5\xd9'\
-b'\xad\xda\xb5\xda\xad\xda\xb5\xf9\xad\xd9\xb5\xd9\xb5\xda\xad\xf9'\
-b'\xb5\xda\xb5\xfa\xad\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xfa\xbd\xf9'\
-b'\xbe\x1a\xb5\xf9\xb5\xf9\xad\xda\xad\xda\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xa5\xba\x8d\x7a\x85\x3a\x7d\x3a\x7d\x3a'\
-b'\x7d\x3a\x7d\x1a\x75\x1a\x74\xfa\x74\xfa\x85\x3a\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xd9\xb5\xf9\xad\xf9\xb5\xd9\xb5\xfa\xad\xf9\xb5\xd9'\
-b'\xb5\xd9\xb5\xda\xb5\xf9\xb5\xda\xb5\xd9\xad\xd9\xb5\xd9\xad\xd9'\
-b'\xb5\xd9\xad\xf9\xb5\xd9\xad\xf9\xb5\xd9\xad\xfa\xb5\xda\xad\xda'\
-b'\xb5\xda\xad\xda\xad\xd9\xb5\xfa\xad\xda\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xba\xad\xda\xad\xd9\xad\xb9\xad\xda\xa5\xd9\xad\xd9\xad\xda'\
-b'\xa5\xb9\xad\xd9\xad\xda\xad\xba\xa5\xd9\xa5\xba\xa5\xb9\x9d\x9a'\
-b'\x85\x5a\x64\xda\x44\x7b\x3c\x3b\x44\x5a\x5c\xba\x75\x1a\x95\x7a'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x95\x79\x95\x7a\x95\x7a'\
-b'\x8d\x5a\x74\xfa\x5c\xba\x44\x5b\x3c\x5a\x4c\x9a\x5c\xbb\x74\xfb'\
-b'\x85\x3a\x85\x5a\x8d\x5a\x85\x5a\x8d\x3a\x8d\x5a\x85\x3a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x7d\x3a\x85\x3a\x7d\x1a\x4c\x9a\x1b\xdb'\
-b'\x0b\x7a\x1b\x79\x13\x7a\x1b\xdb\x44\x7b\x74\xfa\x75\x1a\x75\x1a'\
-b'\x75\x1a\x74\xfa\x75\x1a\x74\xfa\x6c\xfa\x64\x58\x64\xba\x64\xdb'\
-b'\x64\xda\x5c\xba\x54\x7a\x53\x34\x43\x76\x23\xfb\x1b\xdb\x13\xbb'\
-b'\x23\x99\x33\x36\x43\x34\x54\x18\x54\x9b\x5c\xba\x54\xba\x4c\x9b'\
-b'\x43\xb7\x52\xb1\x4a\xd2\x33\x78\x2c\x1b\x3c\x5b\x4c\x7b\x54\x9a'\
-b'\x54\x9b\x4c\x7a\x5a\xf1\x62\xd1\x54\x79\x5c\xda\x64\xda\x6c\xda'\
-b'\x4c\x9b\x1b\xdb\x13\x9b\x0b\x9b\x0b\x9b\x23\xdb\x44\x7a\x6c\xfa'\
-b'\x75\x1a\x64\xba\x34\x5b\x13\xba\x1b\x59\x42\xd3\x5a\x90\x23\x78'\
-b'\x3c\x5b\x6c\xda\x6c\xfb\x6c\xfa\x6c\xfb\x5c\x79\x5b\x54\x4b\x13'\
-b'\x43\x76\x64\xba\x5c\xba\x4c\x7b\x3c\x5b\x2c\x1a\x43\x34\x4a\xd2'\
-b'\x33\xb9\x34\x3b\x34\x3b\x24\x1b\x13\xdb\x13\xbb\x2b\x99\x44\x19'\
-b'\x5c\xba\x64\xda\x6c\xda\x6c\xfa\x6c\xda\x5b\x95\x5b\xd6\x6c\xda'\
-b'\x74\xfa\x75\x1a\x75\x1a\x74\xfa\x74\xd9\x75\x1a\x7d\x1a\x64\xdb'\
-b'\x34\x3b\x13\xbb\x0b\x9b\x1b\xbb\x34\x3b\x64\xdb\x85\x3a\x85\x3a'\
-b'\x85\x3a\x7d\x3a\x85\x5a\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x8d\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x7d\x3a\x6c\xfa\x5c\x9a\x4c\x7b'\
-b'\x4c\x7b\x54\x9a\x6c\xfa\x85\x3a\x8d\x5a\x95\x79\x95\x7a\x95\x79'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\xa5\xba\x9d\x9a\x85\x5a\x64\xda'\
-b'\x4c\x5b\x34\x3b\x44\x5b\x6c\xfa\x95\x7a\xa5\x9a\xa5\xb9\xa5\xba'\
-b'\xad\xb9\xad\xda\xa5\xba\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xba\xad\xd9\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xb5\xfa\xad\xf9\xad\xda\xb5\xda\xad\xf9'\
-b'\xad\xda\xad\xd9\xb5\xda\xad\xda\xad\xf9\xad\xda\xb5\xf9\xb5\xda'\
-b'\xb5\xf9\xb5\xd9\xb5\xd9\xad\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xda\xbd\xf9\xb5\xd9\xbd\xfa\xb5\xd9\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xfa\xbe\x1a\xb5\xf9\xad\xda\xad\xda\xad\xda\xad\xda\xad\xd9'\
-b'\xad\xd9\xad\xda\xad\xd9\xad\xda\x95\x5a\x7d\x3a\x85\x3a\x7d\x3a'\
-b'\x7d\x3a\x85\x3a\x7d\x1a\x75\x1a\x75\x1a\x8d\x5a\xb5\xda\xb5\xf9'\
-b'\xb5\xda\xb5\xd9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xad\xf9\xb5\xd9\xad\xf9\xb5\xf9\xad\xda\xb5\xfa\xb5\xfa\xad\xda'\
-b'\xb5\xda\xb5\xd9\xad\xda\xad\xda\xad\xd9\xb5\xda\xad\xd9\xad\xd9'\
-b'\xb5\xda\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xd9\xad\xb9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xba'\
-b'\xad\xda\xa5\xba\xad\xb9\xa5\xda\xad\xba\xa5\xb9\xa5\xba\x95\x7a'\
-b'\x7d\x1a\x5c\xba\x44\x5b\x3c\x3a\x4c\x9b\x64\xdb\x7d\x3a\x95\x9a'\
-b'\xa5\xba\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x7a\x95\x7a\x95\x7a'\
-b'\x85\x5a\x6c\xfa\x54\x9b\x44\x5b\x44\x5b\x4c\x9b\x64\xda\x75\x1a'\
-b'\x85\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x85\x3a\x85\x3a\x85\x3a\x75\x1a\x44\x5b\x1b\xbb'\
-b'\x13\x9a\x13\x7a\x13\x7a\x23\xfb\x54\x9a\x75\x1a\x7d\x1b\x7d\x1a'\
-b'\x75\x1a\x75\x1a\x74\xfa\x75\x1a\x6c\xfb\x5b\xd6\x5b\xb5\x5c\xba'\
-b'\x64\xdb\x64\xba\x5c\xbb\x4c\x5a\x4b\x34\x3b\x36\x1b\xdb\x13\xbb'\
-b'\x1b\xdb\x2b\x77\x3b\x97\x4c\x9b\x54\xba\x54\xbb\x54\xbb\x44\x7b'\
-b'\x43\x77\x62\x6f\x3b\x35\x2c\x1b\x34\x3a\x44\x19\x4c\x7a\x54\x9b'\
-b'\x5c\xba\x54\xbb\x53\x75\x62\x6f\x5b\x33\x5c\x79\x64\xda\x6c\xfb'\
-b'\x54\x9a\x23\xfb\x13\xbb\x13\x9b\x13\x9a\x1b\xdb\x3c\x5a\x6c\xdb'\
-b'\x74\xfa\x5c\xbb\x34\x1b\x13\x9a\x23\x58\x52\xb1\x4a\xd2\x1b\xba'\
-b'\x4c\x7b\x6c\xfa\x6c\xfa\x6c\xfb\x64\x99\x5b\x74\x53\xb6\x43\x14'\
-b'\x54\x39\x6c\xda\x5c\xdb\x4c\x79\x43\xf8\x34\x3a\x33\x78\x43\x14'\
-b'\x4b\x13\x33\xd9\x2c\x1b\x23\xfb\x1b\xdb\x1b\xdb\x2b\xfb\x44\x5b'\
-b'\x5c\xba\x64\xfa\x64\xda\x64\xda\x5b\xb5\x63\xd6\x6c\xda\x75\x1a'\
-b'\x75\x1a\x75\x1a\x74\xda\x5b\xb5\x64\x37\x75\x1a\x7d\x1b\x6c\xfa'\
-b'\x3c\x5a\x13\xbb\x0b\x9b\x1b\xdb\x34\x3b\x5c\xba\x7d\x3a\x85\x3a'\
-b'\x7d\x3a\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a'\
-b'\x85\x5a\x8d\x5a\x85\x3a\x85\x5a\x7d\x3a\x6c\xfa\x5c\xdb\x4c\x9a'\
-b'\x4c\x7a\x54\x9b\x64\xfa\x7d\x3a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\xa5\xba\x9d\xba\x8d\x7a\x74\xfa'\
-b'\x54\x9a\x34\x3a\x3c\x5b\x64\xda\x85\x5a\x9d\x9a\xa5\xba\xa5\xd9'\
-b'\xa5\xda\xa5\xb9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xba\xad\xd9'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xda\xad\xda\xb5\xd9\xb5\xda'\
-b'\xad\xd9\xad\xd9\xad\xda\xb5\xd9\xad\xda\xad\xda\xad\xd9\xb5\xda'\
-b'\xad\xda\xb5\xd9\xad\xfa\xb5\xd9\xad\xd9\xb5\xd9\xad\xfa\xb5\xd9'\
-b'\xad\xf9\xb5\xfa\xb5\xda\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xda\xb5\xd9'\
-b'\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xbe\x1a\xbd\xfa\xb5\xf9\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xda\xad\xd9\xa5\xba\x8d\x7a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x7d\x1a\x7d\x1a\x7d\x1a\x8d\x5a\xb5\xfa\xb5\xf9'\
-b'\xad\xd9\xb5\xd9\xb5\xf9\xb5\xda\xad\xd9\xb5\xf9\xb5\xd9\xad\xda'\
-b'\xb5\xd9\xb5\xfa\xb5\xda\xb5\xd9\xad\xd9\xb5\xd9\xad\xd9\xb5\xd9'\
-b'\xb5\xf9\xad\xda\xad\xd9\xb5\xf9\xb5\xd9\xad\xfa\xad\xda\xb5\xda'\
-b'\xad\xfa\xb5\xd9\xb5\xfa\xad\xd9\xb5\xda\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xa5\xba\x9d\x9a\x85\x59\x85\x5a\xa5\xba'\
-b'\xa5\xb9\xad\xda\xa5\xd9\xad\xb9\xa5\xda\xa5\xba\x9d\x9a\x8d\x5a'\
-b'\x6c\xfa\x54\x9b\x3c\x3b\x44\x5a\x54\xba\x74\xfa\x8d\x7a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x9d\x99\x9d\x9a\x95\x79\x95\x7a\x8d\x7a'\
-b'\x7d\x39\x64\xda\x4c\x9a\x44\x5a\x44\x7a\x5c\xba\x6c\xda\x7d\x1a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x85\x5a\x8d\x3a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x5a\x85\x3a\x85\x3a\x75\x1a\x5c\xba\x54\x9b\x3c\x5b\x1b\xdb'\
-b'\x13\x7a\x13\x7a\x0b\x9a\x2b\xfb\x54\xbb\x75\x1a\x75\x1a\x7d\x1a'\
-b'\x75\x1a\x74\xfa\x74\xfa\x74\xfa\x74\xfa\x64\xda\x5b\xb5\x5b\xb5'\
-b'\x64\xba\x5c\xda\x5c\xba\x4c\x9b\x3c\x19\x43\x14\x33\x36\x13\xdb'\
-b'\x23\xfb\x2b\xfb\x3b\x56\x4c\x19\x54\xba\x5c\xba\x4c\x7a\x4b\x96'\
-b'\x4a\xf3\x3b\x35\x42\xf3\x34\x1a\x3c\x1a\x4b\x55\x4b\xf7\x5c\x9b'\
-b'\x5c\xba\x5c\xda\x53\xf7\x52\xb0\x4b\x75\x5b\x53\x5c\x58\x6c\xfb'\
-b'\x54\xba\x2c\x1b\x1b\xdb\x13\x9b\x0b\x7a\x1b\xbb\x34\x3b\x5c\xdb'\
-b'\x64\xda\x54\x9b\x2c\x1b\x13\x9a\x23\x37\x5a\x90\x33\x14\x23\xfb'\
-b'\x5c\x9a\x6c\xfb\x6c\xfb\x64\x99\x53\x74\x5c\x17\x4b\xb6\x4b\x75'\
-b'\x64\xda\x64\xdb\x5c\x9a\x53\x54\x4b\xb7\x33\xd9\x2b\x77\x23\xdb'\
-b'\x33\x57\x4a\xf3\x33\x98\x23\xfb\x1b\xdb\x1b\xdb\x2c\x1a\x44\x5b'\
-b'\x5c\xba\x64\xfb\x64\xba\x5b\xb5\x5b\xd5\x6c\xda\x6d\x1a\x75\x1a'\
-b'\x74\xfa\x6c\xfa\x63\xb6\x5b\xb5\x74\xfa\x7d\x1a\x7d\x3b\x6c\xfa'\
-b'\x44\x5a\x1b\xdb\x0b\x9b\x1b\xbb\x34\x1b\x5c\xba\x7d\x3a\x7d\x3a'\
-b'\x85\x3a\x85\x5a\x85\x5a\x85\x3a\x85\x5a\x8d\x5a\x8d\x3a\x85\x5a'\
-b'\x8d\x5a\x85\x5a\x85\x5a\x85\x3a\x85\x3a\x75\x1a\x64\xdb\x54\x9a'\
-b'\x4c\x7a\x54\x9b\x64\xda\x75\x1a\x8d\x5a\x95\x7a\x95\x79\x95\x7a'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\xa5\xba\xa5\xba\xa5\x9a\x9d\x7a\x7d\x3a'\
-b'\x64\xdb\x44\x5b\x3c\x3b\x54\x9a\x75\x1a\x95\x7a\xa5\xba\xa5\xba'\
-b'\xad\xb9\xad\xba\xa5\xb9\xad\xda\xad\xda\xad\xd9\xad\xd9\xad\xba'\
-b'\xa5\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xd9'\
-b'\xb5\xda\xad\xda\xb5\xda\xad\xda\xb5\xf9\xad\xd9\xad\xda\xb5\xd9'\
-b'\xad\xda\xad\xda\xb5\xd9\xad\xfa\xb5\xda\xad\xda\xb5\xf9\xb5\xd9'\
-b'\xb5\xd9\xb5\xf9\xad\xd9\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa'\
-b'\xbd\xd9\xb5\xf9\xbd\xda\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb6\x19'\
-b'\xad\xda\xb5\xfa\xb5\xfa\xad\xd9\xad\xda\xad\xda\xb5\xda\xad\xda'\
-b'\xad\xd9\xad\xd9\xad\xda\xad\xda\x95\x7a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x85\x3a\x8d\x5a\x85\x3a\x7d\x3a\x7d\x1a\x8d\x7a\xb5\xfa\xb5\xf9'\
-b'\xb5\xda\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xad\xd9\xb5\xf9\xb5\xfa\xad\xda\xb5\xda\xb5\xda\xad\xf9'\
-b'\xad\xd9\xb5\xd9\xb5\xda\xad\xd9\xb5\xda\xad\xda\xb5\xf9\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xb9\xad\xda\x95\x9a\x85\x59\x74\xfa\x5c\xba\x7d\x1a'\
-b'\x95\x7a\x95\x9a\xa5\xba\xad\xba\xa5\xda\xa5\xba\x9d\x9a\x85\x39'\
-b'\x64\xda\x4c\x7b\x3c\x5a\x4c\x7b\x64\xba\x7d\x1a\x95\x9a\xa5\x9a'\
-b'\xa5\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x95\x7a\x95\x7a\x8d\x7a'\
-b'\x7d\x1a\x5c\xda\x4c\x7b\x44\x5b\x4c\x9b\x5c\xdb\x6c\xfa\x85\x3a'\
-b'\x85\x5a\x85\x5a\x8d\x3a\x85\x5a\x8d\x5a\x85\x5a\x8d\x3a\x85\x5a'\
-b'\x85\x3a\x85\x5a\x75\x1a\x4c\x7a\x3c\x3a\x3c\x3a\x3c\x3b\x34\x3b'\
-b'\x1b\xba\x13\x7a\x13\x9b\x2c\x1b\x5c\xba\x7d\x1a\x7d\x1a\x7d\x1a'\
-b'\x75\x1b\x75\x1a\x75\x1a\x75\x1b\x74\xfa\x6c\xfa\x64\xba\x5b\x95'\
-b'\x53\xd7\x64\xda\x5c\xba\x4c\x9b\x3c\x3b\x33\xd9\x42\xf4\x2b\x57'\
-b'\x23\xfb\x34\x1b\x3b\xf9\x3b\x76\x54\x7a\x54\x7a\x4b\xb6\x4a\xf3'\
-b'\x33\xd9\x23\xda\x4a\xf3\x43\x96\x3c\x7b\x4c\x39\x53\x54\x53\xf7'\
-b'\x5c\xbb\x5c\xba\x54\x59\x5a\xb1\x5b\xf8\x5c\x17\x53\x53\x5c\x58'\
-b'\x54\x9a\x34\x1b\x23\xfb\x13\xbb\x13\x7a\x13\xbb\x34\x1b\x54\x9a'\
-b'\x54\xbb\x44\x5a\x23\xfb\x13\x7a\x33\x15\x5a\x8f\x2b\x58\x2c\x1a'\
-b'\x5c\xbb\x74\xfa\x64\x99\x5b\x74\x64\x37\x64\x79\x4b\x14\x5c\x58'\
-b'\x6c\xfb\x64\x9a\x5b\x74\x53\xd6\x44\x5a\x33\x77\x33\xda\x2c\x1b'\
-b'\x23\xfb\x33\x77\x4a\xf3\x2b\x78\x1b\xdb\x1b\xdb\x2c\x1b\x44\x7a'\
-b'\x5c\xbb\x6c\xfa\x5b\xd6\x63\xb6\x6c\xda\x74\xfa\x74\xfb\x75\x1a'\
-b'\x74\xfa\x63\xd6\x63\xb5\x6c\xda\x7d\x1a\x7d\x3a\x7d\x3a\x6c\xfb'\
-b'\x4c\x7b\x1b\xfb\x0b\x9b\x1b\xbb\x34\x3b\x54\x9a\x7d\x1a\x85\x3a'\
-b'\x85\x3a\x85\x3a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x85\x5a\x8d\x5a'\
-b'\x85\x5a\x8d\x5a\x8d\x5a\x85\x5a\x85\x3a\x75\x1a\x6c\xfa\x5c\xba'\
-b'\x54\x9b\x54\x9a\x5c\xbb\x75\x1a\x85\x5a\x8d\x7a\x95\x7a\x9d\x7a'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x9d\xba\xa5\xba\xa5\xba\x9d\x99\x8d\x5a'\
-b'\x74\xfa\x54\x9a\x3c\x5b\x44\x7a\x6c\xda\x8d\x5a\xa5\x9a\xa5\xba'\
-b'\xa5\xda\xad\xd9\xad\xda\xad\xd9\xad\xba\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xb9\xad\xda\xad\xda\xad\xda\xad\xb9\xb5\xda\xad\xda\xad\xb9'\
-b'\xad\xda\xad\xda\xad\xd9\xb5\xd9\xad\xda\xad\xda\xad\xd9\xb5\xda'\
-b'\xad\xf9\xb5\xda\xad\xda\xad\xd9\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xb5\xda\xb5\xfa\xb5\xd9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xd9\xb5\xda\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xfa'\
-b'\x9d\x9a\x9d\x9a\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xad\xda\xb5\xd9\xb5\xfa\xad\xd9\x95\x9a\x85\x5a\x85\x5a\x85\x3a'\
-b'\x8d\x5a\x8d\x5a\x85\x3a\x7d\x3a\x7d\x3a\x95\x7a\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xad\xda\xb5\xd9'\
-b'\xb5\xda\xb5\xfa\xad\xfa\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xad\xda'\
-b'\xb5\xd9\xb5\xf9\xad\xda\xb5\xf9\xad\xd9\xad\xda\xb5\xda\xad\xfa'\
-b'\xb5\xd9\xb5\xda\xad\xfa\xb5\xd9\xad\xba\x9d\x9a\x9d\x99\x95\x7a'\
-b'\x8d\x5a\xa5\xba\xad\xd9\xad\xd9\xb5\xda\xad\xda\x9d\xba\xa5\xba'\
-b'\xa5\xba\x85\x59\x95\x7a\xa5\xb9\xa5\xb9\x9d\x9a\x95\x7a\x75\x1a'\
-b'\x54\xba\x44\x7b\x44\x5b\x54\x9a\x6c\xfa\x85\x5a\x9d\x9a\xa5\x99'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\x95\x79\x9d\x9a\x95\x7a\x8d\x5a'\
-b'\x74\xfa\x5c\xba\x4c\x7b\x44\x7b\x54\x9b\x64\xda\x75\x1a\x85\x3a'\
-b'\x8d\x5a\x8d\x5a\x8d\x5a\x8d\x3a\x85\x5a\x85\x5a\x8d\x5a\x85\x3a'\
-b'\x85\x5a\x8d\x5a\x95\x7a\x8d\x5a\x85\x3a\x6c\xfa\x64\xda\x6c\xfa'\
-b'\x6c\xda\x34\x1a\x13\xbb\x34\x1b\x64\xda\x75\x1a\x7d\x1a\x7d\x1a'\
-b'\x75\x1b\x7d\x1a\x74\xfa\x74\xfa\x75\x1a\x74\xfa\x6c\xfb\x5c\xba'\
-b'\x5b\x95\x5b\xd6\x5c\xba\x54\x9b\x3c\x5a\x2c\x1b\x23\xb9\x2b\x78'\
-b'\x23\xfb\x2c\x3b\x44\x5b\x3b\x97\x43\xb7\x53\x96\x4b\x34\x33\xfa'\
-b'\x2c\x1b\x2c\x1b\x3b\x97\x4b\x13\x44\x1a\x4c\x3a\x54\x59\x53\x54'\
-b'\x5b\xd6\x5c\xda\x5c\xba\x5a\xf2\x53\x95\x64\xdb\x5c\x38\x5b\xb5'\
-b'\x5c\x9a\x34\x3b\x2c\x1b\x1b\xdb\x13\x7b\x13\xbb\x2c\x1b\x44\x7a'\
-b'\x4c\x5a\x3c\x5b\x1b\xdb\x13\x7a\x42\xd3\x52\xb1\x1b\x99\x34\x3b'\
-b'\x64\xdb\x6c\xfa\x5b\xb5\x64\x17\x6c\xfb\x53\xd6\x4b\x75\x6c\xda'\
-b'\x64\xba\x5b\x74\x5b\xf6\x5c\xba\x43\xb8\x3b\xb8\x3c\x3b\x2c\x1b'\
-b'\x23\xfb\x23\xfb\x2b\x78\x4a\xd2\x33\x57\x1b\xdb\x2c\x1b\x44\x7a'\
-b'\x5c\xbb\x6c\xda\x64\x79\x6c\xda\x6d\x1a\x74\xfa\x75\x1a\x74\xfa'\
-b'\x63\xf6\x63\xb5\x74\xd9\x75\x1a\x7d\x3a\x7d\x1a\x7d\x1a\x75\x1b'\
-b'\x4c\x7a\x23\xfb\x13\x9b\x13\xbb\x34\x1b\x54\xba\x75\x1a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x85\x3a\x7d\x1a\x85\x3a\x85\x5a\x8d\x5a\x85\x5a'\
-b'\x8d\x5a\x95\x7a\x8d\x7a\x8d\x5a\x85\x5a\x7d\x3a\x6c\xfa\x64\xda'\
-b'\x54\x9b\x4c\x9b\x5c\xba\x6c\xfa\x85\x5a\x95\x7a\x95\x79\x95\x7a'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\xa5\x99\xa5\xba\xa5\xba\x9d\x9a\x95\x7a'\
-b'\x7d\x3a\x64\xdb\x44\x7a\x44\x5b\x5c\xba\x85\x5a\x9d\x9a\xa5\xb9'\
-b'\xa5\xba\xa5\xba\xad\xda\xad\xda\xa5\xda\xad\xba\xad\xda\xa5\xd9'\
-b'\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xda\xb5\xd9\xb5\xda'\
-b'\xad\xda\xb5\xd9\xad\xda\xad\xda\xb5\xf9\xad\xda\xad\xda\xad\xf9'\
-b'\xad\xda\xad\xda\xb5\xda\xad\xf9\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xda\xad\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xa5\xda\xad\xba\xb5\xf9\xb5\xf9\xb5\xf9\xbe\x19'\
-b'\xb5\xda\xa5\xba\xad\xda\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xbd\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xa5\xba\x8d\x5a\x85\x3a\x85\x3a'\
-b'\x8d\x5a\x85\x5a\x7d\x3a\x7d\x3a\x7d\x1a\x95\x7a\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xd9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xd9\xad\xfa'\
-b'\xad\xf9\xad\xda\xad\xda\xa5\xba\x7c\xf9\x74\x97\x95\x39\xad\xda'\
-b'\xad\xf9\xb5\xd9\xb5\xda\xad\xd9\xad\xf9\xb5\xda\xad\xd9\xad\xda'\
-b'\xad\xfa\xad\xd9\xb5\xda\xad\xda\x9d\x9a\x95\x7a\x9d\x9a\x95\x7a'\
-b'\x8d\x7a\xad\xda\xb5\xf9\xb6\x19\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xa5\xda\xa5\xba\xad\xda\xa5\xba\x9d\x9a\x75\x1a\x54\x9a'\
-b'\x4c\x9a\x3c\x3a\x44\x7b\x5c\xda\x75\x1a\x8d\x7a\xa5\x9a\xa5\x9a'\
-b'\x9d\xba\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x95\x7a\x95\x7a\x85\x3a'\
-b'\x64\xfa\x54\x9a\x44\x7b\x4c\x7a\x5c\xba\x6c\xfa\x7d\x1a\x85\x5a'\
-b'\x7d\x3a\x7d\x1a\x7d\x3a\x8d\x5a\x8d\x5a\x85\x5a\x8d\x5a\x85\x5a'\
-b'\x85\x3a\x85\x3a\x9d\xba\xa5\xba\x95\x9a\x8d\x7a\x8d\x5a\x8d\x7a'\
-b'\x8d\x5a\x75\x3a\x34\x3b\x34\x3a\x6c\xfa\x85\x5a\x85\x5a\x7d\x3a'\
-b'\x7d\x1a\x75\x1a\x75\x1a\x75\x1a\x74\xfa\x6c\xfa\x54\x9a\x44\x5a'\
-b'\x54\x7a\x5b\x74\x5b\xf6\x4c\x9b\x44\x7b\x34\x3b\x23\xdb\x1b\xdb'\
-b'\x23\xfb\x34\x1b\x3c\x5a\x44\x3a\x52\xf2\x53\x33\x44\x3a\x34\x3b'\
-b'\x34\x1a\x2c\x1b\x34\x1a\x4b\x13\x52\xf2\x53\xb6\x54\xba\x54\x9a'\
-b'\x5b\x75\x5b\xd6\x5c\xba\x53\x74\x5b\x33\x64\xdb\x6c\xda\x6c\xda'\
-b'\x64\xbb\x3c\x3a\x2c\x1b\x1b\xdb\x0b\x9a\x13\x9b\x2c\x1b\x3c\x3b'\
-b'\x3c\x5b\x34\x3b\x13\xba\x1b\x58\x52\xb1\x42\xf3\x1b\xba\x44\x5b'\
-b'\x6c\xda\x6c\xfa\x6c\xb9\x6c\xfa\x64\x99\x4b\x34\x5c\x78\x64\xba'\
-b'\x5b\x95\x5b\xf6\x64\xda\x54\x59\x4b\x14\x43\xb7\x3c\x5b\x34\x3a'\
-b'\x2c\x1b\x23\xfb\x1b\xfb\x2b\x99\x42\xd3\x33\x56\x2c\x1b\x44\x7a'\
-b'\x64\xdb\x6c\xfa\x6c\xfa\x6c\xfa\x74\xfa\x75\x1b\x74\xfa\x63\xf7'\
-b'\x5b\x95\x6c\xd9\x75\x1a\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x3a'\
-b'\x64\xda\x3c\x5b\x13\xbb\x13\xbb\x2c\x1b\x4c\x9b\x75\x1a\x85\x3a'\
-b'\x85\x5a\x6c\xfa\x44\x1a\x3b\xf8\x54\x59\x7d\x1a\x8d\x5a\x95\x7a'\
-b'\x9d\xba\xa5\xba\x9d\x9a\xa5\xba\x8d\x7a\x7d\x3a\x75\x1a\x64\xda'\
-b'\x54\xba\x54\x9a\x5c\xbb\x6c\xda\x7d\x3a\x8d\x5a\x95\x7a\x95\x7a'\
-b'\x9d\x99\x9d\x9a\x9d\x9a\x9d\xb9\xa5\xba\xa5\xb9\xa5\xba\x9d\x9a'\
-b'\x85\x5a\x6c\xfa\x54\x9b\x44\x5a\x54\x9b\x74\xfa\x95\x7a\x9d\x9a'\
-b'\xa5\xba\xa5\xd9\xad\xb9\xa5\xba\xa5\xd9\xad\xd9\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xb9\xad\xda\xb5\xba\xad\xda\xad\xda\xad\xd9'\
-b'\xad\xd9\xb5\xda\xad\xda\xb5\xd9\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xd9\xb5\xd9\xad\xfa\xad\xba\x7d\x19\x64\xfa\x7d\x1a\x9d\x9a'\
-b'\xad\xd9\xb5\xda\xa5\xba\x95\x7a\x95\x9a\x95\x7a\x9d\x99\xad\xda'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xda\x95\x79\x5c\xba\x74\xfa\x9d\x9a\xad\xfa\xb5\xfa\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xad\xda\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xad\xd9\xa5\xba\x8d\x5a\x85\x3a'\
-b'\x85\x5a\x85\x5a\x75\x1a\x75\x1a\x7d\x1a\x95\x7a\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xa5\xba\xa5\xba\x9d\xb9\xad\xda\xb5\xf9\xb5\xd9'\
-b'\xad\xda\xb5\xfa\xad\xd9\x95\x79\x74\xd9\x5b\xf7\x43\x96\x74\x98'\
-b'\xad\xda\xad\xfa\xb5\xd9\xad\xda\xb5\xd9\xad\xfa\xb5\xda\xb5\xda'\
-b'\xad\xd9\xad\xd9\xa5\xb9\x9d\x9a\xad\xd9\xad\xf9\xad\xda\xa5\xba'\
-b'\xa5\xd9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xbe\x1a\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xa5\x9a\xad\xd9\xb5\xf9\xad\xda\x7d\x3a\x4c\x7a\x4c\x7a'\
-b'\x54\xbb\x5c\xbb\x44\x5a\x64\xda\x85\x3a\x9d\x9a\xa5\xba\xa5\x9a'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\xa5\x9a\x9d\x9a\x95\x79\x75\x1a'\
-b'\x5c\xba\x54\x7a\x4c\x7b\x54\x9b\x5c\xda\x74\xfa\x7d\x3a\x5c\x9a'\
-b'\x33\x98\x2b\xb9\x3b\xfa\x75\x1a\x8d\x5a\x85\x3a\x75\x1a\x7d\x3a'\
-b'\x85\x3a\x74\xfa\x95\x7a\x95\x7a\x85\x3a\x8d\x5a\x95\x7a\x9d\x9a'\
-b'\x9d\x9a\x95\x7a\x64\xda\x54\x7a\x95\x7a\xa5\x9a\x9d\xba\x9d\x9a'\
-b'\x8d\x5a\x85\x3a\x75\x1a\x75\x1a\x74\xfb\x4c\x9a\x1b\x99\x23\x9a'\
-b'\x34\x3a\x5c\x79\x53\x75\x53\xd7\x3c\x5b\x34\x1a\x23\xfb\x1b\xdb'\
-b'\x23\xfb\x34\x3a\x3c\x3a\x4b\x75\x53\x13\x43\x56\x44\x5a\x3c\x3b'\
-b'\x2c\x1b\x34\x1b\x3c\x1a\x52\xf2\x5a\xb0\x4c\x39\x5c\xdb\x64\xda'\
-b'\x5c\x9a\x5b\x95\x5b\xb6\x53\xd7\x52\xd1\x64\x9a\x6c\xfa\x75\x1a'\
-b'\x6c\xfa\x44\x7b\x34\x3a\x23\xfb\x0b\x9a\x0b\x9a\x23\xfb\x34\x1a'\
-b'\x34\x3b\x2c\x1b\x13\xbb\x23\x57\x5a\x90\x33\x16\x23\xdb\x44\x7b'\
-b'\x64\xfa\x75\x1a\x75\x1b\x75\x1a\x53\xd6\x53\x75\x6c\xb9\x63\x94'\
-b'\x5b\xf6\x6c\xda\x64\xba\x43\x97\x4b\xf8\x53\x75\x4b\xb7\x34\x3a'\
-b'\x2c\x1b\x23\xfb\x23\xdb\x1b\xdb\x23\x99\x42\xf3\x43\x56\x44\x5b'\
-b'\x5c\xda\x6c\xfb\x6c\xfa\x74\xfa\x7d\x1a\x75\x1a\x64\x17\x5b\x95'\
-b'\x6c\xd9\x7d\x1a\x7d\x3a\x7d\x1a\x7d\x1a\x7d\x3a\x8d\x5a\x8d\x5a'\
-b'\x75\x1a\x75\x1a\x3c\x3b\x13\xbb\x34\x1b\x4c\x7a\x75\x1a\x85\x3a'\
-b'\x85\x3a\x6c\xfa\x54\x9a\x74\xfa\x85\x5a\x85\x3a\x8d\x5a\x9d\xb9'\
-b'\xb5\xd9\xb5\xfa\xad\xd9\xad\xd9\xa5\xba\x85\x3a\x7d\x1a\x6c\xfb'\
-b'\x5c\xbb\x54\x9a\x5c\xba\x64\xda\x75\x3a\x8d\x5a\x95\x7a\x9d\x7a'\
-b'\x95\x9a\x9d\x9a\x9d\x9a\xad\xda\xad\xda\xad\xda\xa5\xb9\xa5\x9a'\
-b'\x8d\x7a\x75\x1a\x5c\xba\x44\x7b\x4c\x7a\x64\xda\x8d\x5a\x9d\x99'\
-b'\xa5\xba\x9d\x9a\xa5\xba\x9d\x9a\x95\x7a\xa5\xba\xad\xd9\xad\xda'\
-b'\xb5\xf9\xad\xda\xad\xda\xb5\xda\xad\xd9\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xda\xb5\xd9\xad\xfa\xb5\xda\xb5\xd9\xa5\xb9\xad\xba'\
-b'\xb5\xfa\xb5\xf9\xb5\xda\x64\xda\x34\x3a\x4c\x5a\x54\x9a\x8d\x5a'\
-b'\x9d\x9a\x9d\x9a\x95\x7a\x7d\x39\x85\x3a\x85\x3a\x9d\x7a\xa5\xba'\
-b'\xad\xd9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xad\xb9\x9d\x9a\x9d\x9a\x9d\x9a\x9d\xba\x9d\xb9\xa5\x99\xad\xda'\
-b'\xb5\xfa\xb5\xda\xa5\xd9\xa5\xb9\xad\xda\xad\xda\xad\xda\xb5\xf9'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xd9\xad\xfa\x8d\x7a\x74\xfa'\
-b'\x8d\x5a\x6c\xfa\x3c\x3a\x44\x5b\x64\xda\x95\x7a\xb5\xfa\xb5\xf9'\
-b'\xb5\xda\xa5\xba\x8d\x5a\x7d\x3a\x85\x3a\x9d\xba\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xda\xad\xda\xa5\xda\x85\x3a\x4b\xf8'\
-b'\x95\x59\xb5\xf9\xad\xf9\xb5\xfa\xad\xd9\xad\xf9\xad\xda\xad\xd9'\
-b'\xad\xfa\xad\xda\xa5\xba\x9d\xba\xad\xda\xb5\xf9\xb5\xd9\xad\xda'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xad\xd9\x9d\x9a\xa5\xba\xa5\xda\x95\x79\x64\xda\x5c\xba\x74\xfa'\
-b'\x75\x1a\x75\x1a\x64\xda\x64\xba\x8d\x5a\x9d\x9a\xa5\xba\xa5\x9a'\
-b'\xa5\xb9\x9d\x9a\xa5\x9a\xa5\xda\xad\xda\xa5\xda\x8d\x5a\x4c\x7a'\
-b'\x4c\x7b\x6c\xfa\x54\x9a\x54\x9b\x64\xda\x75\x1a\x6c\xfa\x3c\x3a'\
-b'\x44\x19\x54\x79\x3c\x3a\x64\xba\x85\x5a\x85\x5a\x74\xfa\x75\x1a'\
-b'\x7d\x3a\x7d\x1a\x95\x7a\x95\x99\x95\x9a\xa5\xb9\xad\xd9\xad\xda'\
-b'\xb5\xf9\xad\xfa\x85\x3a\x7d\x3a\xad\xda\xad\xda\xa5\xb9\xad\xda'\
-b'\xad\xda\x9d\xba\x8d\x3a\x74\xfa\x6c\xfa\x44\x5b\x2c\x1a\x44\x5b'\
-b'\x64\xdb\x6c\xfa\x5c\x79\x53\x54\x43\xd8\x34\x3b\x23\xfb\x23\xfb'\
-b'\x2b\xfa\x34\x3b\x3b\xd8\x53\x95\x54\x7a\x43\x97\x3b\x97\x34\x3a'\
-b'\x2c\x1b\x33\xf9\x4b\x14\x53\x75\x4b\x13\x53\xd6\x64\xdb\x64\xda'\
-b'\x64\xdb\x5c\x9a\x5b\xb5\x53\x13\x5a\xb1\x5c\x58\x6c\xfa\x75\x1a'\
-b'\x75\x1a\x5c\xbb\x3c\x5b\x2b\xfb\x0b\x9a\x13\x9b\x1b\xdb\x2c\x1b'\
-b'\x2c\x1b\x23\xfb\x13\x9a\x33\x15\x5a\xb0\x23\x79\x23\xfb\x4c\x9b'\
-b'\x6c\xfa\x75\x1a\x74\xfa\x6c\xba\x53\x34\x5c\x38\x63\x95\x63\xd6'\
-b'\x6c\xfa\x6c\xfa\x53\xf7\x4b\xd7\x5c\xdb\x54\x7a\x53\x75\x43\x96'\
-b'\x34\x1a\x23\xdb\x1b\xdb\x1b\xdb\x13\xdb\x23\xba\x43\x55\x4c\x39'\
-b'\x5c\xda\x6c\xfa\x7d\x3a\x85\x3a\x85\x5a\x6c\xd9\x5b\xd6\x5c\x7a'\
-b'\x64\xda\x75\x1a\x7d\x3b\x7d\x3a\x7d\x3b\x85\x5a\xa5\xba\x9d\x9a'\
-b'\x95\x7a\x8d\x7a\x6d\x1a\x23\xfb\x2c\x1b\x4c\x7b\x74\xfa\x7d\x3a'\
-b'\x8d\x5a\x9d\xba\x95\x9a\x9d\x9a\x9d\x9a\x95\x7a\x95\x7a\xa5\xba'\
-b'\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa\x95\x9a\x8d\x7a\x85\x3a'\
-b'\x6c\xfa\x5c\xba\x75\x1a\x85\x3a\x7d\x1a\x85\x5a\x95\x7a\x95\x9a'\
-b'\x9d\x79\x9d\x9a\xa5\xda\xad\xd9\xb5\xf9\xad\xf9\xa5\xb9\xa5\xba'\
-b'\x95\x7a\x85\x3a\x5c\x7a\x33\xd8\x33\xf9\x54\x9a\x5c\xba\x8d\x5a'\
-b'\x95\x7a\x95\x7a\x9d\x9a\x9d\x99\x95\x7a\x95\x7a\xad\xda\xb5\xf9'\
-b'\xb5\xfa\xb5\xd9\xad\xba\xad\xda\xad\xda\xad\xd9\xb5\xda\xad\xd9'\
-b'\xad\xda\xb5\xda\xad\xd9\xb5\xda\xad\xfa\xad\xda\xad\xda\xad\xda'\
-b'\xad\xda\xb5\xd9\x9d\x9a\x4c\x7a\x75\x1a\x8d\x5b\x7d\x1a\x9d\x9a'\
-b'\xa5\xba\x95\x79\x95\x7a\xa5\xba\x9d\x9a\xa5\xda\xad\xd9\xb5\xfa'\
-b'\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xda\xad\xda'\
-b'\xad\xda\xad\xfa\xad\xda\xad\xd9\xa5\xda\xad\xb9\xad\xda\xad\xda'\
-b'\xad\xda\xa5\xba\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x9d\x9a\xad\xda'\
-b'\xad\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xa5\xba\x8d\x59'\
-b'\x9d\x9a\x9d\x9a\x7d\x1a\x4c\x7b\x5c\xba\x8d\x7a\xb5\xf9\xb5\xd9'\
-b'\xa5\xba\x95\x7a\x74\xfa\x5c\x9a\x64\xda\xad\xd9\xbd\xfa\xb5\xf9'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xfa\x7d\x1a'\
-b'\x7d\x19\xad\xda\xb5\xda\xb5\xf9\xad\xda\xb5\xf9\xb5\xda\xb5\xfa'\
-b'\xb5\xd9\xb5\xd9\xad\xda\xad\xda\xad\xd9\xb5\xf9\xb5\xda\xad\xd9'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xfa'\
-b'\xad\xda\x9d\x99\xa5\xb9\xa5\xba\x9d\xba\x8d\x7a\x7d\x3a\x85\x3a'\
-b'\xa5\xba\x9d\x9a\x8d\x7a\x7d\x1a\x95\x7a\x9d\xb9\xa5\xba\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\xa5\xba\xad\xd9\xad\xda\xa5\xba\x95\x7a\x6c\xfa'\
-b'\x6c\xda\x85\x5a\x85\x3a\x6c\xda\x6c\xfa\x85\x3a\x8d\x7a\x85\x3a'\
-b'\x95\x7a\xa5\xba\x8d\x7a\x85\x3a\xa5\xb9\xb5\xda\xad\xda\x9d\x9a'\
-b'\x85\x39\x8d\x5a\x95\x7a\xb5\xd9\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xbe\x1a\xb5\xfa\x9d\xba\x95\x7a\xad\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xda\x9d\x99\x7d\x1a\x6c\xfa\x5c\xbb\x54\x9a\x54\x9a'\
-b'\x75\x1a\x85\x5a\x64\xda\x54\x59\x4b\x34\x33\xb8\x2c\x1b\x23\xfb'\
-b'\x2c\x1b\x34\x3b\x44\x5a\x54\x9b\x54\xbb\x4c\x59\x43\x35\x33\xd9'\
-b'\x33\xd9\x4b\x13\x4b\x96\x4c\x7b\x53\xb6\x5a\xd0\x5c\x59\x64\xdb'\
-b'\x6c\xda\x6c\xda\x5c\xba\x5b\x95\x6a\x6d\x5b\x74\x6c\xda\x75\x1a'\
-b'\x75\x1a\x64\xba\x44\x5b\x34\x1b\x0b\x9b\x0b\x9b\x1b\xdb\x23\xfb'\
-b'\x23\xfb\x1b\xdb\x1b\x59\x5a\x90\x52\x90\x1b\x99\x2c\x1b\x54\x9b'\
-b'\x75\x1a\x75\x1a\x6c\xfa\x5b\x74\x53\x33\x5b\x94\x63\xf6\x6c\xda'\
-b'\x6c\xfb\x5c\x79\x43\x96\x6c\xba\x6c\xda\x5c\xba\x4c\x7a\x4b\x75'\
-b'\x43\x76\x23\xda\x1b\xdb\x1b\xdb\x1b\xdb\x1b\xdb\x34\x1b\x4c\x7b'\
-b'\x64\xba\x85\x3a\x9d\xba\x95\x7a\x7d\x1a\x74\xfa\x7d\x3a\x6c\xfa'\
-b'\x7d\x1a\x95\x7a\x85\x3a\x7d\x3a\x7d\x1a\x74\xf9\x85\x3a\x95\x5a'\
-b'\x95\x7a\xa5\x9a\x95\x9a\x34\x1a\x2b\xfb\x44\x7a\x6c\xfa\x85\x3a'\
-b'\x8d\x7a\xad\xda\xb5\xda\xad\xd9\xad\xd9\xad\xda\x9d\x9a\xa5\xba'\
-b'\xb5\xf9\xb5\xfa\xad\xd9\x95\x7a\x8d\x5a\x8d\x7a\x95\x7a\xa5\x9a'\
-b'\x95\x9a\x85\x5a\x9d\xba\xa5\xda\x95\x7a\x8d\x5a\x95\x7a\x95\x7a'\
-b'\x95\x99\x9d\x9a\xa5\xba\xad\xda\xad\xda\xb5\xda\xad\xda\xa5\xb9'\
-b'\x95\x9a\x5c\x7a\x2b\xb8\x33\xd9\x3c\x3a\x5c\xdb\x5c\x9a\x7d\x1a'\
-b'\x8d\x5a\x9d\x99\x9d\x9a\x9d\xba\xa5\xba\x95\x99\xa5\x9a\xad\xd9'\
-b'\xb5\xf9\xa5\xda\xa5\xba\xa5\x99\xa5\xba\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xda\xb5\xd9\xad\xf9\xb5\xd9\xad\xd9\xa5\xb9\xa5\xba'\
-b'\xad\xda\xb5\xf9\x9d\x9a\x7d\x1a\x9d\x9a\x9d\x9a\x95\x9a\xa5\xba'\
-b'\xad\xda\xad\xda\xa5\xba\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xfa\xad\xda'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xd9\xad\xda'\
-b'\xad\xd9\xad\xda\xb5\xfa\xad\xd9\xb5\xda\xb5\xfa\xb6\x19\xbd\xfa'\
-b'\xad\xba\x9d\x9a\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x9d\x9a\xa5\xda'\
-b'\xad\xd9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xad\xda\xa5\xba\x7d\x1a\x64\xda\x95\x9a\xb5\xfa\xb5\xd9'\
-b'\xb5\xfa\xb5\xfa\xa5\xda\x95\x9a\x95\x7a\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xf9\xad\xda'\
-b'\x95\x79\xad\xda\xad\xda\xb5\xd9\xad\xf9\xad\xd9\xb5\xda\xb5\xd9'\
-b'\xad\xfa\xb5\xd9\xb5\xf9\xad\xda\xad\xda\xb5\xf9\xb5\xfa\xad\xda'\
-b'\xad\xd9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\x9d\x9a\x8d\x5a\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xad\xda\x95\x79'\
-b'\xad\xba\xad\xfa\x9d\xb9\x8d\x5a\x95\x9a\xa5\xba\xa5\xba\x95\x7a'\
-b'\x64\xba\x5c\x9a\x74\xfa\x9d\x9a\xad\xfa\xad\xda\xa5\xda\xa5\xba'\
-b'\x9d\x9a\x9d\x9a\xa5\xba\x95\x7a\x85\x5a\xa5\xba\xad\xba\xa5\xda'\
-b'\xa5\xda\xa5\x9a\x9d\x9a\xad\xda\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9'\
-b'\xad\xda\x9d\xb9\x95\x79\xb5\xfa\xbe\x19\xbd\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xbe\x19\xb5\xd9\x9d\x9a\xb5\xfa\xb5\xf9\xad\xfa\xb5\xda'\
-b'\xad\xda\xad\xd9\xa5\xba\x7d\x1a\x64\xfa\x75\x1a\x75\x1a\x7d\x3a'\
-b'\x95\x7a\x95\x7a\x64\xdb\x4c\x9a\x44\x19\x4b\x14\x33\x98\x23\xfb'\
-b'\x2c\x1b\x3c\x3a\x44\x5b\x54\xba\x54\xba\x4c\x7a\x3b\xf9\x3c\x1b'\
-b'\x33\xd9\x43\xb8\x44\x7b\x54\x9b\x54\x59\x53\x74\x5c\x79\x6c\xfa'\
-b'\x6c\xfa\x6c\xfa\x6c\xfa\x5c\x79\x5a\xb0\x53\x13\x64\xdb\x75\x1a'\
-b'\x7d\x1b\x6c\xfa\x4c\x7a\x34\x3b\x0b\x9b\x0b\x9b\x13\xbb\x23\xdb'\
-b'\x23\xfb\x13\xbb\x23\x58\x62\x8f\x52\xb1\x1b\x9a\x34\x3b\x54\xba'\
-b'\x75\x1a\x75\x1a\x74\xfa\x64\x17\x53\xb6\x64\x16\x6c\xfa\x6d\x1a'\
-b'\x74\xfa\x6c\xfa\x64\xb9\x74\xfa\x6c\xfa\x64\xda\x54\xbb\x4c\x5a'\
-b'\x43\x76\x3b\x36\x23\xba\x1b\xdb\x13\xdb\x23\xfb\x34\x3b\x4c\x7b'\
-b'\x6c\xda\x9d\xba\xad\xda\xad\xda\x8d\x5a\x9d\x9a\xa5\xba\x9d\xba'\
-b'\x9d\xba\xa5\xba\x75\x1a\x5c\x79\x43\x97\x33\x37\x2b\x58\x33\x98'\
-b'\x6c\xb9\x9d\x9a\xa5\xba\x3c\x3a\x23\xfb\x44\x5b\x64\xda\x85\x3a'\
-b'\x85\x3a\xad\xda\xb5\xda\xb5\xf9\xb5\xda\xb5\xf9\x9d\x9a\x95\x79'\
-b'\xb5\xfa\xad\xb9\x8d\x5a\x8d\x5a\x95\x7a\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xa5\xb9\xa5\xba\xad\xb9\xad\xda\xad\xda\x95\x7a\x8d\x7a\x95\x9a'\
-b'\x9d\x7a\x95\x79\xa5\xba\xad\xba\xa5\xba\xad\xda\xa5\xda\xa5\xba'\
-b'\x8d\x5a\x4c\x7a\x54\x9a\x64\xdb\x64\xba\x75\x1a\x95\x7a\x9d\x9a'\
-b'\x95\x7a\x95\x7a\xad\xd9\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xda\xad\xda\xa5\xba\xa5\xba\xad\xd9\xad\xfa\xad\xda\xad\xd9'\
-b'\xad\xba\xad\xda\xb5\xd9\xb5\xfa\xb5\xfa\xad\xd9\xa5\xba\x9d\x9a'\
-b'\x9d\x9a\x8d\x5a\x7d\x3a\x8d\x5a\x8d\x7a\x75\x1a\x5c\xba\x5c\xba'\
-b'\x85\x5a\xad\xd9\xad\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xad\xda\xad\xda'\
-b'\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xad\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xad\xda\xad\xda\xa5\xba\x9d\x9a\x95\x7a\x95\x7a\x9d\x9a\xa5\xb9'\
-b'\xad\xfa\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xad\xda\x85\x3a\x6c\xfa\x7d\x1a\xa5\xba\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa'\
-b'\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xfa\xbd\xfa\xbe\x1a\xb5\xf9'\
-b'\xad\xda\xad\xda\xad\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xad\xd9\xb5\xfa'\
-b'\xb5\xd9\xb5\xfa\xb5\xf9\xad\xda\xad\xfa\xb5\xd9\xb5\xd9\xad\xda'\
-b'\xad\xd9\xad\xd9\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xd9\xb5\xda'\
-b'\xad\xda\xad\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xad\xda'\
-b'\xa5\xba\xad\xda\xa5\xda\x9d\x7a\x9d\x9a\xa5\xb9\xad\xd9\xa5\xba'\
-b'\x74\xfa\x6c\xfa\x6c\xfa\x85\x3a\xa5\xb9\x9d\x9a\xa5\xb9\xb5\xf9'\
-b'\xad\xd9\xad\xfa\xad\xd9\xa5\xba\xad\xfa\xbd\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xad\xd9\xad\xd9\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xfa\xad\xfa\x9d\x99\xad\xda\xbd\xfa\xb5\xf9\xb6\x19\xbd\xfa'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\x9d\x99\xad\xda\xad\xda\xa5\xb9\x9d\x9a'\
-b'\x9d\xba\xad\xda\xa5\xba\x7d\x1a\x75\x1a\x95\x7a\x9d\x9a\x9d\xba'\
-b'\xa5\xba\x95\x7a\x64\xba\x54\x9a\x44\x7b\x3b\xd8\x43\x34\x2b\xd9'\
-b'\x2c\x1b\x3c\x3b\x4c\x7a\x54\x9b\x54\x9b\x44\x7a\x3c\x3b\x3c\x3b'\
-b'\x3c\x3a\x44\x5b\x4c\x9a\x5c\xba\x64\xda\x6c\xdb\x6c\xfa\x6c\xfa'\
-b'\x6c\xfa\x74\xfa\x74\xfa\x64\xda\x54\x5a\x5c\x9a\x74\xfa\x74\xfa'\
-b'\x7d\x1a\x75\x1a\x54\x9b\x3c\x3b\x13\xdb\x13\x9b\x13\xbb\x1b\xdb'\
-b'\x1b\xdb\x13\x9b\x13\x7a\x23\x37\x23\x58\x23\xda\x3c\x5b\x64\xda'\
-b'\x7d\x1a\x7d\x1b\x7d\x1a\x7d\x3a\x74\xfa\x74\xfa\x75\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1a\x75\x1a\x74\xfa\x74\xfa\x64\xfa\x5c\xba\x4c\x9b'\
-b'\x3c\x5b\x3b\x56\x43\x14\x1b\x9a\x13\xbb\x23\xfb\x34\x3b\x54\x7b'\
-b'\x6c\xfa\xa5\xba\xb5\xf9\xad\xda\x9d\x7a\xa5\xd9\xad\xfa\xb5\xd9'\
-b'\xad\xda\x8d\x5a\x44\x19\x3b\xd9\x43\xd8\x3b\xf8\x3b\xf9\x3c\x19'\
-b'\x44\x38\x8d\x5a\x95\x9b\x2c\x1b\x23\xfb\x3c\x5a\x64\xda\x7d\x3a'\
-b'\x8d\x5a\xad\xda\xad\xf9\xad\xda\xb5\xf9\xb5\xf9\xad\xda\xa5\xba'\
-b'\xad\xd9\x9d\x9a\x9d\x9a\xad\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\xad\xd9\x9d\x9a\x8d\x59\x95\x9a'\
-b'\x9d\x7a\x9d\x9a\xa5\xb9\xad\xda\xa5\xba\x9d\x99\x9d\x99\x9d\xba'\
-b'\x95\x7a\x95\x7a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\xa5\xd9\xb5\xf9'\
-b'\xad\xda\xa5\xba\xb5\xd9\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xa5\xba\xa5\xba\xad\xd9\x74\xf9\x74\xd9\xad\xda\x9d\x9a\x9d\x7a'\
-b'\x9d\x9a\x9d\x99\xad\xda\xb5\xf9\xb5\xf9\xad\xda\x95\x7a\x9d\x9a'\
-b'\x7d\x3a\x6c\xfa\x8d\x7a\x95\x9a\x95\x7a\x8d\x7a\x85\x3a\x74\xfa'\
-b'\x7d\x1a\x85\x39\xad\xda\xb5\xfa\xad\xda\xa5\xb9\xad\xda\xb5\xfa'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xad\xda\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xad\xda\xa5\xb9\xa5\xb9\x9d\x99\x95\x7a\x8d\x7a\x95\x79\x9d\x9a'\
-b'\xad\xd9\xad\xd9\xb5\xfa\xb5\xda\xb5\xf9\xb5\xf9\xb5\xda\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xda\x95\x99\x85\x3a\x8d\x5a\xad\xd9\xb5\xfa'\
-b'\xbd\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbe\x19\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9\xb5\xfa'\
-b'\xb5\xfa\xad\xda\xad\xda\xad\xf9\xb5\xf9\xad\xda\xb5\xfa\xb5\xf9'\
-b'\xad\xda\xb5\xd9\xad\xfa\xb5\xf9\xb5\xda\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xda\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xad\xb9\xad\xda\xa5\xba\x9d\x99\xa5\xba\xad\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xda\xad\xda\x9d\x99\xa5\xba\xad\xda\xb5\xd9'\
-b'\xb5\xfa\xad\xda\xad\xd9\xb5\xda\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xda\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xfa\xad\xda\xad\xb9\xbe\x19\xbe\x1a\xb5\xf9\xb5\xf9'\
-b'\xbe\x19\xbe\x1a\xb5\xf9\xa5\xba\x9d\x9a\x85\x5a\x85\x3a\x9d\x9a'\
-b'\x8d\x7a\x95\x7a\x95\x9a\x7d\x3a\x85\x5a\x95\x7a\x95\x7a\x9d\x9a'\
-b'\x95\x9a\x95\x9a\x8d\x5a\x74\xfb\x54\x9a\x3c\x3b\x33\xd8\x33\xd9'\
-b'\x34\x1b\x3c\x3a\x44\x7a\x54\xbb\x4c\x7a\x43\xb7\x43\x55\x34\x3a'\
-b'\x44\x5b\x4c\x9b\x54\xba\x5c\xda\x6c\xda\x6c\xfa\x75\x1b\x75\x1a'\
-b'\x74\xfa\x74\xfa\x75\x1b\x75\x1a\x75\x1a\x7d\x1a\x75\x3a\x75\x1a'\
-b'\x75\x1b\x75\x1a\x5c\xba\x44\x5b\x1b\xdb\x0b\xbb\x13\xbc\x13\xbb'\
-b'\x13\x9b\x0b\x9b\x0b\x9b\x0b\x7b\x13\xbb\x23\xfb\x44\x5a\x6c\xfa'\
-b'\x7d\x1a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x1a\x75\x1a\x75\x1a\x7d\x1b'\
-b'\x75\x1b\x75\x1a\x7c\xfa\x75\x1b\x75\x1a\x6c\xfa\x64\xdb\x54\x9a'\
-b'\x44\x7a\x2c\x1b\x33\x56\x43\x14\x23\xba\x23\xfb\x34\x3b\x4c\x9a'\
-b'\x6c\xda\x9d\x9a\xad\xfa\xad\xda\x9d\xba\xad\xda\xad\xda\xb5\xf9'\
-b'\xad\xda\x54\x79\x74\xfa\x9d\x9a\x9d\x9a\x9d\xba\x9d\x9a\x9d\xba'\
-b'\x95\x7a\x9d\x9a\x8d\x5a\x2b\xfa\x23\xfb\x3c\x3b\x5c\xba\x7d\x3a'\
-b'\x95\x9a\xa5\xba\xa5\xba\xad\xd9\xb5\xfa\xb5\xfa\xad\xd9\xad\xd9'\
-b'\xa5\x9a\xa5\xba\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xda\xad\xd9\xad\xda\x9d\xba\x8d\x5a\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x9d\x9a\xa5\xb9\xad\xda\xad\xba\xa5\xba'\
-b'\x9d\x99\xa5\xba\xa5\xd9\xad\xd9\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xfa\xb6\x1a'\
-b'\x9d\x9a\x8d\x59\xa5\xba\x85\x3a\x74\xfa\x85\x3a\x8d\x5a\x8d\x5a'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\xad\xda\xb5\xf9\xad\xd9\x9d\x99\xad\xda'\
-b'\x8d\x7a\x8d\x5a\x9d\x99\xad\xda\xb5\xfa\xb5\xf9\xa5\xba\x8d\x7a'\
-b'\x95\x7a\x8d\x5a\x9d\xba\xa5\xb9\xa5\xba\xad\xda\xad\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xbe\x19\xb5\xfa'\
-b'\xbd\xf9\xbd\xf9\xb5\xfa\xad\xd9\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xad\xfa\xb5\xfa\xad\xfa\xad\xda\xad\xb9\xa5\x99\xa5\xba\xad\xda'\
-b'\xad\xd9\xad\xd9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xda\x9d\xba\x85\x3a\x9d\xba\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xbd\xfa\xbe\x19\xb5\xfa\xbd\xfa\xbe\x1a\xb5\xfa'\
-b'\xad\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xda\xad\xd9\xad\xda\xad\xda'\
-b'\xb5\xd9\xad\xda\xad\xd9\xad\xda\xad\xfa\xad\xda\xa5\xb9\xb5\xfa'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xa5\x57\x52\xcc'\
-b'\x42\x4a\x42\x4a\x42\x4a\x3a\x4a\x3a\x2a\x63\x8f\x94\xd4\x4a\x6a'\
-b'\x5b\x2d\xb5\xb9\xb5\xf9\xb5\xf9\x63\x6f\x42\x2a\x7c\x53\x9d\x37'\
-b'\x4a\xab\x42\x6a\x42\x4a\x4a\x6a\x4a\x6a\x52\xec\xad\x98\xbd\xfa'\
-b'\xb5\xf9\xb5\xf9\x73\xb0\x42\x49\x63\x6f\xb5\xd9\xbe\x1a\xa5\x56'\
-b'\x52\xab\x52\xcc\x9d\x57\xad\xfa\xb5\xb9\x7c\x11\x4a\x8a\x39\xe8'\
-b'\x4a\x6a\x7c\x11\xad\xb9\xad\xda\x95\x37\x42\x8c\x3a\x2a\x42\x4a'\
-b'\x42\x4a\x42\x6b\x63\xb1\x8d\x59\x95\x59\x53\x0e\x3a\x2a\x3a\x4a'\
-b'\x3a\x2a\x4a\x8c\x63\xd1\x95\x38\x95\x9a\x74\xfa\x22\x6f\x09\x8a'\
-b'\x23\x34\x3c\x5b\x44\x7b\x3b\x95\x22\x0c\x19\x06\x11\x48\x22\x90'\
-b'\x44\x18\x54\x9a\x5c\xdb\x64\xdb\x6c\xfa\x74\xfa\x53\xd4\x32\x2b'\
-b'\x21\xa8\x29\xea\x43\x0f\x6c\x98\x74\xd9\x3a\x8d\x32\x0a\x2a\x0a'\
-b'\x2a\x0a\x32\x0a\x2a\x0b\x33\xd7\x1b\xfb\x13\x7a\x02\x51\x01\x6b'\
-b'\x01\x28\x01\x8b\x0a\x93\x13\x9b\x1b\x79\x11\xec\x19\xeb\x64\x77'\
-b'\x7d\x1b\x7d\x3a\x5b\xd4\x2a\x0a\x42\xef\x7c\xf9\x4b\x10\x2a\x0a'\
-b'\x2a\x0a\x32\x0a\x2a\x0b\x42\xef\x6c\x98\x75\x1b\x43\x73\x21\xca'\
-b'\x2a\xb0\x23\x34\x09\x8b\x19\x28\x11\x48\x09\x8b\x11\xaa\x21\xcb'\
-b'\x3a\xcf\x3a\x4b\x4a\xab\x95\x16\xa5\xba\x9d\x99\x63\x6f\x42\x4a'\
-b'\x63\x8f\x74\xf9\x9d\xba\xad\xfa\x94\xf5\x4a\x8a\x42\x6a\x4a\x6a'\
-b'\x42\x4a\x3a\x4a\x4a\xee\x2a\xaf\x09\x8a\x22\x8f\x54\x9a\x7d\x1a'\
-b'\x95\x9a\x74\x33\x3a\x2a\x4a\xcc\x73\xf2\x42\x6a\x42\x4a\x42\x4a'\
-b'\x42\x4a\x42\x4a\x6b\x8f\xa5\x57\x52\xab\x4a\x6a\x8c\x93\xb5\xfa'\
-b'\xbd\xfa\x84\x32\x42\x4a\x5b\x90\x6c\x34\x42\x4a\x32\x2a\x3a\x2a'\
-b'\x3a\x2a\x3a\x2a\x3a\x4a\x74\x33\xa5\xba\xa5\xba\xa5\xda\xad\xd9'\
-b'\xad\xda\xa5\xda\xad\xda\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xfa\xb5\xf9\xbe\x19\xbd\xfa'\
-b'\xad\xd9\xa5\xda\x9d\xba\x95\x7a\x7d\x1a\x85\x3a\x8d\x79\x9d\x9a'\
-b'\xad\xda\xad\xd9\xad\xd9\xad\xd9\xb5\xfa\xad\xba\xad\xda\xb5\xf9'\
-b'\xad\xd9\x9d\x9a\x95\x9a\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\x95\x79'\
-b'\x95\x7a\xa5\xba\xa5\xb9\x9d\x7a\xa5\xba\xb5\xd9\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xbe\x1a\xbe\x19\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9'\
-b'\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xfa\xad\xd9\xb5\xfa\xbd\xfa\xbe\x19'\
-b'\xad\xba\xad\xda\xad\xd9\xad\xda\xad\xfa\xad\xda\xad\xd9\xb5\xfa'\
-b'\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xfa\xa5\x9a\x85\x39\x95\x7a\xad\xba\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x19\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xad\xda\xa5\xb9\xad\xd9'\
-b'\xad\xda\xa5\xd9\xad\xb9\xad\xd9\xad\xda\xad\xd9\xad\xb9\xb5\xfa'\
-b'\xbd\xf9\xb5\xf9\xb6\x19\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xda\xad\xd9'\
-b'\xa5\xba\xad\xda\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\x9d\x15\x10\xa2'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x39\xe8\x73\xf1\x00\x00'\
-b'\x21\x24\xad\x78\xb5\xf9\xb5\xf9\x39\xe8\x00\x00\x5b\x4e\x8c\xd5'\
-b'\x08\x61\x00\x00\x00\x00\x00\x00\x00\x00\x10\xc3\xa5\x36\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\x3a\x08\x00\x00\x00\x20\x73\xd0\xbe\x1a\x94\xd4'\
-b'\x00\x41\x10\x82\x95\x16\xa5\x98\x4a\x6a\x00\x20\x00\x00\x00\x20'\
-b'\x00\x00\x00\x20\x42\x6a\xa5\x78\x9d\x16\x10\xa2\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x20\x52\xed\x9d\x79\x29\x87\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x29\xa7\x94\xf6\xa5\x99\x29\x87\x00\x00'\
-b'\x22\x8f\x3c\x5b\x2a\xb0\x00\x62\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x11\x68\x4c\x37\x5c\xba\x6c\xda\x6c\xfb\x53\xb3\x08\x82\x00\x00'\
-b'\x00\x20\x00\x00\x00\x00\x2a\x0a\x6c\x97\x10\xe4\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x41\x33\x74\x23\xb9\x01\x49\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x21\x02\x30\x13\x37\x00\x62\x00\x41\x5c\x15'\
-b'\x7d\x3a\x85\x5a\x4a\xef\x00\x00\x21\x66\x74\xd9\x21\x88\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x21\x87\x6c\xb9\x32\x8d\x00\x00'\
-b'\x11\x8a\x22\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x32\x6d\x19\x67\x00\x00\x3a\x6b\x95\x7a\x7c\x54\x08\x61\x00\x41'\
-b'\x7c\x12\x95\x9a\x9d\x9a\xad\xfa\x7c\x32\x00\x20\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x21\x46\x52\xee\x00\x00\x00\x83\x4b\xf6\x75\x1a'\
-b'\x95\x7a\x3a\x09\x00\x00\x29\xc8\x53\x0e\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x3a\x09\x94\xd5\x08\x61\x00\x00\x21\x25\x9d\x36'\
-b'\xbe\x1a\x52\xec\x00\x00\x21\xea\x3a\xf0\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x63\x6f\xad\xda\xa5\xb9\xa5\xda\xad\xd9'\
-b'\xad\xda\xa5\xba\xa5\xba\xad\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\xb6\x19\xbd\xfa\xb6\x19\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xfa'\
-b'\xad\xd9\xa5\x9a\x95\x7a\x7d\x1a\x8d\x5a\xa5\xda\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xda\xa5\xba\xb5\xfa\xb5\xfa'\
-b'\xb5\xfa\xa5\xb9\xad\xba\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\x9d\x99'\
-b'\x9d\x9a\xb5\xda\xb5\xfa\xad\xda\xb5\xf9\xb5\xf9\xb6\x1a\xbe\x19'\
-b'\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x19\xb5\xfa\xbd\xf9\xbe\x1a'\
-b'\xb5\xf9\xb6\x1a\xbd\xf9\xb5\xf9\xb5\xfa\xb5\xda\xb5\xf9\xbd\xfa'\
-b'\xa5\x9a\xad\xda\xa5\xda\xa5\xb9\xa5\xba\xb5\xf9\xb5\xda\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\x9d\x9a\x7d\x3a\x7d\x1a\x9d\xb9\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xf9\xbd\xfa'\
-b'\xbd\xfa\xb6\x19\xb5\xfa\xbe\x19\xbd\xfa\xbd\xfa\xbd\xf9\xb5\xfa'\
-b'\x9d\xba\xad\xda\xb5\xf9\xb5\xfa\xb5\xd9\xad\xfa\xad\xda\xad\xda'\
-b'\xad\xd9\xb5\xda\xb5\xfa\xb5\xfa\xb5\xda\xad\xd9\xad\xda\xb5\xf9'\
-b'\xbe\x1a\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xa5\x99'\
-b'\x8d\x5a\x85\x5a\x95\x79\xad\xda\xb5\xfa\xb5\xf9\xad\x98\x84\x52'\
-b'\x73\xf1\x19\x45\x00\x00\x3a\x29\x74\x12\x94\xd4\x7c\x11\x00\x00'\
-b'\x21\x25\xad\x98\xbe\x1a\xb5\xf9\x39\xe8\x00\x00\x5b\x4e\x8c\xd5'\
-b'\x08\x41\x00\x41\x6b\x8f\x84\x52\x84\x32\x8c\x73\xb5\xd8\xb5\xfa'\
-b'\xbd\xf9\xb5\xf9\x42\x08\x00\x00\x00\x00\x10\xc3\x94\xf5\x94\xd4'\
-b'\x08\x61\x08\xa2\x9d\x16\x63\x4f\x00\x00\x08\x82\x63\x4e\x8c\x93'\
-b'\x63\x4e\x08\x82\x00\x00\x63\x4e\x9d\x36\x10\xa2\x00\x20\x63\x4e'\
-b'\x84\x32\x4a\x8a\x00\x00\x18\xe4\x95\x16\x29\x86\x00\x00\x42\x6a'\
-b'\x74\x12\x63\x4e\x18\xe3\x00\x00\x42\x4a\xa5\x98\x29\x87\x00\x00'\
-b'\x1a\x90\x33\x75\x00\x62\x00\x00\x11\xaa\x2b\x33\x22\xb1\x00\xa4'\
-b'\x08\xc4\x43\xb4\x64\xdb\x6c\xfa\x6c\xfa\x29\xea\x00\x00\x19\x67'\
-b'\x53\xb3\x4b\x30\x21\xa8\x53\xb3\x74\xb8\x10\xe4\x00\x00\x3a\x8d'\
-b'\x53\xb2\x5b\xb2\x53\xb3\x4c\x39\x1a\x0d\x00\x00\x00\x42\x02\x0f'\
-b'\x0a\x93\x01\x8c\x00\x41\x01\x6a\x1b\x15\x00\x62\x00\x41\x64\x15'\
-b'\x7d\x3a\x7d\x3a\x43\x0f\x00\x00\x21\x67\x74\xf8\x21\xa8\x00\x00'\
-b'\x29\xea\x53\x92\x42\xef\x00\x61\x00\x20\x53\xb3\x3a\xae\x00\x00'\
-b'\x19\xa9\x33\xb7\x1a\xd3\x0a\x50\x00\x21\x00\x00\x21\xcb\x32\xf1'\
-b'\x54\x57\x53\xb4\x00\x61\x08\x61\x6b\xd2\x31\xc8\x00\x00\x42\x8b'\
-b'\xad\xd9\xad\xba\x9d\x99\xb5\xfa\x7c\x32\x00\x00\x10\xc2\x6b\xd1'\
-b'\x53\x92\x22\xd2\x33\x74\x4b\xf6\x08\xa3\x00\x00\x4b\x30\x8d\x7b'\
-b'\x84\xd6\x10\xa2\x00\x00\x73\xf1\x6b\x8f\x00\x00\x19\x04\x74\x11'\
-b'\x74\x12\x7c\x31\x94\xd5\x94\xf5\x08\x61\x00\x00\x00\x00\x42\x49'\
-b'\xb5\xd9\x5a\xec\x00\x00\x3a\x2a\x8c\xf7\x74\x12\x6b\x8f\x08\x61'\
-b'\x00\x20\x63\x6e\x84\x31\x9d\x36\xb5\xfa\xb5\xf9\xad\xda\x95\x7a'\
-b'\x7d\x3a\x75\x1a\x75\x1a\x95\x7a\xad\xd9\xad\xda\xb5\xda\xad\xd9'\
-b'\xb5\xda\xb5\xfa\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xa5\xb9\xa5\xba\x85\x59\x85\x5a\xad\xba\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xfa\xbe\x19\xb5\xf9\xb6\x1a\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xda\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xad\xda'\
-b'\xa5\xba\xb5\xd9\xad\xd9\xad\xd9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xad\xd9\xb5\xfa\xbd\xfa'\
-b'\xa5\xba\xa5\xd9\xad\xda\xad\xf9\xad\xd9\xb5\xda\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xda\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xd9'\
-b'\xb5\xfa\xb5\xda\xbd\xfa\xb5\xd9\x9d\xb9\x9d\x9a\xad\xfa\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb6\x19\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xbe\x1a\xb5\xf9\xbd\xfa\xbd\xf9\xb6\x1a\xb5\xf9\xbd\xfa\xad\xd9'\
-b'\x8d\x5a\x8d\x59\x95\x7a\xad\xda\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xd9\xad\xda'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xda'\
-b'\xa5\xb9\x95\x7a\x95\x79\x9d\x9a\xb5\xfa\xb5\xd9\xb5\xfa\xad\xfa'\
-b'\xad\xda\x31\xc8\x00\x00\x5b\x2e\xb5\xfb\xb5\xfa\x7c\x12\x00\x00'\
-b'\x08\xa2\x52\xcc\x5b\x0c\x5b\x0d\x19\x04\x00\x00\x63\x4e\x94\xf5'\
-b'\x08\x61\x00\x41\x52\xcc\x63\x4e\x63\x4d\x73\xd0\xb5\xd9\xbe\x19'\
-b'\xb5\xfa\xb5\xd9\x3a\x08\x00\x00\x00\x00\x00\x00\x31\xa7\x84\x52'\
-b'\x08\x61\x10\x82\x8c\xb4\x29\x86\x00\x00\x5a\xec\xb6\x19\xb6\x1a'\
-b'\xb5\xf9\x5b\x0d\x00\x00\x29\x86\x94\xf5\x10\xa3\x00\x41\x84\x73'\
-b'\xad\x98\x6b\xaf\x00\x00\x10\xc3\x94\xf6\x29\xa7\x00\x00\x6b\xb0'\
-b'\xb5\xfa\xad\xfa\x74\x11\x00\x00\x10\xa2\x8c\xd5\x31\xa7\x00\x00'\
-b'\x1a\x90\x1a\x4e\x00\x00\x09\x06\x3b\xf9\x3c\x5b\x44\x5b\x3b\xb6'\
-b'\x44\x17\x5c\x9a\x64\xda\x6c\xdb\x6c\xfa\x32\x2b\x00\x00\x00\x62'\
-b'\x29\xc9\x42\xce\x5b\xd3\x75\x1a\x74\xd8\x10\xc4\x00\x00\x2a\x0a'\
-b'\x42\xee\x42\xce\x43\x10\x43\xf6\x08\xc5\x00\x00\x01\xee\x13\x9a'\
-b'\x13\x7a\x13\x59\x0a\xd5\x13\x7a\x1b\x77\x00\x62\x00\x21\x64\x15'\
-b'\x7d\x3a\x85\x3b\x4a\xef\x00\x00\x19\x66\x74\xd9\x21\x88\x00\x00'\
-b'\x3a\xad\x6c\xb8\x5b\xf5\x08\xa3\x00\x00\x4b\x72\x3a\xae\x00\x00'\
-b'\x11\x89\x3c\x3a\x2c\x3c\x13\x57\x00\x62\x00\x21\x2b\x35\x4c\x7b'\
-b'\x5c\xda\x7d\x1a\x4a\xad\x00\x00\x08\xa3\x00\x20\x10\xe4\x7c\xb6'\
-b'\x9d\x9a\x9d\x9a\x95\x9a\xad\xfa\x7c\x32\x00\x20\x10\x82\x4a\xed'\
-b'\x22\x4e\x1a\x2e\x33\x32\x7d\x3a\x3a\x2a\x00\x00\x31\xe8\xa5\xba'\
-b'\x63\x90\x00\x00\x18\xe3\xa5\x57\x6b\x8f\x00\x00\x18\xe3\x5b\x2e'\
-b'\x5b\x2e\x63\x2e\x84\x73\x94\xf5\x08\x61\x00\x00\x00\x00\x00\x00'\
-b'\x63\x6e\x5a\xec\x00\x00\x3a\x2a\xad\xd9\xb6\x1a\x9d\x36\x10\xa2'\
-b'\x08\x61\x94\xf5\xbe\x3a\xbd\xfa\xbe\x19\xb5\xfa\xad\xda\x7d\x19'\
-b'\x74\xfa\x7d\x1a\x85\x3a\x95\x7a\xa5\xba\x95\x7a\xa5\xb9\xa5\xba'\
-b'\xad\xd9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xad\xda\x95\x9a\xa5\x9a\xad\xda\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xfa\xb5\xfa\xad\xda\xad\xd9\xb5\xda'\
-b'\xad\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xb6\x19'\
-b'\xb5\xfa\xbd\xfa\xad\xda\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xf9\xbe\x1a'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xad\xd9\xad\xb9\xb5\xfa\xbd\xfa'\
-b'\xb5\xfa\xad\xda\xad\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xbe\x19\xb5\xfa'\
-b'\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xad\xda'\
-b'\xa5\xb9\x95\x7a\x85\x5a\x8d\x39\xa5\xba\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xda\xad\xd9\xad\xda'\
-b'\xad\xb9\x31\xc8\x00\x00\x53\x2e\x9d\x9a\xa5\xda\x74\x11\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x4e\x94\xd5'\
-b'\x08\x61\x00\x00\x00\x00\x00\x00\x00\x00\x19\x04\xad\x77\xbd\xfa'\
-b'\xbd\xf9\xb5\xf9\x42\x09\x00\x00\x31\xe8\x08\xa2\x00\x00\x31\xa7'\
-b'\x00\x40\x10\xa2\x84\x94\x19\x04\x00\x00\x7c\x31\xb5\xfa\xb5\xf9'\
-b'\xbd\xfa\x7c\x32\x00\x00\x19\x04\x7c\x54\x10\xa2\x00\x00\x10\xa2'\
-b'\x18\xc3\x08\x41\x00\x00\x3a\x29\xa5\x78\x29\x86\x00\x00\x6b\xb0'\
-b'\xb5\xfa\xb5\xfa\x95\x16\x08\x82\x08\x41\x84\x93\x31\xa7\x00\x00'\
-b'\x32\xcf\x21\xeb\x00\x00\x11\xcb\x3c\x3a\x34\x1b\x34\x3b\x3c\x5b'\
-b'\x44\x7b\x4c\x7b\x4c\x9b\x54\x9a\x5c\xbb\x43\xd5\x08\xe5\x00\x00'\
-b'\x00\x00\x00\x00\x00\x41\x32\x8d\x5c\x77\x10\xc4\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x61\x3b\x32\x00\x83\x00\x00\x12\xb3\x1b\x79'\
-b'\x1b\x58\x1b\x78\x1b\x7a\x13\x9a\x13\x37\x00\x62\x00\x21\x4b\xd5'\
-b'\x64\xda\x64\xfa\x32\xcf\x00\x00\x19\x47\x5c\x79\x19\x88\x00\x00'\
-b'\x00\x61\x08\xc3\x08\x62\x00\x00\x08\xa4\x4c\x17\x2a\x6e\x00\x00'\
-b'\x11\x69\x2c\x1a\x23\xfb\x1b\x57\x00\x42\x00\x41\x1b\x35\x44\x5b'\
-b'\x8d\x5a\xad\xda\x9d\x57\x21\x45\x00\x00\x00\x00\x3b\x10\x6c\xfa'\
-b'\x74\xfa\x64\xda\x64\xda\xad\xda\x84\x52\x00\x20\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x31\xa7\xb5\xd9\x7c\x32\x00\x20\x08\xa2\x8c\xd5'\
-b'\x3a\x08\x00\x00\x4a\x8b\xb6\x1a\x6b\x8f\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x4a\x6a\x94\xf5\x08\x61\x08\x81\x3a\x08\x00\x00'\
-b'\x10\xa2\x29\x86\x00\x00\x42\x4a\xb5\xf9\xbd\xfa\x9d\x36\x10\x82'\
-b'\x08\x61\x94\xd5\xbe\x1a\xb5\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xad\xda'\
-b'\x9d\x9a\x9d\x99\x95\x9a\x95\x9a\x8d\x5a\x85\x39\xa5\xba\xa5\xda'\
-b'\xad\xda\xb5\xd9\xad\xfa\xad\xda\xad\xfa\xb5\xfa\xb5\xf9\xb6\x1a'\
-b'\xb5\xfa\xad\xd9\xad\xba\xa5\xba\xad\xda\xad\xda\xb5\xf9\xb5\xda'\
-b'\xa5\xda\xa5\xba\xad\xd9\xad\xfa\xb5\xf9\xa5\xba\xa5\xb9\xad\xd9'\
-b'\xad\xda\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xf9\xb5\xfa\xad\xd9\xb5\xf9\xbd\xfa\xb5\xfa\xbe\x19\xbd\xfa'\
-b'\xbd\xfa\xbd\xf9\xb6\x1a\xb5\xf9\xbd\xf9\xb5\xfa\xb6\x19\xb5\xf9'\
-b'\xbd\xfa\xb5\xfa\xb5\xfa\xad\xd9\xa5\xda\xad\xd9\xb5\xfa\xbd\xfa'\
-b'\xb6\x1a\xb5\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xfa\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xfa\xb6\x19'\
-b'\xb5\xf9\xb5\xda\xb5\xd9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xbe\x19'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xad\xd9\x9d\xba\xad\xba\xb5\xf9\xbd\xf9'\
-b'\xb6\x1a\xbd\xf9\xb5\xfa\xbe\x19\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xad\xda\xad\xd9\xad\xda\xa5\xba\xad\xb9\xbd\xf9\xbd\xf9\xb5\xfa'\
-b'\xbe\x1a\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x19\xb5\xfa\xbd\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xd9\xad\xd9\xad\xda\xad\xf9\xa5\xba'\
-b'\xa5\x99\x31\xc7\x00\x00\x5b\x2e\xad\xda\xad\xfa\x73\xf1\x00\x00'\
-b'\x08\xa2\x5b\x2e\x63\x6f\x63\x6e\x21\x24\x00\x00\x63\x4e\x94\xd5'\
-b'\x00\x61\x00\x40\x52\xcc\x6b\x6e\x63\x6e\x73\xf0\xb5\xd9\xbd\xfa'\
-b'\xbe\x1a\xb5\xf9\x3a\x08\x00\x00\x63\x4e\x6b\x8f\x00\x20\x00\x00'\
-b'\x00\x00\x08\x82\x8c\xd5\x29\x66\x00\x00\x63\x2d\xbe\x1a\xb5\xfa'\
-b'\xbe\x1a\x63\x2e\x00\x00\x19\x45\x7c\x95\x10\xa3\x00\x00\x08\xa2'\
-b'\x00\x21\x00\x00\x29\x87\x95\x17\xad\xb9\x29\x86\x00\x00\x6b\xb0'\
-b'\xb6\x1a\xb6\x1a\x7c\x12\x00\x20\x10\xa2\x94\xd5\x31\xa7\x00\x00'\
-b'\x63\x8f\x53\x0d\x00\x00\x21\x66\x7c\xf9\x4c\x5a\x33\x98\x23\x56'\
-b'\x2b\x77\x3b\xd8\x3b\xd8\x3b\xf9\x3b\xf9\x3b\xf9\x33\x76\x2a\xb0'\
-b'\x19\xcb\x08\xc5\x00\x00\x00\x62\x33\x33\x08\xa4\x00\x00\x11\xaa'\
-b'\x1a\x4f\x1a\x0d\x2a\x0d\x3b\x55\x08\xa4\x00\x00\x11\xee\x23\x58'\
-b'\x2b\x37\x2b\x17\x1a\xd4\x13\x79\x13\x37\x00\x62\x00\x20\x33\x54'\
-b'\x44\x5b\x44\x5b\x22\x4e\x00\x00\x09\x06\x3b\xd8\x11\x47\x00\x00'\
-b'\x00\x21\x00\x20\x00\x00\x00\x42\x32\x90\x4b\xb7\x21\xeb\x00\x00'\
-b'\x21\xa9\x74\xfa\x7d\x5a\x74\x96\x08\x82\x00\x41\x6c\x55\x95\x9a'\
-b'\xb5\xfa\xb5\xfa\x85\x5a\x32\xaf\x00\x00\x10\xe5\x64\x98\x75\x1b'\
-b'\x7d\x3a\x85\x3a\x95\x7a\xad\xfa\x7c\x32\x00\x00\x08\x82\x4a\xed'\
-b'\x63\x4e\x63\x4e\x7c\x32\xad\xd9\xa5\x77\x21\x25\x00\x00\x4a\xab'\
-b'\x10\xa3\x00\x20\x84\x52\xb6\x1a\x6b\x8f\x00\x00\x18\xe3\x63\x4e'\
-b'\x63\x4e\x63\x4e\x84\x73\x94\xf5\x08\x61\x10\x82\x8c\xb4\x31\xc7'\
-b'\x00\x00\x00\x00\x00\x00\x42\x49\xb5\xf9\xbe\x1a\x9d\x36\x10\x82'\
-b'\x08\x61\x94\xd5\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xfa'\
-b'\xad\xda\xa5\xda\xa5\x99\x95\x7a\x75\x1a\x8d\x5a\x85\x39\x95\x5a'\
-b'\x95\x7a\x95\x79\x95\x7a\x7d\x1a\x74\xfa\x7d\x1a\x7d\x3a\x85\x1a'\
-b'\x95\x7a\xa5\xba\xad\xfa\xb5\xf9\xa5\xb9\xad\xda\x9d\x9a\x64\xba'\
-b'\x3c\x3a\x3c\x19\x4c\x5a\x54\x7a\x6c\xfa\x95\x7a\xa5\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xad\xda\xb5\xfa\xad\xfa\xb5\xd9\xb5\xfa\xb5\xfa'\
-b'\xb5\xfa\xbd\xfa\xad\xd9\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xad\xda\xad\xda\xb5\xd9\xbd\xf9\xbe\x1a'\
-b'\xbd\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xb6\x19\xb5\xf9\xb5\xf9\xbe\x19\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xad\xfa\xb5\xd9\x9d\xba\x75\x1a\x85\x3a\xb5\xfa\xb5\xf9'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xd9\xb5\xda\xad\xd9\xb5\xf9\xb5\xfa\xbd\xfa\xbe\x19'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xad\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xb6\x1a\xb5\xf9\xb5\xfa\xad\xda\x9d\x99\xad\xba\x95\x9a'\
-b'\x95\x79\x29\xc8\x00\x00\x63\x4e\xb5\xfa\xb5\xfa\x74\x12\x00\x00'\
-b'\x19\x24\x9d\x58\xa5\xda\x9d\x9a\x31\xc8\x00\x00\x63\x4e\x94\xf5'\
-b'\x08\x41\x08\x61\x7b\xf1\x8c\xb4\x94\xb4\x94\xd5\xb5\xd9\xbd\xf9'\
-b'\xbd\xf9\xb5\xf9\x3a\x09\x00\x00\x63\x6e\xb5\xd9\x42\x49\x00\x00'\
-b'\x00\x00\x10\x82\x9d\x16\x5b\x2e\x00\x00\x10\xa2\x73\xd0\x9c\xf5'\
-b'\x73\xd0\x10\xa2\x00\x00\x4a\xed\x84\xd7\x08\x82\x00\x41\x53\xb3'\
-b'\x32\x6c\x00\x00\x19\x46\x6c\x98\x7d\x19\x21\x67\x00\x00\x52\xcc'\
-b'\x8c\x94\x73\xb0\x19\x04\x00\x00\x3a\x08\xa5\x98\x31\xa6\x00\x00'\
-b'\x6b\x8f\x8c\x94\x08\x61\x00\x20\x52\xac\x74\x54\x3a\x8f\x08\xa4'\
-b'\x08\x83\x42\xd1\x63\xd6\x5b\xd5\x5b\xb6\x32\x4e\x10\xe6\x2a\x2d'\
-b'\x4a\xb0\x31\xeb\x00\x00\x00\x41\x3a\x8f\x08\xa3\x00\x00\x22\x0c'\
-b'\x3a\xd1\x3a\x90\x42\xb0\x4b\x13\x21\x48\x00\x00\x00\x63\x1a\x0e'\
-b'\x32\x71\x19\xab\x00\x42\x11\x69\x32\xd3\x08\xa4\x00\x00\x19\x47'\
-b'\x42\x8f\x3a\x6e\x08\xa4\x00\x00\x29\xa8\x5b\x95\x19\x26\x00\x00'\
-b'\x32\x0a\x4a\xef\x00\x21\x00\x41\x53\x10\x6c\x57\x32\x2c\x00\x00'\
-b'\x3a\x09\xad\xd9\xb5\xfa\x9d\x16\x10\x82\x08\x61\x94\xd4\xb6\x1a'\
-b'\xb5\xf9\xa5\xba\x74\xfa\x43\x10\x00\x00\x19\x26\x85\x39\x95\x9a'\
-b'\x9d\x9a\x9d\x9a\xa5\xb9\xad\xfa\x84\x32\x00\x00\x10\xc3\x7c\x32'\
-b'\x8c\xb4\x8c\xb4\x94\xf5\x9d\x99\x8d\x5a\x42\x8c\x00\x00\x00\x41'\
-b'\x00\x00\x29\x66\xad\x98\xbe\x1a\x6b\x8f\x00\x00\x21\x45\x84\x73'\
-b'\x8c\xb4\x8c\x94\x9d\x36\x94\xf5\x08\x61\x10\x82\x9d\x36\x94\xf5'\
-b'\x10\xc3\x00\x00\x00\x00\x42\x4a\xbd\xf9\xbe\x1a\x9d\x36\x10\x82'\
-b'\x08\x61\x94\xd5\xbe\x1a\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xf9\xbe\x1a'\
-b'\xb5\xf9\x7d\x3a\x5c\x9a\x54\x9a\x6c\xda\x75\x1a\x85\x5a\xad\xda'\
-b'\xb5\xf9\xb5\xfa\x9d\xba\x85\x5a\x7d\x1a\x85\x59\x7d\x3a\x74\xfa'\
-b'\x7d\x3a\x85\x3a\xad\xba\xb5\xfa\x9d\x9a\x64\xb9\x3b\xb8\x1b\x99'\
-b'\x23\x99\x2b\xd9\x2b\xfa\x23\xba\x23\xba\x3c\x3a\x54\x9a\x75\x1a'\
-b'\x9d\x9a\xad\xda\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xd9\xad\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xad\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x19\xbd\xfa\xb5\xfa\xbd\xf9'\
-b'\xbd\xfa\xb5\xfa\xb5\xfa\xb5\xd9\xad\xda\xb5\xfa\xbe\x1a\xbd\xf9'\
-b'\xbe\x1a\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xfa\xb6\x19\xbe\x1a'\
-b'\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xfa\xbe\x1a\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xfa\xb5\xf9\xb5\xd9\xb5\xf9\xbd\xfa\xb5\xf9\xb6\x19\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xad\xda\x9d\x9a\xa5\x99\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xb6\x19\xbd\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xb5\xfa\x7c\xd8\x95\x59\xad\xda'\
-b'\xad\xb9\x31\xc7\x00\x00\x63\x2e\xb6\x19\xb5\xfa\x7c\x11\x00\x00'\
-b'\x19\x25\xa5\x78\xad\xda\xa5\x99\x31\xc8\x00\x00\x5b\x4e\x94\xd5'\
-b'\x08\x61\x00\x00\x00\x00\x00\x20\x00\x00\x18\xe3\xa5\x57\xbe\x1a'\
-b'\xb5\xf9\xb5\xd9\x3a\x08\x00\x00\x63\x4e\xbe\x1a\x9d\x36\x21\x45'\
-b'\x00\x00\x08\x82\x8c\xf6\x9d\x58\x3a\x08\x00\x00\x00\x00\x00\x61'\
-b'\x00\x00\x00\x00\x3a\x08\xa5\x78\x9d\x16\x10\xa2\x00\x41\x53\xd5'\
-b'\x4c\x17\x08\xa3\x00\x00\x4a\xef\x7d\x19\x19\x66\x00\x00\x00\x00'\
-b'\x00\x20\x00\x00\x00\x00\x29\x65\x94\xf5\xad\xb9\x31\x87\x00\x00'\
-b'\x6b\x8f\xb5\xfa\x63\x4e\x00\x41\x00\x00\x00\x41\x00\x20\x00\x00'\
-b'\x19\x67\x6c\x97\x85\x3a\x85\x5a\x85\x39\x32\x0a\x00\x00\x00\x00'\
-b'\x00\x40\x00\x00\x00\x00\x29\xc8\x7c\x76\x10\xc4\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x21\x43\x12\x3b\x75\x09\x27\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x20\x12\x0e\x3b\xf9\x32\xb0\x00\x41\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\xc3\x74\x55\x8d\x59\x29\xa7\x00\x00'\
-b'\x4b\x0e\x8d\x5a\x31\xc9\x00\x00\x29\xc8\x85\x3a\x42\xcd\x00\x00'\
-b'\x3a\x08\xb5\xf9\xb5\xf9\x95\x15\x08\x82\x08\x41\x8c\xb4\xb5\xfa'\
-b'\xb5\xfa\x9d\x9a\x95\x9a\x5b\x90\x00\x00\x21\x45\xa5\x99\xad\xda'\
-b'\xad\xd9\xad\xd9\xad\xda\xb5\xfa\x7c\x32\x00\x20\x00\x00\x00\x20'\
-b'\x00\x20\x00\x00\x29\x66\x8d\x39\x8d\x7a\x7c\x74\x08\x61\x00\x00'\
-b'\x00\x00\x5b\x2d\xb5\xfa\xbe\x1a\x6b\x8f\x00\x00\x00\x00\x00\x20'\
-b'\x00\x20\x00\x00\x42\x29\x94\xd4\x08\x61\x08\x82\x9d\x16\xbe\x1a'\
-b'\x73\xd0\x00\x40\x00\x00\x42\x49\xb5\xf9\xbe\x1a\x9d\x16\x08\x82'\
-b'\x08\x61\x94\xf4\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\x85\x5a\x6c\xda\x7d\x3a\x8d\x7a\x85\x3a\xa5\x9a\xbd\xf9'\
-b'\xb6\x19\xb5\xfa\xb5\xda\x9d\x79\xa5\xda\xb5\xfa\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xda\x8d\x5a\x44\x3a\x23\x98\x33\xb8\x34\x1a'\
-b'\x2b\xda\x2b\xfa\x23\x9a\x1b\x99\x1b\x79\x23\xb9\x23\xba\x23\x99'\
-b'\x44\x3a\x7d\x3a\xad\xda\xb5\xd9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xfa'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xbd\xfa\xbe\x19\xbe\x1a\xbe\x19\xbd\xf9\xbe\x19\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xb5\xf9\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa'\
-b'\xbd\xf9\xbd\xfa\xb5\xfa\xad\xda\xbd\xfa\xb6\x19\xbe\x1a\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xfa\xbe\x1a\xb5\xf9'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xfa\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xb6\x19\xb5\xfa\xb5\xfa\xb5\xfa\xa5\xba\xad\xd9\xb5\xfa'\
-b'\xb5\xf9\x63\x2d\x31\xc7\x7c\x32\xb5\xf9\xb5\xfa\x94\xb4\x39\xe8'\
-b'\x52\xcb\xa5\xb8\xad\xda\xad\xd9\x5b\x2e\x31\xc8\x7c\x32\x9d\x37'\
-b'\x42\x49\x31\xc8\x31\xe8\x31\xe8\x31\xe7\x4a\x6a\xad\x98\xbd\xf9'\
-b'\xb5\xf9\xb5\xf9\x6b\x6e\x39\xc8\x84\x32\xb6\x1a\xbd\xfa\x8c\x93'\
-b'\x3a\x08\x4a\x6a\x95\x17\x8d\x7a\x9d\x78\x6b\x8f\x3a\x08\x29\x66'\
-b'\x3a\x08\x6b\x8f\xad\x98\xbe\x1a\xa5\x77\x42\x6a\x42\x29\x8c\xf6'\
-b'\x95\x7a\x4b\x30\x21\xa7\x4a\xac\x95\x59\x4a\xcd\x31\xc8\x31\xc8'\
-b'\x31\xe7\x42\x49\x63\x6f\xa5\x57\xb5\xf9\xb5\xd9\x5b\x0d\x31\xc7'\
-b'\x84\x53\xb5\xfa\xad\xd9\x84\x52\x42\x6a\x29\x86\x21\x67\x3a\x8d'\
-b'\x6c\x97\x85\x5a\x85\x5a\x8d\x5a\x95\x7a\x84\xd7\x53\x2f\x29\xc8'\
-b'\x21\x46\x29\x87\x4a\xed\x84\xf7\x8d\x59\x42\x6b\x29\xc7\x29\xc8'\
-b'\x31\xa8\x29\xc7\x29\xe9\x54\x16\x4c\x9b\x23\xb8\x0a\x0f\x01\x08'\
-b'\x00\xc6\x01\x28\x0a\x72\x1b\xba\x3c\x5b\x54\x9a\x4b\x92\x2a\x0a'\
-b'\x21\x66\x21\x86\x42\x6b\x7c\x75\x95\x9a\x95\x7a\x52\xee\x29\xa7'\
-b'\x6b\xf2\x9d\x9b\x74\x34\x29\xc8\x32\x09\x84\xb6\x63\xd2\x31\xc7'\
-b'\x63\x6e\xb5\xda\xb5\xfa\x9d\x57\x42\x4a\x42\x49\x9d\x36\xb5\xf9'\
-b'\xb5\xda\x95\x79\x9d\x9a\x7c\x54\x39\xe8\x52\xec\xb5\xb9\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xbe\x1a\x94\xd4\x3a\x08\x39\xe8\x31\xe8'\
-b'\x31\xc8\x31\xc7\x52\xcc\xa5\xb9\xb5\xfa\xad\xb9\x52\xcc\x31\xc7'\
-b'\x42\x29\x9d\x16\xb5\xf9\xb5\xfa\x84\x52\x39\xe8\x31\xe8\x39\xc7'\
-b'\x39\xe8\x31\xc7\x63\x4e\xa5\x56\x42\x49\x4a\x4a\xa5\x77\xbe\x19'\
-b'\xb5\xd9\x5b\x2e\x31\xc7\x6b\x8f\xbd\xf9\xbe\x1a\xa5\x77\x4a\x49'\
-b'\x42\x49\xa5\x57\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x19\xbd\xfa\xbd\xfa'\
-b'\xbe\x19\xb5\xfa\xad\xda\xa5\xb9\xa5\xba\x9d\x99\xad\xf9\xbd\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\x64\xb9\x44\x5a\x3c\x3a\x54\x9b\x44\x5b'\
-b'\x2c\x1b\x34\x1b\x23\xfa\x2b\xda\x1b\x9a\x2b\xfa\x34\x1a\x2b\xfa'\
-b'\x3c\x3b\x3c\x3a\x7d\x1a\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xbe\x19\xb5\xf9\xbd\xfa\xbd\xfa\xb6\x1a'\
-b'\xbd\xf9\xb6\x19\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbe\x1a'\
-b'\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbe\x1a\xbe\x19\xbd\xfa\xbd\xfa\xbd\xfa\xb6\x1a\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb6\x1a\xbd\xf9\xb5\xf9\xbe\x19'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xb6\x1a\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xfa\xb5\xf9\xb5\xda\xb5\xf9\xbd\xfa'\
-b'\xb5\xfa\xbd\xf9\xbe\x19\xbd\xf9\xb5\xf9\xbe\x1a\xbd\xfa\xb5\xf9'\
-b'\xbe\x1a\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xf9\xb5\xd9\xad\xda\xad\xba\xb5\xda'\
-b'\xb5\xf9\xb5\xd9\xad\xd9\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xad\xda\xb5\xfa\xb5\xfa\xb5\xd9\xad\xd8'\
-b'\xb5\xf9\xbe\x1a\xb6\x19\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\x9d\x9a\x8d\x5a\x9d\x7a\xa5\xb9\xa5\xb9\xa5\xb9\xad\xd9'\
-b'\xb5\xd9\xb5\xda\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xd9\xad\xd9\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xd9\xa5\xb9\x7c\xfa\x75\x1a'\
-b'\x7d\x3a\x85\x3a\x8d\x5a\x8d\x5a\x95\x7a\x95\x7a\x95\x9b\x95\x7a'\
-b'\x8d\x39\x95\x59\x9d\x9a\x9d\x9a\x9d\x79\x9d\x79\x9d\x79\x9d\x79'\
-b'\x9d\x79\x95\x7a\x85\x3a\x6c\xfa\x4c\x9a\x2c\x1b\x13\xbb\x13\x59'\
-b'\x1b\x57\x13\x59\x0b\x9b\x23\xfb\x44\x5b\x5c\xba\x75\x1b\x85\x3a'\
-b'\x8d\x39\x95\x59\x9d\x9a\x9d\x9a\x9d\x9a\x95\x99\x95\x79\x95\x7a'\
-b'\x95\x7a\x95\x7a\x95\x7a\x95\x79\x95\x7a\x9d\x9a\x9d\x9a\xad\xda'\
-b'\xb5\xda\xb5\xf9\xb5\xfa\x84\xf8\x6c\x57\x9d\x79\xb5\xd9\xb5\xfa'\
-b'\xa5\xba\x8d\x5a\xa5\xba\xad\xf9\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xda'\
-b'\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xd9'\
-b'\xad\xd9\xb5\xd9\xb5\xd9\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xd9'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda\xb5\xd9\xb5\xd9\xb5\xd9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xd9\xbd\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xda\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xbe\x1a\xbd\xfa\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xad\xd9\xb5\xfa\xb5\xda\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xfa'\
-b'\xbd\xfa\xb6\x19\xb5\xf9\xa5\xba\x75\x1a\x5c\xba\x54\x9a\x4c\x9a'\
-b'\x2b\xfb\x2b\xba\x2b\xb9\x3b\xf9\x4c\x39\x5c\x79\x64\xba\x54\x9a'\
-b'\x64\xda\x6c\xdb\x64\xba\xa5\xb9\xbd\xf9\xb5\xfa\xb5\xf9\xb6\x1a'\
-b'\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xfa'\
-b'\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xb6\x19\xb5\xfa\xb5\xf9\xad\xba\xa5\xba\x9d\x79\xa5\xba\xb5\xfa'\
-b'\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xfa\xbe\x19\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xb5\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xbe\x19\xb5\xfa\xbd\xf9'\
-b'\xbe\x1a\xb5\xf9\xbe\x19\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xb5\xd9\xb5\xfa\xbd\xfa\xbd\xf9\xb6\x1a\xbe\x1a\xb5\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xfa\xbe\x19\xb5\xf9\xbe\x1a\xb5\xfa\xb5\xf9\xb5\xfa\xbe\x19'\
-b'\xbd\xf9\xbd\xfa\xb5\xfa\xb5\xfa\xb6\x19\xbd\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xfa\xbe\x1a\xb5\xfa\xbe\x1a\xbd\xfa\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa'\
-b'\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xfa\xbd\xf9\xb5\xf9'\
-b'\xb5\xf9\xad\xd9\x9d\x99\x9d\x9a\xa5\xda\xb5\xfa\xb5\xfa\xb5\xfa'\
-b'\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xfa\xb5\xda\xb5\xfa'\
-b'\xb5\xf9\xb5\xda\xb5\xfa\xad\xf9\x8d\x5a\x85\x5a\x7d\x3a\x75\x1a'\
-b'\x85\x3a\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x95\x7a'\
-b'\x95\x79\x95\x7a\x9d\x9a\x9d\x9a\x9d\x9a\x95\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x95\x7a\x8d\x7a\x74\xfa\x54\x9b\x34\x1b\x13\x9a\x1b\x79'\
-b'\x1b\x58\x1b\x79\x13\x9b\x23\xfb\x44\x7b\x64\xda\x75\x1a\x85\x5a'\
-b'\x95\x7a\x95\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x9d\x99\x95\x9a\x9d\x9a\x9d\x7a\x9d\x9a\xa5\xb9'\
-b'\xad\xd9\xb5\xfa\x8d\x59\x4b\xb6\x3b\x14\x4b\x34\x6c\x16\x8d\x18'\
-b'\x95\x59\x8d\x7a\xad\xda\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xfa'\
-b'\xbd\xfa\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xd9\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb6\x1a\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbe\x19\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xb6\x1a\x9d\x9a\x8d\x5a\x7d\x1a\x54\xba'\
-b'\x4c\x7a\x6c\xda\x95\x7a\x9d\x7a\x9d\x9a\xa5\xba\xad\xda\xad\xda'\
-b'\xad\xda\xa5\xba\x95\x7a\xad\xda\xb5\xf9\xb5\xf9\xbe\x1a\xbd\xf9'\
-b'\xb5\xf9\xbd\xf9\xbe\x1a\xb5\xfa\xb5\xd9\xb5\xfa\xbe\x19\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xad\xf9\xa5\x9a\x95\x7a\x8d\x7a\x95\x7a\x9d\x99\xb5\xfa'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xbe\x19\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xfa'\
-b'\xbe\x19\xbe\x19\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xb5\xf9\xbe\x1a\xbd\xf9\xb6\x19\xbd\xfa\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xbe\x1a\xbd\xf9\xbe\x19\xbe\x19\xbd\xfa\xb5\xf9\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xb6\x19\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xfa'\
-b'\xbd\xf9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xbd\xfa\xbd\xf9\xbe\x1a'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbe\x19\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xb6\x19'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xf9'\
-b'\xb5\xfa\xbd\xfa\xb6\x19\xb5\xf9\xbd\xf9\xb6\x1a\xb5\xf9\xb5\xfa'\
-b'\xbd\xda\xb5\xfa\xad\xda\xa5\x99\xa5\xba\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xd9\xb5\xfa\xb5\xda\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xf9\xb5\xd9'\
-b'\xb5\xd9\xad\xda\x85\x5a\x85\x3a\x6c\xda\x74\xfa\x7d\x3a\x7d\x1a'\
-b'\x85\x5a\x85\x5a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x7a'\
-b'\x9d\x9a\x95\x99\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x95\x7a\x8d\x5a\x75\x1a\x54\x9a\x34\x1a\x1b\x9a\x1b\x59'\
-b'\x23\x58\x13\x79\x13\x9b\x23\xfb\x44\x5a\x64\xdb\x7d\x1a\x85\x5a'\
-b'\x95\x7a\x9d\x79\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\x9a\x9d\x7a\x9d\x9a\x9d\x9a\x9d\x99\x95\x9a\x9d\x9a\x9d\x99'\
-b'\xa5\xba\xad\xda\x85\x3a\x44\x19\x2b\x37\x3b\x15\x4a\xb2\x4a\xd3'\
-b'\x53\xd6\x95\x7a\xb5\xd9\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xbe\x19\xb5\xf9\xbd\xfa\xb5\xfa'\
-b'\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xbd\xf9\xb6\x1a\xb5\xf9\xb6\x1a\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbd\xfa\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa\xbd\xf9'\
-b'\xb6\x1a\xbd\xf9\xb5\xf9\xbd\xf9\xb5\xfa\x9d\xba\x85\x5a\x85\x3a'\
-b'\x9d\x9a\x9d\x9a\x95\x7a\x9d\x99\x9d\x99\xad\xda\xad\xf9\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xbe\x1a\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xf9'\
-b'\xb5\xda\xad\xda\xad\xd9\xad\xb9\xb5\xda\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\xbe\x1a\xbe\x19\xbd\xfa\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xfa\xb5\xfa\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\xbe\x19\xb5\xf9\xbd\xfa\xb6\x19\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xf9\xb5\xfa\xbe\x1a\xb5\xf9\xb5\xf9\xb5\xda\xb5\xfa'\
-b'\xb5\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xad\xda'\
-b'\xad\xda\xb5\xd9\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xf9\xb5\xfa\xbe\x19\xbd\xfa\xb5\xfa\xbd\xf9\xb6\x19\xb5\xfa'\
-b'\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xfa'\
-b'\xbe\x19\xb5\xfa\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbe\x1a\xbd\xfa'\
-b'\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xd9\xad\xda\xad\xda\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xb5\xfa\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xad\xda\x54\x9a\x5c\xba\x64\xda\x75\x1a\x85\x3a\x7d\x3a'\
-b'\x85\x5a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x95\x99\x9d\x7a'\
-b'\x95\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x9d\x9a\xa5\xba\x9d\x99'\
-b'\x95\x7a\x95\x7a\x85\x5a\x75\x1a\x54\xbb\x34\x1a\x13\x99\x1b\x79'\
-b'\x1b\x58\x1b\x59\x13\x9a\x23\xfb\x44\x7a\x64\xda\x7d\x3a\x85\x5a'\
-b'\x95\x7a\x95\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x9d\x99\x95\x7a\x95\x7a\x9d\x9a\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\xa5\xba\x7d\x1a\x2b\x98\x4c\x19\x74\x77\x4b\x76'\
-b'\x54\x39\x9d\x9a\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\xbe\x19\xb5\xfa\xb6\x1a\xb5\xf9\xb5\xfa\xbe\x1a\xb5\xf9'\
-b'\xbd\xfa\xbe\x19\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xfa\xb6\x1a\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xf9\xbe\x1a\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\xbd\xfa\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb6\x19\xb5\xfa'\
-b'\xbd\xf9\xb6\x1a\xb5\xf9\xbd\xfa\xb5\xfa\x9d\x9a\x9d\x99\xa5\xba'\
-b'\x95\x99\x95\x79\x9d\x7a\xad\xba\xad\xda\xb5\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xbd\xfa\xb5\xfa\xad\xda\xbd\xfa\xbd\xfa\xb5\xf9\xbe\x19'\
-b'\xb5\xfa\xb5\xf9\xbd\xfa\xbe\x19\xb5\xf9\xb5\xda\xb5\xf9\xb5\xda'\
-b'\xb5\xf9\xbd\xfa\xbe\x1a\xbe\x1a\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a'\
-b'\xbe\x1a\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbd\xfa\xbe\x19'\
-b'\xbe\x1a\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xfa\xb6\x19\xb5\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbe\x19\xb5\xf9\xbd\xfa\xbd\xf9\xb6\x19'\
-b'\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x1a'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xb5\xfa\xad\xf9\xb5\xf9\xb5\xda'\
-b'\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xad\xda\xa5\xb9\xa5\xda'\
-b'\xad\xda\xad\xd9\xad\xfa\xb5\xda\xb5\xf9\xb5\xfa\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x19\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xbe\x1a\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xb6\x19\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xbe\x1a\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xbd\xf9\xbe\x1a\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x19\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xf9\xbe\x19\xb5\xfa\xb6\x19\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xad\xd9\xad\xda\xb5\xf9\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xb5\xf9\xb5\xd9\xad\xda\xb5\xf9\xad\xd9\xb5\xd9\xad\xfa'\
-b'\xad\xb9\xa5\xba\x7d\x1a\x7d\x3a\x85\x3a\x85\x5a\x8d\x5a\x85\x3a'\
-b'\x85\x5a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x9d\x9a\x95\x99'\
-b'\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99\xa5\x9a\xa5\xba\x9d\x9a\x9d\x9a'\
-b'\x95\x7a\x8d\x7a\x85\x5a\x75\x1a\x54\x9a\x33\xfa\x1b\x79\x1b\x59'\
-b'\x23\x58\x1b\x58\x13\x9a\x23\xfb\x3c\x5b\x64\xdb\x7d\x1a\x85\x5a'\
-b'\x95\x7a\x9d\x99\x9d\x9a\xa5\x99\x9d\xb9\xa5\xba\x9d\x99\x9d\x9a'\
-b'\x9d\x99\x9d\x9a\x9d\x9a\x95\x9a\x9d\x7a\x95\x7a\x9d\x9a\x9d\xb9'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\x95\x7a\x5c\xbb\x34\x1a\x6d\x1a\x6c\xfa'\
-b'\x64\xda\xa5\x9a\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xb6\x19\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xb6\x19\xb5\xf9\xbe\x1a\xbd\xf9\xb6\x19\xb5\xfa'\
-b'\xbe\x19\xb5\xf9\xbe\x1a\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xb5\xf9\xbd\xf9\xb6\x1a\xb5\xf9\xbd\xf9\xb6\x1a\xbd\xf9'\
-b'\xb5\xf9\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xbe\x19\xb5\xf9\xb5\xfa\xb5\xfa\xa5\xba\x95\x7a'\
-b'\x9d\x9a\xad\xda\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xfa'\
-b'\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xf9\xbe\x1a\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\xbe\x19\xad\xd9\xb5\xfa\xb5\xfa\xbd\xf9\xbe\x1a\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\xbe\x19\xbe\x19\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbe\x1a\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9'\
-b'\xbe\x1a\xbe\x1a\xbe\x19\xbd\xfa\xb5\xf9\xbe\x19\xbd\xfa\xb5\xf9'\
-b'\xb5\xfa\xbe\x1a\xb5\xf9\xbd\xfa\xb6\x1a\xb5\xf9\xbd\xfa\xb5\xfa'\
-b'\xbd\xfa\xbe\x1a\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xf9\xbe\x1a\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbe\x1a\xbe\x19'\
-b'\xbd\xfa\xbd\xfa\xb5\xfa\xa5\xb9\xa5\xba\x95\x7a\x8d\x7a\x9d\x9a'\
-b'\x9d\x9a\xa5\x9a\xad\xd9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa'\
-b'\xb6\x19\xbd\xfa\xbd\xf9\xbd\xfa\xb6\x19\xbd\xf9\xb5\xf9\xb6\x1a'\
-b'\xbd\xf9\xbd\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb6\x19\xbd\xfa'\
-b'\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xbe\x19\xb5\xfa\xbd\xfa\xbd\xf9'\
-b'\xb5\xfa\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xb5\xfa\xbe\x1a\xbd\xf9\xb5\xfa\xbe\x1a\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xfa\xbe\x19\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbe\x19'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xda\xad\xda\xb5\xf9\xb5\xfa\xb5\xda'\
-b'\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xf9\xb5\xda\xb5\xfa\xb5\xfa\xb5\xd9'\
-b'\xad\xda\xad\xda\xa5\xda\xad\xda\xa5\xda\xa5\xda\x95\x7a\x85\x3a'\
-b'\x85\x5a\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x9d\x9a\x9d\x9a\x9d\x9a'\
-b'\x9d\x9a\x9d\x9a\x9d\x9a\xa5\x9a\xa5\xb9\x9d\x9a\x9d\xb9\x9d\x99'\
-b'\x95\x7a\x95\x5a\x85\x5a\x74\xfa\x54\x9b\x34\x1a\x1b\x79\x1b\x59'\
-b'\x1b\x58\x1b\x59\x13\x9a\x23\xfb\x3c\x5b\x5c\xba\x7d\x3a\x8d\x5a'\
-b'\x95\x7a\x95\x7a\xa5\xba\x9d\x9a\xa5\xba\x9d\x9a\xa5\x9a\xa5\xba'\
-b'\x9d\x9a\x9d\x9a\x9d\x99\x95\x79\x95\x79\x95\x7a\x9d\x9a\xad\xda'\
-b'\xad\xda\xa5\xb9\xa5\xb9\xa5\xba\x9d\x9a\x6c\xfa\x5c\x9a\x64\xda'\
-b'\x95\x7a\xad\xda\xb5\xf9\xb5\xfa\xb5\xda\xbd\xf9\xb5\xfa\xbd\xfa'\
-b'\xb5\xf9\xb6\x19\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xfa'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb6\x1a\xb5\xf9\xb5\xfa\xbd\xfa'\
-b'\xb6\x1a\xbd\xf9\xb5\xf9\xb5\xf9\xb6\x1a\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xb6\x19'\
-b'\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\x95\x7a\x8d\x5a'\
-b'\x95\x79\xad\xd9\xb5\xfa\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa'\
-b'\xbe\x1a\xb5\xfa\xad\xb9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xf9'\
-b'\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbe\x19\xbe\x19\xbe\x1a\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x19\xbd\xfa\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x1a'\
-b'\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xb6\x19\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbe\x19\xb5\xfa\xa5\xb9\x95\x7a\x95\x7a\x95\x79\x8d\x59'\
-b'\x8d\x7a\x95\x99\xad\xda\xad\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xf9'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xfa\xb6\x19\xbd\xf9\xb5\xf9'\
-b'\xbe\x1a\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x19\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xb6\x19\xbd\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xbe\x19\xb5\xf9\xb5\xf9\xbe\x1a\xb5\xf9'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xad\xd9\xb5\xd9\xb5\xda\xad\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xd9\xad\xd9\xb5\xf9\xb5\xfa'\
-b'\xad\xd9\xb5\xda\xad\xd9\xad\xda\x9d\x99\x9d\x9a\x95\x79\x85\x5a'\
-b'\x8d\x5a\x95\x7a\x95\x7a\x95\x7a\x95\x9a\x9d\x99\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\x9d\x9a\xa5\xb9\x9d\xba\xa5\xba\xa5\xba\xa5\x9a\x9d\x9a'\
-b'\x95\x7a\x8d\x5a\x85\x5a\x75\x1a\x54\x9a\x34\x1a\x1b\x58\x1b\x59'\
-b'\x23\x58\x1b\x58\x13\x7a\x1b\xdb\x44\x5b\x5c\xbb\x7d\x3a\x8d\x5a'\
-b'\x95\x7a\x9d\x99\x9d\x99\xa5\xba\xa5\xb9\xa5\xba\x9d\x9a\x9d\xba'\
-b'\xa5\xba\xa5\x99\x9d\x9a\x9d\x9a\x9d\xba\x9d\x9a\xa5\xb9\xad\xda'\
-b'\xad\xda\xad\xda\xad\xfa\xb5\xda\xad\xda\x95\x9a\x85\x5a\x9d\x9a'\
-b'\x9d\x9a\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9'\
-b'\xbe\x19\xb5\xfa\xbd\xf9\xb6\x19\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xb6\x1a\xb5\xf9\xbe\x19\xb5\xfa\xbd\xf9\xb6\x1a\xb5\xf9'\
-b'\xbe\x19\xb5\xfa\xbd\xfa\xbd\xfa\xb5\xfa\xbd\xfa\xb6\x19\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xf9'\
-b'\xbe\x19\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xfa'\
-b'\xb6\x19\xbd\xf9\xb6\x19\xbd\xfa\xb6\x19\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xf9\xbd\xf9\xbe\x1a\xb5\xf9\xbe\x19\xbd\xfa\xb5\xf9\xb5\xf9'\
-b'\xbe\x1a\xb5\xf9\xb6\x19\xbd\xf9\xb5\xfa\xb5\xfa\x9d\x99\x8d\x7a'\
-b'\x9d\x9a\xad\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x19\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xad\xda\xb5\xf9\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xb6\x19\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xb5\xf9\xbe\x19\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xbe\x1a\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbe\x1a\xbe\x19\xbe\x1a\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xbe\x19\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xb6\x19\xbd\xfa\xbe\x19\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xb5\xfa\xbd\xfa\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbe\x1a\xbe\x19\xb6\x1a\xbd\xfa\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xfa\xad\xda'\
-b'\xb5\xf9\xad\xda\xb5\xd9\xb5\xf9\xb5\xfa\xbd\xf9\xb6\x1a\xbd\xf9'\
-b'\xb5\xfa\xbd\xfa\xbe\x1a\xb5\xf9\xbe\x19\xb5\xfa\xb5\xf9\xbe\x19'\
-b'\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xb6\x19\xbd\xf9\xb5\xfa\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xb5\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xbe\x1a\xb5\xf9'\
-b'\xbd\xfa\xbd\xfa\xb5\xfa\xbe\x19\xb5\xfa\xbd\xfa\xbe\x1a\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xfa\xb5\xf9\xbe\x1a\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xbe\x19\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xda\xad\xd9'\
-b'\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xda\xad\xf9'\
-b'\xb5\xda\xb5\xda\xa5\xda\xa5\xda\x7d\x1a\x85\x5a\x8d\x5a\x85\x3a'\
-b'\x8d\x5a\x8d\x7a\x95\x7a\x95\x7a\x95\x9a\x9d\x9a\x9d\x99\x9d\x9a'\
-b'\x9d\x9a\x9d\xba\xa5\x9a\xa5\x9a\xa5\xba\xa5\xb9\x9d\xba\x9d\x9a'\
-b'\x95\x7a\x8d\x7a\x85\x3a\x6c\xfa\x4c\x9b\x2b\xfa\x23\x59\x1b\x79'\
-b'\x23\x58\x1b\x58\x13\x7a\x1b\xdb\x3c\x3b\x5c\xba\x75\x1a\x85\x5a'\
-b'\x95\x7a\x9d\x9a\xa5\x9a\x9d\xb9\xa5\x9a\x9d\x99\xa5\xba\xa5\x99'\
-b'\x9d\x9a\xa5\xba\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\xa5\xb9\xa5\xba'\
-b'\xad\xd9\xad\xda\xad\xfa\xad\xd9\xb5\xd9\xb5\xf9\xad\xd9\xad\xda'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xb6\x19\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xbe\x19\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xf9\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xfa'\
-b'\xb6\x1a\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xbe\x19\xb6\x1a\xbd\xfa'\
-b'\xb6\x1a\xbd\xf9\xbe\x1a\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xfa'\
-b'\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xbd\xf9'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb6\x19\xa5\xba\x9d\x9a'\
-b'\xad\xda\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x1a'\
-b'\xbe\x19\xad\xda\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x1a\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbe\x19\xb5\xf9\xbe\x19\xbd\xfa\xb6\x19\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbe\x1a'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb6\x19\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x19\xb5\xfa'\
-b'\xbe\x19\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xb6\x1a\xbd\xf9\xbd\xfa'\
-b'\xbd\xfa\xbe\x19\xb5\xfa\xbd\xfa\xb5\xf9\xbe\x19\xbd\xfa\xb6\x19'\
-b'\xbd\xf9\xbe\x1a\xb5\xf9\xb5\xf9\xbe\x19\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xb6\x1a\xbd\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xd9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xb5\xfa'\
-b'\xb5\xf9\xad\xfa\x75\x1a\x7d\x1a\x74\xfa\x85\x5a\x75\x1a\x85\x5a'\
-b'\x8d\x5a\x8d\x7a\x95\x79\x9d\x7a\x9d\x9a\x9d\x99\x9d\x9a\x9d\x99'\
-b'\x9d\x9a\xa5\x9a\xa5\xb9\xa5\xb9\xa5\xba\xa5\xba\xa5\xb9\x9d\x9a'\
-b'\x95\x7a\x8d\x79\x7d\x1a\x6c\xda\x4c\x7a\x2b\xda\x23\x58\x1b\x58'\
-b'\x23\x38\x1b\x58\x13\x7a\x13\xbb\x34\x3b\x54\xbb\x75\x1a\x85\x5a'\
-b'\x95\x7a\x9d\x9a\xa5\xb9\xa5\xba\xa5\xba\xa5\xba\xa5\x99\xa5\xba'\
-b'\xa5\xba\xa5\xba\xa5\x9a\x9d\xba\x9d\xba\xa5\x9a\xa5\xba\xa5\xba'\
-b'\xa5\xba\xa5\x9a\xad\xda\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xb6\x19\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xb6\x19\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xfa\xbe\x19\xb5\xfa\xb5\xf9'\
-b'\xbe\x1a\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xda\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x19\xbd\xfa\xb6\x19\xbd\xfa\xbe\x19'\
-b'\xb5\xfa\xbd\xf9\xbe\x19\xb5\xfa\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbe\x19\xb5\xfa\xbd\xf9\xb5\xf9\xbe\x1a\xbd\xfa'\
-b'\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xb6\x1a\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xb6\x19\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xb5\xda\xb5\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa'\
-b'\xbe\x19\xb5\xfa\xbd\xfa\xbe\x19\xbd\xf9\xbe\x1a\xb5\xf9\xbe\x1a'\
-b'\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xf9\xbd\xfa\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xd9'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa'\
-b'\xbe\x19\xb5\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xb5\xfa\xbe\x19\xbd\xfa\xb5\xfa\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xb6\x19\xbd\xfa\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xb6\x19'\
-b'\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x1a\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbe\x1a\xb5\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x1a'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x19\xb5\xfa\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xfa\xb6\x19\xbd\xfa\xbd\xf9'\
-b'\xb5\xfa\xbe\x1a\xb5\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x1a'\
-b'\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xbd\xfa\xb6\x19\xb5\xfa\xbd\xfa\xb5\xf9\xb6\x19\xbd\xfa'\
-b'\xb5\xf9\xb5\xfa\xb6\x19\xbd\xfa\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xd9\xb5\xd9\xb5\xfa\xad\xd9\xad\xda\xb5\xf9\xad\xda'\
-b'\x95\x79\x9d\x9a\x5c\x79\x5c\x7a\x54\x7a\x64\xda\x64\xba\x64\xba'\
-b'\x6c\xfa\x74\xfa\x7d\x1a\x7d\x3a\x85\x3a\x85\x5a\x8d\x7a\x95\x7a'\
-b'\x95\x9a\x9d\x9a\x9d\x9a\x9d\x9a\x9d\xba\x9d\xba\x9d\xba\x9d\x9a'\
-b'\x95\x9a\x8d\x7a\x7d\x3a\x64\xdb\x44\x7b\x23\xba\x23\x58\x1b\x58'\
-b'\x23\x38\x23\x58\x1b\x79\x13\x9b\x2c\x1b\x4c\x7a\x6c\xfa\x7d\x3a'\
-b'\x85\x5a\x95\x7a\x95\x7a\x95\x7a\x95\x7a\x8d\x5a\x8d\x7a\x85\x5a'\
-b'\x85\x3a\x7d\x3a\x7d\x3a\x75\x1a\x6c\xda\x64\xb9\x74\xfa\x85\x5a'\
-b'\x8d\x5a\x5c\xb9\x9d\x9a\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xd9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb6\x1a\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xbd\xfa\xbe\x19\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xfa\xb6\x19'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb6\x19\xb5\xfa\xb5\xd9'\
-b'\xb5\xfa\xad\xd9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xbe\x19\xb5\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xbe\x19\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xb5\xfa\xb5\xfa\xbe\x1a\xbd\xf9\xbe\x1a\xb5\xf9\xbe\x1a'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xbd\xfa\xb5\xf9\xbe\x19\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbe\x1a\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xfa\xbd\xfa'\
-b'\xb6\x19\xbd\xfa\xbd\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xda'\
-b'\xb5\xfa\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xb5\xfa\xbe\x1a\xbd\xf9\xb6\x19'\
-b'\xbd\xf9\xbe\x19\xbd\xfa\xb6\x1a\xbe\x19\xbe\x1a\xb6\x1a\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa'\
-b'\xbe\x1a\xb5\xf9\xbe\x19\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xb5\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xbe\x1a\xbd\xf9\xb5\xfa\xbe\x19\xbd\xfa\xbd\xf9\xb6\x19\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x19\xbd\xfa\xbd\xfa\xbd\xf9'\
-b'\xb5\xfa\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x19\xb5\xf9\xbd\xfa\xbd\xf9\xb6\x19'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xad\xfa\x9d\x99'\
-b'\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\x9d\x9a\xa5\xb9\xad\xfa\x7c\x56'\
-b'\x53\x12\x7c\x77\x5b\xb6\x5b\xd6\x4b\xb6\x4b\xd7\x53\xf8\x33\x36'\
-b'\x33\x56\x33\x77\x33\x97\x3b\xb8\x3b\xd9\x3b\xd8\x43\xf9\x4c\x39'\
-b'\x4c\x59\x4c\x5a\x4c\x7a\x54\x7a\x54\x7a\x5c\x7a\x5c\x99\x5c\x99'\
-b'\x5c\x9a\x5c\x7a\x54\x59\x44\x19\x33\xd9\x2b\x78\x2b\x36\x33\x16'\
-b'\x32\xf5\x3a\xf4\x33\x15\x2b\x36\x2b\x57\x33\x98\x3b\xd8\x3b\xf9'\
-b'\x44\x19\x44\x19\x44\x19\x3c\x1a\x3c\x1a\x3b\xf9\x33\xfa\x33\xfa'\
-b'\x33\xfa\x3c\x3a\x54\x7a\x64\xda\x75\x1a\x75\x3a\x6c\xfa\x85\x3a'\
-b'\x85\x3a\x7d\x19\x95\x59\xa5\x9a\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb6\x1a'\
-b'\xb5\xf9\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xf9'\
-b'\xbe\x19\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xfa\xad\xda\xb5\xd9\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xfa\xb5\xf9'\
-b'\xbe\x19\xb5\xf9\xb5\xf9\xbd\xfa\xb6\x19\xb5\xf9\xb6\x1a\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa'\
-b'\xbe\x19\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbe\x19\xbd\xfa\xbd\xfa'\
-b'\xbd\xf9\xbe\x1a\xbd\xfa\xb6\x19\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x19\xbd\xfa\xb6\x1a\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xf9\xb5\xfa\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xbe\x19\xbd\xfa\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xbe\x1a\xbe\x19\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xb6\x19\xbd\xf9'\
-b'\xbd\xfa\xb6\x19\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xfa\xbe\x19\xbd\xfa\xbe\x19'\
-b'\xb5\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xfa'\
-b'\xb5\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x19\xb5\xfa'\
-b'\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xfa\xbd\xfa\xb6\x19\xbd\xfa\xbd\xf9'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbe\x19'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x1a\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x1a'\
-b'\xb5\xf9\xbe\x1a\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xf9'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbe\x1a\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9\xbd\xfa\xb6\x19'\
-b'\xbd\xfa\xb6\x1a\xbd\xf9\xbd\xfa\xbd\xfa\xb6\x19\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xb5\xfa\xbe\x19\xb5\xf9\xbe\x1a\xbd\xf9\xb5\xf9'\
-b'\xb5\xf9\xbe\x1a\xbd\xfa\xb5\xf9\xbd\xfa\xb6\x19\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xb6\x1a\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xad\xda\x95\x7a'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\x85\x1a\x9d\x99\x9d\x59\x62\xf1'\
-b'\x62\x6e\x6b\xb4\x63\x94\x63\x94\x5b\x95\x5b\x95\x5b\xd5\x4a\xd2'\
-b'\x42\xf3\x3a\xf4\x2b\x15\x2b\x16\x2b\x16\x2b\x16\x2b\x37\x23\x37'\
-b'\x1b\x58\x1b\x58\x1b\x58\x23\x58\x23\x57\x33\x36\x3b\x15\x42\xf4'\
-b'\x4a\xd2\x52\xb1\x52\x90\x5a\x8f\x6a\x6e\x6a\x4d\x72\x4c\x7a\x2c'\
-b'\x7a\x2b\x7a\x4c\x72\x2c\x72\x2b\x72\x4c\x6a\x4d\x62\x6e\x5a\x90'\
-b'\x52\xb1\x42\xd2\x3a\xf4\x33\x15\x2b\x37\x23\x57\x1b\x58\x1b\x58'\
-b'\x1b\x59\x23\x99\x23\x99\x3b\xd9\x44\x19\x44\x3a\x5c\x9a\x6c\xb9'\
-b'\x5c\x79\x54\x18\x6c\x98\x9d\x59\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xda\xbd\xf9\xb6\x1a\xb5\xfa\xb5\xf9\xbd\xf9'\
-b'\xb6\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xb5\xfa\xbe\x1a\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xfa'\
-b'\xb5\xfa\xbe\x19\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x19\xbd\xfa\xb5\xf9\xbe\x1a'\
-b'\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xf9'\
-b'\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\x8d\x7a\x8d\x59\x95\x79\xb5\xf9\xbe\x1a\xbd\xfa\xbe\x1a\xb5\xfa'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xda\xb5\xfa\xb5\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xb6\x19\xbd\xf9\xbe\x19'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbe\x1a\xb6\x19\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xfa\xb5\xf9\xbd\xfa'\
-b'\xbd\xfa\xb6\x19\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x1a'\
-b'\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x19\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa\xb6\x1a\xbd\xf9'\
-b'\xb5\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb6\x19\xbd\xf9\xbd\xf9\xb5\xfa'\
-b'\xbe\x1a\xbd\xf9\xb5\xfa\xbe\x19\xb5\xfa\xb5\xda\xb5\xd9\x9d\x9a'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\x95\x7a\xa5\xda\x84\x77\x62\xf0'\
-b'\x6a\xf0\x6b\xf5\x6c\x36\x5b\xb5\x5b\xd6\x5b\xb6\x53\xd7\x33\x16'\
-b'\x23\x57\x23\x79\x23\x99\x23\xb9\x23\xba\x23\xda\x23\xda\x23\xba'\
-b'\x23\xda\x23\xda\x23\xda\x23\xba\x1b\x79\x1b\x58\x2b\x37\x33\x15'\
-b'\x3a\xf4\x52\xb1\x5a\x8f\x6a\x4d\x72\x4c\x7a\x2b\x7a\x2b\x82\x0a'\
-b'\x82\x0a\x82\x0a\x7a\x2a\x7a\x2b\x72\x4c\x72\x4d\x62\x6e\x5a\x90'\
-b'\x42\xd2\x33\x15\x23\x37\x23\x58\x23\x99\x1b\x79\x23\x9a\x23\xda'\
-b'\x34\x1a\x34\x3a\x3c\x3a\x3c\x3a\x34\x1a\x34\x1a\x5c\xba\x6c\xfa'\
-b'\x5c\x7a\x54\x79\x8d\x3a\xb5\xda\xb5\xf9\xb5\xd9\xb5\xfa\xb5\xf9'\
-b'\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xbe\x19\xb5\xfa'\
-b'\xbd\xf9\xb6\x1a\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x19\xb5\xfa\xb5\xf9'\
-b'\xbd\xf9\xb5\xfa\xb5\xf9\xbe\x1a\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xb5\xfa\xbd\xfa\xb5\xd9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xf9\xb6\x1a\xbd\xf9'\
-b'\xbe\x19\xb5\xf9\xb6\x19\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb6\x1a\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xbe\x1a\xb5\xf9\xbd\xfa\xbe\x1a\xb5\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xf9\xb5\xfa\xbe\x19\xbd\xfa\xbe\x19\xbd\xfa\xb5\xfa\xbd\xf9'\
-b'\xb6\x1a\xbd\xf9\xbd\xfa\xb6\x19\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19\xbd\xf9\xbd\xfa'\
-b'\xbd\xfa\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9\xbd\xfa'\
-b'\x5c\xba\x5c\xb9\x64\xd9\xb5\xda\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbe\x19\xbd\xf9\xb5\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xb6\x19\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xbd\xfa\xb6\x19\xbd\xf9\xb5\xfa\xbe\x1a\xbd\xf9\xbd\xfa'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xb6\x19\xbd\xfa\xbd\xfa\xbe\x19\xb5\xfa'\
-b'\xbe\x1a\xb6\x1a\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xb5\xf9'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xb6\x1a\xbd\xf9\xbd\xfa\xbd\xfa\xbe\x19\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xb6\x19\xbd\xfa\xb6\x19\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xf9'\
-b'\xbd\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbe\x19\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xda\xad\xd9\xad\xd9\xad\xda\xad\xda'\
-b'\xad\xda\xad\xd9\xb5\xd9\xb5\xfa\x9d\xba\xad\xda\x6c\xda\x4c\x5a'\
-b'\x4c\x59\x7d\x1a\x8d\x5a\x7d\x1a\x6c\xb9\x5c\x9a\x54\x7a\x2b\xfb'\
-b'\x2b\xfb\x2c\x1b\x2c\x1b\x2c\x1b\x34\x1b\x34\x3b\x3c\x3a\x3c\x5b'\
-b'\x3c\x5b\x3c\x3b\x44\x7b\x3c\x3b\x34\x3b\x2b\xfb\x2b\xda\x23\xda'\
-b'\x23\x9a\x1b\x79\x23\x58\x2b\x37\x33\x15\x3a\xf4\x42\xd3\x4a\xd2'\
-b'\x4a\xd2\x4a\xd2\x42\xd3\x42\xf4\x3a\xf5\x2b\x16\x23\x37\x23\x58'\
-b'\x23\x79\x23\x79\x1b\x9a\x1b\xba\x2c\x1b\x34\x3b\x3c\x5b\x4c\x7b'\
-b'\x54\x9b\x54\xbb\x54\xba\x5c\xbb\x5c\xbb\x5c\x9b\x74\xfa\x7d\x3a'\
-b'\x85\x3a\x7d\x1a\x95\x9b\xa5\xba\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbe\x1a'\
-b'\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xfa'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa\xbd\xfa'\
-b'\xb5\xf9\xbe\x1a\xb5\xfa\xbd\xf9\xb5\xf9\xbe\x1a\xb5\xf9\xb5\xf9'\
-b'\xbd\xfa\xb5\xfa\xbd\xf9\xbe\x19\xb5\xfa\xbd\xf9\xbe\x1a\xb5\xf9'\
-b'\xbe\x1a\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb6\x19'\
-b'\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xfa\xbe\x19\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x19\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x19\xbd\xfa\xb5\xf9\xbe\x1a'\
-b'\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x19\xb5\xf9'\
-b'\xbd\xfa\xbd\xf9\xb6\x19\xbd\xf9\xbd\xf9\xbe\x1a\xbe\x19\xbd\xf9'\
-b'\x75\x1a\x75\x19\x7d\x3a\xb5\xf9\xbd\xfa\xb5\xfa\xbe\x19\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xbe\x19\xb5\xfa\xb6\x19\xbd\xf9\xb5\xfa\xbe\x19\xbd\xf9'\
-b'\xbd\xfa\xb6\x19\xbe\x19\xbd\xfa\xbd\xf9\xb6\x19\xbd\xf9\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xfa\xbe\x19\xbd\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xb6\x19\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbe\x19\xb5\xfa\xbd\xfa'\
-b'\xbd\xf9\xbd\xfa\xb6\x19\xbd\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xb6\x19\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xf9'\
-b'\xbe\x1a\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x19\xb5\xfa\xbd\xfa\xb5\xf9'\
-b'\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xb5\xf9'\
-b'\xbd\xfa\xbd\xf9\xbe\x19\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xfa'\
-b'\xb5\xf9\xad\xd9\xad\xda\xad\xda\xad\xda\xad\xda\xad\xb9\xad\xd9'\
-b'\xb5\xfa\xad\xda\xad\xd9\xad\xda\xad\xd9\xa5\xba\x54\x7a\x44\x5a'\
-b'\x44\x5a\x7d\x3a\x85\x3a\x7d\x1a\x64\xda\x5c\xba\x5c\xdb\x44\x5a'\
-b'\x3c\x5a\x44\x5b\x44\x7a\x44\x7a\x44\x7a\x4c\x7b\x4c\x7a\x54\x9b'\
-b'\x54\xbb\x54\x9a\x54\x9a\x54\x9a\x54\xba\x54\xba\x54\x9a\x54\xba'\
-b'\x54\x9b\x4c\x9a\x3c\x5b\x23\xdb\x13\x9a\x1b\x58\x23\x57\x23\x37'\
-b'\x23\x37\x2b\x37\x23\x58\x1b\x78\x13\x7a\x1b\xba\x23\xfb\x34\x3b'\
-b'\x44\x5b\x4c\x7b\x4c\x7a\x4c\x7b\x4c\x7a\x54\xba\x54\x9a\x5c\xda'\
-b'\x5c\xba\x5c\xba\x5c\xba\x64\xda\x64\xda\x64\xfa\x7d\x3a\x8d\x5a'\
-b'\x95\x7a\x8d\x5a\x95\x9a\x85\x39\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa'\
-b'\xbd\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xbe\x1a\xb5\xf9'\
-b'\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xbd\xfa\xbd\xfa\xbe\x19\xb5\xfa\xbd\xf9\xb6\x19\xb5\xf9\xbd\xf9'\
-b'\xbe\x19\xb5\xf9\xb5\xf9\xb5\xfa\xbe\x19\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xb6\x19\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xf9\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbe\x1a\xbd\xf9\xbe\x1a'\
-b'\xb5\xfa\xbd\xf9\xb5\xfa\xbe\x1a\xb5\xf9\xbe\x1a\xbd\xf9\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xf9\xb6\x1a'\
-b'\xbd\xfa\xb6\x19\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x19\xbd\xfa\xbd\xf9'\
-b'\xbd\xf9\xbe\x19\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19'\
-b'\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x1a'\
-b'\xbd\xfa\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x19'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xb5\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xf9'\
-b'\xbe\x1a\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x1a\xbe\x19\xb5\xfa'\
-b'\xbd\xf9\xbe\x1a\xbe\x19\xbd\xf9\xb5\xfa\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xb6\x1a'\
-b'\xbd\xfa\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19'\
-b'\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xb6\x1a\xbd\xf9\xbe\x1a'\
-b'\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xb5\xfa\xbe\x19'\
-b'\xbd\xf9\xbe\x1a\xb5\xf9\xbe\x19\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xbd\xfa\xbd\xfa\xb6\x19\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xda'\
-b'\xb5\xd9\xb5\xf9\xb5\xfa\xad\xd9\xad\xd9\xad\xda\x7d\x1a\x5c\xda'\
-b'\x64\xdb\x85\x5a\x75\x1a\x75\x1a\x6c\xfb\x64\xda\x6c\xfb\x54\x9a'\
-b'\x4c\x9a\x54\x9b\x54\x9b\x54\x9a\x54\x9b\x54\x9a\x54\x9a\x5c\xba'\
-b'\x5c\xba\x5c\xba\x5c\xdb\x5c\xdb\x64\xdb\x64\xdb\x6c\xda\x64\xda'\
-b'\x6c\xda\x6c\xfb\x54\xba\x34\x3b\x23\xfb\x1b\xbb\x13\x9a\x13\x7a'\
-b'\x13\x7a\x13\x7a\x13\x7a\x13\x9b\x1b\xdb\x2c\x1b\x3c\x5a\x4c\x7a'\
-b'\x5c\xba\x64\xda\x64\xda\x64\xfa\x64\xda\x64\xdb\x64\xda\x64\xdb'\
-b'\x64\xda\x64\xda\x64\xda\x6c\xfb\x75\x1a\x75\x1a\x8d\x5a\x8d\x5a'\
-b'\x8d\x5a\x95\x7a\x95\x9a\x8d\x7a\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xd9\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xbd\xf9\xb6\x1a\xb5\xf9\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xf9\xbd\xfa'\
-b'\xbd\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xfa\xbe\x19'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xfa\xbd\xf9\xb6\x1a'\
-b'\xb5\xfa\xbd\xf9\xbd\xfa\xb6\x19\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa'\
-b'\xbd\xfa\xb6\x19\xbd\xf9\xbe\x1a\xb5\xf9\xbe\x1a\xbd\xfa\xbe\x1a'\
-b'\xbd\xfa\xb5\xfa\xbd\xfa\xbe\x1a\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xf9'\
-b'\xbd\xfa\xb6\x19\xbd\xfa\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xb5\xfa'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xbd\xf9\xbe\x19\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a'\
-b'\xbe\x1a\xbd\xf9\xb5\xf9\xb5\xf9\xbe\x1a\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xda\xb5\xf9\xb5\xda\xb5\xfa\xbe\x1a\xb5\xf9\xbe\x19\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xbd\xf9\xbe\x19\xb5\xf9\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19\xb5\xf9'\
-b'\xbe\x19\xbd\xfa\xb6\x19\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19\xb5\xfa'\
-b'\xbe\x19\xbe\x19\xb5\xfa\xbd\xf9\xbe\x19\xbe\x19\xbd\xf9\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x19\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbd\xf9\xbe\x19\xbd\xfa\xbd\xfa\xbe\x19\xbd\xf9\xb5\xfa\xb5\xfa'\
-b'\xbe\x19\xbd\xfa\xbe\x19\xb5\xfa\xbe\x19\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9'\
-b'\xbe\x1a\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbe\x19\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xb6\x19\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xbe\x19\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xfa\xbe\x19\xbd\xfa\xb5\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xb5\xfa\xb5\xf9\xb5\xda\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xda\xad\xfa\x75\x1a\x54\x7a'\
-b'\x54\x9b\x7d\x3a\x74\xfa\x74\xfa\x7d\x1a\x75\x1a\x6c\xfa\x5c\xba'\
-b'\x54\xba\x5c\xba\x5c\xbb\x5c\xba\x5c\xba\x5c\xbb\x64\xda\x64\xda'\
-b'\x64\xda\x64\xda\x64\xda\x6c\xda\x6c\xda\x6c\xfb\x6c\xfa\x74\xfa'\
-b'\x6c\xfa\x6c\xfa\x64\xbb\x4c\x7a\x34\x3b\x23\xfb\x13\xbb\x13\xbb'\
-b'\x13\x9b\x13\x9b\x13\x9b\x13\xdb\x23\xfb\x34\x3b\x44\x5b\x54\x9b'\
-b'\x64\xda\x6c\xfa\x6c\xfb\x6c\xfa\x6c\xda\x6c\xda\x64\xda\x6c\xda'\
-b'\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfb\x75\x1a\x75\x1a\x8d\x5a\x95\x7a'\
-b'\x95\x7a\x85\x59\x9d\x9a\x95\x7a\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xbd\xf9\xb6\x1a\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xb5\xf9\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xf9\xbe\x1a\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xb5\xfa'\
-b'\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xf9\xb5\xf9\xb6\x19\xbd\xf9\xbd\xf9'\
-b'\xb5\xf9\xbe\x1a\xb5\xf9\xbd\xf9\xbd\xf9\xb6\x1a\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xb6\x19\xbd\xfa\xbd\xf9\xbe\x19'\
-b'\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x1a\xb5\xf9'\
-b'\xbe\x1a\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xb6\x19\xbd\xf9\xbd\xf9'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbe\x1a\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xd9'\
-b'\xb5\xf9\xb5\xd9\xb5\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xb6\x19\xbd\xf9\xbe\x19\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xfa'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbe\x1a'\
-b'\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xfa'\
-b'\xbd\xf9\xbe\x1a\xb5\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xfa\xb6\x1a\xbd\xf9\xb5\xfa'\
-b'\xbd\xfa\xbe\x19\xbd\xfa\xb6\x1a\xbd\xf9\xbd\xfa\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xb5\xfa\xbe\x19\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xad\xda\xad\xb9\x7d\x3a\x5c\xbb'\
-b'\x64\xda\x85\x5a\x7d\x3a\x7d\x3a\x7d\x3a\x7d\x1a\x6c\xfa\x64\xda'\
-b'\x5c\xbb\x5c\xba\x5c\xbb\x5c\xbb\x5c\xda\x5c\xda\x64\xda\x64\xdb'\
-b'\x64\xda\x64\xda\x64\xdb\x6c\xfa\x74\xfa\x74\xfa\x75\x1a\x75\x1a'\
-b'\x75\x1a\x75\x1a\x64\xda\x54\x9a\x3c\x5b\x2c\x1b\x23\xfb\x1b\xdb'\
-b'\x13\xdb\x13\xbb\x1b\xdb\x24\x1b\x34\x1b\x44\x5a\x54\xba\x64\xda'\
-b'\x6c\xfa\x6c\xfa\x6c\xfa\x6c\xfb\x6c\xfa\x64\xda\x64\xda\x64\xda'\
-b'\x64\xda\x64\xda\x64\xda\x6c\xfa\x75\x1a\x7d\x1a\x85\x5a\x95\x7a'\
-b'\x95\x7a\x8d\x7a\x9d\x9a\x9d\x79\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbe\x19'\
-b'\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9'\
-b'\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xb6\x19\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x1a\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb6\x1a\xbd\xf9\xb5\xfa\xb5\xda'\
-b'\xb5\xf9\xad\xda\xb5\xfa\xad\xba\xad\xda\xb5\xda\xad\xda\xad\xd9'\
-b'\xad\xda\xad\xda\xad\xda\xad\xda\xb5\xfa\xad\xd9\xb5\xfa\xb5\xf9'\
-b'\xb5\xfa\xb5\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa'\
-b'\xbe\x1a\xb5\xf9\xbe\x19\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbd\xf9\xbe\x1a\xbe\x19\xbd\xfa\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19'\
-b'\xbe\x19\xbd\xfa\xbe\x1a\xbe\x19\xbd\xfa\xbe\x1a\xbe\x1a\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xbe\x1a\xbe\x19\xbd\xf9\xbe\x1a\xbe\x19\xbd\xfa'\
-b'\xbd\xfa\xb6\x19\xb5\xf9\xb6\x19\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xfa'\
-b'\xb5\xd9\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbe\x19\xb5\xf9'\
-b'\xbe\x19\xbd\xf9\xb6\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbe\x1a\xb5\xf9\xbe\x1a\xbd\xf9\xb6\x19\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xb5\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbd\xf9\xb6\x1a\xbd\xf9\xbd\xf9\xbd\xf9\xb6\x19\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xb5\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xb6\x19\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xb5\xfa'\
-b'\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xb6\x1a'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a'\
-b'\xb5\xf9\xbe\x19\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xf9\xbe\x1a\xb5\xf9\xbd\xf9'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xad\xda\xa5\xba\x64\xda\x54\x9a'\
-b'\x5c\xba\x7d\x3a\x85\x5a\x8d\x5a\x85\x3a\x75\x1a\x6c\xfb\x5c\x9a'\
-b'\x54\xba\x54\xba\x5c\xba\x5c\xba\x5c\xbb\x5c\xba\x64\xdb\x5c\xda'\
-b'\x64\xdb\x64\xda\x6c\xda\x64\xda\x6c\xfb\x74\xfa\x75\x1a\x75\x1a'\
-b'\x74\xfa\x75\x1a\x6c\xfa\x5c\xbb\x4c\x7a\x34\x3b\x23\xfb\x1b\xfb'\
-b'\x23\xdb\x1b\xdb\x23\xfb\x2c\x3b\x3c\x3a\x44\x7a\x5c\xbb\x6c\xfa'\
-b'\x74\xfa\x75\x1a\x74\xfa\x6c\xfa\x6c\xfa\x64\xdb\x64\xda\x64\xbb'\
-b'\x5c\xdb\x5c\xbb\x5c\xbb\x64\xdb\x6d\x1a\x7d\x3a\x85\x5a\x95\x79'\
-b'\x9d\x9a\x95\x7a\x9d\x9a\xad\xd9\xb5\xf9\xb5\xf9\xbe\x19\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xbe\x1a\xb5\xfa\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xbe\x19\xbd\xfa\xbd\xfa\xbe\x19\xb5\xf9\xbd\xfa\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa'\
-b'\xb6\x19\xbd\xfa\xb5\xf9\xb6\x19\xbd\xf9\xb5\xf9\xb5\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xb5\xda\xad\xd9'\
-b'\xad\xda\xad\xd9\xb5\xd9\xad\xd9\xad\xd9\xad\xda\xad\xda\xad\xf9'\
-b'\xad\xd9\xad\xda\xad\xda\xad\xda\xb5\xd9\xad\xda\xad\xd9\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb6\x19\xbd\xfa\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xbe\x1a'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x1a'\
-b'\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbe\x1a'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xb5\xd9\xb5\xf9'\
-b'\xb5\xda\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x19'\
-b'\xb5\xf9\xbd\xf9\xbe\x19\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9'\
-b'\xbd\xf9\xbe\x1a\xbd\xfa\xb5\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xb6\x19\xbd\xf9\xbd\xf9\xb5\xf9\xbe\x1a\xbd\xf9\xb5\xf9\xbd\xf9'\
-b'\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xfa\xbd\xf9\xbe\x1a'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xf9\xbe\x1a'\
-b'\xb5\xf9\xbe\x19\xb5\xfa\xbe\x1a\xb5\xf9\xbd\xfa\xb5\xfa\xbe\x19'\
-b'\xbd\xfa\xbe\x1a\xbd\xf9\xbd\xfa\xb5\xfa\xbe\x19\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbe\x19\xbd\xfa\xbe\x19\xb5\xf9\xbe\x19\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xb5\xfa\xbe\x19\xb5\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xb6\x19\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xb5\xf9\xbe\x1a\xb5\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xda\xad\xd9\xa5\xba\x7d\x3a\x6c\xfa'\
-b'\x6c\xdb\x85\x5a\x85\x3a\x85\x3a\x7d\x1a\x75\x1a\x64\xfa\x5c\xba'\
-b'\x54\x9b\x54\x9a\x5c\xbb\x5c\xba\x5c\xba\x5c\xbb\x5c\xda\x64\xdb'\
-b'\x64\xda\x64\xdb\x64\xda\x64\xda\x64\xdb\x6c\xfa\x74\xfa\x74\xfa'\
-b'\x75\x1b\x7d\x1a\x74\xfb\x5c\xda\x4c\x7b\x3c\x3a\x2c\x1b\x23\xdb'\
-b'\x1b\xdb\x23\xfb\x23\xfa\x34\x1a\x3c\x3b\x44\x5a\x5c\xba\x6c\xfb'\
-b'\x74\xfa\x74\xfa\x6c\xfa\x6c\xfb\x64\xda\x5c\xda\x5c\xbb\x5c\xba'\
-b'\x5c\xba\x5c\xba\x54\xba\x5c\xda\x6c\xfa\x7d\x1a\x85\x3a\x8d\x5a'\
-b'\x95\x7a\x95\x9a\xa5\xb9\xad\xda\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9'\
-b'\xb6\x19\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9'\
-b'\xbd\xfa\xb5\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9\xb5\xf9'\
-b'\xbd\xfa\xb5\xfa\xbd\xf9\xb6\x19\xb5\xfa\xb5\xf9\xad\xfa\xad\xd9'\
-b'\xad\xda\xad\xda\xb5\xfa\xad\xda\xad\xfa\xad\xd9\xb5\xda\xb5\xfa'\
-b'\xad\xda\xad\xd9\xad\xda\xad\xda\xb5\xd9\xad\xd9\xb5\xda\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xb6\x19\xbd\xfa\xbd\xfa\xb5\xf9\xbd\xf9\xbe\x19\xb5\xfa'\
-b'\xbe\x19\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbe\x19'\
-b'\xbd\xfa\xbe\x1a\xbe\x1a\xbd\xfa\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19'\
-b'\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xfa'\
-b'\xbe\x19\xbe\x19\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x19\xbd\xfa\xbd\xfa'\
-b'\xbe\x1a\xbd\xfa\xb5\xf9\xbe\x19\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x19'\
-b'\xbd\xf9\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19'\
-b'\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbe\x19\xbe\x19\xbd\xf9'\
-b'\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xb6\x19\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19\xb5\xfa\xbd\xf9\xbd\xf9'\
-b'\xbe\x1a\xb5\xf9\xbd\xfa\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xb5\xfa'\
-b'\xbd\xf9\xb6\x19\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xf9'\
-b'\xb5\xfa\xbd\xfa\xb5\xf9\xb6\x19\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x19'\
-b'\xbd\xf9\xb5\xf9\xb5\xfa\xb5\xf9\xad\xfa\xad\xba\x8d\x5a\x64\xda'\
-b'\x64\xda\x85\x5a\x85\x5a\x85\x3a\x74\xfa\x75\x1b\x6c\xfa\x5c\xbb'\
-b'\x4c\x7a\x4c\x9b\x54\x9b\x54\xbb\x54\xbb\x5c\xba\x5c\xbb\x64\xda'\
-b'\x64\xda\x5c\xba\x5c\xbb\x5c\xba\x64\xdb\x64\xda\x6c\xfa\x74\xfb'\
-b'\x75\x1a\x6c\xfa\x6c\xdb\x5c\xba\x4c\x7b\x34\x3b\x2c\x1b\x23\xdb'\
-b'\x1b\xdb\x23\xfb\x23\xfb\x34\x3b\x3c\x5b\x4c\x7a\x5c\xbb\x6c\xfb'\
-b'\x75\x1a\x6c\xfb\x6c\xfa\x64\xda\x5c\xbb\x5c\xbb\x5c\xba\x5c\xbb'\
-b'\x54\xbb\x54\x9a\x54\x9b\x5c\xbb\x6c\xfa\x7d\x1a\x85\x3a\x8d\x7a'\
-b'\x95\x7a\x9d\x99\xad\xda\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb6\x19'\
-b'\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xda\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xad\xb9\xa5\xda\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xb6\x19\xbd\xfa\xbe\x1a\xb5\xf9\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xb5\xf9\xb5\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xfa\xb6\x19'\
-b'\xbd\xfa\xbe\x19\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xad\xda\xb5\xd9'\
-b'\xad\xd9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xd9\xb5\xda\xb5\xf9\xb5\xda'\
-b'\xb5\xd9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xda\xb5\xf9\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xfa\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xbe\x19\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9'\
-b'\xbe\x19\xbd\xfa\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x1a\xbe\x1a'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xfa\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xfa\x8d\x59\x7d\x39\x85\x39'\
-b'\x85\x59\x85\x39\x85\x39\x85\x3a\x85\x39\x85\x39\x85\x39\x85\x39'\
-b'\x7d\x39\x85\x39\x85\x39\x7d\x39\x85\x5a\x85\x39\x7d\x39\x85\x5a'\
-b'\xad\xd9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xfa\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xbe\x19\xbd\xfa\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x19'\
-b'\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19\xb5\xf9'\
-b'\xbe\x1a\xbd\xf9\xb6\x1a\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbe\x19\xbd\xf9\xb5\xfa\xbd\xf9\xb6\x19\xbd\xfa\xbe\x19'\
-b'\xbd\xf9\xb6\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xb6\x1a\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xfa\xb5\xf9\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x19'\
-b'\xb5\xfa\xb5\xfa\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xbe\x1a\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xb6\x19\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xb5\xfa\xb5\xda\xad\xd9\xad\xda\x8d\x7a\x75\x1a'\
-b'\x6c\xda\x85\x3a\x85\x3a\x7d\x3a\x6c\xfa\x6c\xfa\x5c\xda\x4c\x7a'\
-b'\x44\x5b\x4c\x7b\x4c\x9a\x4c\x9b\x4c\x5b\x4c\x7a\x4c\x9a\x54\x9a'\
-b'\x54\x9b\x54\x9b\x5c\xba\x54\xba\x5c\xba\x5c\xba\x5c\xdb\x6c\xfa'\
-b'\x6c\xfa\x6c\xfb\x5c\xda\x54\x9a\x44\x7a\x3c\x3b\x2c\x1b\x1b\xfb'\
-b'\x1b\xdb\x1b\xdb\x24\x1b\x2c\x1b\x2c\x1a\x3c\x5a\x4c\x7a\x5c\xba'\
-b'\x6c\xfa\x6c\xfa\x64\xda\x5c\xba\x5c\xbb\x5c\xba\x54\xba\x54\x9a'\
-b'\x4c\x9a\x4c\x9b\x54\x9b\x54\xba\x64\xda\x74\xfa\x7d\x3a\x95\x7a'\
-b'\xa5\xba\xad\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xda'\
-b'\xad\xda\xad\xd9\xb5\xf9\xbd\xfa\xb5\xf9\xad\xd9\xad\xfa\xb5\xf9'\
-b'\xbe\x19\xb5\xfa\xa5\xb9\xad\xd9\xb5\xfa\xb5\xda\xb5\xf9\xb5\xf9'\
-b'\xbe\x1a\xbd\xfa\xbd\xf9\xbd\xf9\xb6\x1a\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbd\xfa\xb6\x19\xbd\xf9\xb6\x1a\xbd\xf9\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xb6\x19\xb5\xfa\xb5\xfa'\
-b'\xbd\xfa\xbe\x1a\xbd\xfa\xbd\xfa\xb5\xfa\xb6\x19\xbd\xfa\xb5\xf9'\
-b'\xbd\xfa\xbd\xfa\xb5\xfa\xbe\x19\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xf9'\
-b'\xb5\xf9\xbe\x1a\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x19'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x19'\
-b'\xbd\xfa\xbe\x19\xbe\x1a\xbd\xfa\xbe\x19\xbe\x1a\xbd\xfa\xbe\x19'\
-b'\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xbd\xfa\xbe\x1a\xbd\xf9\xb6\x19\xbd\xfa\xbd\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbe\x19\xbd\xf9\xbe\x19'\
-b'\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19\xad\xd9\x6d\x19\x64\xda\x64\xd9'\
-b'\x64\xd9\x64\xf9\x64\xd9\x64\xf9\x64\xda\x64\xf9\x64\xd9\x64\xfa'\
-b'\x64\xd9\x64\xf9\x64\xda\x64\xd9\x64\xd9\x64\xd9\x64\xd9\x6c\xf9'\
-b'\xa5\xb9\xbd\xfa\xbe\x1a\xbe\x19\xbd\xf9\xbe\x19\xbe\x19\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xb6\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xb5\xf9'\
-b'\xbd\xfa\xbd\xfa\xb6\x19\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xb6\x19\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x19\xbd\xfa\xbd\xfa\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xb6\x19'\
-b'\xbd\xfa\xb5\xfa\xbe\x19\xbd\xf9\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xbe\x19'\
-b'\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xad\xd9\xa5\xba\x95\x7a\x85\x5a'\
-b'\x85\x5a\x8d\x7a\x85\x3a\x7d\x3a\x75\x1a\x6c\xfb\x64\xba\x4c\x7b'\
-b'\x44\x5b\x44\x5a\x4c\x9b\x4c\x7b\x4c\x7a\x4c\x7b\x4c\x9b\x4c\x9a'\
-b'\x54\x9a\x4c\x9a\x54\x9b\x5c\xbb\x54\xba\x54\x9a\x54\xbb\x64\xda'\
-b'\x6c\xfa\x64\xdb\x5c\xba\x54\x9b\x44\x5b\x3c\x3a\x2c\x1b\x23\xfb'\
-b'\x23\xdb\x23\xfb\x1b\xfb\x23\xfb\x23\xfb\x34\x3b\x44\x5b\x54\xbb'\
-b'\x64\xda\x6c\xfb\x64\xdb\x54\x9a\x54\x9a\x54\x9b\x54\x9b\x54\x9a'\
-b'\x54\x9b\x4c\x9a\x54\x9a\x54\x9b\x64\xda\x6c\xfa\x7d\x1a\x9d\xba'\
-b'\xad\xfa\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xfa\xa5\xba'\
-b'\x9d\x99\xad\xda\xb5\xda\xb5\xf9\xbd\xfa\xb5\xfa\xb5\xfa\xb5\xfa'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb6\x19\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xb5\xf9\xbe\x1a\xbd\xf9\xb6\x19'\
-b'\xbd\xfa\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xbe\x19\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbe\x19\xb5\xfa'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xbe\x19'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xfa'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xfa'\
-b'\xbd\xfa\xbe\x1a\xbe\x19\xbd\xfa\xbd\xf9\xb5\xd9\xb5\xda\xb5\xd9'\
-b'\xad\xd9\xb5\xda\xb5\xda\xad\xd9\xb5\xd9\xad\xd9\xad\xd9\xb5\xd9'\
-b'\xad\xd9\xb5\xda\xb5\xd9\xad\xd9\xb5\xd9\xad\xda\xb5\xd9\xad\xd9'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xfa\xbe\x1a'\
-b'\xbd\xf9\xbe\x1a\xbe\x19\xbd\xfa\xbe\x1a\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xb6\x1a\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbe\x19\xbd\xf9\xb6\x19\xbd\xf9\xbd\xf9\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xb5\xf9\xbe\x1a\xbd\xf9\xbe\x1a'\
-b'\xb5\xf9\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xb6\x1a\xbd\xf9\xbd\xfa\xbd\xfa\xbe\x19\xbd\xf9\xb6\x1a'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xf9\xbe\x19'\
-b'\xb5\xfa\xbe\x1a\xb5\xf9\xb5\xfa\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xfa'\
-b'\xb6\x1a\xb5\xf9\xbd\xfa\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x19\xb5\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xbe\x19\xb5\xf9\xb5\xfa\xb5\xda\xad\xda\xa5\xb9\x95\x7a\x95\x7a'\
-b'\x95\x9a\x9d\x9a\x95\x7a\x8d\x5a\x7d\x3a\x74\xfa\x5c\xba\x44\x5a'\
-b'\x3c\x5b\x3c\x3a\x3c\x5a\x44\x5b\x44\x5b\x44\x5a\x44\x5b\x44\x7b'\
-b'\x44\x5b\x4c\x5a\x4c\x7b\x54\x9a\x54\x9b\x4c\x9a\x5c\xba\x5c\xba'\
-b'\x64\xbb\x5c\xba\x54\x9a\x4c\x7b\x44\x5a\x34\x3b\x2c\x1b\x2c\x1b'\
-b'\x23\xfb\x23\xda\x23\xfb\x23\xfb\x23\xfb\x2c\x1b\x44\x5a\x54\x9a'\
-b'\x64\xdb\x64\xda\x5c\xda\x54\x9a\x4c\x7a\x54\xba\x5c\xba\x54\xbb'\
-b'\x54\x9b\x54\x9a\x54\x9b\x5c\xbb\x5c\xba\x64\xda\x75\x1a\x85\x3a'\
-b'\x95\x7a\xa5\xb9\xad\xda\xb5\xf9\xbd\xf9\xbd\xf9\xad\xd9\xa5\xb9'\
-b'\x9d\x9a\xad\xd9\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xad\xfa\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xfa\xb5\xf9\xbd\xfa\xbe\x1a'\
-b'\xb5\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbe\x19\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xbd\xf9\xb6\x1a\xbe\x1a\xbd\xfa\xbd\xfa\xbe\x19'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xf9\xbe\x19\xb5\xf9\xbd\xf9\xbe\x19\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x19'\
-b'\xbd\xfa\xbe\x19\xbe\x1a\xbd\xfa\xbe\x19\xbe\x1a\xbd\xfa\xbe\x19'\
-b'\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9\xbe\x19\xbe\x1a'\
-b'\xbd\xfa\xbe\x1a\xb5\xf9\xbd\xf9\xb6\x1a\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa\xb6\x19\xbd\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9\xbd\xf9'\
-b'\xbe\x19\xbe\x19\xbe\x19\xbd\xfa\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x19\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbe\x1a\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xf9\xbe\x1a\xbe\x19\xb6\x19\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbe\x19'\
-b'\xbd\xfa\xb5\xf9\xbd\xf9\xbe\x1a\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x19\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xb5\xfa\xb5\xf9\xad\xfa\xad\xfa\xa5\xba\x95\x7a\x95\x7a'\
-b'\x95\x7a\x95\x9a\x8d\x5a\x85\x5a\x7d\x1a\x75\x1a\x64\xdb\x4c\x7b'\
-b'\x44\x7a\x44\x7b\x4c\x7a\x44\x5a\x44\x7b\x44\x5a\x44\x7a\x4c\x7a'\
-b'\x4c\x7a\x4c\x7b\x54\x9a\x54\xbb\x54\x9b\x54\xba\x5c\xbb\x5c\xdb'\
-b'\x5c\xba\x54\x9b\x54\xba\x4c\x9a\x44\x5b\x34\x3b\x34\x3a\x2c\x1a'\
-b'\x2c\x1b\x34\x1b\x2c\x1b\x34\x1b\x34\x3a\x34\x3b\x44\x7b\x54\x9a'\
-b'\x54\xba\x5c\xdb\x64\xdb\x5c\xba\x5c\xbb\x5c\xbb\x5c\xba\x54\x9b'\
-b'\x4c\x9a\x4c\x7a\x4c\x7b\x54\x9a\x5c\xbb\x64\xda\x6c\xfa\x7d\x3a'\
-b'\x8d\x5a\x85\x3a\x9d\x9a\xb5\xd9\xb5\xfa\xb5\xfa\xad\xda\xa5\xba'\
-b'\xa5\xba\xad\xda\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xfa\xad\xda\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xb5\xf9\xb6\x1a\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xb6\x1a\xbd\xfa\xbe\x19\xbd\xfa\xbd\xfa'\
-b'\xbd\xfa\xb6\x19\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xb6\x19\xbd\xf9\xbd\xf9\xb6\x1a\xb5\xf9\xbe\x19\xb5\xfa'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xb6\x19\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x19\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbe\x19\xb5\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xbd\xfa\xbe\x1a\xbe\x1a\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xbd\xfa\xbe\x1a\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xb5\xfa\xbe\x1a\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xad\xda\xad\xd9\xb5\xf9\xbe\x1a\xbe\x1a'\
-b'\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xf9\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xbe\x19\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xbe\x19\xbe\x1a'\
-b'\xbd\xf9\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xbe\x19\xb5\xf9\xbe\x19\xbd\xfa\xb6\x19\xbd\xf9'\
-b'\xbe\x19\xbd\xf9\xbe\x19\xbd\xf9\xbe\x19\xbd\xf9\xb6\x19\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xfa\xb6\x19\xbd\xfa\xbd\xf9\xbe\x19'\
-b'\xb5\xfa\xbd\xf9\xbe\x19\xb5\xfa\xbd\xfa\xbe\x19\xbd\xf9\xb5\xfa'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xb5\xfa\xbe\x19\xb5\xfa\xbe\x19\xb5\xf9'\
-b'\xbe\x1a\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xfa'\
-b'\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x19\xb5\xf9\xbd\xf9'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xb5\xf9\xbe\x1a'\
-b'\xb6\x1a\xad\xd9\xa5\xba\xa5\xba\x9d\x9a\x95\x9a\x85\x5a\x85\x3a'\
-b'\x7d\x3a\x7d\x1a\x7d\x1a\x75\x1a\x6c\xfa\x6c\xfa\x64\xdb\x54\x9a'\
-b'\x4c\x9a\x4c\x7b\x4c\x9b\x4c\x9b\x4c\x9b\x4c\x9a\x4c\x9b\x4c\x7b'\
-b'\x4c\x7b\x4c\x7a\x44\x7b\x3c\x5a\x44\x5a\x4c\x9a\x5c\xbb\x5c\xba'\
-b'\x54\x9a\x54\x9b\x54\x9b\x4c\x7b\x3c\x5b\x3c\x3b\x34\x3b\x2c\x1b'\
-b'\x2c\x1b\x2c\x1b\x2c\x1b\x2c\x1b\x2c\x1a\x34\x3b\x3c\x5b\x44\x5b'\
-b'\x4c\x9a\x5c\xba\x5c\xbb\x5c\xba\x5c\xba\x54\xba\x5c\xbb\x5c\xba'\
-b'\x54\x9b\x54\x9b\x54\xba\x5c\xba\x5c\xbb\x64\xda\x6c\xfa\x7d\x3a'\
-b'\x8d\x5a\x8d\x5a\x9d\x99\xad\xfa\xb5\xf9\xbd\xf9\xad\xd9\xa5\xd9'\
-b'\xa5\xb9\xad\xd9\xad\xd9\xb5\xfa\xb5\xf9\xb5\xd9\xad\xfa\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x1a\xb5\xfa\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xfa\xbe\x1a\xb5\xf9\xb5\xfa\xb5\xfa\xb5\xf9\xb5\xfa'\
-b'\xb5\xfa\xbe\x1a\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xfa\xb6\x19\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xb6\x19\xbd\xfa\xbd\xfa'\
-b'\xbe\x19\xb5\xf9\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xb5\xf9'\
-b'\xbe\x19\xbd\xfa\xb6\x19\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xb6\x1a\xbe\x19\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xb6\x19\xbd\xf9\xbd\xf9\xbe\x19\xbe\x19\xbe\x19\xbd\xfa\xbe\x19'\
-b'\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9'\
-b'\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbe\x1a\xbe\x19\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x1a'\
-b'\xbd\xfa\xbe\x1a\xb5\xf9\xbe\x1a\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xda\xad\xba\xa5\xba\xa5\xba\x95\x9a\x85\x39'\
-b'\x95\x79\xad\xda\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbe\x19\xbe\x1a\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x19'\
-b'\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19'\
-b'\xbd\xf9\xbd\xfa\xb5\xfa\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x19\xbd\xfa\xbe\x19\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xfa\xb5\xf9'\
-b'\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\x95\x7a\x85\x3a\x7d\x3a\x75\x1a\x75\x1a\x6c\xfa\x64\xda'\
-b'\x64\xbb\x6c\xdb\x64\xda\x64\xda\x64\xba\x64\xda\x5c\xbb\x44\x7b'\
-b'\x44\x5b\x44\x5a\x44\x5a\x3c\x3b\x44\x5b\x44\x7a\x4c\x7b\x4c\x7b'\
-b'\x4c\x7a\x44\x7b\x34\x3b\x2c\x1b\x2c\x1b\x3c\x3b\x4c\x7a\x4c\x9b'\
-b'\x4c\x7b\x4c\x7a\x44\x5a\x3c\x5b\x3c\x3a\x34\x1b\x2c\x1b\x23\xfa'\
-b'\x23\xfb\x23\xfb\x1b\xfb\x23\xfb\x23\xfb\x2b\xfb\x34\x1b\x44\x5b'\
-b'\x44\x5b\x4c\x7a\x5c\xbb\x5c\xbb\x5c\xbb\x54\xbb\x54\x9a\x54\x9a'\
-b'\x4c\x7a\x4c\x9a\x54\xbb\x5c\xba\x5c\xba\x64\xdb\x6c\xfa\x7d\x3a'\
-b'\x8d\x5a\x8d\x5a\x9d\x9a\xad\xda\xb5\xf9\xb5\xfa\xad\xda\xad\xda'\
-b'\xa5\xba\xad\xda\xb5\xda\xb5\xfa\xb5\xf9\xad\xd9\xb5\xda\xb5\xfa'\
-b'\xb5\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x19\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xbe\x1a\xb5\xf9\xb5\xfa\xa5\xba\x95\x79\xa5\xb9\xad\xda\xa5\x99'\
-b'\x9d\x9a\xad\xd9\xbe\x1a\xb5\xfa\xbd\xf9\xbe\x1a\xbe\x19\xbe\x19'\
-b'\xbd\xfa\xb6\x19\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xf9\xbd\xfa\xb6\x19'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbe\x19\xbd\xf9\xbe\x19\xb5\xf9\xbd\xfa'\
-b'\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbe\x19\xb5\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x1a\xbd\xf9\xbe\x1a\xb5\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xfa\xbe\x1a\xbd\xfa\xbd\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xbd\xfa\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xfa\xbe\x1a'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbe\x1a'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xb6\x19\xbd\xfa\xb5\xfa'\
-b'\xb5\xf9\xb5\xfa\xb5\xf9\xa5\xda\x7d\x3a\x5c\x9a\x44\x5a\x5c\x9a'\
-b'\x95\x7a\x95\x9a\xad\xda\xb5\xfa\xbe\x19\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xb5\xf9\xbd\xfa\xbe\x19\xbe\x19\xbe\x1a\xbd\xf9\xbe\x19'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9\xbe\x1a'\
-b'\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xfa'\
-b'\xbd\xf9\xb6\x19\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x19\xbd\xf9'\
-b'\xbe\x19\xbd\xf9\xbe\x19\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xb6\x1a\xbd\xf9\xbe\x19\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x19\xb5\xfa'\
-b'\xbe\x19\xbd\xf9\xbd\xfa\xbd\xfa\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbe\x1a\xbe\x19\xb5\xf9'\
-b'\xbe\x1a\xbd\xfa\xb6\x19\xb6\x1a\xbd\xfa\xb6\x1a\xb5\xf9\xbd\xf9'\
-b'\xbe\x1a\xb5\xfa\xb6\x19\xb5\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbe\x19'\
-b'\xb5\xfa\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xf9'\
-b'\xb5\xfa\xb5\xfa\xbd\xf9\xb5\xfa\xb5\xfa\xbd\xf9\xb6\x19\xb5\xfa'\
-b'\xb5\xfa\x95\x7a\x7d\x3a\x7d\x1a\x74\xfa\x75\x1a\x6c\xfa\x64\xda'\
-b'\x5c\xba\x64\xda\x5c\xbb\x5c\xba\x5c\xbb\x5c\xbb\x54\x9b\x3c\x5a'\
-b'\x3c\x3b\x34\x3b\x34\x3b\x2c\x1b\x34\x3a\x3c\x5b\x3c\x5b\x3c\x5b'\
-b'\x3c\x5b\x3c\x3b\x34\x1a\x1b\xdb\x1b\x9a\x1b\x9a\x2c\x1b\x3c\x5b'\
-b'\x3c\x5b\x3c\x5a\x3c\x5b\x3c\x3b\x2c\x1b\x2b\xfb\x23\xdb\x1b\xdb'\
-b'\x1b\xdb\x1b\xdb\x1b\xdb\x13\xbb\x1b\xdb\x1b\xdb\x24\x1b\x34\x3a'\
-b'\x3c\x5b\x3c\x5a\x4c\x7a\x4c\x9a\x4c\x9a\x4c\x7a\x4c\x7a\x4c\x9b'\
-b'\x4c\x9b\x4c\x7b\x4c\x7b\x54\x9b\x54\x9a\x5c\xda\x6c\xdb\x7d\x1a'\
-b'\x85\x5a\x8d\x7a\x95\x9a\xa5\xba\xad\xd9\xad\xda\xad\xd9\xad\xd9'\
-b'\xad\xda\xad\xd9\xad\xd9\xb5\xf9\xb5\xfa\xb5\xda\xb5\xf9\xb5\xfa'\
-b'\xbe\x19\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xfa\xb5\xf9\xbd\xfa\xb6\x1a'\
-b'\xb5\xf9\xad\xda\x95\x7a\x85\x3a\x9d\x9a\xb5\xfa\xa5\xb9\x9d\x7a'\
-b'\x9d\xba\xad\xfa\xbd\xfa\xbd\xf9\xbd\xfa\xb6\x19\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xbe\x1a\xbd\xf9\xb6\x19'\
-b'\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x19\xb5\xf9\xbd\xfa\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbe\x19\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x1a\xbd\xf9'\
-b'\xbd\xf9\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbe\x19\xbd\xfa\xbe\x19'\
-b'\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19\xbe\x19\xbd\xfa\xbe\x19'\
-b'\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9'\
-b'\xbe\x1a\xbe\x19\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x19'\
-b'\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xb6\x19\xbd\xf9'\
-b'\xbd\xfa\xad\xda\x85\x3a\x54\x9a\x4c\x7b\x44\x5a\x4c\x9a\x85\x5b'\
-b'\x64\xda\x3c\x3a\x44\x5a\x75\x1a\xb5\xfa\xbe\x1a\xbd\xf9\xbd\xf9'\
-b'\xbe\x19\xbd\xfa\xbe\x19\xbd\xfa\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa'\
-b'\xbe\x1a\xbe\x19\xbd\xfa\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbe\x1a\xbe\x19\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x19\xbd\xfa\xbe\x1a'\
-b'\xb5\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x19\xbd\xf9\xbd\xfa'\
-b'\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xfa'\
-b'\xbd\xf9\xbe\x1a\xb6\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xb5\xf9\xbd\xfa\xbe\x19\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xb5\xf9\xbd\xfa\xbe\x19\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x19\xbd\xfa\xb5\xfa\xbe\x19'\
-b'\xb5\xf9\xb5\xda\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xfa\xbd\xf9'\
-b'\xb5\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa'\
-b'\xad\xd9\xa5\xb9\x85\x5a\x7d\x3a\x74\xfa\x6c\xfb\x6c\xfa\x64\xdb'\
-b'\x5c\xbb\x5c\xdb\x5c\xba\x54\xba\x5c\xba\x5c\xda\x54\x9b\x3c\x5b'\
-b'\x3c\x3a\x34\x3b\x2c\x1a\x2c\x1b\x2c\x1b\x2c\x1b\x34\x1b\x34\x1a'\
-b'\x2c\x1b\x2c\x1b\x23\xfb\x13\xbb\x1b\x79\x13\x79\x1b\xdb\x2c\x1a'\
-b'\x34\x3a\x3c\x3b\x34\x1b\x2c\x1b\x23\xfb\x1b\xdb\x13\xbb\x13\xbb'\
-b'\x13\xbb\x13\xbb\x13\x7a\x1b\x79\x13\x7a\x1b\xbb\x23\xfb\x2c\x1b'\
-b'\x34\x3b\x3c\x3b\x3c\x5b\x44\x7b\x4c\x7a\x54\x9b\x4c\x7b\x4c\x7b'\
-b'\x4c\x9a\x4c\x7a\x4c\x7a\x4c\x7a\x4c\x9b\x54\x9a\x5c\xba\x6c\xfa'\
-b'\x7d\x3a\x8d\x5a\x8d\x5a\x9d\x9a\xa5\xb9\xad\xda\xad\xda\xad\xda'\
-b'\xad\xda\xad\xda\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xd9\xad\xda\xb5\xf9'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x1a\xb6\x19\xb5\xda'\
-b'\xb5\xd9\xa5\xba\xa5\xb9\xa5\xba\xbd\xfa\xb5\xf9\xad\xda\xad\xfa'\
-b'\xad\xd9\xb5\xfa\xbd\xf9\xbd\xfa\xb6\x19\xbd\xfa\xbd\xfa\xb6\x19'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbd\xf9\xbd\xf9\xb6\x1a\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x1a\xb5\xf9'\
-b'\xbd\xf9\xbe\x19\xbd\xf9\xbe\x19\xbd\xf9\xb6\x1a\xbd\xf9\xbe\x19'\
-b'\xbe\x19\xbd\xf9\xb6\x1a\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19'\
-b'\xb5\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xbe\x19\xbd\xfa\xb5\xf9\xbe\x19'\
-b'\xbd\xfa\xb5\xf9\xbd\xf9\xbe\x1a\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xb5\xf9\xbd\xf9\xbd\xfa\xb5\xfa'\
-b'\xbd\xf9\xb5\xfa\xb5\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xbe\x19\xbe\x1a'\
-b'\xbe\x1a\xbd\xf9\xbd\xf9\xbe\x1a\xb5\xf9\xbe\x1a\xb5\xf9\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xbe\x1a\xb5\xfa\xbd\xfa\xa5\xda'\
-b'\x8d\x7a\x5c\xba\x44\x5a\x54\x9a\x54\xba\x64\xdb\x8d\x7a\x85\x3a'\
-b'\x3c\x3a\x3c\x5b\x44\x5b\x4c\x7a\x95\x7a\xbd\xf9\xbd\xf9\xbd\xfa'\
-b'\xbd\xfa\xbd\xf9\xbe\x19\xbe\x1a\xbe\x19\xbe\x19\xbd\xfa\xbd\xf9'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xbe\x19\xbe\x1a\xbd\xf9\xbe\x19\xbe\x1a'\
-b'\xbd\xf9\xbe\x1a\xbe\x19\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9'\
-b'\xbe\x19\xbd\xf9\xbe\x19\xbe\x1a\xbd\xf9\xb5\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xf9\xbe\x19\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xf9'\
-b'\xb6\x19\xbd\xf9\xbd\xf9\xbd\xfa\xbe\x1a\xb5\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbe\x1a\xb5\xfa\xb5\xf9\xb5\xf9'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xda\xb5\xf9\xbd\xf9'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xb6\x19\xbd\xfa\xb5\xf9\xbd\xf9\xbe\x1a'\
-b'\xb5\xfa\xb5\xf9\xb5\xfa\xbd\xf9\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xb6\x1a\xbd\xf9\xb6\x1a\xbd\xfa\xb5\xfa'\
-b'\xa5\xba\x9d\x9a\x8d\x5a\x75\x1a\x75\x1a\x7d\x1a\x75\x1a\x6c\xfa'\
-b'\x64\xfa\x64\xda\x64\xba\x5c\xba\x5c\xbb\x64\xda\x54\x9b\x44\x5a'\
-b'\x3c\x5b\x34\x3b\x34\x3a\x2b\xfb\x23\xfb\x2c\x1b\x2c\x1b\x34\x1b'\
-b'\x2c\x1b\x2c\x1b\x23\xfb\x13\xba\x13\x7a\x13\x9a\x23\xdb\x2c\x1b'\
-b'\x34\x3b\x34\x1b\x2c\x1a\x23\xfb\x1b\xfb\x1b\xdb\x13\xbb\x13\xbb'\
-b'\x0b\x9b\x0b\x9b\x13\x7a\x1b\x78\x1b\x79\x13\x9a\x13\xdb\x23\xfb'\
-b'\x2c\x1b\x34\x1a\x3c\x3a\x3c\x3b\x44\x5a\x44\x7b\x44\x7a\x44\x7b'\
-b'\x4c\x5b\x44\x7b\x44\x7a\x4c\x7b\x4c\x7b\x4c\x7b\x54\xbb\x6c\xda'\
-b'\x7d\x1a\x85\x5a\x8d\x7a\x9d\x7a\xa5\xba\xad\xda\xa5\xda\xad\xda'\
-b'\xad\xd9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa'\
-b'\xbd\xf9\xbe\x1a\xb5\xfa\xb5\xf9\xbd\xfa\xbd\xfa\xb5\xf9\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbd\xf9\xbe\x19\xbd\xfa'\
-b'\xb5\xf9\xbe\x1a\xbd\xf9\xb5\xf9\xb5\xfa\xbe\x19\xbd\xfa\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xbe\x1a\xb5\xf9\xbd\xf9\xbe\x1a\xb5\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbe\x19\xbd\xfa\xbe\x1a\xbd\xf9\xbd\xf9'\
-b'\xbe\x19\xbd\xf9\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9'\
-b'\xbe\x1a\xbe\x19\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x19'\
-b'\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xbd\xfa\xbe\x19\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xfa\xbe\x1a\xbd\xf9'\
-b'\xbd\xfa\xbd\xfa\xbe\x19\xb5\xfa\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xf9\xb5\xf9\xb5\xfa\xbd\xf9\xad\xda\x8d\x5a\x5c\xba'\
-b'\x54\x9a\x64\xda\x64\xda\x64\xba\x6c\xda\x95\x7a\x9d\x9a\x64\xdb'\
-b'\x44\x7a\x5c\xba\x54\x9b\x4c\x9a\x6c\xda\xad\xda\xbe\x19\xbd\xfa'\
-b'\xbd\xf9\xb5\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xfa\xbd\xf9\xbd\xfa'\
-b'\xb5\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbe\x1a\xbd\xf9\xbe\x1a\xbd\xf9'\
-b'\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x19\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xf9'\
-b'\xbd\xfa\xbd\xf9\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x19\xbd\xfa\xbe\x1a'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xf9\xbd\xfa\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xb6\x19\xbd\xfa\xbd\xf9\xbd\xf9\xb5\xf9\xbd\xfa\xbd\xf9\xb6\x19'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xf9\xb5\xf9\xb5\xf9\xb5\xf9'\
-b'\xb5\xf9\xb5\xfa\xb5\xd9\xb5\xfa\xb5\xf9\xb5\xf9\xbd\xfa\xb5\xfa'\
-b'\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xb5\xf9'\
-b'\xbd\xfa\xb5\xf9\xb5\xfa\xbe\x1a\xbd\xf9\xb5\xfa\xbd\xf9\xb5\xfa'\
-b'\xb5\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xbd\xf9\xb5\xf9\xad\xda'\
-b'\x8d\x7a\x7d\x3a\x7d\x3a\x7d\x1a\x7d\x3a\x7d\x3a\x7d\x3a\x75\x1a'\
-b'\x6c\xfb\x6c\xfb\x64\xdb\x5c\xbb\x5c\xba\x5c\xbb\x54\x9a\x3c\x5a'\
-b'\x34\x3b\x2c\x1b\x2c\x1b\x2c\x1b\x2c\x1b\x2c\x1a\x2c\x1b\x2c\x1b'\
-b'\x23\xfb\x23\xfb\x23\xdb\x13\x9b\x0b\x7a\x13\xbb\x23\xdb\x2c\x1b'\
-b'\x2c\x1b\x2c\x1b\x2c\x1b\x23\xfb\x1b\xdb\x13\xbb\x13\xbb\x13\xbb'\
-b'\x13\xbb\x0b\x9b\x13\x9a\x1b\x59\x1b\x59\x13\x9a\x13\xbb\x1b\xdb'\
-b'\x24\x1b\x2c\x1a\x34\x3b\x3c\x3b\x3c\x3b\x3c\x3a\x44\x5b\x44\x5b'\
-b'\x3c\x5a\x3c\x5a\x44\x3b\x4c\x7a\x4c\x7a\x4c\x7a\x54\x9a\x64\xda'\
-b'\x6c\xfa\x75\x1a\x8d\x5a\x8d\x7a\x9d\x9a\xad\xd9\xad\xd9\xa5\xda'\
-b'\xad\xda\xb5\xda\xb5\xfa\xb5\xf9\xb5\xf9\xb5\xfa\xad\xfa\xb5\xf9'\
-b'\xbd\xf9\xbd\xfa\xbd\xf9\xb5\xf9\xbe\x19\xbd\xfa\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xbe\x1a\xbd\xfa\xb5\xf9\xbd\xfa\xb5\xf9'\
-b'\xbd\xf9\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xfa\xbe\x1a\xbd\xf9\xb5\xfa'\
-b'\xbd\xfa\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xf9\xb5\xfa\xbd\xf9\xbd\xfa'\
-b'\xb6\x19\xbd\xf9\xbd\xfa\xbd\xf9\xb6\x19\xbd\xf9\xbd\xfa\xbe\x19'\
-b'\xb5\xf9\xbd\xf9\xbe\x19\xb5\xfa\xbe\x19\xbd\xf9\xbe\x19\xb5\xfa'\
-b'\xbd\xf9\xbe\x19\xbd\xf9\xb5\xfa\xbd\xf9\xbe\x19\xb5\xf9\xbe\x1a'\
-b'\xbd\xf9\xbd\xf9\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9\xbd\xfa\xbd\xf9'\
-b'\xbe\x1a\xbd\xf9\xb6\x1a\xbd\xf9\xbe\x1a\xb5\xf9\xbd\xf9\xbe\x1a'\
-b'\xbe\x19\xbd\xf9\xbe\x1a\xbd\xfa\xbd\xfa\xbe\x1a\xbd\xf9\xb5\xfa'\
-b'\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbd\xfa\xbe\x19\xbd\xfa'\
-b'\xbe\x19\xbd\xfa\xbd\xf9\xbe\x1a\xbd\xf9\xbe\x1a\xbe\x1a\xbd\xf9'\
-b'\xb5\xfa\xbd\xfa\xb5\xf9\xbd\xf9\xb5\xf9\xb5\xf9\xb5\xf9\xbd\xfa'\
-
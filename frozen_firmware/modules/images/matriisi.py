@@ -1,6807 +0,0 @@
-# Code generated by img_cvt.py.version = "0.1"
-source = "/tmp/matriisi_plain.ppm"
-rows = 170
-cols = 320
-mode = 10
-data =\
-b'\xc4\x84\xbc\x64\xbc\x23\xb4\x23\xc4\x84\xbc\x43\xab\xe3\xb3\xe3'\
-b'\xbc\x64\xc4\xa4\xbc\x44\xb4\x23\xbc\x43\xbc\x84\xbc\x84\xc4\x84'\
-b'\xc4\xa4\xc4\xa4\xbc\x64\xbc\x43\xbc\x64\xbc\x44\xb4\x23\xbc\x23'\
-b'\xbc\x64\xc4\xa4\xbc\x43\xb3\xe3\xb4\x03\xbc\x84\xc4\xc5\xc4\x84'\
-b'\xbc\x64\xbc\x64\xc4\x84\xc4\xa4\xc4\xa4\xbc\x84\xbc\x64\xbc\x23'\
-b'\xbc\x44\xbc\x84\xbc\x43\xb4\x03\xb4\x23\xc4\x84\xc4\xc5\xbc\x64'\
-b'\xb4\x23\xb4\x23\xbc\x64\xcc\xe5\xc4\xe5\xc4\xa4\xbc\x64\xbc\x64'\
-b'\xbc\x84\xc4\xa4\xbc\x64\xbc\x44\xbc\x43\xbc\x64\xc4\xa4\xbc\x64'\
-b'\xb4\x23\xbc\x23\xbc\x84\xcc\xe5\xc4\xc5\xbc\x64\xbc\x43\xbc\x64'\
-b'\xc4\xc5\xcd\x05\xc4\xa4\xbc\x64\xb4\x23\xbc\x43\xc4\xa5\xbc\x84'\
-b'\xbc\x64\xbc\x64\xbc\x44\xc4\xa4\xc4\xa4\xbc\x44\xbc\x43\xbc\x84'\
-b'\xc4\xc5\xcd\x26\xc4\xc5\xbc\x64\xbc\x44\xbc\x64\xc4\xe5\xcc\xe5'\
-b'\xbc\x64\xbc\x43\xb4\x23\xbc\x84\xc4\x84\xbc\x64\xc4\x84\xc4\xa4'\
-b'\xbc\x84\xc4\xc5\xc4\xa4\xbc\x44\xbc\x64\xc4\xc5\xcd\x05\xcd\x06'\
-b'\xc4\xa4\xb4\x23\xb4\x23\xbc\x64\xc4\xa5\xc4\xc5\xc4\xc5\xbc\x64'\
-b'\xbc\x43\xbc\x84\xc4\x84\xbc\x44\xc4\xa4\xcd\x06\xc4\xe5\xcd\x05'\
-b'\xc4\xc5\xbc\x44\xbc\x43\xc4\xc5\xcd\x05\xc4\xc5\xc4\xa5\xbc\x43'\
-b'\xb4\x03\xbc\x64\xc4\x84\xc4\xa5\xcc\xe5\xc4\xe5\xc4\xa4\xc4\x84'\
-b'\xc4\xa5\xbc\x44\xc4\xa4\xcd\x26\xcd\x26\xcd\x05\xc4\xe5\xbc\x44'\
-b'\xb4\x03\xc4\x84\xc4\xc5\xcc\xe5\xcc\xe5\xc4\xc5\xbc\x64\xbc\x64'\
-b'\xbc\x84\xc4\x84\xcd\x06\xcd\x26\xcd\x26\xcc\xe5\xc4\xe5\xbc\x64'\
-b'\xbc\x64\xcd\x05\xcd\x06\xcc\xe5\xc4\xe5\xc4\xa4\xb4\x23\xbc\x44'\
-b'\xc4\xa4\xc4\xe5\xcc\xe6\xcd\x05\xcd\x05\xc4\xa5\xbc\x84\xbc\x64'\
-b'\xcc\xe5\xcd\x46\xd5\x46\xcd\x26\xcd\x06\xc4\xc5\xb4\x23\xbc\x64'\
-b'\xc4\xc5\xc4\xe5\xcc\xe5\xcc\xe5\xc4\xe5\xbc\x64\xbc\x44\xc4\xa5'\
-b'\xcd\x06\xcd\x26\xcd\x26\xcd\x26\xcd\x06\xc4\xc5\xbc\x64\xcd\x05'\
-b'\xcd\x06\xcc\xe6\xcc\xe5\xc4\xe5\xc4\xc5\xbc\x23\xbc\x84\xcc\xe5'\
-b'\xc4\xe5\xcc\xe5\xcc\xe5\xcd\x06\xc4\xe5\xbc\x44\xc4\xc5\xcd\x06'\
-b'\xcd\x26\xd5\x26\xcd\x26\xcd\x06\xc4\xc5\xb4\x23\xc4\xc5\xc4\xc5'\
-b'\xc4\xc5\xc4\xc5\xc4\xc5\xcc\xe5\xc4\xa4\xb4\x23\xc4\xc5\xcc\xe6'\
-b'\xcd\x06\xcd\x06\xcd\x06\xcd\x06\xc4\xa4\xbc\x64\xcd\x06\xcd\x05'\
-b'\xc4\xe5\xcc\xc5\xc4\xc5\xc4\xc5\xbc\x23\xbc\x44\xc4\xc5\xc4\xe5'\
-b'\xcc\xc5\xc4\xe5\xc4\xe5\xcc\xc5\xbc\x43\xc4\xa5\xcd\x06\xcd\x06'\
-b'\xcd\x26\xcd\x06\xcd\x05\xc4\xe5\xb4\x03\xbc\x64\xc4\xc5\xc4\xa4'\
-b'\xc4\xa5\xc4\xa5\xc4\xc5\xc4\xa4\xb4\x03\xbc\x64\xc4\xc5\xc4\xc5'\
-b'\xcc\xe5\xc4\xe5\xcc\xe5\xc4\x84\xb4\x23\xbc\x84\xcc\xe5\xc4\xc5'\
-b'\xc4\xc5\xc4\xc5\xc4\xa4\xbc\x64\xab\xc2\xbc\x23\xc4\x84\xc4\xa5'\
-b'\xc4\xc5\xc4\xc5\xc4\xa4\xbc\x44\xb4\x23\xbc\x43\xc4\xc5\xcc\xe5'\
-b'\xcc\xe5\xc4\xe5\xc4\xc5\xbc\x43\xb3\xe3\xbc\x44\xbc\x64\xc4\x84'\
-b'\xc4\x84\xc4\x84\xbc\x84\xbc\x44\xb3\xe2\xb4\x03\xbc\x84\xc4\xa4'\
-b'\xbc\x64\xbc\xa4\xbc\x43\xb4\x03\xb4\x23\xbc\x84\xbc\x64\xbc\x43'\
-b'\xbc\x63\xbc\x84\xbc\x84\xbc\x43\xbc\x64\xbc\x84\xbc\x64\xb4\x23'\
-b'\xb4\x23\xbc\x64\xbc\x84\xb4\x23\xb4\x03\xb4\x23\xbc\x84\xbc\x84'\
-b'\xbc\x43\xb4\x43\xb4\x43\xbc\x84\xbc\x64\xbc\x64\xbc\x84\xbc\x43'\
-b'\xbc\x43\xbc\x44\xbc\xa4\xbc\x84\xb4\x23\xb4\x23\xbc\x43\xbc\xa4'\
-b'\xbc\x84\xbc\x43\xb4\x23\xb4\x43\xc4\x84\xbc\xa4\xbc\x64\xbc\x43'\
-b'\xbc\x43\xbc\x64\xc4\xa4\xc4\xa4\xbc\x64\xb4\x43\xbc\x43\xbc\x64'\
-b'\xc4\xc5\xbc\x84\xbc\x23\xb4\x23\xb4\x43\xc4\xa4\xc4\xa4\xbc\x43'\
-b'\xbc\x43\xb4\x43\xbc\x84\xc4\xc5\xbc\x84\xbc\x43\xbc\x43\xbc\x63'\
-b'\xc4\xa4\xc4\xc5\xbc\x64\xbc\x43\xbc\x43\xbc\x64\xc4\xc4\xbc\x84'\
-b'\xbc\x43\xbc\x63\xbc\x63\xbc\xa4\xc4\xc5\xbc\x64\xb4\x43\xbc\x43'\
-b'\xbc\x84\xc4\xc5\xc4\xc4\xbc\x63\xbc\x43\xbc\x43\xbc\x84\xc4\xc5'\
-b'\xbc\x84\xbc\x64\xbc\x63\xbc\x64\xc4\xa4\xc4\xa4\xb4\x44\xbc\x43'\
-b'\xbc\x64\xc4\xa4\xc4\xc5\xc4\xa4\xbc\x43\xb4\x43\xbc\x43\xc4\xa4'\
-b'\xc4\xc5\xc4\xc4\xc4\x84\xbc\x64\xbc\x63\xc4\xa4\xbc\x84\xbc\x63'\
-b'\xbc\x84\xc4\xa4\xbc\xa4\xc4\xc5\xbc\xa4\xb4\x23\xbc\x43\xbc\x84'\
-b'\xc4\xe5\xc4\xc4\xc4\xc5\xbc\x84\xb4\x23\xbc\x64\xc4\xc4\xbc\x84'\
-b'\xc4\xc4\xc4\xe5\xc4\xa4\xbc\x84\xbc\xa4\xbc\x64\xbc\x43\xbc\xa4'\
-b'\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xa4\xb4\x43\xbc\x43\xc4\xa5\xc4\xc5'\
-b'\xc4\xe5\xcd\x05\xc4\xe5\xbc\x64\xbc\x64\xbc\xa4\xbc\x84\xc4\xc5'\
-b'\xcd\x05\xcd\x05\xc4\xc5\xc4\xa4\xbc\x84\xb4\x43\xc4\xa4\xc4\xe5'\
-b'\xcd\x05\xcd\x05\xc4\xe5\xbc\x84\xb4\x23\xc4\x84\xc4\xa4\xc4\xe5'\
-b'\xcc\xe5\xcd\x05\xc4\xe5\xbc\x84\xbc\x84\xbc\x64\xc4\xa4\xcd\x05'\
-b'\xcd\x05\xc4\xe5\xc4\xe5\xc4\xa5\xbc\x43\xbc\x64\xc4\xc5\xcc\xe5'\
-b'\xcd\x05\xcc\xe5\xc4\xe5\xc4\xa4\xbc\x44\xbc\x84\xc4\xe4\xcd\x05'\
-b'\xc5\x05\xcc\xe5\xc4\xe5\xc4\xc5\xbc\x63\xbc\x64\xc4\xe5\xcc\xe5'\
-b'\xc5\x05\xc4\xe5\xcc\xe5\xc4\xe5\xbc\x43\xbc\x84\xc4\xe5\xcc\xe5'\
-b'\xc4\xe5\xc4\xe5\xcd\x05\xc4\xe5\xbc\x44\xbc\x64\xc4\xe5\xcc\xe5'\
-b'\xcc\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xbc\x43\xbc\x64\xcc\xe5\xc4\xe5'\
-b'\xc4\xe5\xcc\xe5\xc4\xe5\xc4\xe5\xbc\x43\xbc\x44\xc4\xe5\xcc\xe5'\
-b'\xc5\x05\xc4\xe5\xc4\xe5\xc4\xe5\xbc\x64\xb4\x23\xc4\xe5\xc4\xe5'\
-b'\xcc\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xbc\x84\xb4\x03\xc4\xe5\xc4\xe5'\
-b'\xc4\xc5\xc4\xc5\xc4\xe5\xc4\xe5\xbc\xa4\xb4\x03\xc4\xc4\xc4\xc4'\
-b'\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xa4\xb4\x03\xc4\xa4\xc4\xe5'\
-b'\xc4\xc4\xc4\xc4\xc4\xc5\xc4\xc5\xc4\xa4\xb4\x03\xbc\x43\xc4\xc4'\
-b'\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5\xbc\x84\xb4\x03\xb4\x43\xc4\x84'\
-b'\xc4\xc5\xc4\xc4\xc4\xc5\xc4\xc5\xc4\x84\xb4\x23\xab\xe3\xbc\x84'\
-b'\xc4\xa4\xc4\xc4\xc4\xc5\xc4\xa4\xbc\x84\xb4\x43\xb4\x23\xb4\x23'\
-b'\xc4\xa4\xc4\xc5\xc4\xc5\xc4\xc4\xbc\xa4\xb4\x43\xb3\xe2\xb4\x43'\
-b'\xbc\x84\xbc\xa4\xc4\xc5\xc4\xa4\xbc\x84\xbc\x64\xbc\x43\xab\xe2'\
-b'\xbc\x84\xc4\x84\xbc\x84\xbc\x64\xbc\x84\xbc\xa4\xbc\x84\xbc\x43'\
-b'\xb4\x23\xbc\x64\xbc\xa4\xbc\x43\xb4\x03\xb4\x23\xbc\x63\xc4\xa4'\
-b'\xbc\x43\xb4\x43\xbc\x43\xbc\x84\xc4\xa4\xbc\x64\xbc\x84\xbc\x83'\
-b'\xbc\x64\xbc\x43\xbc\x64\xc4\xa4\xbc\x84\xbc\x23\xb4\x22\xb4\x43'\
-b'\xbc\xa4\xbc\x84\xb4\x23\xb4\x23\xbc\x43\xbc\x84\xc4\xa4\xbc\x64'\
-b'\xbc\x63\xbc\x64\xbc\x64\xbc\xa4\xc4\xa4\xbc\xa4\xbc\x63\xbc\x43'\
-b'\xb4\x44\xc4\xa4\xc4\xa4\xb4\x43\xb4\x23\xb4\x43\xbc\x64\xc4\xa4'\
-b'\xbc\x84\xbc\x43\xbc\x43\xbc\x63\xbc\xa4\xc4\xc5\xbc\x84\xbc\x64'\
-b'\xbc\x64\xbc\x64\xc4\xa4\xc4\xc5\xbc\x84\xbc\x63\xb4\x43\xbc\x44'\
-b'\xbc\xa4\xc4\xa4\xbc\x64\xb4\x43\xbc\x64\xbc\x64\xc4\xc4\xbc\xa4'\
-b'\xbc\x44\xbc\x43\xbc\x64\xc4\xa4\xc4\xe5\xc4\xa4\xbc\x64\xbc\x43'\
-b'\xbc\x43\xbc\xa4\xc4\xc5\xbc\x84\xbc\x64\xbc\x64\xbc\x63\xc4\xa4'\
-b'\xc4\xa4\xbc\x43\xbc\x43\xbc\x64\xbc\xa4\xc4\xc5\xc4\xc5\xbc\x64'\
-b'\xb4\x43\xb4\x43\xbc\xa4\xc4\xe5\xc4\xc5\xc4\xa4\xbc\x84\xbc\x64'\
-b'\xbc\x64\xc4\xc4\xbc\x64\xbc\x84\xbc\xa4\xc4\xa4\xc4\xa4\xc4\xc5'\
-b'\xbc\x84\xb4\x23\xbc\x43\xc4\xa4\xc4\xe5\xc4\xe5\xc4\xe5\xc4\x84'\
-b'\xbc\x43\xbc\x43\xc4\xc4\xc4\xa4\xc4\xc5\xc4\xc5\xc4\xa4\xbc\x84'\
-b'\xbc\x84\xbc\x84\xbc\x43\xbc\x64\xc4\xc5\xc4\xe5\xc4\xc5\xc4\xc5'\
-b'\xbc\x84\xb4\x23\xbc\x63\xc4\xe5\xc4\xe5\xcd\x05\xcc\xe5\xc4\xc4'\
-b'\xbc\x63\xbc\x84\xbc\xa4\xbc\x84\xc4\xc5\xcd\x05\xcc\xe5\xc4\xc4'\
-b'\xbc\xa4\xbc\x84\xb4\x23\xbc\x84\xcc\xe5\xcd\x05\xcd\x05\xc4\xe5'\
-b'\xc4\xc5\xbc\x43\xbc\x64\xc4\xa4\xc4\xc5\xcd\x05\xcd\x05\xc4\xe5'\
-b'\xc4\xc5\xbc\x84\xbc\x84\xbc\x64\xc4\xc5\xcd\x05\xcd\x05\xc4\xe5'\
-b'\xc4\xe5\xc4\xc5\xbc\x43\xbc\x64\xc4\xe5\xc4\xe5\xcd\x05\xc5\x05'\
-b'\xcd\x05\xc4\xc5\xbc\x63\xbc\x84\xc4\xa4\xc4\xe5\xcd\x05\xcd\x05'\
-b'\xcc\xe5\xc4\xe5\xc4\xa4\xbc\x43\xc4\xa4\xc5\x05\xcc\xe5\xcc\xe5'\
-b'\xc5\x05\xcd\x05\xc4\xc5\xb4\x43\xc4\xa4\xc4\xe5\xcc\xe5\xcd\x05'\
-b'\xcc\xe5\xc4\xe5\xc4\xe5\xbc\x64\xbc\x63\xc4\xe5\xcc\xe5\xc5\x05'\
-b'\xc5\x05\xcc\xe5\xcc\xe5\xc4\xa4\xb4\x23\xc4\xc4\xc4\xe5\xcc\xe5'\
-b'\xc4\xe5\xcc\xe5\xc4\xe5\xc4\xc5\xb4\x03\xbc\xa4\xc4\xe5\xcc\xe5'\
-b'\xc4\xe5\xcc\xe5\xcc\xe5\xc4\xe5\xbc\x63\xb4\x23\xcc\xe5\xc4\xe5'\
-b'\xc4\xe5\xcc\xe5\xc4\xe5\xc4\xe5\xc4\xa4\xb4\x02\xc4\xa4\xc4\xc5'\
-b'\xcc\xe4\xc4\xe5\xcc\xe5\xc4\xe5\xc4\xc4\xbc\x23\xbc\x44\xc4\xe5'\
-b'\xc4\xe5\xcc\xc5\xc4\xc5\xc4\xe5\xc4\xe5\xc4\x84\xb4\x03\xbc\xa4'\
-b'\xc4\xc5\xc4\xc5\xc4\xe5\xc4\xc4\xc4\xc5\xc4\xa4\xb4\x23\xb4\x23'\
-b'\xc4\xc4\xc4\xc4\xc4\xc4\xc4\xc5\xc4\xc4\xc4\xc4\xbc\x43\xb4\x03'\
-b'\xbc\x64\xc4\xc4\xc4\xc5\xc4\xc4\xc4\xc4\xc4\xa4\xbc\x84\xb4\x03'\
-b'\xb4\x23\xbc\x84\xc4\xc4\xc4\xc5\xc4\xc5\xc4\xc5\xc4\x84\xb4\x43'\
-b'\xb4\x23\xb4\x23\xc4\xa4\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xa4\xbc\x84'\
-b'\xb3\xe3\xb4\x43\xbc\x64\xc4\x84\xc4\xc4\xc4\xc5\xc4\xa4\xbc\x84'\
-b'\xbc\x43\xbc\x84\xc4\xa4\xb4\x23\xb4\x03\xb4\x23\xbc\x84\xc4\x84'\
-b'\xbc\x43\xb4\x43\xbc\x64\xbc\x84\xc4\xa4\xbc\x84\xbc\x84\xc4\xa4'\
-b'\xbc\x84\xbc\x64\xbc\x64\xbc\x84\xc4\xa4\xbc\x43\xb4\x03\xb4\x23'\
-b'\xbc\x64\xc4\xa4\xb4\x43\xb4\x23\xb4\x23\xbc\x64\xc4\xa4\xbc\x84'\
-b'\xbc\x64\xbc\x63\xbc\x64\xc4\x84\xc4\xa4\xc4\xa4\xc4\xa4\xbc\x64'\
-b'\xb4\x43\xbc\x43\xbc\x84\xc4\xa4\xbc\x63\xb4\x23\xb4\x23\xbc\x44'\
-b'\xc4\xc4\xbc\x84\xbc\x43\xbc\x63\xbc\x64\xc4\x84\xc4\xc5\xc4\xc4'\
-b'\xbc\x84\xbc\x64\xbc\x63\xbc\x84\xc4\xc5\xc4\xc4\xbc\x64\xbc\x43'\
-b'\xb4\x43\xb4\x43\xc4\xa4\xbc\x84\xbc\x43\xbc\x63\xbc\x64\xbc\x84'\
-b'\xc4\xe5\xc4\xa4\xbc\x63\xbc\x64\xbc\x63\xc4\xa4\xcc\xe5\xc4\xc5'\
-b'\xbc\x84\xbc\x63\xb4\x43\xbc\x64\xc4\xc4\xbc\xa4\xbc\x64\xbc\x64'\
-b'\xbc\x63\xbc\x64\xc4\xa4\xbc\x84\xb4\x43\xbc\x63\xbc\x84\xc4\xc5'\
-b'\xc4\xe5\xc4\xe5\xbc\x84\xbc\x43\xbc\x43\xbc\xa4\xc4\xe5\xc4\xc4'\
-b'\xc4\xc4\xc4\x84\xbc\x64\xbc\x43\xc4\xa4\xbc\x64\xbc\x43\xbc\xa4'\
-b'\xc4\xa4\xc4\xc4\xc4\xc5\xc4\xc4\xbc\x43\xb4\x23\xbc\x64\xc4\xc5'\
-b'\xcc\xe5\xcd\x05\xc4\xe5\xbc\x64\xbc\x43\xbc\x43\xc4\xc5\xbc\xa4'\
-b'\xc4\xa4\xc4\xc5\xc4\xc5\xbc\x84\xbc\x84\xc4\xa4\xb4\x23\xbc\x63'\
-b'\xc4\xc5\xcc\xe5\xc4\xe5\xcd\x05\xc4\xc4\xbc\x43\xb4\x43\xc4\xc4'\
-b'\xcc\xe5\xcc\xe5\xcd\x05\xcd\x05\xc4\xa4\xb4\x44\xbc\x84\xbc\x84'\
-b'\xbc\x84\xc4\xc5\xcd\x05\xcd\x05\xc4\xc5\xc4\xc4\xbc\x84\xb4\x23'\
-b'\xc4\x84\xcc\xe5\xcd\x05\xcd\x25\xcd\x06\xc4\xe5\xbc\x64\xbc\x43'\
-b'\xc4\xa4\xc4\xc5\xc4\xe5\xcd\x05\xcd\x05\xc4\xe5\xbc\xa4\xbc\x84'\
-b'\xbc\x64\xbc\x84\xc4\xe5\xcd\x05\xcd\x05\xcd\x05\xc4\xe5\xc4\xc5'\
-b'\xb4\x23\xbc\x64\xc4\xe5\xcd\x05\xcd\x05\xcd\x05\xcd\x05\xc4\xe5'\
-b'\xbc\x64\xbc\x64\xbc\xa4\xc4\xe5\xcc\xe5\xcd\x06\xc5\x05\xcd\x05'\
-b'\xc4\xc5\xbc\x64\xbc\x64\xc4\xe5\xcd\x05\xcd\x06\xc5\x05\xcd\x05'\
-b'\xcd\x06\xc4\xc5\xb4\x23\xc4\xc5\xcd\x05\xc4\xe5\xc4\xe5\xcd\x06'\
-b'\xc5\x05\xcc\xe5\xbc\x84\xb4\x43\xcc\xe5\xcc\xe5\xc5\x05\xcc\xe5'\
-b'\xcd\x05\xc5\x05\xc4\xe5\xb4\x23\xbc\x84\xcd\x05\xcc\xe5\xc4\xe5'\
-b'\xcd\x05\xcc\xe5\xc4\xe5\xc4\xc4\xb4\x02\xc4\xe5\xcc\xe5\xcc\xe5'\
-b'\xc4\xe5\xc4\xe5\xcd\x05\xcc\xe5\xbc\x64\xb4\x23\xcc\xe5\xcc\xe5'\
-b'\xc4\xe5\xcc\xe5\xcc\xe5\xc4\xe5\xc4\xe5\xb4\x03\xbc\x84\xcc\xe5'\
-b'\xc4\xe5\xc4\xe5\xcc\xe5\xc4\xe5\xc4\xe5\xc4\xa4\xb4\x03\xc4\xa4'\
-b'\xc4\xe5\xc4\xe5\xcc\xe5\xcc\xe5\xc4\xe5\xc4\xe4\xbc\x63\xb4\x03'\
-b'\xc4\xc4\xc4\xe5\xcc\xe5\xc4\xe5\xc4\xe4\xc4\xc5\xc4\xc4\xbc\x43'\
-b'\xb4\x03\xc4\xa4\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5\xbc\x84'\
-b'\xb4\x03\xbc\x43\xbc\xa4\xc4\xc5\xc4\xc5\xc4\xc4\xc4\xc4\xc4\xc4'\
-b'\xbc\x64\xab\xe2\xb4\x23\xc4\xa4\xc4\xc4\xc4\xc4\xc4\xc4\xc4\xc5'\
-b'\xc4\x84\xb4\x23\xb4\x43\xb4\x23\xc4\x84\xc4\xc5\xc4\xc5\xc4\xc4'\
-b'\xc4\xc4\xc4\xa4\xb4\x23\xab\xe3\xbc\x84\xc4\xa4\xc4\xc5\xc4\xc5'\
-b'\xbc\x64\xbc\x84\xc4\xa4\xc4\xc5\xc4\xa4\xc4\xa4\xc4\xc4\xc4\xa4'\
-b'\xbc\x64\xbc\x63\xbc\x63\xbc\x84\xbc\x84\xb4\x23\xb4\x03\xb4\x03'\
-b'\xbc\x64\xc4\xa4\xb4\x43\xb4\x23\xbc\x43\xbc\x84\xc4\xc4\xbc\xa4'\
-b'\xc4\x84\xbc\x84\xc4\x84\xbc\x84\xc4\x84\xc4\xa4\xc4\xc4\xbc\x84'\
-b'\xbc\x43\xbc\x23\xbc\x43\xbc\xa4\xbc\x84\xb4\x23\xb4\x23\xb4\x23'\
-b'\xbc\x84\xc4\xc5\xbc\x84\xbc\x63\xbc\x64\xbc\x84\xc4\xa4\xc4\xe5'\
-b'\xc4\xc5\xc4\xa4\xbc\x84\xbc\x64\xbc\x63\xbc\xa4\xc4\xc5\xbc\x84'\
-b'\xbc\x63\xbc\x43\xb4\x23\xbc\x84\xc4\xa4\xbc\x43\xbc\x43\xbc\x64'\
-b'\xbc\x84\xc4\xc4\xc4\xe5\xc4\xa4\xbc\x84\xbc\x64\xbc\x84\xc4\xa4'\
-b'\xcd\x05\xc4\xc5\xbc\x84\xbc\x64\xb4\x43\xb4\x43\xc4\xa4\xbc\x84'\
-b'\xbc\x63\xbc\x64\xbc\x64\xbc\x64\xc4\xc4\xc4\xa4\xbc\x43\xb4\x43'\
-b'\xbc\x84\xc4\xa4\xcd\x05\xcd\x05\xc4\xc5\xbc\x84\xbc\x43\xbc\x43'\
-b'\xc4\xa4\xc4\xe5\xc4\xa4\xc4\xa4\xbc\xa4\xbc\x64\xbc\x64\xc4\xa4'\
-b'\xbc\x64\xb4\x43\xbc\x84\xc4\xa4\xc4\xe5\xc4\xe5\xc4\xe5\xbc\x84'\
-b'\xb4\x43\xbc\x43\xc4\xa5\xc5\x05\xcd\x05\xcd\x05\xc4\xc5\xbc\x63'\
-b'\xb4\x43\xbc\x84\xc4\xa4\xbc\x84\xc4\xa4\xc4\xe5\xc4\xc5\xc4\xa4'\
-b'\xc4\xc4\xbc\x84\xb4\x23\xbc\x43\xc4\xc5\xcd\x05\xcd\x05\xcd\x26'\
-b'\xc4\xe5\xbc\x63\xb4\x43\xbc\x84\xc4\xe5\xc4\xe5\xcd\x05\xcd\x05'\
-b'\xc4\xc5\xbc\x84\xbc\x64\xbc\xa4\xbc\x44\xbc\x84\xc4\xe5\xcd\x05'\
-b'\xcd\x05\xcc\xe5\xc4\xe5\xbc\x64\xb4\x23\xc4\xa4\xcd\x05\xcd\x06'\
-b'\xcd\x26\xcd\x26\xc5\x05\xbc\x84\xbc\x43\xbc\xa4\xbc\xa4\xc4\xc5'\
-b'\xcd\x05\xc5\x05\xcd\x05\xc4\xe5\xc4\xa5\xbc\x84\xb4\x43\xc4\xa5'\
-b'\xcd\x05\xcd\x05\xcd\x05\xcd\x26\xcd\x05\xc4\xa4\xb4\x23\xbc\xa4'\
-b'\xcc\xe5\xcd\x05\xcd\x05\xcd\x06\xc5\x05\xc4\xe5\xbc\x84\xbc\x64'\
-b'\xbc\x84\xc4\xe5\xcd\x05\xcd\x05\xcd\x06\xc5\x05\xcd\x05\xc4\xc5'\
-b'\xb4\x23\xc4\xa4\xc5\x05\xcd\x05\xcd\x06\xcd\x05\xcd\x06\xc5\x05'\
-b'\xbc\xa4\xbc\x43\xc4\xc5\xcd\x05\xcc\xe5\xcd\x06\xcd\x05\xc5\x05'\
-b'\xcc\xe5\xbc\x84\xb4\x23\xcc\xe5\xcd\x05\xc4\xe5\xcd\x05\xcd\x06'\
-b'\xcd\x05\xcd\x05\xbc\x84\xb4\x23\xcd\x05\xcd\x05\xc5\x05\xcd\x05'\
-b'\xc5\x05\xcd\x05\xcc\xe5\xbc\x64\xb4\x23\xcc\xe5\xc4\xe5\xc5\x05'\
-b'\xcd\x05\xcc\xe5\xc5\x05\xc4\xe5\xbc\x63\xb4\x23\xcd\x05\xc5\x05'\
-b'\xc4\xe5\xcd\x05\xcd\x05\xcd\x05\xc4\xe5\xbc\x64\xbc\x23\xc4\xe5'\
-b'\xcc\xe5\xc4\xe5\xc4\xe5\xcc\xe5\xc4\xe5\xc4\xe5\xbc\x63\xb4\x43'\
-b'\xcc\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xcc\xe5\xcc\xe5\xc4\xe5\xbc\x64'\
-b'\xb4\x23\xc4\xe5\xcc\xe5\xc4\xe5\xcc\xe5\xc4\xe5\xc4\xe5\xc4\xe5'\
-b'\xbc\x44\xb4\x23\xbc\xa4\xc4\xe4\xc4\xc5\xc4\xc4\xc4\xc4\xc4\xe5'\
-b'\xc4\xc4\xb4\x23\xb4\x03\xbc\x84\xc4\xc4\xc4\xc5\xc4\xc5\xc4\xc5'\
-b'\xc4\xc5\xc4\xa4\xbc\x64\xb3\xe2\xb4\x43\xc4\xc5\xc4\xc5\xc4\xc4'\
-b'\xc4\xc5\xc4\xc5\xc4\xa4\xb4\x23\xb4\x23\xbc\x43\xbc\xa4\xc4\xc5'\
-b'\xc4\xc5\xc4\xe5\xc4\xc5\xc4\xc4\xbc\x64\xab\xc2\xb4\x23\xc4\xa4'\
-b'\xbc\x43\xb4\x43\xbc\x84\xc4\xa4\xb4\x43\xb4\x03\xb4\x03\xb4\x64'\
-b'\xc4\xa4\xbc\x64\xbc\x64\xbc\x84\xc4\x84\xc4\xc4\xc4\xc4\xc4\xc4'\
-b'\xc4\xc4\xc4\xa4\xbc\x84\xbc\x64\xbc\x63\xc4\xa4\xc4\xc5\xbc\x64'\
-b'\xb4\x23\xb4\x23\xb4\x23\xbc\xa4\xbc\x84\xb4\x23\xb4\x43\xbc\x64'\
-b'\xbc\x84\xc4\xc5\xc4\xc4\xc4\xa4\xbc\x84\xc4\xa4\xc4\xa4\xc4\xc4'\
-b'\xc4\xc5\xcc\xe5\xc4\xa4\xbc\x64\xbc\x43\xbc\x43\xbc\x84\xc4\xa4'\
-b'\xbc\x43\xb4\x43\xbc\x43\xbc\x63\xbc\xa4\xc4\xa5\xbc\x63\xbc\x63'\
-b'\xbc\x84\xc4\xa4\xc4\xe5\xcd\x05\xc4\xe5\xc4\xa4\xbc\x84\xbc\x84'\
-b'\xbc\x84\xc4\xc5\xcc\xe5\xbc\xa4\xbc\x64\xbc\x43\xb4\x43\xbc\x64'\
-b'\xc4\xa4\xb4\x43\xbc\x43\xbc\x64\xc4\x84\xc4\xc5\xcd\x05\xc4\xc5'\
-b'\xbc\x84\xbc\x63\xbc\x84\xc4\xa4\xcd\x05\xcd\x26\xc4\xe5\xc4\xa4'\
-b'\xbc\x64\xb4\x43\xbc\x64\xc4\xc5\xbc\x84\xbc\x84\xbc\x84\xc4\xa4'\
-b'\xbc\x84\xbc\xa4\xc4\xa5\xb4\x43\xbc\x43\xbc\x84\xc4\xe5\xcd\x25'\
-b'\xcd\x26\xcd\x05\xc4\xa4\xbc\x64\xbc\x43\xbc\xa4\xcc\xe5\xc4\xe5'\
-b'\xcc\xe5\xc4\xe5\xc4\xa4\xbc\x44\xbc\x64\xbc\xa4\xb4\x43\xbc\x64'\
-b'\xc4\xa4\xc4\xe5\xcd\x05\xc4\xe5\xc4\xe5\xbc\x64\xbc\x43\xbc\x64'\
-b'\xc4\xe5\xcd\x25\xcd\x26\xcd\x26\xc4\xe5\xbc\x84\xb4\x43\xbc\x64'\
-b'\xc4\xa4\xc4\xa4\xc4\xc5\xcc\xe5\xcc\xe5\xc4\xc5\xbc\x84\xc4\xa4'\
-b'\xb4\x43\xbc\x63\xc4\xc5\xcd\x05\xcd\x26\xd5\x46\xcd\x25\xc4\xe5'\
-b'\xbc\x64\xb4\x43\xc4\xc5\xcd\x05\xcd\x05\xcd\x26\xcd\x05\xc5\x05'\
-b'\xc4\xa4\xbc\x64\xbc\x84\xbc\x64\xc4\xa4\xcc\xe5\xcd\x06\xcd\x05'\
-b'\xcd\x06\xc4\xe5\xc4\xc5\xb4\x23\xbc\x64\xcd\x05\xcd\x26\xcd\x26'\
-b'\xcd\x26\xcd\x26\xcd\x05\xbc\xa4\xb4\x43\xc4\xa5\xc4\xc5\xcd\x05'\
-b'\xcd\x06\xc5\x05\xcd\x05\xc5\x05\xc4\xc5\xbc\x84\xbc\x43\xc4\xc5'\
-b'\xcd\x05\xcd\x06\xcd\x05\xcd\x26\xcd\x26\xcd\x05\xbc\x64\xbc\x64'\
-b'\xc5\x05\xcd\x26\xcd\x26\xcd\x26\xcd\x05\xc5\x06\xcd\x05\xbc\x84'\
-b'\xbc\x64\xc4\xc5\xcd\x05\xc5\x05\xc5\x05\xcd\x05\xc5\x06\xcd\x05'\
-b'\xc4\xc5\xb4\x23\xc4\xe5\xcd\x06\xcd\x06\xcd\x26\xcd\x06\xcd\x05'\
-b'\xcd\x06\xc4\xe5\xb4\x03\xc4\xc5\xcd\x05\xc4\xe6\xcd\x06\xcd\x05'\
-b'\xc4\xe5\xc4\xe5\xcc\xe5\xb4\x23\xbc\x84\xcd\x05\xc4\xe5\xcd\x05'\
-b'\xcd\x06\xcd\x05\xcd\x05\xcd\x05\xbc\x64\xb4\x43\xcd\x05\xcd\x06'\
-b'\xcd\x05\xcd\x06\xc4\xe5\xc4\xe5\xcd\x05\xc4\xa4\xac\x03\xc4\xe5'\
-b'\xc4\xe5\xcc\xe5\xcd\x05\xcc\xe5\xcc\xe5\xc4\xe5\xc4\xc5\xb4\x03'\
-b'\xc4\xa4\xcc\xe5\xcc\xe5\xcd\x05\xcd\x05\xc5\x05\xcc\xe5\xc4\xe5'\
-b'\xbc\x43\xb4\x23\xc4\xe5\xcc\xe4\xc4\xe5\xcc\xe5\xcc\xe5\xc4\xe5'\
-b'\xc4\xe4\xbc\x63\xb4\x03\xc4\x84\xc4\xc5\xc4\xe5\xcc\xe5\xc4\xe5'\
-b'\xc4\xe5\xc4\xc5\xc4\xa4\xab\xe2\xbc\x43\xc4\xc5\xc4\xe5\xc4\xe4'\
-b'\xc4\xe5\xc4\xe5\xc4\xc5\xbc\x84\xbc\x43\xb4\x23\xbc\x64\xc4\xc4'\
-b'\xc4\xc4\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc4\xb4\x23\xb3\xe2\xbc\x64'\
-b'\xc4\xa4\xc4\xc5\xc4\xe5\xcc\xe5\xc4\xe5\xc4\xc5\xc4\xa4\xbc\x64'\
-b'\xc4\xc5\xc4\xa5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc4\xc4\xc4\xc4\xc5'\
-b'\xc4\xc4\xbc\x84\xb4\x43\xb4\x23\xbc\x43\xc4\xa4\xbc\x64\xb4\x23'\
-b'\xb4\x23\xb4\x23\xbc\x84\xc4\xc4\xbc\x64\xbc\x63\xbc\x64\xc4\xa4'\
-b'\xc4\xc4\xc4\xe5\xcc\xe4\xc4\xe5\xc4\xc4\xc4\x84\xbc\x84\xbc\x64'\
-b'\xc4\xa4\xc4\xe5\xbc\x84\xbc\x43\xb4\x23\xb4\x23\xbc\x64\xc4\xa4'\
-b'\xb4\x43\xb4\x43\xbc\x43\xbc\x84\xc4\xc4\xc4\xe5\xc4\xc5\xc4\xa4'\
-b'\xbc\xa4\xc4\xa4\xc4\xc5\xc4\xc5\xcd\x05\xcd\x05\xc4\xa5\xbc\x84'\
-b'\xbc\x43\xb4\x23\xbc\x84\xc4\xa4\xbc\x64\xb4\x44\xbc\x63\xbc\x63'\
-b'\xbc\x84\xc4\xc4\xbc\x64\xbc\x43\xbc\x63\xc4\xa4\xc4\xe5\xcd\x25'\
-b'\xcd\x26\xc4\xe5\xc4\xa4\xbc\x84\xbc\x63\xbc\x84\xc4\xe5\xc4\xe5'\
-b'\xc4\xa4\xc4\xa4\xbc\x64\xb4\x43\xbc\x44\xbc\xa4\xb4\x43\xbc\x43'\
-b'\xbc\x84\xc4\xa4\xc4\xe5\xcd\x05\xcd\x05\xc4\x84\xbc\x64\xbc\x64'\
-b'\xc4\xa4\xcd\x05\xcd\x46\xcd\x26\xcc\xe5\xc4\xc4\xbc\x64\xb4\x23'\
-b'\xbc\x84\xc4\xa4\xbc\x64\xbc\xa4\xc4\xc5\xc4\xc4\xbc\x84\xc4\xa4'\
-b'\xc4\xa4\xb4\x23\xb4\x43\xbc\xa4\xcd\x05\xcd\x46\xd5\x46\xcd\x46'\
-b'\xc4\xe5\xbc\x84\xbc\x43\xbc\x84\xcc\xe5\xc4\xe5\xc5\x05\xcd\x05'\
-b'\xc4\xe5\xbc\x84\xbc\x43\xbc\x84\xbc\x63\xbc\x64\xc4\xa4\xcd\x05'\
-b'\xcd\x26\xcd\x05\xcd\x05\xc4\xe5\xbc\x64\xbc\x63\xc4\xa4\xcd\x26'\
-b'\xcd\x46\xd5\x46\xcd\x46\xcd\x26\xc4\xc4\xbc\x43\xbc\x64\xc4\xc5'\
-b'\xc4\xa4\xc4\xe5\xc5\x05\xcd\x05\xc4\xe5\xc4\xc5\xbc\xa5\xbc\x84'\
-b'\xb4\x43\xc4\x84\xcd\x05\xcd\x46\xcd\x46\xcd\x46\xcd\x46\xcd\x05'\
-b'\xbc\x64\xbc\x43\xc4\xe5\xcd\x25\xcd\x26\xcd\x25\xcd\x25\xcd\x05'\
-b'\xc4\xe5\xbc\x84\xbc\x64\xbc\x64\xc4\xa4\xcd\x05\xcd\x05\xc5\x06'\
-b'\xcd\x25\xcd\x26\xcd\x05\xbc\x84\xb4\x23\xcc\xe5\xcd\x46\xcd\x46'\
-b'\xcd\x26\xcd\x46\xcd\x46\xcd\x25\xc4\xa4\xb4\x43\xc4\xa5\xc5\x05'\
-b'\xcd\x05\xcc\xe5\xc5\x05\xcd\x05\xcd\x05\xc4\xe5\xbc\x84\xbc\x43'\
-b'\xc4\xe5\xcd\x06\xcd\x26\xcd\x26\xcd\x06\xcd\x26\xcd\x26\xcc\xe5'\
-b'\xb4\x23\xc4\xe5\xcd\x25\xcd\x26\xcd\x25\xcd\x05\xcd\x05\xc5\x06'\
-b'\xcd\x05\xbc\x63\xb4\x43\xcc\xe5\xc5\x05\xcc\xe5\xcd\x05\xc5\x06'\
-b'\xcd\x06\xcd\x05\xc4\xe5\xb4\x03\xc4\xc5\xcd\x05\xcd\x26\xcd\x06'\
-b'\xcd\x05\xcd\x06\xcd\x26\xcd\x05\xbc\x64\xb4\x23\xcd\x05\xc4\xe5'\
-b'\xcd\x05\xc4\xe5\xcd\x06\xcd\x05\xc4\xe5\xc4\xc5\xb4\x03\xc4\xa4'\
-b'\xcc\xe5\xc5\x05\xc5\x05\xcd\x05\xcd\x05\xcd\x05\xcd\x05\xbc\xa4'\
-b'\xb4\x03\xc5\x05\xcd\x05\xc5\x05\xc5\x05\xcd\x05\xcd\x05\xcc\xe5'\
-b'\xc4\xe5\xb4\x23\xbc\x43\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xcc\xe5'\
-b'\xc4\xe5\xcc\xe5\xbc\x84\xab\xe2\xc4\xa4\xc4\xe5\xc4\xe5\xcc\xe5'\
-b'\xcc\xe5\xcc\xe5\xcd\x05\xc4\xc5\xbc\x64\xab\xe2\xc4\x84\xcc\xe5'\
-b'\xc4\xe5\xcc\xe4\xc4\xc5\xc4\xe5\xc4\xe5\xbc\x63\xb4\x03\xbc\x43'\
-b'\xbc\x84\xc4\xc5\xc4\xe5\xcc\xe4\xc4\xc5\xc4\xe5\xc4\xc5\xbc\x64'\
-b'\xab\xc2\xb4\x23\xc4\xc4\xcd\x05\xc4\xe5\xcc\xe5\xc5\x05\xcc\xe5'\
-b'\xbc\x23\xb4\x23\xb4\x23\xbc\x63\xc4\xa4\xbc\x64\xb4\x43\xbc\x43'\
-b'\xbc\x84\xc4\xc4\xcc\xe5\xc4\xc5\xc4\xc4\xc4\xc5\xc4\xc4\xc4\xc4'\
-b'\xc4\xc4\xc4\xa5\xc4\xe5\xcc\xe5\xbc\x84\xbc\x43\xb4\x23\xb4\x23'\
-b'\xbc\x84\xc4\x84\xb4\x23\xb4\x23\xbc\x43\xbc\x64\xc4\xc4\xc4\xc4'\
-b'\xbc\x84\xbc\x64\xc4\xa4\xc4\xc4\xcc\xe5\xcd\x05\xcd\x05\xcd\x05'\
-b'\xc4\xc5\xc4\x84\xbc\x64\xbc\x64\xbc\xa4\xcc\xe5\xbc\x84\xbc\x64'\
-b'\xbc\x63\xb4\x23\xb4\x43\xc4\xa4\xbc\x64\xb4\x23\xb4\x63\xbc\x84'\
-b'\xc4\xc5\xcd\x05\xcd\x25\xc4\xe5\xc4\xa4\xc4\x84\xbc\xa4\xc4\xa5'\
-b'\xcc\xe5\xcd\x26\xcd\x05\xc4\xc5\xbc\x84\xb4\x43\xb4\x23\xbc\x84'\
-b'\xc4\x84\xb4\x43\xbc\x64\xbc\x84\xc4\x84\xc4\xa4\xc4\xe5\xc4\xa4'\
-b'\xb4\x43\xbc\x64\xbc\x84\xc4\xe5\xcd\x45\xd5\x66\xd5\x46\xcc\xe5'\
-b'\xc4\xa4\xbc\x64\xbc\x43\xbc\xa4\xc4\xe5\xc4\xc5\xc4\xc4\xc4\xc4'\
-b'\xbc\x84\xbc\x44\xbc\x64\xbc\x84\xb4\x23\xb4\x43\xbc\x84\xcc\xe5'\
-b'\xcd\x05\xcd\x26\xcd\x46\xc4\xe5\xbc\x84\xbc\x64\xc4\x84\xc5\x05'\
-b'\xcd\x46\xd5\x46\xcd\x26\xcd\x05\xc4\xa4\xb4\x43\xb4\x23\xc4\xa4'\
-b'\xbc\x64\xbc\x64\xc4\xa4\xc4\xe5\xc4\xe5\xc4\xc4\xc4\xc5\xc4\xa4'\
-b'\xb4\x23\xbc\x64\xc4\xc5\xcd\x46\xd5\x66\xd5\x66\xd5\x67\xcd\x25'\
-b'\xbc\xa4\xbc\x44\xbc\x84\xc4\xe5\xc5\x05\xcd\x05\xcd\x06\xc5\x05'\
-b'\xc4\xe5\xbc\x84\xbc\x64\xbc\x84\xb4\x23\xbc\x84\xc4\xe5\xcd\x05'\
-b'\xcd\x26\xcd\x26\xcd\x46\xcd\x26\xbc\x84\xbc\x43\xc4\xc4\xcd\x46'\
-b'\xd5\x46\xcd\x46\xcd\x46\xcd\x26\xcd\x05\xc4\x84\xb4\x43\xbc\x84'\
-b'\xc4\xa4\xc4\xe5\xcc\xe5\xc4\xe5\xcd\x05\xcd\x06\xc4\xe5\xc4\xc5'\
-b'\xbc\x63\xbc\x43\xcd\x05\xcd\x46\xcd\x46\xcd\x46\xd5\x46\xcd\x46'\
-b'\xcd\x46\xc4\x84\xb4\x43\xc4\xe5\xcd\x26\xcd\x26\xcd\x05\xcd\x05'\
-b'\xcd\x05\xcd\x05\xc4\xc5\xbc\x64\xbc\x44\xc4\xa4\xc5\x05\xcd\x05'\
-b'\xcd\x26\xcd\x26\xcd\x26\xcd\x26\xcd\x26\xbc\x64\xbc\x84\xcd\x46'\
-b'\xd5\x46\xcd\x46\xcd\x26\xcd\x26\xcd\x25\xcd\x25\xc4\xe5\xb4\x23'\
-b'\xc4\xa4\xcd\x05\xcd\x05\xc4\xe5\xcc\xe5\xc5\x06\xcd\x05\xcd\x05'\
-b'\xc4\xc5\xb4\x03\xc4\xc5\xcd\x26\xcd\x26\xcd\x26\xcd\x26\xcd\x26'\
-b'\xcd\x26\xcd\x25\xc4\xa4\xb4\x23\xcd\x05\xcd\x25\xcd\x26\xcd\x05'\
-b'\xc5\x05\xcd\x05\xc5\x05\xc5\x05\xbc\x64\xb4\x23\xc4\xe5\xcd\x05'\
-b'\xcc\xe6\xc5\x05\xcd\x05\xcd\x06\xcd\x05\xcd\x05\xb4\x43\xbc\x64'\
-b'\xcd\x25\xcd\x06\xcd\x26\xcd\x26\xcd\x05\xc5\x06\xcd\x05\xcd\x05'\
-b'\xb4\x23\xbc\x64\xcd\x05\xcc\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xe5'\
-b'\xc4\xe5\xc4\xc4\xb4\x03\xbc\x84\xcd\x05\xcc\xe5\xcd\x05\xc5\x05'\
-b'\xcd\x05\xcd\x05\xcd\x05\xc4\xc5\xb4\x03\xbc\x43\xc4\xe5\xcc\xe5'\
-b'\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xbc\x63\xb4\x23\xb4\x43'\
-b'\xc4\xc4\xc4\xc5\xc4\xe5\xcc\xe5\xc4\xc5\xc4\xe5\xc4\xc5\xbc\x63'\
-b'\xab\xc2\xbc\x43\xc4\xc5\xcc\xe5\xcc\xe5\xc4\xe5\xcc\xe5\xc5\x05'\
-b'\xc4\xc4\xc4\x84\xb4\x43\xb4\x03\xc4\x84\xc4\xe5\xcc\xe5\xc5\x05'\
-b'\xcd\x05\xcd\x05\xc5\x05\xcd\x05\xc4\xe5\xbc\xa4\xbc\x64\xbc\x43'\
-b'\xbc\x44\xbc\xa4\xbc\x84\xb4\x43\xb4\x23\xb4\x23\xb4\x43\xc4\xa5'\
-b'\xbc\x84\xbc\x43\xbc\x63\xbc\x84\xc4\xc4\xcd\x05\xcd\x05\xcd\x05'\
-b'\xc5\x05\xc4\xe5\xc4\xa4\xc4\xa4\xbc\x84\xc4\xa4\xc4\xe5\xc4\xe5'\
-b'\xbc\x84\xbc\x43\xb4\x23\xb4\x23\xbc\x64\xbc\x84\xb4\x23\xb4\x43'\
-b'\xbc\x64\xbc\xa4\xc4\xe5\xcd\x05\xc4\xc5\xbc\xa4\xc4\xa4\xc4\xa4'\
-b'\xc4\xe5\xcd\x05\xcd\x26\xcd\x46\xcd\x05\xc4\xc5\xbc\x84\xbc\x43'\
-b'\xb4\x43\xc4\x84\xc4\xa5\xbc\x64\xbc\x64\xbc\x84\xbc\x63\xbc\x64'\
-b'\xc4\xc4\xbc\x64\xb4\x23\xbc\x43\xc4\xa4\xcc\xe5\xcd\x26\xd5\x66'\
-b'\xcd\x46\xcc\xe5\xc4\xc4\xbc\x84\xbc\x84\xc4\xa4\xcd\x05\xcd\x06'\
-b'\xc4\xe5\xc4\xc5\xc4\x84\xbc\x43\xb4\x23\xbc\x64\xbc\x44\xb4\x23'\
-b'\xbc\x64\xbc\xa4\xc4\xe5\xcc\xe5\xcd\x26\xc4\xe5\xbc\x84\xbc\x64'\
-b'\xbc\x84\xc4\xe5\xcd\x25\xd5\x86\xd5\x67\xd5\x46\xcc\xe5\xbc\x84'\
-b'\xbc\x43\xb4\x43\xc4\xa4\xc4\xa4\xbc\x84\xc4\xc4\xc4\xc5\xc4\xc4'\
-b'\xbc\x84\xbc\x84\xc4\xa4\xb4\x23\xb4\x43\xc4\xa5\xcd\x05\xd5\x46'\
-b'\xd5\x66\xd5\x66\xcd\x46\xc4\xc4\xbc\x64\xbc\x84\xcc\xe5\xcd\x26'\
-b'\xcd\x26\xcd\x25\xcd\x25\xcc\xe5\xbc\x84\xb4\x23\xbc\x64\xbc\x64'\
-b'\xbc\x43\xbc\xa4\xc4\xe5\xcd\x05\xcd\x26\xcd\x06\xcd\x05\xc4\xe5'\
-b'\xbc\x64\xbc\x64\xcc\xe5\xd5\x66\xd5\x66\xd5\x67\xd5\x66\xd5\x66'\
-b'\xcd\x05\xbc\x84\xbc\x23\xc4\xa4\xc4\xc5\xc4\xe5\xcc\xe5\xcd\x05'\
-b'\xc4\xe5\xcc\xe5\xc4\xc5\xc4\xa4\xbc\x64\xb4\x43\xc4\xc5\xcd\x26'\
-b'\xcd\x46\xd5\x46\xcd\x66\xd5\x67\xd5\x66\xc4\xc5\xbc\x43\xc4\xa5'\
-b'\xcd\x26\xcd\x46\xcd\x46\xcd\x26\xcd\x26\xcd\x26\xcc\xe5\xbc\x84'\
-b'\xbc\x44\xbc\x64\xc4\xc5\xcc\xe5\xcd\x05\xcd\x05\xcd\x06\xcd\x26'\
-b'\xcd\x26\xcd\x05\xbc\x64\xbc\x84\xcd\x46\xd5\x66\xd5\x66\xcd\x67'\
-b'\xd5\x46\xcd\x46\xcd\x46\xcc\xe5\xbc\x43\xc4\xa5\xcd\x05\xcd\x05'\
-b'\xcd\x05\xcd\x05\xcd\x05\xcc\xe5\xcd\x05\xc4\xe5\xbc\x44\xbc\x64'\
-b'\xcd\x05\xcd\x06\xcd\x26\xcd\x46\xcd\x46\xd5\x46\xcd\x46\xcd\x46'\
-b'\xbc\x43\xbc\xa4\xcd\x46\xcd\x26\xcd\x26\xcd\x25\xcd\x26\xcd\x05'\
-b'\xcd\x05\xcd\x05\xb4\x23\xb4\x44\xc4\xe5\xc4\xe5\xcd\x05\xc5\x05'\
-b'\xcd\x06\xcd\x06\xcd\x05\xcd\x05\xbc\x64\xb4\x43\xcd\x26\xcd\x26'\
-b'\xcd\x46\xcd\x26\xcd\x46\xcd\x26\xcd\x26\xcd\x26\xc4\xa4\xb4\x03'\
-b'\xc4\xe5\xcd\x05\xcd\x05\xc4\xe5\xc5\x05\xcd\x05\xc4\xe5\xc4\xe5'\
-b'\xbc\x84\xb4\x03\xc4\xe5\xcd\x05\xcd\x05\xcd\x06\xcd\x06\xcd\x26'\
-b'\xcd\x26\xcd\x05\xcc\xe5\xab\xe3\xc4\xa4\xcd\x26\xcd\x05\xcd\x06'\
-b'\xcd\x06\xc5\x05\xc5\x05\xcc\xe5\xc4\xa4\xb4\x43\xb4\x23\xc4\xc5'\
-b'\xc4\xe5\xc4\xe5\xcc\xe5\xcc\xe5\xc4\xe5\xcc\xe5\xc4\xc4\xb3\xe3'\
-b'\xb4\x23\xc4\xc5\xcc\xe5\xcc\xe5\xcd\x05\xcd\x05\xcc\xe5\xc4\xe5'\
-b'\xc4\xe5\xbc\x84\xab\xe2\xb4\x43\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xe5'\
-b'\xcc\xe5\xc4\xe5\xc4\xa4\xb4\x23\xb4\x23\xbc\x84\xbc\xa5\xcc\xe5'\
-b'\xc4\x85\xb4\x44\xbc\x43\xbc\x84\xc4\xc5\xcd\x05\xcd\x05\xc5\x05'\
-b'\xcc\xe5\xc4\xe5\xc4\xc5\xc4\xc4\xc4\xc5\xc4\xc5\xcc\xe5\xcd\x05'\
-b'\xc4\xc5\xbc\x84\xbc\x43\xb4\x23\xb4\x23\xbc\x84\xbc\x64\xb4\x23'\
-b'\xb4\x23\xbc\x64\xc4\x84\xc4\xe5\xc4\xe5\xc4\xa4\xc4\x84\xc4\xa4'\
-b'\xc4\xc4\xcc\xe5\xcd\x26\xcd\x46\xcd\x46\xcd\x25\xc4\xe5\xc4\xa4'\
-b'\xbc\x63\xbc\x44\xbc\x84\xc4\xe5\xc4\x84\xbc\x64\xbc\x63\xb4\x43'\
-b'\xb4\x43\xbc\x84\xbc\x84\xb4\x03\xb4\x23\xbc\x84\xc4\xc4\xcd\x25'\
-b'\xd5\x46\xcd\x46\xc5\x05\xc4\xc4\xc4\xa4\xbc\xa4\xc4\xc4\xc4\xe5'\
-b'\xcd\x46\xcd\x46\xcd\x05\xc4\xa4\xbc\x64\xb4\x23\xb4\x23\xbc\x84'\
-b'\xbc\x43\xb4\x23\xbc\x64\xc4\xa4\xc4\xc5\xc4\xe5\xc5\x05\xc4\xc5'\
-b'\xbc\x63\xbc\x64\xbc\xa4\xc4\xe5\xd5\x46\xd5\x87\xd5\x86\xd5\x66'\
-b'\xcd\x05\xc4\xa4\xbc\x64\xb4\x43\xc4\xa4\xc4\xe5\xc4\xa4\xc4\xc4'\
-b'\xc4\xc5\xc4\xa4\xbc\x64\xbc\x43\xbc\xa4\xb4\x43\xb4\x23\xbc\x64'\
-b'\xc4\xe5\xcd\x26\xd5\x66\xd5\x67\xd5\x66\xcd\x05\xc4\xa4\xbc\x84'\
-b'\xc4\x84\xcd\x06\xd5\x46\xcd\x46\xcd\x46\xcd\x26\xc4\xe5\xbc\x64'\
-b'\xb4\x23\xbc\x64\xbc\x64\xbc\x43\xbc\xa4\xc4\xc5\xcd\x05\xcd\x05'\
-b'\xc5\x05\xcd\x05\xc4\xc5\xbc\x64\xbc\x64\xc4\xe5\xd5\x66\xd5\x87'\
-b'\xd5\xa7\xd5\xa7\xd5\x87\xcd\x26\xc4\xa4\xbc\x43\xbc\x84\xc4\xe5'\
-b'\xcc\xe5\xcc\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xc5\xbc\x64\xbc\x84'\
-b'\xb4\x23\xbc\x64\xc4\xe5\xcd\x26\xcd\x46\xd5\x66\xd5\x67\xd5\x67'\
-b'\xcd\x46\xc4\xa4\xbc\x64\xc4\xc5\xcd\x46\xd5\x67\xd5\x66\xd5\x46'\
-b'\xcd\x26\xcd\x26\xc4\xe5\xbc\x44\xb4\x43\xbc\x64\xbc\xa4\xc4\xe5'\
-b'\xcc\xe5\xcd\x05\xcd\x05\xcd\x06\xcd\x25\xcd\x05\xbc\x84\xbc\x43'\
-b'\xc5\x05\xd5\x66\xd5\x67\xd5\x87\xd5\x66\xd5\x67\xcd\x66\xcd\x46'\
-b'\xbc\x84\xbc\x64\xc4\xe5\xcd\x26\xcd\x05\xcd\x06\xc5\x05\xcc\xe5'\
-b'\xc4\xe5\xcc\xe5\xc4\xa4\xb4\x44\xbc\x84\xcd\x05\xcd\x26\xcd\x26'\
-b'\xcd\x26\xcd\x46\xcd\x47\xcd\x46\xd5\x46\xbc\x64\xbc\x84\xd5\x46'\
-b'\xcd\x66\xd5\x46\xcd\x46\xcd\x26\xcd\x26\xcd\x26\xcd\x05\xbc\x84'\
-b'\xb4\x03\xc4\xc5\xcc\xe5\xcc\xe5\xcd\x05\xcd\x05\xc5\x05\xcd\x06'\
-b'\xcd\x06\xcd\x05\xb4\x03\xc4\xc4\xcd\x46\xd5\x46\xcd\x46\xd5\x46'\
-b'\xd5\x46\xcd\x46\xcd\x46\xcd\x46\xbc\x84\xbc\x43\xcd\x06\xcd\x26'\
-b'\xcd\x05\xcd\x05\xcd\x05\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xc5\xab\xe2'\
-b'\xc4\xc5\xcd\x05\xcd\x05\xcd\x06\xcd\x06\xcd\x26\xcd\x26\xcd\x26'\
-b'\xcd\x26\xbc\x43\xbc\x64\xcd\x26\xcd\x26\xcd\x26\xcd\x26\xcd\x25'\
-b'\xcd\x05\xcd\x06\xc5\x05\xc4\xc4\xb4\x03\xbc\x84\xc4\xe5\xc4\xe5'\
-b'\xc4\xe5\xcc\xe5\xcc\xe5\xc4\xe5\xc5\x05\xc4\xc5\xb4\x03\xbc\x43'\
-b'\xcc\xe5\xcd\x05\xcd\x05\xcd\x25\xcd\x05\xcd\x25\xcd\x06\xcd\x05'\
-b'\xc4\xc4\xab\xe2\xb4\x43\xc4\xe5\xc5\x05\xc4\xe5\xc4\xe5\xcc\xe5'\
-b'\xc4\xe5\xc4\xc5\xc4\x84\xb4\x03\xbc\x43\xbc\x64\xc4\xc4\xcc\xe5'\
-b'\xc4\xe5\xcc\xe5\xc5\x05\xcd\x06\xcd\x05\xbc\x84\xab\xc2\xb4\x03'\
-b'\xcd\x05\xc4\xa4\xbc\x64\xb4\x23\xb4\x23\xc4\xa4\xbc\x64\xb4\x23'\
-b'\xb4\x23\xbc\x43\xbc\x84\xcc\xe5\xc4\xc4\xbc\x84\xbc\x84\xbc\xa4'\
-b'\xc4\xc4\xcc\xe5\xcd\x26\xcd\x46\xcd\x46\xcd\x25\xcc\xe5\xc4\xc4'\
-b'\xbc\x84\xbc\x64\xbc\x84\xc4\xc4\xc4\xc5\xbc\x84\xbc\x64\xb4\x43'\
-b'\xb4\x23\xbc\x64\xbc\x84\xb4\x23\xb4\x23\xbc\x43\xc4\xa4\xc4\xe5'\
-b'\xcd\x26\xd5\x46\xcd\x25\xc4\xe5\xc4\xc4\xc4\xa4\xc4\xc5\xc4\xc5'\
-b'\xcd\x05\xd5\x46\xd5\x46\xcd\x05\xc4\xc4\xbc\x64\xb4\x03\xb4\x03'\
-b'\xbc\x84\xbc\x64\xb4\x23\xbc\x64\xbc\x84\xc4\xa4\xc4\xc5\xcc\xe5'\
-b'\xc4\xc5\xbc\x63\xbc\x64\xbc\x84\xc4\xe5\xcd\x25\xd5\x66\xd5\xa7'\
-b'\xd5\x67\xcd\x46\xc4\xc5\xbc\x84\xbc\x43\xbc\x63\xc4\xc5\xc4\xe5'\
-b'\xc4\xc4\xc4\xc4\xc4\xa4\xbc\x84\xbc\x43\xbc\x44\xbc\x84\xb4\x03'\
-b'\xb4\x23\xbc\x84\xc4\xe5\xcd\x26\xd5\x66\xd5\x87\xcd\x46\xcd\x05'\
-b'\xc4\xa4\xbc\x84\xc4\xa4\xcd\x05\xd5\x67\xd5\x66\xd5\x46\xcd\x46'\
-b'\xcc\xe5\xbc\x84\xb4\x03\xb4\x23\xbc\x84\xb4\x44\xbc\x64\xc4\xa4'\
-b'\xc4\xc5\xc4\xe5\xc4\xe5\xc4\xe5\xcc\xe5\xbc\x64\xbc\x43\xc4\xa4'\
-b'\xcd\x25\xd5\x66\xd5\xa7\xdd\xa7\xdd\xa7\xd5\x66\xcd\x05\xbc\x84'\
-b'\xbc\x43\xbc\xa5\xcd\x05\xc4\xe5\xcd\x05\xcc\xe5\xc4\xe5\xc4\xc5'\
-b'\xc4\x84\xbc\x43\xbc\x84\xb4\x23\xbc\x43\xc4\xc5\xcd\x26\xcd\x46'\
-b'\xd5\x66\xd5\x67\xd5\x87\xd5\x66\xc4\xc4\xbc\x64\xc4\xc4\xd5\x46'\
-b'\xd5\x87\xd5\x86\xd5\x66\xcd\x46\xcd\x46\xcd\x05\xbc\x84\xb4\x23'\
-b'\xbc\x64\xbc\x64\xc4\xc4\xc4\xe5\xc4\xe5\xcc\xe5\xcd\x05\xcd\x06'\
-b'\xcd\x05\xc4\xe5\xbc\x43\xbc\x84\xcd\x26\xd5\x86\xd5\x87\xd5\xa7'\
-b'\xd5\x87\xd5\x87\xd5\x87\xcd\x46\xbc\x64\xbc\x64\xcd\x05\xcd\x26'\
-b'\xcd\x06\xcd\x05\xc5\x05\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xa4\xbc\x64'\
-b'\xb4\x23\xc4\xe5\xcd\x26\xcd\x26\xcd\x46\xcd\x46\xd5\x66\xd5\x67'\
-b'\xd5\x67\xcd\x26\xbc\x63\xcd\x26\xd5\x67\xd5\x66\xcd\x67\xcd\x66'\
-b'\xcd\x46\xcd\x46\xcd\x26\xcd\x05\xb4\x43\xbc\x44\xc4\xc5\xc4\xe5'\
-b'\xc4\xe5\xc4\xe5\xcd\x05\xcd\x06\xcd\x05\xcd\x06\xcd\x06\xb4\x23'\
-b'\xc4\xa4\xcd\x46\xcd\x66\xd5\x67\xd5\x67\xd5\x66\xd5\x67\xd5\x66'\
-b'\xcd\x66\xc4\xe5\xb4\x03\xcd\x05\xcd\x26\xcd\x06\xcd\x06\xc5\x05'\
-b'\xcd\x05\xc4\xe5\xcc\xe5\xc4\xe5\xbc\x43\xb4\x03\xc4\xe5\xcd\x05'\
-b'\xcd\x06\xcd\x26\xcd\x26\xcd\x46\xd5\x46\xd5\x46\xcd\x46\xb4\x23'\
-b'\xc4\xa4\xcd\x46\xd5\x66\xcd\x46\xcd\x46\xcd\x46\xcd\x26\xcd\x25'\
-b'\xcd\x05\xc4\xe5\xb4\x02\xbc\x84\xc4\xe5\xc4\xe5\xc4\xe5\xcc\xe5'\
-b'\xc4\xe5\xc4\xe5\xcd\x05\xcd\x05\xbc\x64\xb4\x03\xcd\x05\xcd\x25'\
-b'\xcd\x26\xcd\x46\xcd\x46\xd5\x46\xd5\x46\xcd\x26\xcd\x25\xbc\x84'\
-b'\xab\xe2\xc4\xc5\xc5\x05\xc5\x05\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xe5'\
-b'\xc4\xc5\xbc\x84\xb4\x03\xb4\x23\xc4\x84\xc4\xe5\xcc\xe5\xcc\xe5'\
-b'\xcd\x05\xcd\x05\xcd\x05\xcd\x25\xc4\xa4\xab\xe2\xb4\x03\xcc\xe5'\
-b'\xcd\x25\xcd\x25\xcd\x06\xcd\x26\xcd\x26\xcd\x25\xc4\xe5\xc4\xa5'\
-b'\xcd\x06\xcd\x26\xcd\x46\xd5\x46\xcd\x46\xcd\x26\xc4\xe5\xc4\xa4'\
-b'\xbc\x84\xbc\x64\xbc\x84\xc4\xe5\xc4\xc5\xbc\x63\xbc\x43\xbc\x43'\
-b'\xb4\x23\xbc\x64\xbc\x84\xb4\x23\xb4\x23\xbc\x64\xc4\xc4\xcd\x05'\
-b'\xcd\x46\xd5\x46\xcd\x25\xcd\x05\xc4\xc5\xc4\xc4\xc4\xc4\xc4\xc5'\
-b'\xcd\x05\xcd\x26\xd5\x46\xcd\x25\xc4\xc4\xbc\x64\xb4\x23\xb4\x03'\
-b'\xbc\x43\xbc\x84\xb4\x23\xb4\x43\xbc\x64\xbc\xa4\xc4\xa4\xc5\x05'\
-b'\xc4\xe5\xbc\x84\xbc\x64\xbc\x84\xc4\xc4\xcd\x05\xd5\x66\xd5\x86'\
-b'\xd5\x87\xd5\x66\xcd\x25\xc4\xc4\xbc\x84\xbc\x43\xbc\x64\xc4\xe5'\
-b'\xc4\xe5\xc4\xa4\xc4\xa4\xbc\xa4\xbc\x64\xb4\x43\xbc\x64\xbc\x84'\
-b'\xb4\x03\xb4\x03\xbc\x83\xc4\xe5\xcd\x26\xd5\x66\xd5\x87\xd5\x66'\
-b'\xcd\x06\xc4\xc5\xc4\xa4\xc4\xa4\xc4\xe5\xcd\x26\xd5\x86\xd5\x66'\
-b'\xcd\x46\xcd\x05\xc4\xa4\xbc\x43\xac\x03\xbc\x43\xbc\x64\xb4\x23'\
-b'\xbc\x64\xbc\xa4\xc4\xe5\xc4\xe5\xc4\xe5\xcd\x05\xc4\xe5\xbc\x64'\
-b'\xbc\x63\xbc\xa4\xcd\x25\xd5\x66\xdd\xa7\xdd\xc7\xd5\xa7\xd5\x66'\
-b'\xcd\x05\xbc\x84\xbc\x63\xbc\x84\xcc\xe5\xc4\xe5\xc4\xe5\xc4\xe5'\
-b'\xc4\xe5\xc4\xc5\xbc\x84\xbc\x64\xbc\x84\xb4\x43\xb4\x03\xbc\x84'\
-b'\xcd\x05\xcd\x46\xd5\x66\xd5\x87\xd5\x87\xd5\x87\xcd\x25\xc4\xa4'\
-b'\xbc\x84\xc4\xe5\xd5\x67\xd5\x87\xd5\x87\xd5\x66\xd5\x46\xcd\x26'\
-b'\xc4\xe5\xbc\x63\xb4\x03\xbc\x64\xbc\x64\xbc\xa4\xc4\xc5\xc4\xe5'\
-b'\xc4\xe5\xcd\x06\xcd\x06\xcd\x05\xcd\x05\xbc\x64\xbc\x64\xcd\x05'\
-b'\xd5\x87\xd5\xa7\xd5\xa7\xdd\xa7\xd5\xa8\xd5\xa7\xd5\x66\xc4\xc5'\
-b'\xb4\x43\xc4\xc5\xcd\x06\xcd\x25\xcd\x06\xcc\xe5\xc4\xe5\xcc\xe5'\
-b'\xc4\xe5\xc4\xc5\xbc\x64\xb4\x43\xbc\x43\xc4\xe5\xcd\x26\xcd\x46'\
-b'\xcd\x46\xd5\x67\xd5\x87\xd5\x87\xd5\xa7\xcd\x05\xbc\x64\xcd\x26'\
-b'\xd5\x87\xd5\x86\xd5\x67\xd5\x66\xd5\x46\xcd\x26\xcd\x26\xcd\x05'\
-b'\xb4\x43\xb4\x43\xc4\xa4\xc4\xc5\xc4\xe5\xc4\xe5\xcc\xe5\xcd\x05'\
-b'\xcd\x06\xcd\x06\xcd\x26\xc4\xc5\xb4\x23\xcd\x46\xd5\x66\xd5\x87'\
-b'\xd5\x87\xd5\x87\xd5\x87\xd5\x87\xd5\x87\xd5\x66\xbc\x84\xb4\x43'\
-b'\xcd\x26\xcd\x26\xcd\x06\xcd\x05\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xe5'\
-b'\xc4\xc5\xbc\x43\xb4\x03\xc4\xe5\xcd\x05\xcd\x26\xcd\x26\xcd\x46'\
-b'\xd5\x46\xd5\x67\xd5\x67\xd5\x66\xbc\xa4\xbc\x44\xd5\x66\xd5\x66'\
-b'\xd5\x66\xcd\x46\xcd\x46\xcd\x26\xcd\x26\xcd\x05\xcc\xe5\xbc\x44'\
-b'\xb4\x03\xc4\xe5\xc4\xc5\xc4\xe5\xcc\xe5\xcc\xe5\xcc\xe5\xcc\xe5'\
-b'\xcd\x06\xcd\x06\xbc\x63\xbc\x43\xcd\x26\xd5\x46\xd5\x66\xd5\x46'\
-b'\xd5\x67\xd5\x66\xcd\x46\xcd\x46\xcd\x46\xc4\xa4\xab\xe3\xc4\xe5'\
-b'\xcd\x25\xcd\x05\xcc\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xc5'\
-b'\xb4\x23\xb4\x03\xc4\x84\xcc\xe5\xcc\xe5\xcd\x05\xcd\x06\xcd\x25'\
-b'\xcd\x26\xcd\x25\xcd\x26\xc4\x84\xab\xc2\xbc\xa4\xcd\x26\xcd\x25'\
-b'\xcd\x26\xcd\x26\xcd\x05\xc5\x05\xcd\x05\xc4\xc5\xbc\x84\xb4\x23'\
-b'\xb4\x03\xbc\x84\xc4\xc5\xc4\xe5\xc4\xe5\xc4\xe5\xcc\xe5\xcd\x06'\
-b'\xc4\xc5\xbc\xa4\xbc\x43\xb4\x44\xbc\x84\xc4\xc4\xcd\x25\xd5\x46'\
-b'\xcd\x46\xd5\x46\xcd\x25\xcc\xe5\xc4\xc4\xc4\xc5\xc4\xc5\xc4\xe5'\
-b'\xcd\x05\xcd\x26\xcd\x46\xcc\xe5\xc4\xa4\xbc\x43\xb4\x03\xb4\x03'\
-b'\xbc\x84\xb4\x43\xb4\x03\xb4\x43\xbc\x84\xc4\xa4\xcc\xe5\xcd\x25'\
-b'\xc4\xc5\xbc\x84\xbc\x84\xc4\xa4\xc4\xc5\xcd\x05\xd5\x46\xd5\x86'\
-b'\xd5\x87\xd5\x66\xcd\x25\xc4\xc5\xbc\x84\xbc\x43\xbc\x43\xc4\xa5'\
-b'\xc4\xc5\xc4\xa4\xbc\x84\xbc\x84\xbc\x64\xb4\x43\xbc\x64\xbc\x84'\
-b'\xb4\x23\xb4\x03\xbc\x64\xc4\xc5\xcd\x25\xd5\x66\xd5\xa7\xd5\x86'\
-b'\xcd\x46\xcd\x05\xc4\xc5\xc4\xa4\xc4\xa4\xc4\xe5\xcd\x26\xd5\x66'\
-b'\xd5\x46\xcd\x25\xcc\xe5\xbc\x84\xb4\x23\xb4\x02\xbc\x64\xbc\x43'\
-b'\xb4\x03\xb4\x43\xc4\xa4\xc4\xe5\xcd\x05\xcd\x06\xcd\x26\xc4\xe5'\
-b'\xbc\x84\xbc\x84\xc4\xa4\xcd\x05\xd5\x66\xd5\xa7\xdd\xc8\xdd\xc7'\
-b'\xd5\x87\xcd\x26\xc4\xc4\xbc\x44\xb4\x23\xbc\x84\xc4\xc5\xc4\xa4'\
-b'\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xa4\xbc\x64\xbc\x64\xbc\x84\xb4\x03'\
-b'\xb4\x43\xc4\xc5\xcd\x26\xd5\x66\xd5\xa7\xdd\xa7\xdd\xc7\xd5\x87'\
-b'\xcd\x26\xc4\xc4\xbc\x84\xc4\xc5\xd5\x66\xd5\x87\xd5\x67\xd5\x66'\
-b'\xcd\x46\xcd\x06\xc4\xc5\xbc\x63\xb4\x03\xbc\x64\xb4\x43\xbc\x64'\
-b'\xc4\xa5\xc4\xe5\xcd\x05\xcd\x05\xcd\x26\xcd\x46\xcd\x26\xc4\xa4'\
-b'\xbc\x64\xc4\xc4\xcd\x46\xdd\xa7\xdd\xc7\xdd\xc7\xdd\xc8\xd5\xa7'\
-b'\xd5\x87\xcd\x25\xbc\x84\xb4\x23\xc4\xc5\xc4\xe5\xc5\x05\xc4\xe5'\
-b'\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xe5\xc4\xa4\xbc\x84\xbc\x44\xb4\x23'\
-b'\xc4\xe5\xcd\x46\xd5\x66\xd5\x87\xd5\x87\xd5\xa7\xdd\xa7\xdd\xa7'\
-b'\xcd\x26\xbc\x64\xc4\xc4\xd5\x67\xd5\x87\xd5\x67\xd5\x66\xcd\x46'\
-b'\xcd\x26\xcd\x05\xcd\x05\xc4\xa4\xb4\x23\xb4\x23\xc4\x84\xc4\xe5'\
-b'\xc4\xe5\xcc\xe5\xcd\x05\xcd\x06\xcd\x26\xcd\x46\xd5\x66\xc4\xc5'\
-b'\xbc\x64\xd5\x46\xd5\xa7\xdd\xa7\xd5\xa7\xdd\xa7\xd5\xa7\xd5\x87'\
-b'\xd5\x87\xd5\x66\xc4\xa4\xb4\x23\xcd\x05\xcd\x05\xcd\x05\xc4\xe5'\
-b'\xc4\xe5\xcc\xe5\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc4\xab\xe3\xc4\xa4'\
-b'\xcd\x26\xcd\x46\xd5\x46\xd5\x67\xd5\x87\xd5\x87\xd5\x87\xd5\x87'\
-b'\xd5\x87\xb4\x43\xc4\xc5\xd5\x86\xd5\x67\xd5\x66\xcd\x46\xcd\x46'\
-b'\xcd\x26\xcd\x05\xc5\x05\xc4\xe5\xb4\x24\xb4\x03\xc4\xc5\xc4\xc5'\
-b'\xc4\xe5\xc4\xe5\xcd\x05\xcd\x06\xcd\x05\xcd\x26\xcd\x46\xc4\xe5'\
-b'\xb4\x02\xcd\x46\xd5\x66\xd5\x67\xd5\x87\xd5\x87\xd5\x87\xcd\x86'\
-b'\xd5\x66\xcd\x46\xcd\x26\xb4\x23\xbc\x84\xcd\x05\xc5\x05\xc4\xe5'\
-b'\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xc5\xb4\x03\xb4\x43'\
-b'\xcc\xe5\xcd\x05\xcd\x26\xcd\x26\xd5\x46\xd5\x46\xd5\x46\xd5\x66'\
-b'\xd5\x66\xc4\xe5\xab\xe2\xc4\xc5\xcd\x46\xcd\x46\xcd\x46\xcd\x26'\
-b'\xcd\x05\xcd\x05\xc4\xe5\xc4\xe5\xbc\x84\xb4\x23\xb4\x03\xbc\x84'\
-b'\xc4\xc4\xc4\xc5\xc4\xc5\xc4\xe5\xc4\xe5\xc4\xe5\xcd\x05\xc4\xc5'\
-b'\xb4\x23\xab\xe2\xc4\xc4\xcd\x46\xd5\x46\xd5\x67\xd5\x67\xd5\x66'\
-b'\xd5\x67\xcd\x26\xc4\xc5\xbc\x84\xbc\x23\xb4\x03\xb4\x43\xbc\x84'\
-b'\xb4\x03\xb4\x03\xb4\x43\xc4\xa4\xc4\xe5\xcd\x46\xcd\x26\xcd\x05'\
-b'\xc4\xc5\xc4\xc4\xc4\xa4\xc4\xc5\xc4\xe5\xcd\x25\xcd\x66\xd5\x66'\
-b'\xd5\x66\xcd\x46\xcc\xe5\xc4\x84\xb4\x43\xb4\x23\xbc\x44\xc4\xa4'\
-b'\xbc\x84\xbc\x64\xbc\x63\xbc\x84\xbc\x64\xbc\x84\xc4\xc4\xbc\x64'\
-b'\xb4\x43\xbc\x43\xc4\xa4\xc5\x05\xd5\x46\xd5\x87\xdd\xa7\xd5\x86'\
-b'\xd5\x66\xcd\x05\xc4\xc5\xc4\xa4\xbc\xa4\xc4\xa4\xcd\x05\xd5\x46'\
-b'\xcd\x26\xcd\x05\xc4\xc5\xbc\x84\xb4\x23\xb3\xe3\xbc\x63\xb4\x43'\
-b'\xb3\xe3\xb4\x23\xbc\x84\xc4\xe5\xcd\x26\xd5\x46\xd5\x66\xcd\x26'\
-b'\xc4\xe5\xc4\xa4\xc4\xa4\xc4\xc5\xcd\x25\xd5\x67\xdd\xa7\xd5\xa7'\
-b'\xd5\xa7\xd5\x66\xcd\x05\xbc\x84\xb4\x23\xb4\x03\xbc\x84\xbc\x84'\
-b'\xbc\x64\xc4\xa4\xc4\xa5\xc4\xc5\xc4\xa5\xbc\xa4\xc4\xa4\xbc\xa4'\
-b'\xb4\x23\xbc\x43\xc4\xa4\xcd\x26\xd5\x86\xdd\xa7\xdd\xc8\xdd\xe8'\
-b'\xd5\xa7\xcd\x46\xc4\xc5\xbc\x84\xbc\x84\xc4\xe5\xd5\x46\xcd\x46'\
-b'\xcd\x26\xcd\x25\xcd\x05\xc4\xc5\xbc\x84\xb4\x23\xb4\x43\xbc\x43'\
-b'\xb4\x03\xbc\x64\xc4\xe5\xcd\x05\xcd\x26\xcd\x46\xd5\x66\xd5\x87'\
-b'\xcd\x46\xc4\xa4\xbc\x84\xc4\xe5\xd5\x46\xdd\xa7\xdd\xc8\xdd\xc7'\
-b'\xd5\xa7\xd5\x87\xd5\x66\xcd\x05\xbc\x64\xb4\x03\xbc\x84\xbc\xa4'\
-b'\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xe5\xc4\xe5\xc4\xc5'\
-b'\xbc\x84\xb4\x03\xc4\xa4\xcd\x46\xd5\x87\xdd\xa7\xdd\xa7\xdd\xc8'\
-b'\xdd\xc8\xdd\xc7\xdd\xa7\xc4\xe5\xbc\x64\xc4\xc5\xd5\x66\xd5\x66'\
-b'\xcd\x46\xcd\x26\xcd\x06\xcc\xe5\xc4\xe5\xc4\xe5\xbc\x84\xb4\x23'\
-b'\xb4\x23\xbc\x64\xc4\xe5\xcd\x05\xcd\x06\xcd\x26\xcd\x46\xd5\x66'\
-b'\xd5\x87\xd5\x87\xcd\x26\xbc\x64\xcd\x05\xd5\xc7\xdd\xc8\xdd\xa7'\
-b'\xd5\xa7\xd5\xa7\xd5\x87\xd5\x67\xcd\x46\xcd\x05\xb4\x43\xbc\x64'\
-b'\xc4\xc5\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xe5\xc4\xe5\xc4\xe5\xcc\xe5'\
-b'\xcd\x06\xc4\xc5\xb4\x03\xc4\xc5\xcd\x46\xd5\x87\xd5\x87\xd5\xa7'\
-b'\xdd\xa7\xdd\xa8\xdd\xa7\xd5\xa7\xdd\xa7\xbc\x64\xbc\xa4\xd5\x66'\
-b'\xd5\x46\xcd\x46\xcd\x46\xcd\x26\xcd\x05\xc4\xe5\xcc\xe5\xc4\xc5'\
-b'\xc4\xa4\xab\xa2\xc4\xa4\xc4\xc5\xc4\xe5\xcd\x05\xcd\x26\xcd\x26'\
-b'\xcd\x26\xd5\x46\xd5\x67\xd5\x67\xc4\xa4\xbc\x63\xd5\x87\xd5\xa7'\
-b'\xd5\xa7\xd5\x87\xd5\x87\xd5\x87\xd5\x66\xcd\x46\xcd\x26\xcd\x05'\
-b'\xab\xe3\xbc\x84\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5'\
-b'\xc4\xe5\xc4\xe5\xcc\xe5\xbc\x64\xb4\x03\xcd\x05\xcd\x26\xd5\x66'\
-b'\xd5\x67\xd5\x66\xd5\x87\xd5\x87\xd5\x87\xd5\x86\xd5\x66\xbc\x64'\
-b'\xb4\x43\xcd\x26\xcd\x26\xcd\x26\xcd\x25\xcd\x05\xc5\x05\xc4\xe5'\
-b'\xc4\xe5\xc4\xc5\xbc\x64\xb4\x02\xb4\x23\xc4\xa4\xc4\xc5\xc4\xe5'\
-b'\xcc\xe5\xcd\x05\xcd\x06\xcd\x25\xcd\x26\xcd\x25\xbc\x63\xab\xe2'\
-b'\xc4\xc5\xd5\x66\xd5\x66\xd5\x46\xd5\x46\xcd\x46\xcd\x46\xcd\x26'\
-b'\xcd\x05\xc4\xe5\xbc\x64\xab\xc2\xbc\x43\xc4\xc5\xc4\xe5\xc4\xe5'\
-b'\xcc\xe5\xc4\xe5\xc4\xe5\xcd\x05\xcd\x26\xd5\x46\xd5\x66\xd5\x66'\
-b'\xcd\x25\xc4\xc4\xbc\x64\xb4\x03\xb4\x03\xbc\x64\xbc\x63\xb4\x23'\
-b'\xb4\x23\xbc\x64\xc4\xa4\xc4\xc4\xcd\x05\xc4\xe5\xbc\x84\xbc\x84'\
-b'\xc4\x84\xc4\xa4\xc5\x05\xcd\x46\xd5\x66\xdd\xa7\xd5\xa7\xd5\x66'\
-b'\xcd\x26\xc4\xe5\xc4\xa4\xbc\x64\xbc\x64\xc4\xa4\xcd\x05\xc4\xe5'\
-b'\xc4\xc5\xc4\xa4\xbc\x84\xb4\x43\xb4\x23\xbc\x64\xb4\x63\xb3\xe3'\
-b'\xb4\x23\xbc\x64\xc4\xe5\xcd\x46\xd5\x86\xdd\xa7\xd5\x87\xcd\x46'\
-b'\xc5\x05\xc4\xc4\xc4\xa4\xc4\xc4\xc4\xe5\xcd\x46\xd5\x87\xd5\x87'\
-b'\xd5\x66\xd5\x46\xc4\xe5\xbc\x63\xb4\x03\xac\x03\xbc\x64\xbc\x43'\
-b'\xb4\x23\xbc\x64\xbc\xa4\xc4\xc5\xcc\xe5\xc5\x05\xcd\x06\xc4\xe5'\
-b'\xbc\x64\xbc\x64\xbc\xa4\xcc\xe5\xd5\x66\xd5\xa7\xdd\xe8\xdd\xe8'\
-b'\xdd\xc7\xd5\x87\xcd\x25\xc4\xa4\xbc\x64\xb4\x43\xc4\xc5\xcd\x06'\
-b'\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xa4\xbc\x64\xb4\x43\xbc\x64'\
-b'\xb4\x03\xb4\x02\xbc\x84\xcd\x05\xd5\x46\xd5\x87\xd5\xa7\xdd\xc7'\
-b'\xdd\xc7\xd5\x67\xcd\x05\xc4\xa4\xc4\xa5\xcd\x05\xd5\x67\xdd\xa7'\
-b'\xd5\xa7\xd5\x87\xd5\x66\xcd\x46\xcd\x05\xbc\x84\xb4\x03\xb4\x23'\
-b'\xbc\x64\xbc\x43\xbc\xa4\xc4\xc5\xc4\xe5\xc4\xe5\xcd\x05\xcd\x26'\
-b'\xcd\x26\xcd\x26\xbc\x84\xbc\x64\xc4\xc5\xd5\x66\xdd\xc7\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xdd\xc8\xdd\xc7\xd5\x87\xc4\xe5\xbc\x43\xbc\x64'\
-b'\xcd\x05\xcd\x06\xcd\x05\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc5'\
-b'\xc4\xa4\xbc\x64\xb4\x23\xb4\x03\xc4\xc5\xcd\x26\xcd\x46\xd5\x67'\
-b'\xd5\x87\xdd\xa7\xdd\xc8\xdd\xc8\xd5\xa7\xcc\xe5\xbc\x84\xcd\x26'\
-b'\xdd\xc7\xdd\xa7\xd5\xa7\xd5\x87\xd5\x66\xcd\x46\xcd\x26\xcd\x05'\
-b'\xc4\xc5\xb4\x03\xb4\x43\xbc\x84\xc4\xc5\xc4\xc5\xc4\xe5\xc4\xe5'\
-b'\xcd\x06\xcd\x06\xcd\x26\xcd\x46\xd5\x46\xbc\x84\xc4\xa5\xd5\x87'\
-b'\xdd\xc7\xdd\xc8\xdd\xc8\xdd\xc8\xdd\xc8\xdd\xc8\xd5\xa7\xd5\x87'\
-b'\xcd\x05\xb4\x03\xc4\xe5\xcd\x26\xcd\x05\xcd\x05\xc4\xe5\xc4\xc5'\
-b'\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc5\xbc\xa4\xab\xc2\xc4\xa5\xcd\x26'\
-b'\xcd\x26\xd5\x46\xd5\x67\xd5\x87\xd5\x87\xd5\xa7\xdd\xa7\xdd\xa7'\
-b'\xc5\x05\xb4\x43\xd5\x87\xd5\xa7\xd5\x87\xd5\x87\xd5\x67\xcd\x46'\
-b'\xcd\x26\xcd\x26\xcd\x05\xc4\xe5\xb4\x23\xac\x03\xc4\xc5\xc4\xc5'\
-b'\xc4\xc5\xcc\xe5\xc4\xe5\xc4\xe5\xcd\x06\xcd\x06\xcd\x26\xcd\x26'\
-b'\xb4\x23\xc4\x84\xd5\x86\xd5\x87\xdd\xa7\xdd\xa7\xd5\xa7\xdd\xa7'\
-b'\xd5\xa7\xd5\x87\xd5\x66\xd5\x46\xb4\x43\xbc\x64\xcd\x06\xcd\x05'\
-b'\xc5\x05\xc4\xe5\xc4\xc5\xcc\xc5\xc4\xc5\xc4\xc5\xc4\xc4\xc4\xa4'\
-b'\xab\xc2\xbc\x64\xcc\xe5\xcd\x05\xcd\x26\xcd\x26\xcd\x46\xd5\x66'\
-b'\xd5\x67\xd5\x66\xd5\x87\xcd\x46\xb4\x23\xbc\x64\xd5\x66\xd5\x66'\
-b'\xcd\x46\xcd\x46\xcd\x46\xcd\x26\xcd\x05\xcc\xe5\xc4\xe5\xbc\x84'\
-b'\xb4\x23\xab\xe3\xbc\x84\xc4\xa4\xc4\xc5\xc4\xc5\xc4\xc5\xcc\xc5'\
-b'\xc4\xe5\xcd\x05\xcc\xe5\xbc\x84\xab\xe2\xbc\x44\xcd\x46\xd5\x67'\
-b'\xcd\x26\xd5\x67\xd5\x87\xcd\x46\xcd\x05\xc4\xe5\xc4\xc5\xc4\xa4'\
-b'\xc4\xc5\xc5\x05\xcd\x46\xd5\x66\xd5\x86\xd5\xa7\xd5\x66\xcd\x05'\
-b'\xc4\xa4\xbc\x63\xb4\x23\xb4\x23\xbc\xa5\xc4\xa4\xbc\x44\xbc\x64'\
-b'\xbc\x84\xbc\x84\xbc\x84\xc4\xc5\xc4\xa5\xb4\x43\xb4\x23\xbc\x64'\
-b'\xc4\xc4\xcd\x05\xd5\x66\xd5\xa7\xdd\xc7\xd5\xa7\xd5\x66\xcd\x26'\
-b'\xc4\xe5\xc4\xa4\xbc\xa4\xc4\xa5\xc4\xe5\xcd\x46\xd5\x46\xcd\x26'\
-b'\xcd\x05\xc4\xc4\xbc\x63\xb4\x03\xb3\xe3\xbc\x63\xb4\x03\xab\xe2'\
-b'\xb4\x23\xc4\xa4\xcd\x05\xcd\x46\xd5\x67\xd5\x87\xd5\x66\xcd\x05'\
-b'\xc4\xc5\xbc\xa4\xc4\xa4\xcd\x05\xcd\x46\xd5\x87\xdd\xc7\xdd\xc7'\
-b'\xd5\xa7\xd5\x66\xcd\x05\xbc\x84\xb4\x23\xb4\x03\xbc\x84\xc4\x84'\
-b'\xbc\x63\xbc\x84\xc4\xa4\xc4\xc5\xc4\xc5\xc4\xa4\xc4\xa5\xc4\xc5'\
-b'\xbc\x63\xb4\x23\xbc\x64\xc4\xe5\xd5\x66\xdd\xa7\xdd\xc8\xdd\xe8'\
-b'\xdd\xe8\xdd\xa7\xd5\x66\xc4\xe5\xbc\x84\xbc\x84\xc4\xc5\xd5\x46'\
-b'\xd5\x66\xcd\x46\xcd\x26\xcd\x05\xc4\xe5\xc4\xa4\xbc\x43\xb4\x03'\
-b'\xb4\x44\xb4\x03\xb4\x23\xbc\x84\xc4\xe5\xcd\x26\xcd\x46\xd5\x67'\
-b'\xd5\x87\xd5\xa7\xd5\x67\xc4\xe5\xc4\xa4\xc4\xc5\xcd\x46\xdd\xa7'\
-b'\xdd\xe8\xdd\xc8\xdd\xc7\xd5\xa7\xd5\x87\xd5\x66\xc4\xe5\xbc\x43'\
-b'\xb4\x03\xbc\x84\xbc\x84\xc4\xa4\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5'\
-b'\xc4\xe5\xc4\xe5\xc4\xe5\xc4\xc5\xb4\x23\xbc\x63\xcd\x06\xd5\xa7'\
-b'\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xa7\xc4\xe5'\
-b'\xbc\x63\xc4\xc5\xd5\x66\xd5\x67\xcd\x46\xcd\x26\xcd\x26\xcd\x05'\
-b'\xc4\xe5\xc4\xc5\xc4\xa4\xb4\x43\xb4\x23\xb4\x03\xc4\xa4\xc5\x05'\
-b'\xcd\x06\xcd\x26\xcd\x46\xd5\x67\xd5\x87\xdd\xa7\xdd\xc7\xcd\x66'\
-b'\xbc\x84\xcc\xe5\xdd\xc8\xdd\xe8\xdd\xc8\xdd\xc7\xdd\xa8\xd5\xa7'\
-b'\xd5\x87\xd5\x66\xcd\x46\xc4\xc5\xb4\x03\xbc\x84\xc4\xc5\xc4\xc5'\
-b'\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xe5\xcc\xe5\xcd\x05\xcd\x06'\
-b'\xb4\x43\xbc\x84\xd5\x86\xd5\x87\xd5\xa8\xdd\xc8\xdd\xc8\xdd\xe8'\
-b'\xdd\xc8\xdd\xc8\xdd\xc7\xd5\x87\xb4\x43\xc4\xc5\xd5\x66\xd5\x66'\
-b'\xcd\x46\xcd\x26\xcd\x05\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc5'\
-b'\xab\xe3\xb4\x03\xc4\xe5\xcc\xe5\xcd\x05\xcd\x06\xcd\x46\xd5\x46'\
-b'\xd5\x67\xd5\x87\xd5\x87\xd5\xa7\xc4\xa4\xbc\x64\xdd\xa7\xdd\xc7'\
-b'\xdd\xa7\xd5\xa7\xd5\xa7\xd5\x87\xd5\x67\xd5\x66\xcd\x46\xcd\x25'\
-b'\xbc\x84\xab\xc2\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5'\
-b'\xc4\xc5\xc4\xe5\xc4\xe5\xcd\x06\xbc\xa4\xab\xe2\xcd\x06\xd5\x66'\
-b'\xd5\x67\xd5\x87\xdd\xa7\xd5\xa7\xdd\xa7\xd5\xa7\xd5\xa7\xd5\x87'\
-b'\xd5\x66\xb4\x03\xbc\x84\xcd\x46\xcd\x26\xcd\x26\xcd\x05\xcc\xe5'\
-b'\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xa4\xbc\x84\xb3\xe2\xb4\x03\xbc\xa4'\
-b'\xc4\xc5\xcc\xe5\xcc\xe5\xcd\x06\xcd\x26\xcd\x46\xd5\x46\xd5\x46'\
-b'\xcd\x46\xbc\x43\xb3\xe3\xc5\x05\xd5\x86\xd5\x86\xd5\x66\xd5\x66'\
-b'\xd5\x66\xcd\x46\xcd\x46\xcd\x26\xcd\x05\xc4\xa5\xb4\x03\xab\xc2'\
-b'\xb4\x03\xbc\x64\xbc\x64\xb3\xe2\xb4\x03\xbc\x64\xc4\xc4\xc5\x05'\
-b'\xcd\x46\xd5\x46\xcd\x05\xc4\xc5\xbc\xa4\xc4\x84\xc4\xa4\xc4\xe5'\
-b'\xcd\x26\xd5\x67\xd5\xa7\xdd\xa7\xd5\xa7\xd5\x66\xcd\x05\xc4\xc4'\
-b'\xbc\x64\xbc\x43\xbc\x64\xc4\xc4\xc4\xe5\xc4\xa4\xc4\xa4\xbc\xa4'\
-b'\xbc\x64\xbc\x43\xbc\x64\xbc\xa4\xbc\x43\xb4\x03\xb4\x23\xc4\xa4'\
-b'\xcd\x05\xd5\x66\xd5\xa7\xdd\xc7\xdd\xa7\xd5\x87\xcd\x46\xc4\xe5'\
-b'\xc4\xa4\xbc\xa4\xc4\xa5\xc5\x05\xcd\x46\xd5\x87\xd5\x87\xd5\x66'\
-b'\xcd\x46\xc4\xc5\xbc\x64\xb4\x02\xab\xe2\xbc\x44\xb4\x23\xab\xe2'\
-b'\xbc\x43\xc4\xa4\xc4\xe5\xcd\x26\xcd\x46\xd5\x66\xd5\x46\xc4\xe5'\
-b'\xc4\xa4\xbc\x84\xc4\xa5\xcd\x05\xd5\x66\xdd\xc7\xdd\xc8\xdd\xe8'\
-b'\xdd\xc7\xd5\xa7\xd5\x66\xc4\xc5\xbc\x63\xb4\x23\xbc\x64\xc4\xc5'\
-b'\xc4\xc4\xc4\xa5\xc4\xc4\xc4\xc5\xbc\xa4\xbc\xa4\xbc\x64\xbc\x84'\
-b'\xbc\x84\xb4\x03\xb4\x23\xc4\xa4\xcd\x26\xd5\x87\xdd\xc7\xdd\xc8'\
-b'\xdd\xe8\xdd\xe8\xdd\xc7\xd5\x46\xc4\xe5\xbc\xa4\xc4\xa5\xcd\x26'\
-b'\xd5\x87\xd5\xa7\xd5\x87\xd5\x66\xcd\x46\xcd\x26\xcc\xe5\xbc\x84'\
-b'\xb4\x02\xb4\x23\xb4\x23\xb4\x03\xbc\x84\xc4\xc5\xc4\xe5\xcd\x05'\
-b'\xcd\x26\xd5\x66\xd5\x67\xd5\x87\xcd\x26\xbc\x84\xc4\x84\xcd\x26'\
-b'\xd5\xa7\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xc7\xd5\x87'\
-b'\xcd\x05\xbc\x43\xb4\x23\xc4\xc5\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xc5'\
-b'\xc4\xa4\xc4\xa5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xa4\xb4\x23\xb4\x43'\
-b'\xcd\x06\xd5\x87\xd5\xa7\xdd\xc7\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xd5\x66\xbc\x84\xc4\xa5\xd5\x87\xd5\xa7\xd5\x87\xd5\x67'\
-b'\xd5\x46\xcd\x46\xcd\x06\xcd\x05\xc4\xe5\xbc\xa4\xb4\x03\xb4\x03'\
-b'\xbc\x44\xc4\xc5\xc4\xe5\xc4\xe5\xcd\x05\xcd\x26\xcd\x46\xd5\x67'\
-b'\xd5\x87\xd5\x87\xd5\x46\xbc\x64\xcd\x26\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xdd\xc7\xd5\xa7\xd5\xa7\xd5\x87\xcd\x26\xb4\x03'\
-b'\xbc\x84\xcd\x05\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc4\xc4\xc5'\
-b'\xc4\xc5\xc4\xe5\xc4\xe5\xc4\x84\xab\xe2\xcd\x05\xd5\x67\xd5\x67'\
-b'\xd5\x87\xd5\xa7\xdd\xc8\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\x87'\
-b'\xb4\x03\xcd\x25\xd5\xa7\xd5\x87\xd5\x67\xcd\x46\xcd\x46\xcd\x06'\
-b'\xcd\x05\xc4\xe5\xc4\xc5\xc4\xc5\xb4\x03\xab\xe2\xc4\xc4\xc4\xc5'\
-b'\xc4\xc5\xc4\xe5\xcd\x06\xcd\x26\xcd\x26\xd5\x46\xd5\x66\xd5\x87'\
-b'\xcd\x46\xb3\xe3\xd5\x46\xdd\xc7\xdd\xc7\xdd\xc7\xdd\xc7\xd5\xa7'\
-b'\xdd\xa7\xd5\xa7\xd5\x67\xd5\x66\xcd\x46\xbc\x64\xb4\x03\xc4\xe5'\
-b'\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xa5\xc4\xc5\xc4\xc5\xc4\xc5'\
-b'\xc4\xe5\xbc\x84\xab\xc2\xc4\xc5\xcd\x46\xd5\x46\xd5\x66\xd5\x87'\
-b'\xd5\x87\xd5\xa7\xdd\xa7\xdd\xa7\xd5\xa7\xd5\x87\xc4\x84\xb4\x03'\
-b'\xcd\x25\xcd\x66\xcd\x46\xcd\x46\xcd\x06\xcd\x05\xc4\xe5\xc4\xc5'\
-b'\xc4\xc5\xc4\xa4\xb4\x43\xb3\xe3\xb4\x03\xbc\x84\xc4\xa5\xc4\xc5'\
-b'\xc4\xe5\xcd\x05\xcd\x06\xcd\x26\xcd\x46\xd5\x67\xcd\x26\xbc\x84'\
-b'\xdd\xc8\xdd\xc8\xd5\xa7\xd5\x66\xc4\xe5\xbc\x64\xb4\x03\xab\xe2'\
-b'\xbc\x43\xbc\x64\xab\xe3\xb4\x03\xbc\x63\xc4\xa4\xc4\xe5\xcd\x26'\
-b'\xcd\x46\xcd\x05\xc4\xa4\xbc\x84\xbc\x84\xc4\xa4\xc5\x05\xcd\x46'\
-b'\xd5\x87\xdd\xa7\xdd\xc7\xd5\xa7\xd5\x67\xcd\x26\xc4\xe5\xc4\x84'\
-b'\xbc\x64\xbc\x64\xc4\xa4\xcd\x06\xc5\x05\xc4\xc5\xc4\xc5\xbc\xa4'\
-b'\xbc\x64\xb4\x23\xb4\x23\xbc\x84\xb4\x03\xb3\xe2\xb4\x43\xc4\xa4'\
-b'\xcd\x26\xd5\x86\xdd\xa7\xdd\xc8\xdd\xc7\xd5\x87\xcd\x26\xc4\xe5'\
-b'\xc4\xa4\xbc\x84\xc4\xc5\xcd\x06\xd5\x66\xd5\xa7\xdd\xa7\xd5\xa7'\
-b'\xd5\x67\xcd\x26\xc4\xa4\xb4\x23\xab\xc2\xb4\x23\xbc\x64\xb4\x03'\
-b'\xb4\x23\xbc\x84\xc4\xc5\xc5\x05\xcd\x06\xcd\x26\xcd\x66\xcd\x25'\
-b'\xc4\xa5\xbc\x64\xbc\x84\xc4\xe5\xcd\x46\xdd\xa7\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xd5\xa7\xd5\x46\xc4\xc5\xbc\x64\xbc\x43\xc4\xc5'\
-b'\xcd\x25\xcd\x05\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xa4\xbc\xa4\xbc\x84'\
-b'\xbc\x63\xbc\x84\xb4\x03\xb4\x03\xbc\x84\xcd\x26\xd5\x66\xd5\xa7'\
-b'\xdd\xc7\xdd\xc8\xdd\xe8\xdd\xe8\xd5\x87\xcd\x25\xc4\xa4\xbc\xa4'\
-b'\xcd\x06\xd5\x87\xdd\xc8\xdd\xc7\xd5\x87\xd5\x87\xd5\x66\xcd\x46'\
-b'\xc4\xe5\xbc\x84\xab\xe2\xb4\x23\xb4\x23\xbc\x43\xbc\xa4\xc4\xc5'\
-b'\xc4\xc5\xcd\x05\xcd\x26\xcd\x46\xd5\x66\xd5\x67\xcd\x26\xbc\x84'\
-b'\xbc\x84\xcd\x26\xdd\xc7\xdd\xe8\xe5\xe8\xe6\x08\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xc7\xd5\x66\xbc\xa4\xb4\x23\xc4\xa5\xcd\x06\xcd\x25'\
-b'\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xa5\xc4\xc5\xc4\xa4\xc4\xc5\xc4\xa4'\
-b'\xbc\x64\xab\xe3\xbc\xa4\xcd\x46\xd5\x67\xd5\x87\xdd\xc7\xdd\xc8'\
-b'\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8\xd5\x87\xc4\x84\xc4\xe5\xdd\xa7'\
-b'\xdd\xc8\xd5\xa7\xd5\xa7\xd5\x87\xd5\x67\xcd\x26\xcd\x26\xc4\xe5'\
-b'\xc4\xe5\xb4\x23\xb4\x03\xbc\x63\xc4\xa4\xc4\xc5\xc4\xc5\xc4\xe5'\
-b'\xcd\x05\xcd\x26\xcd\x46\xd5\x47\xd5\x87\xd5\x87\xc4\xa4\xbc\x84'\
-b'\xdd\xa7\xdd\xe8\xdd\xe8\xdd\xe8\xe5\xe8\xdd\xe8\xdd\xe8\xdd\xc7'\
-b'\xd5\xa7\xd5\x87\xcd\x26\xab\xe2\xc4\xc5\xcd\x26\xcd\x05\xc4\xe5'\
-b'\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xa4\xc4\xc5\xc4\xc5\xbc\x84'\
-b'\xab\xc2\xcc\xe5\xcd\x46\xd5\x46\xd5\x87\xd5\x87\xdd\xa7\xdd\xc8'\
-b'\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xc7\xc4\xc4\xbc\x64\xd5\xa7\xdd\xa7'\
-b'\xd5\x87\xd5\x87\xd5\x66\xcd\x46\xcd\x26\xcd\x06\xc4\xe5\xc4\xc5'\
-b'\xc4\xc4\xab\xc2\xb4\x23\xbc\xa4\xc4\xa5\xc4\xc5\xc4\xc5\xc4\xe5'\
-b'\xcd\x06\xcd\x26\xcd\x46\xd5\x46\xd5\x67\xcd\x25\xab\xe2\xcd\x26'\
-b'\xdd\xa7\xdd\xc7\xdd\xc8\xdd\xc7\xdd\xc7\xdd\xc7\xd5\xa7\xd5\x87'\
-b'\xd5\x87\xd5\x66\xcc\xe5\xab\xc2\xbc\xa4\xcd\x05\xc4\xe5\xc4\xc5'\
-b'\xc4\xc5\xc4\xa5\xc4\xa4\xbc\xa4\xc4\xa5\xc4\xc5\xc4\xc4\xab\xe3'\
-b'\xab\xe3\xc4\xc5\xcd\x26\xcd\x26\xd5\x46\xd5\x66\xd5\x87\xd5\x87'\
-b'\xd5\xa7\xdd\xa7\xd5\xa7\xd5\x66\xbc\x64\xb4\x02\xc4\xe5\xd5\x66'\
-b'\xd5\x66\xcd\x46\xcd\x46\xcd\x26\xcd\x06\xcd\x05\xc4\xe5\xc4\xe5'\
-b'\xcd\x06\xc4\xc5\xbc\xa4\xc4\xa4\xc4\xe5\xcd\x26\xd5\x66\xd5\xa7'\
-b'\xdd\xa7\xd5\xa7\xd5\x66\xcd\x25\xbc\xa4\xb4\x23\xab\xe3\xb4\x23'\
-b'\xbc\x64\xb4\x23\xb4\x03\xbc\x43\xbc\xa4\xc4\xc5\xcc\xe5\xcd\x26'\
-b'\xcd\x26\xc4\xc4\xbc\x84\xbc\x84\xc4\xa4\xc4\xc5\xcd\x25\xd5\x67'\
-b'\xd5\xc7\xdd\xc7\xdd\xc8\xdd\xc7\xd5\x86\xcd\x26\xc4\xc4\xbc\x84'\
-b'\xbc\x64\xbc\x84\xc4\xe5\xcd\x26\xcd\x26\xcd\x05\xc4\xe5\xc4\xa4'\
-b'\xbc\x84\xb4\x23\xb4\x03\xbc\x64\xb4\x23\xab\xc2\xb4\x23\xc4\xa4'\
-b'\xcd\x25\xd5\x67\xdd\xc7\xdd\xc7\xdd\xc8\xdd\xa7\xd5\x66\xcd\x05'\
-b'\xc4\xa4\xbc\x84\xc4\xa4\xcd\x05\xd5\x66\xd5\xa7\xdd\xc7\xdd\xa7'\
-b'\xd5\xa7\xd5\x67\xcd\x25\xc4\xa4\xb4\x23\xab\xc2\xb4\x23\xbc\x44'\
-b'\xb4\x23\xbc\x43\xbc\x84\xc4\xc5\xc4\xe5\xcd\x05\xcd\x26\xd5\x46'\
-b'\xcd\x25\xbc\x84\xbc\x64\xc4\xa4\xcd\x05\xd5\x87\xdd\xc8\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8\xd5\x87\xcd\x05\xbc\x84\xbc\x43'\
-b'\xbc\x84\xcd\x26\xcd\x26\xcd\x05\xc5\x05\xc4\xc5\xc4\xc5\xc4\xa4'\
-b'\xc4\xa4\xbc\x64\xbc\x64\xbc\x63\xab\xe2\xb4\x23\xc4\xc5\xd5\x46'\
-b'\xd5\x87\xd5\xa7\xdd\xc8\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xa7\xcd\x06'\
-b'\xc4\xa4\xc4\xa4\xcd\x26\xdd\xa8\xdd\xe8\xdd\xc8\xdd\xa7\xd5\x87'\
-b'\xd5\x67\xcd\x46\xcd\x26\xc4\xa4\xb4\x03\xac\x03\xbc\x43\xb4\x43'\
-b'\xbc\x84\xc4\xa4\xc4\xc5\xc4\xe5\xc4\xe5\xcd\x26\xcd\x46\xd5\x67'\
-b'\xd5\x87\xc4\xe5\xbc\x64\xc4\xc5\xd5\x87\xdd\xe8\xde\x08\xde\x09'\
-b'\xe6\x09\xde\x08\xdd\xe8\xdd\xe8\xdd\xc7\xd5\x87\xbc\xa4\xb4\x23'\
-b'\xc4\xe5\xcd\x26\xcd\x26\xcd\x05\xcc\xe5\xc4\xc5\xc4\xc5\xc4\xc5'\
-b'\xc4\xa5\xc4\xc5\xc4\xa4\xbc\x84\xab\xe3\xbc\x64\xcd\x46\xd5\x67'\
-b'\xd5\x87\xd5\xa7\xdd\xc8\xdd\xc8\xdd\xe8\xde\x08\xdd\xe8\xdd\xe8'\
-b'\xcd\x05\xc4\x84\xd5\xa7\xdd\xe8\xdd\xc8\xd5\xa7\xd5\xa7\xd5\x67'\
-b'\xd5\x66\xcd\x46\xcd\x06\xc5\x05\xc4\xc5\xb4\x02\xab\xe3\xbc\x84'\
-b'\xc4\xa5\xc4\xc5\xc4\xc5\xc4\xe5\xcd\x05\xcd\x06\xcd\x26\xcd\x46'\
-b'\xd5\x67\xd5\x87\xc4\xa4\xbc\x44\xdd\xc7\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xde\x08\xdd\xe8\xdd\xe8\xdd\xc8\xdd\xc8\xd5\xa7\xd5\x87\xbc\x63'\
-b'\xb4\x23\xcd\x26\xcd\x05\xc5\x06\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc4'\
-b'\xc4\xa5\xbc\xa4\xc4\xc5\xc4\xc5\xb4\x23\xb4\x03\xcd\x05\xcd\x26'\
-b'\xd5\x67\xd5\x87\xd5\x87\xdd\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xdd\xc8\xc4\xc5\xbc\x43\xdd\xa7\xd5\xa7\xd5\xa7\xd5\xa7\xd5\x67'\
-b'\xd5\x66\xcd\x46\xcd\x06\xc5\x05\xc4\xe5\xc4\xc5\xb4\x23\xab\xc2'\
-b'\xbc\xa4\xc4\xa5\xc4\xc4\xc4\xc5\xc4\xc5\xc4\xe6\xcd\x05\xcd\x26'\
-b'\xcd\x26\xd5\x46\xd5\x66\xbc\xa4\xb4\x03\xd5\x66\xdd\xa7\xdd\xc7'\
-b'\xdd\xc8\xdd\xc7\xdd\xc8\xdd\xc7\xd5\xc7\xd5\xa7\xd5\x87\xd5\x66'\
-b'\xc4\xe5\xab\xc2\xbc\x43\xcc\xe5\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xa4'\
-b'\xc4\xa4\xbc\xa4\xc4\xa5\xc4\xa4\xbc\xa4\xb4\x03\xab\xa2\xbc\x84'\
-b'\xc4\xe5\xcd\x26\xd5\x46\xd5\x67\xd5\xa7\xd5\xa8\xdd\xc8\xdd\xe8'\
-b'\xcd\x05\xd5\x66\xdd\xa7\xdd\xc8\xdd\xc8\xd5\xa7\xd5\x46\xcd\x05'\
-b'\xc4\xc5\xbc\x84\xbc\x84\xc4\xc5\xcd\x05\xd5\x46\xd5\x87\xdd\xc7'\
-b'\xdd\xc7\xd5\xa7\xd5\x66\xc5\x05\xbc\x84\xb4\x03\xab\xe2\xb4\x43'\
-b'\xbc\x64\xb4\x03\xb4\x23\xbc\x64\xc4\xa4\xc4\xe5\xcd\x05\xcd\x46'\
-b'\xcd\x26\xc4\xc5\xbc\x84\xbc\x84\xbc\x84\xc4\xe5\xcd\x26\xd5\x87'\
-b'\xdd\xc7\xdd\xe7\xdd\xe8\xdd\xc7\xdd\xa7\xcd\x46\xcc\xe5\xbc\xa4'\
-b'\xbc\x64\xbc\x84\xc4\xc5\xcd\x26\xcd\x46\xcd\x05\xcd\x05\xc4\xc5'\
-b'\xc4\xa4\xbc\x64\xb4\x23\xb4\x23\xbc\x64\xac\x03\xab\xe2\xbc\x44'\
-b'\xc4\xe5\xcd\x46\xd5\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\x67'\
-b'\xcd\x05\xc4\xa4\xbc\x84\xc4\xa5\xcd\x05\xd5\x87\xdd\xc7\xdd\xc8'\
-b'\xdd\xc7\xd5\xa7\xd5\x87\xd5\x46\xc4\xc4\xb4\x23\xab\xc2\xb4\x43'\
-b'\xbc\x64\xb4\x23\xbc\x64\xbc\xa4\xc4\xc5\xc4\xe5\xcd\x05\xcd\x26'\
-b'\xd5\x66\xd5\x67\xc4\xe5\xbc\x84\xbc\x64\xc4\xc5\xd5\x66\xdd\xc8'\
-b'\xdd\xe8\xdd\xe8\xe6\x08\xde\x08\xdd\xe8\xdd\xe8\xdd\x87\xcd\x06'\
-b'\xbc\x84\xb4\x43\xc4\xa5\xcd\x46\xcd\x26\xcd\x26\xcd\x05\xc4\xe5'\
-b'\xc4\xc5\xc4\xa4\xc4\xa4\xbc\x84\xbc\x64\xbc\x64\xab\xe2\xb4\x23'\
-b'\xc4\xc5\xcd\x46\xd5\x87\xdd\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xde\x08'\
-b'\xdd\xe8\xd5\x87\xc4\xe5\xbc\x84\xcc\xe5\xd5\x87\xdd\xe8\xdd\xc8'\
-b'\xdd\xc7\xdd\xa7\xd5\x87\xd5\x67\xcd\x46\xcd\x26\xc4\xc5\xb3\xe2'\
-b'\xb4\x03\xb4\x23\xbc\x64\xc4\xa4\xc4\xc4\xc4\xc5\xc4\xe5\xcd\x05'\
-b'\xcd\x26\xd5\x46\xd5\x67\xd5\x87\xcd\x26\xbc\x64\xc4\xc5\xd5\xa7'\
-b'\xe5\xe8\xe6\x09\xde\x09\xe6\x09\xde\x08\xde\x08\xdd\xe8\xdd\xc8'\
-b'\xdd\xc7\xcd\x46\xb4\x23\xbc\x84\xcd\x46\xcd\x26\xcd\x05\xc4\xe5'\
-b'\xc4\xc5\xc4\xc5\xc4\xa4\xc4\xa5\xc4\xa5\xc4\xc4\xc4\xc5\xbc\x64'\
-b'\xb3\xe3\xc4\xe5\xcd\x46\xd5\x67\xd5\x87\xdd\xc8\xdd\xc8\xdd\xe8'\
-b'\xdd\xe8\xde\x08\xe6\x08\xdd\xe8\xcd\x05\xbc\x64\xd5\xa7\xdd\xc8'\
-b'\xdd\xc7\xdd\xc7\xd5\xa7\xd5\x67\xcd\x67\xcd\x46\xcd\x26\xcd\x05'\
-b'\xc4\xe5\xbc\x64\xab\xa2\xbc\x63\xbc\xa4\xc4\xa5\xc4\xc5\xc4\xc5'\
-b'\xcc\xe5\xcd\x06\xcd\x26\xcd\x46\xd5\x66\xd5\x67\xd5\x87\xb4\x03'\
-b'\xc4\xe5\xdd\xe8\xdd\xe8\xe5\xe8\xde\x08\xe6\x08\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x66\xbc\x64\xb4\x03\xcd\x25\xcd\x06'\
-b'\xc4\xe5\xc4\xe5\xc4\xc5\xc4\xc5\xbc\xa4\xc4\xa4\xc4\xa4\xc4\xc5'\
-b'\xc4\xc4\xbc\x64\xa3\xa2\xc4\xe5\xcd\x26\xd5\x66\xd5\x67\xd5\x87'\
-b'\xd5\xa7\xdd\xc8\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xa7\xb4\x23'\
-b'\xcc\xe5\xd5\xc7\xd5\xa7\xd5\x87\xd5\x87\xd5\x66\xcd\x46\xcd\x26'\
-b'\xcd\x26\xc4\xe5\xc4\xc5\xc4\xc5\xb4\x23\xab\xc2\xbc\x64\xbc\xa4'\
-b'\xbc\xa5\xc4\xc5\xc4\xc5\xc4\xe5\xcd\x05\xcd\x06\xcd\x26\xd5\x46'\
-b'\xd5\x66\xc4\xe5\xab\xe2\xc4\xe5\xdd\xa7\xdd\xc7\xdd\xc7\xdd\xc8'\
-b'\xdd\xc8\xdd\xc7\xd5\xa7\xd5\xa7\xd5\x87\xd5\x66\xcd\x46\xbc\x44'\
-b'\xab\xa2\xbc\x84\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xc5'\
-b'\xbc\x64\xb4\x03\xb4\x23\xbc\x84\xb4\x23\xab\xe2\xb4\x23\xbc\xa4'\
-b'\xcd\x05\xd5\x87\xdd\xa7\xdd\xc7\xdd\xc8\xd5\xa7\xd5\x66\xcd\x05'\
-b'\xc4\xa5\xbc\x84\xbc\x84\xc4\xa5\xcd\x05\xd5\x66\xd5\xa7\xdd\xc7'\
-b'\xdd\xc8\xdd\xc7\xd5\x66\xcd\x05\xbc\x84\xb4\x03\xab\xc2\xb4\x23'\
-b'\xbc\x63\xb4\x03\xb4\x23\xbc\x63\xc4\xa4\xc4\xe5\xcd\x25\xd5\x46'\
-b'\xd5\x66\xcd\x26\xc4\xa5\xbc\x84\xbc\x84\xc4\xa4\xcd\x05\xd5\x47'\
-b'\xd5\xa7\xdd\xe8\xdd\xe8\xe5\xe8\xdd\xc7\xdd\xa7\xcd\x66\xc4\xe5'\
-b'\xbc\x84\xbc\x64\xbc\x64\xc4\xc5\xcd\x46\xcd\x25\xcc\xe5\xc4\xe5'\
-b'\xc4\xc4\xc4\xa4\xbc\x64\xb4\x43\xbc\x43\xbc\x84\xac\x03\xab\xe2'\
-b'\xbc\x43\xc4\xe5\xd5\x66\xd5\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xd5\xa7\xd5\x46\xc4\xc5\xbc\x84\xc4\xa4\xcd\x05\xd5\x87\xdd\xc8'\
-b'\xdd\xc8\xdd\xc7\xdd\xc7\xd5\x87\xd5\x66\xcd\x26\xbc\xa4\xb4\x03'\
-b'\xab\xc2\xb4\x43\xb4\x23\xb4\x23\xbc\x84\xc4\xa4\xc4\xc5\xcd\x05'\
-b'\xcd\x26\xd5\x46\xd5\x87\xd5\x87\xcd\x26\xc4\xa4\xbc\x84\xc4\xc5'\
-b'\xcd\x46\xdd\xc8\xde\x08\xde\x08\xe6\x08\xdd\xe9\xdd\xe8\xdd\xe8'\
-b'\xdd\xc8\xd5\x66\xc4\xc5\xb4\x43\xbc\x64\xcd\x25\xcd\x26\xcd\x06'\
-b'\xcd\x05\xc4\xc5\xc4\xc5\xbc\xa4\xbc\xa4\xc4\xa4\xbc\xa4\xbc\x84'\
-b'\xbc\x44\xb3\xe2\xbc\x63\xcd\x26\xd5\x87\xdd\xa7\xdd\xc8\xdd\xe8'\
-b'\xdd\xe8\xde\x08\xde\x09\xde\x08\xdd\xa8\xcd\x05\xbc\x84\xc4\xe5'\
-b'\xd5\xa7\xdd\xe8\xdd\xc8\xdd\xc8\xd5\xa7\xd5\x87\xd5\x67\xcd\x26'\
-b'\xcd\x06\xc4\xe5\xbc\x63\xab\xe2\xb4\x23\xb4\x43\xc4\x84\xc4\xa5'\
-b'\xc4\xc5\xc4\xe5\xcd\x05\xcd\x46\xd5\x47\xd5\x87\xd5\xa7\xdd\xa7'\
-b'\xcd\x26\xbc\x64\xcd\x26\xdd\xe8\xe6\x08\xe6\x09\xde\x09\xe6\x29'\
-b'\xde\x08\xde\x08\xdd\xe8\xdd\xe8\xd5\xc7\xd5\x66\xb4\x23\xbc\x84'\
-b'\xcd\x26\xcd\x06\xcd\x05\xc4\xe5\xc4\xc5\xc4\xa4\xbc\xa4\xc4\xa5'\
-b'\xc4\xa5\xc4\xc5\xc4\xc5\xc4\xa5\xab\xc2\xc4\xc5\xd5\x46\xd5\x87'\
-b'\xd5\xa7\xdd\xc8\xdd\xc8\xdd\xe8\xe6\x08\xde\x08\xde\x08\xdd\xe8'\
-b'\xdd\xe8\xbc\x84\xc4\xa4\xdd\xc8\xdd\xc8\xd5\xc7\xd5\xa7\xd5\x87'\
-b'\xd5\x67\xcd\x46\xcd\x06\xcd\x06\xc4\xe5\xc4\xc5\xbc\x64\xa3\x81'\
-b'\xbc\x64\xc4\xa4\xc4\xa4\xc4\xc5\xc4\xe5\xc4\xe6\xcd\x06\xcd\x46'\
-b'\xcd\x47\xd5\x67\xd5\x87\xdd\xa7\xbc\x84\xbc\x64\xdd\xe7\xdd\xe8'\
-b'\xde\x08\xde\x08\xde\x08\xdd\xe8\xdd\xe8\xdd\xe8\xd5\xc8\xd5\xa7'\
-b'\xd5\x87\xcd\x46\xab\xc2\xbc\x84\xcd\x05\xc4\xe5\xc4\xe5\xc4\xc5'\
-b'\xc4\xc5\xc4\xa4\xc4\xa5\xc4\xa4\xc4\xa5\xc4\xc5\xc4\xc5\xbc\x43'\
-b'\xab\xe2\xcd\x06\xcd\x46\xd5\x67\xd5\x87\xd5\xa7\xdd\xc8\xdd\xc8'\
-b'\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc7\xbc\x84\xbc\x43\xd5\x87'\
-b'\xd5\xa7\xd5\x87\xd5\x66\xd5\x66\xcd\x46\xcd\x06\xcd\x05\xc4\xe5'\
-b'\xc4\xc5\xc4\xa4\xbc\x64\xab\xe2\xab\xe2\xbc\x64\xbc\xa4\xbc\xa5'\
-b'\xc4\xc5\xc4\xe5\xcd\x05\xcd\x06\xcd\x26\xcd\x46\xd5\x66\xd5\x66'\
-b'\xc4\xa4\xab\xe3\xc4\xc5\xdd\xc7\xdd\xe8\xde\x08\xe6\x09\xde\x09'\
-b'\xc4\xa5\xc4\xa5\xc5\x06\xcd\x46\xcd\x06\xc4\xe5\xc4\xa5\xbc\x84'\
-b'\xbc\x64\xb4\x23\xbc\x44\xbc\x84\xb4\x23\xb3\xe3\xb4\x43\xc4\xa4'\
-b'\xcd\x26\xd5\x87\xdd\xc7\xdd\xe8\xdd\xe8\xdd\xc7\xd5\x87\xcd\x46'\
-b'\xc4\xe5\xc4\xa4\xbc\x84\xbc\xa4\xc4\xe5\xcd\x26\xd5\x87\xdd\xc7'\
-b'\xdd\xc8\xdd\xc7\xd5\xa7\xd5\x46\xc4\xe5\xbc\x43\xab\xc2\xab\xc2'\
-b'\xb4\x44\xb4\x03\xab\xe2\xbc\x23\xbc\xa4\xc4\xe5\xcd\x26\xd5\x66'\
-b'\xd5\x87\xd5\x87\xd5\x66\xc4\xe5\xbc\xa4\xbc\x84\xc4\xa4\xcc\xe5'\
-b'\xd5\x66\xd5\xa7\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xcd\x26\xc4\xc5\xbc\x64\xb4\x43\xbc\x84\xcd\x06\xcd\x05\xc4\xc5'\
-b'\xc4\xc5\xbc\xa4\xbc\x84\xc4\x84\xbc\x84\xbc\x64\xc4\xa4\xbc\x44'\
-b'\xab\xe2\xb4\x43\xc4\xe5\xd5\x66\xdd\xa7\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xde\x08\xdd\xe8\xdd\xc8\xd5\x67\xc4\xe5\xbc\x84\xc4\xa4\xc4\xe5'\
-b'\xd5\x87\xdd\xc8\xdd\xc8\xdd\xc8\xdd\xa7\xd5\x87\xcd\x46\xcd\x26'\
-b'\xc4\xc5\xb4\x23\xab\xc2\xb4\x23\xb4\x03\xb4\x03\xbc\x84\xc4\xc4'\
-b'\xc4\xe5\xcd\x26\xd5\x46\xd5\x67\xd5\x87\xdd\xc7\xdd\xa7\xcd\x26'\
-b'\xbc\xa4\xbc\x84\xc4\xe5\xd5\x87\xdd\xe8\xde\x08\xde\x08\xde\x08'\
-b'\xdd\xe8\xde\x08\xdd\xe8\xdd\xc8\xd5\x67\xc4\xc5\xb4\x23\xbc\x64'\
-b'\xcd\x05\xc5\x05\xc4\xe5\xc4\xc5\xc4\xa4\xbc\xa4\xc4\xa4\xbc\xa5'\
-b'\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xa4\xb3\xe3\xb4\x43\xcd\x26\xdd\xa7'\
-b'\xdd\xc8\xdd\xe8\xdd\xe8\xde\x09\xde\x09\xe6\x09\xde\x08\xde\x08'\
-b'\xdd\xa7\xc4\xc5\xbc\x64\xcd\x26\xdd\xc8\xdd\xc8\xdd\xc7\xd5\xa7'\
-b'\xd5\x87\xcd\x67\xcd\x26\xcd\x05\xc4\xe5\xc4\xc5\xbc\x64\xab\xe3'\
-b'\xab\xe2\xbc\x43\xc4\xa5\xc4\xc5\xc4\xe5\xcd\x26\xcd\x46\xd5\x66'\
-b'\xd5\x87\xd5\xa8\xdd\xc8\xdd\xc8\xd5\x87\xbc\x84\xcc\xe5\xdd\xe8'\
-b'\xe6\x09\xde\x08\xde\x09\xde\x09\xde\x08\xdd\xe8\xdd\xe8\xdd\xc8'\
-b'\xd5\xa7\xd5\x87\xc4\xe5\xab\xc2\xc4\xc5\xc5\x05\xc4\xe5\xc4\xc5'\
-b'\xc4\xa5\xbc\xa4\xc4\xa5\xc4\xa4\xc4\xc5\xc4\xc5\xc4\xe5\xcd\x06'\
-b'\xc4\xa5\xab\xc2\xcd\x26\xd5\x87\xd5\xa7\xdd\xc8\xdd\xe8\xdd\xe9'\
-b'\xde\x08\xe6\x09\xde\x08\xde\x08\xe6\x08\xdd\xe8\xc4\xe5\xb4\x23'\
-b'\xdd\xa7\xdd\xa7\xd5\xa8\xd5\x87\xd5\x67\xd5\x46\xcd\x26\xcd\x05'\
-b'\xc4\xe5\xc4\xc5\xc4\xa4\xbc\xa4\xab\xe3\xab\xc2\xbc\xa4\xc4\xc5'\
-b'\xc4\xc5\xcc\xe5\xcd\x06\xcd\x26\xd5\x47\xd5\x67\xd5\x87\xdd\xa7'\
-b'\xdd\xa8\xdd\xc7\xbc\x64\xbc\x84\xdd\xe8\xe6\x08\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xc7\xd5\xa7\xd5\x87\xd5\x66\xcd\x26'\
-b'\xb4\x23\xb4\x03\xc4\xc5\xc4\xc5\xc4\xc5\xc4\xa4\xc4\xa5\xc4\xa4'\
-b'\xbc\xa4\xc4\xa5\xc4\xc5\xc4\xc5\xc4\xe5\xc4\xc5\xab\xc2\xbc\x64'\
-b'\xd5\x66\xd5\x67\xd5\xa7\xdd\xa8\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xdd\xe8\xd5\x87\xbc\x43\xb4\x23\xd5\x46\xd5\x66'\
-b'\xd5\x66\xcd\x46\xcd\x26\xcd\x05\xc4\xe5\xc4\xc5\xc4\xc5\xc4\xa4'\
-b'\xbc\x84\xb4\x43\xab\xc2\xb4\x03\xbc\x44\xc4\xc5\xc4\xe5\xcc\xe6'\
-b'\xe6\x09\xde\x09\xde\x08\xdd\xc8\xd5\x87\xcd\x25\xc4\xc5\xbc\x84'\
-b'\xbc\x43\xbc\x64\xc4\xa4\xc5\x05\xc4\xc5\xbc\xa4\xbc\x84\xbc\x84'\
-b'\xbc\x84\xbc\x64\xbc\xa4\xc4\xc5\xbc\x64\xb4\x23\xbc\x43\xc4\x84'\
-b'\xc4\xe5\xd5\x67\xdd\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe7\xdd\xa7'\
-b'\xcd\x66\xc5\x05\xc4\xa4\xbc\x84\xbc\x84\xc4\xc5\xcd\x26\xd5\x87'\
-b'\xdd\xc7\xdd\xc7\xd5\xa7\xd5\x67\xcd\x26\xc4\xc5\xbc\x43\xab\xc2'\
-b'\xab\xc2\xb4\x23\xab\xc2\xab\xc2\xbc\x43\xc4\xa5\xcd\x26\xd5\x66'\
-b'\xd5\x87\xdd\xa7\xdd\xc8\xdd\xa7\xd5\x66\xc4\xe5\xc4\xa4\xbc\x64'\
-b'\xc4\xa4\xcd\x05\xd5\x87\xdd\xc7\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\x87\xcd\x26\xbc\x84\xb4\x23\xb4\x23\xc4\xc5\xc4\xe5'\
-b'\xc4\xc4\xc4\xa4\xc4\xa4\xbc\x84\xbc\xa4\xc4\xa5\xc4\xc5\xc4\xe5'\
-b'\xcd\x05\xbc\xa4\xb4\x23\xbc\x43\xc4\xe5\xd5\x66\xdd\xc8\xdd\xe8'\
-b'\xe6\x08\xdd\xe8\xe6\x08\xdd\xe8\xde\x08\xdd\xc8\xd5\x66\xc4\xc5'\
-b'\xbc\x84\xc4\xa4\xcd\x26\xd5\xa7\xdd\xc8\xd5\xa7\xd5\x87\xd5\x66'\
-b'\xcd\x26\xcd\x05\xc4\xe5\xbc\x84\xb4\x23\xab\xe3\xb4\x23\xab\xc2'\
-b'\xb4\x23\xc4\xa5\xcd\x05\xcd\x46\xd5\x67\xd5\x87\xdd\xa8\xdd\xc8'\
-b'\xdd\xe8\xdd\xe8\xd5\x87\xc4\xe5\xbc\x84\xc4\xc5\xd5\x86\xdd\xe8'\
-b'\xdd\xe8\xe6\x09\xde\x09\xe5\xe8\xdd\xe9\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xcd\x26\xbc\x43\xab\xe2\xbc\xa4\xc4\xc5\xc4\xc5\xc4\xa4\xbc\xa4'\
-b'\xbc\xa4\xc4\xa5\xc4\xa5\xc4\xc5\xc4\xe5\xcd\x06\xcd\x46\xc4\xe5'\
-b'\xb4\x03\xc4\xa4\xd5\x87\xdd\xe8\xde\x08\xde\x09\xde\x09\xe6\x09'\
-b'\xde\x09\xe6\x09\xe6\x08\xde\x09\xdd\xe8\xcd\x46\xbc\x43\xc4\xe5'\
-b'\xdd\xc8\xd5\xa7\xd5\xa7\xd5\x67\xcd\x46\xcd\x26\xcd\x05\xc4\xc5'\
-b'\xc4\xa5\xc4\xa4\xbc\x84\xbc\x43\xab\xe3\xb4\x03\xc4\xc5\xc4\xe5'\
-b'\xcd\x26\xcd\x46\xd5\x67\xd5\x87\xdd\xa8\xdd\xc8\xdd\xe8\xdd\xe8'\
-b'\xde\x08\xdd\xa7\xbc\x44\xcd\x26\xdd\xe8\xe6\x09\xe6\x08\xde\x09'\
-b'\xde\x08\xdd\xe8\xdd\xe8\xd5\xa8\xd5\xa7\xd5\x67\xd5\x46\xcc\xe5'\
-b'\xab\xc2\xbc\x64\xc4\xc4\xc4\xa4\xc4\xa5\xbc\x84\xc4\xa4\xc4\xa5'\
-b'\xc4\xa5\xc4\xe5\xcc\xe5\xcd\x06\xcd\x26\xcd\x46\xb4\x23\xbc\x64'\
-b'\xdd\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xde\x08\xde\x09\xe6\x09\xde\x09'\
-b'\xe6\x08\xde\x08\xdd\xe8\xdd\xe8\xbc\x84\xbc\x43\xd5\x87\xd5\x87'\
-b'\xd5\x67\xcd\x46\xcd\x26\xcd\x06\xc4\xe5\xc4\xc5\xc4\xc5\xbc\xa4'\
-b'\xbc\x84\xbc\xa4\xb4\x03\xab\xa2\xc4\xa5\xc4\xe5\xcd\x06\xcd\x26'\
-b'\xd5\x46\xd5\x67\xd5\x87\xd5\xa7\xdd\xc8\xdd\xc8\xdd\xe8\xdd\xe8'\
-b'\xd5\x46\xac\x03\xd5\x66\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc8'\
-b'\xdd\xc8\xd5\xa7\xd5\x87\xd5\x66\xcd\x46\xcd\x06\xc4\xe5\xab\xe2'\
-b'\xab\xc2\xc4\xa4\xc4\xa4\xbc\xa4\xbc\x84\xc4\xa4\xc4\xa5\xc4\xc5'\
-b'\xc4\xc5\xcc\xe5\xcd\x05\xcd\x06\xcd\x05\xb4\x03\xb4\x03\xcd\x66'\
-b'\xd5\xa7\xdd\xc8\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xc8\xdd\xa7\xc4\xc5\xab\xc2\xbc\x84\xcd\x46\xd5\x66'\
-b'\xcd\x46\xcd\x05\xc4\xa5\xbc\x84\xbc\x84\xc4\xc5\xcd\x26\xd5\x87'\
-b'\xdd\xa7\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc7\xd5\x87\xcd\x25\xc4\xa4'\
-b'\xbc\x43\xb4\x03\xb4\x23\xc4\xa4\xbc\x84\xbc\x43\xbc\x64\xbc\x84'\
-b'\xbc\xa4\xc4\xc5\xc4\xe5\xcd\x26\xcd\x26\xc4\xc4\xbc\x64\xbc\x64'\
-b'\xc4\x84\xc4\xe5\xcd\x46\xdd\x87\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xa7\xd5\x46\xc4\xe5\xc4\xa4\xbc\x64\xbc\x84\xc4\xe5'\
-b'\xd5\x46\xd5\xa7\xd5\x87\xd5\x67\xcd\x46\xcd\x05\xc4\xc5\xbc\x84'\
-b'\xb4\x23\xab\xe2\xb4\x23\xb4\x03\xa3\xa2\xb4\x03\xc4\xa4\xcd\x26'\
-b'\xd5\x87\xdd\xc7\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8\xd5\x87\xcd\x25'\
-b'\xc4\xa4\xbc\x64\xbc\xa4\xcd\x25\xd5\x87\xdd\xe8\xdd\xe8\xde\x08'\
-b'\xdd\xe8\xdd\xe8\xdd\xc8\xdd\xa7\xcd\x66\xc4\xc4\xb4\x03\xab\xc2'\
-b'\xbc\x44\xbc\x64\xbc\x64\xbc\x84\xbc\x84\xc4\x84\xc4\xa4\xc4\xe5'\
-b'\xcd\x06\xcd\x46\xd5\x67\xd5\x66\xc4\xa5\xbc\x44\xbc\x84\xcd\x05'\
-b'\xd5\xa7\xdd\xe8\xde\x08\xe6\x09\xde\x08\xe6\x09\xdd\xe8\xde\x09'\
-b'\xdd\xe8\xdd\xa7\xcd\x05\xbc\x84\xbc\x64\xcc\xe5\xd5\x87\xd5\x87'\
-b'\xd5\x67\xcd\x46\xcd\x06\xc4\xe5\xc4\xc5\xc4\xa4\xbc\x84\xbc\x64'\
-b'\xbc\x43\xbc\x44\xab\xc2\xb4\x03\xc4\xc5\xd5\x46\xd5\x87\xdd\xa7'\
-b'\xdd\xc8\xdd\xe8\xde\x08\xde\x09\xe6\x08\xdd\xe8\xdd\xa7\xc4\xe5'\
-b'\xbc\x64\xc4\xe5\xdd\xa7\xdd\xe8\xe6\x09\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xdd\xc8\xdd\xa7\xd5\x87\xd5\x66\xcd\x25\xbc\x64\xab\xc2\xb4\x43'\
-b'\xbc\x64\xbc\xa4\xbc\x84\xc4\x84\xc4\xc5\xc4\xc5\xcc\xe5\xcd\x26'\
-b'\xcd\x46\xd5\x87\xd5\xa7\xd5\x87\xc4\xa4\xbc\x64\xd5\x66\xde\x08'\
-b'\xe6\x09\xe6\x09\xde\x09\xe6\x29\xe6\x09\xde\x09\xde\x09\xde\x08'\
-b'\xde\x08\xdd\xe8\xcd\x06\xb4\x23\xcd\x26\xd5\x87\xd5\x66\xcd\x46'\
-b'\xcd\x06\xcc\xe5\xc4\xe5\xc4\xa5\xbc\xa4\xc4\xa4\xbc\x84\xc4\xa5'\
-b'\xbc\xa4\xab\xe3\xb4\x03\xcd\x05\xcd\x46\xd5\x67\xd5\xa7\xdd\xa8'\
-b'\xdd\xc8\xdd\xe8\xde\x09\xe6\x08\xe6\x09\xde\x08\xde\x08\xc4\xe5'\
-b'\xb4\x23\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xd5\x87\xd5\x67\xcd\x46\xcd\x26\xc4\xe5\xc4\x84\xa3\x82\xbc\x43'\
-b'\xbc\x84\xbc\x84\xbc\xa4\xc4\xa5\xc4\xc5\xc4\xe5\xcd\x05\xcd\x26'\
-b'\xcd\x46\xd5\x67\xd5\x87\xdd\xa7\xbc\x64\xbc\x44\xdd\xc8\xdd\xe8'\
-b'\xde\x08\xe6\x09\xde\x09\xe6\x08\xde\x29\xde\x08\xdd\xe8\xdd\xe8'\
-b'\xdd\xc8\xdd\xc8\xd5\x46\xab\xc2\xc4\xe5\xcd\x46\xcd\x26\xcd\x05'\
-b'\xc4\xe5\xc4\xc5\xc4\xc5\xbc\xa4\xc4\x84\xbc\x84\xbc\x84\xc4\xa4'\
-b'\xc4\xa5\xab\xc2\xb4\x23\xcd\x05\xcd\x26\xd5\x67\xd5\x67\xd5\xa7'\
-b'\xd5\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xe5\xe8\xdd\xe8\xe5\xe8\xd5\x87'\
-b'\xb4\x03\xc4\xe5\xdd\xc8\xdd\xc8\xdd\xc8\xd5\xa7\xd5\xa7\xd5\x87'\
-b'\xd5\x66\xcd\x26\xcd\x26\xc5\x05\xc4\xc5\xc4\xa5\xb4\x23\xab\xa2'\
-b'\xb4\x03\xbc\x84\xbc\x84\xc4\x84\xc4\xa4\xc4\xc5\xc4\xe5\xcd\x06'\
-b'\xcd\x26\xcd\x46\xd5\x66\xd5\x67\xc5\x05\xb4\x03\xbc\x44\xd5\x87'\
-b'\xc4\xa5\xcd\x05\xd5\x67\xdd\xc7\xdd\xe8\xe6\x08\xe6\x08\xdd\xe8'\
-b'\xd5\xa7\xd5\x46\xcd\x05\xc4\xa4\xbc\x64\xbc\x64\xc4\xa5\xcd\x06'\
-b'\xd5\x66\xd5\xa7\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\x87\xcd\x26'\
-b'\xc4\xa4\xb4\x03\xab\xa2\xb4\x02\xbc\x43\xab\xe3\xb4\x03\xbc\x43'\
-b'\xc4\xa4\xc4\xe6\xcd\x46\xd5\x67\xd5\xa7\xd5\xa7\xd5\x66\xcc\xe5'\
-b'\xbc\xa4\xbc\x64\xbc\x84\xc4\xe5\xd5\x46\xd5\xa7\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xe5\xe8\xdd\xe8\xdd\xe7\xd5\x87\xcd\x26\xc4\xa4\xbc\x64'\
-b'\xbc\x44\xbc\xa4\xcd\x26\xd5\x46\xcd\x26\xc4\xe5\xc4\xc5\xbc\xa4'\
-b'\xbc\x84\xbc\x64\xbc\x64\xbc\x64\xbc\xa4\xb4\x03\xb3\xe2\xbc\x64'\
-b'\xcd\x05\xd5\x87\xdd\xc8\xdd\xe8\xe6\x08\xdd\xe8\xe6\x08\xe5\xe8'\
-b'\xdd\xe8\xd5\xa7\xcd\x26\xc4\xa5\xbc\x64\xbc\xa4\xcd\x26\xdd\xa7'\
-b'\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x87\xd5\x67\xcd\x26'\
-b'\xbc\x84\xab\xe2\xab\xc2\xb4\x23\xab\xe3\xb4\x23\xbc\x84\xc4\xc5'\
-b'\xc4\xe5\xcd\x26\xd5\x47\xd5\x87\xd5\xa7\xdd\xc8\xdd\xc8\xd5\x46'\
-b'\xc4\xa5\xbc\x64\xc4\xc5\xd5\x66\xdd\xc8\xde\x08\xde\x09\xe6\x09'\
-b'\xde\x08\xe6\x08\xde\x09\xe6\x08\xdd\xe8\xdd\xa7\xc4\xe5\xb4\x43'\
-b'\xbc\x44\xc5\x05\xcd\x26\xcd\x26\xc4\xe5\xc4\xc5\xbc\xa4\xbc\x84'\
-b'\xbc\x84\xc4\x84\xc4\xa5\xc4\xc5\xc4\xc5\xc4\xa4\xab\xe3\xbc\x64'\
-b'\xcd\x46\xdd\xa7\xdd\xe8\xdd\xe8\xde\x09\xe6\x09\xe6\x09\xde\x09'\
-b'\xde\x09\xe6\x09\xde\x08\xd5\x87\xbc\x85\xbc\x64\xd5\x66\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa8\xd5\x87\xd5\x66\xcd\x46\xcd\x05'\
-b'\xc4\xe5\xc4\xa4\xb4\x03\xab\xe2\xab\xe3\xbc\x64\xc4\xa4\xc4\xc5'\
-b'\xc4\xe5\xcd\x26\xcd\x46\xd5\x66\xd5\xa7\xdd\xc8\xdd\xc8\xdd\xe8'\
-b'\xdd\xe8\xcd\x06\xbc\x64\xd5\x87\xe6\x08\xde\x09\xe6\x29\xe6\x09'\
-b'\xde\x29\xde\x09\xe6\x08\xde\x08\xdd\xe8\xdd\xc8\xdd\xa8\xd5\x66'\
-b'\xb4\x03\xbc\x64\xcd\x26\xc5\x05\xc4\xe5\xc4\xc5\xc4\xa4\xbc\xa4'\
-b'\xbc\x84\xc4\xa4\xbc\xa4\xc4\xc5\xc4\xc5\xcd\x06\xc4\xe5\xab\xc2'\
-b'\xc4\xc5\xd5\x87\xdd\xc8\xdd\xe8\xdd\xe8\xde\x09\xde\x09\xe6\x09'\
-b'\xde\x29\xde\x08\xe6\x09\xde\x08\xde\x08\xcd\x26\xb3\xe3\xd5\xa7'\
-b'\xdd\xe8\xdd\xc8\xdd\xa7\xd5\xa7\xd5\x67\xd5\x66\xcd\x26\xcd\x06'\
-b'\xc4\xe5\xc4\xc5\xbc\xa4\xbc\x84\xab\xc2\xab\xc2\xbc\x84\xc4\xa4'\
-b'\xc4\xc5\xc4\xe5\xcd\x06\xcd\x46\xd5\x46\xd5\x87\xd5\xa8\xdd\xa8'\
-b'\xdd\xc8\xdd\xe8\xdd\xc7\xb4\x03\xc4\xc5\xde\x08\xe6\x08\xde\x09'\
-b'\xe6\x08\xde\x09\xde\x08\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa8\xd5\x87'\
-b'\xd5\x66\xcd\x26\xab\xc2\xbc\x44\xc4\xe5\xc4\xc5\xc4\xa4\xbc\xa5'\
-b'\xc4\xa4\xbc\x84\xbc\x84\xc4\xa5\xc4\xc5\xc4\xc5\xc4\xe5\xcd\x05'\
-b'\xbc\x84\xab\xa2\xcd\x05\xd5\x87\xd5\xa7\xdd\xc8\xdd\xc8\xdd\xe8'\
-b'\xdd\xe8\xde\x09\xde\x08\xe6\x09\xde\x08\xdd\xe8\xdd\xe8\xc4\xe5'\
-b'\xab\xe2\xc4\xe5\xd5\x87\xd5\x87\xd5\x67\xd5\x66\xcd\x46\xcd\x06'\
-b'\xcc\xe5\xc4\xe5\xc4\xc5\xc4\xa4\xbc\x84\xbc\x64\xab\xe2\xab\xc3'\
-b'\xbc\x84\xbc\x84\xbc\x84\xc4\xa5\xc5\x06\xcd\x06\xbc\x84\xbc\x44'\
-b'\xbc\x64\xbc\x84\xc4\xe5\xcd\x46\xd5\x87\xdd\xc8\xdd\xe8\xde\x08'\
-b'\xdd\xe8\xdd\xe8\xdd\xa7\xd5\x67\xcd\x05\xc4\xa4\xbc\x64\xbc\x64'\
-b'\xc4\xc4\xcd\x06\xd5\x67\xd5\xc7\xdd\xc8\xdd\xc7\xd5\xa7\xd5\x66'\
-b'\xcd\x26\xc4\xc4\xb4\x23\xab\xa2\xab\xc2\xb4\x03\xab\xa2\xab\xc2'\
-b'\xbc\x44\xc4\xe5\xd5\x66\xd5\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xdd\xa7\xd5\x66\xc4\xe5\xbc\x64\xbc\x64\xc4\xa4\xcd\x06\xd5\x87'\
-b'\xdd\xc7\xdd\xe8\xde\x08\xdd\xe8\xde\x08\xdd\xe8\xdd\xc8\xd5\x87'\
-b'\xcc\xe5\xbc\x63\xb4\x03\xb4\x43\xc4\xc5\xc4\xa5\xbc\xa4\xbc\x84'\
-b'\xbc\x84\xbc\x84\xbc\x84\xc4\xa5\xc4\xe5\xcd\x26\xcd\x46\xc4\xe5'\
-b'\xbc\x64\xbc\x43\xc4\xa4\xcd\x26\xdd\xa7\xdd\xe8\xde\x09\xde\x08'\
-b'\xde\x09\xe6\x09\xde\x08\xde\x08\xdd\xe8\xd5\x87\xcd\x05\xbc\x64'\
-b'\xbc\x64\xc4\xe5\xd5\x67\xdd\xc8\xdd\xc7\xd5\xa7\xd5\x87\xd5\x46'\
-b'\xcd\x26\xc4\xe5\xc4\xc4\xbc\x84\xb4\x23\xb3\xe3\xb4\x23\xa3\xa2'\
-b'\xb4\x02\xc4\xc4\xcd\x26\xcd\x67\xd5\xa7\xdd\xc8\xdd\xe8\xdd\xe8'\
-b'\xe6\x08\xde\x09\xdd\xe8\xd5\x87\xc4\xe5\xbc\x64\xc4\xa4\xd5\x67'\
-b'\xdd\xe8\xde\x08\xe6\x09\xe6\x09\xde\x08\xe6\x08\xdd\xe8\xdd\xe8'\
-b'\xdd\xc8\xd5\xa7\xcd\x05\xb4\x23\xab\xc2\xbc\x84\xbc\x84\xc4\xa4'\
-b'\xbc\x84\xbc\x84\xbc\x84\xc4\xa4\xc4\xc5\xc4\xe5\xcd\x06\xcd\x46'\
-b'\xd5\x87\xd5\x87\xc4\xa5\xb4\x23\xcd\x05\xdd\xc8\xde\x09\xe6\x09'\
-b'\xe6\x09\xe6\x29\xe6\x09\xde\x29\xe6\x09\xde\x09\xde\x09\xe6\x09'\
-b'\xdd\xc8\xc4\xc5\xbc\x43\xcd\x46\xdd\xc8\xd5\xa7\xd5\x87\xd5\x46'\
-b'\xcd\x26\xcd\x05\xc4\xe5\xc4\xa5\xbc\xa4\xbc\x84\xbc\x84\xbc\x64'\
-b'\xb4\x23\xab\xc2\xbc\x84\xcd\x05\xcd\x46\xd5\x67\xd5\xa7\xdd\xc8'\
-b'\xdd\xe8\xdd\xe8\xde\x09\xe6\x09\xe6\x09\xde\x09\xdd\xe8\xc4\xc5'\
-b'\xbc\x64\xdd\xc8\xde\x08\xe6\x09\xe6\x09\xde\x09\xdd\xe8\xdd\xe8'\
-b'\xdd\xc8\xdd\xa8\xd5\x87\xd5\x67\xcd\x46\xcd\x05\xab\xe2\xb3\xe3'\
-b'\xc4\xa4\xbc\x84\xbc\x84\xbc\x84\xbc\x84\xc4\xa4\xc4\xc5\xc4\xe5'\
-b'\xcd\x05\xcd\x26\xd5\x67\xd5\x67\xd5\x87\xbc\x64\xb4\x43\xdd\xc8'\
-b'\xdd\xe8\xde\x08\xe6\x09\xe6\x29\xde\x09\xe6\x09\xde\x29\xde\x09'\
-b'\xe6\x09\xde\x08\xdd\xe8\xdd\xc8\xbc\x84\xb4\x23\xd5\x87\xd5\x67'\
-b'\xd5\x66\xcd\x46\xcd\x06\xc4\xe5\xc4\xc5\xc4\xc5\xbc\x84\xbc\x84'\
-b'\xbc\x84\xbc\x84\xbc\x84\xab\xe2\xab\xc2\xc4\xe5\xcd\x06\xcd\x46'\
-b'\xd5\x67\xd5\x87\xdd\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xe6\x08\xde\x08'\
-b'\xde\x09\xdd\xe8\xc4\xe5\xb4\x23\xdd\xc7\xde\x08\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xc8\xdd\xc8\xd5\x87\xd5\x87\xcd\x46\xcd\x26\xcd\x06'\
-b'\xc4\xe5\xbc\x64\xa3\x81\xb4\x23\xbc\x84\xbc\x84\xbc\x84\xc4\xa4'\
-b'\xc4\xa5\xc4\xc5\xc4\xe5\xcc\xe5\xcd\x06\xcd\x46\xd5\x66\xd5\x66'\
-b'\xc4\xc5\xab\xc2\xc4\xc5\xdd\xc7\xdd\xe8\xdd\xe8\xde\x08\xe6\x09'\
-b'\xde\x09\xde\x09\xe6\x09\xde\x09\xde\x08\xdd\xe9\xdd\xe8\xd5\x87'\
-b'\xd5\x46\xc4\xc5\xb4\x23\xab\xc2\xb4\x23\xbc\x64\xb4\x03\xac\x02'\
-b'\xb4\x43\xc4\x84\xc4\xe5\xcd\x26\xd5\x66\xd5\xa7\xdd\xa7\xd5\x46'\
-b'\xc4\xe5\xbc\xa4\xbc\x64\xbc\x84\xc4\xc5\xcd\x26\xd5\x87\xdd\xc7'\
-b'\xdd\xe8\xde\x08\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xa7\xd5\x46\xc4\xe5'\
-b'\xbc\x84\xbc\x64\xbc\x84\xc4\xc5\xd5\x46\xd5\x87\xd5\x66\xcd\x26'\
-b'\xc4\xe5\xc4\xc4\xbc\x84\xbc\x64\xbc\x43\xb4\x23\xbc\x64\xbc\x43'\
-b'\xab\xc2\xb4\x03\xbc\xa4\xcd\x26\xdd\xa7\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xde\x08\xde\x08\xdd\xe8\xdd\xc8\xd5\x67\xcc\xe5\xbc\x64\xbc\x64'\
-b'\xc4\xc4\xcd\x26\xd5\xa7\xdd\xe8\xde\x08\xdd\xe8\xe5\xe8\xdd\xe8'\
-b'\xdd\xc8\xd5\xa7\xd5\x46\xc4\xc4\xb4\x03\xab\xa2\xb4\x03\xb4\x23'\
-b'\xb3\xe3\xb4\x44\xbc\x84\xc4\xc5\xc4\xe5\xcd\x26\xd5\x67\xd5\x87'\
-b'\xdd\xc7\xdd\xc8\xd5\x87\xcd\x06\xbc\x84\xbc\x64\xc4\xc5\xd5\x66'\
-b'\xdd\xc8\xde\x08\xe6\x09\xde\x09\xde\x09\xe6\x09\xde\x08\xde\x08'\
-b'\xdd\xe8\xdd\xc8\xcd\x26\xbc\x64\xb4\x43\xc4\xa4\xcd\x66\xd5\x46'\
-b'\xcd\x26\xc5\x05\xc4\xc5\xc4\xa4\xbc\x84\xbc\x64\xbc\x84\xbc\x84'\
-b'\xc4\xa5\xc4\xc5\xbc\x64\xab\xc2\xbc\x64\xcd\x26\xdd\xa7\xdd\xe8'\
-b'\xdd\xe8\xde\x09\xe6\x09\xde\x09\xe6\x09\xde\x09\xde\x09\xe6\x08'\
-b'\xd5\xa7\xc4\xc5\xbc\x44\xc4\xe5\xd5\xa7\xde\x08\xe6\x09\xdd\xe9'\
-b'\xdd\xe8\xdd\xc8\xdd\xa8\xd5\x87\xd5\x66\xcd\x26\xc4\xe5\xc4\xa4'\
-b'\xab\xe2\xab\xc2\xb3\xe3\xb4\x43\xbc\x84\xc4\xa4\xc4\xe5\xc5\x05'\
-b'\xcd\x46\xd5\x67\xd5\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xde\x08\xd5\x87'\
-b'\xbc\x64\xc4\xa4\xd5\xc8\xe6\x08\xde\x09\xe6\x09\xde\x09\xde\x29'\
-b'\xe6\x29\xde\x09\xde\x09\xde\x08\xe5\xe8\xdd\xe8\xd5\x87\xbc\x43'\
-b'\xbc\x64\xcd\x46\xcd\x26\xcd\x05\xc4\xe5\xc4\xa5\xbc\xa4\xbc\x84'\
-b'\xbc\x84\xbc\x84\xc4\xa4\xc4\xc5\xc4\xe5\xcd\x05\xbc\x84\xab\xe2'\
-b'\xcd\x46\xd5\xa7\xdd\xe8\xdd\xe8\xde\x08\xe6\x09\xe6\x09\xe6\x29'\
-b'\xe6\x29\xde\x09\xde\x09\xe6\x09\xde\x08\xd5\x46\xab\xe3\xd5\x67'\
-b'\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc8\xdd\xa7\xd5\x87\xd5\x47\xcd\x26'\
-b'\xcd\x06\xc4\xe5\xc4\xc4\xc4\xa4\xbc\x64\xa3\x81\xb4\x03\xbc\x84'\
-b'\xc4\xa4\xc4\xc5\xc4\xe5\xcd\x26\xcd\x46\xd5\x67\xd5\x87\xdd\xa7'\
-b'\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8\xbc\x84\xbc\x43\xdd\xe8\xde\x08'\
-b'\xe6\x09\xde\x09\xe6\x09\xde\x28\xe6\x09\xde\x08\xdd\xe8\xdd\xe8'\
-b'\xdd\xc8\xdd\xa7\xd5\x87\xcc\xe5\xa3\x82\xc4\xc5\xcc\xe5\xc4\xc5'\
-b'\xc4\xc4\xbc\xa4\xbc\x85\xbc\x84\xbc\x84\xc4\x84\xbc\xa5\xc4\xc5'\
-b'\xc4\xc5\xcd\x05\xcc\xe5\xab\xa2\xc4\xa5\xd5\x87\xdd\xa7\xdd\xc8'\
-b'\xdd\xe8\xdd\xe8\xde\x09\xe6\x08\xde\x09\xe6\x09\xe6\x08\xde\x08'\
-b'\xdd\xe8\xdd\xe8\xc4\xc5\xb3\xe3\xd5\x66\xdd\xc7\xdd\xa8\xd5\x87'\
-b'\xd5\x67\xcd\x66\xcd\x46\xcd\x06\xc5\x05\xc4\xc5\xc4\xa5\xc4\xa4'\
-b'\xbc\x84\xb4\x23\xab\xa2\xab\xe2\xbc\x64\xc4\xa4\xc4\xc5\xc4\xe5'\
-b'\xcd\x06\xcd\x46\xd5\x66\xd5\xa7\xdd\xa8\xdd\xe8\xde\x09\xe6\x09'\
-b'\xc4\xa5\xc5\x06\xd5\x67\xdd\xa7\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc7'\
-b'\xd5\x67\xcd\x26\xbc\x84\xb4\x03\xa3\xa2\xb3\xe2\xb4\x03\xa3\x82'\
-b'\xab\xc2\xbc\x64\xcd\x05\xd5\x67\xd5\xc7\xdd\xe8\xdd\xe8\xde\x08'\
-b'\xdd\xe8\xdd\xc7\xd5\x66\xc4\xe5\xbc\x84\xbc\x64\xbc\x84\xc4\xe5'\
-b'\xcd\x46\xdd\xa7\xdd\xe8\xdd\xe8\xde\x08\xdd\xe8\xde\x08\xdd\xe8'\
-b'\xdd\xc8\xd5\x87\xcd\x05\xbc\x64\xb4\x03\xb4\x23\xc4\xa4\xc4\xc5'\
-b'\xbc\x84\xbc\x84\xbc\x64\xbc\x64\xbc\x84\xc4\xa4\xc4\xe5\xcd\x26'\
-b'\xd5\x46\xcd\x06\xbc\x84\xbc\x64\xbc\x64\xc4\xe5\xd5\x66\xdd\xc7'\
-b'\xdd\xe8\xde\x08\xe6\x09\xde\x08\xe6\x09\xde\x08\xdd\xe8\xdd\xc8'\
-b'\xd5\x66\xc4\xc5\xbc\x64\xbc\x84\xc4\xe5\xd5\x66\xdd\xc7\xdd\xe8'\
-b'\xdd\xc8\xd5\xa7\xd5\x66\xcd\x46\xcd\x05\xc4\xc5\xbc\x84\xbc\x43'\
-b'\xab\xe3\xb4\x23\xab\xc2\xab\xa2\xbc\x63\xcd\x05\xd5\x66\xd5\xa7'\
-b'\xdd\xc8\xdd\xe8\xdd\xe8\xe6\x08\xde\x09\xde\x08\xdd\xe8\xd5\x67'\
-b'\xc4\xc5\xbc\x44\xbc\x84\xcd\x26\xdd\xc8\xde\x08\xe6\x09\xde\x09'\
-b'\xe6\x09\xde\x09\xde\x08\xdd\xe8\xdd\xe8\xdd\xc8\xd5\x66\xc4\xa4'\
-b'\xab\xc2\xb4\x03\xbc\xa4\xbc\x84\xbc\x84\xbc\x84\xbc\x84\xbc\x84'\
-b'\xc4\xa5\xc4\xc5\xc5\x05\xcd\x46\xd5\x66\xd5\xa7\xd5\x87\xc4\xc5'\
-b'\xb4\x43\xc4\xc5\xd5\xa7\xe6\x08\xe6\x09\xde\x09\xe6\x09\xe6\x09'\
-b'\xde\x09\xe6\x29\xde\x09\xde\x09\xe6\x09\xde\x08\xd5\x46\xbc\x64'\
-b'\xbc\x84\xd5\x67\xdd\xc8\xdd\xa7\xd5\xa7\xd5\x67\xcd\x26\xcd\x06'\
-b'\xc4\xc5\xc4\xa4\xbc\x84\xbc\x84\xbc\x84\xbc\x64\xb4\x43\xab\xa2'\
-b'\xb4\x23\xcd\x05\xcd\x46\xd5\x87\xdd\xc8\xdd\xe8\xdd\xe8\xe6\x09'\
-b'\xde\x09\xe6\x29\xe6\x29\xe6\x09\xde\x09\xdd\xa7\xbc\x64\xc4\xc5'\
-b'\xdd\xe8\xe6\x09\xde\x09\xde\x09\xe6\x09\xde\x08\xe6\x09\xdd\xe8'\
-b'\xdd\xc8\xdd\xa7\xd5\x87\xcd\x46\xcd\x06\xb4\x23\xab\xc2\xbc\x84'\
-b'\xbc\x84\xbc\x84\xbc\x64\xbc\x84\xc4\xa5\xc4\xa5\xc4\xe5\xcd\x06'\
-b'\xcd\x46\xd5\x67\xd5\x87\xd5\xa7\xdd\xa7\xb4\x23\xbc\xa4\xdd\xe8'\
-b'\xe6\x08\xde\x09\xe6\x29\xe6\x09\xde\x09\xe6\x29\xde\x29\xe6\x29'\
-b'\xde\x09\xde\x09\xde\x08\xdd\xe8\xcd\x26\xab\xa2\xd5\x46\xd5\x87'\
-b'\xd5\x87\xcd\x46\xcd\x26\xc5\x05\xc4\xc5\xc4\xa5\xbc\xa4\xbc\x84'\
-b'\xbc\x84\xbc\x84\xc4\x84\xc4\x84\xab\xe3\xab\xc2\xcd\x05\xcd\x26'\
-b'\xd5\x67\xd5\x87\xd5\xc7\xdd\xc8\xdd\xe8\xde\x09\xe6\x09\xe6\x09'\
-b'\xde\x09\xe6\x09\xde\x08\xdd\xc7\xab\xe2\xcd\x05\xde\x08\xde\x08'\
-b'\xe6\x09\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x87\xd5\x46'\
-b'\xcd\x26\xcd\x06\xc4\xe5\xbc\x64\xa3\x81\xb4\x43\xbc\x84\xbc\x84'\
-b'\xbc\x84\xc4\x85\xc4\xa5\xc4\xc5\xc4\xe5\xcd\x06\xcd\x46\xd5\x47'\
-b'\xd5\x87\xd5\xa7\xd5\x87\xbc\x63\xb4\x23\xd5\xa7\xdd\xe8\xde\x08'\
-b'\xe6\x09\xe6\x09\xde\x09\xe6\x09\xe6\x09\xde\x08\xde\x08\xdd\xe8'\
-b'\xdd\xe8\xdd\xc8\xd5\x86\xb4\x03\xab\xe2\xcd\x05\xcd\x26\xcd\x26'\
-b'\xc4\xe5\xc4\xc5\xc4\xc5\xbc\xa5\xbc\x84\xbc\x84\xbc\x85\xc4\xa5'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xd5\x87\xcd\x06'\
-b'\xc4\xa4\xbc\x64\xbc\x64\xbc\xa4\xcc\xe5\xcd\x66\xd5\x87\xd5\x46'\
-b'\xcd\x05\xc4\xc5\xbc\x84\xbc\x64\xbc\x43\xbc\x43\xbc\x84\xc4\xa5'\
-b'\xb4\x43\xb3\xe3\xb4\x43\xc4\xa5\xcd\x26\xdd\xa7\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xde\x08\xdd\xe8\xdd\xe8\xdd\xa7\xcd\x26\xc4\xc5'\
-b'\xbc\x64\xbc\x63\xbc\xa5\xcd\x26\xd5\x87\xdd\xe8\xdd\xe8\xde\x08'\
-b'\xdd\xe8\xdd\xe8\xdd\xc7\xd5\xa7\xcd\x46\xc4\xa4\xab\xe3\xa3\x81'\
-b'\xb4\x03\xb4\x03\xab\xc2\xb4\x23\xbc\xa4\xc4\xe5\xcd\x26\xd5\x67'\
-b'\xd5\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\x46\xc4\xc5\xbc\x64'\
-b'\xbc\x64\xc4\xe5\xd5\x67\xdd\xc8\xdd\xe8\xde\x09\xde\x09\xde\x08'\
-b'\xde\x09\xe6\x09\xde\x08\xdd\xe8\xdd\xa8\xcd\x26\xbc\x84\xb4\x23'\
-b'\xbc\x84\xcd\x26\xd5\x46\xcd\x26\xc4\xe5\xc4\xa5\xbc\x84\xbc\x64'\
-b'\xbc\x64\xbc\x84\xc4\xa5\xc4\xc5\xc4\xe5\xcc\xe5\xb4\x23\xb4\x03'\
-b'\xc4\xc4\xd5\x86\xdd\xe8\xde\x08\xe6\x09\xe6\x09\xde\x09\xe6\x09'\
-b'\xde\x09\xe6\x09\xde\x09\xe5\xe8\xd5\xa7\xc4\xe5\xbc\x44\xbc\x84'\
-b'\xcd\x46\xdd\xc8\xe6\x08\xde\x09\xdd\xe8\xdd\xc8\xdd\xa8\xd5\x87'\
-b'\xd5\x66\xcd\x26\xc4\xe5\xc4\xa5\xb4\x43\xab\xa2\xab\xe2\xab\xa2'\
-b'\xbc\x23\xc4\xa4\xc4\xe5\xcd\x06\xcd\x46\xd5\x87\xd5\xa7\xdd\xe8'\
-b'\xdd\xe8\xde\x09\xe6\x08\xde\x08\xd5\xa7\xc4\xa4\xb4\x44\xcd\x46'\
-b'\xdd\xe8\xde\x09\xe6\x09\xde\x29\xde\x09\xe6\x29\xe6\x09\xde\x29'\
-b'\xde\x09\xde\x09\xdd\xe8\xdd\xc8\xcd\x46\xb4\x03\xbc\x43\xcd\x26'\
-b'\xcd\x05\xc4\xc5\xc4\xa5\xbc\x84\xbc\x84\xbc\x64\xbc\x84\xbc\x84'\
-b'\xc4\xc5\xc4\xe5\xcd\x05\xcd\x46\xcd\x26\xb4\x23\xc4\xa4\xdd\xc8'\
-b'\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x29\xe6\x09'\
-b'\xde\x09\xde\x29\xe6\x09\xde\x08\xd5\x46\xb4\x03\xcd\x46\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xdd\xc8\xdd\xa7\xd5\x87\xcd\x66\xcd\x26\xc4\xe5'\
-b'\xc4\xc5\xbc\xa4\xbc\x84\xbc\x64\xb4\x03\xa3\x61\xbc\x64\xc4\xa5'\
-b'\xc4\xe5\xcd\x06\xcd\x26\xd5\x67\xd5\xa7\xdd\xa8\xdd\xc8\xdd\xe8'\
-b'\xe6\x08\xde\x09\xe6\x09\xe6\x08\xc4\xc5\xb4\x23\xdd\xe8\xde\x08'\
-b'\xe6\x09\xe6\x29\xe6\x09\xe6\x09\xde\x09\xde\x09\xe6\x08\xdd\xe8'\
-b'\xdd\xc8\xdd\xa8\xd5\x87\xcd\x66\xb4\x23\xab\xc3\xc4\xe5\xc4\xc5'\
-b'\xbc\xa4\xc4\x84\xbc\x84\xbc\x84\xbc\x84\xc4\x84\xc4\xa4\xc4\xe5'\
-b'\xc4\xe5\xcd\x26\xcd\x46\xcd\x46\xb4\x03\xbc\x44\xdd\xa8\xdd\xe8'\
-b'\xdd\xe8\xe6\x09\xe6\x09\xe6\x29\xe6\x09\xe6\x09\xe6\x29\xde\x29'\
-b'\xe6\x09\xde\x08\xde\x08\xdd\xc8\xb4\x43\xbc\x64\xdd\xa7\xdd\xa8'\
-b'\xd5\xa7\xd5\x87\xd5\x67\xcd\x46\xcd\x26\xc5\x05\xc4\xc5\xc4\xa5'\
-b'\xbc\xa4\xbc\x84\xbc\x64\xbc\x44\xa3\x82\xb3\xe3\xc4\xa4\xc4\xc5'\
-b'\xc5\x05\xcd\x26\xcd\x46\xd5\x66\xd5\xa7\xdd\xa8\xdd\xc8\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xa7\xbc\x64\xb4\x23\xd5\x87\xde\x08'\
-b'\xe6\x09\xe6\x08\xe6\x09\xde\x09\xe6\x09\xde\x09\xdd\xe9\xdd\xe8'\
-b'\xe6\x29\xdd\xe9\xd5\x87\xcd\x06\xbc\xa5\xbc\x64\xbc\x64\xc4\xa4'\
-b'\xcd\x26\xd5\x87\xdd\xc7\xdd\xe8\xdd\xe8\xe5\xe9\xde\x08\xdd\xe8'\
-b'\xdd\xe8\xd5\xa7\xcd\x46\xc4\xc4\xb4\x43\xab\xe3\xb4\x23\xbc\x84'\
-b'\xbc\x44\xb4\x23\xbc\x43\xbc\x64\xbc\xa4\xc4\xc5\xcd\x26\xd5\x67'\
-b'\xd5\xa7\xdd\xa7\xd5\x47\xc4\xe5\xbc\x64\xbc\x44\xbc\x84\xc4\xe5'\
-b'\xd5\x67\xdd\xc8\xdd\xe8\xde\x08\xe6\x08\xde\x08\xde\x09\xe6\x08'\
-b'\xdd\xe8\xdd\xa7\xcd\x26\xc4\xa5\xbc\x63\xbc\x64\xc4\xe5\xd5\x66'\
-b'\xdd\xa7\xdd\xc8\xd5\xa7\xd5\x67\xcd\x46\xcc\xe5\xc4\xa5\xbc\x84'\
-b'\xbc\x63\xb4\x23\xb4\x23\xbc\x64\xab\xc2\xab\xc2\xbc\x64\xcd\x05'\
-b'\xd5\xa7\xdd\xe8\xde\x08\xde\x08\xe6\x08\xde\x09\xe6\x09\xe6\x08'\
-b'\xde\x08\xdd\xc8\xcd\x46\xc4\xa5\xb4\x43\xbc\x84\xcd\x26\xdd\xa7'\
-b'\xdd\xe8\xde\x09\xde\x09\xe6\x08\xde\x09\xde\x08\xdd\xe8\xdd\xc8'\
-b'\xd5\xa7\xd5\x66\xc4\xa4\xab\xc2\xab\xc2\xb4\x44\xb4\x23\xbc\x43'\
-b'\xbc\x64\xbc\x84\xc4\xa4\xc4\xe5\xcd\x06\xcd\x46\xd5\x87\xd5\xc7'\
-b'\xdd\xe8\xdd\xe8\xd5\x66\xc4\xa5\xb4\x43\xc4\xa5\xd5\x87\xdd\xe8'\
-b'\xde\x08\xe6\x09\xde\x09\xe6\x09\xe6\x09\xe6\x09\xde\x29\xe6\x09'\
-b'\xde\x09\xde\x08\xdd\x87\xc4\xa4\xb4\x23\xc4\xc5\xd5\x87\xd5\xa7'\
-b'\xd5\x87\xcd\x46\xcd\x06\xc4\xc5\xc4\xa4\xbc\x84\xbc\x64\xbc\x64'\
-b'\xbc\x84\xc4\xa4\xc4\xa5\xbc\x84\xab\xc2\xbc\x44\xcd\x46\xdd\xa7'\
-b'\xdd\xe8\xde\x09\xe6\x09\xe6\x29\xe6\x29\xde\x29\xe6\x29\xe6\x09'\
-b'\xde\x09\xe6\x09\xdd\xe8\xcd\x05\xb4\x43\xcd\x05\xdd\xe8\xde\x09'\
-b'\xde\x09\xe6\x09\xde\x09\xde\x08\xdd\xe8\xdd\xc8\xdd\xa7\xd5\x87'\
-b'\xcd\x46\xcd\x06\xc4\xc5\xb4\x23\xab\xa2\xb4\x23\xbc\x64\xbc\x64'\
-b'\xbc\x84\xc4\xa4\xc4\xe5\xcd\x06\xcd\x46\xd5\x67\xd5\xa7\xdd\xc8'\
-b'\xdd\xe8\xdd\xe8\xde\x08\xd5\x67\xb4\x03\xcd\x26\xde\x08\xe6\x09'\
-b'\xe6\x29\xe6\x09\xde\x09\xe6\x29\xe6\x29\xe6\x09\xe6\x09\xde\x29'\
-b'\xe6\x09\xe5\xe8\xdd\xe8\xd5\x87\xab\xc2\xc4\xc5\xd5\x66\xcd\x46'\
-b'\xcd\x06\xc4\xe5\xc4\xc5\xbc\xa4\xbc\x84\xbc\x84\xbc\x64\xbc\x84'\
-b'\xbc\x84\xc4\xa5\xc4\xc5\xc4\xe5\xab\xc2\xb4\x43\xd5\x67\xd5\xa7'\
-b'\xdd\xc8\xdd\xe8\xde\x08\xde\x09\xe6\x29\xe6\x29\xe6\x09\xde\x29'\
-b'\xde\x09\xe6\x09\xde\x09\xe5\xe8\xbc\x84\xb4\x43\xdd\xe8\xdd\xe8'\
-b'\xde\x08\xdd\xe9\xdd\xe8\xdd\xc8\xdd\xa8\xd5\x87\xcd\x67\xcd\x46'\
-b'\xcd\x06\xc4\xe5\xc4\xa5\xbc\x84\xb4\x03\xa3\x61\xb4\x43\xbc\x84'\
-b'\xbc\x84\xc4\xa5\xc4\xe5\xc5\x05\xcd\x26\xcd\x66\xd5\x87\xd5\x87'\
-b'\xdd\xc7\xdd\xe8\xdd\xe8\xdd\xe8\xd5\x66\xab\xc2\xcd\x46\xde\x08'\
-b'\xe6\x09\xde\x09\xe6\x29\xde\x09\xe6\x09\xe6\x09\xde\x08\xde\x08'\
-b'\xe5\xe9\xdd\xe8\xdd\xc8\xdd\xa7\xd5\x86\xab\xe3\xab\xe2\xcd\x05'\
-b'\xcc\xe5\xc4\xe5\xc4\xa5\xbc\xa4\xbc\x84\xbc\x84\xbc\x84\xbc\x84'\
-b'\xc4\x84\xc4\xa5\xc4\xc5\xc4\xe5\xc4\xe5\xab\xe3\xab\xa2\xcd\x26'\
-b'\xd5\x87\xdd\xc8\xdd\xe8\xde\x08\xe6\x29\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xbc\x84\xbc\x64\xbc\x64\xc4\xc5\xcd\x46\xd5\xa7\xdd\xe8\xdd\xe8'\
-b'\xde\x08\xde\x08\xde\x09\xe6\x08\xdd\xe8\xdd\xc8\xd5\x66\xc4\xe5'\
-b'\xbc\x84\xbc\x44\xbc\x64\xc4\xc5\xd5\x46\xdd\xa7\xdd\xe8\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xd5\xa7\xd5\x87\xcd\x26\xc4\xc4\xb4\x23\xab\xa2'\
-b'\xab\xa2\xb4\x03\xa3\x81\xab\xa2\xbc\x64\xcd\x05\xd5\x86\xdd\xc7'\
-b'\xdd\xe8\xdd\xe8\xe5\xe8\xde\x08\xdd\xe8\xdd\xc8\xd5\x87\xcc\xe5'\
-b'\xbc\x84\xbc\x44\xbc\x84\xcd\x05\xd5\x87\xdd\xc8\xde\x08\xde\x09'\
-b'\xde\x09\xde\x08\xe6\x09\xde\x08\xde\x08\xdd\xe8\xd5\xa7\xcd\x05'\
-b'\xbc\x64\xb4\x03\xb4\x43\xc4\xe5\xc4\xc5\xc4\xa4\xbc\x84\xbc\x64'\
-b'\xbc\x64\xbc\x64\xc4\xa4\xc4\xe5\xcd\x06\xd5\x66\xd5\x87\xcd\x46'\
-b'\xc4\xa5\xb4\x43\xbc\x64\xcd\x05\xd5\x87\xdd\xe8\xde\x08\xe6\x09'\
-b'\xde\x09\xe6\x09\xe6\x09\xde\x09\xe6\x09\xde\x09\xdd\xe8\xd5\x87'\
-b'\xc4\xe5\xbc\x44\xbc\x64\xc5\x05\xd5\xa7\xdd\xe8\xdd\xe8\xdd\xc8'\
-b'\xd5\xa8\xd5\x87\xcd\x46\xcd\x06\xc4\xc5\xbc\xa4\xbc\x64\xbc\x23'\
-b'\xac\x03\xb4\x03\xa3\xa2\xab\xe2\xc4\xc4\xcd\x46\xd5\x87\xdd\xa7'\
-b'\xdd\xe8\xde\x09\xe6\x09\xde\x29\xde\x09\xe6\x09\xde\x08\xde\x08'\
-b'\xd5\x87\xc4\xa5\xb4\x43\xc4\xc5\xd5\xa7\xe6\x08\xe6\x09\xde\x09'\
-b'\xe6\x09\xde\x09\xde\x29\xe6\x09\xde\x09\xdd\xe8\xdd\xe8\xdd\xa7'\
-b'\xd5\x67\xbc\x84\xab\xa2\xb4\x44\xbc\x84\xbc\x84\xbc\x64\xbc\x64'\
-b'\xbc\x64\xbc\x84\xc4\xa4\xc4\xe5\xcd\x06\xcd\x47\xd5\x87\xd5\xa7'\
-b'\xdd\xc8\xd5\xa7\xbc\x84\xbc\x64\xd5\x67\xe6\x09\xde\x09\xe6\x09'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x29\xe6\x09\xe6\x09'\
-b'\xde\x09\xde\x08\xcd\x05\xb4\x23\xcd\x46\xdd\xc8\xdd\xc7\xd5\xa7'\
-b'\xd5\x87\xcd\x46\xcd\x26\xc4\xe5\xc4\xa5\xbc\x84\xbc\x64\xbc\x64'\
-b'\xbc\x64\xbc\x64\xbc\x84\xab\xc2\xb4\x03\xcd\x25\xcd\x47\xd5\x87'\
-b'\xdd\xc8\xdd\xe8\xdd\xe9\xde\x09\xe6\x09\xde\x29\xde\x29\xe6\x09'\
-b'\xde\x09\xde\x09\xde\x08\xc4\xa4\xb4\x23\xdd\xc8\xde\x09\xde\x09'\
-b'\xe6\x29\xe6\x29\xde\x08\xde\x09\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xd5\x67\xcd\x46\xcd\x05\xbc\x84\xa3\x61\xbc\x43\xbc\x64\xbc\x64'\
-b'\xbc\x64\xbc\x84\xbc\x84\xc4\xa5\xc4\xe5\xcd\x05\xcd\x46\xd5\x67'\
-b'\xd5\x87\xd5\xa7\xdd\xc8\xdd\xc7\xbc\x64\xb4\x43\xdd\xe8\xe6\x09'\
-b'\xe6\x09\xe6\x29\xe6\x09\xde\x29\xde\x29\xe6\x09\xe6\x29\xe6\x09'\
-b'\xde\x09\xe6\x09\xde\x08\xdd\xe8\xd5\x66\xab\xa2\xcd\x06\xd5\x87'\
-b'\xd5\x67\xcd\x46\xcd\x26\xcc\xe5\xc4\xe5\xc4\xa5\xbc\x84\xbc\x64'\
-b'\xbc\x64\xbc\x64\xbc\x64\xbc\x84\xc4\xa4\xab\xc2\xb3\xe3\xcd\x26'\
-b'\xcd\x46\xd5\x87\xd5\xa7\xdd\xc8\xdd\xe8\xde\x08\xde\x09\xe6\x09'\
-b'\xde\x09\xe6\x09\xde\x08\xde\x09\xde\x08\xd5\x87\xb3\xe3\xc4\xc5'\
-b'\xdd\xe8\xdd\xe8\xde\x09\xe6\x08\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa8'\
-b'\xd5\x87\xd5\x67\xcd\x46\xcd\x06\xc4\xe5\xc4\xa4\xb4\x23\xa3\x82'\
-b'\xab\xc2\xbc\x43\xbc\x64\xbc\x64\xbc\x85\xc4\xc5\xc4\xe6\xcd\x06'\
-b'\xb4\x03\xbc\x64\xc5\x05\xd5\x66\xd5\xa7\xdd\xc8\xdd\xe8\xe6\x08'\
-b'\xdd\xe8\xdd\xc8\xd5\x67\xc4\xe5\xbc\x64\xb4\x44\xbc\x64\xc4\xc5'\
-b'\xcd\x46\xdd\xa7\xdd\xe8\xde\x08\xde\x09\xde\x09\xde\x08\xe6\x08'\
-b'\xe5\xe8\xdd\xe8\xd5\x87\xcd\x26\xc4\xa4\xbc\x44\xbc\x43\xbc\xa4'\
-b'\xcd\x26\xd5\x66\xcd\x46\xcd\x05\xc4\xc5\xbc\x64\xb4\x44\xbc\x44'\
-b'\xbc\x64\xbc\xa4\xc4\xe5\xcd\x06\xc4\xa4\xb4\x23\xb4\x43\xc4\xa5'\
-b'\xcd\x26\xd5\xa7\xdd\xe8\xde\x09\xde\x08\xe6\x09\xde\x09\xe6\x08'\
-b'\xe6\x09\xde\x08\xdd\xe8\xd5\x87\xcd\x06\xbc\x64\xbc\x43\xbc\x84'\
-b'\xcd\x26\xd5\xa7\xdd\xe8\xe5\xe9\xde\x09\xde\x08\xdd\xe8\xdd\xc8'\
-b'\xd5\xa7\xd5\x66\xcd\x26\xc4\xc5\xb4\x23\xa3\x82\xab\xc2\xab\xc2'\
-b'\xab\xa2\xb4\x23\xc4\xa5\xcd\x06\xd5\x66\xd5\x87\xdd\xc8\xdd\xe8'\
-b'\xde\x08\xe6\x09\xde\x08\xde\x08\xdd\xc8\xcd\x46\xbc\x84\xbc\x43'\
-b'\xc4\xa5\xd5\x66\xdd\xc8\xde\x09\xe6\x09\xe6\x09\xe6\x29\xde\x09'\
-b'\xe6\x09\xe6\x09\xde\x08\xde\x08\xdd\xe8\xdd\xa7\xc4\xc5\xb4\x03'\
-b'\xb4\x23\xcd\x05\xcd\x26\xcc\xe5\xc4\xa5\xbc\x84\xbc\x64\xbc\x64'\
-b'\xbc\x64\xbc\x84\xc4\xa4\xc4\xe5\xcd\x26\xd5\x67\xd5\x66\xc4\xa5'\
-b'\xb4\x23\xc4\xc4\xd5\x87\xde\x08\xe6\x09\xde\x09\xde\x29\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x29\xde\x29\xe6\x09\xde\x09\xde\x08\xd5\x67'\
-b'\xbc\x64\xb4\x63\xd5\x46\xdd\xe8\xe6\x09\xde\x08\xdd\xe8\xdd\xc8'\
-b'\xd5\xa7\xd5\x87\xcd\x46\xcd\x06\xc4\xc5\xbc\xa4\xbc\x64\xbc\x44'\
-b'\xb3\xe2\xab\xc2\xab\xa2\xbc\x84\xc4\xe5\xcd\x26\xd5\x66\xd5\xa7'\
-b'\xdd\xc8\xdd\xe8\xde\x09\xde\x09\xe6\x29\xe6\x29\xde\x29\xde\x09'\
-b'\xdd\xe8\xc4\xe5\xbc\x44\xd5\x87\xe6\x09\xde\x09\xe6\x29\xe6\x29'\
-b'\xde\x29\xe6\x29\xe6\x29\xde\x09\xe6\x09\xde\x09\xdd\xe8\xdd\xc8'\
-b'\xd5\xa7\xcd\x46\xab\xc2\xbc\x43\xc4\xe5\xc4\xa5\xbc\xa4\xbc\x64'\
-b'\xbc\x64\xbc\x64\xbc\x64\xbc\x84\xc4\xc5\xc4\xe5\xcd\x26\xd5\x67'\
-b'\xd5\x87\xdd\xa7\xd5\x46\xab\xc2\xcd\x26\xde\x08\xe6\x09\xe6\x28'\
-b'\xde\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x09\xde\x09'\
-b'\xe6\x09\xe6\x09\xde\x08\xcd\x05\xab\xc2\xd5\xa7\xdd\xe8\xdd\xc8'\
-b'\xdd\xc7\xd5\xa7\xd5\x87\xcd\x46\xcd\x26\xc4\xe5\xc4\xc5\xbc\x84'\
-b'\xbc\x84\xbc\x64\xbc\x64\xbc\x64\xa3\xa2\xab\xa2\xc4\xc5\xc4\xe5'\
-b'\xcd\x26\xd5\x66\xd5\x87\xdd\xa8\xdd\xe8\xdd\xe8\xde\x09\xde\x09'\
-b'\xe6\x28\xe6\x29\xde\x09\xde\x08\xdd\xc8\xb4\x03\xbc\xa4\xde\x08'\
-b'\xe6\x08\xe6\x29\xde\x09\xde\x09\xe6\x09\xde\x08\xde\x08\xdd\xe8'\
-b'\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x67\xcd\x26\xc4\xe5\xa3\xa2\xb4\x03'\
-b'\xbc\x84\xbc\x84\xbc\x64\xbc\x64\xbc\x64\xbc\x84\xc4\x84\xc4\xc5'\
-b'\xc4\xe5\xcd\x05\xcd\x46\xd5\x67\xd5\x87\xdd\xa7\xcd\x05\xab\xc2'\
-b'\xc4\xe5\xdd\xe8\xe6\x08\xde\x09\xe6\x09\xe6\x09\xde\x09\xe6\x29'\
-b'\xde\x09\xde\x09\xe6\x09\xde\x08\xe6\x09\xde\x08\xdd\xe8\xcd\x05'\
-b'\xab\xc2\xbc\x84\xd5\x87\xd5\x87\xd5\x87\xcd\x66\xcd\x46\xcd\x26'\
-b'\xd5\x87\xcd\x26\xc4\xc5\xbc\x64\xbc\x43\xb4\x23\xb4\x44\xbc\xa4'\
-b'\xb4\x23\xab\xe2\xb4\x23\xc4\xa4\xcd\x26\xd5\xa7\xdd\xe8\xe5\xe8'\
-b'\xde\x08\xde\x09\xe6\x09\xdd\xe8\xe6\x08\xdd\xe8\xdd\xa8\xcd\x46'\
-b'\xc4\xc5\xbc\x44\xb4\x43\xbc\x84\xcd\x06\xd5\x87\xdd\xc8\xde\x08'\
-b'\xde\x08\xde\x09\xde\x08\xdd\xe8\xde\x08\xdd\xe8\xdd\xa7\xcd\x25'\
-b'\xbc\x64\xab\xc2\xab\xa2\xb4\x23\xb4\x03\xab\xe3\xb4\x43\xbc\x84'\
-b'\xc4\xe5\xcd\x26\xd5\x67\xdd\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xdd\xe8'\
-b'\xd5\x87\xc4\xe5\xbc\x64\xbc\x44\xc4\x84\xcd\x26\xd5\xa8\xdd\xe8'\
-b'\xe6\x09\xde\x09\xe6\x09\xde\x09\xe6\x08\xde\x09\xde\x09\xe6\x08'\
-b'\xdd\xe8\xd5\x87\xc4\xc5\xbc\x43\xbc\x43\xc4\xc5\xd5\x66\xd5\xa7'\
-b'\xd5\x67\xcd\x46\xc4\xe5\xc4\xa4\xbc\x84\xbc\x64\xbc\x44\xbc\x64'\
-b'\xbc\xa4\xc4\xc5\xcc\xe5\xbc\xa5\xb4\x03\xb4\x23\xcc\xe5\xd5\xa7'\
-b'\xdd\xe8\xde\x09\xe6\x09\xde\x09\xde\x09\xe6\x29\xde\x09\xe6\x29'\
-b'\xde\x09\xde\x09\xe6\x08\xd5\x87\xc4\xa5\xb4\x23\xbc\x84\xd5\x66'\
-b'\xdd\xe8\xde\x08\xe6\x09\xde\x09\xde\x08\xde\x08\xdd\xe8\xdd\xc8'\
-b'\xd5\x87\xd5\x46\xcd\x26\xc4\xc5\xbc\x43\xa3\x81\xab\xc2\xab\xc2'\
-b'\xb4\x03\xbc\x64\xc4\xa5\xc4\xe5\xcd\x46\xd5\x67\xdd\xa8\xdd\xc8'\
-b'\xdd\xe9\xde\x09\xde\x09\xe6\x09\xde\x08\xdd\xa7\xbc\xa5\xb4\x23'\
-b'\xcd\x05\xdd\xc8\xde\x09\xe6\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x09\xde\x29\xde\x08\xde\x08\xdd\xa7\xbc\x64'\
-b'\xb4\x03\xcd\x25\xcd\x46\xcd\x26\xc4\xe5\xc4\xa5\xbc\x84\xbc\x64'\
-b'\xbc\x64\xbc\x64\xbc\x64\xbc\xa4\xc4\xc5\xcd\x06\xcd\x46\xd5\x67'\
-b'\xbc\x84\xb4\x23\xd5\x87\xdd\xe8\xe6\x09\xe6\x29\xde\x29\xe6\x29'\
-b'\xe6\x2a\xde\x09\xe6\x29\xe6\x2a\xde\x29\xe6\x29\xe6\x29\xde\x09'\
-b'\xdd\xe8\xbc\x64\xbc\x64\xdd\xc8\xde\x08\xde\x09\xe6\x08\xdd\xe8'\
-b'\xdd\xe8\xdd\xc8\xd5\x87\xd5\x66\xcd\x26\xc4\xe5\xc4\xc5\xbc\x84'\
-b'\xbc\x64\xb4\x43\xa3\x82\xa3\x82\xbc\x64\xc4\xa4\xc4\xc5\xc5\x06'\
-b'\xcd\x46\xd5\x67\xd5\xa8\xdd\xc8\xdd\xe8\xde\x09\xde\x09\xe6\x29'\
-b'\xde\x29\xde\x08\xdd\xe8\xb4\x44\xbc\x44\xdd\xe8\xde\x09\xe6\x09'\
-b'\xde\x29\xe6\x29\xe6\x09\xe6\x29\xde\x29\xe6\x09\xde\x09\xe6\x09'\
-b'\xdd\xe8\xdd\xe8\xd5\xa7\xd5\x86\xb4\x23\xab\xc2\xcc\xe5\xc4\xe5'\
-b'\xc4\xa4\xbc\x84\xbc\x84\xbc\x64\xbc\x64\xbc\x64\xbc\x84\xc4\xa4'\
-b'\xc4\xc5\xc5\x06\xcd\x26\xd5\x46\xd5\x66\xbc\x44\xac\x03\xdd\xa7'\
-b'\xdd\xe8\xde\x08\xe6\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x09\xde\x29'\
-b'\xe6\x09\xde\x09\xe6\x29\xde\x09\xe6\x08\xde\x08\xc4\xc5\xb3\xe2'\
-b'\xd5\xa7\xdd\xe8\xdd\xe8\xdd\xc8\xdd\xa7\xd5\x87\xd5\x67\xcd\x46'\
-b'\xcd\x06\xc4\xe5\xc4\xc5\xbc\x84\xbc\x84\xbc\x64\xbc\x64\xab\xc2'\
-b'\xa3\x82\xbc\x44\xbc\xa4\xc4\xe5\xcd\x06\xcd\x46\xd5\x67\xd5\xa7'\
-b'\xdd\xa8\xdd\xe8\xdd\xe8\xde\x09\xde\x08\xe6\x09\xde\x08\xe5\xe8'\
-b'\xcd\x46\xb3\xe3\xbc\x84\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xdd\xe8\xd5\x67\xc4\xc5\xb4\x43\xab\xe3\xb4\x03\xc4\x84'\
-b'\xbc\x64\xb4\x23\xb4\x23\xbc\x44\xc4\xa4\xc4\xe5\xcd\x26\xd5\x87'\
-b'\xdd\xc7\xdd\xe8\xdd\xa7\xd5\x67\xc4\xe5\xbc\x64\xb4\x43\xbc\x64'\
-b'\xc4\xc5\xd5\x66\xdd\xc8\xdd\xe8\xde\x08\xde\x09\xde\x08\xe6\x09'\
-b'\xde\x09\xe6\x08\xdd\xe9\xdd\xc8\xd5\x46\xc4\xc5\xb4\x44\xbc\x43'\
-b'\xbc\xa4\xcd\x26\xd5\xa7\xdd\xe8\xdd\xc8\xdd\xa7\xd5\x67\xcd\x26'\
-b'\xcc\xe5\xc4\xa4\xbc\x64\xb4\x43\xb4\x43\xbc\x43\xbc\x84\xb4\x03'\
-b'\xab\xc2\xbc\x43\xcd\x05\xd5\xa7\xdd\xe8\xde\x08\xe6\x08\xde\x09'\
-b'\xde\x08\xe6\x09\xde\x08\xe6\x29\xde\x09\xdd\xe8\xd5\x87\xc4\xe5'\
-b'\xbc\x44\xb4\x43\xc4\xa4\xcd\x67\xdd\xc8\xde\x08\xde\x09\xe6\x09'\
-b'\xde\x09\xe6\x09\xe6\x09\xde\x08\xdd\xe8\xdd\xc8\xd5\xa7\xcd\x25'\
-b'\xbc\x43\xa3\x82\xab\xe2\xb4\x23\xb4\x03\xb4\x23\xbc\x64\xbc\x84'\
-b'\xc4\xc5\xcd\x05\xcd\x46\xd5\xa7\xdd\xc8\xdd\xe8\xde\x09\xe6\x09'\
-b'\xdd\xe8\xcd\x46\xbc\x64\xb4\x23\xc4\xc5\xd5\x87\xdd\xe8\xe6\x09'\
-b'\xde\x09\xe6\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x09\xe6\x09\xde\x09'\
-b'\xe6\x09\xde\x08\xd5\x87\xbc\xa4\xb4\x23\xc4\xc5\xd5\x87\xd5\xa7'\
-b'\xd5\x87\xcd\x46\xcd\x06\xc4\xc5\xc4\xa4\xbc\x64\xbc\x64\xb4\x63'\
-b'\xbc\x64\xbc\x84\xc4\xc5\xc5\x05\xc4\xa5\xab\xc2\xbc\x64\xd5\x66'\
-b'\xdd\xe8\xde\x09\xe6\x09\xde\x29\xe6\x29\xde\x29\xde\x2a\xe6\x09'\
-b'\xde\x29\xde\x2a\xe6\x09\xe6\x09\xde\x09\xd5\x46\xb4\x23\xbc\xa4'\
-b'\xdd\xc8\xde\x09\xe6\x09\xe6\x29\xe6\x09\xde\x09\xde\x08\xdd\xe8'\
-b'\xdd\xc8\xd5\xa7\xd5\x67\xcd\x46\xcc\xe5\xc4\xc5\xbc\x43\xa3\x82'\
-b'\xab\xc2\xbc\x23\xbc\x64\xbc\x84\xc4\xa4\xc4\xe5\xcd\x26\xd5\x67'\
-b'\xd5\xa7\xdd\xc8\xdd\xe8\xde\x09\xe6\x09\xde\x29\xde\x09\xdd\xe8'\
-b'\xc4\xa4\xb4\x23\xdd\xa7\xde\x09\xe6\x09\xe6\x29\xde\x29\xe6\x29'\
-b'\xe6\x2a\xde\x29\xe6\x29\xde\x29\xe6\x29\xe6\x29\xe6\x09\xde\x08'\
-b'\xdd\xe8\xcc\xe5\xab\xa2\xcd\x26\xd5\x66\xcd\x26\xc4\xe5\xc4\xc5'\
-b'\xc4\xa4\xbc\x84\xbc\x64\xbc\x44\xbc\x64\xbc\x64\xbc\xa4\xc4\xc5'\
-b'\xcc\xe5\xcd\x26\xcd\x26\xab\xa2\xc4\xc4\xdd\xc8\xdd\xe8\xde\x09'\
-b'\xe6\x09\xde\x29\xe6\x29\xde\x29\xe6\x2a\xe6\x29\xe6\x29\xde\x29'\
-b'\xe6\x09\xde\x09\xe6\x09\xdd\xe8\xbc\x64\xb4\x23\xdd\xe8\xde\x08'\
-b'\xde\x09\xe6\x09\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x67\xcd\x46'\
-b'\xcd\x06\xc4\xe5\xc4\xc5\xbc\x84\xbc\x64\xb4\x03\x9b\x41\xb4\x23'\
-b'\xbc\x84\xbc\xa4\xc4\xc5\xc4\xe5\xcd\x26\xcd\x67\xd5\x87\xdd\xc8'\
-b'\xdd\xe8\xdd\xe8\xde\x08\xe6\x09\xde\x09\xe6\x08\xdd\xc8\xb4\x03'\
-b'\xbc\xa5\xdd\xe8\xe6\x09\xde\x09\xde\x09\xe6\x29\xde\x29\xe6\x09'\
-b'\xde\x29\xe6\x29\xde\x09\xe6\x09\xdd\xe8\xdd\xc8\xdd\xc7\xd5\x87'\
-b'\xc4\xa5\xa3\x61\xbc\x84\xc4\xe5\xc4\xc5\xc4\xa5\xbc\x84\xbc\x84'\
-b'\xbc\x64\xbc\x64\xbc\x64\xbc\x84\xc4\xa4\xc4\xa5\xc4\xe5\xcd\x06'\
-b'\xcd\x46\xc4\xe5\xab\xa2\xb4\x23\xd5\xa8\xde\x09\xe6\x29\xe6\x2a'\
-b'\xbc\x85\xbc\x44\xbc\x64\xc4\xc5\xcd\x46\xdd\xa7\xdd\xe8\xde\x09'\
-b'\xdd\xe8\xdd\xe8\xdd\xa7\xd5\x67\xcd\x06\xc4\xc4\xbc\x43\xab\xe3'\
-b'\xab\xc2\xb4\x23\xab\xc2\xa3\x82\xb4\x23\xc4\xc5\xd5\x87\xdd\xc8'\
-b'\xdd\xe8\xde\x08\xde\x09\xe6\x08\xde\x09\xe6\x09\xde\x08\xdd\xe8'\
-b'\xd5\x87\xcd\x06\xbc\x84\xbc\x43\xbc\x64\xc4\xc5\xd5\x66\xdd\xe8'\
-b'\xde\x09\xe6\x09\xe6\x09\xde\x09\xde\x09\xe6\x08\xde\x09\xde\x08'\
-b'\xde\x08\xdd\xa8\xcd\x26\xbc\x84\xb3\xe2\xab\xe3\xbc\x84\xbc\x84'\
-b'\xbc\x44\xb4\x44\xbc\x43\xbc\x64\xbc\xa5\xcc\xe5\xcd\x46\xd5\x87'\
-b'\xdd\xc8\xdd\xe8\xdd\xe8\xd5\xa7\xcd\x05\xbc\x64\xb4\x43\xc4\x84'\
-b'\xcd\x46\xdd\xc8\xdd\xe8\xe6\x09\xde\x09\xe6\x29\xe6\x29\xe6\x29'\
-b'\xde\x29\xde\x09\xe6\x09\xde\x08\xdd\xe8\xd5\x46\xbc\x84\xb4\x23'\
-b'\xbc\x84\xcd\x26\xdd\xa7\xdd\xe8\xdd\xc8\xdd\xa7\xd5\x67\xcd\x46'\
-b'\xc4\xe5\xc4\xa5\xbc\x84\xbc\x43\xbc\x44\xbc\x64\xbc\x63\xbc\x84'\
-b'\xb3\xe3\xab\xa2\xbc\x84\xd5\x66\xdd\xc8\xde\x08\xde\x09\xe6\x09'\
-b'\xe6\x29\xde\x29\xde\x29\xe6\x29\xde\x29\xde\x29\xe6\x29\xde\x09'\
-b'\xd5\x87\xbc\x84\xb4\x23\xc4\xc5\xdd\x87\xde\x08\xe6\x09\xe6\x09'\
-b'\xe6\x29\xe6\x09\xe6\x29\xde\x09\xde\x08\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xd5\x66\xcd\x25\xb4\x23\xa3\x81\xb4\x03\xb4\x23\xb4\x43\xbc\x44'\
-b'\xbc\x64\xbc\xa4\xc4\xc5\xcd\x06\xcd\x47\xd5\x87\xdd\xc8\xdd\xe8'\
-b'\xde\x09\xe6\x09\xde\x09\xdd\xc8\xc4\xc5\xb4\x23\xcd\x26\xdd\xe8'\
-b'\xe6\x09\xe6\x29\xde\x29\xde\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xe6\x29\xe6\x29\xde\x29\xe6\x09\xde\x09\xd5\x87\xb4\x23\xc4\xa4'\
-b'\xdd\xa7\xd5\xa7\xd5\x87\xcd\x47\xcd\x26\xc4\xe5\xc4\xa4\xbc\x64'\
-b'\xbc\x64\xb4\x44\xbc\x64\xbc\x64\xbc\xa4\xc4\xc5\xcd\x05\xbc\x84'\
-b'\xab\xa2\xcd\x26\xdd\xc7\xdd\xe8\xde\x09\xe6\x09\xe6\x29\xe6\x29'\
-b'\xde\x2a\xe6\x29\xe6\x29\xe6\x2a\xde\x29\xe6\x09\xde\x09\xde\x09'\
-b'\xdd\xc7\xb4\x03\xbc\xa4\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x09'\
-b'\xde\x09\xde\x08\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x66\xcd\x46\xc5\x05'\
-b'\xc4\xc5\xbc\x84\xb4\x03\x9b\x41\xb4\x03\xb4\x43\xbc\x64\xbc\x84'\
-b'\xc4\xc5\xc4\xe5\xcd\x26\xd5\x47\xd5\x87\xd5\xa8\xdd\xe8\xdd\xe9'\
-b'\xde\x09\xe6\x08\xde\x08\xdd\xe8\xbc\x64\xb4\x23\xdd\xe8\xe6\x09'\
-b'\xe6\x09\xde\x29\xe6\x09\xde\x09\xe6\x29\xde\x29\xe6\x29\xe6\x29'\
-b'\xde\x29\xe6\x09\xde\x08\xde\x08\xdd\xe8\xd5\x87\xab\xa2\xbc\x84'\
-b'\xd5\x66\xcd\x26\xcd\x06\xc4\xe5\xc4\xa5\xbc\x84\xbc\x64\xbc\x64'\
-b'\xbc\x64\xbc\x64\xbc\x84\xbc\xa4\xc4\xc5\xc4\xe5\xcd\x06\xbc\x84'\
-b'\xa3\x81\xd5\x46\xdd\xc8\xdd\xe8\xde\x08\xe6\x09\xde\x09\xe6\x29'\
-b'\xe6\x29\xde\x09\xe6\x29\xe6\x29\xde\x09\xde\x29\xe6\x09\xde\x08'\
-b'\xdd\xe8\xbc\xa4\xb3\xe3\xd5\x87\xde\x08\xde\x08\xde\x08\xdd\xe8'\
-b'\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x67\xcd\x46\xcd\x26\xc4\xe6\xc4\xc5'\
-b'\xbc\x84\xbc\x84\xb4\x23\xab\xa2\xab\xa2\xb4\x23\xbc\x84\xc4\xa5'\
-b'\xd5\x87\xdd\xc8\xde\x09\xe6\x29\xe6\x29\xde\x09\xe6\x09\xe6\x09'\
-b'\xde\x09\xde\x08\xdd\xe8\xd5\xa7\xcd\x26\xbc\xa4\xb4\x23\xb4\x03'\
-b'\xbc\x64\xc4\xe5\xc4\xe5\xbc\x84\xbc\x44\xb4\x43\xbc\x43\xbc\x84'\
-b'\xc4\xc5\xcd\x26\xd5\x67\xdd\xa7\xdd\xa7\xcd\x67\xc4\xc5\xbc\x64'\
-b'\xbc\x43\xbc\x84\xcd\x06\xd5\xa7\xdd\xe8\xde\x09\xde\x09\xe6\x09'\
-b'\xde\x09\xde\x09\xe6\x08\xde\x09\xe6\x09\xde\x08\xdd\xc8\xcd\x26'\
-b'\xc4\xa4\xb4\x43\xbc\x44\xc4\xc5\xd5\x67\xdd\xe8\xde\x08\xe6\x08'\
-b'\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x66\xcd\x06\xc4\xc5\xbc\x84\xb4\x43'\
-b'\xb3\xe3\xb3\xe3\xb4\x23\xab\x82\xab\xa2\xbc\x84\xd5\x46\xdd\xc7'\
-b'\xdd\xe8\xde\x09\xe6\x09\xde\x09\xe6\x09\xde\x29\xde\x09\xe6\x09'\
-b'\xde\x09\xe6\x08\xd5\xa7\xc4\xe5\xbc\x44\xb4\x43\xc4\xc5\xd5\x87'\
-b'\xdd\xe8\xe6\x09\xde\x09\xe6\x29\xde\x09\xde\x29\xe6\x29\xde\x09'\
-b'\xe6\x09\xde\x08\xdd\xe8\xdd\xc7\xcd\x26\xb4\x23\xa3\xa2\xb4\x23'\
-b'\xbc\x84\xbc\x63\xbc\x43\xb4\x43\xbc\x44\xbc\x84\xc4\xc5\xc5\x05'\
-b'\xcd\x46\xd5\x87\xdd\xc8\xdd\xe8\xdd\xe9\xdd\xe8\xd5\x87\xc4\x84'\
-b'\xb4\x23\xc4\xa5\xd5\xa7\xe6\x08\xde\x09\xe6\x09\xde\x29\xde\x29'\
-b'\xe6\x29\xde\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xe6\x08'\
-b'\xd5\x67\xbc\x64\xb4\x43\xcd\x26\xdd\xc8\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xd5\x67\xcd\x26\xc4\xe5\xc4\xa4\xbc\x84\xbc\x43\xb4\x43\xbc\x44'\
-b'\xbc\x64\xbc\xa4\xc4\xa4\xb4\x03\xab\xe2\xcd\x05\xd5\xa7\xdd\xe8'\
-b'\xde\x09\xe6\x09\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xde\x2a\xe6\x29'\
-b'\xe6\x2a\xde\x29\xe6\x09\xde\x09\xd5\x66\xb4\x23\xc4\xe5\xdd\xe8'\
-b'\xde\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xde\x09\xde\x09'\
-b'\xdd\xe8\xdd\xc8\xd5\x87\xd5\x66\xcd\x26\xc4\xe5\xb3\xe2\xa3\x82'\
-b'\xb4\x23\xb4\x43\xbc\x44\xbc\x44\xbc\x84\xbc\xa5\xc4\xe5\xcd\x26'\
-b'\xcd\x47\xd5\x87\xdd\xc8\xdd\xe8\xde\x09\xde\x09\xe6\x09\xde\x08'\
-b'\xc4\xc5\xab\xe2\xdd\xa8\xe6\x09\xde\x29\xe6\x29\xde\x29\xe6\x29'\
-b'\xe6\x29\xe6\x2a\xde\x29\xe6\x29\xe6\x29\xde\x29\xe6\x09\xe6\x09'\
-b'\xde\x09\xdd\xe8\xbc\x63\xb3\xe3\xd5\x87\xd5\xa7\xd5\x87\xd5\x46'\
-b'\xcd\x05\xc4\xe5\xc4\xa5\xbc\x84\xbc\x64\xbc\x43\xbc\x44\xbc\x64'\
-b'\xbc\x84\xc4\xa5\xc4\xc5\xcd\x05\xab\xe2\xb3\xe3\xd5\x87\xd5\xa7'\
-b'\xdd\xe8\xde\x08\xe6\x09\xe6\x29\xde\x29\xe6\x29\xe6\x29\xde\x29'\
-b'\xe6\x09\xe6\x29\xe6\x29\xde\x09\xe6\x09\xdd\xe8\xb4\x23\xbc\x43'\
-b'\xdd\xe8\xde\x09\xe6\x09\xde\x29\xe6\x08\xde\x09\xde\x08\xdd\xe8'\
-b'\xd5\xa8\xd5\xa7\xd5\x67\xcd\x26\xcd\x06\xc4\xe5\xc4\xa4\xbc\x64'\
-b'\xab\xa2\xa3\x82\xb4\x43\xbc\x44\xbc\x64\xbc\xa4\xc4\xc5\xc4\xe5'\
-b'\xcd\x26\xd5\x67\xd5\x87\xd5\xa8\xdd\xc8\xdd\xe8\xde\x09\xe6\x09'\
-b'\xdd\xe8\xdd\xc8\xbc\x63\xb4\x03\xdd\xa7\xde\x09\xe6\x09\xe6\x09'\
-b'\xde\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x09\xde\x09'\
-b'\xe6\x09\xde\x08\xdd\xe8\xdd\xa7\xbc\x64\xa3\x82\xc4\xc4\xcd\x46'\
-b'\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x29\xdd\xc8'\
-b'\xd5\x66\xc4\xc5\xbc\x64\xb4\x23\xbc\x64\xc4\xe5\xd5\x67\xdd\xc8'\
-b'\xde\x08\xe6\x09\xde\x09\xe5\xe8\xdd\xe8\xdd\xa7\xd5\x87\xcd\x06'\
-b'\xc4\xa4\xb4\x23\xa3\xa1\xab\xa2\xab\xe3\xa3\x61\xab\xc2\xc4\xa4'\
-b'\xcd\x46\xdd\xc8\xdd\xe8\xde\x08\xe6\x08\xde\x09\xe6\x08\xe6\x29'\
-b'\xde\x09\xe6\x08\xde\x08\xdd\xa8\xcd\x26\xbc\x84\xb4\x23\xbc\x64'\
-b'\xc4\xe5\xd5\x87\xdd\xe8\xde\x08\xe6\x09\xde\x09\xe6\x29\xde\x09'\
-b'\xe6\x09\xde\x09\xde\x09\xde\x08\xde\x08\xdd\xa7\xcd\x05\xbc\x43'\
-b'\xab\xe2\xb4\x43\xc4\xe5\xc4\xc4\xbc\x84\xbc\x64\xb4\x43\xb4\x44'\
-b'\xbc\x64\xc4\xa4\xcd\x05\xcd\x46\xd5\xa7\xdd\xc8\xdd\xe8\xdd\xc8'\
-b'\xcd\x26\xbc\x84\xb4\x23\xbc\x84\xcd\x46\xdd\xc8\xde\x09\xe6\x09'\
-b'\xe6\x29\xe6\x29\xe6\x29\xde\x29\xe6\x29\xe6\x09\xe6\x29\xde\x09'\
-b'\xe6\x09\xdd\xe8\xd5\x46\xbc\x84\xb4\x03\xc4\x84\xd5\x66\xdd\xe8'\
-b'\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa8\xd5\x87\xcd\x26\xc4\xe5\xc4\xa4'\
-b'\xbc\x64\xbc\x44\xb4\x23\xbc\x43\xbc\x44\xb4\x43\xa3\x82\xb4\x03'\
-b'\xcd\x05\xd5\xa7\xdd\xc8\xde\x08\xe6\x09\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x2a\xde\x09\xe6\x2a\xde\x29\xde\x29\xde\x09\xdd\xa8\xbc\xa5'\
-b'\xb4\x03\xc4\xe5\xdd\xc8\xe6\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x29\xde\x09\xde\x09\xdd\xe8\xdd\xa7\xd5\x87'\
-b'\xcd\x26\xb4\x03\xa3\x82\xb4\x43\xbc\x64\xbc\x43\xb4\x43\xbc\x44'\
-b'\xbc\x64\xbc\xa4\xc4\xe5\xcd\x26\xd5\x67\xd5\xa8\xdd\xe8\xde\x09'\
-b'\xde\x09\xe6\x29\xde\x09\xcd\x26\xb4\x03\xcd\x26\xde\x09\xe6\x29'\
-b'\xe6\x29\xe6\x2a\xde\x2a\xe6\x29\xe6\x2a\xe6\x2a\xe6\x49\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x29\xde\x29\xde\x08\xd5\x46\xab\xc2\xcd\x06'\
-b'\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x87\xcd\x46\xcd\x05\xc4\xc5\xc4\xa4'\
-b'\xbc\x64\xbc\x44\xb4\x43\xb4\x44\xbc\x64\xbc\x84\xc4\xa5\xc4\xc5'\
-b'\xa3\x82\xbc\x64\xd5\x87\xdd\xc8\xdd\xe8\xde\x09\xe6\x09\xe6\x29'\
-b'\xde\x29\xe6\x29\xe6\x2a\xde\x29\xe6\x2a\xe6\x2a\xde\x29\xe6\x29'\
-b'\xe6\x09\xdd\xc8\xab\xe2\xc4\xa4\xde\x08\xe6\x09\xe6\x09\xde\x09'\
-b'\xe6\x29\xde\x29\xde\x09\xde\x09\xde\x08\xdd\xc8\xd5\xa7\xd5\x87'\
-b'\xcd\x46\xcd\x25\xc4\xc5\xbc\xa4\xab\xa2\xa3\x61\xb4\x43\xbc\x43'\
-b'\xbc\x44\xbc\x64\xbc\xa4\xc4\xc5\xc5\x06\xcd\x26\xd5\x67\xd5\xa8'\
-b'\xdd\xc8\xdd\xe8\xde\x09\xde\x09\xde\x08\xe5\xe8\xc4\xe5\xab\xa2'\
-b'\xdd\xa7\xde\x08\xe6\x09\xe6\x29\xde\x29\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xe6\x09\xde\x08\xdd\xe8'\
-b'\xcd\x66\xa3\x82\xc4\xe5\xd5\x87\xd5\x66\xcd\x46\xcd\x06\xc4\xe5'\
-b'\xc4\xa5\xbc\x84\xbc\x64\xbc\x63\xbc\x44\xbc\x64\xbc\x64\xbc\x84'\
-b'\xc4\xc5\xc4\xe5\xc4\xc5\xa3\x82\xb4\x23\xd5\x87\xdd\xc8\xdd\xe8'\
-b'\xde\x08\xde\x09\xe6\x29\xde\x09\xde\x29\xe6\x29\xde\x29\xe6\x29'\
-b'\xe6\x29\xe6\x29\xde\x09\xde\x09\xdd\xe8\xc4\xc5\xab\xc2\xc4\xe5'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xde\x09\xd5\xa7\xc5\x06\xbc\x64\xb4\x23'\
-b'\xb4\x44\xc4\xc5\xcd\x46\xdd\xc8\xde\x08\xe6\x09\xe6\x09\xde\x09'\
-b'\xe6\x09\xde\x09\xe6\x09\xde\x09\xde\x08\xdd\xc8\xd5\x66\xc4\xe5'\
-b'\xbc\x44\xb4\x23\xbc\x64\xc4\xe5\xcd\x46\xcd\x05\xc4\xa5\xbc\x64'\
-b'\xb4\x43\xb4\x43\xbc\x64\xc4\xa5\xcd\x26\xd5\x66\xd5\xc8\xdd\xc8'\
-b'\xd5\xa7\xcd\x06\xbc\x64\xb4\x23\xbc\x64\xcd\x05\xd5\x87\xdd\xe8'\
-b'\xe6\x09\xe6\x09\xde\x09\xe6\x29\xe6\x29\xe6\x29\xde\x29\xe6\x29'\
-b'\xe6\x29\xde\x08\xdd\xc8\xcd\x46\xbc\x84\xb4\x23\xbc\x44\xc5\x05'\
-b'\xd5\x87\xdd\xe8\xe6\x09\xde\x09\xdd\xe8\xdd\xe8\xdd\xc7\xd5\x87'\
-b'\xcd\x46\xc4\xe5\xc4\xa5\xbc\x64\xb4\x23\xab\xe2\xb4\x03\xab\xc2'\
-b'\xa3\x61\xb4\x23\xcd\x05\xd5\x87\xdd\xc8\xdd\xe8\xe6\x08\xde\x29'\
-b'\xe6\x09\xde\x29\xde\x09\xe6\x2a\xe6\x2a\xde\x29\xde\x09\xdd\xc8'\
-b'\xcd\x06\xb4\x44\xb4\x23\xc4\xe5\xd5\xa7\xde\x09\xe6\x09\xde\x09'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x09\xe6\x29\xde\x29\xe6\x09\xde\x08'\
-b'\xdd\xe8\xdd\xa7\xcd\x05\xac\x03\xab\xa2\xbc\x64\xbc\x84\xbc\x64'\
-b'\xbc\x43\xb4\x23\xbc\x44\xbc\x64\xbc\xa5\xc5\x05\xcd\x46\xd5\x87'\
-b'\xd5\xc8\xdd\xe8\xde\x09\xe6\x09\xdd\xc8\xcd\x05\xb4\x03\xbc\x84'\
-b'\xd5\x87\xe6\x08\xde\x29\xe6\x29\xde\x29\xe6\x2a\xde\x2a\xe6\x2a'\
-b'\xde\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x09\xde\x09\xde\x09\xd5\x87'\
-b'\xbc\x43\xbc\x43\xd5\x66\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xc8\xd5\x87'\
-b'\xd5\x46\xcd\x06\xc4\xc5\xbc\x84\xbc\x64\xb4\x43\xb4\x23\xbc\x43'\
-b'\xbc\x64\xbc\xa4\xbc\x64\xab\xa2\xc4\xa4\xd5\x87\xdd\xc8\xdd\xe8'\
-b'\xde\x09\xe6\x29\xe6\x29\xe6\x4a\xde\x2a\xe6\x49\xe6\x2a\xde\x2a'\
-b'\xe6\x2a\xde\x29\xe6\x29\xde\x09\xd5\x87\xab\xe3\xc4\xc5\xde\x08'\
-b'\xe6\x09\xe6\x29\xe6\x29\xe6\x09\xe6\x29\xde\x29\xe6\x29\xde\x09'\
-b'\xde\x08\xdd\xe8\xdd\xc8\xd5\x87\xd5\x66\xcd\x05\xc4\xc5\xab\xa2'\
-b'\xab\xa1\xb4\x43\xb4\x23\xbc\x43\xb4\x43\xbc\x64\xbc\xa4\xc4\xc5'\
-b'\xcd\x26\xcd\x47\xd5\x87\xdd\xc8\xdd\xe8\xde\x09\xde\x09\xde\x09'\
-b'\xe6\x08\xd5\x67\xa3\x82\xcd\x46\xe6\x09\xde\x09\xe6\x29\xe6\x29'\
-b'\xde\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x29'\
-b'\xe6\x29\xde\x09\xde\x08\xdd\xe8\xb4\x23\xb4\x03\xd5\xa7\xd5\xa7'\
-b'\xd5\x87\xd5\x46\xcd\x26\xc4\xe5\xc4\xc5\xc4\x84\xbc\x64\xbc\x43'\
-b'\xb4\x44\xb4\x43\xbc\x64\xbc\x84\xc4\xa5\xc4\xe5\xbc\xa4\xa3\x61'\
-b'\xc4\xe5\xd5\xa7\xdd\xc8\xdd\xe8\xe6\x09\xde\x29\xe6\x29\xde\x29'\
-b'\xe6\x29\xde\x29\xde\x29\xe6\x29\xe6\x29\xde\x09\xe6\x09\xe6\x09'\
-b'\xdd\xe8\xbc\x84\xb3\xe3\xdd\xc7\xde\x09\xe6\x09\xe6\x09\xde\x29'\
-b'\xe6\x09\xde\x08\xdd\xe8\xdd\xe8\xd5\xc8\xd5\xa7\xd5\x67\xcd\x46'\
-b'\xcd\x06\xc4\xc5\xc4\xa4\xbc\x43\xa3\xa2\xa3\x81\xb4\x23\xbc\x44'\
-b'\xbc\x64\xbc\x84\xc4\xc5\xc4\xe6\xcd\x26\xd5\x67\xd5\x88\xd5\xa8'\
-b'\xdd\xe8\xde\x09\xe6\x09\xe6\x29\xe6\x29\xde\x08\xcd\x06\xab\xa2'\
-b'\xdd\xc8\xcd\x46\xc4\xa5\xb4\x23\xb4\x23\xc4\xa4\xcd\x26\xd5\xa7'\
-b'\xdd\xe8\xe6\x09\xe6\x29\xde\x09\xe6\x29\xde\x09\xde\x29\xe6\x29'\
-b'\xe6\x09\xde\x08\xdd\xc7\xcd\x26\xc4\xa4\xb4\x44\xb4\x43\xbc\xa4'\
-b'\xcd\x46\xdd\xa7\xdd\xe8\xe6\x09\xde\x09\xde\x09\xde\x08\xdd\xe8'\
-b'\xdd\xc8\xd5\x87\xcd\x26\xc4\xe5\xbc\x63\xab\xe2\xab\xa2\xab\xe3'\
-b'\xa3\x82\xa3\x81\xbc\x43\xcd\x25\xd5\xa7\xdd\xe8\xde\x08\xe6\x08'\
-b'\xde\x09\xde\x29\xe6\x29\xde\x09\xe6\x09\xde\x29\xe6\x09\xdd\xc8'\
-b'\xcd\x47\xc4\xa4\xb4\x23\xbc\x44\xc4\xe5\xd5\x87\xdd\xe8\xe6\x09'\
-b'\xe6\x29\xde\x09\xe6\x09\xe6\x29\xde\x09\xe6\x09\xe6\x09\xde\x09'\
-b'\xe6\x08\xdd\xe8\xdd\xa7\xc4\xe5\xb4\x03\xab\xe2\xbc\x64\xc4\xe5'\
-b'\xc4\xa4\xbc\x64\xbc\x44\xb4\x23\xbc\x43\xbc\x84\xc4\xc5\xcd\x06'\
-b'\xd5\x67\xd5\xa7\xdd\xe8\xde\x09\xdd\xe8\xd5\xa7\xc4\xc5\xb4\x23'\
-b'\xbc\x43\xcd\x05\xdd\xc8\xde\x08\xe6\x09\xe6\x09\xde\x29\xe6\x29'\
-b'\xe6\x29\xde\x2a\xe6\x29\xde\x29\xe6\x29\xe6\x09\xde\x09\xdd\xe8'\
-b'\xd5\x67\xbc\x84\xb4\x03\xc4\xc4\xd5\x87\xdd\xe8\xe6\x08\xdd\xe8'\
-b'\xdd\xe8\xd5\xa7\xd5\x87\xcd\x46\xcc\xe5\xc4\xa4\xbc\x64\xb4\x23'\
-b'\xbc\x23\xb4\x44\xbc\x44\xbc\x64\xab\xe3\xab\xa2\xc4\xa4\xd5\x87'\
-b'\xdd\xe8\xdd\xe8\xe6\x09\xde\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xe6\x2a\xde\x2a\xde\x29\xe6\x29\xde\x09\xdd\xe8\xcd\x06\xb4\x03'\
-b'\xc4\xc5\xdd\xc8\xde\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x29\xde\x29\xe6\x29\xde\x09\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x67'\
-b'\xcd\x05\xab\xc2\xab\xc2\xbc\x63\xb4\x43\xb4\x23\xbc\x43\xb4\x44'\
-b'\xbc\x84\xc4\xc5\xc5\x06\xcd\x46\xd5\x87\xdd\xc8\xdd\xe8\xde\x09'\
-b'\xe6\x29\xe6\x09\xde\x09\xdd\xa7\xb4\x03\xc4\x84\xdd\xe8\xe6\x09'\
-b'\xde\x29\xde\x29\xe6\x29\xe6\x2a\xde\x2a\xe6\x29\xe6\x2a\xe6\x2a'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xde\x09\xcd\x46\xab\xa2'\
-b'\xcd\x26\xdd\xe8\xdd\xc7\xd5\xa7\xd5\x67\xd5\x46\xcd\x06\xc4\xc5'\
-b'\xbc\xa4\xbc\x64\xbc\x43\xb4\x43\xb4\x43\xbc\x44\xbc\x84\xc4\xa4'\
-b'\xc4\xe5\xb4\x43\xa3\x82\xd5\x46\xd5\xc7\xdd\xe8\xde\x09\xe6\x09'\
-b'\xe6\x29\xe6\x2a\xe6\x2a\xe6\x2a\xde\x29\xe6\x2a\xe6\x29\xe6\x29'\
-b'\xe6\x2a\xe6\x09\xe6\x09\xdd\xe8\xb4\x43\xb4\x03\xdd\xe8\xe6\x09'\
-b'\xde\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xde\x09\xde\x08\xdd\xe8'\
-b'\xdd\xc8\xd5\x87\xd5\x67\xcd\x26\xcc\xe5\xc4\xc5\xbc\x64\xa3\x62'\
-b'\xab\x82\xb4\x43\xb4\x43\xbc\x44\xbc\x84\xbc\xa5\xc4\xc5\xcd\x06'\
-b'\xcd\x47\xd5\x87\xdd\xa8\xdd\xc8\xdd\xe9\xde\x09\xde\x09\xe6\x29'\
-b'\xde\x08\xd5\x87\xab\xc2\xc4\xc5\xdd\xe8\xe6\x09\xde\x29\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x29'\
-b'\xe6\x09\xde\x09\xde\x08\xdd\xe8\xd5\x46\xab\xa2\xbc\x64\xd5\x66'\
-b'\xcd\x66\xcd\x46\xcd\x06\xc4\xc5\xc4\xa4\xbc\x84\xbc\x64\xbc\x63'\
-b'\xb4\x44\xbc\x44\xbc\x64\xbc\x84\xc4\xc5\xc4\xe6\xcd\x26\xc4\xc5'\
-b'\xa3\x82\xa3\x61\xbc\x23\xcd\x06\xd5\xa7\xdd\xe8\xe6\x09\xe6\x09'\
-b'\xde\x09\xe6\x29\xde\x09\xe6\x29\xe6\x09\xde\x09\xdd\xe8\xd5\x87'\
-b'\xc4\xe5\xbc\x64\xb4\x23\xbc\x64\xc4\xe5\xd5\x67\xdd\xc8\xe6\x09'\
-b'\xe6\x09\xde\x29\xde\x29\xe6\x09\xe6\x29\xe6\x09\xe6\x09\xde\x09'\
-b'\xde\x08\xdd\xc8\xd5\x66\xc4\xc5\xb4\x23\xb4\x03\xbc\x64\xcd\x05'\
-b'\xcd\x05\xc4\xc5\xbc\x64\xb4\x43\xb4\x23\xbc\x44\xc4\xa4\xc4\xe6'\
-b'\xd5\x66\xd5\xa7\xdd\xc8\xde\x08\xdd\xc8\xd5\x67\xc4\xc5\xb4\x23'\
-b'\xb4\x23\xc4\xc5\xd5\x66\xdd\xe8\xde\x09\xe6\x09\xde\x09\xe6\x29'\
-b'\xde\x29\xe6\x2a\xde\x29\xe6\x29\xe6\x29\xde\x09\xde\x09\xdd\xe8'\
-b'\xd5\x67\xbc\x84\xb4\x03\xbc\x44\xcd\x05\xdd\xa7\xdd\xe8\xe6\x09'\
-b'\xde\x09\xde\x08\xdd\xe8\xdd\xa7\xd5\x67\xcd\x26\xc4\xc5\xbc\x84'\
-b'\xb4\x43\xb4\x23\xb4\x23\xb4\x23\xbc\x23\xa3\x82\xab\xc2\xc4\xc5'\
-b'\xd5\x87\xdd\xe8\xde\x08\xde\x09\xe6\x09\xe6\x29\xde\x29\xe6\x29'\
-b'\xe6\x2a\xe6\x29\xe6\x2a\xde\x29\xe6\x09\xde\x09\xd5\x67\xbc\x84'\
-b'\xb4\x03\xc4\xa4\xd5\xa7\xde\x09\xe6\x09\xe6\x29\xde\x29\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x09\xe6\x29\xde\x09\xde\x09\xdd\xe8\xdd\xc8'\
-b'\xd5\xa7\xcc\xe5\xab\xc2\xab\xa2\xbc\x63\xb4\x63\xb4\x43\xb4\x23'\
-b'\xb4\x43\xbc\x64\xbc\xa5\xc4\xe5\xcd\x26\xd5\x87\xd5\xc8\xdd\xe8'\
-b'\xde\x09\xe6\x09\xe6\x29\xde\x09\xdd\xa7\xbc\x64\xb4\x23\xcd\x46'\
-b'\xde\x08\xde\x09\xe6\x29\xe6\x29\xde\x2a\xe6\x2a\xe6\x2a\xe6\x4a'\
-b'\xde\x2a\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xdd\xc7'\
-b'\xbc\x64\xb4\x44\xd5\xa7\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x66'\
-b'\xcd\x26\xc4\xe5\xc4\x84\xbc\x64\xb4\x43\xb4\x23\xb4\x43\xbc\x44'\
-b'\xbc\x84\xc4\xc5\xc4\xe5\xb4\x03\xab\xe2\xd5\x66\xdd\xc8\xde\x08'\
-b'\xe6\x09\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xe6\x2a\xde\x49\xe6\x2a'\
-b'\xe6\x2a\xde\x29\xe6\x2a\xe6\x29\xde\x09\xdd\xe8\xb4\x03\xbc\x43'\
-b'\xdd\xe8\xde\x09\xe6\x09\xe6\x29\xe6\x29\xde\x29\xe6\x29\xe6\x09'\
-b'\xde\x09\xde\x08\xdd\xe8\xdd\xc8\xd5\x87\xd5\x46\xcd\x26\xc4\xc5'\
-b'\xbc\x84\xa3\x61\xab\x82\xb4\x23\xb4\x23\xbc\x43\xbc\x64\xbc\x84'\
-b'\xc4\xc5\xc5\x06\xcd\x66\xd5\x87\xdd\xa8\xdd\xe8\xde\x09\xde\x09'\
-b'\xde\x29\xe6\x29\xde\x09\xdd\xe8\xbc\x23\xb4\x03\xdd\xe8\xe6\x09'\
-b'\xe6\x09\xde\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xe6\x2a'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xde\x08\xdd\xe8\xbc\x64'\
-b'\xab\xc2\xd5\x87\xd5\x87\xd5\x67\xcd\x46\xcd\x05\xc4\xe5\xc4\xa5'\
-b'\xbc\x84\xbc\x44\xb4\x43\xbc\x44\xbc\x44\xbc\x84\xbc\xa4\xc4\xc5'\
-b'\xcc\xe5\xcd\x26\xbc\x43\xa3\xa2\xd5\x66\xdd\xe8\xdd\xe8\xde\x09'\
-b'\xe6\x29\xde\x29\xe6\x29\xde\x2a\xe6\x29\xde\x2a\xe6\x2a\xe6\x29'\
-b'\xde\x29\xe6\x29\xe6\x09\xde\x09\xde\x08\xcd\x26\xa3\xa2\xc4\xe5'\
-b'\xde\x08\xe6\x09\xe6\x09\xe6\x29\xde\x29\xde\x09\xde\x08\xdd\xe8'\
-b'\xdd\xc8\xd5\xa7\xd5\x67\xcd\x46\xcd\x06\xc4\xe5\xc4\xc5\xbc\xa4'\
-b'\xcd\x26\xc4\xa5\xbc\x64\xb4\x23\xb4\x23\xbc\x84\xc4\xe5\xcd\x46'\
-b'\xd5\xa7\xdd\xe8\xde\x08\xdd\xc8\xcd\x46\xc4\xa4\xb4\x43\xb4\x23'\
-b'\xbc\x84\xcd\x26\xd5\xa8\xdd\xe8\xe6\x09\xde\x29\xe6\x29\xde\x09'\
-b'\xe6\x29\xe6\x29\xe6\x2a\xde\x29\xe6\x29\xde\x09\xdd\xe8\xd5\x66'\
-b'\xc4\xa5\xb4\x23\xb4\x23\xbc\xa4\xcd\x46\xdd\xc8\xde\x08\xde\x09'\
-b'\xde\x09\xde\x09\xde\x08\xdd\xc8\xd5\xa7\xcd\x46\xc4\xe5\xbc\x84'\
-b'\xbc\x44\xb4\x03\xab\xe2\xb4\x23\xb3\xe3\xa3\x81\xb4\x03\xcd\x05'\
-b'\xd5\xa7\xdd\xe8\xde\x09\xe6\x09\xe6\x09\xde\x29\xe6\x29\xe6\x29'\
-b'\xe6\x2a\xde\x29\xe6\x29\xe6\x09\xde\x09\xd5\xa7\xc4\xe5\xbc\x43'\
-b'\xb4\x03\xc4\xa4\xd5\x87\xdd\xe8\xde\x09\xde\x29\xe6\x29\xe6\x29'\
-b'\xe6\x29\xde\x09\xe6\x09\xde\x29\xde\x09\xde\x08\xde\x08\xdd\xe8'\
-b'\xdd\x87\xc4\xc5\xab\xc2\xab\xa2\xbc\x64\xbc\x84\xbc\x43\xb4\x23'\
-b'\xb4\x23\xbc\x43\xbc\x84\xc4\xc5\xcd\x26\xd5\x87\xdd\xc8\xdd\xe8'\
-b'\xde\x09\xde\x09\xde\x09\xde\x08\xd5\x67\xbc\x64\xb4\x02\xbc\xa4'\
-b'\xd5\xa7\xde\x08\xe6\x09\xe6\x29\xde\x29\xe6\x2a\xe6\x2a\xe6\x2a'\
-b'\xde\x2a\xe6\x2a\xde\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x09\xdd\xc7'\
-b'\xbc\xa4\xb3\xe3\xbc\xa4\xd5\xa7\xdd\xe8\xe5\xe8\xdd\xc8\xdd\xa8'\
-b'\xd5\x67\xcd\x46\xcc\xe5\xc4\xa4\xbc\x64\xb4\x23\xb4\x23\xb4\x23'\
-b'\xbc\x64\xbc\x84\xc4\xc5\xc4\xc5\xab\xc2\xb4\x23\xd5\x86\xdd\xe8'\
-b'\xe6\x09\xe6\x09\xe6\x29\xe6\x2a\xe6\x29\xde\x2a\xe6\x4a\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xde\x2a\xe6\x29\xe6\x29\xd5\xa7\xb4\x23'\
-b'\xbc\x64\xdd\xc8\xe6\x09\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xe6\x2a'\
-b'\xe6\x29\xe6\x29\xde\x09\xde\x09\xdd\xe8\xdd\xc8\xd5\x87\xcd\x46'\
-b'\xcd\x05\xbc\x84\xa3\x61\xa3\xa2\xb4\x23\xb4\x23\xb4\x23\xbc\x64'\
-b'\xbc\x84\xc4\xc5\xc5\x06\xcd\x67\xd5\xa7\xdd\xc8\xdd\xe9\xde\x09'\
-b'\xe6\x29\xe6\x29\xde\x29\xe6\x09\xde\x09\xc4\xe5\xab\xa2\xd5\x87'\
-b'\xde\x09\xe6\x29\xe6\x29\xde\x2a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x2a'\
-b'\xe6\x29\xe6\x2a\xe6\x2a\xde\x29\xe6\x29\xde\x09\xde\x09\xe6\x08'\
-b'\xd5\x87\xa3\x82\xc4\xe5\xdd\xc7\xd5\xa7\xd5\x67\xcd\x46\xcd\x05'\
-b'\xc4\xc5\xbc\x84\xbc\x64\xb4\x43\xb4\x23\xb4\x23\xbc\x44\xbc\x84'\
-b'\xc4\xa4\xc4\xe5\xcd\x06\xcd\x46\xab\xe3\xb4\x03\xd5\xc7\xdd\xe8'\
-b'\xde\x09\xe6\x29\xe6\x29\xde\x29\xe6\x2a\xe6\x2a\xde\x29\xe6\x2a'\
-b'\xe6\x29\xde\x2a\xe6\x29\xde\x29\xe6\x29\xe6\x09\xde\x08\xcd\x26'\
-b'\xa3\x81\xd5\x66\xde\x08\xe6\x09\xe6\x29\xe6\x29\xe6\x29\xde\x09'\
-b'\xe6\x09\xde\x08\xdd\xe8\xd5\xa8\xd5\x87\xd5\x66\xcd\x26\xc4\xc5'\
-b'\xbc\xa5\xbc\x84\xb4\x23\xa3\x62\xa3\x82\xb4\x23\xbc\x64\xbc\x84'\
-b'\xc4\xa5\xc4\xe5\xcd\x26\xd5\x67\xd5\xa7\xdd\xc8\xdd\xe8\xde\x09'\
-b'\xe6\x09\xe6\x09\xde\x29\xe6\x29\xe6\x09\xde\x08\xc4\xe5\xab\x82'\
-b'\xcd\x26\xde\x08\xde\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xde\x09\xdd\xc8\xd5\x67\xcd\x05\xbc\x84\xb4\x23'\
-b'\xab\xc2\xab\xe2\xb4\x23\xab\xa2\xab\xa2\xbc\x64\xcd\x46\xdd\xa8'\
-b'\xe6\x08\xe6\x09\xde\x09\xe6\x09\xde\x29\xe6\x29\xe6\x29\xde\x29'\
-b'\xe6\x09\xde\x29\xde\x09\xdd\xc8\xcd\x46\xbc\x84\xb4\x23\xb4\x23'\
-b'\xc4\xa5\xcd\x66\xdd\xc8\xe6\x09\xe6\x29\xe6\x09\xe6\x29\xe6\x29'\
-b'\xe6\x29\xe6\x09\xe6\x09\xe6\x09\xe6\x09\xe6\x09\xdd\xe8\xd5\x66'\
-b'\xc4\xc5\xb3\xe2\xab\xc2\xbc\x64\xbc\xa4\xbc\x44\xb4\x23\xb4\x23'\
-b'\xb4\x43\xbc\x84\xc4\xe5\xcd\x46\xd5\x87\xdd\xc8\xdd\xe8\xde\x09'\
-b'\xe6\x29\xde\x09\xdd\xc8\xcd\x46\xbc\x64\xb4\x03\xbc\x64\xcd\x26'\
-b'\xd5\xc7\xde\x09\xde\x09\xe6\x29\xe6\x29\xe6\x29\xde\x2a\xe6\x2a'\
-b'\xe6\x29\xde\x2a\xe6\x29\xe6\x09\xe6\x29\xde\x09\xdd\xa7\xc4\xc5'\
-b'\xb4\x23\xb4\x23\xc4\xe5\xdd\xa7\xdd\xe8\xde\x08\xdd\xe8\xdd\xc8'\
-b'\xd5\x87\xcd\x46\xcc\xe5\xbc\xa4\xbc\x64\xb4\x23\xb4\x23\xb4\x23'\
-b'\xbc\x64\xc4\xc5\xc4\xe5\xbc\x43\xab\xa2\xbc\x64\xd5\x86\xdd\xe8'\
-b'\xe6\x09\xe6\x09\xde\x29\xe6\x29\xde\x29\xe6\x2a\xe6\x4a\xde\x29'\
-b'\xe6\x49\xe6\x2a\xe6\x2a\xde\x29\xde\x29\xdd\xe8\xc5\x06\xb4\x03'\
-b'\xbc\x44\xd5\x67\xde\x08\xe6\x29\xe6\x29\xde\x2a\xe6\x29\xe6\x29'\
-b'\xde\x29\xe6\x29\xde\x09\xde\x09\xde\x08\xdd\xc8\xdd\xa7\xd5\x67'\
-b'\xcd\x26\xc4\x84\xa3\x81\xa3\xa2\xb3\xe3\xb4\x03\xb4\x23\xbc\x44'\
-b'\xbc\x84\xc4\xe5\xcd\x26\xcd\x67\xd5\xc8\xdd\xe8\xe6\x09\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x29\xde\x29\xde\x29\xd5\x67\xb4\x03\xc4\xa5'\
-b'\xdd\xe8\xe6\x29\xe6\x29\xde\x2a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xde\x09'\
-b'\xdd\xe8\xc4\x84\xab\xe2\xd5\x66\xdd\xc8\xd5\xa7\xd5\x67\xcd\x46'\
-b'\xc4\xe5\xc4\xa5\xbc\x84\xbc\x43\xb4\x23\xb4\x23\xb4\x43\xbc\x64'\
-b'\xbc\x84\xc4\xe5\xcd\x06\xcd\x46\xd5\x46\xab\xc2\xbc\x84\xdd\xe8'\
-b'\xe6\x08\xe6\x29\xe6\x29\xe6\x29\xde\x2a\xe6\x49\xde\x4a\xe6\x4a'\
-b'\xe6\x4a\xde\x49\xe6\x2a\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xde\x09'\
-b'\xcd\x05\xa3\x81\xd5\x87\xe6\x09\xde\x09\xe6\x09\xe6\x29\xde\x29'\
-b'\xe6\x09\xe6\x09\xde\x08\xdd\xe8\xdd\xc8\xd5\x87\xd5\x66\xcd\x26'\
-b'\xc4\xe5\xbc\x84\xbc\x64\xb4\x43\xa3\x61\xa3\x61\xb4\x23\xbc\x43'\
-b'\xbc\x84\xc4\xc5\xc5\x06\xcd\x46\xd5\x87\xd5\xc8\xdd\xe8\xde\x09'\
-b'\xe6\x29\xe6\x29\xe6\x29\xde\x29\xe6\x29\xe6\x09\xde\x09\xd5\xa7'\
-b'\xab\x82\xc4\xc5\xde\x09\xde\x29\xe6\x29\xe6\x29\xde\x2a\xe6\x29'\
-b'\xe6\x29\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xde\x29\xe6\x09'\
-b'\xe6\x09\xde\x08\xdd\xe8\xcd\x05\xa3\x61\xc4\xe5\xd5\x46\xcd\x26'\
-b'\xc4\xe5\xc4\xc5\xbc\x84\xbc\x64\xb4\x44\xb4\x43\xb4\x23\xbc\x44'\
-b'\xbc\x84\xbc\xa4\xc4\xe5\xcd\x06\xcd\x46\xd5\x67\xd5\x87\xbc\x64'\
-b'\xab\xa2\xd5\x46\xde\x08\xe6\x09\xde\x29\xe6\x29\xe6\x2a\xde\x2a'\
-b'\xe6\x49\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x09\xdd\xc8\xcd\x46\xc4\xa4\xb4\x23'\
-b'\xb3\xe3\xbc\x44\xc4\xc5\xbc\x64\xb4\x23\xb4\x23\xb4\x43\xbc\x84'\
-b'\xc4\xe5\xd5\x66\xd5\xa8\xdd\xe8\xe6\x08\xe6\x09\xde\x09\xde\x09'\
-b'\xdd\xa8\xcd\x26\xbc\x84\xb4\x23\xb4\x24\xc4\xc5\xd5\x67\xdd\xe8'\
-b'\xe6\x09\xe6\x29\xde\x09\xe6\x29\xde\x29\xe6\x2a\xde\x2a\xe6\x29'\
-b'\xde\x29\xde\x29\xe6\x29\xde\x08\xd5\x87\xc4\xe5\xb4\x44\xb4\x03'\
-b'\xbc\x64\xcd\x26\xd5\xc7\xdd\xe8\xe6\x09\xde\x08\xdd\xe8\xd5\xa7'\
-b'\xd5\x47\xcc\xe5\xbc\xa4\xbc\x44\xb4\x23\xb4\x23\xbc\x64\xbc\xa4'\
-b'\xc4\xe5\xc4\xa5\xab\xe3\xb4\x02\xc4\xa4\xd5\x87\xdd\xe8\xde\x08'\
-b'\xe6\x09\xe6\x09\xe6\x29\xde\x29\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xde\x2a\xe6\x29\xde\x29\xdd\xe8\xd5\x67\xbc\x84\xb4\x03\xbc\x43'\
-b'\xcd\x26\xdd\xc8\xde\x08\xe6\x09\xe6\x29\xe6\x29\xde\x09\xe6\x29'\
-b'\xe6\x29\xe6\x09\xde\x09\xde\x09\xdd\xe8\xdd\xc7\xd5\x87\xcd\x46'\
-b'\xbc\x43\xa3\x61\xab\x82\xab\xe2\xab\xc2\xb4\x23\xb4\x44\xbc\xa4'\
-b'\xc4\xe5\xcd\x46\xd5\xa7\xdd\xc8\xde\x09\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x2a\xde\x29\xe6\x29\xde\x09\xd5\x46\xb4\x23\xb4\x23\xcd\x26'\
-b'\xdd\xe8\xde\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xde\x08'\
-b'\xcd\x46\xb4\x03\xbc\x64\xd5\x86\xdd\xc7\xd5\xa7\xd5\x87\xcd\x26'\
-b'\xc4\xe5\xc4\xa4\xbc\x64\xb4\x43\xb4\x23\xb4\x23\xb4\x44\xbc\x84'\
-b'\xc4\xe5\xcd\x26\xcd\x67\xd5\xa7\xcd\x06\xab\xe3\xc4\xe5\xdd\xe8'\
-b'\xe6\x29\xde\x29\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xde\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x29\xe6\x2a\xe6\x29\xde\x08'\
-b'\xc4\xe5\xab\xc2\xd5\x47\xde\x09\xe6\x09\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x29\xe6\x09\xde\x09\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x67\xcd\x26'\
-b'\xc4\xe5\xc4\xa4\xbc\x44\xb4\x23\xa3\x81\x9b\x41\xb4\x03\xbc\x44'\
-b'\xbc\x84\xc4\xe5\xcd\x26\xd5\x67\xd5\xa8\xdd\xe8\xde\x09\xe6\x09'\
-b'\xe6\x29\xe6\x29\xe6\x4a\xe6\x49\xde\x2a\xe6\x29\xde\x29\xdd\xe8'\
-b'\xbc\x44\xab\xe3\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xde\x29\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xde\x29\xe6\x29'\
-b'\xde\x09\xe6\x08\xdd\xe8\xdd\xa7\xb4\x03\xab\xc2\xd5\x46\xcd\x26'\
-b'\xc4\xe5\xc4\xc5\xbc\x84\xbc\x44\xbc\x23\xb4\x23\xb4\x23\xbc\x43'\
-b'\xbc\x64\xbc\xa5\xc4\xe5\xcd\x26\xcd\x47\xd5\x87\xdd\xa7\xdd\xa7'\
-b'\xac\x03\xb4\x03\xdd\xe8\xe6\x09\xe6\x29\xde\x29\xe6\x2a\xe6\x2a'\
-b'\xde\x2a\xe6\x2a\xe6\x2a\xde\x2a\xe6\x2a\xe6\x2a\xe6\x29\xde\x2a'\
-b'\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xb4\x23\xb4\x03\xdd\xc8\xde\x08'\
-b'\xe6\x09\xde\x09\xe6\x09\xde\x08\xdd\xe8\xdd\xc8\xdd\xa8\xd5\x87'\
-b'\xcd\x46\xcd\x06\xc4\xc5\xbc\xa4\xbc\x64\xb4\x43\xb4\x23\xb4\x03'\
-b'\xa3\x61\xa3\xa2\xbc\x64\xc4\xc5\xc5\x06\xcd\x46\xd5\x87\xd5\xa8'\
-b'\xdd\xe8\xde\x09\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x2a\xdd\xc8\xcd\x26\xbc\x84\xb4\x23\xb4\x43\xc4\xa5\xcd\x46'\
-b'\xdd\xc8\xde\x08\xde\x08\xde\x09\xdd\xe8\xd5\xa7\xd5\x47\xc4\xe5'\
-b'\xbc\x84\xb4\x23\xb4\x23\xb4\x44\xbc\x84\xcd\x05\xc4\xe5\xbc\x44'\
-b'\xb4\x03\xb4\x43\xc4\xe5\xd5\x87\xdd\xe8\xe6\x08\xde\x09\xe6\x29'\
-b'\xde\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x2a\xe6\x29\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xa8\xcd\x06\xb4\x44\xb4\x03\xbc\x64\xcd\x05\xd5\xa7'\
-b'\xde\x08\xe6\x29\xe6\x09\xe6\x29\xde\x29\xe6\x09\xe6\x09\xe6\x29'\
-b'\xde\x09\xe6\x09\xde\x08\xdd\xe8\xdd\xa7\xcd\x26\xbc\x43\xa3\x61'\
-b'\xa3\x82\xab\xe2\xab\xa2\xb3\xe2\xbc\x64\xbc\xa5\xcd\x06\xd5\x87'\
-b'\xdd\xc7\xdd\xe8\xde\x09\xe6\x09\xe6\x29\xde\x29\xde\x29\xe6\x29'\
-b'\xe6\x29\xdd\xe8\xcd\x26\xbc\x44\xac\x03\xbc\x84\xd5\x66\xdd\xe8'\
-b'\xde\x09\xe6\x29\xe6\x29\xde\x29\xe6\x2a\xe6\x29\xe6\x2a\xde\x29'\
-b'\xe6\x2a\xde\x29\xe6\x29\xe6\x29\xe6\x09\xdd\xe8\xd5\x46\xbc\x44'\
-b'\xab\xe2\xc4\xa4\xd5\x87\xdd\xc8\xd5\xa7\xd5\x66\xcd\x26\xc4\xc5'\
-b'\xbc\x64\xbc\x43\xb4\x03\xb4\x03\xb4\x43\xbc\x84\xc4\xc5\xcd\x26'\
-b'\xd5\x87\xdd\xa7\xd5\x87\xbc\x64\xab\xe3\xc4\xc5\xdd\xa7\xde\x09'\
-b'\xe6\x09\xe6\x29\xe6\x29\xde\x2a\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xde\x2a\xe6\x29\xe6\x09\xdd\xc8\xc4\xa5'\
-b'\xab\xe2\xc4\xe5\xdd\xe8\xe6\x09\xde\x09\xe6\x29\xe6\x29\xe6\x29'\
-b'\xde\x29\xde\x09\xde\x08\xdd\xe8\xdd\xa7\xd5\x87\xcd\x26\xcc\xe5'\
-b'\xbc\x84\xbc\x44\xb4\x23\xab\x82\xa3\x61\xab\xa2\xbc\x63\xc4\xc5'\
-b'\xcd\x06\xd5\x66\xd5\xa8\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xde\x49\xe6\x4a\xe6\x2a\xe6\x2a\xde\x29\xde\x09\xcd\x26'\
-b'\xab\xa2\xcd\x26\xde\x09\xe6\x29\xe6\x29\xde\x2a\xe6\x2a\xde\x2a'\
-b'\xe6\x29\xe6\x4a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xe6\x29'\
-b'\xde\x09\xde\x08\xdd\xe8\xcd\x26\xa3\x81\xc4\xa4\xcd\x46\xcd\x05'\
-b'\xc4\xc5\xbc\x84\xbc\x64\xb4\x23\xb4\x23\xb4\x23\xb4\x23\xbc\x64'\
-b'\xbc\xa5\xc4\xe6\xcd\x46\xd5\x67\xd5\xa8\xdd\xe8\xdd\xe8\xdd\xa7'\
-b'\xa3\xa2\xc4\xa4\xde\x08\xe6\x09\xe6\x29\xde\x29\xe6\x2a\xe6\x4a'\
-b'\xe6\x2a\xe6\x49\xde\x4a\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x2a'\
-b'\xe6\x29\xde\x29\xe6\x09\xdd\xe8\xb4\x23\xb4\x03\xdd\xe8\xde\x09'\
-b'\xe6\x09\xe6\x09\xde\x09\xde\x08\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x67'\
-b'\xcd\x26\xc4\xe5\xc4\xa5\xbc\x64\xbc\x43\xb4\x23\xb4\x23\xb4\x23'\
-b'\xab\xa2\x9b\x41\xbc\x84\xc4\xe5\xcd\x26\xd5\x67\xd5\xa7\xdd\xe8'\
-b'\xde\x09\xde\x29\xe6\x29\xe6\x29\xe6\x49\xde\x29\xe6\x4a\xe6\x29'\
-b'\xe6\x29\xde\x29\xe6\x09\xde\x09\xd5\x66\xa3\x82\xcd\x05\xde\x09'\
-b'\xe6\x09\xe6\x29\xde\x29\xe6\x2a\xe6\x29\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xe6\x29\xe6\x29\xde\x29\xe6\x09\xde\x09\xdd\xe9\xdd\xc8\xd5\xa7'\
-b'\xd5\x66\xb4\x03\x9b\x41\xbc\x64\xc4\x84\xbc\x64\xbc\x44\xb4\x43'\
-b'\xb4\x43\xbc\x44\xbc\x64\xbc\xa5\xc4\xe5\xcd\x06\xcd\x67\xd5\xa8'\
-b'\xbc\x44\xb4\x23\xbc\x64\xc5\x06\xd5\xa7\xdd\xe9\xe6\x29\xe6\x29'\
-b'\xde\x29\xe6\x29\xe6\x29\xe6\x09\xe6\x09\xde\x29\xe6\x09\xe6\x08'\
-b'\xdd\xe8\xdd\xa8\xcd\x05\xb4\x23\xa3\x61\xa3\x82\xab\xe3\xa3\x81'\
-b'\xab\xc2\xbc\x64\xcd\x05\xd5\x67\xdd\xa7\xdd\xe8\xde\x09\xe6\x09'\
-b'\xe6\x09\xde\x29\xde\x2a\xe6\x29\xde\x29\xde\x09\xdd\xc8\xcd\x26'\
-b'\xbc\x64\xac\x03\xb4\x43\xcd\x05\xd5\xa7\xdd\xe8\xe6\x29\xe6\x29'\
-b'\xe6\x2a\xe6\x2a\xde\x29\xe6\x2a\xe6\x2a\xde\x2a\xe6\x29\xde\x29'\
-b'\xe6\x29\xde\x09\xdd\xe8\xd5\x67\xbc\x84\xb4\x03\xb4\x23\xc4\xe5'\
-b'\xd5\x87\xdd\xc7\xd5\xa7\xd5\x46\xc5\x05\xc4\xa4\xbc\x43\xb4\x23'\
-b'\xb4\x03\xb4\x43\xbc\x84\xc4\xe5\xcd\x46\xd5\x87\xdd\xc8\xd5\xa7'\
-b'\xc4\xe5\xb4\x03\xb4\x03\xc4\xc4\xd5\x87\xdd\xe8\xe6\x09\xde\x29'\
-b'\xe6\x29\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xde\x29\xdd\xe8\xcd\x67\xb4\x44\xab\xe2\xc4\xa4'\
-b'\xd5\xa7\xde\x09\xde\x09\xe6\x29\xe6\x29\xde\x29\xe6\x29\xe6\x09'\
-b'\xde\x08\xdd\xe8\xdd\xc8\xd5\x87\xcd\x26\xc4\xe5\xbc\x84\xbc\x43'\
-b'\xab\xe2\xa3\x82\xa3\x82\xa3\x41\xb4\x43\xc4\xe5\xd5\x46\xd5\xa7'\
-b'\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x2a\xde\x29\xe6\x29\xde\x09\xd5\x67\xb4\x23\xb4\x23'\
-b'\xd5\x87\xde\x09\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x2a'\
-b'\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xde\x09'\
-b'\xde\x08\xdd\xc7\xbc\x64\xab\xe2\xcd\x05\xcd\x26\xc4\xe5\xbc\xa4'\
-b'\xbc\x63\xb4\x23\xb4\x03\xb4\x03\xb4\x43\xbc\x64\xc4\xc5\xc5\x06'\
-b'\xd5\x67\xd5\xa7\xdd\xc8\xde\x09\xde\x09\xe6\x08\xd5\x46\xab\xa2'\
-b'\xc4\xe5\xdd\xe8\xe6\x09\xde\x29\xe6\x4a\xe6\x2a\xe6\x49\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x2a\xe6\x2a'\
-b'\xe6\x29\xe6\x09\xdd\xe8\xb4\x23\xb4\x03\xdd\xc8\xe6\x09\xde\x09'\
-b'\xe6\x29\xde\x09\xdd\xe8\xdd\xe8\xdd\xa8\xd5\x87\xcd\x46\xcd\x05'\
-b'\xc4\xc5\xbc\x84\xbc\x43\xb4\x23\xb4\x03\xb4\x23\xb4\x23\xb4\x03'\
-b'\x9b\x21\xbc\x64\xcd\x26\xd5\x67\xd5\xc8\xdd\xe8\xde\x09\xde\x29'\
-b'\xe6\x29\xe6\x29\xe6\x2a\xde\x49\xe6\x49\xe6\x4a\xde\x4a\xe6\x2a'\
-b'\xe6\x29\xde\x29\xde\x09\xdd\xe8\xb4\x03\xac\x03\xdd\xe8\xe6\x09'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x29\xde\x29\xe6\x09\xde\x09\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x66'\
-b'\xc4\xc5\x9b\x41\xb4\x03\xbc\x84\xbc\x63\xb4\x23\xb4\x23\xb4\x23'\
-b'\xbc\x23\xbc\x64\xbc\x84\xc4\xe5\xcd\x26\xcd\x67\xd5\x87\xdd\xc8'\
-b'\xdd\xe9\xde\x09\xde\x09\xe6\x08\xdd\xe8\xbc\x64\xab\xc2\xd5\xa7'\
-b'\xde\x09\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x4a\xde\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xde\x09'\
-b'\xde\x09\xd5\xa7\xab\xe2\xb4\x23\xdd\xc7\xde\x08\xdd\xe8\xdd\xe8'\
-b'\xdd\xa8\xd5\xa7\xd5\x67\xcd\x26\xc4\xe5\xc4\xc5\xbc\x85\xbc\x64'\
-b'\xd5\x88\xdd\xe9\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x2a\xde\x2a'\
-b'\xe6\x2a\xe6\x2a\xde\x29\xe6\x2a\xde\x29\xe6\x29\xdd\xe8\xd5\x67'\
-b'\xc4\xc5\xb4\x23\xb4\x03\xbc\x64\xcd\x26\xd5\xa7\xdd\xc8\xd5\xa7'\
-b'\xcd\x46\xc4\xc5\xbc\x64\xb4\x23\xb4\x03\xb4\x44\xbc\xa4\xcd\x06'\
-b'\xd5\x87\xdd\xc8\xdd\xe8\xdd\xc8\xcd\x46\xbc\x64\xb4\x03\xb4\x23'\
-b'\xc4\xe5\xd5\x87\xdd\xe8\xe6\x09\xe6\x09\xde\x29\xe6\x2a\xde\x2a'\
-b'\xe6\x4a\xe6\x29\xe6\x4a\xe6\x4a\xe6\x29\xe6\x2a\xde\x29\xe6\x09'\
-b'\xd5\xa8\xc4\xe5\xb4\x23\xb4\x03\xbc\x84\xcd\x66\xdd\xc8\xe6\x09'\
-b'\xe6\x29\xde\x09\xe6\x29\xe6\x09\xde\x29\xde\x09\xde\x08\xdd\xc8'\
-b'\xd5\x87\xcd\x26\xc4\xc5\xbc\x64\xb4\x23\xab\xa2\xab\xa2\xab\xa2'\
-b'\x9b\x41\xb4\x03\xcd\x05\xd5\x87\xdd\xe8\xe6\x08\xde\x09\xe6\x29'\
-b'\xde\x29\xe6\x29\xde\x2a\xe6\x29\xe6\x4a\xde\x2a\xe6\x29\xde\x29'\
-b'\xde\x29\xdd\xe9\xd5\x47\xb4\x43\xb3\xe2\xc4\xa4\xd5\xa7\xde\x09'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x29'\
-b'\xe6\x2a\xe6\x29\xe6\x29\xe6\x09\xde\x09\xe6\x08\xdd\xc8\xc4\xe5'\
-b'\xab\xc2\xb4\x03\xcc\xe5\xc4\xe5\xc4\xa4\xbc\x63\xb4\x23\xb4\x03'\
-b'\xb4\x03\xb4\x43\xbc\x85\xc4\xe5\xcd\x47\xd5\xa7\xdd\xe8\xde\x09'\
-b'\xde\x09\xe6\x29\xe6\x29\xdd\xe8\xc4\xc5\xab\xe2\xc4\xa5\xdd\xc8'\
-b'\xde\x09\xe6\x29\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xde\x4a\xe6\x29\xe6\x29'\
-b'\xdd\xc8\xbc\x64\xb4\x03\xd5\x87\xde\x08\xe6\x09\xe6\x29\xde\x09'\
-b'\xde\x09\xdd\xe8\xdd\xc7\xd5\x87\xcd\x26\xc4\xe5\xc4\xa4\xbc\x63'\
-b'\xb4\x23\xb4\x03\xb4\x03\xb4\x23\xbc\x64\xbc\x84\xa3\x82\xb4\x03'\
-b'\xd5\x66\xdd\xc8\xdd\xe8\xde\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x49\xde\x2a'\
-b'\xe6\x29\xde\x09\xcd\x25\xa3\x82\xcd\x46\xe6\x09\xde\x29\xe6\x29'\
-b'\xe6\x2a\xe6\x29\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xe6\x29\xde\x09\xde\x08\xdd\xc8\xd5\xa7\xd5\x66\xcd\x05\xab\xe2'\
-b'\xa3\x61\xb4\x43\xb4\x23\xb4\x23\xb4\x03\xb4\x03\xb4\x43\xbc\x64'\
-b'\xc4\xc5\xc5\x06\xcd\x47\xd5\x87\xdd\xc8\xdd\xe9\xde\x09\xe6\x29'\
-b'\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xb4\x03\xb3\xe3\xdd\xe8\xde\x09'\
-b'\xe6\x29\xde\x2a\xe6\x2a\xe6\x4a\xde\x49\xe6\x2a\xe6\x4a\xde\x2a'\
-b'\xe6\x4a\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x29\xe6\x09'\
-b'\xdd\xc7\xab\xa2\xbc\x64\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xd5\x67\xcd\x26\xc4\xe5\xc4\xa5\xbc\x84\xbc\x44\xb4\x23\xb4\x23'\
-b'\xb4\x23\xb4\x43\xbc\x64\xc4\xa5\xc4\xe5\xc4\xc4\xa3\x41\xbc\x84'\
-b'\xdd\xc7\xdd\xe8\xde\x09\xde\x29\xe6\x29\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xde\x29\xe6\x4a\xe6\x4a\xe6\x4a\xde\x2a\xe6\x29\xe6\x29'\
-b'\xe6\x29\xe6\x09\xd5\x67\xab\xa2\xbc\x64\xdd\xc8\xde\x09\xe6\x29'\
-b'\xe6\x2a\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x29\xdd\xe8\xd5\x67\xbc\xa5\xb4\x23\xb4\x03'\
-b'\xbc\x84\xcd\x26\xd5\xc8\xde\x08\xe6\x09\xe6\x09\xe6\x29\xe6\x29'\
-b'\xe6\x09\xe6\x09\xde\x08\xdd\xc8\xd5\x87\xcd\x26\xc4\xa5\xbc\x43'\
-b'\xab\xe2\xab\xa2\xb4\x03\xa3\xa2\xa3\x61\xb4\x23\xcd\x25\xdd\xc7'\
-b'\xde\x08\xe6\x09\xde\x09\xde\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x2a'\
-b'\xde\x2a\xe6\x4a\xde\x29\xe6\x2a\xde\x29\xdd\xe8\xcd\x46\xbc\x64'\
-b'\xb4\x03\xb4\x43\xcd\x05\xdd\xa7\xde\x09\xe6\x09\xe6\x29\xde\x29'\
-b'\xe6\x29\xe6\x2a\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xde\x09'\
-b'\xde\x09\xe6\x08\xdd\xc7\xcd\x26\xb4\x23\xab\xc2\xb4\x43\xc4\xc5'\
-b'\xc4\xa4\xbc\x44\xb4\x23\xb4\x03\xb4\x23\xbc\x64\xc4\xc5\xcd\x26'\
-b'\xd5\x87\xdd\xc8\xde\x09\xde\x29\xe6\x29\xe6\x29\xde\x29\xde\x09'\
-b'\xd5\x46\xbc\x43\xab\xe2\xc4\xa4\xd5\x87\xdd\xe9\xe6\x29\xe6\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a'\
-b'\xde\x49\xe6\x2a\xde\x29\xe6\x29\xde\x09\xd5\x66\xb4\x23\xb3\xe3'\
-b'\xc4\xe5\xdd\xc7\xde\x08\xde\x09\xde\x08\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xd5\x67\xcd\x06\xc4\xc4\xbc\x64\xb4\x23\xb4\x03\xb4\x03\xb4\x23'\
-b'\xbc\x64\xc4\xc5\xc4\xe5\xb4\x03\xab\xc2\xcd\x05\xdd\xe8\xde\x08'\
-b'\xe6\x29\xe6\x29\xde\x2a\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xd5\xa8'\
-b'\xb4\x23\xb4\x43\xd5\xa8\xe6\x29\xe6\x29\xe6\x4a\xe6\x2a\xe6\x2a'\
-b'\xe6\x49\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xdd\xe9'\
-b'\xdd\xe8\xd5\xa7\xd5\x66\xcd\x25\xbc\x84\xa3\x41\xab\xc2\xb4\x02'\
-b'\xac\x03\xb4\x03\xb4\x23\xbc\x64\xbc\xa5\xc5\x06\xcd\x47\xd5\xa7'\
-b'\xdd\xc8\xde\x09\xde\x29\xe6\x29\xe6\x2a\xe6\x2a\xde\x29\xe6\x29'\
-b'\xe6\x29\xdd\xc8\xab\xc2\xbc\x43\xdd\xe8\xe6\x29\xe6\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xdd\xc8\xab\xc2'\
-b'\xb4\x23\xdd\xc8\xdd\xc7\xdd\xc7\xd5\xa7\xd5\x66\xcd\x26\xc4\xe5'\
-b'\xc4\xa4\xbc\x64\xb4\x23\xb4\x23\xb4\x03\xb4\x23\xbc\x43\xbc\x84'\
-b'\xc4\xc5\xc5\x06\xd5\x46\xd5\x66\xab\xe2\xab\xe3\xdd\xc7\xde\x08'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x4a\xe6\x2a\xe6\x49\xe6\x2a\xe6\x4a'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xde\x4a\xe6\x2a\xe6\x2a\xe6\x29\xde\x09'\
-b'\xde\x08\xbc\x44\xab\xa2\xdd\xc7\xde\x09\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x29\xe6\x2a\xe6\x29\xde\x29\xe6\x09\xde\x08\xdd\xe8\xdd\xa8'\
-b'\xd5\x87\xcd\x46\xcd\x06\xc4\xc5\xbc\x84\xb4\x44\xab\xc2\x9b\x21'\
-b'\xab\xc3\xb4\x23\xbc\x44\xbc\x84\xc4\xc5\xcd\x06\xcd\x46\xd5\x87'\
-b'\xdd\xc8\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x49\xe6\x2a\xde\x2a'\
-b'\xe6\x29\xde\x29\xde\x08\xcd\x26\xa3\x82\xbc\xa5\xe6\x08\xde\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x8b\xee\x6b\xee\x8c'\
-b'\xe6\x6b\xe6\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xdd\xe8\xcd\x47\xbc\xa5\xb4\x23\xb4\x03\xbc\xa4\xcd\x46\xdd\xc8'\
-b'\xde\x09\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xde\x2a\xe6\x2a\xe6\x29'\
-b'\xde\x2a\xe6\x29\xde\x09\xde\x09\xe6\x08\xdd\xe8\xcd\x46\xbc\x84'\
-b'\xab\xe2\xab\xc2\xbc\x84\xbc\xa4\xb4\x24\xb4\x03\xb4\x03\xb4\x44'\
-b'\xc4\xa5\xcd\x06\xd5\x87\xdd\xc8\xde\x08\xe6\x09\xde\x29\xe6\x29'\
-b'\xe6\x29\xde\x29\xe6\x09\xd5\x87\xc4\xc5\xb4\x03\xb4\x03\xbc\xa4'\
-b'\xd5\x67\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x2a\xde\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xde\x49\xe6\x2a\xde\x2a\xe6\x29\xde\x29\xe6\x09'\
-b'\xdd\xc8\xc4\xe5\xb4\x23\xab\xe3\xc4\xa4\xd5\x67\xdd\xe8\xde\x08'\
-b'\xde\x08\xdd\xe8\xdd\xc8\xd5\x87\xcd\x46\xc4\xe5\xbc\x64\xb4\x23'\
-b'\xb4\x03\xb4\x03\xb4\x23\xbc\x84\xc4\xe5\xcd\x46\xcd\x26\xb4\x23'\
-b'\xab\xc2\xbc\x84\xd5\x87\xdd\xe8\xe6\x09\xe6\x29\xde\x29\xe6\x29'\
-b'\xde\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x2a\xe6\x29\xe6\x29\xd5\xa8\xbc\x84\xab\xc2\xbc\xa4\xdd\xa7'\
-b'\xde\x09\xe6\x29\xe6\x29\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x49\xe6\x29'\
-b'\xe6\x29\xde\x29\xe6\x09\xde\x08\xdd\xe8\xdd\xa7\xd5\x66\xcd\x26'\
-b'\xbc\xa4\xab\xa2\xa3\x41\xa3\xa2\xab\xc2\xb4\x03\xb4\x43\xbc\xa5'\
-b'\xcc\xe5\xcd\x67\xd5\xa7\xdd\xe8\xe6\x09\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x29\xd5\x87\xac\x03'\
-b'\xbc\x64\xdd\xc8\xe6\x29\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x2a\xe6\x4a\xe6\x2a\xe6\x29'\
-b'\xe6\x29\xe6\x29\xde\x09\xdd\xc8\xb4\x23\xb4\x03\xd5\x87\xdd\xc7'\
-b'\xd5\xa7\xd5\x66\xcd\x26\xc4\xe5\xc4\xa4\xbc\x43\xb4\x23\xb4\x03'\
-b'\xb4\x03\xb4\x23\xbc\x64\xbc\xa5\xc5\x05\xcd\x46\xd5\x87\xdd\xc8'\
-b'\xdd\xc8\xbc\xa4\xa3\x82\xd5\x87\xde\x09\xe6\x29\xe6\x2a\xde\x4a'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xde\x2a\xe6\x29\xde\x09\xd5\x67\xa3\x61'\
-b'\xc4\xe5\xde\x09\xe6\x29\xe6\x29\xde\x09\xe6\x29\xe6\x29\xe6\x09'\
-b'\xde\x09\xde\x08\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x66\xcd\x06\xc4\xc5'\
-b'\xbc\x84\xb4\x43\xb4\x03\xb4\x03\x9b\x41\xa3\x61\xb4\x43\xbc\x84'\
-b'\xc4\xc5\xcd\x26\xcd\x67\xd5\xa7\xdd\xe8\xde\x09\xde\x09\xe6\x29'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xe6\x49\xde\x2a\xe6\x29\xe6\x29\xde\x29'\
-b'\xde\x09\xcd\x06\x9b\x61\xcd\x46\xe6\x09\xde\x29\xe6\x2a\xe6\x2a'\
-b'\xde\x2a\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xde\x2a'\
-b'\xe6\x29\xe6\x29\xde\x29\xe6\x29\xe6\x08\xdd\xe8\xd5\xa7\xab\xc2'\
-b'\xb3\xe2\xcd\x46\xcd\x26\xc4\xe5\xc4\xa5\xbc\x84\xb4\x44\xb4\x23'\
-b'\xb4\x23\xb4\x23\xbc\x44\xbc\x64\xbc\xa5\xc4\xe5\xcd\x46\xd5\x67'\
-b'\xd5\xa7\xdd\xc8\xdd\xe8\xdd\xe8\xcc\xe5\xa3\x81\xc4\xe5\xe6\x09'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8c\xee\x8b'\
-b'\xee\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xdd\xe8\xcd\x46\xbc\x85'\
-b'\xb4\x03\xb4\x23\xc4\xa5\xd5\x67\xdd\xe8\xe6\x09\xe6\x29\xe6\x2a'\
-b'\xe6\x29\xe6\x2a\xde\x2a\xe6\x4a\xe6\x4a\xe6\x49\xe6\x2a\xe6\x2a'\
-b'\xe6\x29\xde\x29\xdd\xe9\xd5\x87\xc4\xc5\xb4\x03\xb4\x03\xbc\x84'\
-b'\xcd\x46\xdd\xc8\xe6\x09\xe6\x09\xde\x08\xdd\xc8\xd5\x87\xcd\x05'\
-b'\xbc\xa4\xb4\x43\xb4\x03\xb4\x03\xb4\x44\xc4\xa5\xcd\x26\xd5\x87'\
-b'\xd5\xa8\xcd\x26\xb4\x43\xab\xe3\xbc\x43\xcd\x26\xd5\xc7\xe6\x08'\
-b'\xe6\x09\xe6\x29\xe6\x29\xde\x2a\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xd5\x87\xbc\xa5'\
-b'\xab\xe3\xb4\x03\xc4\xe5\xdd\xa7\xde\x08\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x2a\xe6\x29\xde\x29\xe6\x29\xe6\x29\xde\x09\xde\x08\xdd\xe8'\
-b'\xdd\xa7\xd5\x66\xcd\x05\xbc\x84\xab\xa2\xa3\x21\xa3\x82\xa3\x41'\
-b'\xab\xe2\xc4\x84\xcd\x05\xcd\x67\xd5\xa7\xdd\xe8\xe6\x09\xe6\x29'\
-b'\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xde\x29\xdd\xe8\xc4\xc5\xab\xc2\xbc\x43\xd5\x67\xde\x08\xe6\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x49\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x29\xde\x09\xe6\x09\xd5\x87'\
-b'\xb4\x43\xab\xe2\xcd\x05\xd5\xa7\xd5\x86\xcd\x26\xcc\xe5\xbc\xa4'\
-b'\xbc\x43\xb4\x03\xb3\xe3\xb4\x03\xb4\x43\xbc\x85\xc4\xe5\xcd\x26'\
-b'\xd5\x87\xdd\xe8\xde\x08\xe6\x09\xde\x09\xcd\x46\xab\xe2\xc4\xa4'\
-b'\xdd\xe8\xe6\x29\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xde\x29\xe6\x29\xdd\xe8\xbc\x44\xab\xc2\xd5\x87\xde\x09\xe6\x09'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x29\xde\x09\xdd\xe8\xdd\xa7'\
-b'\xd5\x66\xcd\x46\xc4\xe5\xc4\x84\xbc\x43\xb4\x23\xb3\xe3\xab\xe2'\
-b'\xac\x03\xa3\x41\xab\xa2\xc4\xc5\xcd\x26\xd5\x87\xdd\xc8\xde\x09'\
-b'\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xe6\x09\xc4\xc5\xa3\x61'\
-b'\xd5\x87\xe6\x09\xde\x29\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x2a'\
-b'\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xde\x29\xe6\x29'\
-b'\xe6\x09\xdd\xe8\xdd\xc7\xd5\x66\xab\xc2\xab\xa2\xc4\xc5\xc4\xa5'\
-b'\xbc\x84\xb4\x43\xb4\x23\xb4\x03\xb4\x03\xb4\x23\xbc\x64\xbc\xa4'\
-b'\xc4\xe5\xcd\x26\xd5\x87\xd5\xa8\xdd\xe8\xde\x09\xe6\x09\xde\x09'\
-b'\xe6\x08\xd5\x87\xa3\x62\xc4\xa4\xde\x09\xe6\x29\xe6\x2a\xe6\x2a'\
-b'\xe6\x49\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x29\xde\x29\xe6\x29\xde\x09\xcd\x26'\
-b'\xa3\x61\xcd\x26\xde\x08\xe6\x09\xe6\x29\xde\x09\xde\x08\xdd\xe8'\
-b'\xdd\xc8\xd5\xa7\xcd\x67\xcd\x26\xc4\xe5\xbc\xa5\xbc\x64\xb4\x23'\
-b'\xb4\x23\xb4\x23\xb4\x23\xbc\x44\xbc\x64\xa3\xa2\xa3\x41\xc4\xe5'\
-b'\xd5\x87\xd5\xc8\xde\x09\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x29\xe6\x29\xdd\xc8\xcd\x26\xbc\x64\xb4\x03\xb4\x23\xc4\xa5'\
-b'\xd5\x67\xdd\xe8\xde\x09\xde\x29\xe6\x29\xe6\x2a\xde\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x49\xe6\x4a\xe6\x2a\xde\x29\xde\x09'\
-b'\xd5\xa7\xc4\xe5\xb4\x23\xb3\xe3\xbc\x64\xcd\x26\xdd\xc8\xde\x09'\
-b'\xe6\x29\xe6\x29\xde\x29\xe6\x29\xe6\x29\xde\x29\xe6\x09\xe6\x29'\
-b'\xde\x09\xdd\xe8\xdd\xa7\xd5\x66\xc5\x05\xbc\x64\xab\xa2\xa3\x61'\
-b'\xa3\xa2\x9b\x21\xab\xa2\xc4\xa4\xd5\x66\xdd\xc7\xdd\xe8\xde\x09'\
-b'\xde\x29\xe6\x29\xde\x29\xe6\x2a\xe6\x4a\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xde\x4a\xe6\x29\xe6\x29\xdd\xe8\xcd\x67\xbc\x64\xab\xe2\xbc\x43'\
-b'\xcd\x26\xdd\xe8\xe6\x08\xe6\x29\xde\x2a\xe6\x2a\xe6\x2a\xe6\x2a'\
-b'\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x49\xe6\x2a\xe6\x29\xe6\x29\xde\x09'\
-b'\xde\x09\xdd\xe8\xcd\x26\xb4\x03\xab\xc2\xbc\xa4\xd5\x46\xcd\x46'\
-b'\xc4\xe5\xbc\x84\xb4\x23\xb4\x03\xb3\xe3\xb4\x23\xbc\x64\xc4\xc5'\
-b'\xcd\x46\xd5\x87\xdd\xe8\xde\x08\xde\x29\xe6\x29\xe6\x29\xdd\xe8'\
-b'\xcd\x26\xac\x03\xb3\xe3\xcd\x25\xdd\xc8\xde\x09\xe6\x29\xe6\x2a'\
-b'\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xde\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xcd\x26\xab\xc2'\
-b'\xbc\x43\xd5\x87\xe6\x09\xe6\x09\xe6\x09\xe6\x29\xde\x29\xe6\x09'\
-b'\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x66\xc5\x05\xc4\xa4\xbc\x44\xb4\x23'\
-b'\xab\xe3\xab\xe3\xb4\x23\xbc\x64\xbc\x64\xa3\x61\xb4\x43\xd5\x87'\
-b'\xdd\xc8\xde\x09\xe6\x29\xde\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x4b\xe6\x4a\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x2a\xde\x08\xbc\xa5\xab\xa2\xd5\x66\xde\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x2a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x49\xe6\x2a'\
-b'\xe6\x29\xe6\x29\xde\x29\xe6\x09\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x46'\
-b'\xab\xc2\xa3\x81\xbc\x64\xb4\x43\xb4\x03\xb4\x02\xab\xe3\xb4\x23'\
-b'\xbc\x44\xbc\x84\xc4\xe5\xcd\x46\xd5\x87\xd5\xc8\xde\x09\xde\x29'\
-b'\xe6\x29\xe6\x2a\xde\x29\xe6\x29\xe6\x29\xdd\xe8\xb4\x03\xab\xe2'\
-b'\xdd\xc8\xde\x29\xe6\x29\xe6\x2a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xde\x29'\
-b'\xe6\x29\xde\x29\xe6\x09\xdd\xe8\xab\xe3\xab\xe2\xdd\xc8\xde\x08'\
-b'\xe6\x08\xdd\xe8\xdd\xc8\xdd\xa7\xd5\x87\xcd\x46\xcd\x05\xc4\xa5'\
-b'\xbc\x64\xb4\x43\xb4\x03\xb4\x03\xb4\x03\xb4\x23\xbc\x64\xbc\xa4'\
-b'\xc4\xe5\xcd\x05\xab\xa2\xab\xc3\xd5\xa7\xdd\xe8\xde\x29\xe6\x29'\
-b'\xde\x29\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xe6\x4a\xde\x4a\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x09\xdd\xe8'\
-b'\xb4\x23\xab\xc2\xdd\xc8\xde\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x2a'\
-b'\xe6\x2a\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09\xde\x09'\
-b'\xdd\xe8\xdd\xa8\xd5\x67\xcd\x26\xc4\xe5\xbc\xa4\xb3\xe3\x9b\x21'\
-b'\xab\xa2\xb4\x03\xb4\x23\xb4\x44\xbc\x64\xc4\xc5\xcd\x06\xcd\x47'\
-b'\xab\xe3\xb4\x03\xa3\x82\xa3\xa2\xbc\x84\xd5\x67\xdd\xe8\xde\x08'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xde\x2a\xde\x09\xd5\xa7\xcc\xe6\xb4\x23'\
-b'\xb3\xe3\xbc\x44\xcd\x06\xd5\xc7\xde\x09\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x29\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x29\xde\x2a\xe6\x29'\
-b'\xe6\x29\xde\x09\xde\x09\xd5\xa7\xc4\xe5\xb4\x03\xab\xc2\xbc\x64'\
-b'\xcd\x05\xc4\xe5\xbc\x84\xb4\x23\xab\xe3\xb4\x03\xb4\x44\xc4\xc5'\
-b'\xcd\x26\xd5\xa7\xdd\xe8\xde\x09\xe6\x29\xde\x29\xe6\x29\xe6\x2a'\
-b'\xde\x09\xdd\xc8\xc5\x06\xb4\x23\xab\xc2\xbc\x84\xd5\x66\xdd\xe8'\
-b'\xe6\x09\xe6\x29\xe6\x29\xde\x2a\xe6\x4a\xe6\x49\xe6\x4a\xde\x4a'\
-b'\xe6\x4a\xe6\x4a\xde\x49\xe6\x2a\xde\x2a\xe6\x29\xe6\x29\xdd\xe8'\
-b'\xcd\x26\xb4\x23\xab\xc2\xc4\xa4\xd5\x87\xdd\xe8\xde\x08\xe6\x09'\
-b'\xe6\x09\xde\x08\xdd\xe8\xdd\xc8\xd5\x86\xcd\x26\xc4\xc5\xb4\x63'\
-b'\xb4\x03\xab\xe3\xab\xe3\xb4\x23\xbc\x84\xc4\xe5\xcd\x06\xb4\x23'\
-b'\xab\xa2\xc4\xa4\xd5\xa7\xde\x08\xde\x29\xe6\x29\xe6\x29\xde\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xdd\xc8\xbc\x84\xab\xc2\xc4\xe5'\
-b'\xdd\xe8\xe6\x29\xe6\x29\xde\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x2a\xe6\x29\xde\x29\xe6\x09\xde\x08\xdd\xe8'\
-b'\xdd\xa7\xd5\x66\xc4\xe5\xab\xa2\xa3\x61\xb3\xe3\xab\xe2\xb3\xe2'\
-b'\xb4\x03\xb4\x43\xbc\x85\xcd\x05\xcd\x67\xd5\xa8\xdd\xe8\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x2a\xe6\x29'\
-b'\xde\x09\xc4\xe5\xa3\x82\xcd\x25\xde\x09\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x29\xde\x29\xe6\x08\xcd\x26'\
-b'\xa3\x61\xc4\xe5\xdd\xe8\xdd\xe8\xdd\xc7\xd5\xa7\xd5\x86\xcd\x26'\
-b'\xc4\xe5\xc4\xa4\xbc\x44\xb4\x03\xb3\xe3\xac\x03\xb4\x03\xbc\x44'\
-b'\xbc\x84\xc4\xe5\xcd\x26\xd5\x87\xd5\xa7\xd5\x67\xa3\x61\xbc\x84'\
-b'\xde\x08\xe6\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xde\x09\xdd\xe8\xab\xe2\xb3\xe3\xdd\xe8\xe6\x09'\
-b'\xe6\x29\xe6\x2a\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xe6\x29'\
-b'\xde\x09\xde\x09\xdd\xe8\xd5\xa7\xd5\x87\xcd\x26\xc4\xe5\xc4\xa4'\
-b'\xbc\x64\xb4\x03\xa3\x81\x9b\x21\xab\xe2\xb4\x23\xbc\x64\xc4\xa5'\
-b'\xc4\xe5\xcd\x46\xd5\x87\xd5\xc8\xdd\xe9\xde\x09\xe6\x29\xe6\x49'\
-b'\xe6\x4a\xe6\x49\xde\x4a\xe6\x4a\xe6\x2a\xde\x29\xe6\x29\xde\x09'\
-b'\xd5\x66\xa3\x62\xc4\xc5\xde\x08\xe6\x29\xe6\x2a\xde\x2a\xe6\x4a'\
-b'\xe6\x49\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a'\
-b'\xe6\x49\xe6\x29\xde\x29\xe6\x29\xe6\x29\xde\x09\xdd\xc7\xb4\x23'\
-b'\xa3\x82\xcd\x25\xd5\x87\xd5\x46\xcd\x26\xc4\xe5\xbc\xa5\xbc\x64'\
-b'\xbc\x44\xbc\xa5\xb4\x44\xb3\xe3\xb4\x03\xb4\x43\xc4\xc5\xcd\x46'\
-b'\xdd\xc8\xde\x09\xde\x29\xe6\x29\xde\x2a\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xde\x2a\xde\x29\xdd\xa8\xcd\x05\xb4\x44\xb3\xe3\xb4\x43\xc5\x06'\
-b'\xd5\xa7\xde\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x2a\xe6\x4a\xde\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x29'\
-b'\xdd\xe8\xd5\x46\xbc\x64\xab\xe2\xb4\x23\xc4\xe5\xdd\xa7\xdd\xe8'\
-b'\xde\x09\xe6\x09\xde\x08\xdd\xe8\xdd\xa7\xcd\x46\xc4\xe5\xbc\x64'\
-b'\xb4\x23\xb3\xe3\xb4\x03\xbc\x44\xc4\xc5\xcd\x46\xd5\x87\xd5\x87'\
-b'\xc4\xc5\xab\xe2\xb4\x02\xc4\xc5\xd5\x87\xdd\xe8\xe6\x09\xe6\x29'\
-b'\xde\x29\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xdd\xe8\xcd\x26\xb4\x23'\
-b'\xab\xc2\xc4\xa4\xd5\x87\xdd\xe8\xe6\x29\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xde\x29\xe6\x29\xde\x09\xdd\xe8'\
-b'\xdd\xc8\xd5\x87\xd5\x46\xc4\xe5\xb4\x23\xa3\x41\xa3\x61\xa3\x61'\
-b'\xa3\xa2\xb4\x23\xc4\x84\xcd\x06\xd5\x67\xdd\xc8\xdd\xe8\xe6\x29'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xde\x29\xcd\x46\xab\xe3\xb4\x23\xd5\x67\xde\x09'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xde\x29'\
-b'\xde\x09\xdd\xc7\xbc\x64\xab\xe2\xcd\x46\xdd\xc7\xdd\xa7\xd5\x87'\
-b'\xcd\x26\xc4\xe5\xbc\x84\xbc\x43\xb4\x03\xab\xe2\xb4\x03\xb4\x23'\
-b'\xbc\x64\xc4\xc5\xcd\x26\xd5\x87\xd5\xc8\xde\x09\xe6\x09\xde\x08'\
-b'\xcd\x26\xa3\x82\xc4\xe5\xe6\x08\xe6\x29\xde\x2a\xe6\x4a\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xdd\xc8\xab\xe3'\
-b'\xb4\x03\xdd\xc8\xe6\x09\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xe6\x29'\
-b'\xde\x09\xde\x09\xde\x08\xdd\xe8\xd5\xa7\xd5\x66\xcd\x26\xc4\xe5'\
-b'\xc4\xa4\xb4\x43\xb4\x03\xab\xe3\xab\xe2\xab\xa2\x9b\x01\xac\x03'\
-b'\xc4\xc5\xcd\x06\xcd\x67\xd5\xc8\xdd\xe8\xde\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x49\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xde\x29\xe6\x29\xdd\xe8\xab\xe3\xab\xe2\xdd\xe8\xe6\x09'\
-b'\xde\x29\xe6\x2a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xde\x09'\
-b'\xdd\xe8\xdd\xc8\xcd\x05\x9b\x41\xbc\x44\xcd\x05\xc4\xc5\xbc\xa4'\
-b'\xbc\x64\xb4\x23\xb4\x03\xb4\x03\xb4\x03\xb4\x43\xbc\x84\xc4\xa5'\
-b'\xc5\x06\xcd\x47\xd5\xa7\xdd\xc8\xde\x08\xe6\x09\xde\x09\xe6\x09'\
-b'\xdd\xe8\xbc\x64\xa3\x82\xd5\x87\xde\x29\xe6\x29\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xde\x29\xdd\xa7'\
-b'\xab\xe3\xab\xe2\xdd\xa7\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xdd\xc8\xd5\x67\xc4\xe5\xbc\x64\xb4\x03'\
-b'\xab\xe3\xb4\x23\xc4\xa5\xcd\x26\xdd\xa7\xde\x09\xde\x09\xdd\xc8'\
-b'\xcd\x26\xb4\x44\xab\xe2\xb4\x23\xc4\xc5\xd5\x87\xde\x08\xe6\x09'\
-b'\xe6\x29\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x29\xde\x09\xd5\xa7\xc4\xc5'\
-b'\xb3\xe3\xab\xe3\xbc\x84\xd5\x67\xdd\xe8\xe6\x09\xe6\x29\xe6\x29'\
-b'\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xde\x08'\
-b'\xdd\xc8\xd5\xa7\xcd\x26\xc4\xc4\xb4\x43\xa3\x82\xa3\x61\xa3\x82'\
-b'\x9b\x21\xab\xe2\xc4\xe5\xd5\x87\xdd\xc8\xe6\x08\xde\x09\xe6\x29'\
-b'\xe6\x29\xde\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xde\x29\xde\x08\xcd\x26\xb4\x23\xab\xc2\xbc\xa4'\
-b'\xd5\x87\xde\x09\xe6\x29\xe6\x29\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x29'\
-b'\xe6\x29\xde\x08\xdd\xc7\xc4\xc5\xab\xc2\xb4\x03\xcd\x25\xd5\x66'\
-b'\xcd\x26\xc4\xc4\xbc\x64\xb4\x23\xab\xe2\xab\xe2\xb4\x23\xbc\x64'\
-b'\xc4\xc5\xcd\x46\xd5\xa8\xdd\xe8\xde\x09\xe6\x29\xe6\x4a\xe6\x2a'\
-b'\xde\x29\xdd\xe8\xbc\x84\xab\xa2\xc4\xa4\xdd\xc7\xe6\x09\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x6a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29'\
-b'\xd5\xa8\xb4\x23\xb4\x03\xd5\x87\xde\x09\xe6\x29\xde\x29\xe6\x29'\
-b'\xe6\x29\xe6\x09\xde\x08\xdd\xe8\xdd\xc8\xd5\xa7\xcd\x46\xcc\xe5'\
-b'\xbc\xa4\xb4\x44\xb4\x03\xab\xe2\xab\xe3\xb4\x03\xbc\x43\xbc\x64'\
-b'\xa3\x61\xb4\x03\xd5\x66\xdd\xc8\xde\x09\xe6\x29\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x4b\xe6\x6a'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xde\x29\xc4\xe5\xa3\x61'\
-b'\xcd\x46\xde\x09\xe6\x29\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xde\x29'\
-b'\xde\x09\xdd\xe8\xdd\xc7\xdd\xa7\xcd\x46\xab\xe2\xa3\x41\xbc\x63'\
-b'\xb4\x43\xb4\x03\xb3\xe2\xab\xe2\xb4\x03\xb4\x23\xbc\x84\xc4\xc5'\
-b'\xcd\x26\xcd\x67\xd5\xc8\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x2a'\
-b'\xe6\x49\xe6\x29\xde\x09\xdd\xc8\xab\xc2\xab\xe3\xdd\xe8\xe6\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x49\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x29\xe6\x29'\
-b'\xe6\x29\xde\x09\xdd\xa7\xab\xa2\xb4\x23\xdd\xe8\xde\x08\xe6\x09'\
-b'\xde\x08\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x67\xcd\x26\xc4\xe5\xbc\x84'\
-b'\xbc\x64\xb4\x23\xb4\x03\xb4\x03\xb4\x03\xb4\x43\xbc\x84\xc4\xc5'\
-b'\xc5\x05\xc4\xe5\xa3\x41\xbc\x43\xdd\xc8\xde\x09\xe6\x29\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09'\
-b'\xd5\x87\xab\xa2\xb4\x23\xdd\xe8\xe6\x2a\xe6\x6a\xe6\x6b\xe6\x6b'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8'\
-b'\xd5\x87\xcc\xe5\xbc\x64\xac\x03\xab\xc2\xab\xe2\xb4\x23\xa3\x82'\
-b'\xab\xa1\xbc\x84\xd5\x66\xdd\xe8\xe6\x09\xe6\x29\xde\x09\xe6\x29'\
-b'\xe6\x2a\xde\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xde\x29\xdd\xc8\xcd\x26\xbc\x44\xab\xc3\xb4\x43'\
-b'\xcd\x06\xdd\xc8\xde\x09\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a\xde\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xde\x4a\xe6\x29\xe6\x2a\xde\x29\xe6\x29'\
-b'\xe6\x09\xde\x09\xdd\xc7\xcd\x05\xb4\x03\xab\xa2\xbc\x43\xc4\xe5'\
-b'\xc4\xa4\xbc\x43\xb3\xe3\xab\xe2\xb4\x03\xbc\x64\xc4\xc5\xcd\x47'\
-b'\xd5\xa8\xde\x08\xe6\x29\xe6\x29\xe6\x49\xe6\x2a\xe6\x4a\xde\x29'\
-b'\xe6\x29\xdd\xe8\xcd\x26\xb4\x03\xab\xc2\xbc\xa4\xd5\x87\xdd\xe9'\
-b'\xe6\x29\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x29\xde\x29'\
-b'\xdd\xe9\xcd\x26\xb4\x03\xab\xc2\xc4\xe5\xdd\xc7\xde\x09\xde\x09'\
-b'\xe6\x09\xde\x09\xde\x08\xdd\xe8\xdd\xa7\xcd\x66\xcc\xe6\xbc\xa4'\
-b'\xb4\x43\xb4\x03\xab\xc2\xab\xe3\xb4\x23\xbc\x84\xc4\xe5\xcd\x67'\
-b'\xcd\x26\xb4\x03\xab\xe2\xcd\x46\xdd\xe8\xe6\x09\xde\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4b\xe6\x4a\xe6\x4a\xde\x29\xd5\x87'\
-b'\xb4\x03\xb4\x23\xdd\xa7\xe6\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29'\
-b'\xe6\x09\xde\x08\xdd\xc8\xd5\xa7\xd5\x46\xcd\x05\xb4\x43\x9b\x21'\
-b'\xa3\xa2\xab\xe2\xab\xe2\xb3\xe3\xb4\x43\xbc\x84\xc4\xe5\xcd\x47'\
-b'\xd5\xa7\xdd\xe8\xde\x09\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xd5\xa7\xab\x82\xb4\x44'\
-b'\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x29\xe6\x29\xe6\x29\xde\x09\xdd\xa7\xab\xa2\xb4\x23\xdd\xc8'\
-b'\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x87\xcd\x46\xcc\xe5\xbc\xa4\xbc\x43'\
-b'\xb4\x23\xb4\x02\xab\xe3\xb4\x03\xb4\x23\xbc\x64\xbc\xc5\xcd\x26'\
-b'\xcd\x67\xd5\xa7\xdd\xc8\xdd\xa7\xab\xc2\xab\xe2\xdd\xe8\xe6\x09'\
-b'\xe6\x29\xde\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x2a\xe6\x2a'\
-b'\xe6\x29\xde\x09\xdd\xe8\xb4\x43\xa3\x82\xdd\xa7\xe6\x09\xde\x29'\
-b'\xe6\x2a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x67\xcd\x06\xc4\xc5\xbc\x84'\
-b'\xb4\x23\xb4\x03\xa3\x82\x9b\x21\xab\xe2\xb4\x43\xbc\x84\xc4\xc5'\
-b'\xcd\x26\xcd\x67\xd5\xa8\xdd\xe8\xde\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x29'\
-b'\xe6\x09\xcd\x46\xa3\x61\xbc\x64\xde\x09\xe6\x4a\xe6\x6b\xee\x6b'\
-b'\xee\x8c\xe6\x8c\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x2a\xe6\x29\xe6\x29'\
-b'\xde\x08\xdd\xc8\xcd\x26\xbc\x43\xa3\x82\xab\xa2\xb4\x44\xb3\xe3'\
-b'\xab\xc2\xb4\x03\xbc\x64\xc4\xe5\xd5\x67\xdd\xc8\xde\x09\xe6\x29'\
-b'\xde\x29\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x2a'\
-b'\xde\x09\xd5\x67\xbc\xa5\xab\xe3\xb3\xe3\xc4\xa4\xd5\x87\xde\x08'\
-b'\xe6\x29\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xde\x09'\
-b'\xd5\xa7\xc4\xc5\xab\xe3\xab\xe2\xbc\xa4\xd5\x87\xdd\xe8\xde\x09'\
-b'\xde\x09\xdd\xe8\xdd\xc8\xd5\x87\xcd\x25\xc4\xa4\xb4\x43\xb3\xe2'\
-b'\xab\xe2\xb4\x03\xbc\x64\xc4\xe5\xcd\x47\xd5\xc8\xdd\xe8\xdd\xe8'\
-b'\xcd\x06\xb4\x03\xab\xc2\xbc\x84\xd5\x87\xdd\xe8\xe6\x09\xe6\x29'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xd5\x87'\
-b'\xb4\x44\xab\xc2\xc4\x84\xd5\xa7\xe6\x08\xe6\x29\xe6\x29\xe6\x2a'\
-b'\xe6\x29\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x29\xe6\x09\xe6\x09'\
-b'\xdd\xe8\xdd\xc8\xd5\x87\xcd\x25\xc4\xc5\xbc\x64\xb3\xe2\xa3\x41'\
-b'\xa3\x41\x9b\x41\xb3\xe3\xc4\xa4\xcd\x06\xd5\x67\xdd\xc8\xde\x08'\
-b'\xde\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x4a'\
-b'\xe6\x6a\xe6\x4b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x29\xcd\x47\xab\xc2'\
-b'\xbc\x64\xdd\xc8\xde\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xde\x29\xde\x08\xd5\x87\xab\xc2\xb4\x03'\
-b'\xd5\x66\xdd\x87\xd5\x66\xcd\x25\xc4\xc5\xbc\x64\xb4\x23\xb4\x02'\
-b'\xab\xe2\xb3\xe3\xb4\x23\xbc\x64\xc4\xc5\xcd\x46\xd5\x87\xdd\xc8'\
-b'\xde\x09\xe6\x29\xde\x29\xde\x29\xdd\xe8\xbc\x64\xa3\x82\xd5\x87'\
-b'\xe6\x09\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4b'\
-b'\xe6\x6a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xcd\x46\x9b\x41\xc4\xe5\xde\x08'\
-b'\xe6\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x29\xe6\x09\xde\x09'\
-b'\xdd\xe8\xdd\xa7\xd5\x87\xcd\x46\xc4\xe5\xc4\xa4\xbc\x64\xb4\x03'\
-b'\xb3\xe2\xab\xe3\xab\xe2\xb4\x03\x9b\x41\xa3\x82\xc4\xe5\xcd\x46'\
-b'\xd5\x87\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xde\x29\xe6\x09\xc4\xe5\x9b\x41\xcd\x26\xde\x09\xe6\x29'\
-b'\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x29\xe6\x29\xe6\x09'\
-b'\xde\x08\xdd\xe8\xd5\x87\xab\xc2\xa3\x62\xc4\xc5\xc4\xa5\xbc\x64'\
-b'\xb4\x43\xb4\x03\xb4\x03\xb4\x03\xb4\x23\xb4\x64\xbc\xa4\xc4\xe5'\
-b'\xcd\x47\xd5\x87\xd5\xc8\xdd\xe9\xde\x09\xde\x29\xe6\x29\xe6\x29'\
-b'\xde\x29\xde\x08\xcd\x06\xa3\x61\xbc\xa5\xe6\x29\xe6\x4a\xe6\x6a'\
-b'\xee\x8c\xee\x8b\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xdd\xe9\xd5\x67'\
-b'\xbc\x84\xab\xe3\xab\xe2\xbc\x84\xcd\x46\xdd\xe8\xde\x08\xdd\xe8'\
-b'\xd5\xa7\xcd\x26\xbc\xa5\xb4\x23\xab\xe2\xb4\x03\xbc\x44\xc4\xe5'\
-b'\xd5\x67\xdd\xc8\xde\x08\xde\x29\xe6\x29\xde\x09\xdd\xa8\xc5\x05'\
-b'\xb4\x23\xab\xc2\xbc\x43\xcd\x26\xdd\xe8\xde\x09\xe6\x29\xe6\x2a'\
-b'\xde\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xd5\x67\xbc\x84'\
-b'\xab\xc2\xb4\x03\xc4\xe5\xdd\xa7\xe6\x09\xde\x09\xe6\x29\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x29\xde\x09\xdd\xe9\xdd\xc8'\
-b'\xd5\x87\xcd\x05\xbc\x84\xb4\x23\xab\xe2\xab\xa2\xab\xe3\xab\xc2'\
-b'\x9b\x41\xab\xe2\xcd\x25\xdd\xc7\xdd\xe8\xe6\x09\xe6\x29\xe6\x29'\
-b'\xde\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b'\
-b'\xe6\x6a\xe6\x4b\xe6\x4a\xe6\x4a\xde\x29\xdd\xc8\xbc\xa4\xab\xa2'\
-b'\xb4\x43\xd5\x66\xdd\xe8\xe6\x29\xde\x2a\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a'\
-b'\xe6\x29\xde\x29\xe6\x29\xde\x09\xdd\xe8\xd5\x66\xab\xe2\xab\xc2'\
-b'\xc4\xe5\xcd\x05\xbc\xa4\xb4\x43\xb4\x02\xab\xe2\xab\xe2\xb4\x03'\
-b'\xbc\x64\xc4\xe5\xcd\x47\xd5\xa8\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x09\xc5\x06\xab\xa2\xc4\xa4'\
-b'\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xde\x2a\xe6\x29\xdd\xc8\xb4\x23\xab\xc2\xd5\x87'\
-b'\xde\x08\xde\x29\xe6\x29\xde\x09\xe6\x29\xde\x09\xdd\xe8\xdd\xc8'\
-b'\xd5\x87\xcd\x46\xc4\xe5\xbc\x84\xb4\x43\xb4\x03\xab\xc2\xab\xe3'\
-b'\xb4\x03\xb4\x44\xc4\x84\xcc\xe6\xc4\xe5\xa3\x41\xbc\x64\xdd\xe7'\
-b'\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x6b\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xde\x29\xe6\x09\xbc\xa4\xa3\x41\xd5\x67\xe6\x29'\
-b'\xe6\x2a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x2a'\
-b'\xe6\x29\xde\x4a\xe6\x29\xe6\x29\xe6\x29\xde\x09\xde\x08\xdd\xe8'\
-b'\xdd\xa7\xd5\x87\xcd\x26\xc4\xc4\xa3\x61\xa3\x41\xb3\xe2\xab\xe2'\
-b'\xb3\xe2\xab\xe3\xb4\x03\xbc\x64\xbc\xa5\xcd\x06\xcd\x67\xd5\xa8'\
-b'\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xde\x29\xe6\x29\xe6\x09\xd5\x87\xa3\x41\xbc\x84\xde\x08\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a'\
-b'\xe6\x29\xde\x29\xe6\x08\xcd\x06\xa3\x41\xc4\xe5\xde\x08\xde\x08'\
-b'\xe6\x09\xdd\xe8\xdd\xc8\xd5\x87\xcd\x47\xcd\x06\xc4\xa5\xbc\x64'\
-b'\xb4\x23\xb4\x03\xb3\xe3\xb4\x03\xb4\x23\xbc\x64\xbc\xa5\xc4\xe5'\
-b'\xcd\x26\xd5\x67\xd5\x86\xbc\x84\xa3\x41\xc4\xe5\xe6\x29\xe6\x4a'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x2a\xd5\xa8\xc4\xc5\xb4\x03\xab\xe2'\
-b'\xbc\x64\xcd\x46\xdd\xc8\xe6\x29\xe6\x29\xe6\x2a\xe6\x2a\xe6\x29'\
-b'\xe6\x2a\xe6\x29\xe6\x09\xde\x09\xdd\xa8\xcd\x46\xc4\xc5\xb4\x23'\
-b'\xab\xe2\xab\xe3\xb4\x23\xc4\xc5\xcd\x06\xbc\x64\xab\xc2\xb3\xe3'\
-b'\xc4\xc5\xd5\x87\xdd\xe8\xe6\x09\xde\x29\xe6\x29\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xdd\xe8\xcd\x26\xb4\x24\xab\xc2\xb4\x43'\
-b'\xcd\x26\xdd\xe8\xe6\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29'\
-b'\xde\x09\xde\x09\xdd\xe8\xdd\xa7\xc4\xa4\xa3\x81\xa3\x82\xb4\x23'\
-b'\xb4\x03\xab\xc2\xab\xc2\xb4\x03\xbc\x64\xc5\x05\xd5\x67\xd5\xc8'\
-b'\xde\x08\xe6\x29\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xdd\xe8\xc5\x06\xab\xc2\xb3\xe2\xcd\x06'\
-b'\xdd\xc8\xde\x29\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xde\x29\xdd\xe8\xcc\xe5\xab\xa2\xb4\x43\xd5\x87'\
-b'\xdd\xe8\xe6\x08\xdd\xe8\xdd\xe8\xdd\xc8\xd5\x87\xcd\x46\xc4\xe5'\
-b'\xbc\x84\xb4\x23\xb3\xe2\xab\xc2\xab\xe3\xb4\x23\xbc\x85\xcd\x06'\
-b'\xd5\x67\xdd\xc8\xdd\xe9\xdd\xe8\xc4\xc5\xab\xa2\xc4\xe5\xdd\xe8'\
-b'\xde\x29\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8\xbc\x64\xab\x82\xd5\x66\xe6\x09'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x09\xe6\x09\xdd\xe8\xdd\xc8\xd5\x87\xd5\x46'\
-b'\xcc\xe5\xbc\xa4\xb4\x43\xab\xe2\x9b\x21\x9b\x21\xab\xc2\xb4\x03'\
-b'\xbc\x64\xc4\xe5\xcd\x46\xd5\x88\xdd\xe8\xde\x09\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x4b\xe6\x4a'\
-b'\xe6\x4a\xde\x2a\xe6\x29\xdd\xe8\xab\xc3\xab\xc2\xdd\xe8\xde\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a'\
-b'\xde\x29\xe6\x09\xde\x08\xdd\xc7\xab\xa2\xab\xc2\xd5\xa7\xdd\xa7'\
-b'\xd5\x67\xcd\x46\xcd\x05\xc4\xa4\xbc\x63\xb4\x23\xb3\xe2\xab\xe2'\
-b'\xab\xe3\xb4\x03\xbc\x64\xbc\xa5\xc5\x06\xcd\x67\xd5\xa7\xdd\xc8'\
-b'\xde\x09\xde\x09\xde\x08\xdd\xc7\xab\xc3\xab\xc2\xdd\xc8\xe6\x09'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a'\
-b'\xe6\x2a\xe6\x2a\xde\x29\xdd\xe8\xb4\x23\xab\xa2\xd5\xa7\xe6\x09'\
-b'\xe6\x29\xe6\x29\xde\x2a\xe6\x29\xe6\x29\xe6\x29\xe6\x49\xde\x29'\
-b'\xde\x09\xdd\xe8\xdd\xc8\xd5\x87\xcd\x46\xc4\xe5\xc4\xa5\xbc\x44'\
-b'\xb4\x23\xab\xe3\xb3\xe3\xab\xe2\x9b\x41\x9b\x41\xbc\x85\xcd\x06'\
-b'\xe6\x4a\xdd\xc8\xc4\xe6\xb4\x23\xab\xc2\xbc\x44\xcd\x26\xdd\xc8'\
-b'\xde\x09\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x29\xe6\x29\xde\x09\xdd\xe8'\
-b'\xdd\xa7\xc4\xc5\xab\xa2\x9b\x20\xa3\x61\x9b\x41\xa3\x81\xbc\x63'\
-b'\xcd\x05\xd5\x87\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xde\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xd5\xc8\xc4\xe5\xab\xe3\xab\xc2\xbc\x84\xd5\x87\xdd\xe8'\
-b'\xe6\x09\xe6\x2a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x29'\
-b'\xe6\x29\xdd\xc8\xcd\x05\xab\xe3\xab\xc2\xc4\x84\xd5\x66\xdd\xc8'\
-b'\xdd\xc7\xdd\xa7\xcd\x66\xc4\xe5\xbc\x84\xb4\x03\xab\xc2\xab\xe2'\
-b'\xb4\x03\xbc\x84\xc5\x06\xd5\x87\xd5\xc8\xde\x09\xe6\x29\xe6\x29'\
-b'\xe6\x29\xde\x09\xcd\x46\xb4\x03\xab\xc2\xc4\xa4\xd5\xa7\xde\x09'\
-b'\xe6\x29\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xde\x2a\xe6\x29\xd5\xa7\xb4\x44\xab\xa2\xc4\xe5\xdd\xe8\xe6\x09'\
-b'\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29'\
-b'\xe6\x09\xdd\xe8\xdd\xc8\xd5\x86\xcd\x26\xc4\xc4\xbc\x63\xb4\x03'\
-b'\xab\xc2\xab\xc2\xab\xe2\xab\xe3\x9b\x21\xb4\x43\xd5\x46\xd5\xa7'\
-b'\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x2a\xde\x09\xbc\xa5\xa3\x81\xcd\x26\xde\x09\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x49\xe6\x29\xe6\x29\xde\x29'\
-b'\xe6\x08\xdd\xe8\xdd\xc7\xc4\xc4\x9b\x41\xc4\x84\xcd\x05\xc4\xc4'\
-b'\xbc\x63\xb4\x03\xab\xe2\xab\xc2\xab\xe3\xb4\x03\xbc\x64\xc4\xc5'\
-b'\xcd\x26\xd5\x87\xdd\xc8\xde\x09\xe6\x29\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xe6\x29\xde\x29\xd5\x67\xa3\x41\xbc\x84\xe6\x09\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6a\xe6\x6a'\
-b'\xe6\x4b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xde\x09\xdd\xc8\xab\xc2\xab\xc3\xdd\xc8\xde\x08'\
-b'\xde\x09\xe6\x29\xe6\x09\xde\x09\xde\x09\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xd5\x46\xcd\x06\xc4\xc4\xbc\x64\xb4\x23\xb3\xe2\xab\xe2\xab\xe3'\
-b'\xb4\x03\xbc\x43\xbc\x84\xc4\xc5\xb4\x03\x9b\x21\xcd\x26\xdd\xe8'\
-b'\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x4a'\
-b'\xe6\x6b\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xd5\x66\xa3\x61\xbc\x84\xde\x09'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x29'\
-b'\xde\x08\xdd\xe8\xd5\xa7\xd5\x67\xcd\x06\xb4\x03\x9b\x00\xa3\xa2'\
-b'\xb4\x24\xab\xe3\xb4\x23\xcd\x06\xdd\xc8\xde\x29\xe6\x2a\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xde\x2a\xe6\x29\xe6\x09\xdd\xc8\xcd\x26'\
-b'\xb4\x23\xab\xc2\xb4\x23\xc4\xe5\xd5\x87\xd5\x67\xc4\xe5\xbc\x64'\
-b'\xab\xe3\xab\xc2\xb4\x03\xbc\x84\xcd\x06\xd5\x87\xdd\xe8\xe6\x09'\
-b'\xde\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xde\x09\xd5\x87'\
-b'\xbc\x85\xab\xc2\xb3\xe3\xc4\xc5\xd5\xa7\xe6\x09\xe6\x29\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x29\xdd\xe8'\
-b'\xcd\x06\xab\xe3\xab\xc2\xbc\xa4\xd5\x87\xdd\xe8\xe6\x29\xe6\x29'\
-b'\xde\x29\xe6\x29\xe6\x29\xe6\x09\xde\x09\xdd\xe8\xdd\xa7\xcd\x46'\
-b'\xc4\xc5\xbc\x64\xb4\x03\xab\xc2\xab\xc2\xb4\x03\xbc\x84\xc5\x06'\
-b'\xcd\x46\xb4\x44\xa3\x82\xbc\x63\xd5\x66\xdd\xe8\xe6\x09\xe6\x29'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xde\x09\xcd\x26\xab\xc2\xb4\x03\xd5\x66\xde\x08\xe6\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x29\xe6\x09\xdd\xe8\xdd\xc8'\
-b'\xd5\x86\xc4\xe5\xa3\x81\xab\x82\xb4\x03\xab\xe2\xab\xc2\xab\xc2'\
-b'\xb4\x03\xbc\x64\xc4\xe5\xcd\x47\xd5\xa8\xde\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xc4\xe5\xa3\x61\xc4\xe5\xde\x08\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xde\x29\xe6\x29\xdd\xa8\xab\xa2\xab\xe3\xdd\xc7\xde\x08\xde\x09'\
-b'\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x87\xcd\x25\xc4\xe5\xbc\x84\xb4\x23'\
-b'\xab\xe2\xab\xc2\xab\xc2\xab\xe3\xb4\x44\xbc\x84\xc5\x06\xcd\x47'\
-b'\xd5\x87\xdd\xc8\xdd\xe8\xc4\xc5\x9b\x21\xcd\x26\xde\x29\xe6\x49'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x6a\xe6\x4b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xdd\xc8\xa3\xc2\xab\xc2\xdd\xe8\xe6\x09'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x29\xe6\x4a\xe6\x2a\xe6\x29\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xde\x29\xde\x09\xde\x08\xdd\xc8\xdd\xa7\xd5\x46'\
-b'\xcd\x05\xc4\xa5\xbc\x64\xb4\x23\xab\xa2\x93\x00\xa3\x81\xb4\x03'\
-b'\xb4\x43\xbc\x84\xc4\xe5\xcd\x47\xd5\xa7\xdd\xe8\xde\x09\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xde\x29\xdd\xe9\xbc\x64\xa3\x61\xd5\x67'\
-b'\xde\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x2a\xe6\x49\xe6\x29\xde\x29\xdd\xa8\xab\xe3\xa3\x61'\
-b'\xcd\x27\xdd\xc8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xde\x09\xd5\x87\xbc\xa4\xab\xe2\xab\xc2'\
-b'\xbc\x84\xd5\x67\xdd\xe8\xe6\x29\xe6\x29\xde\x29\xe6\x29\xde\x09'\
-b'\xdd\xe8\xd5\x87\xcd\x06\xbc\x64\xac\x03\xab\xc2\xab\xe3\xbc\x64'\
-b'\xc4\xe5\xd5\x67\xdd\xc8\xde\x08\xdd\xe8\xcd\x46\xb4\x43\xab\xa2'\
-b'\xb4\x23\xcd\x05\xdd\xc8\xde\x08\xe6\x29\xe6\x29\xe6\x2a\xde\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xdd\xe8\xc4\xe5\xab\xe3'\
-b'\xab\xc2\xc4\xa4\xd5\x87\xe5\xe8\xe6\x29\xe6\x29\xe6\x2a\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xe8\xdd\xc8\xd5\x87\xcd\x25\xc4\xc4\xb4\x03\x9b\x21'\
-b'\xa3\x41\x9b\x21\xa3\x81\xbc\x43\xc4\xe5\xd5\x67\xdd\xc8\xde\x08'\
-b'\xde\x29\xe6\x2a\xe6\x29\xde\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x4a'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xd5\xc8'\
-b'\xbc\x64\xa3\xa1\xc4\xa4\xdd\xc7\xde\x09\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xde\x29\xde\x09'\
-b'\xd5\x67\xb3\xe2\xb4\x03\xd5\x66\xdd\xc7\xdd\xa7\xd5\x87\xcd\x26'\
-b'\xc4\xc4\xbc\x64\xb4\x03\xab\xe2\xab\xc2\xb3\xe2\xb4\x24\xbc\xa5'\
-b'\xcd\x06\xd5\x67\xdd\xc8\xde\x09\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xe6\x09\xcd\x26\xa3\x61\xbc\x84\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xde\x09\xbc\xa4\x9b\x41\xcd\x46\xe6\x09\xe6\x29\xe6\x2a'\
-b'\xe6\x29\xe6\x2a\xe6\x49\xe6\x29\xe6\x29\xe6\x09\xde\x08\xdd\xe8'\
-b'\xdd\xc8\xd5\x87\xd5\x46\xcd\x05\xbc\x84\xbc\x43\xb4\x02\xab\xc2'\
-b'\xab\xc2\xab\xe2\xb4\x03\xa3\x82\x9b\x41\xc4\xc5\xd5\x67\xdd\xc8'\
-b'\xde\x09\xde\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xde\x29\xdd\xc8\xab\xa2\xab\xc2\xdd\xe8\xde\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x2a'\
-b'\xde\x29\xde\x09\xde\x08\xdd\xc7\xd5\x66\xa3\x82\xab\xa2\xc4\xe5'\
-b'\xc4\xa4\xbc\x64\xb4\x23\xb4\x03\xab\xe2\xab\xc3\xb4\x03\xb4\x43'\
-b'\xbc\x84\xc4\xe5\xd5\x47\xd5\x87\xdd\xe8\xe6\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x09\xd5\x87\xa3\x82\xb4\x23'\
-b'\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xd5\xa8\xab\xc2'\
-b'\xee\x8b\xe6\x8c\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xdd\xc8\xc5\x06\xb4\x23\xab\xc2\xb4\x23\xcd\x06\xdd\xc8'\
-b'\xe6\x29\xe6\x2a\xde\x2a\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x2a'\
-b'\xe6\x29\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xd5\xa7\xcd\x26\xbc\x84'\
-b'\xb4\x03\xab\xc2\xab\xc2\xb4\x03\xab\xc3\x9b\x41\xb4\x03\xcd\x26'\
-b'\xdd\xc7\xde\x09\xde\x09\xe6\x29\xde\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xdd\xe8\xc4\xe5\xab\xe3\xab\xc2\xc4\xa4'\
-b'\xd5\x87\xde\x08\xe6\x29\xe6\x2a\xe6\x2a\xde\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xe6\x29\xde\x29\xe6\x08\xdd\xc8\xc4\xe5\xab\xa2\xab\xc2'\
-b'\xc4\xc4\xcd\x05\xc4\xa4\xb4\x43\xab\xe3\xab\xc2\xab\xc2\xb4\x23'\
-b'\xbc\xa4\xcd\x06\xd5\x87\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29\xcd\x46\xab\xc2'\
-b'\xab\xe2\xd5\x46\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xcd\x66'\
-b'\xab\xc2\xb4\x23\xd5\xa7\xde\x09\xe6\x29\xde\x29\xe6\x29\xe6\x09'\
-b'\xde\x09\xde\x08\xdd\xe8\xdd\xa7\xd5\x66\xcd\x05\xbc\xa4\xb4\x43'\
-b'\xb3\xe2\xab\xc2\xab\xc2\xb4\x03\xbc\x44\xc4\xa5\xcd\x26\xd5\x87'\
-b'\xcd\x26\xa3\x82\xb4\x43\xdd\xc8\xe6\x09\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xee\x8b\xee\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x6a\xe6\x4a'\
-b'\xe6\x29\xd5\x87\xa3\x61\xbc\x44\xde\x08\xe6\x29\xe6\x4a\xde\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x49\xe6\x29\xde\x29\xde\x29\xe6\x08\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xcd\x46\xcc\xe5\xbc\x63\x9b\x21\xa3\x61\xab\xc2\xab\xa2\xab\xc2'\
-b'\xb4\x02\xb4\x44\xc4\xa5\xcd\x26\xd5\x67\xd5\xc8\xde\x09\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x09\xdd\xc8\xa3\xa2\xab\xc2\xdd\xe8\xe6\x2a'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x49\xe6\x2a\xe6\x29\xe6\x09\xdd\xe8\xb4\x23\xa3\x61\xd5\x87'\
-b'\xde\x08\xde\x08\xdd\xe8\xdd\xc8\xdd\xa7\xd5\x87\xcd\x26\xc4\xc5'\
-b'\xbc\x84\xbc\x43\xb4\x03\xab\xe3\xab\xe3\xb4\x03\xb4\x24\xbc\x84'\
-b'\xc4\xc5\xcd\x26\xd5\x87\xd5\xa8\xdd\xe8\xdd\xe7\xc4\xa4\x9b\x41'\
-b'\xcd\x26\xe6\x29\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x8b\xe6\x8b\xee\x6b\xe6\x6b\xdd\xe9'\
-b'\xee\x8c\xee\x8c\xee\x8c\xee\x8c\xee\x8c\xee\x8b\xe6\x6b\xee\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4b\xe6\x4a\xde\x09\xd5\x67'\
-b'\xbc\x84\xab\xc2\xab\xe3\xc4\xa5\xd5\x87\xde\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x09\xde\x09\xdd\xe8'\
-b'\xd5\x46\xb4\x23\x9b\x41\xa3\xa2\xab\xe2\xab\xa2\xab\xc2\xb4\x23'\
-b'\xbc\xa4\xcd\x26\xdd\xa7\xde\x08\xe6\x09\xe6\x29\xde\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x4a'\
-b'\xe6\x4a\xdd\xe8\xc4\xe6\xab\xe3\xab\xa2\xc4\xa4\xd5\x87\xde\x08'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6a'\
-b'\xe6\x6b\xe6\x6a\xe6\x6a\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xde\x4a'\
-b'\xe6\x2a\xe6\x29\xde\x09\xcd\x46\xb4\x03\xab\xa2\xbc\x84\xd5\x86'\
-b'\xdd\xe8\xde\x09\xe6\x08\xdd\xe8\xdd\xc7\xd5\x87\xcd\x25\xc4\xa4'\
-b'\xb4\x23\xab\xe2\xab\xa2\xab\xc3\xb4\x23\xbc\xa5\xcd\x26\xd5\x87'\
-b'\xdd\xe8\xe6\x29\xe6\x2a\xe6\x29\xdd\xc8\xbc\x84\xa3\x82\xbc\x64'\
-b'\xdd\xa7\xde\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xde\x09\xcd\x26\xab\xa2'\
-b'\xbc\x64\xdd\xc8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xde\x29\xe6\x09\xdd\xe8'\
-b'\xdd\xc8\xd5\x87\xcd\x46\xc4\xc5\xbc\x63\xb4\x03\xab\xc2\xa3\x81'\
-b'\x9b\x21\x9b\x21\xb4\x23\xc4\xc4\xcd\x26\xd5\xa7\xdd\xe8\xe6\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xde\x09\xb4\x44\xa3\x61\xd5\x87\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xe8\xcc\xe5\x9b\x21\xbc\xa4\xd5\x86\xd5\x66\xcd\x25'\
-b'\xc4\xc5\xbc\x64\xb4\x23\xab\xe2\xab\xc2\xab\xc2\xb3\xe3\xb4\x23'\
-b'\xbc\x84\xcd\x06\xd5\x67\xdd\xa8\xdd\xe9\xe6\x09\xe6\x2a\xe6\x4a'\
-b'\xe6\x2a\xde\x29\xde\x09\xdd\xc7\xab\xa2\xab\xc2\xdd\xe8\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xde\x09\xc4\xc5\x9b\x21\xcd\x05'\
-b'\xe6\x09\xe6\x29\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x29\xe6\x29'\
-b'\xe6\x29\xde\x09\xdd\xe8\xdd\xa8\xd5\x87\xcd\x26\xc4\xe5\xbc\x84'\
-b'\xb4\x44\xb4\x03\xab\xe2\xab\xc2\xab\xe3\xb4\x23\xb4\x23\x9b\x21'\
-b'\xab\xa2\xcd\x46\xd5\xa8\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x6a'\
-b'\xe6\x4a\xe6\x6a\xe6\x4a\xee\x6b\xe6\x6b\xe6\x6b\xee\x6a\xe6\x6b'\
-b'\xe6\x6b\xee\x8b\xee\x8b\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xee\x8c'\
-b'\xee\xac\xee\x8c\xe6\xac\xe6\x8c\xe6\x8c\xe6\x8b\xee\x8c\xe6\x8b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x2a\xdd\xc8\xc4\xe5\xb3\xe3\xab\xc2'\
-b'\xb4\x44\xcd\x46\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xde\x4a\xe6\x29\xde\x29\xdd\xe8\xcd\x46\xbc\x43'\
-b'\xab\xa2\xac\x03\xcd\x05\xdd\xa7\xdd\xc8\xd5\xa7\xcd\x46\xc4\xa5'\
-b'\xb4\x23\xab\xc2\xab\xc2\xb4\x03\xbc\x85\xcd\x26\xd5\xa7\xdd\xe8'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xc8'\
-b'\xc4\xe5\xab\xc2\xab\xc2\xc4\xa4\xd5\x87\xde\x08\xe6\x29\xe6\x2a'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x4b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xde\x29\xd5\xa7\xbc\x64\xa3\x82\xbc\x43\xd5\x66\xdd\xe8\xe6\x09'\
-b'\xe6\x29\xe6\x2a\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xde\x29\xe6\x09'\
-b'\xdd\xe8\xdd\xa8\xd5\x66\xcd\x05\xbc\x84\xb4\x23\xab\xc2\xab\xa2'\
-b'\xab\xc3\xb4\x23\xbc\xa5\xc4\xe5\xab\xe2\xab\x82\xcc\xe5\xdd\xc7'\
-b'\xde\x08\xe6\x29\xde\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x6a'\
-b'\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8b\xe6\x8b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x09\xc4\xe5\xa3\x82\xc4\xa4'\
-b'\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xe6\x29\xde\x08\xdd\xe8\xdd\xc7\xcd\x45\xa3\x82'\
-b'\xab\xa2\xbc\x83\xbc\x43\xab\xe3\xab\xc2\xab\xa2\xab\xe3\xb4\x23'\
-b'\xbc\xa5\xcd\x06\xd5\x87\xdd\xc9\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x6a\xe6\x6b\xe6\x6a\xe6\x6a\xe6\x6b\xe6\x4b\xe6\x4a\xe6\x29'\
-b'\xcd\x26\x9b\x41\xc4\xa4\xde\x09\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xde\x29\xdd\xe8\xbc\x64\x9b\x41\xd5\x66\xde\x09\xe6\x09\xde\x09'\
-b'\xde\x08\xe6\x08\xdd\xe8\xdd\xc7\xd5\x87\xd5\x46\xc5\x05\xc4\xa4'\
-b'\xbc\x43\xab\xe2\xab\xc2\xab\xc2\xab\xc2\xb4\x03\xbc\x64\xc4\xc5'\
-b'\xcd\x26\xd5\x67\xd5\xa7\xd5\x87\xa3\xa2\xab\xc2\xdd\xc8\xde\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x6b\xe6\x6a\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6a\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xd5\x66\x9b\x41\xb4\x44'\
-b'\xde\x08\xe6\x29\xe6\x2a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x4a\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xe8\xdd\xc8\xd5\x87\xcd\x46\xc4\xe5\xbc\x84\xb4\x03'\
-b'\x9b\x01\xa3\x41\xab\xc2\xab\xe3\xb4\x23\xbc\x64\xc4\xc5\xcd\x26'\
-b'\xd5\x87\xdd\xc8\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x8b\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8b\xe6\x8c\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x09\xcd\x46\xbc\x44\xab\xa2\xac\x03\xc4\xe5\xd5\xa8'\
-b'\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8\xc5\x06\xb4\x03\xab\xa2\xb4\x44'\
-b'\xcd\x46\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xc8\xd5\x67\xc4\xc5\xb4\x43\xab\xc3\xab\xc2\xab\xe3'\
-b'\xbc\x64\xc5\x06\xd5\x87\xdd\xe8\xde\x09\xdd\xc8\xc4\xe5\xab\xc2'\
-b'\xab\xa2\xc4\xa4\xd5\x87\xdd\xe8\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6a\xee\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xdd\xe8'\
-b'\xc4\xc5\xab\xa2\xb3\xe2\xcd\x25\xdd\xc8\xde\x29\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x4a\xde\x29\xe6\x29\xde\x29\xde\x09\xdd\xe8\xdd\xa7\xd5\x46'\
-b'\xc4\xe4\xbc\x43\x9b\x41\x9b\x21\xa3\x41\xa3\x81\xb4\x03\xbc\x84'\
-b'\xcd\x26\xd5\x87\xdd\xe8\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xee\x8b'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xde\x09\xbc\x85\xa3\x81\xcc\xe5\xde\x08'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xe6\x09\xdd\xc8\xb4\x03\xa3\x82'\
-b'\xcd\x46\xdd\xc7\xdd\xc8\xdd\xc7\xd5\x87\xd5\x46\xc4\xe5\xbc\x84'\
-b'\xb4\x23\xab\xe2\xab\xa2\xab\xc2\xab\xe3\xbc\x44\xc4\xc5\xcd\x46'\
-b'\xdd\xa8\xdd\xe9\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xdd\xc8'\
-b'\xab\xc2\xab\xa2\xd5\xa7\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xdd\xc8\xa3\xa2\xab\xa2\xdd\xc8\xe6\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29\xe6\x29\xde\x29\xde\x09'\
-b'\xdd\xe8\xdd\xe8\xdd\xa7\xd5\x66\xcd\x06\xc4\xc4\xb4\x63\xb4\x03'\
-b'\xab\xc2\xab\xa2\xab\xc2\xab\xc2\x9b\x21\xa3\x61\xc4\xc5\xcd\x46'\
-b'\xd5\xa8\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6a\xee\x6b\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xdd\xc8\xab\xc2\xab\xa2'\
-b'\xdd\xc8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xe6\x2a\xe6\x29\xe6\x29\xde\x08\xdd\xc7'\
-b'\xb4\x03\x9b\x41\xc4\xe5\xcd\x26\xc4\xe5\xbc\x84\xb4\x44\xb4\x03'\
-b'\xab\xc3\xab\xc3\xab\xe3\xb4\x23\xbc\x84\xc4\xc5\xcd\x26\xd5\x87'\
-b'\xdd\xe9\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x8b\xee\x8c\xee\x8c'\
-b'\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x4b\xe6\x6b\xe6\x4a\xe6\x2a\xd5\xa8'\
-b'\xc4\xa5\xab\xc2\xab\xc2\xbc\x64\xcd\x67\xdd\xe8\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xd5\xa8\xc4\xa5\xab\xc2\xab\xc2\xbc\x84\xd5\x87\xde\x08'\
-b'\xe6\x09\xe6\x2a\xe6\x49\xe6\x2a\xe6\x4a\xde\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x2a\xe6\x29\xe6\x29\xde\x29\xde\x09\xdd\xc8\xd5\x66\xc4\xe5'\
-b'\xbc\x43\xab\xe2\xab\xa2\xab\xa2\xb4\x03\xa3\xa2\xa3\x41\xbc\x43'\
-b'\xd5\x66\xdd\xe8\xde\x09\xe6\x29\xde\x29\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x6a\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xde\x09\xcd\x26\xab\xc3'\
-b'\xab\xa2\xc4\xc4\xd5\xa7\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x09\xdd\xe8'\
-b'\xd5\x46\xab\xe2\xab\xa2\xc4\xc4\xcd\x25\xc4\xe5\xbc\x64\xb4\x03'\
-b'\xab\xc2\xab\xa2\xab\xc2\xb4\x44\xc4\xc5\xcd\x46\xd5\xa8\xde\x09'\
-b'\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xdd\xe8\xbc\x44\xab\xa2\xcd\x26\xde\x08\xe6\x2a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x8b\xee\x8c\xee\x6b\xe6\x8b'\
-b'\xee\x8b\xe6\x6b\xee\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8\xbc\x64\xa3\x61\xcd\x25'\
-b'\xde\x08\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x29\xe6\x08\xe6\x08'\
-b'\xdd\xe8\xdd\xc7\xd5\x66\xcd\x26\xc4\xc4\xbc\x63\xb4\x03\xab\xc2'\
-b'\xab\xa2\xab\xc2\xb4\x03\xbc\x64\xc4\xe5\xcd\x46\xd5\x87\xc4\xa4'\
-b'\x9b\x21\xc4\xe5\xe6\x08\xde\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x4b\xe6\x6b\xee\x6b\xe6\x8b\xee\x6b\xe6\x6b\xee\x8b\xe6\x8b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x29\xcd\x46\x9b\x21\xbc\x84\xde\x09\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x2a\xde\x29\xde\x29\xde\x09\xdd\xe8\xdd\xe8'\
-b'\xd5\xa7\xd5\x66\xcd\x25\xbc\xa4\xa3\x41\x9b\x21\xab\xc2\xab\xa2'\
-b'\xab\xa2\xab\xe2\xb4\x23\xbc\x65\xc4\xe5\xcd\x47\xdd\xa8\xdd\xe9'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xee\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x2a\xe6\x29\xde\x08\xbc\x64\x9b\x21'\
-b'\xcd\x46\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x6a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09'\
-b'\xd5\x66\xa3\x41\xb4\x44\xdd\xe8\xe6\x09\xe6\x29\xe6\x09\xde\x08'\
-b'\xdd\xc8\xd5\xa7\xd5\x46\xcd\x06\xbc\xa5\xbc\x44\xb4\x03\xab\xe3'\
-b'\xab\xc2\xab\xe3\xb4\x23\xbc\x64\xc4\xe6\xcd\x47\xd5\xa8\xdd\xe9'\
-b'\xab\xe3\xbc\x64\xcd\x26\xdd\xc8\xdd\xc8\xcd\x06\xb4\x23\xab\xa2'\
-b'\xb4\x03\xc5\x05\xdd\xa8\xde\x29\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xd5\x67'\
-b'\xbc\x64\xab\xa2\xab\xe3\xc4\xe5\xdd\xa8\xde\x29\xe6\x2a\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x29\xde\x09'\
-b'\xdd\xe8\xd5\x66\xb4\x43\x9b\x21\xa3\x82\xab\xc2\xa3\x82\xab\xa2'\
-b'\xb4\x23\xbc\xa5\xcd\x46\xdd\xa7\xde\x09\xde\x29\xe6\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x29\xd5\x87\xb4\x23\xa3\x82\xbc\x63'\
-b'\xd5\x86\xde\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8\xc4\xc5'\
-b'\xa3\x82\xb4\x03\xd5\x66\xdd\xc8\xde\x08\xde\x08\xdd\xe8\xdd\xc8'\
-b'\xd5\xa7\xcd\x46\xc4\xe5\xbc\x63\xb4\x03\xab\xa2\xab\xa2\xab\xe2'\
-b'\xbc\x44\xc4\xc5\xcd\x47\xdd\xa8\xe6\x09\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xdd\xa8\xb4\x03\xab\xc2\xcd\x46\xde\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xee\x8c\xe6\x8c\xe6\x6b\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b\xe6\x8b\xe6\x6b\xee\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x2a\xde\x09\xbc\xa5\xa3\x41\xc4\xe5\xde\x09'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xde\x29\xe6\x09\xde\x08\xdd\xc8\xd5\xa7'\
-b'\xcd\x46\xcd\x05\xbc\x84\xb4\x23\xab\xc2\xab\xa2\xab\x82\x9b\x21'\
-b'\x9b\x21\xbc\x44\xc4\xe5\xd5\x67\xdd\xc8\xde\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x6a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x6c'\
-b'\xee\x8c\xe6\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x29\xbc\xa5\x9b\x21\xcd\x26\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x6a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29'\
-b'\xe6\x29\xde\x09\xdd\xe8\xdd\xa7\xa3\x82\xa3\xa2\xd5\x66\xd5\x86'\
-b'\xcd\x46\xcd\x05\xc4\xa4\xbc\x43\xac\x03\xab\xc2\xab\xa2\xab\xc2'\
-b'\xac\x03\xbc\x64\xc4\xa5\xcd\x26\xd5\x87\xdd\xc8\xde\x09\xe6\x2a'\
-b'\xe6\x4a\xe6\x29\xe6\x4a\xe6\x29\xde\x29\xde\x09\xcd\x05\x9b\x01'\
-b'\xbc\xa4\xde\x09\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x29'\
-b'\xdd\xe9\xbc\x64\x9b\x41\xcd\x46\xe6\x08\xde\x29\xe6\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x49\xe6\x29\xde\x29\xde\x09\xdd\xe8'\
-b'\xdd\xa8\xcd\x67\xcd\x06\xc4\xa5\xbc\x64\xb4\x03\xab\xe2\xab\xc3'\
-b'\xcc\xe5\xb4\x23\x9b\x41\xa3\x61\xa3\x61\x9b\x21\xab\xe2\xcd\x25'\
-b'\xdd\xc8\xde\x09\xe6\x29\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x4a\xdd\xe9\xcd\x26\xb4\x03\xa3\xa2'\
-b'\xb4\x23\xcd\x26\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xc7'\
-b'\xc4\xa5\xab\xa2\xab\xa2\xc4\xa4\xd5\x87\xdd\xa7\xd5\x87\xcd\x05'\
-b'\xbc\x84\xb4\x03\xab\xa2\xab\xa2\xb4\x03\xbc\x85\xcd\x26\xd5\xa8'\
-b'\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xee\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xdd\xc8\xbc\x64\xa3\x82\xb4\x03\xcd\x45\xdd\xe8'\
-b'\xe6\x09\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x29\xd5\x87\xb4\x23\xa3\x82'\
-b'\xc4\xa4\xd5\xc7\xde\x09\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xe6\x29\xe6\x09\xde\x08\xdd\xc8\xd5\xa7\xcd\x46\xc4\xc4'\
-b'\xbc\x63\xab\xe2\xab\xa2\xab\xa2\xab\xe2\xb4\x44\xc4\xc5\xcd\x46'\
-b'\xcd\x26\xab\xc2\xab\xe2\xd5\x66\xde\x08\xe6\x29\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8b\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\x6c\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xc4\xe5\xa3\x41\xbc\xa4\xdd\xe8\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xe6\x29\xde\x09\xde\x08\xdd\xc8\xdd\xa7\xd5\x45\xab\xe2\x9b\x21'\
-b'\xb4\x23\xb4\x02\xab\xc2\xa3\xa2\xab\xa2\xab\xe2\xbc\x44\xc4\xc5'\
-b'\xcd\x46\xd5\xa8\xdd\xe8\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xdd\xe8\xab\xc3\xa3\x61\xdd\xa7\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x4b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x09\xd5\xa7\xa3\x82\xab\xa2\xdd\xc7\xde\x09'\
-b'\xe6\x09\xde\x09\xde\x09\xdd\xe8\xdd\xe8\xdd\xa7\xd5\x67\xcd\x25'\
-b'\xc4\xc5\xbc\x64\xb4\x23\xab\xc2\xab\xc2\xab\xc2\xab\xe3\xb4\x23'\
-b'\xbc\x84\xc5\x06\xcd\x46\xd5\xa7\xdd\xc8\xdd\xe8\xd5\x87\xa3\x61'\
-b'\xab\xe3\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xd5\x87\xa3\x82\xb3\xe2\xdd\xc8\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x0a\xdd\xe9'\
-b'\xc4\xc5\xab\xe3\xa3\x82\xb4\x03\xbc\x64\xab\xe3\xa3\x82\xab\xc2'\
-b'\xbc\x43\xc5\x06\xd5\x87\xde\x08\xe6\x29\xde\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xdd\xc8\xc4\xc5\xab\xc2\xab\xa2\xbc\x84\xd5\x67'\
-b'\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xde\x29\xdd\xc8\xc4\xc5\xab\xa2'\
-b'\xab\xc2\xbc\xa4\xd5\xa7\xde\x08\xde\x09\xe6\x29\xde\x29\xe6\x09'\
-b'\xde\x09\xdd\xe8\xd5\xa7\xcd\x26\xbc\xa4\xb4\x03\xab\xc2\xab\xa2'\
-b'\xb3\xe3\xbc\x84\xcd\x06\xd5\xa7\xdd\xe9\xe6\x29\xe6\x4a\xe6\x49'\
-b'\xdd\xe8\xc4\xc5\xa3\xa2\xab\xc2\xcc\xe5\xdd\xc7\xde\x09\xe6\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x6a\xe6\x6b\xee\x6b'\
-b'\xe6\x8b\xee\x8c\xe6\x8b\xe6\x8c\xee\x8b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xde\x09\xcd\x06\xa3\xa2\xab\xe2\xd5\x46'\
-b'\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xe6\x09'\
-b'\xdd\xe8\xdd\xc8\xd5\x86\xcd\x26\xc4\xc4\xbc\x43\xab\xc2\xa3\x41'\
-b'\x9b\x21\x9b\x21\xb3\xe3\xc4\xa5\xcd\x46\xd5\xa8\xdd\xe9\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xee\x6b\xe6\x6b\xe6\x8b\xe6\x6c\xe6\x6b'\
-b'\xe6\x8b\xe6\x8c\xee\x6b\xe6\x8b\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x2a\xcd\x26\xa3\x61\xb4\x44\xdd\xe8\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xde\x08\xcd\x26\x9b\x41\xb4\x23'\
-b'\xdd\xa7\xdd\xa7\xd5\xa7\xd5\x46\xcd\x05\xc4\xa4\xb4\x43\xab\xe2'\
-b'\xab\xa2\xab\xa2\xab\xc2\xb4\x03\xbc\x84\xc4\xe6\xd5\x67\xdd\xc8'\
-b'\xde\x09\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xd5\x87\xa3\x41\xb4\x23\xde\x08\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x6a'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xde\x29\xdd\xa8\xa3\x82\xab\xa2\xdd\xc8\xe6\x29'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x49\xe6\x29'\
-b'\xde\x29\xe6\x09\xdd\xe8\xdd\xc8\xd5\x87\xd5\x46\xc4\xe5\xc4\x84'\
-b'\xb4\x43\xb3\xe3\xab\xc2\xab\xa2\xab\xc2\xb4\x03\xb4\x23\xa3\x61'\
-b'\x9b\x41\xcd\x06\xdd\xc8\xde\x09\xe6\x29\xe6\x4a\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8b\xe6\x6b\xe6\x6b'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xde\x09\xc4\xc5\x9b\x21\xc4\xe5\xde\x09\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x8c\xee\x8c\xee\xac'\
-b'\xb4\x03\xc4\xc5\xd5\x87\xde\x09\xe6\x09\xdd\xe8\xd5\x87\xc4\xe5'\
-b'\xb4\x44\xab\xa2\xa3\xa2\xb3\xe3\xbc\xa5\xd5\x47\xdd\xe8\xde\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x09'\
-b'\xd5\x87\xbc\x64\xab\xa2\xab\xc2\xc4\xc5\xd5\xa7\xde\x09\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xee\x6b\xe6\x6b\xee\x6b\xee\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x49\xdd\xc8\xc4\xc5\xa3\xa2\xab\xa2\xc4\xc4'\
-b'\xd5\xa7\xde\x09\xe6\x29\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xdd\xe8\xd5\xa7\xcd\x46'\
-b'\xc4\xa4\xb4\x23\xab\xc2\xa3\x82\xab\xe2\xbc\x44\xc4\xe5\xc4\xe6'\
-b'\xab\xe3\xa3\x81\xc4\x84\xd5\x86\xdd\xe8\xde\x09\xe6\x29\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x6b\xee\x8c\xe6\x8b\xe6\x6b\xee\x6b'\
-b'\xe6\x4a\xe6\x4a\xdd\xc8\xbc\x44\xa3\x81\xbc\x64\xdd\xa7\xde\x09'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xdd\xc7\xbc\x84\xa3\x61'\
-b'\xb4\x43\xc4\xa4\xb4\x23\xab\xc2\xa3\xa2\xab\xa2\xab\xe2\xbc\x64'\
-b'\xc4\xe5\xd5\x67\xdd\xc8\xde\x29\xe6\x4a\xee\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x8b\xe6\x6c\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xd5\x67\xa3\x81\xb4\x03\xdd\xa7\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xee\x8b\xe6\x8b\xee\x8b\xee\x8b'\
-b'\xe6\x6b\xee\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b'\
-b'\xe6\x6a\xe6\x4a\xe6\x2a\xe6\x29\xdd\xe8\xab\xe3\xa3\x61\xd5\x67'\
-b'\xde\x09\xe6\x29\xde\x29\xe6\x29\xde\x09\xde\x09\xdd\xe8\xdd\xc7'\
-b'\xd5\x87\xcd\x46\xcc\xe5\xbc\x84\xb4\x03\xab\xc2\xab\xa1\xab\xa2'\
-b'\xab\xe2\xb4\x24\xc4\xa5\xcd\x26\xd5\x67\xdd\xc8\xde\x09\xe6\x08'\
-b'\xc4\xe5\x9b\x01\xc4\xc5\xde\x09\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x8b\xee\x6b\xe6\x8b\xee\x8c\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xee\x6b\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xd5\xc7\xa3\x82\xab\xa2\xdd\xc8\xde\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x49\xe6\x4a\xe6\x29\xde\x29'\
-b'\xde\x09\xdd\xe8\xdd\xa7\xcd\x66\xcd\x06\xc4\xa4\xb4\x43\xab\xa2'\
-b'\x92\xe0\xa3\x41\xab\xa2\xab\xe2\xb4\x44\xc4\xa5\xcd\x06\xd5\x67'\
-b'\xdd\xc8\xde\x09\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6a\xe6\x6a\xe6\x4b\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xdd\xc7\xab\xc2\xa3\x82\xdd\xa7\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xee\x6b'\
-b'\xe6\x6b\xee\x8c\xee\x8c\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xad'\
-b'\xe6\x2a\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xe6\x29\xdd\xc8\xcd\x46\xbc\x84\xab\xe2\xa3\x82\xab\xc2\xbc\x44'\
-b'\xcd\x06\xd5\xa7\xde\x09\xe6\x2a\xe6\x2a\xdd\xe9\xcd\x26\xb4\x03'\
-b'\xa3\x82\xb4\x03\xc5\x06\xdd\xc8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8c'\
-b'\xee\x8b\xe6\x8c\xe6\x8c\xee\x8c\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xdd\xc8\xc4\xa5\xa3\xa2\xab\xa2\xc4\xa4\xd5\xa7\xde\x09'\
-b'\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xe8\xd5\xa7\xd5\x26\xc4\xa4\xab\xa2\x9b\x00\x9b\x21'\
-b'\x9b\x00\xab\xa2\xbc\x84\xcd\x46\xdd\xa7\xde\x08\xe6\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x6b\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\x6b\xe6\x8b\xee\x8c\xe6\x6c\xe6\x6b\xe6\x4a'\
-b'\xe6\x29\xcd\x26\xab\xc2\xab\xa2\xcd\x05\xdd\xe8\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xde\x29\xdd\xe8\xbc\x84\xa3\x61\xc4\xa4'\
-b'\xdd\xa7\xdd\xe8\xdd\xe8\xdd\xa7\xd5\x66\xcd\x05\xc4\xa4\xb4\x23'\
-b'\xab\xc2\xa3\xa2\xab\xa2\xab\xe3\xbc\x64\xc4\xe6\xd5\x67\xdd\xe8'\
-b'\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6a\xe6\x4b\xee\x6a\xe6\x4a\xe6\x2a'\
-b'\xd5\x87\xab\xa2\xab\xc2\xd5\x87\xde\x09\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x8b\xe6\x6c\xee\x8b\xe6\x8c\xee\x8c\xe6\x6c\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x29\xc4\xe5\x9b\x21\xc4\xa4\xde\x08'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xe6\x29\xde\x09\xde\x08\xdd\xe8\xdd\xa7\xd5\x66\xcd\x25'\
-b'\xc4\xa4\xbc\x43\xab\xe3\xab\xa2\xa3\xa2\xab\xa2\xab\xe3\xb4\x23'\
-b'\xab\xa2\x9b\x00\xc4\xe5\xdd\xc7\xde\x09\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x8c\xee\x8b'\
-b'\xe6\x8c\xe6\x6c\xe6\x8b\xe6\x8b\xee\x6b\xe6\x8b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xd5\xa8\xa3\x81\xab\xa2\xdd\xe8\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x6b\xe6\x4a\xe6\x6b\xe6\x4a'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x09\xde\x09\xdd\xe8\xcd\x26'\
-b'\x9b\x21\xab\xc2\xcd\x05\xc4\xc5\xbc\x64\xb4\x23\xab\xe2\xab\xa2'\
-b'\xab\xc2\xab\xe3\xb4\x23\xbc\x85\xcc\xe6\xd5\x47\xdd\xa8\xdd\xe8'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xde\x29\xde\x09\xcd\x06\x9b\x21\xbc\x84\xde\x29\xe6\x4a'\
-b'\xe6\x6a\xe6\x6b\xee\x6b\xe6\x6b\xee\x8b\xee\x8c\xe6\x8c\xe6\x8c'\
-b'\xee\x8c\xee\xac\xe6\xac\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xcd'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xdd\xe9\xd5\x87\xc4\xe5\xb4\x23'\
-b'\xa3\xa2\xa3\x82\xb3\xe3\xbc\xa4\xc4\xa4\xab\xc2\xa3\x82\xbc\x43'\
-b'\xcd\x46\xdd\xe8\xe6\x09\xde\x29\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6c\xee\x6c'\
-b'\xe6\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xdd\xc8'\
-b'\xbc\xa5\xab\xa2\xab\xc2\xc4\xc5\xd5\xa7\xde\x09\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x29\xde\x09\xde\x08\xd5\x87\xbc\x64\xa3\x61\xab\xe2\xc4\xe5'\
-b'\xc4\xc5\xbc\x43\xab\xc2\xa3\x82\xab\xa2\xb4\x03\xbc\xa5\xcd\x46'\
-b'\xd5\xa8\xde\x09\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x8b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x6b\xe6\x4a\xdd\xe8'\
-b'\xbc\x85\xa3\x61\xb4\x43\xd5\x87\xde\x09\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x8b\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8b\xe6\x8b\xee\x6b\xe6\x8b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xdd\xc8\xbc\x44\xa3\x82\xc4\xe5\xdd\xe8'\
-b'\xde\x29\xe6\x29\xe6\x29\xde\x2a\xe6\x29\xe6\x29\xde\x09\xdd\xe8'\
-b'\xdd\xa7\xd5\x66\xcd\x05\xc4\xa4\xb4\x23\xab\xc2\xa3\x82\xab\xa2'\
-b'\xab\xe3\xbc\x64\xc4\xe6\xd5\x67\xdd\xc8\xde\x09\xe6\x09\xdd\xa7'\
-b'\xab\xe3\xa3\x81\xd5\x46\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xee\x6b\xee\x8c\xee\x8b\xe6\x6c\xee\x8b\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xe6\xac\xee\x8c\xee\x8c\xe6\x8c\xe6\x8b\xee\x8b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x2a\xd5\xc8\xa3\x82\xab\xa2\xdd\xa8\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x29\xde\x29'\
-b'\xde\x09\xdd\xe8\xdd\xc7\xd5\xa7\xd5\x46\xc4\xe4\xbc\x83\xb3\xe2'\
-b'\x93\x01\x9b\x21\xa3\x81\xab\xa2\xb4\x03\xbc\x64\xc4\xe6\xd5\x67'\
-b'\xdd\xc8\xde\x09\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xee\x8b\xe6\x6b\xee\x6b\xe6\x6c\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xd5\xa8\xa3\x62\xab\xa2\xdd\xe8\xde\x2a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xdd\xa7'\
-b'\xa3\xa2\xa3\x81\xd5\x87\xde\x08\xde\x08\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xd5\x67\xcd\x05\xbc\xa5\xb4\x43\xb3\xe2\xab\xc2\xa3\xa2\xab\xc2'\
-b'\xb4\x03\xbc\x64\xc4\xc5\xcd\x26\xd5\xa8\xdd\xc8\xe6\x09\xe6\x29'\
-b'\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xb4\x03\x9b\x41\xd5\x66\xe6\x2a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xe6\x8b\xee\x8c\xee\x8c'\
-b'\xe6\xac\xee\xad\xee\xad\xee\xad\xee\xcd\xe6\xad\xee\xae\xee\xce'\
-b'\xee\xad\xee\xac\xee\xac\xe6\x8d\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xde\x09\xdd\xe8'\
-b'\xd5\x87\xc4\x84\x9b\x41\x9b\x00\x9b\x21\x9b\x01\xab\xc2\xc4\xc5'\
-b'\xd5\x87\xdd\xe8\xde\x09\xe6\x29\xe6\x29\xde\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x8b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x2a\xdd\xc8\xc4\xa5\xa3\xa2'\
-b'\xab\xa2\xc4\xc5\xd5\xa7\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xdd\xe8\xc4\xe5\xab\xa2\xab\xa2\xc4\xc4\xd5\xa7\xdd\xe8'\
-b'\xde\x08\xdd\xe8\xdd\xc7\xd5\x66\xc4\xe5\xbc\x64\xab\xe2\xab\x82'\
-b'\xab\xa2\xac\x03\xbc\x84\xcd\x26\xdd\xa8\xde\x09\xe6\x2a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x2a\xd5\x67\xab\xe2'\
-b'\xab\x82\xc4\xe5\xdd\xc7\xe6\x09\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xee\x8b\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x6c\xee\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xd5\xc8\xb4\x03\xa3\xa1\xcd\x26\xe6\x08\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xde\x29\xde\x09\xdd\xe8\xdd\xa7\xd5\x66\xcd\x05'\
-b'\xbc\x84\xb4\x02\xab\xc2\xa3\x81\xab\xa2\xab\xe3\xbc\x64\xab\xe2'\
-b'\x9b\x21\xc4\xc4\xdd\xc7\xde\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x8b\xe6\x6b\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\xac\xe6\xac\xee\x8c\xee\x8c\xe6\x8c\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xbc\x84\x9b\x21\xcd\x05\xde\x29\xe6\x4a'\
-b'\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x4b\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8\xdd\xc8\xc4\xe5'\
-b'\x9b\x00\xb4\x23\xcd\x05\xc4\xc4\xbc\x63\xb4\x03\xab\xc2\xa3\x81'\
-b'\xa3\xa2\xab\xc2\xb4\x23\xc4\xa5\xcd\x26\xd5\x87\xdd\xe8\xe6\x29'\
-b'\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xd5\xa7\xa3\x61\xa3\xa2\xdd\xe8\xe6\x29'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xee\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x08'\
-b'\xbc\x44\x9b\x01\xcd\x26\xe6\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xe6\x29\xde\x09\xde\x09\xdd\xc8\xd5\x87\xcd\x26'\
-b'\xc4\xc5\xbc\x64\xb4\x03\xab\xc2\xab\xa2\xab\xc2\xab\xe3\xb4\x23'\
-b'\xbc\x85\xc5\x05\xcd\x46\xd5\x87\xcd\x05\x9b\x21\xb4\x03\xdd\xe8'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xee\x6b\xe6\x6b\xee\x8c\xee\x8c'\
-b'\xe6\xac\xee\xac\xee\xad\xe6\xad\xee\xad\xee\xcd\xee\xcd\xee\xae'\
-b'\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xac\xe6\x8c\xee\x8c\xee\x8b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x2a\xde\x29\xdd\xe8\xcd\x26'\
-b'\xb4\x23\xa3\x82\xab\xe2\xc4\xe5\xd5\x46\xc4\xe5\xb4\x23\xa3\x82'\
-b'\xa3\x82\xb3\xe2\xbc\xa4\xcd\x47\xdd\xc8\xde\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xdd\xa8\xbc\xa4\xa3\x82\xab\xa2\xc4\xc4'\
-b'\xd5\xa7\xe6\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xee\x6b\xe6\x6b\xee\x8c\xee\x6b\xe6\x8b'\
-b'\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xde\x09'\
-b'\xcd\x46\xab\xe3\xa3\x61\xbc\x64\xd5\x86\xdd\xe8\xe6\x09\xe6\x29'\
-b'\xe6\x2a\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xde\x09\xdd\xc7\xd5\x86'\
-b'\xcd\x05\xbc\x84\xb3\xe2\xa3\xa2\xa3\xa2\xab\xe2\xbc\x64\xcd\x06'\
-b'\xd5\x87\xdd\xe9\xe6\x29\xe6\x29\xdd\xe8\xc4\xa5\xa3\x61\xb4\x03'\
-b'\xd5\x46\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x8c\xee\x8c\xe6\xac\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\xac\xee\xac\xe6\xac\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xd5\x87\xab\xc2\xab\xc2\xd5\x66\xde\x09\xe6\x2a\xe6\x4a'\
-b'\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29\xde\x09'\
-b'\xdd\xe8\xdd\xc8\xd5\xa7\xd5\x46\xc4\xc4\xbc\x43\x9b\x21\x9b\x00'\
-b'\xa3\x41\xa3\x82\xab\xe3\xbc\x64\xc4\xe5\xd5\x67\xdd\xe8\xe6\x29'\
-b'\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6b\xee\x8b\xee\x8b\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xe6\x8c\xee\xac\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xd5\x87\xa3\x41\xab\xe3\xdd\xe8\xe6\x2a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xee\x8b\xe6\x6b\xee\x6b\xee\x8b\xe6\x6b\xee\x8b'\
-b'\xee\x6b\xe6\x6b\xee\x8b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xdd\xe8\xbc\x63'\
-b'\x9b\x01\xcd\x05\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc7\xd5\x87\xd5\x66'\
-b'\xcd\x05\xc4\xa4\xbc\x43\xab\xe2\xab\xa2\xa3\x82\xab\xa2\xab\xe3'\
-b'\xbc\x44\xc4\xc5\xcd\x46\xd5\xa8\xdd\xe9\xe6\x29\xe6\x29\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xde\x09\xd5\xa7\xa3\x62\xab\xa2\xdd\xc8\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x8b\xe6\x6b'\
-b'\xee\x6b\xe6\x8b\xe6\x6b\xee\x8b\xee\x8b\xe6\x6b\xee\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29'\
-b'\xcd\x05\x9b\x00\xbc\x84\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xe6\x29\xde\x29\xde\x09\xdd\xe8\xd5\xa7\xcd\x47\xc4\xe5\xbc\x84'\
-b'\xb4\x23\xab\xc3\xab\xa2\xab\xa2\xab\xa2\x9b\x21\x9b\x21\xbc\x84'\
-b'\xcd\x26\xd5\x87\xdd\xe9\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x8b'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xee\xac\xee\xad\xe6\xad\xee\xad\xee\xad'\
-b'\xee\xce\xee\xcd\xee\xad\xe6\xad\xee\xad\xee\xad\xe6\xac\xee\x8c'\
-b'\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x29\xdd\xc8\xc4\xe5\xab\xe3\xab\x82'\
-b'\xb4\x23\xcd\x26\xdd\xe8\xe6\x09\xe6\x29\xde\x29\xde\x09\xdd\xa8'\
-b'\xcd\x26\xbc\x84\xab\xc2\xa3\x82\xab\xa2\xb4\x23\xc5\x06\xd5\x87'\
-b'\xde\x09\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x4b\xe6\x4a\xe6\x6b'\
-b'\xe6\x2a\xd5\xa8\xbc\xa4\xa3\x82\xab\xa2\xc4\xc5\xdd\xa7\xde\x09'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6a\xe6\x6b\xee\x6b'\
-b'\xee\x6b\xe6\x8b\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b\xe6\x8c\xe6\x6c'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x2a\xd5\x87\xb4\x44'\
-b'\xa3\x61\xb4\x03\xd5\x46\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29'\
-b'\xde\x29\xe6\x09\xdd\xe8\xd5\x87\xcd\x05\xc4\x84\xb4\x03\xa3\xa2'\
-b'\xa3\x81\xab\xc2\xb4\x44\xc4\xa5\xab\xe3\xa3\x41\xbc\x84\xd5\xa6'\
-b'\xdd\xe8\xde\x29\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x8b\xe6\x8c\xee\x8c\xe6\x8c\xee\xac\xee\xad\xe6\xac'\
-b'\xee\xac\xee\x8d\xe6\x8d\xee\x8c\xe6\x8c\xe6\x6b\xee\x6b\xe6\x4a'\
-b'\xcd\x47\xab\x82\xb4\x03\xd5\x87\xe6\x09\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x8b\xe6\x6b\xee\x8c\xee\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x09\xde\x08\xdd\xc7\xbc\x64\x9b\x21\xbc\x64'\
-b'\xcd\x25\xc4\xc4\xbc\x63\xb3\xe2\xab\xa2\xa3\x82\xa3\xa2\xb4\x03'\
-b'\xbc\x84\xcd\x06\xd5\xa7\xde\x09\xe6\x2a\xe6\x6b\xe6\x6b\xe6\x8b'\
-b'\xe6\x8b\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b\xee\x8b\xe6\x6b'\
-b'\xe6\x4a\xe6\x09\xb4\x23\x9b\x21\xcd\x46\xe6\x29\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x6b\xe6\x8b\xee\x8b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xc8\xa3\xa2'\
-b'\xa3\x61\xd5\x87\xde\x09\xe6\x29\xe6\x29\xe6\x2a\xde\x29\xe6\x29'\
-b'\xde\x09\xde\x09\xdd\xe8\xdd\xc7\xd5\x87\xd5\x46\xc4\xe5\xbc\x84'\
-b'\xb4\x23\xab\xc2\xab\xa2\xa3\x81\xab\xc2\xb4\x03\xbc\x84\xc4\xe6'\
-b'\xcd\x66\xd5\xa7\xdd\xc8\xd5\x86\xa3\x61\xa3\x82\xdd\xc8\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b\xe6\x6b\xee\x8c\xe6\x6b'\
-b'\xe6\x8b\xee\x6c\xe6\x8c\xe6\x8c\xe6\x8c\xe6\x8b\xe6\x6c\xe6\x8b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xde\x29'\
-b'\xd5\x87\xa3\x41\xab\xa2\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29'\
-b'\xe6\x09\xdd\xe8\xd5\xa7\xd5\x67\xc5\x05\xbc\x84\xa3\x41\x92\xe0'\
-b'\xa3\x82\xab\xa2\xab\xa2\xab\xe3\xbc\x64\xc4\xc5\xcd\x26\xd5\xa8'\
-b'\xdd\xe9\xe6\x2a\xe6\x6b\xe6\x6b\xee\x8c\xee\x8c\xe6\xac\xee\xac'\
-b'\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xac\xee\x8c\xe6\x8c'\
-b'\xee\x6b\xe6\x4a\xd5\xa8\xbc\xa5\xab\xa2\xa3\xa2\xbc\x84\xd5\x67'\
-b'\xde\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29'\
-b'\xe6\x29\xe6\x29\xdd\xe9\xd5\x87\xc4\xc5\xb4\x03\xab\xa2\xa3\x82'\
-b'\xab\xe2\xc4\xa4\xcd\x47\xdd\xc8\xe6\x29\xe6\x29\xe6\x29\xd5\xa7'\
-b'\xbc\x84\xa3\x82\xab\xa2\xc4\xc4\xdd\xa7\xde\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x8b\xee\x8c\xe6\x8c\xee\x8c\xee\x8b\xe6\x8c\xee\x8c\xe6\x6b'\
-b'\xee\x8c\xe6\x8b\xee\x6b\xe6\x4a\xdd\xe8\xc4\xa5\xa3\x81\xab\xc2'\
-b'\xcd\x05\xdd\xc8\xde\x29\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x4b\xe6\x6a\xe6\x6b\xe6\x4a\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x29\xde\x08\xdd\xc7\xd5\x87'\
-b'\xcd\x05\xbc\x63\xa3\x41\x93\x00\x9b\x21\xa3\x41\xac\x02\xc4\xa4'\
-b'\xcd\x26\xdd\xa8\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xee\x6b\xee\x8c\xe6\x8c\xee\x8c\xee\xac\xe6\x8c\xee\x8d'\
-b'\xe6\xac\xee\xac\xee\xac\xe6\x8c\xee\x8b\xe6\x6b\xe6\x29\xc5\x06'\
-b'\xa3\x81\xb4\x23\xd5\xa7\xe6\x29\xe6\x4a\xe6\x4b\xe6\x6b\xee\x6b'\
-b'\xe6\x8b\xee\x8b\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8b\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xc4\xe5\x9b\x41\xbc\x43\xdd\xc7'\
-b'\xdd\xe8\xdd\xe8\xdd\xe8\xdd\xc8\xd5\x87\xcd\x45\xc4\xc4\xbc\x63'\
-b'\xab\xe3\xab\xa2\xa3\x81\xab\xa2\xb4\x03\xbc\x85\xcd\x26\xdd\xa8'\
-b'\xdd\xe9\xe6\x2a\xe6\x4a\xe6\x6a\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xcd\x26\x9b\x21\xb4\x43\xde\x08\xe6\x2a\xe6\x6a\xe6\x6b'\
-b'\xee\x8b\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xee\x8c\xee\xac\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\xac\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xcd\x46\x9b\x21'\
-b'\xb4\x03\xdd\xe8\xe6\x2a\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x29\xe6\x09\xde\x08'\
-b'\xdd\xe8\xdd\xa7\xd5\x66\xcd\x26\xc4\xc4\xbc\x63\xb3\xe3\xab\xa2'\
-b'\xa3\x82\xab\x82\xab\xc2\xab\xe3\x9b\x01\xa3\x61\xcd\x26\xd5\xc8'\
-b'\xde\x08\xe6\x29\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x8b\xe6\x6b\xee\x6b\xee\x8b\xee\x8b\xee\x6c\xee\x8c\xee\x8c'\
-b'\xe6\x6b\xe6\x8b\xee\x6b\xee\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29'\
-b'\xdd\xe8\xab\xe3\x9b\x21\xd5\x67\xde\x29\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a'\
-b'\xe6\x6b\xe6\x4b\xe6\x6a\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xe6\x09\xdd\xe8\xc4\xa5\x9b\x00'\
-b'\xbc\x43\xcd\x66\xcd\x26\xc4\xc5\xbc\x64\xb4\x03\xab\xc2\xab\xa2'\
-b'\xab\xc2\xab\xe3\xb4\x44\xc4\xa5\xcd\x26\xd5\x88\xdd\xe9\xde\x2a'\
-b'\xee\xcd\xee\xad\xee\xad\xee\xad\xe6\xac\xee\x8c\xe6\x6b\xe6\x2a'\
-b'\xd5\x67\xb4\x44\xa3\x81\xab\xc2\xc4\xc5\xdd\xc8\xe6\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x09\xd5\xa7\xcd\x26'\
-b'\xbc\x64\xab\xc2\xa3\x62\xa3\xa2\xb4\x23\xc4\xe5\xbc\x64\xa3\x82'\
-b'\xab\xa2\xc4\xa4\xd5\xa7\xdd\xe8\xde\x29\xe6\x29\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x6a\xe6\x6b\xee\x6b\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xde\x09\xcd\x06\xab\xa2\xa3\x81\xc4\xa4\xd5\xa7'\
-b'\xe6\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xe6\x08'\
-b'\xd5\x66\xb4\x03\xa3\x61\xbc\x63\xcd\x05\xc4\xa4\xb4\x23\xab\xa2'\
-b'\xa3\x81\xa3\xa2\xb4\x03\xbc\x84\xcd\x26\xd5\xc8\xe6\x09\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x8b\xe6\x8b\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x29\xc4\xa5\xa3\x61'\
-b'\xbc\x64\xdd\xc8\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x8b\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xde\x29\xcd\x26\xa3\x41\xb4\x03\xd5\xa7\xde\x09'\
-b'\xe6\x29\xe6\x2a\xe6\x2a\xe6\x29\xe6\x29\xe6\x29\xde\x09\xdd\xe8'\
-b'\xdd\xc7\xd5\x87\xcd\x26\xc4\xc4\xbc\x43\xab\xe2\xab\xa1\xa3\x82'\
-b'\xab\xa2\xb4\x23\xbc\xa5\xcd\x26\xd5\xa8\xdd\xe8\xe6\x09\xe6\x29'\
-b'\xdd\xc8\xab\xa2\xa3\x61\xd5\x67\xe6\x29\xe6\x4a\xe6\x4b\xe6\x6b'\
-b'\xe6\x6b\xee\x8c\xe6\x8c\xe6\x8c\xe6\x8c\xe6\x8c\xee\xad\xee\xad'\
-b'\xe6\xac\xee\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8b'\
-b'\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x29\xc4\xa5\x93\x00'\
-b'\xc4\xc5\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4b\xe6\x6a'\
-b'\xe6\x4b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xdd\xc8\xd5\xa7'\
-b'\xd5\x66\xc5\x05\xbc\x83\xb4\x02\x9b\x01\x9b\x00\xa3\x61\xab\xa2'\
-b'\xab\xe3\xbc\x44\xc4\xc5\xcd\x46\xdd\xa8\xde\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x8c\xe6\x6b\xe6\x8b\xee\x8c'\
-b'\xe6\x6b\xe6\x8c\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x2a'\
-b'\xe6\x09\xbc\xa4\x9b\x00\xc4\xc5\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x6a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x2a\xe6\x29\xd5\xc7\xab\xc2'\
-b'\xa3\x62\xd5\x66\xde\x08\xe6\x09\xde\x09\xde\x09\xdd\xe8\xd5\xa8'\
-b'\xcd\x67\xcc\xe5\xbc\x84\xb4\x23\xab\xe3\xa3\xa2\xab\xa2\xab\xc2'\
-b'\xee\xad\xee\xad\xe6\xac\xe6\x8c\xee\x6b\xde\x09\xcd\x27\xac\x03'\
-b'\xa3\x82\xb4\x03\xcd\x26\xdd\xe9\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29'\
-b'\xde\x09\xdd\xc8\xd5\x46\xb4\x23\x9b\x01\x9b\x00\x9b\x01\x9b\x01'\
-b'\xb4\x23\xcd\x25\xdd\xa7\xdd\xe9\xe6\x29\xe6\x29\xde\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x2a\xd5\x67\xb4\x03\xa3\x61\xb4\x43\xd5\x67\xde\x08\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x8b\xee\x6c\xe6\x8b\xee\x8c\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8\xc4\xe5'\
-b'\xa3\x82\xab\xa2\xcd\x05\xd5\xa7\xdd\xe8\xde\x08\xdd\xe8\xdd\xa7'\
-b'\xd5\x46\xc4\xc5\xb4\x43\xab\xc2\xa3\x82\xa3\x81\xab\xe3\xbc\x64'\
-b'\xcd\x26\xdd\xa8\xde\x09\xe6\x4a\xe6\x6b\xee\x6b\xe6\x6b\xe6\x8b'\
-b'\xe6\x8b\xe6\x6c\xee\x6b\xe6\x6b\xdd\xe9\xbc\x64\xa3\x61\xc4\xc4'\
-b'\xdd\xe8\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\xad\xee\xac\xee\xac\xee\xad\xe6\xac\xee\xad'\
-b'\xee\xac\xee\xad\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8b\xe6\x6b'\
-b'\xe6\x4a\xe6\x2a\xd5\x67\xa3\x81\xab\xc2\xd5\x87\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xdd\xe8\xdd\xc8\xd5\x66\xcd\x25'\
-b'\xc4\xa4\xb4\x23\xab\xc2\xab\x81\xa3\x82\xab\xa2\xb4\x03\xbc\x84'\
-b'\xb4\x43\x93\x01\xbc\x64\xdd\xc7\xde\x29\xe6\x2a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xee\x8b\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\xac\xee\xac'\
-b'\xe6\xad\xee\x8c\xee\xad\xee\xad\xee\xac\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\x6b\xee\x6b\xe6\x4a\xe6\x4a\xdd\xe8\xab\xe3\x9b\x21'\
-b'\xd5\x67\xe6\x29\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4b'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x49\xe6\x29'\
-b'\xde\x09\xe6\x08\xdd\xc8\xd5\x66\x9b\x41\xa3\x62\xc4\xe5\xc4\xc4'\
-b'\xbc\x64\xb4\x03\xab\xc2\xa3\x82\xa3\x81\xab\xc2\xb4\x03\xbc\x84'\
-b'\xcd\x06\xd5\x87\xdd\xe9\xde\x29\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xde\x29\xcd\x46\x9b\x21\xb4\x03\xde\x09\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xee\x8b\xe6\x6c\xee\x8b'\
-b'\xee\x8c\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xcd\x06'\
-b'\x9b\x01\xb4\x43\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8\xd5\xa8\xcd\x47'\
-b'\xee\x8c\xee\x8c\xe6\x6b\xdd\xc9\xc4\xc5\xab\xc2\xa3\x82\xbc\x64'\
-b'\xd5\x67\xde\x09\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29'\
-b'\xdd\xe8\xd5\x67\xbc\x63\xa3\x81\xab\xa2\xc4\xa4\xc5\x05\xbc\x64'\
-b'\xab\xa2\xa3\x61\xa3\x82\xb4\x23\xc4\xe5\xd5\x87\xdd\xe8\xe6\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x8c'\
-b'\xe6\x8c\xee\x8b\xe6\x8c\xe6\x8b\xee\x6b\xe6\x6b\xe6\x4a\xd5\xa8'\
-b'\xbc\x64\xa3\x61\xab\xe2\xcd\x26\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a'\
-b'\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x8b\xe6\x6b'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8b\xe6\x8c\xee\x8c'\
-b'\xe6\x8b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29\xd5\xa8\xb4\x44\xa3\x61'\
-b'\xb4\x43\xd5\x66\xde\x08\xe6\x09\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x29'\
-b'\xde\x29\xe6\x09\xde\x08\xdd\xc7\xd5\x66\xcc\xe5\xbc\x63\xab\xe2'\
-b'\xa3\x82\xa3\x81\xab\xc2\xbc\x64\xc5\x06\xd5\x87\xde\x09\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xdd\xc8\xb4\x03\xa3\x61\xc4\xe5\xdd\xe8'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8c\xee\x8c\xee\x8c'\
-b'\xee\xac\xe6\xad\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad'\
-b'\xee\xad\xe6\xac\xee\xad\xee\xac\xe6\x8c\xee\x8c\xe6\x6c\xe6\x6b'\
-b'\xe6\x4a\xd5\xa7\xab\xa2\xa3\x82\xd5\x66\xde\x09\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xe8\xdd\xa7\xd5\x66\xcd\x05\xbc\x84\xb4\x23\xa3\x81'\
-b'\x92\xe0\x9b\x01\xa3\x81\xb4\x03\xbc\x84\xcd\x26\xd5\xa8\xde\x09'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x8b\xe6\x8b\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xe6\xac\xe6\xad\xee\xac\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8b\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xd5\x87\xa3\x41\xab\xc2'\
-b'\xdd\xe8\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xee\x8b'\
-b'\xe6\x6b\xe6\x6b\xee\x8b\xe6\x6b\xee\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xde\x29\xde\x09\xd5\x87\xa3\x41\xa3\x81\xd5\xa7\xdd\xe8'\
-b'\xdd\xe8\xdd\xe7\xdd\xa7\xd5\x86\xcd\x26\xc4\xc5\xbc\x64\xab\xe3'\
-b'\xab\xa2\xa3\x82\xa3\x82\xab\xc2\xbc\x24\xc4\xa5\xcd\x26\xd5\xa7'\
-b'\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xe6\x09\xd5\xa7\xa3\x82\xa3\x61\xd5\xa7\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xee\x6b\xe6\x8b\xee\x8b\xe6\x6c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xe6\x8b\xee\x8b\xee\x8c\xee\x8b\xe6\x6b\xee\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8'\
-b'\xb4\x03\x9b\x21\xcd\x26\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xee\x8c\xee\x8c'\
-b'\xe6\x4a\xd5\x88\xbc\x64\xa3\x82\xab\xc2\xbc\xa5\xd5\xa8\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x8b\xee\x6c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8b\xee\x6c'\
-b'\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xde\x29\xd5\x87'\
-b'\xbc\x64\xa3\x82\xab\xa2\xc4\xc5\xd5\xa7\xde\x09\xde\x09\xde\x08'\
-b'\xdd\xc8\xcd\x67\xc4\xc5\xb4\x03\xa3\x82\xa3\x61\xab\xc3\xbc\x84'\
-b'\xcd\x46\xdd\xc8\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xdd\xe9\xc4\xc5\xa3\x82'\
-b'\xab\xa2\xc4\xe5\xdd\xc7\xe6\x09\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x6b\xe6\x6b\xe6\x4a\xe6\x09\xcd\x26\xa3\xa2\xab\x82\xc4\xe5'\
-b'\xdd\xc7\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x29\xdd\xe8\xdd\xc8'\
-b'\xd5\x66\xcd\x05\xbc\x84\xb3\xe2\xa3\x81\xa3\x62\xab\xa2\xb4\x23'\
-b'\xc4\xc5\xd5\x67\xd5\x46\xab\xc2\xa3\xa2\xcd\x25\xdd\xe8\xde\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x8b\xee\x8b\xe6\x8c\xe6\x8c'\
-b'\xee\x8c\xee\xac\xe6\xad\xee\xac\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xe6\xad\xee\xad\xee\xad\xee\x8d\xee\xac\xe6\x8c\xee\x6b\xe6\x6a'\
-b'\xdd\xe8\xab\xe3\xa3\x61\xcd\x26\xe6\x09\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xee\x8b\xe6\x8b\xee\x6c\xe6\x8b\xee\x8b\xe6\x6b\xee\x6b'\
-b'\xe6\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xde\x29\xde\x08\xdd\xe8\xdd\x87\xb4\x03'\
-b'\x9b\x01\xbc\x43\xbc\x84\xb4\x03\xab\xa2\xa3\x81\xa3\x81\xab\xa2'\
-b'\xb4\x23\xc4\xa5\xcd\x47\xdd\xc8\xe6\x09\xe6\x4a\xe6\x6b\xe6\x8b'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8b'\
-b'\xe6\x8c\xee\x6b\xe6\x6b\xe6\x6a\xe6\x2a\xc4\xe5\x93\x00\xbc\x64'\
-b'\xde\x29\xe6\x4b\xe6\x8b\xee\x8b\xe6\x8b\xee\x8b\xe6\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xe6\x8b\xee\x8c\xe6\x8c\xee\x8c\xee\x8b'\
-b'\xee\x8c\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xd5\x87\x9b\x41\xa3\x82\xdd\xa7\xe6\x09'\
-b'\xe6\x29\xe6\x29\xe6\x2a\xe6\x29\xde\x29\xe6\x09\xde\x08\xdd\xe8'\
-b'\xdd\xa7\xd5\x66\xcd\x25\xc4\xa4\xb4\x43\xab\xe2\xab\x82\xa3\x82'\
-b'\xab\xa2\xb3\xe3\xbc\x64\xc4\xc5\xcd\x46\xd5\xa8\xdd\xe8\xde\x08'\
-b'\xde\x09\xdd\xe8\xb4\x23\x9b\x00\xcc\xe6\xe6\x29\xe6\x4a\xe6\x4b'\
-b'\xe6\x6b\xe6\x8b\xee\x8c\xee\x8b\xe6\x8b\xee\x6c\xee\x8b\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x6b\xe6\x8b'\
-b'\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xde\x29'\
-b'\xcd\x66\x9b\x41\xab\xe3\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xee\x8b\xee\x8c\xe6\xad\xee\xad\xee\xad'\
-b'\xb4\x03\xa3\x82\xab\xe3\xcd\x05\xdd\xe8\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b'\
-b'\xe6\x8c\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x29\xd5\x87\xbc\x64\xa3\x62'\
-b'\xab\xa2\xc4\xc5\xd5\xc7\xe6\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x29'\
-b'\xe6\x29\xe6\x29\xde\x29\xdd\xe8\xd5\xa7\xcd\x06\xbc\x64\xab\xc2'\
-b'\xa3\x61\xa3\xa2\xb4\x24\xc4\xe5\xd5\x88\xe6\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x09\xcd\x06\xab\xc2\xa3\x61\xbc\x84'\
-b'\xd5\x86\xde\x08\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x8b\xee\x6b\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\xac\xe6\xac\xee\xac\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b\xe6\x8b'\
-b'\xe6\x6b\xe6\x4a\xdd\xe8\xbc\x64\xa3\x61\xb4\x03\xd5\x66\xde\x08'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a'\
-b'\xe6\x6b\xe6\x6a\xe6\x4b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xde\x09\xde\x08\xdd\xc8\xd5\x87\xcd\x05\xbc\x84\xb4\x03'\
-b'\xa3\x82\x9b\x41\x9b\x21\x9b\x01\xb4\x02\xcd\x05\xd5\x87\xdd\xe8'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xee\x6b\xe6\x6b\xee\x8c\xe6\x8c'\
-b'\xee\xad\xee\xac\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xe6\xac\xee\xac\xe6\x8c\xe6\x6b\xe6\x6b\xdd\xe9'\
-b'\xb4\x23\xa3\x21\xc4\xe5\xde\x08\xe6\x4a\xe6\x6a\xe6\x6b\xee\x6b'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xcd\x25\x9b\x21'\
-b'\xab\xe2\xd5\xa7\xdd\xc7\xdd\xc7\xd5\xa7\xd5\x46\xcd\x05\xbc\x84'\
-b'\xb4\x03\xab\xa2\xa3\x81\xa3\x82\xab\xc2\xb4\x44\xc4\xc5\xcd\x47'\
-b'\xdd\xc8\xe6\x09\xe6\x4a\xe6\x6a\xe6\x8b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x09\xb4\x23\x9b\x01\xcd\x26'\
-b'\xe6\x2a\xe6\x6a\xee\x6b\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8b'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\x8b\xee\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xd5\x87\xa3\x41\xa3\x82\xdd\xc7\xde\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xde\x29\xe6\x09\xde\x09\xdd\xc8\xd5\xa7\xd5\x46'\
-b'\xc4\xe5\xbc\x84\xb4\x03\xab\xa2\xa3\x82\xab\x82\xab\xa2\xb4\x03'\
-b'\xbc\x64\xc4\xc5\xbc\x43\x92\xe0\xb4\x44\xdd\xe8\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b'\
-b'\xe6\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8b\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x09\xbc\x44\x9b\x00\xc4\xc5\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xee\x8b\xee\x8c\xe6\xac\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xcd'\
-b'\xbc\x64\xd5\x67\xde\x09\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\xac\xee\x8c\xe6\x8c\xee\x8c\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x2a\xd5\x88\xbc\x64\xa3\x82\xab\xa2\xc4\xe5'\
-b'\xdd\xc8\xde\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xdd\xc8'\
-b'\xcd\x66\xc4\xa5\xb3\xe3\xa3\x81\xa3\x61\xab\xc3\xbc\x84\xcd\x46'\
-b'\xdd\xc8\xdd\xe8\xd5\x67\xb4\x03\x9b\x61\xb4\x03\xd5\x46\xdd\xe8'\
-b'\xe6\x09\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\xac\xee\xac\xee\x8d'\
-b'\xe6\x8c\xee\x8d\xee\xac\xe6\x8c\xee\x8c\xee\x8c\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xd5\x47\xab\xc2\xa3\x82\xbc\xa4\xdd\xc7\xde\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x08\xdd\xe8\xdd\x86'\
-b'\xbc\x83\x9b\x21\xab\xc2\xb4\x03\xa3\xa2\xa3\x61\xa3\x82\xab\xe3'\
-b'\xbc\x84\xcd\x26\xd5\xa8\xe6\x09\xe6\x4a\xe6\x6a\xe6\x6b\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\xac\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xcd'\
-b'\xee\xad\xe6\xac\xee\x8c\xee\x8c\xe6\x8c\xe6\x6b\xe6\x29\xbc\x64'\
-b'\x9b\x21\xc4\xa4\xdd\xe8\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c'\
-b'\xe6\x8c\xee\xac\xee\xac\xee\xad\xe6\xac\xee\xac\xee\xad\xe6\xac'\
-b'\xee\xac\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8b\xee\x8b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xdd\xc8\xab\xe3\x9b\x21'\
-b'\xcd\x26\xe6\x08\xe6\x29\xe6\x29\xe6\x29\xde\x09\xe6\x09\xde\x08'\
-b'\xdd\xc7\xd5\xa7\xd5\x66\xc4\xe5\xbc\x64\xb4\x02\xab\xa2\xa3\x81'\
-b'\xa3\x82\xab\xc2\xb4\x44\xc4\xc5\xcd\x47\xdd\xc8\xde\x09\xe6\x4a'\
-b'\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x29\xdd\xa7\xa3\x82\xa3\x61\xd5\xa7'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\xac\xee\xad\xe6\xac\xee\xac\xee\xad\xee\xad\xe6\xac'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xe6\x8c\xe6\x8c\xee\x8b\xee\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x29\xd5\x87\x9b\x41\xa3\x82\xdd\xc8\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6a'\
-b'\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xe6\x29\xde\x29\xdd\xe8\xdd\xc8\xd5\x87\xcd\x25\xc4\xc5\xb4\x43'\
-b'\xab\xe2\xab\xa2\xa3\x41\x92\xe0\x9b\x41\xb4\x23\xbc\x85\xcd\x26'\
-b'\xd5\x87\xdd\xe8\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xee\x8c\xe6\x8b\xe6\x8c\xee\x8c\xe6\x6b\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xd5\xa7\xa3\x62\xa3\x82\xd5\xc7\xe6\x4a\xe6\x6b\xee\x8c'\
-b'\xee\x8c\xe6\xac\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xae\xee\xcd'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\x8b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x8b\xee\x8b\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\xac'\
-b'\xee\xac\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xd5\xa7\xbc\x64\xa3\x61\xab\xc2\xc4\xc5\xdd\xc8\xde\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xde\x29\xdd\xe8\xd5\x87\xc5\x05\xb4\x43\xab\x82\xa3\x41'\
-b'\xa3\x82\xab\xc2\x9b\x21\xa3\x61\xc4\xc4\xdd\xa7\xde\x08\xde\x09'\
-b'\xde\x29\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\xac'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x6b\xe6\x6a\xdd\xe9'\
-b'\xbc\xa5\xa3\x61\xab\xe2\xcd\x46\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xee\x8b\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8b\xe6\x8c\xee\x8b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xdd\xe8\xc4\xa5'\
-b'\xa3\x41\xb4\x23\xd5\x86\xdd\xa7\xd5\x87\xcd\x46\xc4\xa4\xb4\x23'\
-b'\xab\xa2\xa3\x61\xa3\x82\xab\xe2\xbc\x64\xcd\x06\xd5\xa8\xde\x29'\
-b'\xe6\x4a\xe6\x6b\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xee\xac\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xe6\x8c\xe6\x6b\xe6\x29\xc4\xc5\x9b\x21'\
-b'\xbc\x63\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x6b\xee\x6b\xee\x8c\xe6\x8c'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xac\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x29\xc4\xe5\x9b\x00\xb4\x43'\
-b'\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x29\xe6\x29\xdd\xe8\xdd\xc8\xd5\xa7\xcd\x46'\
-b'\xcc\xc5\xbc\x63\xb3\xe2\xa3\xa2\xa3\x61\xa3\x82\xab\xc2\xbc\x44'\
-b'\xc4\xc5\xd5\x47\xd5\xa8\xdd\xe8\xcd\x05\x93\x01\xb4\x03\xdd\xe8'\
-b'\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c\xee\x8c\xee\x8c\xee\x8c'\
-b'\xee\xac\xee\xac\xee\xad\xee\x8d\xee\xac\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xe6\xac\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x8b\xee\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xd5\x87\xa3\x41\xa3\x82\xdd\xc8\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6a\xe6\x4b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x49\xe6\x29\xe6\x09\xde\x08'\
-b'\xdd\xe8\xd5\x87\xcd\x26\xab\xa2\x92\xe0\xab\xa2\xab\xc2\xa3\x82'\
-b'\xa3\x61\xab\xa2\xab\xe3\xbc\x44\xc4\xe6\xcd\x47\xdd\xc8\xde\x29'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x6c'\
-b'\xee\x8c\xe6\x8b\xe6\x6c\xe6\x6b\xee\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xde\x09\xc4\xc4\x9b\x01\xbc\x64\xe6\x29\xe6\x6b\xe6\x8c'\
-b'\xee\x8c\xee\xad\xee\xad\xee\xad\xe6\xcd\xee\xae\xee\xcd\xee\xce'\
-b'\xee\xad\xee\xad\xee\xad\xe6\xac\xee\x8c\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\xac\xee\x8d\xee\x8d'\
-b'\xe6\xad\xee\xac\xe6\x8c\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xd5\x87'\
-b'\xbc\x44\xa3\x61\xab\xa2\xc4\xe5\xdd\xc8\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xd5\x46\xb4\x03'\
-b'\x93\x00\x9b\x41\xa3\x41\x9b\x41\xab\xa2\xbc\x64\xcd\x26\xd5\xa7'\
-b'\xe6\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x8c\xe6\x8b\xe6\x8c\xee\x8c\xe6\x8c\xee\xac\xee\x8c\xe6\x8c'\
-b'\xee\xac\xe6\x8c\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xd5\x67\xab\xe3'\
-b'\xa3\x41\xbc\x84\xdd\xa7\xe6\x09\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x8b\xee\x8c\xe6\x8c\xee\xac\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xe6\xac\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b\xe6\x8b\xe6\x8b'\
-b'\xee\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xdd\xe8\xbc\x64\x9b\x41'\
-b'\xbc\x64\xdd\xc7\xe6\x09\xe6\x29\xe6\x29\xe6\x09\xde\x08\xdd\xe8'\
-b'\xdd\xa7\xd5\x66\xc4\xe5\xbc\x43\xab\xc2\xa3\x62\xa3\x61\xab\xc2'\
-b'\xbc\x44\xc4\xe6\xd5\x87\xde\x09\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x8c'\
-b'\xe6\x8b\xe6\x8c\xee\x6b\xe6\x6b\xe6\x49\xcd\x06\x9b\x21\xb4\x03'\
-b'\xdd\xa7\xde\x29\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c\xee\xac\xee\xad'\
-b'\xee\xad\xee\xad\xe6\xad\xee\xcd\xee\xae\xee\xcd\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xac\xe6\xac\xee\xac\xee\x8c'\
-b'\xe6\x8c\xe6\x6b\xe6\x6a\xe6\x4a\xd5\xa8\xa3\x82\xa3\x62\xd5\x87'\
-b'\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xe8\xdd\xc7\xd5\x87\xcd\x46\xc4\xc4\xbc\x43\xab\xe2'\
-b'\xa3\x82\xa3\x61\xa3\x81\xab\xc2\xa3\x82\x92\xe0\xb4\x23\xd5\x87'\
-b'\xde\x08\xe6\x2a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xe6\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\xad\xee\xad\xe6\xac\xee\xad\xe6\xad\xee\xad'\
-b'\xee\xad\xee\xac\xe6\x8c\xee\xad\xe6\xac\xee\x8c\xee\x8c\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x2a\xd5\x87\x9b\x41\xa3\x82\xdd\xc7\xe6\x2a'\
-b'\xe6\x6a\xe6\x6b\xe6\x6b\xee\x6b\xee\x6b\xe6\x8b\xee\x6b\xee\x6b'\
-b'\xee\x8b\xee\x6b\xe6\x6b\xee\x8b\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xe6\x09\xdd\xe8\xbc\x84\x92\xe0\xbc\x64\xdd\xa7\xd5\x86'\
-b'\xcd\x46\xc4\xe5\xbc\x64\xb4\x03\xab\xa2\xa3\x81\xa3\x82\xab\xc2'\
-b'\xb4\x03\xbc\x85\xcd\x06\xd5\x87\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xe6\x6b\xee\x6a\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x49\xe6\x29\xd5\xc8\xab\xa2\x9b\x41\xd5\x67\xe6\x4a\xe6\x8b'\
-b'\xee\x8c\xe6\xac\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xac'\
-b'\xee\x8c\xee\x8c\xee\x8d\xee\xad\xe6\x8c\xee\xad\xee\xac\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x6b\xe6\x6b\xe6\x4a\xd5\x88\xbc\x44\xa3\x61'\
-b'\xab\xc2\xc4\xe6\xdd\xc8\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x8b\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xdd\xe8\xcd\x05\xab\xa2\xa3\x61'\
-b'\xb4\x44\xd5\x46\xd5\x66\xc4\xe5\xb4\x43\xa3\x82\xa3\x41\xa3\x82'\
-b'\xb4\x03\xc4\xe5\xd5\x87\xdd\xe9\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x8b\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\x6b\xe6\x6b\xe6\x09\xc4\xc5\xa3\x61\xab\xc2'\
-b'\xcd\x25\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xac\xe6\xac'\
-b'\xee\xac\xee\xad\xee\xac\xee\x8c\xee\xac\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xe6\x6b\xe6\x6b\xe6\x4a\xdd\xc8\xb4\x03\x9b\x41\xc4\xc4'\
-b'\xdd\xc8\xde\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xe6\x29\xde\x09\xde\x08\xdd\xc8\xd5\x66\xc5\x05\xbc\x64'\
-b'\xab\xe2\xa3\x81\xa3\x61\xab\xa2\xb4\x23\xc4\xc5\xd5\x67\xdd\xe9'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xcd\x26\x9b\x41\xab\xc2\xd5\x87'\
-b'\xde\x09\xe6\x4a\xe6\x4a\xe6\x6b\xee\x6b\xe6\x8c\xee\xad\xe6\xad'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xcd\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xcd\xee\xcd\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xac'\
-b'\xee\x8c\xee\x6c\xe6\x6b\xe6\x29\xbc\x64\x9b\x00\xc4\xa4\xde\x09'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8c\xee\x8b\xe6\x6b'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x09\xde\x09\xdd\xe8\xdd\xc7'\
-b'\xd5\x66\xcd\x25\xc4\xa4\xb4\x03\x9b\x01\x92\xe0\xa3\x41\xa3\x62'\
-b'\xab\xc2\xbc\x44\xc4\xc5\xd5\x67\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x6b'\
-b'\xee\x8b\xe6\x8b\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\xac'\
-b'\xee\xac\xe6\x8c\xee\x8c\xee\xad\xee\x8c\xe6\x8c\xe6\x8c\xee\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xd5\x67\x9b\x41\xa3\x81\xdd\xc8\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c'\
-b'\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8b\xee\x8c'\
-b'\xee\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xde\x09\xcd\x26\x9b\x00\xab\xc2\xdd\xc7\xde\x09'\
-b'\xe6\x09\xe6\x09\xde\x09\xde\x08\xdd\xc8\xd5\x87\xcd\x26\xc4\xc5'\
-b'\xbc\x44\xab\xe2\xab\xa2\xa3\x61\xa3\x82\xab\xc2\xb4\x44\xc4\xc5'\
-b'\xcd\x26\xd5\xa8\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xde\x29\xe6\x09\xc5\x05\x9b\x01\xb4\x03\xde\x09\xe6\x6b'\
-b'\xee\x8b\xee\x8c\xe6\xad\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xad'\
-b'\xee\xad\xee\xcd\xee\xad\xee\xad\xee\xcd\xee\xad\xe6\xad\xee\xad'\
-b'\xee\xad\xe6\xac\xee\xad\xee\xac\xe6\x8c\xee\xac\xee\x8c\xe6\x8c'\
-b'\xe6\x8b\xe6\x6b\xe6\x4a\xd5\x87\xbc\x44\xa3\x61\xab\xc2\xc4\xe5'\
-b'\xdd\xc8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8b\xee\x8c\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xde\x09\xd5\x66\xb4\x03\x9b\x41\xac\x03\xcd\x26'\
-b'\xdd\xe8\xde\x08\xe6\x09\xe6\x09\xde\x08\xdd\xc7\xcd\x46\xbc\x84'\
-b'\xab\xe2\xa3\x61\xa3\x61\xab\xc2\xbc\x64\xcd\x46\xdd\xc8\xe6\x29'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x8c\xe6\x8b\xee\x8c'\
-b'\xe6\x8b\xe6\x6b\xe6\x4a\xd5\xa7\xb4\x03\xa3\x41\xb4\x43\xd5\x87'\
-b'\xe6\x09\xe6\x29\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c'\
-b'\xee\x8c\xe6\xac\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xe6\xad\xee\xad\xe6\xad\xee\xac\xe6\xad\xee\x8d\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x6b\xe6\x6a\xd5\xa8\xab\xc2\xa3\x61\xc5\x05\xdd\xe8'\
-b'\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b\xe6\x6a'\
-b'\xe6\x4b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x09\xde\x08'\
-b'\xdd\xc8\xd5\x67\xcd\x05\xbc\x84\xb3\xe3\xa3\x82\xa3\x61\xa3\x82'\
-b'\xb4\x03\xbc\x84\xcd\x26\xcd\x26\xa3\x62\xa3\x81\xd5\x46\xde\x08'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xee\x8c\xee\x8c\xee\xac\xee\xad'\
-b'\xee\xad\xee\xcd\xee\xad\xe6\xad\xee\xce\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xe6\xad\xee\xad\xee\xad\xe6\xad'\
-b'\xee\x8c\xe6\x8b\xe6\x4a\xd5\x67\x9b\x41\xa3\xa2\xdd\xc8\xe6\x4a'\
-b'\xe6\x6b\xee\x6b\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xee\x8b\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x2a\xe6\x29'\
-b'\xde\x09\xdd\xe8\xdd\xc7\xcd\x25\x9b\x21\xa3\x81\xc4\xe4\xc4\xa4'\
-b'\xb4\x43\xab\xc2\xa3\x81\xa3\x61\xa3\x82\xab\xe3\xbc\x64\xc4\xe6'\
-b'\xd5\x67\xdd\xe8\xde\x2a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x8b\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xd5\x87\x9b\x21\xa3\x82\xdd\xc8\xe6\x4a'\
-b'\xe6\x6b\xee\x6b\xe6\x8c\xee\x8c\xee\xac\xee\xad\xee\xac\xee\xad'\
-b'\xee\x8c\xee\xad\xee\xac\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xe6\x8b\xee\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xd5\xa7\xa3\x82\x9b\x41\xd5\x67\xde\x09'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x4a\xe6\x49\xe6\x29'\
-b'\xde\x29\xdd\xe9\xdd\xc8\xd5\x87\xcd\x06\xbc\xa4\xb4\x23\xab\xc2'\
-b'\xa3\x82\xa3\x61\xab\xa2\xab\xe3\xbc\x64\xc4\xe5\xcd\x46\xd5\xa7'\
-b'\xdd\xe8\xdd\xe8\xde\x08\xdd\xc8\xb4\x03\x9b\x00\xcd\x06\xe6\x4a'\
-b'\xe6\x6b\xe6\x8b\xee\x8c\xe6\x8c\xee\xad\xe6\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xe6\x8c\xee\x8c\xee\x8d\xe6\x8c\xe6\x8b\xe6\x6b'\
-b'\xe6\x2a\xd5\x87\xb4\x44\xa3\x61\xab\xa2\xc4\xe5\xdd\xc8\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8b'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xee\x8c\xee\xad\xee\xac'\
-b'\xee\x8c\xee\xac\xee\x8c\xe6\x8c\xe6\x6b\xee\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xdd\xa8\xbc\x84\xa3\x61\xa3\xa2\xc4\xe5\xdd\xc8\xe6\x09'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x2a\xe6\x29\xde\x09'\
-b'\xdd\xe8\xd5\x87\xc4\xe5\xb4\x24\xa3\xa2\xa3\x41\xa3\x82\xb4\x03'\
-b'\xc4\xe5\xd5\x87\xde\x09\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x29\xc4\xe6\xa3\x62\xa3\x81\xc4\xe5\xdd\xc8\xe6\x09'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xcd\xe6\xcd\xee\xce'\
-b'\xee\xad\xee\xad\xee\xad\xe6\xac\xee\xac\xee\xac\xe6\x8c\xee\x8c'\
-b'\xe6\x8b\xe6\x4a\xd5\x67\xa3\xa2\xab\x82\xcd\x26\xe6\x08\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xde\x29\xdd\xe8\xdd\xc7\xd5\x86\xcd\x05\xbc\x84'\
-b'\xb4\x03\xa3\x81\x9b\x41\x9b\x21\x92\xe0\xab\xc2\xc4\xc5\xd5\x67'\
-b'\xdd\xe8\xe6\x29\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c\xe6\x8c\xee\xad'\
-b'\xe6\xad\xee\xad\xee\xcd\xee\xad\xee\xce\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xcd\xee\xad\xee\xad\xe6\xac'\
-b'\xee\x8c\xe6\x6b\xde\x09\xb4\x23\x9b\x01\xc5\x05\xe6\x29\xe6\x4a'\
-b'\xe6\x6b\xe6\x8c\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad'\
-b'\xee\xad\xe6\xac\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xde\x08\xbc\x84\x92\xe0\xbc\x44\xdd\xc7\xdd\xc8'\
-b'\xdd\xc7\xd5\xa7\xd5\x66\xcd\x05\xc4\xa4\xb4\x23\xab\xc2\xa3\x81'\
-b'\xa3\x61\xa3\x82\xab\xe3\xbc\x64\xcd\x06\xd5\x87\xdd\xe9\xe6\x2a'\
-b'\xe6\x4a\xe6\x6b\xee\x6b\xe6\x6b\xe6\x8b\xee\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xd5\x66\x9b\x21\xa3\x62\xdd\xc8\xe6\x4a'\
-b'\xe6\x6b\xe6\x8b\xee\x8c\xee\x8c\xe6\xac\xee\xad\xee\xad\xe6\xad'\
-b'\xee\xad\xee\xad\xe6\xad\xee\xad\xe6\xac\xee\xac\xee\xac\xee\x8c'\
-b'\xee\xac\xee\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4b\xe6\x4a\xe6\x29\xdd\xe8\xb4\x23\x92\xe0\xc4\xc5\xe6\x29'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x2a\xe6\x29\xdd\xe9'\
-b'\xdd\xa8\xd5\x67\xc4\xe5\xbc\x64\xb4\x03\xab\xa2\xa3\x62\xa3\x82'\
-b'\xab\xa2\xb4\x03\xbc\x64\xc4\xe5\xbc\x84\x9b\x01\xa3\xa2\xdd\xc7'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c\xee\xac\xe6\xad'\
-b'\xe6\x4a\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c\xee\xac\xe6\x8c\xee\xac'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x8c\xe6\x6b\xe6\x2a\xd5\x87'\
-b'\xb4\x44\xa3\x61\xab\xa2\xc4\xe6\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\xac\xe6\xac\xee\xad\xe6\xad\xee\xad\xe6\xad'\
-b'\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xde\x09'\
-b'\xc4\xe5\xa3\x82\xa3\x61\xbc\x84\xdd\xa7\xe6\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xde\x08\xdd\xa8\xcd\x46\xbc\x84\xab\xc2'\
-b'\xa3\x62\xa3\x41\xab\xc2\xbc\x64\xcd\x26\xdd\xa8\xe6\x09\xe6\x29'\
-b'\xd5\xa7\xb4\x24\xa3\x41\xb4\x03\xd5\x66\xdd\xe8\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8b\xe6\x8c\xee\x8c\xee\xad'\
-b'\xe6\xad\xee\xac\xe6\xad\xee\xad\xee\xcd\xee\xce\xee\xcd\xee\xad'\
-b'\xee\xce\xee\xcd\xee\xad\xee\xad\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8b'\
-b'\xe6\x4a\xcd\x26\xa3\x62\xab\xc2\xd5\x66\xde\x08\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xee\x8c\xe6\x8c\xee\x8b\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xee\x8c\xee\x8c\xee\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8'\
-b'\xdd\xa7\xcd\x25\xa3\x61\x9b\x21\xb3\xe2\xab\xa2\xa3\x61\xa3\x61'\
-b'\xab\xa2\xb4\x44\xc5\x06\xd5\x87\xde\x09\xe6\x4a\xe6\x6b\xee\x8b'\
-b'\xee\x8c\xe6\xac\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xad\xee\xad\xee\xad\xee\xce\xee\xad\xe6\xad\xee\xac'\
-b'\xe6\x8b\xe6\x4a\xcd\x06\x9b\x01\xb4\x03\xdd\xe8\xe6\x4a\xe6\x6b'\
-b'\xee\x8c\xee\x8c\xe6\xad\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xad'\
-b'\xee\xad\xee\xac\xee\xad\xee\xad\xe6\xad\xee\xac\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xdd\xe8\xb3\xe3\x9b\x01\xc5\x05\xde\x09\xe6\x29'\
-b'\xe6\x29\xe6\x29\xe6\x2a\xde\x09\xde\x08\xdd\xe8\xdd\xa7\xd5\x66'\
-b'\xcd\x05\xc4\xa4\xb4\x23\xab\xc2\xa3\x61\xa3\x61\xa3\x82\xab\xe3'\
-b'\xbc\x64\xcd\x06\xd5\x88\xdd\xe9\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6a'\
-b'\xe6\x4a\xe6\x4a\xde\x09\xd5\x66\x9b\x21\xa3\x81\xdd\xc8\xe6\x4a'\
-b'\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c\xee\xad\xe6\xac\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xad\xe6\x8c\xe6\x8d\xe6\xac'\
-b'\xee\xad\xe6\xad\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xee\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xde\x09\xc4\xc5\x9a\xe0\xb4\x23\xdd\xe8'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4b\xe6\x6a\xe6\x4a\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8\xd5\x87\xcd\x26'\
-b'\xc4\xc5\xb4\x23\xab\xc2\xa3\x82\xa3\x61\x9b\x00\x92\xe0\xab\xe3'\
-b'\xc4\xa5\xcd\x26\xd5\xa8\xde\x09\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b'\
-b'\xb4\x24\xcd\x06\xdd\xc8\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x2a\xd5\x67\xb4\x23\xa3\x61'\
-b'\xab\xa2\xc4\xe5\xdd\xc8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xe6\xac\xee\x8c\xee\x8d\xee\xad\xee\xac\xee\xad\xee\xad\xee\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x2a\xcd\x47\xab\xc2'\
-b'\xa3\x41\xb4\x23\xd5\x67\xde\x09\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xdd\xe8'\
-b'\xd5\x66\xc4\xe5\xb4\x23\xa3\x82\x9b\x41\xa3\x81\xb4\x03\xbc\x84'\
-b'\xa3\x82\xa3\x41\xc4\xa4\xd5\x86\xdd\xe8\xe6\x29\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c\xee\xad\xee\xad'\
-b'\xee\xac\xee\xad\xee\xad\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xad\xee\xad\xe6\xad\xee\xac\xee\xad\xee\x8c\xe6\x8b\xe6\x2a'\
-b'\xc4\xe6\xa3\x41\xb4\x03\xd5\x86\xe6\x09\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x8c\xee\xac\xe6\x8c\xee\x8c\xe6\xac\xee\xad\xee\xac'\
-b'\xe6\xac\xe6\xac\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29'\
-b'\xdd\xc7\xb4\x03\x9b\x21\xbc\x84\xd5\x86\xd5\x86\xcd\x26\xc4\xc4'\
-b'\xb4\x43\xab\xa2\xa3\x61\xa3\x61\xab\xa2\xb4\x44\xc4\xe6\xd5\x88'\
-b'\xde\x09\xe6\x4a\xe6\x6b\xe6\x8c\xee\x8c\xee\xac\xe6\xad\xee\xad'\
-b'\xee\xad\xee\xad\xe6\xcd\xee\xad\xee\xad\xe6\xad\xee\xac\xe6\x8c'\
-b'\xe6\x6b\xdd\xc8\xab\xa2\x9b\x41\xcd\x46\xe6\x29\xe6\x4b\xe6\x8b'\
-b'\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xcd\xee\xcd\xee\xcd\xee\xce'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad'\
-b'\xe6\xad\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xd5\x87\x9b\x41\xa3\x61\xd5\x87\xe6\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29'\
-b'\xde\x29\xde\x09\xdd\xe8\xdd\xa7\xd5\x66\xcd\x05\xbc\x84\xb4\x23'\
-b'\xab\xc2\xa3\x61\xa3\x61\xa3\x82\xab\xe2\xbc\x84\xcd\x06\xd5\x67'\
-b'\xdd\xc8\xdd\xe9\xde\x08\xd5\x46\x9b\x21\xa3\x62\xd5\xa7\xe6\x4a'\
-b'\xe6\x6b\xe6\x8b\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\xad\xee\xad'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xac\xee\xad'\
-b'\xee\xac\xee\x8c\xee\xad\xe6\xac\xee\x8c\xe6\x8c\xe6\x6c\xee\x8b'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xd5\x66\x9b\x41\xa3\x62\xd5\xa8'\
-b'\xe6\x49\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x29\xde\x29\xdd\xe8\xdd\xa8\xcd\x46\xc4\xc5\xa3\x61\x92\xe0'\
-b'\xa3\x41\xa3\x82\xa3\x61\xab\xa2\xb4\x03\xbc\x64\xc5\x06\xd5\x67'\
-b'\xa3\x61\x9b\x01\x9b\x61\xb4\x23\xcd\x06\xdd\xe8\xe6\x2a\xe6\x6a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xd5\x67\xb4\x23\xa3\x41\xab\xc2\xc4\xe5'\
-b'\xdd\xc8\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x8b\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\xac'\
-b'\xee\xad\xee\xad\xe6\xad\xee\xad\xe6\xad\xee\xad\xe6\xac\xee\x8d'\
-b'\xe6\xac\xee\x8c\xe6\x6b\xe6\x4a\xd5\x88\xb4\x23\xa3\x41\xab\xe2'\
-b'\xcd\x26\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x6b\xee\x8b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xde\x29\xde\x09\xdd\xc8\xd5\x86\xcd\x05\xb4\x03\x9b\x00\x92\xe0'\
-b'\x92\xe0\xa3\x41\xb4\x23\xcd\x05\xd5\xa7\xdd\xe8\xde\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x8c\xe6\x8c\xe6\x8c\xee\xac'\
-b'\xee\xad\xee\xad\xee\xad\xe6\xcd\xee\xad\xee\xcd\xee\xce\xee\xcd'\
-b'\xee\xad\xee\xad\xee\xad\xe6\xad\xee\x8c\xe6\x8b\xde\x09\xbc\x85'\
-b'\x9b\x41\xbc\x43\xd5\xa7\xde\x29\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b'\
-b'\xe6\x8c\xee\xac\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xad'\
-b'\xee\xae\xee\xad\xee\xad\xee\xac\xee\xad\xee\xac\xee\xac\xee\xac'\
-b'\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b\xee\x6b\xe6\x4a\xe6\x4a\xdd\xe8'\
-b'\xbc\x64\x9b\x01\xb4\x43\xdd\xc7\xe6\x09\xe6\x09\xde\x09\xde\x09'\
-b'\xdd\xe8\xdd\xa7\xd5\x66\xc4\xe5\xbc\x43\xab\xc2\xa3\x61\xa3\x41'\
-b'\xa3\x82\xb4\x23\xc4\xc5\xd5\x67\xdd\xe9\xe6\x4a\xe6\x6b\xee\x8c'\
-b'\xe6\x8c\xee\xac\xee\xad\xe6\xac\xee\x8c\xee\x8c\xe6\x8c\xe6\x6b'\
-b'\xe6\x4a\xc4\xa5\x92\xe0\xbc\x44\xde\x09\xe6\x4a\xe6\x6b\xee\x8c'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xce\xee\xce\xee\xae\xe6\xce\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xce\xe6\xce\xee\xad\xee\xad\xee\xad\xee\xcd'\
-b'\xee\xad\xee\xad\xee\xac\xe6\x8c\xee\xac\xee\x8c\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x2a\xcc\xe6\x93\x00\xb4\x03\xde\x09\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xde\x29\xde\x08\xdd\xe8'\
-b'\xdd\xa7\xd5\x66\xcd\x05\xbc\x84\xb4\x23\xab\xa2\xa3\x61\xa3\x61'\
-b'\xa3\x82\xab\xe3\xbc\x64\xbc\x64\x9b\x00\xa3\x61\xd5\x87\xe6\x29'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c\xee\xac\xee\xad'\
-b'\xe6\xac\xee\xad\xee\xad\xe6\xac\xe6\xac\xee\xad\xee\xad\xee\xad'\
-b'\xe6\xad\xee\xad\xee\xad\xee\xad\xe6\xac\xee\x8c\xee\x8c\xe6\x8b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x29\xdd\xc8\xab\xc2\x93\x00\xcd\x26'\
-b'\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x8b\xee\x6b\xee\x6b\xee\x8b\xe6\x8c'\
-b'\xee\x8c\xe6\x8b\xee\x8b\xee\x8c\xe6\x6b\xee\x8b\xee\x8b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xde\x08\xbc\xa5\x92\xe0'\
-b'\xb4\x03\xcd\x46\xcd\x26\xc4\xc5\xb4\x44\xab\xe3\xab\x82\xa3\x82'\
-b'\xdd\xa8\xc4\xe6\xab\xe3\x9b\x41\x9b\x01\xa3\x62\xb4\x44\xcd\x26'\
-b'\xdd\xc8\xcd\x47\xb4\x23\xa3\x41\xa3\xa2\xc4\xe5\xdd\xc8\xde\x09'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\xac\xee\xac\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xac\xee\x8c\xe6\x8c'\
-b'\xe6\x6b\xe6\x6b\xdd\xe8\xbc\x85\xa3\x61\xa3\xa2\xc4\xc5\xdd\xc8'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x8b\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xe6\x09\xdd\xe8\xcd\x05\xa3\xa2\xa3\x41\xbc\x64'\
-b'\xc4\xa4\xb4\x03\xa3\x82\x9b\x41\xa3\x61\xb4\x03\xc4\xc5\xd5\x87'\
-b'\xdd\xe9\xe6\x49\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b\xee\x8b\xe6\x8c'\
-b'\xee\xad\xee\xad\xe6\xcd\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xad'\
-b'\xee\xad\xe6\xad\xee\xac\xee\x8c\xe6\x8b\xdd\xe9\xb4\x44\xa3\x41'\
-b'\xbc\x84\xdd\xc7\xe6\x29\xe6\x4a\xe6\x6b\xee\x6b\xee\x8c\xee\x8c'\
-b'\xee\xac\xe6\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xe6\xad\xee\xad\xe6\xad\xee\xad\xee\xad'\
-b'\xe6\xac\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xde\x09\xc4\xa5'\
-b'\x9b\x21\xb4\x03\xdd\xa7\xde\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xdd\xc7\xd5\x66\xcd\x05'\
-b'\xbc\x64\xab\xe2\xa3\x82\xa3\x41\xa3\x82\xac\x03\xbc\xa5\xcd\x47'\
-b'\xdd\xc8\xde\x2a\xe6\x6b\xe6\x6b\xe6\x8b\xe6\x8b\xee\x6b\xe6\x4a'\
-b'\xd5\x87\xa3\x61\xa3\x61\xd5\x87\xe6\x29\xe6\x6a\xe6\x6b\xee\x8c'\
-b'\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xcd\xee\xad'\
-b'\xe6\xad\xee\xad\xee\xad\xe6\xac\xee\xac\xe6\x8d\xee\x8c\xe6\x8b'\
-b'\xe6\x6b\xe6\x09\xb4\x43\x92\xe0\xc4\xa5\xe6\x29\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x8b\xee\x6b\xe6\x6b\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xde\x29\xde\x09\xe6\x08\xdd\xc8\xd5\xa7\xd5\x46\xc4\xe5'\
-b'\xbc\x84\xb4\x02\xa3\x81\x9b\x41\x92\xe0\x9b\x01\xab\xc2\xbc\x64'\
-b'\xc5\x06\xd5\x87\xdd\xe9\xe6\x2a\xe6\x6a\xe6\x6b\xe6\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\xac\xee\xad'\
-b'\xe6\xac\xee\xac\xee\x8d\xe6\xac\xee\x8c\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x2a\xde\x08\xbc\x64\x92\xe0\xbc\x64'\
-b'\xe6\x29\xe6\x4a\xe6\x6b\xee\x8b\xe6\x8c\xe6\x8c\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xa8\xab\xa2'\
-b'\x9b\x21\xcd\x05\xde\x08\xe6\x29\xe6\x09\xe6\x09\xde\x08\xd5\xa8'\
-b'\xe6\x6b\xe6\x4a\xe6\x09\xd5\x67\xbc\xa4\xab\xc2\x9b\x20\x9b\x01'\
-b'\xa3\x61\x9b\x21\x9b\x41\xbc\x84\xdd\xa7\xde\x08\xe6\x09\xe6\x29'\
-b'\xde\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x8b'\
-b'\xe6\x8c\xee\x8c\xe6\x8c\xe6\xac\xee\xad\xee\xad\xe6\xad\xee\xad'\
-b'\xe6\xac\xe6\x8c\xee\xad\xe6\xac\xe6\x8c\xee\x8c\xe6\x8c\xe6\x6b'\
-b'\xe6\x09\xcd\x06\xa3\xa2\xa3\x61\xbc\x64\xd5\x87\xe6\x09\xe6\x49'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xee\x8b'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xee\xac\xe6\xac\xee\x8c\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8b\xe6\x6b\xe6\x8b\xe6\x6b\xe6\x4b\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xdd\xc8\xbc\x84\x9b\x41\xab\xa2\xcd\x05\xdd\xc7'\
-b'\xdd\xe8\xdd\xc8\xd5\x87\xcd\x25\xbc\x64\xab\xc2\x9b\x41\x9b\x41'\
-b'\xab\xa2\xbc\x64\xcd\x26\xdd\xc8\xe6\x29\xe6\x4b\xe6\x6b\xe6\x8b'\
-b'\xee\x8c\xe6\xac\xee\xad\xee\xac\xe6\x8c\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xe6\xac\xe6\x8c\xe6\x6b\xdd\xc8\xab\xe3\xa3\x41\xc4\xc4'\
-b'\xdd\xe8\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6c\xee\x8c\xe6\x8c\xe6\xac'\
-b'\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xad'\
-b'\xee\xad\xe6\x8c\xee\x8c\xe6\x8c\xe6\x6b\xe6\x4a\xcd\x06\x9b\x21'\
-b'\xab\xc2\xd5\xa7\xde\x29\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29'\
-b'\xde\x08\xdd\xc8\xd5\x86\xcd\x05\xbc\x84\xb4\x02\xa3\x81\xa3\x41'\
-b'\xa3\x62\xab\xc2\xbc\x64\xcd\x06\xd5\xa8\xde\x09\xe6\x2a\xde\x09'\
-b'\xb4\x23\x92\xe1\xbc\xa4\xde\x08\xe6\x2a\xe6\x6b\xee\x8c\xe6\x8c'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xce\xe6\xcd\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xe6\x8c\xee\x8b'\
-b'\xe6\x4b\xdd\xc8\xa3\x82\x9b\x21\xd5\x67\xe6\x4a\xe6\x6b\xe6\x8b'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8b\xee\x8b\xe6\x8c'\
-b'\xee\x8c\xee\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xde\x08'\
-b'\xdd\xe8\xdd\xa7\xd5\x86\xc4\xa4\x9b\x01\x9b\x21\xab\xc2\xa3\x82'\
-b'\xa3\x61\xa3\x61\xa3\x82\xb4\x03\xbc\x85\xcd\x26\xd5\xa8\xde\x09'\
-b'\xe6\x4a\xe6\x6b\xe6\x8b\xe6\x8b\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xe6\x8c\xee\xad\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b'\
-b'\xee\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x09\xcd\x06\x9b\x01\xa3\xa2'\
-b'\xdd\xe8\xe6\x4a\xe6\x6b\xee\x8c\xee\x8b\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xee\x8c\xe6\xac\xee\x8c\xee\x8c\xee\x8c\xee\xac\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8b\xe6\x8c\xee\x6b\xe6\x8b\xee\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xc5\x05'\
-b'\x9b\x01\xab\xc2\xdd\xc8\xde\x29\xe6\x4a\xe6\x6a\xe6\x6b\xee\x8c'\
-b'\xee\x8b\xe6\x6b\xe6\x4a\xe6\x29\xdd\xc8\xc4\xe5\xa3\x61\x93\x01'\
-b'\xa3\x41\x9b\x00\x9b\x00\xab\xa2\xbc\x84\xcd\x47\xdd\xe8\xde\x09'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xee\xac\xee\xad\xee\xac\xee\xad\xee\xad\xee\xad'\
-b'\xee\x8c\xee\xac\xee\x8d\xe6\x8c\xee\x8c\xe6\x6b\xe6\x4a\xd5\x67'\
-b'\xab\xe3\x9b\x41\xb4\x03\xd5\x46\xde\x08\xe6\x2a\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xee\x6b\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xee\xac\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xad\xee\x8c\xe6\xac'\
-b'\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x6c\xee\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x29\xcd\x67\xab\xc2\x9b\x41\xbc\x43\xd5\x87\xdd\xe8\xde\x29'\
-b'\xe6\x29\xe6\x29\xde\x29\xe6\x09\xde\x08\xdd\xc8\xd5\x66\xc4\xc4'\
-b'\xb4\x03\xa3\x81\x9b\x41\xa3\x62\xac\x03\xc4\xc5\xd5\x87\xde\x09'\
-b'\xe6\x4b\xe6\x6b\xe6\x8b\xe6\x6c\xee\x8c\xe6\x8c\xe6\xac\xee\x8c'\
-b'\xe6\x8c\xee\x8b\xe6\x6b\xd5\x87\xab\xa2\xa3\x61\xcd\x05\xdd\xe8'\
-b'\xe6\x29\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c\xee\xac\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce\xee\xee'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xe6\xad\xee\xad\xee\xac\xe6\x6c\xe6\x4a\xcd\x46\xa3\x41\xa3\x82'\
-b'\xd5\x66\xe6\x29\xe6\x4a\xe6\x6a\xee\x6b\xe6\x6b\xee\x8c\xee\x8c'\
-b'\xee\x8b\xe6\x6b\xee\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xdd\xc8\xd5\x87\xcd\x25'\
-b'\xc4\xa4\xb4\x03\xa3\xa2\xa3\x61\xa3\x41\xab\xa2\xb4\x43\xbc\x44'\
-b'\x9b\x21\xa3\x81\xd5\x87\xe6\x09\xe6\x4a\xe6\x6a\xe6\x6b\xee\x8c'\
-b'\xee\x8c\xee\xac\xe6\xad\xee\xad\xee\xce\xee\xce\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xcd\xee\xcd\xe6\xad\xee\xad\xee\xac\xe6\xac\xe6\x8c'\
-b'\xe6\x6a\xcd\x46\x9b\x01\xa3\xa2\xdd\xe8\xe6\x6a\xe6\x8c\xee\x8c'\
-b'\xee\xac\xee\xad\xee\xad\xee\xac\xe6\x8c\xee\xac\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x29\xde\x29\xdd\xe9\xcd\x26\x9b\x21\xa3\x61\xd5\x46\xd5\x86'\
-b'\xcd\x46\xc4\xe5\xbc\x64\xb4\x02\xab\x82\xa3\x61\xa3\x61\xab\xa2'\
-b'\xb4\x03\xc4\xa5\xcd\x26\xd5\xa8\xe6\x09\xe6\x4a\xe6\x6b\xe6\x8b'\
-b'\xe6\x8b\xe6\x6c\xee\x8b\xe6\x8c\xee\x8c\xe6\x8b\xee\x8c\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xde\x29\xd5\xa7\xa3\x61\x9b\x21'\
-b'\xd5\x67\xe6\x4a\xe6\x6b\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\xac'\
-b'\xee\xad\xee\xac\xe6\xad\xee\xad\xe6\xac\xee\xad\xe6\x8c\xee\x8c'\
-b'\xee\xac\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c'\
-b'\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29\xdd\xe8'\
-b'\xb4\x03\x92\xe0\xc4\xc5\xe6\x29\xe6\x4b\xe6\x6b\xee\x8c\xee\x8c'\
-b'\xe6\x6b\xe6\x6a\xe6\x09\xcd\x46\xac\x03\xa3\x41\xab\xa2\xc4\xc5'\
-b'\xd5\x87\xcd\x06\xb4\x43\xa3\x62\x93\x01\x9b\x21\xab\xe2\xc4\xc5'\
-b'\xd5\x87\xde\x08\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x8c\xe6\x8c\xe6\x8c\xee\xac\xee\xad\xe6\x8d\xee\xac\xe6\x8c'\
-b'\xe6\xac\xee\x8c\xe6\x8c\xe6\x8b\xe6\x4a\xd5\xa8\xbc\x44\x9b\x41'\
-b'\xab\xa2\xcd\x05\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xee\xac'\
-b'\xe6\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xad\xee\xac'\
-b'\xee\xac\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xdd\xe9'\
-b'\xc4\xa5\xa3\x41\xa3\xa2\xcc\xe5\xdd\xc7\xde\x29\xe6\x2a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09'\
-b'\xdd\xe8\xd5\x87\xcd\x05\xbc\x64\xab\xc2\x9b\x41\xa3\x41\xab\xa2'\
-b'\xbc\x64\xcd\x26\xdd\xc8\xe6\x2a\xe6\x6a\xee\x6b\xe6\x8b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xcd\x26\xa3\x62\xa3\x82\xcd\x25\xde\x08\xe6\x2a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6c\xee\x8c\xee\x8c\xe6\xad\xee\xcd\xee\xcd'\
-b'\xee\xae\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xce'\
-b'\xee\xef\xee\xee\xee\xee\xee\xef\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xee\xad\xe6\x8c\xe6\x6b\xd5\x87\xa3\x82\xa3\x61\xcd\x26'\
-b'\xde\x29\xe6\x4a\xe6\x4b\xe6\x6b\xee\x8c\xee\xac\xe6\x8d\xee\x8c'\
-b'\xe6\xac\xee\xac\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x8b'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29'\
-b'\xde\x08\xdd\xc8\xd5\x87\xcd\x25\xc4\xa4\xb4\x23\xa3\x81\x92\xe0'\
-b'\x92\xe0\x9b\x21\xb3\xe3\xbc\xa4\xcd\x46\xdd\xc9\xe6\x2a\xe6\x6a'\
-b'\xe6\x8b\xe6\x8c\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xcd\xee\xce\xee\xce\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xce\xee\xad\xee\xce\xee\xad\xee\xad\xee\x8c\xe6\x6c'\
-b'\xe6\x4a\xbc\x84\x92\xe0\xbc\x64\xe6\x29\xe6\x6b\xee\x8c\xee\xad'\
-b'\xe6\xad\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\x8c'\
-b'\xe6\xac\xee\xad\xee\xad\xe6\xac\xee\xac\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x09\xcd\x46\x9b\x20\xa3\x61\xd5\x87\xdd\xe8'\
-b'\xe6\x08\xdd\xe8\xdd\xe8\xdd\xc8\xd5\xa7\xcd\x46\xc4\xe5\xbc\x64'\
-b'\xab\xe2\xa3\x82\xa3\x61\xa3\x61\xa3\xa2\xb4\x03\xc4\xa5\xcd\x27'\
-b'\xdd\xa8\xde\x09\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8\xb4\x03\x92\xe0'\
-b'\xc4\xa5\xe6\x4a\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xad'\
-b'\xee\xad\xee\xad\xe6\x8c\xee\xac\xee\xad\xee\xad\xee\xac\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xe6\x8b\xee\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xcd\x46\x9b\x21\xa3\x82\xdd\xa8\xe6\x6a\xe6\x8b\xee\x8c\xe6\x8c'\
-b'\xe6\x2a\xcd\x47\xb4\x03\x9b\x41\xab\xa2\xc4\xe5\xdd\xc8\xde\x29'\
-b'\xe6\x29\xde\x29\xde\x08\xd5\xa7\xcc\xe5\xb4\x03\xa3\x41\x9b\x00'\
-b'\x9b\x41\xb4\x03\xc4\xe6\xd5\xa7\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xee\x8b\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xe6\x6b\xe6\x6a\xdd\xe9\xc4\xa5\xa3\x61\xa3\x61\xc4\xa4'\
-b'\xd5\xc8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x8b\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\xac\xee\xac\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xad\xe6\xad\xee\xad'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x6b\xe6\x4a\xd5\x87\xb4\x03'\
-b'\x9b\x21\xb4\x23\xd5\x66\xde\x08\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xde\x29\xde\x08\xdd\xc7\xd5\x46\xc4\xc4\xac\x03'\
-b'\xa3\x82\x9b\x41\xa3\x61\xb4\x03\xc4\xc5\xd5\x67\xde\x09\xe6\x2a'\
-b'\xe6\x29\xc4\xe5\x9b\x41\xab\xc2\xd5\x46\xdd\xe8\xe6\x29\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xee\xee\xee\xee\xce\xee\xef\xee\xce'\
-b'\xee\xce\xee\xce\xee\xef\xee\xce\xee\xee\xee\xce\xee\xce\xee\xad'\
-b'\xee\xad\xe6\xac\xee\x8c\xdd\xc8\xab\xa2\x9b\x41\xcc\xe5\xe6\x09'\
-b'\xe6\x4a\xe6\x6b\xee\x8b\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xad\xe6\xac\xee\xad'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xee\x8b\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xde\x08\xdd\xe8\xdd\xa7\xbc\x44\x92\xe0'\
-b'\xab\xa2\xb4\x23\xab\xc2\xa3\x61\xa3\x41\xa3\x82\xb4\x03\xbc\xa5'\
-b'\xcd\x47\xdd\xc9\xe6\x4a\xe6\x6b\xe6\xac\xee\xac\xee\xad\xe6\xad'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xcd\xee\xce\xe6\xad\xee\xad\xee\xad\xe6\xac\xe6\x6b'\
-b'\xe6\x09\xab\xc2\x9b\x01\xcd\x06\xe6\x4a\xe6\x8c\xee\xac\xee\xad'\
-b'\xee\xad\xee\xad\xe6\xcd\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad'\
-b'\xee\xad\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xac\xe6\xac\xee\xac'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xee\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x29\xcd\x46\x9b\x01\xa3\x61\xd5\x87\xde\x09'\
-b'\xe6\x2a\xe6\x29\xe6\x4a\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x08'\
-b'\xdd\xe8\xdd\xa7\xcd\x46\xc4\xe5\xbc\x64\xb3\xe3\xa3\x81\xa3\x61'\
-b'\xa3\x61\xab\xa2\xb4\x23\xc4\xa5\xcd\x27\xd5\xa8\xde\x09\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xdd\xe8\xc4\xa4\x92\xe0'\
-b'\xab\xe3\xde\x09\xe6\x6a\xe6\x6b\xee\x8c\xee\x8c\xe6\xac\xee\xac'\
-b'\xee\xac\xe6\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xe6\x6b\xee\x6b\xe6\x6b\xe6\x4a\xe6\x2a'\
-b'\xde\x09\xbc\x64\x92\xe0\xbc\x64\xe6\x2a\xe6\x6b\xee\x8c\xee\x8c'\
-b'\xb3\xe3\x9b\x41\xab\xa2\xc4\xe6\xdd\xe8\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x4a\xe6\x2a\xe6\x2a\xe6\x29\xde\x09\xd5\x87\xc4\xc5'\
-b'\xab\xc3\x9b\x21\x9b\x00\xa3\x62\xb4\x23\xcd\x06\xdd\xc8\xe6\x29'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x09\xcd\x06\xab\xa2\x9b\x41\xb4\x43\xd5\x87\xde\x09'\
-b'\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b'\
-b'\xe6\x8c\xee\x8c\xe6\x8c\xee\xac\xee\xac\xee\xad\xe6\xad\xee\xad'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xcd\xee\xce\xee\xcd\xee\xad\xee\xad'\
-b'\xee\xac\xe6\x8c\xe6\x8c\xe6\x6b\xe6\x29\xc4\xe6\xa3\x61\xa3\x61'\
-b'\xc4\xc4\xdd\xc8\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xee\x8c\xe6\x8b\xee\x8b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8'\
-b'\xd5\x86\xcd\x05\xbc\x44\xa3\xa2\x9b\x41\x9b\x41\xab\xa2\xb4\x44'\
-b'\xb4\x43\x9b\x21\xb3\xe2\xd5\x66\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x8c\xee\x8c\xe6\xad\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xef\xf6\xee\xee\xef\xf6\xee\xee\xef'\
-b'\xee\xee\xf6\xee\xee\xcf\xee\xee\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xac\xe6\x8c\xdd\xe9\xab\xe3\x9b\x21\xc4\xa4\xde\x08\xe6\x4a'\
-b'\xe6\x6b\xe6\x8c\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xce\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xce'\
-b'\xee\xad\xee\xad\xee\xac\xee\xad\xee\x8c\xe6\x8c\xee\x8c\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x2a\xe6\x09\xd5\x87\xa3\x61\x9b\x21'\
-b'\xcd\x05\xdd\xc7\xd5\x87\xd5\x46\xc4\xe4\xbc\x43\xab\xc2\xa3\x61'\
-b'\xa3\x41\xa3\x61\xab\xe3\xbc\x84\xcd\x27\xdd\xc9\xe6\x2a\xe6\x6b'\
-b'\xe6\x8b\xee\xac\xe6\xac\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xad\xe6\xad\xee\x8c\xe6\x6b'\
-b'\xd5\x87\x9b\x21\x9b\x41\xd5\xa8\xe6\x6b\xee\x8c\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xad\xee\xce\xee\xcd\xee\xce\xee\xce\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xe6\xac\xee\x8c\xee\x8c\xe6\x8c\xee\x8b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xcd\x46\x9b\x01\xa3\x61\xd5\xa7\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4b\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xd5\xa7\xcd\x46'\
-b'\xc4\xe5\xbc\x64\xab\xe2\xa3\x82\xa3\x41\xa3\x61\xab\xa2\xb4\x23'\
-b'\xc4\xa5\xcd\x26\xd5\xa7\xdd\xc8\xde\x08\xdd\xe8\xcd\x46\x9b\x21'\
-b'\xa3\x41\xd5\xa7\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xac\xee\xad'\
-b'\xee\xac\xe6\x8c\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xd5\x87\xa3\x62\x9b\x41\xd5\x67\xe6\x6a\xe6\x8b\xee\x8c'\
-b'\xab\xe3\xcd\x06\xdd\xe9\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x4a'\
-b'\xe6\x6a\xe6\x4b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29'\
-b'\xdd\xe8\xd5\x67\xbc\x84\xa3\xa2\x9b\x21\x93\x00\xa3\x82\xbc\x64'\
-b'\xcd\x46\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xd5\x67\xab\xe3\x9b\x21\xab\xe2\xcd\x26\xdd\xe8\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xcd'\
-b'\xee\xce\xee\xad\xee\xcd\xee\xad\xe6\xad\xee\xad\xee\xad\xe6\xad'\
-b'\xee\x8c\xe6\x8b\xe6\x6b\xdd\xc8\xb4\x23\x9b\x21\xb4\x03\xd5\x66'\
-b'\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8b'\
-b'\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xe6\x29\xde\x09\xdd\xe8\xdd\xa7\xcd\x25\xc4\x84\xab\xa2\x92\xe0'\
-b'\x92\xe0\x9a\xe1\xab\xa2\xbc\x84\xcd\x46\xdd\xc8\xde\x29\xe6\x4a'\
-b'\xe6\x6a\xee\x6b\xe6\x8b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xee\xee\xee\xee\xce\xee\xef\xee\xce'\
-b'\xee\xef\xee\xce\xee\xce\xee\xcf\xee\xce\xee\xce\xee\xad\xee\xad'\
-b'\xe6\x8c\xe6\x29\xb4\x24\x9b\x00\xbc\x64\xdd\xe8\xe6\x4a\xe6\x6b'\
-b'\xee\x8c\xee\xac\xee\xad\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef'\
-b'\xee\xef\xee\xce\xee\xef\xee\xef\xee\xee\xee\xee\xee\xee\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\xad\xee\xad\xee\xac\xe6\x8c'\
-b'\xee\x8c\xe6\x6b\xe6\x6b\xe6\x4a\xde\x08\xb4\x44\x92\xe0\xb4\x43'\
-b'\xdd\xe8\xe6\x29\xe6\x29\xde\x09\xde\x09\xdd\xe8\xdd\xc7\xd5\x66'\
-b'\xcd\x05\xbc\x84\xab\xe2\xa3\x81\xa3\x41\xa3\x61\xab\xc2\xb4\x64'\
-b'\xcd\x06\xd5\xa8\xe6\x0a\xe6\x6a\xe6\x8b\xee\x8c\xe6\xac\xe6\xac'\
-b'\xee\xad\xe6\xad\xee\xad\xe6\xad\xee\x8c\xe6\x8c\xe6\x6b\xe6\x4a'\
-b'\xc4\xc5\x92\xe0\xb4\x03\xe6\x29\xe6\x8b\xee\x8c\xee\xad\xe6\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xae\xe6\xce\xee\xce\xee\xad'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xac\xe6\xac\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xe6\x6b\xe6\x4a\xe6\x2a\xcd\x46\x9b\x01\xa3\x61\xd5\xa8\xe6\x2a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xe6\x29\xde\x09\xdd\xc8\xdd\xa7\xcd\x46\xc4\xe5\xbc\x44\xab\xe2'\
-b'\xa3\x61\xa3\x41\xa3\x61\xa3\xa2\xb4\x03\xbc\x84\xc4\xc5\xa3\x61'\
-b'\x92\xe0\xc4\xe5\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c'\
-b'\xee\x8c\xe6\xac\xee\xac\xe6\xad\xee\xad\xee\xad\xee\xad\xe6\xad'\
-b'\xee\xcd\xee\xad\xee\xcd\xe6\xcd\xee\xad\xee\xad\xee\xad\xe6\xac'\
-b'\xee\xad\xee\x8c\xe6\xac\xe6\x8c\xee\x8c\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xbc\xa4\x92\xe0\xb4\x03\xde\x09\xe6\x6b\xee\x8b'\
-b'\xe6\x4b\xee\x8b\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x49\xde\x29\xdd\xe8\xcd\x46\xbc\x44\xa3\x82\x9b\x00'\
-b'\x9b\x01\xa3\xa2\xbc\x84\xd5\x67\xdd\xe8\xe6\x09\xd5\x87\xb4\x44'\
-b'\x9b\x41\xa3\x81\xc4\xc5\xdd\xc8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xe6\xac\xee\xad\xee\xad\xe6\xcd\xee\xce\xee\xce\xee\xad'\
-b'\xee\xce\xe6\xad\xee\xad\xee\xcd\xee\xad\xee\xad\xee\xad\xe6\x8c'\
-b'\xe6\x8b\xe6\x2a\xcd\x06\xa3\x82\xa3\x41\xbc\xa4\xdd\xa7\xde\x29'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6c\xee\x8c\xe6\x8c\xee\xac'\
-b'\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xac\xe6\xad\xee\xac\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x6b\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6a'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8\xd5\x66\xab\xc2\x9b\x21'\
-b'\xbc\x23\xb4\x43\xab\xa2\x9b\x21\x9b\x21\xa3\xa2\xbc\x44\xcd\x06'\
-b'\xd5\xa8\xe6\x29\xe6\x6b\xe6\x6b\xe6\x8c\xe6\x8c\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xef\xee\xce\xf6\xee'\
-b'\xee\xce\xee\xee\xf6\xcf\xee\xee\xee\xce\xee\xcd\xee\xad\xee\x8c'\
-b'\xe6\x4a\xbc\x84\x9b\x01\xb4\x23\xdd\xc8\xe6\x2a\xe6\x6b\xe6\x8b'\
-b'\xee\x8c\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xee\xad'\
-b'\xe6\x8c\xee\x8b\xe6\x6b\xe6\x4a\xcd\x46\x9b\x21\xa3\x61\xd5\x87'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xde\x29\xde\x09\xdd\xc7\xd5\x87\xcd\x05\xbc\x84\xb4\x03\xa3\x82'\
-b'\x9b\x41\xa3\x41\xa3\xa2\xb4\x24\xc4\xe6\xd5\x87\xde\x09\xe6\x4a'\
-b'\xee\x6b\xe6\x8c\xee\x8c\xee\x8b\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x09'\
-b'\xb4\x03\x92\xe0\xc4\xa5\xe6\x4a\xe6\x8b\xee\x8d\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xae\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xce\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xad\xee\x8c\xe6\x8c'\
-b'\xee\x6b\xe6\x6a\xe6\x29\xcd\x26\x9b\x01\xa3\x61\xd5\xa7\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xee\x8b\xe6\x6b\xee\x6b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xde\x09\xdd\xe8'\
-b'\xd5\xa7\xcd\x46\xc4\xc5\xbc\x43\xab\xc2\xa3\x62\x9b\x41\x9b\x01'\
-b'\x92\xe0\xab\x82\xc4\xa5\xcd\x26\xdd\xa8\xde\x09\xe6\x4a\xe6\x6b'\
-b'\xe6\x8b\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\xac\xee\xac\xee\xad'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\x8c\xee\x8c\xe6\x8c\xee\x8b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xdd\xc8\xab\xa2\x9b\x01\xc5\x06\xe6\x4a\xe6\x6b'\
-b'\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xac\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x6b\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xdd\xa7\xc5\x06'\
-b'\xb4\x23\xa3\x41\x92\xe0\x9b\x21\xab\xc2\xb4\x23\xa3\x61\xa3\x41'\
-b'\xbc\x64\xd5\x86\xdd\xe8\xe6\x29\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x6a\xe6\x6b\xee\x6b\xe6\x8b\xee\x8c\xe6\x8c\xee\xac\xee\xad'\
-b'\xe6\xad\xee\xad\xee\xad\xee\xad\xee\xae\xee\xcd\xee\xcd\xee\xce'\
-b'\xee\xad\xee\xcd\xee\xad\xe6\xad\xee\xad\xe6\xac\xe6\x8c\xe6\x6b'\
-b'\xdd\xe8\xbc\x64\x9b\x21\xab\xc2\xcd\x26\xdd\xe8\xe6\x29\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8c\xee\x8c\xee\xac\xee\xac\xe6\x8c'\
-b'\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xe6\x8c\xee\xac\xe6\x8c\xee\x8c\xe6\x8c\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xd5\x66\xa3\xa2\x9b\x41\xc4\xa4'\
-b'\xd5\xa7\xdd\xc7\xd5\xa7\xcd\x25\xc4\xa4\xb3\xe2\xa3\x61\x9b\x21'\
-b'\xa3\x61\xab\xe3\xc4\xc5\xd5\x67\xde\x09\xe6\x6a\xee\x8b\xe6\xac'\
-b'\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xee\x8c\xe6\x4a'\
-b'\xc4\xc5\x93\x01\xab\xc2\xd5\xa7\xe6\x29\xe6\x6a\xe6\x8c\xee\xad'\
-b'\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xf6\xef\xee\xef\xef\x0f\xf6\xef\xee\xef\xef\x0f\xf6\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xe6\x8c\xe6\x6b\xe6\x09\xb3\xe3\x9b\x00\xbc\xa5\xe6\x29'\
-b'\xe6\x4a\xe6\x6b\xe6\x8b\xe6\x6b\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xde\x08\xdd\xc8\xd5\x86'\
-b'\xcd\x25\xc4\xa4\xb4\x23\xab\xa2\xa3\x41\x9b\x41\xa3\x82\xb4\x03'\
-b'\xc4\xc5\xcd\x67\xdd\xe9\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xd5\xa7'\
-b'\xa3\x41\x9b\x21\xcd\x67\xe6\x4a\xee\x8b\xe6\xac\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xef\xee\xee\xee\xcf'\
-b'\xee\xce\xee\xce\xee\xef\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xe6\xac\xee\x8c'\
-b'\xe6\x8b\xe6\x4b\xe6\x4a\xcd\x46\x9b\x01\xa3\x61\xd5\xa8\xe6\x4a'\
-b'\xe6\x6b\xee\x6b\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b'\
-b'\xe6\x8c\xee\x8b\xee\x8c\xee\x8b\xe6\x6b\xee\x8b\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xe6\x29\xe6\x09\xde\x08\xdd\xc8\xd5\x86\xcd\x05\xb4\x43'\
-b'\x92\xe1\x92\xe0\x9b\x41\x9b\x41\xa3\x61\xab\xc2\xb4\x44\xc4\xc5'\
-b'\xd5\x67\xdd\xc8\xe6\x29\xe6\x4a\xe6\x6b\xee\x6b\xe6\x8c\xee\x8c'\
-b'\xe6\xac\xee\xac\xee\x8c\xee\xad\xe6\xad\xee\xad\xee\xac\xe6\xad'\
-b'\xee\xad\xe6\xac\xee\xac\xe6\xac\xee\x8c\xe6\x6b\xe6\x6b\xe6\x6a'\
-b'\xe6\x4a\xe6\x4a\xde\x29\xc5\x05\x9b\x01\xa3\xa2\xdd\xc8\xe6\x4a'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad'\
-b'\xe6\xac\xee\x8c\xee\xac\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29\xde\x09'\
-b'\xdd\xe8\xd5\x87\xbc\xa4\xa3\x41\x92\xc0\x92\xe0\x92\xc0\xa3\x62'\
-b'\xbc\xa4\xd5\x66\xdd\xe8\xde\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8c\xee\xac\xee\x8c\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xee\xce\xe6\xad\xee\xae\xee\xcd'\
-b'\xee\xae\xee\xad\xe6\xad\xee\xad\xee\x8c\xe6\x6b\xe6\x4a\xd5\x47'\
-b'\xab\xa2\x9b\x41\xbc\x63\xd5\xa7\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c\xe6\xac\xee\xad\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xcd\xee\xce\xee\xcd\xee\xad\xe6\xad'\
-b'\xee\xad\xee\xad\xee\xac\xe6\xad\xee\x8c\xee\x8c\xe6\x8c\xee\x8b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xcd\x26\xa3\x62\xa3\x61\xcd\x05\xdd\xe8'\
-b'\xe6\x09\xe6\x29\xe6\x29\xde\x09\xde\x08\xdd\xc8\xd5\x86\xc4\xe5'\
-b'\xb4\x43\xab\xa2\x9b\x41\x9b\x21\xab\xa2\xbc\x44\xcd\x27\xdd\xc9'\
-b'\xe6\x4a\xe6\x8b\xe6\x8c\xee\xac\xee\xad\xee\xad\xee\xad\xee\xcd'\
-b'\xee\xcd\xee\xad\xee\xcd\xee\xad\xee\xad\xe6\x8c\xe6\x6a\xc5\x06'\
-b'\x9b\x21\xab\xa2\xd5\x66\xe6\x29\xe6\x6b\xe6\x6b\xee\x8c\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xef\x0f'\
-b'\xf7\x0f\xee\xf0\xf7\x0f\xef\x10\xf6\xf0\xef\x0f\xee\xf0\xf7\x0f'\
-b'\xf6\xef\xee\xef\xf6\xef\xee\xee\xee\xef\xee\xee\xee\xce\xee\xcd'\
-b'\xee\xad\xee\x8c\xe6\x6a\xc5\x06\x9b\x00\xab\xa2\xd5\xc8\xe6\x4a'\
-b'\xee\x8c\xee\x8c\xee\xad\xee\xad\xee\xad\xee\x8c\xee\x8c\xee\x8c'\
-b'\xee\x8c\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xde\x09\xdd\xe8\xd5\x87\xd5\x45\xc4\xc4\xb4\x23\xab\xc2'\
-b'\xa3\x41\x9b\x21\xa3\x61\xab\xe3\xbc\x84\xcd\x26\xd5\x87\xc4\xc5'\
-b'\x93\x00\xa3\x82\xdd\xc8\xe6\x6a\xe6\x6b\xee\x8c\xe6\x8c\xee\xad'\
-b'\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee'\
-b'\xee\xef\xee\xce\xee\xee\xee\xce\xee\xef\xee\xee\xee\xef\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x8c'\
-b'\xee\x8c\xe6\x6b\xe6\x29\xcd\x26\x9b\x01\xa3\x61\xdd\xc8\xe6\x4a'\
-b'\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xee\xac\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xe6\x09\xde\x08\xd5\x66'\
-b'\xa3\x41\x9b\x01\xc4\xa4\xcd\x25\xc4\xa5\xb4\x23\xab\xa2\xa3\x61'\
-b'\x9b\x41\xa3\x62\xab\xc2\xb4\x44\xc4\xc5\xd5\x67\xdd\xe9\xe6\x2a'\
-b'\xe6\x6a\xe6\x6b\xe6\x8c\xee\x8c\xee\xac\xe6\xac\xee\x8c\xee\xac'\
-b'\xe6\x8c\xee\xad\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b\xee\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x29\xdd\xe8\xb3\xe3\x92\xe0\xbc\x84\xe6\x09'\
-b'\xf6\xef\xee\xee\xee\xce\xee\xef\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xac\xee\x8c\xe6\x8c'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29'\
-b'\xdd\xe8\xcd\x26\xb3\xe3\x9b\x21\xab\xa2\xb4\x64\xab\xc2\x9b\x21'\
-b'\x92\xe0\xa3\x41\xb4\x03\xc4\xe5\xd5\xa7\xde\x09\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8c\xe6\x8c\xe6\xad\xee\xad'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xcd\xee\xcd\xee\xad\xee\xcd\xee\xcd'\
-b'\xee\xad\xe6\xad\xee\xad\xe6\x8c\xe6\x6b\xdd\xe9\xbc\x84\x9b\x41'\
-b'\xa3\xa2\xcd\x05\xdd\xe8\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xac\xee\x8c\xe6\x6b'\
-b'\xe6\x6b\xe6\x29\xc4\xe5\x9b\x41\xab\xa2\xcd\x25\xdd\xe8\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29'\
-b'\xdd\xe8\xdd\xa7\xcd\x26\xc4\xa4\xab\xe2\xa3\x61\x9b\x21\x9b\x61'\
-b'\xac\x03\xc4\xc5\xd5\x88\xde\x0a\xe6\x6b\xee\x8b\xee\x8c\xe6\xac'\
-b'\xee\xad\xee\xad\xee\x8c\xe6\xac\xe6\x8c\xe6\x6b\xd5\x47\xa3\x41'\
-b'\xa3\x61\xcd\x46\xde\x09\xe6\x4a\xe6\x8c\xee\xac\xee\xad\xee\xce'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xf7\x0f\xee\xf0'\
-b'\xee\xef\xf7\x0f\xee\xf0\xee\xef\xf7\x0f\xee\xef\xef\x0f\xf6\xf0'\
-b'\xef\x0f\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xe6\x8b\xdd\xe9\xa3\x82\x9b\x00\xc5\x06\xe6\x29\xe6\x8b'\
-b'\xee\xac\xee\xad\xee\xad\xee\xcd\xe6\xad\xee\xce\xee\xcd\xee\xad'\
-b'\xe6\xad\xee\xad\xee\x8c\xee\x8c\xe6\x8c\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8\xdd\xa7'\
-b'\xcd\x46\xc4\xe4\xbc\x43\xab\xc2\xa3\x61\x9b\x21\xa3\x41\x9b\x41'\
-b'\x92\xe0\xab\xa2\xd5\x67\xdd\xe9\xe6\x4a\xe6\x6b\xee\x8b\xe6\x8c'\
-b'\xe6\xac\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xee\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xac'\
-b'\xe6\x8c\xe6\x6a\xe6\x29\xcd\x26\x9b\x00\x9b\x61\xd5\xa8\xe6\x6a'\
-b'\xee\x6b\xee\x8c\xe6\xac\xee\x8c\xe6\xad\xee\xac\xee\xad\xee\xad'\
-b'\xe6\xad\xee\x8c\xee\xac\xee\xac\xe6\xad\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b\xee\x8b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xdd\xc8'\
-b'\xab\xe3\x92\xe0\xbc\x64\xdd\xe8\xdd\xe8\xde\x08\xdd\xe8\xd5\x87'\
-b'\xcd\x26\xc4\xc5\xb4\x23\xab\xc2\xa3\x61\x9b\x41\xa3\x62\xab\xc2'\
-b'\xb4\x64\xc4\xe6\xd5\x67\xdd\xe9\xe6\x2a\xe6\x6b\xe6\x8b\xe6\x8b'\
-b'\xee\x8c\xe6\x8b\xe6\x8c\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xcd\x46\x9b\x21\xa3\x41\xcd\x46'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xee\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xe6\xad\xee\xad\xee\xad\xe6\xac\xee\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29\xd5\x87'\
-b'\xbc\x64\x9b\x41\xa3\x61\xbc\xa4\xd5\xa7\xdd\xe8\xdd\xc7\xcd\x46'\
-b'\xbc\x64\xa3\x82\x9b\x01\x9b\x01\xa3\x61\xb4\x44\xcd\x26\xdd\xc8'\
-b'\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xee\x8b\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\xac\xee\xad\xe6\xad\xee\xad\xe6\xad\xee\xad\xe6\xad\xee\xad'\
-b'\xee\xad\xe6\x8c\xe6\x8b\xe6\x4a\xd5\x67\xab\xc2\x9b\x21\xbc\x23'\
-b'\xd5\x86\xe6\x09\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c'\
-b'\xee\x8c\xee\xac\xe6\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\xad\xee\xac\xe6\x8c\xe6\x6b'\
-b'\xe6\x29\xc4\xa5\x9b\x21\xab\xc2\xd5\x66\xde\x09\xe6\x2a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4b'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8\xd5\x66\xc4\xe5\xbc\x43'\
-b'\xab\xa2\x9b\x21\x9b\x21\xab\xa2\xb4\x44\xcd\x26\xd5\xc8\xe6\x2a'\
-b'\xe6\x6b\xe6\x6b\xe6\x8b\xee\x6b\xe6\x4a\xd5\x87\xa3\x62\x9b\x21'\
-b'\xc4\xe5\xde\x08\xe6\x4a\xe6\x8b\xee\x8c\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xef\xee\xee\xee\xef\xf6\xef\xee\xef\xf7\x0f\xef\x0f'\
-b'\xf6\xf0\xef\x0f\xef\x0f\xf6\xf0\xef\x0f\xf7\x10\xee\xf0\xef\x0f'\
-b'\xf6\xef\xee\xef\xef\x0f\xf6\xef\xee\xee\xee\xce\xee\xce\xee\xad'\
-b'\xe6\x8c\xe6\x4a\xbc\x85\x9a\xe0\xb4\x03\xde\x08\xe6\x6b\xee\x8c'\
-b'\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xad\xe6\xad\xee\xad\xee\xac\xee\xac\xee\xac'\
-b'\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x2a'\
-b'\xe6\x29\xde\x09\xdd\xe8\xd5\xa7\xd5\x46\xc4\xc4\xb4\x23\x9b\x01'\
-b'\x92\xe0\x9b\x21\x9b\x41\xab\xa2\xb4\x23\xc4\xe6\xd5\x88\xde\x09'\
-b'\xe6\x4a\xe6\x6b\xee\x8c\xe6\x8c\xee\xad\xee\xad\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xf6\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad'\
-b'\xe6\x6c\xe6\x6b\xe6\x29\xcd\x26\x9b\x01\xa3\x61\xd5\xa8\xe6\x6b'\
-b'\xe6\x8b\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xee\xcd\xe6\xad\xee\xad\xee\xac\xe6\xac\xee\xac\xee\xac\xe6\xac'\
-b'\xee\xac\xee\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09'\
-b'\xbc\x84\x92\xe0\xab\xc2\xdd\xc8\xe6\x09\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xe6\x29\xe6\x29\xde\x09\xdd\xe8\xd5\xa8\xcd\x26\xc4\xa5\xb4\x23'\
-b'\xab\xa2\xa3\x61\x9b\x41\xa3\x61\xab\xe3\xbc\x64\xc4\xe5\xd5\x67'\
-b'\xdd\xe9\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8\xb4\x44\x92\xe0\xab\xc2'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xcf'\
-b'\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xee\xad\xe6\xad'\
-b'\xee\x8c\xe6\x8c\xe6\x6b\xee\x6b\xe6\x4a\xdd\xc8\xc4\xc5\xa3\x61'\
-b'\x9b\x21\xbc\x43\xd5\x87\xde\x09\xe6\x09\xe6\x29\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xc8\xcd\x26\xb4\x43\xa3\x61\x93\x01\x9b\x00\xa3\x82'\
-b'\xbc\x64\xcd\x46\xdd\xe9\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8c'\
-b'\xe6\x8c\xee\xac\xee\xad\xee\xad\xee\xad\xee\xac\xe6\xac\xee\x8c'\
-b'\xe6\x8c\xe6\x6b\xe6\x09\xc4\xa5\x9b\x41\xa3\x81\xc4\xe5\xdd\xc8'\
-b'\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xef\xee\xee\xee\xce\xee\xef\xee\xee\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xe6\x8c\xee\x6b\xde\x09'\
-b'\xbc\x44\x9b\x21\xb4\x03\xd5\x87\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xee\x8b\xee\x8c\xee\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x8b'\
-b'\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8'\
-b'\xd5\xa7\xcd\x46\xc4\x84\xab\xe2\xa3\x61\x9b\x21\xa3\x61\xab\xe3'\
-b'\xc4\xa5\xd5\x67\xdd\xe9\xe6\x29\xd5\xa8\xab\xa2\x9b\x01\xbc\xa4'\
-b'\xdd\xe8\xe6\x2a\xe6\x6b\xee\x8c\xee\xad\xee\xad\xee\xce\xee\xce'\
-b'\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xef\x10\xf6\xef\xee\xf0\xef\x0f\xf6\xef\xee\xef\xef\x0f\xf6\xf0'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xad'\
-b'\xee\x8b\xd5\xa8\x9b\x41\x9b\x41\xcd\x46\xe6\x4a\xee\x8c\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xcd'\
-b'\xee\xad\xe6\xad\xee\x8c\xee\x8c\xee\x8c\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x29\xe6\x29\xde\x08\xdd\xe8\xcc\xe5\x9b\x00'\
-b'\x9b\x21\xbc\x84\xbc\x63\xb3\xe2\xa3\x81\x9b\x41\xa3\x41\xa3\x82'\
-b'\xb4\x23\xc4\xc6\xd5\x67\xde\x09\xe6\x4a\xe6\x8b\xe6\x8c\xee\x8c'\
-b'\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\xad'\
-b'\xee\x8c\xe6\x6a\xe6\x29\xcd\x26\x93\x01\xa3\x41\xdd\xc8\xe6\x6b'\
-b'\xee\x8c\xe6\x8c\xee\xad\xe6\xad\xee\xcd\xee\xad\xe6\xcd\xee\xce'\
-b'\xee\xcd\xee\xad\xee\xce\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xe6\xad\xee\xad\xee\xad\xee\xad\xee\xac\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8b\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xcd\x26\x9b\x01\x9b\x41\xd5\x66\xde\x09\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x49\xe6\x29'\
-b'\xdd\xe9\xd5\xa7\xcd\x26\xc4\xa5\xb4\x23\xa3\xa2\xa3\x41\x9b\x41'\
-b'\xa3\x82\xab\xe2\xbc\x64\xc4\xe5\xd5\x87\xdd\xe8\xe6\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xd5\x66\xa3\x61\x92\xe1'\
-b'\xf6\xef\xee\xef\xf6\xef\xee\xef\xf6\xee\xee\xef\xee\xef\xee\xee'\
-b'\xee\xee\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xe6\xad\xee\xac'\
-b'\xe6\x8c\xee\x6b\xe6\x6b\xe6\x29\xcd\x26\xab\xc2\x9b\x21\xab\xe3'\
-b'\xcd\x46\xde\x09\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x29\xde\x09\xd5\xa7\xcc\xe5\xb4\x03\x9b\x41'\
-b'\x93\x00\x9b\x21\xab\xa2\xbc\xa4\xd5\x87\xde\x09\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x8b\xe6\x8c\xe6\x8b\xe6\x8c\xee\x8c\xe6\x8c\xe6\x6b'\
-b'\xe6\x4a\xd5\x87\xab\xe3\x9b\x20\xb4\x03\xd5\x66\xde\x08\xe6\x29'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xee\xac\xee\xad'\
-b'\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xee\xee\xee'\
-b'\xee\xef\xee\xef\xee\xee\xf6\xef\xee\xce\xee\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xce\xee\xae\xee\xad\xe6\xac\xe6\x6b\xdd\xe9\xb4\x03'\
-b'\x9b\x20\xbc\x63\xd5\xa7\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8c'\
-b'\xe6\xac\xee\xad\xe6\xad\xee\xcd\xee\xad\xe6\xac\xee\xad\xee\xac'\
-b'\xee\x8c\xe6\x8c\xee\x8b\xee\x8c\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x08\xdd\xc8\xd5\x66\xc4\xe5\xb4\x23\xa3\x81'\
-b'\x9b\x21\x9b\x21\xa3\x82\xb4\x23\xab\xc2\x92\xe0\xb4\x43\xdd\xa7'\
-b'\xe6\x09\xe6\x49\xe6\x6b\xe6\x8c\xee\xac\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef\xef\x0f'\
-b'\xf6\xef\xee\xef\xf7\x0f\xef\x10\xee\xef\xf7\x0f\xef\x10\xee\xef'\
-b'\xf6\xef\xef\x0f\xee\xef\xee\xef\xee\xce\xee\xce\xee\xcd\xee\x8c'\
-b'\xe6\x2a\xb4\x23\x92\xe0\xbc\x44\xe6\x29\xe6\x8b\xee\xad\xee\xce'\
-b'\xee\xce\xee\xef\xee\xee\xee\xef\xf6\xef\xf6\xef\xee\xef\xf6\xef'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xee\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xad\xee\xac\xee\xac\xee\x8c\xe6\x8c'\
-b'\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x29\xde\x08\xbc\x64\x92\xe0'\
-b'\xab\xc2\xdd\xa7\xdd\xc7\xdd\xa7\xd5\x66\xcd\x05\xbc\x84\xb4\x03'\
-b'\xab\xa1\x9b\x41\x9b\x41\xa3\x62\xb4\x03\xbc\xa5\xd5\x47\xdd\xe9'\
-b'\xe6\x4a\xe6\x6b\xe6\x8c\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xcd\xee\xce\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xac'\
-b'\xe6\x8c\xe6\x4b\xe6\x29\xcd\x26\x93\x00\x9b\x41\xd5\xa8\xe6\x6b'\
-b'\xee\x8b\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xac\xe6\xad\xee\xac'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xdd\xa7\xa3\x82\x92\xe0\xc4\xc5\xe6\x29\xe6\x49\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x29\xdd\xe8\xd5\x88\xcd\x26'\
-b'\xbc\xa4\xb4\x03\xa3\x82\xa3\x41\x9b\x41\xa3\x62\xab\xe3\xbc\x64'\
-b'\xc4\xe5\xd5\x67\xdd\xc8\xde\x08\xde\x09\xe6\x08\xbc\xa4\x9a\xe1'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xee\xee\xcf\xf6\xee'\
-b'\xee\xcf\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xac\xe6\x8c'\
-b'\xe6\x6b\xe6\x4a\xd5\x87\xb4\x23\x9b\x21\xa3\x82\xc4\xe5\xdd\xe8'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x6a\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xd5\x87'\
-b'\xc4\xc5\xab\xe3\x9b\x21\x9a\xe0\x9b\x21\xab\xc2\xc4\xc5\xd5\xa7'\
-b'\xe6\x29\xe6\x4a\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x09'\
-b'\xc4\xe5\xa3\x61\xa3\x41\xc4\xa4\xdd\xc7\xde\x09\xe6\x2a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8c\xee\x8c\xee\xac\xe6\xad\xee\xcd'\
-b'\xee\xad\xee\xce\xee\xce\xee\xee\xee\xee\xee\xcf\xee\xce\xee\xee'\
-b'\xf6\xef\xee\xef\xee\xce\xee\xef\xee\xef\xf6\xee\xee\xee\xee\xcf'\
-b'\xee\xce\xee\xce\xee\xad\xe6\xac\xee\x6b\xd5\xa8\xab\xc2\x9b\x41'\
-b'\xbc\x84\xdd\xc8\xe6\x29\xe6\x4a\xe6\x6b\xee\x8b\xee\xac\xee\xad'\
-b'\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xad\xee\xad\xee\xac\xee\xad\xee\xac\xee\x8c\xe6\x8b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xe6\x09\xdd\xe8\xd5\x87'\
-b'\xcd\x25\xbc\x63\xab\xa2\x93\x00\x92\xc0\x9a\xe1\xa3\xa2\xbc\x64'\
-b'\xcd\x46\xdd\xc8\xe6\x4a\xe6\x6b\xee\x8c\xe6\xac\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xf6\xce\xee\xee\xee\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xf6\xef\xee\xef\xf6\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xee\xef\xf6\xef\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x6b'\
-b'\xcd\x26\x9b\x21\xa3\x62\xd5\x87\xe6\x6b\xee\x8c\xee\xce\xee\xce'\
-b'\xee\xee\xee\xef\xee\xef\xf6\xef\xee\xef\xef\x0f\xef\x0f\xef\x10'\
-b'\xef\x10\xf7\x0f\xf6\xef\xef\x0f\xf6\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xee\xee\xee\xee\xce\xee\xce\xee\xad\xee\xcd\xee\xad'\
-b'\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xdd\xe8\xab\xc2\x92\xe0'\
-b'\xbc\x84\xde\x09\xe6\x29\xde\x29\xe6\x09\xde\x09\xde\x08\xdd\xc7'\
-b'\xd5\x87\xcd\x46\xc4\xa4\xb4\x23\xab\xa2\xa3\x41\x9b\x21\xa3\x61'\
-b'\xab\xc3\xbc\x84\xcd\x27\xd5\xc8\xe6\x2a\xe6\x6b\xee\x8c\xee\x8c'\
-b'\xee\xac\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad\xe6\x8c'\
-b'\xe6\x8b\xe6\x4a\xe6\x29\xcd\x06\x9b\x00\xa3\x41\xdd\xa8\xe6\x6b'\
-b'\xe6\x8c\xee\xac\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xcd\xee\xcd\xee\xcd\xee\xcd\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xe6\xad\xee\x8c\xe6\x8c\xee\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xde\x08\xb4\x23\x92\xe0\xb4\x03\xde\x09\xe6\x4a\xe6\x4a\xe6\x4b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xdd\xe9\xd5\x87\xcd\x26\xbc\x84\xb4\x03\xa3\x82'\
-b'\xa3\x41\x9b\x41\xa3\x61\xab\xe3\xbc\x64\xc4\xe5\xcc\xe5\xa3\x82'\
-b'\xf6\xef\xf6\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xee\xee\xef'\
-b'\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xe6\xac\xe6\x8c\xee\x6b'\
-b'\xdd\xe9\xbc\x84\xa3\x41\xa3\x62\xbc\x84\xdd\xc8\xe6\x29\xe6\x4a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xe6\x29\xdd\xe8\xd5\x66\xbc\x84\xab\xa2\x9b\x21\x92\xe1\xa3\x41'\
-b'\xb4\x03\xc4\xe6\xdd\xa7\xe6\x09\xe6\x4a\xe6\x29\xd5\x87\xb4\x03'\
-b'\x9b\x01\xab\xc2\xcd\x26\xdd\xe8\xde\x29\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xee\x6b\xe6\x8b\xee\x8c\xe6\xad\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef\xee\xee\xee\xef\xf6\xef'\
-b'\xee\xef\xee\xee\xf6\xef\xee\xee\xee\xee\xee\xcf\xee\xce\xee\xce'\
-b'\xee\xce\xee\xad\xee\xac\xe6\x6b\xcd\x67\xa3\x82\xa3\x41\xc4\xc5'\
-b'\xdd\xe8\xe6\x29\xe6\x6b\xe6\x6b\xe6\x8c\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xee\xee\xee\xee\xef\xee\xef\xee\xee\xee\xef\xee\xee'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad'\
-b'\xee\xad\xee\x8c\xe6\x8c\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29'\
-b'\xde\x08\xdd\xa7\xb4\x23\x9a\xe0\xab\xa2\xb4\x22\xa3\x81\x9b\x21'\
-b'\x9b\x21\xa3\x82\xb4\x44\xcd\x06\xd5\xc8\xe6\x4a\xe6\x6b\xee\x8c'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xf6\xee'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xad\xee\x8c\xde\x09'\
-b'\xab\xc2\x92\xe0\xc4\xa5\xe6\x4a\xe6\x8c\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xef\xf6\xef\xee\xef\xef\x0f\xf7\x0f\xf6\xf0\xef\x10\xf6\xef'\
-b'\xf7\x10\xef\x10\xef\x10\xf6\xf0\xef\x0f\xf7\x0f\xee\xf0\xf7\x0f'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xee\xee\xce\xee\xce'\
-b'\xee\xce\xee\xcd\xee\xac\xe6\x8c\xe6\x4a\xd5\x87\x9b\x21\x9b\x01'\
-b'\xcd\x46\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xde\x08\xdd\xc8\xdd\xa7\xcd\x46\xc4\xe4\xbc\x43'\
-b'\xab\xc2\xa3\x61\x9b\x21\xa3\x41\xab\xc2\xb4\x64\xc5\x06\xd5\xa8'\
-b'\xde\x0a\xe6\x4b\xe6\x6b\xe6\x8b\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xc5\x05\x93\x01\x9b\x41\xd5\xa7\xe6\x6a'\
-b'\xee\x8c\xee\xad\xe6\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xce\xee\xee\xee\xce\xee\xce\xee\xef\xee\xee\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xe6\xcd\xee\xad'\
-b'\xee\xad\xee\xac\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x6a\xe6\x4a'\
-b'\xe6\x09\xc4\xe5\x92\xe1\xa3\x61\xd5\xa7\xe6\x4a\xe6\x4b\xe6\x6b'\
-b'\xe6\x6b\xee\x8b\xe6\x8b\xee\x8c\xee\x8b\xe6\x8b\xee\x8b\xee\x6b'\
-b'\xee\x8b\xe6\x6b\xee\x6b\xee\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x09\xdd\xe8'\
-b'\xd5\x87\xcd\x06\xbc\x84\xab\xe3\xa3\x82\x9b\x41\x9b\x21\x9b\x21'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xee\xee\xef\xee\xee\xee\xef\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x8b\xe6\x2a\xc4\xe6'\
-b'\xa3\x82\x9b\x21\xb4\x23\xd5\x87\xde\x29\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c\xee\x8b'\
-b'\xee\x8c\xee\x8c\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a'\
-b'\xe6\x4a\xe6\x2a\xe6\x2a\xde\x09\xdd\xc8\xcd\x26\xbc\x63\xa3\x82'\
-b'\x93\x01\x92\xe0\xa3\x61\xb4\x23\xc4\xe5\xc4\xc5\xa3\x62\x9b\x41'\
-b'\xbc\x63\xd5\x87\xdd\xe8\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xef\xf6\xef\xee\xee\xee\xef'\
-b'\xee\xee\xee\xef\xee\xce\xf6\xef\xee\xee\xee\xce\xee\xee\xee\xce'\
-b'\xee\xad\xee\xac\xe6\x4b\xcd\x26\xa3\x41\xa3\x81\xcd\x05\xde\x08'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xce\xee\xee'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xef\xf6\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xee\xee\xce'\
-b'\xee\xcd\xee\xad\xee\xad\xee\xac\xee\x8c\xe6\x8b\xe6\x6a\xe6\x4a'\
-b'\xdd\xe8\xc4\xa4\x9b\x01\xa3\x82\xcd\x46\xdd\xa7\xd5\x87\xcd\x05'\
-b'\xbc\x84\xab\xe2\xa3\x41\x9b\x20\xa3\x41\xab\xe3\xbc\xa5\xd5\x67'\
-b'\xde\x09\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xf6\xee\xee\xee\xf6\xef\xee\xee\xee\xef\xee\xef'\
-b'\xf6\xee\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xac\xe6\x6b\xc4\xc5'\
-b'\x92\xe0\xab\xc2\xdd\xc8\xe6\x6b\xee\xad\xee\xcd\xee\xce\xee\xef'\
-b'\xee\xef\xf6\xef\xef\x0f\xf6\xf0\xef\x0f\xef\x10\xf7\x10\xef\x10'\
-b'\xee\xef\xf7\x10\xf7\x10\xef\x10\xf6\xf0\xef\x10\xef\x10\xef\x0f'\
-b'\xf7\x10\xee\xef\xf7\x0f\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xce\xee\xad\xee\x8c\xe6\x6a\xc4\xc5\x92\xe1\xab\xa2'\
-b'\xdd\xe8\xe6\x4a\xe6\x6b\xe6\x8b\xee\x6c\xe6\x8b\xee\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8'\
-b'\xdd\xa7\xcd\x66\xc4\xe5\xbc\x64\xab\xe2\xa3\x61\x9b\x21\xa3\x41'\
-b'\xa3\xa2\xb4\x24\xc4\xe5\xd5\x87\xdd\xe9\xe6\x2a\xe6\x6a\xe6\x6b'\
-b'\xe6\x4a\xe6\x2a\xe6\x09\xcd\x05\x92\xe0\xa3\x41\xd5\xa8\xe6\x4a'\
-b'\xee\x8c\xe6\x8c\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xef\xee\xcf\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce'\
-b'\xee\xce\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xee\xad\xee\xad\xe6\x8c\xee\x8c\xee\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x29\xd5\x67\x9b\x41\x9b\x01\xcd\x26\xe6\x2a\xe6\x6a\xe6\x8b'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c'\
-b'\xe6\x8c\xee\x8b\xe6\x8c\xe6\x8b\xee\x8b\xe6\x8b\xe6\x8b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xde\x09\xdd\xc8\xd5\x67\xcd\x06\xbc\x85'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xee\xee\xce'\
-b'\xee\xce\xee\xad\xee\xac\xe6\x8c\xe6\x4a\xcd\x47\xab\xe3\x9b\x20'\
-b'\xab\xc2\xcd\x26\xde\x09\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x8b\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xe6\xac\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x29\xde\x29\xde\x08\xdd\xa7'\
-b'\xcc\xe5\xb4\x03\xa3\x61\x92\xe1\x93\x00\x92\xe0\x9b\x01\xb4\x23'\
-b'\xd5\x66\xdd\xe8\xde\x08\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b'\
-b'\xee\x8b\xe6\x8c\xee\x8c\xe6\xac\xee\xad\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef\xee\xce\xf6\xef'\
-b'\xee\xee\xee\xce\xee\xef\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\x8c\xe6\x4a\xc4\xc5\x9b\x21\xab\xa2\xcd\x46\xde\x09\xe6\x4a'\
-b'\xe6\x6b\xee\x8b\xee\x8c\xee\xad\xee\xcd\xee\xce\xee\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xef\x0f\xee\xef\xef\x10\xf6\xef\xef\x10\xf7\x10'\
-b'\xf6\xef\xef\x0f\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xe6\x8c\xe6\x6b\xe6\x2a'\
-b'\xc5\x06\x9b\x21\xa3\x61\xcd\x25\xde\x08\xe6\x29\xe6\x29\xe6\x29'\
-b'\xde\x08\xdd\xc8\xd5\x66\xc4\xc5\xb4\x23\xa3\x82\x9b\x21\x9b\x21'\
-b'\xa3\x82\xb4\x44\xcd\x06\xd5\xc8\xe6\x4a\xe6\x8c\xee\x8c\xee\xad'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x6b\xdd\xa8\xa3\x61'\
-b'\x9b\x01\xc5\x06\xe6\x4a\xee\x8c\xee\xcd\xee\xce\xee\xce\xee\xef'\
-b'\xf6\xef\xee\xef\xef\x0f\xef\x10\xf6\xf0\xf7\x0f\xef\x10\xf6\xf0'\
-b'\xf7\x10\xef\x10\xee\xf0\xf7\x0f\xef\x10\xf7\x10\xf6\xef\xf7\x10'\
-b'\xef\x10\xef\x0f\xee\xf0\xef\x0f\xf6\xef\xee\xef\xee\xef\xee\xee'\
-b'\xee\xee\xee\xce\xee\xad\xe6\x8c\xe6\x2a\xb4\x03\x92\xe0\xb4\x44'\
-b'\xe6\x2a\xe6\x8b\xee\x8c\xee\xad\xee\xac\xee\xad\xee\xad\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x2a\xe6\x29\xdd\xe8\xdd\xc7\xd5\x67\xcd\x05\xbc\x84'\
-b'\xb3\xe2\xa3\x81\x9b\x21\x9b\x41\xa3\x82\xb4\x03\xc4\xa5\xcd\x47'\
-b'\xdd\xc8\xdd\xe8\xdd\xe8\xc4\xe5\x93\x01\xa3\x41\xd5\x87\xe6\x4a'\
-b'\xe6\x6b\xee\x8c\xee\xac\xe6\xad\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xce\xf6\xce\xee\xce\xee\xee\xee\xce'\
-b'\xee\xce\xee\xef\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xcd\xe6\xad\xee\xac\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a'\
-b'\xe6\x2a\xdd\xe8\xab\xc2\x92\xe0\xbc\x64\xe6\x29\xe6\x6b\xe6\x6b'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\xac\xee\x8c\xee\x8c\xee\xac\xee\x8c'\
-b'\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\x8c\xe6\x8b\xe6\x8b\xee\x6b\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6a\xe6\x6b\xee\x8b\xe6\x8b\xee\x6b'\
-b'\xf6\xef\xee\xef\xf6\xee\xee\xee\xee\xce\xf6\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xee\x8c\xe6\x6b\xd5\xa8\xb4\x44\x9b\x21\xa3\x81\xc4\xc5'\
-b'\xdd\xe9\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xee\x6b\xe6\x6b\xee\x8b'\
-b'\xe6\x8c\xee\x8c\xe6\xac\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xac\xe6\xac\xee\x8c\xee\x8c\xee\x8c\xe6\x8b'\
-b'\xee\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09'\
-b'\xde\x08\xdd\xa7\xbc\x84\x9b\x01\x9b\x01\x9b\x21\x92\xe0\x9b\x00'\
-b'\xa3\x82\xbc\x64\xcd\x46\xdd\xc8\xde\x29\xe6\x49\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xee\x8c\xee\x8c\xe6\x8c\xee\xad\xee\xcd\xe6\xcd\xee\xcd'\
-b'\xee\xce\xee\xcd\xee\xce\xee\xcf\xee\xee\xee\xce\xee\xce\xee\xee'\
-b'\xee\xef\xee\xce\xee\xce\xf6\xee\xee\xce\xee\xcd\xee\xad\xee\x8c'\
-b'\xde\x29\xbc\x64\x9b\x21\xab\xe2\xd5\x66\xe6\x09\xe6\x4a\xe6\x6b'\
-b'\xee\x8c\xee\xad\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef'\
-b'\xef\x0f\xee\xf0\xf7\x10\xf7\x10\xf7\x10\xef\x10\xef\x10\xf6\xf0'\
-b'\xef\x10\xef\x10\xf6\xf0\xef\x0f\xf6\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xce\xee\xce\xee\xad\xe6\x8c\xe6\x6a\xd5\x46'\
-b'\xa3\x41\x9b\x21\xc4\xe5\xde\x09\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x2a\xe6\x29\xde\x08\xdd\xa7\xcd\x25\xbc\x84'\
-b'\xab\xc2\xa3\x41\x9b\x21\xa3\x41\xab\xe3\xbc\xa5\xd5\x67\xde\x09'\
-b'\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xcd\xee\xcd\xee\xad\xee\x8c\xe6\x4a\xb4\x44\x92\xe0'\
-b'\xb4\x03\xdd\xe8\xe6\x8b\xee\xad\xee\xce\xee\xce\xee\xef\xee\xee'\
-b'\xee\xef\xf6\xef\xef\x0f\xf6\xf0\xef\x0f\xef\x10\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xee\xf0\xf7\x10\xef\x10\xef\x10\xf6\xf0'\
-b'\xef\x10\xf7\x10\xf7\x0f\xee\xef\xef\x0f\xf6\xef\xee\xef\xf6\xef'\
-b'\xee\xce\xee\xce\xee\xad\xe6\x8b\xdd\xc8\xa3\x62\x92\xe0\xcd\x06'\
-b'\xe6\x6b\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xce\xee\xcd\xee\xad'\
-b'\xee\xad\xee\xad\xee\xac\xee\xad\xee\xac\xee\x8c\xe6\x8b\xee\x8b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29\xe6\x29\xde\x08'\
-b'\xdd\xc8\xd5\x87\xcd\x25\xc4\xa4\xb4\x03\xa3\x81\x9b\x41\x9b\x21'\
-b'\xa3\x61\xab\xc2\xbc\x64\xb4\x23\x92\xe0\x9b\x21\xd5\x87\xe6\x49'\
-b'\xe6\x4a\xe6\x6b\xe6\x8c\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xee\xee\xce\xee\xee\xee\xce\xee\xce'\
-b'\xee\xce\xee\xee\xee\xcf\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xcd\xee\xad\xee\xad\xe6\x8c\xee\x8c\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xde\x08\xbc\x84\x92\xe0\xa3\xa2\xdd\xe9\xe6\x6b\xee\x6b'\
-b'\xe6\x8c\xee\xac\xee\xac\xee\xad\xe6\xad\xee\xac\xe6\xad\xee\xad'\
-b'\xe6\xac\xee\xac\xee\xad\xe6\x8c\xee\xac\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8b'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xee\xef\xee\xee\xee\xce\xee\xcf\xee\xce\xee\xce\xee\xad\xee\xad'\
-b'\xe6\x8b\xde\x09\xc4\xa5\xa3\x61\xa3\x41\xbc\x64\xdd\xa8\xe6\x29'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xee\x6b\xe6\x8b\xe6\x6b\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\xac\xee\xad\xe6\xad\xee\xad\xee\xad\xe6\xcd\xee\xcd'\
-b'\xee\xcd\xee\xad\xe6\xad\xee\xad\xee\xad\xe6\xad\xee\xac\xee\x8c'\
-b'\xe6\x8c\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x2a\xde\x09'\
-b'\xd5\xa7\xbc\x44\x9b\x21\xa3\x61\xc4\xc4\xcd\x25\xbc\x84\xab\xc2'\
-b'\x9b\x21\x92\xe0\x9b\x21\xab\xc2\xc4\x84\xd5\x67\xde\x09\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xe6\x8b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xee\xf6\xcf\xee\xef'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xe6\x8b\xdd\xe9'\
-b'\xb4\x23\x9b\x01\xb4\x23\xd5\xa7\xe6\x29\xe6\x4a\xe6\x6b\xee\x8c'\
-b'\xee\xac\xe6\xad\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef\xef\x0f'\
-b'\xf7\x10\xf7\x10\xef\x0f\xee\xf0\xf7\x10\xef\x0f\xf6\xf0\xef\x10'\
-b'\xf7\x0f\xf7\x10\xee\xf0\xef\x0f\xef\x10\xee\xef\xf6\xef\xee\xef'\
-b'\xf6\xef\xee\xee\xee\xce\xee\xad\xee\xac\xe6\x6b\xd5\x88\xa3\x82'\
-b'\x9b\x21\xc4\xc4\xdd\xe8\xe6\x4a\xee\x6b\xee\x8c\xee\xad\xee\xac'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x2a\xe6\x09'\
-b'\xdd\xc7\xd5\x66\xc4\xe5\xb4\x23\xa3\x81\x9b\x21\x9b\x21\xa3\x82'\
-b'\xb4\x43\xc5\x06\xd5\xc8\xe6\x2a\xe6\x8b\xee\xac\xee\xac\xee\xad'\
-b'\xee\xac\xee\x8d\xee\x8c\xe6\x8c\xe6\x6a\xcd\x46\x9b\x21\x9b\x21'\
-b'\xcd\x46\xe6\x4a\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef'\
-b'\xf6\xef\xee\xef\xef\x10\xf6\xef\xef\x10\xf7\x10\xee\xef\xf6\xf0'\
-b'\xf7\x10\xee\xef\xef\x10\xf7\x10\xef\x10\xf6\xf0\xf7\x10\xef\x10'\
-b'\xf6\xf0\xef\x0f\xef\x10\xf6\xf0\xee\xf0\xee\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xad\xe6\x8b\xcd\x26\x93\x01\xa3\x41\xd5\xa8'\
-b'\xee\x8b\xee\xad\xe6\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xe6\xad\xee\xad\xee\x8c'\
-b'\xee\xac\xee\x8c\xee\x8c\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xe6\x09\xde\x08\xdd\xc7\xd5\x87\xd5\x25\xc4\xa4'\
-b'\xb4\x23\xa3\x82\x9b\x41\x9b\x01\x92\xe0\x9b\x01\xb4\x03\xc4\xe5'\
-b'\xd5\x87\xde\x09\xe6\x4a\xe6\x6b\xee\x8c\xe6\x8c\xee\xad\xee\xad'\
-b'\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xf6\xee\xee\xee\xee\xce\xee\xee\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xad\xee\xcd\xee\xad\xe6\xac\xe6\x8c\xee\x8b\xe6\x6b'\
-b'\xe6\x4a\xe6\x29\xcd\x26\x9b\x01\x9b\x21\xd5\x66\xe6\x4a\xe6\x8b'\
-b'\xee\x8c\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xad\xee\xac\xee\xad\xe6\xad'\
-b'\xee\xac\xe6\xac\xee\x8c\xee\xac\xe6\x8c\xee\x8c\xe6\xac\xee\x8c'\
-b'\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xce'\
-b'\xf6\xee\xee\xce\xee\xce\xee\xce\xee\xad\xee\xac\xee\x8c\xe6\x2a'\
-b'\xcd\x06\xa3\xa2\x9b\x21\xb3\xe3\xcd\x67\xde\x29\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\xad\xee\xad\xe6\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xad\xee\xcd\xee\xad\xee\xcd\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x09\xcd\x46'\
-b'\xab\xa2\x9b\x00\xb4\x03\xcd\x66\xdd\xe8\xe5\xe9\xde\x08\xdd\xc8'\
-b'\xcd\x26\xbc\x64\xa3\x82\x9b\x01\x92\xe0\x9b\x41\xab\xe3\xc4\xc5'\
-b'\xdd\xa7\xe6\x29\xe6\x6b\xe6\x6b\xe6\x8b\xe6\x8c\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xac\xe6\x8b\xd5\xa8\xab\xe3'\
-b'\x9b\x21\xbc\x63\xdd\xa7\xde\x29\xe6\x4b\xe6\x8b\xe6\x8c\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xef\xee\xef\xf6\xef\xef\x10\xef\x10\xf6\xf0'\
-b'\xef\x10\xef\x10\xf6\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10\xf6\xf0'\
-b'\xef\x10\xef\x10\xf7\x10\xf6\xef\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xce\xee\xad\xe6\x8b\xdd\xc8\xab\xc2\x9b\x00'\
-b'\xbc\x64\xdd\xe8\xe6\x4a\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\xac\xee\x8c\xe6\x8c\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8\xd5\xa7\xcd\x05\xbc\x84\xab\xc2'\
-b'\xa3\x41\x9b\x01\xa3\x41\xab\xc3\xbc\x85\xcd\x67\xde\x09\xe6\x4b'\
-b'\xe6\x6b\xe6\x8b\xe6\x8b\xe6\x6b\xdd\xe9\xab\xe3\x92\xe0\xbc\x44'\
-b'\xe6\x09\xe6\x8b\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xef\x0f\xee\xef\xf6\xf0\xef\x10\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xee\xf0\xf7\x0f\xef\x10\xef\x10\xf7\x0f'\
-b'\xef\x10\xf7\x10\xef\x0f\xf6\xef\xef\x0f\xf6\xef\xee\xef\xf6\xee'\
-b'\xee\xce\xee\xcd\xee\x8c\xe6\x4a\xbc\x44\x92\xe0\xab\xe3\xe6\x29'\
-b'\xe6\x8c\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xad\xe6\xad\xee\xac\xee\x8c\xee\x8c\xee\x8c\xe6\x8b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xde\x08'\
-b'\xdd\xc7\xd5\x86\xcd\x25\xb4\x23\x92\xe0\x92\xe0\x9b\x21\x9b\x21'\
-b'\x9b\x21\xab\xa2\xb4\x44\xc4\xe5\xd5\x88\xde\x09\xe6\x4a\xe6\x8b'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\xad\xee\xad\xee\xcd\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xce'\
-b'\xee\xce\xee\xad\xee\xcd\xee\xad\xee\xad\xe6\x8c\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x29\xd5\xa7\xa3\x61\x92\xe0\xc4\xa5\xe6\x4a\xe6\x8b'\
-b'\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xcd\xee\xcd'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xcd\xee\xad\xe6\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xad\xee\xcd\xee\xad'\
-b'\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef\xee\xef\xee\xee\xee\xef'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x6b\xcd\x67\xac\x03'\
-b'\x9b\x01\xa3\xa2\xcd\x06\xde\x09\xe6\x4a\xe6\x4a\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xee\x6c\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\xac\xe6\xac'\
-b'\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xad\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xe6\xad'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xe6\x6b\xe6\x4a\xdd\xe8\xbc\x84\x9b\x41'\
-b'\xa3\x41\xc4\xa5\xd5\xc7\xe6\x09\xe6\x29\xe6\x29\xe6\x2a\xe6\x29'\
-b'\xe6\x29\xde\x09\xdd\xc7\xcd\x25\xb4\x43\xa3\x62\x9b\x00\x92\xe0'\
-b'\xa3\x62\xb4\x03\xcd\x06\xdd\xc8\xe6\x4a\xe6\x6b\xe6\x8b\xee\xac'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xcd\xee\xcd\xee\xad\xee\xac\xe6\x6b\xd5\x67\xa3\x82\x9b\x21'\
-b'\xc4\xa4\xdd\xc8\xe6\x29\xe6\x6a\xe6\x6b\xee\x8c\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xef\xf6\xef\xee\xef\xef\x0f\xf6\xef\xf7\x0f\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf6\xef\xef\x10\xef\x10\xef\x0f\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xad\xee\x8c\xde\x09\xab\xe3\x9a\xe1\xb4\x23'\
-b'\xdd\xc8\xe6\x4a\xe6\x8c\xee\xad\xee\xce\xee\xce\xee\xee\xee\xee'\
-b'\xee\xee\xee\xef\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\xac\xe6\x8c\xee\x8c\xe6\x6b\xe6\x6a\xe6\x2a\xe6\x09\xdd\xc7'\
-b'\xd5\x66\xc4\xc5\xb4\x23\xa3\x81\x9b\x21\x9b\x21\xa3\x81\xb4\x23'\
-b'\xc4\xe6\xdd\xa8\xde\x09\xe6\x29\xc4\xc5\x9a\xe0\xa3\x61\xd5\x87'\
-b'\xe6\x4a\xe6\x8c\xee\xac\xee\xad\xee\xce\xee\xce\xee\xce\xee\xee'\
-b'\xf6\xef\xee\xef\xee\xef\xf7\x0f\xef\x0f\xee\xef\xf7\x10\xf7\x0f'\
-b'\xee\xf0\xf7\x10\xef\x10\xef\x10\xf6\xf0\xf7\x10\xee\xf0\xf7\x10'\
-b'\xf6\xf0\xef\x10\xef\x10\xee\xf0\xf7\x0f\xee\xef\xee\xef\xee\xef'\
-b'\xee\xce\xee\xad\xee\x8c\xde\x09\xa3\xa2\x92\xe0\xc4\xa5\xe6\x6b'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xe6\xad\xee\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x2a'\
-b'\xe6\x29\xe6\x09\xdd\xe8\xc4\xa4\x9a\xe1\x9b\x21\xc4\xc4\xc4\xc4'\
-b'\xbc\x63\xab\xc2\xa3\x61\x9b\x21\x9b\x21\xab\x82\xb4\x23\xc4\xc5'\
-b'\xcd\x67\xdd\xe9\xe6\x4a\xe6\x8b\xee\x8c\xee\x8c\xee\x8c\xee\xac'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xee\xcd\xee\xad\xe6\xad\xee\xac\xee\x8c\xe6\x8b\xee\x6b'\
-b'\xe6\x4a\xe6\x4a\xde\x08\xb4\x03\x92\xe0\xab\xe3\xe6\x09\xe6\x6b'\
-b'\xee\x8c\xee\xad\xee\xad\xee\xcd\xe6\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xcd\xee\xad\xee\xce'\
-b'\xee\xcd\xee\xcd\xee\xcd\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xf6\xef'\
-b'\xee\xad\xee\xad\xee\x8c\xe6\x6b\xd5\xc8\xbc\x44\x9b\x21\xa3\x61'\
-b'\xbc\xa4\xdd\xc8\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x6b\xee\x6b\xe6\x8b'\
-b'\xee\x8c\xe6\x8b\xee\x8c\xee\x8c\xe6\xac\xee\xad\xee\xad\xee\xcd'\
-b'\xee\xcd\xee\xae\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\xad\xee\xad'\
-b'\xee\xac\xe6\x8c\xe6\x6b\xe6\x4a\xd5\x87\xab\xe3\x9b\x01\xab\xe2'\
-b'\xcd\x46\xde\x08\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x09\xd5\xa7\xcc\xe5\xb4\x03'\
-b'\x9b\x61\x92\xe0\x93\x01\xa3\x62\xb4\x44\xcd\x46\xdd\xe9\xe6\x4a'\
-b'\xee\x8b\xe6\x8c\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xac\xe6\x8c\xe6\x4a\xcd\x26\xa3\x62\xa3\x41\xc4\xe5'\
-b'\xdd\xe8\xe6\x29\xe6\x6a\xe6\x8c\xee\xac\xee\xad\xee\xce\xee\xee'\
-b'\xee\xef\xee\xef\xf7\x0f\xef\x0f\xee\xf0\xf7\x10\xef\x10\xee\xf0'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf6\xf0'\
-b'\xef\x10\xef\x10\xf6\xef\xf6\xef\xef\x0f\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xad\xee\xac\xe6\x29\xb4\x44\x92\xe0\xab\xe2\xdd\xa7'\
-b'\xe6\x4a\xe6\x8b\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xee\xee\xef'\
-b'\xee\xce\xee\xce\xee\xad\xee\xad\xee\xac\xee\x8c\xe6\x8b\xe6\x6b'\
-b'\xe6\x4a\xe6\x29\xdd\xe8\xd5\x87\xcd\x05\xbc\x63\xab\xc2\x9b\x41'\
-b'\x9b\x01\x9b\x21\xab\xc2\xb4\x43\xa3\x61\x92\xe0\xbc\x84\xde\x08'\
-b'\xe6\x4a\xee\x8b\xe6\x8c\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xef\xee\xef\xf6\xef\xee\xef\xef\x0f\xee\xf0\xee\xef'\
-b'\xf7\x0f\xef\x10\xf6\xef\xf7\x0f\xef\x10\xef\x10\xf7\x0f\xef\x10'\
-b'\xef\x0f\xf6\xef\xee\xef\xf7\x0f\xee\xef\xee\xef\xf6\xef\xee\xee'\
-b'\xee\xce\xee\xad\xe6\x8c\xd5\x67\x9b\x01\x9b\x21\xd5\x67\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xce\xee\xef\xf6\xef\xee\xef\xee\xef\xf7\x0f'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x0f\xee\xf0\xf7\x0f\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xcd\xee\xcd'\
-b'\xee\xad\xee\xad\xee\x8c\xee\x8c\xee\x8c\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x29\xde\x09\xc4\xc5\x92\xe0\x9b\x21\xd5\x46\xdd\xe8'\
-b'\xdd\xc8\xdd\xa7\xd5\x66\xcd\x05\xbc\x84\xb4\x02\xa3\x82\x9b\x21'\
-b'\x9b\x21\xa3\x61\xb4\x03\xbc\xa5\xcd\x47\xdd\xe9\xde\x4a\xe6\x6b'\
-b'\xe6\x8c\xee\x8c\xee\xac\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xad\xee\x8c\xe6\x8c\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x09\xc4\xc5\x92\xe0\xa3\x41\xd5\xa8\xe6\x6b'\
-b'\xe6\x8c\xee\xac\xe6\xad\xee\xcd\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xef\x0f\xf6\xef\xef\x10\xef\x0f\xf7\x10'\
-b'\xee\x8c\xe6\x8b\xde\x09\xc4\xc5\xa3\x61\x9b\x21\xb4\x43\xd5\x87'\
-b'\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x6b\xee\x6b\xe6\x6b\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\xac\xee\xac\xee\xad\xee\xad\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xee\xad\xe6\xac'\
-b'\xe6\x8c\xee\x6b\xe6\x29\xc4\xc5\xa3\x41\x9b\x41\xbc\x84\xdd\xa7'\
-b'\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xdd\xe8'\
-b'\xd5\x87\xc4\xc5\xab\xe2\x9b\x21\x9a\xe0\x9b\x01\xa3\xa2\xbc\x64'\
-b'\xd5\x67\xde\x09\xe6\x6b\xe6\x6b\xe6\x8b\xee\x8c\xe6\xac\xee\x8c'\
-b'\xe6\x8c\xe6\x6b\xe6\x2a\xc4\xc5\x9b\x21\xa3\x82\xcd\x05\xdd\xe8'\
-b'\xe6\x49\xe6\x6b\xe6\x6b\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xf6\xf0\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xee\xef\xef\x10\xee\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xee\xac\xe6\x4a\xbc\x85\x9a\xe0\xab\xa2\xd5\x87\xe6\x4a'\
-b'\xe6\x8b\xee\xad\xee\xce\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xf7\x0f\xf6\xef\xef\x0f\xf7\x0f\xee\xef\xee\xef\xf6\xef\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\xac\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x29\xde\x09\xdd\xa7\xd5\x46'\
-b'\xc4\xa4\xb4\x02\xa3\x61\x92\xe1\x92\xc0\x92\xe1\xab\xc2\xc4\xc5'\
-b'\xd5\x88\xde\x09\xe6\x6b\xe6\x8b\xee\x8c\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef\xee\xef\xf6\xef\xf6\xef'\
-b'\xef\x0f\xee\xf0\xef\x0f\xee\xf0\xf6\xef\xef\x0f\xef\x10\xf6\xef'\
-b'\xee\xf0\xef\x10\xf7\x10\xee\xef\xf6\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xce\xee\xac\xe6\x6b\xbc\xa5\x92\xe0\xa3\x82\xdd\xe9\xee\x8c'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xf6\xef\xee\xf0'\
-b'\xee\xef\xf7\x10\xee\xf0\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x0f'\
-b'\xee\xf0\xf7\x0f\xf7\x0f\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xad\xee\xad\xe6\xad\xee\xac\xee\x8c\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x09\xc4\xe5\x92\xe0\x9b\x21\xd5\x66\xe6\x09'\
-b'\xde\x29\xe6\x29\xe6\x29\xde\x09\xde\x09\xdd\xc8\xd5\x87\xcd\x25'\
-b'\xc4\xa4\xb4\x23\xa3\x82\x9b\x21\x9b\x21\xa3\x41\xab\xc3\xbc\x84'\
-b'\xcd\x26\xd5\xc8\xe6\x2a\xe6\x6b\xe6\x8b\xe6\x8c\xee\x8c\xee\xac'\
-b'\xe6\x8c\xee\xac\xe6\xac\xee\x8c\xee\x8c\xe6\x8c\xe6\x8b\xee\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x29\xcd\x66\x9b\x41\x9b\x01\xc4\xe5\xe6\x4a'\
-b'\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xee\xee\xce\xee\xee\xee\xce\xee\xee'\
-b'\xee\xce\xee\xef\xee\xee\xee\xce\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xf7\x0f\xee\xef\xef\x10\xf7\x10\xf7\x10\xee\xef\xf7\x10\xf7\x10'\
-b'\xe6\x29\xcd\x26\xab\xa2\x9b\x01\xab\xc3\xcd\x46\xe6\x09\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x8c\xee\x8c\xee\x8c\xee\x8c'\
-b'\xee\x8c\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xce\xee\xee\xee\xce\xee\xce\xee\xee'\
-b'\xee\xce\xee\xce\xee\xce\xee\xad\xee\xcd\xe6\xad\xee\xac\xe6\x8c'\
-b'\xe6\x4a\xd5\xa8\xb4\x03\x9b\x00\xab\xa2\xcd\x26\xde\x08\xe6\x2a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x8b\xee\x8b\xe6\x8b\xee\x8c'\
-b'\xe6\x8b\xe6\x6b\xe6\x8c\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xe6\x29\xdd\xe8\xd5\x46\xbc\x84\xab\xc2\x9b\x21\x92\xe0'\
-b'\x9b\x01\xab\xc2\xbc\xa5\xd5\x87\xe6\x29\xe6\x4b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x09\xbc\x84\x9b\x01\xab\xa2\xcd\x45\xde\x08\xe6\x2a'\
-b'\xe6\x4a\xe6\x8b\xee\xac\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef'\
-b'\xf6\xef\xef\x0f\xef\x0f\xef\x10\xf7\x10\xee\xef\xef\x10\xf6\xf0'\
-b'\xef\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf6\xf0\xef\x10\xf6\xf0'\
-b'\xef\x0f\xee\xf0\xf7\x0f\xee\xef\xf6\xef\xee\xee\xee\xce\xee\xce'\
-b'\xee\xad\xe6\x4b\xc4\xc5\x9b\x01\xa3\x61\xcd\x46\xe6\x29\xe6\x6b'\
-b'\xee\xad\xee\xce\xee\xef\xee\xef\xf6\xef\xee\xef\xef\x0f\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xee\xef'\
-b'\xef\x10\xf6\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xce\xee\xad\xee\xad\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xe6\x29'\
-b'\xdd\xe8\xd5\xa7\xc4\xc4\x9b\x01\x9b\x00\xa3\x82\x9b\x41\x9b\x00'\
-b'\x9b\x41\xab\xc2\xbc\x85\xcd\x47\xdd\xe9\xe6\x6a\xe6\x8c\xee\xac'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xee\xee\xce\xee\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xf6\xef\xef\x0f\xf6\xf0\xef\x0f\xee\xef'\
-b'\xf7\x0f\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xad\xee\x8c\xe6\x29\xab\xc2\x92\xc0\xb4\x44\xe6\x4a\xee\xac'\
-b'\xee\xcd\xee\xce\xee\xef\xee\xef\xee\xef\xf7\x0f\xef\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xf6\xf0\xf7\x10\xee\xf0\xef\x10\xf7\x10'\
-b'\xef\x10\xef\x10\xf6\xf0\xef\x10\xf6\xef\xf6\xef\xef\x0f\xee\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xee\x8c'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xc4\xe5\x92\xe0\x9b\x41\xd5\x67\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x29'\
-b'\xde\x09\xdd\xe8\xdd\xa7\xd5\x66\xc4\xc4\xb4\x43\xab\xa2\xa3\x41'\
-b'\x9b\x21\x9b\x41\xab\xa2\xb4\x44\xcd\x06\xd5\x88\xde\x09\xe6\x4a'\
-b'\xe6\x8b\xee\x8c\xe6\x8c\xe6\x8c\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xdd\xc8\xab\xa2\x92\xc0\xb4\x44\xe6\x29'\
-b'\xe6\x8b\xee\x8c\xee\xad\xe6\xad\xee\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef\xee\xee\xee\xef\xee\xef'\
-b'\xee\xef\xee\xee\xee\xef\xf6\xef\xee\xef\xf6\xef\xef\x0f\xee\xef'\
-b'\xf7\x10\xf7\x10\xef\x0f\xf6\xf0\xef\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xab\xe3\x9b\x01\xa3\x82\xc4\xe5\xdd\xe8\xe6\x4a\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xee\x8c\xee\x8c\xe6\x8c\xe6\xac\xee\xac'\
-b'\xe6\xad\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xef\xee\xce\xee\xce\xee\xee\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xe6\x8c\xee\x8c\xe6\x2a'\
-b'\xc4\xe6\xa3\x61\x9b\x21\xb4\x64\xd5\xa7\xe6\x29\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\xac\xee\x8c\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xc7\xcd\x26\xbc\x44'\
-b'\xa3\x81\x9b\x01\x92\xe0\x9b\x21\xab\xc3\xc4\xc5\xd5\xa7\xe6\x09'\
-b'\xdd\xa8\xb4\x03\x93\x00\xab\xe2\xd5\x66\xdd\xe8\xe6\x2a\xe6\x4a'\
-b'\xe6\x8b\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xef\xf6\xef\xee\xf0\xf7\x0f\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xef\x10\xf6\xf0\xef\x10\xf7\x10\xef\x10\xf7\x0f\xef\x10'\
-b'\xee\xf0\xf7\x0f\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xac'\
-b'\xe6\x6b\xcd\x26\x9b\x21\x9b\x41\xcd\x05\xe6\x29\xe6\x6b\xee\xad'\
-b'\xee\xee\xee\xef\xee\xef\xf6\xef\xef\x0f\xf6\xf0\xf7\x10\xef\x10'\
-b'\xf6\xf0\xf7\x10\xef\x10\xf7\x10\xee\xf0\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x10\xf6\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xcd\xee\xad\xee\xac\xe6\x8b\xe6\x6b'\
-b'\xe6\x4a\xdd\xe8\xab\xe2\x92\xc0\xab\xe3\xd5\x66\xcd\x25\xc4\xa4'\
-b'\xb4\x03\xa3\x61\x9b\x01\x9b\x21\xa3\x61\xb4\x23\xc4\xe6\xd5\xa8'\
-b'\xe6\x4a\xe6\x8b\xee\x8c\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xf6\xef\xef\x0f\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce'\
-b'\xee\xad\xe6\x8c\xd5\xa8\x9b\x41\x9b\x00\xcd\x06\xe6\x6b\xee\xad'\
-b'\xee\xce\xee\xce\xee\xef\xee\xef\xf6\xef\xef\x10\xf6\xef\xf7\x10'\
-b'\xee\xf0\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xf6\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10\xee\xf0\xf7\x0f\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xac'\
-b'\xee\x8c\xe6\x6b\xe6\x4a\xc4\xc5\x9a\xe0\x9b\x41\xd5\x67\xe6\x29'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x08\xdd\xc8\xd5\x66'\
-b'\xc4\xe5\xbc\x44\xab\xc2\xa3\x61\x9b\x21\x9b\x41\xab\x82\xb4\x23'\
-b'\xc4\xc5\xd5\x87\xdd\xe9\xe6\x2a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xde\x29\xdd\xe8\xbc\x44\x92\xe0\xa3\x82\xdd\xc8'\
-b'\xe6\x6b\xe6\x8b\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xee\xee\xce\xee\xce\xf6\xef\xee\xcf\xee\xee\xf6\xce\xee\xef'\
-b'\xf6\xee\xee\xef\xee\xee\xf6\xef\xee\xef\xef\x0f\xf6\xf0\xef\x10'\
-b'\xf7\x0f\xef\x10\xf6\xf0\xef\x10\xf7\x0f\xee\xf0\xf7\x0f\xf7\x10'\
-b'\xa3\x62\xbc\x84\xdd\xc8\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b'\
-b'\xe6\x8b\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xee\xac\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xee\xee\xcf\xee\xee\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x8c\xe6\x6b\xdd\xc8\xb4\x44'\
-b'\x9b\x20\xa3\x82\xcd\x05\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xee\x8b\xe6\x8c\xe6\x8c\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xac\xee\xac\xee\x8c\xee\x8c'\
-b'\xe6\x6b\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xde\x08'\
-b'\xd5\xa7\xcd\x05\xb4\x23\xa3\x61\x92\xe0\x92\xe0\x9b\x41\xab\xe3'\
-b'\xa3\xa2\x9b\x00\xb4\x03\xd5\x66\xdd\xe8\xe6\x29\xe6\x4a\xe6\x6b'\
-b'\xe6\x8b\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xf6\xef'\
-b'\xee\xef\xee\xef\xef\x0f\xf7\x0f\xee\xf0\xef\x10\xf7\x10\xee\xef'\
-b'\xef\x10\xf7\x10\xef\x10\xf6\xf0\xef\x0f\xf6\xf0\xef\x10\xf6\xef'\
-b'\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xce\xee\xce\xee\xad\xee\x8b'\
-b'\xd5\x67\x9b\x41\x9b\x21\xc4\xc5\xde\x09\xe6\x6b\xee\xad\xee\xce'\
-b'\xee\xee\xee\xef\xf6\xef\xef\x0f\xf7\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xef\x10\xf7\x0f\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xad\xee\xad\xe6\x6b'\
-b'\xe6\x4a\xc4\xe6\x9b\x00\x9b\x41\xcd\x26\xe6\x09\xe6\x09\xde\x08'\
-b'\xdd\xc8\xd5\x87\xcd\x05\xbc\x63\xab\xa2\x9b\x41\x9b\x01\x9b\x41'\
-b'\xab\xc2\xbc\x85\xcd\x47\xde\x09\xe6\x6b\xee\x8c\xee\xac\xee\xad'\
-b'\xee\xad\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef\xee\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xf6\xef\xee\xee\xee\xce\xee\xce\xee\xcd'\
-b'\xee\x8c\xe6\x6b\xc4\xe5\x9a\xe1\x9b\x41\xd5\xa8\xee\x8b\xee\xad'\
-b'\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xef\x0f\xef\x10\xf7\x10'\
-b'\xef\x10\xf6\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x0f\xee\xef\xee\xef\xf6\xee\xee\xee\xee\xce\xee\xad'\
-b'\xe6\xac\xe6\x8c\xe6\x4a\xc4\xc5\x92\xe0\x9b\x41\xd5\x87\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xee\x8b\xee\x8b\xee\x8b\xee\x8b'\
-b'\xe6\x6b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x6a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xde\x09\xdd\xe8\xd5\x87\xcd\x05\xbc\x84\xab\xe2\xa3\x61'\
-b'\x9b\x21\x9b\x21\xa3\x62\xb4\x03\xc4\xa5\xcd\x46\xdd\xa8\xe6\x09'\
-b'\xe6\x29\xe6\x29\xde\x09\xde\x08\xcd\x05\x9b\x01\x9b\x00\xcd\x46'\
-b'\xe6\x4a\xee\x8b\xe6\x8c\xee\xac\xe6\xad\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef\xee\xee\xee\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xf7\x0f\xee\xf0\xf7\x0f\xef\x10'\
-b'\xef\x10\xf6\xef\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xdd\xc9\xe6\x4b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8b\xe6\x6b\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xee'\
-b'\xee\xee\xee\xce\xee\xce\xee\xef\xf6\xee\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xad\xee\x8c\xe6\x8b\xe6\x4a\xcd\x26\xa3\x82\x9b\x21'\
-b'\xb4\x23\xd5\x87\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x8b'\
-b'\xe6\x8c\xee\x8c\xee\xac\xee\xad\xe6\xad\xee\xcd\xee\xcd\xee\xce'\
-b'\xee\xcd\xee\xad\xee\xce\xee\xcd\xee\xad\xe6\xad\xee\xad\xe6\xad'\
-b'\xee\x8c\xee\x8c\xee\x8c\xe6\x8b\xe6\x8b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x2a\xde\x09\xdd\xe8\xd5\x67\xc4\xc5\xab\xe2\x9b\x01\x92\xc0'\
-b'\x92\xc0\x92\xe0\xab\xc2\xc4\xc5\xd5\xa7\xde\x09\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xee\x8c\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xf6\xef\xef\x0f\xee\xef\xf6\xf0'\
-b'\xef\x0f\xf7\x10\xee\xef\xef\x10\xf6\xf0\xef\x0f\xef\x0f\xee\xef'\
-b'\xf7\x0f\xee\xef\xee\xef\xee\xee\xee\xce\xee\xac\xee\x8b\xd5\xa8'\
-b'\xa3\x82\x9b\x01\xbc\x64\xdd\xe8\xe6\x6b\xee\xac\xee\xce\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xf0\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xf7\x11\xef\x10\xf7\x11\xf7\x11\xef\x10\xf7\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xef\x10\xf6\xf0\xf7\x10\xef\x10\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x6b'\
-b'\xdd\xe8\xab\xa2\x92\xe0\xbc\x44\xe6\x09\xe6\x6a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xde\x09\xdd\xc8\xd5\x46\xc4\xc4\xb4\x03'\
-b'\xa3\x61\x9b\x01\x9b\x21\xa3\x61\xb4\x03\xc4\xe6\xd5\xa8\xe6\x2a'\
-b'\xee\x8b\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xce\xee\xee\xee\xce\xee\xee\xee\xce\xee\xce\xee\xad'\
-b'\xee\x8c\xe6\x4a\xb4\x03\x92\xc0\xab\xe3\xe6\x29\xe6\x8c\xee\xad'\
-b'\xee\xce\xee\xce\xee\xef\xf6\xef\xef\x0f\xf6\xf0\xef\x10\xf6\xf0'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf6\xf0\xef\x10\xee\xf0'\
-b'\xf7\x0f\xee\xf0\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xce\xee\xce'\
-b'\xee\xad\xee\x8b\xe6\x2a\xc4\xc5\x92\xe0\x9b\x21\xd5\x87\xe6\x4a'\
-b'\xe6\x8b\xee\x8c\xee\x8c\xe6\xac\xee\x8c\xe6\x8d\xe6\xad\xee\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xe6\x09\xdd\xe8\xd5\xa7'\
-b'\xcd\x26\xc4\xa4\xb4\x03\xa3\x81\x9b\x21\x9b\x21\x9b\x61\xab\xc2'\
-b'\xbc\x64\xc5\x06\xd5\x87\xdd\xa7\xd5\x66\x9b\x61\x92\xc0\xbc\x84'\
-b'\xe6\x2a\xe6\x6b\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xf6\xee\xee\xef\xf6\xee'\
-b'\xee\xef\xee\xee\xf6\xef\xee\xef\xef\x0f\xf7\x10\xee\xf0\xf7\x0f'\
-b'\xf7\x10\xef\x10\xf6\xf0\xef\x0f\xf7\x10\xee\xef\xf7\x10\xef\x10'\
-b'\xee\xad\xee\xac\xee\xad\xee\xad\xee\xac\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xe6\xac\xee\xac\xe6\xad\xee\xad\xee\xcd\xee\xce\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xef'\
-b'\xee\xee\xee\xee\xee\xce\xee\xef\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xee\xac\xe6\x8b\xdd\xe9\xbc\x64\x9b\x21\xa3\x61\xc4\xe5'\
-b'\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x6b\xee\x6b\xe6\x8b\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xcd\xee\xae\xee\xad\xee\xac\xee\x8c\xee\x8c\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x29\xde\x08\xdd\xc7\xc4\xa4\x9b\x21\x9b\x21'\
-b'\xab\xa2\x9b\x21\x92\xe0\x9b\x00\xa3\x62\xbc\x43\xcd\x26\xdd\xe9'\
-b'\xe6\x4a\xe6\x8b\xee\x8c\xee\xac\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xf6\xef\xee\xef\xef\x0f'\
-b'\xf6\xef\xef\x0f\xf6\xf0\xef\x0f\xef\x0f\xf6\xef\xee\xef\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xce\xee\xce\xee\xad\xee\x8c\xdd\xc9\xa3\xa2'\
-b'\x92\xe0\xb4\x23\xdd\xe8\xe6\x6a\xee\x8c\xee\xce\xee\xee\xee\xef'\
-b'\xf6\xef\xef\x0f\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11'\
-b'\xef\x11\xf7\x10\xef\x11\xf7\x11\xef\x10\xf7\x31\xf7\x11\xef\x11'\
-b'\xf7\x11\xef\x10\xf7\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xf6\xef'\
-b'\xef\x0f\xee\xef\xee\xef\xee\xee\xee\xce\xee\xad\xee\x8c\xe6\x4b'\
-b'\xbc\x85\x92\xe0\xa3\x62\xd5\xa7\xe6\x6b\xe6\x8c\xee\xac\xee\xad'\
-b'\xee\xac\xee\xac\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8'\
-b'\xd5\x87\xcd\x05\xbc\x63\xab\xc2\x9b\x21\x9b\x00\x9b\x41\xab\xc2'\
-b'\xbc\x85\xcd\x47\xdd\xe9\xe6\x6a\xee\x8c\xee\xac\xee\xad\xee\xad'\
-b'\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xac'\
-b'\xe6\x6b\xdd\xc8\xa3\x62\x92\xe0\xbc\x85\xe6\x6b\xee\x8c\xee\xcd'\
-b'\xee\xce\xee\xef\xee\xee\xee\xef\xf6\xef\xef\x0f\xef\x10\xf7\x0f'\
-b'\xf7\x10\xee\xf0\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x11'\
-b'\xf7\x10\xef\x10\xf7\x11\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x0f\xef\x0f\xf6\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xad\xe6\x8c\xe6\x4a\xc4\xc5\x92\xe0\x9b\x21\xd5\x87\xe6\x6b'\
-b'\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xcd\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xee\xac\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x8b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xdd\xe8\xd5\xa7\xcd\x46\xc4\xa4\xb4\x23\xa3\x82'\
-b'\x9b\x21\x9b\x00\x9b\x41\xab\xa2\xb4\x03\xa3\x41\x92\xc0\xab\xa2'\
-b'\xdd\xc8\xe6\x49\xe6\x6a\xe6\x6b\xe6\x8c\xee\x8c\xee\xad\xe6\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xee\xee\xcf\xee\xce\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xef\x0f\xf6\xf0\xee\xef'\
-b'\xef\x10\xf7\x0f\xef\x10\xf7\x10\xee\xf0\xf7\x10\xef\x10\xf7\x10'\
-b'\xee\xce\xee\xcd\xee\xcd\xee\xce\xee\xad\xee\xcd\xe6\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xee\xee\xce\xee\xee'\
-b'\xee\xcf\xee\xef\xee\xce\xee\xce\xee\xee\xee\xce\xee\xcd\xee\xad'\
-b'\xee\x8c\xe6\x4b\xcd\x67\xab\xa2\x9b\x01\xac\x03\xd5\x67\xe6\x09'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xee\x6b\xe6\x8c\xee\x8c\xee\x8c\xee\xad'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xcd\xe6\xad\xee\xad\xee\x8c\xe6\x8c'\
-b'\xee\x6b\xe6\x4b\xe6\x4a\xdd\xe8\xc4\xa5\x9b\x21\xa3\x61\xc4\xc4'\
-b'\xd5\x86\xcd\x25\xbc\x64\xa3\xa2\x9b\x01\x92\xe0\x9b\x01\xab\xa2'\
-b'\xbc\x84\xd5\x67\xde\x2a\xe6\x6b\xee\x8c\xe6\xac\xee\xad\xee\xae'\
-b'\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xce\xee\xce\xee\xad\xee\x8c\xde\x09\xac\x03\x9a\xe0'\
-b'\xab\xe2\xdd\xa8\xe6\x4a\xee\x8c\xee\xce\xee\xee\xee\xef\xf6\xef'\
-b'\xee\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x11\xf7\x10'\
-b'\xf7\x11\xef\x11\xf7\x30\xf7\x11\xf7\x11\xef\x10\xf7\x10\xf7\x31'\
-b'\xef\x10\xf7\x11\xef\x11\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xf6\xef\xf6\xef\xee\xef\xee\xcf\xee\xce\xee\xad\xe6\x8b\xd5\xa8'\
-b'\xa3\x41\x93\x00\xc4\xa5\xe6\x4a\xee\x8c\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xac\xe6\x8c\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xde\x09\xdd\xc7\xd5\x46\xc4\xa4\xb4\x03\xa3\x61'\
-b'\x9b\x00\x9b\x01\xa3\x61\xb4\x23\xc4\xe6\xd5\x88\xe6\x2a\xe6\x6b'\
-b'\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xad\xee\xac\xee\xac\xe6\x8c'\
-b'\xe6\x6b\xcd\x26\x93\x00\x9b\x01\xcd\x46\xe6\x6b\xee\xac\xee\xad'\
-b'\xee\xce\xee\xce\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xf0\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x11\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xee\xf0'\
-b'\xf7\x10\xee\xf0\xf7\x10\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xad\xee\x8c\xe6\x49\xc4\xc5\x92\xe0\x9b\x21\xd5\x87\xee\x6b'\
-b'\xe6\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xe6\xcd\xee\xad\xee\xad\xe6\xad\xee\xad\xee\xac\xee\x8c'\
-b'\xe6\x8c\xee\xac\xee\x8c\xee\x8c\xee\x8b\xe6\x8b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x08\xdd\xc8'\
-b'\xd5\x46\xc4\xc5\xb4\x43\xa3\xa2\x9b\x21\x93\x00\x92\xe1\x93\x01'\
-b'\xb4\x03\xc4\xc5\xcd\x67\xdd\xe8\xe6\x2a\xe6\x6b\xe6\x8b\xee\x8c'\
-b'\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xf6\xee\xee\xee\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xf7\x0f'\
-b'\xee\xef\xee\xf0\xf6\xef\xef\x0f\xf7\x10\xef\x0f\xf6\xef\xf7\x10'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xee\xee\xce\xee\xef\xee\xee\xee\xef\xee\xce\xee\xce'\
-b'\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xe6\x8b'\
-b'\xde\x09\xbc\xa5\x9b\x21\x9b\x41\xc4\xa4\xdd\xc8\xe6\x29\xe6\x4a'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8c\xee\x8c\xe6\xac\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xef\xee\xce\xee\xef\xee\xef\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xee\xee\xef\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xe6\xac'\
-b'\xe6\x8b\xe6\x6b\xdd\xe8\xbc\x84\x9b\x01\xa3\x81\xcd\x05\xdd\xe8'\
-b'\xde\x09\xe6\x09\xdd\xe8\xdd\xa7\xcd\x05\xb4\x43\xa3\x81\x93\x01'\
-b'\x92\xe0\x9b\x21\xab\xc2\xc4\xa5\xd5\xa8\xe6\x2a\xe6\x8b\xee\x8c'\
-b'\xee\xac\xee\xad\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xf6\xef\xee\xee'\
-b'\xee\xce\xee\xce\xee\xcd\xee\x8c\xe6\x29\xb4\x44\x92\xe0\xab\xa2'\
-b'\xd5\x87\xe6\x4a\xee\x8c\xee\xcd\xee\xce\xee\xef\xf6\xef\xef\x0f'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11\xef\x11\xf7\x10'\
-b'\xef\x11\xf7\x30\xef\x31\xf7\x30\xef\x31\xf7\x31\xef\x11\xf7\x30'\
-b'\xf7\x11\xef\x11\xf7\x30\xf7\x10\xef\x11\xf7\x10\xf7\x10\xee\xf0'\
-b'\xef\x0f\xee\xef\xee\xef\xee\xce\xee\xcd\xee\x8c\xe6\x2a\xb4\x23'\
-b'\x92\xe0\xab\xa2\xdd\xe8\xe6\x8b\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xef\xee\xee\xee\xee\xee\xcf\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xad\xee\x8c\xee\x8c\xe6\x6b\xe6\x4a\xde\x29\xdd\xe8\xd5\x87'\
-b'\xc5\x05\xbc\x63\xab\xc2\x9b\x21\x93\x00\x9b\x21\xab\xc2\xbc\x84'\
-b'\xcd\x47\xdd\xe9\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c\xe6\x8c\xe6\x6b'\
-b'\xe6\x29\xbc\x44\x92\xc0\xa3\x82\xdd\xe8\xee\x8b\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xf7\x0f\xef\x0f\xee\xef'\
-b'\xf7\x10\xef\x10\xf6\xf0\xef\x10\xef\x10\xf7\x10\xef\x11\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x11\xef\x10\xf7\x11\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xee\xef\xf7\x0f\xee\xef\xee\xee\xee\xce'\
-b'\xee\xcd\xee\x8c\xe6\x4a\xc4\xa5\x92\xe0\x9b\x21\xd5\x88\xe6\x8b'\
-b'\xee\xac\xee\xad\xee\xce\xee\xce\xee\xce\xee\xee\xee\xce\xee\xee'\
-b'\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad'\
-b'\xee\xad\xee\xad\xe6\xac\xe6\xac\xee\x8c\xee\x8c\xee\x8c\xee\x8b'\
-b'\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xe6\x29\xdd\xe8\xdd\xa7\xd5\x66\xbc\x84\x9b\x01\x92\xe0'\
-b'\x92\xe0\x9b\x01\x9b\x21\xa3\x62\xb4\x03\xc4\xc5\xcd\x67\xdd\xe9'\
-b'\xe6\x4a\xe6\x6b\xe6\x8c\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xce\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xf7\x0f\xee\xef\xef\x0f\xf6\xf0\xee\xef\xef\x10\xee\xf0\xef\x0f'\
-b'\xee\xce\xee\xcd\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xce\xee\xce\xee\xce\xee\xee\xee\xcf\xee\xee\xee\xef'\
-b'\xf6\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x6b\xd5\x87'\
-b'\xab\xc3\x9b\x00\xab\xc2\xcd\x46\xe6\x09\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x8b\xee\x8c\xe6\x8c\xee\xac\xee\xac\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef\xef\x0f\xee\xf0'\
-b'\xf7\x0f\xef\x10\xf6\xef\xef\x0f\xf7\x0f\xee\xef\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c'\
-b'\xe6\x6b\xdd\xe9\xb4\x44\x9b\x00\xab\xc2\xcd\x46\xde\x09\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xd5\x87\xcc\xe5'\
-b'\xb4\x03\xa3\x61\x92\xe1\x92\xe0\x9b\x41\xab\xe3\xc4\xe6\xdd\xc8'\
-b'\xe6\x4a\xe6\x8c\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xee\xee\xee\xee\xee\xee\xce\xee\xee\xee\xee\xee\xce'\
-b'\xee\xce\xee\xad\xee\x8c\xe6\x4a\xbc\x84\x93\x00\xa3\x61\xcd\x46'\
-b'\xe6\x29\xe6\x8b\xee\xcd\xee\xce\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x11\xef\x11\xf7\x10\xf7\x31'\
-b'\xf7\x31\xef\x11\xf7\x10\xf7\x11\xf7\x10\xef\x11\xf7\x30\xef\x11'\
-b'\xf7\x31\xf7\x10\xef\x11\xf7\x11\xef\x10\xef\x10\xf7\x10\xee\xf0'\
-b'\xf7\x0f\xee\xef\xee\xce\xee\xce\xee\xad\xe6\x8b\xcd\x47\x9b\x01'\
-b'\x9b\x01\xc5\x06\xe6\x4a\xee\xad\xee\xcd\xee\xce\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xf7\x0f\xee\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x8c\xee\x8b\xe6\x6b'\
-b'\xe6\x2a\xde\x09\xdd\xc7\xcd\x46\xc4\xa4\xb4\x03\xa3\x61\x9b\x01'\
-b'\x9b\x01\xa3\x61\xac\x03\xc4\xc6\xd5\x88\xde\x09\xe6\x4a\xe6\x4a'\
-b'\xdd\xc8\xa3\x82\x92\xc0\xb4\x23\xe6\x2a\xe6\x6b\xe6\x8c\xee\xad'\
-b'\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef\xef\x0f'\
-b'\xee\xf0\xf7\x0f\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x11\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xee\xf0\xef\x0f\xee\xef\xee\xef\xf6\xef\xee\xce'\
-b'\xee\xae\xe6\x8c\xe6\x4a\xc4\xa4\x92\xe0\x9b\x21\xd5\xa7\xee\x8b'\
-b'\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xee\xee\xee\xee\xee\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xcd\xee\xad\xee\xad\xee\xad\xe6\xad\xee\xad\xe6\x8c'\
-b'\xee\x8c\xe6\x8c\xee\x8b\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x4a\xe6\x2a\xde\x29\xde\x09\xdd\xa7\xa3\xa2\x92\xc0'\
-b'\xab\xa2\xc4\xc4\xbc\x64\xab\xe2\xa3\x61\x9b\x01\x9b\x00\xa3\x61'\
-b'\xab\xe3\xbc\xa5\xcd\x47\xdd\xc8\xe6\x2a\xe6\x6b\xee\x8c\xee\xac'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xf7\x0f\xf7\x0f'\
-b'\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xef\xee\xee\xee\xce\xee\xef\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xad\xee\xac\xe6\x8b\xe6\x2a\xc4\xc5\x9b\x41'\
-b'\x9b\x21\xbc\x64\xdd\xc8\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b'\
-b'\xee\x8c\xe6\x8c\xee\x8c\xee\xad\xee\xad\xee\xad\xee\xce\xee\xee'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xef\xef\x0f\xf7\x10\xf7\x10'\
-b'\xef\x10\xf6\xf0\xef\x10\xee\xf0\xf6\xf0\xef\x0f\xf6\xef\xf6\xef'\
-b'\xee\xef\xee\xee\xee\xee\xee\xce\xee\xce\xee\xad\xe6\xac\xe6\x8b'\
-b'\xdd\xc8\xb3\xe3\x9b\x00\xb4\x03\xd5\x67\xe6\x09\xe6\x4a\xe6\x4a'\
-b'\xe6\x6b\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29'\
-b'\xde\x09\xd5\x87\xc4\xc4\xab\xe3\xa3\x41\x92\xe0\x92\xe0\xa3\x41'\
-b'\xb4\x24\xcd\x26\xdd\xe9\xe6\x4a\xee\x8b\xee\x8c\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\xad\xee\x8c\xe6\x4a\xc4\xc5\x9b\x01\x9b\x41\xcd\x06\xe6\x29'\
-b'\xe6\x6b\xee\xad\xee\xce\xee\xce\xee\xef\xf6\xef\xf7\x0f\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x11\xf7\x10\xef\x11\xef\x30'\
-b'\xf7\x11\xf7\x30\xef\x31\xef\x31\xf7\x31\xf7\x30\xef\x11\xf7\x31'\
-b'\xf7\x10\xef\x11\xf7\x30\xf7\x10\xef\x10\xf7\x10\xef\x10\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xce\xee\xcd\xee\x8c\xde\x09\xab\xc2\x92\xe0'\
-b'\xb4\x03\xde\x09\xee\x8c\xee\xcd\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xf6\xef\xf7\x0f\xef\x10\xf6\xef\xef\x10\xf6\xef\xef\x0f\xf6\xef'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xad'\
-b'\xee\x8c\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8\xd5\x67\xc4\xe5'\
-b'\xb4\x43\xab\xa2\x9b\x21\x9b\x00\x9b\x21\xab\xa2\xb4\x44\xcd\x05'\
-b'\xc4\xe5\x9b\x01\x93\x00\xc4\xe5\xe6\x2a\xe6\x6b\xee\x8c\xee\xac'\
-b'\xee\xad\xee\xce\xee\xce\xee\xce\xee\xef\xf6\xef\xee\xef\xf6\xef'\
-b'\xef\x0f\xee\xef\xef\x10\xf7\x10\xee\xf0\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x11\xf7\x10\xf7\x10'\
-b'\xee\xf0\xf7\x10\xf7\x10\xf6\xf0\xef\x0f\xee\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xee\x8c\xe6\x4a\xbc\xa5\x92\xe0\x9b\x21\xd5\x88\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xce\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xef\x0f\xf7\x0f\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad'\
-b'\xee\xac\xee\xac\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8\xb4\x23\x92\xe0'\
-b'\xa3\x41\xd5\x66\xdd\xe8\xdd\xc8\xd5\xa7\xcd\x26\xbc\xa5\xb4\x03'\
-b'\xa3\x81\x9b\x21\x9b\x01\x9b\x41\xab\xe3\xbc\x84\xcd\x26\xd5\xc8'\
-b'\xde\x2a\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\x8c\xee\x8c\xe6\xac\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce'\
-b'\xee\xee\xee\xcf\xee\xce\xee\xee\xee\xce\xf6\xcf\xee\xee\xee\xce'\
-b'\xee\xce\xee\xad\xee\x8c\xe6\x6b\xd5\xa8\xab\xe3\x9b\x00\xa3\x82'\
-b'\xcd\x06\xde\x09\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\xad\xee\xad\xee\xad\xe6\xce\xee\xce\xee\xee\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xf7\x0f\xee\xf0\xf7\x10\xef\x10\xee\xf0'\
-b'\xf7\x10\xef\x0f\xf6\xef\xef\x10\xef\x0f\xf6\xef\xef\x10\xee\xef'\
-b'\xee\xef\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x6b\xd5\x88'\
-b'\xab\xa2\x93\x01\xb4\x43\xd5\xa7\xe6\x29\xe6\x4a\xe6\x6b\xee\x8c'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xac\xe6\x8c\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8\xd5\x66\xbc\x84\xab\xc2\x9b\x21'\
-b'\x92\xe0\x92\xe0\xa3\x62\xb4\x44\xcd\x47\xde\x09\xe6\x6b\xe6\x8b'\
-b'\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xad\xee\xcd\xee\xad\xee\xad'\
-b'\xe6\x8c\xe6\x6a\xc5\x06\x9b\x21\x9b\x21\xc4\xc5\xde\x08\xe6\x6b'\
-b'\xee\xad\xee\xcd\xee\xee\xee\xef\xf6\xef\xef\x0f\xee\xf0\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x11\xef\x11\xf7\x11\xf7\x30\xf7\x11'\
-b'\xef\x31\xf7\x11\xf7\x10\xf7\x10\xef\x11\xf7\x11\xf7\x30\xef\x11'\
-b'\xf7\x11\xf7\x10\xef\x11\xf7\x11\xef\x10\xf7\x10\xf7\x10\xef\x0f'\
-b'\xee\xef\xee\xef\xee\xce\xee\xad\xe6\x6b\xc4\xc5\x9a\xe1\x9b\x41'\
-b'\xd5\x67\xe6\x8b\xee\xad\xee\xce\xee\xce\xee\xef\xee\xef\xf7\x0f'\
-b'\xee\xf0\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x0f\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x49'\
-b'\xde\x08\xdd\xa7\xcd\x46\xbc\x84\xb3\xe2\xa3\x61\x9b\x00\x93\x01'\
-b'\x9b\x21\x92\xe0\x9b\x01\xc4\xc5\xdd\xe8\xe6\x49\xe6\x6b\xe6\x8c'\
-b'\xee\xac\xee\xac\xee\xad\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef'\
-b'\xee\xef\xf6\xef\xf6\xef\xef\x0f\xee\xef\xf7\x10\xf7\x10\xee\xf0'\
-b'\xf7\x10\xef\x10\xf7\x10\xf6\xf0\xef\x10\xf7\x10\xef\x10\xee\xf0'\
-b'\xf7\x10\xef\x10\xef\x0f\xee\xef\xf7\x0f\xee\xef\xf6\xef\xee\xce'\
-b'\xee\xcd\xee\xac\xe6\x4a\xc4\xa4\x92\xe0\x9b\x21\xd5\x87\xee\x8b'\
-b'\xee\xad\xee\xad\xee\xce\xee\xef\xf6\xef\xee\xef\xf7\x0f\xef\x0f'\
-b'\xf6\xf0\xee\xf0\xef\x10\xf7\x10\xee\xef\xf7\x0f\xf6\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xee\xee\xee\xee\xee\xee\xce\xee\xce'\
-b'\xee\xce\xee\xad\xee\xad\xee\xad\xee\xac\xe6\xac\xee\x8c\xee\x8c'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x2a\xde\x09\xc4\xe5\x9b\x00'\
-b'\x93\x01\xc4\xe5\xde\x08\xe6\x29\xe6\x29\xe6\x29\xe6\x29\xde\x09'\
-b'\xdd\xc8\xd5\x46\xc4\xc5\xb4\x23\xa3\xa2\x9b\x21\x9b\x01\x9b\x41'\
-b'\xab\xa2\xbc\x44\xc5\x06\xd5\xa8\xde\x2a\xe6\x6b\xee\x8b\xee\xac'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xf6\xee\xee\xee\xf6\xef'\
-b'\xcd\x47\xde\x09\xe6\x6b\xe6\x8b\xee\x8c\xee\xad\xe6\xad\xee\xcd'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\xac\xe6\x8c\xe6\x29\xc4\xe6\xa3\x61\x9b\x01\xb4\x43\xdd\xa7'\
-b'\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b\xee\x8c\xe6\x8c\xee\x8c'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xcd\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf6\xf0\xee\xef\xef\x10\xf6\xef\xee\xef'\
-b'\xee\xef\xf6\xee\xee\xce\xee\xae\xee\xac\xe6\x6b\xcd\x47\xa3\x61'\
-b'\x9b\x21\xbc\x84\xdd\xc8\xe6\x29\xe6\x6b\xe6\x8b\xee\xac\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xee\x8c\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x29\xdd\xc8\xcd\x26'\
-b'\xbc\x64\xab\x82\x9b\x00\x92\xe0\x9b\x00\xa3\x82\xbc\x64\xd5\x67'\
-b'\xde\x09\xe6\x6b\xee\x8c\xe6\x8c\xee\x8c\xee\xac\xee\x8c\xe6\x8b'\
-b'\xe6\x4a\xd5\x47\xa3\x41\x9b\x00\xbc\x84\xdd\xe8\xe6\x6a\xee\x8c'\
-b'\xee\xad\xee\xce\xee\xcf\xee\xef\xee\xef\xf7\x0f\xee\xef\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x11\xef\x10\xf7\x31\xef\x11\xef\x30'\
-b'\xf7\x11\xef\x30\xf7\x31\xef\x31\xf7\x30\xef\x11\xf7\x31\xf7\x10'\
-b'\xef\x11\xf7\x31\xf7\x10\xef\x10\xf7\x10\xef\x10\xee\xf0\xf6\xef'\
-b'\xee\xef\xee\xce\xee\xcd\xee\x8c\xdd\xc8\xa3\x61\x92\xe0\xbc\x64'\
-b'\xe6\x4a\xee\x8c\xee\xcd\xee\xce\xee\xef\xee\xef\xf7\x0f\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xf6\xf0\xef\x10\xf7\x10\xef\x10\xf7\x10\xee\xef\xf7\x0f\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xad\xee\xad\xee\x8c'\
-b'\xe6\x6b\xe6\x6b\xe6\x2a\xde\x08\xdd\xc8\xd5\x66\xc4\xc4\xb4\x03'\
-b'\x9b\x00\x92\xc0\x92\xe0\x9b\x01\xa3\x82\xbc\x44\xcd\x06\xd5\xc8'\
-b'\xe6\x2a\xe6\x8b\xee\x8c\xee\xac\xee\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xef\x0f\xee\xef'\
-b'\xf6\xf0\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf6\xf0\xf7\x10'\
-b'\xef\x10\xf7\x10\xee\xf0\xf6\xef\xee\xf0\xee\xef\xee\xee\xee\xce'\
-b'\xee\xae\xe6\x8c\xe6\x4a\xbc\xa5\x92\xe0\x9b\x21\xd5\x87\xe6\x8c'\
-b'\xee\xad\xee\xce\xee\xee\xee\xee\xee\xef\xf6\xef\xef\x0f\xef\x10'\
-b'\xf7\x10\xf7\x0f\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xf7\x10\xef\x0f\xf6\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xcd\xee\xad\xee\xad\xee\xac\xe6\x8c'\
-b'\xee\x8c\xee\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x29\xd5\x87\xa3\x41'\
-b'\x92\xc0\xb4\x44\xde\x08\xe6\x29\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x49\xde\x29\xdd\xe8\xd5\x87\xc4\xe5\xbc\x44'\
-b'\xab\xa2\x9b\x41\x9b\x01\x9b\x21\xa3\x82\xb4\x23\xc4\xe6\xd5\x88'\
-b'\xde\x09\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce'\
-b'\x9b\x01\xab\xc2\xc4\xe5\xdd\xe9\xe6\x4a\xe6\x6b\xee\x8c\xe6\x8c'\
-b'\xee\xad\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xac\xee\x8c'\
-b'\xe6\x6b\xdd\xc8\xb4\x24\x9b\x00\xa3\x61\xc4\xe5\xdd\xe9\xe6\x4a'\
-b'\xe6\x6a\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c\xee\x8c\xee\xac\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xef\xee\xef\xf6\xef\xef\x10'\
-b'\xf6\xf0\xef\x10\xef\x10\xf6\xf0\xef\x0f\xf6\xf0\xef\x10\xee\xf0'\
-b'\xf6\xf0\xef\x10\xf7\x0f\xee\xf0\xf7\x0f\xef\x0f\xee\xef\xf6\xef'\
-b'\xee\xee\xee\xce\xee\xad\xee\xac\xe6\x6b\xc4\xe6\x9b\x41\xa3\x41'\
-b'\xc4\xc5\xdd\xe8\xe6\x4a\xe6\x6b\xee\x8c\xee\xad\xee\xce\xee\xce'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xee\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a'\
-b'\xe6\x29\xd5\xa7\xcd\x05\xb4\x23\xa3\x62\x93\x00\x92\xe0\x9b\x01'\
-b'\xab\xc2\xbc\xa5\xd5\x87\xde\x29\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xd5\x87\xa3\x82\x92\xe0\xb4\x23\xdd\xc8\xe6\x4a\xee\x8c\xee\xad'\
-b'\xee\xce\xee\xce\xee\xee\xee\xef\xf6\xef\xef\x0f\xee\xf0\xf7\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xf7\x10\xf7\x11\xf7\x11'\
-b'\xf7\x30\xf7\x11\xef\x11\xf7\x10\xf7\x11\xef\x30\xf7\x11\xef\x10'\
-b'\xf7\x31\xef\x10\xf7\x10\xef\x10\xef\x10\xf6\xf0\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\x8c\xe6\x4a\xb4\x64\x92\xe0\xa3\x62\xd5\xa8'\
-b'\xe6\x8b\xee\xad\xee\xce\xee\xef\xee\xef\xf7\x0f\xef\x10\xf6\xf0'\
-b'\xef\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xee\xef\xf6\xef\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xce'\
-b'\xee\xad\xee\xac\xee\x8c\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8\xcd\x26'\
-b'\x9b\x21\x92\xe0\xab\xa2\xab\xe2\xa3\x61\x93\x00\x9b\x00\xa3\x61'\
-b'\xab\xe3\xc4\xc5\xd5\x88\xde\x2a\xe6\x6b\xee\x8c\xee\xac\xee\xad'\
-b'\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xf7\x0f\xee\xef\xee\xef\xf6\xf0\xf7\x0f\xef\x10\xef\x0f'\
-b'\xf6\xef\xee\xef\xf7\x0f\xef\x10\xf6\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xee\x8c\xe6\x4a\xc4\xa5\x92\xe0\x9b\x21\xd5\x87\xee\x8b'\
-b'\xee\xad\xee\xce\xee\xce\xee\xef\xf6\xef\xef\x0f\xee\xf0\xf7\x10'\
-b'\xee\xef\xef\x10\xf6\xf0\xef\x10\xf7\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xee\xf0\xf6\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\xad\xee\xad'\
-b'\xee\xad\xe6\x8c\xee\x8b\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8\xab\xe3'\
-b'\x92\xc0\xa3\x82\xdd\xc7\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x6a\xe6\x4a'\
-b'\xe6\x6b\xe6\x6a\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a'\
-b'\xde\x09\xd5\xa7\xcd\x06\xbc\x64\xab\xc2\xa3\x41\x9b\x00\x9b\x21'\
-b'\xa3\x62\xb4\x03\xbc\xc5\xcd\x67\xdd\xe9\xe6\x4b\xe6\x8c\xee\xac'\
-b'\x92\xe0\x92\xc0\x9a\xe1\xa3\xa2\xc4\xc5\xdd\xc8\xe6\x4a\xe6\x6b'\
-b'\xe6\x8c\xee\xac\xee\xad\xe6\xad\xee\xcd\xee\xcd\xee\xad\xee\xce'\
-b'\xee\xcd\xee\xce\xee\xcd\xee\xad\xee\xad\xee\x8c\xe6\x8c\xe6\x4a'\
-b'\xcd\x06\xa3\x82\x93\x00\xb4\x03\xd5\x87\xe6\x29\xe6\x4a\xe6\x6b'\
-b'\xe6\x6b\xee\x6b\xee\x8c\xe6\x8c\xee\xac\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xee\xee\xce\xee\xef\xee\xef\xf7\x0f\xee\xef\xee\xf0'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x0f\xf7\x10\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xce\xee\xcd\xee\x8c\xe6\x4a\xbc\xa5\x9b\x00\xa3\x61\xcd\x05'\
-b'\xde\x08\xe6\x4a\xe6\x6b\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xef'\
-b'\xee\xef\xee\xef\xf6\xef\xf6\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c'\
-b'\xe6\x8b\xe6\x6b\xe6\x4a\xde\x09\xd5\xa7\xc4\xe5\xb4\x03\xa3\x41'\
-b'\x92\xe0\x92\xe0\x9b\x21\xab\xc3\xc4\xc5\xd5\x87\xde\x09\xd5\x87'\
-b'\xab\xa2\x92\xe0\xab\xe3\xd5\xa7\xe6\x29\xe6\x6b\xe6\xac\xee\xad'\
-b'\xee\xce\xee\xce\xee\xce\xee\xef\xee\xef\xf6\xef\xef\x0f\xf7\x0f'\
-b'\xee\xf0\xef\x10\xf7\x10\xef\x10\xf7\x11\xef\x10\xef\x30\xf7\x11'\
-b'\xef\x11\xef\x10\xf7\x31\xf7\x11\xef\x10\xf7\x11\xf7\x11\xf7\x11'\
-b'\xef\x10\xf7\x11\xef\x10\xf7\x10\xf7\x10\xef\x0f\xf6\xef\xee\xef'\
-b'\xee\xce\xee\xad\xee\x8c\xcd\x67\x9b\x21\x9a\xe0\xc4\xc5\xe6\x6a'\
-b'\xee\xad\xee\xce\xee\xef\xee\xef\xf6\xef\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x11\xf7\x11\xef\x11\xf7\x11\xf7\x11'\
-b'\xf7\x11\xef\x11\xf7\x11\xf7\x10\xf7\x11\xef\x10\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x0f\xf6\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xce\xee\xad\xee\xac\xe6\x8c\xe6\x6b\xe6\x29\xc4\xc5'\
-b'\x92\xe0\x9b\x01\xc4\xe5\xd5\xa7\xd5\x46\xc4\xe5\xb4\x43\xa3\xa2'\
-b'\x9b\x21\x9a\xe0\x9b\x21\xa3\xa2\xbc\x44\xcd\x26\xdd\xe9\xe6\x4a'\
-b'\xe6\x8c\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xee\xee\xee'\
-b'\xf6\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xef\x10\xf6\xef\xee\xf0'\
-b'\xef\x0f\xf7\x10\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xee\xee\xce'\
-b'\xee\xad\xee\x8c\xe6\x4a\xbc\xa4\x92\xe0\x9b\x21\xd5\x67\xe6\x6b'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xef\xee\xef\xf7\x0f\xee\xef\xf7\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf6\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xcd\xee\xad'\
-b'\xee\xad\xee\xac\xe6\x8c\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x09\xbc\x84'\
-b'\x92\xe0\x9b\x21\xcd\x46\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x6a'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x4a\xde\x09\xd5\xc8\xcd\x26\xbc\x85'\
-b'\xab\xe3\xa3\x61\x9b\x01\x9b\x21\xa3\x61\xab\xe3\xbc\x85\xcd\x26'\
-b'\xb4\x24\xa3\x41\x92\xe0\x92\xc0\x92\xe0\xa3\x82\xbc\x84\xdd\xa8'\
-b'\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c\xee\x8c\xee\xad\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xe6\xac\xee\x8c\xe6\x6b\xdd\xc8\xb4\x44'\
-b'\x9b\x21\x9b\x41\xc4\xa5\xdd\xe8\xe6\x2a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x8c\xe6\x8c\xee\xac\xee\xad\xe6\xad\xee\xce\xee\xce'\
-b'\xee\xef\xee\xef\xee\xef\xef\x0f\xf7\x10\xee\xf0\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xee\xef\xf6\xf0\xef\x0f\xef\x10\xf6\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xad\xee\x8c\xde\x0a\xb4\x44\x9b\x01\xa3\xa2\xcd\x46\xe6\x29'\
-b'\xe6\x4b\xe6\x6b\xee\xac\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xf7\x0f\xef\x0f\xee\xef\xef\x10\xf7\x0f\xef\x10\xef\x0f\xf7\x0f'\
-b'\xf6\xef\xee\xef\xef\x0f\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xce'\
-b'\xee\xad\xee\xad\xe6\x8c\xee\x6b\xe6\x4a\xe6\x29\xdd\xe8\xd5\x67'\
-b'\xc4\xa4\xab\xc2\x9b\x21\x92\xe0\x92\xe0\xa3\x21\xab\xe3\xab\xa2'\
-b'\x92\xe0\xab\x82\xd5\x46\xde\x09\xe6\x4a\xee\x6b\xee\x8c\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xef\xf6\xef\xee\xef\xee\xef\xf6\xf0'\
-b'\xef\x0f\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11\xf7\x10'\
-b'\xf7\x10\xf7\x31\xef\x10\xf7\x10\xf7\x31\xef\x10\xef\x30\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x10\xee\xf0\xee\xef\xee\xef\xee\xee'\
-b'\xee\xcd\xee\x8c\xde\x29\xab\xe3\x92\xe0\xab\xa2\xdd\xe9\xe6\x8c'\
-b'\xee\xad\xee\xce\xee\xef\xf6\xef\xef\x0f\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x11\xf7\x11\xef\x30\xf7\x31\xef\x11\xf7\x30\xef\x31'\
-b'\xf7\x31\xf7\x10\xef\x31\xef\x11\xf7\x11\xf7\x11\xef\x10\xf7\x11'\
-b'\xf7\x10\xef\x10\xf7\x10\xf6\xf0\xee\xf0\xf7\x0f\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xce\xee\xce\xee\xcd\xee\x8c\xe6\x6b\xe6\x29\xb4\x03'\
-b'\x92\xc0\xa3\x61\xd5\xa7\xe6\x29\xe6\x29\xe6\x09\xdd\xe8\xdd\xa7'\
-b'\xcd\x26\xbc\xa4\xb3\xe2\xa3\x61\x9b\x01\x93\x00\x9b\x41\xac\x03'\
-b'\xc4\xc5\xd5\x88\xe6\x2a\xe6\x6b\xee\xac\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xf6\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce'\
-b'\xee\xcd\xee\x8c\xe6\x4a\xbc\x84\x92\xe0\x9b\x21\xd5\x67\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xce\xee\xef\xee\xef\xf7\x0f\xee\xf0\xef\x10'\
-b'\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x11\xf7\x11'\
-b'\xef\x10\xf7\x11\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x0f\xef\x0f\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce'\
-b'\xee\xce\xee\xad\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xe6\x29\xcd\x46'\
-b'\x9b\x01\x92\xe0\xbc\x84\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b'\
-b'\xe6\x8b\xee\x8b\xe6\x8c\xe6\x8b\xee\x6b\xee\x8b\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xee\x6a\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x29\xdd\xc8\xcd\x47\xc4\xa5\xb4\x03\xa3\x81\x9b\x21\x9b\x01'\
-b'\xe6\x29\xd5\x87\xbc\x64\xa3\x61\x92\xe0\x92\xc0\x92\xe0\xa3\x41'\
-b'\xbc\x64\xd5\x87\xe6\x2a\xe6\x6b\xe6\x6b\xe6\x8c\xe6\x8c\xe6\xac'\
-b'\xee\xac\xe6\x8c\xe6\x8c\xee\x6b\xe6\x4a\xcd\x46\xa3\xa2\x9a\xe0'\
-b'\xab\xc2\xcd\x46\xe6\x09\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b'\
-b'\xee\x8c\xe6\xac\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce\xee\xee'\
-b'\xee\xef\xf6\xef\xee\xef\xf6\xef\xef\x10\xf7\x10\xef\x0f\xf6\xf0'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xee\xf0'\
-b'\xef\x10\xf6\xef\xee\xef\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xad'\
-b'\xee\x8c\xdd\xe9\xac\x03\x9b\x00\xab\xe2\xd5\x87\xe6\x29\xe6\x4b'\
-b'\xe6\x8b\xee\xad\xee\xce\xee\xce\xee\xef\xee\xef\xf7\x0f\xee\xf0'\
-b'\xf7\x10\xf7\x10\xf7\x10\xf7\x10\xef\x10\xf6\xf0\xf7\x10\xef\x10'\
-b'\xef\x10\xf6\xf0\xef\x0f\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xcd\xee\xad\xee\xac\xe6\x8c\xe6\x6b\xe6\x4a'\
-b'\xe6\x29\xdd\xc8\xcd\x46\xbc\x64\xab\x82\x9b\x00\x92\xc0\x92\xc0'\
-b'\x92\xe0\xa3\xa2\xc4\xc5\xdd\xa7\xe6\x29\xe6\x6b\xe6\x8b\xe6\x8c'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef'\
-b'\xef\x0f\xee\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xef\x10'\
-b'\xef\x10\xf7\x11\xf7\x10\xef\x11\xf7\x10\xf7\x11\xf7\x11\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf6\xf0\xf7\x0f\xee\xef\xee\xee\xee\xce'\
-b'\xee\xad\xe6\x6b\xcc\xe6\x9b\x01\x9b\x01\xcd\x06\xe6\x6b\xee\xac'\
-b'\xee\xce\xee\xee\xf6\xef\xef\x0f\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x11\xef\x10\xf7\x31\xf7\x11\xef\x11\xf7\x31\xf7\x11\xef\x11'\
-b'\xf7\x31\xef\x11\xf7\x31\xf7\x31\xef\x31\xf7\x30\xf7\x11\xef\x11'\
-b'\xf7\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xee\xef\xef\x0f\xee\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xcd\xee\xad\xe6\x8b\xd5\xc8\xa3\x62'\
-b'\x92\xe0\xb4\x23\xe6\x2a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x2a\xe6\x09\xdd\xe8\xd5\x66\xc4\xe5\xbc\x43\xab\xa2\x9b\x21'\
-b'\x9a\xe0\x9b\x21\xa3\x82\xbc\x44\xcd\x26\xdd\xc9\xe6\x4a\xe6\x8c'\
-b'\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xee'\
-b'\xee\xef\xee\xef\xee\xee\xee\xef\xf6\xee\xee\xef\xee\xce\xee\xce'\
-b'\xee\xad\xe6\x8c\xe6\x4a\xbc\x84\x92\xe0\x9b\x21\xd5\x67\xee\x6b'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xef\xf6\xef\xef\x0f\xef\x0f\xf7\x10'\
-b'\xf6\xf0\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11\xf7\x10\xef\x10'\
-b'\xf7\x11\xef\x10\xf7\x10\xf7\x11\xf7\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xf6\xf0\xef\x10\xf7\x10\xf6\xef\xf6\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xcd\xee\xac\xe6\x8c\xee\x8b\xe6\x4a\xe6\x4a\xdd\xa7'\
-b'\xa3\x82\x92\xc0\xab\xe3\xdd\xe8\xe6\x4a\xe6\x6b\xee\x8c\xe6\x8c'\
-b'\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xee\x8c\xee\x8c\xee\x8b\xe6\x8b\xe6\x6c\xee\x8b\xe6\x8b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x6a\xe6\x2a\xdd\xe9\xd5\x88\xc5\x06'\
-b'\xee\x6b\xe6\x6b\xe6\x2a\xd5\x87\xbc\x64\xa3\x62\x92\xe0\x92\xc0'\
-b'\x92\xe0\x9b\x41\xb4\x44\xd5\x67\xe6\x29\xe6\x4a\xe6\x6b\xee\x8b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xdd\xe9\xbc\x64\x9b\x21\x9b\x21\xbc\x64'\
-b'\xdd\xc8\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x8b\xee\x8c'\
-b'\xe6\x8c\xee\xac\xee\xad\xee\xad\xee\xce\xee\xee\xee\xee\xee\xef'\
-b'\xee\xef\xef\x0f\xf6\xf0\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xee\xf0\xef\x0f\xf6\xf0'\
-b'\xef\x0f\xee\xef\xef\x0f\xee\xef\xee\xce\xee\xce\xee\xad\xe6\x8b'\
-b'\xd5\xa8\xab\xc2\x9b\x00\xb4\x03\xd5\xa7\xe6\x2a\xe6\x6b\xee\x8b'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xf7\x0f\xef\x10\xf7\x10\xef\x10'\
-b'\xef\x10\xef\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xee\xef\xf7\x0f\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xee\xee\xcf\xee\xce\xee\xce\xee\xad\xee\xad\xe6\x8c'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8\xd5\x66\xab\xc2\x92\xe0\x93\x01'\
-b'\x9b\x00\x92\xc0\x93\x00\xa3\x62\xb4\x44\xcd\x46\xdd\xe9\xe6\x6b'\
-b'\xee\x8b\xee\x8c\xee\xad\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xf6\xf0\xf7\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xee\xef\xef\x0f\xee\xef\xee\xef\xee\xce\xee\xad'\
-b'\xee\x8c\xdd\xe8\xa3\x82\x92\xe0\xac\x03\xe6\x29\xee\x8c\xee\xce'\
-b'\xee\xee\xee\xef\xee\xef\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11'\
-b'\xf7\x11\xf7\x31\xef\x31\xf7\x31\xf7\x11\xef\x31\xf7\x31\xf7\x31'\
-b'\xf7\x31\xf7\x31\xef\x11\xf7\x11\xf7\x11\xef\x31\xf7\x11\xf7\x31'\
-b'\xef\x11\xf7\x11\xf7\x10\xef\x10\xf7\x10\xf7\x10\xee\xf0\xf6\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xae\xee\xac\xe6\x6b\xcd\x26\x9b\x01'\
-b'\x92\xe0\xc4\xe5\xe6\x4a\xe6\x8c\xee\xac\xee\xad\xee\xac\xee\xac'\
-b'\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xe6\x29\xde\x09\xd5\xa7\xcd\x46'\
-b'\xc4\xa4\xab\xe2\xa3\x61\x93\x00\x9b\x01\x9b\x41\xab\xe3\xc4\xc5'\
-b'\xd5\x88\xde\x09\xe6\x6b\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xac\xee\x8c\xe6\x4a\xbc\x84\x92\xe0\x9b\x21\xd5\x67\xe6\x8b'\
-b'\xee\xac\xee\xce\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x11\xf7\x10\xf7\x30'\
-b'\xef\x11\xf7\x30\xef\x11\xf7\x10\xef\x11\xf7\x10\xf7\x11\xef\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xee\xef\xee\xef\xf6\xef'\
-b'\xee\xee\xee\xce\xee\xad\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xde\x08'\
-b'\xb4\x23\x92\xe0\xa3\x41\xd5\x87\xe6\x4a\xee\x6b\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xee\xac\xee\x8c\xe6\xac\xe6\x8c'\
-b'\xe6\xac\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c'\
-b'\xee\x8b\xee\x8c\xee\x8b\xe6\x8c\xe6\x8c\xee\xac\xee\xac\xee\xad'\
-b'\xee\xad\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x29\xd5\xa7\xbc\x84\xa3\x82'\
-b'\x92\xe1\x92\xc0\x92\xc0\x9b\x21\xb4\x03\xcd\x46\xde\x09\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xcd\x47\xab\xc2\x92\xe0\xa3\xa2\xcd\x06\xde\x08'\
-b'\xe6\x29\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x8b\xee\x8c\xee\x8d'\
-b'\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xef\xee\xef'\
-b'\xf6\xef\xf6\xf0\xef\x0f\xf7\x10\xee\xf0\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xee\xf0\xef\x0f'\
-b'\xf6\xef\xee\xef\xf6\xef\xee\xce\xee\xce\xee\xad\xe6\x6b\xd5\x67'\
-b'\xa3\x62\x9b\x01\xbc\x64\xd5\xc8\xe6\x2a\xe6\x6b\xee\x8c\xee\xad'\
-b'\xee\xce\xee\xef\xee\xef\xf6\xf0\xef\x10\xf6\xf0\xef\x10\xf7\x10'\
-b'\xf7\x10\xf7\x10\xf7\x11\xf7\x10\xf7\x10\xf7\x11\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf6\xef\xef\x0f'\
-b'\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xcd\xee\xad'\
-b'\xee\xac\xe6\x6b\xe6\x4a\xde\x09\xbc\x84\x9b\x01\x9b\x01\xbc\x84'\
-b'\xc4\xc5\xb4\x03\xa3\x61\x92\xe0\x92\xe0\x9b\x01\xab\xa2\xbc\x84'\
-b'\xd5\x67\xde\x2a\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xf0'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf6\xef\xef\x0f\xf6\xef\xee\xef\xee\xce\xee\xce\xee\xac'\
-b'\xe6\x6a\xbc\x85\x92\xe0\x9b\x41\xd5\x67\xe6\x6b\xee\xad\xee\xce'\
-b'\xee\xef\xf6\xef\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11\xef\x11'\
-b'\xf7\x30\xef\x11\xf7\x11\xef\x31\xf7\x31\xf7\x31\xef\x31\xf7\x11'\
-b'\xf7\x31\xef\x31\xf7\x31\xf7\x31\xef\x31\xf7\x11\xef\x31\xf7\x10'\
-b'\xf7\x31\xef\x10\xf7\x11\xf7\x10\xef\x10\xef\x10\xf7\x10\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xce\xee\xcd\xee\x8c\xe6\x4a\xb4\x64\x92\xe0'\
-b'\x9b\x21\xd5\x88\xee\x8b\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xad\xee\xad\xee\xac\xe6\x8c\xe6\x8b\xee\x6b\xe6\x4a'\
-b'\xe6\x09\xdd\xe8\xd5\x87\xc4\xe5\xbc\x43\xab\xa2\x9b\x21\x93\x00'\
-b'\x9b\x21\xab\x82\xb4\x44\xcd\x26\xdd\xc9\xe6\x4a\xee\x8c\xee\x8c'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xad\xee\xcd\xee\xad'\
-b'\xee\xac\xe6\x8b\xe6\x2a\xbc\x64\x92\xc0\x9b\x21\xd5\x67\xe6\x6b'\
-b'\xee\xac\xee\xad\xee\xce\xee\xef\xee\xef\xee\xef\xf7\x0f\xef\x10'\
-b'\xf6\xf0\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x11\xf7\x10'\
-b'\xf7\x10\xef\x11\xf7\x30\xf7\x10\xef\x30\xf7\x11\xef\x10\xf7\x30'\
-b'\xf7\x10\xef\x11\xf7\x10\xf7\x10\xef\x10\xf6\xf0\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xcd\xee\xad\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x29'\
-b'\xc4\xe5\x9a\xe1\x93\x00\xc4\xe6\xe6\x4a\xe6\x6b\xee\x8c\xee\x8c'\
-b'\xe6\xac\xee\xac\xee\xac\xe6\xac\xee\xac\xee\xad\xee\xad\xee\xac'\
-b'\xee\xad\xee\xac\xee\xad\xe6\xac\xee\xac\xee\xad\xe6\x8c\xee\xac'\
-b'\xe6\x8c\xee\xad\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xad\xee\xad\xee\x8c\xee\x8c\xe6\x6b\xe6\x4a\xe6\x09\xd5\xa7'\
-b'\xc4\xa5\xa3\x82\x9a\xe0\x92\xe0\x92\xe0\x9b\x01\xab\xe3\xcd\x05'\
-b'\xd5\x87\xbc\x84\x9b\x21\x9b\x01\xb4\x23\xd5\x87\xe6\x09\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xee\x8c\xe6\xac\xee\xad'\
-b'\xee\xcd\xe6\xad\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef'\
-b'\xef\x0f\xef\x10\xf7\x10\xef\x10\xf7\x10\xee\xf0\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xee\xf0\xf7\x0f\xee\xef\xf7\x0f\xee\xef'\
-b'\xee\xef\xee\xef\xee\xce\xee\xcd\xee\xac\xe6\x6b\xcd\x06\x9b\x41'\
-b'\x9b\x21\xbc\xa4\xdd\xe8\xe6\x4a\xe6\x6b\xee\x8c\xee\xad\xee\xee'\
-b'\xee\xef\xee\xef\xf7\x0f\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x11\xef\x11\xf7\x10\xef\x11\xef\x11\xf7\x10\xf7\x11\xef\x11'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf6\xf0\xef\x10\xf6\xf0'\
-b'\xf7\x0f\xf6\xef\xee\xef\xf6\xef\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\x8c\xe6\x8c\xe6\x4a\xcd\x06\x9b\x21\x9b\x00\xbc\x84\xdd\xc7'\
-b'\xde\x08\xdd\xe8\xd5\x67\xc4\xc5\xab\xe2\x9b\x41\x92\xe0\x92\xe0'\
-b'\x9b\x21\xab\xc2\xbc\xa5\xd5\xa8\xe6\x4a\xe6\x8b\xee\x8c\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xf6\xee\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xef\x0f\xee\xef\xf6\xf0\xee\xef\xef\x10\xef\x10\xee\xef\xee\xf0'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xad\xee\x8c'\
-b'\xd5\x67\x9b\x41\x92\xe0\xbc\x64\xe6\x2a\xee\xac\xee\xcd\xee\xee'\
-b'\xee\xef\xee\xef\xf7\x10\xef\x10\xf7\x10\xef\x11\xf7\x10\xf7\x31'\
-b'\xef\x11\xf7\x31\xf7\x31\xef\x11\xf7\x31\xf7\x31\xf7\x11\xf7\x31'\
-b'\xef\x31\xf7\x11\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x11\xef\x31'\
-b'\xf7\x11\xef\x31\xf7\x10\xef\x11\xf7\x10\xf7\x10\xef\x0f\xee\xef'\
-b'\xf6\xef\xee\xee\xee\xce\xee\xad\xe6\x8c\xde\x09\xab\xa2\x92\xc0'\
-b'\xab\xc3\xe6\x09\xe6\x8c\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee'\
-b'\xee\xce\xee\xef\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad'\
-b'\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x4a\xde\x09\xdd\xa7\xcd\x46\xc4\x84'\
-b'\xab\xe2\xa3\x61\x9b\x01\x93\x00\x9b\x41\xab\xe3\xbc\xa5\xd5\x87'\
-b'\xde\x09\xe6\x6b\xee\x8c\xee\x8c\xee\x8c\xee\xac\xee\xad\xe6\x8c'\
-b'\xee\x8c\xe6\x6b\xe6\x29\xbc\x64\x92\xe0\x9b\x01\xd5\x67\xe6\x6b'\
-b'\xe6\xac\xee\xad\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xef\x0f'\
-b'\xef\x0f\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x31\xf7\x10'\
-b'\xef\x31\xf7\x10\xf7\x11\xef\x10\xf7\x11\xf7\x30\xf7\x11\xef\x10'\
-b'\xf7\x11\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x0f\xf7\x0f'\
-b'\xee\xef\xee\xee\xee\xce\xee\xad\xee\x8c\xe6\x6b\xe6\x4a\xe6\x4a'\
-b'\xd5\x67\x9b\x41\x92\xc0\xb4\x23\xe6\x29\xe6\x6b\xee\x8c\xe6\xac'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xcd\xee\xad'\
-b'\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef'\
-b'\xee\xce\xee\xcd\xee\xad\xee\xad\xe6\x8c\xe6\x6b\xe6\x4b\xe6\x2a'\
-b'\xe6\x09\xd5\xa7\xc4\xc5\xa3\x82\x92\xe0\x92\xc0\x92\xc0\x9b\x01'\
-b'\xa3\x61\x92\xe1\x9b\x41\xc4\xc4\xdd\xc7\xde\x09\xe6\x29\xe6\x2a'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x8c\xee\x8c\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xf0\xf6\xf0\xef\x0f\xf6\xf0\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf6\xf0\xef\x10\xf7\x10\xee\xef\xef\x10\xee\xef\xf6\xef'\
-b'\xee\xee\xee\xce\xee\xae\xee\xac\xe6\x4a\xc4\xa5\x9b\x21\x9b\x41'\
-b'\xc4\xe5\xe6\x08\xe6\x4a\xe6\x8b\xee\x8c\xee\xcd\xee\xee\xee\xef'\
-b'\xee\xef\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xf7\x11\xf7\x11'\
-b'\xef\x10\xf7\x31\xf7\x31\xf7\x31\xf7\x31\xef\x30\xf7\x11\xf7\x31'\
-b'\xef\x10\xf7\x11\xf7\x11\xef\x10\xf7\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xee\xef\xef\x0f\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xad'\
-b'\xee\x8c\xe6\x6a\xcd\x47\xa3\x41\x92\xe0\xb4\x43\xdd\xc8\xe6\x2a'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29\xdd\xe8\xd5\x67\xc4\xa4\xab\xc2'\
-b'\x9b\x21\x92\xc0\x92\xe0\x9b\x21\xb3\xe3\xc4\xe6\xd5\xc8\xe6\x4a'\
-b'\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce\xee\xee\xf6\xef'\
-b'\xee\xef\xee\xef\xf6\xef\xee\xef\xf6\xef\xf6\xef\xee\xef\xf7\x0f'\
-b'\xee\xef\xee\xef\xf6\xef\xee\xee\xee\xce\xee\xad\xee\x8c\xe6\x2a'\
-b'\xac\x03\x92\xc0\xa3\x62\xd5\xa8\xee\x8b\xee\xad\xee\xce\xee\xef'\
-b'\xf6\xef\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11\xef\x31\xf7\x11'\
-b'\xf7\x31\xef\x11\xf7\x31\xf7\x31\xf7\x31\xef\x11\xf7\x31\xf7\x31'\
-b'\xf7\x31\xef\x31\xf7\x11\xf7\x31\xef\x11\xf7\x31\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x30\xf7\x11\xef\x10\xef\x10\xf7\x10\xef\x10\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xce\xee\xad\xee\x8b\xd5\x67\x9b\x21\x92\xe0'\
-b'\xbc\x84\xe6\x6a\xee\x8c\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xee'\
-b'\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xe6\x29'\
-b'\xdd\xe8\xd5\x87\xc4\xe5\xbc\x43\xab\xa2\x9b\x21\x9a\xe0\x9b\x21'\
-b'\xa3\x82\xb4\x44\xcd\x06\xd5\xc8\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x8c'\
-b'\xee\x8b\xe6\x6b\xe6\x29\xbc\x64\x92\xc0\x9b\x20\xcd\x67\xe6\x6b'\
-b'\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef'\
-b'\xf6\xf0\xef\x10\xf7\x10\xee\xf0\xf7\x10\xf7\x10\xef\x10\xef\x11'\
-b'\xf7\x10\xf7\x10\xef\x30\xf7\x11\xef\x10\xf7\x10\xef\x10\xf7\x11'\
-b'\xef\x30\xf7\x10\xf7\x11\xef\x10\xf7\x10\xef\x10\xee\xf0\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xce\xee\xad\xee\xac\xe6\x8b\xe6\x6b\xe6\x4a'\
-b'\xdd\xe8\xab\xc2\x92\xe0\xa3\x82\xdd\xe8\xe6\x6b\xee\x8c\xee\xac'\
-b'\xee\xad\xee\xcd\xe6\xcd\xee\xad\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xcd\xee\xcd\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee'\
-b'\xee\xef\xee\xef\xee\xef\xf7\x0f\xef\x10\xf6\xef\xef\x10\xf7\x10'\
-b'\xee\xce\xee\xce\xee\xad\xee\xad\xee\xad\xee\xac\xe6\x8c\xe6\x6a'\
-b'\xe6\x4a\xe6\x29\xde\x08\xd5\xa7\xc4\xc5\xa3\x82\x92\xe0\x92\xc0'\
-b'\x92\xc0\x92\xe0\xa3\x41\xbc\x84\xd5\x87\xdd\xe8\xde\x09\xe6\x29'\
-b'\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8c\xe6\xac\xee\xad\xee\xad'\
-b'\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef\xef\x0f'\
-b'\xf7\x0f\xef\x10\xf7\x10\xef\x10\xf7\x10\xee\xf0\xf7\x10\xef\x10'\
-b'\xf6\xef\xef\x10\xee\xef\xf6\xef\xef\x0f\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xcd\xee\x8c\xde\x2a\xbc\x64\x93\x01\xa3\x61\xcd\x26'\
-b'\xe6\x09\xe6\x4a\xe6\x8b\xee\xad\xee\xcd\xee\xcf\xee\xef\xef\x0f'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x11\xef\x10\xf7\x11\xef\x31\xf7\x30'\
-b'\xf7\x31\xef\x11\xef\x11\xf7\x11\xef\x11\xf7\x31\xef\x11\xf7\x30'\
-b'\xf7\x11\xef\x10\xf7\x10\xf7\x11\xef\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xf7\x10\xee\xef\xf6\xef\xee\xef\xee\xcf\xee\xce\xee\xcd\xee\xac'\
-b'\xe6\x6b\xd5\x88\xa3\x82\x92\xe0\xb4\x03\xdd\xa7\xe6\x4a\xe6\x6b'\
-b'\xee\xac\xee\x8c\xee\x8c\xe6\x8c\xe6\x8b\xe6\x4b\xe6\x2a\xdd\xe8'\
-b'\xcd\x46\xbc\x64\xab\xa2\x9b\x21\x92\xe0\x92\xe0\xa3\x41\xb4\x03'\
-b'\xc5\x06\xdd\xe9\xe6\x4b\xe6\x8c\xee\xac\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xee\xee\xee\xee\xce\xee\xad\xee\xac\xe6\x6b\xcd\x26'\
-b'\x9b\x01\x9b\x00\xc4\xc5\xe6\x4a\xee\xad\xee\xce\xee\xce\xee\xef'\
-b'\xee\xef\xf7\x10\xee\xf0\xf7\x10\xef\x10\xf7\x11\xf7\x10\xef\x31'\
-b'\xf7\x11\xef\x31\xf7\x31\xf7\x31\xef\x11\xf7\x31\xf7\x31\xef\x11'\
-b'\xf7\x31\xf7\x31\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x30\xef\x11'\
-b'\xf7\x11\xf7\x31\xef\x11\xf7\x11\xf7\x10\xef\x10\xf7\x10\xef\x0f'\
-b'\xee\xef\xee\xce\xee\xce\xee\xac\xe6\x6b\xbc\xa5\x92\xe0\x9b\x01'\
-b'\xcd\x47\xe6\x6b\xee\xad\xee\xce\xee\xce\xee\xef\xee\xef\xf6\xef'\
-b'\xf6\xef\xef\x0f\xf6\xef\xf7\x0f\xee\xef\xf6\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xcd\xee\xac\xe6\x8c'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xde\x09\xdd\xa7\xcd\x26\xbc\xa4\xab\xe3'\
-b'\xa3\x41\x9b\x00\x93\x00\x9b\x41\xab\xe3\xc4\xa5\xd5\x47\xdd\xe8'\
-b'\xe6\x2a\xe6\x4a\xde\x08\xb4\x43\x92\xc0\x9b\x01\xcd\x66\xe6\x6a'\
-b'\xee\x8c\xee\xac\xee\xcd\xee\xce\xee\xce\xee\xef\xee\xef\xee\xef'\
-b'\xee\xef\xef\x0f\xee\xef\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x11\xf7\x10\xef\x30\xf7\x11\xf7\x30\xf7\x11\xef\x10'\
-b'\xf7\x10\xf7\x11\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xee\xef\xee\xef\xee\xee\xee\xad\xee\xad\xee\x8c\xe6\x6b\xe6\x4a'\
-b'\xe6\x09\xbc\x64\x92\xe0\x9b\x01\xcd\x46\xe6\x6b\xe6\x8c\xee\xad'\
-b'\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef\xee\xef'\
-b'\xee\xef\xf7\x0f\xf7\x10\xee\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xee\x8c\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x09\xdd\xe8\xd5\x46\xab\xc2\x92\xe0\x9b\x01'\
-b'\x9b\x01\x92\xc0\x92\xc0\x92\xe0\xa3\x82\xc4\x84\xd5\x87\xde\x08'\
-b'\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xee\x8c\xee\x8c\xe6\xac\xee\xad'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xef\xf6\xee\xee\xef\xee\xef'\
-b'\xee\xef\xf6\xf0\xee\xef\xf6\xef\xef\x10\xf7\x0f\xef\x10\xee\xef'\
-b'\xf7\x10\xee\xef\xf7\x10\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xad\xee\x8c\xdd\xe9\xb4\x03\x92\xe0\xab\xa2\xd5\x66\xe6\x29'\
-b'\xe6\x6b\xe6\x6b\xee\x8d\xee\xcd\xee\xef\xee\xef\xf6\xef\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xef\x11\xf7\x11\xf7\x31\xef\x11\xf7\x11'\
-b'\xf7\x31\xef\x11\xf7\x31\xf7\x30\xf7\x31\xef\x11\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x11\xef\x31\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xef\x10\xee\xef\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xad\xe6\x8b'\
-b'\xdd\xc8\xab\xc2\x92\xe0\xab\xa2\xd5\x87\xe6\x4a\xe6\x8c\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xee\xac\xe6\x8b'\
-b'\xe6\x6b\xe6\x29\xdd\xc8\xcd\x26\xb4\x43\xa3\x62\x9b\x01\x92\xe0'\
-b'\x93\x00\xa3\x62\xb4\x44\xcd\x46\xde\x09\xe6\x6b\xee\x8c\xee\xad'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xee\xee\xee\xee\xce'\
-b'\xee\xee\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x8c\xdd\xe9\xa3\xa2'\
-b'\x92\xe0\xab\xa2\xdd\xe8\xe6\x8c\xee\xad\xee\xce\xee\xee\xee\xef'\
-b'\xf7\x0f\xef\x10\xf7\x10\xf7\x10\xef\x11\xf7\x11\xef\x31\xf7\x31'\
-b'\xf7\x11\xef\x31\xf7\x31\xf7\x11\xf7\x31\xf7\x31\xf7\x31\xf7\x31'\
-b'\xef\x11\xf7\x31\xef\x11\xf7\x31\xf7\x11\xf7\x31\xef\x31\xf7\x11'\
-b'\xf7\x31\xef\x10\xf7\x10\xf7\x31\xef\x10\xf7\x10\xef\x10\xf6\xef'\
-b'\xee\xef\xee\xee\xee\xcd\xee\x8c\xe6\x2a\xab\xe3\x92\xc0\xa3\x61'\
-b'\xdd\xe9\xe6\x8c\xee\xad\xee\xce\xee\xee\xee\xef\xf6\xef\xef\x0f'\
-b'\xee\xef\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xf6\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce'\
-b'\xee\xce\xee\xad\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8'\
-b'\xd5\x87\xc4\xe5\xbc\x43\xab\x82\x9b\x21\x92\xe0\x9b\x01\xa3\x82'\
-b'\xb4\x23\xc4\xe5\xd5\x46\xb4\x23\x92\xe0\x9b\x01\xcd\x47\xe6\x4a'\
-b'\xe6\x6b\xee\x8c\xee\xad\xee\xad\xee\xce\xee\xce\xee\xee\xf6\xee'\
-b'\xee\xef\xf6\xef\xf6\xef\xef\x0f\xf6\xef\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xef\x11\xf7\x10\xef\x10\xf7\x11\xef\x30\xf7\x11'\
-b'\xef\x30\xf7\x10\xef\x11\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x0f'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xce\xee\xac\xe6\x8c\xe6\x6b\xe6\x6a'\
-b'\xe6\x29\xcd\x26\x9b\x01\x92\xe0\xbc\x64\xe6\x4a\xee\x8c\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xee\xee\xef\xee\xef\xee\xee'\
-b'\xee\xef\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xf7\x0f\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xe6\xad\xee\xad\xe6\x8c'\
-b'\xe6\x6b\xe6\x4a\xdd\xe8\xc4\xc5\xa3\x61\x92\xe0\xab\xc2\xcd\x05'\
-b'\xc4\xe5\xab\xe3\x9b\x01\x92\xe0\x92\xc0\x92\xe0\xa3\x61\xbc\x64'\
-b'\xd5\x87\xde\x09\xe6\x4a\xe6\x6b\xe6\x8b\xe6\x8c\xee\x8c\xee\xad'\
-b'\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef'\
-b'\xef\x0f\xee\xef\xf7\x10\xef\x0f\xee\xf0\xee\xef\xf6\xf0\xef\x0f'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xad'\
-b'\xee\x8b\xd5\xa8\xab\xc2\x93\x00\xab\xe3\xd5\x87\xe6\x2a\xe6\x6b'\
-b'\xe6\x8c\xee\xad\xee\xce\xee\xee\xf6\xef\xef\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x11\xf7\x11\xef\x31\xf7\x31\xf7\x10\xef\x31'\
-b'\xf7\x11\xf7\x31\xef\x11\xf7\x11\xef\x11\xf7\x31\xf7\x10\xef\x31'\
-b'\xf7\x11\xf7\x30\xef\x11\xf7\x11\xf7\x30\xef\x10\xef\x10\xf7\x10'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xce\xee\xad\xee\x8c\xdd\xe9'\
-b'\xab\xe3\x92\xe0\xa3\x82\xd5\x66\xe6\x2a\xe6\x8b\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xee\x8c\xe6\x8b\xe6\x4a\xe6\x29\xd5\xa8\xcc\xe5\xb4\x23'\
-b'\xa3\x41\x92\xe0\x92\xe0\x9b\x01\xa3\x82\xbc\x64\xcd\x67\xde\x09'\
-b'\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xad\xee\xad\xee\x8c\xe6\x4a\xbc\xa5\x9a\xe0'\
-b'\x9b\x01\xc5\x06\xe6\x6b\xee\xac\xee\xce\xee\xce\xee\xef\xf6\xef'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x11\xef\x31\xf7\x31\xef\x31\xf7\x11\xef\x31\xf7\x31'\
-b'\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x31\xef\x11\xf7\x11\xef\x31'\
-b'\xf7\x11\xf7\x31\xef\x11\xf7\x10\xef\x10\xef\x10\xf7\x0f\xee\xef'\
-b'\xee\xef\xee\xce\xee\xad\xe6\x8c\xd5\xa8\x9b\x41\x92\xe0\xb4\x23'\
-b'\xe6\x4a\xee\x8c\xee\xcd\xee\xee\xee\xef\xf6\xef\xef\x0f\xee\xf0'\
-b'\xf7\x10\xf7\x10\xf6\xf0\xef\x0f\xf7\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x0f\xee\xef\xf7\x0f\xf6\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xce\xee\xad\xee\x8c\xe6\x8c\xe6\x6b'\
-b'\xe6\x4a\xe6\x29\xde\x09\xdd\xc7\xcd\x26\xbc\x84\xab\xe2\x9b\x41'\
-b'\x9a\xe0\x92\xe1\x9b\x21\x9b\x21\x92\xc0\x93\x01\xcd\x05\xe6\x09'\
-b'\xe6\x4a\xe6\x6b\xe6\x8c\xee\xac\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xf0\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x11\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xce\xee\xad\xee\xac\xee\x8b\xe6\x6b'\
-b'\xe6\x2a\xd5\xa7\xa3\x81\x92\xe0\xab\xa2\xde\x09\xe6\x8b\xee\xad'\
-b'\xee\xad\xee\xce\xee\xee\xee\xce\xee\xce\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xf6\xef\xf7\x10\xef\x10\xee\xf0\xf7\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x11\xf7\x10\xf7\x11\xf7\x11\xf7\x11'\
-b'\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xcd\xee\xad\xee\x8c\xe6\x6b'\
-b'\xe6\x6a\xdd\xa8\xb4\x23\x9b\x01\x9b\x21\xbc\x64\xd5\xa7\xde\x09'\
-b'\xde\x08\xdd\xc8\xcd\x25\xab\xe3\x9b\x21\x92\xe0\x92\xc0\x92\xe0'\
-b'\x9b\x41\xbc\x64\xd5\x67\xe6\x29\xe6\x6b\xe6\x6b\xee\x8c\xee\xac'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xee\xf6\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xf6\xef\xf7\x0f\xee\xef\xee\xef'\
-b'\xf7\x0f\xee\xef\xee\xef\xee\xee\xee\xce\xee\xad\xee\xac\xe6\x6b'\
-b'\xcd\x67\xa3\x82\x9b\x01\xb4\x23\xdd\xc8\xe6\x4a\xe6\x6b\xee\x8b'\
-b'\xee\xad\xee\xcd\xee\xef\xee\xef\xf6\xef\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xef\x11\xf7\x31\xf7\x31\xf7\x11\xef\x11\xf7\x31\xef\x31'\
-b'\xf7\x31\xef\x31\xf7\x30\xf7\x31\xef\x31\xf7\x11\xef\x31\xf7\x11'\
-b'\xef\x31\xf7\x11\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xee\xf0\xee\xef\xee\xef\xee\xce\xee\xad\xee\x8c\xe6\x29\xb4\x44'\
-b'\x9a\xe0\xa3\x41\xcd\x26\xe6\x2a\xe6\x8b\xee\xad\xee\xce\xee\xee'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xad\xee\xac\xe6\x8c\xe6\x4a\xde\x09'\
-b'\xd5\x87\xc4\xc5\xab\xe3\x9b\x41\x9a\xe0\x92\xe0\x9b\x01\xab\xa2'\
-b'\xbc\xa5\xd5\x88\xe6\x2a\xe6\x6b\xee\x8c\xee\x8c\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\xac\xe6\x8c\xe6\x6b\xd5\x87\xa3\x61\x92\xe0'\
-b'\xb4\x03\xde\x09\xee\x8b\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xf6\xef\xef\x10\xef\x10\xf7\x10\xef\x11\xf7\x11\xf7\x11\xef\x30'\
-b'\xf7\x11\xf7\x31\xf7\x11\xef\x31\xf7\x31\xf7\x31\xf7\x11\xf7\x31'\
-b'\xef\x11\xf7\x31\xf7\x11\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x11'\
-b'\xf7\x30\xef\x10\xf7\x11\xf7\x10\xef\x10\xf7\x10\xee\xf0\xf6\xef'\
-b'\xee\xef\xee\xce\xee\xad\xee\x8b\xc4\xe6\x9a\xe0\x92\xe0\xc4\xe6'\
-b'\xe6\x6b\xee\xad\xee\xce\xee\xef\xee\xef\xee\xef\xf7\x10\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xf7\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xf6\xef\xef\x0f\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xad'\
-b'\xee\xac\xee\x8c\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x09\xdd\xe8\xd5\x66'\
-b'\xc4\xe5\xb4\x23\xa3\x81\x9b\x01\x92\xe0\x92\xe0\xa3\x41\xb4\x23'\
-b'\xc4\xe5\xd5\xa7\xe6\x29\xe6\x6b\xe6\x6b\xee\x8c\xee\xad\xee\xad'\
-b'\xee\xce\xee\xce\xee\xce\xee\xee\xf6\xef\xee\xef\xef\x0f\xf6\xef'\
-b'\xee\xef\xee\xf0\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xee\xf0\xf7\x10'\
-b'\xef\x0f\xee\xef\xf6\xef\xee\xee\xee\xce\xee\xad\xe6\x8c\xe6\x6b'\
-b'\xe6\x4a\xe6\x08\xb4\x03\x92\xc0\x9b\x21\xd5\x88\xe6\x6b\xee\xac'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xef\xee\xef\xee\xee\xee\xef\xf6\xef'\
-b'\xee\xef\xee\xef\xf7\x0f\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x11\xf7\x11\xef\x10\xef\x11\xef\x10\xf7\x31\xef\x10\xf7\x11'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xe6\x8c\xe6\x8c\xe6\x4a'\
-b'\xcd\x26\xa3\x82\x92\xe0\xab\xa2\xcd\x26\xde\x08\xe6\x29\xe6\x29'\
-b'\xe6\x2a\xe6\x29\xe6\x09\xdd\xe8\xcd\x26\xb4\x23\x9b\x21\x92\xe0'\
-b'\x92\xe0\x92\xe0\x9b\x41\xb4\x23\xd5\x67\xe6\x29\xe6\x6b\xe6\x8b'\
-b'\xe6\x8c\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee'\
-b'\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xce\xee\xcd\xee\x8c\xe6\x6b\xcd\x06'\
-b'\xa3\x41\x9b\x01\xbc\x64\xdd\xe8\xe6\x4a\xe6\x6b\xee\x8c\xee\xad'\
-b'\xee\xce\xee\xef\xee\xef\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x11\xf7\x31\xef\x11\xef\x11\xf7\x30\xf7\x31\xef\x31\xf7\x11'\
-b'\xf7\x31\xef\x31\xf7\x11\xef\x31\xf7\x31\xf7\x31\xf7\x11\xef\x30'\
-b'\xf7\x11\xf7\x31\xef\x11\xf7\x31\xef\x10\xf7\x10\xef\x10\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xee\xee\xcd\xee\xac\xe6\x4a\xbc\x85\x93\x00'\
-b'\x9b\x21\xc4\xe5\xe6\x29\xe6\x8c\xee\xad\xee\xce\xee\xee\xee\xef'\
-b'\xf6\xef\xee\xef\xf6\xef\xf7\x0f\xef\x0f\xf6\xef\xf6\xef\xef\x0f'\
-b'\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xce\xee\xad\xee\x8c'\
-b'\xe6\x8b\xe6\x4a\xde\x08\xd5\x67\xbc\x84\xab\xc2\x9b\x21\x92\xe0'\
-b'\x92\xe0\x9b\x21\xab\xc2\xc4\xc5\xd5\xa8\xe6\x2a\xe6\x6b\xe6\x8b'\
-b'\xe6\x8c\xee\x8c\xe6\x8b\xe6\x6b\xe6\x29\xb4\x24\x92\xe0\x9b\x21'\
-b'\xcd\x47\xe6\x6a\xee\x8c\xee\xcd\xee\xce\xee\xcf\xee\xef\xf6\xef'\
-b'\xef\x0f\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xf7\x11'\
-b'\xef\x31\xef\x11\xf7\x31\xf7\x11\xef\x31\xf7\x31\xf7\x31\xef\x31'\
-b'\xf7\x31\xf7\x31\xef\x31\xf7\x11\xef\x31\xf7\x11\xf7\x11\xef\x31'\
-b'\xf7\x11\xef\x11\xf7\x30\xef\x10\xf7\x10\xef\x10\xef\x0f\xee\xef'\
-b'\xee\xee\xee\xce\xee\xac\xe6\x4a\xb4\x23\x92\xe0\x9b\x21\xd5\x88'\
-b'\xee\x8b\xee\xad\xee\xce\xee\xef\xf6\xef\xee\xef\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11\xf7\x11\xef\x11\xf7\x11'\
-b'\xef\x11\xef\x11\xf7\x11\xf7\x10\xf7\x11\xf7\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xef\x10\xf6\xef\xee\xef\xf6\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xcd\xee\xad\xee\xac\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x29'\
-b'\xde\x09\xdd\xc8\xd5\x66\xab\xe2\x92\xc0\x92\xe0\x9b\x01\x92\xe1'\
-b'\x92\xe0\x9b\x21\xab\xc3\xbc\x84\xcd\x67\xde\x09\xe6\x4a\xe6\x8c'\
-b'\xee\xac\xee\xac\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xef\x0f\xee\xef\xf7\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xee\xf0\xf7\x10\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xad\xee\x8c\xe6\x8b'\
-b'\xe6\x4a\xe6\x29\xc4\xc5\x92\xe1\x92\xe0\xc4\xc5\xe6\x6a\xee\x8c'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xf6\xee\xee\xef\xf6\xef\xef\x0f'\
-b'\xf6\xef\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x10\xf7\x11'\
-b'\xef\x11\xf7\x10\xf7\x31\xf7\x31\xf7\x31\xef\x10\xf7\x31\xf7\x31'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x6b\xdd\xe9\xbc\x64'\
-b'\x9b\x21\x9b\x01\xb4\x44\xd5\xa7\xe6\x29\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x29\xde\x08\xcd\x46\xb4\x24'\
-b'\x9b\x41\x92\xc1\x92\xc0\x92\xc0\x9b\x21\xb4\x03\xcd\x46\xde\x09'\
-b'\xe6\x6b\xee\x8c\xe6\x8c\xee\xac\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xee\xee\xee\xee\xef\xf6\xef\xee\xee\xf6\xef\xee\xce'\
-b'\xee\xee\xee\xce\xee\xce\xee\xad\xee\x8c\xe6\x4a\xc4\xc5\x9b\x21'\
-b'\x9b\x21\xc4\xc4\xde\x08\xe6\x4a\xe6\x6b\xe6\x8c\xee\xad\xee\xee'\
-b'\xee\xef\xee\xef\xf7\x0f\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x11'\
-b'\xef\x31\xf7\x11\xf7\x31\xf7\x31\xef\x11\xf7\x31\xf7\x31\xef\x30'\
-b'\xf7\x11\xf7\x31\xef\x30\xf7\x31\xef\x11\xf7\x11\xef\x31\xf7\x11'\
-b'\xef\x30\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf6\xf0\xee\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xad\xe6\x6b\xc4\xc5\x9b\x01\x9b\x00'\
-b'\xbc\xa4\xe6\x09\xe6\x8b\xee\xad\xee\xce\xee\xee\xee\xef\xf6\xef'\
-b'\xef\x0f\xee\xf0\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xf6\xf0'\
-b'\xef\x0f\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xee\xee\xce'\
-b'\xee\xcd\xee\xad\xee\x8c\xe6\x6b\xe6\x4a\xdd\xe8\xcd\x46\xbc\x64'\
-b'\xa3\x82\x9b\x01\x92\xe0\x92\xe0\x9b\x41\xb3\xe3\xc4\xe5\xdd\xa8'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xcd\x26\x9b\x01\x92\xe0\xbc\x44'\
-b'\xe6\x29\xe6\x6b\xee\xad\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x31'\
-b'\xf7\x10\xf7\x31\xef\x11\xf7\x11\xf7\x11\xef\x11\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x31\xf7\x11\xef\x31\xf7\x31\xef\x11\xf7\x30\xf7\x31'\
-b'\xef\x10\xf7\x10\xf7\x11\xef\x10\xf7\x10\xf7\x10\xee\xef\xf6\xef'\
-b'\xee\xce\xee\xad\xee\x8c\xdd\xe8\xa3\x62\x92\xc0\xab\xc2\xde\x29'\
-b'\xee\x8c\xee\xce\xee\xee\xee\xef\xef\x0f\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x11\xef\x11\xf7\x30\xef\x31\xf7\x11\xf7\x31'\
-b'\xf7\x30\xf7\x11\xef\x31\xef\x31\xf7\x31\xef\x11\xef\x11\xf7\x11'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xef\x0f\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xce\xee\xce\xee\xad\xee\xad\xe6\x8c\xe6\x6b'\
-b'\xe6\x4a\xe6\x29\xdd\xe8\xb4\x23\x92\xc0\x9b\x01\xbc\x84\xc4\xc4'\
-b'\xb4\x23\xa3\x82\x9b\x21\x9a\xe0\x9b\x01\xa3\x62\xb4\x23\xc5\x06'\
-b'\xd5\xa8\xe6\x2a\xe6\x8b\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xf0'\
-b'\xf6\xf0\xee\xf0\xf7\x10\xf6\xef\xef\x10\xf6\xf0\xef\x0f\xef\x0f'\
-b'\xf7\x10\xee\xef\xee\xef\xf6\xef\xee\xce\xee\xcd\xee\x8c\xe6\x8b'\
-b'\xe6\x4b\xe6\x49\xd5\x67\x9b\x21\x92\xe0\xb4\x03\xe6\x29\xe6\x8c'\
-b'\xee\xad\xee\xce\xee\xce\xee\xef\xee\xef\xf6\xef\xee\xef\xef\x0f'\
-b'\xf7\x10\xf6\xf0\xef\x10\xf7\x10\xf7\x10\xef\x11\xf7\x10\xef\x11'\
-b'\xf7\x30\xef\x31\xef\x11\xf7\x10\xef\x11\xf7\x31\xf7\x11\xef\x31'\
-b'\xee\xcd\xee\xad\xee\xad\xe6\x8c\xe6\x6a\xd5\x67\xab\xa2\x92\xe0'\
-b'\xa3\x82\xcd\x05\xde\x09\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x08'\
-b'\xd5\x67\xbc\x44\xa3\x61\x92\xe0\x92\xc0\x92\xe0\x9b\x01\xab\xe3'\
-b'\xcd\x26\xe6\x09\xe6\x6a\xe6\x8c\xee\x8c\xee\xad\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xad\xee\xad\xee\x8c\xde\x29\xbc\x64\x93\x01\xa3\x41'\
-b'\xc5\x05\xde\x09\xe6\x4a\xe6\x6b\xee\x8c\xee\xcd\xee\xce\xee\xef'\
-b'\xf6\xef\xef\x0f\xf7\x10\xef\x10\xef\x10\xf7\x11\xf7\x11\xef\x10'\
-b'\xf7\x31\xf7\x11\xef\x11\xef\x31\xf7\x30\xf7\x11\xef\x31\xf7\x31'\
-b'\xef\x31\xf7\x11\xf7\x31\xef\x31\xf7\x31\xf7\x30\xf7\x11\xef\x31'\
-b'\xf7\x11\xf7\x11\xef\x31\xf7\x10\xef\x10\xf7\x10\xef\x0f\xee\xef'\
-b'\xee\xee\xee\xce\xee\xac\xe6\x6b\xcd\x26\x9b\x21\x93\x00\xbc\x44'\
-b'\xde\x09\xe6\x6b\xee\xad\xee\xce\xee\xef\xee\xef\xf7\x0f\xee\xf0'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x6b\xe6\x29'\
-b'\xdd\xc8\xcd\x06\xb4\x23\xa3\x61\x9b\x01\x92\xe0\x92\xe0\x9b\x61'\
-b'\xb4\x23\xcd\x06\xd5\xa7\xdd\xa7\xab\xa2\x92\xc0\xa3\x61\xd5\x87'\
-b'\xe6\x4a\xee\x8c\xee\xac\xee\xad\xee\xce\xee\xce\xee\xce\xee\xef'\
-b'\xf6\xef\xf6\xef\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x11'\
-b'\xef\x10\xf7\x11\xef\x31\xf7\x30\xef\x31\xf7\x31\xef\x11\xf7\x31'\
-b'\xf7\x11\xef\x11\xf7\x31\xf7\x11\xef\x11\xf7\x31\xef\x11\xf7\x11'\
-b'\xf7\x11\xef\x30\xf7\x10\xef\x10\xef\x10\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xce\xee\xad\xe6\x8b\xcd\x46\x93\x01\x92\xe0\xbc\x64\xe6\x4b'\
-b'\xee\xad\xee\xce\xee\xee\xf6\xef\xee\xf0\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xef\x11\xf7\x31\xf7\x11\xef\x31\xf7\x11\xef\x11\xf7\x31'\
-b'\xef\x11\xf7\x31\xf7\x11\xf7\x11\xef\x31\xf7\x30\xf7\x11\xef\x31'\
-b'\xf7\x31\xef\x11\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x10\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xee\xee\xee\xee\xce\xee\xad\xee\xac'\
-b'\xee\x8c\xe6\x6a\xe6\x09\xb4\x23\x92\xe0\x9b\x01\xcd\x05\xdd\xe8'\
-b'\xdd\xe8\xdd\xa7\xcd\x25\xbc\x84\xab\xe2\xa3\x41\x93\x00\x9a\xe1'\
-b'\x9b\x41\xab\xc2\xbc\x85\xcd\x67\xdd\xe9\xe6\x6b\xee\x8c\xee\xac'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xf7\x0f\xee\xef\xee\xef\xef\x0f\xee\xef\xf6\xef\xef\x0f'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xad\xe6\x8c'\
-b'\xe6\x6a\xe6\x4a\xdd\xc8\xab\xa2\x92\xc0\x9b\x61\xdd\xc8\xe6\x6b'\
-b'\xee\xad\xee\xcd\xee\xee\xee\xef\xee\xef\xf6\xef\xef\x0f\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11\xef\x10\xf7\x11'\
-b'\xf7\x31\xf7\x11\xf7\x31\xef\x31\xf7\x11\xf7\x31\xef\x11\xf7\x31'\
-b'\xee\xad\xee\xac\xee\x8b\xde\x09\xbc\xa5\x9b\x21\x9b\x01\xb4\x23'\
-b'\xd5\x87\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x6b'\
-b'\xee\x6b\xe6\x8b\xee\x8c\xe6\x8c\xe6\x8b\xee\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xde\x08\xd5\x87\xbc\x64\xa3\x62\x92\xe0\x92\xe0\x92\xc0'\
-b'\x9b\x01\xab\xc2\xc5\x06\xdd\xe9\xe6\x4a\xe6\x8b\xee\x8c\xee\xac'\
-b'\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xee\xac\xe6\x6b\xdd\xe9\xb4\x03\x92\xe0\xa3\x82\xcd\x26'\
-b'\xe6\x29\xe6\x4a\xe6\x8b\xee\xac\xee\xad\xee\xce\xee\xef\xf6\xef'\
-b'\xef\x10\xf7\x10\xee\xf0\xf7\x10\xf7\x10\xf7\x10\xef\x11\xf7\x31'\
-b'\xf7\x31\xef\x11\xf7\x31\xf7\x31\xef\x31\xf7\x31\xf7\x11\xef\x31'\
-b'\xf7\x31\xf7\x31\xef\x11\xf7\x31\xef\x11\xf7\x11\xef\x31\xf7\x11'\
-b'\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xce\xee\xad\xee\x8b\xd5\x67\xa3\x41\x92\xe0\xb4\x03\xdd\xe8'\
-b'\xe6\x6a\xee\xad\xee\xce\xee\xee\xee\xef\xf7\x0f\xef\x10\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xf7\x10\xef\x11\xf7\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf6\xf0\xef\x0f'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c'\
-b'\xe6\x8b\xe6\x4a\xe6\x29\xd5\xa7\xc4\xc5\xb4\x03\x9b\x41\x92\xe0'\
-b'\x92\xc0\x92\xe1\xa3\x62\xab\xc2\x92\xe0\x92\xe1\xbc\xa4\xde\x09'\
-b'\xe6\x4a\xe6\x6b\xe6\x8c\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xef\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xf7\x11\xef\x11\xf7\x10\xf7\x11\xf7\x31\xef\x11'\
-b'\xf7\x31\xef\x31\xf7\x11\xef\x30\xf7\x31\xf7\x10\xf7\x10\xef\x31'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x0f\xee\xef\xee\xee'\
-b'\xee\xce\xee\xac\xe6\x6b\xbc\x64\x92\xc0\x9b\x01\xcd\x46\xe6\x6b'\
-b'\xee\xad\xee\xce\xee\xef\xee\xef\xee\xef\xf7\x10\xf7\x10\xf7\x10'\
-b'\xf7\x11\xf7\x31\xef\x11\xf7\x31\xf7\x11\xef\x31\xf7\x31\xf7\x31'\
-b'\xf7\x31\xef\x31\xf7\x31\xf7\x31\xf7\x31\xf7\x11\xef\x31\xf7\x11'\
-b'\xf7\x31\xf7\x11\xf7\x31\xf7\x10\xf7\x11\xef\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xef\x0f\xee\xef\xee\xef\xf6\xef\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xac\xe6\x6b\xe6\x29\xb4\x24\x92\xc0\x93\x00\xcd\x26\xe6\x09'\
-b'\xe6\x29\xe6\x29\xe6\x29\xde\x29\xdd\xe8\xd5\x87\xc4\xe5\xb4\x23'\
-b'\xab\x82\x9b\x21\x92\xe0\x9b\x01\xa3\x82\xb4\x23\xc5\x06\xd5\xa8'\
-b'\xe6\x4a\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xee\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xee\xee\xce\xee\xce\xee\xad\xee\x8c'\
-b'\xe6\x6b\xe6\x4a\xde\x09\xbc\x64\x92\xe0\x93\x01\xcd\x06\xe6\x6b'\
-b'\xee\xac\xee\xad\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xf7\x10'\
-b'\xf6\xf0\xef\x10\xf7\x10\xf7\x10\xef\x11\xf7\x10\xf7\x31\xef\x11'\
-b'\xef\x30\xf7\x11\xef\x11\xf7\x31\xf7\x10\xef\x31\xf7\x31\xf7\x11'\
-b'\xee\x8c\xe6\x6b\xd5\x67\xab\xe3\x9a\xe0\xa3\x41\xc4\xc5\xdd\xe9'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x6b\xee\x6b\xe6\x8b\xee\x8c\xe6\x8c'\
-b'\xe6\x8c\xee\xac\xee\xac\xee\xad\xee\xad\xe6\x8c\xee\x8c\xe6\x8c'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xde\x29\xd5\x87\xbc\x84\xa3\x62\x92\xe0'\
-b'\x92\xe0\x92\xe0\x9b\x01\xab\xa2\xc4\xc5\xdd\xe8\xe6\x4a\xe6\x6b'\
-b'\xe6\x8c\xee\xac\xee\xac\xee\xad\xee\xad\xee\xad\xee\xac\xee\xac'\
-b'\xe6\x8c\xe6\x6b\xd5\xa8\xab\xc3\x92\xe0\xab\xc2\xd5\x67\xe6\x29'\
-b'\xe6\x6a\xe6\x6c\xee\x8c\xee\xce\xee\xee\xee\xef\xee\xef\xef\x0f'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xef\x11\xf7\x10\xef\x31'\
-b'\xf7\x11\xf7\x10\xef\x31\xf7\x11\xf7\x30\xef\x31\xf7\x31\xf7\x10'\
-b'\xef\x31\xf7\x31\xf7\x30\xef\x11\xf7\x31\xf7\x30\xf7\x11\xef\x10'\
-b'\xf7\x31\xef\x10\xf7\x10\xf7\x10\xee\xef\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xad\xee\x8b\xd5\xa8\xa3\x82\x92\xe0\xab\xc2\xd5\xa8\xe6\x4a'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x11\xf7\x11\xf7\x11\xef\x31\xf7\x31\xf7\x11\xef\x11'\
-b'\xf7\x11\xf7\x11\xef\x11\xf7\x11\xf7\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf6\xf0\xee\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xad\xe6\x8c\xe6\x6b\xe6\x4a\xdd\xe8\xd5\x67\xc4\xa5'\
-b'\xab\xc2\x9b\x21\x92\xe0\x92\xc0\x92\xe0\x93\x00\xb4\x03\xcd\x46'\
-b'\xdd\xe8\xe6\x4a\xee\x6b\xe6\x8c\xee\xac\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xf0\xf7\x10\xef\x10'\
-b'\xef\x10\xef\x10\xef\x10\xf7\x10\xef\x31\xf7\x10\xef\x11\xf7\x10'\
-b'\xf7\x11\xf7\x30\xef\x11\xf7\x11\xef\x11\xf7\x11\xef\x10\xf7\x11'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xee\xf0\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xee\x8c\xde\x09\xa3\xa2\x92\xc0\xa3\x62\xdd\xe8\xee\x8c'\
-b'\xee\xcd\xee\xce\xee\xef\xf7\x0f\xf7\x10\xef\x10\xef\x10\xef\x11'\
-b'\xf7\x30\xef\x11\xf7\x31\xef\x11\xf7\x31\xf7\x31\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x11\xf7\x31\xef\x32\xf7\x11\xf7\x31\xf7\x31\xef\x31'\
-b'\xf7\x31\xef\x31\xef\x11\xf7\x31\xef\x30\xf7\x11\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xf6\xf0\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xad\xe6\x8c\xe6\x29\xb4\x23\x92\xe0\x9b\x01\xcd\x26\xe6\x4a'\
-b'\xe6\x6a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x2a\xe6\x09'\
-b'\xdd\xc8\xcd\x46\xbc\xa4\xab\xe2\xa3\x41\x9a\xe0\x92\xe0\x9b\x21'\
-b'\xab\xc3\xbc\x85\xcd\x47\xde\x09\xe6\x6b\xee\x8c\xee\xac\xee\xad'\
-b'\xee\xad\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xee'\
-b'\xee\xef\xee\xee\xf6\xee\xee\xcf\xee\xee\xee\xce\xee\xad\xee\x8c'\
-b'\xe6\x8b\xe6\x4a\xe6\x29\xcd\x05\x9b\x00\x92\xe0\xb4\x44\xe6\x4a'\
-b'\xe6\x8c\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef\xf7\x0f\xef\x0f'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xef\x10\xf7\x11'\
-b'\xf7\x31\xf7\x30\xef\x11\xf7\x31\xef\x11\xf7\x11\xf7\x31\xef\x31'\
-b'\xde\x09\xc4\xc5\xa3\x41\x92\xe1\xab\xe3\xd5\x67\xe6\x29\xe6\x6a'\
-b'\xe6\x6b\xe6\x6b\xee\x6b\xee\x8c\xe6\x8c\xee\x8c\xee\xac\xee\xac'\
-b'\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xad\xee\xad'\
-b'\xee\xac\xe6\x8c\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29\xd5\xa7\xc4\xa5'\
-b'\xa3\x82\x92\xe0\x92\xc0\x92\xc0\x92\xe0\xa3\x82\xc4\xa5\xd5\xc8'\
-b'\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x8c\xee\x8c\xe6\x8c\xe6\x8c\xee\x6b'\
-b'\xe6\x4a\xd5\x67\xa3\x82\x9a\xe0\xb3\xe3\xd5\xa7\xe6\x29\xe6\x4a'\
-b'\xe6\x8b\xee\x8c\xee\xcd\xee\xce\xee\xef\xf6\xef\xee\xef\xf6\xf0'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x31\xf7\x11\xef\x11\xf7\x31\xef\x31\xf7\x11\xef\x31'\
-b'\xf7\x31\xef\x11\xf7\x11\xf7\x31\xef\x11\xf7\x11\xef\x10\xf7\x31'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x10\xee\xef\xee\xef\xee\xce\xee\xcd'\
-b'\xee\x8c\xdd\xe8\xa3\xc2\x92\xc0\xa3\x82\xd5\x87\xe6\x4a\xee\xac'\
-b'\xee\xce\xee\xee\xf6\xef\xee\xf0\xf7\x10\xf7\x10\xef\x10\xf7\x11'\
-b'\xf7\x11\xef\x31\xef\x11\xf7\x31\xf7\x11\xef\x11\xf7\x31\xef\x31'\
-b'\xf7\x31\xef\x31\xf7\x11\xef\x31\xf7\x11\xf7\x11\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xef\x0f\xf7\x0f\xee\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xce\xee\xad\xee\xac\xee\x8c\xe6\x6b\xe6\x4a\xe6\x09'\
-b'\xdd\xc7\xcd\x05\xa3\x61\x92\xc0\x92\xe1\x92\xc0\x92\xc0\x9b\x21'\
-b'\xab\xa2\xbc\xa5\xd5\x87\xe6\x2a\xe6\x6b\xe6\x8b\xee\x8c\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xf7\x0f'\
-b'\xf7\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x11\xf7\x10\xef\x30'\
-b'\xf7\x11\xef\x11\xf7\x10\xf7\x30\xf7\x10\xef\x31\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xef\x0f\xef\x0f\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xad\xee\x8c\xd5\x67\x9b\x21\x92\xe0\xb4\x03\xe6\x2a\xe6\xac'\
-b'\xee\xce\xee\xce\xee\xef\xee\xef\xf7\x10\xef\x10\xf7\x10\xf7\x11'\
-b'\xf7\x31\xf7\x11\xef\x11\xf7\x31\xf7\x31\xef\x31\xf7\x11\xf7\x31'\
-b'\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xef\x32\xf7\x31\xf7\x32\xf7\x11'\
-b'\xf7\x31\xf7\x31\xf7\x31\xf7\x11\xef\x11\xf7\x31\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x0f\xf6\xef\xee\xef\xee\xce\xee\xce'\
-b'\xee\xad\xe6\x8c\xe6\x2a\xb4\x23\x92\xc0\x93\x01\xcd\x46\xe6\x6a'\
-b'\xe6\x8c\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x8b\xee\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x29\xdd\xe9\xd5\x87\xc5\x06\xb4\x44\xab\x82'\
-b'\x9b\x20\x92\xe0\x9b\x00\xa3\x62\xb4\x23\xc4\xe6\xd5\xa8\xe6\x2a'\
-b'\xe6\x8b\xee\xac\xee\xad\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\xac'\
-b'\xe6\x8b\xe6\x4a\xe6\x29\xd5\xa7\xa3\x62\x92\xc0\xa3\x82\xdd\xe8'\
-b'\xee\x8b\xee\xad\xee\xce\xee\xce\xee\xee\xf6\xef\xee\xef\xee\xef'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xf7\x30\xf7\x11\xef\x10'\
-b'\xf7\x31\xef\x11\xf7\x31\xf7\x11\xf7\x31\xef\x31\xf7\x11\xf7\x11'\
-b'\xab\xe3\x9b\x01\x9b\x21\xbc\xa4\xdd\xe8\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6b\xee\x8c\xe6\x8c\xe6\x8c\xee\xac\xee\xad\xee\xad\xee\xad'\
-b'\xee\xae\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xad\xee\xad\xee\x8c\xee\x8c\xe6\x6b\xe6\x4a\xe6\x29'\
-b'\xd5\xc7\xc4\xc5\xa3\xa2\x9b\x01\x92\xe0\x92\xe0\x92\xe0\xa3\x62'\
-b'\xbc\x84\xd5\x87\xe6\x2a\xe6\x6a\xe6\x6b\xee\x6b\xe6\x6a\xe6\x2a'\
-b'\xcd\x06\x9b\x41\x9b\x00\xb4\x23\xd5\xc8\xe6\x29\xe6\x4b\xe6\x8b'\
-b'\xee\x8d\xee\xce\xee\xce\xee\xef\xee\xef\xee\xef\xf7\x0f\xee\xf0'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xf7\x11\xef\x10\xf7\x11\xef\x30'\
-b'\xf7\x11\xef\x11\xf7\x31\xf7\x31\xef\x11\xf7\x11\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x31\xef\x10\xf7\x31\xf7\x31\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf6\xef\xee\xef\xf6\xef\xee\xee\xee\xcd\xee\x8c'\
-b'\xde\x09\xab\xe3\x92\xe0\xa3\x62\xcd\x46\xe6\x4a\xee\x8c\xee\xce'\
-b'\xee\xee\xee\xef\xee\xf0\xf7\x10\xef\x10\xf7\x10\xf7\x11\xef\x31'\
-b'\xf7\x11\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x31\xf7\x31\xf7\x11'\
-b'\xf7\x31\xf7\x31\xef\x31\xf7\x11\xf7\x31\xef\x31\xef\x11\xf7\x11'\
-b'\xf7\x10\xef\x10\xef\x10\xf7\x10\xee\xf0\xf6\xef\xf6\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xce\xee\xad\xee\xad\xe6\xac\xe6\x6b\xe6\x6a'\
-b'\xde\x29\xcd\x26\x9b\x21\x92\xc0\xab\xa2\xb4\x23\xa3\x82\x9b\x00'\
-b'\x92\xc0\x92\xe0\x9b\x21\xab\xe3\xc4\xc5\xd5\xa8\xe6\x4a\xe6\x6b'\
-b'\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce\xee\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x11\xef\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xee\xef\xf6\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xac\xe6\x6b\xbc\xa5\x92\xe0\x92\xe0\xc4\xc5\xe6\x6b\xee\xad'\
-b'\xee\xce\xee\xee\xf6\xef\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x11'\
-b'\xf7\x31\xef\x31\xf7\x31\xf7\x31\xf7\x31\xf7\x11\xef\x32\xf7\x31'\
-b'\xef\x32\xf7\x31\xef\x31\xf7\x32\xf7\x31\xef\x31\xf7\x32\xef\x31'\
-b'\xf7\x32\xef\x31\xf7\x31\xf7\x31\xef\x31\xf7\x11\xef\x31\xf7\x11'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xee\xef\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xad\xee\x8c\xe6\x29\xb4\x23\x92\xc0\x9b\x01\xcd\x46\xe6\x6b'\
-b'\xee\x8c\xee\xac\xee\xad\xee\xce\xee\xcd\xee\xad\xee\xad\xee\xad'\
-b'\xee\x8c\xe6\x8c\xe6\x8b\xee\x6b\xe6\x6a\xe6\x4a\xe6\x29\xdd\xc8'\
-b'\xcd\x46\xbc\xa5\xab\xe3\xa3\x41\x92\xe0\x92\xe0\x9b\x21\xab\xc2'\
-b'\xbc\x85\xcd\x47\xdd\xe9\xe6\x6b\xee\x8c\xee\x8c\xee\xac\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xee\xac'\
-b'\xee\x8b\xe6\x6b\xe6\x2a\xdd\xe8\xab\xe3\x92\xe0\x9b\x01\xcd\x67'\
-b'\xe6\x6b\xee\xac\xee\xad\xee\xce\xee\xee\xee\xef\xf6\xef\xef\x0f'\
-b'\xf6\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x11\xf7\x11'\
-b'\xef\x30\xf7\x11\xef\x31\xf7\x11\xef\x10\xf7\x31\xef\x31\xf7\x31'\
-b'\x9b\x00\xab\xa2\xcd\x47\xe6\x4a\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8c'\
-b'\xee\x8c\xee\xac\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\xac\xee\x8b\xe6\x6b'\
-b'\xe6\x4a\xe6\x29\xdd\xc8\xc4\xc5\xab\xa2\x93\x01\x92\xc0\x92\xc0'\
-b'\x92\xe0\xa3\x41\xbc\x64\xd5\x67\xe6\x09\xe6\x29\xde\x09\xbc\xa5'\
-b'\x9b\x21\x9b\x01\xbc\x64\xdd\xc8\xe6\x29\xe6\x4a\xe6\x6b\xee\xac'\
-b'\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xef\x0f'\
-b'\xf7\x10\xee\xf0\xef\x10\xef\x10\xf7\x10\xf7\x11\xef\x31\xf7\x11'\
-b'\xf7\x30\xef\x31\xf7\x11\xef\x10\xf7\x31\xef\x31\xf7\x10\xef\x31'\
-b'\xf7\x11\xf7\x11\xf7\x31\xef\x10\xf7\x11\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xee\xf0\xf6\xef\xee\xef\xee\xee\xee\xcd\xee\x8c\xe6\x2a'\
-b'\xb4\x44\x92\xe0\x9b\x21\xcc\xe5\xe6\x2a\xee\x8b\xee\xcd\xee\xcf'\
-b'\xee\xef\xf6\xef\xf7\x10\xef\x10\xf7\x11\xef\x11\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x31\xf7\x11\xef\x31\xf7\x31\xf7\x12\xef\x31\xf7\x32'\
-b'\xf7\x11\xef\x31\xf7\x31\xf7\x31\xf7\x11\xf7\x31\xef\x31\xf7\x11'\
-b'\xf7\x11\xef\x10\xf7\x11\xf7\x10\xef\x10\xef\x10\xef\x0f\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xee\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x6b'\
-b'\xdd\xe9\xab\xe3\x92\xc0\x9b\x21\xcd\x46\xdd\xe8\xd5\x87\xc5\x05'\
-b'\xb4\x23\xa3\x61\x92\xe0\x92\xc0\x92\xe0\xa3\x41\xb4\x03\xc5\x06'\
-b'\xdd\xc9\xe6\x4b\xe6\x8c\xee\xac\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xf6\xef\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x0f\xee\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xad'\
-b'\xee\x8c\xe6\x2a\xab\xe3\x92\xe0\x9b\x21\xd5\x87\xee\x8c\xee\xad'\
-b'\xee\xce\xee\xef\xee\xef\xf6\xef\xef\x10\xf7\x10\xf7\x11\xf7\x10'\
-b'\xef\x31\xf7\x11\xef\x31\xf7\x11\xef\x31\xf7\x31\xf7\x31\xf7\x32'\
-b'\xf7\x31\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x31\xf7\x32'\
-b'\xf7\x31\xf7\x32\xf7\x11\xef\x31\xf7\x31\xf7\x31\xef\x11\xf7\x31'\
-b'\xef\x11\xf7\x10\xef\x10\xef\x10\xf7\x10\xee\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xe6\x8c\xe6\x2a\xb4\x23\x92\xe0\x93\x01\xcd\x26\xe6\x6b'\
-b'\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xce'\
-b'\xee\xce\xee\xce\xee\xad\xee\xad\xee\x8c\xe6\x8c\xe6\x6b\xe6\x6b'\
-b'\xe6\x4a\xe6\x29\xe6\x09\xd5\x87\xcd\x05\xb4\x44\xa3\x82\x9b\x21'\
-b'\x92\xe0\x9b\x00\xa3\x62\xb4\x03\xc4\xe5\xd5\xa8\xde\x2a\xe6\x6b'\
-b'\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xad\xee\xad\xee\xad\xe6\xac'\
-b'\xe6\x8c\xe6\x6b\xe6\x49\xe6\x09\xc4\xa4\x92\xe0\x92\xe0\xbc\x84'\
-b'\xe6\x4a\xee\x8c\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef'\
-b'\xef\x0f\xf7\x10\xee\xf0\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x31'\
-b'\xf7\x11\xef\x30\xf7\x11\xf7\x31\xf7\x31\xef\x11\xf7\x11\xf7\x31'\
-b'\xc4\xa5\xde\x0a\xee\x8b\xe6\x8c\xee\x8c\xee\x8c\xe6\xac\xee\xac'\
-b'\xee\xad\xe6\xad\xee\xad\xee\xcd\xee\xce\xee\xee\xee\xce\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xad\xee\xac'\
-b'\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x29\xdd\xc8\xc4\xe5\xab\xc2\x9b\x01'\
-b'\x92\xe0\x92\xc0\x92\xe0\x9b\x41\xb4\x23\xcd\x26\xb4\x43\x9b\x00'\
-b'\x9b\x21\xbc\xa4\xdd\xe8\xe6\x29\xe6\x4a\xe6\x6b\xe6\x8c\xee\xad'\
-b'\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xf7\x0f\xee\xf0'\
-b'\xf7\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xef\x10'\
-b'\xf7\x11\xf7\x11\xef\x31\xf7\x11\xf7\x30\xf7\x11\xef\x31\xf7\x11'\
-b'\xef\x30\xf7\x31\xef\x10\xf7\x11\xef\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xee\xef\xee\xef\xee\xee\xee\xcd\xee\xad\xe6\x4a\xbc\x85'\
-b'\x9b\x00\x9b\x01\xc4\xa5\xe6\x29\xe6\x8c\xee\xcd\xee\xce\xee\xef'\
-b'\xf7\x0f\xef\x10\xef\x10\xf7\x11\xf7\x30\xf7\x31\xef\x11\xf7\x31'\
-b'\xf7\x31\xf7\x32\xef\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x31\xf7\x32'\
-b'\xf7\x32\xf7\x31\xef\x32\xf7\x12\xf7\x31\xef\x31\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x11\xf7\x10\xef\x10\xf7\x10\xf7\x10\xf7\x10\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x8c\xe6\x4a'\
-b'\xc4\xe5\x9b\x00\x92\xe0\xbc\x44\xde\x09\xe6\x4a\xe6\x4a\xe6\x4a'\
-b'\xe6\x09\xd5\x87\xc4\xc5\xb4\x03\x9b\x41\x92\xe0\x92\xe0\x9a\xe1'\
-b'\xa3\x61\xb4\x43\xcd\x26\xde\x09\xe6\x6b\xee\x8c\xee\xac\xee\xad'\
-b'\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xef'\
-b'\xee\xef\xee\xf0\xee\xef\xef\x10\xf7\x10\xee\xf0\xef\x10\xf6\xf0'\
-b'\xee\xef\xef\x10\xf6\xef\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xad'\
-b'\xe6\x8c\xd5\xa8\xa3\x41\x92\xc0\xab\xa2\xde\x09\xee\x8c\xee\xcd'\
-b'\xee\xce\xee\xef\xf6\xef\xef\x10\xf7\x10\xef\x10\xef\x11\xf7\x11'\
-b'\xf7\x31\xef\x11\xf7\x31\xf7\x31\xf7\x31\xf7\x12\xef\x31\xf7\x32'\
-b'\xef\x31\xf7\x31\xef\x32\xf7\x31\xef\x31\xf7\x32\xef\x31\xf7\x31'\
-b'\xef\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x11\xf7\x31\xef\x11\xf7\x31'\
-b'\xf7\x31\xef\x10\xf7\x10\xf7\x10\xef\x10\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xee\x8c\xe6\x29\xb4\x23\x92\xc0\x9b\x01\xcd\x26\xe6\x6b'\
-b'\xee\xac\xee\xcd\xee\xce\xee\xce\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xee\xee\xee\xee\xce\xee\xad\xee\xad\xee\xac'\
-b'\xee\x8c\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x29\xdd\xc8\xcd\x46'\
-b'\xc4\xa4\xab\xe3\x9b\x41\x93\x00\x92\xe0\x9b\x21\xab\xc2\xbc\x64'\
-b'\xcd\x47\xdd\xe9\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c\xee\x8c\xe6\x8c'\
-b'\xee\x6b\xe6\x6a\xe6\x2a\xe6\x29\xcd\x46\x9b\x21\x92\xc0\xab\xc3'\
-b'\xde\x29\xe6\x8b\xee\xac\xee\xad\xee\xce\xee\xee\xf6\xef\xee\xef'\
-b'\xf6\xef\xee\xef\xf7\x0f\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x11\xef\x30\xf7\x11\xef\x11\xf7\x31\xf7\x31\xef\x11'\
-b'\xee\xac\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xf6\xef\xef\x10\xf7\x10\xef\x10\xf7\x0f\xef\x10\xf7\x10\xf7\x0f'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xce'\
-b'\xee\xad\xee\xad\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x49\xdd\xe8\xc5\x05'\
-b'\xab\xc3\x9b\x01\x92\xc0\x92\xc0\x92\xc0\x93\x01\x92\xe0\x9b\x01'\
-b'\xc4\xa4\xdd\xc7\xde\x08\xe6\x29\xe6\x4a\xe6\x6b\xee\x8c\xee\xad'\
-b'\xee\xad\xee\xce\xee\xce\xee\xce\xf6\xef\xee\xef\xee\xef\xf7\x0f'\
-b'\xee\xef\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11\xef\x30'\
-b'\xf7\x10\xf7\x11\xef\x10\xf7\x10\xef\x11\xf7\x11\xf7\x10\xef\x11'\
-b'\xf7\x11\xf7\x10\xf7\x11\xef\x30\xf7\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xf6\xef\xee\xef\xee\xee\xee\xce\xee\x8c\xe6\x6b\xc4\xc5\x9b\x01'\
-b'\x93\x00\xbc\x64\xde\x08\xe6\x8b\xee\xad\xee\xce\xee\xef\xef\x10'\
-b'\xf7\x10\xf7\x10\xf7\x10\xef\x11\xf7\x31\xef\x11\xf7\x31\xf7\x32'\
-b'\xef\x32\xf7\x31\xf7\x32\xf7\x32\xef\x31\xf7\x32\xef\x32\xf7\x31'\
-b'\xef\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x31\xf7\x31\xef\x31'\
-b'\xf7\x11\xef\x31\xf7\x31\xf7\x11\xef\x10\xef\x10\xef\x10\xef\x0f'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xce\xee\xcd\xee\xac\xe6\x6b\xdd\xc8'\
-b'\xa3\x82\x92\xc0\xa3\x61\xd5\xa7\xe6\x6a\xee\x8b\xe6\x8c\xee\x8c'\
-b'\xe6\x8b\xe6\x6b\xe6\x4a\xde\x09\xd5\x67\xc4\xa5\xab\xc2\x9b\x21'\
-b'\x92\xe0\x92\xc0\x9b\x01\xa3\x82\xbc\x64\xcd\x67\xde\x09\xe6\x6b'\
-b'\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xf6\xee\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xf6\xef\xef\x0f\xf6\xef\xef\x0f\xef\x0f'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xac'\
-b'\xe6\x6b\xc4\xe5\x9b\x00\x92\xe0\xbc\x64\xe6\x6b\xee\xac\xee\xce'\
-b'\xee\xee\xee\xef\xee\xef\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x11'\
-b'\xf7\x31\xf7\x11\xf7\x31\xef\x31\xf7\x11\xf7\x31\xf7\x32\xf7\x31'\
-b'\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x32'\
-b'\xf7\x31\xef\x32\xf7\x31\xef\x31\xf7\x31\xf7\x31\xf7\x31\xef\x11'\
-b'\xf7\x11\xf7\x11\xef\x10\xef\x10\xf7\x10\xef\x0f\xee\xef\xee\xee'\
-b'\xee\xcd\xee\x8c\xde\x2a\xb4\x03\x92\xe0\x93\x00\xcd\x26\xee\x6b'\
-b'\xe6\xac\xee\xce\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xf7\x0f'\
-b'\xf6\xef\xef\x0f\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xcd\xee\xad\xee\xad\xee\x8c\xe6\x8b\xe6\x6b\xe6\x6b\xe6\x6a'\
-b'\xe6\x2a\xde\x09\xd5\x87\xcc\xe6\xb4\x24\xa3\x82\x9b\x21\x92\xe0'\
-b'\x9b\x01\xa3\x61\xb4\x03\xc4\xc6\xd5\xa8\xde\x09\xe6\x6a\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xde\x09\xd5\xa7\xa3\x82\x92\xc0\x9b\x41'\
-b'\xd5\x87\xee\x6b\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef'\
-b'\xee\xef\xee\xef\xef\x0f\xef\x10\xf6\xf0\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x11\xf7\x11\xf7\x10\xef\x11\xf7\x30\xef\x11\xf7\x31\xf7\x31'\
-b'\xee\xef\xee\xce\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef\xef\x0f\xee\xf0\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf6\xf0\xef\x10\xef\x10'\
-b'\xf7\x10\xee\xef\xf7\x0f\xee\xef\xee\xef\xf6\xef\xee\xce\xee\xce'\
-b'\xee\xce\xee\xcd\xee\xad\xee\xac\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x29'\
-b'\xdd\xc8\xcd\x05\xab\xe2\x93\x01\x92\xe0\x92\xc0\x92\xe0\x93\x01'\
-b'\xab\xc2\xc4\xe5\xdd\xa8\xde\x29\xe6\x4a\xe6\x6b\xe6\x8c\xee\xac'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef'\
-b'\xee\xef\xf7\x0f\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xef\x11\xf7\x10\xf7\x31\xef\x11\xf7\x30\xef\x10\xf7\x31\xf7\x10'\
-b'\xef\x10\xf7\x30\xef\x10\xef\x10\xf7\x10\xef\x10\xee\xf0\xf6\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xac\xe6\x6b\xcd\x26\x9b\x21\x92\xe0'\
-b'\xb4\x03\xdd\xe8\xe6\x6b\xee\xad\xee\xee\xee\xef\xf6\xef\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x11\xf7\x31\xf7\x31\xf7\x31\xf7\x32\xef\x31'\
-b'\xf7\x32\xf7\x32\xf7\x31\xef\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x32'\
-b'\xf7\x31\xef\x32\xf7\x32\xef\x31\xf7\x32\xef\x31\xf7\x12\xf7\x31'\
-b'\xf7\x31\xf7\x11\xef\x11\xf7\x10\xf7\x10\xf7\x10\xf7\x10\xf7\x10'\
-b'\xee\xef\xee\xef\xee\xee\xee\xce\xee\xad\xee\x8c\xe6\x4a\xbc\x84'\
-b'\x92\xe0\x9b\x01\xc4\xa5\xe6\x4a\xe6\x8c\xee\x8c\xee\xad\xee\xad'\
-b'\xee\xad\xee\xad\xee\x8c\xee\x8c\xe6\x6b\xe6\x4a\xdd\xe8\xcd\x67'\
-b'\xbc\x64\xa3\xa2\x9b\x01\x92\xe0\x92\xc0\x9b\x01\xab\xa2\xbc\x85'\
-b'\xd5\x87\xe6\x2a\xe6\x6b\xee\xac\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xee\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xef\xee\xee\xf6\xce\xee\xce\xee\xad\xee\x8c'\
-b'\xe6\x4a\xb4\x23\x92\xc0\x9b\x01\xcd\x26\xe6\x6b\xee\xad\xee\xce'\
-b'\xee\xce\xee\xef\xf7\x0f\xef\x10\xf7\x10\xef\x10\xf7\x11\xf7\x10'\
-b'\xef\x31\xef\x31\xf7\x31\xf7\x31\xef\x31\xf7\x32\xef\x11\xf7\x31'\
-b'\xef\x32\xf7\x31\xef\x32\xf7\x31\xef\x31\xf7\x32\xef\x31\xf7\x31'\
-b'\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xef\x31\xf7\x12\xf7\x31\xef\x31'\
-b'\xf7\x31\xef\x11\xf7\x10\xf7\x10\xef\x10\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xac\xe6\x29\xb4\x03\x92\xe0\x93\x01\xcd\x26\xe6\x6b'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xef\xee\xef\xee\xef\xf7\x0f\xef\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xee\xee\xce\xee\xad\xee\xad\xee\x8c\xee\x8c'\
-b'\xe6\x6b\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29\xdd\xc8\xcd\x46\xbc\x84'\
-b'\xab\xc3\x9b\x41\x92\xe0\x92\xe0\x9b\x21\xab\xa2\xbc\x64\xcd\x26'\
-b'\xdd\xc8\xde\x09\xe6\x29\xe6\x09\xdd\xe8\xb4\x23\x92\xe0\x9a\xe0'\
-b'\xc4\xc5\xe6\x4a\xe6\x8b\xee\xac\xee\xad\xee\xcd\xee\xce\xee\xee'\
-b'\xf6\xef\xee\xef\xf6\xef\xee\xef\xef\x0f\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x30\xf7\x11\xef\x10\xf7\x11\xf7\x10\xef\x11'\
-b'\xf6\xef\xf6\xef\xef\x10\xf6\xef\xf7\x10\xf7\x10\xf7\x0f\xf6\xf0'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xee\xef\xf7\x0f\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xce\xee\xad\xee\xad\xee\x8c\xe6\x6b\xe6\x4a'\
-b'\xe6\x29\xdd\xe8\xc4\xe5\x9b\x41\x92\xc0\x9b\x01\x92\xc0\x92\xc0'\
-b'\x92\xc0\x9b\x01\xab\xa2\xc4\xe5\xdd\xc8\xe6\x4a\xe6\x6b\xee\x8c'\
-b'\xe6\xac\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xef\xee\xf0\xf7\x0f\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xf7\x10\xef\x10\xef\x11'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xad\xe6\x6b\xd5\x67\xa3\x41\x92\xe0\xab\xe3'\
-b'\xdd\xc8\xe6\x6b\xee\xad\xee\xce\xee\xef\xf7\x0f\xef\x10\xef\x10'\
-b'\xf7\x10\xf7\x31\xef\x11\xf7\x31\xef\x31\xf7\x32\xf7\x32\xf7\x32'\
-b'\xef\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32'\
-b'\xef\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x32\xef\x31\xf7\x31'\
-b'\xf7\x31\xef\x31\xf7\x31\xef\x31\xef\x11\xef\x10\xef\x10\xf7\x10'\
-b'\xee\xef\xee\xef\xee\xef\xee\xce\xee\xad\xe6\x8b\xd5\x87\x9b\x41'\
-b'\x92\xc0\xab\xa2\xdd\xe8\xe6\x6b\xee\xac\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xcd\xee\xad\xee\xac\xe6\x8c\xe6\x6b'\
-b'\xe6\x4a\xdd\xc8\xcd\x26\xb4\x43\xa3\x82\x9b\x00\x92\xe0\x92\xe0'\
-b'\x9b\x21\xab\xc3\xc4\xc5\xd5\xa8\xe6\x2a\xe6\x8b\xee\x8c\xee\xad'\
-b'\xee\xad\xee\xce\xee\xce\xee\xce\xee\xee\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xef\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x8b'\
-b'\xdd\xc8\xa3\x62\x92\xe0\x9b\x61\xdd\xc8\xe6\x8c\xee\xad\xee\xce'\
-b'\xee\xee\xee\xef\xee\xef\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11'\
-b'\xf7\x31\xf7\x11\xef\x11\xf7\x31\xf7\x11\xf7\x31\xf7\x31\xf7\x32'\
-b'\xf7\x31\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xef\x32'\
-b'\xf7\x31\xef\x32\xf7\x31\xf7\x31\xf7\x32\xef\x31\xf7\x31\xf7\x11'\
-b'\xef\x11\xf7\x31\xf7\x10\xef\x10\xf7\x10\xef\x0f\xee\xef\xee\xee'\
-b'\xee\xcd\xee\x8c\xde\x2a\xb4\x03\x92\xc0\x9b\x01\xcd\x26\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xce\xee\xef\xf6\xef\xef\x0f\xf7\x10\xf6\xf0'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xad'\
-b'\xee\xac\xee\x8c\xee\x8c\xe6\x8b\xe6\x6b\xee\x6b\xe6\x4a\xe6\x4a'\
-b'\xe6\x08\xd5\x87\xc4\xe6\xb4\x23\xa3\x82\x9b\x01\x92\xe0\x93\x00'\
-b'\xa3\x61\xab\xe3\xbc\xa4\xcd\x46\xdd\x87\xc4\xc4\x92\xe0\x92\xc0'\
-b'\xb4\x23\xde\x29\xe6\x6b\xe6\x8c\xee\xad\xee\xad\xee\xce\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xee\xef\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x30\xef\x11\xf7\x30'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xef\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11'\
-b'\xef\x11\xf7\x11\xef\x11\xf7\x11\xf7\x10\xef\x11\xef\x10\xf7\x10'\
-b'\xef\x10\xee\xf0\xf7\x10\xee\xf0\xf7\x0f\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xe6\x8c\xe6\x8b\xe6\x6b'\
-b'\xe6\x29\xc5\x05\xa3\x41\x92\xe0\xb3\xe3\xc4\xe5\xb4\x23\x9b\x41'\
-b'\x92\xc0\x92\xc0\x92\xe0\x92\xe0\xab\xa2\xc4\xc5\xdd\xc8\xe6\x4a'\
-b'\xe6\x6b\xe6\x8c\xee\xac\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xef'\
-b'\xee\xef\xee\xef\xf6\xef\xee\xef\xef\x10\xee\xef\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x10\xee\xef\xee\xef\xf6\xef\xee\xee'\
-b'\xee\xce\xee\xad\xee\x8b\xd5\xa8\xa3\x82\x92\xe0\xa3\x82\xd5\x87'\
-b'\xe6\x4a\xee\xac\xee\xce\xee\xef\xee\xef\xf7\x10\xf7\x10\xf7\x10'\
-b'\xef\x11\xf7\x31\xf7\x31\xf7\x11\xf7\x32\xef\x31\xf7\x32\xf7\x32'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xef\x32\xf7\x32\xf7\x52'\
-b'\xf7\x32\xf7\x32\xf7\x32\xef\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x32'\
-b'\xef\x31\xf7\x11\xf7\x11\xf7\x31\xf7\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xf6\xef\xee\xef\xee\xce\xee\xcd\xee\x8c\xe6\x2a\xb4\x03\x92\xe0'\
-b'\x9b\x01\xcd\x06\xe6\x6b\xee\xac\xee\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xee\xee\xef\xee\xcf\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\xac\xee\x8c\xe6\x6b\xe6\x29\xdd\xc8\xc5\x06\xb4\x03\xa3\x41'\
-b'\x92\xe0\x92\xe0\x92\xe0\x9b\x41\xab\xe3\xc4\xe6\xdd\xc8\xe6\x4a'\
-b'\xe6\x8b\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xf6\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x6b'\
-b'\xcd\x26\x9b\x01\x92\xe0\xab\xe3\xe6\x2a\xee\x8c\xee\xad\xee\xce'\
-b'\xee\xef\xee\xef\xf6\xef\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x11'\
-b'\xf7\x31\xef\x10\xf7\x31\xf7\x31\xef\x31\xf7\x31\xf7\x12\xef\x31'\
-b'\xf7\x31\xef\x32\xf7\x31\xef\x31\xf7\x32\xef\x31\xf7\x31\xf7\x32'\
-b'\xf7\x31\xf7\x32\xef\x32\xf7\x31\xf7\x31\xf7\x32\xf7\x31\xef\x31'\
-b'\xf7\x11\xf7\x31\xef\x11\xef\x10\xf7\x10\xee\xf0\xee\xef\xee\xce'\
-b'\xee\xce\xee\xac\xe6\x29\xac\x03\x92\xe0\x93\x00\xcd\x26\xee\x6b'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xf7\x0f\xef\x10\xee\xf0\xf7\x10'\
-b'\xf7\x10\xef\x10\xf7\x11\xf7\x10\xf7\x11\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf6\xef\xee\xef\xee\xee'\
-b'\xee\xee\xee\xce\xee\xad\xee\xad\xee\xad\xee\x8c\xe6\x8b\xe6\x6b'\
-b'\xe6\x6b\xe6\x6a\xe6\x4a\xe6\x29\xdd\xc8\xcd\x46\xbc\x84\xab\xc3'\
-b'\x9b\x21\x9a\xe0\x92\xe0\x9b\x01\xa3\x82\xab\xc2\x9b\x01\x92\xc0'\
-b'\xa3\x62\xd5\xa7\xe6\x4a\xe6\x6b\xee\x8b\xee\x8c\xee\xac\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xef\xf7\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x31\xf7\x11\xef\x10\xf7\x11\xf7\x11\xf7\x11\xf7\x31\xf7\x11'\
-b'\xef\x11\xf7\x11\xef\x31\xf7\x11\xef\x11\xf7\x31\xef\x11\xf7\x31'\
-b'\xf7\x31\xef\x31\xf7\x10\xef\x11\xf7\x31\xf7\x10\xf7\x11\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x0f\xee\xf0\xef\x0f\xee\xef\xee\xef'\
-b'\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x6b\xe6\x29'\
-b'\xc4\xc5\x9b\x21\x9b\x01\xb4\x23\xd5\xa7\xde\x08\xdd\xe8\xd5\x46'\
-b'\xb4\x44\x9b\x41\x92\xe0\x92\xe0\x92\xc0\x92\xe1\xa3\x82\xc4\xa5'\
-b'\xd5\xc8\xe6\x4a\xe6\x6b\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xf0\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x0f\xf6\xef\xee\xef\xf6\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xad\xe6\x8b\xdd\xc8\xab\xa2\x92\xe0\xa3\x62\xcd\x46\xe6\x4a'\
-b'\xee\x8c\xee\xce\xee\xee\xee\xef\xf6\xf0\xef\x10\xef\x10\xf7\x11'\
-b'\xf7\x31\xef\x31\xf7\x31\xf7\x32\xef\x31\xf7\x32\xf7\x32\xef\x32'\
-b'\xf7\x32\xf7\x32\xef\x52\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32'\
-b'\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xef\x32\xf7\x31\xef\x31\xf7\x32'\
-b'\xf7\x31\xf7\x31\xef\x11\xef\x31\xf7\x11\xef\x10\xef\x10\xee\xef'\
-b'\xf6\xef\xee\xee\xee\xce\xee\xad\xe6\x6b\xcd\x26\x9b\x01\x92\xe0'\
-b'\xac\x03\xde\x29\xee\x8c\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xce\xee\xce\xee\xad\xee\x8c\xe6\x8c\xe6\x6a\xe6\x29\xd5\x88'\
-b'\xc4\xc5\xab\xe3\x9b\x21\x92\xe0\x92\xe0\x9a\xe0\xa3\x41\xb4\x24'\
-b'\xc5\x26\xdd\xe9\xe6\x4a\xe6\x8c\xee\xac\xee\xac\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xcd\xee\xcd\xee\xad\xe6\xac\xe6\x8c\xe6\x4a'\
-b'\xbc\x64\x92\xe0\x92\xe0\xc4\xa5\xe6\x6a\xe6\x8c\xee\xcd\xee\xce'\
-b'\xee\xee\xee\xef\xf6\xef\xee\xef\xf7\x10\xf7\x10\xef\x10\xf7\x11'\
-b'\xf7\x10\xef\x31\xf7\x11\xef\x11\xf7\x31\xf7\x31\xef\x31\xf7\x31'\
-b'\xf7\x31\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xef\x31\xf7\x32'\
-b'\xf7\x31\xef\x31\xf7\x32\xf7\x32\xef\x31\xf7\x11\xf7\x31\xef\x31'\
-b'\xf7\x11\xef\x31\xf7\x10\xf7\x10\xef\x10\xf7\x0f\xee\xef\xee\xee'\
-b'\xee\xcd\xee\x8c\xe6\x2a\xab\xe3\x92\xc0\x9a\xe1\xcd\x26\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xee\xf6\xef\xee\xef\xf7\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x11\xef\x31\xef\x31\xf7\x11\xf7\x31\xef\x31\xf7\x31'\
-b'\xef\x11\xf7\x11\xf7\x11\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xad\xee\xac'\
-b'\xee\x8c\xee\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8'\
-b'\xd5\x87\xc4\xe5\xb4\x03\xa3\x62\x9b\x00\x92\xe0\x92\xc0\x92\xe0'\
-b'\x92\xe1\xbc\x44\xcd\x46\xdd\xe8\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c'\
-b'\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce\xee\xee\xee\xef\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x11\xef\x31\xf7\x11\xef\x31'\
-b'\xf7\x31\xf7\x31\xf7\x11\xef\x31\xf7\x31\xf7\x31\xef\x11\xf7\x11'\
-b'\xef\x31\xf7\x11\xf7\x31\xf7\x31\xef\x11\xf7\x10\xef\x11\xf7\x11'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xf6\xf0\xee\xef\xf6\xef\xf6\xef'\
-b'\xee\xee\xee\xce\xee\xce\xee\xad\xee\xac\xe6\x8b\xde\x09\xbc\x84'\
-b'\x9b\x01\x9b\x01\xbc\x84\xdd\xc8\xe6\x09\xe6\x29\xe6\x2a\xe6\x4a'\
-b'\xde\x08\xd5\x67\xbc\x64\xa3\x41\x92\xe0\x92\xe0\x92\xe0\x92\xe0'\
-b'\xa3\x61\xbc\x84\xd5\xa8\xe6\x4a\xe6\x6b\xe6\x8c\xee\xac\xee\xad'\
-b'\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef\xee\xef\xf7\x0f\xee\xef'\
-b'\xf7\x0f\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xf0\xee\xef\xee\xef'\
-b'\xef\x0f\xf6\xf0\xee\xef\xee\xef\xee\xef\xee\xee\xee\xcd\xee\xad'\
-b'\xee\x8c\xde\x09\xab\xe3\x92\xe1\x9b\x21\xcd\x06\xe6\x4a\xe6\x8c'\
-b'\xee\xcd\xee\xce\xee\xef\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x31'\
-b'\xf7\x11\xf7\x31\xef\x12\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32'\
-b'\xf7\x32\xf7\x52\xf7\x32\xf7\x52\xf7\x52\xf7\x32\xf7\x52\xef\x32'\
-b'\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xef\x31'\
-b'\xf7\x32\xf7\x31\xf7\x11\xf7\x11\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xee\xef\xee\xce\xee\xcd\xee\x8c\xde\x09\xab\xa2\x92\xc0\x9b\x41'\
-b'\xd5\x67\xe6\x6b\xee\xad\xee\xcd\xee\xce\xee\xef\xee\xef\xf6\xef'\
-b'\xef\x0f\xf7\x0f\xf7\x10\xef\x0f\xf6\xef\xf7\x10\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xad\xee\x8c\xe6\x8b'\
-b'\xe6\x6a\xe6\x09\xd5\x87\xc4\x85\xab\xc2\x9b\x21\x92\xe0\x92\xc0'\
-b'\x93\x00\xa3\x62\xbc\x44\xcd\x46\xdd\xe9\xe6\x6b\xe6\x8b\xee\x8c'\
-b'\xee\x8c\xee\xad\xe6\xad\xee\x8d\xee\xac\xe6\x8c\xe6\x6b\xdd\xe8'\
-b'\xab\xa2\x92\xc0\x9b\x21\xd5\x67\xe6\x6b\xee\xac\xee\xad\xee\xce'\
-b'\xee\xef\xee\xef\xee\xef\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xef\x11\xf7\x11\xf7\x31\xf7\x11\xef\x11\xf7\x31\xf7\x11\xf7\x31'\
-b'\xef\x11\xf7\x31\xef\x31\xf7\x31\xf7\x32\xef\x31\xf7\x32\xf7\x31'\
-b'\xf7\x32\xf7\x32\xf7\x31\xf7\x31\xf7\x32\xef\x32\xf7\x31\xf7\x31'\
-b'\xef\x11\xf7\x11\xf7\x11\xef\x10\xf7\x10\xef\x10\xee\xef\xee\xcf'\
-b'\xee\xcd\xee\x8c\xe6\x29\xac\x03\x92\xe0\x93\x00\xcd\x26\xe6\x6b'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x11\xf7\x31\xf7\x11\xf7\x30\xef\x11\xf7\x11\xf7\x31\xef\x11'\
-b'\xf7\x31\xef\x31\xf7\x31\xf7\x31\xef\x11\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xee\xef\xf7\x0f\xee\xef\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xad\xee\xac\xe6\x8c\xee\x8b\xe6\x6b\xe6\x6b\xe6\x4a'\
-b'\xe6\x4a\xe6\x29\xde\x09\xd5\xa7\xcd\x26\xbc\x64\xa3\x82\x92\xc0'\
-b'\x92\xe0\x92\xe0\x9b\x01\xa3\x82\xb4\x44\xcd\x06\xd5\xc8\xe6\x2a'\
-b'\xe6\x6b\xe6\x8b\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xee\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xef\xf7\x0f'\
-b'\xf7\x32\xf7\x31\xf7\x11\xf7\x31\xf7\x31\xf7\x31\xf7\x31\xf7\x31'\
-b'\xef\x11\xf7\x32\xf7\x31\xf7\x11\xf7\x31\xef\x31\xf7\x31\xf7\x31'\
-b'\xf7\x31\xef\x11\xf7\x11\xef\x31\xf7\x11\xef\x31\xf7\x10\xf7\x31'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xee\xef\xef\x0f\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xad\xee\xad\xe6\x6b\xdd\xe9\xb4\x24\x9b\x00'\
-b'\x9b\x21\xc4\xc5\xde\x08\xe6\x2a\xe6\x4a\xe6\x6a\xe6\x6b\xe6\x8b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xd5\x87\xbc\x84\xa3\x62\x92\xe0\x92\xc0'\
-b'\x92\xe0\x92\xe0\xa3\x41\xbc\x44\xd5\x87\xe6\x4a\xe6\x6b\xee\x8c'\
-b'\xee\xac\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xf7\x0f\xee\xef\xf7\x0f\xee\xef\xef\x0f\xf6\xef'\
-b'\xee\xef\xee\xef\xee\xef\xf6\xee\xee\xee\xee\xce\xee\xad\xee\x8c'\
-b'\xde\x29\xb4\x44\x9a\xe0\x9b\x01\xc4\xc5\xe6\x29\xe6\x8b\xee\xad'\
-b'\xee\xce\xee\xef\xf7\x0f\xef\x10\xf7\x10\xef\x10\xf7\x11\xf7\x31'\
-b'\xef\x31\xf7\x31\xf7\x32\xf7\x31\xef\x32\xf7\x32\xf7\x32\xef\x52'\
-b'\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xef\x52\xf7\x33\xf7\x52\xf7\x52'\
-b'\xf7\x32\xf7\x32\xef\x32\xf7\x32\xef\x32\xf7\x31\xf7\x32\xf7\x32'\
-b'\xef\x31\xf7\x31\xef\x11\xf7\x31\xf7\x10\xef\x10\xef\x10\xf6\xef'\
-b'\xee\xef\xee\xce\xee\xad\xe6\x6a\xbc\xa5\x92\xe0\x92\xe0\xbc\x64'\
-b'\xe6\x4a\xee\x8c\xee\xcd\xee\xee\xee\xef\xee\xef\xf7\x0f\xef\x10'\
-b'\xf6\xf0\xef\x10\xee\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xee\xef\xef\x0f\xf6\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xce'\
-b'\xee\xad\xe6\x8c\xe6\x6b\xe6\x4a\xdd\xe8\xcd\x46\xbc\x64\xa3\x82'\
-b'\x9b\x01\x92\xe0\x92\xc0\x9b\x01\xa3\x82\xbc\x64\xd5\x67\xde\x09'\
-b'\xe6\x6b\xe6\x6b\xee\x8b\xe6\x8b\xe6\x8b\xee\x6b\xe6\x4a\xd5\x67'\
-b'\x9b\x21\x92\xc0\xa3\xa2\xdd\xe8\xe6\x6b\xee\xac\xee\xce\xee\xce'\
-b'\xee\xce\xee\xef\xf6\xef\xee\xef\xee\xef\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x30\xf7\x31\xef\x11\xf7\x31\xf7\x31'\
-b'\xf7\x31\xf7\x11\xf7\x32\xef\x31\xf7\x31\xf7\x32\xf7\x31\xef\x32'\
-b'\xf7\x31\xef\x31\xf7\x32\xef\x31\xf7\x31\xf7\x31\xf7\x11\xf7\x31'\
-b'\xef\x31\xf7\x31\xf7\x11\xef\x10\xf7\x10\xee\xef\xf6\xef\xee\xee'\
-b'\xee\xce\xee\x8c\xde\x29\xab\xe3\x92\xc0\x9a\xe0\xcd\x26\xe6\x6b'\
-b'\xee\xad\xee\xce\xee\xef\xf6\xef\xf7\x10\xef\x10\xf7\x10\xf7\x11'\
-b'\xef\x31\xf7\x31\xef\x31\xf7\x31\xf7\x31\xef\x31\xf7\x31\xf7\x31'\
-b'\xf7\x31\xf7\x11\xf7\x31\xef\x31\xf7\x11\xf7\x31\xf7\x31\xef\x11'\
-b'\xf7\x11\xf7\x10\xef\x10\xf7\x10\xef\x10\xee\xf0\xf7\x0f\xee\xef'\
-b'\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x8b\xee\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xe8\xcd\x05\x93\x01'\
-b'\x92\xc0\x93\x01\x9b\x41\x9b\x00\x92\xe0\x92\xe0\xa3\x41\xab\xe3'\
-b'\xc4\xc5\xd5\x67\xde\x09\xe6\x6b\xe6\x8c\xee\xac\xee\xad\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xee\xf6\xef\xee\xef\xee\xef\xee\xef'\
-b'\xf7\x32\xf7\x32\xef\x32\xf7\x32\xef\x32\xf7\x32\xef\x32\xf7\x32'\
-b'\xf7\x32\xf7\x31\xef\x32\xf7\x32\xf7\x32\xf7\x31\xf7\x12\xef\x31'\
-b'\xf7\x31\xf7\x31\xef\x31\xf7\x11\xf7\x31\xf7\x10\xef\x11\xf7\x10'\
-b'\xef\x11\xf7\x10\xef\x10\xef\x10\xf6\xf0\xee\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xad\xee\xad\xe6\x8b\xdd\xc8\xab\xe3\x92\xe0\xa3\x61'\
-b'\xcd\x06\xde\x29\xe6\x4a\xe6\x6a\xe6\x8b\xee\x8c\xee\xad\xee\xad'\
-b'\xee\x8c\xe6\x8c\xe6\x8b\xe6\x6b\xe6\x2a\xd5\xa7\xc4\xa5\xa3\x82'\
-b'\x92\xe1\x92\xc0\x92\xe0\x92\xe0\x9b\x21\xb4\x23\xd5\x67\xde\x29'\
-b'\xe6\x6b\xee\x8c\xee\x8c\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee'\
-b'\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xee\xee\xce\xee\xce\xee\xad\xee\x8c\xe6\x4a'\
-b'\xbc\x84\x9a\xe0\x93\x00\xbc\x64\xde\x09\xe6\x6b\xee\xad\xee\xce'\
-b'\xee\xef\xf6\xef\xef\x10\xf7\x10\xef\x10\xf7\x11\xef\x31\xf7\x31'\
-b'\xf7\x11\xf7\x32\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x53\xf7\x52\xf7\x32\xf7\x52\xf7\x33\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x52\xef\x32\xf7\x31'\
-b'\xf7\x31\xf7\x31\xef\x11\xf7\x11\xef\x10\xf7\x10\xee\xef\xee\xef'\
-b'\xee\xce\xee\xcd\xee\x8c\xd5\xa8\xa3\x61\x92\xc0\xa3\x62\xd5\xa8'\
-b'\xe6\x8b\xee\xad\xee\xce\xee\xef\xee\xef\xf6\xef\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x11\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x8c\xe6\x6b\xe6\x4a\xdd\xc8'\
-b'\xcd\x06\xb4\x23\xa3\x61\x93\x00\x92\xe0\x92\xe0\x9b\x01\xab\xa2'\
-b'\xbc\xa5\xd5\x67\xde\x09\xe6\x4a\xe6\x4b\xe6\x4a\xe6\x29\xbc\x84'\
-b'\x92\xe0\x92\xe0\xb4\x44\xe6\x2a\xe6\x8b\xee\x8c\xee\xad\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xee\xef\xf7\x0f\xee\xf0\xf7\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x11\xf7\x11\xef\x10\xf7\x31\xef\x11\xef\x11'\
-b'\xf7\x31\xef\x31\xf7\x31\xf7\x11\xf7\x32\xef\x31\xf7\x31\xf7\x32'\
-b'\xf7\x32\xf7\x31\xf7\x31\xf7\x32\xef\x32\xf7\x11\xf7\x31\xef\x31'\
-b'\xf7\x11\xef\x11\xf7\x10\xf7\x10\xef\x10\xef\x10\xee\xef\xee\xee'\
-b'\xee\xcd\xee\x8c\xe6\x2a\xab\xe3\x92\xe0\x9a\xe1\xcd\x26\xe6\x8b'\
-b'\xee\xac\xee\xce\xee\xee\xef\x0f\xef\x10\xf7\x10\xef\x10\xf7\x31'\
-b'\xf7\x11\xef\x31\xf7\x11\xf7\x31\xf7\x31\xf7\x31\xf7\x32\xef\x31'\
-b'\xf7\x31\xf7\x31\xef\x31\xf7\x11\xf7\x31\xef\x31\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x31\xf7\x11\xef\x11\xf7\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xad'\
-b'\xe6\x8c\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x4a\xe6\x29\xd5\xa7\xa3\x61'\
-b'\x92\xc0\x9b\x01\xc4\xc4\xcd\x05\xbc\x64\xab\xa2\x9b\x21\x92\xe0'\
-b'\x92\xe0\x9b\x21\xa3\xa2\xbc\x44\xcd\x26\xdd\xc8\xe6\x4a\xe6\x6b'\
-b'\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xee'\
-b'\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x31\xf7\x32\xf7\x31\xef\x32'\
-b'\xf7\x32\xf7\x31\xf7\x32\xef\x31\xf7\x31\xef\x32\xf7\x31\xf7\x31'\
-b'\xf7\x11\xf7\x31\xef\x31\xf7\x11\xef\x31\xef\x31\xf7\x11\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf6\xef\xef\x0f\xee\xef\xf6\xef\xee\xce'\
-b'\xee\xcd\xee\xad\xe6\x6b\xd5\x87\xab\xa2\x92\xe0\xa3\x82\xd5\x47'\
-b'\xe6\x29\xe6\x4a\xe6\x6b\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xcd'\
-b'\xee\xad\xee\xad\xee\xad\xee\xac\xe6\x8c\xe6\x6b\xe6\x29\xdd\xc8'\
-b'\xc4\xc5\xa3\x82\x9b\x00\x92\xc0\x92\xe0\x92\xc0\x9b\x21\xb4\x03'\
-b'\xcd\x47\xde\x29\xe6\x6b\xe6\x8b\xee\x8c\xee\xad\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xce\xf6\xee\xee\xee\xee\xef\xee\xee\xee\xee'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad\xe6\x8c\xe6\x4a\xc4\xc5'\
-b'\x9b\x01\x92\xe0\xb4\x23\xdd\xe9\xe6\x6b\xee\xac\xee\xce\xee\xee'\
-b'\xf6\xef\xef\x0f\xf7\x10\xef\x10\xf7\x11\xf7\x11\xf7\x11\xf7\x31'\
-b'\xef\x31\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x52\xf7\x32\xf7\x52'\
-b'\xef\x32\xf7\x53\xf7\x32\xef\x32\xf7\x53\xf7\x32\xef\x52\xf7\x52'\
-b'\xf7\x33\xef\x52\xf7\x32\xf7\x32\xf7\x32\xef\x32\xf7\x32\xf7\x32'\
-b'\xf7\x31\xef\x31\xf7\x11\xf7\x11\xef\x10\xef\x10\xf6\xef\xee\xef'\
-b'\xee\xce\xee\xac\xe6\x4a\xb4\x24\x92\xe0\x9b\x00\xc4\xc5\xe6\x6a'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xf7\x0f\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x11\xef\x11\xf7\x11\xf7\x10\xf7\x11\xef\x11\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf6\xef\xee\xef'\
-b'\xee\xef\xf6\xef\xee\xce\xee\xce\xee\xce\xee\xad\xee\x8c\xe6\x8b'\
-b'\xe6\x6a\xe6\x29\xd5\xa8\xc4\xe5\xb4\x03\xa3\x41\x92\xe0\x92\xe0'\
-b'\x92\xe0\x9b\x21\xab\xc3\xc4\xc5\xd5\x87\xdd\xe8\xdd\xc8\xab\xc3'\
-b'\x92\xc0\x9b\x00\xc5\x06\xe6\x4a\xee\x6b\xe6\x8c\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xef\x0f\xee\xef\xf7\x10'\
-b'\xef\x10\xef\x10\xef\x10\xf7\x10\xf7\x10\xef\x11\xf7\x31\xf7\x31'\
-b'\xf7\x11\xf7\x11\xef\x31\xf7\x31\xf7\x31\xf7\x11\xef\x31\xf7\x32'\
-b'\xef\x11\xf7\x31\xf7\x32\xef\x31\xf7\x11\xf7\x31\xf7\x31\xef\x31'\
-b'\xf7\x11\xf7\x31\xef\x11\xf7\x10\xf7\x10\xef\x0f\xee\xef\xee\xcf'\
-b'\xee\xcd\xee\x8c\xe6\x29\xab\xe2\x92\xc0\x93\x00\xcd\x06\xe6\x6b'\
-b'\xee\xad\xee\xce\xee\xef\xf7\x0f\xf7\x10\xef\x10\xf7\x11\xef\x11'\
-b'\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x32\xef\x32\xf7\x32\xf7\x32'\
-b'\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x31\xef\x31'\
-b'\xf7\x31\xf7\x31\xef\x11\xf7\x31\xf7\x10\xef\x11\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xf6\xef\xee\xef\xee\xef\xee\xce\xee\xce'\
-b'\xee\xad\xee\xac\xee\x8c\xee\x8b\xe6\x4a\xe6\x2a\xdd\xe8\xb4\x23'\
-b'\x92\xe0\x92\xe0\xbc\x84\xdd\xe8\xdd\xe8\xdd\xc8\xd5\x67\xc4\xc5'\
-b'\xb4\x03\xa3\x62\x9b\x01\x92\xe0\x92\xe0\x9b\x42\xab\xe3\xc4\xc5'\
-b'\xd5\x87\xde\x09\xe6\x6b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xcd'\
-b'\xf7\x52\xf7\x32\xf7\x32\xef\x32\xf7\x32\xef\x32\xf7\x32\xf7\x32'\
-b'\xf7\x32\xef\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x31\xef\x32\xf7\x32'\
-b'\xf7\x31\xef\x32\xf7\x11\xf7\x31\xf7\x11\xf7\x11\xef\x10\xf7\x31'\
-b'\xef\x10\xef\x10\xf7\x10\xee\xef\xee\xef\xee\xef\xee\xce\xee\xcd'\
-b'\xee\xac\xe6\x6b\xcd\x46\xa3\x62\x92\xe0\xab\xc3\xd5\x87\xe6\x4a'\
-b'\xe6\x6a\xe6\x6b\xee\xac\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xee\xac\xee\x8c\xe6\x6b'\
-b'\xe6\x4a\xdd\xc8\xc4\xe5\xab\xa2\x93\x01\x92\xe0\x92\xc0\x92\xe0'\
-b'\x9b\x01\xab\xe3\xcd\x06\xde\x09\xe6\x6a\xe6\x8b\xee\x8c\xee\xad'\
-b'\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\x8c\xe6\x6a\xcd\x06\x9b\x21'\
-b'\x92\xe0\xab\xc3\xdd\xc8\xe6\x4a\xee\xac\xee\xce\xee\xce\xee\xef'\
-b'\xef\x0f\xf7\x10\xef\x10\xf7\x10\xef\x11\xf7\x31\xef\x31\xf7\x31'\
-b'\xf7\x32\xef\x32\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52'\
-b'\xf7\x53\xf7\x32\xf7\x52\xf7\x52\xf7\x32\xf7\x53\xf7\x32\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x52\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xef\x31'\
-b'\xf7\x31\xf7\x11\xef\x11\xf7\x30\xef\x10\xf7\x0f\xee\xef\xee\xce'\
-b'\xee\xad\xee\x8b\xcd\x47\x9b\x21\x92\xe0\xab\xa2\xdd\xe9\xe6\x8c'\
-b'\xee\xad\xee\xce\xee\xef\xf7\x10\xee\xf0\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x11\xef\x31\xf7\x31\xef\x31\xef\x11\xf7\x31\xf7\x31\xef\x11'\
-b'\xf7\x11\xf7\x11\xf7\x11\xef\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce'\
-b'\xee\xad\xee\x8c\xe6\x8b\xe6\x4b\xe6\x09\xd5\x87\xbc\xa5\xab\xc2'\
-b'\x9b\x21\x92\xe0\x92\xc0\x92\xe0\x9b\x41\xab\xe3\xbc\x63\x9b\x21'\
-b'\x92\xc0\x9b\x41\xd5\x87\xe6\x4a\xe6\x6b\xee\x8c\xe6\xac\xee\xad'\
-b'\xee\xae\xee\xce\xee\xce\xee\xce\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xf7\x0f\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xef\x31\xf7\x31\xf7\x11\xef\x11\xef\x31\xf7\x31\xf7\x31\xf7\x31'\
-b'\xf7\x31\xf7\x31\xef\x12\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x11'\
-b'\xef\x31\xf7\x11\xf7\x10\xef\x10\xef\x10\xf7\x10\xee\xef\xee\xee'\
-b'\xee\xce\xee\x8c\xde\x29\xab\xc3\x92\xe0\x9a\xe1\xc5\x06\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xef\xee\xef\xf7\x10\xf7\x10\xef\x10\xf7\x31'\
-b'\xf7\x31\xef\x11\xf7\x31\xf7\x32\xf7\x31\xf7\x31\xef\x32\xf7\x31'\
-b'\xf7\x32\xf7\x32\xf7\x31\xef\x32\xf7\x31\xef\x32\xf7\x32\xf7\x32'\
-b'\xf7\x31\xf7\x11\xf7\x31\xef\x31\xf7\x31\xf7\x31\xef\x11\xf7\x11'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x0f\xee\xef\xf6\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xce\xee\xad\xe6\x8c\xe6\x8b\xe6\x4a\xe6\x09\xc4\xc5'\
-b'\x92\xe0\x92\xc0\xab\xc3\xdd\xc7\xe6\x09\xde\x29\xe6\x29\xe6\x29'\
-b'\xde\x09\xd5\xc7\xcd\x26\xbc\x64\xab\xc2\x9b\x41\x9a\xe0\x92\xe0'\
-b'\x9b\x01\xa3\x82\xb4\x44\xcd\x26\xd5\xc8\xe6\x4a\xe6\x8b\xee\x8c'\
-b'\xf7\x52\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x52\xf7\x32\xf7\x32'\
-b'\xef\x32\xf7\x32\xf7\x32\xef\x32\xf7\x31\xf7\x32\xf7\x31\xf7\x31'\
-b'\xef\x32\xf7\x31\xf7\x31\xef\x11\xef\x31\xf7\x10\xf7\x11\xef\x10'\
-b'\xf7\x10\xf7\x10\xee\xef\xee\xef\xf6\xef\xee\xce\xee\xcd\xee\x8c'\
-b'\xe6\x4b\xc4\xe6\x9b\x41\x9a\xe0\xb4\x03\xdd\xc8\xe6\x4a\xe6\x6a'\
-b'\xe6\x8c\xee\xad\xee\xce\xee\xce\xee\xcf\xee\xee\xee\xef\xee\xef'\
-b'\xee\xef\xee\xee\xee\xee\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad'\
-b'\xe6\x8c\xe6\x8b\xe6\x4a\xdd\xe9\xc4\xe5\xab\xc3\x9b\x01\x92\xc0'\
-b'\x92\xe0\x92\xe0\x9b\x00\xab\xc2\xcc\xe6\xdd\xe9\xe6\x4a\xe6\x8b'\
-b'\xee\x8c\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce'\
-b'\xee\xad\xee\xad\xee\xad\xee\x8c\xe6\x6a\xcd\x47\xa3\x41\x92\xe0'\
-b'\xa3\x82\xd5\x87\xe6\x4a\xee\x8c\xee\xcd\xee\xce\xee\xef\xf6\xef'\
-b'\xee\xef\xf7\x10\xf7\x10\xef\x10\xf7\x11\xf7\x11\xf7\x31\xf7\x31'\
-b'\xf7\x31\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xef\x52\xf7\x33'\
-b'\xf7\x32\xf7\x52\xf7\x33\xf7\x32\xf7\x52\xf7\x32\xf7\x53\xf7\x52'\
-b'\xf7\x33\xf7\x52\xf7\x32\xef\x32\xf7\x32\xf7\x32\xef\x32\xf7\x31'\
-b'\xf7\x31\xef\x31\xf7\x11\xef\x10\xf7\x10\xee\xef\xee\xef\xee\xcd'\
-b'\xee\x8c\xde\x09\xab\xe3\x92\xe0\x9b\x01\xcd\x06\xe6\x6b\xee\xad'\
-b'\xee\xce\xee\xef\xf6\xef\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x31'\
-b'\xf7\x11\xf7\x11\xef\x31\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x11'\
-b'\xef\x31\xf7\x31\xef\x31\xf7\x11\xf7\x11\xf7\x11\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x0f\xee\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xce\xee\xad\xee\xac\xe6\x8c\xe6\x6b\xe6\x4a\xdd\xe8'\
-b'\xd5\x67\xbc\x64\xab\xa2\x9b\x01\x92\xc0\x92\xc0\x92\xe0\x92\xe0'\
-b'\x92\xc0\xa3\x82\xd5\x66\xe6\x09\xe6\x4a\xe6\x6b\xe6\x8b\xee\x8c'\
-b'\xee\xad\xee\xcd\xee\xcd\xee\xce\xee\xee\xee\xee\xee\xef\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xf0\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xf7\x10\xef\x11\xf7\x10\xf7\x31\xf7\x11\xef\x11\xf7\x11\xef\x31'\
-b'\xf7\x11\xf7\x31\xf7\x31\xef\x31\xf7\x11\xef\x31\xf7\x11\xf7\x11'\
-b'\xf7\x31\xef\x11\xf7\x10\xf7\x10\xef\x10\xf6\xf0\xee\xef\xee\xce'\
-b'\xee\xcd\xee\x8c\xe6\x09\xab\xc2\x92\xe0\x93\x00\xcd\x06\xee\x8b'\
-b'\xee\xad\xee\xce\xee\xee\xf7\x0f\xef\x10\xf7\x10\xf7\x11\xef\x11'\
-b'\xf7\x31\xf7\x31\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x32\xef\x32'\
-b'\xf7\x32\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xef\x32'\
-b'\xf7\x32\xef\x32\xf7\x32\xf7\x31\xf7\x11\xef\x31\xf7\x11\xf7\x31'\
-b'\xf7\x11\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xee\xef\xf6\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xad\xee\x8c\xe6\x6a\xe6\x29\xd5\x67'\
-b'\x9b\x41\x92\xe0\xa3\x41\xd5\x67\xde\x29\xe6\x2a\xe6\x4a\xe6\x4a'\
-b'\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xdd\xe8\xd5\x87\xc4\xc5\xb4\x03'\
-b'\xa3\x62\x9b\x01\x92\xe0\x9b\x00\x9b\x42\xab\xe3\xc4\xa5\xd5\x67'\
-b'\xf7\x52\xf7\x52\xf7\x32\xf7\x52\xf7\x52\xf7\x32\xf7\x32\xf7\x52'\
-b'\xf7\x32\xf7\x52\xf7\x31\xf7\x32\xef\x32\xf7\x32\xf7\x32\xef\x31'\
-b'\xf7\x31\xf7\x11\xef\x31\xf7\x11\xf7\x31\xef\x11\xef\x10\xf7\x10'\
-b'\xef\x10\xee\xef\xee\xef\xf6\xef\xee\xce\xee\xcd\xee\x8c\xe6\x2a'\
-b'\xbc\xa5\x9b\x20\x9b\x01\xb4\x44\xdd\xe8\xe6\x4a\xe6\x6b\xee\x8c'\
-b'\xee\xad\xee\xae\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xce'\
-b'\xee\xad\xee\xad\xee\x8c\xe6\x6b\xe6\x4a\xdd\xe8\xcd\x06\xab\xe2'\
-b'\x9b\x01\x92\xc0\x92\xc0\x92\xe0\x92\xe1\xab\xa2\xc4\xc5\xdd\xc8'\
-b'\xe6\x4a\xe6\x6b\xe6\x8c\xee\x8c\xe6\xac\xee\xad\xee\xad\xee\xad'\
-b'\xee\xac\xe6\x8c\xee\x8b\xe6\x6b\xd5\x87\xa3\x82\x92\xc0\xa3\x61'\
-b'\xcd\x46\xe6\x4a\xe6\x8b\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef'\
-b'\xf7\x10\xef\x10\xef\x10\xf7\x11\xef\x31\xf7\x31\xef\x31\xf7\x12'\
-b'\xef\x32\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32'\
-b'\xf7\x52\xef\x32\xf7\x52\xf7\x53\xef\x32\xf7\x52\xf7\x32\xef\x32'\
-b'\xf7\x52\xf7\x33\xf7\x52\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x31'\
-b'\xf7\x31\xef\x11\xf7\x11\xf7\x10\xee\xef\xee\xef\xee\xce\xee\xad'\
-b'\xe6\x6b\xc4\xe5\x9b\x00\x92\xc0\xb4\x03\xde\x29\xee\xac\xee\xcd'\
-b'\xee\xef\xee\xef\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x31\xf7\x11'\
-b'\xef\x31\xf7\x31\xf7\x31\xf7\x11\xf7\x31\xf7\x11\xf7\x31\xf7\x31'\
-b'\xf7\x11\xf7\x31\xf7\x11\xef\x31\xef\x31\xf7\x11\xef\x30\xf7\x11'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xee\xf0\xf7\x0f\xf6\xef'\
-b'\xee\xef\xee\xee\xee\xce\xee\xce\xee\xcd\xee\xad\xee\x8c\xe6\x6b'\
-b'\xe6\x4a\xe6\x29\xdd\xc8\xcd\x25\xb4\x43\xa3\x62\x92\xe0\x92\xc0'\
-b'\x92\xc1\x92\xe0\xa3\x61\xb4\x43\xcd\x26\xdd\xe8\xe6\x4a\xe6\x6b'\
-b'\xe6\x8b\xee\x8c\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xee'\
-b'\xee\xef\xef\x0f\xf6\xef\xef\x0f\xf6\xef\xf7\x10\xef\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xef\x11\xf7\x10\xef\x30\xf7\x11\xf7\x31\xef\x11'\
-b'\xf7\x31\xef\x11\xf7\x11\xf7\x31\xef\x11\xf7\x31\xf7\x31\xef\x11'\
-b'\xef\x31\xf7\x10\xef\x11\xef\x10\xf7\x10\xef\x0f\xee\xef\xee\xef'\
-b'\xee\xcd\xee\x8c\xde\x29\xab\xc3\x92\xc0\x92\xe1\xcd\x06\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xef\xee\xef\xf7\x10\xef\x11\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x31\xf7\x32\xf7\x31\xef\x32\xf7\x31\xf7\x32\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xef\x32\xf7\x32\xf7\x32'\
-b'\xf7\x31\xf7\x32\xef\x31\xf7\x32\xf7\x32\xf7\x31\xef\x31\xf7\x11'\
-b'\xef\x31\xf7\x11\xf7\x11\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x0f'\
-b'\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xad\xe6\x6b\xe6\x4a\xdd\xc8'\
-b'\xab\xc2\x92\xc0\x92\xe0\xc4\xe5\xe6\x29\xe6\x4a\xe6\x4a\xe6\x6a'\
-b'\xe6\x6b\xe6\x6a\xe6\x6a\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a\xde\x29'\
-b'\xdd\xc8\xcd\x26\xbc\x64\xab\xc2\x9b\x21\x92\xe0\x92\xe0\x9b\x01'\
-b'\xf7\x53\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xef\x52\xf7\x32\xf7\x32'\
-b'\xf7\x32\xef\x32\xf7\x52\xf7\x32\xf7\x31\xef\x31\xf7\x32\xf7\x32'\
-b'\xf7\x31\xf7\x31\xef\x11\xf7\x31\xf7\x11\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xee\xef\xee\xee\xee\xce\xee\xcd\xe6\x8c\xde\x09\xb4\x44'\
-b'\x9b\x01\x9b\x21\xbc\xa4\xe6\x09\xe6\x4a\xe6\x6b\xe6\x8c\xee\xad'\
-b'\xee\xce\xee\xee\xee\xef\xee\xef\xf6\xef\xf7\x0f\xef\x0f\xf6\xef'\
-b'\xf7\x0f\xf6\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xac\xe6\x8c\xe6\x6a\xde\x09'\
-b'\xcd\x26\xac\x03\x9b\x21\x92\xc0\x92\xe0\x92\xc0\x92\xe0\xa3\x82'\
-b'\xbc\xa5\xd5\xa8\xe6\x49\xe6\x6b\xee\x6b\xe6\x8b\xe6\x8c\xee\x8c'\
-b'\xe6\x8c\xe6\x6b\xe6\x6a\xd5\xa8\xab\xa2\x92\xc0\x9b\x21\xcd\x06'\
-b'\xe6\x29\xe6\x6b\xee\xad\xee\xcd\xee\xce\xee\xef\xee\xef\xf6\xef'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x11\xf7\x11\xef\x11\xf7\x31\xf7\x31'\
-b'\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x52\xf7\x52\xef\x33\xf7\x52'\
-b'\xf7\x33\xf7\x52\xf7\x32\xf7\x32\xf7\x53\xf7\x32\xf7\x53\xf7\x52'\
-b'\xf7\x32\xf7\x52\xef\x32\xf7\x32\xef\x32\xf7\x32\xef\x31\xf7\x31'\
-b'\xef\x11\xf7\x11\xef\x10\xef\x10\xf6\xef\xee\xee\xee\xcd\xee\x8c'\
-b'\xdd\xc8\xa3\x62\x92\xe0\x9b\x41\xd5\x67\xe6\x6b\xee\xad\xee\xce'\
-b'\xee\xef\xf7\x0f\xef\x10\xf7\x10\xf7\x10\xf7\x31\xf7\x11\xf7\x31'\
-b'\xf7\x31\xf7\x31\xef\x31\xf7\x32\xef\x32\xf7\x31\xef\x32\xf7\x31'\
-b'\xef\x32\xf7\x31\xf7\x31\xf7\x11\xf7\x31\xf7\x31\xf7\x11\xef\x31'\
-b'\xf7\x31\xf7\x11\xef\x11\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x0f'\
-b'\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xad\xee\xac'\
-b'\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8\xcd\x26\x9b\x21\x92\xc0'\
-b'\x92\xe0\x92\xe0\x92\xc0\x92\xc0\x9b\x01\xa3\x82\xbc\x64\xd5\x67'\
-b'\xde\x09\xe6\x4a\xe6\x8b\xee\x8c\xee\xac\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xef\x0f\xf6\xf0\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x11\xf7\x10'\
-b'\xef\x11\xf7\x31\xef\x31\xf7\x11\xf7\x31\xef\x11\xf7\x11\xf7\x31'\
-b'\xf7\x10\xf7\x11\xf7\x30\xef\x10\xf7\x10\xee\xef\xf6\xef\xee\xee'\
-b'\xee\xce\xee\x8c\xde\x09\xab\xc2\x92\xe0\x93\x00\xcd\x06\xe6\x6b'\
-b'\xee\xad\xee\xce\xee\xef\xf7\x0f\xef\x10\xf7\x10\xef\x11\xf7\x31'\
-b'\xf7\x31\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x52\xf7\x32'\
-b'\xef\x32\xf7\x32\xf7\x32\xf7\x32\xef\x31\xf7\x32\xf7\x31\xf7\x31'\
-b'\xef\x31\xf7\x11\xef\x31\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10'\
-b'\xee\xef\xee\xef\xee\xee\xee\xce\xee\xad\xe6\x8b\xe6\x4a\xde\x09'\
-b'\xbc\x64\x92\xe0\x92\xe0\xb4\x24\xe6\x29\xe6\x4a\xe6\x6b\xee\x6b'\
-b'\xe6\x6b\xe6\x6b\xee\x8c\xe6\x6b\xe6\x8b\xee\x6b\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xe6\x4a\xde\x09\xd5\x87\xc4\xe6\xb4\x23\xa3\x82'\
-b'\xf7\x52\xf7\x53\xf7\x32\xf7\x52\xf7\x52\xf7\x32\xf7\x52\xf7\x52'\
-b'\xf7\x32\xf7\x32\xf7\x32\xef\x52\xf7\x32\xf7\x32\xf7\x31\xef\x31'\
-b'\xf7\x31\xef\x31\xf7\x11\xef\x31\xf7\x10\xef\x10\xef\x10\xee\xef'\
-b'\xee\xef\xee\xef\xee\xce\xee\xad\xee\x8c\xdd\xe9\xac\x03\x9a\xe0'\
-b'\x9b\x41\xc4\xe5\xe6\x09\xe6\x6a\xe6\x8b\xee\xac\xee\xcd\xee\xce'\
-b'\xee\xef\xee\xef\xf7\x0f\xef\x10\xee\xf0\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xef\x10\xf7\x0f\xee\xef\xf6\xef\xf6\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xce\xee\xce\xee\xad\xee\xad\xee\x8c\xe6\x8b'\
-b'\xe6\x4b\xe6\x09\xcd\x46\xb4\x03\x9b\x21\x92\xe0\x92\xe0\x92\xc0'\
-b'\x92\xe0\xa3\x61\xbc\x64\xd5\x87\xe6\x29\xe6\x4a\xe6\x6b\xe6\x6b'\
-b'\xe6\x6a\xe6\x4a\xdd\xc8\xab\xe3\x92\xe0\x9b\x01\xc4\xc4\xde\x09'\
-b'\xe6\x6a\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xef\xee\xef\xee\xef'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x31\xf7\x31\xf7\x31\xef\x12'\
-b'\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32'\
-b'\xf7\x52\xf7\x33\xf7\x52\xf7\x52\xef\x32\xf7\x52\xf7\x32\xf7\x33'\
-b'\xf7\x52\xf7\x33\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x31\xf7\x31'\
-b'\xf7\x31\xef\x10\xf7\x10\xef\x0f\xee\xef\xee\xce\xee\xad\xe6\x4a'\
-b'\xbc\x64\x92\xe0\x92\xe1\xbc\x64\xe6\x4a\xee\xad\xee\xce\xee\xef'\
-b'\xf6\xef\xef\x10\xf7\x10\xef\x10\xf7\x11\xef\x31\xf7\x31\xef\x31'\
-b'\xf7\x31\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x31\xf7\x32'\
-b'\xf7\x32\xef\x31\xf7\x32\xef\x32\xf7\x31\xef\x31\xf7\x31\xf7\x31'\
-b'\xef\x11\xf7\x31\xf7\x11\xef\x11\xf7\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xef\x0f\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xcd'\
-b'\xee\xad\xee\xac\xe6\x8c\xe6\x4b\xe6\x29\xc5\x05\x9b\x01\x92\xc0'\
-b'\xa3\x61\xbc\x84\xab\xe3\x9b\x41\x92\xe0\x92\xc0\x92\xe0\x9b\x21'\
-b'\xab\xc2\xbc\xa5\xd5\x88\xe6\x2a\xe6\x6b\xe6\x8c\xee\x8c\xee\xad'\
-b'\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xef\xef\x0f\xee\xf0\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xf7\x11\xef\x11\xf7\x10\xf7\x31\xef\x11\xef\x10'\
-b'\xf7\x11\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xee\xef\xee\xce'\
-b'\xee\xad\xee\x8c\xde\x29\xab\xc2\x92\xc0\x92\xe1\xcd\x06\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xef\xef\x10\xf7\x10\xf7\x10\xf7\x31\xef\x31'\
-b'\xf7\x31\xf7\x32\xf7\x32\xef\x31\xf7\x32\xf7\x32\xf7\x52\xef\x32'\
-b'\xf7\x32\xf7\x52\xef\x52\xf7\x52\xf7\x32\xf7\x32\xf7\x32\xf7\x32'\
-b'\xf7\x52\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x31\xef\x32\xf7\x31'\
-b'\xf7\x11\xf7\x31\xf7\x31\xf7\x11\xf7\x11\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x0f\xf6\xef\xee\xef\xee\xce\xee\xcd\xee\x8c\xe6\x6b\xe6\x29'\
-b'\xcd\x26\x9b\x01\x92\xc0\xa3\x82\xdd\xc8\xe6\x6b\xee\x8c\xe6\x8c'\
-b'\xee\xac\xee\xad\xee\x8c\xee\xac\xee\x8c\xe6\xac\xee\x8c\xee\x8c'\
-b'\xe6\x8c\xee\x8c\xe6\x8c\xee\x8c\xee\x8c\xe6\x8b\xe6\x4b\xe6\x0a'\
-b'\xf7\x53\xf7\x32\xf7\x32\xf7\x53\xf7\x32\xef\x32\xf7\x53\xf7\x32'\
-b'\xef\x52\xf7\x32\xf7\x32\xf7\x32\xef\x32\xf7\x31\xf7\x32\xf7\x32'\
-b'\xf7\x31\xf7\x11\xef\x11\xf7\x10\xef\x10\xf7\x10\xf7\x10\xee\xef'\
-b'\xee\xee\xee\xce\xee\xad\xe6\x8b\xd5\x88\xab\xc2\x92\xe0\xa3\x62'\
-b'\xcd\x26\xe6\x2a\xe6\x6b\xe6\x6b\xee\xad\xee\xae\xee\xce\xee\xef'\
-b'\xf6\xef\xef\x10\xf7\x10\xf7\x0f\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf6\xf0\xef\x10\xf7\x10\xef\x0f\xef\x0f\xf6\xef'\
-b'\xee\xef\xee\xef\xf6\xef\xee\xee\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\x8c\xe6\x8b\xe6\x4a\xe6\x09\xcd\x47\xb4\x23\x9b\x21\x92\xe1'\
-b'\x92\xe0\x92\xc0\x92\xe1\x9b\x41\xb4\x44\xd5\x67\xe6\x09\xe6\x29'\
-b'\xe6\x2a\xdd\xe8\xb4\x23\x92\xe0\x9a\xe0\xbc\x64\xdd\xe8\xe6\x4a'\
-b'\xe6\x8b\xee\xad\xee\xad\xee\xce\xee\xee\xee\xee\xf6\xef\xef\x0f'\
-b'\xef\x10\xf6\xf0\xef\x10\xf7\x11\xef\x11\xf7\x11\xf7\x31\xf7\x31'\
-b'\xf7\x32\xf7\x31\xef\x32\xf7\x52\xf7\x32\xef\x52\xf7\x33\xf7\x52'\
-b'\xf7\x32\xef\x52\xf7\x33\xf7\x32\xf7\x53\xf7\x32\xf7\x52\xef\x52'\
-b'\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xef\x32\xf7\x32\xef\x31\xef\x11'\
-b'\xf7\x11\xef\x10\xf7\x10\xee\xef\xee\xce\xee\xcd\xe6\x8c\xd5\x67'\
-b'\x9b\x41\x92\xe0\xa3\x62\xd5\xa8\xe6\x8b\xee\xad\xee\xce\xee\xef'\
-b'\xef\x10\xf7\x10\xf7\x10\xf7\x11\xef\x31\xf7\x31\xf7\x11\xf7\x31'\
-b'\xef\x32\xf7\x32\xef\x31\xf7\x32\xef\x31\xf7\x32\xef\x32\xf7\x31'\
-b'\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x31'\
-b'\xf7\x31\xef\x31\xf7\x31\xf7\x31\xef\x31\xf7\x11\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xce\xee\xce'\
-b'\xee\xad\xee\xad\xe6\x8c\xe6\x6b\xe6\x29\xbc\x64\x92\xc0\x92\xe0'\
-b'\xb4\x23\xdd\xc8\xdd\xc7\xd5\x46\xbc\x84\xab\xc2\x9b\x21\x92\xc0'\
-b'\x92\xc0\x92\xe0\x9b\x41\xab\xe3\xc4\xc5\xd5\xa8\xe6\x4a\xe6\x8b'\
-b'\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xce\xee\xce\xee\xee\xee\xee'\
-b'\xf6\xef\xee\xef\xf6\xef\xee\xef\xef\x0f\xf7\x10\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x30\xef\x10\xf7\x11\xf7\x10\xf7\x31'\
-b'\xef\x10\xf7\x11\xef\x10\xf7\x10\xef\x10\xf6\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\x8c\xde\x09\xab\xa2\x92\xe0\x92\xe1\xc5\x06\xee\x6b'\
-b'\xee\xad\xee\xce\xee\xef\xf7\x0f\xef\x10\xf7\x10\xef\x11\xf7\x31'\
-b'\xf7\x31\xef\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x32\xf7\x52\xf7\x33\xef\x52\xf7\x52\xf7\x32'\
-b'\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x32'\
-b'\xef\x32\xf7\x31\xef\x31\xef\x11\xf7\x31\xef\x11\xf7\x10\xef\x10'\
-b'\xef\x10\xee\xf0\xf6\xef\xee\xef\xee\xce\xee\xad\xe6\x6b\xe6\x4a'\
-b'\xd5\xa7\xa3\x61\x92\xc0\x9b\x01\xcd\x46\xe6\x6a\xe6\x8c\xee\xac'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xce'\
-b'\xee\xcd\xee\xcd\xee\xce\xee\xcd\xee\xcd\xee\xce\xee\xad\xee\xcd'\
-b'\xf7\x52\xf7\x53\xf7\x32\xf7\x52\xf7\x52\xf7\x33\xf7\x52\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xef\x31\xf7\x31\xef\x31'\
-b'\xef\x11\xf7\x31\xf7\x11\xef\x10\xf7\x10\xee\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xad\xee\x6b\xcd\x47\xa3\x81\x92\xe0\xab\x82\xd5\x67'\
-b'\xe6\x4a\xe6\x6a\xee\x8b\xee\xad\xee\xce\xee\xee\xee\xef\xf7\x0f'\
-b'\xef\x10\xf7\x10\xee\xf0\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf6\xf0\xf7\x10\xef\x10'\
-b'\xef\x10\xf6\xef\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce\xee\xce'\
-b'\xee\xcd\xee\xad\xee\x8c\xe6\x8b\xe6\x6a\xe6\x09\xd5\x67\xb4\x43'\
-b'\xa3\x41\x92\xe0\x92\xe0\x92\xc0\x92\xe0\x9b\x21\xb4\x23\xcd\x26'\
-b'\xd5\xa7\xbc\x64\x92\xe0\x92\xe0\xb4\x03\xdd\xc8\xe6\x29\xe6\x6b'\
-b'\xe6\x8c\xee\xac\xee\xad\xee\xce\xee\xce\xee\xef\xee\xef\xf6\xef'\
-b'\xee\xef\xf7\x10\xf7\x10\xef\x10\xf7\x31\xef\x31\xf7\x31\xef\x32'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x52\xf7\x33'\
-b'\xf7\x52\xf7\x32\xf7\x52\xf7\x52\xf7\x32\xf7\x53\xf7\x32\xf7\x33'\
-b'\xf7\x52\xf7\x33\xef\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x31\xf7\x31'\
-b'\xf7\x11\xef\x10\xee\xef\xf6\xef\xee\xce\xee\xac\xe6\x2a\xab\xe3'\
-b'\x92\xe0\x9a\xe0\xc4\xc5\xe6\x6b\xee\xad\xee\xce\xee\xef\xf7\x0f'\
-b'\xf7\x10\xef\x10\xef\x11\xf7\x11\xf7\x31\xef\x31\xf7\x31\xf7\x32'\
-b'\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x31\xf7\x32'\
-b'\xf7\x32\xef\x32\xf7\x32\xef\x31\xf7\x32\xef\x31\xf7\x32\xef\x32'\
-b'\xf7\x31\xf7\x11\xf7\x31\xf7\x11\xef\x11\xf7\x31\xf7\x11\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xad\xee\x8c\xe6\x6b\xdd\xe8\xa3\xa2\x92\xc0\x92\xe1'\
-b'\xc4\xe5\xe6\x29\xe6\x2a\xde\x4a\xe6\x29\xdd\xc8\xcd\x46\xbc\x64'\
-b'\xa3\xa2\x9b\x01\x92\xe0\x92\xc0\x9a\xe0\xa3\x41\xb4\x03\xc5\x06'\
-b'\xdd\xc8\xe6\x4a\xe6\x8b\xee\x8c\xee\xac\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xee\xef\xee\xef\xf7\x0f'\
-b'\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xee\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xee\x8c\xde\x09\xab\xa2\x92\xe0\x9a\xe0\xc5\x06\xe6\x8b'\
-b'\xee\xac\xee\xce\xee\xef\xee\xf0\xf7\x10\xf7\x10\xef\x31\xf7\x31'\
-b'\xf7\x32\xf7\x31\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52'\
-b'\xef\x52\xf7\x33\xf7\x52\xf7\x32\xf7\x52\xf7\x32\xf7\x33\xf7\x52'\
-b'\xef\x52\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xef\x31\xf7\x32'\
-b'\xf7\x31\xf7\x32\xf7\x11\xf7\x31\xf7\x31\xf7\x31\xef\x11\xf7\x10'\
-b'\xf7\x10\xf7\x10\xee\xef\xee\xef\xee\xce\xee\xad\xee\x8b\xe6\x4a'\
-b'\xde\x09\xb4\x03\x92\xe0\x92\xe0\xbc\x84\xe6\x4a\xee\x8c\xee\xad'\
-b'\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef\xee\xce'\
-b'\xee\xef\xee\xcf\xee\xef\xee\xcf\xee\xee\xee\xef\xee\xce\xee\xef'\
-b'\xf7\x53\xf7\x32\xf7\x52\xf7\x32\xf7\x33\xf7\x52\xf7\x32\xf7\x52'\
-b'\xf7\x32\xf7\x32\xef\x52\xf7\x32\xf7\x32\xf7\x32\xf7\x31\xf7\x31'\
-b'\xf7\x11\xef\x11\xef\x10\xf7\x10\xef\x0f\xee\xef\xee\xee\xee\xce'\
-b'\xee\xac\xe6\x6b\xc5\x06\xa3\x41\x92\xe0\xab\xe3\xd5\xa8\xe6\x4a'\
-b'\xe6\x6b\xe6\x8c\xee\xad\xee\xce\xee\xee\xee\xef\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xf7\x11\xf7\x11\xf7\x11\xef\x11'\
-b'\xf7\x11\xf7\x10\xf7\x11\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xf7\x10\xef\x10\xf6\xef\xef\x0f\xf6\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xce\xee\xad\xee\xad\xe6\x8c\xe6\x8b\xe6\x4b\xe6\x29'\
-b'\xd5\x67\xbc\x44\x9b\x41\x92\xe1\x92\xc0\x92\xc0\x92\xc0\x9b\x21'\
-b'\xa3\x82\x9b\x00\x92\xc0\xab\xc2\xd5\x87\xde\x08\xe6\x4a\xe6\x6b'\
-b'\xee\x8c\xee\x8c\xee\xad\xee\xce\xee\xce\xee\xce\xee\xef\xee\xef'\
-b'\xf7\x0f\xef\x10\xef\x10\xf7\x10\xf7\x11\xf7\x11\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x32\xef\x32\xf7\x32\xf7\x52\xf7\x32\xef\x32\xf7\x52'\
-b'\xf7\x33\xf7\x52\xef\x33\xf7\x32\xf7\x52\xef\x32\xf7\x52\xf7\x52'\
-b'\xf7\x32\xf7\x32\xf7\x52\xef\x32\xf7\x32\xf7\x31\xef\x11\xef\x11'\
-b'\xf7\x10\xef\x10\xee\xef\xee\xee\xee\xad\xe6\x6b\xcd\x06\x9b\x01'\
-b'\x92\xe0\xab\xc2\xdd\xe9\xee\x8c\xee\xcd\xee\xee\xee\xef\xf7\x10'\
-b'\xef\x10\xf7\x11\xf7\x31\xef\x11\xf7\x31\xf7\x31\xf7\x32\xef\x32'\
-b'\xf7\x31\xef\x32\xf7\x32\xf7\x31\xef\x32\xf7\x52\xf7\x32\xf7\x52'\
-b'\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x31'\
-b'\xef\x32\xf7\x32\xf7\x31\xef\x31\xf7\x31\xef\x11\xf7\x31\xf7\x11'\
-b'\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x0f\xee\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xad\xee\x8c\xe6\x6b\xd5\x67\x9b\x21\x92\xe0\x9b\x41'\
-b'\xd5\x87\xe6\x4a\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x6b\xe6\x4a\xe6\x29'\
-b'\xdd\xc8\xcd\x26\xb4\x23\xa3\x62\x93\x00\x92\xe0\x92\xe0\x9a\xe1'\
-b'\xa3\x62\xb4\x44\xcd\x26\xdd\xe9\xe6\x6a\xe6\x8c\xee\x8c\xee\xac'\
-b'\xee\xad\xee\xad\xee\xce\xee\xce\xf6\xce\xee\xee\xee\xef\xee\xef'\
-b'\xee\xef\xee\xef\xee\xf0\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x0f\xf7\x0f\xee\xef\xee\xee'\
-b'\xee\xae\xe6\x8c\xde\x09\xab\xa2\x92\xe0\x92\xe1\xc4\xe6\xee\x6b'\
-b'\xee\xad\xee\xce\xee\xef\xf7\x0f\xef\x10\xf7\x11\xf7\x11\xef\x31'\
-b'\xf7\x31\xf7\x32\xef\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x52\xf7\x32'\
-b'\xf7\x33\xf7\x52\xf7\x32\xef\x53\xf7\x32\xf7\x52\xf7\x52\xf7\x33'\
-b'\xf7\x32\xf7\x52\xf7\x32\xef\x52\xf7\x32\xf7\x32\xf7\x32\xf7\x32'\
-b'\xef\x32\xf7\x31\xf7\x32\xef\x31\xef\x11\xf7\x11\xf7\x11\xef\x10'\
-b'\xef\x10\xf7\x10\xef\x0f\xee\xef\xee\xee\xee\xce\xee\x8c\xe6\x6b'\
-b'\xe6\x29\xc4\xc5\x92\xe0\x92\xc0\xab\xc3\xde\x09\xe6\x8b\xee\xad'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef\xee\xef\xf6\xef\xee\xef'\
-b'\xf6\xef\xf6\xef\xee\xef\xf6\xef\xf6\xef\xee\xef\xf6\xef\xf6\xef'\
-b'\xf7\x52\xf7\x53\xf7\x32\xf7\x52\xef\x52\xf7\x32\xf7\x52\xef\x32'\
-b'\xf7\x52\xf7\x32\xf7\x32\xef\x32\xf7\x31\xef\x31\xf7\x31\xef\x11'\
-b'\xf7\x11\xf7\x10\xef\x10\xef\x0f\xf6\xef\xee\xce\xee\xce\xee\xac'\
-b'\xe6\x2a\xc4\xa5\x9b\x21\x92\xe0\xb4\x23\xdd\xc8\xe6\x4a\xe6\x6b'\
-b'\xee\x8c\xee\xad\xee\xce\xee\xee\xee\xef\xf6\xf0\xef\x10\xf7\x10'\
-b'\xef\x10\xf7\x10\xef\x11\xf7\x11\xef\x10\xef\x11\xf7\x30\xf7\x31'\
-b'\xef\x10\xf7\x31\xef\x11\xf7\x11\xf7\x10\xf7\x11\xef\x10\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x0f\xee\xef\xf6\xef\xee\xef\xee\xef'\
-b'\xee\xee\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xe6\x8c\xe6\x6b'\
-b'\xe6\x4a\xde\x29\xd5\x87\xbc\x64\xa3\x61\x92\xe0\x92\xc0\x92\xc0'\
-b'\x92\xc0\x92\xc0\x92\xe1\xbc\x64\xd5\x87\xde\x08\xe6\x2a\xe6\x6a'\
-b'\xe6\x6b\xe6\x8c\xee\xac\xee\xad\xee\xcd\xee\xce\xee\xee\xee\xef'\
-b'\xf6\xef\xee\xf0\xf7\x10\xef\x10\xf7\x10\xef\x31\xef\x31\xf7\x32'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x53\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x52\xf7\x53\xf7\x32\xf7\x53\xf7\x32\xf7\x33'\
-b'\xef\x52\xf7\x33\xf7\x32\xf7\x32\xf7\x32\xf7\x31\xef\x31\xf7\x10'\
-b'\xf7\x10\xee\xef\xee\xee\xee\xce\xee\xac\xdd\xe9\xa3\xa2\x92\xe0'\
-b'\x9b\x01\xc5\x06\xe6\x6b\xee\xad\xee\xce\xee\xef\xf6\xef\xef\x10'\
-b'\xf7\x10\xf7\x11\xef\x11\xf7\x31\xf7\x31\xf7\x32\xef\x31\xf7\x32'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x32\xef\x32'\
-b'\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xef\x52\xf7\x32\xf7\x31\xef\x32'\
-b'\xf7\x31\xf7\x32\xf7\x31\xf7\x32\xf7\x31\xf7\x31\xef\x11\xf7\x31'\
-b'\xf7\x11\xef\x10\xf7\x10\xf7\x10\xee\xf0\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\xad\xe6\x8c\xe6\x4a\xbc\xa4\x92\xe0\x92\xc0\xab\xe3'\
-b'\xe6\x09\xe6\x6a\xe6\x8b\xee\x8c\xee\x8c\xee\x8c\xe6\x8c\xe6\x6b'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xdd\xa8\xc5\x05\xb4\x03\x9b\x41\x92\xe0'\
-b'\x92\xe0\x92\xc0\x9b\x00\xa3\x82\xbc\x64\xcd\x47\xde\x09\xe6\x6b'\
-b'\xee\x8b\xee\x8c\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee'\
-b'\xf6\xef\xee\xef\xf6\xef\xee\xef\xef\x0f\xee\xf0\xf7\x10\xef\x10'\
-b'\xef\x10\xf7\x10\xf7\x10\xee\xf0\xee\xf0\xee\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xee\x8c\xde\x09\xab\xa2\x92\xc0\x92\xe0\xc4\xe5\xe6\x8b'\
-b'\xee\xac\xee\xce\xee\xef\xef\x0f\xf7\x10\xef\x11\xf7\x31\xf7\x31'\
-b'\xf7\x32\xf7\x31\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xef\x52\xf7\x32'\
-b'\xf7\x52\xf7\x52\xf7\x33\xf7\x52\xf7\x32\xf7\x33\xef\x52\xf7\x52'\
-b'\xf7\x32\xf7\x53\xf7\x52\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xef\x32'\
-b'\xf7\x32\xf7\x32\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x31\xf7\x11'\
-b'\xf7\x10\xef\x10\xf6\xf0\xee\xef\xee\xef\xee\xce\xee\xad\xe6\x6b'\
-b'\xe6\x29\xcd\x67\x9b\x21\x92\xc0\x9b\x21\xd5\x87\xe6\x6b\xee\xac'\
-b'\xee\xad\xee\xce\xee\xef\xee\xee\xee\xef\xf6\xef\xef\x0f\xef\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10'\
-b'\xf7\x53\xf7\x52\xf7\x52\xf7\x33\xf7\x32\xf7\x53\xf7\x32\xf7\x53'\
-b'\xf7\x32\xf7\x32\xef\x52\xf7\x32\xf7\x32\xf7\x31\xef\x31\xf7\x31'\
-b'\xef\x10\xf7\x10\xef\x0f\xee\xef\xee\xce\xee\xad\xee\xac\xde\x0a'\
-b'\xbc\x64\x93\x00\x9b\x01\xbc\x64\xdd\xe9\xe6\x6a\xe6\x6b\xee\x8c'\
-b'\xee\xcd\xee\xce\xee\xef\xf7\x0f\xef\x10\xf7\x10\xf7\x10\xef\x10'\
-b'\xf7\x11\xf7\x11\xf7\x10\xef\x31\xf7\x31\xf7\x11\xef\x31\xf7\x11'\
-b'\xf7\x31\xef\x11\xf7\x31\xef\x30\xf7\x31\xef\x11\xf7\x10\xf7\x10'\
-b'\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xee\xef\xf7\x0f\xee\xef'\
-b'\xee\xef\xee\xef\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xac\xee\x8c'\
-b'\xe6\x8b\xe6\x6b\xe6\x49\xe5\xe8\xd5\x67\xbc\x64\x9b\x21\x92\xc0'\
-b'\x92\xc1\x92\xe0\x92\xc0\x92\xe0\xab\xa2\xc4\xc5\xdd\xa8\xe6\x29'\
-b'\xe6\x4a\xe6\x6b\xee\x8c\xe6\xac\xee\xad\xee\xce\xee\xce\xee\xce'\
-b'\xee\xef\xf6\xef\xef\x0f\xf7\x10\xf7\x11\xf7\x11\xf7\x11\xf7\x31'\
-b'\xef\x31\xf7\x32\xef\x32\xf7\x52\xf7\x32\xf7\x52\xef\x32\xf7\x52'\
-b'\xf7\x33\xf7\x52\xef\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x52\xf7\x52'\
-b'\xf7\x32\xf7\x32\xef\x52\xf7\x32\xf7\x31\xef\x31\xf7\x11\xef\x10'\
-b'\xef\x10\xee\xef\xee\xce\xee\xad\xe6\x6b\xbc\x84\x92\xe0\x92\xe0'\
-b'\xb4\x03\xe6\x29\xee\xac\xee\xce\xee\xee\xee\xef\xf7\x10\xef\x10'\
-b'\xf7\x11\xef\x31\xf7\x31\xf7\x31\xef\x31\xf7\x32\xf7\x32\xf7\x31'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xef\x52\xf7\x52\xf7\x52\xf7\x52'\
-b'\xf7\x52\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32'\
-b'\xf7\x32\xef\x31\xf7\x32\xef\x31\xf7\x11\xf7\x31\xf7\x31\xef\x11'\
-b'\xf7\x31\xf7\x10\xef\x10\xef\x10\xee\xf0\xee\xef\xf6\xef\xee\xee'\
-b'\xee\xce\xee\xad\xee\x8b\xe6\x29\xab\xe3\x92\xe0\x92\xe0\xbc\x85'\
-b'\xe6\x4a\xee\x8b\xee\x8c\xee\xac\xee\xad\xee\xad\xee\xad\xee\xac'\
-b'\xee\xac\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xe6\x09\xd5\x87\xc4\xc5'\
-b'\xab\xe3\x9b\x21\x92\xe0\x92\xe0\x92\xe0\x9b\x01\xab\xa2\xbc\x84'\
-b'\xd5\x67\xde\x2a\xe6\x6b\xe6\x8b\xee\x8c\xee\xac\xee\xad\xee\xcd'\
-b'\xee\xce\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xef\xee\xef\xf7\x0f'\
-b'\xee\xf0\xf7\x10\xef\x0f\xf6\xef\xf7\x0f\xee\xef\xf6\xef\xee\xce'\
-b'\xee\xcd\xee\x8c\xde\x09\xa3\xa2\x92\xe0\x9a\xe0\xc4\xe6\xee\x6b'\
-b'\xee\xad\xee\xce\xee\xef\xf7\x10\xef\x10\xf7\x10\xef\x11\xf7\x31'\
-b'\xef\x31\xf7\x32\xef\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x53\xf7\x32'\
-b'\xf7\x33\xef\x52\xf7\x32\xf7\x52\xf7\x52\xf7\x32\xf7\x53\xf7\x32'\
-b'\xf7\x32\xef\x52\xf7\x33\xf7\x52\xf7\x52\xf7\x32\xf7\x32\xf7\x52'\
-b'\xf7\x32\xef\x32\xf7\x32\xf7\x32\xef\x31\xf7\x11\xf7\x11\xef\x11'\
-b'\xef\x10\xf7\x10\xf7\x10\xef\x0f\xee\xef\xee\xce\xee\xad\xe6\x8b'\
-b'\xe6\x4a\xdd\xc8\xab\xa2\x92\xe0\x92\xe0\xc4\xc5\xe6\x6b\xee\xac'\
-b'\xee\xad\xee\xce\xee\xef\xee\xef\xf6\xef\xef\x0f\xee\xf0\xf6\xef'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10'\
-b'\xf7\x52\xf7\x53\xf7\x52\xf7\x52\xf7\x52\xf7\x32\xf7\x52\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x32\xf7\x32\xf7\x31\xf7\x31\xf7\x11\xef\x11'\
-b'\xf7\x10\xee\xef\xee\xef\xee\xce\xee\xad\xee\x8c\xdd\xe9\xb4\x03'\
-b'\x92\xe0\x9b\x21\xc4\xa5\xde\x09\xe6\x6a\xee\x6b\xee\x8c\xee\xad'\
-b'\xee\xee\xee\xef\xee\xef\xf7\x10\xef\x10\xef\x10\xf7\x10\xf7\x11'\
-b'\xef\x10\xef\x31\xf7\x11\xf7\x31\xef\x11\xf7\x31\xf7\x11\xef\x31'\
-b'\xf7\x11\xf7\x31\xef\x11\xf7\x11\xf7\x31\xef\x31\xf7\x11\xef\x11'\
-b'\xef\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xee\xef\xf7\x0f'\
-b'\xee\xef\xf6\xef\xee\xee\xee\xee\xee\xce\xee\xce\xee\xad\xee\xad'\
-b'\xe6\x8c\xee\x6b\xe6\x4b\xe6\x4a\xde\x08\xcd\x25\x9b\x41\x92\xc0'\
-b'\x93\x00\x92\xe1\x92\xc0\x92\xc0\x92\xc0\x92\xe0\xa3\xa2\xc4\xa5'\
-b'\xd5\xc8\xe6\x29\xe6\x6b\xe6\x8b\xee\x8c\xee\xad\xee\xcd\xee\xce'\
-b'\xee\xee\xee\xef\xee\xef\xef\x10\xef\x10\xef\x10\xf7\x31\xf7\x31'\
-b'\xf7\x31\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x33'\
-b'\xf7\x52\xf7\x32\xf7\x53\xf7\x52\xf7\x33\xef\x52\xf7\x33\xf7\x52'\
-b'\xf7\x32\xf7\x32\xf7\x32\xef\x32\xf7\x31\xf7\x11\xef\x11\xf7\x10'\
-b'\xf7\x0f\xee\xee\xee\xad\xee\x8c\xd5\x88\xa3\x41\x92\xe0\x9b\x21'\
-b'\xd5\x67\xe6\x6b\xee\xad\xee\xce\xee\xef\xf7\x10\xef\x10\xf7\x10'\
-b'\xf7\x11\xef\x11\xf7\x31\xf7\x31\xf7\x32\xf7\x32\xef\x32\xf7\x32'\
-b'\xf7\x32\xef\x52\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x32\xf7\x32'\
-b'\xf7\x52\xef\x52\xf7\x52\xf7\x52\xef\x32\xf7\x32\xf7\x32\xf7\x32'\
-b'\xef\x32\xf7\x32\xf7\x32\xf7\x32\xef\x32\xf7\x31\xf7\x31\xef\x11'\
-b'\xf7\x31\xef\x11\xf7\x10\xf7\x10\xf7\x10\xee\xef\xee\xef\xee\xee'\
-b'\xee\xce\xee\xac\xe6\x6b\xd5\xa8\xa3\x41\x92\xc0\x9b\x21\xd5\x46'\
-b'\xe6\x6a\xe6\x8c\xee\xac\xe6\xad\xee\xcd\xee\xcd\xe6\xce\xee\xcd'\
-b'\xee\xae\xee\xcd\xee\xad\xee\xad\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a'\
-b'\xdd\xe8\xd5\x67\xbc\x84\xab\xa2\x9b\x01\x92\xe0\x92\xe0\x92\xe0'\
-b'\x9b\x21\xab\xc3\xc4\xc5\xd5\x87\xe6\x2a\xe6\x6b\xe6\x8b\xee\x8c'\
-b'\xee\xad\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xf6\xef\xee\xef'\
-b'\xee\xef\xef\x0f\xf6\xf0\xef\x10\xee\xef\xee\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xee\x8c\xde\x09\xa3\x82\x92\xc0\x92\xe0\xc4\xe5\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xef\xee\xef\xf7\x10\xf7\x11\xf7\x31\xf7\x31'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x52\xef\x32\xf7\x52'\
-b'\xf7\x52\xf7\x33\xf7\x52\xf7\x33\xef\x32\xf7\x52\xf7\x32\xf7\x53'\
-b'\xf7\x52\xf7\x32\xf7\x52\xf7\x33\xef\x32\xf7\x52\xf7\x32\xf7\x32'\
-b'\xf7\x32\xf7\x32\xef\x31\xf7\x32\xf7\x32\xf7\x31\xef\x31\xf7\x31'\
-b'\xf7\x11\xef\x10\xef\x10\xf6\xef\xee\xef\xee\xee\xee\xae\xee\x8c'\
-b'\xe6\x6a\xe6\x29\xb4\x44\x92\xe0\x92\xc0\xb4\x03\xe6\x2a\xe6\x8c'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xee\xef\xf7\x0f\xef\x10\xf7\x10'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10\xef\x11\xf7\x10'\
-b'\xf7\x53\xf7\x52\xf7\x52\xf7\x33\xf7\x32\xef\x53\xf7\x32\xf7\x53'\
-b'\xef\x32\xf7\x32\xef\x52\xf7\x32\xef\x31\xef\x31\xf7\x11\xef\x10'\
-b'\xef\x0f\xf6\xef\xee\xce\xee\xcd\xee\x8c\xd5\xa8\xab\xc2\x92\xe0'\
-b'\x9b\x41\xc4\xe5\xe6\x29\xe6\x6a\xe6\x6b\xee\xac\xee\xce\xee\xce'\
-b'\xee\xef\xef\x0f\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11\xef\x10'\
-b'\xf7\x31\xf7\x11\xef\x31\xf7\x11\xf7\x31\xef\x31\xf7\x31\xef\x31'\
-b'\xf7\x31\xef\x31\xf7\x11\xf7\x31\xef\x11\xf7\x10\xf7\x31\xf7\x30'\
-b'\xf7\x11\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10\xee\xef'\
-b'\xee\xef\xee\xef\xee\xef\xee\xef\xee\xce\xee\xce\xee\xad\xee\xad'\
-b'\xee\xac\xe6\x8b\xe6\x6b\xe6\x29\xd5\x87\xa3\xa2\x92\xc0\x9b\x01'\
-b'\xbc\x64\xbc\xa4\xa3\x82\x92\xe0\x92\xe0\x92\xc0\x92\xc0\x92\xe0'\
-b'\xa3\x82\xbc\x84\xd5\xa7\xe6\x2a\xe6\x6b\xe6\x8b\xee\x8c\xee\xad'\
-b'\xee\xce\xee\xce\xf6\xef\xf7\x0f\xf7\x10\xf7\x10\xef\x11\xef\x31'\
-b'\xf7\x31\xef\x32\xf7\x32\xf7\x32\xef\x32\xf7\x52\xf7\x52\xf7\x52'\
-b'\xef\x32\xf7\x53\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x52\xf7\x33'\
-b'\xef\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x31\xef\x31\xf7\x10\xef\x10'\
-b'\xee\xef\xee\xce\xee\xad\xe6\x4a\xb4\x23\x92\xe0\x92\xe0\xbc\x64'\
-b'\xe6\x4a\xee\xac\xee\xce\xee\xef\xee\xef\xf7\x10\xef\x10\xf7\x10'\
-b'\xef\x31\xf7\x31\xf7\x31\xef\x31\xf7\x32\xf7\x31\xf7\x32\xf7\x32'\
-b'\xf7\x32\xf7\x32\xf7\x52\xf7\x52\xf7\x52\xf7\x52\xef\x52\xf7\x32'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x52\xf7\x32'\
-b'\xf7\x52\xf7\x31\xf7\x32\xef\x31\xf7\x31\xf7\x32\xf7\x31\xf7\x31'\
-b'\xef\x11\xf7\x11\xf7\x10\xef\x10\xef\x10\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xce\xee\x8c\xe6\x6b\xc5\x06\x92\xe0\x92\xe0\xa3\x82\xdd\xe8'\
-b'\xe6\x6b\xee\x8c\xee\xad\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xee\xac\xee\x8c'\
-b'\xe6\x8b\xe6\x6b\xe6\x4a\xdd\xe8\xcd\x46\xbc\x44\xa3\x82\x9b\x01'\
-b'\x92\xc0\x92\xc0\x92\xe0\x9b\x41\xab\xe3\xc4\xe5\xdd\xa8\xe6\x4a'\
-b'\xe6\x6b\xe6\x8b\xee\x8c\xee\xad\xee\xcd\xee\xce\xee\xee\xee\xef'\
-b'\xf6\xef\xee\xef\xee\xef\xf7\x0f\xee\xef\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xe6\x8c\xdd\xe8\xab\x82\x92\xe0\x92\xe0\xc4\xe6\xee\x6b'\
-b'\xee\xac\xee\xce\xee\xef\xf7\x0f\xef\x10\xef\x11\xf7\x31\xef\x31'\
-b'\xf7\x31\xef\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x33\xf7\x52'\
-b'\xf7\x32\xf7\x52\xf7\x32\xf7\x52\xf7\x53\xf7\x32\xf7\x52\xef\x32'\
-b'\xf7\x33\xf7\x52\xf7\x32\xf7\x52\xf7\x53\xf7\x32\xf7\x52\xef\x32'\
-b'\xf7\x32\xf7\x52\xf7\x32\xef\x32\xf7\x31\xf7\x31\xf7\x11\xef\x11'\
-b'\xf7\x11\xf7\x10\xef\x10\xf7\x10\xee\xef\xee\xef\xee\xce\xee\x8c'\
-b'\xe6\x6b\xe6\x29\xcd\x05\x93\x01\x92\xe0\xa3\x61\xdd\xc8\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xf6\xef\xee\xf0\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x11\xf7\x11\xf7\x10\xef\x11'\
-b'\xf7\x52\xf7\x52\xf7\x52\xf7\x52\xf7\x32\xf7\x52\xf7\x52\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x32\xf7\x31\xf7\x31\xf7\x11\xf7\x10\xef\x10'\
-b'\xee\xef\xee\xce\xee\xad\xe6\x8b\xd5\x67\xa3\x82\x92\xe0\xa3\x62'\
-b'\xcd\x26\xe6\x2a\xe6\x6b\xe6\x6b\xee\x8c\xee\xce\xee\xce\xee\xef'\
-b'\xef\x0f\xf7\x10\xee\xf0\xef\x10\xf7\x10\xf7\x11\xef\x11\xf7\x31'\
-b'\xf7\x11\xef\x31\xf7\x11\xef\x31\xf7\x31\xf7\x11\xf7\x31\xf7\x11'\
-b'\xf7\x31\xef\x31\xf7\x31\xef\x31\xf7\x11\xef\x31\xef\x11\xf7\x31'\
-b'\xef\x11\xef\x11\xf7\x10\xf7\x10\xef\x10\xf7\x10\xef\x10\xf7\x10'\
-b'\xf6\xef\xee\xef\xf6\xef\xee\xef\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xe6\x8c\xe6\x8b\xe6\x4a\xdd\xc8\xab\xe3\x92\xc0\x9a\xe0\xbc\x64'\
-b'\xdd\xc7\xdd\xe8\xdd\xa7\xc4\xc5\xab\xa2\x93\x01\x92\xc0\x92\xe0'\
-b'\x92\xc0\x92\xe0\xa3\x42\xbc\x64\xd5\x87\xe6\x2a\xe6\x6b\xe6\x8c'\
-b'\xee\xad\xee\xce\xee\xee\xee\xef\xef\x10\xef\x10\xf7\x11\xf7\x11'\
-b'\xf7\x31\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x33\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x52\xef\x53\xf7\x32\xf7\x52\xf7\x33\xf7\x52'\
-b'\xf7\x32\xf7\x32\xef\x32\xf7\x31\xf7\x31\xef\x11\xf7\x10\xee\xef'\
-b'\xee\xef\xee\xad\xe6\x8b\xcd\x26\x9b\x01\x92\xe0\xa3\x62\xd5\xa8'\
-b'\xe6\x8c\xee\xad\xee\xce\xee\xef\xee\xef\xf7\x10\xf7\x10\xef\x11'\
-b'\xf7\x11\xf7\x31\xf7\x11\xf7\x32\xef\x32\xf7\x32\xf7\x32\xef\x52'\
-b'\xf7\x32\xf7\x52\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x52'\
-b'\xf7\x53\xf7\x52\xf7\x32\xf7\x53\xf7\x52\xef\x32\xf7\x52\xf7\x32'\
-b'\xf7\x32\xf7\x32\xef\x32\xf7\x32\xf7\x32\xef\x31\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x11\xef\x10\xf7\x10\xf7\x10\xee\xef\xee\xef\xee\xce'\
-b'\xee\xcd\xee\x8c\xe6\x4a\xb4\x23\x92\xc0\x92\xe0\xb4\x24\xe6\x2a'\
-b'\xe6\x8b\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xce\xee\xee'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xce\xee\xad'\
-b'\xee\xad\xee\x8c\xe6\x8c\xe6\x6b\xe6\x4a\xe6\x29\xd5\xc8\xcd\x06'\
-b'\xb4\x23\xa3\x61\x93\x01\x92\xc0\x92\xc0\x9a\xe1\x9b\x61\xb4\x03'\
-b'\xcd\x06\xdd\xc8\xe6\x4a\xe6\x6b\xe6\x8c\xee\xad\xee\xad\xee\xce'\
-b'\xee\xce\xee\xef\xee\xef\xf6\xef\xee\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xcd\xee\x8c\xdd\xe9\xa3\x82\x92\xe0\x92\xe0\xc4\xe5\xe6\x6b'\
-b'\xee\xad\xee\xce\xee\xef\xf7\x0f\xf7\x10\xf7\x10\xef\x11\xf7\x31'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xef\x52\xf7\x52\xf7\x32\xf7\x53'\
-b'\xef\x32\xf7\x33\xf7\x52\xef\x32\xf7\x32\xf7\x53\xf7\x32\xf7\x52'\
-b'\xf7\x52\xf7\x33\xef\x52\xf7\x32\xf7\x32\xf7\x53\xf7\x32\xf7\x52'\
-b'\xf7\x32\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x32\xef\x31\xf7\x31'\
-b'\xf7\x31\xef\x11\xf7\x10\xef\x0f\xf6\xef\xee\xef\xee\xce\xee\xad'\
-b'\xe6\x6b\xe6\x4a\xd5\x87\xa3\x41\x92\xc0\x93\x01\xcd\x26\xe6\x6b'\
-b'\xee\xad\xee\xce\xee\xce\xee\xef\xee\xef\xf7\x0f\xef\x10\xf6\xf0'\
-b'\xef\x10\xef\x10\xf7\x10\xef\x11\xf7\x10\xef\x11\xf7\x11\xf7\x31'\
-b'\xf7\x53\xf7\x53\xf7\x52\xf7\x33\xf7\x52\xf7\x33\xf7\x32\xf7\x53'\
-b'\xf7\x32\xf7\x32\xef\x32\xf7\x32\xef\x31\xf7\x31\xef\x10\xf7\x0f'\
-b'\xee\xef\xee\xad\xe6\x6b\xcd\x06\x9b\x41\x92\xe0\xab\xa2\xd5\x67'\
-b'\xe6\x4a\xe6\x6a\xe6\x6b\xee\xac\xee\xce\xee\xce\xee\xef\xef\x10'\
-b'\xf7\x10\xf6\xf0\xf7\x10\xf7\x10\xef\x11\xf7\x10\xf7\x31\xef\x11'\
-b'\xf7\x31\xf7\x11\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x31\xf7\x31'\
-b'\xef\x11\xf7\x31\xf7\x11\xf7\x31\xf7\x31\xf7\x11\xf7\x31\xf7\x10'\
-b'\xf7\x31\xef\x10\xf7\x31\xef\x11\xf7\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xee\xf0\xef\x0f\xee\xef\xee\xef\xee\xee\xee\xce\xee\xcd\xee\xad'\
-b'\xee\x8c\xe6\x6b\xde\x09\xb4\x23\x92\xe0\x92\xe0\xb4\x03\xd5\xa7'\
-b'\xde\x09\xe6\x29\xe6\x29\xde\x09\xdd\xc8\xc4\xe5\xab\xc2\x9b\x01'\
-b'\x92\xc0\x92\xe0\x92\xc0\x92\xc0\x9b\x41\xb4\x44\xd5\x67\xe6\x29'\
-b'\xe6\x8b\xee\xad\xee\xce\xee\xef\xf6\xef\xf7\x10\xef\x11\xf7\x31'\
-b'\xef\x31\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x52\xef\x52\xf7\x33'\
-b'\xf7\x52\xf7\x33\xf7\x32\xf7\x52\xf7\x32\xf7\x53\xef\x32\xf7\x52'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xef\x31\xf7\x11\xef\x10\xf6\xef'\
-b'\xee\xce\xee\xad\xde\x09\xab\xa2\x92\xe0\x9a\xe1\xc4\xc5\xe6\x4a'\
-b'\xee\x8c\xee\xce\xee\xee\xf6\xef\xef\x10\xf7\x10\xef\x10\xf7\x31'\
-b'\xf7\x31\xef\x31\xf7\x31\xf7\x32\xf7\x32\xef\x31\xf7\x32\xf7\x32'\
-b'\xf7\x32\xf7\x52\xf7\x52\xf7\x52\xf7\x52\xf7\x32\xf7\x32\xf7\x32'\
-b'\xef\x32\xf7\x32\xf7\x52\xef\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x32'\
-b'\xf7\x52\xf7\x32\xf7\x32\xf7\x32\xf7\x31\xf7\x32\xef\x31\xf7\x31'\
-b'\xf7\x11\xef\x11\xf7\x10\xef\x10\xee\xf0\xf6\xef\xee\xef\xee\xce'\
-b'\xee\xad\xe6\x8c\xdd\xe8\xa3\x62\x92\xe0\x9a\xe0\xc5\x06\xe6\x4a'\
-b'\xee\x8c\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xce\xee\xee\xee\xef'\
-b'\xee\xef\xee\xee\xee\xef\xee\xee\xee\xef\xee\xce\xee\xce\xee\xce'\
-b'\xee\xce\xee\xcd\xee\xad\xee\xad\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a'\
-b'\xde\x09\xd5\xa7\xc4\xe5\xb3\xe3\x9b\x41\x92\xe0\x92\xc0\x92\xe0'\
-b'\x93\x01\xa3\x62\xb4\x44\xcd\x26\xdd\xe9\xe6\x6b\xee\x8c\xee\xad'\
-b'\xee\xcd\xee\xee\xee\xef\xee\xef\xf6\xef\xee\xef\xf6\xee\xee\xce'\
-b'\xee\xad\xee\x8b\xdd\xe8\xa3\x82\x92\xe0\x9a\xe0\xc4\xe6\xee\x6b'\
-b'\xee\xac\xee\xce\xee\xef\xef\x0f\xef\x10\xf7\x11\xf7\x31\xf7\x31'\
-b'\xef\x31\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x33\xf7\x52\xf7\x32'\
-b'\xf7\x52\xf7\x52\xf7\x33\xf7\x52\xf7\x52\xf7\x32\xf7\x53\xef\x32'\
-b'\xf7\x32\xf7\x52\xf7\x33\xf7\x52\xf7\x52\xef\x32\xf7\x53\xf7\x32'\
-b'\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xef\x31\xf7\x31\xf7\x31\xef\x11'\
-b'\xf7\x11\xf7\x10\xef\x10\xf7\x10\xee\xef\xee\xef\xee\xee\xee\xad'\
-b'\xee\x8c\xe6\x4a\xde\x08\xab\xe3\x92\xe0\x92\xc0\xbc\x44\xe6\x4a'\
-b'\xee\x8c\xee\xcd\xee\xee\xee\xef\xf6\xef\xef\x10\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xf7\x11\xf7\x11\xef\x11\xf7\x10\xef\x31\xf7\x10'\
-b'\xf7\x52\xf7\x52\xf7\x52\xf7\x52\xef\x52\xf7\x52\xf7\x32\xef\x52'\
-b'\xf7\x52\xf7\x32\xf7\x52\xf7\x31\xf7\x31\xef\x11\xf7\x10\xee\xef'\
-b'\xee\xad\xe6\x4b\xc4\xc5\x9b\x21\x9a\xe1\xab\xe3\xd5\x87\xe6\x2a'\
-b'\xe6\x6a\xe6\x6b\xee\xad\xee\xce\xee\xce\xee\xef\xf6\xef\xef\x0f'\
-b'\xef\x10\xef\x10\xef\x10\xf7\x11\xf7\x11\xef\x31\xf7\x11\xef\x31'\
-b'\xf7\x11\xef\x31\xf7\x31\xef\x11\xf7\x31\xf7\x11\xf7\x31\xef\x31'\
-b'\xf7\x31\xf7\x31\xf7\x31\xef\x31\xef\x31\xef\x31\xf7\x11\xef\x31'\
-b'\xef\x11\xf7\x11\xf7\x10\xf7\x10\xef\x10\xf7\x10\xf7\x10\xee\xf0'\
-b'\xef\x0f\xf6\xef\xf6\xef\xee\xef\xee\xee\xee\xce\xee\xce\xee\xad'\
-b'\xe6\x8b\xe6\x29\xbc\x64\x92\xe1\x92\xe0\xab\xc3\xdd\xa7\xde\x09'\
-b'\xe6\x2a\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x09\xdd\xc8\xc5\x05'\
-b'\xab\xe3\x9b\x01\x92\xe0\x92\xe0\x92\xc0\x92\xe0\x9b\x21\xb4\x23'\
-b'\xd5\x67\xe6\x4a\xee\xac\xee\xce\xee\xef\xef\x10\xf7\x10\xf7\x11'\
-b'\xf7\x31\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x32\xf7\x52'\
-b'\xf7\x32\xef\x52\xf7\x53\xf7\x32\xf7\x52\xf7\x32\xf7\x52\xf7\x33'\
-b'\xf7\x32\xf7\x52\xef\x32\xf7\x31\xf7\x11\xef\x10\xf7\x10\xee\xef'\
-b'\xee\xce\xe6\x6b\xc4\xc5\x93\x01\x92\xe0\xab\xa2\xdd\xe8\xe6\x8b'\
-b'\xee\xad\xee\xce\xee\xef\xee\xef\xf7\x10\xef\x10\xf7\x11\xf7\x11'\
-b'\xef\x31\xf7\x31\xf7\x32\xef\x31\xf7\x32\xf7\x32\xf7\x52\xf7\x32'\
-b'\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xef\x32\xf7\x52\xf7\x53\xf7\x52'\
-b'\xf7\x52\xf7\x52\xf7\x33\xf7\x52\xf7\x52\xf7\x32\xf7\x52\xef\x32'\
-b'\xf7\x32\xf7\x52\xef\x32\xef\x32\xf7\x32\xf7\x31\xf7\x32\xf7\x31'\
-b'\xef\x11\xf7\x11\xf7\x10\xef\x10\xf7\x10\xee\xef\xee\xee\xee\xce'\
-b'\xee\xad\xee\x8b\xcd\x47\x9b\x01\x92\xc0\x9b\x41\xd5\xa8\xe6\x6b'\
-b'\xee\x8c\xee\xad\xee\xcd\xee\xce\xee\xce\xee\xee\xee\xef\xee\xce'\
-b'\xee\xee\xf6\xef\xee\xce\xee\xef\xee\xee\xee\xce\xee\xee\xee\xce'\
-b'\xee\xce\xee\xce\xee\xcd\xee\xad\xe6\xad\xee\xac\xee\x8c\xe6\x8c'\
-b'\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8\xd5\x67\xc4\xa4\xab\xc2\x9b\x21'\
-b'\x92\xe0\x92\xc0\x92\xe0\x9b\x00\xa3\x82\xbc\x64\xd5\x67\xde\x2a'\
-b'\xee\x8c\xee\xcd\xee\xce\xee\xef\xee\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\xcd\xe6\x8c\xdd\xe9\xa3\x82\x92\xc0\x92\xe0\xc4\xc5\xe6\x6b'\
-b'\xee\xad\xee\xee\xee\xef\xf6\xef\xf7\x10\xef\x11\xef\x11\xf7\x31'\
-b'\xf7\x32\xf7\x32\xf7\x32\xef\x32\xf7\x52\xf7\x32\xf7\x32\xef\x53'\
-b'\xf7\x32\xf7\x32\xf7\x52\xf7\x33\xef\x32\xf7\x52\xf7\x32\xf7\x53'\
-b'\xf7\x52\xf7\x32\xf7\x52\xf7\x33\xf7\x32\xf7\x52\xf7\x32\xf7\x53'\
-b'\xef\x32\xf7\x32\xf7\x32\xef\x32\xf7\x32\xf7\x32\xf7\x31\xef\x11'\
-b'\xf7\x31\xef\x11\xf7\x10\xef\x10\xf6\xef\xee\xef\xee\xee\xee\xce'\
-b'\xee\x8c\xe6\x6b\xe6\x29\xc4\xa5\x92\xe0\x92\xe0\xa3\xa2\xde\x09'\
-b'\xee\x8c\xee\xcd\xee\xce\xee\xef\xee\xef\xf6\xef\xef\x10\xf7\x10'\
-b'\xef\x10\xef\x11\xf7\x10\xef\x10\xf7\x31\xf7\x11\xf7\x10\xf7\x31'\
-b'\xf7\x53\xf7\x52\xf7\x33\xf7\x52\xf7\x53\xf7\x32\xf7\x53\xf7\x32'\
-b'\xf7\x32\xf7\x32\xef\x32\xf7\x32\xef\x31\xf7\x11\xef\x10\xee\xee'\
-b'\xee\x8c\xc4\xc5\x9b\x01\x92\xe0\xab\xe2\xd5\xa7\xe6\x29\xe6\x4a'\
-b'\xe6\x6c\xee\x8c\xee\xad\xee\xce\xee\xee\xee\xef\xf7\x0f\xf6\xf0'\
-b'\xf7\x10\xf7\x10\xef\x10\xf7\x11\xef\x10\xf7\x31\xf7\x31\xf7\x11'\
-b'\xef\x31\xf7\x31\xf7\x31\xf7\x31\xef\x31\xf7\x31\xf7\x11\xf7\x31'\
-b'\xf7\x11\xef\x31\xf7\x11\xf7\x31\xf7\x11\xf7\x31\xf7\x11\xf7\x30'\
-b'\xf7\x31\xef\x30\xf7\x11\xef\x10\xf7\x10\xef\x10\xef\x10\xf7\x10'\
-b'\xef\x10\xef\x0f\xf6\xef\xee\xef\xee\xef\xee\xce\xee\xcd\xee\xad'\
-b'\xe6\x6b\xcd\x06\x9b\x01\x92\xc0\xa3\x61\xd5\x46\xdd\xe8\xe6\x29'\
-b'\xe6\x4a\xe6\x6a\xe6\x4b\xe6\x4a\xe6\x4a\xe6\x4a\xe6\x29\xde\x08'\
-b'\xdd\xa7\xc4\xc5\xab\xa2\x92\xe0\x92\xc1\x92\xc0\x92\xe0\x92\xc0'\
-b'\x9b\x21\xb4\x44\xdd\xe9\xee\xce\xee\xef\xf7\x10\xf7\x11\xef\x31'\
-b'\xf7\x31\xef\x32\xf7\x32\xf7\x32\xef\x32\xf7\x52\xf7\x33\xf7\x52'\
-b'\xf7\x33\xf7\x32\xf7\x52\xf7\x32\xef\x33\xf7\x52\xf7\x32\xf7\x52'\
-b'\xf7\x32\xf7\x32\xef\x32\xf7\x31\xf7\x31\xef\x11\xef\x10\xee\xef'\
-b'\xee\xcd\xdd\xe9\xa3\x82\x92\xe0\x9a\xe0\xc4\xe5\xe6\x4a\xe6\x8c'\
-b'\xee\xcd\xee\xce\xee\xef\xf7\x0f\xef\x10\xf7\x10\xef\x10\xf7\x31'\
-b'\xf7\x31\xf7\x11\xef\x31\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x32'\
-b'\xef\x52\xf7\x52\xf7\x32\xf7\x52\xf7\x52\xf7\x32\xf7\x32\xf7\x32'\
-b'\xef\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x52\xf7\x33\xf7\x52\xf7\x52'\
-b'\xf7\x32\xf7\x32\xf7\x32\xf7\x32\xf7\x31\xef\x32\xf7\x31\xf7\x31'\
-b'\xef\x11\xf7\x11\xf7\x10\xef\x10\xf6\xf0\xee\xef\xee\xef\xee\xce'\
-b'\xee\xad\xe6\x6b\xbc\x84\x92\xe0\x92\xc0\xab\xc2\xde\x09\xe6\x6b'\
-b'\xee\xac\xee\xad\xee\xce\xee\xce\xee\xce\xee\xce\xee\xef\xf6\xef'\
-b'\xee\xee\xee\xef\xee\xef\xf6\xee\xee\xef\xee\xef\xee\xce\xee\xef'\
-b'\xee\xce\xee\xce\xee\xce\xee\xce\xee\xcd\xee\xad\xee\xad\xee\x8c'\
-b'\xee\x8c\xe6\x8b\xe6\x6b\xe6\x4a\xe6\x29\xdd\xe8\xd5\xa7\xcd\x05'\
-b'\xb4\x23\x9b\x41\x92\xe0\x92\xc0\x92\xe0\x92\xe0\x9b\x21\xab\xe3'\
-b'\xcd\x06\xe6\x4b\xee\xce\xf6\xef\xee\xef\xf6\xee\xee\xee\xee\xce'\
-b'\xee\xad\xee\x8c\xdd\xe8\xa3\x81\x92\xe0\x92\xe0\xc4\xe5\xe6\x6b'\
-b'\xee\xad\xee\xce\xee\xef\xef\x0f\xf7\x10\xf7\x10\xf7\x31\xf7\x31'\
-b'\xef\x31\xf7\x32\xf7\x32\xf7\x32\xf7\x52\xf7\x53\xf7\x32\xf7\x52'\
-b'\xf7\x53\xf7\x32\xf7\x52\xf7\x52\xf7\x33\xf7\x52\xf7\x32\xf7\x32'\
-b'\xf7\x53\xef\x32\xf7\x52\xf7\x32\xef\x53\xf7\x32\xf7\x52\xf7\x32'\
-b'\xf7\x32\xf7\x52\xf7\x32\xf7\x32\xf7\x31\xef\x32\xf7\x31\xf7\x31'\
-b'\xef\x11\xf7\x10\xef\x10\xf7\x10\xef\x0f\xee\xef\xee\xce\xee\xce'\
-b'\xee\xad\xe6\x6b\xe6\x49\xcd\x26\x9b\x01\x92\xc0\x9b\x21\xd5\x87'\
-b'\xe6\x8c\xee\xad\xee\xce\xee\xef\xf6\xef\xef\x0f\xf7\x10\xef\x10'\
-b'\xf7\x10\xf7\x10\xf7\x11\xef\x31\xf7\x10\xef\x11\xef\x11\xf7\x11'\
-
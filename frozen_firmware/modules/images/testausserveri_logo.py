@@ -511,3 +511,22 @@ b'\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff'\
 b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'\
 b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'\
 b'\xff\xff\xff\xff\xff\xff\xff\xff'
+
+# transparency spans, generated by scripts/img_spans.py
+key = 0xffff
+spans =\
+b'\x01\x22\x0a\x02\x20\x0e\x07\x03\x01\x1e\x1b\x01\x1c\x1e\x01\x1b'\
+b'\x1e\x01\x1a\x1f\x01\x18\x21\x01\x17\x21\x01\x16\x21\x01\x15\x21'\
+b'\x01\x13\x22\x01\x13\x21\x01\x13\x1f\x01\x17\x1a\x01\x17\x18\x01'\
+b'\x17\x16\x01\x16\x16\x01\x16\x16\x01\x16\x15\x01\x15\x16\x01\x15'\
+b'\x16\x01\x14\x17\x01\x13\x18\x01\x13\x18\x01\x12\x19\x01\x11\x1b'\
+b'\x01\x10\x1d\x01\x0f\x1e\x01\x0e\x20\x01\x0d\x21\x01\x0c\x22\x01'\
+b'\x0b\x23\x01\x09\x25\x01\x08\x26\x01\x07\x27\x01\x06\x28\x01\x05'\
+b'\x28\x01\x04\x29\x01\x03\x2a\x01\x03\x2a\x01\x02\x2a\x01\x01\x2b'\
+b'\x01\x01\x2a\x01\x00\x2b\x01\x00\x2b\x01\x00\x2b\x01\x00\x2a\x01'\
+b'\x00\x2a\x01\x00\x2a\x01\x00\x2a\x01\x00\x2a\x01\x00\x2a\x01\x01'\
+b'\x29\x01\x02\x28\x01\x02\x28\x01\x03\x27\x01\x03\x26\x01\x04\x25'\
+b'\x02\x05\x12\x03\x0f\x02\x06\x10\x06\x0e\x02\x06\x0e\x09\x0e\x03'\
+b'\x05\x0e\x0b\x06\x01\x06\x03\x05\x0c\x0d\x06\x01\x06\x02\x06\x0b'\
+b'\x0d\x0d\x02\x07\x0c\x0c\x08\x02\x09\x0c\x0a\x08\x02\x0b\x0b\x09'\
+b'\x08\x02\x0d\x0a\x09\x07\x02\x10\x07\x0a\x05\x02\x13\x04\x0a\x03'
@@ -0,0 +1,2 @@
+# Host stand-in for the MicroPython aioespnow module, only on the host path
+from espnow_sim import SimESPNow as AIOESPNow  # noqa: F401
@@ -0,0 +1,144 @@
+"""
+Image loading benchmark: Python image module vs raw and compressed .bimg assets.
+
+Writes the pixels of frozen_fs/images/<name>.bimg back out as the module
+img_cvt.py would make (a data bytes literal) and as a raw and a deflate
+.bimg. For each form it reports the file size, the time to get the image
+into a 320x170 RGB565 framebuffer and the heap it takes on the way, and
+checks that all give the same pixels. The clipped run draws a 100x50 window
+out of the middle of the compressed image.
+
+    make bench_assets
+    # or
+    MICROPYPATH=frozen_firmware/modules:libs/micropython-async/v3:scripts \
+        micropython scripts/bench_assets.py
+
+A frozen module keeps its data in flash as raw bytes, so its flash footprint
+is that of the raw .bimg, not of the source. Compressed assets are expanded by
+MicroPython's deflate module, so CPython only runs the module and raw rows.
+"""
+
+import espnow_sim  # noqa: F401, first, sets up CPython compatibility
+import gc
+import os
+import sys
+from time import ticks_us, ticks_diff
+
+from bdg.assets import DEFLATE, blit_asset, read_header
+
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+NAMES = ("boot", "matriisi")
+TMP = "/tmp"
+CLIP = (110, 60, 100, 50)
+
+
+class Display(object):
+    def __init__(self, width=320, height=170):
+        self.width = width
+        self.height = height
+        self.mode = 1
+        self.mvb = memoryview(bytearray(width * height * 2))
+
+
+def heap():
+    try:
+        return gc.mem_alloc()  # MicroPython
+    except AttributeError:
+        import tracemalloc
+
+        return tracemalloc.get_traced_memory()[0]
+
+
+def pixels(path):
+    with open(path, "rb") as f:
+        img = read_header(f)
+        if img.flags != DEFLATE:
+            return img, f.read()
+        if deflate is not None:
+            return img, deflate.DeflateIO(f, deflate.ZLIB).read()
+        import zlib
+
+        return img, zlib.decompress(f.read())
+
+
+def write_files(name):
+    img, data = pixels(f"frozen_fs/images/{name}.bimg")
+    module = f"bench_assets_{name}"
+    with open(f"{TMP}/{module}.py", "w") as f:
+        f.write(f"rows = {img.rows}\ncols = {img.cols}\nmode = {img.mode}\n")
+        f.write("data =\\\n")
+        for i in range(0, len(data), 32):
+            chunk = "".join(f"\\x{v:02x}" for v in data[i : i + 32])
+            f.write(f"b'{chunk}'\\\n")
+        f.write("\n")
+    raw = f"{TMP}/{module}.bimg"
+    with open(raw, "wb") as f:
+        f.write(b"BI" + bytes((img.mode, 0)))
+        f.write(img.rows.to_bytes(2, "big") + img.cols.to_bytes(2, "big"))
+        f.write(data)
+    return module, raw
+
+
+def measure(fn, ssd):
+    gc.collect()
+    before = heap()
+    t0 = ticks_us()
+    keep = fn(ssd)
+    us = ticks_diff(ticks_us(), t0)
+    used = heap() - before
+    del keep
+    return us, used
+
+
+def bench(name):
+    module, raw = write_files(name)
+    packed = f"frozen_fs/images/{name}.bimg"
+
+    def from_module(ssd):
+        sys.path.insert(0, TMP)
+        img = __import__(module)
+        ssd.mvb[:] = img.data
+        return img  # held like a module level image import
+
+    runs = [
+        (f"import {name} module", f"{TMP}/{module}.py", from_module),
+        ("blit_asset raw", raw, lambda ssd: blit_asset(ssd, raw)),
+    ]
+    if deflate is not None:
+        runs += [
+            ("blit_asset deflate", packed, lambda ssd: blit_asset(ssd, packed)),
+            ("  100x50 clip", packed, lambda ssd: blit_asset(ssd, packed, clip=CLIP)),
+        ]
+    first = None
+    for label, path, fn in runs:
+        ssd = Display()
+        us, used = measure(fn, ssd)
+        if "clip" not in label:
+            if first is None:
+                first = bytes(ssd.mvb)
+            elif bytes(ssd.mvb) != first:
+                raise AssertionError(f"{label} gives different pixels")
+        size = os.stat(path)[6]
+        print(f"{label:<24} {size:>8} B {us:>9}us {used:>8} B")
+    if deflate is None:
+        print(f"blit_asset deflate       {os.stat(packed)[6]:>8} B   needs MicroPython")
+
+
+def main():
+    try:
+        import tracemalloc
+
+        tracemalloc.start()
+    except ImportError:
+        pass
+    print("320x170 RGB565 image          file       time      heap")
+    for name in NAMES:
+        bench(name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Transparent blit benchmark: per pixel colour key vs precomputed spans.
+
+Blits the 58x70 Testausserveri logo into a 320x170 RGB565 buffer with the
+keyed loop testausserveri.py used (one key compare per pixel) and with
+bdg.blit.blit_spans() (one slice copy per opaque run), checks that both give
+the same pixels, also partly off screen, and reports the time per blit.
+
+    make bench_blit
+    # or
+    PYTHONPATH=frozen_firmware/modules:libs/micropython-async/v3:scripts \
+        python3 scripts/bench_blit.py
+"""
+
+import espnow_sim  # noqa: F401, first, sets up CPython compatibility
+from time import ticks_us, ticks_diff
+
+from bdg.blit import blit_spans
+from images import testausserveri_logo as logo
+
+RUNS = 20
+
+
+class Display(object):
+    def __init__(self, width=320, height=170):
+        self.width = width
+        self.height = height
+        self.mvb = memoryview(bytearray(width * height * 2))
+
+
+def blit_keyed(ssd, img, row, col):
+    # the loop blit_spans replaces, clipped on all sides for the comparison
+    data = img.data
+    key0 = data[0]
+    key1 = data[1]
+    mvb = ssd.mvb
+    for r in range(img.rows):
+        y = row + r
+        if not 0 <= y < ssd.height:
+            continue
+        for p in range(img.cols):
+            x = col + p
+            if not 0 <= x < ssd.width:
+                continue
+            si = (r * img.cols + p) * 2
+            if data[si] != key0 or data[si + 1] != key1:
+                di = (y * ssd.width + x) * 2
+                mvb[di] = data[si]
+                mvb[di + 1] = data[si + 1]
+
+
+def timed(fn, ssd, row, col):
+    t0 = ticks_us()
+    for _ in range(RUNS):
+        fn(ssd, logo, row, col)
+    return ticks_diff(ticks_us(), t0) // RUNS
+
+
+def main():
+    for row, col in ((50, 131), (0, 0), (-20, -30), (140, 290)):
+        a, b = Display(), Display()
+        blit_keyed(a, logo, row, col)
+        blit_spans(b, logo, row, col)
+        if bytes(a.mvb) != bytes(b.mvb):
+            raise AssertionError(f"blit_spans differs at {row}, {col}")
+    ssd = Display()
+    keyed = timed(blit_keyed, ssd, 50, 131)
+    spans = timed(blit_spans, ssd, 50, 131)
+    print(
+        f"{logo.cols}x{logo.rows} logo, {len(logo.spans)} bytes of spans:"
+        f" keyed {keyed}us, spans {spans}us per blit ({keyed / max(1, spans):.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Bulk transfer benchmark: bdg.msg.bulk over a lossy simulated link.
+
+Two SimBadges connect and one sends a SIZE byte blob to the other with
+Connection.send_blob() for every combination of LOSSES and WINDOWS. Reports
+throughput, chunk frames sent per chunk delivered, retransmits and duplicates,
+and checks the received bytes. The badge row paces the receiving listener like
+the firmware does (rx_yield_s = 0.1), the others show the protocol limit.
+
+    make bench_bulk
+    # or
+    PYTHONPATH=frozen_firmware/modules:libs/micropython-async/v3:scripts \
+        python3 scripts/bench_bulk.py
+"""
+
+import asyncio
+import random
+
+from espnow_sim import Medium, SimBadge  # first, sets up CPython compatibility
+from time import ticks_ms, ticks_diff
+
+SIZE = 16 * 1024
+LOSSES = (0.0, 0.05, 0.15, 0.3)
+WINDOWS = (1, 4, 8, 16)
+BADGE_SIZE = 4 * 1024
+CON_ID = 3
+
+
+async def run(loss, window, size=SIZE, rx_yield_s=0.0):
+    from bdg.msg.bulk import BulkReceiver, BulkSender, BulkStart
+
+    medium = Medium(loss=0, latency_ms=(2, 8), seed=2)
+    a = SimBadge(medium, pos=(0, 0))
+    b = SimBadge(medium, pos=(2, 0))
+    a.start(beacon_s=0)
+    b.start(beacon_s=0, rx_yield_s=rx_yield_s)
+    conn_a = await a.connect(b, con_id=CON_ID)
+    assert conn_a is not None, "connection failed"
+    await asyncio.sleep_ms(100)
+    conn_b = b.NowListener.connections[CON_ID]
+    medium.set_link(a.mac, b.mac, loss=loss)
+
+    blob = bytes(random.Random(size).getrandbits(8) for _ in range(size))
+    buf = bytearray(size)
+    receiver = None
+
+    async def receive():
+        nonlocal receiver
+        async for msg in conn_b.get_msg_aiter():
+            if isinstance(msg, BulkStart):
+                receiver = BulkReceiver(conn_b, msg, buf)
+                return await receiver.run(timeout_ms=30_000)
+
+    rx = asyncio.create_task(receive())
+    sender = BulkSender(conn_a, blob, window=window)
+    t0 = ticks_ms()
+    ok = await sender.run(timeout_ms=30_000)
+    elapsed = max(1, ticks_diff(ticks_ms(), t0))
+    await rx
+    assert ok and bytes(buf) == blob, "blob differs"
+    a.stop()
+    b.stop()
+    return {
+        "kib_s": size * 1000 / 1024 / elapsed,
+        "frames": sender.sent / sender.n,
+        "resent": sender.resent,
+        "dup": receiver.dup,
+        "ms": elapsed,
+    }
+
+
+def main():
+    print("loss  window    KiB/s  frames/chunk  resent  dup      ms")
+    for loss in LOSSES:
+        for window in WINDOWS:
+            r = asyncio.run(run(loss, window))
+            print(
+                f"{loss:>4.0%} {window:>7} {r['kib_s']:>8.1f} {r['frames']:>13.2f}"
+                f" {r['resent']:>7} {r['dup']:>4} {r['ms']:>7}"
+            )
+    r = asyncio.run(run(0.05, 8, BADGE_SIZE, rx_yield_s=0.1))
+    print(
+        f"badge pacing, 5% loss, window 8: {r['kib_s']:.1f} KiB/s,"
+        f" {r['frames']:.2f} frames/chunk, {r['ms']}ms for {BADGE_SIZE} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+Conference scale load benchmark for the messaging stack.
+
+Places `badges` virtual badges at random positions in a hall and runs them
+through Beacon / NowListener discovery, then opens `sessions` concurrent game
+connections with NowListener.conn_req and exchanges `messages` app messages on
+each. Results are written as JSON to `out` so runs of different firmware
+versions can be compared:
+
+    discovery_ms    p50/p90/p99 time from a badge's first beacon until a
+                    neighbour in range listed it in last_seen
+    discovered      share of in-range (receiver, sender) pairs discovered
+    conn_success    share of conn_req() calls that opened a connection
+    conn_setup_ms   p50/p90/p99 conn_req() duration of successful sessions
+    retransmits     extra AppMsg frames sent per delivered app message
+    cpu_us_frame    CPU time per frame received by any badge
+    heap_peak       peak Python heap in bytes
+
+    make bench_conference
+    # or
+    PYTHONPATH=frozen_firmware/modules:libs/micropython-async/v3:scripts \
+        python3 scripts/bench_conference.py badges=300 out=conference.json
+
+Parameters are key=value arguments, see DEFAULTS. MicroPython has no process
+clock, there cpu_us_frame is wall time and includes idle time.
+"""
+
+import asyncio
+import builtins
+import gc
+import json
+import random
+import sys
+import time
+
+from espnow_sim import Medium, SimBadge  # first, sets up CPython compatibility
+from time import ticks_ms, ticks_us, ticks_diff
+
+from bdg.msg import BadgeAdrDict, RPSMsg
+
+DEFAULTS = {
+    "badges": 200,
+    "hall_w": 60,  # meters
+    "hall_h": 30,
+    "beacon_s": 5.0,  # firmware default
+    "discovery_s": 15.0,
+    "sessions": 20,
+    "messages": 20,
+    "loss": 0.02,
+    "seed": 1,
+    "out": "conference_bench.json",
+}
+
+CON_ID = 1
+
+
+def parse_args(argv):
+    params = dict(DEFAULTS)
+    for arg in argv:
+        key, _, value = arg.partition("=")
+        if key not in params:
+            raise ValueError(f"unknown parameter {key}, known: {list(params)}")
+        params[key] = type(DEFAULTS[key])(value)
+    return params
+
+
+def percentiles(values):
+    values = sorted(values)
+    n = len(values)
+
+    def p(q):
+        return values[min(n - 1, n * q // 100)] if n else None
+
+    return {"p50": p(50), "p90": p(90), "p99": p(99), "n": n}
+
+
+def firmware_version():
+    try:
+        with open("frozen_fs/VERSION") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class SeenLog(BadgeAdrDict):
+    # last_seen that remembers when each badge was first listed
+    def __init__(self):
+        super().__init__(max_size=20, stale_multiplier=2.6)
+        self.first = {}
+
+    def __setitem__(self, key, value):
+        if key not in self.first:
+            self.first[key] = ticks_ms()
+        super().__setitem__(key, value)
+
+
+class Probe:
+    """CPU clock and heap high-water mark, on CPython and MicroPython."""
+
+    def __init__(self):
+        self.process = hasattr(time, "process_time_ns")
+        self.heap_peak = 0
+        self._task = None
+        self._tracemalloc = None
+        if hasattr(gc, "mem_alloc"):
+            gc.collect()
+        else:
+            import tracemalloc
+
+            tracemalloc.start()
+            self._tracemalloc = tracemalloc
+
+    def cpu_us(self):
+        if self.process:
+            return time.process_time_ns() // 1000
+        return ticks_us()
+
+    def cpu_since(self, start):
+        if self.process:
+            return self.cpu_us() - start
+        return ticks_diff(ticks_us(), start)
+
+    def sample(self):
+        if self._tracemalloc:
+            heap = self._tracemalloc.get_traced_memory()[1]
+        else:
+            heap = gc.mem_alloc()
+        self.heap_peak = max(self.heap_peak, heap)
+
+    async def _sampler(self):
+        while True:
+            self.sample()
+            await asyncio.sleep_ms(50)
+
+    def start(self):
+        self._task = asyncio.create_task(self._sampler())
+
+    def stop(self):
+        self.sample()
+        self._task.cancel()
+        if self._tracemalloc:
+            self._tracemalloc.stop()
+
+
+async def discovery(badges, params):
+    started = {}
+
+    async def start(b):
+        # badges do not boot in lockstep, spread the first beacons
+        await asyncio.sleep(random.random() * params["beacon_s"])
+        started[b.mac] = ticks_ms()
+        b.start(beacon_s=params["beacon_s"])
+
+    for b in badges:
+        b.NowListener.last_seen = SeenLog()
+        asyncio.create_task(start(b))
+    await asyncio.sleep(params["discovery_s"])
+
+    latency = []
+    expected = 0
+    for b in badges:
+        first = b.NowListener.last_seen.first
+        for o in badges:
+            if o is b or o.mac not in started or not b.in_range(o):
+                continue
+            expected += 1
+            if o.mac in first:
+                latency.append(ticks_diff(first[o.mac], started[o.mac]))
+
+    return {
+        "discovery_ms": percentiles(latency),
+        "discovered": len(latency) / expected if expected else None,
+        "pairs_in_range": expected,
+    }
+
+
+def pick_pairs(badges, n):
+    free = list(badges)
+    random.shuffle(free)
+    pairs = []
+    while free and len(pairs) < n:
+        a = free.pop()
+        near = [b for b in free if a.in_range(b)]
+        if near:
+            b = random.choice(near)
+            free.remove(b)
+            pairs.append((a, b))
+    return pairs
+
+
+async def session(a, b, params, counts):
+    t = ticks_ms()
+    try:
+        ok = await asyncio.wait_for(a.NowListener.conn_req(b.mac, CON_ID), 25)
+    except asyncio.TimeoutError:
+        ok = False
+    if not ok:
+        return None
+    setup_ms = ticks_diff(ticks_ms(), t)
+
+    conn = a.NowListener.connections[CON_ID]
+    peer = b.NowListener.connections.get(CON_ID)
+    received = 0
+
+    async def reader():
+        nonlocal received
+        while received < params["messages"]:
+            await peer.in_q.get()
+            received += 1
+
+    reader_t = asyncio.create_task(reader()) if peer else None
+    for i in range(params["messages"]):
+        try:
+            conn.send_app_msg(RPSMsg(i))
+            counts["app_sent"] += 1
+        except Exception:  # QueueFull when the sender falls behind
+            counts["send_errors"] += 1
+        await asyncio.sleep_ms(100)
+    try:
+        if reader_t:
+            await asyncio.wait_for(reader_t, 5)
+    except asyncio.TimeoutError:
+        pass
+    counts["app_delivered"] += received
+    await conn.terminate()
+    return setup_ms
+
+
+def count_app_frames(badge, counts):
+    asend = badge.espnow.asend
+
+    async def counting_asend(mac, msg, sync=None):
+        if b"AppMsg" in msg:
+            counts["app_frames"] += 1
+        return await asend(mac, msg, sync)
+
+    badge.espnow.asend = counting_asend
+
+
+async def run(params):
+    random.seed(params["seed"])
+    probe = Probe()
+    probe.start()
+    medium = Medium(loss=params["loss"], latency_ms=(1, 6), seed=params["seed"])
+    badges = [
+        SimBadge(
+            medium,
+            pos=(
+                random.uniform(0, params["hall_w"]),
+                random.uniform(0, params["hall_h"]),
+            ),
+        )
+        for _ in range(params["badges"])
+    ]
+    counts = {"app_frames": 0, "app_sent": 0, "app_delivered": 0, "send_errors": 0}
+    for b in badges:
+        count_app_frames(b, counts)
+
+    cpu0 = probe.cpu_us()
+    results = await discovery(badges, params)
+
+    pairs = pick_pairs(badges, params["sessions"])
+    setups = await asyncio.gather(*[session(a, b, params, counts) for a, b in pairs])
+    cpu = probe.cpu_since(cpu0)
+
+    for b in badges:
+        b.stop()
+    probe.stop()
+
+    ok = [ms for ms in setups if ms is not None]
+    delivered = counts["app_delivered"]
+    frames = medium.stats["delivered"]
+    results.update(
+        {
+            "conn_attempts": len(pairs),
+            "conn_success": len(ok) / len(pairs) if pairs else None,
+            "conn_setup_ms": percentiles(ok),
+            "app_sent": counts["app_sent"],
+            "app_delivered": delivered,
+            "send_errors": counts["send_errors"],
+            "retransmits": (
+                (counts["app_frames"] - counts["app_sent"]) / delivered
+                if delivered
+                else None
+            ),
+            "frames_rx": frames,
+            "cpu_us_frame": cpu // frames if frames else None,
+            "heap_peak": probe.heap_peak,
+            "medium": medium.stats,
+        }
+    )
+    return results
+
+
+def main(argv):
+    params = parse_args(argv)
+    out = params.pop("out")
+
+    _print = builtins.print
+    builtins.print = lambda *args, **kwargs: None  # the stack logs every frame
+    try:
+        results = asyncio.run(run(params))
+    finally:
+        builtins.print = _print
+
+    report = {
+        "bench": "conference",
+        "firmware": firmware_version(),
+        "runtime": sys.implementation.name,
+        "cpu_clock": "process" if hasattr(time, "process_time_ns") else "wall",
+        "time": time.time(),
+        "params": params,
+        "results": results,
+    }
+    with open(out, "w") as f:
+        json.dump(report, f)
+
+    for key, value in results.items():
+        print(f"{key:>15}: {value}")
+    print(f"results written to {out}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
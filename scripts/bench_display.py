@@ -0,0 +1,362 @@
+"""
+Display benchmark: bytes sent over SPI per frame, full vs partial refresh.
+
+Replays the drawing calls of each game's typical frames on a host model of the
+badge display: SimST7789 is a FrameBuffer with the st7789 driver's _wcd(),
+set_window() and show(), and its SPI bus feeds Panel, which counts the bytes
+and writes RAMWR data into a model of the controller RAM through the CASET /
+RASET window. Every frame is shown twice, with the driver's full show() and
+with bdg.display.partial(), and after each partial show the visible RAM must
+equal the framebuffer.
+
+The latency part runs a button poll task every POLL_MS next to a game that
+redraws the whole screen, with the panel taking as long as the real bus for
+each byte. It reports how late the polls were with the blocking show() and
+with the background flush().
+
+Needs framebuf, so it runs on the MicroPython unix port:
+
+    make bench_display
+    # or
+    MICROPYPATH=frozen_firmware/modules:scripts micropython scripts/bench_display.py
+"""
+
+import asyncio
+import framebuf
+from time import ticks_us, ticks_diff
+
+from bdg.display import CASET, RASET, RAMWR, partial
+
+WIDTH = 320
+HEIGHT = 170
+OFFSET = (0, 35)  # ADAFRUIT_1_9 in landscape
+RAM_W = 320
+RAM_H = 240
+SPI_HZ = 80_000_000
+POLL_MS = 5
+
+BLACK = 0
+WHITE = 0xFFFF
+GREY = 0x1084
+RED = 0x00F8  # byte swapped RGB565, like the driver's colors
+GREEN = 0xE007
+YELLOW = 0xE0FF
+
+
+class Panel(object):
+    """The controller side of the SPI bus."""
+
+    def __init__(self):
+        self.ram = bytearray(RAM_W * RAM_H * 2)
+        self.bytes = 0
+        self.windows = 0
+        self.data = True
+        self.cmd = None
+        self.win = (0, RAM_W - 1, 0, RAM_H - 1)
+        self.pos = 0
+        self.realtime = False  # block like the bus does
+
+    def dc(self, v):
+        self.data = bool(v)
+
+    def cs(self, v):
+        pass
+
+    def write(self, buf):
+        self.bytes += len(buf)
+        if self.realtime:
+            t0 = ticks_us()
+            us = len(buf) * 8_000_000 // SPI_HZ
+            while ticks_diff(ticks_us(), t0) < us:
+                pass
+        if not self.data:
+            self.cmd = bytes(buf)
+            if self.cmd == RAMWR:
+                self.pos = 0
+                self.windows += 1
+            return
+        x0, x1, y0, y1 = self.win
+        if self.cmd == CASET:
+            self.win = (buf[0] << 8 | buf[1], buf[2] << 8 | buf[3], y0, y1)
+        elif self.cmd == RASET:
+            self.win = (x0, x1, buf[0] << 8 | buf[1], buf[2] << 8 | buf[3])
+        elif self.cmd == RAMWR:
+            self.ramwr(buf)
+
+    def ramwr(self, buf):
+        # pixels fill the window row by row
+        x0, x1, y0, y1 = self.win
+        w = x1 - x0 + 1
+        i = 0
+        while i < len(buf):
+            row, col = divmod(self.pos, w)
+            if y0 + row > y1:
+                raise ValueError("RAMWR beyond the window")
+            n = min(len(buf) - i, (w - col) * 2)
+            a = ((y0 + row) * RAM_W + x0 + col) * 2
+            self.ram[a : a + n] = buf[i : i + n]
+            self.pos += n // 2
+            i += n
+
+    def visible(self):
+        x, y = OFFSET
+        return b"".join(
+            self.ram[((y + r) * RAM_W + x) * 2 : ((y + r) * RAM_W + x + WIDTH) * 2]
+            for r in range(HEIGHT)
+        )
+
+
+class SPI(object):
+    def __init__(self, panel):
+        self.panel = panel
+
+    def write(self, buf):
+        self.panel.write(buf)
+
+
+class SimST7789(framebuf.FrameBuffer):
+    """The parts of the st7789 driver that partial() builds on."""
+
+    def __init__(self, spi, cs, dc, height=HEIGHT, width=WIDTH):
+        self._spi = spi
+        self._cs = cs
+        self._dc = dc
+        self.height = height
+        self.width = width
+        self.mode = framebuf.RGB565
+        self.palette = framebuf.FrameBuffer(bytearray(4), 2, 1, framebuf.RGB565)
+        buf = bytearray(height * width * 2)
+        self.mvb = memoryview(buf)
+        super().__init__(buf, width, height, self.mode)
+        self.set_window()
+
+    def _wcd(self, command, data):
+        self._dc(0)
+        self._cs(0)
+        self._spi.write(command)
+        self._cs(1)
+        self._dc(1)
+        self._cs(0)
+        self._spi.write(data)
+        self._cs(1)
+
+    def set_window(self):
+        xs, ys = OFFSET
+        xe, ye = xs + self.width - 1, ys + self.height - 1
+        self._wcd(CASET, int.to_bytes((xs << 16) + xe, 4, "big"))
+        self._wcd(RASET, int.to_bytes((ys << 16) + ye, 4, "big"))
+
+    def show(self):
+        self._dc(0)
+        self._cs(0)
+        self._spi.write(RAMWR)
+        self._dc(1)
+        self._spi.write(self.mvb)
+        self._cs(1)
+
+
+def label(ssd, row, col, width, height, text, color=WHITE):
+    # gui.widgets.Label.value(): clear the field, then a CWriter glyph per char
+    ssd.fill_rect(col, row, width, height, BLACK)
+    cw = height * 3 // 5
+    x = col + (width - cw * len(text)) // 2
+    ssd.palette.pixel(0, 0, BLACK)
+    ssd.palette.pixel(1, 0, color)
+    for _ in text:
+        glyph = bytearray(((cw + 7) // 8) * height)
+        for i in range(0, len(glyph), 3):
+            glyph[i] = 0x5A
+        fbc = framebuf.FrameBuffer(glyph, cw, height, framebuf.MONO_HLSB)
+        ssd.blit(fbc, x, row, -1, ssd.palette)
+        x += cw
+
+
+def background(ssd):
+    # Screen change: ugui clears, widgets draw
+    ssd.fill(BLACK)
+    label(ssd, 4, 2, 316, 14, "Title", GREEN)
+
+
+# tetris_solo.py geometry
+CELL = 8
+BOARD_X = 8
+BOARD_Y = 5
+PANEL_X = BOARD_X + 10 * CELL + 12
+T_PIECE = ((1, 0), (0, 1), (1, 1), (2, 1))
+
+
+def tetris_frames():
+    def cells(ssd, px, py, color):
+        for dx, dy in T_PIECE:
+            x = BOARD_X + (px + dx) * CELL
+            y = BOARD_Y + (py + dy) * CELL
+            ssd.fill_rect(x, y, CELL - 1, CELL - 1, color)
+
+    def start(ssd):
+        background(ssd)
+        ssd.rect(BOARD_X - 1, BOARD_Y - 1, 10 * CELL + 2, 20 * CELL + 2, GREY)
+
+    def fall(py):
+        def frame(ssd):
+            cells(ssd, 4, py - 1, BLACK)
+            cells(ssd, 4, py, RED)
+
+        return frame
+
+    def lock(ssd):
+        # _lock_step: HUD, next preview, whole board with force=True
+        label(ssd, 30, PANEL_X, 100, 10, "Score: 120")
+        ssd.fill_rect(PANEL_X, 80, 4 * 10, 4 * 10, BLACK)
+        cells(ssd, 0, 0, YELLOW)
+        for i in range(200):
+            x = BOARD_X + (i % 10) * CELL
+            y = BOARD_Y + (i // 10) * CELL
+            ssd.fill_rect(x, y, CELL - 1, CELL - 1, RED if i > 180 else BLACK)
+
+    return [start] + [fall(py) for py in range(1, 18)] + [lock]
+
+
+def reaction_frames():
+    # ReactionButton.show(): fillcircle and two border circles
+    def button(i, active):
+        def frame(ssd):
+            x, y, r = 40 + i * 80, 100 + 18, 18
+            ssd.ellipse(x, y, r, r, YELLOW if active else RED, True)
+            ssd.ellipse(x, y, r + 1, r + 1, WHITE if active else RED)
+            ssd.ellipse(x, y, r + 2, r + 2, WHITE if active else RED)
+
+        return frame
+
+    def points(n):
+        def frame(ssd):
+            label(ssd, 40, 2, 316, 35, str(n))
+
+        return frame
+
+    frames = [background]
+    for n in range(8):
+        frames += [button(n % 4, True), button(n % 4, False), points(n)]
+    return frames
+
+
+def tictac_frames():
+    # one cell per move: border, then an X (two lines) or an O (circle)
+    def move(i):
+        def frame(ssd):
+            x, y, ht = 85 + (i % 3) * 50, 10 + (i // 3) * 50, 48
+            ssd.rect(x, y, ht, ht, WHITE)
+            if i % 2:
+                ssd.ellipse(x + ht // 2, y + ht // 2, ht // 2 - 4, ht // 2 - 4, GREEN)
+            else:
+                ssd.line(x + 4, y + 4, x + ht - 5, y + ht - 5, RED)
+                ssd.line(x + 4, y + ht - 5, x + ht - 5, y + 4, RED)
+
+        return frame
+
+    return [background] + [move(i) for i in range(9)]
+
+
+def hackergotchi_frames():
+    # evolving screen: two font10 labels and the arial35 spinner every 0.2s
+    def tick(n):
+        def frame(ssd):
+            label(ssd, 30, 2, 316, 10, "... evolving ...")
+            label(ssd, 60, 2, 316, 10, f"00:{59 - n:02d}")
+            label(ssd, 90, 150, 160, 35, "|/-\\"[n % 4])
+
+        return frame
+
+    return [background] + [tick(n) for n in range(20)]
+
+
+def testausserveri_frames():
+    # full screen image and a keyed logo (bdg.utils.blit), then only LEDs change
+    def start(ssd):
+        ssd.mvb[:] = bytes(len(ssd.mvb))
+        ssd.mark_all()
+
+    def idle(ssd):
+        pass
+
+    return [start] + [idle] * 10
+
+
+GAMES = (
+    ("tetris", tetris_frames),
+    ("reaction", reaction_frames),
+    ("tictac", tictac_frames),
+    ("hackergotchi", hackergotchi_frames),
+    ("testausserveri", testausserveri_frames),
+)
+
+
+def run(frames, partial_refresh):
+    panel = Panel()
+    ssd = partial(SimST7789)(SPI(panel), cs=panel.cs, dc=panel.dc)
+    ssd.partial = partial_refresh
+    sizes = []
+    windows = 0
+    for frame in frames:
+        panel.bytes = 0
+        panel.windows = 0
+        frame(ssd)
+        ssd.show()
+        if panel.visible() != bytes(ssd.mvb):
+            raise AssertionError(f"{frame} left the panel out of date")
+        sizes.append(panel.bytes)
+        windows += panel.windows
+    # the first frame draws the whole screen in every game
+    rest = sizes[1:]
+    return sum(rest) // len(rest), max(rest), windows / len(frames)
+
+
+async def latency(background, frames=30):
+    panel = Panel()
+    ssd = partial(SimST7789)(SPI(panel), cs=panel.cs, dc=panel.dc)
+    ssd.show()
+    panel.realtime = True
+    late = []
+    running = True
+
+    async def poll():
+        # ButtonEvents and NowListener.task need the loop every few ms
+        while running:
+            t0 = ticks_us()
+            await asyncio.sleep_ms(POLL_MS)
+            late.append(ticks_diff(ticks_us(), t0) - POLL_MS * 1000)
+
+    task = asyncio.create_task(poll())
+    for n in range(frames):
+        ssd.fill(WHITE if n % 2 else BLACK)
+        if background:
+            await ssd.flush()
+        else:
+            ssd.show()
+        await asyncio.sleep_ms(20)
+    running = False
+    await task
+    if panel.visible() != bytes(ssd.mvb):
+        raise AssertionError("flush() left the panel out of date")
+    late.sort()
+    return late[len(late) // 2], late[len(late) * 99 // 100], late[-1]
+
+
+def main():
+    print("game            frames  full B/frame  partial B/frame  max B  win/frame")
+    for name, frames in GAMES:
+        frames = frames()
+        full = run(frames, False)
+        avg, top, win = run(frames, True)
+        us = avg * 8 * 1_000_000 // SPI_HZ
+        print(
+            f"{name:<15} {len(frames):>6} {full[0]:>13} {avg:>16} {top:>6}"
+            f" {win:>10.1f}  ({us}us at {SPI_HZ // 1_000_000}MHz)"
+        )
+    print(f"\npoll lateness, {POLL_MS}ms poll, full screen redraws   median  p99  max")
+    for name, background in (("show()", False), ("flush()", True)):
+        med, p99, top = asyncio.run(latency(background))
+        print(f"{name:<47} {med:>5}us {p99:>5}us {top:>5}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Send path benchmark: inline retry loop vs bdg.msg.pipeline.SendPipeline.
+
+A game loop ticks every TICK_MS and sends one frame to each of PEERS peers on
+a FakeESPNow with airtime. Every FAULT_EVERY frames the driver drops out
+(ESP_ERR_ESPNOW_NOT_INIT) and needs REPAIR_MS after active(True) to recover.
+Reports delivered frames, throughput, frame latency percentiles and how long
+the game loop was stalled by sending.
+
+    make bench_send
+    # or
+    MICROPYPATH=frozen_firmware/modules:libs/micropython-async/v3:scripts \
+        micropython scripts/bench_send.py
+"""
+
+import asyncio
+import gc
+
+from espnow_sim import FakeESPNow  # first, sets up CPython compatibility
+from time import ticks_ms, ticks_us, ticks_diff
+
+TICKS = 200
+TICK_MS = 20
+PEERS = 4
+AIRTIME_MS = 1
+FAULT_EVERY = 97
+REPAIR_MS = 30
+
+
+async def legacy_send(espnow, mac, msg, sync=False, retries=3):
+    # send_message before the pipeline: retries inline, repairs inline
+    for _ in range(retries):
+        try:
+            await espnow.asend(mac, msg, sync=sync)
+            return True
+        except OSError as err:
+            if err.args[1] == "ESP_ERR_ESPNOW_NOT_INIT":
+                espnow.active(True)
+                gc.collect()
+            elif err.args[1] == "ESP_ERR_ESPNOW_NOT_FOUND":
+                espnow.add_peer(mac)
+            else:
+                raise err
+    return False
+
+
+def percentile(values, p):
+    if not values:
+        return 0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def make_espnow():
+    e = FakeESPNow(airtime_ms=AIRTIME_MS)
+    e.active(True)
+    return e, [bytes([2, 0, 0, 0, 0, i + 1]) for i in range(PEERS)]
+
+
+async def run(mode):
+    from bdg.msg.pipeline import SendPipeline
+
+    e, macs = make_espnow()
+    pipe = SendPipeline.of(e)
+    latency = []
+    stall = []
+    n = 0
+
+    def done(start):
+        def cb(fut):
+            if fut.result():
+                latency.append(ticks_diff(ticks_ms(), start))
+
+        return cb
+
+    t0 = ticks_ms()
+    futs = []
+    for _ in range(TICKS):
+        tick = ticks_us()
+        for mac in macs:
+            n += 1
+            if n % FAULT_EVERY == 0:
+                e.break_driver(repair_ms=REPAIR_MS)
+            start = ticks_ms()
+            msg = b"frame %d" % n
+            if mode == "legacy":
+                if await legacy_send(e, mac, msg):
+                    latency.append(ticks_diff(ticks_ms(), start))
+            else:
+                futs.append(pipe.submit(mac, msg, cb=done(start)))
+        stall.append(ticks_diff(ticks_us(), tick) / 1000)
+        await asyncio.sleep_ms(TICK_MS)
+
+    for fut in futs:
+        await fut.wait()
+    elapsed = ticks_diff(ticks_ms(), t0)
+
+    return {
+        "mode": mode,
+        "frames": n,
+        "delivered": len(latency),
+        "fps": len(latency) * 1000 // max(1, elapsed),
+        "lat_p50": percentile(latency, 50),
+        "lat_p99": percentile(latency, 99),
+        "stall_p99": percentile(stall, 99),
+        "stall_max": max(stall),
+        "dropped": pipe.dropped,
+    }
+
+
+def main():
+    print("mode      frames delivered fps lat_p50 lat_p99 stall_p99 stall_max")
+    for mode in ("legacy", "pipeline"):
+        r = asyncio.run(run(mode))
+        print(
+            f"{r['mode']:<9} {r['frames']:>6} {r['delivered']:>9} {r['fps']:>3}"
+            f" {r['lat_p50']:>5}ms {r['lat_p99']:>5}ms"
+            f" {r['stall_p99']:>7.1f}ms {r['stall_max']:>7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Decode a trace saved on the badge with bdg.trace.save().
+
+    mpremote exec "from bdg import trace; trace.save()" + cp :/trace.bin .
+    PYTHONPATH=frozen_firmware/modules:scripts python3 scripts/decode_trace.py trace.bin
+
+Optional second argument filters on event names, e.g. `out_retry,out_timeout`.
+Times are printed relative to the first record.
+"""
+
+import sys
+from collections import Counter
+
+import espnow_sim  # noqa: F401, sets up CPython compatibility
+from bdg import trace
+
+
+def main(argv):
+    path = argv[0] if argv else "trace.bin"
+    only = set(argv[1].split(",")) if len(argv) > 1 else None
+
+    recs, names = trace.load(path)
+    t0 = recs[0][2] if recs else 0
+    counts = Counter()
+    for r in recs:
+        name = trace.EVENTS.get(r[1], (f"ev{r[1]}",))[0]
+        counts[name] += 1
+        if only and name not in only:
+            continue
+        print(trace.fmt(r[:2] + (r[2] - t0,) + r[3:], names))
+
+    print(f"{len(recs)} records")
+    for name, n in counts.most_common():
+        print(f"{n:>8} {name}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
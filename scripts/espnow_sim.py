@@ -0,0 +1,1139 @@
+"""
+Host side ESP-NOW simulator for exercising bdg.msg without badges.
+
+Medium is a shared radio, SimESPNow a drop-in aioespnow.AIOESPNow on it and
+SimBadge one virtual badge running its own NowListener and Beacon. Any number
+of badges run in one asyncio loop, on CPython or the MicroPython unix port.
+
+Run the self checks from the repository root:
+
+    make espnow_sim
+    # or
+    MICROPYPATH=frozen_firmware/modules:libs/micropython-async/v3:scripts \
+        micropython scripts/espnow_sim.py
+
+Minimal use:
+
+    medium = Medium(loss=0.05, latency_ms=(2, 8), seed=1)
+    a = SimBadge(medium, pos=(0, 0))
+    b = SimBadge(medium, pos=(3, 0))
+    a.start(beacon_s=0.5)
+    b.start(beacon_s=0.5)
+    await asyncio.sleep(2)
+    assert b.mac in a.NowListener.last_seen
+"""
+
+import asyncio
+import math
+import random
+import sys
+import time
+from collections import deque
+from heapq import heappush, heappop
+
+
+def _cpython_compat():
+    """
+    Make the firmware modules run on CPython like on MicroPython.
+
+    Adds the time.ticks_* and asyncio *_ms extensions and imports bdg.* without
+    private name mangling: bdg.msg relies on `msg.__id` being the same
+    attribute in every class, which holds on MicroPython only.
+    """
+    import io
+    import tokenize
+    from importlib.machinery import PathFinder, SourceFileLoader
+
+    t0 = time.monotonic_ns()
+    time.ticks_ms = lambda: (time.monotonic_ns() - t0) // 1_000_000
+    time.ticks_us = lambda: (time.monotonic_ns() - t0) // 1_000
+    time.ticks_diff = lambda a, b: a - b
+    time.ticks_add = lambda a, b: a + b
+    asyncio.sleep_ms = lambda ms: asyncio.sleep(ms / 1000)
+    asyncio.wait_for_ms = lambda aw, ms: asyncio.wait_for(aw, ms / 1000)
+
+    class NoMangleLoader(SourceFileLoader):
+        def get_code(self, fullname):
+            toks = []
+            src = self.get_data(self.path)
+            for tok in tokenize.tokenize(io.BytesIO(src).readline):
+                name = tok.string
+                if tok.type == tokenize.NAME and name[:2] == "__" != name[-2:]:
+                    tok = tok._replace(string=name + "_mp__")
+                toks.append(tok)
+            return compile(tokenize.untokenize(toks), self.path, "exec")
+
+    class NoMangleFinder:
+        @staticmethod
+        def find_spec(fullname, path=None, target=None):
+            if fullname != "bdg" and not fullname.startswith("bdg."):
+                return None
+            spec = PathFinder.find_spec(fullname, path)
+            if spec and spec.origin and spec.origin.endswith(".py"):
+                spec.loader = NoMangleLoader(fullname, spec.origin)
+            return spec
+
+    sys.meta_path.insert(0, NoMangleFinder)
+
+
+if not hasattr(time, "ticks_ms"):
+    _cpython_compat()
+
+from time import ticks_ms, ticks_diff, ticks_add
+
+# esp_now_err_t values, MicroPython raises OSError(code, name)
+ESP_ERR = {
+    "ESP_ERR_ESPNOW_NOT_INIT": 0x3067,
+    "ESP_ERR_ESPNOW_ARG": 0x3068,
+    "ESP_ERR_ESPNOW_FULL": 0x306A,
+    "ESP_ERR_ESPNOW_NOT_FOUND": 0x306B,
+    "ESP_ERR_ESPNOW_EXIST": 0x306D,
+    "ESP_ERR_ESPNOW_IF": 0x306E,
+}
+
+
+def esp_err(name):
+    return OSError(ESP_ERR[name], name)
+
+
+def is_group(mac):
+    # group bit set: broadcast (ff:ff:..) or multicast like the beacon bb:bb:..
+    return bool(mac[0] & 0x01)
+
+
+class FakeESPNow:
+    """
+    aioespnow.AIOESPNow stand-in that only records sent frames.
+
+    It enforces the same peer rules as the driver: sending to an unknown peer
+    raises ESP_ERR_ESPNOW_NOT_FOUND and add_peer() fails with
+    ESP_ERR_ESPNOW_FULL when max_peers is reached. Each asend() takes
+    airtime_ms, break_driver() makes sends fail until the driver is repaired.
+    """
+
+    def __init__(self, max_peers=20, airtime_ms=0):
+        self.max_peers = max_peers
+        self.airtime_ms = airtime_ms
+        self.peers = {}
+        self.peers_table = {}
+        self.sent = []
+        self._active = False
+        self.broken = None  # error name raised until repaired
+        self._repair_ms = 0
+        self._repaired_at = None
+
+    def active(self, flag=None):
+        if flag is not None:
+            self._active = bool(flag)
+            if self._active and self.broken and self._repaired_at is None:
+                self._repaired_at = ticks_add(ticks_ms(), self._repair_ms)
+        return self._active
+
+    def break_driver(self, name="ESP_ERR_ESPNOW_NOT_INIT", repair_ms=30):
+        """Fail sends with name until active(True) is called and repair_ms passed."""
+        self.broken = name
+        self._repair_ms = repair_ms
+        self._repaired_at = None
+
+    def config(self, *args, **kwargs):
+        pass
+
+    def add_peer(self, mac, *args, **kwargs):
+        if mac in self.peers:
+            raise esp_err("ESP_ERR_ESPNOW_EXIST")
+        if len(self.peers) >= self.max_peers:
+            raise esp_err("ESP_ERR_ESPNOW_FULL")
+        self.peers[mac] = (mac, None, 0, 0, False)
+
+    def del_peer(self, mac):
+        if mac not in self.peers:
+            raise esp_err("ESP_ERR_ESPNOW_NOT_FOUND")
+        del self.peers[mac]
+
+    def get_peers(self):
+        return tuple(self.peers.values())
+
+    def _check_send(self, mac):
+        if self.broken:
+            repaired = self._repaired_at
+            if repaired is None or ticks_diff(ticks_ms(), repaired) < 0:
+                raise esp_err(self.broken)
+            self.broken = None
+        if not self._active:
+            raise esp_err("ESP_ERR_ESPNOW_NOT_INIT")
+        if mac not in self.peers:
+            raise esp_err("ESP_ERR_ESPNOW_NOT_FOUND")
+
+    async def asend(self, mac, msg, sync=None):
+        self._check_send(mac)
+        if self.airtime_ms:
+            await asyncio.sleep_ms(self.airtime_ms)
+        self.sent.append((mac, bytes(msg)))
+        return True
+
+
+class Medium:
+    """
+    Shared radio medium for SimESPNow interfaces.
+
+    Badges have a 2D position in meters and link RSSI follows a log-distance
+    path loss model: rssi_1m - 10 * path_exp * log10(d) +- shadowing_db.
+    Frames below sensitivity are not heard. Every heard frame gets a latency
+    from latency_ms, is lost with probability loss, duplicated with
+    probability dup and delayed past later frames with probability reorder.
+    set_link() overrides RSSI or loss for one pair of badges.
+    """
+
+    def __init__(
+        self,
+        loss=0.0,
+        latency_ms=(1, 3),
+        reorder=0.0,
+        dup=0.0,
+        rssi_1m=-45,
+        path_exp=2.5,
+        shadowing_db=0,
+        sensitivity=-92,
+        seed=None,
+    ):
+        self.loss = loss
+        self.latency_ms = latency_ms
+        self.reorder = reorder
+        self.dup = dup
+        self.rssi_1m = rssi_1m
+        self.path_exp = path_exp
+        self.shadowing_db = shadowing_db
+        self.sensitivity = sensitivity
+        if seed is not None:
+            random.seed(seed)
+
+        self.ifaces = {}  # mac -> SimESPNow
+        self.pos = {}  # mac -> (x, y)
+        self.links = {}  # (mac_a, mac_b) -> (rssi, loss)
+        self._air = []  # heap of (due_ms, seq, dst, src, msg, rssi)
+        self._seq = 0
+        self._wake = asyncio.Event()
+        self._task = None
+        self.stats = {
+            "tx": 0,
+            "delivered": 0,
+            "lost": 0,
+            "out_of_range": 0,
+            "duplicated": 0,
+            "reordered": 0,
+            "rx_overflow": 0,
+        }
+
+    def add(self, iface, pos=(0, 0)):
+        self.ifaces[iface.mac] = iface
+        self.pos[iface.mac] = pos
+        return iface
+
+    def remove(self, mac):
+        self.ifaces.pop(mac, None)
+        self.pos.pop(mac, None)
+
+    def move(self, mac, pos):
+        self.pos[mac] = pos
+
+    def set_link(self, a, b, rssi=None, loss=None):
+        self.links[(a, b)] = self.links[(b, a)] = (rssi, loss)
+
+    def distance(self, a, b):
+        (ax, ay), (bx, by) = self.pos[a], self.pos[b]
+        return math.sqrt((ax - bx) ** 2 + (ay - by) ** 2)
+
+    def rssi(self, src, dst):
+        rssi = self.links.get((src, dst), (None, None))[0]
+        if rssi is None:
+            d = max(0.1, self.distance(src, dst))
+            rssi = self.rssi_1m - 10 * self.path_exp * math.log10(d)
+            if self.shadowing_db:
+                rssi += random.uniform(-self.shadowing_db, self.shadowing_db)
+        return int(rssi)
+
+    def transmit(self, src, dst, msg) -> int:
+        """Put msg on air, returns how many receivers will get it."""
+        self.stats["tx"] += 1
+        if is_group(dst):
+            dsts = [mac for mac in self.ifaces if mac != src]
+        else:
+            dsts = [dst] if dst in self.ifaces else []
+
+        lo, hi = self.latency_ms
+        now = ticks_ms()
+        heard = 0
+        for mac in dsts:
+            rssi = self.rssi(src, mac)
+            if rssi < self.sensitivity:
+                self.stats["out_of_range"] += 1
+                continue
+            loss = self.links.get((src, mac), (None, None))[1]
+            if random.random() < (self.loss if loss is None else loss):
+                self.stats["lost"] += 1
+                continue
+            heard += 1
+            delay = random.uniform(lo, hi)
+            if self.reorder and random.random() < self.reorder:
+                self.stats["reordered"] += 1
+                delay += hi * 2
+            self._put(ticks_add(now, int(delay)), mac, src, msg, rssi)
+            if self.dup and random.random() < self.dup:
+                self.stats["duplicated"] += 1
+                self._put(ticks_add(now, int(delay) + 1), mac, src, msg, rssi)
+
+        if heard and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._deliver())
+        self._wake.set()
+        return heard
+
+    def _put(self, due, dst, src, msg, rssi):
+        self._seq += 1
+        heappush(self._air, (due, self._seq, dst, src, msg, rssi))
+
+    async def _deliver(self):
+        while True:
+            if not self._air:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+            wait = ticks_diff(self._air[0][0], ticks_ms())
+            if wait > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for_ms(self._wake.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            _, _, dst, src, msg, rssi = heappop(self._air)
+            iface = self.ifaces.get(dst)
+            if iface is not None and iface._rx(src, msg, rssi):
+                self.stats["delivered"] += 1
+
+
+class SimESPNow(FakeESPNow):
+    """
+    aioespnow.AIOESPNow on a simulated Medium.
+
+    Received frames update peers_table with [rssi, ticks_ms] like the driver
+    and are queued in a receive buffer of rxbuf frames, frames arriving to a
+    full buffer are dropped. Supports async iteration, airecv(), arecv(),
+    recv(), any() and stats().
+    """
+
+    __next_mac = 1
+
+    def __init__(
+        self, medium=None, mac=None, pos=(0, 0), max_peers=20, airtime_ms=0, rxbuf=16
+    ):
+        super().__init__(max_peers=max_peers, airtime_ms=airtime_ms)
+        if mac is None:
+            n = SimESPNow.__next_mac
+            SimESPNow.__next_mac += 1
+            mac = bytes([0x02, 0x5B, 0, 0, n >> 8, n & 0xFF])
+        self.mac = mac
+        self.medium = default_medium() if medium is None else medium
+        self.medium.add(self, pos)
+        self.rxbuf = rxbuf
+        self.clock = ticks_ms  # stamps received frames like the driver does
+        self._rx_q = deque((), rxbuf)
+        self._rx_ev = asyncio.Event()
+        self.tx_pkts = 0
+        self.tx_failures = 0
+        self.rx_pkts = 0
+        self.rx_dropped = 0
+
+    async def asend(self, mac, msg, sync=None):
+        self._check_send(mac)
+        if self.airtime_ms:
+            await asyncio.sleep_ms(self.airtime_ms)
+        self.tx_pkts += 1
+        heard = self.medium.transmit(self.mac, mac, bytes(msg))
+        if not heard and not is_group(mac):
+            self.tx_failures += 1
+            # only sync sends learn about the missing MAC layer ack
+            return not sync
+        return True
+
+    def _rx(self, src, msg, rssi) -> bool:
+        if not self._active:
+            return False
+        if len(self._rx_q) >= self.rxbuf:
+            self.rx_dropped += 1
+            self.medium.stats["rx_overflow"] += 1
+            return False
+        self._rx_q.append((src, msg, rssi, self.clock()))
+        self.rx_pkts += 1
+        self._rx_ev.set()
+        return True
+
+    def any(self) -> bool:
+        return len(self._rx_q) > 0
+
+    def _pop(self):
+        # like the driver: peers_table gets rssi and arrival time of each read
+        src, msg, rssi, t = self._rx_q.popleft()
+        self.peers_table[src] = [rssi, t]
+        return [src, msg]
+
+    def recv(self, timeout_ms=None):
+        if len(self._rx_q):
+            return self._pop()
+        return [None, None]
+
+    async def airecv(self):
+        while not len(self._rx_q):
+            self._rx_ev.clear()
+            await self._rx_ev.wait()
+        return self._pop()
+
+    arecv = airecv
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.airecv()
+
+    def stats(self):
+        return (
+            self.tx_pkts,
+            self.tx_pkts - self.tx_failures,
+            self.tx_failures,
+            self.rx_pkts,
+            self.rx_dropped,
+        )
+
+
+_default_medium = None
+
+
+def default_medium():
+    """Medium used by SimESPNow() without arguments, e.g. aioespnow.AIOESPNow()."""
+    global _default_medium
+    if _default_medium is None:
+        _default_medium = Medium()
+    return _default_medium
+
+
+def load_stack(clock=None):
+    """
+    Import private copies of bdg.msg.connection and bdg.msg.clock.
+
+    NowListener and Beacon keep their state in class attributes, so every
+    virtual badge needs its own copy of the module (and of bdg.aproc, which
+    holds the shared AProc stop event). clock replaces ticks_ms in the copies.
+    """
+    for name in ("bdg.msg.connection", "bdg.aproc", "bdg.msg.clock"):
+        sys.modules.pop(name, None)
+    stack = __import__("bdg.msg.connection", None, None, ("NowListener",))
+    clock_mod = __import__("bdg.msg.clock", None, None, ("ClockSync",))
+    if clock is not None:
+        stack.ticks_ms = clock_mod.ticks_ms = clock
+    return stack, clock_mod
+
+
+_fw_msgs = None
+
+
+def load_fwshare():
+    """
+    Import a private copy of bdg.msg.fwshare bound to the last load_stack().
+
+    The message classes of the first copy replace those of later copies, the
+    registry only knows one class per name.
+    """
+    global _fw_msgs
+    from bdg.msg import AppMsg
+
+    sys.modules.pop("bdg.msg.fwshare", None)
+    mod = __import__("bdg.msg.fwshare", None, None, ("FwSeed",))
+    if _fw_msgs is None:
+        _fw_msgs = mod.FwInfo, mod.FwReq
+    mod.FwInfo, mod.FwReq = _fw_msgs
+    for cls in _fw_msgs:
+        AppMsg.register(cls)
+    return mod
+
+
+def sim_clock(offset_ms=0, drift_ppm=0):
+    """ticks_ms of a badge clock that is offset_ms ahead and drift_ppm fast."""
+    t0 = ticks_ms()
+
+    def clock():
+        now = ticks_ms()
+        return ticks_add(now, offset_ms + ticks_diff(now, t0) * drift_ppm // 1_000_000)
+
+    return clock
+
+
+class LegacyCodec:
+    """bdg.msg.codec of firmware from before capability negotiation."""
+
+    CAP_COMPACT = 1
+    CAP_POSTED = 16
+
+    @staticmethod
+    def offer(sid):
+        return sid
+
+    @staticmethod
+    def answer(sid):
+        return sid, 0
+
+    @staticmethod
+    def agreed(sid):
+        return 0
+
+
+class SimBadge:
+    """
+    One virtual badge: a SimESPNow interface and its own messaging stack.
+
+    clock_ms and drift_ppm give the badge its own clock, see sim_clock().
+    legacy=True makes it negotiate like old firmware: it echoes the OpenConn
+    session_id and only sends the legacy format.
+
+    Attributes:
+        NowListener, Beacon, Connection, ClockSync: Classes of this badge's
+            stack copy.
+        clock: ticks_ms of this badge.
+    """
+
+    def __init__(
+        self,
+        medium,
+        mac=None,
+        pos=(0, 0),
+        nick=None,
+        clock_ms=0,
+        drift_ppm=0,
+        legacy=False,
+        **iface_kw,
+    ):
+        self.espnow = SimESPNow(medium, mac, pos, **iface_kw)
+        self.espnow.active(True)
+        self.mac = self.espnow.mac
+        self.nick = nick or f"sim{self.mac[-2:].hex()}"
+        self.clock = ticks_ms
+        if clock_ms or drift_ppm:
+            self.clock = self.espnow.clock = sim_clock(clock_ms, drift_ppm)
+        stack, clock_mod = load_stack(self.clock)
+        if legacy:
+            stack.codec = LegacyCodec
+        self.fwshare = load_fwshare()
+        self.ClockSync = clock_mod.ClockSync
+        self.NowListener = stack.NowListener
+        self.Beacon = stack.Beacon
+        self.Connection = stack.Connection
+
+    def start(self, beacon_s=5, rx_yield_s=0.0, con_cb=None):
+        from bdg.msg import BeaconMsg
+
+        self.NowListener.rx_yield_s = rx_yield_s
+        if con_cb is not None:
+            self.NowListener.con_cb = con_cb
+        self.NowListener.start(self.espnow)
+        if beacon_s:
+            self.Beacon.setup(self.espnow, BeaconMsg(nick=self.nick), timeout=beacon_s)
+            self.Beacon.start(task=True)
+
+    def stop(self):
+        if self.Beacon.is_running():
+            self.Beacon.stop()
+        self.NowListener.stop()
+        self.espnow.active(False)
+
+    def in_range(self, other: "SimBadge", min_rssi=-70):
+        # NowListener ignores frames weaker than -70dBm
+        return self.espnow.medium.rssi(other.mac, self.mac) >= min_rssi
+
+    async def connect(self, other: "SimBadge", con_id=1):
+        """Open a connection to other, returns this badge's Connection or None."""
+        conn = self.Connection(other.mac, con_id, self.espnow)
+        if await conn.connect():
+            return conn
+        return None
+
+
+def seq_msg():
+    """Numbered AppMsg content for the checks."""
+    from bdg.msg import AppMsg, BadgeMsg
+
+    @AppMsg.register
+    class SeqMsg(BadgeMsg):
+        def __init__(self, n: int):
+            super().__init__()
+            self.n = n
+
+    return SeqMsg
+
+
+def check_peer_slots(n_macs=60, max_peers=20):
+    """Talk to more badges than the driver allows and check nothing fails."""
+    from bdg.msg import send_message
+    from bdg.msg.peers import PeerSlots
+
+    e = FakeESPNow(max_peers=max_peers)
+    e.active(True)
+    slots = PeerSlots.of(e)
+    beacon = b"\xbb" * 6
+    slots.pin(beacon, "beacon")
+    opponent = bytes([2, 0, 0, 0, 0, 1])
+    slots.pin(opponent, 1)
+
+    macs = [bytes([2, 0, 0, 0, i >> 8, i & 0xFF]) for i in range(2, n_macs + 2)]
+
+    async def talk():
+        for mac in macs:
+            await send_message(e, mac, b"ping")
+            await send_message(e, opponent, b"move")
+
+    asyncio.run(talk())
+
+    assert len(e.peers) <= max_peers, "driver peer limit exceeded"
+    assert beacon in e.peers and opponent in e.peers, "pinned peer evicted"
+    assert len(e.sent) == 2 * n_macs, "send failed"
+    slots.unpin(opponent, 1)
+    print(
+        f"peer slots ok: {len(e.sent)} frames, {len(e.peers)}/{max_peers} peers,"
+        f" {slots.evictions} evictions"
+    )
+
+
+def check_discovery(n=6, spacing=3, far=40):
+    """Badges on a line discover neighbours in range, a far badge stays unseen."""
+    from bdg.msg import PingMsg
+
+    async def run():
+        medium = Medium(loss=0.1, latency_ms=(1, 5), reorder=0.05, dup=0.05, seed=7)
+        badges = [SimBadge(medium, pos=(i * spacing, 0)) for i in range(n)]
+        loner = SimBadge(medium, pos=(far, far))
+        for b in badges + [loner]:
+            b.start(beacon_s=0.3)
+        await asyncio.sleep(2)
+
+        for b in badges:
+            near = [o.mac for o in badges if o is not b and b.in_range(o)]
+            missing = [m.hex() for m in near if m not in b.NowListener.last_seen]
+            assert not missing, f"{b.nick} did not see {missing}"
+            assert loner.mac not in b.NowListener.last_seen, "out of range badge seen"
+
+        # handshake over a clean link, a lost OpenConn reply is not recovered
+        # when the request is retransmitted (the reply reuses the request id)
+        medium.set_link(badges[0].mac, badges[1].mac, loss=0)
+        conn = await badges[0].connect(badges[1], con_id=7)
+        assert conn is not None, "connection failed"
+        conn.send_app_msg(PingMsg(1, False))
+        reply = await asyncio.wait_for(conn.in_q.get(), 5)
+        assert reply.reply, "no ping reply"
+
+        for b in badges + [loner]:
+            b.stop()
+        return medium.stats
+
+    stats = asyncio.run(run())
+    print(f"discovery ok: {n + 1} badges, medium {stats}")
+
+
+def check_clock_sync(clock_ms=123_456, drift_ppm=40, rx_yield_s=0.05):
+    """Two badges with different clocks agree on the shared time."""
+
+    async def run():
+        medium = Medium(loss=0.05, latency_ms=(1, 8), seed=3)
+        a = SimBadge(medium, pos=(0, 0))
+        b = SimBadge(medium, pos=(2, 0), clock_ms=clock_ms, drift_ppm=drift_ppm)
+        a.start(beacon_s=0, rx_yield_s=rx_yield_s)
+        b.start(beacon_s=0, rx_yield_s=rx_yield_s)
+        medium.set_link(a.mac, b.mac, loss=0)  # see check_discovery
+        conn_a = await a.connect(b, con_id=5)
+        assert conn_a is not None, "connection failed"
+        await asyncio.sleep_ms(200)
+        conn_b = b.NowListener.connections[5]
+        medium.set_link(a.mac, b.mac, loss=0.05)
+
+        clock_a, clock_b = a.ClockSync(conn_a), b.ClockSync(conn_b)
+        err_a, err_b = await asyncio.gather(clock_a.sync(), clock_b.sync())
+        assert err_a is not None and err_b is not None, "no sync exchange"
+        skew = ticks_diff(clock_a.now(), clock_b.now())
+        assert abs(skew) <= err_a + err_b, f"shared clocks {skew}ms apart"
+        a.stop()
+        b.stop()
+        return skew, err_a, err_b, clock_a.peer_offset()
+
+    skew, err_a, err_b, offset = asyncio.run(run())
+    print(
+        f"clock sync ok: offset {offset}ms, shared clocks {skew}ms apart,"
+        f" error bounds {err_a}ms/{err_b}ms"
+    )
+
+
+class WalkGame:
+    """Deterministic two player toy game for check_lockstep."""
+
+    def __init__(self, seed):
+        self.pos = [0, 0]
+        self.t = 0
+        self.rng = random.Random(seed)
+        self.held = 0
+
+    def local_input(self):
+        # buttons are held for a while, like on a real badge
+        if self.rng.random() < 0.2:
+            self.held = self.rng.randrange(4)
+        return self.held
+
+    def step(self, inputs):
+        for p, i in enumerate(inputs):
+            self.pos[p] = (self.pos[p] * 3 + i + self.t) & 0xFFFF
+        self.t += 1
+
+    def save(self):
+        return (self.pos[0], self.pos[1], self.t)
+
+    def load(self, state):
+        self.pos[0], self.pos[1], self.t = state
+
+    def checksum(self):
+        return (self.pos[0] << 16 | self.pos[1]) ^ self.t
+
+
+def check_lockstep(frames=120, loss=0.15, tick_ms=125, rx_yield_s=0.1):
+    """Lockstep and rollback games stay in sync over a lossy link, at the
+    listener pacing of the badge."""
+    from bdg.games.lockstep import Lockstep
+
+    async def play(rollback, delay):
+        medium = Medium(loss=0, latency_ms=(2, 15), seed=11)
+        a = SimBadge(medium, pos=(0, 0))
+        b = SimBadge(medium, pos=(2, 0))
+        a.start(beacon_s=0, rx_yield_s=rx_yield_s)
+        b.start(beacon_s=0, rx_yield_s=rx_yield_s)
+        conn_a = await a.connect(b, con_id=9)
+        assert conn_a is not None, "connection failed"
+        await asyncio.sleep_ms(300)
+        conn_b = b.NowListener.connections[9]
+        medium.set_link(a.mac, b.mac, loss=loss)
+        # acks go out through the listener, posted InputMsgs must not get one
+        def acks():
+            return a.NowListener.metrics.frames_out + b.NowListener.metrics.frames_out
+
+        acked, t = acks(), ticks_ms()
+
+        games = (WalkGame(1), WalkGame(2))
+        kw = {"tick_ms": tick_ms, "delay": delay, "rollback": rollback}
+        sides = [
+            Lockstep(c, g, hash_every=8, **kw) for c, g in zip((conn_a, conn_b), games)
+        ]
+        tasks = [asyncio.create_task(s.run()) for s in sides]
+        while min(s.confirmed for s in sides) < frames:
+            await asyncio.sleep_ms(tick_ms)
+            assert all(s.desync is None for s in sides), "desync"
+            assert not any(t.done() for t in tasks), "lockstep task ended"
+        elapsed = ticks_diff(ticks_ms(), t)
+        acked = acks() - acked
+        for s in sides:
+            s.stop()
+        await asyncio.gather(*tasks)
+        a.stop()
+        b.stop()
+        assert acked == 0, f"{acked} posted frames acked"
+        # the listener keeps up with the tick, stalls would stretch the game
+        assert elapsed < frames * tick_ms * 5 // 4, f"{frames} frames in {elapsed}ms"
+        assert sides[0].me != sides[1].me, "both badges are the same player"
+        # same state after the same confirmed frame on both badges
+        f = min(s.confirmed for s in sides) // 8 * 8
+        assert sides[0].hashes[f] == sides[1].hashes[f], "states differ"
+        return sides
+
+    # no input delay makes rollback predict and replay nearly every frame
+    for rollback, delay in ((0, 2), (4, 0)):
+        sides = asyncio.run(play(rollback, delay))
+        print(
+            f"lockstep ok: delay {delay} rollback {rollback}, {frames} frames at"
+            f" {loss:.0%} loss, {tick_ms}ms tick, rx yield {rx_yield_s}s,"
+            f" stalls {[s.stalls for s in sides]}"
+            f" rollbacks {[s.rollbacks for s in sides]}"
+        )
+
+
+def check_resume(n_msgs=6, outage_ms=3000):
+    """A connection survives an outage and delivers what was sent meanwhile."""
+    import umsgpack
+
+    SeqMsg = seq_msg()
+
+    def seq(data):
+        d = umsgpack.loads(data)  # compact [.., fields] or legacy dict
+        return d[4]["n"] if isinstance(d, list) else d["content"]["n"]
+
+    async def run():
+        medium = Medium(loss=0, latency_ms=(2, 8), seed=5)
+        a = SimBadge(medium, pos=(0, 0))
+        b = SimBadge(medium, pos=(2, 0))
+        a.start(beacon_s=0)
+        b.start(beacon_s=0)
+        conn_a = await a.connect(b, con_id=6)
+        assert conn_a is not None, "connection failed"
+        await asyncio.sleep_ms(100)
+        conn_b = b.NowListener.connections[6]
+        got = []
+
+        async def read():
+            async for msg in conn_b.get_msg_aiter():
+                if isinstance(msg, SeqMsg):
+                    got.append(msg.n)
+
+        reader = asyncio.create_task(read())
+        medium.set_link(a.mac, b.mac, loss=1)
+        for n in range(n_msgs):
+            conn_a.send_app_msg(SeqMsg(n))
+            await asyncio.sleep_ms(outage_ms // n_msgs)
+        assert conn_a.lost_at is not None, "outage not noticed"
+        # unacked frames wait for the resume in the order they were sent
+        replay = [seq(data) for data, _ in conn_a.retx]
+        assert replay == list(range(n_msgs)), f"replay order {replay}"
+        medium.set_link(a.mac, b.mac, loss=0)
+        t = ticks_ms()
+        while conn_a.lost_at is not None:
+            await asyncio.sleep_ms(5)
+        resume_ms = ticks_diff(ticks_ms(), t)
+        for _ in range(100):
+            if len(got) == n_msgs:
+                break
+            await asyncio.sleep_ms(20)
+        assert conn_a.active and conn_b.active, "connection closed"
+        # replayed one by one, a move-by-move game sees them in send order
+        assert got == list(range(n_msgs)), f"delivered {got}"
+
+        # no answer within the grace period ends the session
+        conn_a.grace_s = 1
+        medium.set_link(a.mac, b.mac, loss=1)
+        conn_a.send_app_msg(SeqMsg(n_msgs))
+        for _ in range(100):
+            if conn_a.closed:
+                break
+            await asyncio.sleep_ms(100)
+        assert conn_a.closed, "lost session not terminated"
+        reader.cancel()
+        a.stop()
+        b.stop()
+        return resume_ms, replay, got
+
+    resume_ms, replay, got = asyncio.run(run())
+    print(
+        f"resume ok: resumed {resume_ms}ms after the link returned,"
+        f" replayed {replay}, got {got}"
+    )
+
+
+def check_keepalive(idle_ms=300, loss=0.1):
+    """Idle connections stay up on a lossy link and a peer that left is lost."""
+
+    async def run():
+        medium = Medium(loss=0, latency_ms=(2, 8), seed=9)
+        a = SimBadge(medium, pos=(0, 0))
+        b = SimBadge(medium, pos=(2, 0))
+        for badge in (a, b):
+            badge.Connection.idle_ms = idle_ms
+            badge.NowListener.keepalive_ms = idle_ms // 4
+            badge.start(beacon_s=0)
+        conn_a = await a.connect(b, con_id=7)
+        assert conn_a is not None, "connection failed"
+        await asyncio.sleep_ms(100)
+        conn_b = b.NowListener.connections[7]
+        medium.set_link(a.mac, b.mac, loss=loss)
+
+        await asyncio.sleep_ms(20 * idle_ms)
+        assert not conn_a.peer_lost.is_set(), "peer lost on an idle link"
+        assert not conn_b.peer_lost.is_set(), "peer lost on an idle link"
+        beats = conn_a.metrics.heartbeats + conn_b.metrics.heartbeats
+        assert beats, "no heartbeats"
+
+        # b walks away
+        conn_a.grace_s = 1
+        medium.move(b.mac, (500, 0))
+        t = ticks_ms()
+        await asyncio.wait_for_ms(conn_a.peer_lost.wait(), 20 * idle_ms)
+        lost_ms = ticks_diff(ticks_ms(), t)
+        for _ in range(50):
+            if conn_a.closed:
+                break
+            await asyncio.sleep_ms(100)
+        assert conn_a.closed, "lost peer not terminated"
+        a.stop()
+        b.stop()
+        return beats, lost_ms, conn_a.link
+
+    beats, lost_ms, link = asyncio.run(run())
+    print(
+        f"keepalive ok: {beats} heartbeats at {loss:.0%} loss, peer lost after"
+        f" {lost_ms}ms, {link}"
+    )
+
+
+def check_mixed_versions(n_msgs=10):
+    """Every pair of old and new firmware talks, in the best common format."""
+    import umsgpack
+
+    SeqMsg = seq_msg()
+
+    async def run(legacy_a, legacy_b):
+        medium = Medium(loss=0, latency_ms=(2, 8), seed=13)
+        a = SimBadge(medium, pos=(0, 0), legacy=legacy_a)
+        b = SimBadge(medium, pos=(2, 0), legacy=legacy_b)
+        compact_at_legacy = 0
+        for badge, legacy in ((a, legacy_a), (b, legacy_b)):
+            if legacy:
+                # old firmware can not decode the compact format
+                def rx(src, msg, rssi, _rx=badge.espnow._rx):
+                    nonlocal compact_at_legacy
+                    if isinstance(umsgpack.loads(msg), list):
+                        compact_at_legacy += 1
+                    return _rx(src, msg, rssi)
+
+                badge.espnow._rx = rx
+            badge.start(beacon_s=0)
+        conn_a = await a.connect(b, con_id=8)
+        assert conn_a is not None, "connection failed"
+        await asyncio.sleep_ms(100)
+        conn_b = b.NowListener.connections[8]
+        assert conn_a.session_id == conn_b.session_id, "sessions differ"
+        assert conn_a.caps == conn_b.caps, "capabilities differ"
+
+        got = {conn_a: [], conn_b: []}
+
+        async def read(conn):
+            async for msg in conn.get_msg_aiter():
+                if isinstance(msg, SeqMsg):
+                    got[conn].append(msg.n)
+
+        readers = [asyncio.create_task(read(c)) for c in got]
+        for n in range(n_msgs):
+            conn_a.send_app_msg(SeqMsg(n))
+            conn_b.send_app_msg(SeqMsg(n))
+            await asyncio.sleep_ms(30)
+        await asyncio.sleep_ms(500)
+        for conn, ns in got.items():
+            assert sorted(ns[:n_msgs]) == list(range(n_msgs)), f"delivered {ns}"
+        assert not compact_at_legacy, "compact frames sent to old firmware"
+        m = conn_a.metrics
+
+        # malformed compact frames are dropped, the listener keeps running
+        for bad in (
+            [8, "x", None, "SeqMsg", {"n": 0}],
+            [8, 1, "s", "SeqMsg", {"n": 0}],
+            [8, 1, None, 5, {"n": 0}],
+            [8, 1, None, "SeqMsg", [0]],
+            [8, 1],
+        ):
+            await a.espnow.asend(b.mac, umsgpack.dumps(bad))
+            await asyncio.sleep_ms(150)
+        b.NowListener.blocked_macs.clear()  # the bursts above get a blocked
+        conn_a.send_app_msg(SeqMsg(n_msgs))
+        await asyncio.sleep_ms(500)
+        assert got[conn_b][-1] == n_msgs, "listener died on a malformed frame"
+        for r in readers:
+            r.cancel()
+        a.stop()
+        b.stop()
+        return conn_a.caps, m.bytes_out // m.frames_out
+
+    for legacy_a, legacy_b in ((False, False), (False, True), (True, False)):
+        caps, size = asyncio.run(run(legacy_a, legacy_b))
+        names = ["old" if legacy else "new" for legacy in (legacy_a, legacy_b)]
+        print(
+            f"mixed versions ok: {names[0]}->{names[1]} caps {caps},"
+            f" {size} bytes per frame"
+        )
+
+
+def check_gossip(n=5, spacing=8, beacon_s=0.2, budget=60, ttl_s=2):
+    """Badges learn their neighbours' neighbours, within the airtime budget."""
+    from bdg.msg.gossip import Gossip
+
+    async def run():
+        medium = Medium(loss=0.05, latency_ms=(2, 8), seed=21)
+        # a line of badges, each one only hears the next
+        badges = [SimBadge(medium, pos=(spacing * i, 0)) for i in range(n)]
+        for badge in badges:
+            gossip = Gossip(badge.NowListener.last_seen, badge.mac, ttl_s=ttl_s)
+            gossip.budget, gossip.burst = budget, 50
+            badge.NowListener.gossip = gossip
+            badge.Beacon.ext_every = 1
+        t = ticks_ms()
+        for badge in badges:
+            badge.start(beacon_s=beacon_s)
+        await asyncio.sleep(3)
+        elapsed_s = ticks_diff(ticks_ms(), t) / 1000
+        heard = [b.NowListener.gossip.heard for b in badges]
+        sizes = [len(h) for h in heard]
+        first, second, third = badges[:3]
+        assert second.mac in first.NowListener.last_seen, "neighbour not heard"
+        assert third.mac not in first.NowListener.last_seen, "badges too close"
+        peer = heard[0].get(third.mac)
+        assert peer is not None and peer.hops == 2, f"2 hops not learned {heard[0]}"
+        assert peer.via == second.mac, "learned from the wrong neighbour"
+        assert badges[3].mac not in heard[0], "learned beyond max_hops"
+        sent = [b.NowListener.gossip.sent for b in badges]
+        for badge in badges:
+            g = badge.NowListener.gossip
+            assert g.sent <= budget * elapsed_s + g.burst, "over the airtime budget"
+
+        # a badge that leaves is forgotten by the badges that only heard of it
+        medium.move(third.mac, (500, 500))
+        for _ in range(100):
+            if third.mac not in heard[0]:
+                break
+            await asyncio.sleep_ms(100)
+        assert third.mac not in heard[0], "left badge not forgotten"
+
+        # junk entries of a neighbour's digest are skipped, not kept or raised
+        g = first.NowListener.gossip
+        good = [b"\x07" * 6, "far", -60, 1, 0]
+        junk = [
+            [b"\x01" * 6, "x", -60, 1, "0"],
+            [[1, 2], "x", -60, 1, 0],
+            [b"\x03" * 6, 5, -60, 1, 0],
+            [b"\x04" * 6, "x" * 200, -60, 1, 0],
+            [b"\x05" * 3, "x", -60, 1, 0],
+            None,
+        ]
+        assert g.learn(second.mac, junk + [good]) == [good[0]], "junk learned"
+        assert g.learn(second.mac, 7) == [], "junk digest learned"
+        g.digest()
+        for badge in badges:
+            badge.stop()
+        return sizes, max(sent) / elapsed_s
+
+    sizes, bps = asyncio.run(run())
+    print(
+        f"gossip ok: {n} badges in a line learned {sizes} badges beyond range,"
+        f" digests {bps:.0f} bytes/s at a budget of {budget}"
+    )
+
+
+class MemOTA:
+    """In memory stand-in for ota.update.OTA, committed when the block succeeds."""
+
+    def __init__(self):
+        self.image = bytearray()
+        self.committed = False
+
+    def __enter__(self):
+        self.image = bytearray()
+        return self
+
+    def write(self, buf):
+        self.image += buf
+
+    def __exit__(self, exc_type, exc, tb):
+        self.committed = exc_type is None
+        return False
+
+
+def check_fw_share(n=5, size=3 * 4096 + 1000, loss=0.05):
+    """A new firmware spreads from one seed to every badge, bad seeds are caught."""
+    import hashlib
+    import os
+    import tempfile
+    from types import SimpleNamespace
+
+    img = bytes(random.Random(size).getrandbits(8) for _ in range(size))
+    manifest = {
+        "version": "v1.1.0",
+        "size": size,
+        "sha256": hashlib.sha256(img).hexdigest(),
+    }
+    tmp = tempfile.mkdtemp()
+
+    def reader(image):
+        def read(off, buf):
+            seg = image[off : off + len(buf)]
+            buf[: len(seg)] = seg
+
+        return read
+
+    async def run():
+        medium = Medium(loss=loss, latency_ms=(2, 8), seed=17)
+
+        def new_badge(pos, beacon_s=0.3):
+            badge = SimBadge(medium, pos=pos)
+            # message ids come from one counter for all badges of the sim, they
+            # repeat sooner than on a badge and old ids would hide new frames
+            badge.NowListener.delivered = deque([], 16)
+            badge.fwshare.MANIFEST = os.path.join(tmp, badge.mac.hex())
+            badge.Beacon.ext_every = 1
+            badge.start(beacon_s=beacon_s)
+            return badge
+
+        badges = [new_badge((2 * i, 0)) for i in range(n)]
+        seed, fetchers = badges[0], badges[1:]
+        seed.fwshare.FwSeed(manifest, reader(img)).enable()
+        wifi = []
+
+        async def update(badge):
+            fw = badge.fwshare
+            t = ticks_ms()
+            while ticks_diff(ticks_ms(), t) < 60_000:
+                found = fw.seeds("v1.0.0")
+                if found:
+                    macs = [mac for v, mac in found if v == found[0][0]]
+                    ota = MemOTA()
+                    fetch = fw.FwFetch(badge.espnow, manifest, lambda: ota)
+                    if await fetch.run(macs, rounds=1):
+                        assert ota.committed and ota.image == img, "bad image"
+                        mf = fw.load_manifest("v1.1.0")
+                        fw.FwSeed(mf, reader(bytes(ota.image))).enable()
+                        return ticks_diff(ticks_ms(), t)
+                await asyncio.sleep_ms(random.randrange(100, 500))
+            wifi.append(badge)
+
+        times = await asyncio.gather(*[update(b) for b in fetchers])
+        assert not wifi, f"{len(wifi)} badges needed WiFi"
+        served = [b.NowListener.services[b.fwshare.FW_CON_ID].served for b in badges]
+
+        # a seed serving a corrupted image under the right manifest
+        bad = bytearray(img)
+        bad[size // 2] ^= 0xFF
+        evil = new_badge((0, 2), beacon_s=0)
+        evil.fwshare.FwSeed(manifest, reader(bytes(bad))).enable()
+        victim = new_badge((2, 2), beacon_s=0)
+        ota = MemOTA()
+        fetch = victim.fwshare.FwFetch(victim.espnow, manifest, lambda: ota)
+        ok = await fetch.run([evil.mac], rounds=1)
+        assert not ok and not ota.committed, "corrupted image committed"
+        assert victim.fwshare.load_manifest("v1.1.0") is None, "manifest saved"
+
+        # a seed with its own manifest for the forged image, and one with junk
+        # in its BeaconExt
+        forged = dict(manifest, sha256=hashlib.sha256(bad).hexdigest())
+        evil.fwshare.FwSeed(forged, reader(bytes(bad))).enable()
+        victim.NowListener.beacon_ext[b"\x02" * 6] = SimpleNamespace(fw=110)
+        assert victim.fwshare.seeds("v1.0.0") is not None
+        ota = MemOTA()
+        fetch = victim.fwshare.FwFetch(victim.espnow, manifest, lambda: ota)
+        ok = await fetch.run([evil.mac], rounds=1)
+        assert not ok and not ota.image, "forged manifest accepted"
+        for badge in badges + [evil, victim]:
+            badge.stop()
+        return times, served
+
+    times, served = asyncio.run(run())
+    print(
+        f"fw share ok: {len(times)} badges updated from 1 seed in"
+        f" {max(times)}ms, segments served {served}, 0 over WiFi,"
+        " corrupted and forged seeds rejected"
+    )
+
+
+if __name__ == "__main__":
+    check_peer_slots()
+    check_discovery()
+    check_clock_sync()
+    check_lockstep()
+    check_resume()
+    check_keepalive()
+    check_mixed_versions()
+    check_fw_share()
+    check_gossip()
@@ -0,0 +1,108 @@
+"""
+Pack sprite frames into one .bimg atlas for bdg.widgets.sprite.SpriteAtlas.
+
+Reads RGB565 image modules made by make convert_image, one per frame, and
+stacks them into a vertical strip as wide as the widest frame, narrower ones
+padded on the right with the key colour. The frame table holds the first row
+and the height of each frame, so a frame is a run of whole rows of the strip.
+
+    python3 scripts/img_atlas.py [--index] [--deflate] [--key 0xffff|none] \\
+        frozen_fs/images/walk.bimg walk1.py walk2.py walk3.py
+
+--index stores the strip as 2, 4 or 8 bit colour indices with one lut for all
+frames (see img_index.py), --deflate compresses the rows (see img_bimg.py).
+The key colour defaults to the top left pixel of the first frame.
+
+On the badge:
+
+    atlas = SpriteAtlas("walk")  # /readonly_fs/images/walk.bimg
+    walker = layer.add(AnimatedSprite(atlas, frame_ms=120), row=80, col=40)
+"""
+
+import sys
+
+from img_bimg import DEFLATE, RAW, encode, header
+from img_index import MODES, index, pack
+
+ATLAS = 0x10
+
+
+def u16(v) -> bytes:
+    return v.to_bytes(2, "big")
+
+
+def load(path):
+    img = {}
+    with open(path) as f:
+        exec(f.read(), img)
+    if img["mode"] not in (1, 10):
+        raise ValueError(f"{path}: RGB565 or RGB565_I images only")
+    return img
+
+
+def strip(frames, key):
+    """Rows of all frames, padded to the widest, and the frame table."""
+    cols = max(img["cols"] for img in frames)
+    pad = u16(0 if key is None else key)
+    data = bytearray()
+    table = []
+    for img in frames:
+        table.append((len(data) // (cols * 2), img["rows"]))
+        w = img["cols"] * 2
+        for r in range(img["rows"]):
+            data += img["data"][r * w : (r + 1) * w]
+            data += pad * (cols - img["cols"])
+    return data, cols, table
+
+
+def main(out, paths, indexed=False, flags=RAW, key=None):
+    frames = [load(p) for p in paths]
+    if key is None:
+        key = frames[0]["data"][0] << 8 | frames[0]["data"][1]
+    elif key < 0:
+        key = None  # opaque
+    data, cols, table = strip(frames, key)
+    rows = len(data) // (cols * 2)
+    mode = frames[0]["mode"]
+    lut = b""
+    if indexed:
+        colours, kidx, indices = index(data, key)
+        for n, bits, mode in MODES:
+            if len(colours) <= n:
+                break
+        else:
+            raise ValueError(f"{len(colours)} colours, 256 fit")
+        lut = b"".join(colours)
+        data = pack(indices, rows, cols, bits)
+        keyed, kval = kidx >= 0, max(kidx, 0)
+    else:
+        # framebuf's value of the key pixel, the ssd.mvb bytes little endian
+        keyed = key is not None
+        kval = (key & 0xFF) << 8 | key >> 8 if keyed else 0
+    body = encode(data, flags)
+    with open(out, "wb") as f:
+        f.write(header(mode, flags | ATLAS, rows, cols))
+        f.write(u16(len(table)) + u16(len(lut) // 2) + u16(kval))
+        f.write(bytes((int(keyed), 0)))
+        f.write(lut)
+        for y, h in table:
+            f.write(u16(y) + u16(h))
+        f.write(body)
+    size = len(body) + 16 + len(lut) + 4 * len(table)
+    print(
+        f"{out}: {len(table)} frames, {rows}x{cols} strip, {len(lut) // 2} colours,"
+        f" {size} bytes (RGB565 {rows * cols * 2})"
+    )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    indexed = "--index" in args
+    flags = DEFLATE if "--deflate" in args else RAW
+    key = None
+    if "--key" in args:
+        i = args.index("--key")
+        key = -1 if args[i + 1] == "none" else int(args[i + 1], 0)
+        del args[i : i + 2]
+    args = [a for a in args if a not in ("--index", "--deflate")]
+    main(args[0], args[1:], indexed, flags, key)
@@ -0,0 +1,78 @@
+"""
+Convert an image module made by make convert_image into a .bimg asset.
+
+Writes the 8 byte header of bdg.assets (b"BI", mode, flags, rows, cols) and
+the data bytes, by default to frozen_fs/images/<name>.bimg, which the firmware
+build freezes to /readonly_fs/images/<name>.bimg:
+
+    python3 scripts/img_bimg.py [--deflate] images/boot.py [out.bimg]
+
+--deflate stores the rows as a zlib stream with a 1 KB window (WBITS), which
+the badge expands row by row. The input can also be a .bimg, to compress or
+expand an existing asset.
+
+On the badge, draw it with bdg.assets.blit_asset(ssd, "boot").
+"""
+
+import os
+import sys
+import zlib
+
+RAW = 0
+DEFLATE = 1
+WBITS = 10  # 1 KB window, the RAM the badge's decoder needs for it
+
+
+def header(mode, flags, rows, cols) -> bytes:
+    size = rows.to_bytes(2, "big") + cols.to_bytes(2, "big")
+    return b"BI" + bytes((mode, flags)) + size
+
+
+def read_bimg(path):
+    with open(path, "rb") as f:
+        h = f.read(8)
+        data = f.read()
+    if h[:2] != b"BI":
+        raise ValueError(f"{path}: not a .bimg image")
+    if h[3] == DEFLATE:
+        data = zlib.decompress(data)
+    rows, cols = int.from_bytes(h[4:6], "big"), int.from_bytes(h[6:8], "big")
+    return data, rows, cols, h[2]
+
+
+def encode(data, flags) -> bytes:
+    if flags == RAW:
+        return bytes(data)
+    c = zlib.compressobj(9, zlib.DEFLATED, WBITS)
+    return c.compress(data) + c.flush()
+
+
+def main(path, out=None, flags=RAW):
+    if path.endswith(".bimg"):
+        data, rows, cols, mode = read_bimg(path)
+    else:
+        img = {}
+        with open(path) as f:
+            exec(f.read(), img)
+        data, rows, cols, mode = img["data"], img["rows"], img["cols"], img["mode"]
+    if out is None:
+        name = os.path.splitext(os.path.basename(path))[0]
+        out = os.path.join("frozen_fs", "images", f"{name}.bimg")
+    body = encode(data, flags)
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out, "wb") as f:
+        f.write(header(mode, flags, rows, cols))
+        f.write(body)
+    print(
+        f"{path}: {rows}x{cols} mode {mode}, {len(data)} bytes of pixels,"
+        f" {len(body) + 8} bytes -> {out}"
+    )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    flags = RAW
+    if "--deflate" in args:
+        args.remove("--deflate")
+        flags = DEFLATE
+    main(args[0], args[1] if len(args) > 1 else None, flags)
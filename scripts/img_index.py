@@ -0,0 +1,106 @@
+"""
+Convert an RGB565 image module into a palette indexed sprite for Sprite.
+
+Reads rows, cols and data of a module made by make convert_image, collects
+its colours and writes a module with 2, 4 or 8 bit colour indices, the
+fewest bits that hold all colours, and a lut of the RGB565 colours:
+
+    rows = 16
+    cols = 16
+    mode = 5  # framebuf.GS2_HMSB, GS4_HMSB (2) or GS8 (6)
+    lut = b'...'  # 2 bytes per colour, in the byte order of ssd.mvb
+    key = 0  # index of the transparent colour, -1 for none
+    data = b'...'
+
+data has framebuf's layout for the mode, so Sprite blits it through the lut
+with FrameBuffer.blit(). Rows are padded to whole bytes; in a GS2_HMSB byte
+the first pixel is in the low bits, in a GS4_HMSB byte in the high nibble.
+
+    python3 scripts/img_index.py firmware/sprites/player.py out.py [0xffff|none]
+
+The key colour defaults to the top left pixel, like img_spans.py. Convert
+the source with DITHER=None, dithering spreads an image over many colours.
+"""
+
+import sys
+
+GS4_HMSB = 2
+GS2_HMSB = 5
+GS8 = 6
+MODES = ((4, 2, GS2_HMSB), (16, 4, GS4_HMSB), (256, 8, GS8))
+
+
+def pack(indices, rows, cols, bits) -> bytes:
+    per = 8 // bits
+    stride = (cols + per - 1) // per
+    buf = bytearray(rows * stride)
+    for r in range(rows):
+        for c in range(cols):
+            v = indices[r * cols + c]
+            i = r * stride + c // per
+            if bits == 2:
+                buf[i] |= v << (c % 4 * 2)
+            elif bits == 4:
+                buf[i] |= v << 4 if c % 2 == 0 else v
+            else:
+                buf[i] = v
+    return bytes(buf)
+
+
+def index(data, key):
+    """lut, key index and per pixel indices of RGB565 data."""
+    pixels = [bytes(data[i : i + 2]) for i in range(0, len(data), 2)]
+    colours = sorted(set(pixels))
+    if key is not None:
+        k = key.to_bytes(2, "big")
+        if k in colours:  # the transparent colour first
+            colours.remove(k)
+            colours.insert(0, k)
+    lookup = {p: i for i, p in enumerate(colours)}
+    kidx = 0 if key is not None and key.to_bytes(2, "big") in lookup else -1
+    return colours, kidx, [lookup[p] for p in pixels]
+
+
+def literal(name, b, width=16):
+    lines = [f"{name} =\\"]
+    for i in range(0, len(b), width):
+        chunk = "".join(f"\\x{v:02x}" for v in b[i : i + width])
+        lines.append(f"b'{chunk}'\\")
+    lines[-1] = lines[-1][:-1]
+    return "\n".join(lines) + "\n"
+
+
+def main(path, out, key=None):
+    img = {}
+    with open(path) as f:
+        exec(f.read(), img)
+    if img["mode"] not in (1, 10):
+        raise ValueError("RGB565 or RGB565_I images only")
+    data, rows, cols = img["data"], img["rows"], img["cols"]
+    if key is None:
+        key = data[0] << 8 | data[1]
+    elif key < 0:
+        key = None  # opaque
+    colours, kidx, indices = index(data, key)
+    for n, bits, mode in MODES:
+        if len(colours) <= n:
+            break
+    else:
+        raise ValueError(f"{len(colours)} colours, 256 fit, convert with DITHER=None")
+    packed = pack(indices, rows, cols, bits)
+    with open(out, "w") as f:
+        f.write(f"# indexed sprite, generated by scripts/img_index.py from {path}\n")
+        f.write(f"rows = {rows}\ncols = {cols}\nmode = {mode}\nkey = {kidx}\n")
+        f.write(literal("lut", b"".join(colours)))
+        f.write(literal("data", packed))
+    print(
+        f"{out}: {rows}x{cols}, {len(colours)} colours, {bits} bit,"
+        f" {len(packed) + len(colours) * 2} bytes (RGB565 {rows * cols * 2})"
+    )
+
+
+if __name__ == "__main__":
+    key = sys.argv[3] if len(sys.argv) > 3 else None
+    if key is not None:
+        key = -1 if key == "none" else int(key, 0)
+    main(sys.argv[1], sys.argv[2], key)
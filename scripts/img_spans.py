@@ -0,0 +1,91 @@
+"""
+Add transparency spans to an RGB565 image module for bdg.blit.blit_spans().
+
+Reads rows, cols and data of a module made by make convert_image, finds the
+runs of pixels that differ from the key colour (default: the top left pixel,
+like the old keyed blit) and appends them to the module as
+
+    key = 0xffff
+    spans = b'...'  # per row: n, then n (skip, run) pixel counts, bytes
+
+Skips and runs above 255 pixels are split with zero length runs, so any
+width works. Running it again replaces the spans.
+
+    python3 scripts/img_spans.py frozen_firmware/modules/images/logo.py [0xffff]
+"""
+
+import sys
+
+MARK = "# transparency spans, generated by scripts/img_spans.py"
+
+
+def row_spans(data, cols, r, key):
+    """(skip, run) pixel counts of the opaque runs of row r."""
+    out = []
+    x = 0  # end of the last run
+    c = 0
+    while c < cols:
+        i = (r * cols + c) * 2
+        if data[i] << 8 | data[i + 1] == key:
+            c += 1
+            continue
+        start = c
+        while c < cols:
+            i = (r * cols + c) * 2
+            if data[i] << 8 | data[i + 1] == key:
+                break
+            c += 1
+        skip, run = start - x, c - start
+        while skip > 255:
+            out.append((255, 0))
+            skip -= 255
+        while run > 255:
+            out.append((skip, 255))
+            skip, run = 0, run - 255
+        out.append((skip, run))
+        x = c
+    return out
+
+
+def spans(data, rows, cols, key) -> bytes:
+    buf = bytearray()
+    for r in range(rows):
+        pairs = row_spans(data, cols, r, key)
+        if len(pairs) > 255:
+            raise ValueError(f"row {r} has {len(pairs)} runs, 255 fit")
+        buf.append(len(pairs))
+        for skip, run in pairs:
+            buf += bytes((skip, run))
+    return bytes(buf)
+
+
+def literal(name, b, width=16):
+    lines = [f"{name} =\\"]
+    for i in range(0, len(b), width):
+        chunk = "".join(f"\\x{v:02x}" for v in b[i : i + width])
+        lines.append(f"b'{chunk}'\\")
+    lines[-1] = lines[-1][:-1]
+    return "\n".join(lines) + "\n"
+
+
+def main(path, key=None):
+    with open(path) as f:
+        src = f.read()
+    src = src.split("\n" + MARK)[0].rstrip("\n") + "\n"
+    img = {}
+    exec(src, img)
+    if img["mode"] not in (1, 10):
+        raise ValueError("RGB565 or RGB565_I images only")
+    data, rows, cols = img["data"], img["rows"], img["cols"]
+    if key is None:
+        key = data[0] << 8 | data[1]
+    sp = spans(data, rows, cols, key)
+    with open(path, "w") as f:
+        f.write(src)
+        f.write(f"\n{MARK}\nkey = 0x{key:04x}\n")
+        f.write(literal("spans", sp))
+    print(f"{path}: {rows}x{cols}, {len(sp)} bytes of spans, key 0x{key:04x}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], int(sys.argv[2], 0) if len(sys.argv) > 2 else None)
@@ -0,0 +1,137 @@
+"""
+Replay a radio capture (bdg.msg.capture) into NowListener on the host.
+
+Received frames of the capture are fed to NowListener.task through a fake
+ESP-NOW interface, with the recorded RSSI. speed=1 keeps the original timing,
+speed=N plays N times faster and speed=0 as fast as the listener takes them,
+which doubles as a throughput benchmark on real event traffic.
+
+    mpremote cp :/capture0.bin :/capture1.bin :/capture2.bin :/capture3.bin .
+    PYTHONPATH=frozen_firmware/modules:libs/micropython-async/v3:scripts \
+        python3 scripts/replay_capture.py path=capture speed=0
+"""
+
+import asyncio
+import builtins
+import sys
+
+from espnow_sim import FakeESPNow  # first, sets up CPython compatibility
+from time import ticks_ms, ticks_diff
+
+from bdg.msg.capture import read, RX
+
+DEFAULTS = {"path": "capture", "count": 4, "speed": 1.0, "quiet": 1}
+
+
+class ReplayESPNow(FakeESPNow):
+    """Receives the captured frames, sends go to FakeESPNow.sent."""
+
+    def __init__(self, frames, speed=1.0):
+        super().__init__(max_peers=20)
+        self.frames = frames
+        self.speed = speed
+        self.fed = 0
+        self.done = asyncio.Event()
+        self._start = None
+        self._offset = 0  # ms of earlier capture sessions
+        self._last = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.fed >= len(self.frames):
+            # the listener asked for more, so the last frame is processed
+            self.done.set()
+            await asyncio.Event().wait()
+
+        t_ms, rssi, mac, msg = self.frames[self.fed]
+        if self._start is None:
+            self._start = ticks_ms()
+            self._offset = -t_ms
+        if t_ms < self._last:
+            # next Capture.start() session, its clock starts from zero again
+            self._offset += self._last
+        self._last = t_ms
+
+        if self.speed:
+            due = int((t_ms + self._offset) / self.speed)
+            wait = due - ticks_diff(ticks_ms(), self._start)
+            if wait > 0:
+                await asyncio.sleep_ms(wait)
+        self.fed += 1
+        self.peers_table[mac] = [rssi, ticks_ms()]
+        return [mac, msg]
+
+
+async def accept(conn, req=False):
+    # stand-in for the game: accept every connection and consume its messages
+    async def drain():
+        while True:
+            await conn.in_q.get()
+
+    asyncio.create_task(drain())
+    return True
+
+
+async def replay(frames, speed):
+    from bdg.msg.connection import NowListener
+
+    e = ReplayESPNow(frames, speed)
+    e.active(True)
+    NowListener.rx_yield_s = 0
+    NowListener.con_cb = accept
+    t0 = ticks_ms()
+    task = NowListener.start(e)
+    while not e.done.is_set() and not task.done():
+        await asyncio.sleep_ms(10)
+    elapsed = ticks_diff(ticks_ms(), t0)
+    error = None
+    if task.done():
+        # listener crashed, the frame that killed it is the last one fed
+        try:
+            await task
+        except Exception as e:
+            error = repr(e)
+    else:
+        task.cancel()
+    return {
+        "listener_error": error,
+        "frames": e.fed,
+        "elapsed_ms": elapsed,
+        "fps": e.fed * 1000 // max(1, elapsed),
+        "sent": len(e.sent),
+        "badges_seen": len(NowListener.last_seen),
+        "connections": len(NowListener.connections),
+        "blocked": len(NowListener.blocked_macs),
+    }
+
+
+def main(argv):
+    params = dict(DEFAULTS)
+    for arg in argv:
+        key, _, value = arg.partition("=")
+        params[key] = type(DEFAULTS[key])(value)
+
+    frames = []
+    tx = 0
+    for _, t_ms, direction, rssi, mac, msg in read(params["path"], params["count"]):
+        if direction == RX:
+            frames.append((t_ms, rssi, mac, msg))
+        else:
+            tx += 1
+    print(f"capture: {len(frames)} received, {tx} sent frames")
+
+    _print = builtins.print
+    if params["quiet"]:
+        builtins.print = lambda *args, **kwargs: None
+    try:
+        results = asyncio.run(replay(frames, params["speed"]))
+    finally:
+        builtins.print = _print
+    for key, value in results.items():
+        print(f"{key:>12}: {value}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])